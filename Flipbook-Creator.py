@@ -1,18 +1,46 @@
-﻿import os
+﻿import logging
+import math
+import os
+import queue
 import sys
+import threading
+import weakref
+from collections import Counter
+from dataclasses import dataclass, replace
 
 from PIL import Image
-from PySide6.QtCore import QSize, Qt, QMimeData, QPoint, QTimer
-from PySide6.QtGui import QIcon, QPixmap, QImage, QPainter, QDrag, QAction, QKeySequence, QColor
+from PySide6.QtCore import (
+    QSize, Qt, QMimeData, QPoint, QRect, QTimer, QObject, QRunnable, QThreadPool, Slot
+)
+from PySide6.QtGui import (
+    QIcon, QPixmap, QPixmapCache, QImage, QPainter, QDrag, QAction, QKeySequence, QColor, QFont,
+    QFontMetrics
+)
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
     QPushButton, QFrame, QFileDialog, QSlider, QLabel,
     QSpacerItem, QSizePolicy, QGridLayout, QScrollArea, QToolButton,
-    QSpinBox, QComboBox, QColorDialog
+    QSpinBox, QComboBox, QColorDialog, QCheckBox
 )
 
+import icons_rc  # noqa: F401  registers the :/icons/ resources compiled from icons.qrc
+
 # supported image formats
 IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp', '.bmp', '.tga')
+_EXT_SET = frozenset(ext.lower() for ext in IMAGE_EXTENSIONS)
+
+# Qt PNG writer quality for "Fast PNG"; Qt maps quality 80 to zlib compression level 1
+FAST_PNG_QUALITY = 80
+
+# QPixmapCache limit in KB for the scaled thumbnail pixmaps
+THUMBNAIL_CACHE_LIMIT = 256 * 1024
+
+# exports with at least this many output pixels scale their frames in parallel; below it the
+# thread hand-off costs more than it saves
+PARALLEL_EXPORT_PIXELS = 2048 * 2048
+
+# longest side of the downscaled copy used for grid thumbnails (matches the zoom slider's maximum)
+PREVIEW_SIZE = 256
 
 # --- STYLES (QSS) ---
 STYLESHEET = """
@@ -22,6 +50,11 @@ QWidget {
     font-size: 11pt;
 }
 #LeftFrame { background-color: #242424; }
+#SectionLabel { font-weight: bold; margin-top: 10px; }
+#ScaleValueLabel { font-weight: bold; min-width: 45px; }
+#ResolutionLabel { color: #888888; font-size: 9pt; }
+#ShortcutsLabel { color: #888888; font-size: 9pt; margin-top: 10px; }
+QScrollArea#GridScrollArea { border: none; background-color: #1a1a1a; }
 QPushButton {
     background-color: #3f51b5; color: white; border: none;
     padding: 8px 16px; border-radius: 4px;
@@ -37,6 +70,42 @@ QToolButton:disabled {
     background-color: #2a2a2a;
     color: #666666;
 }
+QPushButton#ExportButton {
+    background-color: #4caf50;
+    font-weight: bold;
+    padding: 12px;
+    margin-top: 20px;
+}
+QPushButton#ExportButton:hover { background-color: #45a049; }
+QPushButton#ExportButton:disabled {
+    background-color: #2a2a2a;
+    color: #666666;
+}
+QPushButton#ColorSwatch {
+    border: 2px solid #3a3a3a;
+    border-radius: 4px;
+}
+QPushButton#ColorSwatch:hover { border: 2px solid #3f51b5; }
+QToolButton#AddButton, QToolButton#DeleteButton {
+    color: white;
+    border: none;
+    padding: 8px;
+    border-radius: 25px;
+    font-size: 24pt;
+    font-weight: bold;
+}
+QToolButton#AddButton { background-color: #3f51b5; }
+QToolButton#AddButton:hover { background-color: #303f9f; }
+QToolButton#AddButton:disabled {
+    background-color: #2a2a2a;
+    color: #666666;
+}
+QToolButton#DeleteButton { background-color: #f44336; }
+QToolButton#DeleteButton:hover { background-color: #d32f2f; }
+QToolButton#DeleteButton:disabled {
+    background-color: #2a2a2a;
+    color: #666666;
+}
 QScrollBar:vertical {
     border: none; background: #1a1a1a;
     width: 10px; margin: 0px 0px 0px 0px;
@@ -80,17 +149,302 @@ QComboBox QAbstractItemView {
     selection-background-color: #3f51b5;
     color: #f0f0f0;
 }
+ImageThumbnail {
+    background-color: transparent;
+    border: 2px solid transparent;
+    border-radius: 6px;
+}
+ImageThumbnail:hover {
+    background-color: #3a3a3a;
+    border: 2px solid #555555;
+}
+ImageThumbnail[state="selected"], ImageThumbnail[state="dragging"] {
+    background-color: #4a4a5a;
+    border: 2px solid #3f51b5;
+}
+ImageThumbnail[state="selected"]:hover, ImageThumbnail[state="dragging"]:hover {
+    border: 2px solid #5f71d5;
+}
+DropZone {
+    color: #666666;
+    font-size: 24pt;
+    font-weight: bold;
+    background-color: transparent;
+    padding-top: 15px;
+}
+DropZone[state="over"] {
+    color: #3f51b5;
+    background-color: #2a2a3a;
+    border: 2px dashed #3f51b5;
+}
+DropZone[state="over-end"] {
+    color: #4caf50;
+    background-color: #2a3a2a;
+    border: 2px dashed #4caf50;
+}
 """
 
+# fill of the background color swatch button; its border comes from #ColorSwatch in STYLESHEET
+COLOR_SWATCH_STYLE = "background-color: rgb({r}, {g}, {b});"
+
+
+def is_supported_image(name):
+    """Returns True if the file name has one of the supported image extensions."""
+    return os.path.splitext(name)[1].lower() in _EXT_SET
+
+
+def scale_to_fit(image, size):
+    """Smoothly scales a QImage or QPixmap to fit in a size x size box, keeping the aspect ratio.
+
+    Sources much larger than the target are first shrunk to twice the target with a fast
+    nearest-neighbour pass, so the smooth pass doesn't have to read the whole large source.
+    """
+    if max(image.width(), image.height()) > 4 * size:
+        image = image.scaled(
+            size * 2, size * 2,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.FastTransformation
+        )
+    return image.scaled(
+        size, size,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation
+    )
+
+
+def load_image(full_path):
+    """Decodes an image file into a full-size QImage, a small preview QImage and the file name.
+
+    Only uses QImage (not QPixmap), so it is safe to call from worker threads.
+    Returns None if the file can't be decoded.
+    """
+    image = QImage(full_path)
+
+    # fallback to PIL for formats QImage might not support (e.g., some TGA/WebP)
+    if image.isNull():
+        try:
+            pil_image = Image.open(full_path)
+            pil_image = pil_image.convert("RGBA")
+            data = pil_image.tobytes("raw", "RGBA")
+            # copy so the QImage owns its pixels instead of pointing into `data`
+            image = QImage(data, pil_image.width, pil_image.height, QImage.Format.Format_RGBA8888).copy()
+        except Exception as e:
+            print(f"Warning: Could not load image {full_path} with PIL: {e}")
+            return None
+
+        if image.isNull():
+            return None
+
+    # use the formats the export atlas is drawn in, so frames are blitted without per-pixel conversion
+    if image.hasAlphaChannel():
+        image = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+    else:
+        image = image.convertToFormat(QImage.Format.Format_RGB32)
+
+    preview = image
+    if image.width() > PREVIEW_SIZE or image.height() > PREVIEW_SIZE:
+        preview = scale_to_fit(image, PREVIEW_SIZE)
+    return image, preview, os.path.basename(full_path)
+
+
+class ImageLoadTask(QRunnable):
+    """Thread pool task that decodes one file and passes (index, result) to a callback.
+
+    The callback runs on the worker thread, so it must not touch any Qt objects.
+    """
+
+    def __init__(self, full_path, index, callback, cancel_event=None):
+        super().__init__()
+        self.full_path = full_path
+        self.index = index
+        self.callback = callback
+        self.cancel_event = cancel_event
+
+    def run(self):
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            result = None
+        else:
+            result = load_image(self.full_path)
+        self.callback(self.index, result)
+
+
+@dataclass(eq=False)
+class ImageEntry:
+    """One frame in the grid. Entries compare by identity, so duplicates of a file stay distinct."""
+    image: QImage  # full-size image used for export
+    filename: str
+    full_path: str
+    preview: QPixmap  # downscaled copy used for thumbnails
+
+
+class ScaleTask(QRunnable):
+    """Thread pool task that smoothly scales a QImage and passes (key, scaled) to a callback."""
+
+    def __init__(self, key, image, width, height, callback):
+        super().__init__()
+        self.key = key
+        self.image = image
+        self.width = width
+        self.height = height
+        self.callback = callback
+
+    def run(self):
+        self.callback((self.key, scale_frame(self.image, self.width, self.height)))
+
+
+def scale_frame(image, width, height):
+    """Smoothly scales a frame to exactly width x height, ignoring its aspect ratio."""
+    return image.scaled(
+        width, height,
+        Qt.AspectRatioMode.IgnoreAspectRatio,
+        Qt.TransformationMode.SmoothTransformation
+    )
+
+
+def scale_images(jobs, pool=None):
+    """Scales {key: (image, width, height)} jobs and returns {key: scaled image}.
+
+    With a pool the jobs run on its threads and this blocks until all of them are done;
+    QImage.scaled releases the GIL, so they really run side by side. Without one they run
+    inline on the calling thread.
+    """
+    if pool is None:
+        return {key: scale_frame(image, width, height) for key, (image, width, height) in jobs.items()}
+
+    results = queue.SimpleQueue()
+    for key, (image, width, height) in jobs.items():
+        pool.start(ScaleTask(key, image, width, height, results.put))
+    return dict(results.get() for _ in jobs)
+
+
+def make_image_entry(full_path, result):
+    """Turns a load_image() result into a grid entry. Creates QPixmaps, so GUI thread only."""
+    image, preview, filename = result
+    return ImageEntry(image, filename, full_path, QPixmap.fromImage(preview))
+
+
+# entries still alive anywhere (grid, undo history), keyed by image_cache_key(), so loading
+# an unchanged file again reuses its decoded pixels instead of decoding a second copy
+_ENTRY_CACHE = weakref.WeakValueDictionary()
+
+
+def image_cache_key(full_path):
+    """Returns the _ENTRY_CACHE key for a file, or None if it can't be stat'ed."""
+    try:
+        # normalized so the same file matches whether it came from a file dialog or a folder
+        # scan, which differ in separators (and on Windows in case)
+        return os.path.normcase(os.path.abspath(full_path)), os.stat(full_path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class ImageLoader(QObject):
+    """Decodes a list of files on the global thread pool without blocking the GUI.
+
+    Workers push their results onto a queue that a GUI-thread timer drains, and entries are
+    handed to on_batch in input order, in batches of batch_size, so the grid is rebuilt once
+    per batch rather than once per image. on_finished is called after the last batch.
+    """
+
+    BATCH_SIZE = 16
+    POLL_INTERVAL = 15  # ms
+    _PENDING = object()  # placeholder in _results for files that haven't finished yet
+
+    def __init__(self, file_paths, on_batch, on_finished=None, parent=None, batch_size=BATCH_SIZE):
+        super().__init__(parent)
+        self.file_paths = file_paths
+        self.on_batch = on_batch
+        self.on_finished = on_finished
+        self.batch_size = batch_size
+        self._cancel_event = threading.Event()
+        self._queue = queue.SimpleQueue()
+        # decoded results (or cached entries) by file index, held until all earlier files are in
+        self._results = [self._PENDING] * len(file_paths)
+        self._keys = [None] * len(file_paths)  # _ENTRY_CACHE key per file
+        self._next_index = 0
+        self._received = 0
+        self._batch = []
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.POLL_INTERVAL)
+        self._timer.timeout.connect(self.drain)
+
+    def start(self):
+        """Queues one decode task per file that isn't already loaded."""
+        pool = QThreadPool.globalInstance()
+        for index, full_path in enumerate(self.file_paths):
+            key = self._keys[index] = image_cache_key(full_path)
+            cached = _ENTRY_CACHE.get(key) if key is not None else None
+            if cached is not None:
+                self._results[index] = cached
+                self._received += 1
+            else:
+                pool.start(ImageLoadTask(full_path, index, self._queue_result, self._cancel_event))
+        self._timer.start()
+        self.drain()
+
+    def cancel(self):
+        """Stops delivering results; tasks that haven't started yet skip decoding."""
+        self._cancel_event.set()
+        self._timer.stop()
+        self.deleteLater()
+
+    def _queue_result(self, index, result):
+        # runs on worker threads
+        self._queue.put((index, result))
+
+    @Slot()
+    def drain(self):
+        """Collects finished results and releases every entry that is now in order."""
+        if self._cancel_event.is_set():
+            return
+
+        while True:
+            try:
+                index, result = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            self._received += 1
+            self._results[index] = result
+
+        while self._next_index < len(self._results) and self._results[self._next_index] is not self._PENDING:
+            result = self._results[self._next_index]
+            self._results[self._next_index] = None
+            if result is not None:
+                if isinstance(result, ImageEntry):
+                    # a new entry sharing the cached pixels, so the grid still sees distinct items
+                    entry = replace(result)
+                else:
+                    entry = make_image_entry(self.file_paths[self._next_index], result)
+                # point the cache at the newest entry, which outlives the ones it was copied from
+                if self._keys[self._next_index] is not None:
+                    _ENTRY_CACHE[self._keys[self._next_index]] = entry
+                self._batch.append(entry)
+            self._next_index += 1
+
+        done = self._received == len(self.file_paths)
+        if self._batch and (done or len(self._batch) >= self.batch_size):
+            batch, self._batch = self._batch, []
+            self.on_batch(batch)
+
+        if done:
+            self._timer.stop()
+            if self.on_finished is not None:
+                self.on_finished()
+            self.deleteLater()
+
 
 class ImageThumbnail(QWidget):
     """A single image thumbnail widget with drag-and-drop support."""
 
-    def __init__(self, pixmap, filename, full_path, index, parent=None):
+    MARGIN = 5  # space around and between the image and the name
+    NAME_COLOR = QColor(208, 208, 208)
+
+    def __init__(self, entry, index, parent=None):
         super().__init__(parent)
-        self.original_pixmap = pixmap
-        self.filename = filename
-        self.full_path = full_path
+        self.entry = entry
+        self.filename = entry.filename
+        self.full_path = entry.full_path
         self.index = index
         self.thumbnail_size = 100
         self.is_selected = False
@@ -100,115 +454,137 @@ class ImageThumbnail(QWidget):
         self.drag_start_position = None
         self.drag_threshold = 5  # pixels
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(5, 5, 5, 5)
-        layout.setSpacing(5)
-
-        self.image_label = QLabel()
-        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.image_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
-        self.update_background_style()
-        layout.addWidget(self.image_label)
-
-        self.name_label = QLabel(filename)
-        self.name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.name_label.setWordWrap(True)
-        self.name_label.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
-        self.name_label.setStyleSheet("""
-            QLabel {
-                color: #d0d0d0;
-                font-size: 9pt;
-                background-color: transparent;
-            }
-        """)
-        layout.addWidget(self.name_label)
+        # the image and file name are painted directly in paintEvent (like an item delegate)
+        # instead of using child QLabels, so each grid item is a single widget
+        self._scaled = None  # source scaled to the thumbnail size
+        self.thumbnail_pixmap = None  # scaled image composited onto the background color
+        self.name_font = QFont(self.font())
+        self.name_font.setPointSize(9)
 
+        # state styles live in the global STYLESHEET; let it paint this widget's own background/border
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         self.setAttribute(Qt.WidgetAttribute.WA_Hover, True)
+        # clicks on selectable widgets don't clear the selection (see FlipbookApp.eventFilter)
+        self.setProperty("selectable", True)
         self.update_style()
         self.update_thumbnail()
 
+    def set_entry(self, entry):
+        """Swaps the displayed image, used when the grid reuses this widget for another item."""
+        self.entry = entry
+        self.filename = entry.filename
+        self.full_path = entry.full_path
+        self.update_thumbnail()
+
     def set_background_color(self, color):
         """Sets the background color."""
+        if color == self.background_color:
+            return
         self.background_color = color
-        self.update_background_style()
-        self.update_thumbnail()
-
-    def update_background_style(self):
-        """Updates the background stylesheet for the image_label."""
-        self.image_label.setStyleSheet(f"""
-            QLabel {{
-                background-color: rgba({self.background_color.red()}, {self.background_color.green()}, 
-                                       {self.background_color.blue()}, {self.background_color.alpha()});
-                border-radius: 4px;
-                padding: 5px;
-            }}
-        """)
+        # the scaled image is unchanged, only the fill behind it needs redrawing
+        self._composite()
 
     def set_selected(self, selected):
         """Sets the selection state."""
+        if selected == self.is_selected:
+            return
         self.is_selected = selected
         self.update_style()
 
     def update_style(self):
         """Updates the widget's style based on its state (selected, dragging)."""
-        if self.is_selected or self.is_dragging:
-            self.setStyleSheet("""
-                QWidget {
-                    background-color: #4a4a5a;
-                    border: 2px solid #3f51b5;
-                    border-radius: 6px;
-                }
-                QWidget:hover {
-                    background-color: #4a4a5a;
-                    border: 2px solid #5f71d5;
-                    border-radius: 6px;
-                }
-            """)
+        if self.is_dragging:
+            state = "dragging"
+        elif self.is_selected:
+            state = "selected"
         else:
-            self.setStyleSheet("""
-                QWidget {
-                    background-color: transparent;
-                    border: 2px solid transparent;
-                    border-radius: 6px;
-                }
-                QWidget:hover {
-                    background-color: #3a3a3a;
-                    border: 2px solid #555555;
-                    border-radius: 6px;
-                }
-            """)
+            state = "normal"
+        # re-polish so the [state=...] rules from the global stylesheet are re-evaluated
+        self.setProperty("state", state)
+        self.style().unpolish(self)
+        self.style().polish(self)
+        self.update()
 
     def update_thumbnail(self):
         """Renders the thumbnail pixmap, scaling it and drawing it on the background color."""
+        self._rescale_source()
+        self._composite()
+        self.update_geometry()
+
+    def _rescale_source(self):
+        """Scales the source image to the current thumbnail size."""
+        self._scaled = self.get_scaled_pixmap()
+
+    def _composite(self):
+        """Draws the scaled image centered on the background color."""
+        if self._scaled is None:
+            return
         size = self.thumbnail_size + 10
         thumbnail_with_bg = QPixmap(size, size)
         thumbnail_with_bg.fill(self.background_color)
 
         painter = QPainter(thumbnail_with_bg)
-        scaled = self.original_pixmap.scaled(
-            self.thumbnail_size, self.thumbnail_size,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
         # center the image
-        x = (size - scaled.width()) // 2
-        y = (size - scaled.height()) // 2
-        painter.drawPixmap(x, y, scaled)
+        x = (size - self._scaled.width()) // 2
+        y = (size - self._scaled.height()) // 2
+        painter.drawPixmap(x, y, self._scaled)
+        painter.end()
+
+        self.thumbnail_pixmap = thumbnail_with_bg
+        self.update()
+
+    def name_rect(self):
+        """Returns the rect the file name is drawn in, below the image."""
+        size = self.thumbnail_size + 10
+        top = self.MARGIN * 2 + size
+        return QRect(self.MARGIN, top, size, self.height() - top - self.MARGIN)
+
+    def update_geometry(self):
+        """Sizes the widget to fit the image plus the word-wrapped file name."""
+        size = self.thumbnail_size + 10
+        name_height = QFontMetrics(self.name_font).boundingRect(
+            QRect(0, 0, size, 10000),
+            Qt.AlignmentFlag.AlignHCenter | Qt.TextFlag.TextWordWrap,
+            self.filename
+        ).height()
+        self.setFixedSize(size + self.MARGIN * 2, size + name_height + self.MARGIN * 3)
+
+    def paintEvent(self, event):
+        """Draws the thumbnail and its name; the state background/border comes from the stylesheet."""
+        if self.thumbnail_pixmap is None:
+            return
+        painter = QPainter(self)
+        painter.drawPixmap(self.MARGIN, self.MARGIN, self.thumbnail_pixmap)
+        painter.setFont(self.name_font)
+        painter.setPen(self.NAME_COLOR)
+        painter.drawText(
+            self.name_rect(),
+            Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap,
+            self.filename
+        )
         painter.end()
 
-        self.image_label.setPixmap(thumbnail_with_bg)
-        self.image_label.setFixedSize(size, size)
-        self.name_label.setFixedWidth(size)
+    def get_scaled_pixmap(self):
+        """Returns the preview scaled to the thumbnail size, reusing a copy from QPixmapCache if possible."""
+        # keyed by pixmap data rather than by path, so a file that changed on disk is never shown stale
+        key = f"{self.entry.preview.cacheKey()}|{self.thumbnail_size}"
+        scaled = QPixmapCache.find(key)
+        if scaled is None:
+            scaled = scale_to_fit(self.entry.preview, self.thumbnail_size)
+            QPixmapCache.insert(key, scaled)
+        return scaled
 
     def set_thumbnail_size(self, size):
         """Sets the thumbnail size and triggers a rerender."""
+        if size == self.thumbnail_size:
+            return
         self.thumbnail_size = size
         self.update_thumbnail()
 
     def mousePressEvent(self, event):
         """Handle mouse press for selection and drag initiation."""
         if event.button() == Qt.MouseButton.LeftButton:
-            modifiers = QApplication.keyboardModifiers()
+            modifiers = event.modifiers()
             grid_widget = self.parent()
 
             self.drag_start_position = event.position().toPoint()
@@ -257,8 +633,8 @@ class ImageThumbnail(QWidget):
             return
 
         # mark all selected items as "dragging" for styling
+        thumbnails = grid_widget.get_all_thumbnails()
         for idx in selected_indices:
-            thumbnails = grid_widget.get_all_thumbnails()
             if idx < len(thumbnails):
                 thumbnails[idx].is_dragging = True
                 thumbnails[idx].update_style()
@@ -268,29 +644,7 @@ class ImageThumbnail(QWidget):
         mime_data.setText(','.join(map(str, selected_indices)))
         drag.setMimeData(mime_data)
 
-        # create a custom pixmap for the drag preview
-        if len(selected_indices) == 1:
-            pixmap = self.image_label.pixmap().copy()
-        else:
-            # show a count for multi-drag
-            pixmap = self.image_label.pixmap().copy()
-            painter = QPainter(pixmap)
-            painter.setPen(Qt.GlobalColor.white)
-            painter.setBrush(Qt.GlobalColor.blue)
-            painter.drawEllipse(pixmap.width() - 30, 0, 30, 30)
-            painter.drawText(pixmap.width() - 30, 0, 30, 30,
-                             Qt.AlignmentFlag.AlignCenter, str(len(selected_indices)))
-            painter.end()
-
-        # make the drag pixmap semi-transparent
-        transparent_pixmap = QPixmap(pixmap.size())
-        transparent_pixmap.fill(Qt.GlobalColor.transparent)
-
-        painter = QPainter(transparent_pixmap)
-        painter.setOpacity(0.2)
-        painter.drawPixmap(0, 0, pixmap)
-        painter.end()
-
+        transparent_pixmap = grid_widget.get_drag_preview(self, len(selected_indices))
         drag.setPixmap(transparent_pixmap)
 
         # Ми залишаємо виправлення hotspot з минулого разу, про всяк випадок
@@ -304,8 +658,8 @@ class ImageThumbnail(QWidget):
 
         # cleanup styles after drag completed
         grid_widget.hide_end_drop_zone()
+        thumbnails = grid_widget.get_all_thumbnails()
         for idx in selected_indices:
-            thumbnails = grid_widget.get_all_thumbnails()
             if idx < len(thumbnails):
                 thumbnails[idx].is_dragging = False
                 thumbnails[idx].update_style()
@@ -320,16 +674,8 @@ class DropZone(QLabel):
         self.setAlignment(Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignTop)
         self.setFixedSize(30, 100)
         self.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
-        self.setStyleSheet("""
-            QLabel {
-                color: #666666;
-                font-size: 24pt;
-                font-weight: bold;
-                background-color: transparent;
-                padding-top: 15px;
-            }
-        """)
         self.setAcceptDrops(True)
+        self.setProperty("selectable", True)
         self.is_drag_over = False
 
     def dragEnterEvent(self, event):
@@ -353,41 +699,14 @@ class DropZone(QLabel):
     def update_style(self):
         """Updates style to show visual feedback on drag over."""
         if self.is_drag_over:
-            current_text = self.text()
             # special styling for the "end drop zone" (which shows '+')
-            if current_text == "+":
-                self.setStyleSheet("""
-                    QLabel {
-                        color: #4caf50;
-                        font-size: 24pt;
-                        font-weight: bold;
-                        background-color: #2a3a2a;
-                        border: 2px dashed #4caf50;
-                        padding-top: 15px;
-                    }
-                """)
-            else:
-                self.setStyleSheet("""
-                    QLabel {
-                        color: #3f51b5;
-                        font-size: 24pt;
-                        font-weight: bold;
-                        background-color: #2a2a3a;
-                        border: 2px dashed #3f51b5;
-                        padding-top: 15px;
-                    }
-                """)
+            state = "over-end" if self.text() == "+" else "over"
         else:
-            # Default style
-            self.setStyleSheet("""
-                QLabel {
-                    color: #666666;
-                    font-size: 24pt;
-                    font-weight: bold;
-                    background-color: transparent;
-                    padding-top: 15px;
-                }
-            """)
+            state = ""
+        self.setProperty("state", state)
+        self.style().unpolish(self)
+        self.style().polish(self)
+        self.update()
 
     def set_height(self, height):
         self.setFixedSize(30, height)
@@ -398,7 +717,7 @@ class ImageGridWidget(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.images = []  # list of (pixmap, filename, full_path)
+        self.images = []  # list of ImageEntry
         self.thumbnail_size = 100
         self.selected_indices = set()
         self.last_selected_index = None  # for shift-click range selection
@@ -410,16 +729,25 @@ class ImageGridWidget(QWidget):
 
         self.end_drop_zone = None  # the final '+' drop zone
         self.is_dragging_active = False
+        self._drag_hover_known = False  # whether _drag_hover_widget is valid for the current drag
+        self._drag_hover_widget = None  # child under the cursor at the last dragMoveEvent
+
+        # widgets are kept between rebuilds and reused for whatever image sits at their index
+        self._thumbnails = []
+        self._drop_zones = []  # drop zone i sits after thumbnail i and has index i + 1
+        self._built_columns = None
+        self._drag_preview = None  # (key, pixmap) of the last drag preview, see get_drag_preview
+        self._scroll_area = None  # enclosing QScrollArea, resolved in showEvent
 
         self.layout = QGridLayout(self)
         self.layout.setContentsMargins(10, 10, 10, 10)
         self.layout.setSpacing(5)
         self.layout.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
 
-        # timer to debounce grid rebuilds on resize
+        # timer to debounce grid relayouts on resize
         self.resize_timer = QTimer()
         self.resize_timer.setSingleShot(True)
-        self.resize_timer.timeout.connect(self.rebuild_grid)
+        self.resize_timer.timeout.connect(self.relayout_positions)
 
         self.setAcceptDrops(True)
         self.setMouseTracking(True)
@@ -435,59 +763,75 @@ class ImageGridWidget(QWidget):
         if event.button() == Qt.MouseButton.LeftButton:
             child_at_pos = self.childAt(event.position().toPoint())
 
-            if child_at_pos is None:
-                # clicked on the empty space
+            # thumbnails and drop zones have no children, so childAt() returns them directly
+            if child_at_pos is None or child_at_pos.property("selectable") is not True:
+                # clicked on the empty space, not a thumbnail or drop zone
                 self.clear_selection()
-            else:
-                # check if the click was on a child of a thumbnail/dropzone
-                parent_widget = child_at_pos
-                is_thumbnail_or_dropzone = False
-
-                while parent_widget is not None:
-                    if isinstance(parent_widget, (ImageThumbnail, DropZone)):
-                        is_thumbnail_or_dropzone = True
-                        break
-                    parent_widget = parent_widget.parent()
-
-                if not is_thumbnail_or_dropzone:
-                    # clicked on a grid background, but not a widget
-                    self.clear_selection()
 
         super().mousePressEvent(event)
 
-    def save_state(self):
-        """Saves the current image order to the undo history."""
-        state = [img for img in self.images]
-        self.history.append(state)
+    def record_history(self, operation):
+        """Pushes an edit onto the undo history.
+
+        Edits are stored as diffs rather than copies of the whole image list:
+            ("append", entries)           entries were added at the end
+            ("delete", [(index, entry)])  entries were removed, in ascending index order
+            ("reorder", order)            the list became [old[i] for i in order]
+        """
+        self.history.append(operation)
         self.redo_stack.clear()
         if len(self.history) > self.max_history:
             self.history.pop(0)
 
+    def apply_operation(self, operation, reverse=False):
+        """Applies a history operation to self.images, or reverts it if reverse is True."""
+        kind, data = operation
+        if kind == "append":
+            if reverse:
+                del self.images[len(self.images) - len(data):]
+            else:
+                self.images.extend(data)
+        elif kind == "delete":
+            if reverse:
+                for index, entry in data:
+                    self.images.insert(index, entry)
+            else:
+                for index, _ in reversed(data):
+                    self.images.pop(index)
+        elif kind == "reorder":
+            if reverse:
+                restored = [None] * len(data)
+                for new_index, old_index in enumerate(data):
+                    restored[old_index] = self.images[new_index]
+                self.images[:len(data)] = restored
+            else:
+                self.images[:len(data)] = [self.images[i] for i in data]
+
     def undo(self):
-        """Restores the previous state from history."""
+        """Reverts the last edit from history."""
         if len(self.history) > 0:
-            current_state = [img for img in self.images]
-            self.redo_stack.append(current_state)
-            self.images = self.history.pop()
+            operation = self.history.pop()
+            self.apply_operation(operation, reverse=True)
+            self.redo_stack.append(operation)
             self.selected_indices.clear()
             self.last_selected_index = None
             self.rebuild_grid()
             self.update_toolbar_state()
         else:
-            print("Nothing to undo")
+            logging.debug("Nothing to undo")
 
     def redo(self):
-        """Restores a state from the redo stack."""
+        """Re-applies the last undone edit."""
         if len(self.redo_stack) > 0:
-            current_state = [img for img in self.images]
-            self.history.append(current_state)
-            self.images = self.redo_stack.pop()
+            operation = self.redo_stack.pop()
+            self.apply_operation(operation)
+            self.history.append(operation)
             self.selected_indices.clear()
             self.last_selected_index = None
             self.rebuild_grid()
             self.update_toolbar_state()
         else:
-            print("Nothing to redo")
+            logging.debug("Nothing to redo")
 
     def update_toolbar_state(self):
         """Notifies the main window to update button states (e.g., delete)."""
@@ -505,11 +849,13 @@ class ImageGridWidget(QWidget):
         self.rebuild_grid()
         self.update_toolbar_state()
 
-    def append_images(self, image_paths_and_pixmaps):
+    def append_images(self, image_paths_and_pixmaps, record_history=True):
         """Appends new images to the end of the list."""
         if image_paths_and_pixmaps:
-            self.save_state()
-            self.images.extend(image_paths_and_pixmaps)
+            operation = ("append", list(image_paths_and_pixmaps))
+            self.apply_operation(operation)
+            if record_history:
+                self.record_history(operation)
             self.rebuild_grid()
 
     def calculate_columns(self):
@@ -520,13 +866,8 @@ class ImageGridWidget(QWidget):
         # item_width = thumbnail + padding + dropzone + spacing
         item_width = self.thumbnail_size + 10 + 30 + 10
 
-        # find the parent QScrollArea to get the viewport width
-        parent_scroll = self.parent()
-        while parent_scroll and not isinstance(parent_scroll, QScrollArea):
-            parent_scroll = parent_scroll.parent()
-
-        if parent_scroll and hasattr(parent_scroll, 'viewport'):
-            available_width = parent_scroll.viewport().width() - 40  # allow for margins/scrollbar
+        if self._scroll_area is not None:
+            available_width = self._scroll_area.viewport().width() - 40  # allow for margins/scrollbar
         else:
             available_width = self.width() - 40
 
@@ -534,54 +875,100 @@ class ImageGridWidget(QWidget):
         return columns
 
     def rebuild_grid(self):
-        """Clears and rebuilds the entire thumbnail grid layout."""
-        # clear the existing layout
-        while self.layout.count():
-            item = self.layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        """Syncs the grid with self.images, reusing the existing widgets where possible."""
+        count = len(self.images)
+
+        # drop surplus widgets from the tail
+        while len(self._thumbnails) > count:
+            thumbnail = self._thumbnails.pop()
+            self.layout.removeWidget(thumbnail)
+            thumbnail.deleteLater()
+        while len(self._drop_zones) > max(0, count - 1):
+            drop_zone = self._drop_zones.pop()
+            self.layout.removeWidget(drop_zone)
+            drop_zone.deleteLater()
 
         if not self.images:
+            self._built_columns = None
             return
 
-        columns = self.calculate_columns()
+        # widget positions only depend on their index, so existing ones stay put unless the column count changed
+        self.relayout_positions()
+        columns = self._built_columns
 
-        for i, (pixmap, filename, full_path) in enumerate(self.images):
+        for i, entry in enumerate(self.images):
             row = i // columns
             col_pair = (i % columns) * 2  # each item takes 2 cols (thumbnail + dropzone)
 
-            thumbnail = ImageThumbnail(pixmap, filename, full_path, i, self)
+            if i < len(self._thumbnails):
+                thumbnail = self._thumbnails[i]
+                if thumbnail.entry is not entry:
+                    thumbnail.set_entry(entry)
+                is_new = False
+            else:
+                thumbnail = ImageThumbnail(entry, i, self)
+                self._thumbnails.append(thumbnail)
+                is_new = True
+
             thumbnail.set_thumbnail_size(self.thumbnail_size)
             thumbnail.set_background_color(self.background_color)
             thumbnail.set_selected(i in self.selected_indices)
-            self.layout.addWidget(thumbnail, row, col_pair)
+            if is_new:
+                self.layout.addWidget(thumbnail, row, col_pair)
 
             # add a drop zone after each item, except the last one
-            if i < len(self.images) - 1:
-                drop_zone = DropZone(i + 1, self)
+            if i < count - 1:
+                if i < len(self._drop_zones):
+                    drop_zone = self._drop_zones[i]
+                    is_new = False
+                else:
+                    drop_zone = DropZone(i + 1, self)
+                    self._drop_zones.append(drop_zone)
+                    is_new = True
                 drop_zone.set_height(self.thumbnail_size + 50)
-                self.layout.addWidget(drop_zone, row, col_pair + 1)
+                if is_new:
+                    self.layout.addWidget(drop_zone, row, col_pair + 1)
 
-        # create the final '+' drop zone
-        if self.images:
-            last_index = len(self.images) - 1
+        # the final '+' drop zone is created once and only added to the layout during a drag
+        if self.end_drop_zone is None:
+            self.end_drop_zone = DropZone(count, self)
+            self.end_drop_zone.setText("+")
+        self.end_drop_zone.index = count
+        self.end_drop_zone.set_height(self.thumbnail_size + 50)
+
+        if self.is_dragging_active:
+            last_index = count - 1
             last_row = last_index // columns
             last_col_pair = (last_index % columns) * 2
+            self.layout.addWidget(self.end_drop_zone, last_row, last_col_pair + 1)
 
-            self.end_drop_zone = DropZone(len(self.images), self)
-            self.end_drop_zone.setText("+")
-            self.end_drop_zone.set_height(self.thumbnail_size + 50)
-            self.end_drop_zone.setStyleSheet("""
-                QLabel {
-                    color: #666666;
-                    font-size: 24pt;
-                    font-weight: bold;
-                    background-color: transparent;
-                }
-            """)
-
-            if self.is_dragging_active:
-                self.layout.addWidget(self.end_drop_zone, last_row, last_col_pair + 1)
+    @Slot()
+    def relayout_positions(self):
+        """Moves the existing widgets to their cells for the current column count.
+
+        Only widgets whose cell actually changes are re-added; nothing is recreated or rerendered.
+        """
+        if not self.images:
+            return
+
+        columns = self.calculate_columns()
+        old_columns = self._built_columns
+        if columns == old_columns:
+            return
+        self._built_columns = columns
+
+        for i, thumbnail in enumerate(self._thumbnails):
+            row = i // columns
+            col_pair = (i % columns) * 2
+            if old_columns is not None and i // old_columns == row and (i % old_columns) * 2 == col_pair:
+                continue
+            self.layout.addWidget(thumbnail, row, col_pair)
+            if i < len(self._drop_zones):
+                self.layout.addWidget(self._drop_zones[i], row, col_pair + 1)
+
+        if self.is_dragging_active:
+            last_index = len(self.images) - 1
+            self.layout.addWidget(self.end_drop_zone, last_index // columns, (last_index % columns) * 2 + 1)
 
     def show_end_drop_zone(self):
         """Shows the final '+' drop zone during a drag operation."""
@@ -610,11 +997,13 @@ class ImageGridWidget(QWidget):
             self.end_drop_zone.setParent(None)
 
     def dragEnterEvent(self, event):
+        self._drag_hover_known = False
         if event.mimeData().hasText():
             event.acceptProposedAction()
 
     def dragLeaveEvent(self, event):
         """Hide the end drop zone if the drag leaves the widget area."""
+        self._drag_hover_known = False
         self.hide_end_drop_zone()
 
     def dragMoveEvent(self, event):
@@ -625,6 +1014,12 @@ class ImageGridWidget(QWidget):
             pos = event.position().toPoint()
             widget_at_pos = self.childAt(pos)
 
+            # mouse moves arrive continuously; only react when the cursor reaches a different widget
+            if self._drag_hover_known and widget_at_pos is self._drag_hover_widget:
+                return
+            self._drag_hover_known = True
+            self._drag_hover_widget = widget_at_pos
+
             if widget_at_pos is None:
                 # dragging over empty grid space, show the end zone
                 if not self.is_dragging_active:
@@ -640,22 +1035,25 @@ class ImageGridWidget(QWidget):
             indices_str = event.mimeData().text()
             self.handle_drop(indices_str, len(self.images))
             event.acceptProposedAction()
+        self._drag_hover_known = False
         self.hide_end_drop_zone()
 
     def get_all_thumbnails(self):
-        """Utility function to get all ImageThumbnail widgets from the layout."""
-        thumbnails = []
-        for i in range(self.layout.count()):
-            widget = self.layout.itemAt(i).widget()
-            if isinstance(widget, ImageThumbnail):
-                thumbnails.append(widget)
-        return thumbnails
+        """Returns the ImageThumbnail widgets in index order (the list maintained by rebuild_grid)."""
+        return self._thumbnails
 
     def clear_selection(self):
         """Clears the current selection."""
+        thumbnails = self.get_all_thumbnails()
+        # only the selected widgets need restyling, and their repaints are coalesced into one
+        self.setUpdatesEnabled(False)
+        try:
+            for idx in self.selected_indices:
+                if idx < len(thumbnails):
+                    thumbnails[idx].set_selected(False)
+        finally:
+            self.setUpdatesEnabled(True)
         self.selected_indices.clear()
-        for thumbnail in self.get_all_thumbnails():
-            thumbnail.set_selected(False)
         self.update_toolbar_state()
 
     def select_single(self, index):
@@ -691,27 +1089,61 @@ class ImageGridWidget(QWidget):
         end = max(self.last_selected_index, index)
 
         thumbnails = self.get_all_thumbnails()
-        for i in range(start, end + 1):
-            self.selected_indices.add(i)
-            if i < len(thumbnails):
-                thumbnails[i].set_selected(True)
+        self.setUpdatesEnabled(False)
+        try:
+            for i in range(start, end + 1):
+                self.selected_indices.add(i)
+                if i < len(thumbnails):
+                    thumbnails[i].set_selected(True)
+        finally:
+            self.setUpdatesEnabled(True)
         self.update_toolbar_state()
 
+    def get_drag_preview(self, thumbnail, count):
+        """Returns the semi-transparent drag pixmap for dragging `count` items from `thumbnail`.
+
+        The result is cached until the thumbnail's pixmap or the selection size changes.
+        """
+        key = (thumbnail.thumbnail_pixmap.cacheKey(), count)
+        if self._drag_preview is not None and self._drag_preview[0] == key:
+            return self._drag_preview[1]
+
+        # draw everything semi-transparent in a single pass, straight from the thumbnail pixmap
+        source = thumbnail.thumbnail_pixmap
+        transparent_pixmap = QPixmap(source.size())
+        transparent_pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(transparent_pixmap)
+        painter.setOpacity(0.2)
+        painter.drawPixmap(0, 0, source)
+
+        if count > 1:
+            # show a count for multi-drag; Source mode replaces the image under the badge
+            # instead of blending with it, so it matches an opaque badge faded as a whole
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+            painter.setPen(Qt.GlobalColor.white)
+            painter.setBrush(Qt.GlobalColor.blue)
+            painter.drawEllipse(source.width() - 30, 0, 30, 30)
+            painter.drawText(source.width() - 30, 0, 30, 30,
+                             Qt.AlignmentFlag.AlignCenter, str(count))
+        painter.end()
+
+        self._drag_preview = (key, transparent_pixmap)
+        return transparent_pixmap
+
     def get_selected_indices(self):
         """Returns a sorted list of selected indices."""
-        return sorted(list(self.selected_indices))
+        return sorted(self.selected_indices)
 
     def delete_selected(self):
         """Deletes all selected items."""
         if not self.selected_indices:
             return
 
-        self.save_state()
-        indices_to_delete = sorted(self.selected_indices, reverse=True)
-
-        for idx in indices_to_delete:
-            if 0 <= idx < len(self.images):
-                self.images.pop(idx)
+        removed = [(idx, self.images[idx]) for idx in sorted(self.selected_indices) if 0 <= idx < len(self.images)]
+        operation = ("delete", removed)
+        self.apply_operation(operation)
+        self.record_history(operation)
 
         self.selected_indices.clear()
         self.last_selected_index = None
@@ -721,31 +1153,22 @@ class ImageGridWidget(QWidget):
     def handle_drop(self, indices_str, target_index):
         """Moves items from source_indices to the target_index."""
         try:
-            self.save_state()
-            source_indices = sorted([int(idx) for idx in indices_str.split(',')], reverse=True)
-
-            # get items to move
-            images_to_move = []
-            for idx in source_indices:
-                if 0 <= idx < len(self.images):
-                    images_to_move.append(self.images[idx])
-
-            # remove items from old positions
-            for idx in source_indices:
-                if 0 <= idx < len(self.images):
-                    self.images.pop(idx)
-                    # adjust target_index if we removed an item from before it
-                    if idx < target_index:
-                        target_index -= 1
-
-            # insert items at a new position
-            for i, image_data in enumerate(reversed(images_to_move)):
-                self.images.insert(target_index, image_data)
+            count = len(self.images)
+            source_indices = sorted(idx for idx in {int(idx) for idx in indices_str.split(',')} if 0 <= idx < count)
+            moving = set(source_indices)
+
+            # build the new order in one pass: the remaining items with the moved block
+            # inserted at the target, keeping the moved items in their original order
+            remaining = [i for i in range(count) if i not in moving]
+            target_index -= sum(1 for idx in source_indices if idx < target_index)
+            order = remaining[:target_index] + source_indices + remaining[target_index:]
+
+            operation = ("reorder", order)
+            self.apply_operation(operation)
+            self.record_history(operation)
 
             # select the newly dropped items
-            self.selected_indices.clear()
-            for i in range(len(images_to_move)):
-                self.selected_indices.add(target_index + i)
+            self.selected_indices = set(range(target_index, target_index + len(source_indices)))
 
             self.hide_end_drop_zone()
             self.rebuild_grid()
@@ -759,12 +1182,48 @@ class ImageGridWidget(QWidget):
         self.thumbnail_size = size
         self.rebuild_grid()
 
+    def find_scroll_area(self):
+        """Returns the QScrollArea this grid is placed in, or None."""
+        parent_scroll = self.parent()
+        while parent_scroll and not isinstance(parent_scroll, QScrollArea):
+            parent_scroll = parent_scroll.parent()
+        return parent_scroll
+
+    def showEvent(self, event):
+        """Resolves the enclosing scroll area once, so calculate_columns doesn't walk the parents."""
+        super().showEvent(event)
+        if self._scroll_area is None:
+            self._scroll_area = self.find_scroll_area()
+
     def resizeEvent(self, event):
-        """Debounce grid rebuild on widget resize."""
+        """Debounce grid relayout on widget resize."""
         super().resizeEvent(event)
         self.resize_timer.start(100)
 
 
+class CustomScrollArea(QScrollArea):
+    """Scroll area that notifies the grid widget on resize and positions the floating buttons."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.grid_widget = None
+        self.floating_buttons = []  # (button, y) pairs kept at the right edge
+
+    def add_floating_button(self, button, y):
+        """Pins a child button to the right edge at the given height, above the grid."""
+        self.floating_buttons.append((button, y))
+        button.move(self.width() - 70, y)
+        button.raise_()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # pass resize event to grid to trigger debounced relayout
+        if self.grid_widget is not None:
+            self.grid_widget.resize_timer.start(150)
+        for button, y in self.floating_buttons:
+            button.move(self.width() - 70, y)
+
+
 class FlipbookApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -772,9 +1231,23 @@ class FlipbookApp(QMainWindow):
         self.setGeometry(100, 100, 900, 600)
 
         self.current_icon_size = 100
-        self.setWindowIcon(QIcon("icons/icon.png"))
+        self.image_loader = None  # the ImageLoader currently streaming in a folder, if any
+        # export gets its own pool so its scale tasks never queue behind a folder load's decodes
+        self.export_pool = QThreadPool(self)
+        self.setWindowIcon(QIcon(":/icons/icon.png"))
         self.current_bg_color = QColor(42, 42, 42)  # default bg
 
+        # coalesce the slider/spinbox value storms into one update per gesture
+        self._scale_timer = QTimer(self)
+        self._scale_timer.setSingleShot(True)
+        self._scale_timer.setInterval(50)
+        self._scale_timer.timeout.connect(self.update_resolution)
+
+        self._grid_timer = QTimer(self)
+        self._grid_timer.setSingleShot(True)
+        self._grid_timer.setInterval(100)
+        self._grid_timer.timeout.connect(self.apply_grid_change)
+
         main_widget = QWidget()
         main_layout = QHBoxLayout(main_widget)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -797,7 +1270,7 @@ class FlipbookApp(QMainWindow):
         left_frame_layout.addWidget(self.folder_button)
 
         grid_label = QLabel("Grid Layout:")
-        grid_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        grid_label.setObjectName("SectionLabel")
         left_frame_layout.addWidget(grid_label)
 
         grid_layout = QHBoxLayout()
@@ -818,7 +1291,7 @@ class FlipbookApp(QMainWindow):
         left_frame_layout.addLayout(grid_layout)
 
         bg_label = QLabel("Add Background:")
-        bg_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        bg_label.setObjectName("SectionLabel")
         left_frame_layout.addWidget(bg_label)
 
         bg_layout = QHBoxLayout()
@@ -828,17 +1301,10 @@ class FlipbookApp(QMainWindow):
         bg_layout.addWidget(self.bg_combo)
 
         self.color_picker_btn = QPushButton()
+        self.color_picker_btn.setObjectName("ColorSwatch")
         self.color_picker_btn.setFixedSize(30, 30)
-        self.color_picker_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: rgb({self.current_bg_color.red()}, {self.current_bg_color.green()}, {self.current_bg_color.blue()});
-                border: 2px solid #3a3a3a;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                border: 2px solid #3f51b5;
-            }}
-        """)
+        self._swatch_color = None
+        self.update_color_swatch(self.current_bg_color)
         self.color_picker_btn.clicked.connect(self.pick_background_color)
         self.color_picker_btn.setVisible(False)  # initially hidden
         bg_layout.addWidget(self.color_picker_btn)
@@ -846,7 +1312,7 @@ class FlipbookApp(QMainWindow):
         left_frame_layout.addLayout(bg_layout)
 
         scale_label = QLabel("Output Scale:")
-        scale_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
+        scale_label.setObjectName("SectionLabel")
         left_frame_layout.addWidget(scale_label)
 
         scale_container = QVBoxLayout()
@@ -858,47 +1324,39 @@ class FlipbookApp(QMainWindow):
         self.scale_slider.valueChanged.connect(self.on_scale_changed)
 
         self.scale_label = QLabel("100%")
-        self.scale_label.setStyleSheet("font-weight: bold; min-width: 45px;")
+        self.scale_label.setObjectName("ScaleValueLabel")
 
         scale_slider_layout.addWidget(self.scale_slider)
         scale_slider_layout.addWidget(self.scale_label)
         scale_container.addLayout(scale_slider_layout)
 
         self.scale_resolution_label = QLabel("Output: 0 x 0")
-        self.scale_resolution_label.setStyleSheet("color: #888888; font-size: 9pt;")
+        self.scale_resolution_label.setObjectName("ResolutionLabel")
         scale_container.addWidget(self.scale_resolution_label)
 
         left_frame_layout.addLayout(scale_container)
 
+        self.fast_png_checkbox = QCheckBox("Fast PNG")
+        self.fast_png_checkbox.setToolTip("Save PNGs with light compression: much faster, larger files")
+        left_frame_layout.addWidget(self.fast_png_checkbox)
+
         self.export_button = QPushButton("Export Flipbook")
-        self.export_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4caf50;
-                font-weight: bold;
-                padding: 12px;
-                margin-top: 20px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #2a2a2a;
-                color: #666666;
-            }
-        """)
+        self.export_button.setObjectName("ExportButton")
         self.export_button.clicked.connect(self.export_flipbook)
         self.export_button.setEnabled(False)
         left_frame_layout.addWidget(self.export_button)
 
+        # plain text, so the label doesn't need Qt's rich text engine to lay it out
         shortcuts_label = QLabel(
-            "<b>Shortcuts:</b><br>"
-            "Ctrl+Z - Undo<br>"
-            "Ctrl+Y / Ctrl+Shift+Z - Redo<br>"
-            "Delete - Remove selected<br>"
-            "Ctrl+Click - Multi-select<br>"
+            "Shortcuts:\n"
+            "Ctrl+Z - Undo\n"
+            "Ctrl+Y / Ctrl+Shift+Z - Redo\n"
+            "Delete - Remove selected\n"
+            "Ctrl+Click - Multi-select\n"
             "Shift+Click - Range select"
         )
-        shortcuts_label.setStyleSheet("color: #888888; font-size: 9pt; margin-top: 10px;")
+        shortcuts_label.setTextFormat(Qt.TextFormat.PlainText)
+        shortcuts_label.setObjectName("ShortcutsLabel")
         shortcuts_label.setWordWrap(True)
         left_frame_layout.addWidget(shortcuts_label)
 
@@ -911,23 +1369,11 @@ class FlipbookApp(QMainWindow):
         right_zone_layout.setSpacing(5)
         main_layout.addWidget(right_zone_widget, stretch=1)
 
-        # custom QScrollArea to notify the grid widget on resize
-        class CustomScrollArea(QScrollArea):
-            def __init__(self, parent=None):
-                super().__init__(parent)
-                self.grid_widget = None
-
-            def resizeEvent(self, event):
-                super().resizeEvent(event)
-                # pass resize event to grid to trigger debounced rebuild
-                if self.grid_widget and hasattr(self.grid_widget, 'resize_timer'):
-                    self.grid_widget.resize_timer.start(150)
-
         scroll_area = CustomScrollArea()
         scroll_area.setWidgetResizable(True)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet("QScrollArea { border: none; background-color: #1a1a1a; }")
+        scroll_area.setObjectName("GridScrollArea")
 
         self.image_grid = ImageGridWidget()
         scroll_area.setWidget(self.image_grid)
@@ -938,81 +1384,35 @@ class FlipbookApp(QMainWindow):
         right_zone_layout.addWidget(scroll_area, stretch=1)
 
         self.add_button = QToolButton(scroll_area)
+        self.add_button.setObjectName("AddButton")
         self.add_button.setFixedSize(50, 50)
         self.add_button.setToolTip("Add images")
         self.add_button.clicked.connect(self.add_images)
 
-        add_icon = QIcon("icons/add.png")
+        add_icon = QIcon(":/icons/add.png")
         if not add_icon.isNull():
             self.add_button.setIcon(add_icon)
             self.add_button.setIconSize(QSize(45, 45))
         else:
             self.add_button.setText("+")  # fallback if icon not found
 
-        self.add_button.setStyleSheet("""
-            QToolButton {
-                background-color: #3f51b5;
-                color: white;
-                border: none;
-                padding: 8px;
-                border-radius: 25px;
-                font-size: 24pt;
-                font-weight: bold;
-            }
-            QToolButton:hover {
-                background-color: #303f9f;
-            }
-        """)
-
         self.delete_button = QToolButton(scroll_area)
+        self.delete_button.setObjectName("DeleteButton")
         self.delete_button.setFixedSize(50, 50)
         self.delete_button.setToolTip("Delete selected images")
         self.delete_button.setEnabled(False)
         self.delete_button.clicked.connect(self.delete_selected_images)
 
-        delete_icon = QIcon("icons/delete.png")
+        delete_icon = QIcon(":/icons/delete.png")
         if not delete_icon.isNull():
             self.delete_button.setIcon(delete_icon)
             self.delete_button.setIconSize(QSize(45, 45))
         else:
             self.delete_button.setText("✕")  # fallback if icon not found
 
-        self.delete_button.setStyleSheet("""
-            QToolButton {
-                background-color: #f44336;
-                color: white;
-                border: none;
-                padding: 8px;
-                border-radius: 25px;
-                font-size: 24pt;
-                font-weight: bold;
-            }
-            QToolButton:hover {
-                background-color: #d32f2f;
-            }
-            QToolButton:disabled {
-                background-color: #2a2a2a;
-                color: #666666;
-            }
-        """)
-
-        self.add_button.move(scroll_area.width() - 70, 20)
-        self.delete_button.move(scroll_area.width() - 70, 80)
-        self.add_button.raise_()
-        self.delete_button.raise_()
-
-        # update FAB positions on scroll area resize
-        def update_button_positions():
-            self.add_button.move(scroll_area.width() - 70, 20)
-            self.delete_button.move(scroll_area.width() - 70, 80)
-
-        original_resize = scroll_area.resizeEvent
-
-        def new_resize_event(event):
-            original_resize(event)
-            update_button_positions()
-
-        scroll_area.resizeEvent = new_resize_event
+        # the scroll area keeps the FABs pinned to its top-right corner as it resizes
+        scroll_area.add_floating_button(self.add_button, 20)
+        scroll_area.add_floating_button(self.delete_button, 80)
 
         slider_frame = QFrame()
         slider_frame.setFixedHeight(40)
@@ -1025,7 +1425,7 @@ class FlipbookApp(QMainWindow):
         zoom_icon = QLabel()
         zoom_icon.setTextInteractionFlags(Qt.TextInteractionFlag.NoTextInteraction)
 
-        zoom_pixmap = QPixmap("icons/zoom.png")
+        zoom_pixmap = QPixmap(":/icons/zoom.png")
         if not zoom_pixmap.isNull():
             zoom_icon.setPixmap(zoom_pixmap.scaled(40, 40, Qt.AspectRatioMode.KeepAspectRatio,
                                                    Qt.TransformationMode.SmoothTransformation))
@@ -1066,6 +1466,7 @@ class FlipbookApp(QMainWindow):
         delete_action.triggered.connect(self.delete_selected_images)
         self.addAction(delete_action)
 
+    @Slot(str)
     def on_background_changed(self, text):
         """Handles the background type combo box change."""
         if text == "Solid Color":
@@ -1075,42 +1476,33 @@ class FlipbookApp(QMainWindow):
             self.color_picker_btn.setVisible(False)
             self.image_grid.set_background_color(QColor(0, 0, 0, 0))  # transparent
 
+    @Slot()
     def pick_background_color(self):
         """Opens the color picker dialog."""
         color = QColorDialog.getColor(self.current_bg_color, self, "Select Background Color")
         if color.isValid():
             self.current_bg_color = color
-            self.color_picker_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: rgb({color.red()}, {color.green()}, {color.blue()});
-                    border: 2px solid #3a3a3a;
-                    border-radius: 4px;
-                }}
-                QPushButton:hover {{
-                    border: 2px solid #3f51b5;
-                }}
-            """)
+            self.update_color_swatch(color)
             self.image_grid.set_background_color(color)
 
+    def update_color_swatch(self, color):
+        """Shows the color on the picker button, skipping the stylesheet reparse if it's unchanged."""
+        rgb = (color.red(), color.green(), color.blue())
+        if rgb == self._swatch_color:
+            return
+        self._swatch_color = rgb
+        self.color_picker_btn.setStyleSheet(COLOR_SWATCH_STYLE.format(r=rgb[0], g=rgb[1], b=rgb[2]))
+
     def eventFilter(self, obj, event):
         """Global event filter to clear selection when clicking outside a thumbnail."""
         if event.type() == event.Type.MouseButtonPress:
             if event.button() == Qt.MouseButton.LeftButton:
                 widget = QApplication.widgetAt(event.globalPosition().toPoint())
 
-                if widget is not None:
-                    parent_widget = widget
-                    is_thumbnail_or_dropzone = False
-
-                    # check if the click was on a thumbnail or its child
-                    while parent_widget is not None:
-                        if isinstance(parent_widget, (ImageThumbnail, DropZone)):
-                            is_thumbnail_or_dropzone = True
-                            break
-                        parent_widget = parent_widget.parent()
-
-                    if not is_thumbnail_or_dropzone:
-                        self.image_grid.clear_selection()
+                # thumbnails and drop zones are painted without child widgets, so the widget
+                # under the cursor is the item itself and no parent walk is needed
+                if widget is not None and widget.property("selectable") is not True:
+                    self.image_grid.clear_selection()
 
         return super().eventFilter(obj, event)
 
@@ -1120,16 +1512,30 @@ class FlipbookApp(QMainWindow):
         if image_count == 0:
             return 1, 1
 
-        import math
         rows = math.ceil(math.sqrt(image_count))
-        cols = rows
-
-        # try to make it rectangular if possible
-        while (cols - 1) * rows >= image_count:
-            cols -= 1
+        # try to make it rectangular if possible: the fewest columns that still fit everything
+        cols = -(-image_count // rows)
 
         return rows, cols
 
+    def apply_min_grid_size(self):
+        """Resets the grid inputs to the squarest grid for the current images and updates the labels once."""
+        cols, rows = self.get_min_grid_size()
+        # set both values silently, so on_grid_changed doesn't run once per spinbox
+        self.columns_input.blockSignals(True)
+        self.rows_input.blockSignals(True)
+        # drop the old minimums first, or the smaller grid after a delete would be clamped to them
+        self.columns_input.setMinimum(1)
+        self.rows_input.setMinimum(1)
+        self.columns_input.setValue(cols)
+        self.rows_input.setValue(rows)
+        self.columns_input.blockSignals(False)
+        self.rows_input.blockSignals(False)
+
+        self._grid_timer.stop()
+        self.update_grid_constraints()
+        self.update_resolution()
+
     def update_grid_constraints(self):
         """Prevents the user from setting a grid size too small to hold all images."""
         if not self.image_grid.images:
@@ -1141,9 +1547,9 @@ class FlipbookApp(QMainWindow):
         current_cols = self.columns_input.value()
         current_rows = self.rows_input.value()
 
-        import math
-        min_rows = math.ceil(image_count / current_cols)
-        min_cols = math.ceil(image_count / current_rows)
+        # ceil division in integers
+        min_rows = -(-image_count // current_cols)
+        min_cols = -(-image_count // current_rows)
 
         # block signals to prevent feedback loop
         self.columns_input.blockSignals(True)
@@ -1161,18 +1567,34 @@ class FlipbookApp(QMainWindow):
         self.columns_input.blockSignals(False)
         self.rows_input.blockSignals(False)
 
+    @Slot()
     def on_grid_changed(self):
-        """Called when columns or rows spinbox is changed."""
+        """Called when columns or rows spinbox is changed; the update is debounced."""
+        self._grid_timer.start()
+
+    @Slot()
+    def apply_grid_change(self):
+        """Applies the changed grid size to the constraints and the resolution label."""
         self.update_grid_constraints()
         self.update_resolution()
-        self.on_scale_changed()
 
+    @Slot()
     def on_scale_changed(self):
-        """Called when scale slider is moved."""
+        """Called when scale slider is moved; the resolution update is debounced."""
         scale = self.scale_slider.value()
         self.scale_label.setText(f"{scale}%")
-        self.update_resolution()
+        self._scale_timer.start()
+
+    def flush_pending_updates(self):
+        """Runs any debounced grid/scale update right away."""
+        if self._grid_timer.isActive():
+            self._grid_timer.stop()
+            self.apply_grid_change()
+        if self._scale_timer.isActive():
+            self._scale_timer.stop()
+            self.update_resolution()
 
+    @Slot()
     def update_resolution(self):
         """Updates the 'Output: W x H' label based on grid and scale."""
         if not self.image_grid.images:
@@ -1180,7 +1602,7 @@ class FlipbookApp(QMainWindow):
             return
 
         # assume all images are the same size as the first
-        first_image = self.image_grid.images[0][0]
+        first_image = self.image_grid.images[0].image
         cell_width = first_image.width()
         cell_height = first_image.height()
 
@@ -1203,8 +1625,10 @@ class FlipbookApp(QMainWindow):
         self.scale_resolution_label.setText(
             f"Output: {output_width} x {output_height} (Cell: {scaled_cell_width} x {scaled_cell_height})")
 
+    @Slot()
     def export_flipbook(self):
         """Generates and saves the final flipbook texture."""
+        self.flush_pending_updates()
         if not self.image_grid.images:
             print("No images to export")
             return
@@ -1224,84 +1648,20 @@ class FlipbookApp(QMainWindow):
             columns = self.columns_input.value()
             rows = self.rows_input.value()
 
-            first_pixmap = self.image_grid.images[0][0]
-            cell_width = first_pixmap.width()
-            cell_height = first_pixmap.height()
+            first_image = self.image_grid.images[0].image
+            cell_width = first_image.width()
+            cell_height = first_image.height()
 
             original_width = cell_width * columns
             original_height = cell_height * rows
 
-            flipbook_texture = QPixmap(original_width, original_height)
-
-            # fill the texture based on background settings
-            if self.bg_combo.currentText() == "Transparency":
-                flipbook_texture.fill(Qt.GlobalColor.transparent)
-            else:
-                flipbook_texture.fill(self.current_bg_color)
-
-            painter = QPainter(flipbook_texture)
-
-            for idx, (pixmap, filename, full_path) in enumerate(self.image_grid.images):
-                if idx >= columns * rows:
-                    break  # stop if we have more images than grid cells
-
-                row = idx // columns
-                col = idx % columns
-
-                x = col * cell_width
-                y = row * cell_height
-
-                # ensure the image is scaled to fit a cell if it's a different size
-                if pixmap.width() != cell_width or pixmap.height() != cell_height:
-                    scaled_pixmap = pixmap.scaled(
-                        cell_width, cell_height,
-                        Qt.AspectRatioMode.IgnoreAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-                    painter.drawPixmap(x, y, scaled_pixmap)
-                else:
-                    painter.drawPixmap(x, y, pixmap)
-
-            painter.end()
-
-            # apply final output scaling
+            # final output size after scaling
             scale = self.scale_slider.value() / 100.0
             output_width = int(original_width * scale)
             output_height = int(original_height * scale)
 
-            if output_width != original_width or output_height != original_height:
-                flipbook_texture = flipbook_texture.scaled(
-                    output_width, output_height,
-                    Qt.AspectRatioMode.IgnoreAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-
-            image = flipbook_texture.toImage()
-
-            if file_path.lower().endswith(('.jpg', '.jpeg')):
-                image.save(file_path, "JPEG", 95)
-            elif file_path.lower().endswith('.png'):
-                image.save(file_path, "PNG")
-            elif file_path.lower().endswith('.webp'):
-                image.save(file_path, "WEBP")
-            elif file_path.lower().endswith('.bmp'):
-                image.save(file_path, "BMP")
-            elif file_path.lower().endswith(('.tiff', '.tif')):
-                image.save(file_path, "TIFF")
-            elif file_path.lower().endswith('.tga'):
-                # special handling for TGA via PIL, as Qt's TGA support can be flaky
-                buffer = image.bits().tobytes()
-                pil_image = Image.frombytes(
-                    'RGBA',
-                    (image.width(), image.height()),
-                    buffer,
-                    'raw',
-                    'BGRA'
-                )
-                pil_image.save(file_path, "TGA")
-            else:
-                # default to PNG
-                image.save(file_path, "PNG")
+            image = self.render_flipbook(columns, rows, output_width, output_height)
+            self.save_flipbook(image, file_path)
 
             print(f"Flipbook exported successfully: {file_path}")
 
@@ -1310,40 +1670,144 @@ class FlipbookApp(QMainWindow):
             import traceback
             traceback.print_exc()
 
+    def render_flipbook(self, columns, rows, output_width, output_height):
+        """Paints the grid's frames into a new atlas of the given output size and returns it.
+
+        Keeping this in its own method frees the cell list and scaled copies on return, before
+        the atlas is encoded.
+        """
+        # build the atlas as a QImage so it can be saved without a pixmap round trip
+        flipbook_texture = QImage(output_width, output_height, QImage.Format.Format_ARGB32_Premultiplied)
+
+        # fill the texture based on background settings
+        painter = QPainter()
+        if self.bg_combo.currentText() == "Transparency":
+            flipbook_texture.fill(Qt.GlobalColor.transparent)
+            painter.begin(flipbook_texture)
+            # nothing to blend with, so frames are copied in rather than alpha blended
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        else:
+            flipbook_texture.fill(self.current_bg_color)
+            painter.begin(flipbook_texture)
+
+        # stop if we have more images than grid cells
+        frames = [entry.image for entry in self.image_grid.images[:columns * rows]]
+
+        # frames used in several cells (held frames, duplicates) are only scaled once per cell size
+        repeats = Counter(frame.cacheKey() for frame in frames)
+        scaled_frames = {}
+
+        cells = []
+        for idx, frame in enumerate(frames):
+            row = idx // columns
+            col = idx % columns
+
+            # cell bounds in the output, rounded so neighbouring cells share an edge exactly
+            x = col * output_width // columns
+            y = row * output_height // rows
+            width = (col + 1) * output_width // columns - x
+            height = (row + 1) * output_height // rows - y
+            cells.append((x, y, width, height, frame))
+
+        # frames are fitted to their cells in a single smooth scale, in parallel for large outputs,
+        # a few threads' worth at a time so only one wave of scaled copies is held in memory at once
+        if output_width * output_height >= PARALLEL_EXPORT_PIXELS:
+            pool = self.export_pool
+            wave_size = max(1, pool.maxThreadCount()) * 2
+        else:
+            pool = None
+            wave_size = 1
+        for start in range(0, len(cells), wave_size):
+            wave = cells[start:start + wave_size]
+
+            jobs = {}
+            for _, _, width, height, frame in wave:
+                key = (frame.cacheKey(), width, height)
+                if (frame.width(), frame.height()) != (width, height) and key not in scaled_frames:
+                    jobs[key] = (frame, width, height)
+            wave_scaled = scale_images(jobs, pool)
+
+            for x, y, width, height, frame in wave:
+                if (frame.width(), frame.height()) != (width, height):
+                    key = (frame.cacheKey(), width, height)
+                    scaled_frame = scaled_frames[key] if key in scaled_frames else wave_scaled[key]
+                    if repeats[key[0]] > 1:
+                        scaled_frames[key] = scaled_frame
+                    painter.drawImage(x, y, scaled_frame)
+                else:
+                    painter.drawImage(x, y, frame)
+
+        painter.end()
+
+        return flipbook_texture
+
+    def save_flipbook(self, image, file_path):
+        """Encodes the atlas to file_path in the format given by its extension."""
+        if file_path.lower().endswith(('.jpg', '.jpeg')):
+            image.save(file_path, "JPEG", 95)
+        elif file_path.lower().endswith('.png'):
+            image.save(file_path, "PNG", FAST_PNG_QUALITY if self.fast_png_checkbox.isChecked() else -1)
+        elif file_path.lower().endswith('.webp'):
+            image.save(file_path, "WEBP")
+        elif file_path.lower().endswith('.bmp'):
+            image.save(file_path, "BMP")
+        elif file_path.lower().endswith(('.tiff', '.tif')):
+            image.save(file_path, "TIFF")
+        elif file_path.lower().endswith('.tga'):
+            # special handling for TGA via PIL, as Qt's TGA support can be flaky.
+            # convert to straight-alpha RGBA in place and let PIL read the pixels from it,
+            # so the atlas is never held twice
+            image.convertTo(QImage.Format.Format_RGBA8888)
+            pil_image = Image.frombuffer(
+                'RGBA',
+                (image.width(), image.height()),
+                image.constBits(),
+                'raw',
+                'RGBA',
+                image.bytesPerLine(),
+                1
+            )
+            pil_image.save(file_path, "TGA")
+        else:
+            # default to PNG
+            image.save(file_path, "PNG")
+
+    @Slot()
     def undo(self):
         """Wrapper for grid undo that also updates the UI state."""
         self.image_grid.undo()
-        cols, rows = self.get_min_grid_size()
-        self.columns_input.setValue(cols)
-        self.rows_input.setValue(rows)
-        self.update_grid_constraints()
-        self.update_resolution()
+        self.apply_min_grid_size()
 
+    @Slot()
     def redo(self):
         """Wrapper for grid redo that also updates the UI state."""
         self.image_grid.redo()
-        cols, rows = self.get_min_grid_size()
-        self.columns_input.setValue(cols)
-        self.rows_input.setValue(rows)
-        self.update_grid_constraints()
-        self.update_resolution()
+        self.apply_min_grid_size()
 
+    @Slot()
     def delete_selected_images(self):
         """Wrapper for grid delete that also updates the UI state."""
         self.image_grid.delete_selected()
 
         # reset the grid to the smallest possible size
-        cols, rows = self.get_min_grid_size()
-        self.columns_input.setValue(cols)
-        self.rows_input.setValue(rows)
-        self.update_grid_constraints()
-        self.update_resolution()
+        self.apply_min_grid_size()
 
+    @Slot()
     def update_delete_button_state(self):
         """Enables/disables the delete button based on selection."""
         has_selection = len(self.image_grid.selected_indices) > 0
         self.delete_button.setEnabled(has_selection)
 
+    def start_loader(self, file_paths, on_batch, batch_size=ImageLoader.BATCH_SIZE):
+        """Starts decoding files in the background, cancelling any load still in progress."""
+        if self.image_loader is not None:
+            self.image_loader.cancel()
+        self.image_loader = ImageLoader(file_paths, on_batch, self.on_loader_finished, self, batch_size)
+        # appending while a load streams in would interleave the two sets of frames
+        self.add_button.setEnabled(False)
+        self.image_loader.start()
+
+    @Slot()
     def add_images(self):
         """Opens file dialog to append images to the grid."""
         file_paths, _ = QFileDialog.getOpenFileNames(
@@ -1356,44 +1820,21 @@ class FlipbookApp(QMainWindow):
         if not file_paths:
             return
 
-        images_data = []
-        for full_path in file_paths:
-            filename = os.path.basename(full_path)
-
-            if not filename.lower().endswith(IMAGE_EXTENSIONS):
-                continue
-
-            pixmap = QPixmap(full_path)
-
-            # fallback to PIL for formats QPixmap might not support (e.g., some TGA/WebP)
-            if pixmap.isNull():
-                try:
-                    pil_image = Image.open(full_path)
-                    pil_image = pil_image.convert("RGBA")
-                    data = pil_image.tobytes("raw", "RGBA")
-                    q_image = QImage(data, pil_image.width, pil_image.height, QImage.Format.Format_RGBA8888)
-                    pixmap = QPixmap.fromImage(q_image)
-
-                    if pixmap.isNull():
-                        continue
-
-                except Exception as e:
-                    print(f"Warning: Could not load image {full_path} with PIL: {e}")
-                    continue
-
-            images_data.append((pixmap, filename, full_path))
+        file_paths = [p for p in file_paths if is_supported_image(p)]
+        if file_paths:
+            # deliver everything in one batch so the whole add stays a single undo step
+            self.start_loader(file_paths, self.on_added_images_loaded, batch_size=len(file_paths))
 
+    def on_added_images_loaded(self, images_data):
+        """Appends the frames picked in add_images once they have all been decoded."""
         if images_data:
             self.image_grid.append_images(images_data)
 
-            cols, rows = self.get_min_grid_size()
-            self.columns_input.setValue(cols)
-            self.rows_input.setValue(rows)
-            self.update_grid_constraints()
-            self.update_resolution()
+            self.apply_min_grid_size()
 
             self.export_button.setEnabled(True)
 
+    @Slot()
     def select_folder(self):
         """Opens the folder dialog to load and replace all images."""
         folder_path = QFileDialog.getExistingDirectory(self, "Select Image Folder")
@@ -1403,65 +1844,66 @@ class FlipbookApp(QMainWindow):
 
         try:
             # load and sort all supported images from the folder
-            file_list = sorted(
-                [f for f in os.listdir(folder_path) if f.lower().endswith(IMAGE_EXTENSIONS)],
-                key=lambda f: f.lower()
-            )
+            # sort on the lowercased name computed once per file, keeping the full path alongside
+            with os.scandir(folder_path) as entries:
+                file_list = sorted(
+                    (entry.name.lower(), entry.path) for entry in entries
+                    if is_supported_image(entry.name) and entry.is_file()
+                )
 
             if not file_list:
                 return
 
-            images_data = []
-            for filename in file_list:
-                full_path = os.path.join(folder_path, filename)
-
-                pixmap = QPixmap(full_path)
-
-                # fallback to PIL
-                if pixmap.isNull():
-                    try:
-                        pil_image = Image.open(full_path)
-                        pil_image = pil_image.convert("RGBA")
-                        data = pil_image.tobytes("raw", "RGBA")
-                        q_image = QImage(data, pil_image.width, pil_image.height, QImage.Format.Format_RGBA8888)
-                        pixmap = QPixmap.fromImage(q_image)
+            # replace the current images right away; decoded frames stream in batch by batch.
+            # the old frames are kept alive until the loader has looked them up, so reloading
+            # the same folder reuses any unchanged files instead of decoding them again
+            previous_images = self.image_grid.images
+            self.image_grid.add_images([])
+            self.start_loader([path for _, path in file_list], self.on_folder_batch_loaded)
+            del previous_images
 
-                        if pixmap.isNull():
-                            continue
-                    except Exception as e:
-                        print(f"Warning: Could not load image {full_path} with PIL: {e}")
-                        continue
-
-                images_data.append((pixmap, filename, full_path))
+        except Exception as e:
+            print(f"Error loading images: {e}")
 
-            self.image_grid.add_images(images_data)
+    def on_folder_batch_loaded(self, images_data):
+        """Appends a batch of frames from a folder load; loading a folder is not an undoable edit."""
+        self.image_grid.append_images(images_data, record_history=False)
 
-            cols, rows = self.get_min_grid_size()
-            self.columns_input.setValue(cols)
-            self.rows_input.setValue(rows)
-            self.update_grid_constraints()
-            self.update_resolution()
+        self.apply_min_grid_size()
 
-            self.export_button.setEnabled(True)
+        self.export_button.setEnabled(True)
 
-        except Exception as e:
-            print(f"Error loading images: {e}")
+    def on_loader_finished(self):
+        """Forgets the loader once it has delivered everything."""
+        self.image_loader = None
+        self.add_button.setEnabled(True)
 
+    @Slot(int)
     def on_slider_change(self, value):
         """Applies the thumbnail size slider value to the grid."""
         self.current_icon_size = value
         self.image_grid.set_thumbnail_size(value)
 
     def resizeEvent(self, event):
-        """Triggers a grid rebuild on window resize."""
+        """Triggers a grid relayout on window resize."""
         super().resizeEvent(event)
         if hasattr(self, 'image_grid'):
             self.image_grid.resize_timer.start(100)
 
+    def closeEvent(self, event):
+        """Cancels a folder load still in progress so quitting doesn't wait for its decodes."""
+        if self.image_loader is not None:
+            self.image_loader.cancel()
+            self.image_loader = None
+        # drop decode tasks that haven't started; the ones already running finish on their own
+        QThreadPool.globalInstance().clear()
+        super().closeEvent(event)
+
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setStyleSheet(STYLESHEET)
+    QPixmapCache.setCacheLimit(THUMBNAIL_CACHE_LIMIT)
 
     window = FlipbookApp()
     window.show()
@@ -0,0 +1,14050 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\xc7\xfd\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5cr\xa8f\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x0aIiCCPsRGB IEC\
+61966-2.1\x00\x00H\x89\x9dSw\
+X\x93\xf7\x16>\xdf\xf7e\x0fVB\xd8\xf0\xb1\x97l\
+\x81\x00\x22#\xac\x08\xc8\x10Y\xa2\x10\x92\x00a\x84\x10\
+\x12@\xc5\x85\x88\x0aV\x14\x15\x11\x9cHU\xc4\x82\xd5\
+\x0aH\x9d\x88\xe2\xa0(\xb8gA\x8a\x88Z\x8bU\x5c\
+8\xee\x1f\xdc\xa7\xb5}z\xef\xed\xed\xfb\xd7\xfb\xbc\xe7\
+\x9c\xe7\xfc\xcey\xcf\x0f\x80\x11\x12&\x91\xe6\xa2j\x00\
+9R\x85<:\xd8\x1f\x8fOH\xc4\xc9\xbd\x80\x02\x15\
+H\xe0\x04 \x10\xe6\xcb\xc2g\x05\xc5\x00\x00\xf0\x03y\
+x~t\xb0?\xfc\x01\xafo\x00\x02\x00p\xd5.$\
+\x12\xc7\xe1\xff\x83\xbaP&W\x00 \x91\x00\xe0\x22\x12\
+\xe7\x0b\x01\x90R\x00\xc8.T\xc8\x14\x00\xc8\x18\x00\xb0\
+S\xb3d\x0a\x00\x94\x00\x00ly|B\x22\x00\xaa\x0d\
+\x00\xec\xf4I>\x05\x00\xd8\xa9\x93\xdc\x17\x00\xd8\xa2\x1c\
+\xa9\x08\x00\x8d\x01\x00\x99(G$\x02@\xbb\x00`U\
+\x81R,\x02\xc0\xc2\x00\xa0\xac@\x22.\x04\xc0\xae\x01\
+\x80Y\xb62G\x02\x80\xbd\x05\x00v\x8eX\x90\x0f@\
+`\x00\x80\x99B,\xcc\x00 8\x02\x00C\x1e\x13\xcd\
+\x03 L\x03\xa00\xd2\xbf\xe0\xa9_p\x85\xb8H\x01\
+\x00\xc0\xcb\x95\xcd\x97K\xd23\x14\xb8\x95\xd0\x1aw\xf2\
+\xf0\xe0\xe2!\xe2\xc2l\xb1Ba\x17)\x10f\x09\xe4\
+\x22\x9c\x97\x9b#\x13H\xe7\x03L\xce\x0c\x00\x00\x1a\xf9\
+\xd1\xc1\xfe8?\x90\xe7\xe6\xe4\xe1\xe6f\xe7l\xef\xf4\
+\xc5\xa2\xfek\xf0o\x22>!\xf1\xdf\xfe\xbc\x8c\x02\x04\
+\x00\x10N\xcf\xef\xda_\xe5\xe5\xd6\x03p\xc7\x01\xb0u\
+\xbfk\xa9[\x00\xdaV\x00h\xdf\xf9]3\xdb\x09\xa0\
+Z\x0a\xd0z\xf9\x8by8\xfc@\x1e\x9e\xa1P\xc8<\
+\x1d\x1c\x0a\x0b\x0b\xed%b\xa1\xbd0\xe3\x8b>\xff3\
+\xe1o\xe0\x8b~\xf6\xfc@\x1e\xfe\xdbz\xf0\x00q\x9a\
+@\x99\xad\xc0\xa3\x83\xfdqanv\xaeR\x8e\xe7\xcb\
+\x04B1n\xf7\xe7#\xfe\xc7\x85\x7f\xfd\x8e)\xd1\xe2\
+4\xb1\x5c,\x15\x8a\xf1X\x89\xb8P\x22M\xc7y\xb9\
+R\x91D!\xc9\x95\xe2\x12\xe9\x7f2\xf1\x1f\x96\xfd\x09\
+\x93w\x0d\x00\xac\x86O\xc0N\xb6\x07\xb5\xcbl\xc0~\
+\xee\x01\x02\x8b\x0eX\xd2v\x00@~\xf3-\x8c\x1a\x0b\
+\x91\x00\x10g42y\xf7\x00\x00\x93\xbf\xf9\x8f@+\
+\x01\x00\xcd\x97\xa4\xe3\x00\x00\xbc\xe8\x18\x5c\xa8\x94\x17L\
+\xc6\x08\x00\x00D\xa0\x81*\xb0A\x07\x0c\xc1\x14\xac\xc0\
+\x0e\x9c\xc1\x1d\xbc\xc0\x17\x02a\x06D@\x0c$\xc0<\
+\x10B\x06\xe4\x80\x1c\x0a\xa1\x18\x96A\x19T\xc0:\xd8\
+\x04\xb5\xb0\x03\x1a\xa0\x11\x9a\xe1\x10\xb4\xc118\x0d\xe7\
+\xe0\x12\x5c\x81\xebp\x17\x06`\x18\x9e\xc2\x18\xbc\x86\x09\
+\x04A\xc8\x08\x13a!:\x88\x11b\x8e\xd8\x22\xce\x08\
+\x17\x99\x8e\x04\x22aH4\x92\x80\xa4 \xe9\x88\x14Q\
+\x22\xc5\xc8r\xa4\x02\xa9Bj\x91]H#\xf2-r\
+\x149\x8d\x5c@\xfa\x90\xdb\xc8 2\x8a\xfc\x8a\xbcG\
+1\x94\x81\xb2Q\x03\xd4\x02u@\xb9\xa8\x1f\x1a\x8a\xc6\
+\xa0s\xd1t4\x0f]\x80\x96\xa2k\xd1\x1a\xb4\x1e=\
+\x80\xb6\xa2\xa7\xd1K\xe8ut\x00}\x8a\x8ec\x80\xd1\
+1\x0ef\x8c\xd9a\x5c\x8c\x87E`\x89X\x1a&\xc7\
+\x16c\xe5X5V\x8f5c\x1dX7v\x15\x1b\xc0\
+\x9ea\xef\x08$\x02\x8b\x80\x13\xec\x08^\x84\x10\xc2l\
+\x82\x90\x90GXLXC\xa8%\xec#\xb4\x12\xba\x08\
+W\x09\x83\x841\xc2'\x22\x93\xa8O\xb4%z\x12\xf9\
+\xc4xb:\xb1\x90XF\xac&\xee!\x1e!\x9e%\
+^'\x0e\x13_\x93H$\x0e\xc9\x92\xe4N\x0a!%\
+\x902I\x0bIkH\xdbH-\xa4S\xa4>\xd2\x10\
+i\x9cL&\xeb\x90m\xc9\xde\xe4\x08\xb2\x80\xac \x97\
+\x91\xb7\x90\x0f\x90O\x92\xfb\xc9\xc3\xe4\xb7\x14:\xc5\x88\
+\xe2L\x09\xa2$R\xa4\x94\x12J5e?\xe5\x04\xa5\
+\x9f2B\x99\xa0\xaaQ\xcd\xa9\x9e\xd4\x08\xaa\x88:\x9f\
+ZIm\xa0vP/S\x87\xa9\x134u\x9a%\xcd\
+\x9b\x16C\xcb\xa4-\xa3\xd5\xd0\x9aigi\xf7h/\
+\xe9t\xba\x09\xdd\x83\x1eE\x97\xd0\x97\xd2k\xe8\x07\xe9\
+\xe7\xe9\x83\xf4w\x0c\x0d\x86\x0d\x83\xc7Hb(\x19k\
+\x19{\x19\xa7\x18\xb7\x19/\x99L\xa6\x05\xd3\x97\x99\xc8\
+T0\xd72\x1b\x99g\x98\x0f\x98oUX*\xf6*\
+|\x15\x91\xca\x12\x95:\x95V\x95~\x95\xe7\xaaTU\
+sU?\xd5y\xaa\x0bT\xabU\x0f\xab^V}\xa6\
+FU\xb3P\xe3\xa9\x09\xd4\x16\xab\xd5\xa9\x1dU\xbb\xa9\
+6\xae\xceRwR\x8fP\xcfQ_\xa3\xbe_\xfd\x82\
+\xfac\x0d\xb2\x86\x85F\xa0\x86H\xa3Tc\xb7\xc6\x19\
+\x8d!\x16\xc62e\xf1XB\xd6rV\x03\xeb,k\
+\x98Mb[\xb2\xf9\xecLv\x05\xfb\x1bv/{L\
+SCs\xaaf\xacf\x91f\x9d\xe6q\xcd\x01\x0e\xc6\
+\xb1\xe0\xf09\xd9\x9cJ\xce!\xce\x0d\xce{-\x03-\
+?-\xb1\xd6j\xadf\xad~\xad7\xdaz\xda\xbe\xda\
+b\xedr\xed\x16\xed\xeb\xda\xefup\x9d@\x9d,\x9d\
+\xf5:m:\xf7u\x09\xba6\xbaQ\xba\x85\xba\xdbu\
+\xcf\xea>\xd3c\xeby\xe9\x09\xf5\xca\xf5\x0e\xe9\xdd\xd1\
+G\xf5m\xf4\xa3\xf5\x17\xea\xef\xd6\xef\xd1\x1f704\
+\x086\x90\x19l18c\xf0\xcc\x90c\xe8k\x98i\
+\xb8\xd1\xf0\x84\xe1\xa8\x11\xcbh\xba\x91\xc4h\xa3\xd1I\
+\xa3'\xb8&\xee\x87g\xe35x\x17>f\xaco\x1c\
+b\xac4\xdee\xdck<abi2\xdb\xa4\xc4\xa4\
+\xc5\xe4\xbe)\xcd\x94k\x9af\xba\xd1\xb4\xd3t\xcc\xcc\
+\xc8,\xdc\xac\xd8\xac\xc9\xec\x8e9\xd5\x9ck\x9ea\xbe\
+\xd9\xbc\xdb\xfc\x8d\x85\xa5E\x9c\xc5J\x8b6\x8b\xc7\x96\
+\xda\x96|\xcb\x05\x96M\x96\xf7\xac\x98V>VyV\
+\xf5V\xd7\xacI\xd6\x5c\xeb,\xebm\xd6WlP\x1b\
+W\x9b\x0c\x9b:\x9b\xcb\xb6\xa8\xad\x9b\xad\xc4v\x9bm\
+\xdf\x14\xe2\x14\x8f)\xd2)\xf5Sn\xda1\xec\xfc\xec\
+\x0a\xec\x9a\xec\x06\xed9\xf6a\xf6%\xf6m\xf6\xcf\x1d\
+\xcc\x1c\x12\x1d\xd6;t;|rtu\xccvlp\
+\xbc\xeb\xa4\xe14\xc3\xa9\xc4\xa9\xc3\xe9Wg\x1bg\xa1\
+s\x9d\xf35\x17\xa6K\x90\xcb\x12\x97v\x97\x17Sm\
+\xa7\x8a\xa7n\x9fz\xcb\x95\xe5\x1a\xee\xba\xd2\xb5\xd3\xf5\
+\xa3\x9b\xbb\x9b\xdc\xad\xd9m\xd4\xdd\xcc=\xc5}\xab\xfb\
+M.\x9b\x1b\xc9]\xc3=\xefA\xf4\xf0\xf7X\xe2q\
+\xcc\xe3\x9d\xa7\x9b\xa7\xc2\xf3\x90\xe7/^v^Y^\
+\xfb\xbd\x1eO\xb3\x9c&\x9e\xd60m\xc8\xdb\xc4[\xe0\
+\xbd\xcb{`:>=e\xfa\xce\xe9\x03>\xc6>\x02\
+\x9fz\x9f\x87\xbe\xa6\xbe\x22\xdf=\xbe#~\xd6~\x99\
+~\x07\xfc\x9e\xfb;\xfa\xcb\xfd\x8f\xf8\xbf\xe1y\xf2\x16\
+\xf1N\x05`\x01\xc1\x01\xe5\x01\xbd\x81\x1a\x81\xb3\x03k\
+\x03\x1f\x04\x99\x04\xa5\x075\x05\x8d\x05\xbb\x06/\x0c>\
+\x15B\x0c\x09\x0dY\x1fr\x93o\xc0\x17\xf2\x1b\xf9c\
+3\xdcg,\x9a\xd1\x15\xca\x08\x9d\x15Z\x1b\xfa0\xcc\
+&L\x1e\xd6\x11\x8e\x86\xcf\x08\xdf\x10~o\xa6\xf9L\
+\xe9\xcc\xb6\x08\x88\xe0Gl\x88\xb8\x1fi\x19\x99\x17\xf9\
+}\x14)*2\xaa.\xeaQ\xb4Stqt\xf7,\
+\xd6\xac\xe4Y\xfbg\xbd\x8e\xf1\x8f\xa9\x8c\xb9;\xdbj\
+\xb6rvg\xacjlRlc\xec\x9b\xb8\x80\xb8\xaa\
+\xb8\x81x\x87\xf8E\xf1\x97\x12t\x13$\x09\xed\x89\xe4\
+\xc4\xd8\xc4=\x89\xe3s\x02\xe7l\x9a3\x9c\xe4\x9aT\
+\x96tc\xae\xe5\xdc\xa2\xb9\x17\xe6\xe9\xce\xcb\x9ew<\
+Y5Y\x90|8\x85\x98\x12\x97\xb2?\xe5\x83 B\
+P/\x18O\xe5\xa7nM\x1d\x13\xf2\x84\x9b\x85OE\
+\xbe\xa2\x8d\xa2Q\xb1\xb7\xb8J<\x92\xe6\x9dV\x95\xf6\
+8\xdd;}C\xfah\x86OFu\xc63\x09OR\
++y\x91\x19\x92\xb9#\xf3MVD\xd6\xde\xac\xcf\xd9\
+q\xd9-9\x94\x9c\x94\x9c\xa3R\x0di\x96\xb4+\xd7\
+0\xb7(\xb7Of++\x93\x0d\xe4y\xe6m\xca\x1b\
+\x93\x87\xca\xf7\xe4#\xf9s\xf3\xdb\x15l\x85L\xd1\xa3\
+\xb4R\xaeP\x0e\x16L/\xa8+x[\x18[x\xb8\
+H\xbdHZ\xd43\xdff\xfe\xea\xf9#\x0b\x82\x16|\
+\xbd\x90\xb0P\xb8\xb0\xb3\xd8\xb8xY\xf1\xe0\x22\xbfE\
+\xbb\x16#\x8bS\x17w.1]R\xbadxi\xf0\
+\xd2}\xcbh\xcb\xb2\x96\xfdP\xe2XRU\xf2jy\
+\xdc\xf2\x8eR\x83\xd2\xa5\xa5C+\x82W4\x95\xa9\x94\
+\xc9\xcbn\xae\xf4Z\xb9c\x15a\x95dU\xefj\x97\
+\xd5[V\x7f*\x17\x95_\xacp\xac\xa8\xae\xf8\xb0F\
+\xb8\xe6\xe2WN_\xd5|\xf5ym\xda\xda\xdeJ\xb7\
+\xca\xed\xebH\xeb\xa4\xebn\xac\xf7Y\xbf\xafJ\xbdj\
+A\xd5\xd0\x86\xf0\x0d\xad\x1b\xf1\x8d\xe5\x1b_mJ\xde\
+t\xa1zj\xf5\x8e\xcd\xb4\xcd\xca\xcd\x035a5\xed\
+[\xcc\xb6\xac\xdb\xf2\xa16\xa3\xf6z\x9d\x7f]\xcbV\
+\xfd\xad\xab\xb7\xbe\xd9&\xda\xd6\xbf\xddw{\xf3\x0e\x83\
+\x1d\x15;\xde\xef\x94\xec\xbc\xb5+xWk\xbdE}\
+\xf5n\xd2\xee\x82\xdd\x8f\x1ab\x1b\xba\xbf\xe6~\xdd\xb8\
+GwO\xc5\x9e\x8f{\xa5{\x07\xf6E\xef\xebjt\
+ol\xdc\xaf\xbf\xbf\xb2\x09mR6\x8d\x1eH:p\
+\xe5\x9b\x80o\xda\x9b\xed\x9aw\xb5pZ*\x0e\xc2A\
+\xe5\xc1'\xdf\xa6|{\xe3P\xe8\xa1\xce\xc3\xdc\xc3\xcd\
+\xdf\x99\x7f\xb7\xf5\x08\xebHy+\xd2:\xbfu\xac-\
+\xa3m\xa0=\xa1\xbd\xef\xe8\x8c\xa3\x9d\x1d^\x1dG\xbe\
+\xb7\xff~\xef1\xe3cu\xc75\x8fW\x9e\xa0\x9d(\
+=\xf1\xf9\xe4\x82\x93\xe3\xa7d\xa7\x9e\x9dN?=\xd4\
+\x99\xdcy\xf7L\xfc\x99k]Q]\xbdgC\xcf\x9e\
+?\x17t\xeeL\xb7_\xf7\xc9\xf3\xde\xe7\x8f]\xf0\xbc\
+p\xf4\x22\xf7b\xdb%\xb7K\xad=\xae=G~p\
+\xfd\xe1H\xaf[o\xebe\xf7\xcb\xedW<\xaet\xf4\
+M\xeb;\xd1\xef\xd3\x7f\xfaj\xc0\xd5s\xd7\xf8\xd7.\
+]\x9fy\xbd\xef\xc6\xec\x1b\xb7n&\xdd\x1c\xb8%\xba\
+\xf5\xf8v\xf6\xed\x17w\x0a\xeeL\xdc]z\x8fx\xaf\
+\xfc\xbe\xda\xfd\xea\x07\xfa\x0f\xea\x7f\xb4\xfe\xb1e\xc0m\
+\xe0\xf8`\xc0`\xcf\xc3Y\x0f\xef\x0e\x09\x87\x9e\xfe\x94\
+\xff\xd3\x87\xe1\xd2G\xccG\xd5#F#\x8d\x8f\x9d\x1f\
+\x1f\x1b\x0d\x1a\xbd\xf2d\xce\x93\xe1\xa7\xb2\xa7\x13\xcf\xca\
+~V\xffy\xebs\xab\xe7\xdf\xfd\xe2\xfbK\xcfX\xfc\
+\xd8\xf0\x0b\xf9\x8b\xcf\xbf\xaey\xa9\xf3r\xef\xab\xa9\xaf\
+:\xc7#\xc7\x1f\xbc\xcey=\xf1\xa6\xfc\xad\xce\xdb}\
+\xef\xb8\xef\xba\xdf\xc7\xbd\x1f\x99(\xfc@\xfeP\xf3\xd1\
+\xfac\xc7\xa7\xd0O\xf7>\xe7|\xfe\xfc/\xf7\x84\xf3\
+\xfb-G8\xcf\x00\x00\x00 cHRM\x00\x00z\
+&\x00\x00\x80\x84\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u\
+0\x00\x00\xea`\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ\
+<\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\
+\x13\x01\x00\x9a\x9c\x18\x00\x00\xbd\x1eIDATx\x9c\
+\xec\xbdw|\x14\xc5\xfb\x00\xfc\xcc^\x09\xa9\xa4\x91n\
+\x12\x08\xbdw\xe9-\x14\x11Q\xa4)J\x11\x0b\x88\xbd\
+\xf7\x02*b\xf7ko(6\x94\x22H\x07A\xaa\x85\
+\xae(\xbd\x07\x08%$!\x09\xe9w\xb7;\xef\x1fw\
+\xbb7;\xfb\xcc\xee]\x08\xea\xef}\xdf\x87\xcf\x91\xdd\
+\xd9)\xcf<\xf3\xb4yfv\x96\x00\x80\x04^\xa0\x00\
+@\xc0\x1a\x88/\xaf\x0a\x81\x96c\xf3Q\xee\x19A\xea\
+\x15\xd5\xc1\xe6\xc7\x9e\xf1\xc0\xd6\xab^\xb3\xf7jY\x09\
+\x00\x14.]a\xae\xb1>\xb2uI\xcc=\xe1\xf2`\
+8\x89\xeey\x5ck\xf2\x9c\x00>.\x18\xfd\xb0\xb1\xe0\
+\xfb\xc5\xd7\xcb\x8f%\x01?\xed\xf82f\xc0\xd3\xd6*\
+\xbf\x15\x04BwuLy~\x13\xe1\x80\xd1S\xe5\x17\
+Q\x1b\xbc|\xf0\xb8\x89\xf0\xb4\xc2\x9fo\x87\xaf\x9f\x02\
+\x00\xa1\x94\xca\x16e5\x90\x904\x8c!\xac\x80\xef\xb0\
+\xa8S\xbc\xe0b\x82\xcc\x96a\x07J\xc4\xd0\x14\xfc\xcc\
+\xc7\xb7-\xc2Q\xa4@$\xd0\xd3$\x10\xc6dq\xe4\
+\xf3\xabi\x12\x18\xfb\xc4\x975\xc3\x1d\xb8\xe7\x98\xf0\x8b\
+hd\x05V\xf4W\xebf\x9f\xf1\xc2\xcf?S\xb8{\
+\xac\xcf|\xba\xfa\xcc\x8c\x16\xa2\xbe\x89\xfa\xc0\xf3\x0eO\
+33Z\x99\xb5\xc5\xd7e\xa6\xd0\x83\xe5!\x96w\xf8\
+\xfay\x9a\x99\xc9Z@\xc02'K(~\x80\xcd,\
+\x9b\xfa\xdc\xccR`\x8c\x22R4\x22\x8b$J\xe3-\
+\xb0\xa8.+\xeb\x87\x95\xe5\x09\xaa \xcf1\x8bi%\
+\x8c\x22\x01\x16\xe1nU\x86\xcf'j\x93-\x83Yq\
+Q{\x00z\xcb\xc9\xe3\x8b\xf1\x86\xc8\xc2\x06\x02\x22\xc5\
+\x83\xd5-R\xbeX\x9d\x22\xef\x8f}\x1e\x0c\xaej}\
+\x22\x19\x0a\xd6\xa3\x09\xa4\x0f\xa2\xe7\x1a](\xa5\x01\xb7\
+\xab*\x00\xf5Z\xd5\xdc\x22\xf7\x86o\x10\x13z\x0ca\
+\xb6\x0c\x86\x03\xefz\x9b\x09\x01\xdb\x1e_\xb7\x19\xd1I\
+\x00yx\xe0\x19\x90W\x18\xbcR\xe3\xddK\xf59\xdb\
+?\x9enl]f\xca@\xc4\xa0\x18\x8e|\xfd\x98\x90\
+\xf2e\xcd\xea\xc5\xda\x11\x8d\xb7\x02z\xfea\xf3\xf0\xd3\
+,\x96>\x98%\x15\xb9\xebj\x1f1\xe1\xe5\xf1\xc1\x94\
+3\xa6\x0c\xd9\xfc\xfcX\xb0r\xc1\xf6\x13+c&\x9c\
+\xc1\x82\x15\xbf\x03\x92\xae\x04\xab\x00\xd4\x0a\xd4\xcea\x03\
+\xc46\xa8>\x13i]\xb3\x8e\x06\xcapl:6\x0f\
+\xe7\xdb\xe6\xef%\xa4,\x8f;\xcfD<\x9e\x22ad\
+\xebQ\x904\xb3\xc1\x0e\xc4\x82\xf3ua\xe9\x18\xae\x81\
+x[f\x0c\x85\xe1\xca\x0b(\x0fX\xdcD-\x8b\x09\
+\x85\xc8+\xb0R\xb4\xacW\xc5\xb7m\xd6\x0f^\x01\xf3\
+S^3\xa5\xc1\x96\xc7@m\x9b\xc7\x83-oVO\
+ \xcaK\xcd\xc7\x1a\x17\xac\xbc\xae\x5cMc\x00,3\
+\x07\xa2\xad\xcc,\x12E\xae\xd9r\xbc\x80\xb3\xccf\xe6\
+I`ucm\x99\x09\x16\xcb\xb0\xbc\x00\xb3\x8c\xcb\xf6\
+M4\x80f\xc2h\x86\x0b/ \xa26D \xa2+\
+\xd6\xbe\xfa\x0c\xc0Ok\xb5\x0e\x05\xf44\xc0\xeae\x9f\
+\xf1\xc0\xc7^D^C \x96L\xd4'\xec\x19ou\
+E\xb4S\xb8|\x14\x8c\xb8\xb2\xdeA0c\xc0\x0a?\
+\x0f\x81X`^I\xf3F\x0e\xc0\x8f\xbf\x15/\xf12\
+\x140\xa8\x9d\x08\x040\x8d\xce\xbbV\xc1x\x02<S\
+\x98Y\x07\x91R\xe0\x05VT\x8f\x0873\x86\xad\x0d\
+\xed\xcd\xe2\x8f\x955\x033\x05\x8b\x95\xe7\xc7\x05\xf3\x9a\
+\xf8:D\xed\xf0..[N\x84\x8b\x95\x95g\x01S\
+\xaeVB#\xf2(\xf8:E\xe5\x02\x05\x96\xa7\x01\xc4\
+\x86Q4\xf6\xbc\x97\x82y3|>\x16D\x0aR\xe4\
+\x15\xb3y$\x00\xa0\x94RL)\x09\x1bc\xe75\x98\
+\xc6f\x1b1C\x8e\x174\x11\xe3\xf0\xcca\xc6<|\
+y\xcc\xd5\xc5\x18\xdbl\xaeg\xc54f\xb8\x06\x92\x8f\
+\x05\x91\xb0\x88\x94\x17\xdbO\x11\x8e\x98\xe2\xc4pe\xf1\
+S\x904\x10<\xe7q\x15\xf5I\xa4\x98y\x01b\xeb\
+\x12\xc5H\xcc\x14\x96\x19_\xaa\x16\xd8J\xc8\xd9~\xaa\
+\xbc\xa1^cma\xb8\x06R\xb7z\x1f\x88\xc2\x09\xd4\
+X\xb2\xcf1Z\x1a\xea\x0d&\x06`G*\xc7\x1a\x17\
+Y\xb9@\xb4=[\x87ZF%\xbeH\xa8\xf8\xcea\
+\x02\x83\xe1,z&b 3\xc1S\xc1\xca\x12\xf08\
+\x89\xac\x04\xcf\xe0\xea5O\x13\x0c_\x16\xcc\x14,\xdf\
+w\xcc\xf3\xe1\x15\x03\x80x.\xcf\xb7+q\xf7l\x9d\
+j=fF\x03[be\xd3)\xe8\xc7\x99\xad#\x10\
+\x0f\x0ek\x93M\xe3\xc7\x03\x13r\xd18\xf1\xf5\xf1\x80\
+\xe1\xc8\xe2\x1e\xa8B\xe3\x81UpV\x8a\x88W\xe4\x96\
+\xc0\x0f(/\x04j\xa5\x80\xa4\xf3`e5XB\xb0\
+\xc2\xcf\xcfK\xd9:Dmb\xd6\x02c\xc2@\x99F\
+dq1k+\x81\x9eN<S\xb3}5\x0bR\x05\
+b%\xd8:yP\xf1d\xe9\xc7>\x13\xd1\x84_\xb9\
+\x11)/Q\xfb\xbc\x80\xb2\xe9lL@-\xcb\xd3\x93\
+W\xfcV|\xc5\xd6\xa7\xb6\xa1\xfe\xe5#\xf1fu\xf0\
+K\xb8\x00\xf8\xf8\xb2\xb8\x98\x09\x13\xafd\xd9\xb1g\x9f\
+\x03\xf7\x8c\xcf\x07H9\x91b\x03\x10\xc7*\x02v\xfb\
+Y0s\xa10\xeb*\xcac\xe6!\xa8\xcf\x09\x97\xce\
+\x07h\x00\xc4\x83'R\x08\x98\xb5\x101:\xff\x9c\xc5\
+\xc5L9`\x02\xc6\x96\xc5\xf0\xe4\xafY\x10\x09\xab\xa8\
+?X\x9b\x18#c\xd6\x93}\xc6\xe7\xe7q\xc0\xbc\x8f\
+@\xac7\xa6H\xf8:x\xafC\xe4\xc5\xa8iV\xbb\
+S\xad,\x1cFc\xf6/\xab\xc4Y\x1c\xe5\x00\xeaf\
+\x81\xdd8\xc6\xd3\x01\x13H\xccp\xb1\xcf(\xf2\x13\x19\
+\x00\x9e\xde\x22Z\x99\x02\xcfP\xac\x1b\xa1VlU)\
+\xe6\xea\x88\x06M%<k)0E\xc13L\xd0\x1d\
+\x13\xe0e\x96O\xbdV\xf10cR\xabm\xa0\x22K\
+\xc3\xa6a\xde\x8e\x99\xf0cy1oE-k\x16l\
+\xc2\xcac\x1b\x98\xf8\xb1\xc4\xe8\x84\xe1\x87\x95\x05\xc13\
+L\x81\xf0y\xcd\xea6\xf3\xf2\xd8\xf9>o\x80\x00\xf0\
+)\x10\xdf\x16\x8f\x83\x99\x82\xc5\xf0\xc3@\x84;\xb6\xb7\
+@T\xa7h\x9c\x82\xde\x08\xa4\x16\x0c4:\x89i&\
+\x91\xe6\x07\xa4\x0c\x8b0\xabpx\x81\xe5\x07\x89WR\
+|\x1f\xd8\xb2l\x9b\x81\xec\xd9\x16\x09\xac\x88!1\x8b\
+\xc7\x06\x1e\xad\x06\x80\x17@L\xb0\xcd\x02Tfxc\
+8\x9814v\x8f\xe5\xb5\x12T\xac>\x16'\xb5<\
+\xb6G\x83\x17X\x9e?Xz\x00so6\x05\x10)\
+\x0e3\xab\xca\xe6\xe3\xcb\xb2\xc0\x8f\x1f&;\x22%`\
+&\xc4\x22:`y1EF\x01\x80\xd44\x08\xc8w\
+\xc0\x0c\xcc\xdc\x12Q~\xb3\xe7lgE\x0c\x8ci^\
+\xac\x1e\xf6/{-\xd2\xd4\x18\xf0AJQ\xbd\x98\xc2\
+\x11\x09\x1b\x8f\xb3H\x90\x02\xf1\xa4\xd8\xba\xcc\xe8b\x86\
+\x0b\x9ffeq\xf8)\x00\x86\xa3\x99u\xe4\x151\xb6\
+R\x83\x09'\x01\xa3r\xc5\xb6}\xf38\x88\x04K\xad\
+\xc3\xea\xa5 3\x0f\x05\xeb7\xdf_LF0C\xc9\
+\xb7\xcb\xe2\xcc\xd3\x9f\xaf[\xd4n\x8d\x14\x80\x889D\
+{\xdb\xf9m\xc3\x22\x82\x98\x81\xc8b\xf2\x1d\xe57\xab\
+`\xd1f\xbe\x1c\x8b\x93H\x90\xcc\xde\x1f\xb0\x1a$\x16\
+\x7f,\x8d\xef\x13\xc6l\xd8\xce4\x96\xe1\xd9\xb2\x22\x85\
+\x80\x81\xc8Zc\x0a\x8b\x85@\xa6[\x982\xc4\xdaf\
+\x81\xe7\x1b\xde\xe3\xc1\xae\xf96\x02Q\xb6\x22\x10\xd5\xc7\
+\xf2\x96\x99Rc\xf1\xb6\x92\x17,-\x10\x03\xc8\xe2\x85\
+\xf1\x8eU[\x81\xd2B\x07fo\x03\xf2\x8c\xaf\x807\
+H\xa2\xde\x9bYGQ\x9d\x94\xfb\xb1\xf5[\x11\xd7\xac\
+^\x16\x08\xf2c\x9f\x81I:\xffL\xb5\x14X\xbbf\
+VC\x84\x8f\x19\xde\xfc3\x91e\xc2\xf2a\xe9\x00\xe2\
+\x15\x16\x11MD\xb8\xf0c\xc6\xb7\xad*-\xac<6\
+\xa6\x98\xf2a\x15\xa7(/\xfb\x17\x8b\x86c\x96\x1f\xb3\
+\xc4|\x19~e\x87\x05v\x9f\x8c\x15`t\xe2\xfb\xc4\
+\xd2\x04\xdb\x85\xc9\x1a\x01\xfe\x99Y\x9b*\x04\xb5\x1a \
+\x1a8\xab2V\xdb\x86y\x8be\xa6\x19E\xda\x99\xcf\
+'\x22\x80\x99\x95\xc3\x80\x1f\x00\x11\x0e\xbc%\x10Y\x08\
+\x11\xf0u\xf2.%\xdb>VF\xd4>_\x87\xc8;\
+0\xb3\xac\xd8\xc6 \xb3\xf1\xe0\x01\xa3\x85\xa8\x9c\x88\x0e\
+<\xaef4\xe5=\x1a\x8c6|L\x01\xdb\xbf\x81\x81\
+\x19\xffa\xde\x1a\xa6\xb80\xda\x05c\xf5\xb1v\x035\
+\x86\x06\xba\xd6t'\xa0Y\x1e\x91[$r\xed\xf8g\
+|\x1e\x91\x90\xb2m\x99Y\x1b\x1e\x0f\x1e\xf8:\xcc\xca\
+`\xc4\xe6\xcb\xf2\xf8\xaa\x0c\x86)\x1e3\x867\xa3#\
+V\x96g|\x9eA\xac\x98H\xbd\x0f\xf8E\x12\xa4N\
++\x1cE\x0a\x0c\xc3\xd5\xec\x0d>\xac, y\xcc\xf8\
+\x86\xa7\x17VF4\xfef\x8a\x94W>\x00\xe2 \xad\
+HY\x89\xfa\xc7\x83hl0\xcf\x01\xad3\x18\x05`\
+\x16\x03\x08Dsa\x96\x88\x02\x80\x0dC\x0c\xa9\xdf\xcc\
+\xe2b8a\xe9f\x82\x8e1\xab\x88\xb0\xa2W\x92\xb1\
+\xfeYY=3\x5c\xd9t\x91%\xc7\x94\x1dvm\xa6\
+\xd8x\x86e\xad\x22\xf6\x5c\x14\xcb\x111v\xa0\x82\x1f\
+\x88\x01a\xf1\x00$\x1f\x9b\x07S\x1c\x98''\xea\x0b\
+\x86\x87Hq\x00\xe8\xf1g\xdb\x95A\xbc3\x92\xc5\xcd\
+L\xf9\xf0\xe50\xa5-\xe21L\x11\x89\x14\xa4\x10\xec\
+\x01\xe4\xb1B\x9a\x07VK\x89\xb4\xa4z\xcdv\x14\xdb\
+\xc1'\xb2\xbe\x22\xdc\xcc\xac;\x96\x86\x093\x7f\xcdC\
+ \x96T4\x08X\x90\xcd\xcc\xe2\xb2\xf7\x22e\xa1\xd6\
+\x0b\x80oJ1\xc3\xc9\x8a9E\xc2\xc2\xe3\xc7\x07\xf6\
+\xb0%>\x15O\x96Q\xcd\xb6W\x03\x18\xc7\xdeJ\xb8\
+0\xda\x8a\xc6\x9b\xaf\x8fo\x9b\xa7!oU\xb1\xe0\xb8\
+\x99\xd1\xe4\x05\x96\xad\x93W2<\xcd\xf8\xba\xf9v\xcc\
+<\x1eS\xc0\x14\x80\x99+\x83!\xc0\x12\xc0l\x9e\xa4\
+>g\xeb\xc2,\xa2\xd9\x12\x0f\xdb9~\xa0\xac,\xa0\
+\x990`\xde\x02\xff\xcc\xac\x1e3%b&Xl\x7f\
+E8`i<\x0dx\x5cy\xdcDu\x98\xe1h\xd6\
+o\x11\x8ef\x1e\x8b\x88)\xb1|\x98\x17\x81\xe1)j\
+ODsQ\xff\xcd\xc6\x8d\xa5\x83U?0\xab\x8d\xd5\
+g\xc5\xdf\x18\xedE2\xc7\xe773^(\xd2f[\
+<\xb1\xfcXcV\xcc\xc4\x97\xe7\xd3X\xe0=\x07\xc2\
+=c\xcb\x98\xb9|\xeas\xab\x03+x\xe0\xd31E\
+\x88\x09\x19\x0f<mx\x81\xb1R(V\x82'z\xe7\
+\x81o[\x84\x9fh\xcc\x02a\x22\x1eg\xb3\x97\x800\
+|E\xb8\x89x\xcbj\x93\x1a\xff\x8c\x15F\xccc!\
+\x5c\x1e\x00\xbc]\xe0\xcaZ\xe1\x0e&\xb8\xf2\xbc\xaa\xe6\
+\x15)qL\xe9\x98\xd1B\xbb\x0fv#\x10_\x89\x19\
+\xd3\xb0\x10\x88\xb6\xb6r\xbd0A\xe4\x9fa\x9a\x9a'\
+\x8a\xc8R`\xc2\x17\xc8@\xb1\x84\xe6\xc1\xca\x15cA\
+\xc4DV\x03dE;v\x9cD\xf8\x8b\xf0`q\x11\
+\xe1!R\x82f\xf7\x18\x0e\x98\x85\xe5\xc7JT'[\
+\x8fi\xd0K\x00\xa2\xfa\x031Z\x22\xa1d\x9f\xf1;\
+\x1aE\x9e\x0a\xd6\x9e\xd9x\x8a\xea\x10y \x98\xd1\x08\
+\x18\x82]\x02\xe4\x81E\x1c 0\x04\xcc\x06\x0ec$\
+\x9eX\x81x\x11X:\x8fk\xb0 r\xc7D8\x98\
+\xd1E$\x00X\x9b<\x83\x98\xe57c\x02\xcc\x02a\
+e\xd9\xddrl9Q]f\xcf\xf8X\x80Hq\x88\
+\xc63\x90\xe0\x9e\x9aOT\x07\x11\xfcDy1\xb0\xf2\
+\xa8D\xfd\xe0\xd3D\xb8c\xed\xf0JGDkVI\
+\x8axS\x08\xa2\x18\x80\x956\xc1:\xc52\xaa\x95W\
+\xc0\x13\x12#\x82H\xdba\xda\x90\xbd\xb6z\xaf\xdd\x8c\
+@fVMd\x89\xb1\xfc\x18MD\x16\x00\x90\xe7\xa2\
+\xf6y\x08\xd4[cq\xe6\xaf1\xe6\xb5\xf2lD \
+\x12\x043\xab/\xc2\x87\x073z\xf3<\xab\xb6\x87E\
+\xe9\xb1:\x03\xe9\x9f\xc8Bc\xc7\x82a<nf\xa9\
+Y\x8fStL\x9d\x08'\xb5\x9f5z\x1d\xd8\x0e\xe6\
+\x8c)\x02\xbes\xec_\x91Fc\x89\x1d\x88\xa5\x020\
+g\x10\xcc-3c\x90@\xb43\xf6\x9c\xefc\xa0\x0c\
+*zfE\x07\xbe\x1d+\x85\x86\xe1\x8b\xf5\xddL(\
+\xd9g\xec{\x10V\x8c\xc7+}\x16G>\xb6\xc4\x9f\
+\x98\x83\x19\x07\x1eg\x9en|_\xf8:0~\x10)\
+6\x8c\x9ef\xfd\xe5\xeb\xb72j\xa2\xf2V\x86\xc4\xca\
+\x98\x89\xf84\x908\x89\x01\xd4}\x00\x81\x16b\xb5\x1e\
+{\x8f\x11\x19\xd3\xd8\x22\x0bd\xb5\x8d4P\xbc\xf8\xba\
+Ei,c`\xeb\xdfV \xd2\xf0fJ\xc2\xea\x99\
+h\x1cD}\xc1,\x0aO{+oG\xa4\x04\xf8t\
+\xcc\x8a\x89\xf0\x01\xc0\xc7\x03\xa3\xb3H\xf8y<\xf8\xb6\
+U\x9e\xb1\xe2[\x11\x8d\xcc\x8c\x08\x06\x98\x90Z\xb5)\
+RR\x18\x88\xceb\x08t\x17#\xdbNP\xc0\x1f\x8c\
+\xc0W\x8a\xdd\xf3\x0d\xb2\xe5\xb0:D\x03\xcekr\xfe\
+'bLLa\x98Y\x01\x1eg\xb6\x0cV\x0f[\x1f\
+F\x0b3\xe1b\xfb\x14\x88\xd7a\x95\xce3\x04\x9b\xce\
+\xb7/R\xb6\x81(\x15Q;\x22\xe0\xc7\x89M\xc3\xea\
+\xc7\x0e\x9d\xb1R\xd2\xfc\xf8c\x8a\x16\xc3\x09\xabG\x84\
+;\x80\x91>\x18\x0d0z\x9a\x197\xf6y \xf4T\
+\xb8\x1f\x8b\x0b\xdf\x16\xc6\x9b\x81(1\x14\xcc\xb4h\xa0\
+B\xc5>gAD`5MD \xcc\xbd\xe2\xb56\
+\x80^k\x8a6K\x88\x5c@L\x98\x82\xf1\x840o\
+\x82M\x13\xede`\xdb\x11YL\xd1Q\xd6|\x1d\x00\
+z\x9cE\x8cf\xa6\xc0\xf9\xb6\xcd\xf2X\xd1\xc6\xcc\x00\
+\xf0\xfd\xc0\x94\xbd\x15.<^\x81(RL9a\x16\
+\x19K3S\x86\xa2\xb1c_P\x12\xf1\x14V\x96\x10\
+B\xa8$I@\x00\x9c\xa0\x1fS\x8c\xd7D8\xd5H\
+\x01\xb0`\x850\x9f\x86iR\x91 \xb1L`Fl\
+\xabt\xb6\x1e\x0a\x00\xf6\x98\xc8H\x90$I\xe1\xd2\xad\
+\xfa\x80\xa5c\xee\xa6(?\xc6\xc0X\x19Q?\xf8A\
+\x16y\x1c\xa2=\x11V\xb8\x9bY63F1S\x86\
+jy\xf5(,+%\xcbzK\xa2\xfe\x01\xe0}\x0b\
+\xc4\x9a\x83 _0^\x96\xd9\x18c`\xa5\x18\xccx\
+\x07\x1b\x13Z/\xb1\x9e2f\xcc\x98\xb8\xab\x07\xf5\xbf\
+1\xc4\xe9\x8cB\xeaa\xa7O\x81*\x95\x80\xc0\xec\xe5\
+\x0c\x11s\xf3\x03\x8c16\x96\x0f\xb8||\x9bl}\
+\x98\x9b\xa6\x12B\x97\xc7n\xb3\x856\xc8\xcaj\x97\x14\
+_\x0f\xc0\xbc\xf3\xac\xa7\x80\x11\x10\xb3\xca\x22\xcb\xcb\x0f\
+\x0e_\xa7\xc8%\xc4\x14\xa0\x99g\xc33\x82H\xc1\xf1\
+\xf8\x8a\xac\xae\xfaL\x04\x98\x80\x8ap\xc5\x98]\xa4`\
+(\x04\xe6\x15\xa9\xd7\x22\x9a\xa2\xd6S\xd0\x17\x1eG\xfe\
+\xb5^\x9e\xb7\xf8k\x160O\xcb\xaa\xcfl}<\x1f\
+\xe9\xc64\xbbG\x9f\xb8\x91\xc3\xaf{\xcffs\xd8\xaa\
+\x5c\xae\x0b`\xa49\x8b\x17\xa6\x04\xb0\xa9|@ z\
+\xe7X\xc4\x9c\x22\x0d\x8c\xfd\xf8zx\x82\xb3\x9d\xe0\xdf\
+[g\x99W\x11\xd4!\x01\x00xd\xb9\xb4A\x83\x06\
+m\x87^;t\x22W\x9eo\x0b\xc0HD>\x8f\x88\
+x\x98\xd65cvLy\xf2y0\x8f\x07\x9b\x03\x12\
+\xe6\x19\x86;V\xafHI\xf0\xf5\x8a\xfa-\xb2\x94\xd8\
+x\xb2\xcfE\x87k`cm\xc6\xa8l9>\xbfY\
+\xff1a\xe3\xdb\xe7\x95$\xdf\x1fL\xf1\xb3uc\xef\
+\xf0\xb3\xf7l:\xaf\xd8\xd4z$\x00P\xd2\xd3\xd3\xe5\
+\xcc\x8c\xcc\xbaw\xdf5\xe5\xe7S\xa7r+\x16/[\
+>\x1b\xf0\xbd\x13l\x1b\x0a\x18\xf1\xad\xd1\x12\xa0\x0a\xaa\
+;gc\x90\xb31\xe9\x81\xfc\xf8\xfc6.\x8d\xbd\xb7\
+!\xcf\xf9:\xb0\xe7\xec\x8f0\xd7\x10\x11\x1a\x16\xf7\xf5\
+\xd7_\xff4\xe5\xae;\xefd\xfa\xa5\x12\xd1\x86\x94\xe1\
+\xeb\x22\xc8=\xe1\x9e\xf1y\xf8\xbc\xa2\xf2XY\x96\xee\
+\x81\x96\xe1\x05\x80\x17\x5c\x0coQ\x19\x8c\x16f\xed\xf2\
+\xcf\xcc\xd2\x02\xa5\xb3\x88\xf6X\x9fyz\x89\xea\xe6\xe9\
+\x11\xc88cm\x8b\xd2\xb0>`|\xca\xe2\xcc\xcb\x94\
+\x8a\x1b\x0c\xb9zHDq~\xfe\xa1\xf5\xeb\xd7\x1e\x00\
+B\xec\xcc3\x02F\xbe\x0dt|\x08\xa5\x14\x02\xfd\x01\
+\x98\x13 \x18\x05\xc0\xff\xf8\xce\xb3\x0a@TVt/\
+\x1a\x18Ui\xc1=wM\xe9w\xee\xdc\xd9\x8b#\x87\
+\x8f\x18\xc1\x0c\x80\x88!\x018\xa2\x09\x88\x0a\x80\x13\x19\
+\x90\xbc\x18\x93\x04\xc2T\x22\xe6\x0f\x84\xb1\x03Q\x0c\xb5\
+\x05<\xc3\xf3\xfd`q0Snf\x8a\xc8\x8avf\
+\xe3\x05\x80\xd3M\xd4\x1e\xdb/\x1b\xe0\xb8`y\xb0|\
+f\xfdE\x95\x83DH\xd8\xd6\xdf\xb7\x1c\xa8,\xbbH\
+c\xe3bR\xb8\xb6D|\xc3+\x13T\xe1_\xaa\x02\
+`\x1b\xb7!\xcf1\xed\xa7j,^X\xcd\xac\x8d\x99\
+\xb5\xe0\xdb\xc6\x14\x0a\xfb\x0c\x92\x13\xe2\xe1\xcd\xd7_\x7f\
+\xac\xbc\xb4\x8c\xf6\xed\xdb\xb7\x17CPL\xb0\xd8gf\
+\x03\x8a\x12\x98)\x0b\x5c\xba\x84\xa4ce1\x06\xc3\x14\
+\x0c_?\xc6\xfc\x01\x03!\x00\x12!\xe0\xb0\xd9\xa4\x10\
+\xa7\xc3\xe6\x0cq\xd8\xeb8\x9d\x8e\x10\x87\xc3f\xb7\xd9\
+$\x9bM\x22\x84\x04V%\x93\xcfL\x11\x89\xf0\xc7\x94\
+\xaa\x99R\xb0\xe2\x1d+eb\xa5\x8c0\xfa\xb3\xc0\xd3\
+\xdbL\xc1\xf0\xf9\x0dc\x15\x12\xe2\x88\xd9\xbd{\xf7^\
+J)\xed\xda\xbdK'\xa6N\x91,\xa8|n&\xf8\
+\x1ao\x07\xa3\x00T\xc1UA\x14\x03`\x81\x08\xd2\xd9\
+`\x8b\xd9\xfc\x93\xcd\xaf\xcd\xe5\x05\xed\xb3\xd7f\x07v\
+(\x00\xa0\x10B`\xf3\xaf\xbf\xfd\xde\xa1s\xe7\xae-\
+[\xb6hq\xf0\xe0\xc1}`\x14>\xac\x0d,n \
+\x0a\xdcX\xf5\x89g Q\xec\x00{\xc6\xd3\x8e\xcfK\
+\x1b5\xc8\x02\x8fB\xe1x\xce1\xedA\xd3\xa6\xcd\xa0\
+\xe0|^dzffTRbRtiYi\xbd\
+\x84\xf8z\xa9\xc9\xa9\xc9I\xf1q\xb1q1\xd1\xb11\
+\xe1\x91\x11\x91a\x11\xa1a\xa1!\xa1uB\xec\xce\x10\
+\xbb\xddn#\x12\x10J\x08Q<\x8a\xecv\xbb\xdd.\
+O\xb5\xab\xa2\xac\xb2\xa2\xac\xac\xb4\xb4\xe8\xc2\x85\xa2\xfc\
+\xfc\xfc\x82\x0b\x17\xf2\xf3rN\x9e.\xb0;B\xce\xd9\
+\xec\xb6\xa2=\xbbw_\xac\x17\x1b[T76\xda\xbd\
+i\xd3\xaf@\x80@HX\x08TUTa\xf4\xc0h\
+\xc1\xd3\x99\xcd+\xe27\x96VX>\xb3\xf1\xb1\xe2\xe5\
+`\xbe;!\x8a\x85\x99\xf5K\xf7,:::a\xc3\
+\xba\xf5\x1b\xda\xb4k\xdbl\xf4\x0d#o\x98?o\xc1\
+<\xa6N\xb6\x1f,\x7f\x9b\xc9\x9b\xa1\x7f\xc1~\x17\x80\
+\xd5Nf\x82\x80u\xca*8hV\x86\xc5\x81\xed@\
+ \x03\xac\xde\x1b\x82E}z\xf6LX\xbb~C^\
+\xde\xf9\xbc\xc2\xce]:\xb7\xcf=\x99{\x92kG$\
+\xa0\x06a\x03\xa3r\xc2h\x83\x09\xb4\xe8\xb9\xfaL\x15\
+t\x91\xb0\xab\xfd\x01\xbb\xdd\x0e\x94R\xe8\xdd\xbb\x0f\xfc\
+\xfa\xeb\xafP?5\x1d\xee\xb9\xf7\x9e\x94s\x85\xe7\xd3\
+\xb7m\xdb\x96\xdc\xa8q\xb3+\x9a6m\xd4\xb4A\x83\
+\x06\xcd3322\x93\x12\x13\x13\xe2\xe2\xe3C\xa1\x96\
+\xa1\xbc\xa2\x9c\x16\xe4\x17\x14\x9d={\xf6\xcc\xc9\x939\
+\x87\x8f\x1f?v`\xc7\x8e?\x0fFFF\x9e\xac\xa8\
+\xa88\xb3\xf2\xa7\x9fr.\x16\x17W\x0b\x8a\xb3J\xd8\
+\x8a6l\x1eV@1Af\xeb\x11\x05D\x83Q\xfe\
+<~|^\xbe\x0e\x91\x10\xf2\xcf\x14\x00\x80+2\xd2\
+\xd3\x97/]\xbe\xa6U\xab\x96\x8d\x9f}\xea\x89\xa9/\
+\xcdxu\x9a/\x8f\xc4\x95\x07&]\x14\xd0e\xfb\xae\
+3\x8e5\xf90\x08\x8b\x00\xdba\x91v\xe4\x85\x03{\
+n\xa6%\xd5{@\xd2\x02Q\x08|~\xb5\x8c\x0c\x00\
+0r\xf8\xf0\xd1\xf3\x17,\x98{\xe0\xe0\x81c\x9d:\
+v\xecVVV\x9e\xc7\xb5c\xc68X\xbd\xd8@\x9b\
+)G\xf6\x1a\xf3p\xf86\xd4\x81\x96\x99\xe7\xd0\xb8q\
+c\x90e\x05\xec6[\xfd\xb7\xdf\xfa_\xbb\xe3\xc7\x8f\
+5\xae\xaa\xa8h\xd9\xb9[\x97\xb6-Z4o\x16\x13\
+\x13k6\x06\xff\x08\xb8\xdc\xd5p\xf0\xc0\xc13G\x8e\
+\x1d\xdds\xf8\xd0\xe1\xddG\x8e\x1c9\xb0u\xcb\x96\xbf\
+\xff\xfe{\xf7\xce\xc4\xe4d\xb9\xa4\xa4\x04\xaa**\xd8\
+\x22<\xce,-\xf9\x08=\x9b\xa6\x96\xc3x\xd2L\x01\
+`\x10\x88\xc12\x03\xf6\xcc\x0a\x11\xb0\xf5)\x8d\xb2\x1a\
+6]\xb9\xea\xa7\x9f\xb2\x1a6H\xff\xe6\xab/\xe6\x8c\
+\xbf\xe5\xb61\x0c.,_\xa9<\x83\xbd\xdd'\x92!\
+}\xc3A(\x00\x15\x01\xd1|\x830\xf7\xd8\xbcL\x14\
+\xc0\xc3\x9e\xf1e\xcc\xe68\xd8\xfc\xdfl^h\x98\xbb\
+}\xfb\xd5Ws(\xa5t\xe7\xf6\xed\x7f\x85\x86\x84F\
+s\xfde\x09\xcb\x0a!?w$\xdc\x8fo\x13\xa3!\
+_\x86o\x8f-c\x07\xfd\x14\x0c\xa2\xa2\xa2\x80\x00@\
+\xf7\xceW\xf6z\xfd\xd5W_Z\xb4h\xd1\x8f\x7f\xff\
+\xfd\xf7\xb1\x82\x82|Z\x13P\xa8\x82\xa6\x1a\xaf\x15_\
+n\x85*T\xa6\x94\xcaZ\x9a\xff\x17\x18\x9c9w\xb6\
+h\xd3\xa6\x0d\xbf|\xfe\xd9g\xef\xdfx\xd3\x8d7\xd7\
+\x09\xaf\x93\x0cxl\x81\x1f\x033Z\xb24\x17\x8d\x8f\
+\xd93\xd1O4\xeeVq \x8c\x1f\xd9t-@\xdd\
+\xa1}\xbb\xcey\xe7\xf2\xf2(\xa5\xf4\xd7\x8d\xeb6\x03\
+@\x1d_^\x95\xe7\xf9~\x9b\xc5\xa3D\xcf\xb4<\xb4\
+\x06A@\x91\xa0[\x09\xacY\xc0BT\xdeJ\xa9X\
+\x05@\xac\x02#\x12\x00@\x1d\xa7\xb3n\xce\xd1c'\
+)\xa5\xf4\xe7\x9f~Z\xcf\x10=XF\x10)\x00\x96\
+\xa31f\x01\xee/\x96\xaeAJbr\xcc\x90\xa1C\
+\xaf\x9e3g\xceg\x7f\xec\xd8\xb1\xa3\xb0\xb0\xf0b\x80\
+\x12.\xba\xb1(\xc4\xff\xfc\x02\xafP\xd9\xa78\xc4y\
+\xa8\x22SJ=\xde\x9f\xa2\xa6\x1b\xc1\xe5r\xd1\xfd\x07\
+\xf6\x1f]\xbar\xe5\xd2[o\xbbmJ\xe3\x86\x0d3\
+m6\xef\x8a\x17!\x84%\x84\xd5X\xb047S\xb0\
+\xfc\xd8\x99)\x93`\x95\x83U^^Q\xc1\xa0\xc1\x83\
+\xfa\xe5\xe7\xe5_\xa0\x94\xd2\x9c\xe3G\xcf]\x91\x9a\x94\
+\xce\x0c;\xc6\xbbf\x06\x8e\xe5\x1b!~\x22a\xc7~\
+\x00\xe6\x02ff\xa1E\xf9Y\xcbO\xb8{L\x11\x88\
+\x84\x8b\x08\xda6\xcb\xa7c\x94>={\x0cT\x19q\
+\xc1\x0f\xf3\x16\x83w\x9f\xb5J<\x96\x90V\x83\x89\xe1\
+k\xc6 \x80\x5c\xeb\x18\x03\x00\xa0Azz\xc4\xb0\xa1\
+C{\xbd8u\xea\xdb\x07\xf6\xef?\xe6v{\x02\x91\
+r\xff}@\x86\x99\xb7\xf6\x0aw\x1d\xe8\x8f)\xa3(\
+TQX\xdf\x82\xc9\xa3PJ\x151b\xe7\xce\x9d-\
+\x983g\xce\xb2\x9b\xc6\x8e\x1d\xdf\xa7O\xef\x86`\x84\
+@\x84\x8e\x1f7v\x9c\xb0q5\xab\x13\xe3\xa7@\x14\
+\x01p\xcfu\x06\x08\x00\xe0\x96\x9bo\x1ev\xa1\xb0\xb0\
+\x92RJ+*\xca\xdd\xbd{u\xeb\xc9\xe1'\xb2\xe6\
+|\xbb\x80<\x13)\xbcKV\x00\xbc\xe0YYg\xb5\
+a\x91\x90\x13$\x1d\xf3\x04\xf8i\x07\x01#n\x81\xe0\
+\xa5\x1b\x847_{\xe5\x1d\x95\xf9\xbe\x9b\xfd\xcd\x1c\xd0\
+\x036\x80\xc0\xfc\x15Y|3\xc6d\xf3H\x80@B\
+|\x5c\x83;\xee\xb8}\xf2\x9aU\xab~5\x17Z\xc5\
+\x98$\xca\x8e<\xe7EW\x5c\x95\xe2\xfb\xdf(\xf8\xea\
+?\xb17@\x99|l\xe5\xe6-RJ\xe9\xb1c\xc7\
+\x0a\xde|\xfd\x8d\xf7z\xf7\xee3\x08\xa1\x95\x99\xe0\x9b\
+\x09\xb3\xd5\x18\x99YZ\xabq\x15\x09\xa1\xd6\x9e\xcdf\
+\x03\xa7\xc3\x01\xc3\xaf\xbdv\xbc\xa7\xda\xa5\xf5\xf5\xf6[\
+\xc6O\x16\xe0fe`0\x85g\xaa\xc0h\x90\x0a@\
+d\xe9xA\xc3\x1a\xc4\x045\x90]\x84\xd8|_\xb4\
+\xa7\xc0j\xd7\xa0\x99R\x00BH\x9d\xbf\xfe\xf8c\x8f\
+:\x10\x1f\xbc\xfb\xce\x97v\x9b\xa4\xaec[\x0d\xb8\xd5\
+3@\xf2\xf2\xcaB\x83\x8e\xad\xdbv}\xf7\xcd\xb7\xde\
+\xcc9~\xec\xb4XZ\xfdb\xab\x9b\xbf+HVs\
+\xf9Bm?_\xd6/\xe6z\x91\xb7\x9e\x0e\x18\x15\x83\
+B\x15\x03.\xea\x133\xaf\x80RJW\xaf^\xb3\xf6\
+\xbe{\xee\xbf72&:^#\xa8?n\x80\x09\x0b\
+\xff\x0c\xb8\xbfV\x16[\x12\xe4\xc5\x14\x03?\xe6\xa8P\
+\x86\x87\x87C\xeb\x16\xcd\xe1\xc5\xe7\x9f\xbf\xaf\xba\xbaZ\
+\xeb\xdb\xdbo\xbe\xfe\xa1\x00_\xb6}3\x1cD\xbc\x85\
+\x1acZ\x03\x05\x10\xc8\xdc\x1fS\x0cf\xdbz\x03\xa9\
+\xd3j\x1aa\xe6u\x88\xd2yE\x02\x1d\xdb\xb5\xb9\xd2\
+\xe5ri\xfe\xf5\xb7\xb3\xbe\xf8\x04\x19\x10\x9e1D\xcf\
+\xb1t\xb34\x18}\xfduC~Z\xb6\xe2\xc7\x82\xfc\
+\x822\xa1\x04 \xf2!\x12\x97\xe0Br\xa2rz%\
+\xa3W\x0al\x10\x10\x0b\x06\xe2\x0a\x00\xf37Xu\xa6\
+N\x1f\xcc\x90\xdf\xb3w\xcf\xbe\xd7^{\xfd\xb5z\x89\
+\x89\x99#F\x8f\x82\xf8\x84\x04\xb0\xdb\xb48\xa9\xd5\xf8\
+\xb0i\x98\xe0\x88\x94\x08 \xcf\xb0\xb2\x98b\x97\x00@\
+\x8a\x8a\x8a\x84\x1b\xae\x1f\x06\xef\xbe\xf9\xe6s\xd5\x95\x95\
+Z\x7f\xd6\xfd\xbcf-!\x1a\xce\xecv`\x06wb\
+\xa5\x00\xd8{C\xdb\x1c~5\xde\x0al\xb5\xe5\xd6\xa0\
+iL\xcaYYi3!6\x13x\xab\xdd\x86\xbaA\
+$\xcc\x99\x87\xcf>\xf5\xd44\x96\xd1^\x7fu\xc6\xdb\
+\xc6\x810\xb50\x01\xfdl>f%\x00\xd2\xf0k\xae\
+\xbe~\xdd\x9a\xd5\x1b\xab++e\xa34r\xf3\xe6@\
+@$oH6\xec\x9a\xcf%\xaeB/\xf8\xec?3\
+?\xc2\x0c\x0f-E\xa7\x00\xc4\x0a\xe1\xe4\xc9Sg>\
+\xfe\xf8\xe3O'M\x9a\xd4z\xf4h\xef\x8aYxX\
+8 \xe3\x12\xc8\x18\x19\x84\x04I\x97\x04i\x22~\xf0\
+\xf2\x18!\x10\x17\x17\x07\xb7\x8d\x9d\x00\xdf~\xf1\xc5\x1b\
+\xb2\xc7\x1f\xc79\xb0\x7fON|ll<S\x8e\xf3\
+:\x08fTj\xd2\xbfKR\x00\xbc\xc5\x14Yj\xde\
+\xc5&\x5c\x19\xabrf\x02\x8c\x11\xddjJ\x11\xc8\xe0\
+J\x84Yf\xfbu\xfd\xfa_X&\x9b6\xf5\xd9\x17\
+\x10\xe2\xf3\xf5\xa8\x80\xb5\xa9+;\xe4\xeaA0j\xf8\
+\xf5\xf0\xd5g\x9f]\xf5\xfd\xd7_\xaeGeKs\x87\
+9\xb9\x11I\xadN\xde\x04\x13}\xae\xaa\x1a\xb9\x07\xc6\
+Z\xb44m~\xaf=\xd5#\x8e\xc7\x0e\xd8\xbc<R\
+\x8a@\x91\x19\x95Ayii\xd5\xeb\xaf\xbf\xf1\xf1=\
+\xf7\xdc\xdb\xbem\xebv\x90\x91\x9e\x0e\x8d\x9a4\x81\xd0\
+p\x9d2`\x05\xcb\x8c'P\x1e1\x19sl\x0a\xac\
+\x1b\xf3\x9bn\x18\x03\x9f}\xfc\x09|=\xeb\xab\x8f\x14\
+\xc5\x8f|\xfe\xf9\xbc\xaa\xa1W\x0f\xe8\x8e\xf0\x17\x83'\
+aq\xe5q\xe1\x81\xe7O\xbe\xbfZ=\xb4\x06\x0a\x00\
+s\xe9Ek\xfc\x04\x8c\x82I\xb8\xbd\xe1V\x0a\xc0\xcc\
+\x92\x9b\xcd\xfd\xcd\xbc\x06\xf6\x19p\xf5\x11\x00\x80\xac\xcc\
+\xcc\x16\xe5\xa5\xa5U,\x83=\xfd\xc4\xa3\x8f\x19\x07\x06\
+\xbd\x161\x15\xa4%'ARb\x1c\xbc<\xf5\xb9\x8e\
+\x0b\xe6\xcf\x9dk!eB\x0b\xaeP\x93\xa92\x96&\
+\x9b?\xbe<\xc0z\x07~\xf1\xf7?c~\xa6\x1db\
+t\x1a\xaf\x00\x14Ju\x9d\xa3\x94\x16_(\xf1\xbc\xfd\
+\xc6\x9boM\x1c7\xbeq\xe3\xc6\x8d\xa1I\xb3f\xbc\
+p\xf0\x02\x16\xa8\x12@\xc7TP\x8f\xd6\x96\xca\xef\xbd\
+\xba\xf7\xb0\xef\xdc\xbe\xe3;\x8f\xac_\xc1y\xf3\xb5\xe9\
+\xe3cc\xa2\xd4zX\x83!2|\x22%`\xa6\x18\
+\xd0r\xf4\x12\xa7\x00\xa2\xf9\xbcHQ\x80\xd3\xe9\xac{\
+EFf\xb3\xf8\x988\x88\x8a\x88T\x11\xb3\x9a\x1a\x18\
+4\x17W7\xa6\x1cDeDZ\x94UV\x00\x000\
+e\xd2\x1d\xf7\xf0\x8c8\xf9\x8e\xdb\xeeF\x88j\xc6\x14\
+\xde\x9f\x8f\x09\xae\xea\xdb#v\xd1\x9c\xef\xde:|\xe0\
+\x80\x8b\xaf\x9b\x17\x0d=\xf7\xeb\xaf\x0d\xf2\xc2+\x08_\
+\x06\xc5\xf7\x0b\x06\x8a\x8a\x8a\xe9\xd9\xb3g\x95\x13'N\
+V\xe5\xe4\xe4\x5c\xcc\xc9\xc9\xb9p\xf4\xe8\xd1\x82\xc3\x87\
+\x0e\x15\xe6\x9c8Qr\xf2\xe4\xc9\x8a\xf3yy\x9e\x0b\
+\x17\x0a\x83\xaaW\x0c\xac0\xfb\x95\x01\xeb\xf1\x1b\x15\x00\
+\xe5\xca(\x94u\xa9)\xa5t\xef\x9e=\x05\xaf\xbf\xf2\
+\xea\x8bWddDJ\x12\x01\xa7\xc3!\x1a\xb3@\xdc\
+~l\x8c\xf9<\xaaA1\x08\xa1\xdd&E|\xfb\xf5\
+\xd7?\xf1=\x7f\xfe\xb9\xa7g\xa4\xa5%C\xdd\xb0\x08\
+\xbe>\x95i\x18>%\xc0\xb5%!\xed\x02\x18y\x9b\
+7tZ:\x0d\xf2e v\x0e\x02\xa0\xdfnH\xb8\
+t6M\xcd'\xdbl6\xe7\xd0a\xd7N\xe8\xda\xa1\
+sS\x9b\xcd>\xfd\xc3O>\xbep\xec\xd8Q\x16y\
+\x02\xf8VM\xbe\x0d`\xd2D\x1fN\xc4\xf2\xaa\xf5\x89\
+\xb6\xf0\xea\xea\x5c\xb4p\xe1\x92\xeb\xae\xbf~([\xc9\
+\xc4\xf1co\xff\xf2\x9b\xd9\x9f\xfb2J\xd4\xb8mW\
+\xab'&:\x92^\x91\x9a\x0a\xdd\xbau\x03\xa2\xd0\xdb\
+&\xde~\xc7\xe3\x9d\xbatmd\xec\x1e1T@\xf8\
+'X\xcf\xb0\x9ebT\xf2AUU\x15\x14\x14\x14\x14\
+\x95\x95\x96\x9d\xcb9q\xfc\xf8\x81}\x07\x8e\xe7\x9d?\
+\x7f.?\xff\xfc\xf9\xfc\xfc\xfc\x22we\xd5\xc56m\
+\xdbUT\x94\x97\xb9*\xaa\xaa<.\x8f\xdbSr\xb1\
+D&\x00\xb4nt4\xa9\xac\xac\x94\xe2bb\xec\x00\
+`\x8f\x8b\xaf\xe7\xd8\xb1}[\x84\xc3\xe9\x8c\x8a\x8e\x8b\
+\x8fH\xac\x97P/%5%1.>.\xb5q\xe3\
+F\xf5\x13\xe2\x13\xd2bcb\xeaE\xc7\xc48\xc4\x18\
+q@\xd5nR\xa0>\x9e'\xfeD\x7f\xe7\xd0\x0d\xe4\
+\x14\x80x|\x0f\x1dZ\x86\xdf\x7f\xff}\xdf\xec\xaf\xbf\
+z\x9b\xd8\xed3\x7fX\xf8#\xe4\x9d=\xabV\xc4S\
+O\xb4\xbdXB\xa8\x0cL^\xf6\xbd\x04\x06I\xef}\
+dxX\xe2\x9a\xd5k\x96_\xd9\xad[\x07\x00\x0a\xb2\
+\x87\x82\xcd.\xc1\xe2E?,\xbe\xfe\xfaQ\xc3(Z\
+\x17!\xde\x0eir\x81m)\xc7\xf0\xe3\xcb\xf08\xb2\
+m\x01\xa5\x81\x7f\x1e\x1c@\xecRc\xde\x00\xef)h\
+\xeeuXX\x9d\xe8\x97_z\xe9\x9d\x13'N\xe4\xdc\
+z\xdb\x1d\xd7pH\x89\xbc\x0b\xab\xb6E\xde\x08\x8b\xb7\
+N\xc3\x82QC\xb2i\x00\x00\x10\x17\x1d\x93z\xfa\xec\
+\xd9\x02J\xfd\xd3q*+\xf4\x86\x91#n6\xa1\x13\
+\x01\x00[\xd3\xa6\x8d`\xf4\xb0\xab\xa1]\xcbf\x8dV\
+\xaf\x5c\xbeHg\xf3\x84F\xd9$b\x17$xd\x0f\
+=q\x22\xe7\xdc\xa6M\x9b\xb6/\xf8a\xc1\x17\x0f\xde\
+\xf7\xe0\xdd\xdd\xae\xec\xd2;\xab~\x83\xac\x99\x9f|\x1e\
+\xbbp\xc1\xc2\x90\x9bo\x1a\x0bM\x1a6\x05\xa7\xd3\xa9\
+!?\xe1\xe6\xb1\xf0\xcc\x13O\xc2]\x93'C\xdd\xc8\
+\x08-=))\x11\x08!\x90\x9c\x94\x08\x92$Af\
+f\xa6\xae\xd3M\x9b6\x83Q7\xdd\x08-Z\xb6 \
+\xcf<\xffl\xe4\x90\xa1\xd7\xa44m\xde\xbc\xed\xc8Q\
+#n\x986\xf5\xf9W\x96/]\xfa\xd3\xc1\x03\x07\x0e\
+^,.\x16\xafp\x08\x81\xa3\x8bp\xea\xa3\xee:4\
+z>\xabW\xff\xb4b\xe0\xa0\x81m\xbbv\xee\x0c>\
+\x8f\xcc\xcak\x14\xfdD\xae\xb6\xc1\x0bl\xd9\xaci\xb3\
+\xdd\xbbv\x1dTq\x90}\xee\xff\xe6\xcd\xbf\xees:\
+\x1dQ\x80\x03\xf1\xfdo\x03}\x9b\xfc} x\x9az\
+2\xf4\x12\xf6\x01`\xd7\xa2\x8d:\xd8\xbc\x1b^|y\
+\xfa{\x94R\xfa\xde\xfb\xef\xff/<,L\xdd~\x0b\
+\xa0\x17f\xben\xd14\xc0,\xe2\x8f\xcd\xabD\x04\x04\
+&\x1f\x00\x00\x5c7l\xd8(\x8d\xc7d/S\xb9\xab\
+\xaa\xe9\xcdcn\xb8\x9e\xc9L\x9cDb\xdb\x81k\x06\
+e\xc3\xb7_|:i\xf7\x9f\xbb\x8a\xf5\x8c\xca\x86\xbc\
+jO\xe0)\xa5\xf4Baa\xe9\xd6\xcd\x9b7\xcf\x99\
+=\xfb\x8b\x09c\xc7\xdc\x12\x1b\x13\xd3 !.\x01\x1e\
+\x7f\xecqp:\x1cP\xd7;\xed\x02I\x92\xa0e\xcb\
+\x96p\xcf]\xf7\xc0U\x03\x07C\xdb\xd6\xad!*\xc2\
+\x1b,#\x84@\xaf\x9e=\xa1_\xef\xde\x80\x00\xe6\xf1\
+\x01\x00@xx88|\x8a\x84\x10\x02@\x08D\xc6\
+F\xb3k\xf4`\xb3\xd9\x22{t\xef\xde\xeb\xad7\xde\
+\x98\xbav\xf5\x9a%\xbbw\xef>h\xdd+\x1d\xf1|\
+\xab\x01&43\x09\x86\x1e?~\xacz\xde\x9c\xef\x9e\
+\x18:t0\xef\x95\x88\x04\x87w\x9fy^\x12\xd2\xa5\
+]\xcb\xe6]\xce\xe5\xe6\xe6\xeb\xf0\xa2\x94\x96\x97\x16\x97\
+t\xef\xda\xb9\x0d\xde6\xd1\xf1)\xf1n\x82\xe6\xa7\xc3\
+\x18_ci\xc0\xd4\xc5+*\x09j\xa8\x00\xf8\x00\x1f\
+\xdb(\x1f\x03\xc0\x08\xaa[\xdf\xbc\xef\x9e{\x1e\xa6\x94\
+\xd2\xfd\xfb\xf7\x1fn\xd5\xaam\x17\x0cI\xaes|\x1a\
+[\x9fH\x13\x82\xe0Z4\xa8\x06e\xf5\xf6\x9bo\xce\
+\xf2\x8f\xa37\xe8TVV\xea\x1e\xd8\xbf\xdf \x86\xca\
+\x9a\x19MMLL\x9b\xfd\xe5\x97\x0b\x03\xe5i\xd3\x08\
+\xbd \x10\xa8\xc2\xc5\xe2\xa2\x8a\xc5\x8b\x16/}\xf2\xc9\
+\xa7\x9e\xbd\xb2c\xe7\xde\x00@\x1aed\xc0\x15II\
+\x00\x00\x10\x19\x1e\x01))\xde\x83d\xd2\x92S\xf8%\
+2\x88\x88\x88\x80\x8c\xf4t\x90l\xfc\x0cO7\x16\xfc\
+=\xc6d<mAthH\xdd\x88\xba@\x08\x81\x90\
+\xd0\xd0\xb4\x09\xe3'\xdc\xfa\xe9\xc7\x9f|\xb0c\xeb\xb6\
+?M\xe9\xa3\x8by(\xdcOD#\xc5\x1f/a\xe0\
+\xe7\x95+74i\x98\xd5\xaeq\xe3\x86\xaa\xf7\x83\x19\
+\x09\x96\x87\xb1\xbe\xb3\x04\xd3\xf1K\x9f\x9e=\x07\x95\x17\
+\x17\x97\xf3\xd8\xc8\x9ejz\xf7\xa4\xdb\xafo\x94U\x9f\
+\xa7\xa7\xe4\x9b\xf3\xf3\xca\xc0\xc0\x8bL\x9a\xa1\x0e0\xf2\
+6p\xe9,\xbe\x97\xbc\x15X\xa4\x00x\x02\xf2\xc2\xab\
+S\x02\x83\x07\x0d\x1a\xa6\x12\xe8\x81\xfb\x1ex\xda\xe1t\
+\x82\xcdf\x03I\x92\x00p\xb7\x87\xd7h\x98\x00\xf3\x1d\
+\xe7\x07\x91\x05~ \xd5\xfc\x1a\x9e}\xfb\xf6\x8e<{\
+\xfa\xcca\x95\xa5TO\xa0\xac\xa4\xa4\xacG\x8fn\xec\
+\x12\x0e\x5c{\xf5\xe0a\xa7O\xe4\x9c\xc4\xc5\xd5\x9c\xc1\
+u\x86\x0b]\xfe\xf2\xc3O+V\xfd\xf2\xc0\xdd\xf7\xdc\
+\xdf\xb6E\xcb\x8e\x80\x81^\xf8\x08\x00\x80\xc3\xe1\x00\xa7\
+\xc3iH\xe7K\x9a\xd0K\xa4`Ee\xd54\x83\xf2\
+W!2R\xf3Jb\xaf\x1e|\xf553\xa6O\x7f\
+c\xcf_\xbb\x8d\xf4C\x83\x80\x88\x12\xe0\xca\x18\x97\x19\
+\xbdP|\xe1B\xd9W3g\xde\xefp\xd8U^3\
+\x13\x1a\x11\x0d\x0c\x16w\xc4u\xd7\x8c\xae,+\xab\xa6\
+\x08<x\xcf\x94'\x00\x00BCC\xf8\xf6\xb8:\x09\
+ \xf5\x07Bo\x1e7l\x8a\xa3]\xd3Z\xdc\x08\x84\
+\xcd\xc51/\x80\x15,\x0d\xf1\xbe}\xfa\xf4(,,\
+,\xa7\x94\xd2\xa5K\x97\xady\xf8\xa1\x87\xdb\x0c\x1e|\
+\xb5\xfa\x18kKD\x183\xd7\x08\xb84\x8c\xf8\xc0\xe5\
+'\x91\x91\xe10b\xe4\xf50\xe1\xe6q]\xf2\xf2\xf2\
+\xbc\xe6\xdf\xa3PE\xf6^\xe6\xe5\xe5\xe5\xa7\xa5\xa55\
+\x01\x00\xb8\xef\xbe\xfb\x1erU\xf9\xc7^\xb8\x85\x06\x89\
+\xec\xeb\x05^A\xcb\x9e=}&\xef\xb5\x193\xde\x1f\
+q\xfd\xf0>\x19))\x91\x80\x00\xb2-\x16\xc0\xc88\
+X\x1e\xb34\xf6Y \xf900\x08\xbf\xc3\xee\x80\xac\
+\xac,]Z||\x1c\xf4\xed\xd3'c\xe4\xa8Q\xc3\
+\x16\xfd\xb8hQiII\x85\x8e\x082C/\x1d\x11\
+\x11W\x0aYNa\x93*\xcb\xcb\xe9g\x9f|\xf4}\
+\x9f\x9e]\x13:w\xe8\xa0*M\xcc\x9ab}W\xfb\
+\xa4\xf5\xeb\xf6[\xc6\xdf!\xbbP\xd9\xa7\xdf\xce\xfa\xfc\
+K\x84vD\xb3\xfc\xde9\xbf\xcf\x13\xd0v\xfcI\xc4\
+\xaf\xc91|\xcc\xd2XYQA'\x93\xb4\x86\xfb\x00\
+X\x02\x89\x04\x93}f\xb5\x9c\x07\x00\x00-\x9a6m\
+~`\xef\xdec\x94RZZr\xb1\xfc\xc9'\x9fz\
+(3#\x93\x84\x86h\x16\x0bkO\xa4\xe9\xb0\x01\x13\
+\x11\x0e\xd3\xe4\xda}tT\x144\xf7\xad%\xbf\xf0\xfc\
+\xd4\xa7\xd4\x01\xf5x\x5cZ\xa0i\xf3\x96\xcd;\xdex\
+\xf3\xcd\xf7\xf5\xec\x86\xefy\xe7\xcc\x12\xf7H\xa1\x1eY\
+\xa6\xb2\xe2_\xd2*,,\xa0\xdb\xb6o\xdby\xdf=\
+\xf7<\x12\x1f\x13\x9b\x06\x1cx_\x95\xf5w-\xd0\xb3\
+\xfa\xfe\x0b\xe0\xb0;\xa0y\xb3\xe6\xe0\xb0\xfb\xa7\xe4\x91\
+Q\x91\x10\x1e\x16\x0e6\x9b\x0dV\xaf^\x03\x93\xef\x98\
+\xdc\xfc\xb1G\x1f\xfd\xdf\xae?\xfe<\x8a\x10\x8c\xa3\xab\
+E|@P\xf4\xd7\x8d\x1b\x0e\xbd\xff\xfak\xbd\x1a\xa4\
+k\xe4\x95\x88\x9e\xbfD\x82\x06\x00\x00\xa1!!p\xfb\
+\xc4\x09\xf7\x89\xe6i\xbflX\xfb;!\xc0\xc6\x1d0\
+\xa3c\xf3\x0a\xbe\x7f\xceO\x8cm\x89x\xd7,>\x00\
+\xe9i\xa9q\xf5\xebg\xa6\xf3}\xa15\xf4\x00D\x82\
+\x8fY}\x1e1Q:\x00\x00\xc4E\xc7$\xfd\xbaq\
+\xe3\xef*\xe1V.[\xf1\xd3\x94\xc9\x93ZK\xc6\x97\
+r\x02\xb5\xe8\xbcPK\x5c\x19\xd14A\x83\xf0\x900\
+HO\xcd\x80\xd4\xc4\x14\xe8\xd8\xae\x03Y\xb9|\xe5\x06\
+J)\x95\x15\x85\xba=\x1e\xe3:;b\x8c\x84<\xab\
++\xa3g\xde\xdcS\xb9\xf4\xc8\xe1C\xeb\xdfz\xeb\xcd\
+\xb1\x08Z\x02\x9c\xffo)\x80\x10g\x08$%%\xf3\
+8{-#!0b\xc4\x08\x88\x8d\x89\x03\x00\x80\xb4\
+\xf4\xb4\xb8\xb7\xdf|\xe3\x99\x1d\xdb\xb6\xed\x16J\xb3\xc1\
+\xe2\x8b\xcf\x1f\xe0\xa1\xb2\xacL\x99|\xdb\xadS\x18T\
+$\x82\x0b\xbcv\x9d\x9c\x94\x08\xe3\xc6\x8c\x81\xcf?\xfe\
+\xf8\x09\xb7\xdb\x85\x8eo\xce\xd1\xc391\xd1\x91Wp\
+]'\x9ae\xf7jo6\x06\xc0\xf0%\xe1\xdbf\xef\
+EB\xaf\xf3\xb4F\x8f\x1cq\xcd\xb4\xe7\x9e~\xb3i\
+\xd3\x86\xed\xf8:h\x0d\x82\x80\xbc\xf0\xf3\xf7\xd8F \
+L\x01`Z\x0c\x00\x00\xec\x92\x14\xbah\xe1\xc2\x1fT\
+\x02\x9e\xce=]~\xf7\x94;\x1f\xee\xd9\xa3+df\
+d\xf2D\x00\x04\x1f\xec\x07\xc8sL9\x19\xc0aw\
+@|l\x1c$&$\x02\x00@l\x5clfA~\
+A)\xa5\x94V{dN\x01\xf8\xe7\xa3\xa2i)\xee\
+\x11\xf8w\xb3\xc9\xb2BW\xaf\xfei\xd3\xa7\x1f|4\
+\xe6\xc6\xe1#\xe1\xfe{\xefe\xd1\xc1\x98\xe1\xdf\x00\xd4\
+\x12\x06\x0bv\x9b\x1dKF\xc7\xaf}\xc7\xf6\xd0\xaau\
+K \x00\x91\xf7\xde}\xf7\x83\x7f\xef\xdau\xc0(\xc6\
+<q\xd5\x97\x95D`\x1c\xa1\xf7\xfe\xf7\xd6{\xcd\x1a\
+6\x80\xb00\xa7\x8a\x0b6\x85$\x00\x00mZ6\x87\
+\x0d\xab\x7f\x9a\xeea\xcfg`\xaa\xab\xaa(sw\xea\
+\xd8\xbe\xab\xa0o\x00>\xb7_\xf2Z}\xed\x19\xd1\xaf\
+\x06`\xde\x076\xd5\xd5\xc5X\x92\x13\x12\xec\xef\xbf\xf3\
+\xee\xcc\x0dkW\xef\xca\xce\xee\xa3\x05\xab\xd9\xfa\xe8%\
+*\x00L!\x88\x96\xe5\xd8{\x8c\x18\xba\x0e\xd9m6\
+x\xe3\xb5W\xdec\x07\xe6\xcf\x9d;\xd7^;\xe4\x9a\
+\xe6\x00\x00\x92\xf7E\x1a3\xb7\xc8\xec\xc7{+<^\
+\x06 \x84\x80\xcd\xff\xa6\x19\xdc{\xf7=\xb7j,\xc6\
++\x80@\x16\xf8|\x91>\xc5\xb7f\xad\xc2\xda5k\
+\x0e}5k\xd6\xb8^}\xfa8\xbaw\xed\x0e\x12\x12\
+\xc8\x03=3\xfc[PK\x0a\xc0\x06\x82#\xc0\xd8v\
+\x08\x00@\x97.\x9d\xa1c\xa7\x0e\x00\x00\x10\x1eV\x07\
+\xae\x1a00\xe1\xde\x07\x1ex\xf8tnn\x91\x85L\
+\xe3#\xc1,\x0f(\xdc6\xe4\x9fV,Y1f\xc4\
+\x90\x98z\xb1\xb1*\x1e\x92\x04`#@t\x1a\xeb\xa5\
+iS\xff\xe7\xf1Y~Y\x91\x0d\xad\xdc8j\xc4-\
+\x5c_T\x17_\xe5;\x9b\x04\xbe5S\xef\x0bi\xc1\
+x\xa8\xbc\xb5\xd7\x9e\xf7\xef\xdb\xa7\xef\xf9\xbcs\xa7\x0f\
+\xef\xdf{|\xc2\xd8\x9b[\x22ej\xcd\x03`\x914\
+{)'P\x05\xa0\x83'\x1f{\xf4\xf1\x92\x22\xff\xf8\
+\xee\xd9\xb3\xa7\xf0\xe9'\x9e|t\xfc\xf8q\xe0p:\
+\xf9i\x01F\x1c\x91\x12\xe0\x97*-\x199<<\x0c\
+\xe2\xe3\xe3\xb5\x97K>\xff\xec\xb3\xefE\xf2m\x09\x8a\
+Be\xd9o\x99\x8e\x1f?vq\xda\xb3\xcf=G\x80\
+\xd4{\xe0\xbe\xfb`\xf8\xf0\xe1\x18\x8d\xfem\xa1\xaf\x15\
+`;\xe1\xb0;\x02\x9e\xb2t\xbd\xb2\x13t\xed\xee]\
+)v:\xfd\xd3\xe9\xcc\xcc\xcc\x86\xaf\xbc\xf2\xca\xff*\
+++\xdd:\xe1\xc6\xf7\x0d\x8b\x06\xc4\x90g\xf3\xa6\xf5\
+\xbb\xdf}uF\xd3\xac\xcc\x0c\x00\x00\x90\xbc\xcb\xbcv\
+\x00\x00\xa7M\x82\xcf?\xfe\xe8s5\xaf\xdb\xed\xa6n\
+\x8f[\x0b\x0cSJ\xe9\xab3\xa6\xbf\xceu\x1b\xe1?\
+\xc2\xde\xab\xcaA\xcd\xcf^\xf3$\xc4\xbc\x00 \x84\x90\
+\xd7_y\xe5\x15J)]\xbf\xfe\xe7M\xa9\xa9)Q\
+\xccaj\x06\x0f\x9c\xd6b\x0c\x80uA4\xed\xc6u\
+Z\xe4\xfa\x8b\xee\x01\x00\xe0\xe1\x07\x1f\x1a\xe7v\xbbK\
+\xd9\xe1Z\xb6x\xf1\xca\x9e=z\xb4@\x08\x83\xd5\xc7\
+>g\xf3\x99Z}+\x08\x0d\x09\x8d8|\xe8\xd0\x11\
+\x03\x13\xb1Q}\x03C\x1a\x83\x82\x87\xf7\xef_6 \
+\xbb\xbf\xa6\xa5;u\xec\x04u#\xa2\xf9~\x89\x98 \
+\x18\xa5p\xa9J\xa4\xd6\x95P0\xf1\x8a:auT\
+\xcf\x0f\x85\x0e\x1d:t[\xbdj\xd5:\xa3`\x8b\x85\
+\x9c\xcf\xc1\xa7\x9c>y\xe2\xdc\xc8a\xd7\xf5c\xdbI\
+K\xa9\x17\xbed\xc1Bmgg\xa5\xab\x9a\xba\xdd.\
+\xca\x9e\xea\xf3\xfd\xec\xd9K\xb2\xb2\xb2 >>\x01\xed\
+6x\x85\x9d\xe3S\xc2<C\xc7\x1b\xf4\xf9\xf5\xfc\xdb\
+\xb3K\xf7\x8e\x7fl\xdf\xb9\x9bRJ?\xf8\xe0\x9d\xf7\
+\xb8\xb2\xaa|\xea\xca\x07\x22\xf8\x14Q\x00\xbc\xfb/z\
+\x13\xcf\xc6! r\xc71O@#\xc2\x8d#F\xc2\
+\xa4\xdb\xef\xe8\xbdc\xebv\xdd\xe98\x05\xe7\xf3\xcb\xa6\
+L\x9a\xac\x9b #u`\xf3\xfc@\xacj@\x9c\xd9\
+\xbf_v\xb6\x81\x9dD\x0a\x80s3\xcf\x9f?Wx\
+\xc3\xc8\xd1w\x0d\xce\x1e\x04\xfdz\xf7\xb3j\xea\x92\xf0\
+\x14\x94\x0b\xb4,\xcf|\xff\x05\x10\xe2q\xe7\xa4\xc9w\
+\x9f:u\xea\x8cQ\xa6\xb1\xf5Vs\x05@)\xa5\xc5\
+EE\xf2\xa8\x11\xc3\xc7\x02\x008\x9d\xf6\xf0\x9f\x7fZ\
+\xa3\xbd*^\xe1r\xd1\xea\xeaj\xea\xa9\xaaV\xa8/\
+\x0ep\xfc\xf0\xe1\xbf\xef\xbc\xe3\x8e\x88\xb6m\xdb2\xb8\
+jK}\x04\x00\x88\xe4\x8d/b\xc2.\xa21\xcf\xaf\
+\xa4K\xe7\xce0 \xbb?\x00\x80\xed\xc1\x07\x1exB\
+\xc5\xe9\xf6\xdb'\xde\xcd\x95ec\x03:/\xa0\xa6\x0a\
+\x00\x13bV\x11\xf0\x8a\x81\xd7X\x98\x00\x8a\x94\x03$\
+''C|t,\x0c\xbfnX\xa3]\xbb\xfe\xd8\xc7\
+\x0f\xd7\x8f\x0b\x16.m\xda\xa4IS\xa6\xc3\x22\xe1\x0f\
+\x94\xd8\x80\xa4\x0b\x19\xee\xb9\xe7\xa7\xbe\x8c*\x00-\xc5\
+\x18\x0d\x5c\xb6x\xd1\x9a\x8c\xf44\x0d\xe7\xd0\xf00\xb6\
+\xa9@\x15\xd4?e\xcd\xff+B\xcf\x82\xe98&&\
+$\xd4\xff\xe2\x8b/\xbe5\x0a6\xf6\xc3\x81}yY\
+Vd\xfa\xcc\xd4\xa7^\xfa\xe9\xa7\x15\xda\x1b}\x95\x9e\
+j\xa5\xdc\xe3\xa2\x9e*\xb7\xa2T\xb9dJ)=|\
+`\x7f\xc1\x95\x9d:6\xec\xdc\xa1=8C\xc2y\xfc\
+|<(\xe9\xe4\x83\x18-\xbf\x99\x12\xd0\xe0\x93\x8f>\
+\x84\xa5\x0b\x16wZ\xbc\xe0\xc7\xdf(\xa5\xb4\xa0\xe0\xfc\
+\xc5+;\xb4\xeb+\xa0\x8b\xfa\x97\xf5\xcc\x03\x16~3\
+\x05\xc0\xa6\xf3.\xbfh\xfd\x9f\xb7\xd2\xc0\x95C\xadt\
+TT\x14DEE&lZ\xbb\xee7~\xb0\x0a\xf2\
+\xf3\x0b\x1e\xbc\xef\x01^\xf3aJ\x0a{\x1e\x08\xf0\x84\
+T\xfb\x0d\x00@\xd6\xae]\xabY\x056&\xe8='\
+\xcf?/T\x14\x99\xbe\xf4\xd2\x0b\xcf9\xedv\xcc\x97\
+\xf5[\x0a\x5c9\xb2\xed_\xf2\x14F\x00\xffEa\xb7\
+\x02\x8c>\x00\x00p\xef}\x0f\xdct\xf0\xd0\xc1<?\
+\xfdy\xa1\x17+\x02\xfd\xf1&zp{\x5c\xb4\xcaS\
+\xad\xb8\x5c.\xc5\xe3\xf6(\x94RZRT\xe4\x19<\
+xPO\x047\xf5\xafD\xfc+\x8b\x12\x80\x1a\xed'\
+\xfcx\x8b\xfaG\x08!\xd0\xb5kW\xe8\xd5\xb3\x07\xbc\
+\xf3\xf6\xdbO_,.\xa9\xa4\x94\xd2\x8d\x1b\xd7\xef\x18\
+:\xb8\x7f}\xa4\x0cf\xf4\xb4\xb4KQ\x00f\xc2,\
+\x0a\x12\x8a<\x07\x1d\x91\x04\xf7Z'\x1cv{\xd4\x92\
+\xc5\x0b\x97c\x03\xf3\xe5\xe7_~\x97\x9a\x9a\x92\xc1t\
+\xd8F\xac5\xab\x19\x98\x95\xd1\xfa\x9c\x9c\x94\xda \xbf\
+\xb0\xb0Xe)Y\x91\x0d\xef\xe2\xe7\xe6\xe6\xe6\x0f\x1e\
+<\xc8\x1b\xdd3\xeei@\x95\x9eI\xda\xff\x0f8M\
+t\xb4JHN\x82\x17^|!\xf3\x9bo\xbe^\xe4\
+\xe7\x12L\xb0\xb9\x89\x9c\xc2\xa6\xf3\xcfd\xea\xf6\xb8\xa8\
+\xc7\xed\xa6\xb2\xcb\x1fw\x1c?\xee\xe6\x9b\x00\x00\x9c\x8e\
+\x10\x01\x9e:aWc\x00\xe0\xbf7\xf4\xc9\xd0\xcf\x0e\
+\xed\xdb\xc0\xb2\xc5K\xdb-[\xbcx]\xb5/\xe6\xf0\
+\xd5\xac/\xe6g\xd5\xcf\x8c\x8c\x8f\x8dV\xf3\x9b\xc5\xd5\
+t\xf7\x97\xa2\x00\xcc*\x07\xee\x99\x99;\x8e\xd5c\x88\
+\x03\x80\x97Z\xec\xbd\xed\x87y\xdf\xa3'\xea\x9c8q\
+\x22o\xe4\xf5\xc3\xd5\xcf)aD\x0dT\x11\x98\x0d\x06\
+\x01\x00I\x02\xe2P\xfb<r\xf8\xc81~&Q\xa8\
+\xc2\xac\xedo\xdb\xbe\xfd\xef&\xcd\x9a\xb1\xcb1H\x7f\
+\x09\x01b\xf0\xa40\xdaY\xe1\xf8_\x02L\x81\x05S\
+\x8e\xbd7\xcb\x83\xb6\x93\x9e\x99\x09\xef\xbf\xff\x1e\xb4i\
+\xd7\x1a\x1e\xb8\xef\xbe\xa9g\xce\x9d\xd5\x9f\x8d\xa4-\xc7\
+\x8a\xc0\xb8\xa3K\xa12\x95=\x1e\xeaq\xfb\x85\xff\x91\
+\x87\x1fx\xd1\x19\xea\x80\xd0P\xdd\xa7\x165>\xf6Z\
+~P\xc7\x970]b\xc6\x14\xdd\xf2KBCCa\
+\xfc\xcdc\xa1C\xebV\xf6\xfb\xee\xb9\xebaWU\xb5\
+v\x92\xe8\xdbo\xbe\xfa\x1e\x00\x80\xc3ng\xeb2\xa3\
+\x8b\x8e\x7f\x83U\x00f\x82o\xc6\xb0\x22\x81\x17)\x05\
+a\x00\x8f0\x9d#\x84\xc0;o\xbd\xf9\xb1h\xe8>\
+\xfb\xf0\x83\x8f#\xc3\xc3\xf9w\xae\x83aF6\x0f\x86\
+\xbf\x8d\x00\xb1K@\xb4\xbd\xcao\xbc\xf1\xf6{<\x1e\
+\x8b\x16/[a\xb79c\xb9\xbaE\xb1\x14u9\xc8\
+L9\xfe_\x82@\x15\x80\x95\x92\x0eTy\x18\xdai\
+\xdc\xb8!\xa4\xa4\xa4@\x5c|\x1c\xbc\xf5\xf6\xdbW\x1d\
+:|8\xd7/\xdf\xeanAF\xd6\xd5i\x02\x7f(\
+)[F\xf6o\x00\xdb\xb1m\xeb|\xf5<\x05\x89\xe8\
+\x86\xc7\x06^\x1e!>\xcc\xd8\xc0\xb8\x8a\xab\xe9\xd44\
+\x22\x22\x1c\xfa\xf4\xec\x01\x0b\xbe\x9f\xd7\xf2\xd0\x9e}k\
+T\x14\x5cU\x95\xf4\xb6\x09\xe3\x1f\xe1\xca\x89\xe2\x5c\x22\
+c[c\x05`6o7s\xe1\xb1\x9f\x08D\x8co\
+(\xf7\xca\xcb\xd3_\xd1\xe9lf\xac\xfe\xfe\xf3\xaf=\
+\xbd{\xeb^l\x0f\xc6\x13\xe0\x15\x00[\xc6\xf7\xad>\
+b# \xd9\x99\x0d\x22\xd2\x86\x0d\x1b7\xb3\xf8\xb4l\
+\xd7\xa9;S\x96\x1dl_]\xba\xa3\x9f$\xa6\xd9`\
+p\x15\xe1\x1d,\xd4\xc4Z\xd7\x06\xd4V\x9bB\xfc\x09\
+!0l\xd80\xb8i\xec\xd8\x8cE\x8b\x16n\xf0\x8f\
+\x10\xa6\x00d\xaa\x1dK\xc6(\x05\xc5\x97\xa62\xd9\xba\
+5\xab\xb77m\xd2(\xac\x8e\xb3\x0e\x8f\x83\xef\xafN\
+#H~\x1bfJg\x02\x00\x90\x99\x91\x0e\xafN\x7f\
+\x01f\xbc4\xed\xe1];\xff(Q\xb1-(\xc8s\
+\xbd4\xf5\xd9\x1b\xb2\xd2\xd2\xd8\xfc|\xfc\x8d}&4\
+\xbe\x97\xaa\x00\xf8\x8e\xf0\x0a\x80}.\xba7\x036\xaf\
+i=O>\xf6\xd8\xd3\x22%P^ZV\xf9\xe8\xa3\
+\x8f>\xde\xadGWh\xdc\xb4\x89\xfa\xeag \xb8\xf0\
+\xed\xab\x7fUM\xaejx\x1b\x01I;\x81\xa8A\x83\
+\xac\xc6\xe7\xce\x9e+R\xdb\x7f\xf1\xa5W_c\xea\xc4\
+,8C\xb7\x80H\x13\x8c\xe2\x0aV\xb0\x02U\xd0\xff\
+5\x10\x09\x92\xee\xe7\x0c\x09\x81^\xbdzCjr\xb2\
+\xf3\xd3\x8f?\xfe\x92\xea\xc0\xb0|\xe3\x8f\xe3\xf8\xaee\
+\xd9?]8y\xfc\xd8\xb9\xf4\xd4\xd4t\xaeMF\xd8\
+\x0c\xc1=\x8c\x9f\x84\x90\xdd\xbbg\xd3\x93\xc7\x8f\xaff\
+\xa7\x1a\xb9\xb9'\x0b\xb2\xb2\xea\xf7\xee\xd0\xba5\x8c\xbb\
+a4\xdb\xa6U0\x1dU\x025U\x00f\xc2\xce\x22\
+$\x12Z\x9e0\xa2@!F4!sO\x992\xe5\
+\x01\xfd`*\xba\xb7\xea\x16\xfc0o\xe1\xd3O=\x95\
+\x96\x94\x98\x0c-\x9b7\x87\xa6M\x1a\xb1\xf5X\x01\x8b\
+\x17r&\x02\xb1y\x7f\xde\xba\x86\x0c\xb9z\xa0\xfar\
+\xc8\xb9\xdc\xb3\xe7\xa3\xa2c\x13-\xea\x16\x05*/U\
+\x10\xb1\xf2\xbc\x97\xf6\x7fI\xd0k\x0aZ?\xd9\xcdG\
+\xaf\xbc2\xe3U\xa3\x12P'\xfb\x8a\xce\x92\xb0\xb7\xa5\
+e\x17\xab\xfb\xf6\xea\xd9\x03iC\xf2_\x1ad$`\
+:\xdfq\xeb\xadw\x1c9|\xb8\x80\xc5\xec\x8f?w\
+\xeeo\xd9\xb2\xb9\x16GB^\xfb6\x13x\xf4w)\
+\x0a\x00\x9b\xbf\x03w\x8fu< \xc4\xb8\x8ea\xf5\xf2\
+\xe9\x00\x000q\xfc\x84[\xdd\xd5\xd5\x0a\xa5\xdeH\xbc\
+\xdb]\xa5\xb8\xdd\x95\xda(\xee\xdb\xb7\xefdvv\xff\
+\xc1\x13n\xbe\x19&\x8cE\x8f\xf5\xc3\x04\x82o\xcf\x06\
+\xfe}\xdbX\xd0\x0e\x00\x00&\xdfq\xc7\xfdj\xbb\xf7\
+\xdcu\xd7\xc3\x82:\xad\x94\xe4\xff\x0f\xd6`\xa64\xcd\
+\xf8\x0b\x00\x00\x1ey\xe4\xd1')\x07\xda\x16!&\x1c\
+\xc0\xc2\x0d7\x8c\x18\x87\xe3@\x00\xb8c\xbd\x048\xa2\
+i\xedZ\xb6H\xfdn\xf6\xecox|V\xafY\xb5\
+!,2,\x01)+\x92\xad\x80\xe2p\xb5\xa9\x00\x08\
+\x82\x04\x8b\x98\x84\xe4\xe5\xeb\xb3\x0a\x14\xf2\x9dF\x83c\
+\xd7\x0e\x192\xb2\xaa\xa2\xc2M)\xa5\x1eW5\xf5\xb8\
+\xca\x15\x97\xbb\x8a\xaas\xbd\x92\x92\x12\xfa\xed\xacY\xaf\
+7\xc8H\xb3\x03\x00\x5c5`\x00\x8c\x1a5\x8a}\xc1\
+\xc8\x94a@?\x05\x10Ny\x08\x00\xfc0o\xde7\
+\x94R\xbau\xeb\xd6?\xb8:x\x1a\x02\x08\xea\x11\xdc\
+\xf3u\xfd\x7f\x15\xcc\x94(\x80\xb5{\x0c\x00\x00\xe3o\
+\x998E\xaf\x00t\x9b9t\x0a\xe0\xe9\xa7\x9e\x98\xe6\
+oJR\x0d\x01\xcf\xd3\xecT\x80\xc7I\xbbw:\x9d\
+\xd0 \xc3;\x8b\xb8\xee\x9akF\x1f;t\xc8p\x12\
+\xd2\xd7_\xcf\x9a\x03`8K\x80\x97'3\xb9\xb9,\
+\x0a\x00#\xa4HHy\x04\xf8\x812CZ\xd4I\xe0\
+\xea\xd3ES{\xf5\xea9\xe0Baa\x19\xa5\x94\xba\
+\xdd\xd5\xd4]]\xe1U\x06\x1e\xff*\xd0\xb2\xa5K\xb7\
+5i\xdc\xb8\xdb\x1d\x13'\xc2\x8e\xad[!\x929\x01\
+\x97i\xd7\x06z\x9c\xd5g\xfc\xcbM\x0c^\xde\xa0\x9e\
+\xdda\x87\x9b\xc7\xdcP'?\xef\xdc\x01J)\xed\xda\
+\xabo6S\x07\x1f\xfd5\x13p\xab\xe7\xc1(\x80\xff\
+\xb7)\x0b+\xcbj\xc6\x936\xc2D\xe5\x87\x8f\x18y\
+\x93\x7f\xdf\x86:\x15\xd0\xbf\xee=k\xd6\xe7\xb3\xfd\x8d\
+H\x0e \xc4\x01\xfe\x97z\xd4\xf6\x18\xbe\xd4\x82~\x18\
+\xde\xd0\xaaU\x0b\xb8~\xc8\x90\xb0W_~\xf9\x13^\
+\xf0)\xa5\xf4\xd5Wg\xbc\x87\x15\xe6\xfa\x8c\xc9\x91Y\
+\x00]\xfb\xd5T\x01\x88,\xb3\xd5\x5c\xde\xcc\xc2\x83\xa0\
+<BT\xa1R`;\x0b={v\xebr\x22''\
+\x8fRJ\x15\xb7\x87VWV*\xd5\xd5\xd5J5s\
+d\xd3\xd93g*?\xff\xf4\xd3\xe7\xdf|\xed5\xf6\
+PLu\xbb\x96\x04Dw\xbc\xb8\x89\x967\xfcl\x00\
+@\xc2\x22\xc2a@vv\x13E\x96\xe9\xcf\xeb\xd6\xad\
+c\x06M4E\xb2R\x04\x97\x0a\x97\xbb\xfe\xff\x02X\
+\x19&\xcd\x83#@\x1c\x84\xb1\xae\xc3\x87\x8d\xb8\xa1\xa2\
+\xac\xbc\xcao\xfae\xcd\xfa\xaf_\xbf\xee7\xd0\x0e~\
+\x95\xbcq\x1fbx\x85\x977\x04\x06\xdc\x08!P\xc7\
+\xb7l8\xf4\xeaA\x03\x0f\xed\xdf\x8f\x1cpB\xe9\xab\
+3^~\xce\xa2\x7ff\xfd\xc6d\xc2\xa0\x18j\xc3\x03\
+\xe0-u s\xfc@\xe3\x00V\xca\xc6,/\x00\x00\
+4o\xd6\xac\xc5\xa1C\x07s\xbcJ@\xa6\xd5\xd5\xd5\
+\xd4\xed\xf1P\xfe\xf3L\xabW\xad\xfc\xb9K\xe7\x8e\xad\
+\x19b\xda$oP\x8fw\xf5E\x9a\x97M\xe7\xe9\x01\
+wN\x9at\x17\xa5\x94v\xe9\xd2\xb5\x07S\x96\xcd\xfb\
+\xffv\xa1\xac\x09\xd4\x84.\xbc\xd0\xb3i\x00\xfa\xb8\x8d\
+\x0d\x80\xd8\x89\xf7\xa7)\x81\xfe\xfd\xfa\x0d\xce\xcf\xcf\xbf\
+\xc0\xf2\xc7\x89\x9cc\xb9\x89\x09q\xa9\xbe\xea$\xd0\x8e\
+\xed\x22\x12\xe8\x97q\xf5\xc8\x10\x09\xea\xc5\xc6{\xbfS\
+\x98\xd5\x10\x1a7n\x0c\x1f}\xf0\x01\xdc6nl\xe8\
+\xe3\x8f<2\xedB\xa1\xff\xebJ\xea\xb9\x12\x15\x15\xe5\
+\xf4\x89\xa7\x1e\x9b2\xe4\xea\xc1\xec\x8a\x95U_\xd94\
+\xde\xd3\x16\x05}/)\x08\xc8k\x173\xe1\xc0\xee\xf9\
+\xb4@c\x00\x81*\x19\xad\xad\x94\xd4\xa4\xcc#G\x0e\
+\x1f\xf7*u\x85\xbad\x17\xba\xf7\xab\xb0 \xbfr\xc2\
+\xf8\xf1w\xb2\xf8y\x97\xf8\x08\xcb4<q1\xc2\xb3\
+\xc2\xad\x1d 1\xf7\xfb9\x8b\x96-^\xba\x0cy\x05\
+\x96\xa5\xa3\x15`\x03i\x967\xd0\xfc\xff\xa6\x12\xb2\xc2\
+\x8b\xbf\xc7\x18\x9f\x7ff\xe5\x8d\xb2\xcb\xb8v\x09\x88\x83\
+=\xecc\xdf\xbe}\x87T\xbe8w\xf6lU\xabV\
+-}{9\x88\x04 \xd9}\x96_u\xfdU\xde0\
+\xe0a\xb7\xd9\xa0[\x97N0\xec\x9a\xa1p\xff]w\
+A\xa7N\x9d\xe0\xed\xb7\xdfn\xbdm\xf3\xef\xbf\xaa\xf5\
+{O\x95\xf2^_\xb8PP5h\xd0\x80\x9b\x01\x00\
+\xe2\xe2bE\xf403BA\x05\xd9kC\x01\xb0D\
+\x15\xcdiy\x84\xb1\x0e\xf1s\x17a\xe0\x02\x8c\x07\x93\
+bm\xe9\x08\x95\x98\x18\x9f~P\xf5\x04\x14\xd9\xf4l\
+\x889\xdf\xcf\xf9\xae^\x5c\x5c=\x06G\xfe[\x07\x22\
+\x101\x1a\x01\x00p:C\xea\xce\x9e\xfd\xdd\xc2\x81\xfd\
+\xaf\xea'(k\x06\x22\x85\x1aH\x99@\xf2\xffW\x15\
+\x00\x9bG4\xd6*\x98\xc5U\xb0kV\xa9k\xe5\xee\
+\x7f\xf0\xa1\x87U^\xa8,/\xa7O=\xfe\xf8(\xb5\
+\x1c\xf1\x06\xfd|\xab@\x84\xe5C\xd5\x13\xe0\xdb\x82\xa6\
+M\xb2`@\xdf~0\xf9\xb6\xdb`\xcc\x981w\xef\
+\xdf\xb7_\xfb2\x92\xcb\xe5\xa2\xaa3\x9a{\x22\xa7\xf0\
+\xeakP\xde\xc0\xe8\xc0\xd3D$/\xa6\x8a\xe1R\x15\
+\x00&\x9c\x81\x0c\x14\xc6l|\x1dX C\xd4Q\x91\
+\x8b\x03\xbeA\x02\x00\x80\xc8\xa8\xc8\xc4\x9d;w\xec\x14\
+\x8b\xbe\x1f\x8e\x1c>rd\xd0\xe0A\xecg\xcbx\xe1\
+7\x13\x18\xa1bl\xda\xb4I\xab\xc1\x83\x06\x8d\xb0\xdb\
+lu\xd0\x92\xc6zDu\x06\x02\xff\x96@_\x0e\x08\
+\x84\xa7\xcc\xca\x88\x0c\x96\xce\xf3\xb29\x1d\xd19\xc7\x8f\
+\x9fP\x85\xf3\xdb/\xbe\x9cr\xef]STW\x5c\x15\
+zU\xd8\x99\xf7\xec\xf9{/$'%A\x83\x8c4\
+\xe8\xde\xf9\xca\x86\xdb\xb7lY\xa9\x06\x14=\x1e\x0f\xf5\
+\xb8\x5c\xda\xf7%\xfe\xfa\xf3\x8fc\xed\xda\xb5j\x99\x96\
+\x9e\x06q\xf1\xb1|\x7f\xcc\xe4\x85\xef\x8f\xa8\xcf\xa8\xac\
+\x06\xab\x00\xf8\xa87/\x88|\xba(p\x87\x953\x0b\
+\xf2\x99\x09\xbd\xa8\x1d\x15l\xc0\xb8v+\x96.Z\xa6\
+\x17u\xf1;\xe1\x95\x95\x95\xcac\x8f=>\xadC\xfb\
+\xf6\x90\x9c\xa0-\xc1b\xcc\x04\x80\xd3\x80\xc7\x9f\x00\x00\
+\x84\x86\x84DJ\x92T\x87\xcbW\x9b b\x98\xff\x0a\
+\x98\xd1\xeer\x94c\xf3\x9a)\x05x\xee\xb9\xe7_R\
+\xc7\xff\xb6\xdbn}\xa6w\xf7\x1e\xd0\xaaU+\xf5\xb1\
+j\xe9Y~T\x95\x81o,\x09\x1b4\x86g\x9ex\
+\x02\xde}\xe3\x8d{\xff\xfa\xf3O\xed\x95\xe4J\x8f\x8b\
+z\x98\xb7\x087o\xde\xf4GRRb\x06\x00\x88N\
+H\xc2\xfa-2\xb6ft2x\x085\xf1\x00x%\
+ \xd2\xae\x18\x02\x98V\xc2,;&\xec\x98{#:\
+\x7f\x10UB\xf7L\x99\xfc\x00\x95\xf1\x13b\xfdg\xc3\
+\xe8\xdf\xfc\xa2\x94\xd2\xa5\x8b\x17\xaf\x98r\xdb\xed\x0d\xb8\
+\xfe\xf0`\xa5\x8du\x8c\xe1\x03^q\xf1\xf5\xf1\x7f\xcd\
+\xe8+\x82`\x84\xe4\xbf\x00f\xf8\xf24\x08\xa4,\xc6\
+\x9b\xec3\xcdX\xd4KL\xcc,...\xa5\x94\xd2\
+\xf7\xdey\xe7]\x93z\x98\xfaXe@\xd4{\x00\x00\
+\xe8\xde\xb9S\xc3\x0dk\xd6\xfd\xa8\xf2Q\x15u\xd1\x0a\
+\xb9\x92\xba\xdc\xfe\xa3\xc3\xe6\xcf\xff~mhD\x9d\x18\
+\x93>Z\xc9\x92\x09n\x86\xb2\x06\x99\xa8\x89\x02`\x89\
+\xc67he\xa1EJ\xc0J\xd0\xb1N\xf2y\xb1C\
+>5e\x95\x9c\x5c\xafAIII)k\xf5Y\xdb\
+\xcf\xfa\x00\x1e\xca\xbd\x08F)=q\xecX^\xdf^\
+\xbd\x86\x86\x87\xd5\x81\xa8(\xdd\x0b\x86f\x02j\xa6\xec\
+\xd8A\x1113\x08\x9eY\x81H\x99\xfc\xbf\x0d0\x01\
+\xc1\xf2\x80 \x9fn,\xbe\xfaz\xf6w\x94R:{\
+\xf67\xf3%I\xe2\xad1&H\x04\xb4\xaf\xf8\xe8_\
+\x03\xbci\xd4\xc8[N\x9f8\xa1\x85\xf8\xab<nZ\
+\xe9\xa9\xa6\xd5\x1e\xbf\xe5\xdf\xf5\xc7\xb6\xf9\x19\x19\xa9v\
+\xa6v\x9e7X\xf9\xc0\xf0`\xfb\xc5\xf3\x17\x9f\xc6\xe6\
+\xd5h\x11\xac\x02\x10\x09'B\x18S\x05\x80Yj\x91\
+\x82\xc0 \x18\xa5\x02\x00\x00\xdf\xcf\xfef\x9e\xde\xde\x0b\
+?\xdaE=\x94R\x0f\xb2N\xe0q\xbb\xe9\xf4\x17_\
+\x9c>n\xdcXH\x88\x8fgq\xc1\xda\x151^ \
+\x83z\xa9p\xa9\xf5Y\x09\xd5?\x0eDBQ\xc2h\
+-\xac\x02\x8c4\xd7\xe2:]{\xf4\xe8G)\xa5k\
+\xd7\xad\xfd-26\x8a7p|\xdd\x98`\x01\x00@\
+R\x5c\x5c\xbd9_\x7f\xab;\x8a\xcc%{h\xb5\xc7\
+C\xd9o\x07\xbc\xf6\xca\xcb\x9f\xd5OO\x83\xc4D\xdd\
++\x225U\xfa\x229\xd0\x19A,\xef\xa5*\x00\x11\
+\x12\xc1\x0a=&\xcc\xa2y=\xaf\x5c\xcc\xb4\x1f\x01\x00\
+\xe8\xdf\xbf\xef\x10D\xce\x85\xa0\xf8\x14\x80\x0a\xbf\xfd\xf6\
+\xcb\x8e\xb3yg\xb5\x173v\xef\xda\xf5k\xef\xde=\
+\x1b\x11\xe2\xfd\xb2M\x80\x04\x17\xd1IDC\x0d\xbat\
+\xea\x00}{\xf5d\xf3\xf0\x80ix\xd3:-\xe0r\
+)\x80\x9a\xe3\x10\xd8\xb7\x03\x02\xe9+K{\x9b\xafn\
+Gn\xee\xe9\xf3G\x8f\x1c9\x15\x12\x16VWP\xa7\
+\x11'\x0eF\x0e\x1f>\xea\xf8\xe1#\xda\xe7\xcb\xbc_\
+|\xf0\xee$T\xf9\xc9\xe3\xf1\xd0W\xa6\xcf\x98n\xd6\
+\x19\xa4}Q\x1fE\xcf\xcc\xf2_\x92\x02\x10\x119\xa0\
+\xc6@,\xe8fsx\x91\xc20\x8b\x1fh\x9a\xbdE\
+\x8b\xa6\x8e#\x07\x0f2\x07\x89b\xe7\xc1\x89\xee)\xfd\
+\xe8\x93\x8ff\x12B\xea\xa4\xa6\xa54zq\xc6Ko\
+\x9e8\x91\x93C)\xa5\x17.\x5c\xa0\x8f>\xf2\xc8\x1d\
+\x1d:t`\x07\x8dm[d=X\x9aY)\x0a\x00\
+\x00\x98t\xcbx\xf8u\xe5\x8a\x08\xa7\xff\x18A\xb31\
+\xf8\xbf\x04\x22\xfa\xb0\xf7\x1a\x8dz\xf7\xea5\xa0U\xf3\
+\xe6\xcd\xb9gf\x02*\xba\xd7)\xe9\x19\xd3g\xbc\x91\
+\x9f\x7f\xbe,##\xbd>\x92\xd7\x94\xa6\x0d\x1b6\x86\
+a\xd7\x0f\x8b\x9c>}\xfa\xdb2\xb3\xcd\xdcC\x15\xea\
+\xe6x\xc9\xe5\xae\xa27\x8e\x1eu\x93\xa0\x0d\xbe\x0fV\
+\xb16\x91\x5c\x05\x92\xbf\xd6\x14\x00&\x8cVy0\xcf\
+\x00\x13\xf8@\xcac\x87\x8e\xea\x06\xf7\x91\x87\x1fz\x90\
+\xb7\xeeF\xc7\x9f9\x18\x92\xd9\xf7}\xf8\xd0\xe1}\xa1\
+\x11\x11\xba3\x9e\xecNG\xdd'\x9ez\xf2\x91\xa3G\
+\x8f\x1c\xa4\x94\xd2u?\xaf]\x91\x91\x91\x91\x0c\x00\x10\
+\x1b\x13\x0b\x01\xd0\x82\x1f|\xd6\xd3\xe1\x95\x18\x00\x00\xbc\
+\xf3\xda\xeb\xef\xef\xfc\xfd\xf7\xbf\x86\x0c\xc8\xceD\x06\xd8\
+\x0a\xac\x14QmA\xa0\xb8\xa8\x7f\x031 \x1aL\x1c\
+?v\x94\x22\xcb\xf4\xe8\x91#g[4mR\xdf\xb7\
+I\x86\x17\x12\xab\xb6\x0d\xdea\xa7\xce\x9d:oX\xb7\
+a[\xe7\xce\x9dzryE\xb8jm\x85\x85\x85\xc1\
++\xd3g\x5c\xb9y\xf3\xef\x7f\xe89\xc9\x7f\x16$;\
+\xd1T\x14\x85^{\xf5\xe0k\x99j\xb0\x17\xca\x0c<\
+l\x82\x0ff\x1c\x83Q\x025\x0e\x02\x8a\x04\xd7L3\
+a\xf7\xbc\x80\xf3y\x02U*l\xba]\xed\x5cH\x88\
+3:\xe7x\xce\x193\xd1\xf7\x8f\x8f>\xfa/{<\
+\xf4\xbak\xaf\xed\xc7\x11Z7$\xb7N\xbcu\xca\x1f\
+\x7f\xfcq\xf8\x97_~9p\xd3\x0d7]\xd5\xa6e\
+[ \xde\xf5b\xd1\x9c\x0b\xbb\xe7\xe3\x01\xba\xc1\x7f\xea\
+\xd1\x87\xb5\x83N6o\xda\xb4+-99!\xd6\xff\
+\xb9\xaa\xda\x10\xe8@\x15I \xf5X\xb5\x81\xe51e\
+P\x00\x80k\x87^3\xac\xbaR;\x06\x8f\x1e\xdc\xb7\
+\xf7\xe0\xc4qc3\x22\x22\x22Du[\xb5%yo\
+\x88s\xe4\xa8\xe1\xb7w\xef\xde\xa3\x1f\x97\x07\x9b~j\
+c\x92\x9e\x9e\x0e}{\xf6\x86)\x93&\xdf\x7f\xe1\xc2\
+\x05\x8f\x9f\x95\xfc\xae\xbe\xfe(1\xbfg\x90s\xf2\xc4\
+\xb9\xd8\xc4z\x89H\xddBEcr\x8d\xf5\x1b\xeb\xb3\
+\xa1\xefj\xda\xa5(\x00\xacb\x8c\x91\x03\xd1Df\x0a\
+\x80\xd7\xf2\xa2)\x83a\xa0\xdex\xed\xf5\x19zI\xe7\
+\xaf(\xe6\xf5SJ)\xfd\xe0\xddw>\xe3\x88\x88\x11\
+\x10\x00\x00&\xdez\xdb\x1d/\xbe\xf8\xd2\x07\xd9\xd9\x03\
+\x06\x08\xe4\x00cN\xde\x931\x1c\x13\xfe\xec\x93\x8f=\
+\xcb\xe3\xb5k\xc7\x8e\x1d\x03\xfa\xf6\x89\xe3\x0e\x830\x03\
++\x01\xff'\x15\x00\x7fo)\xb87\x8e\x1eu\xbd\xbb\
+\xaa\xda\xfbj\xb7\xefG)\xa5;\xb6n\xd9=x\xd0\
+\x80\x04\xee\xd3p\x98`\x08\xdb%\x84\xd4i\xd3\xaeu\
+4\x17_\xe0y\x91\xdd\xef\x0f\x00\x00\xfd\xfa\xf5I\xd8\
+\xf2\xfb\xef\xda\xc7k\x15\xbf\xdd72\x92\xa2\xf8\x8e\x86\
+\xf7?\x9b\xf6\xd2\x8b/#t\xc3d\xc8\x8cF|~\
+\xb3)\x03\xdf\x8e\x06\xb5\xa5\x00X\xa2\xb1\x84\xb4\x12x\
+\x10\xd4\x81\xe5\xe7\x89\x84y\x0aZ\x9d\x19\xf53\xd3\xcf\
+\x9e=[\xc8\x8f\x87\x7f\xc0\xc4Z\xe0\xec\x99\xd3\xf91\
+\xd1Q\xc9\x1c1\xd5kt;pBB|L\xb3f\
+M\xdb\x11B\xc2\x90r\x18\xed\xb0\xa9\x8b\x96\xff\xf9\xa7\
+\x9f|^\xc5GV\x14\xdd\x07H\xd7\xff\xbcf\xfb5\
+\x83\x06\xd4\x8b\x8d\x8d\x01A\x1bX\x9b\xc1Bm)\x06\
+\xac.\x11s\xea`\xf0\x90A\xc3\xaa\xaa\xfc\xdf\xfb\xf3\
+PJ\xab\x98Q[\xf7\xf3\x9a\xed\xd9\xbd{\xc7FD\
+\x86\xabu\x18\x94\xb3I\xbb6\x00\x80\xc8\xa8(\xfe\x88\
+8d\x5c\xfc\xc2\xdf\xbf\x7f\xff\xc1\x07\xf6\xef\xd7}\xa1\
+\xca+\xfa\xec\xfe\x12\xe6\x93\xe4\xeaY\x82\x0c\x87](\
+,\xbc\x18\x1b\x17\xc3\x1f%\x16\xa8R\x14\x19\x93@\xe2\
+\x00\x86:/U\x01\xf0\x8d[Y\xfc@\x9e[\xcdi\
+D\x8aC'@3\xa6Og\x8ez\xf2\x0fB p\
+\xfb\xc4\x09wrm\x88\x94\x11\xf6r\x10\xf6\x9e\x02\x98\
+\xa4\x19\x98\x7f\xea3ON\xe5\xd9\x8b\x87u?\xaf\xd9\
+\x9e\xdd\xa7W\xbd\x98\xe8h\xbe\xf8\xbf\x09\x96}\x0b\xb0\
+,\xdct\xc3\xe8\x11\x17\x8bK<\xea\xe81\xb3k\xea\
+f\x94\xe1\xda5?\xfd\xd6\xa6U\x0b6r\x8f\xf1\x0e\
+\xdf\x8ehl\x8c?_\x8e:Ng\xc8\x07\x1f|\xf0\
+\x8e\xda\xee\xaa\x9fVnZ\xbb\xe6\xa7\x8d\x1af\xda\xc6\
+\x11\xbd\xcb\xcf\xe2\xcf\x8e\xe3\xab\xaf\xbd\xfa\x96\xa0\xff\x22\
+\xdc1\xd9a\xcb\x89\xfam\xaa\x04\x82U\x00\x22\x97\xfb\
+R\x84\xddL\x09`1\x04\xac}\xdd\x1e\xec\xd4\xb4\xd4\
+\xb4\xdcS'\x0b\xf4C \x12\x7f\xfd\xb3_7\xad\xff\
+\x1d\xf4B\x0e\xc85\x00\xbe\xf1\x88\xcf\xcb\xd2\x81\xbf7\
+\x96#\x00/<\xf7\xcc4V\xf4\x8d{\x14\xfd\xb8n\
+\xfd\xfd\xb7?\xfa\xf4\xeciv\xd6\xe0?\x09\x81\x0a\xbc\
+\x19\xad\x00\x00\xe0\xe6\x9bn\x1a^v\xf1\x222:\xfa\
+\xf3\xf9TX\xb3b\xc5\xc6\xd0\x10g\xa4\xdd\x7f\xa2\x93\
+\x99\xa25S\xca<\x8f\x01\x00@\xdf\xbe}z\x1e=\
+r\xe4<\xa5\x0a\xdd\xb0a\xc3\xe6\xe7\x9e}\xe66\xdf\
+#\xdb_\x7f\xed\xda\xcb\x8e\x97^Y\xeb\xb7\x9a\xb1\xcf\
+rsO\xe7\xc5&$\xf2G|\xa1\xf4\x00#\xbf\x98\
+)\x82@\xcai\xcfj[\x01\x04\xe3\x0d\x88\xb5.\xae\
+\x04\xac\xf2hs\xe8\x07\x1e~\xf81#\xcb` S\
+\xafc\xe9\xf52\xddn\x97\xd2\xb3G\x17\xf6\x08q\xb3\
+\x81\xe0\xddM\x96\xb8f\xda\x9aW\x08\xc4\xe6;\x88\xe4\
+\xf9g\x9ezI\x8f\x9f\xc2\xb0\x0f\x1e\xc6\x5c\xb7n\xed\
+_\x19\x19\xe9)\x89\xc9\x89A}i\x97\xeb\xd7\xa5B\
+\xb0\xc2oT\x00\xbe\x94\x11#G\xdc\xa8\x06\xfc0\xbf\
+\x8d\x17/\x156\xae[\xbb.3-U]\xb1\x91\x00\
+4\xbf=\x10\xdc\xd8q\xd3\xc65>6\xb6\xce\xcb/\
+\xbd\xf4\xc6\x89\x9c\x1c\xba\x7f\xff\x81\x1d\xabV\xad\x1c\xdd\
+\xb6mk\x18\x98\x9d\xad~\x88\x03\xb2\xfb\xf6\x1d\xc4\x8e\
+\x96^Y\x19\x15\x00\x8b\xf3\x8c\xd7^\x9b\x16 \x0d\xd9\
+t\xb1\x01\x09L\x01\xe8\xea\xa55\x98\x02\x98\x05\x1b\xcc\
+<\x026O J\x00{\xc6\x13\x81\x0b\xd6\x00\x84\x84\
+\x84\xc6\x1c9z\xec\x94:\x06\xe6\x0a@\xa1T\xa9\xa6\
+\xaa\xcb6\xe7\x9b/\xbfC\x88.\xd2\xb2\x06bZ\xe4\
+c\xef\xb5\xa9\x83w\x87\x1b\xc0\xf4\xe7\x9f\x9b.\xc0\xd0\
+\x12v\xed\xfa\xf3\xef\x81\x83\xfa'\xf7\xe9\xdd\x07BC\
+t\xab\x96fP\xdb\x0a \xd0|\xc2\xbc\xe9\x99\x19Y\
+\xea\xe7\xd5\xdc\x8a\xec\xdb\x8diT\x00\xd8\xf6mJ)\
+]0\x7f\xee\xcf11\x91\xa1\xceP\xed;-\x86\xb7\
+\xf3\x02\xc0\x8d\x00\x00i\xd1\xb4i\xab\xd7g\xccx\xff\
+\x93\x0f?\x9c\xf7\xe6\xebo\x0e\x8b\x8fO\x80\xab\xaf\xbe\
+\x1a\xa2\xa3\xf9\xef\xcc\x00\xcc\x9b3ga\x00\xc3D)\
+\xf5\x071)\xa5\xf4\xe0\xc1\x03\xc7\xedNg\x1c\xd3>\
+\x16\x04\x04.\xcd*\xd0g\xa6D\x0c\xcfh-+\x80\
+@~\x98\x02\xc0\xd2\x81\xcbc\x154\x04\x00\x80\x89\xb7\
+N\xbcS\xc7-\x02\xd0\xac\x8b\xe2}1\xa3\xe8B\xe1\
+\xc5\xfai\xa9\x0d\x11\x82\x99\x09;Fl~\x00yZ\
+\x19\xa6,S\x9fy\xea\x05=vL\x10I\x80;\xef\
+\x1coX\xb7\xf6\xcf\xa1W_]/,,\x0c;.\
+\xda\x0c\x02\xb5\xdeVu\x5c2\xa4\xa7\xa55\xce\xcf\xcf\
+/\xa2\x94R\xb7\xe2\xa1\x1em.\xcd\x8b\xbdx\xf3\xd6\
+\xb2\xa5KW\xa5\xa5%\xab\x1a\x00\xe3U\x1e_\xc3\xb5\
+\xc3n\xaf\xdb\xa7w\xcf\xfe\xa3G\x8f\xee%\xe8\xab\xae\
+\xbfM\x9b4jUQVZ\xa5\xc7\x09\xbf\xf3p\xf7\
+\xe3'N\xb8\x83\xa9\xcaL\x01\x04k\x90\x02\x02z\x09\
+S\x00^ E.\x09[\xce\xcc\xda\x8b\x94\x82Y\x1e\
+\x15T\xf7\xdf\xb6e\xdb\xd6]B\xa91\x04\xff\xfd/\
+f\xbc:\xfd\xc57\x99\xfa\x0c\x8a\x85\xe9\x8f\xc1\x85G\
+\xfa,R\x18\x06\xe1\x7f\xfe\xb9g\xa6\xfaQd\x17\x94\
+\xfc\xd7F\x86\xf2[F\xf6\xc9\xaa\x15\xcb\xb7u\xee\xd0\
+!\xaeC\xfb\xf6\xf0\x7f\x0a\x18\x8d\xb5|\xf9\xb2\x9f\xfc\
+}\xf4\xe8\xfa\x8c*E\xdf\xde-\xf6\xc9\xbc9s~\
+\x0cq8\x82\x11\x12^1\xd8\x09!\x22\x83\x83\x1a\x9e\
+/>\xfe\xf8s\x8c\xdd\xd8QR\xef\xd9m\xe6k\xd6\
+\xaf\xfd\x95\x10\xed\xd3r<_\xf3\xf8\x8b\xfac\xa6\xd0\
+Ly\x93\xd6@\x01\x04b\xddyd\xac\xdc~\xec\x19\
+f\xe5E\xd7\x04\x00\xa0g\xef>\x83\x8d\x1c\xc20\x89\
+n\xd3\x8f\x7f\xee_\x5c\x90_\x9a\x14\x17\xab}g\xc9\
+\x040\x05\xc0\x12\xd6\xec^\x15~-V1u\xea\xb3\
+/\xf8Q\xc4-\x1b\xe6\x07\xf0sM\xf6#\xa4\xbf\xac\
+[\xb7\xb5m\xeb\xd61\x19\xf53!:*:\x80.\
+\xd5*XY\x22\x8ca\x1dD\x92\xb4\xcf\xe9\x8e\x1c9\
+j\x8c\xb1\xbf\xc2m\x5c\xdaC^\xb0\xbe\x9e5\xeb[\
+_P0\x10\xbcX\xc0\x0c\x9b\x95\xf1\x82\xfa\x99\x99\x8d\
+/\x14^\xb8(\xc6\xdd\x8f\xbf\x87\xcb\xd3\xad\x87n#\
+\x92\x19\xed\xac\xbc\x00\x00}?\xad\xf2]\xd2\xa9\xc0f\
+\x0a\xc0LA\x00\x18\x89\x8a\x09\x8bH{\xe9\xf2\x11\xe6\
+D\xd7\xaf\xbe\xf9\x8e\xf9Z\xb0\xa2\xbb\xd4\xc9>uQ\
+\xaa\xf8=\xb6\x19/\xbd\xc0/\xc9\xb0m\x8a\xd2\xad\xb4\
+\xabH\x01\x00\x91\x00\xa6N}^\x9b\xf3+\x8a\xe8s\
+\xd5X\xfc\xdb\xf8DQ<\xd4\xcdx3+\x97-\xfb\
+m\xc8\xc0\xab\x22\x13\x13\x12\x82\x0d\x0c^*XYY\
+\xdd3\x87\xdd\x16\xe9\xb4;\xeb\x02!\xec\xc9\xba\xd2\x1c\
+nN\xad\xef\xbbb\xf8H\x87\x9f&2\x95\x99\xc3^\
+?\xfe\xf0\xc3\x99\xd1\xd1Q!u#\x22\x83\xe9\x83\xc8\
+\xe3\x04\xd0+\x7fC\xf0\xf9\x83\xf7\xde\xff\x14\xc3Z\xbb\
+\xf2Y!^\xd5\xbf\xff\xc1\x07\xb3\x00\x00\xecv\xf6\xe8\
+\x7f\x94\x8e\x22\xfa\x06\xa2\xe0P\x0f\x82\xd6p\x0a\x10\x88\
+\x02\x10Yv\x1ei\x1eq3\x05\xc0\x83fQ\xe3\x13\
+\x12\xd3\xcf\x9d\xcb;\xcf\x8b\x88\x91W\x14\xea\xa6UT\
+\xf1)\x80\xb2\xb2\xe2\xaa\xa6YYM,\x88\xc6\xa7\x05\
+cQ\xd8>\x81\xddn\x83\x0f\xdfy[\xfb\x98\xa9G\
+\xf6h\x9f/\xe3\xe3\xc5\x98\xfb\xc83\x987\xddCe\
+\xc5E\xab<\x1e\xcd\xba,Y\xb4xc\xc3\x06Y\x91\
+\xbdz\xf5\x82\xc8(c\xe0\xea_\x00\x1d\xbd\xecNG\
+\xdd\xa8\x88\x88\x04\xa2~a\x89HN\xf0\x1d\xdfF\x08\
+\xd4\x996m\xda\xcb\x15\x95\x15.\xca\x01\xbb\xcf\xdeH\
+\x17\x85\xca\x1e\x99V\xba\xddZ\xd2\x94I\x93Gw\xed\
+\xdcEm=\xd81S\xffbc\xce*\x00\x02\x00\xd0\
+\xacq\x93&\xe5\xa5e\xd5\x18^\x942^(\xa7\xee\
+\x0b\x0b\x0b\xcb\xd2RRS\xb9\x0dI\x81\xe0%qi\
+\x81\xf6K\xab\x83\xd6P\x01\x04b\xed1\xe17\xb3\xf4\
+\x81\x94\xe3\xf3k\xc4\x7f\xf8\xb1'\x1e\xe7\x99\x85\x15*\
+\xed^Q\xa8\x22\xfbC1\x1f\xbe\xf7\xf6\xe7\x08q\xad\
+\x08hv/J\xb3\x01x\xcf\x84\xbfu\xe2\xc4;d\
+\x9f\xdb\xee\xfd\xf8$\x1b\xf43\x8bs\x8b\xfa'S\x85\
+zh\xa5\xe2\xa1e\xcc\x89G\xcb\x97/\xdb\xd0\xa5c\
+\xc7\xba6\x9b\x0d\x98-\xb3\xff\x06`\xd6?J\x22\xc4\
+w.\x22\xb1\x13B\x9c\x84\x90\x10\xc2\x9c\xa2\xdc\xa8I\
+\xa3\xd6S\xa7M}m\xd7\x1f\x7f\xfc\x95s\x22\xe7x\
+qI\x89\xd8\xc5\xf6]xd\x99\xca>\x1al\xff\xe3\
+\x8f#\x1d:tj\x1c\x17\x17\x0f\x01\x80\xc8\x18a\xfc\
+\xc8\xf3\xa5\xe6\x05|\xf6\xc9'\xdf\x181\xc4\xc6M\x9f\
+~\xe7\xa4\xc9\xf72\xedZ\xad\x5c\xb0\xb2`\x86\xbfe\
+\x1fi\x0d\xa6\x00\x22\xe2\x88\x88d6w\xb2\x8a\x03\x18\
+\xe6Z\x5c\x1e\x8d\xf0+V\xaeY+\x14\x12\x85a\x16\
+\x85RZ\xed\x9b\x08\xb8\xaa\xe4.\x9d;t\xb3  \
+\xaf|x\xc0\xd2Q\xebA\x98\x00\xe0\xb0\xeb\xaf\xbb\xc1\
+]]\xcdL\x07\x05A.+\xd0:\xe5\xa1UT\xa6\
+\x15\x8aL\xab<\xfej\x97,Z\xb8\xa1e\xb3\xa6u\
+\x1b7l\x08\x97\x08\xbc\xf2\xe6\xd3\xf8\xfe\x1a\xca\x85\x85\
+\x86\xc0U\x03\x07\xe8\xea\x94\x808% N \x10B\
+$RG\x22R\x080g8\xaa\x90\x98\x9e\xd2b\xd9\
+\x8a\x15\xebt\x02\xc4J\xbf\xfa\x05_\xdf\xf3c\xc7\x8e\
+\xe5\xa4\xd7\xaf\xdf\x80\xc3\x03\xeb\x0b\xf6\x9c\xef\x0b\xc6\xa7\
+\xea\xb5\xcdw\x9c\xb8\x1d\x00\xa0{\xafn\xdd\xac\x07\x8c\
+\xbf\xa2t\xdd\x86\xf5\xbfsm\x8b\xa6!\xb5\x05\x04\xe0\
+\xf2(\x00\xder\x9b\x05\xf10E`\x19p\xe1\xea\x80\
+\xd6\x1d;w.*))\x17\x92\x5c\x0b\x14\xf98\xc4\
+g$\x17\xfc0o\x05O\x10\x01\xa1\xf8A\xc0\x98<\
+\x90\xb2\x84e\xee\xe1\xc3\x86\xdd\xe8\xf1\xb0!!\x5c\x09\
+\x88\xcf.\xd2s\x92\xfa\x0e\xba\x87z?c\xad\xc2\x9a\
+\x9fVmh\xde\xaci\x04\x13\x14\xab\x09\x04\xaa\x00D\
+e\xe0\x96\xb1c:o\x5c\xf7\xf3H\x22\xe9\x04\xdcA\
+\x08q\x00\x01'\x10\x12B\x08\x09\x01\xdf\xb8\x12\x89@\
+\x8b\x16\xad:\xddq\xe7=w~\xf4\xc9\xa7\xb3N\x9d\
+\xca=\x8b\x09\x92_\x09z!''\xe7tZZF\
+\x16\xd3\x86\x99\xb5\x14\x09\x98\xc8\x0b\xe5\xf9\x5c\xfb\xc2\x10\
+\x00\x80\xdda'\xcb\x96/_G\x85\x80O_J\xcb\
+J\xab\xda\xb4o\xd7\x11\x8c/y\x89\xf8\xae\xa6JA\
+\xd7_Z\xc3  \x8f\x88\x99+\x1fH\xb4?Po\
+\x80g@\x00\x00\xb8\xff\xf1\xc7\x1eA\x19\xc3@w\xfd\
+\xb3\xbb\xee\x9c4\xd9n\xb3\x81S\x1f|1#\x1cJ\
+\xc4\x00A\xcd+\x01\xe3\xe6\x8e\x1a1\xfcf=^\xfa\
+=\x00\xfe\xb5\x00K5 d4J)]\xb1t\xe9\
+\xdaVM\x1a\x85\x12B\xfe\x89\xc0\xa0J\x1bM\xe3\x5c\
+;\xe4\xaa\x01\xe7\xce\x9c.)..\xa6\xbf\xfc\xb2\xe9\
+\x97[o\x9dp;\x93\xdfN\x88\xcd\x01^e 9\
+\x1dvh\xd3\xaee\xdb\x1f\x7f\xfcq\xfe\xc5\x8b\xa5n\
+\xf3\x9e\xe9d\x9f\x1e;~\xf4\x5c\xfd\xfa\x99M\x10\x5c\
+x\xfc\xd4\xbf\x81(\x07\xd13\xcd\x80y\xbf.\xe4\xed\
+\xef\xa8\xd1\xa3o\x0elT(u1i\xaf\xbc\xfa\xca\
+\xab\x04\x08p\xab\x17\x18]E\xfd\x0a\x04t\xe5h-\
++\x00\xcc\xc5\x0fD\x8b\x9a\xa5\xf3\x82\xaf\x8b%\x10I\
+\x92\xe6\xcc\xfb\xe1G1\x89q\xd8\xbbw\xcf\xc9&\x0d\
+\x1b\xd7k\xdb\xaa58\x9d\xda\xce13\x82a\xc4\xae\
+\xb1\x12 \xa0\xad\xfd\xc2\x0d\xa3F\x8deO\x93\x11\xad\
+\xf3\xebW2\x82\x87%\x0b\x17\xae\xceLK\xaf\xd3\xb8\
+q\xe3 P\x0e\x0a|\xc2\x00v`Vg\xbau\xea\
+\xd4\xab\xb4\xb8\xb8\x8c\xc7\xe7\xfdw\xdfy\xcf_Pr\
+\x80\xcf\xf2\x8f\x1a5\xf2\xeas\xe7\xce\xe6c}\xd0m\
+\xa8e=;Ji\xce\xf1c\xf9\x1d;vj\xc9\xe1\
+c6>\xd8\xd8b<.Jgy\xdb&\xf9\xc64\
+<<\x22\xe1\xf0\xe1#9\xec\xb8\xf1c\xa8\x063]\
+\x0a\xa5\x95\xbe\x1ckW\xaf\xf9\xddns@ZZ:\
+\xdf\xe6e\x03z\x89\x0a\xc0\xcc\xe2[\x09\xb8\x95b0\
+#6\xa8\x7f[\xb4\xef\xd0\xf4l^\x81!8d\x05\
+3?\xfd\xf4K\x00\x00\xfd~\x0f\x1d\x88\x08_\x1b\x83\
+\xe2\xeb\x8b\xdf\x15\x1e=z\xf4XWU5\xbfD\x5c\
+SY\xe7j\xf0\xd7\xf2\xe3\x82\x05+\xb223\xad>\
+JR\x93>J\xe0\x15~\x89x?\xa0)\x01\x00t\
+\xbb\xf2\xca.y\xe7\xce\x15Q\xea\xb5\xd4\xb2\x22\xeb\xfa\
+t\xcbm\x13\xa7\xb0\x95\xd4oP\xbfQn\xee\xe9\x12\
+?\xf6\x0a\x22\xf4\xfe\xa8\xba\x0a99\xc7\xcee\xf7\xe9\
+\xd3\x9e\x19O\x91e\x17)\xf4`\x15\xb9\xc4]\xdb\xd9\
+O\x8b\xbd\xfa\xea\xab\xaf\x9b\x8d\x08UdJ\x15\x99V\
++\x94\x96\xf9:RRTTqe\xf7.]\x1ca\
+u,\x8e@\xac=\xa05T\x00\xec5/\x98\xbc`\
+c\xe5\x00\x02\x13~\xb6>\xbeM\x00\x00\x18z\xfd\xf5\
+\xa3Q\x12\xf3\xdb\xc34\xcaS\xea\xf1x\x94k\x86\x5c\
+\xcd~\xf5\xe7R\x84=\xd8\xa1\xe2\xf3k\xfe\xde\x88a\
+\xc3nt\xb9\xaad\xbf\xd8rn\xbf\x856\x10N\x11\
+\x14\xfd\xd2\xd9\x8f\x0b\xe6/\xcf\xcc\xc8\x08s8P\xcf\
+\xa7\xa6\x9e\x0e\x01\x00I\xf2Z~\x09\x00\xa0s\xe7N\
+\x9drO\x9d*Pq\x93}\x87c\xb28\xee\xfc\xe3\
+\xcf=@\xfc\x1b\x81\xbe\xff\xfe{\xed\xa0\x0d\xb7\x22S\
+m\xdd\x9f\xfdQ\xfd\xf9\x08G\x0e\x1f:\xd3\xbe}\x87\
+6\xd1Q\xb1X\x1f\x18\xdc\x09\x80\x917E}\xc6h\
+\x82)\x0dM\x01\x00s\x1aU\xcf\xde}\xfaUUU\
+\x19\x961\xd5\xf1\xa0\x8aL\xa9\xecS\x00\xcc\xa3\x87\x1e\
+y\xf8\x19\xc9f\x83\xd4\xb4T\x0b\x94j\x07h\x0d\x14\
+\x80h\xde\xce\x9bRLp\x81\xf9\x8b-\x0d\x02\x18\x95\
+\x02V78\xec\x0e\x00B\xe0\xb5\xd7\xdfz\xdfR\x14\
+\x14\xfd\xe6\x91C\x07\x0f\x1c\xf5\x05\x9b\xac\xc0\xccb\xb0\
+y\x82\x01\x83kI\x98\xcf\x97\x0d\x1e4`ti\xe9\
+E]\x84\xcb\xb0I\xc8$\xcc!\x9a\x22x\xa8^\x09\
+\xac\x5c\xbe\xec\xa7V\xcd\x9b\x87\xdal\xda\xa7\xed\xcd\xfa\
+\x19\xa8\x02\xd0\xc6\xbc}\xfb6\x9dO\x9e8\x91\xef\xc7\
+\xcdwh\x86\xcf\x82\xab}*)))k\xda\xa2M\
+g\x00\x80\xcc\xac\xcc\xe6EEE\xa5^|};\xfb\
+\x18\xed\xa7\xa8\x87k(\xb2\xa6\x00\x8e\x1f;v\xba{\
+\xa7+\x9b\x03\x00H\xda\xeb\xc0\xf87\xfa\x98\xb4`\xfa\
+e\x05:>%\xcc\xb6\xf4\x8d\x1b7\xfd\x8e\x8f\x94\x9f\
+\x1e.Ji9U\xf7\xa4R:k\xd6W\x8b\x1a7\
+m\x06\xa3F\xdf\x08\x92\xcd\xb0\x18R\xeb@k\xa8\x00\
+\xcc\xe6\xf6,a\xac\xe6\xfe\xbc\x02`\x15\x0c my\
+3\x11\x02\x89)W@\xcb\xb6\xed\xa3\x7f\xdd\xb2u\x1f\
+O\x5c#\xb5\xf5\x0a\xe0}\xfdq_\x81@m0\x8a\
+Z\x0f\xfbW\x05\x09|J@\x92\x08\xbc\xf0\xfcs#\
+\xd9\xcfF\x1b$\xdaj^ R\x10\xb2B\x99]\xc3\
+t\xd9\xe2Ek\x9a4n\x5c\xc7\xeet\xd4\xb4\x8fl\
+\x19m|Z\xb7h\xd16\xef\xecin\x0e\xafM\xd8\
+}\xce\x99\xa2\xa5\xdfx\xd3\xd8[\x08!p\xf7=w\
+\xdf\xa5\xe6V?\xce\xe2\xd5\x19\x0auS\xef\x86)\xb7\
+\xc7C=\x1eo\xd9\xa3G\x8f\xe4\xa6\xa5e4f\x02\
+\x9b\x18\xff\xa9\xc9\x18\x7f^\xca\xb8\x8a<aM\x99\xbf\
+\xf6\xfa\xeb\xaf\xb2\xbd\xc7\x86\xc9M\xbd\xa7\x1c\xa9\xfbR\
+\x8f\x1e=\x96\xdf\xb7\xff\x80\xc6-[\xb5\x86\xc8\xc8\xba\
+H\xb3\xb5\x0b\xb4\x16v\x02b\xae>\x9b\x1e\x8c\x12\xe0\
+\xdd3~\xce\xcf\xbar\xd0\xbau\xfb\xd6\xd5\xaejl\
+\xdd\xccTH\xfa\xf4\xe9s5[O\x80\x10\xa8\x07`\
+fuL\x9ey\xdd\xd3\xf4\xf44h\x94\x95\x05\x83\xfa\
+\x0f\x18UZR\xa2w!\x15\xee\xaf\xae\xbf\x0a+c\
+8=T\xe1c2,\x5c\xf8\xc3\xeafM\x9b\x84\xb1\
+K\x84APE\xa7\x98\x01\x00\xda\xb6m\xd5&\xf7\xd4\
+\xc9s\xc2\xc1\xf0)c\xd6\xabyi\xc6+\xaf\x03\x00\
+\xbc\xf2\xfa\x9bo\xa9i\xb2\x8a\xa7\xa2PY\x91i\xb5\
+\xecQ*\xddn\xc5\xed\x13\xfe\xfd\xfb\xf6\xe5\xb4h\xd1\
+\x12\x8b\xf6s\xfc\x87z7\x97\xaa\xec\x00\xf0q\xd4y\
+\xab\xed;u\xe8\xe4\xf7h\xfctP\xbd4E\xf1*\
+:\xd5\x0bPa\xe8\xd0\xa17\x02\x80O\xa9\xf9\x1c\x9a\
+\xcb\xb3zsI\xef\x02`\xca\x80\xcfc\x96\xd7L!\
+\x88\xe6i\x04\x00\xe0\xaa!\xd7@\xff\xc1C\xe0\xe6\xf1\
+\xb7\x8c\xb7\x14\x10N\x1ar\xcf\xe6\x16\xc4\xc7\xc7%\xfb\
+\xab\x0c\x8cP\xc1d\x16\x94\x09\x8a\x01\xdb\xb5k\x0f\xd3\
+\xa7\xbd0*\xff|\x9e\xdb\xcf4\x88\x84\x9b);\xf6\
+\x19\xefD0;\x06\x97,Z\xf8SV\xfd\x0c\xf6,\
+C\xbe\x1ff}\xd3\x9e\xb7i\xd9\xb2\xe5\xd1C\x87r\
+\x05\xd8hx\xf8\x175\xbd\xb0p\xe9\xf2\xa5\x00@\xe6\
+\xcfgVs\xd8\xf9\xbe,\xd3J\x97Gq\xf9\xf66\
+\x1c=r\xf8T\xe3\xac\x86\xbc\xf0K\xe0\xffH\xa7*\
+5\x22~\xbb\x5c`\xa0\xc9\x86\x8d\x1b\xb7\xf0$`\x8e\
+\x11\xa6\xb2L\xa9G\xa6\xb4\x82\x19\xd6\xe9\xd3\xa7\xbf\xe1\
+p8\xa0~\xfd\xfa\xd0\xb0ach\xd8\xb0!4l\
+\xd8\x10\x1a7n\x02\x0d\x1b6\x84\xe8Z<\x06\x8e\x06\
+\xa1\x00XbR\xb5<\xd7y\x96\xb8\x94\xbb\xa6\x5c\x1a\
+\x8a\x8fE>J\x08\x81\xe4\x94\x14\x88\x8f\x8f\x83\xde=\
+{\xf5\xd4=\xc5Z'\xfa\xca~\xfei\xcd\xfa\xd2\x8b\
+\xe5\xe7\xbc\xda\xd4\x0a\x1dCm\x22\x10Y\x07\x8c\x06\xec\
+\xb5\x90!\xcf\x9f?\x0f\xeb7n\x9a\xff\xd6[o\x8f\
+-(\xc8W\xbc\xd8\x12\x00J\xfc#\xc0\xf4\xd1\xd0\x02\
+\x86\xbdn\xb4$\xf0xd\x00\x00\x18z\xdd\xf5\x03\xdf\
+y\xf7\x9d\x05\xe9i)!\x1c^VD\x22M\x1a7\
+\xa6W\x0f\x1e\x04-\x9a6m>w\xfe\xfc\x9f\x1a4\
+j\x94jl\x8c\xb9',\xba\xde\xb4FYY\x8dz\
+\xf4\xce\x1e\x92\x92\x94\x94\xa0f\xa5\x04\x00\x08\xd5\x8a:\
+$\x898$\x02\xb9\xa7N\x9e\xce\xce\x1e0\xf0\xd0\xd1\
+#\x07}\xd5\xa8|\xa9\xf8\xda`p\xd7\xee1j\xd4\
+\x14\xcc\x94\x08e\x9f\xb5k\xd7\x1e\x0e\x1e8\xb8Y\xf1\
+YOJ\x99\xc6}9\xa9Om9\x08\x80\xa2\x95\xeb\
+\xd0\xbdA\x83\x06\x91\xa1\xa1\xa1P\xa7N\x08\x84\x86\x86\
+Bhh(\x84\x848!,,\x0c\x9a5kQ\xab\
+J \x18\xc0\xd6\xf8\xad~\x81\xe6\x13\xfd\xd8\xb6u\xb0\
+a\xd3\xc6\xed\x22+\xc3y\x9d\x1aL\x9cx\x0b\x7f\xe0\
+\xa7\x19\x88\x06[d\xdd\xad,\xbc\x99W\x80\xe2\xd3\xbd\
+kWx\xf6\x99\xa7G\x16\xe4\x9f7\xfa\x8f|t\x5c\
+1\xf6\xdd\xe0\x050\xcbh\xb2\x22S7\xf3\xbd\xbae\
+\x8b\x16-M\x88\x8f\xc3\x02\xb7h?\xaeHM\x86w\
+\xdfx\x15>z\xf7\xed&\x87\x0e\x1e8n\x1c\x04]\
+\xa3:\xc4\xd8\x97z\x0a\x8b\x8aK\x16\xfd\xb8l\xf5\xa9\
+\x93\xb9\xa7\xbd\xe3\xa5hAKE\xf6\x8f\xdf\x91\xc3G\
+N6\xc8j\xccZ~\xdf\xd6j\xc2\xf0\x99\xc1\xf2\xab\
+\xcfQ\xfa\x06\x00Vc\xc6\xa7k\xcfZ\xb7n\x0b\xa3\
+G\x8f\xce.+/\xd3\xf8P\xa1zR\xa8\x97\xec\xfa\
+oaaaU\x97\xae][\x00!P',\x0cB\
+\xc3\xc3u\xbf\xba11`7\xdf\xbb\x12p_\xe9e\
+\xd8\x07`%\xcc5Q\x16\x86N%\xa6\xa4\xa4\x9e8\
+\x91\x93G\x03\x01\x1f\xb1eY\xa6\xdd\xbbw\xef\xce\xe1\
+aE\xc4@\x049\xd8\xfaD\xf9\x0c\xd3\x9e\x10\xa7\x03\
+zu\xef\x09\xcf<\xf1\xc4\xa8\xd2\x92bN\xa8\xf0[\
+\xfd\xba!\x92\xcf\x17\x08P\x15@5\xf3\xad\xfa\xb9\xdf\
+\xcf^\x94\x92\x10\x0f\x0e\xbbv\xc0\xa6\xb0O\x1d\xda\xb7\
+\x81\x17\x9fy\xaa\xc1\xc6u\xeb\x8e\xfa\x9b09\x18\x93\
+\x7f\x8fW\xa7\xa4\xfd\xf9<T\xa6\x1e*\xeb\x84\xff\xf0\
+\xe1C\xa7\xae\xc8\xc8l\xc4\xd1R]\xc2P\x83o\x84\
+\x80\xc4\xf2\x92T3\x99\xd7A \xe3\x8a\xe5#\x00\x00\
+QQQ\xd1\xc7\x8e\x1e;\xa7\xa3\x84\x82\x0c\x197\xb3\
+\x1b8h\xf0\xb56\x9b\x0d\xea7\xc8\x82\xf4\xcc\xfa\xda\
+/3\xb3>4j\xd2\x14\x9c!\x96\x8bX\xb5\xae\x00\
+\xd85\x09\xd65T\xffJ v@y\xe1\xe7]c\
+\xb6\xac\xfa\x5cM\xe7\xeb\xa1\x00\x00\xad\xdb\xb6m\x19_\
+/!\xce\xd8\x04\xd2\xb8\xef\xd1\xdf\xbb\xfe<RQQ\
+q\x9c{l\x06\xc2\xa9H\x10y\xb1<\x18\x1dx+\
+E\x01\x80V\xbb\xdcd\xcb\xb6\xadt\xe7\x9f;\xe7\xff\
+\xf1\xe7_7/^\xb6\xe4[\xbb\xddNt\xd5\xf1\xc1\
+!b\xb80\xa4S\x1f\x85%\x1f\xe5]n\x19\x9c\x0e\
+\x1b\x8c\xbe\xf1\xa6\xeb\x14\xc53\xf7\xc9\xc7\x9e\xb81\xe7\
+\xf4Ym:@\xbc\x1e\xacZ\x0b\x05\x00p\xbb\xdcY\
+\xc3F\x8eZ\xd5\xb2M\xdb\x06*>\x84kW7K\
+1\xe0\xe9\x1f75\xc0E)\x05\xe2\x9b\xe6\xa8{z\
+rN\x9c8?l\xc4\xe8\xabN\x9d\xc89\xec+\xa8\
+\xf2\x85:Y\x00\x00P\x00$\xa0\xa0H@\xd4\xd9\x85\
+\x86*KS\xdd\x83\x00\xe0\x92\xf2I\x92\xad\xf8\xcf?\
+\xff\xdc^\xbfA\xfdkXl\x08\xf8\xa7\x04Z\xe4\x82\
+\x81\xce\x9d:\xb4-+)Z\x92\x9c\x94\x0c@\x00$\
+I\x02\x02\x04\x1cN'T\x94\x97\xc3\x91\xc3\x87j\x0b\
+\xef\xa0\xe0R=\x80`,>v/\x01\x008\x1d\x0e\
+xj\xea\xf3\x8f\x1a-\x9b\xde\xba\xf0\x11\xef\x993?\
+\xfb.4$\x1c\xea8\xad6\xc2\x05D\x83`\xf3\x06\
+\xeb!\xa0\xf9G\xdep\xc3\xb8j\xd6d\x0bC\xffF\
+\x03\x8cF\xe4}\x84r+\x0a\xadf^L\xfan\xf6\
+W\xdf\xa7&\xd5\xb3\xd9\x1dv\x15/u\xa9\x92\x00\x00\
+\xdc2\xee\xc6\x06\xdb\xb7\xfc~\xd0_\x95\xcfe\xd75\
+\xcc\xb7\xca.G\xf8\xfe\xc8\xfa\x8d>\xb2G\xd1^\xe7\
+\xa5\x94\xd2\x13\xa7N\x9dm\xd3\xbec{\x86\x04,\x1e\
+\xda\x94\xd4g\xf9\xd5\x0d9\xac\xe5\x0f\x84\xfe\x97\xec&\
+\xa0\x95\x12\x02\x1d;t\x84\xc7\x1f{\xfc\x01#U\x18\
+\xda \xfc;\xfb\xfb\xef\x97DFE\x93\xd4\xb4th\
+\x90\xd5\x10RRR!9%\x05\xd23\xebChx\
+x\xad\xe1Hk\xb8\x0c\xc8\x12\x1f[\x12\xe4\x9f\x99\xed\
+\x1d\xe0\xdd^@\xeeu\xe9\x0e\xbb\x03\xbe\xfe\xe6\x1b\xdd\
+\x19l<\x7fQ\x95\xb0\xcc\xe4\xea\xe1G\x1f{\x0a\x00\
+\xc0\x16\xdc\x06\x0b\x91b2\xc3\x93/[\x1b\xa0\xd53\
+l\xd8\x88\x1b<\xeaz\x18\xa5T\xf3\x95\x83\x8d\x07p\
+\xe0\xa12e\xdfN\x9c;g\xf6\x82\x8c\xf4\x14\xd5\xd7\
+T\x85\x0b\xaeHMn\xb8w\xcf\xdf\x87\xfd\xd5\x0a>\
+\x8b\xc5\xb7\xa9\x0e\x8a\xf6SQ\xf7\xcf\xf7e\xa6[y\
+yy\xe7\x1b6n\xde\x86\xa1\x01\xbf,l\x03\x00\x89\
+p\xd3\x00\xdc\xa6\xa2.:6\x8e\x81\x94\x0d\x08T\xaf\
+\xa6K\xe7+{\xb3\xddW\x8d\x93n\x8c\x98\xe9\x0e\xa5\
+\x94\xee\xde\xbd\xe7H\x9d\xb0\xf0\xba\x92\xcd\x0eNg \
+{\xd6j\x06\xb4\x96\x14\x80\x99\xc0\x8b\xf2\x8a\xbc\x01\x00\
+\xa3\xb0\x19\x06j\xe5\xca\x95\xc2\xf7\xffUpSJ\xd9\
+\xb7mG\x8e\x1a5\x06\x00\xc0\xeep\x80\x14\xf8\x9a\xaa\
+\xc8\x1a\x8b\x98\x22XF\x09\xd421N1\xc0\x88\xeb\
+G\x8cQt\xc2\x8c\x04\x06Y)d'\x9f\xdc\xa5.\
+'w<\xd9\xc2\x05\xf3W\x00\x80\xc6\x81\xf5\xebg4\
+9\xb0\x7f/'\xfc2R\x13\x83\x9bA\x09\xf1Q0\
+\x9f\x02`\xf2\x15\x14\xe4\x17\xb7n\xab;\xddT\xed\xbf\
+J\x13\x1f\x1fI\x1cO\x11\xe6\x99\xe9x\x98)\xf5Z\
+Q\x00\x00\x00I\x89\x89\xd0\xa1}\xc7\x86\xa7N\x9d.\
+\xa6\x14Q\x00*\x0dd&@H)--\xbdX\x9e\
+\x9a\x9a&:\xa9\xaa\xd6\x80^\xa2\x02\xb0\xb2\xf6\x00F\
+%`\xe5\xee\x9b\x0d\x84\x04\x00 IR\xf8_\x7f\xff\
+\xb5\x1be0\x1f\xc8\x8aB\xab(\xa5\xea\xda\xf1\x85\x0b\
+\x17.6k\xd9\xe2J\x00\x00\x9b\xcd\xe6\xfd\x8a\xef\xa5\
+m\xac\xb8\xdc\x0a\x00\xb1XDb\x95\xc0\xc8\x91\xa3o\
+\xf2\xb8\xdcL\xef\x05\xc40p\x1c\xeb\x92c\xb9\xf5J\
+`\xc1\x82\xb9\x8b\x01\x00\x12\x13\x93\x92\x0f\x1d:x\x5c\
+\xcb\xc7\xbdc`\x0a\x86\xa9\x88V\x89\xe1\x14\xf4\xb3g\
+N\x17\xb4j\xdd\xf6J\x8e\x16\x12\xf1\xf6\x9d\x11n\xa2\
+=3\xd2\xca\xd4K\x0b\x84\xd7\x82\x06\x22I\xd0\xbbw\
+\x1f\xe8\xd7\xaf?\xf4\xee\xdd\x07\xfa\xf6\xcb\x86\x87\x1f}\
+\x02\xee\x9cro\xc4\xe2\xc5\xcb6!\xbd7&0\xd7\
+\xbd\xfa\xf4\x1bx\xa9(\x81\x98.\x00\x10|\x10\x90_\
+y\x060F\xe0\xf8\xc0\x96U0B\x02\xff\x12([\
+\x8e\xadKb\xef\x1b4h\x98Q\xb7nt\x8c0\xb7\
+\xb6|L\xb5\xa4\xe3G\x8f\x1e\xcf;s\xee\xa8\xdd\xee\
+\x00\xa7\xd3\x09N\xa7\x13JJ\x8a\x83\x8d\x94\xb0\xfd\x09\
+&@h\x06\xa2\xc0\x14_\x0f\xf1\xc7\xe1\xc0\x06\x00\xf2\
+\x0f?\xcc\xfbn\x84\xcb\xe5\x9e3\xf7\xfb\xd9u\xea\xd4\
+q\x98\x1a;\xb5v\xe2oL\x94\x9f\x00\xf1\xd1\x8e\x02\
+\x01\x02\xc3\x87\x8f\xbev\xde\x0f\xb0\xe4\x8a\xd4+\xd2\x1a\
+5j\x9c\xe9E\x8e\xfa\xaa5\x91\x1b\xad=6|H\
+\xfci\x94\x09\x1b\xfa\xaa9v\xf4\xc8\xd9\x1bG\x8f\x19\
+\xb2\xfb\xef]\x7f2}\xa5\x00\x84R\xa0l\x80O\xa5\
+\x87\xafgj\xe5\x06\xda\x052N\xb5\x120\xab\x9fY\
+\x1fZ\xb4h\x09U\x95U\xa0P\x05(\xa5p\xec\xc8\
+a\xc8=\x95[\xd60+\xf3o\x80!\xda\xbe\x15J\
+\xf5\xf6G\xeb\x09\xf1\x8fJ\x93\xc6\x0d\x1bo\xda\xb0n\
+\xb5\xefV$Kf2&\xd8\x8cQ3P'\xce\xbc\
+\x10XiN5?\xbb\xc1\x84'\xbe\x9a\xae0i\x80\
+\xe4\xa7\x00\x00YY\x0d3\xa2\xa3\xeb\xc6\x01\x0fZN\
+\x0a2\x10P\x18\xe6;\x92s\xec\x8c\xe2\x91\x0b\xda\xb4\
+n\x0d\x92$AhX(\x9c?\x7f\x1e\x0e\x1c8`\
+\x81\xbe\x0e\x10\xa1\xac\xb5h\xab\xa8\x1e\x96~\xbe|D\
+\x01\x00;\x00\xf5,^\xb2h\xfeM7\xdc\x00s\xe7\
+\xcd\xfb\xce\x11\x12b\xd7\xb2\xb0\x1b\x86L\x9b$\xe8 \
+\xfa\x95\x80\xf7\xd9\xa8\x11\xa3\x87\xea\x8b\xe9E\x9f\x97u\
+\xf6\x01%\xc4\xc7\xd8\xaaf\xf6\x95\xa4\x14\x80PP\xbf\
+\x8e\x94{\xea\xe4\x99aC\xaf\x1f\xb4{\xff\x9e=\xbe\
+\xd2\x92\xda\x0a\x05J|\xfd\xa1\x04l@AfyC\
+$\x18,zlZ\xb0FJ\x08\x84\x10\xb0K6\xa0\
+\x00P^T\x02s\xbe\xf9\x16\x14E\x06\xe2\xb3Y\x0a\
+U\xa0\xa4\xa2\x14\xbau\xedrL+\x83H\x0f\xc3\xba\
+ZZV\x83\x86\xec\xa9F\x22\xb8,\xd1~\x0cD\xcb\
+\x80,\x22</\xf1\xf9D\x9e\x02{/R\x10ZZ\
+jzrrTdd\x1dCn\xc6\xc1Q\x1b\xb2\xfb\
+\xd4lA~An\xf1\xc5b8|\xe408\x9du\
+\xc0n\xb7\xc1\xc5\xb2R\xa4\x9b\xffI\xe0\x18\x97\x02\x00\
+\xa1\x04\x88\x9d\x02\xf5\xfc\xb8d\xc9\xfc\x11\xa3F\xd3\xf9\
+\xf3\xe7\xcd\x0b\x09\x09!({\xf3\x12\xee\x13bJ)\
+\xe3I{\x1f\xf8\x17\xf3\xb0\xc2\xdea&\x9aS\xa6G\
+\x10KTEXg\xfd\x01\x80R\xa2Y\xc1\x13'\x8f\
+\x9f\x19<\xe0\xaa\x81\xfb\x0f\x1d\xda\xeb+\xad\xba\xf9\x0a\
+\x05\x85h\x1a\x09\x08\xa5 \xab\x8d\xab\x06\x83\x00P\x9a\
+\x9aX\x0f\x1c6\x07\xe4\x9c9\xc3\xd2\xcb\xcc[\xf5#\
+c\xc4< \xc1\x22\x84@x\x9dPp{d\xb8p\
+\xb1\x04\x14\xaa\xe8\x05\xc0\xd7\xc1\xdc3\xa7O\xa3\xb53\
+\xbc\xcb#\x96\x96\x91\x1e\xc8\xb7*.\x05\x82R~\x86\
+\x9dxL\x9a\x02\x98\x11\xd1_c\xda\x97}\xa6\xce\xe5\
+\x80\xcb\xcb-%\x13HM\xbb\xa2\x9e\xee \x0f\xa4e\
+\x1bP\x90\xa8_k\x15\x16\x14\x9e\x89\x8d\x8d\x83\xf8z\
+\x09P\xaf^=\xc8;\x9f\x07\x15eeH\x97\x82\x82\
+\x7fL\xfbr@\x00\xa8B\x81\xca\xe0\xa3\xd9\xd2\xa5K\
+~\xb8\xf6\x9a\xeb\x86\x97\x14\x97\xc8\xde\xcdp\x8a\x1f=\
+\x91\x8fF\xf9Ia \xb2@\xc04v\xc2\x8e&\xb0\
+\x03\xc8\xfa\xbb\x04@\xf6'\x1d9|\xf0T\xff\xbe\x03\
+\xfa\xe9\x85\x9f\x10\xe2]\xd7\xd7\x84\x9f\x80D\x197_\
+\xad@\xbb\xaf\xe3\x08\x89m\xd8 #\x83\xe9\x8c\xc8P\
+\xd5\x1a(\x8a\x02\xc5\xe5\xa5P^]\x01n\xd9\x0d\xb2\
+\x22\x83\x87\xf9\xb9e\x0f\x00\x00\x9c/8\x9f'+2\
+\x87\xba\xf9uRB\xbd\xa4\xcb\x85wM\x80\x9d\x87\x9b\
+\xb9\xab\xec_6\xbf\xc8\x1b0s\xcf\x80O\xb3I\x12\
+$\xc6%\xc4\x18\x9e\x989|\x00\x90\x93\x93s\xc6n\
+\xb7CJR2(\x8a\x07\xa8\xc2\x87\x1d,\xa72\xff\
+&\x88h\xa4\xf3\xba~^\xf7\xf3\xa2\xa7\x9fz\xfa\xba\
+\xd3\xb9\xa7*\xbd\x9bb\x00\xb4(\x08\xa6v\x01\xc0\xb8\
+bF\x80O1\x02\xb1\x18%\xe4\xde\xe7\xee\x03\xa5\x00\
+\x0a\xd5\x16\xefv\xef\xfa\xf3\xe85\xd7\x5c\xdb\xf7\xc8\xb1\
+\xa3\x07\xfd\x99\x09\x00\x80BA\xf1\x06!(\xa1\x04$\
+J\xbd\x93:\x1f\x1f1\xbb\x88|-5h\xd2h\xc0\
+u\xc3\x87\xdd\x1f\x1f\x1f\x8fqE0\x80\xf8\x94\x97\x06\
+\xe7\xcf\xe5\x17\x9e\xcb\xcb/\xd45\xc0\x999\x0a\xa0m\
+\xd0\x02\x00\x88\x8a\x8a\xaa\x1b\x12\x1a\xea\xb0;\x9d`\xb7\
+\xd9!$$\x14\x22\x22\x22!,4\x0cj\x09\x82R\
+*\xba@\x1cw\x8d\xb9\xed\x14\xf4\xc1=\x83\xc4q\xf9\
+\x15.\x0fOx\x05\x00\xc0#\xcb`\xb3\x93XCi\
+\x16|\xafO\xaa\xd6\xbf\xb2\xbc\xdc\x93w\xee\x5c^I\
+\xc9E\xc8;\x97\x07\x87\x0e\x1d\x16\xe1\x80\x0dx\xad1\
+A\x0d!\x908\x0b\x00\x00\xb4k\xd7\x0e\xaa\xdd\xd5\xcb\
+\x1f}\xe2\xc9\x91%\xc5%\x95\x04\x08x\xfd\x00\xd5\xcd\
+\xf7\x13J\xc7\x80\x1a \xcd`\x199\x8ct\xda\x883\
+\x0f^\xe2)\x00 \x03(\x14\xa8G\x01\x90\xbc\xfe\xee\
+\x81=\x7f\x1f\x19v\xdd\xf5\x03\x0f\x1e:t\xd4\x9f\x9d\
+H>MA\x80\x80\x04\x94\xc8\x04\x08/\xfcjk:\
+\xc4\xb2\xb3\x07t\xe9=``\xff\x82\x82\x025\x89\x99\
+\x22\x18 \x90q53v\x81\x02\x01\x00\xc8;{\xae\
+\xa8\xe0\x5c\xdeY]\xcd\x0cf\xfe\x9e\xa8\xba\x0d \xb4\
+N\x9d\xb0\xbau\xeb\xd6u:C 5#\x1d\xc2\x22\
+\xc3A\xa6\x0a\xc8\xc4L\x94.\x1f`S\x00\x16x7\
+_ds\xf8\xfc\xd8\x14@T?\x00\x00DE2\x1f\
+\xbd\x13\x0c#\xa1\x00v\x1f\x06\xe5\x95\x95\xa5'ss\
+\xf3\xab\xab+\xe1\xc8\xf1#@\xa9\xc2\xb7\xaf\x02\x86w\
+m0\xc1\xa5\x80\x19Mu\xe9\xbb\xfe\xfc\x13\xb6m\xdb\
+\x01\x07\x0f\x1eZ1\xe6\xa6\x9bF\x9d\xce\xcd-\xb7\x09\
+\x1c+3w+`\x8c\xb8[\xa2\xce\x0eX?P\xdd\
+\xef*\x03\xa5n\x00\xb0\xd9\x00\x08\xc0\x9e];\x0e^\
+5\xe8\xea\xecc'O\x1ccr\x13\xafo\xc1\xba\xfd\
+6\xff4\xc0/\xfc\x94k\x05\x00\x00\x9a\xb7h\xd5\xac\
+~z\x83&\x09q\xf1W \x18cs\xff\x7fl\x5c\
+/\x96\x16\x17\x15\x14\xe4\xe7\xa3\x0f\x09\x83 !\xdaZ\
+\x8f\xc3\xe1\xa8\x93\x10\x9fX7-%\x15\xa2\xc2#\xa0\
+\xa8\xa0\x00*\xcb\xcb\xa1\xba\xa2\xea\x9fB[\x07\xd8\xc6\
+\x0a\x96\x88\xa2\x09\xa4\xe8\x9eWc\x227\xd7 \xde\x11\
+Qu#L1\xe5\xa0\xa8\xa8\xa8\xdcn\xb3]\xc8\xaa\
+\xdf\x00\xaeH\xabq\x5c\xe5\xbf2E`\xbd-\x9d\xb8\
+\xc9\x8aL\xfe\xfe{\x17\x1c\xd8\xb7\x0fV\xae\x5c\xb1\xfc\
+\xf1\xc7\x1e\xbf\xbe\xb4\xa4\xb8\x9a\x80\x9f\xa900\x95\x04\
+Ll\x02*\xc8T@\x09\xc8\x8a\x04\xd4.\x01\x91\x00\
+\xf6\xfe\xb9c_\xcf\xde\xfd\xfa\x9c8s\xfa\xa4\xaf~\
+\x9f\xea \x94\x89\xf6+^\xb7\xdf#\xf9\xdaR\xc0\x1b\
+\x03\xe0i\x00\x00\x00\x92D\xa4\x86\x0d\x1b\xd4\x8f\x88\x8a\
+rv\xeb\xd6\xad\xa3\x09\xd6f=\xad\xc1\x18cvL\
+\xf7\xf3\xcdghyqYI\x89\xae\x18\x8f\x99\xef\xda\
+\xa3*\x00\xbb\xc3\x99\x90\x10_75-\x15\x8aJ.\
+\x04\x8bT\xad\x83\x95\x07\xc0\xba\xfc|XC\x84\x10\x05\
+s%\xa2\xb3~u\x9cN\xc8\xccj`#@\xad7\
+\xf33\xad\x96\x95\x95V\xdblR\xd9\x15\xe9\xe9\xd0\xa2\
+E3\xf5M*\xbe\xed\xff*\xb0\xf3|,\xd2\x01\xfc\
+\xb3\x8a\x8ar\x88\x8e\x8e\x86\x8d\xbf\xfd\xbaf\xc0\xa0\xab\
+\x86UVV\xb9\x09\xba;\xf62p\x0aOQ\xeae\
+\x0a\xc9!\x11\xc9\x06\xb0\xf7\xef]\x87\xb2\xaf\xbaj@\
+\xf1\xc5\xd2s\xfe^\xf8\x17\xfb|\x96\x1f\x00\x08\x18\xdd\
+~\xcdf\xb0\x9dQ\x00\x00R\x92\x92\x1a^\x91~E\
+*\x00@\xbbvm\xdb\xd5v\xb7p\x08\x8ez\x17K\
+.\xfa\xa3\xce\xd8D\x1a\x00\x98\xd0-\x10\x09\x9cii\
+)a\x11au \xf7dn\x8d\xb1\xac-\xc0\x82\x80\
+\xbc\xc3\xc7\xffx`\xbb\x8dm\xfd\x15\xcdw\x09\x00@\
+\x87.]\xa0~\x83\xac\x10B\xc0\xff24\xe5Q2\
+\x82\xa2(\xee\xc2\xc2\xc2\xca\xbc\xbcsp\xf2\xe4)p\
+\xbb\xdd\xc2\xbc&\xf0o(\x0a\x11\x87a\xd3\x02\x1d\x11\
+\x8a\x8b\x8b!\xf7\xe4I\xd8\xbau\xeb\xaa\xe1\xc3\xae\x1f\
+UQV^\x09ZFv\x8bT\x90\xa6\xcf\xd2?\xf3\
+\xb7\x02\x94\x82\x02\x0a\x10_\xc0\xef\xe0\xde=\xc7\x86\x0e\
+\xbdf`\xde\xf9\xc23Li\xc9\x87\x11\xf5\xcd\xf9U\
+K\xefs\xfb\x89\x1a\x22\x13\xb9\xf1\xe0p\xd8a\xf8\xc8\
+\x11\x03\x22\x22\x22\xc3\x01\x00\xb2\xfb\xf4\xe9O\x08\x09\xf6\
+3HA\x1a\x83\xe0UgYiY\xb9i5\x5c\x95\
+6\x9b\xcdQ'4,\xac^J\x0a\x84\x84\x06\xfc>\
+\x80\xc1;\xaa-`\xa7\x00\xa2W\x7f\x01\xf4\x16\x8bE\
+Jt\xcdo-f\xf3\xe8<\x83\xa4z\x09@d%\
+\xa4\x8e\x839\x0d\x81\xa8\xff\x89\x07DV\xa8\xbb\xb0\xb0\
+\xb8\xea|A\x01\x1c>|D]\x01\xa8\xa1\xcbWc\
+\xe0\x15\xa5Y\x1e>\x0ds\xfbYz\xf1\x1e\x82N\x09\
+\xafZ\xbdj\xf1\xd5\xd7\x5c;\xbc\xb4\xb4\xac\xc2\xfb\xd0\
+gq\x03d\x13J\xc18\x85\x10\xf5\x82\xf8\x82X>\
+g\xdd\xfb\x1a+\xc0\xf1#\x87r\xae\xba\xea\xaa\x01\xc7\
+O\x9e>\xa1\xc7\xcf\x17\xcd\xf7\xae\xf9\xf9\xfc\x7fE\xf5\
+\x04T\xaf\x92\xb5\xf6\x94\xfb\x81\xdb\xed\x81\xeb\xae\xb9v\
+\x98\x8aB\xb7\x9e\xbd\xba\x0e\xc8\xce\xee\xcbv!\xf0\xde\
+^\x0a\xf0\xa8\xe9\x9b\xadvUU\xa8\xd7\xba\x95T\xe6\
+\x9au\xb3m6\x9b\xddnw\x84\xc6\xc6\xc4\xc1\xd5\x83\
+\xd9S\xec-\x91\xb8,\xc0\xbf\x9b\x0f`\x1e\x5c\x118\
+9\x86\xdd~<\xc2\xfcj\x00\x00\x00\x84E\x84CL\
+|,\x84\x84\x858$;\xf2-/\xaeE\xf6\xd6f\
+\xb3y.^,v\x17\x16\x14\x80\xcb\xe5R\xf1\xfe\xa7\
+\xdd\x7f\xd4R\x07QNt\xcfzf\xbc\x12\x00\x95\xd5\
+6n\x5c\xb7j\xf8\x88\x11\xa3*+\xab]\xda\xe3@\
+\xd5\x1f[\xabU(\x92\xfa\x0bi\x9b`rN\xe5\xf6\
+\xcf\x1e\xd0/'\xf7\xf41\xa6\x84O\xd25\xb7\x9f\xfa\
+\xd6\xfd\x19\xe1'\x8a\xb11\xe3\x5c\xa6G\xf7\xee}z\
+\xf4\xec\xd9[\xcba\xb7\xc1c\x8f>\xfa\x8c\xa0'X\
+\xafj\x00bAG2\x82$\xd9\xc0\x19\x12Rm(\
+\xcf\xf2\xaco\xba\xa4b%I6Gd\xdd\xa8PE\
+\x91\xa1}\xa7\x0e\xd0\xa6};HIM\x05G-\x9d\
+\x06\x14,\xb0/\xf2\xb0\x8dX\xb1\x04\x96GeV5\
+]\x15z\xcc\xb1\xa4\x00\x00\x83\xaf\x1a\x0cu\xa3\xea\x82\
+\xcd\xe6\xb0K6\xc9\xae{j!NT\x91\xd9\xf8\x04\
+\x0ffS\x16>\xcf\xe5\x063a\xe7\xe9\xc5r\x1e\xaf\
+\xd0\x18\x5c\xa9\xea-\xc0\xcfkV\xaf\xe83`\xc0U\
+\x87\x0e\x1f:\x827\x8d\x13\x92uA(\x9f\xdd\xe0\x1d\
+\xa8\x86\xdd{\xf7\xfb\xaf\xbfo\xef\xd9\xa3W\x9fc'\
+O\x1e\xe7p\xf3\x8f\x87W\xea)U\xd9\xdf{\xafp\
+n\xbf\xa2f&DR\x00\x80\x86\x86\x86BB|\xc2\
+\x15\x9f\x7f6s\xa6\xb3N\x1d\x87wb\xe3\xcd\x96=\
+p`\xef\x19\xd3_|\x93;I\xf7\x1fP\xf8\x86\x99\
+0U\xbb\xe8\xf6(\x1e\x0d\x11\x91y\x04f\xf0$\x89\
+\xd4\x09u:\x1dN\x1b\xd4\xad\x1b\x05\xed;\xb4\x87F\
+M\x1aCLl\x8c\xa8\xd1\xcb\x0aX\x10\x90w\xf7M\
+\xe7\xf0\xcc56O\x11\x0a\xa2\xf7 \xd0dp\xc9\x1e\
+p8\x1c6I\x92\x8c\xf3;\xae${[U\xed\xa2\
+u\xc2\xc2\x14\xe6\xec\xf8\x7fc>_[\xc0\xbb\xf9\x22\
+\xa5\xc9*\x0b\xa2z\x02\xdb~\xfbe\xfd\xea\xd5\xab\xd7\
+[7cT\x08\x84\xfag\x5c\x06M\xc5\x8e\x1e\xf3\xf0\
+\xfb\xeff\xcf\xc99\x9ds\x94\xcf\xee\xfb\xabn\xf7\xd5\
+\x9bBd\x88\x88$\xa9\x1e\x05\x9dx\xeb-\xd0\xbec\
+Gi\xe2\x84[\xc6o\xdf\xb6\xed\x97\xc6\xcd\x9afy\
+\xa7)T\xa7\x90\x9ex\xea\x99\x87\x96,]\xf2c\xab\
+V-\xdbh\xf5\x10\x09\x92\x92\x92\xf0\x0e^N\xa0\x14\
+\xa8\xc7\xa3)=\xca*J\xdf|\x8c\x10\x00\x1b\xf5\x7f\
+X\x80\x10\x026\x9b\xc3\x16\x1d\x1d\x03\xc5E\xc50\xeb\
+\xb3\xcfa\xe3\xba\xf5p\xfe\x5c^M0\xb8d\x05\xa1\
+\xbe\x0d\xc8\x0f3\xb6A\x88eR\xca]c\xf3VL\
+\x91h@)\x85\xdf~\xfb\x1d\xae\x1a|\x957\xa0\xc4\
+v&\x80nQJ\xc1\x11b#\xd5U\x04\xb4\x17\x9b\
+\x99\xc7\xd65\xfc\xeb\x0a\x03\xa3!/\xf8<\xed\xd8{\
+E\x15\x8b{\xef\xba\xef\xdeq7\x8f\xbb\x91\xad\x98\xe8\
+\xb2\x03W\x1c\x90\x91\xa2\xba3\xea\x09\x9bO\xbd\xa0\x00\
+@\x08<\xf1\xd4\x93\x0f\x1f;\x96s|\xc5O+~\
+\x14\xf4\x85+\xa8\xf9\xc5\x92\xff\x1e\xa0I\xe3\xc6\xf6[\
+\xc7O\xcc\xda\xf6\xc7\xf6\xc6\xbd{\xf4\x1e\xf8\xe0\x03\x0f\
+\xf6\xaa\x9f\x91\xd1:<2\x92A\xd1\xfbO\x01\xef\x16\
+]\x9b$\xc15C\xae\x19\xd6\xa3{\x8f\xec5k\xd7\
+n\x9c;g\xce\xfc\xf8\x98\xd8\xfd\x0a\xd0#\x9f}\xf6\
+Y\x11\x5c\x160\xd8@\xdf\xdb\xaej\xb8\xc3\xd7y\xa3\
+\x99\xd3\xfeH*Ud\x19\xa2#\xeb\xda\x12\x93S\xe0\
+\xd3\x8f>\x0c\x16\x89@\xd2\x82\x06\x95\x0d\xf8\x03\x17\xf8\
+t\xec0\x10,\xaf\xc1_B\xf2i\xe9\xb7\xdc>\x11\
+n\xb8i\xf4\x15\x1b6\xae\xdf\x1b\xd8K\xe8^\xd8\xbe\
+c\xdb\x1f\x00`9q\xfa?\x02,\xebX\x1d\xc6\xe2\
+\xbd\xf6\x95\xb8g\xca\x94{\xd0\xd7\xf3\x03\x01\xee\x0c\x0f\
+\xfe\xdduC>\xd9C\xd5\xcf\x10\x95\x95\x95yF\x8f\
+\xb8a(\xd7\x07\xde\xdb\xc3\xc6_\x83\xba\x11\x91\x11\xef\
+\xbc\xf5\xbfO\x8f\x1c<\xc25\xa7P\x8f,\xeb\xce%\
+\x90\x15\x99\xca2~\xe2\xc9\xd2\xa5\xcb\xb6w\xe9\xdau\
+\x90\x80\x9e\xb5\x04:\xd6\xf5:M\x84\xc0\x1bo\xbf\xf1\
+b\xc0\xb4\xa6\x94\x16\x15\x15\xd1\x19\xaf\xbdv\xc7\x1dw\
+\xde\xa9U\x834d\x86\x04\x86\x90\x0eh\x0d\x0f\x05\x05\
+\x10\xbb\xfb\x98\x97\xc0\x22b\xee\xeb\xe9\xad\x1c\x01\x9f\x0b\
+\xebp8\x00(\x81\x8aJ\x97\xdb\xe3QL\xd7\xf1\xf8\
+\x06$\xef!\x9a\xc1.\x0b\xfdW\x81\xa5\x99h\x0c\xd8\
+|\x14(\xc0\xad\x13o\xb9\xfd\xbd\x0f?|\xcf_\x0c\
+\xb4\xa2\xd8\x1cB\x05\xed\xbdu\xd1\xc4N\xe4\x87\x00\x01\
+\xea[\xc1\x0b\x0f\x0f\xb7}\xf1\xc5\xcc\x05\xc5\x85\x05\x83\
+WoX\xbb\x96\xc3\xdb\xccs\xd1\xeeK\xcaJ+\xde\
+|\xf7\x7f\xd3\xc3\xa3#\x17.\xffyU+\x87\xcd\xd6\
+y\xc4\x88\x11#\x13\xe2\xeb\x81M\xf2!B\x01\x80P\
+\xc3!\xe0[\xb6n9\xbem\xdb\xf6\xa5\xdb\xb6n\xdb\
+v,\xf7\xe4\xdf\xfb\x0f\x1e\xb8\xcc\x8b\xea\xc6a\xb1\xd9\
+\x08\x84\x858m\xe2<\xbe\x85Y\xea\x7f\xcd\xbant\
+]\xf8{\xcfne\xee\xec\xef\xf8@\x0b\x0fV\xd3Z\
+3>\x09\x18X\x05\xc0\xba\xec\xfc\x80\x99\xf2\x13\xe8]\
+~+$\xb5:\xc3##A\xa1\x00.\xb7\xdb\xe5\xf1\
+\x98/\xe4\x13\xc5\xab5d\xc9\xfb\xa9Z\xc5\xa3\xd8#\
+\xa3\xa2\x9c\x94\x92\xca\xaa\xaa\x0a\xb0(.\xac\x16\xc1\xb9\
+\xa6\xf5\xc0%\xd4%\x8a\xb9`\x8aT\x01\x00\xb8c\xe2\
+\xad\xb7|\xfa\xc5\xe7\x9fy3yI\xaf\xed\xb7\x09\xa6\
+U\x00\xaf\x80\x89xI'\xd6^\x0f^\x01\xaf\xe6\x0d\
+\x8f\x8ap,\xf8q\xe1\x8f\xd7_;\xf4\x9a\x9f\x7f\xd9\
+\xb4\x09\xbca\x03u\xf2\xafz+\xd8y\x10*(\xa7\
+N\x9c8\xb1r\xc5\xca\x13[\xb6l[u:\xf7$\
+\x80B{7i\xd4hF\xbf\xfe\xfd\xbb\x02\xf8\x16\x0e\
+\xa8\xd7\xda\x02!P\x5c\x5c\x0c\x0b\x16.x~\xd9\x8a\
+\xe5\x9f-Z\xf0\xe3Y\x87\xdd\x01\xcd\xdb\xb6\x86\x88\xc8\
+p(\xb9\xa0\xcd\x00jkz\xc7\x8d\x83\xbe\x0b\xb2L\
+\xc1\xe3\x91\xb5\xc5|o\xa7\xcdD\x05\xc0\xe3\xf1\x80\xc7\
+\xe3vG\xc7\xc5\x80\xecQ\xa0\xe4\xc2\x85\x9aL_k\
+\x92W\x08f\xae\x9b\xd9\x0f\x9b\x12\xb0zZtT\x98\
+\x0e$\x9b\x04Q\xd1\xd1\xe1\xeb\xd6\xaf\xff\xd5\xd4\x85\xf2\
+}n\xa9\xd2w\xbbs\xe7\x8eC\x8d\x9b5K\xee\xde\
+\xb3'$&'\xb3x\x07\xdb\xf7\xda\x00a\xffjX\
+\x07Oc\xf5pL\x00\x00\x988~\xfc\x04\xd6]6\
+|r<P\xd0\x0a\x09N S\xf04\xbeHQa\
+AQ\x8f+;\xf5\xe6\xfa\x82\xd1\xc5\xd4\x85\x0d\x0b\x0b\
+\x83\x96-[Bxxx\xe4\xaf\x9b~\xd1\x8e\xdb\xf2\
+\x1f\x08\xab\xd017\xdft{\xebv\xad\xe1\xd9\xa9\xcf\
+\x03\x00@bB\x22d\x0f\x1a\x08W4\xc8\xbcD\xf2\
+\xa3\xc0\xe1\xaf]j\xc1\xf3\xb7\xde~\xeb#=\x9a\xfc\
+1m\xfa\xa3U+++<\xc3F\x0c\xbf16.\
+\x16\xea7hP\x03\x1c\xac\x81\xd6\xc2\x87A\x00\x8c\x83\
+\x18\xa8\x92\xb0z\x8e\xb6\xb1j\xf5\xea5\xdcx\xeby\
+\x95S\x00\x7f\xfc\xb1\xf3\xc4\x90\xa1C\x1b\x0e\xb9v\xe8\
+\xe5\xf8\xc0\xe2?\x01\x18-D1\x14\xcdS\xbbu\xc2\
+\xf8\xd1\xae\x8aJ\x8dR\x0a/\xbc\xc1\x02/\xf0V\xd7\
+\xbe\xb3\x08\xf9\x8f^\xe4\xe7\x9d+\xee\xdf\xabW\x0f\x8b\
+~b\xfc\x81\xf5\x1d23\xea78\x9fw\x9e\xfd\x9c\
+2\xfdb\xd6\xac\xb9\x00\x00N\xa7\x13Z\xb5n\x0d\x00\
+\x00\xe9i\xe9\xd0\xa8y3\xb09\x8d\xdbHj\x1f\x8c\
+\x0a\xe0\xf3/f~\x1d\x0c\xf9K.^\xac\xec?\xa0\
+\xff5a\x11\xe1\x10\xe1\x0bv\x82\x916|\xa3\x97U\
+\x01`\x07{\xb2A>\x0c\x19\x11\xf3Zy\x01B\xaf\
+`\xee\xfc\x1f\x16\x199\x93\xe5;\x85\xbad\x85\x96\xf9\
+R\x8e\x1d=z~\xf0\xb5\xd7t\x0c\x8b\xd0\x9d\xa7n\
+fq\xfe\xeb\x80yU6`\x84\x7f\xfc\xb8q\xa3*\
+\xca\xca\x18\x0a\xc9\xe2\xa3\xbbM@\x17\xf039R\x5c\
+\xa5\xbb\xd8\xfc\xeb\x15A\xee\x89\x13%7\x0c\x1f\xde\xa3\
+c\xbbvl\x9f0\x06\xe6\xd3X~\xd3\xf8\xee\x95W\
+^\x7f[E\xa3\xdaU\xedi\xdb\xb9S\x0f\xa6\xbc\xf7\
+B\xaf\xfck\xc3\x13\x0b\x0a~\xf8a\xee\x021\x95\x8d\
+\x1a4\xbf\xb0\xb0\xb8\xf3\x95W\xf6\x94l6\xa8\x1b\x13\
+\x13h3\x97M\x01\xb0B\xce6\xa2\xce\xe7\xf9H\xbf\
+\xd5:\xab(\xe8\xc3\xd6\xc9\xe7\x05\x00\x80\x92\x92\xe2\x8b\
+\xfe\x07\xcc\xd2\x0a\x93\xd1\xfb\x1d\x15o\xd5\xce\x90\x90\xc8\
+\xac\x86\xf5\xe3\x93S\xd9\x03V\x8c\xf5\xfeGA4\xa0\
+\xeaf \xf6\xb9\x07\x00`\xf8u\xc3n\x98\xf9\xd9\xcc\
+y\xde\x0fH\xa8\x87{\x8a\xdf\xe5R\xb7\xfa\xa2q&\
+,\xda\x83\x8d\xbe\xfa\x802\x99\x08\x97\x99\x19\xa0\xd4\xf4\
+\xf4\xa8\x0f>\xfeh\xf9\x8d#G\xf4\xbcc\xc2\x04\xe8\
+\xd0\xba5\xb6\x8c\x0c\x5c\x1a\xcbW\xecp\xc3g3?\
+\x99U^\xe1}Ov\xfd\x86\x0d\xbf\xec\xda\xb6\xfd7\
+c?\xff\xd5\xe1vFE\xc4D\x89\x1f\x13\xdf\x9b\xd3\
+~B{\x5c\xae\xea\x8b\xa5\x17\xcb\x14Y\x86\xd2\x8b\x17\
+\xc5\x05\x03\x87KRz\xd8\xfe\xff@\xe6m\x00za\
+g\x07\x91\x1ft\x9e\xb5\x0c@\x08\x01Y\xf6\x14\x8b\x8b\
+\x81.\x92\x0a\x00\x10\x11\x11Q':*\xa6^\x83\xac\
+\x86\xba\x5c\x5c\xd5\xff\x17\x94\x81j\xfdx\xe5H\xc0{\
+\xc8\x16\x8c\x1a5j\xd4\x0f?\xfc0\xc7\x11\xe24l\
+\xae0=\xc1W\x00\xbc\x0c\x1bB\xbd\x86\xcc\xe2\x9a\x08\
+\x00\xb0\x1fe\x8e\xab\x97\x10u\xdd\x88\x91K\xc6\x8c\x1a\
+\xd5c\xe0\xa0l\xb5VQp\x19\x00\x0c\x0aO{v\
+\xf4\xe8\x91\xbf\xf7\xef\xdbw\x08\x00`\xc3\xa6_\xd6\x0b\
+0d\xc1\xca@]28\x9cN\x00\xe2\xdd\x12\x1d\x16\
+\x11Q\xb7n\xdd\xba\x023\x8e\x13\xae\xa2\xba\xaa*\xef\
+|^!\x00\x80\x22\xcbh\x1e\x04.[\x9fT\xf7R\
+\xb4\x04\xc5\xb3\x06\xcf\xa8\x98k\xc7\xf3(\xff\x8c\x05\xdf\
+$\x84@eEU\xb1\x08I\x96aU\x9bW\xb7n\
+]\xc8?w>q\xeb\xef[\xa1a\xe3\x86p2\xe7\
+\xa4\xfaN\xc0\xff\x05\x10-\xe1\xb0\x02\x22\x03\x00\x0c\xbb\
+n\xd8\xc8\xb9\xdf\xcd\xf9\x9e\xd8\xbd\xc7\x81)\xa0n\x02\
+\x10\xf3\x84\xffxjAD\x1aS\xe1\xd8\x22^ \x18\
+3u\xca@A\x02\x02\x0d\x9b4\x89.\xaf(_b\
+\xb7\xd9\xaf\xf9\xe4\x7fo\xff~\xef\xa3\x8f\x81\xcb\xbfJ\
+\xc3\x1a\x0c\xf5\x9e}9\xc8\x8f\x1d\x05\xf8\xeb\xcf]\x7f\
+u\xec\xd8\xb1\xf5\xde\xdd\xbbwq\xd8\xfc+\x90=\xa0\
+?t\xec\xd4\x19\x0a\xf2\x0b@\xa1J\x0c8l\xf5\x8c\
+h\xf9\x09\xc5\x87\xa7*\xcb\xcb+KJ.\x16\x829\
+\x88T\xb1\xc8\x9f\xab1\xf0\xfb\x00\xd4e\x1bv\x90D\
+l\xc1\x0f\x22 \xd7\xfcY\x02\xaa\x02\xd1\xb1 \x95\x15\
+8w\xf6,w:\x02\xaeg\xd8\x85\xff\xac\x06YI\
+\xe5\xa5\xa5P\x1d\x1d\x09q\x09\xf1p6\xf7\x0c\xfc\x1f\
+\x02^\xe9\x1a\x06x\xcc\x98\x1b\xae\x9b\xf9\xe9\xcc\xb9\xc4\
+.\xf9\x0e\xd0\xa0`\x0b\xe0\xab\xd8~\xa6\xd3\xe7\xd1\xb9\
+\xcb\x14\xb4\xa3\xbb\x03\x11\xee\xc0\x80\x80\x07\xbc\x9bK\xda\
+\xb4k\x1f\x13\x1d\x15\xb5l\xd9\xe2ECo\x189\xfa\
+\xb7\x1d;w*\xfb\x0f\x1dPk\xc3\x8c\x04\xaa\xad\xf6\
+\xec\xdb\xf7wiY\xb9k\xdf\xdf\xbb\x8f\x03xq\xa6\
+\xca\xbf\xe7\xd8\xadZ\xb1\x12\xf6\xee\xd9\x0be\x17K\xa1\
+M\xfbv1\x0d\xb3\xea3sPl\x11P\xfd\x12\x83\
+\x17.\x96\x96\x96*\x1e\xb9\x02\xf4`\xae\xd1\xad\x9f\xd7\
+\x18\xb0\x0f\xea\xf1\xcc\x88\xadQ_\xcaz7\x80^1\
+P\x00\x80\x93\xb9\xa7\xceV\xb9]\xb4\x8e\xc3\xe9\xe3_\
+\x9d!\x00B\x8c\xeeGT\xdd\xa8dY\x96Av\xcb\
+\xff\xa7\xa2}\x08\x18\x94\xc0U\x03\x06\x5c\xfd\xc5\xcc/\
+\x16\xd6\x09\x0b\x93\xbco\xd6{\xad+P\xff\x94\x1c\xef\
+3.\xcd\xeai\x01\x0aP\x00\x05\xc0n\xe3O`\xb6\
+\xd2\x02\xd6y\xbc\xe3C\xc0\xa3\xc8\xe0\x00\x02\x19Y\x0d\
+c\xba\xf5\xee\xb3\xbc^l\xf2\xe0\x84\xa4\xc4\xcd>\x05\
+\xc0V$\xe2#-}\xdf\xfe\x03\x87\xb7o\xdb\xf6\xc7\
+\x85\xe2\xa2\xd3\x92M\x02Ef\xdf\xadC\xa7\xafXz\
+\xed\x01\xa5p\xea\xc4\x09\x00\x00P\xdc\x9e\xf8\xd8\xe8X\
+'\xdb +\xf8\xa0\xbb\xf6>9\x9bw.?\x88\xad\
+\xeb\x97\xbd?|\x14I8\x1fC\xd2\x02\x919\xb3x\
+\x82\x0e\x8e\x9e<v\xfab\x09s\xbc\x92\x00X\x0f \
+\xbe^\xbd\xa4\xac&M\xa5.\xdd{\x01A\xde&6\
+\xc1\xe9\x9f\x06\xc2\xfd\xb0\xe7\xda\xfcu\xc8\xd5C\xaeZ\
+\xbcd\xc9\x8fu\xc2\xc2$\x85*\xe0Q\x14m#L\
+@\xd8\xb3\xaa\xdb\xebc\x81\x02\x00n\x0a\xd4\xa3P\xb0\
+\xf9\x84\xff\xab\xaf\xbf\x9c;i\xf2\xe4\x07\x15\xc5?\xec\
+\x14\xac\x02k|\xa8\xc7\xff\x97\x80\xd7\xa2\xd8%\x02\x0a\
+\xc8@\x81B\xbb\x0e\x1d\xebv\xec\xd9uy\x5clt\
+\xb7\xac\xcc\x0c\xb5@ \x93\x0d\x02\x00\xe0q\xbb\xf3~\
+\xfd\xed\xd7\x9du\xc2C+\x9c!NQ\x99\xda\x06Q\
+\x1b\xba\xf1k\xd2\xb4Y\xaa\xff\x91\x91f\x18\x15\xcf\xe4\
+2\xdf\x12\x10\xc7\xd7\x02\xc5\xa7V\x80gN^)`\
+\xcc\xab\xe63\xdb\xb3\xce\xe7\xc1\x9ek\x1d\x8bK\xaa\x97\
+q\xe4\xf0\x91cf+R<\xec\xdc\xb5\xeb@\xa3\xa6\
+\xcd\xd2\x12\x93S\xd4\x9a\xcc\x88\xc8\xf6\xe7r\x81\x15\xe3\
+\x98)\x00\x00\x00\xe8\x93\xdd\xef\xea\x8a\xb2\xf2J\xef\x0a\
+\x9c\xf7\xb3\xda\xfc\xc7=-A\xfd\xa6\xa8\xf6\x91NJ\
+\xdd\x0a\xa5U\x1eE\xf1}V\x91\xfe\xf6\xcb\xaf\xbfH\
+\xbeO*\xbf\xf0\xc2K\x0fV\xf8\xf6\x16\xb0\xdf\x06\xc4\
+6\xb6\xe8\xbfT\x8a\xfd\xbcy<T\xa1\x95T\xa6\xea\
+7\xcfK\x8b\x8b\x0b\xef\xb9\xe3\xf6^L\x9fE+P\
+,\xbd \xab~\x83\x84\xb6\xed\xdb\xf5\xb1\xd9m!\x82\
+\xbc\x97\x03L\xc71)5\x05\xdau\xec\x08S_|\
+\xe1\x15=]\xf4\xf4\xe2\xa9B)\xa5\x8f?\xf9\xe4s\
+|}\x80\xf3F@\x86\x13\x03Z\x0b\x1b\x81D?^\
+xmH\x9a\xa8\x1c\x08\xeaP;g\xdb\xb6}\xfbN\
+k\xae\xf6\xa7\x94\x96\x97U\xb7l\xd5\xb6'\x00\x80\xee\
+\xa3\x22\xff\x1c\x04\xaapx\xe5\x89\x96\xbf\xfe\xfa\xeb\xaf\
+)..\xae\xa6\xd4\xfb!T\x8f\xc7CU\x89\xbdX\
+z\xb1l\xf1\xd2\xc5krN\x9c8\xc3\xb3\x9c)\xc9\
+\xa8\xef[\x9d\xcc\xc7~7\xac[\xbf%***\x06\
+\xc0{\xba\x0f\x00\xc0\xe3O=\xfdhuu\xb5\xbep\
+\x90\xc0\x7f\x80\xd4C\x15\xeab\xee\x0f\x1d:X2\xa8\
+_\xdf\xdeL\xffQc\xc0\xd3\x86x\xa3\xee5\x16\x88\
+Z\x00\x1d\xbf\xb6h\xd9\x0a&M\x99b\xff\xea\x9bo\
+\x16\xb1\xbdg\xaf\x04\xdf\x06\xa5#F\x8e\xbc9\x80~\
+\x04\xc2WB\xa05P\x00\x98\x95\x0eT\xb0\x03\xde\xec\
+\x83\x11\x13\x98A^\xbct\xf9r\x96j\xaa\x1e\xd56\
+\xbaj\x7f\xfc$\xbd\xe9\xa6\xb1\x13\x00@=\x14\xf4\xbf\
+\x00\xc1\x0c\x9c\x96w\xc8\xd5C\x06\x14](\xaa\xa6\x94\
+R\x97\x22\xd3j\x8f\xc7k\x89}\x82{\xe6\x5c\xde\xb9\
+\x1e\x03\x06^7\x7f\xd1B?\x8dD\x0c\xa7\xdb\xe2\xab\
+\x17\xe4-[\xb6\xee\x0a\x0d\xd7\x7f\x83\x91\x10\x02\x83\x06\
+_\x03\x9f\x7f\xf6\xe5\xe3|\xad\x22F6\xe2\x80{)\
+\x0a\xf5*3\x15\xf2\xce\x9e-\x19\xd0\xb7O/\x8c\x06\
+\x22\xfa8\x9dNMQ!\xcf/IX,\x00\xad\xbb\
+q\xd3&0`\xe0\x80\x94-[\xb6\x1ce)\xc3\xdb\
+~n+\x1bu\xb9\xab\xdd\x8d[4\xef\xc4\xd5o\xd6\
+^\x8d\xfaFk\xc1\x03\x10\xb9\xf2\xac\x15\x13\xa5c\xa7\
+\x0c\xf1\xd6\x8f\xcd\x07\x84\x10\xe8\xdc\xb5\x0b|\xf2\xf9\xe7\
+\xda\xbej\xff\x87\xe5\x8dL\xcc\xde=7\xed\x85\x97\x99\
+\x9a/'3\xd4\x14D\xf8h\x1c\xdd\xa3{\x8f^\xc5\
+E\xc5\x15\xd4',n\x8f\x87\xca\x1e\x99*\xb2\xdf\x1d\
+?\x9es\xf2\x14\x00q>\xf4\xf8\x13\xd30:\xe8\xa8\
+\xa5\xf9\xffz\xd8\xb6m\xeb_Q\xd11qz\x1c\x88\
+\x04\x00$%%\x1d\x1a5i\x06w\xddu\xf7T\xb6\
+Vk\x05\xc0\xaai\x5c\x01\xf0\xa9\x85\x05\xf9\xa5\xd9=\
+{\xf6\x0d\x98\x80\xb8\xf0\x07B\xe3Z\x87:au \
+2*\x12z\xf6\xee\xd9\xae\xb4\xf4\x22\xf5\x8e\x99\xccQ\
+KO\x135\xf5\xf8\xc9\x13y\x19\xf5\xb3\x92\xea\x84\x85\
+[7t\x09@k\xb8\x13\x90\x05\xf4\x0c\xbf\x00@\xa4\
+\xbdxM\xad\xdb\xb0A)\x85?v\xec\x80\x03\x87\x0e\
+\xec3\xd6\xe4-&\x0aK5i\xd2\xb4\x99\xcdY\xc7\
+\xf6\x0f\xae\x0c\xd7\x86\x92\xd1\xde\x92\xeb\xdd\xabw\xafe\
+K\x97.\xa9\x1b]7T\x06\x00\x99R\x90@\xf2F\
+\xd4\x99C:v\xee\xd8\xb1\x17\x80\xbaN\x9f:\xbd\x85\
+\xad\xc8\xb81\x08\xc7p\xe7\xce\x1d\xbb\xfb\xf6\xcd\xee\x7f\
+\xb1\xb8\xa8\x104\x05\xecw\xab\xcf\x9c9\x09\x87\x0f\xee\
+\x87\x8d\x9b6M\xfd\xee\xdb\xef_\xf6\xee\xa9\x08|\x9b\
+\x11Ar\x8b\x86$6.>b\xc9\xb2eK\x06g\
+\xf7\xcb6T\x81\x00\xf2\xc97C\x96\x00\xd1\xac\x09h\
+8\xd5oP\x1f:t\xec\x08T\x02\x88\x8f\x8dm\x12\
+\x11\x11\xc9d1.[\xab\xff\xab\x15\x1c:x\xf0x\
+yUE\x91\xec\xfd\xb6\xa0hZx\xc9x\xd6\xa4 \
+f\xb9\xb1J\xcd\xa6\x02\xa2\xa9\x04\x0b|\x9a\xae\xfe\xee\
+\xbdz\xf6-\xaf\xacd'\xa2\xa8\xf5a\xaf\xff\xde\xbb\
+/\xb7O\xf6\x80\x8c\x9av\xde\x02L\xe7\xa65\x04\x9b\
+Z\xbec\xbbv\xdd\x8a\x8b\x8a\x8a)\xf5Zm\xb7\xc7\
+\xa3\x1dz!\xcbz\xbb\xd9'\xbb\xdf5aaa\x90\
+\x9d\x9d\x1d\xb6\xe5\xf7\xcd{\xd8g\x1e_\xd0M\x04\xdb\
+\xb7n\xfe;!I{eR\x15~\xcd\xfa\xb3\xfdJ\
+LI\x81\xe4\xe4\x14\x98\xfe\xe2\x8b\xaf\x0a+\xe4\x9c]\
+}\x0av\x8f]QZRt\xe1b\x8f\xaeW\xf6\x03\
+\x00 \xf8\xe1\x18\xff\x06`\xe3\x0d\x00\x00\xfd\xb2\xb3\xe1\
+\x7f\xef\xbc\x0b\x93\xa6L\x81\xff\xbd\xf3\xce\xbb\xfa\xbe\xf2\
+/U\xf0\x13\x00J\xdfx\xf3\x8d\x0f@\x22@\xbc\xab\
+0\x22/Y\x84G\xc0x\xd3K\x9c\x02`i\xa2\xb9\
+\x89\xd9\x8bD\xa2i\x016E\x00\x00\x80\xc8\x98\xe8\xe4\
+\x93\xb9\xa7\xcfb\xec&\xba\x97\x15\x85\xf6\xed?\x80\x0d\
+,]n\xb0\x1a8\xb32Z\xden]\xbav>w\
+\xe6l!\xf51\x8fK\xf6P\xb7\xdbc\xe8lUU\
+\xb5\xfc\xf2\xab3\xfe\x07\x00\x10\x19\x19\x03\x0e\x87\x1d\xae\
+\xec\xd25\xfbl^\xde\x05\x1dM|\x12'\xcb\x8an\
+\xce\xbdc\xc7\x8e\xdd\xb11\xb1\x88\xf0\xa3\xe3\xa5\x8d\xdb\
+\x80~}a\xf6\xac\xaf\xde\x14Q^ez\xf1\x1a\x81\
+\xc2\x5c\xf3u\xf8Sr\x8e\x1f+}\xf3\xe5\x97\xfa\x0e\
+\xbb\xe6*V\x09`<\xc7\xd2\xf2\x9f\x06\x02\x00\x90\x9c\
+\x92\x02\x83\x06\x5c\x05\x1d;u\xb6\xff\xf2\xebo;\xf1\
+\x1e\xb1\xafg+\xda*\x08\xa5\x94\x8e\x1b7\xee\xd6\x98\
+\xf8xh\xd2\xac\xd9e\xed\x0f\xbd\xc4\xb7\x01Y\xc40\
+\xc1\x06\xd03K \xc1B\xb5^\x8c\xd9\xb4\xe7\xc4n\
+\x83\xf5\xbf\xfe\xba\x1dg9\x11+Rz\xdf\x03\x0f\xdc\
+\xdf\xa8\x89F\xd4\xda\x22\xa8\x19-\x82q\xdd\x0c\xca\xa2\
+[\x97.\x9dsO\xe5\x16\xa8=\x91\x15\xd9k\xc1\x15\
+J\x15E\xa6\xa7N\x9d:\xb3a\xdd\xfa\xb5\xdf~?\
+oV\xff\xfe\x83\xafb\xea\xd2\x04\xb4M\xfb\x8e\x1d\x16\
+/_\xb6\xe8\xd8\xc9\x9c3\xb2L\xa9\x22{\x95\xa1\xcc\
+\x84\xfb\xf7\xef\xdbw(:6.Y_\x9e\xd8\xc0\x7f\
+\x1e\x90\xa5\xd7\xf6\xf6\xff\xfe\xf7>\xcb\xda\xa2\xd10Z\
+|\xde\x02\x8a\xe38\x85\xf9\xe7\xcbn\x9d0\xb6o\xef\
+\xee]y\xba\xfdk\xc2\x8e\xdd;\x9cNp\x848!\
+=3\xa3a^\xfe\xf9r\x011t\x11\x80j\x9f2\
+\xf6x\xdc4;\xbb\x7f\xd7\xd0\xd00Q@\xb3\xd6\x80\
+\xd6\x82\x07\xc0\xa7c\x82ke\xfd\xd9{Q\x1a[\x17\
+\x00\x00\xbc\xf5\xc1{3E\x8c\xc2\xa6\xb1\x9au\xde\xbc\
+\xf9?\x8e\x1cu#x\xdf\x94\xbb, \x12x3\x06\
+E\x15E\xdb\xb6m;\x9e\xce\xcd-T\xfb!\xabk\
+\xfc\xbe\x8eVWW\xcb/\xcdx\xf9\xa3:\x91\x911\
+\xc9i\x99l}\x12\x80\x14B$\x9b\xee\x18\xb4\x98\xd4\
+\xb4\xa6k\xd6\xfe\xb2\x99RJ=n\xb7\x16\xfb\xdb\xb7\
+\x7f\xff\x91\xd8\xb8\x844\xa6}\x1f\xbdy\xebO\xd8\xb1\
+P\xb3\xdb\xd8\xfb\x17^x\xe1C=\xf5qg\x1f\xbb\
+2\x1dI\x7f\xb7i\xce\xf1ce\xf3\xbe\xfc\xb2\xf7\xa0\
+~\xfd\xbc\x9d\xd5\x7f\xf7\x8c\xe7\xcb\xda\x06\x91\xf7\xab{\
+\x9e\x98\x9c\x0c\x1d\xae\xbc\x12n\x9b4y\xa2~\xaf\x04\
+\xdbC\x7f\xf4\xdfCe\xea\xf2e\xf8{\xf7\xaeS\x9d\
+:w\x0a\xe4#\x96\xc1\x18\x17\x14h\x0d\x15\x80zm\
+%\xd8\xa2\xe5B@\xcab\xc2\xce\xd7K\x80\x99\x17\xdf\
+x\xf3\x8d\xb7\xfa\x09\x8a[\x0d\x85*\xd4E\xa9\xa6]\
+srr\xf2322\x93\x18\xcdz\xb9-\x07\xa6\x08\
+\xb04\x09\x00\xa0nd\x04$%%BzfF\xab\
+\xdc\xdcS\xe7\xd4\xbe\xc8\xbeM:l\x0f\xddn\xb7\xbc\
+\xff\xd0\xa1\xa3k\xd7\xaf_\xff\xe5\xd7\xdf}\xde\xaf\xdf\
+\x00\xffa\x97\xc4V\x07\x88\xcd\x01\x00@$\xe2\xbc\xfb\
+\xce\xfb\xef\xfd\xf2\x8bo>\xdf\x7f\xe0\xf01\x97\xcb\xa3\
+\xb8\xdd^\xeb\xbf{\xcf\x9e\xa3\xe9\xf5\xb3\xd2\x19\x5cl\
+\xe0\xdf\xb3\xc1\x8c\x05\xe1\xc7\x87\xcfO\x00\x00\xae\xbb\xee\
+:X\xf3\xd3\x9aO\xfdx\xcaT\x04\x98\xbb/\xf2\x0e\
+\xa8\xe2\x8d_\xa8\xcf\xce\xe6\xe6\x16?\xff\xe4\x93=\x9e\
+|\xe8A\xe8\xd8\xae\x8d\x88\xde\xb5=\xb6f\xc6\xcfp\
+/I\x12\xcc\xfda\xc1l\x9eG\x0d>\x8fL\xa9[\
+\xf1O\x01\xbe\xfcr\xd6\xdc\xd6\xad[K!!\x01\x7f\
+\x00\xa4\xc6\xca\x8f\x06\xa9\x00\xcc\x96\xfcD.>:o\
+\x0c\xa0\xbch\xba`\x03\xefQ\x7f\xd0\xa6}\xfb\x0e\x1e\
+Y\xb4\xac\xe2'\xbb\x8bRZ\xce\xb8\xbb}\xfa\xf6\xbd\
+6XB!\x10\x88\xdb)\x12v\xac\x1c\x01\x020b\
+\xc4\xf50\xfd\x85\xa9\xcd\xff\xdc\xb1\xfd\xb4\xda\x0f\xb7*\
+\x18\xbe\xff<T\xa1\x8ab<\xe0\xa3\xbc\xbc\xc2\xf5\xe0\
+\x83\xf7?\xc6\xf6+6.&m\xe3\xfa\xf5\x9b\xd8|\
+\xd5\xd5n\x85RJ\xff\xdc\xb5\xeb@Jj\x1a\x1b\x14\
+\x95\xc0/\xcc\xac'\x80\x8d\x07[F\x02\xf0\xee\xbf\x19\
+>|\x04\xb4j\xd1\x12\xde~\xe3\x8dY\xbc\xa8\x8b<\
+4\xff\x95\x89\x02\xf0]\xb9\x14\x7f\xdc\xe2\xc8\xc1\x83\x17\
+\xbe\xff|f\xb7\xfe}{\x83\xd3\xff\xb5\x9c\xcb9\x1d\
+\x08v\xcc\xc3\xf7\xed\xdf{D\xc5^\xbf\xda\xef\x9b\xff\
+\xfb\x5cT\x0f\x13\xd2y\xf0\xc1\xfb\x1fINN\x81\x94\
+\x94d\xb3vDmc\xd7B\xa05\xf4\x00\xcc,\xb4\
+(\x1d\x9b?bB\x8f\xe5\x01&MS\x00\x8d\x9b6\
+\x8b\xdb\xb9k\x97\xfe\x9ch\x84\xc1<T\xa6U\xb2\xac\
+\x11\xf8\x9d\xf7\xde\xfd,(\xb2^:\xf0.#\x9b.\
+\x01\x00q:\x1d\x90\x9c\x90\x00]:wl\x96s\xfc\
+\xe8)\x15\x7f\x8fz\x92\x8f\x1a\xb8\xf3m\xbf\xf5n\xfd\
+U\xa8GV\xa8[\xd1[\xd9\xf6\x9d:uQ\x1b\x98\
+\xf9\xf9\xccYjzUU\xb5R\xed\xaaV(\xa5t\
+\xcf\xde\xbdG\x92S\xae\xe0\x85\x9f\x8d\xdb\xb0?;\xf3\
+L\x877\xe8\xc7\xc8\xefV\x11\x02_~\xf5\xe5\xd7\x94\
+\x03\xfdz\xb7x5\xc2l<]\x8a\x87R\xea\xa1\x94\
+R\xfa\xc7\xb6\xed\x85\xcf?\xf9D\xa7\x97_\x98\x06\xb7\
+M\x98\xf0O\x1f\xf9&\xf2\x08\x00\x00`\xc4\x0d\xa3F\
+\xba\xdc.\xd9\x8b\xb7l\xe8\x87\x87R\xef\xeeM\x97B\
+\xa9\xcb\xff\xac{\xcf\x1e\x03\xff\xa9\x0e\xd0K\x8c\x01`\
+V\x01S\x02\x81\xe4\x01\xae^^\xf8\x81{\x06\x84H\
+\xf0\xc6\xdb\xff\xfb\x80%*\xc60\x94\xca\xd4\xa5(\xb4\
+\xd2\x97\xe1\xcf?w\x1dt8\x9d\xf6:aa\x90\x98\
+\x9c\x0c\x0e;\xf6\xa2\xe3e\x03\x03\x876j\xd2\x04\xa6\
+=\xf7,\xdc{\xe7\xe4\xc6[~\xff\xfd\xb8\x8a\xbb\xb6\
+\x5c\xa7n\xd6Q\xa8&\xfc\xea\xcf#+\xd4M\x15\xea\
+\xf6\x09\x04\xa5\x94~\xf8\xf1\xccY\x00\x00q\x89I\xe9\
+\x05\x05\x85%\x94R\xeary\x14\x8f\xc7\xcb\x84\x07\x0f\
+\x1d:\x9e\x98\x92\x92\xc1\xe1\x84,\xbb\xfa\xe6\xd6\x04\xd8\
+y\xbe\xc8\xfbC\x95\xdcw\xb3\xbf\xf9\xd6?\x16\xfaE\
+0\xdc3\xb0V\x0d\x0aU\xa8\xc7SM=\xbe>\xef\
+\xf9k\xf7\xf9\x07\xef\xb9\xbb\xedw\x9f\xcf\x82\xde\xddu\
+G\x0d\x06\xab\x0dj\xc3{\xd0\xca\x7f<\xf3\xb3/\xfc\
+c\xa9z\xaa\xea\xbd76%\xcb2\xa5nY\x0bT\
+\xed\xd8\xb1s_bJJ|\xdd\x98\x18\x88\x8d\x8b3\
+k#P\xcf\xd2\x14h\x90\x1b\x81\xc4\xee\xab\x89&4\
+k\x1f\x8c\xefB\xf2?\xb6>\xf6\xdeF\xa9\x02\x1b6\
+\xac\xdf`V)\xa1\x00\xe0! Q\x02\xb2/\xb1i\
+\xe3F\x8d\x06\x0d\x1e<0%9\x19\x92\x92\x92@\xf6\
+x\xf8*.'h}\x08\x09\x09\x81>}z\xc3\xc8\
+\xeb\xae\x85\xea\xea\xea\xac[n\xbd}\xc5\x95]\xbbf\
+\x02\xa8\x07fx\x0f\xec\xc0N; \xbe\xff$\x02 \
+)\x00D\xf1\x93;\xbb_\xdf>\x00\x00\xad[\xb5k\
+\x16\x17\x17\x1b\x05\x00 I\x84\xd8l\x12\x1c;z\xfc\
+Tv\xbf\xfe\xfd\xf2\xce\x9c9\xe1\xcb\xae\x0a\xb2z\xc4\
+\x98*\xe8j\xcb\xd4\xf7\x82`0\xe3\xa4\xfd\x1d;n\
+\xc2\xd8Y3g\xce\xf1&\x10\xae\x02\xf5\x03\xc0\x14\x80\
+R\xf0\x19\x19_e|\xb5\xea\xdb\x87\x00\x84\x12\x90l\
+\x0epS\x02\x1e\x00h\xd1\xbae\xbdq\x13nYu\
+\xf6\xfc\xb9\x0e\xd11u\xe1\xbf\x00u\x22\xc3\x13\xfa\xf6\
+\xea\xd5\x07@\xed\x85\xbf\xaf\x94z\xffJ\xd4\xbb\x87N\
+\x96\x14\xa0\xbep\xed\xcf?\xff\xfc[aaa\xc1\x95\
+\xdd\xba\x81B)Vu\xd0n>\x98(\xe8`\xc1,\
+@\x87Y\x08\x91\x17`\xf6\x0cL\xca\xa8\xa0M\x03\x9a\
+\xb7n\xdd\xf0\xf4\xb9s\xc5\xbc\x0dQ\xd8\x1b\xdf\x1c\xab\
+\x9cI\xff\xe4\x93Ofy[\xfaG]F\x1d\xa4\xa7\
+\xa7\xc1\x8c\x19/\xc1\xa4\xdbn\xcd\xdc\xb8~\xfdA\xd6\
+\xc2iN\xb2\xee\xed>_\xcf|\x1e\x81\xf6O\xf6M\
+\x07|\xf9\x8a\x8a\x8b\x8a#cc\xaf\xb8\xff\xc1\x87\x1f\
+e\xe9r\xec\xd8\xb13\xe9\x99\x99\x8d\x18\x14\x08\x80\xce\
+\xba\x03\x18\xbd/\xe0\xf2\x8b\x9e\xb1ytLF\x00\xc8\
+\x0f\xf3\xe7\xcf\xe5\xc7G\xe1\xfa\xa4\x7f\x7fK\xb0+\x80\
+IvS\xef[\x84*}v\xef\xda\x95\xf7\xf6\xab3\
+:7m\xd2\x88\xc5\xe5\x9f\x02\x95\x96\x04\x00`\xcc\xd8\
+\x9bo6\xf6\xc4\xe7\x011q\x1cYq\xd3j\xd9\xef\
+\xffO\xbcu\xe2\xa4\xf8\x84xHLI1kG\xfd\
+{\xc9\x0a \x18\x0f\x00\xc08\xf8\xbcB\xc0\xd2\xccb\
+\x03VK\x83\xd8t@m\xc3\xaevg\xd6\x97\xb3\xb4\
+H+\xca;>\x99qSo\xb4\x95RJ\x0f\x1f9\
+\x92\xe3\x08\x09\x15\xfaX\x01\x123\xd0\xfc\xec_\x15\x7f\
+HOO\x87\xb17\xdf\x94\xb2q\xe3\x06\x93O\x9d\x19\
+\x17\x8f\xfcS\x025\x90\xa4\xe8\x14Ei\xe9\xc5\xb2\x19\
+\xaf\xbd\xf2\xde\xa6M\x9b\xb6\xa8%\x0f\x1f9r\xbaE\
+\xcbV-\x03\xe8\x87H\xc8Ec!R\xe2|\x1b\xd2\
+\xb7_\x7f;\x97\x1a \xb88\x80qh=Tf\x04\
+\xe8BA~\xc1\xe0\x81\x03\xbb\x05<:5\x03\xbe\xbf\
+6\xe6\x07\x00\x00_~\xf5\xd5l=\xd6X?<T\
+Q<\xd4\xe3\xf1\xfa\xff{\xf7\xed=\xd3\xa5g\x8f\xf4\
+\xae=\xb0\x13\xd3/\x0f\xd0K\x8c\x01\xf0B\x1e\xc8*\
+\x00\xb6\xae\x8fM/D\xf9\x0d\x8cx\xfb\x1dw\xdci\
+$.\xa3w\x19\xae\xf10\xf9\xee\xb8\xf3\xce\xbb.\x81\
+vf\x02d\xf5\x9c\xd4K\xac\x07\xc3\xae\x1f\x96\xb0~\
+\xed\xda?\xc5\x8c\xc2\xbf4\xe3\xdf\x07\xa00}S\x18\
+\x85@)\xa5\xb2,+\x1e\x8f\xbf\xa79'N\x9ci\
+\xde\xbcE+\x06\x073A\xe6q\xc5\xc6\x14\x90{\xbe\
+\x1e\xac\x8cm\xe1\x82\x05\xf3\xf9\xfe\x06\xa4\x02\x14\xe3\x8d\
+\xe2'\x00U\x98U\x9eC\x87\x0e^\xe8\xdd\xbdg\xa7\
+\x06\x19\x99\x08\xf9-\xc1J\xc1\xf34Pii#>\
+\xaf4%#\xb5\xf1\x85\xa2\xa2R#\xf2\xfc\xaa\x86L\
+e\xd9\xa3\xbd\xc45o\xde\xfcE\xc4f\x03\xc7?w\
+\x98I\xad\x04\x01\xcd\xd6\xee\xad\x14\x06\xa6 0\x012\
+\xab\x07\x92\xd3\xd2\xb2N\x9d>\x9dg\xe4\x18#\x83\xb1\
+\xd7+\x97/\xffY\xad\xa3\x06`*\xe0\xc8s\x9d'\
+\xd0\xb3O\xaf\xe8m\x9b\xb7\xe8v2\xe2\xe10>\x87\
+B\xa9\xe6\xf6\xfa]g\x11\xe4\x17\x16\x16f5i\xd4\
+\x86\xc3\x03\x0b\xb2Z\xf5ED\x03l\xe5\x00\x986\x80\
+\xb9\x07\xa7\xc3A\xe6\xce\x99\xb3\xc8\xaa\x9fH\xc7\x99\xbf\
+:\x87ZS\x88\xacr?\x91\x93\x93\xff\xf8\xc3\x8f\xb4\
+o\xd1\xa2\x0dt\xec\xd0\x09:\xb4\xef\x08Wv\xea\x06\
+mZ\xb6\x15\xf5#\x10\x10*;\xe2\xdd\x10E\x00\x00\
+\xa6\xdc{\xf7\x83V\xbd\xd3\x96\x02\x99\xc1\x9b|\xe7\xe4\
+\xc9v\xfdr\xe6e\x07ZK\x0a\xc0L\xa8yE\x81\
+\x09\xb6h\xe9\x8f_z\xc2\x5c/\x00\x00\xf8\xe1\x87\x1f\
+\x97\x04\xc2G\xacb\xf0\xb8\xdcr\xc7\x8e\x1d\xad\xfc-\
++\xe10+\xc3\xf7\x15\x00\x00\x12\x12\xe23\x96-[\
+\xb6\xd1\x8f\x91\x19\x93`\xa9\xb2\xbf\x1f\x8c\x02\xd0\xe6\xc8\
+>\xc8\xcf\xcf/\xec\xd8\xa9sg\x06/\x1b\x18\xf1\xe6\
+\xc7\x00\xeb\x8b\xe8\xde\xcc\xda\xf3\xed\xb0\x0a\xc1>w\xee\
+<N\x09(FM\xadp\xb7l\x1a\xba\xbbN_h\
+\xdf\xee=\xa7\x1f\xbe\xef\xd1+\xef\xbd\xf3Ax\xf8\xc1\
+\xc7\xe1\xa9\xc7\x9f\x83\x07\xefy\x04$\x9bA\xe7\x072\
+\x8e\xa2\xbeK\x00@$\x1f/J6)|\xc7\x9f\x7f\
+\xece\xb1\xc2\xc6\x94\x1f\xdb\xdc3\xa7\xf3B#\xc2\xeb\
+\xc1?\x0c4\xc8U\x00Cy0\x1e\xf8f\x05\x18\x11\
+\xb1\xb2\x98\xf5\xe7\xcf\x18\xd4\xca\xadZ\xb5b\xb9\x1aF\
+F\x111\x06\x95\xc1\xe6\xb0Kcn\xba\xe9\xc6\x00\xf1\
+6\xab\x11S\x06\xe8a\x8e\x84\x10x\xf0\xc1\x87n\x1b\
+2dH/\x00\x00\x85\xca\x22\x8c\x11\xae\xf4\xbd\xccK\
+%_\x04\xdd\x97\xcf{\x82'\x00s\x02\xee\xa9S\xa7\
+\xf2{\xf7\xee\xd3o\xc7\xf6m\xdb|I\x12\x98\x8f\x15\
+v\x8a'\xef\xea\xf2c%\xbaf\xefU\xc1g\xdfF\
+\xf6\x8c\xb9\xe9\xc6Q+\x96-[\xcc\xe6F\x86\xc8\x08\
+D\xdf\x14a\xd6!\x08\x05\x00\x19@\xf1\x1d\xa1\xdf\xac\
+e\x8b\x94FM\x1a\xdc\x0c\x92\x02\xe1a!`\xb7\x03\
+\xd4\xcf\xca\x84^=\x0d\xef\x83\x99\x8d#\x9f\xcf@#\
+\x02`S|G\xb3\x0f\x1a\xd8?\xbbC\xdbv\xcd9\
+\x84\x8d\xdd\xe0Vw\xd6\xac^\xf3seYy>\x96\
+\xd5\x02\xa7\x7f\x140\x8d(\xf2\x02Dn\xb0\xc8\x83\xc0\
+\x9e\x89,\x8c\xc1[p:\x1d\x11G\x8f\x1e=\xa9i\
+W\x0b\xbfR}\x5cRRR\x9e\x96\x96\xde\xa0\x86t\
+\x08\x1al6\x09Z6o\xd6p\xd3\xa6\x8d\xdb5L\
+\x14\x99\x8a\xfcx~\xd6\xa8{\xa2\xc8\xde\x1d\x81\x8a\xe2\
+=\xc6\xcb\xf78\xf7\xd4\xa9\xf3\x1d\xdawl\xcb4\xab\
+n\xa0\xe2\xf1\x17\xba\xb4H\xba\xc83c\xf3`\x80M\
+\x0d\x08\x00\x80$\x11\xc7\x82\x1f\xe6-\xf1\xf7\x08\xff|\
+\x99\xf5\x14A\xf5\x86\xbco8\xaa\xa4\xdc\xb4i\xd3\xce\
+\xe6\xcd\x9b7\x8c\x89\x89\x81\xa4\xa4$HJJ\x82\xf4\
+\xf4t\x88\x8b\x8b\x17\x8eO\x00\x80y9\x1am\x17\xff\
+\xb8@;\x85\xc9c\xf0I\x18\x8c\x15}O\xfbd\xf7\
+\x1b\xcc\xd1\xf1?9\x05\xc0\x5cx\xb34\xb5\x0c\x16\xc5\
+7\x13n\xccu4S<\x00\x00\xf0\xe1\xc7\x9f|\xe1\
+g\x09\x13\xb6\xe1\x1eM}\xfe\xf9\x19L{f\x82\x11\
+\x08\x98N\x17\xd4\x9djQ\xe1a\xb1\xdb\xb6l\xf9\xc3\
+\x8f\x85W\x98qD\x15jp\x1e\x15\x85R\x8f\x9bR\
+\x8f\x9b\xba\x98\x00\xd8\x99\xd3\xa7\xcf\xb7\xef\xd8\xa1#\xd2\
+6\xa6<\xad\xfa\x11\x8c\x82\xb0\xec\xbb\xa0M\xc7\x8ae\
+\xcb\x96\x8a\x07\x8b\xe9\xb2q\xe8\x98T\xfd2\xe2\xb6\xed\
+;\xfe\xaa\x13\x16\x16k\xd1G\xac\x0f\xc1\x82\xd6\xbff\
+M\x9b\xb6\xf7\xb8\x5c2\x8b\x1b\x8a\xb3\xa2\xe7\xcf\xfd\xfb\
+\xf7\x1e\x91lR\x04C#\xcc\xfb\xbd$\xdc\x904\xaf\
+/u\x09\x0a\xc0\xca\x8a\xab\x83\xcd\xcf\xff\xb1z\xccb\
+\x04V\xab\x00Z\xfe\xe6\xadZuv\xbb=\xb2\x9f\xf4\
+\xe6L\xa5\xe6(,\xc8/\x8a\x88\x8cH\x0c\x94h\xc8\
+3+\xc0\xbc \x08u\x84Do\xdb\xbcYS\x02^\
+\x05\x80\x87\xfe\xf4\xfc\xaeP\xaax\xa8\xe2vS\x97\xab\
+Z\xdb\x1b\x7f\xe6\xcc\xe9\xf3M\x9b4m\xcf\xb4\xc5\x0b\
+\xba\x99G&\xc4\x93\xab\x8fgN\xac\x9f\xec\xf8\x8b\xea\
+\xd7\xea\xaa\xe3tJ\xb3g\xcf^h\xe8\xaf\xc2\xfc\x90\
+\x15\x12=M\xfc\xb7\xdb\xb7n\xdf\x15\x1a\x1a\x1e\xec\x12\
+o0\x0a\x1e\xcd\xfb\xd5\xacY\xdc\xaeG\x0co\xdfS\
+\xc6\xe3{\xe0\xd1G\x9e\xe4\xe8\xc2\xb6s)\x0a\xc0\x12\
+\x7fz\x09/\x03Y\xad\xf5\x8b\x96\xfe0\xe1\x0dD\xc8\
+\xf9\xfa\x80{\x06\x00\x00?\xff\xbcv\x93\x9f\xccbP\
+8-<m\xeaT\xde\x0b\x10\x11\xcf*\x8dgx\xf4\
+\xb9\xdd\xb7\xfd\xb8NX\x9d\x98\xdf~\xd9\xb4\xc3\x8f\x18\
+?\x1d@z\xa1(\x94\xba<\xb4\xba\xda\xa5T\xfb\xb6\
+\xf7\x1e;z8\xbfO\xcf^\xad\xb9vx\x81\xe5q\
+4S\x00\xa2\xfe\x9b\xf5-\x90|\xa2\xb6\xa5\xeff\xcf\
+^\xe0\xef5\xaf\x0c\xf9`\x9a\xdf\xedg\xb7\xd9o\xfd\
+}\xcb\xae\xa8\xa8\xe8z\x5c{\x81\x02&p\x18\x8dt\
+u:\x1cvh\xdf\xbeu\xcb\xa2\xa2\x0b\x15~\xec\x04\
+\x0a\xc0\xc7w\xea\x10\x97\x94\x94T\xa6\xa5g4\xf6U\
+m\xa6\xac\xad\xd2k\x04\xb4\x96\x14@\xa0\xbf`\x96\x0b\
+\xcd\x96\x17Y\x05\xa0\xf3.\x86\x8d\x18\xae\xdb\x81e\x0a\
+\x8aB\xa9\xef8\xad\xfc\xf3\xf9E\xa9i\xa9\x995\xa4\
+\xa3\xc8r\x9ay\x13\x10\x1a\x12\x0a\x00\x00!\x0eG\xec\
+\xe6M\x9b\xb6\xea\xf0\xe2v\xfb\xb1S\x00E\x96\xa9\xbb\
+\xdaM\xdd\x1e/\xf2'N\x1c?\xdf\xa9c'^\xf8\
+\xcd\x98$\x18&\xaaM\xeb\x83\xd5\xa91\xbd$I\xb6\
+\x85\x0b\x7fd>\xa1\xcd\x09\xbdn\xc9\xd3\xbf\x01J\x85\
+\x1d[\xb7\xfd]7\xb2n\x12\x00\xb0\x1b<k[\x01\
+h\xe0p8\xa0A\x83L\x08\x09q\xc0\x17_\xcc\xfc\
+V\x847\x9b\xac\xed\xdb\xf0\xc1\xc7\x1f\x7f\xfc9G\x0b\
+\xab\xb6k\xa2\x00\x84\x86\xcbL\xe0\xf9\x1f\x8f\x10&\xd4\
+\xa2<|>lZ`V\x0e\xbb\x07.\xcd\x0e\x00\x10\
+\x15\x1dU\xf7\xc0\x81C\xc7y\xc2\x0b\xaf=\x0aU\xa7\
+\xde\x9f}\xf6\xd9W\x0c\xb5\x82%t\xa0\x16\x11\x85\x10\
+\xa7#\xe6\xb7M\x1b7k\xb8\xc9TSN\xde\xed\xbe\
+Ts\xffe\x8fL}\x86\x9f\x1e:\xb8\xfft\xcf\x9e\
+=\xdb\xd8\xfcg\x7f\x88\x96\xf3\xcc\xf0\x102\xf9%\x00\
+\xa6\x04E\xee\xad\xa6\x04\x08!\xf6o\xbf\x9e=O8\
+^\x8a\x1a\xfc\xd4/\x1bn\xd9\xf2\xfb_\x89\x89\x89\xdc\
+qf\xb5\xae\xbct\xf5EEEArr\x22\xf4\xef\
+\xdf\xbf}qI\xb1[ERt6\x05\xe5\x14Ve\
+eUU\xb7.=|K\x12\x043t<\xfdj\x03\
+\x7f]]\xc1*\x00\xde\xfdf+\x15\x09-0i\xbc\
+\xf7 r\xf3\x01\x8c\x0a\x82o\x0b\xb8\xb2\xda\x9evv\
+\x0f\xbc!\xb8\xcexf\x8a\xe2=+\xa0\xca'h\x15\
+\x15\x15\x9e\xee\xbdz^\x19,\x11M\xd2\x03\x19<\x1b\
+\xf8\x94\x97\xddf\x8b\xdc\xfe\xeb\xaf\xdb\xfc\xb8\xab&\xc3\
+\xaf\xac<\xb2\xffH\xcf\x93'rN5l\x98\xc5\x1e\
+\x1ag\xd5V\xa0\x82\x1e\x8c\xe51cV\x8cG\xd4{\
+\x8cG\xb4\xb2?.X\xf0\x83n\xd0\xb4\xa8\xb9\xd7k\
+c?^\xb2}\xfb\xd6\xbf\xa3\x22\x22\xd8\xd0\xbeN\xa9\
+\x04\x08\xd8\xd8\x89\xf2\x11\x00 !!NHKO\x85\
+\x05?\xfc\xb0\xdc\x8f)\xab\x98\x14\x833\xc0*\x80\xef\
+\xbf\xff\xfe\x07\x7f\xb5\x92M\xd0^m\x80\xb0/5U\
+\x00\xd8\xc0\x99\xfd\xac\xe6\xfe\x18\xc3\x05\x12\xfd\xd7)\x00\
+\x09\x88\x13\x00 &>\xe1\x8a\xbc\xbc\xfcB\x9d\x02\xe0\
+\xc3\xb1\x8c\x02\xa8\xa4\xfe\x0fR\xac\x5c\xb9bc\x5c\x5c\
+<\x84\x86\x86\x82\xdd\x19\xf07\x04Y:X\xa5\xf1 \
+\x11\x90l\x00\xc4\x0e\x00\xe0\xb4\xdb\x22\xb7\xfe\xc6\x9cu\
+\xe8\x9b\xa6(\x8aB\x15\xb7\xac1\xd0\xb1\xa3GOg\
+ff6\x0e\xa0\xad@\x05\xb9\xa6\xe5\x02\xc9\x17L\x1e\
+\x02\x00\x10\xe2pHsg\x7f\xf7#K\x07\xed}\x07\
+F\xf8\xb7m\xdf\xb6+<<\x8c\x17~\x9eg\xcc\xf0\
+\x17A@y\xef\xbb\xe7\x9e\xa1z\xe1WW#8\x86\
+SC\x16\x8c\x02\xf8c\xc7\xce\xbf\x9a4n\xc2\x06m\
+1\x5ck\xc3\xfa\xd7\x9a\x02\x08D\xd8\xad\x84\xdf\xaa\x1e\
+3%\x01L\x9a\x8d\xcbgc\xb7c\xbe\xfe\xd6\x9bo\
+\xebU/5hc\xaaP\xedM\xc1j\xe6h\xed'\
+\x9exb2\x00\x8034\xd4H1\xc9HK\xbbd\
+\x0bJS\xf0Uzk\x95l\xc4\xe7\x09\xd4q:c\
+wn\xdb\xb1KCS\xf6x?\xfd\xe5c\x9e\x03\xfb\
+\xf7\x9fi\xda\xb4)\xffV\x9fI\xfd5b\xa2\xda,\
+g\xa58D\xee\xafc\xce\xf7s\x17\xf9\xe9 \xeb\xf6\
+\xfco\xde\xbcyW\x98\x7f\xf5F\xad\x133\x10\x00F\
+o\xd2\x00\xd1QQ\x90U?3\xa0c\xc7\x13\x92\xea\
+AzzZ\x9d\xdf\x7f\xf9\xf5\xa0\x9f\x99d\x7f\x90/\
+\x80\xdd\x0b\x94RZRT\x5c\xfa\xd0=\xf7?\xa1\xd6\
+\xeb;\xaaNd`/\x15\x0c\xf5\x04\xab\x00\xf8\x8a\x82\
+Q\x00fV\xdfj\x85@\xfd\x0b\x5c\x1a\xc7D\xc4F\
+|\x96\xf4\x8a\x8c\x8c\xa6EE%\xa5\xea\xd0\x18\xc1\xe7\
+^\xbb\xbcJ\xa0R\xa1\xb4\xda\x97\xf1\xcc\xa9\xdc\x92\x06\
+\x19\x99\xe8\xf7\x03\x9cN;8\x1c\xde\x08~rrr\
+\xbd\xfb\xa6\xdc}wv\x9f>\x03\xc3\xc2\xc2\xc0fG\
+\xbd8\xa1\xf6e\xae}\xfd!\xdat .*6i\
+\xf7\xce]\xfb(U\x83_^\xc6?t\xe8`^\xbb\
+\x0e\x1d[0Q\xaeK\x9d\xeb\xd6\x16sa\xf5\x06\x92\
+\xc6\xa6\x1b\x94\x80\xc3\x11\xe2\x5c\xb6x\xd9b\xff\xb0y\
+\x07\xe9\xf7\xcd\xbf\xff\x19\x9f\x90\x90$*\x07b\xa5\x82\
+#@\x00R\x12\x13\xe1\xfak\xaf\xf5~X\x99\x10h\
+\xdb\xb65\xc4\xc6\xc6Bjr\x12H\xdck\xe3\xf1\xf1\
+u\xe1\x93\xf7?\x98\xa1\xa2%+\xec\x9b\x08\xdc\xd4-\
+\x00e\xf0\xddW_.\x9dt\xeb-Mz\xf5\xec\xa5\
+C\x8b\xeb\x9f\x19\x0d\x03\x01C=\xc1*\x003Km\
+\x96\x86\x09\xb1\x0a\xbc\x9b/J\x13\x11CwO\x18\xc9\
+\xf8\xe0\xc3O>3\xca\xbd\xa2\x0b\x0c(\xb2Be\x8f\
+B=2\xa5\x15\xb2\xff\xc3\x98\xabW\xadZ\x91\x9c\x9c\
+\x04\x18\xa4\xa6\xa6\x84M}\xf6\xf9;\x96/^\xba\xf7\
+\x95\x97_~+*:\xb2\x9e$I\xb5q\x1c\x95D\
+@\xb2\xfb\x14\x01\xa4%\xa7f\xec\xd9\xb3\xef\xb0\x8a\xeb\
+\xd1#G\xcf\xf5\xec\xd9\xab}LR2D\xc7\xc6\xf1\
+\xb4\xb8\x5cpY,\x8fE\x1e\x9d\xf5\x96$\xc9\xb9|\
+\xe9rm\xb3\xd0o\xbf\xff\xbe36..\xc1\x9b\xd1\
+\x9b\x05\xacy\xc5\xbcq\x02\xd0(33\xb9W\xf7\xee\
+q\x00\x00\xed:\xb4\x87\x87\x1f~\x08:u\xea\x04C\
+\x87^\x03\xf111\x00\xe0=\xb4\x15\x00\xa0e\xcb\xe6\
+\xed]\x95U\x1eJ)\xad\xa2n\xef\x89L\xcc\xca\xa4\
+_\xee\x15J=\xbeS\x7f|p\xe4\xf0\xa1\x9c\xa5\x8b\
+\x17\xaf,..\xd2\x1d\x17^q\xf1b\xc9\xc3\x0f>\
+t\xb7\xc3n\xb3\xb5o\xd7\x0el\xb6Z\x0f\x0b\xd4\x8a\
+\x020\xb3\xd6\x22\x0b/\xd2\xc4\x98\xe2\x00A~\x91\xa2\
+a\x03\x93\xfaN\xda\xa4\xf0\xdd\xfb\xf6\x1dP\x95\xb2\x7f\
+T\x14\x7f\x92\xefl=E\xf6\x8eS5\xa3\xc8\x1fy\
+\xfc\xb1\x87X\xeaI\x92Tg\xe4\xf0\xe1c\x0e\x1c8\
+\x90#\xcb2\xfd\xf8\xc3\x0f\x9e\xb6\xeb\x07)XFG\
+\xee\x89\xe4\xf3bl\x00\x00\xc9\xc9\xa9\x99G\x8f\x1d\xcd\
+-\xb9X\xec\x1a8\xf0\xaanD\x92\xc0\xe1\xb4<-\
+\xb66@d9kS\xe1\x98\xd5\xa5k;4$\xd4\
+\xf6\xd3\xca\x9f6\xed\xde\xf3\xf7\x81\xe8\xe8\x18\x91\xe5\x17\
+\xd16 E\xd0\xa4~\x83\xb6o\xbe\xfe\xfa\x9c\xa9/\
+\xbe\xf0d\xd7\xae]\xc3Z\xb5j\x09-[\xb6\x84~\
+\xfd\xfaBtT\x14\xd8l6\xc8\xcc\xbc\x02l6\x89\
+,_\xbe|3\xa5\xde\x8f\xb3V*.\xed\xc8/\xe3\
+\xf2\xbf\xe2;\xf2\xcbotz\xf7\xea5\x00\x00\xa0\x7f\
+\xbf~\x03\xe7\xce\x99\xf7\xd9\xce\x9d;\xff*--\xd1\
+\x9e\xff\xb2v\xed\xa67g\xbc\xd21:*\x9a=\xec\
+\x94\xa5Wmy\x01\xd2\xa5(\x00\xcc\xe2\xb3\x0dXE\
+\xfa1w\xcd,\xf0\x17\x88\x87\xa1AfF&t\xbd\
+\xb2\xb3}\xfd\x86\xf5\xfe7\xb3x\x05\xa0-+)\x8c\
+\xf6V\xb4\xc1\xac\xae\xaeV\xba\xf5\xe81\x00\x00`\xc2\
+\xc4\x89\xb7l\xd9\xb2u\x1b\xa5\x94V\xbb\xdc\xf4\xde\x07\
+\xee\xbd\xb6K\x17m\xc1\xc0\xd4\xe2H\x84\xb0\x87\x0e\x9a\
+)\x00\xad?\x849\x8833#\xbdY\xcf\x1e=\xfa\
+1\x1e\xc6?e\xf9/\x87\x02\xc0,\xb5\x0a\xa28\x91\
+\x04\x00P\xc7Y\xa7nLtt\x0a\xf3\x5cdh\xd8\
+\xe7\x80\xa4\xa3\xe0\xb4\xd9`\xec\xf8qc\x8a/\x5cP\
+v\xff\xf5w\xde#\x0f=tgDD\x04\xb4k\xd7\
+\x1al\x92\x04\x09\xc9I\xd0\xa3GWx\xe4\xa1\xfb\x1f\
+P9\xe9\xa2\xec\xa6\x95\xd4\xedW\x00\xac\xecS\x99R\
+\xea\xa1\xd4\xe5?\xf2w\xde\xdc\xf9\x8bt\x1d\xb6\xd9 \
+9%%j\xd5\x8aec>\xff\xfc\xb3\xcf\x8e\x1e9\
+TF)\xa5\xc5EEt\xc6\xb4\x17^\xbdo\xca\x94\
+:}\xfb\xf6\xc5h(\x1a\x9b@\x0d\x90\x04P\xf3 \
+\xa0\xc8\x03\xd0\xfa\x05\xb8P\x9by\x06\x80\xe4\x010\xb6\
+\x87\x11Ac\x1c\xdf\xb7\xd4\xe0\xaa\x01W59\x7f.\
+o\xb7pg-\xfbc\xd2\xbd\xe1\x1bY\xfbjN\xc1\
+\x85\x0b\xc5\x1b6\xac\xffE\xcd\xb2e\xeb\xd6C\x9d\xbb\
+vi\xd6\xb0q\x96\xea\xa2\x09\x85\x84\x10\x02\xfd\xfb\xf6\
+\xbb::*:\x11p\xb0\xb2X|\x9f\xb1<\x97\x03\
+.g\xfd\x98\xb24\xe3\x07\x8c\x0e\x04\x8cA`\xb3\xba\
+\xcch\xa6\xdd\xc7\xc6\xc4@Dh\x18\x5c\x91\x91\xde\xe8\
+\xaf\xbf\xfe:D)\xa5\x1b6n\xd8>y\xf2\xa4\x9b\
+\xd4<\xd3^z!+\xf7\xc4\xc9RJ)\xad\x92\xdd\
+\xb4\x8cz\xa8\xcb\xf7\xc5E\xbd\x02P\xa8\xa2\xb8\xa9\xec\
+qS\x8f\xef\xf5\x80\xf2\xd2Rw\x8b\x16\xcd\xdb\xf0\xed\
+\x02\x00<\xf5\xf8\x13\xd0\xaeC;h\xdb\xbaU\xf3[\
+'\xde2~\xc3\x86\xf5\xdb(\xa5\xb4\xf8B\xc9\xe9\xa7\
+\x9f~\xe6\xe6\xb17\xdc\xc0\x1e\x13\x8e\x19J\x9e\xa6\x18\
+\xf0F\xb7V6\x02a?\x91\xa0\x8b<\x01Q\xe0\x8f\
+\xbf\xc7\x02^\x04\x00Hxx\x18d\xd4\xf7\xc6\xed\xfa\
+\xf5\xee\xd5w\xf7\xae\xbf\xce\xfa\x07D\xf7~\x06\xae\x0c\
+\xb8g\xb2\xc7C\xdd\x1e\x8f.\xeb\xfc\xf9\xf3\x7f\x88\x8a\
+\x8e\x8e\x0d\x8f\x8ad\x85_H\xfc'\x1f}\xe2\xd9G\
+\xee{\xf0)I\x92.e\x95\x80g|\xbe\xdd\xcb\x09\
+\xffT;l{\x06\xa5\x8e\xe0b\xb5G\x04S\x0a6\
+\x10\xf0\x8e.\xc1\xe7e\x8d\x1b7\xce\xf6\xe5\xe7\x9f\xbf\
+\xa3\x8e\xfdW_\x7f=\xbfC\x876\xdd\xd6\xae\xf9y\
+\x09\xa5\x94\xba=\x1eZ-WS\xb7\xe2\xa2\xdeOz\
+\xb8\xbd\x1b\xb7<\x0a\xa5\x8a\x87\xca\xb2L=\xb2\x87\xba\
+\x5c\x1eE]`\xfa\xf0\xfd\xf7>\xe0\xfa\xa0\x1b\xcf\x94\
+\x94$\xe8\xd2\xb9\x13$&\xc4\xc3K\xd3\xa6J\xc3\x87\
+\x0d\xeb\xfa\xda+\xaf}\xb5w\xf7\x9e\xe3\x9f\x7f\xfc\xf1\
+\xd7\xbd{\xf4h\x97\x96\x96|)A_\x03}j\xaa\
+\x00\xb0\x0e\xf0\xd6\x1e\xb3dX\x1eQL\x81\x8f\xfac\
+\x1a\x0f\x00\x00\x1a7n\x0c\x0f<p/DEG\xc0\
+\xd8\x1bn\xbe\xa10\xbf\xa0\x8aRJ\xab\xdc.\xea\xd6\
+}\x18\xcc\xa8\x00\xb4%\x1b\x85Ke\xde\xcc+*.\
+\xa2\x1f\x7f\xfc\xd1\xb4\xa9\xcf?\x0f\xce\x90P\x15\x05\x9e\
+\xc1\xbc\x17\x84@\xdd\xc8Hx\xf2\xd1\xc7\xa6\xec\xda\xba\
+\xedP||B*G#\xb3\x01\x09\x04.\xa7e\xfe\
+'\x04\x9e\x17d\x96\x86X\x90Xd\xdd\xf9{\x8c\xb6\
+\x81,\x03bV\x14Z\xb6l\x09Y\x19\x190r\xe4\
+\x88\x9bO\x9c8QI\xa9w\x19\xb2\xb2\xbc\x9cVU\
+W\xcaU\xeej*{\xaa)\xf5TSm)\xc9w\
+\xc4\xb7[\xf1P\x97\xe2\xa6\x1e\x97\x9bz|\xc1\xbf\xdc\
+\x13'\xcf7o\xd5\x22I\xf0QS\x0d\x87\xc8\xc8H\
+HNJ\x84\x9e=\xbd\xe7\xd4\x0c\x1d:\x14^~i\
+z\xea\xd8\xb1\xe3\xa6\xccx\xe5\x95iI\x89\xf1M\x05\
+\xb4\xe4\xfb$\xea\xa7N\x96\x82U\x00V\xf3y\xab\xe5\
+<\xd1O\xa4(X\xad\xcd\xaf$h0`\xc0\x00\xb8\
+y\xdcX\xb8u\xc2\xf8\x87\x15\xb7\xd7jW\xb8\x99/\
+\x87+\x94\xaeX\xb5\xf2\xe7\xa2\xe2\x0b\x17y=\xc0*\
+\x00E\xf1\x9e\xb0\xcbj\x83\xbc\xbc\xf3%\xd7\x8d\x189\
+j\xcc\xd8\xb1\xf0\xce\xdbo\x83M\xd2\xb9\xfd<#\x02\
+\x00\xc0=\x93&w\xa32\xa5w\xdd9\xe9^d\x00\
+\xf8\x01\x0aT\x01\x04\xab(\xfe\xab \xb2\xd2\xd8s@\
+\xaeEq\x02\xb3\xbcX[\x22%\xa3\xa5I\x84\x80$\
+I\xf0\xf0C\x0f\xb6;y<G;\xb5\xb9\xba\xbaB\
+q\xbb\xab(u\xb9)\xadvQ*WS\x85\xba\xa9\
+\xacx\xa8\xc7\xe3\xfdz\xb3KvSw\xb5\xff\xb0\xd2\
+[&\x8c\xbf\xcd\x82\x06h?23\xbc^mV\xc3\
+\x86\xd0\xa0q\xc3\x10gHx\xac\xcd\xbf\xedDT\xd6\
+\x0a\xb42\xb5\xa1\x000-n6\x05\xb0Z!\x10\xc5\
+\x15\x080\x0a\xc1&I@$\x02\xb1\xb1\xb10e\xca\
+\x14\xf2\xe1{\x1f|B\x11\xf8~\xf6\xf7\xcb\xfa\xf4\xed\
+w\x15\x00\xc0\xd3\xcf>\xfb\x22k\xf99W\x80*\xb2\
+~\x03\xc7\xae\xbf\xfe<\xd2\xa8y\xf36Qq\xf1\xd0\
+\xbcU+p8\x84\x84\xd7h`\xb7\xd9\xea\x9e;s\
+\xb6\xf8\xc0\xde\xbd\x87-\x06 \x904\xfe\xf9\xffu\xe1\
+W\xc1L\x19\xaa\x0a>\x90i\xa1\xd9<\x98\x17&\x09\
+\xbc\x81U>v\x80\xe1\xa3\xab\xb3w\xaf\x9e0q\xe2\
+-\xf5\xe6\xcd\x9d\xab\xedGp\xbb]\x94\xba\xdd\x94\xba\
+=\x94\xcano\xdcH\x91\xa9\xecQ\xa8,\xbb\xa9\xc7\
+\xe3\xd6\xe2H\xcb\x97.\xfb\x89\xc3\x0f\xa3\x03\xfbL8\
+\xd6\xa1\x11\x11V\xf8\xb2\xfde\x01U\x8c\xc1*\x003\
+\x81\x16=\xc7\x06K4}\x10\x09\xbe!\x8f\xd3\xe9\x04\
+\x90\x08\xb4j\xd56\xf9\xaf?w\xad\xe3\x85\xf9\xcb\xcf\
+\xbf\x5cr\xf3M7\x0f\x180d\x90\xae\xaa\xc5\x8b\x16\
+/\xf0K<\xb3\x1f\x80{\xb9d\xe1\xc2\xf9KC\xa3\
+\xc2\x93\xf5\xb43e\x18\x00\x00\xd8\xb0n\xdd/\x94R\
+\xda\xbec\x07\xdd\xf7\xab\xb9>ai\x97C\xb8\x03Q\
+\x1a\xffU\xa5\xc2\xe3\x1e\xa8\xe5g\xcb\xb3`\x07\x02\x0e\
+\xf0\x9e\xdc\xcb~\xfc\x14+g\x18\x97\xf1\xe3\xc7A\xd7\
+\xae]a\xea\xd4i\xafiL\xa2~k]e\x1c\xd9\
+\x17<\xf6x\xb4\x1d\x8bG\x8f\x1c9\x91\x95Y_\xb4\
+k3\xd0\xf1\x09\x08G\x06\xcc\xfa\xa5\x93\xb3\x9a*\x00\
+\x91\x9b\x8f\x097\xe6\xee[y\x01\x22\xcd\xaf\x8b\x06\x0f\
+\x1f6l\xe0\x9f\x7f\xee:\xa1\x8eGEY\x99\xfc\xe3\
+\xc2\x1f\x97\xf7\xee\xe1\xfd\x22\x0b\x00@f\xc3,\x88\x88\
+\x8b\xd1\xa80\x7f\xee<\xe6\x03\x15\xde#\xa8\xf8\x17\x86\
+^|i\xda+\xfevt\x1f\xc64L?X\xf8\xe0\
+\x7f\xef\xbcG)\xa5\x8b\x7f\xfca1B\xf8@\xef\xff\
+\xbf\x04\x22\xa5\x88\x19\x18\xd1\xaa\x13?><\xff\xa8\x99\
+\xec\xa0~K\xc2\x9b\x8e\x1d\x90*\xc4\xadm\xeb\xb6\xda\
+\xfe\x8b\xbb'M\xba\xbb\xb2\xbc\x9c\xf9\x9a\x9f\x7fYY\
+\x91\xf5\x86\xe4\x96qc'\x05\xd0g\xcb\xf6\x05\xcfE\
+\x86\x12\xa5\x01\xe8y\xb8\xc6\x0a\x80\x1f\x14\x1e\x19l\xa9\
+\x0eS\x00\x98\xa20\x13x]g\x1e~\xf0\xc1G\xb4\
+}\xe1\x0a\xa5\xeb\xd7\xaf_=\xe4\xea\xabYs\xaf\x03\
+g\x88\xc3\xfe\xe3\xbc\x05\x0b\xd4\xe1\xf2\x06j<\xfe\xef\
+\xefQJ\x8b\x8b\x8b\x8a\xc7\x8e\x1d3\x9eA\xdf\xe6\xff\
+\xe1A\xc8\x01\xd9\xd9\xd0\xb8aC\x98|\xfb\x1d\x0f\xa8\
+\xf5\xb4j\xde\xb4\x15\xfc;\x80\x0dzM\xeb\x08\xf6\xd9\
+\xa5\xb4a&\xd4\x183c\xde\x81\x95'*I@\x1c\
+1\xe1\xe1\x09&\xed\x06\x827\x00\x00\xf4\xea\xd9m\xd0\
+\xf1\xe3\xc7N\xf2J\x80\x87\x05\xf3\xe7\xaf\xee\xd8\xb6]\
+\xec\x15\xa9iX\xff\xadh\x80YqQ=\xa8\x85\x07\
+\x5c\x1e\xb5z\x82U\x00\x22+.\x12zL\xf81\xed\
+\x8eu\x5c\xcd\xe3\xfft\x15!\xe0t\x86\xd4\x9d\xfd\xcd\
+7\xda\xc7%\xbe\x9f\xfd\xed\xd2\xbe\xbdz_\xe7t:\
+E\xbb\xa6\xa0nL\xa4c\xde\x9c\xb9\xda+\x9bU\x1e\
+\x97R!\xbb\xa9z\x9a\x0e\xa5\x94n\xdb\xb6\xf5\xaf6\
+\xedZ\xb7\xf3\x17\x97\x1c\x00\xc4\x01\xdeM<\xea\xa6\x1c\
+\x03\xbe\xf7\xde5\x05\xbe\xf8\xe4\x93\x1b+++)\xa5\
+\x94~\xf9\xc5\x17\xdf\x01\x0e\xff\x84\x95\xaf\x0d\x05\x10H\
+\x1b\xb5Q\x87\xc8\x0b\xe2\xff\xaa\xd7\x81x\x00\xac\x11b\
+\xd3\xd4\xed\x9a\xd2\xe0\x81\xfd\xaf\x1f~\xdd\xd0\xeb\x11|\
+D\xb8p\xcf\xfc\xb7\xb1\xb1\xd1\xe9\xabW\xad\xf8\x19\x95\
+|\x06\xfe\xfe\xe3\xcf\x8d\xf7\xdfuWx\xdd\xc8H\xbe\
+?|\xfb\x22\xa17\xa3\x8d(.'\xf4\x9c\xd9:j\
+\xaa\x000k\xce#(R\x00,\x22\xd8<\x0c\x1bD\
+\x00\x00\x188\xe8\x9a\xceg\xcf\x9e;K)\xa5\xabW\
+\xad\xdar\xcb\xd8\x9b\xafk\xd8 \x93\xeb\x977\xd8c\
+\xb79\x09\x00\x80]\x22\x8eMk\xd7\xafV\x07\xa3\xc2\
+U\xadT\xba\xab\x94J\xb7\x7f\x8d\xff\x8b/\xbe\xf8\xda\
+\xe9\xb4\xc7\xf8\x11\xb0;\x80\x10'\x10\xd5m$v\xf0\
+\x1e\xd8\xa0\xf5\xd3f\xb3A|l\x0c\x8c\x1e1\xbc\xdf\
+\xf9\xf3\xe7]\x94R\xeaq\xb9\x95\xac\xac\xac\x16<B\
+\x5c\xbf.\x07\x04[\xf7\xe5V\x12\x97\x02\x98\xe0\xf3\x0a\
+\x80\xe7C+\x01 \xe0s\xff\xd3\xd2\xd3\x1a\xaf^\xbe\
+d\xfd\x98\x11#\x86\x09\xda\xb6R\x00\x06\xbe|\xed\x95\
+\x19o\xeaE\xde\xf7Z0\xf3\x86\xe9\x9aU+\x7f\xba\
+y\xc4pG\xff>\xfd\xa0~f&\xd6\xa6\x19=x\
+\xbc\xcch\x81y\x01\xac\xdc\xe9\x94H\xb0\x0a\x00\xd3\xc4\
+f\xf3\xb4@\xae\xcd\x06Y\xdbh\xff\xe8#\x8f<N\
+)\xa5\x15\x95\xe5\xeeI\x93o\x9f\xe4p8B\x00\x00\
+\x1a6h\x00\xa0_[\xd5\x06'1!6t\xe9\x8f\
+\x8b~R\x07\xa1\xb2\xb2R\xa9\xac\xaaTd\xdf\xc0\x94\
+]\xbcH_x\xf1\x85\xa9\x0c\xad%P_\xc6!\xc4\
+\xf7\xad7\xdf\x14\x80\xa8\x11d_c\x04\xa0o\x9f^\
+\x8d\x0e\xec?p^\xad\xff\xd5\xd7^\xfd\x1f2p,\
+\xd1\xb1\xf4\xda\xb2\xa8\xc1\xe6\xff\xb7\x14\x80Y\xdb<O\
+Xy\x8ff\xd3F]~\xe2\x0d\xfeI\x00\x00\x0f\xdc\
+u\xd7\x83\x9e\xeaJ\xda\xa5\x93\xef\xf4d?6\x88\xc0\
+\xeb\xc6J\xe5\x09;Q=D\x1f\xdc2a\xc2\xad\x85\
+\x85\x85\xda2\xb3,{\xa8\xec\xd1\x7f\xb7p\xe1\xdc\xb9\
+K^|\xe2I\xe7\x1b/\xbf\xac\xbe]\x88\x097\x9f\
+&\xca\xc3NK\xd54\xde\x13\xc2\xfa\xa3\xcbSS\x0f\
+\xc0\x8a\xe8\x22/\xc1*]M\xb3K\xbe\xf3\x11SR\
+\x93\x93\x97\xfe\xb8x)U\x14\xfa\xd1G\x1f\xcd\x0c\x8b\
+\x0c\xc7^\xd13\x10)22<|\xc3\x9au\xab)\
+\xa5TQdZU]\xa5TVUj*\xb9\xa0\xa0\
+\xa0x\xf2\x9d\x93o\xd6\xd7\xa1\x0a\xbdf\xf5m^\xa5\
+\xe0U\x00\xde\xf3\x06\xbc#\xe7t:\xa2\xb7m\xde\xb2\
+[\xad\xef\xc0\xde\xbd\x87\x89D\x22\x18|\x80\xbb\x161\
+\xd7\x7f\xd5\x12\xff\x13`f\xedE\x02!R\x08f\xbc\
+H\x88w\x15 Dm\xec\xc0\xde=G\x0b\xce\xe7\x15\
+_\xd9\xa1}\x14\xa2\x00\xb01Q\x0d\x12\x13\x17\x22>\
+>\xf1B\xc7\x8e\x1d\xdbm\xdb\xb2\xf9O\x95'\xdcn\
+\x17\xf5\xb8\xab\x15\xc5]\xa5)\x81\xef\xbe\xf9f\xc93\
+\x8f<\x12v\xfd\x90k0Z\xf0\xedb\xc6R\x84\xab\
+\xc8\x98\x8a\xda\x90\x00\x82\x7f\x19(\xd0\xf9\x86\xc1\x1a\x83\
+~S\x0fk\xe1U$u\xca\x80H\x04\x06\x0f\x1c\xdc\
+\xee\xc3\xf7?\x5c\xf8\xd3\x8a\x15\x1b\xda\xb7k\xd7\x8e\xa7\
+\x18\xd29p:l\x90\x9c\x14\x1f\xbdf\xc5\xaa\x8d>\
+g\x8cV\xba\xabi\x15\xb31h\xe9\xd2%\xbb?\xff\
+|f\x87q\xb7L\xe0\x09\xa3\xb6\xaf\x0e\xae\x0d\x08\xb1\
+\x03!v\xdfk\xba\xea`;V.^\xb1\x86u\xfa\
+\xf6\xfe\xf5\xd7\x81\xd4\xc4z\xe9\x168\xfe\x1b \xf2D\
+Dy\xfe\x0d\xe0\x19\x16\x13\x04^\xe0Ee\x85\x1e\x83\
+\xef-K\x09\x00\xa0y\x93&m)\xa5t\xc3\xda\x9f\
+W#\x1d\x17\x09\x22h\x06\xc1\xcf'\x120\xa7\xf9J\
+\x12\x09\x9b7w\xde\xf7*_x\xaa\xab\xa8\xab\xaaB\
+\xf1T\xfb\x95\xc0\xb2\xc5\x8b\x97\xdf6vl\xc4\x88a\
+\xc3\xa0m\xeb\xd6|;\x22\xe5#R\x8a\xaa\x1c\xf12\
+\xc7\xcb\x16\xaalk\xaa\x00D.\xbfP\x03#i\xfc\
+`\xeb\x5c\x93\x88\xd0\xd0\xe4\xf1\xe3\xc7?\xfa\xd0\x03\x8f\
+\x8cJN\xd2^\x82\xe0A\xa7\x05\xebg^\x01\x83\xfa\
+\xf6N\xda\xf2\xcb/\xda1\xdb\xd5\x1e7\xadf\x0ek\
+\xf8\xf0\xc3\x0fgw\xe8\xd01\xf2\x8d7^\x87N\x9d\
+;\xf1u0?\xd5\xf2\x13;\x80d\x03\xb0i\x9a\xfe\
+\xeb\xcf\xbf\xfcNs\xf5\x985\xc4\xe3\x07\x0e\x1em\xd3\
+\xb8\xb1(\x06\xf0o\x81\xc1;2y\xfeo\x81\x95\xc7\
+$\xe2-\x00#O\x8ax\xd0N\x00\x1c\x84q\xdb\x1f\
+z\xf0\xbe\xa7(\xa5\xf4\xc5g\x9f\x9d\x01\x00\x10\x1d\x15\
+\xcd\xe3\xc4\xf1\xb0\xb6$l\x03\xa2\xdbK\xc0\x0b\x18<\
+\xf0\xc0\x03O\xaa|\xe1r\xb9\xa8\xbb\xb2BQ\xaa\xca\
+\xb55\xe7\x1f\x17,X\xf3\xd9;\xef\x85\xcd\x9f=\x1b\
+22\xd2\xf9\xf60\xfa\x98M\xb31\x05 \xf2\x90t\
+J\xf4R\x14\x00\xfb\xe3\x11e\xd3X\x84y\xa2\xf1e\
+4\xe4\x1a\xd6\xcf\x8c\xab\xdf \xb3\xae\xd3\xe1\x84\x10g\
+\x08\x08@#X\xd3&\x8d\xe0\x96\x9bon\xfe\xc7\xb6\
+\xed\xda\x01\x1a\x8a\xe2\xfdT\x14\xa5\xde9\xd9\x94\xbb\xa6\
+<T',\x1c\x06\x0d\x1a\x04\xa9\xa9\xa9|\x1d\xfc`\
+\xfb4=\xb1\x01s`\xe3\x8ci/\xbc\xec\xb7\xfb\x8a\
+\xff\xe0N\x1f\xe4\xe5\x9e>\xd3\xadm[~\x13\xd0\x7f\
+\x01\xcc\xac\xff\xbf\x8d\x83Y\x1e\x11\xf3\xf3\x8a\x00\x04\xf9\
+\x08\x807\x06 \x01q\x10_0\xd0\x19\x12\x027\x8e\
+\x1a\xde\xae\xdag\x99\x1f{\xe8\xbekSR\xd87\x8d\
+A\x02\xc2\xd6\xe3\xb3\xf4D\x13~V!\xb0\x0aB\xc3\
+\xa7W\xcf\x1e\xd9\xb9\xb9\xb9g)\xf5\xbe\x5c&\xbb\xaa\
+\x14\xd9UE\xd5%\xc3\xa5\x8b\x97l\x98\xf6\xf4\xd3\xe1\
+-\x9b7\x0b\x866\xc1\x18]\x8c\xb7u\x867X\x05\
+\x80i\x153\xcd\xcb\xa6\xb1.\xbfh@YE\xc1w\
+\x5cd\x19 *:\x0a\x9ez\xf4\xd1N\x7f\xff\xb9\xeb\
+4E \xe7\xe4\xc9s\x03\x06\xf6\xbf\xd6[B+\x8e\
+i\x5c\x03>\x04$M\xbbO\x1c?\xfe6}\xcd\x8a\
+_\xd30J\xe0\xc2\xf9\xfc\xa2\xa1\x83\x06\x0f3\x19\xc4\
+\x7f\xd3\xda\xfe\x9b\x80\x8d!\x96\x07\xfb\x89\x9e\xb1\xe5\x84\
+|E\xbc\xc2\xaf\xad\x13g\xa4\xa4$\xee\xda\xb9c\xa3\
+,{\xbd\xc3\xe2\xa2\x0b\xe7\xd2R\x92\xf9c\xc5\xd59\
+?\xc2\xc3\xba\x0db\x1c\xaf\xfb\xa7\x04I\x89\x89\xf5\x7f\
+^\xbdz\xbd\xca\x1b\x1ew\x15\x95]\x95\x1a\xafl\x5c\
+\xb7nSzrR,\xd2\x7f\xac\xbf\xaca5\xa3U\
+ \xd6\xbfF\x0a\x80!\x8a\x8eHV\x02\xcd\x0b7\xbf\
+\x1f\x9b\xf7(tHrD1\xdc\xf7\xe9\xd9\xb3W~\
+\xde\xf9\x22L\xf87m\xda\xb8\xaeQ\x93\xa6Y\x5cY\
+lN\x04\xc64\xff@\xf6\xee\xde\xb3\xaf\xab\xb2J;\
+\xfb]\x7f\xf6\x13\x93\xe6\x03\xd9\xe5\xa2\xf7O\x9a|\x8f\
+`\xc0.7\x98\x09\x8fU\x99\x7f\x0a/Q\xbb\x22w\
+\x1e@\xcc+\x22+(\x81WRm\xac\xf0w\xef\xd4\
+\xb9\xfd\x8e-\x9b\xf7\xfbU\xb8\xcf-\x9f7g\x85\x9a\
+\xc7\x0e6\xbb\xe4\x0f\x0a\xdb\xf4\xf5I\xac2\xe0i\xc6\
+\xe6\xd7\xaa{\xe7\xad\xb7\xdfVy\xc3\xe5rQ\x97\xab\
+\x92R\xdf\x19\x02kV\xac\xda\x9c\x10\x1f\xc7\x06\xb71\
+\x05\xc0\xa6c^8\xfb\xcc\xcc\x0b\xd0\xd5w)\x0a\x80\
+\xb7\xea\x04L\x82z\x01\xfc0\xcf\x82\xef\x04O \xe8\
+\xdf\xb7\xef\x90\xc2\x82\xc22L\xf8_~\xe9\x85\xd7\xc2\
+\xc3\xc3D\x83\xc3+\x18\x96\xe0\xbav2\xd3R3\x0b\
+\xcf\x9d/\xf4\x8b\xb9j\xf9\x99\xc6\x18\xf9g\x93\xdfy\
+\xeb\xcd\xff\x11\xe3\x89@\xc1@M\x84\xd2\xccJZ\x95\
+\xa9m0\xc3Ed\x99\xb0\xf1\xe1\x9f\x8b\xac\xa4\xc8\xb0\
+\x00\x00\xc0\x8d#\x86\x8f/\xbepA;\x8bO\xe6>\
+\xd6\xf1\xc8\xc3\x0f<\xee\xcb*\xd9\xbdq\x1fv\x09X\
+]\x05b\x84\x9f\xf0}\xe3eD\xf3fo\xbbe\xe2\
+-\x15\xa5e\xe5*\x97(\xb2\xffU\xf5\x9d\xdb\xb6\xed\
+J\x8a\x8f\xbf\x82\xa3\x8f\x99+o\xd6W\x91\xfc\x18\x0c\
+BM\x14\x80h0T\x05 \xb2\xea\x98\x17\x80)\x00\
+\xb5,;\xb8\xfc5\x00\x00\x0c\x1bz\xed\x8d.\x97\xcb\
+\xb0\x07\xf3tnn\xde5C\xae\x19\x0dz\x10MC\
+\x84\xd6(2*\x12\xb2{\xf7qn\xf9\xf5\xd7?\xd4\
+\xba\xd5O>\xf3\xe7\x07\x88\x14\x00\xa5\x94.Y\xb8p\
+\xc3\x90\x81W5\xec\xde\xa5k\xb0\x07\x87^N\xab\xcc\
++\xbf\xcb\xd5\x06\xcf/\xd83\x949-\xf2\xf0\xf5\xb0\
+\xd7\xac\x10\x02\x00@x\x88#\xe2\xcb\xcf\xf4\x87\xc4*\
+Z\x0cG\xd6\x06\xcd\xe3v\xd3\xaeW^\xe9\xfbZ\x8f\
+d\x97@r\x00\xe8\xf6\x800\xbcC\x08\xe86\x06\x11\
+\xf0\xdd\xf3\x0a@\xc3\xb9c\xbbv\x9d\xf6\xfc\xf5\xd7>\
+\x0d\x07F\xf9\x1c\xd8\xbb\xe7Pjjr\x03\xa6/\xac\
+\x17\xc1[x+\xc5 \x92+]z\xb0\x0a@$\xd8\
+\x22\x8d\x8b\xe5\xc7\x14\x00\xaf\x0c\xcc:\x0e\x00\x00\xb7\x8c\
+\x1b\x7f\x87\xbb\xda{\xd6\x12{x\xc7\xe2\xc5?\xae\xbc\
+\x225\xbd\x01\xe8\x80\xb0\x03a\xe6Yh\xed\x11I\x82\
+\x11#F\xc0\xfe]\x7fk\xdb\x8e=\xea\xf7\xeb\xf9\xa3\
+\xc4\xd8\x1b\xf11\xd0g^|\xe6\xf9\x1bR\x13\x93!\
+59\x05\x9c\xce\x10\xe8\xdf\xaf\x1f4l\xdc\x10L\x00\
+\xc5\xad\x96\xe0\x9fR\x00\xea_\x91p\x9b\x95\x03\x10+\
+\x0e\xf6\x1a\xe3IM\xf8\xfb\xf6\xea\xd1\x7f\xef\xdf\xbb\xf6\
+\xb0B\xa7}|T\xa1\xd4\xfb\xa91\xe6\xd4\xde\x03\x07\
+\x8f:B\x1c\xd1\xde\xc6%\xbb\xe4_>TyWb\
+P\xf2\xb5Gx>\xc5\x04\x0e\x00\x00\xa2\xa2\xa2\xea}\
+\xfb\xd5W\xdaKi,\xbb\xe4\x1c=r\xb2q\xc3\x86\
+\xa2\xaf=\x05b\xe9\xf9t3|.\xe9u`\x0c\x01\
+L\xd0\x02q\xfd\xad\xa6\x03:fy\xe8\xde\xfb\x1f\xc2\
+$l\xda\xb4\xe7_f\x07\x1e\xb4\xf5|K\x0d\xc9\x12\
+\x98\x00\x00\xc4\xc5\xc5\xc0\xc7\x1f|\xf8\xba\xaa\xa1\x15\xea\
+\xf12\x8d\xd5Y\xef\xccY\x83\x8a\xfa\xb6\xa8\x0f\xf2\xce\
+\x9d\xa3\x1f\xbf\xfb\xfe{\xf7M\xb9;.-%\x15>\
+z\xff}\x986u\xaah\xa0\x83\xb9\x0f\x06.\xa7W\
+a\xd5.\xdb\xbe\x19\x0efVL\x053\xf7\x18\x00\x00\
+\x22B\x9d\xa13^|\xf1\xc5\xea\x8a\x0a\xd9?<\x8a\
+A\x91+\x8ab\x98\x0a\xcc\xfe\xe6\xeb\xef\xfdM\xd9T\
+\xeb\xef\xfb\xf1\xdf\xf1\xd3y\x02j\x17x\xcf\xd8`\xdc\
+\x9ey\xfa\xa9\xe71\x16:r\xf8pn\xabV\xcd\xd5\
+\x17\xca\xccx\xd7J\x09X\xfej\xaa\x00\x02\x11h>\
+8\x88\x0d\x94H\x89\xf0\x03\xad\x11\xed\xd9g\x9e\x9e\xc6\
+\x13\xec\xd4\xa9\x93'G\x8d\x18~\x03S\xc6Gtm\
+\x0f?\xff6\x1f\xdb\x06\xca\x8c\xf7L\x9e|\xbb\xfa\x05\
+NE\xf6\x1d\xf9\xa41\x0dv\x9a(\xe3\x19\xc8\xbe\x9f\
+z\xde\x10\xf3\x15bJ)\xfds\xc7\x8e\xfd\xd9}\xfb\
+^5e\xf2$\x98:u*4i\xd2$\xa0\xaf\xd1\
+p\xc0[B>\xdd\xb4\x7f\xff0\x04b\xed\xb1\xe7\x98\
+\xe0\x8b<\x08\xd6k\x84\xc1\xd9}{lX\xbbf+\
+\xd5\x8d\x92\xa2\x13|\xaf\x13\xe0\xdf\xb7/\xcb\xfaW\xc3\
+o\x990a\x12R?a\x9a%\x8cb\xe0=_\x8c\
+\xd7Y^\x04\x00\x80\x1bG\x8f\xba\xb1 \xff|\xbe\x1f\
+I/\x02\xc7\x0e\x1f:se\xa7\x0e\xea\x01\xa2|\xff\
+0#l%\xfc\x18^\x97\xb4\x11\x88w\xdd\x03\xd1N\
+5\xd1\x5c\x12\x10\x026\x87\x1d^|\xe1\xc5Wx\xe1\
+\x9f?\x7f\xce\xe2\x94\x94d>x\xc2.\xd5`\xf5\x8a\
+\x94\x13\x00\x00\xf4\xee\xd5\xabgei\x99\x87R\xdf&\
+\x0ew\x15\xa5\x8a\xdbp\x80\x88\xa2\x98(\x015M;\
+,\x82z\x0f\x8c\xf4AaQ\x11]\xfc\xe3\x82\xf7\x87\
+\x0f\x1b\x962z\xe4(h\xa5\xdf\x11f\x06\xa2\xc1\x05\
+0\x0e\xb6\xa8\xdc?\x0dV\xed\x06\xda'\x00#\xcf\xe8\
+ *<<\xfa\xa5\xa9S_\xf6TW3#\xc3|\
+b]\x1b\x12\xd9\xfb\xcdE\xdf)P\xaa\xb7\xa6z\x03\
+\x94RZZZZ\x99\x9e\x99\xd9\x84\xc3\x85G\x9d\xe1\
+!\xa2\xde\xf3+e\xbcl\xe8\x94@\xcb\xe6\xcdZ\xfd\
+\xb6\xe9\x17\x9d\xb2\xa2\x94\xd2\xd3\xb9\xa7\xf2[\xb5j\xd1\
+\x16i\x9f\xe7g3\xafZd\xfd\x01\xa0v\xde\x05\xc0\
+,,\x86\x94\x8d\xfb\xb1eQEA\x18w\xfe\xb3O\
+>\xfd\x80%NYy\xa9|\xef}\xf7<\xaa\x1f\x0b\
+\xf1\xbc\x87\xe8\x038\xa2)\x07\xa4\xa7\xa66\xc8?s\
+\xee\x02\xa5\x94V\xba\xab\x94\x0aW\xa5\x22\xbb\xaa\x15\xea\
+vS\xddW)\xa9\xf7\x90H\xe3D\x00;v\x98-\
+\xa3W\x1c\xbf\xff\xfe{\xce\x0b\xcfM}\xb0o\xdf~\
+p\xe5\x95\x86\x0f\x13\xf3\xde\x10\x80q\x10E\x96\x13K\
+\xfb/x\x03\x18\x08-\x94\xe0\x07\x00@$\xdf\x11\xf0\
+Y\x0d\x1b@B\x5c,\x0c\x1d<h\xdc\x81\xbd{\xf7\
+\xe9\xa9\xafza\x94Y\xbd\xd5|\x7f_\xfc\xcf\xf7A\
+O\xf5\xc3\x9e\xcc\x99\x1e?\xad\x5c\xfdshH(\x8f\
+'\x8f;k\x9d\xd5\xcf\xbb\x99Yg\x89\xc9G\x00\x00\
+$B\xc2\xde\x7f\xff\xdd\x8fyn\xca;\x97\x97\xdf\xb6\
+m\xdb\x8eH{\x22\xc3\xcb\xb7\x85\xe1x\xc9\x0a\xc0\xcc\
+\xea\x8bV\x02xA\xe7\xe7E\x06\xab\x1c\x12\x1a\x06\xc9\
+\xc9\xc9\xe4\xa3w\xdf\xfd\x86%\xca\xdf\x7f\xffq(\xbb\
+\x7f\xdf\xde\x08Q|s5\x9f\xb0\x13M3\x07$\xfc\
+u#\x22\xe2\xf7\xef\xd9{\x88RJ\xab<\xd5\xb4\xa2\
+\xbaBq\xb9\xaa\x14Ou\x95\xa2\x0a\xed\xde=\x7f\x1f\
+\x983g\xb6\xf6\xe9j\x85\xe7\x18C\x84P\xaf\x00d\
+\xc5\x1b\xb4T\x94jJ}'\x16\xbb\xab]t\xcbo\
+\x9b\x7f\x9f2i\xf2\xf5Z\x87\xfcS\x02\x9dk\xcb\xf5\
+\xd9\xcc\xda\xff\x97Ad\xe9\xf9\xbf\x22\xaf\x00\x08!\xd0\
+\xa4yS\xc8\xccH\x87\x01\xfd\xfav\xde\xfa\xfb\xaf\xcb\
+=n\x17KiJ\xf9\xa0\xadbT\x06T\x13|5\
+0\xe8\x05\xf6@\xf8\x07\x1fx\xe8N\x00\xe0?\x0c\xcb\
+\xe0\xa5\x8b\x01\xd8\x88\xf7\xebN\xa8Q\x03\x1d\xaf\xea\x8c\
+!\x00\x00L\x9a4i\xf2\xc5\x8b\x17+\x99\xe6i^\
+^^a\xb7\x9e\xdd\xbapm\x8b\x8c1\xe6\x1d\x89\xee\
+k\xe5D ^\x98\xb1\x88\xbe\xa8\xf3\x22eB\x1c!\
+\x0eh\xda\xbcy\xc8\xfc\xb9\xf3\x16\xb0\xc4\xf8n\xf6\xd7\
+\xf3BB\x9c\x09*\x13px\xb0m\xa8K7\x22\x81\
+\xd7~6\xbb\x0d\xbaw\xed\xea\x5c\xbdr\xc5ZJ)\
+\xf5\xc8\x1eZ^]\xae\xb8\x5c\x95\x8a\xa7\xbaRQ#\
+y\xc7\x0e\x1f:\x99Q?\xb3\x19\x00\xc0\xd3O=5\
+U'\xd9\xec\x14\xc0\xb8L`\x00E\x91\xa9\x22\xbb\xa9\
+\xcc\xac\x05\x97\x97\x96\xd1ys\xe7\xae\xb8n\xc8\xb5\xbd\
+\xd4\xe5\xc2\xd4\xd4T\xed\xa0\x13\x93/\x03\xf1BSS\
+\xa8\xadzj\xd2.\xa6\xd0t\xe9N\xa7\x13\x9a6i\
+\x02M\x1a6\x84\xe6M\x9a\xc2W3g\xb5\xf8\xe0\xbd\
+w?\xcc=q\xb2\x8a\xa1,\xf5\x1e\xf5\xc6\xaf\xd8\xf8\
+\xad>7j\xbe\xf1\xe0\xd2\x15\x85z|'N\x9d=\
+}\xb6\xb4q\xe3&Yv\xa7MEL$\x07\x22\x83\
+c\xe6\x09\xb0y\x00\x00\xa0e\xab\x96W\xee\xdc\xb6}\
+\x17\x8b\xcf\xe9\xd3\xa7/\xf4\xe8\xa1S\x02,\xed\x82q\
+\xfdu8\x04\xab\x00D\xee?\xb6\xc5\xd7&x\x8e)\
+\x08\x1d1RRS\xa0O\xdf\xbeu\x97-]\xb6\xd2\
+O\x80\x5c\xf9\xc9g\x9e|\xd6\xd0y\x82\x10^{Q\
+\x83W\x10\xfc\xba-\x10\x22I\xd0\xb0\xfe\x15\xf0\xfd\xec\
+o\xbeT\x19\xa2\xdcU\xaeT\xbb\xaa\x14wu\x95&\
+\xfc\xfbw\xef\xde\xdf\xb0~\x03\xdd\x9a\xdd\x94\xc9wN\
+\xae\xae\xa8\xd2\x98O\xffM\xf8@\x94\x80\xca\x8f\x9c\x97\
+ \xcb\xf4\x83\xf7\xde\x9f;f\xccM\xfd\xae\xf4\x7f~\
+\x0c\xb2\xb3\xfb\xc1\x0d#G\x22<\xa0c\x06+\xcd\x8f\
+\xa5[\xd5\x19(\x98\xd5\x8by+fukuI6\
+\x09\xda\xb7k\x0f\x03\xb2\xb3\xa1~Z*\xac[\xbe\xbc\
+\xc3\xec\xaf\xbf~=\xef\x5c^\xb5\x8e\x9ejdOu\
+\xe5u\xe3 \xeb,\xbc\xbe\x8c\x1e\xaa++=\x94R\
+\xea\x91eZ\xed\xf1\xee3Y\xbd|\xd5j\xee\xfd\x11\
+\x95\xa78\x1e&\xbc\x00\x8a\x8c\xa1\xe8\x07\x00\x00\x12\x91\
+\xc2\xbe\x9e5\xeb\x0b\x16\xaf\xd3'O\x15\xf5\xe9\xdd\x8b\
+\xf7\x04\xc0\xa2=\x83\xd0\xb3\xb4\xa55P\x00\x81\xfe\xac\
+<\x01\x02F\xc5\x00\x09IIp\xd3\x84q\x09\xeb\xd6\
+\xad\xfbM\xed\xf8\xf1\xe3G\x8f\xbe\xfe\xfa\x0c\xf6\xbc?\
+\x7f\x19\xa2{%SU\x08\xeaW\x82\xb1N\x1b\x5c\xa4\
+\x97\x9f\x9f\xaaYs\xb7\xe2\xa6.w%e\x83H\x9b\
+\x7f\xdb\xb4-&2\xb2\x9e/\xbb\x0d\x987\xca\x06\x0f\
+\x1a\x9c}\xea\xe4\x893~\xa1V\x10\xb9\xc7\xa7\x05~\
+U!\xfe\x9e\xfc7_}\xb3\xd0\xb7\xa9\x89\xdc2n\
+\x1c<\xf2\xd0\x83\x0c\x19\x0cV\x13\xb3\xa4Vyj\x13\
+\xb0zEmcx\x19\x184,,\x04^\x9d\xfe\x12\
+d\xf7\xed\x0b7\x8c\x1c5\xe0\xd5\xe9\xd3?<\x7f\xee\
+\x9c\xeek/~\x8b\xcf\x90\x9a\x99\xeb\xfbgi\x1c\xc5\
+\x15\xbd\xe5\xf7\xc82\xbdi\xcc\x0d\x13\xb2\xfb\xf6\x1dR\
+]Q\xed\xa6\x94\xd2\x8a\xeaJ\xa5Z\xf6~\xd9\xf3\xfe\
+{\x1e`\xb6v\x1b\xf8\xcb\xcc\xdb\xc5\xe4\x82\xdf,\xc4\
+?\x07\x00\x80\x89\xe3\xc7O.-)\xd6v.\xe6\x9f\
+?W\xda\xbbw\xf7n\x1c}E\xf2\x85y \xbaq\
+\xa9-\x05`\xa6\xed0$\xd9\xfcZ0$,2\x02\
+&\xdez{\xca\xe6-\x9b\xffR;<\xeb\xf3\xcf\xe6\
+\xf6\xec\xd9%\xa9c\x87\xf6*\xe2\xfez\xbc\x96\xde\xe6\
+\xdb\x9bm\x07\xef\x96M\xe2\xfbd\xb4\xba\x85S2\x0e\
+\x96\x7f\x8f\xff\xf8\x9bn\x1a\xa7c$\xc5\xe5=\xeb\xdd\
+\x07+\x97/^\x1f\x16\x1a\x12\xc3\x8c\xbb\xba%T\xab\
+#=-\xb5\xfe\x92E\xfe\x93\x87\x8c\xf1\x00\xf6\xa7g\
+]*x\xc2\xc3\x86\x0d\x1b~\xff\xe0\x7f\xef<y\xf3\
+M7&L}\xfey\x88\x8c\x8a\xf4\xa1\xa3\x8d)\xe6\
+Bc\xe9\x97$\xfcv\x9b\x1dbcb\x83)b&\
+\xf0l\x1e\xcd\x08H\x92\x97\xb4\xa3G\x8c\x82a\xd7_\
+o{i\xeas\xb7\xae^\xbdz\xe5\xd9\xb3g9\xaa\
+xW\xf5\xb5\xfd\x19\x02\xda\x1bVm\xd5\xe7LZ\xd1\
+\x85\xa2\xe2\xe1#\x86k\xdf\x00\x1c=b\xe4\x18\xf5\xd9\
+\xc5\x8a2\x99RJ\x0b\xf3\x0bK\x12\xd3R\xeas}\
+0\xf3\x8a\xb1\xa9./\xec\xbc!de\x02\x00\x00\x9a\
+6m\xd4f\xdd\xfa\xb5\xdbT|\x0a\x0b\x0aJ\xfa\xf4\
+\xe9\xd9\x87\xa1\x1f&[\x80\xa4\x19\xf8\x82\xd6\xb2\x07\x80\
+\xad\xb7c\x9a\x0f\xedh\xd7\xee\xdd\x1b\x1f>r\xf40\
+\xa5\x94\xba\xdd\xd5\xae\x97_|\xfeQn\xeb\xac\xbf\xac\
+\xcf\xcd'\xea:\xbfo\xbf6Q]0\xff4@g\
+Y\xbc\xa7\xfax\x09\xd1\xa9S\xc7\xee\xb2\xcb\x1b9\xf2\
+.\xff0g\xbcSJW,]\xb4$:*\x82y\
+\x99\x80\xddQ\xa8\x05\x1b\x01\x00 )1Qz\xeb\x8d\
+\xd7\xa7\xebYL_\x9f\x8e)\xb9\x14\x03s\x22\xa9\x17\
+/\x96\xd0=\x7f\xef>\xfa\xd7_\x7f\xcd\xea\xdf?\xbb\
+\xdf\xf3\xcf?\x17\xde\xaem[@  \xab\xeft:\
+!4<\xdc\xf0\x1d\xfa\xd0\xd0Ph\xdd\xa2%0\xd1\
+o\x7f\x19\x87\x13\x12\xe2\x13\x0c\xe9\x16 d@`\xac\
+\x1d\x00\x80\xcdf\x83W^\x9a.eg\xf7m\xbdv\
+\xcd\xcfo\xe4\xe6\xe6\xfe\x99\x93\x93\xa3\xa3\x83Gs\xe7\
+}?~\x9e\xafN\x054!\xf7\xcf\xfd\xf9\xb9\xbe\x0a\
+\xa7N\x9e:\x97\x18\x1b\x9f\xca\xe22e\xca\x9d\xf7\xa8\
+\xcfKJK]\x94R\xba\xf8\xc7%\xcb\x99^\xf0<\
+\xcf\xf25\xc6\xef\x98\x87\xc0+\x02\xd6;\xd6\x06&%\
+%9b\xee\xdc\xef\xdfW\xf1\xcf\xcb;W:\xf4\x9a\
+\xab\x07p\xb8\xf0\xc2n\xf9\xa3A*\x00\xdeM\xb3\xea\
+\x18\xaf\x0d\xf94M\xf8[\xb6k\xdd\xfa\xe0\x81\x83y\
+\x94R\xfa\xf3\xea\x9fv?p\xdf\xdd\xddG\x0e\xbf\x8e\
+e\x16\x7f\x1d~\xe1\xf7\xa6\xf3\xefg\x135/\xe1\xf1\
+\xd2\x98011\xf1\x8acG\x8fi\xaf\x0f\xcb\x8a~\
+~\xf8\xc3\x9co\xe60/\xf1`\xee)\xeb\xe1@L\
+L\x0cL}\xfe\x19x\xfa\xe9'\x87\xfd\xfe\xeb\xafG\
+P.\xd3\x84\xdb\xcb\x9c\xe2\xb5\x02}:\xaf\x0e\x5cn\
+\x17\xbdPX\xa0\x1c9rx\xf7\xb4i\xd3\xa6_7\
+\xec\xba\xde\xed\xda\xb6\x13}\x81\x98\x05\x8d]\xea\xc5\xc5\
+AV\xfd\xfa\x90\x94\x94\xacY\x5c\x15233\xe1\xa1\
+{\xee\x87\xcc\x8cLC\x05\x0e\xbb\x03\xe2c\xe3\x02h\
+J\xd7\x1e\xcb\xe4($\xc4\xc7\x84\x0f\x1b:\xb4\xcd\xdd\
+S\xa6L\xda\xb9u\xdb/EE\x17*\xca\xcb\xcbu\
+\x94\xf0P\x8f\x7f\x17\x9fF\x1c\x95\x9ej\xba.\xbc\xaf\
+#\x9e\xf1\x1b\x90z\x98\xf6\xec\xd4\xe7y\xbc\xde|\xf5\
+\x95\xd7)\xa5\xb4\xca\xed\xa6Un\x17\xa52\xa5/\xbc\
+\xf0\xa2\x1a\x88\xf1\xf3\x1cn\xedE2\x10\xec\x94\xc1\xe6\
+t:`\xdc\xb8\xb10\xf5\xf9\xe7n9w\xce\xbbL\
+]\x5cT\xe4\xbea\xd4\xa8\xc1Do\x8b\xd8\xfa\xd8q\
+@\x95\x03\xad\xa5U\x00v\x80\xb1\x8e\xf0\xc4a?\xd2\
+\x00M\x9b7\xebX\xe6\xfb\xd0\xc2W_}>K\x22\
+$\x1c\x00\xd4e\x17^\xe8|n\xbf&\xecz7\x9f\
+\xa8y\xf4\xc2O\xf4\x16\xc8\xb1~\xbd\x1ac\xe07\xf4\
+P\xfa\xe1{o\xcf\xb4\x19\x97|D\x8aO}\x0e\x03\
+\xb2\xb3A\x92$\x90$)n\xde\x9cy\xdfQ\x03\xf0\
+\x11h\xd1\xd4@\x5cF\x94w\xf3o\xbf\xedy\xf9\xe5\
+\xe9o\x0c\x1f1rTfF\x03\xf6\x03\x92\x1a\x84\x84\
+\x84@\xcf\xde\xbd!3#\x03\xb2\xeagBrR\x12\
+\xc4\xc5\xc5\x1b\x14@JJ\x0a\xdc6n\x02$%\x1a\
+\x8f_\xb4\xdbl\x10\x13\x1dcH\xe7\xc1G\x07\xd3<\
+N\x9b=!\xbbO\x9f\x01\x8f<\xf2\xd0#K\x16/\
+\xfc\xb9\xa4\xa4\xd8\x10\xa5\xd3\xa2\xf9\xbe\x00\x9e>p\xaa\
+FOTo@\x9b\xfc\xfb\xc8\xe4\xdd\xdd\xc3\x9e\xce\xab\
+\xc2\x9c\xefg\xcf]\xb9|\xc9j6\xed\xc0\x81\x03G\
+CB\xb4\xe9\x9e\xc6\x00s\xbe\xf9f\x1e\xa5\x94\x96\xf9\
+\x8e\x95;~\xf8HnZz\x9a\x96\x8f\x88\x03\xe1\x18\
+\xff\xfb\xf9\x98\xa02#\xda+#\xa9\xf4o\xd2\xa4Q\
+\xab-\xbf\xff\xf6\x07\xa5\x94VUT\xd2Q#F^\
+\x1b\x80\x02\xe0y\xb7\xc6S\x00\xbes,\x92XC\x22\
+B\x00\x00@\x9f\xbe\xfd\xb2\xd5\x91\x1d{\xf3\x8d\xfcW\
+Tx\xeb\xed\xbb\xd7Y~d\x93\x8f\xee\x15M\x96\xf0\
+\x00\x00\xf0\xd9\x87\x9fj\xd1U\xfeD\x9f7_\x9d\xfe\
+:G8\x91\xe57\x10\x93#:\x8c\xb8\xfe\xfaq'\
+O\xf8\x03\x84X0\x90\xb7Z\x8a./\xd5=\xd3\xee\
+\xd1@\xa3\x1fN\x9e<y\xf6\xc7\x05?.}\xf5\xd5\
+\xd7^\x19w\xcb\x84\xb1Y\xf5\xeb\xb7\x00\x00\xb8\xe7\xbe\
+\xfb\xe0\xd3\x993\xc1a\xb3A\x1d\xa7\x13\xa2\xc2\xc3!\
+<<\x02xHNN\x86\xdb\xc6M\x80\xf44\xe3\x11\
+\x87u\x9cu 1\xc1\xebl\x10B\xb4\x9fM\xdb.\
+\x0f`\xb7\xdb \x22\x22\x1c\x22\x22\xc2!2,\x1c\x9c\
+!!\xbe\xb2\xce\xf8\xbe\xfd\xfa\xf6\x7f\xfc\xa9'\x1f\x9a\
+9\xf3\xf3\x8f\xb6m\xf6\x1f\xa0\xc9\x83N\xb0\x99\xfe\xfa\
+\x03w~\xab\xaf\x8e\xa1b\xa0\xaf\xf7%\x1f\xf6\xe3/\
+\x05\x17\x0a.>\xf0\xc0\x03\x8f\xf9\xba\xe3\xf8k\xe7\xce\
+=L\x01:f\xcc\x98q\xcc\xd8\xab\xe3i_\xbbj\
+\xd5zJ)\xad\xf2\xd5\xf5\xf5\xe7_}\x1a\x1d\x1d\xa5\
+\x92\xc5lI[\xe4\x1d\x98y\x04\xbc\x02\xd0)\x01\x00\
+\x00\xbbM\xaa\xf3\xc1{\xef\xbd\xaf\xe2=\xf6\x861\xa3\
+\xd41\xe1\xf07\xfb\x05}(\xa8h\x0bm0\xee\x8c\
+f\xf9\x87^w\xedpJ)\xdd\xb3g\xef\xa1\x96\xcd\
+\x9b\xb7d\xf8\x8c-\x8b\x0973\x0d\x908<\xd0\xe8\
+\xac6\x97\xba\xef\xee{\xee\xf73\x99\xde\xe0<\xf5\xd8\
+C\xcf\x98\xe0 R\x00X\xff5HLL\xcc\xf8\xe0\
+\xbd\x0ft\xaf\xa1\xaa\xad\xab\xff\xabW*\xd3k\x9f,\
+\xe3r\xe9\xef\x03\x87c\xc7\x8e\x9dZ\xbe|\xf9\xa6U\
+?\xad\xf9\xe6\xd3\x993\x9f\xbej\xe0U\xd7\xb7n\xd9\
+\xbcUbbb\x8c\xcd\xc6\x1eU\xe0\x05\x9b\xcd\x06}\
+{\xf6\x82\xa6YM\xe0\x8a\x94\x14\x88\x8f\x8f\x87\xd8\x98\
+X\x88\x8b\x8b\x87\xe4\x84$h\x90\x9e\x01\xcd\x1a7\x81\
+N\xed;\xc2\xa0A\x83\xe0\xd6\x89\xb7\xc0\x97_~\x09\
+\xf7?\xf8 \x00\x00\x84E\x84\x854n\x9cuE\xaf\
+^=\xb3\x1f~\xe8\xa1\x07\xbe\xf9f\xf6\xc7\xcb\x97\xaf\
+\x5c\xb9\xeb\x8f?\xff.*.*\x17\xe1\xe9_\x0ba\
+>\xd9\xc6\xe9?\xddR\x9fZB\x91}:B\xa6\x0a\
+\xf5~\x97\x8f\xdfqI)\xa5\xdf\xcd\xfef~\x8b\x16\
+MY>\x83\x86\xe9\x19\xf5\x8f\x1d:\x9c\xab\xe6\xd9\xbc\
+\xe9\x97m\xe0=B\x1c\x08!\x0e\xdf\xf8B\xdd\xc8\xc8\
+\xf8?\xb6\xed\xdc\xcd\xd6w\xd3\xd81\x03}\xd5\x88\xf8\
+\x1d\xe3c\xdeS\xc0\x84\xdfj\x9a\xa0I\xf9\x0d7\x8c\
+\x1eWYY\xe1\xa1\x94\xd2{\xef\xbd\xfb\x8e\x98\xe8H\
+l\x7fL\xad(\x00\xb5B\x1e\x08\x00P\xdf5e\xf2\
+\xb0ijY\xc5\xf7\x83\xdbo\xbf\xe3\x9e\xcf>\xfb\xf4\
+\xbd\x8f?\xfep\xe6\x94)w\xdf\x05\x00n_~;\
+SN-\xcb\xd6\x07\xfe4B\xf5\xc9Z~\xac\x1c\x1d\
+\xd0/{\xf0\xaaU\xabVH\x0e\xbb/\x83/\x1b\xf5\
+\xc0]wN\xbe\xef\xa3O\xbfx\xcf\x97\xd7\xc6\x955\
+\xab\x9b\x9f\xd7\x12_&\x85-?`\xe0\xc0k^\x9e\
+>\xfd\xc5\x8e\x1d;\xb6\xd5g\xa7\xa0\xce\xae\x88vO\
+}\xf7D\x98\x8bE\x0a|}\xc1s\xe8\xa1\xbc\xa2\x02\
+$B\xdc\x85\x85\x05%EE\xc5\xc5y\xf9\xf9\xf9\xf9\
+\xf9y\xe7\x0a\xf3\x0a\xce\xe7\x17\xe4\xe7\xe7\x9d\xcf+\xa8\
+(\xaf(v\xbb\x5c\xa5\xd5U\xd5\x95U\xee*Wu\
+\xb5\xdb%\xcb\xb2B$\x9bd\x93$[\x88\xd3i\x8f\
+\x08\x0bs\x86ED\x84\xc5\xc4\xc6F%%%\xc45\
+h\x98\x95\x10\x1e\x16\x9eX\xedr''%&$\xc4\
+\xc7\xc5\xc5\xc5\xc7\xd7\x8b\x8e\x8e\x8e\x0e7AG\xc3\x1a\
+TBR\x00\x0a^\x9f\x8e2\xb9\x88\xae\x0c\x93\x1f|\
+,@\x08\x00\xa5\xa0(2P\xc5\xfb\xee\x88\x0a\x87\x0f\
+\xed?6m\xda\xd4\x17f\x7f7\xef+\x7f-\xc4\x0e\
+@\x15\x00P\xae\xec\xd4\xb1\xd3\xda\x9f\xd7n\x0a\x8f\x8a\
+\xaa\x03\x000\xe8\xeaA\xd7\xad^\xb9z\x09\xf8\x05\xc8\
+\x03\x00\xd0\xb0A\x83\xc6\xbf\xfc\xf2\xcb\xafI))\xf5\
+\x00\x00~\xff}\xf3\xde\xee\xdd\xbb\xb5\x03/\xef\xf2n\
+7\x8b\xaa\xca',\xff\xf8\xf9\x9b\xf8X\xd1\x9f\xe6\xef\
+\x9e\x91\x8f\xd96d\x00\x80\xa6M\x9b6\x9d\xfd\xcd7\
+\xf3\xdaw\xec\xd8\xea\xd9'\x9fx\xf8\xa5W^}\xcb\
+\xf7\x9c\x95W\x85I\xd3\xea\xa2\x94*\x10\x04\x98i7\
+\x91\xcb\xa3\xfe\xd5Fd\xc6\xf4\xe9\x8f\x9e=u\xbax\
+\xca\x94;\xef\xe2\xeaV\x97\xf2\xf8\xb5R$\xa0\xa7\xdb\
+\xee\xcb\xe3\xa0\xb9o6\x9b\x0d\x08!\xd0\xbf_\xbf\xc6\
+\xa7ss\x8bx\xfbY]Q\xe6\x1e\x7f\xd3\xa8\x09\x0c\
+\x1e\x98w\x83M\x05P\x8d\xca\xf5Y\xef\x11\x10R\xe7\
+\xb9g\x9f~\xf2\xf8\xf1c\xc7x\xdb\x87\xd9C>`\
+\xc8N\x0f\xf8I\x03\x1b\xef2\x04\xc5\xa9n\x96\x13\x10\
+TVU\xd2\x8a\xca\x0aZV^F/\x96^\x94K\
+J/z.\x96\x96\xca\xa5ee\xb4\xbc\xa2\x8cVT\
+V\xd0\xca\xcaJZUUI\xab\xaa\xabiY9z\
+(\x93\xa1O\xda\xda<;\xdd\xd1\xcd\x8a\x14\xaew\xfc\
+4\x89\x9b\xef\xabS\x04Y\xa1\x8a\xcbC)\xf3\xb9\xb7\
+\xdc\xdc\x93y\xd3\xa7O{54\xc4\x11\xcb\x0c/\x01\
+\xed<\x7f\xff\x8a\xd0\xa8Q#oR\xcb\xadZ\xbe\xfc\
+g&?\xbb\xaf\x1f:ul\xdf\xad\xba\xb2B\xdb\xfc\
+\xf5\xf4\xb3\xcfL\xe5xX\xf5r1\x97^4\x0d`\
+\x96\xac\x03*g\xf0\xa6\x09\x00\xf9\xe6\xabo>\xa3\x94\
+\xd2\xa7\x1f\x7fl*\x00\xa81\x18~\x1a\xac\xf3&h\
+\x0d\x82\x80\xc1\xcc\xf3\xd5\x9f\xdd\x87\x904i\xf2\xa4\x07\
+\x96.[\xf2K\xd7\xee];3\x84\x13\xad\x9bb\xf7\
+\x98{\xc4\xbbW\xcc\xf8\x01df\xd5\xaf\xb3}\xeb\xb6\
+\xbf)\xa5\xda\xf6NJ)-\xbaPpq\xf0\xc0~\
+C\xf5\xb9Q\xb7\x09s\xc5X\x8f\xc8\xca\xa5\xd3\xe1\x95\
+\x98X/\xf5\xe5\x97\xa7\xbfy\xf6\xecY\xffk\xa0\x94\
+_\x17P\xe5\x82]J\xe4\xa7\x0dz\xa5\xa0/\xc9\xbd\
+\xb8D59\xf1\xbd\x8f\xc0\x15\xa9E\xf0\xae\xce\xab+\
++\xbe\xb9:\xbb\xca\xc2\x871\x14\xbeg\xdcCC\x8f\
+\x99\xcfr+T\xf7\xaa5\xa5\x94^,*(\xfb\xe8\
+\xfdw>NKKe\x83\xa1\x04\xfc\x1fze\x8c\x0a\
+\xd1\xa6\x87o\xbd\xf1\xc6;j\x1d]:w\xee\xad/\
+\xe7\xb7\xbc7\x8e\x1e9R\xcdW]YU\xdd\xa4Y\
+S\xf5\xb5]\x95\x070\x03(\xe2\xed@\x9e#\x06\x11\
+72S&M\xba\xaf\xb2\xac\x94\xbe:\xfd\xe5gB\
+\xfd\xdf\xca\x14\xc5(j\xb4\x0a\x80\x05(\xd8\x8am`\
+$\x04\x01\x00\xd2\xabg\xd7>\x93\xef\x9c\xf4pdd\
+$\xa3\x91\xb5|V\xc2\xc3\x13\x93\xef\x0c\x9f\xd7[9\
+!\xf0\xe5W_\xcd\xa7\xd4\xbb\xc7_]\xee;w&\
+\xb7\xa0s\x876\xec\xf1\xdd\x98\x85\xb7\x9a\x8ba1\x11\
+Q^;\x01\xdd\xd9\x80\x90\x9e\x9e\xd6\xe8\xa5\xe9/\xce\
+8u\xfaT\x05.H\xfe\xff\xf9\x14\xa3\xec\xf2\x01D\
+c\xb9\x80\x00\xc9\xcaG \xb0V\xd4\xb9\xb8>\xb0\xc9\
+\x94f\x8a\xfa\x03y\x02+\xafx\x95\x87\x16\xa3\xe1=\
+\x04Y\xa1\x1e\x8f\xac\x1d\xf9\xae\xc2\xc5\x8bE\xee\xd7_\
+\x9f\xf1n\x93\x86\x0d\xd8\xf7\xe8\xd5\xb1\xb5\xf9\xac9\xeb\
+\x91\xfa\xe2H\x9a%u\xec\xd8\xe1\xdd\x83\xbf\xe0\x87\x1f\
+\x962,j\x10\xb4\xfb\xef\xbd\xebQ\xb5\xdd5k\xd6\
+\xad\xe3\xf8Y\xc4\xab<\xefX\x099/\x03\x22\x05\xa0\
+y\xbc\x00\x00\x9d;w\xea\xf1\xf5\x97_/\xb8\xea\xea\
+\xc1C\x18\x9c\xf8\xf8A\x8d\x14\x00\xcf\xf4\x22/@\xcd\
+\xab.\xf7\x11\x02$$1\xb1^&70|gX\
+$\xad\x08\xc0\xe3`\xd0\x88\xbdz\xf5\x86\x99\x9f\xcc|\
+F\x1d(\x8f\xef\x08\xe8\xbd{v\x1f\xbb\xb2]k\xf6\
+\x03\x1e,aT\xe0-<\x86\x03\xd6\x7f\x11n*-\
+\xf4^\x0a\x01\xb8z\xe8\x90\x96\xaf\xbc\xf2\xca\xf4\x93'\
+N\x16\xe9\x05\x0c\x17\x5c\xfd\xc6a\x91x\xf2\x82\xc6\xd7\
+!P\x0bB\x05`Z\x8a\xea\xac\xb6\xean\xb0\x15\xfa\
+p\xd1O\x00\xf4\xd3\x00E\xf1\xf7\xcc\xc3z\x0d\xda4\
+FA\xa72\x05\x05y\x17_|q\xda\xdb\xdd\xbat\
+n/\x18Cl\x8c\xb0\xa9&d\xd4\xcflV]]\
+\xe5V\x14J[\xb4h\xd1\x86\xa9\x87\x1ds\x00\x00x\
+\xe7\xed\xb7\xb4W\xd4o\x1e7\xee6$/\xcf\xbf\xac\
+\xb1\x12\x19:\x91\xcb\xcf\xf3\x17{\xcf\xd6\x0b\x00\x00a\
+au\xea\xb6m\xdf\xae'!D\xfd\xa8\x06\xe6\xa5^\
+\xb6\x9d\x80\xfcO\xb7\xee\x0fFA\xb6\xb2\xfaf\x04\xd1\
+\x95U\xb5\xb9\xd3\xe9\x80'\x9fxr8\xcf,\x9b\x7f\
+\xdb\xf4g\xe3\xac\xfa\x19\x0c.\xbc\xf0\xf3\x9a\x92M\x13\
+)>\x91F6\x1bt\x02\xe0\xf5P\x9a4k\x06\xe3\
+&L\x80\x1e\xbdz\xd5\x7f\xfa\xd9g_\xdc\xbbw\xef\
+\xa1\x92\x8b\x17uxc6\x1d\x9f\x10\xb0\x02ge\xfb\
+\x03\xf1\x0c\xf8\xc8\x02\xab~\xf899?]\xe1~\xcc\
+Y|\x0a\xf5\xber\xab*\x02Y=\x96\x8b\xeb\x83\xda\
+\x9e\x8cH\xfe\xc1\x83\xfb\x8f=\xf7\xec3\xaf4o\xd1\
+\xb4\x11\xe8\xc1.\x18\x17\x91\x22Wy\x94\x00\x00L\x9a\
+|\xc7=\x94R:w\xce\xdcy\x08\xcf\xb2\xbc!-\
+\xfeq\xc1rJ)\xcd\xcb\xcf\xbfP7&F\xfd\xae\
+\x80\xc8Z\x8b\xbc\x02\x0c\x1f\xb3|fi:/\x93\xf9\
+\x1c\x1a\xcf{\x974\x05\xc0\x90\xe6]q\xde\xaacJ\
+\x81\xb5\xa2<\xa1xA3\x0b4\xf2\xc4\x80\x1e=z\
+4;s*\xb7\x94e\x98\x9f\x7fZ\xb9)\x22\xd4\x11\
+\xc3\x0d\xaaj\x8d\xb19\xbf(& \xcak\x96_B\
+\xfe\xda\x00\xbc\xfb\xeb\xdb\xb7o\x0f\xf5\x1b4\x80,\xef\
+\xf1`Q\xdf\xcf\x9bs\xdf\x89\x13'\xd6\xe7\xe7\x17\x18\
+_a\xa3\xd4R\xc0/}z/\xb6\xf6\xeck\xb6~\
+\x81e\xd6\xe5\xd5\xd2\x8c\x1c{\xb8\xda\xd4\xe7\x1e\x9d\xc0\
++\xfew\xf3\x0d'.y\xc1\xe3r\xd1M\x9b6n\
+|\xec\xd1\x87\x1f\x8e\x8e\x8e\x8a\x03=\xb0|\xc1Zx\
+\x91@\xea~\xecg\xc3~\xfey\xcd\x06J)MK\
+\xcfh\xc2\xd4\xcd\x8f3\xd8$)b\xf7\xee\xbf\xf6S\
+J\xe9\x173g~\x83\xf0\x166\xc5\x15\xf1\x0d\xefi\
+\x98)\x04\xec\x9a\x975\x95\xaf\xed\xa0\xe79-\x0f\xbd\
+D\x0f\xc0\xcc\x85\x17\x09\x0a/\x00\x22M\xc6\x0b\xbb\xc8\
+\xfaJ\x00\xba\xddX\x10\x1b\x1b\x1b\xf1\xe7\x8e\x9d\x07Y\
+\xc6\xf9\xe6\xcb/\x96J\x84\xb0\x9b\xdb5\x01d\x08e\
+&\xccfJ\x81WZ\xd8@\xab`\x98\xaa\xb08\xa8\
+\x1b9z\xf5\xe9\x0d\x0d\x1adA\xdbV\xed\xaf~\xff\
+\x9dw\xdf?|\xf8\x90~C\xbc\x05\xd4L\x01\xe0>\
+\x06\x9a\x93\x89\xd5\xb1\x9e\x88\xae\x94\xa2\xb7\xf4\xea\xa6\x1d\
+vV\x223\xc7r+\xb2\x8cZzJ)=v\xf4\
+\xe8\xc9\xf7\xde{\xf7\xa3\xfe}\xfb\x1a>\xab\x8b\xf0\xa2\
+\x95\xc7(2V\x1a\x0f\x85EF$RJ\xe9\xf7\xb3\
+\xbf\x9b\xc3\x0c\x0f?\xc6\x04\x00 9%\xb9~Q\xf1\
+\x85\x12J)\xed\xde\xb3G?\x0e/\x00\x1c'\xbe\x1e\
+\xacn3\x03k\xd6'\xd13\x83\xb2\xa0\xb5\xa0\x00\xcc\
+\x08,r\x95\xcd4\x19\xe6\x15\x88<\x0a\x1bx?\xfa\
+\xa8Yr\xbb\xd3\x01\xcb\x96.]\xce2\xf2\x86\xb5\xab\
+g\x0d\xea\xdf\x97\x17v\xde\xc5\xc7\xdcvL\xabb\xbf\
+@\xa73\x982\xc3< ^1@\x5c\x5cl\xc6\x98\
+17\x8d\xfd\xec\xf3\xcf\xbf:\x97\x7f\xbe8\x00if\
+I H3D\x0d.\xa9J<\x1f\x17\xb1Pd\xdd\
++\xd3f\xf5\xe4\x9e9[6k\xd6\x17\xdf\x8f\xbdy\
+\xec\xf8\x84\xf8\x84L\x9e&&<\xc4\x1b#\x9e/\xd5\
+1\xc7\xf8Q\xfb\x82\xf0\xc4[n\xb9\x83VW\xd3V\
+\xadZ\xb7\xe4\xdac\x05\x9b\x00\x00\xf4\xea\xd3\xb3\x1f\xa5\
+\x94\xe6\xe4\xe4\x9c\xe4\xf03\xe3\x01\xf6Z$\x17\xbc\x02\
+\x08\xc4\x10Y\xc9\xa2F#z\x09\xcb\x80f\xc8\x89:\
+-\xfa\x05\x22T\x98\xb6\xb63?\xe8xeg\xf8~\
+\xf6\xf7\xef\xb0L\xf4\xc5g\x1f\xbdu\xef]w@V\
+V\x03\x15\x7f\x95(*\xf0\xca\x00\xc0H\xd4@\x15\x1b\
+{\xcf\x0f\x08\xaf\xc4\x0c\x8aLP\x1f\x8f\x1b\xa4gf\
+4\x1d6b\xf8\x8d\x9f\xce\xfc\xfc\xeb#G\x8f\xe5\xb8\
+\xdcn\xf6\x04+\x83\xa4*\x8a\xefLc\xde\xc0\xb3\x81\
+;c\xb1\x00\xe2\x07\x5c\xa0\x0f\xc9\xc1\xba\xf8\xb2\xa2W\
+\x06\x18\x9c:u\xea\xccW\xb3\xbfYx\xf3\xf8q\xe3\
+\x06\x0e\x1a\xd4\x02\xf9\x90\x0aK7;\x88\xc7Hto\
+6f\xecX\x00\x00\xc0\xe2E\x8b\x96\xcd\x9b=g>\
+\xd3>6\xa7\x06\x00\x80['\xde2\x99RJ_\x7f\
+\xe3\xf5\xb7\x98\xfc\x0eA\x1b\x81\xfcDF0PA\x17\
+\x19\x18\xed\x9a\xd6\xd0\x03\x10\xb9\xf7\x98\x95\xe6\xa3\xdf\x98\
+u\xe7\xeb\x15\x09\x0b[\x97\xfa\xd3\x06\xeb\x9e\xfb\xee\xbd\
+\x8be\xa6i\xd3\x9e\x9b\xda\xa7w7\xc8\xccH\x030\
+\x0a$\xaf\x04\xcc\xfa&b\x22\xb3g\x22E\xc1\xd3\x07\
+k\x93\xcd\xc7+\x13\x1d\xd4\x09\x0b\x8b\xef\xd0\xb9s\xcf\
+\xc7\x9e|\xf2\xb9\xa5K\x97\xff\xb4o\xef\xfe\x83\x17\x8a\
+\x8a\x02\xd9\x95S\x03\x10\xa9\x05\x85\xf9\xdf\xeb\xf2\xbb\xa9\
+\xfe\x5c=\x0cJ\xcb\xcb\x5cG\x8e\x1c9\xb6n\xfd\xba\
+M\xd3_\x9e\xfeFvv\xdf!QQ\x91)|\x1f\
+\x991R\xff\x9a\xd1\xdb\xcc}\x16)X\x8e'\x89\xe6\
+QFFE\xd6[\xb4\xf0\x87\xd5\x03\xfb\xf7\x1f\xc8\xb5\
+\xcf\x0b \x00\x00\xbc\xff\xee;\xefSJi\xe7\xce\x9d\
+\xd5}.\xea2\xa3\xc8\xd0\xf1\x16\x9d\xc7\x0d\x15\x5c\x84\
+\x8f\xcc\x8c\xa9\xf0Gk\xb0\x15\x98\x80q\x8b#;@\
+\xecvF\x8d0\xcc3\x16Tb\xcaLy\xb6.~\
+\xfb\x22\xdf\x96ZN\xe9\x97\xdd\xaf\xf7\xc2\x05\x0b\xd7\xd7\
+\xad[\x97\x00\x00<x\xdf=\x8f\xfd\xef\xbd\x0f\xd8\x17\
+{T\x5c\xf8\xed\xbd\x18\x9e|\xdf\xb0m\x98,\x1dD\
+i\xd8\xb6N\xbe\x0c\x9b\x8f\xc5\x07\xd9\xfa\xec{F\x08\
+\x01J\xdd\x80@\x9d\xb0\x88\xa8\x8e\x1d;t\x1c8 \
+\xfb\xca\xd6\xad[7\x8b\x8a\x8a\xba\x229)%M\xa2\
+Jj|bRhll\x0cV\xec\x1f\x81\xd3g\xcf\
+\x9e?~\xecX\xce\xf9\xbc\xf3\xc7\x8e\x9d8qh\xe3\
+\xc6\x0d\x7fl\xda\xb8~\xeb\xc5\xe2\x8b\xe7\x04ET:\
+\xa8[\xcc\x15\xf0\xf3\x0cO\x1fl\xbb-\x80\x9e\xb6<\
+\x1fa\xe3\x07L\x1e\x0a\x00J\xa7.\x9d\xbb\x5cqE\
+Z\xc3\x1f\x7f\xf8q\x1e\xa5\xd4\x05F^\xd2\xf1\xebO\
++\x97\xaf\xa9\x9fY\xbf\xfe\xe8175\xfb\xeb\xaf\xbf\
+\xdc\x94R\x1b\xf3\x9c\xc5\x11\xddJ\x8e\xf4\x8d\xc7\x09k\
+[\xc4\xa3\xea3\xec9P\x1a\xf8V`U\x01\xa8\x15\
+\xb2B\xc3#\xc7\x961\xdb\xcf/\xea(\xff\x9c\xbfV\
+\xf7\xdbS\x00\x90#\xa3\xa2\x92\xf7\xef;\xf8Wjj\
+R=\x00\x0a\xb7O\x9c0\xf9\xf3/\xbf\xf9\xd4\x97\x9f\
+%>[\x17\xdb6\xa6\x1cX\x9cX`\x19M\xbd\xe7\
+\xdf\x13\xe0\x07\x99/+\x81^\xe9\x89\xe8\x87\x01_\x06\
+\xc0\xdf7\x0dl6\x1b\x84\x84\xd4\x81\x8a\x8ar\x08\x0f\
+\x0f\xcf\xf8\xf6\xdbo\xb3\x1a5n\x92\xfe\xcdW_^\
+\x91\x94\x92\x92\x9avEjJ\xbdz\x09)\xf1\xf5\xea\
+%\xc5\xc5\xc5\xd5K\xaa\x97\xe0\xe4\xeb\x08\x16\xaa\xaa\xab\
+!/\xef\x5ciQQQ\xfe\xf9\xf3\xe7\xcf\xe4\xe5\x9d\
+?}\xee\xec\xb9\xd3g\xcf\x9e9s\xe4\xd8\xb1\x93\x07\
+\x0f\x1e<r\xe8\xc0\x81}\x00P\x1d\x1e\x12\x06\xe5\xd5\
+\x15\xa2\xfe\xa9\xc2\x0e\xcc5o\x00D\xca\x95\x1f35\
+MA\x9eam\xb3\xe5l\xe0\x1d'%4\x22,\xb6\
+\xaa\xbc\xb2\x92RZ\x05z\xc5\xc4\xb7\xab8\x9d\xce\x90\
+\xd5\xabVn\xcf\xcb\xcb_r\xc3\x98\x1b\xd5\x17\xccl\
+L\xbd5\x19k\x0c\xb0\xfe\x8a\xca\xa3\xf2I)\x95\x03\
+\xc0C\xab\x8c\xb5L\x22!\x10!)b\x5c\xcc\x83\x10\
+\xdd\xab\xaf}\x10\x02 +\xbeAZ\xbfa\xd3\xa6>\
+\xbd{v\xab\xac\xac\xa0c\xc6\x8c\xbeq\xf1\xe2\xe5\xea\
+\xfa-\xef\xb1\xb0\xc0*\x04+\x10\x094\xc6\x08j:\
+\x0b\xbc\x06\x161$\xcf\xe4*\xe3\xf3\x1e\x01\x9b\x9fm\
+K\xad\xd3\x90w\xe4\xf0\x11\xe0\x08\x09\x81\xef\xbf\xff\x0e\
+\x00\x00l\x92D\xb2\x1a7\x8ak\xd8\xb0Q\x5c||\
+\x5c\xf4\x99\x93\xa7\x22\xc3BC\xebF\xc5\xc4DE\x86\
+\x87G\x84\x86\x87\x87:\xeb\x84\x848\x9c\x0e\xa7\xddn\
+\xb7\xdb\x89D(\xa5\xa0\xc8\x8a\x5c-{<nW\xb5\
+\xcb]UU]QYUY^Uy1\xefl\xde\
+\xc5\xa8\xa8\xa8\xe2\xbau#/\x1e<t\xb8\xe4\xf8\xb1\
+\xa3\x85gN\x9f-Ap\xe6\x81\xe5\x0d\x96\x06<\x8d\
+X\xeb\x89YP+\xab\xaa\xd6\xcd\xb7\x81\xf1\x1b/\xd4\
+\xaa\x90H \xe6K\xf6ZIK\xcfh\xf0\xf6\x9bo\
+|\xfa\xfa\x1boL\xdd\xb6u\xeb\xaf\xe0w\xe7\xb11\
+\x12y\xd5\x18\x98\x19\xa0@\xf9J\xc37\x18\x05\xa0\x16\
+\xc6\x82\x19j:\xffL\x14\x88\x10=\xe3\xe7(h`\
+\x840\xf3\xfe\x0f>\xf8\xe8SJ)\xcd\xcf?_~\
+\xfd\xf5C\xaf\xe6p\xe5\xe7\xfb,\x9e\x04\xf9\x052\xb7\
+\x0f\xe4Y \xe9<.V\xf3B\xbe\x1f<\xdeX}\
+\xac\xd7\xf6o\x83\x8a\x07\x8f\x1b\xfbW\xd4\x17\x9e>\x18\
+\xff\x98\x95\x11\xcd\xab\xb1y3\xc6\xab\xd8\x1c\x1c\x0bP\
+\xb3\xe9\xd0\xbdg\x8f\xbew\xddu\xe7\xa36\x9b]=\
+t\x81\x0f \xaaxbq0^\xbe\xd8~\x8a\x82\xce\
+X\x9f\x09\x18\xfb\xac\xb5\x15L\x0c\x00L\x104cb\
+Qp\x02K\xb7J\xb3\xb3\xc2\x7f\xdf=\xf7>L)\
+\xa5\xe7\xce\x9d-\xec\xdb\xb7w/\xf0\x03FL^x\
+\xd4<l\x19\x91Pb\xcc\xc5+?\xf6\x9a\xcfo\x15\
+\xa0\xe1\x85\x19\x1bt6/pe\xf8{5\x8d\xcf\xcf\
+\xd3\x86\xdf1\xc7[\xe3`\x00SV\x980\x02\xe0\xf4\
+\xc4\xca\xf2\xb4\xb1\x0a\xa2J\xe0\x0f\x14\x8bx\xd2L\x99\
+\xf0<g\xc6\x8f\xa2\xf1\xb4\x817\xf2O\x00\x00\xea%\
+%^\xe1t\xd6\x89\xf1\xf5\x1bk\xcf\x8a70A\x96\
+\xb8k\x91\xe2\xe3\x15\x84!o\xb0\x0a\x00\xb3\x9a\x22\x22\
+\x07\xdbA\x89\xcb\x87iX\xcd\xa2\xf5\xcb\x1e0\x90R\
+J\xcf\x9f?\x97\xdf\xae]\xeb6\xe0\x07\xd1@c\x0c\
+h\xc6X\x22\x8b\x8a\xe1\x88yBV\x1a\xd9\x8a6\x22\
+\x01\x12)5\xb5o,\x88\xcaZY]\xb3\xb1\xe2\xf1\
+\xb3#iX\xddf\xcf0^0\x13\x5c3\x9c1F\
+\xc7,f \xfc\x18\x882\x10)\x05u\xce\xaf\x82H\
+\xf0Y\x9e\xc0\xe8b\xb0\xda\x82\xfcf\xf4\x17y\x18\xb5\
+\xbe\x0c\xc8?\xc7\x84\x1bC\x0a\x9bF\xe8\xf2\x13\xffz\
+*$'$ePJ\xe9\xf9\x82\xf3\x85\x19\xf5\xaf`\
+_\xf9\x14\x09\x1f/0\x980\x981'\xd6\x1f3!\
+\x0d\x94\x811:\x88\x98\x98\x15r\xf6\x99h\x5cx\x05\
+\x81\x09\x8d\xd55\xa6\xb0\x08\x88\x99\x96\x17\xb8@xD\
+D73\xa1\xc0\x04\x1b\xcboC\xf2\xf1\x02\x8d\x09\xa4\
+HP\xcd\x04\x1f3\x02f\x9e\x9c\x88F<O\xf1\xf2\
+\xc2\xd3\x80\x1f_+\xda\xd6X\x01\x88\xac\x0c\x00\x1e\x98\
+P\x11\xe3\x83\x1a\x0aS\x0f\x9b\x8f\x0d\xf2\xf0\xf5\xaa\xf9\
+\x14I\xb2\xd59}\xe2\xd4\x09\xc9I\xec\x1d;w\xec\
+p\xea\xc4\xe9\x1c\xa6\x0e\x09\x8c\x81:\xf5\x19\xdf\x1e\x8b\
+\x9fY \x88\x05\x09Ic\xf3\xb3u\xb2u\xb3u\x05\
+B#\x1e\xd8\xba\xf8\xc0\x1f\xd6/\xd12\x98\xda\x076\
+\x0f\x1f\x10C\x97\x8b\xc0?F\xd83\x8cNX:\x8f\
+\x1b[7\xfb\x1c+\x87\xf1\x85\x19\x1ef\xed`\xcb\x89\
+<\xbd\xf86\xc1$/\x86\x1b\x86\x8f\x9a\x97}\xce\xf3\
+\x0e\x9bW\x14\xbc\x03\x934\xb6\x1c\xff\xdc\xc0\xff\xc1\x04\
+\x01\xd9\xa3\xba\xd8J\xd4k\x9e\x98\xec@\x8a\x22\x9e\xbc\
+\x90\xf0\x84\x04\x00\xa0\x04\xc0F}G\x86\xad^\xb9j\
+\x89Kv\xd9\xdb4o\xd7\xba\xb8\xb0\xe8\xb4/\x8f\xea\
+n\xb1\xcbaV\x83'\xca\xc7\x82\xc4\xd5)Z\xb5\x90\
+\x98\xe7\xc0]\xf3\x0a\x81o[4\x80<`\xb4Q\xd3\
+E\x0c\xc7\x8e\x0b\xdfOV\x99\x99)\x0e6/?\xe6\
+X\xbf\xac\xfa$\xa2?\xc6\xf4\x81\xd0\x013>\xaa\xa5\
+\xc3V\x05D\xfd0\xc3\x07{f6\x1e\x98\xd2\xb72\
+B\xac\x11d\xfbd\xa6LD8\x8b\x84\x9f\x97\xcb\xa0\
+\x80=#\x9fmX\xb3\xce\xbe\xbf\xbc\x954C\x8a\x15\
+(Q\xa7\x88*\xfc\x8f>\xfa\xe8\x0b\x11\x91\xa1Y\x1d\
+:\xb6o\xf5\xff\x94v6;w\x1dE\x14m;\x11\
+\x02!EH\xccx\x08\xde\x81d\x14\x84\x18\xe4\x91\x18\
+ \x9e\x87\xf7A!\x0c\x22E\x09?\x22\x03\xc4\xc06\
+\x13\xb7\xd9^w\xed\xea\xbevI\xd6\xbd\xa7\x7f\xaa\xaa\
+\xab\xabv\xd5=\xa7\xcf\xe7\x7f\xfd\xfd\x9f\xdf\x16y\xe4\
+\xd1\xb2\xda)\xdbY\xc6\xb4\x8cN\xdd\x1b\xcf\x16\x90\xe6\
+H\xb9&n\x98e\xad\xfc\xbe+\xac\x06\xac)\x8bA\
+\xf7r=\xea\xd9\xd6\x9c<6P2\xf3\x9f*\x9b\xad\
+\xef\xd6\x7f\xf3\xc8j#e\xa5\x0eS\x12\xb1Gm\x1c\
+O\xbe\xa9\xcb\x8a\xb5X\xd0\xd8\x9e\xdd\x82\xe3nc\x15\
+b:\xe4ZR\x16\xe5Y\xec\xb5d@\xbd\xaf\xa9\x05\
+\xda\x0b\x8c\xb1>s\xc2\x1a\xf0h\x7f\xb5\xd6Z\x9f\x7f\
+\xfe\x9b\xaf~\xf7\xdb\xdf\xff\xfa\x0f\x7f\xfc\xd3\x17?\xfc\
+\xf0\x8fo\x0b\xcf\xed\xc4\xad/\xbf7y6~jk\
+s\x9b\xd3\xbc\x96>\x0b,\xce#hL\x19\x88\x9f7\
+Y\xa4e\x86t\xd8)\xf308-\xd3\xd2.L\x0e\
+\xe6?7\xfbfs\xa7\xf1\x04\xb6\xd4\xa5\x8dmt\xb2\
+m\xea\x956lq\x93\xbf\xf79n_\xd3\xee\x96\x5c\
+\xcdG\x0c\x1c\xae\xc9\x82\xca~\xcb\xf3\xba\x19\xf9\xb6$\
+|\xfd\xcb_|\xf6\xab/\xbe\xfc\xf2\xab\xbf\xfe\xe5\xeb\
+?\x7f\xf3\xcd\xd7\x7f\xfb\xee\xbb\xef3[M%\x1d\x0d\
+\xd0\x90{r\xfc\x93\xee\x93\xfclcFK{\x12\xf5\
+\x9b=Y\x8a\xdf\x1cf\x22\x0f\xab\xc8,S\xdf\xd8\xeb\
+\xb4n\xf6YF\x9b*\xa1\xd3\xfe5\x00z&\xd3Y\
+\xe0\xdc\xcckzM\xfci\xfb\x9c\xdf\xee\x81\x19?\x93\
+{\x1bs\xef\xf5\x7f\xccQ\xe0T\x86\x0a\xd9\xc6\xde\x18\
+TK\x95\x9f\xff\xe4g\x9f\xbd\xfc\xe9\xa7\xff\xfd\xf1\xdf\
+?\xfe\xe7m\x1bK\x1d\xde\xd8\xa21\xcd(,uY\
+\xc26\xe3\x9a\xa3\xb7~\xca\x98\xb2\xcc\x0b\xf9l\xc0\xb1\
+\xd0G\xe77\x00z\xc6Q'\xa2\x5c\xeb_\xeb\xd1\x06\
+&\xc3t6`\xa7\xfd\xdaz\xe8?-\xe3\xd9MJ\
+\x03\x93\xb6\xaf\xb7\xb6\xa2n)'A\xdc\xfc~\x9a\xc7\
+uM?\x837\xe9\xbe}(\x00\xa4r\xcc\x02\xa9\x18\
+\xdb9\xc76\x88\x01\xf0b\xbd\xfd\xbb\xeco\xe9\x93\xf5\
+\xfe\x11Y\x1e}<e\x22\x93\x97zY\xd0\xb65>\
+ \xeaa=\xec\xdb\xd7v\x13\xd1\x02\xa1\xe9\x98|s\
+\x8f\xa6\xcc6e\xde\x94u\xaa6&\xc03\xbeM\x9f\
+\xa9\xad\xf1bE\xd4\xf6#\xe7\xdd\xfc\x94\xdd\xe3-\xb9\
+L\xfa\x9d@v\xf2\x93\xd4a\xf2\x17\xca\xcck\x8b3\
+\xb3\xdf\xbb\xf6\x0f\x01\x00:\x90\xa1\xb2U\x006\xb6\x11\
+7\xeb\xe6\x11a\xcbF\x0d\xc9OF|-snd\
+\xa6n\xd3u~\xda\xcd\x1b\xd3oI[\xeavS\xc1\
+\x98s\xd9M\xc3f\xb7\x9b\xb5\x19 [p\x18\x805\
+\xbd\x97\xb4g\xdf\x14X\x1ckcNI\xaa\xf9\xcb\x92\
+\xb1\xdc\x8b\xbc\x9e\xf432\x19\xcd\x07[[\x1d\xf3\x0c\
+\x00|Z\x94\xd9\xd7\x0d\x05\xf9\x9b\xcf\x0ca\x9b\x98c\
+&\xe3\xd9\xe2\x88\xf27\x80\xd3\x8c\xd4\x10\xb4\xf1\xa5C\
+o2\x10\xcb\xbe%\xfdM\xeff\xafS\xd6%_\xab\
+f\xc87\x81\xc0\xfa\xd8n\xc1~\xcal\xd3\x9e\x92g\
+\xfe{\x8d17\xe0\xc1>\xea1\x01X\xa3\x16\x07\xe4\
+q\x9b\xc0&\xff\xb3\xfe\x9b7\x1d9\x8f:\x1e\x89w\
+%M\xf1\xe6\xe0\xcflF*e\xcf\xf5O\xce\xdf2\
+|\x8e3\xa7\xb6Lt\xcal\xc9/\xe769o\xd6\
+\xe3f\xbd\x5c\xf3\xe6\xb5\xec;\xed\xc3\x92>\x82\xb2\x8d\
+\xcb~\x06\x9c\xad\x85}\xa6\xdf+\x91\x97<\x8c\xef\xc9\
+1\x09\xc0\xd3~\xe7\xf8m\xff\x94\xd3\x00\xcdt\xa3\xee\
+ml;\x08ek\xcdu\xd8\x98\xcd\xef\xd9\x8a\xd0\xe4\
+\x93n@\xe3\x1dM\x07\x81l\xe3[\xc6k\xd9\xe4\x86\
+,\xe8N7@\xe8\xa8M\xae!\xf2\x84\xacf\xf8l\
+\xb7\xaa\xa8\x81\x9cm0\xa9e\xa5\xe4\x9b\xed\xf9<\x9d\
+\xc1\x9ck\x98\x80\xae=O7\xe7\xe3~30\xf3\xbb\
+\xad%e\xa6\xac=\xc6\xecgvo\xfe\xb9m\xd2\xd6\
+\xc29\xa6Ckg\xb9O~\xe6[&\xd7\xec\xb30\
+\x8e>\xc5\xf6\xc9\xb7o\x92F%.\x94\x8b3%)\
+\xdc\x94\xa7\xa2\xc9\xc3\xd0\x99?\x07^K\x9b\x19\xc4t\
+\xde\x01\xb2\xe4\x9aki|r.3a\x0b\xea\x16p\
+\x96\x1d\xf2\x06a\xda\x85\xba59-3S^\xe3\x91\
+`\xd22\x22\x01\xc8x\xda\x9e\xb7le?\xe1r\x8c\
+\xd9v\x02\xd0&{\xad\xf3\xa3\xd4I/\xce;eh\
+\xab\x10N\xfeE\xf9MV\x0b\xea)\x89=\xf5\x9f\x83\
+\xb6\xf7\x00\x18\xfc<\xe8r{:\xec\x14\xfc\xb9a\xc6\
+?u\x98\x1c\xa1]\x9bsg\x1b\xf5\xe3\xdcW\xa5\xdd\
+\xf8\xdd\xb47\x00\xb1\xcc1\x05F\xb6\x13\xa4\xa8\x83\x05\
+I\xfb\x89\xf2b\xe87\xa0\xcd\x0cd\xe0\xcb\xb9\x1ck\
+\x94ki\xf7Q\xf68\xf2\xbf\xa1\xc9\x87\xd3\x86\xef\xfe\
+\xd7\xeb\xe5\xb6\xe5ZZ\xa5\xb0\xd6\xe3\xfe\xd1\xc6\xdck\
+\xc6K\xeah\x8f\xc3M\xe6\x15\xd9&\x12\xc1\xac-?\
+\xdbY\xfd\x13\x92\xef,\x94\xd7VN\xb5\xc07\xe3\xb5\
+\x0c\xbb\xc7\x9d\x80\xc8x5\x14\xdem\xf6~@\xd3\x9b\
+/61kL\x1b\xb8\xed\xd5\xf4iv\xca\xb1\xa7*\
+f\xe2\x95~`\xc1\xd3\x92\x82\xd9\x7f\xd3\xf4\xa2W\xda\
+\xf6\xf4\x22\x92\xbd\xd70\xfd|\xe1z\xd6r\x1fh\xd5\
+\xcc)\xd9\xdd^3\x86N/\xe6M\xbe\xf8\xff\xc1O\
+>\x05\xd8dY\xff\xc6\xa9\xd7\xea\xc6\xb4\xcd\x9f\xb2i\
+k?\xa1\x7f\xab\x02\x9e\xdd\x8c\x5c\xf7\x09M-\xabM\
+:\x9d\x82.\xf5\x9a\x0e\xb5\xe4w\x03L\xf2J\xd9\xb9\
+\x07\xe6\x88k=\xee\xa39\x9d\xeda\x03\x0d\x8e\xc95\
+\x9a\x9c\xe4{\xf2\xbb\x9cK^6\xd7\x12\x8be\xe7\x06\
+\xdeY\x11\x98\xcd\xccg2\x09m\x1e\xd4/\xdbS\x8f\
+\x9c\xdf\xf8\x1b\xf8^\xd3.E\xc8\xd0\x90z\xf7\x9d2\
+\xd5\xe6{\x93a\xe8\x90-\x1b\xe7\xa7\xf1h2N\x19\
+\xb5\xe9:9\xd1\x94\x81O\xba$\xc0\xb4y\xa7,}\
+\x93}\xe8<\xd3_\xde5=\xb8\xde\xa6\xfbD\xcc\xb6\
+\xd4s\xf3#\xe8\xdd\xf0k\xfd\x9b7\xd7\x92A\xd2@\
+\xc5*\x88\xbc\xe9\xda\xfc\x92\xf2\xdf\xc4\xbcV\xb14=\
+n\xf6\xa7\x01\xf2\xbb\xeb\x8f=\x07\xd0P\x8c\x8b\xa2\xa3\
+\xb6\x80\xe7[M\xb6\xe1\xb69\xedE\x90\x06B\xdc\xf0\
+\x15\xd7\x8do\xe3\xc5\xac\x96kmY\xd4\xe6\xb7\xc0\xce\
+\xb5pm\xf6iN\xcd\x8a\xc0\xb2|\xae\xf9\xcd\xf2\xbd\
+0\x10\xde<\xed\xee=\xe9\xb4\xff\xe6\xd0)oJ\x02\
+m\xce\x89xc\xcf~\x9e\xb0=Ai\xad\xc7\xbd\xa2\
+>\xd3)\xca\x94A\xa0\xfbd=\xda\xc4\xd6\xdc|x\
+\xa1\xfd\xa3*\x80\xe9u`n\x8e\x01\x85\x95_\xa9\xdc\
+\x1a\xc60\xb88\x87|\xf8\xdd\x1c\xc3\x82?e$\x9a\
+?\x9b]\xf3z\xda\xb0\x06\x06ky\x065\xe7\x9a\x02\
+!\xf92cQ\x17^O\x81edA\x91\xf29\x96\
+\xba\xd9\x9e\x9f\xfc\xa6}?99e\xdc\x04\xd9\x1e\xcf\
+j\xe5\x04\xeeL\x06m\x0e\xfbMv\xa3\x1b\x9bL{\
+}E\xf6\x08\xc2\xca\x07s\xda\xc9\x91\xd9\x9e\x19\x9e\xe3\
+N\x8fO^\xaesy\xb8\xd6\xe3k\x99\xed\xd5\xcb\xb5\
+\xdc\xf1v\x864\xc7\xa6\xf3M\xfa\xec\xf1y\x97\xb7\xad\
+\x81\xf6`0\x1aX\x12\xe0\xd8\xc6\xfd\xe3\x9f\xde6'\
+a;3\x1f\xe7S\xf7)[\x1apq\x5c\xb63 \
+\xf7\xddx\xae\x95\xdf\x8dW{\xd4\xc9\xaa\x83rs\xef\
+\xb8\x07\xf4+\xda\xc6\xf6t\xcf\xcb\xfb\x08\x8dZ\x1c\xb5\
+\xc0\xb6*\xe6\x9ax\x10\x88\x0a\xd0\xc0S\x90\xe7\xe7\x94\
+\xd5\xcd\xc9,\xb0\x1a\xc0X\x867\x84\xe7\x5c3\xd0\x89\
+\xa7\xf1h\xd7\xed^\x8a\x05D\xabj&\xf4\xb6j\xc6\
+\xf4\xfd\x90#\xa4\x96\xc5,pH6\x86<\xd6z\xe4\
+\xd1\xd6\x90A\xc8\xfb\x16\xcfd6\xf3\x05[\xdf\xa6\xe9\
+\x94_\xcb\xbe\xb7mS\x02\xb26\x03b[\xbf\xf9\xfc\
+S\xd9\x7f31\xc4\x9aN\xe2e\xb0Z9\xdc\xc6o\
+y7\xa5c{\x1b\x90\x00\xc3\x92\x92|\xa8C3\x1a\
+\x8d\xce\x0cD=M\x06\xd7t\xda\x8c\x1cs\xb2a\xe3\
+k\xceB~f\x17\xcbD\xd4\x87<\x8dw\x93\xd7l\
+Oj\x992\xdb,\x08O\x09\xcbt\xe3\xfa\xa6\xb75\
+s^~ok\xb1G\x8e)\xa7\xed\x11\xd7\xd4@\xfd\
+F\x87w\xb2>\xe6m@{\x83\xcd\x8eZf_{\
+\xde\xda\x8ehr\xe1V\x8e\xad5\x1bcjg?\xc7\
+\x98\x1em,\xfbH-\xd0[\x80\x91\xe7\x04\x88-[\
+\x99N\xa7\x80k\x800\x95\xa4\x94a\x01c49s\
+~\x9f\x9c\x99m7\xa0\xb7u\xb3\x84\xb0\xc7NO`\
+n}\x80\xd5\xcbi\x9f\x19\x1b\xd3+\xe1\xcd/\xd3\x0f\
+\xec&\xe5{G\xc3?\xf4$\xe0\xa9\xdc\xc8\xef\xcf\xa0\
+=+\x8c\xfd}:m\xd6x\x91\x0c\xa1\xe9dm]\
+\x0c\xae\x0d\x86\xa6\x93\xad\x87\xc8>m|\xea\xb6\x9d`\
+\xca\xde\xb7\x15A\xf2&\xa5\xbc\xb5|\xfd6&\xfb\xb9\
+.\xea\xca\xb1\x9b\x07A\x9d\xffND\xbdr\x0e\x83\xdc\
+\x9e\xcd[`\x9f\x12B;\x94\xd6\xf62y\xf1\x9eA\
+\xfa\x88\xad\x8d\xdf\x0d\x84\x1a8\x91\x17\xf5\x9f\x12\xd6\x03\
+\xe5c\xc0=\x99\x8f\xeb\xf8Wu\xec\x98\xae\x19\x85d\
+\x81D'\xc9\xb9\xd3\xa2\x8d\xb79\x9e\x113\xd4Z\xe7\
+\x9bz\xcdF\xc6+\xe7\xddP\x02\xe2Z~\xb2\xf2\xe6\
+\xcf\x84\x9d\x88\x15\x9de\x97\xb4\x1f+\xb8\xf4\x83v\x88\
+\x87\xb6\xb2\xf79\xf6\xf7\x16\xb07{\xc8\xa0\xe6\xfe\xbc\
+Y\x8f\xff\x89\xc7\xe6m\xba\xf0Fi\xcb\xa0\xe6\xa3y\
+S\xd0\xe6e\x95e\xfeb\xebl\x09\xf8\x99s\x18W\
+d\x8f\x01\xf3z/\xaam\xf0T>5\x04M`\xb1\
+\xf1\x0di\xa9\xdfM\x19E\xe3\xb2\x8f\xba/\xb4\x99n\
+t\x02\xcan\xbc\xad\xbf\x01\x879\xc0S\xc8>\xc8\xa2\
+n\xed\xe9\x04?\xd3\x0f\x1aH\xac\xf5>8\xae\x18O\
+\xfel#\x08X\xfbMeD \xb3\xca\x84>\xb1\xd6\
+\xfb\xc1\xc5\xf9i+\xfb\x19A\xb9\x8dL\xff\xe6c\xa6\
+\xbf\xe9F>9\xf6H,_\xa6\x179\x1a\xfa\x983\
+7\x04\xb3y\xbb\xbfe\x14\xd3\xcd\xb2\xb2\xf18\x19\xd7\
+\xe4\x9b\x9e\xac^\xf8\xb6\xe2d\xb7\x060S\x85\xb2y\
+6\xf0:\xe9\xcc1m\x0d\x96y&G~\xd6\xc9&\
+\x1bL\xb2\x9b\x0c\x03p\xeeu\xda\xcf*V\xa3\xb6\x96\
+\xe9\x11\xb5\x11}\xcb\x80\xec\x94\xdd[\x95\x92\xfc\x1b=\
+}\x13p\xff\x04\xb0\x8d\xb7\x92\xe6\x84\xc0{\x0e\x17\x9e\
+\xf3\xda\x0b\x1e\x947!\xdfD7(<\x95\xa3)\xb3\
+\xcde[\x1b\xbb\xf5\xb1q\xcf\x06\xb3\xf1o\x01\xde\xc0\
+\xb2e\xd9\xd4\x83Y\xaee\xd1MV\xe2\xa6\x8e\xd4w\
+\xe1\xd3\xecB\xc060\x5c\xeb\xd17\xe8\xbf\x8dNv\
+H=N|R~R\xea\xf8\xccO\xcc\xd4\xaf\xc5\xd1\
+\x9e3\xdd\xf4\xbc\x22;\xa0\xc3\xcd~!c\xb8\x00s\
+r\xde`\xcc\x05\xdc\xbc\x86\xdc\xfa\x19\xb8\xd3|3\xda\
+M6\xb2\xbe\xf6\xf7\x04w\x9b=\xf50\xa2\xf3M\xb6\
+hNj\xd7\x0c\x10\x0b\x98I\xaf=\xce2\xcf\xfe>\
+ed\xd35\xf5\xb0Cg-[R\xffv\xb6\xbe\x81\
+\xc2\x04B\xa7\xfd\xdf\xb2\x9a\x8dMO\x03\xa4$\x82\xbd\
+U\xdd\xb9FV1S\xec\xe5\xf7\xeb\xcc\xbf\xa9=s\
+\xb5`y1\xf4\x916:5g\xb2\xeb\x94\x91\xfaX\
+\xc97\xf1\xb9\xa9R\xdak\xa8v\x12\xf0\x96N`D\
+b\xe0\xb7w\xf4'\xfe\xe6\xec-K\x90\xd74\x9f\xf2\
+n\x80m\x22[\x97e\xfai\xcc\x14\xc8\x0d\xb0N\xe3\
+m\x1c}\xc0\xd6kz7\x1d\xa6J\xd3d\xb4\xcc\xbf\
+\xfbN\xb1\xf5\xd4\xfe\xfc\x0f4\x22\xb1\xfe\x12;\x91\xd8\
+\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\xc2\x15\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5cr\xa8f\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x0aIiCCPsRGB IEC\
+61966-2.1\x00\x00H\x89\x9dSw\
+X\x93\xf7\x16>\xdf\xf7e\x0fVB\xd8\xf0\xb1\x97l\
+\x81\x00\x22#\xac\x08\xc8\x10Y\xa2\x10\x92\x00a\x84\x10\
+\x12@\xc5\x85\x88\x0aV\x14\x15\x11\x9cHU\xc4\x82\xd5\
+\x0aH\x9d\x88\xe2\xa0(\xb8gA\x8a\x88Z\x8bU\x5c\
+8\xee\x1f\xdc\xa7\xb5}z\xef\xed\xed\xfb\xd7\xfb\xbc\xe7\
+\x9c\xe7\xfc\xcey\xcf\x0f\x80\x11\x12&\x91\xe6\xa2j\x00\
+9R\x85<:\xd8\x1f\x8fOH\xc4\xc9\xbd\x80\x02\x15\
+H\xe0\x04 \x10\xe6\xcb\xc2g\x05\xc5\x00\x00\xf0\x03y\
+x~t\xb0?\xfc\x01\xafo\x00\x02\x00p\xd5.$\
+\x12\xc7\xe1\xff\x83\xbaP&W\x00 \x91\x00\xe0\x22\x12\
+\xe7\x0b\x01\x90R\x00\xc8.T\xc8\x14\x00\xc8\x18\x00\xb0\
+S\xb3d\x0a\x00\x94\x00\x00ly|B\x22\x00\xaa\x0d\
+\x00\xec\xf4I>\x05\x00\xd8\xa9\x93\xdc\x17\x00\xd8\xa2\x1c\
+\xa9\x08\x00\x8d\x01\x00\x99(G$\x02@\xbb\x00`U\
+\x81R,\x02\xc0\xc2\x00\xa0\xac@\x22.\x04\xc0\xae\x01\
+\x80Y\xb62G\x02\x80\xbd\x05\x00v\x8eX\x90\x0f@\
+`\x00\x80\x99B,\xcc\x00 8\x02\x00C\x1e\x13\xcd\
+\x03 L\x03\xa00\xd2\xbf\xe0\xa9_p\x85\xb8H\x01\
+\x00\xc0\xcb\x95\xcd\x97K\xd23\x14\xb8\x95\xd0\x1aw\xf2\
+\xf0\xe0\xe2!\xe2\xc2l\xb1Ba\x17)\x10f\x09\xe4\
+\x22\x9c\x97\x9b#\x13H\xe7\x03L\xce\x0c\x00\x00\x1a\xf9\
+\xd1\xc1\xfe8?\x90\xe7\xe6\xe4\xe1\xe6f\xe7l\xef\xf4\
+\xc5\xa2\xfek\xf0o\x22>!\xf1\xdf\xfe\xbc\x8c\x02\x04\
+\x00\x10N\xcf\xef\xda_\xe5\xe5\xd6\x03p\xc7\x01\xb0u\
+\xbfk\xa9[\x00\xdaV\x00h\xdf\xf9]3\xdb\x09\xa0\
+Z\x0a\xd0z\xf9\x8by8\xfc@\x1e\x9e\xa1P\xc8<\
+\x1d\x1c\x0a\x0b\x0b\xed%b\xa1\xbd0\xe3\x8b>\xff3\
+\xe1o\xe0\x8b~\xf6\xfc@\x1e\xfe\xdbz\xf0\x00q\x9a\
+@\x99\xad\xc0\xa3\x83\xfdqanv\xaeR\x8e\xe7\xcb\
+\x04B1n\xf7\xe7#\xfe\xc7\x85\x7f\xfd\x8e)\xd1\xe2\
+4\xb1\x5c,\x15\x8a\xf1X\x89\xb8P\x22M\xc7y\xb9\
+R\x91D!\xc9\x95\xe2\x12\xe9\x7f2\xf1\x1f\x96\xfd\x09\
+\x93w\x0d\x00\xac\x86O\xc0N\xb6\x07\xb5\xcbl\xc0~\
+\xee\x01\x02\x8b\x0eX\xd2v\x00@~\xf3-\x8c\x1a\x0b\
+\x91\x00\x10g42y\xf7\x00\x00\x93\xbf\xf9\x8f@+\
+\x01\x00\xcd\x97\xa4\xe3\x00\x00\xbc\xe8\x18\x5c\xa8\x94\x17L\
+\xc6\x08\x00\x00D\xa0\x81*\xb0A\x07\x0c\xc1\x14\xac\xc0\
+\x0e\x9c\xc1\x1d\xbc\xc0\x17\x02a\x06D@\x0c$\xc0<\
+\x10B\x06\xe4\x80\x1c\x0a\xa1\x18\x96A\x19T\xc0:\xd8\
+\x04\xb5\xb0\x03\x1a\xa0\x11\x9a\xe1\x10\xb4\xc118\x0d\xe7\
+\xe0\x12\x5c\x81\xebp\x17\x06`\x18\x9e\xc2\x18\xbc\x86\x09\
+\x04A\xc8\x08\x13a!:\x88\x11b\x8e\xd8\x22\xce\x08\
+\x17\x99\x8e\x04\x22aH4\x92\x80\xa4 \xe9\x88\x14Q\
+\x22\xc5\xc8r\xa4\x02\xa9Bj\x91]H#\xf2-r\
+\x149\x8d\x5c@\xfa\x90\xdb\xc8 2\x8a\xfc\x8a\xbcG\
+1\x94\x81\xb2Q\x03\xd4\x02u@\xb9\xa8\x1f\x1a\x8a\xc6\
+\xa0s\xd1t4\x0f]\x80\x96\xa2k\xd1\x1a\xb4\x1e=\
+\x80\xb6\xa2\xa7\xd1K\xe8ut\x00}\x8a\x8ec\x80\xd1\
+1\x0ef\x8c\xd9a\x5c\x8c\x87E`\x89X\x1a&\xc7\
+\x16c\xe5X5V\x8f5c\x1dX7v\x15\x1b\xc0\
+\x9ea\xef\x08$\x02\x8b\x80\x13\xec\x08^\x84\x10\xc2l\
+\x82\x90\x90GXLXC\xa8%\xec#\xb4\x12\xba\x08\
+W\x09\x83\x841\xc2'\x22\x93\xa8O\xb4%z\x12\xf9\
+\xc4xb:\xb1\x90XF\xac&\xee!\x1e!\x9e%\
+^'\x0e\x13_\x93H$\x0e\xc9\x92\xe4N\x0a!%\
+\x902I\x0bIkH\xdbH-\xa4S\xa4>\xd2\x10\
+i\x9cL&\xeb\x90m\xc9\xde\xe4\x08\xb2\x80\xac \x97\
+\x91\xb7\x90\x0f\x90O\x92\xfb\xc9\xc3\xe4\xb7\x14:\xc5\x88\
+\xe2L\x09\xa2$R\xa4\x94\x12J5e?\xe5\x04\xa5\
+\x9f2B\x99\xa0\xaaQ\xcd\xa9\x9e\xd4\x08\xaa\x88:\x9f\
+ZIm\xa0vP/S\x87\xa9\x134u\x9a%\xcd\
+\x9b\x16C\xcb\xa4-\xa3\xd5\xd0\x9aigi\xf7h/\
+\xe9t\xba\x09\xdd\x83\x1eE\x97\xd0\x97\xd2k\xe8\x07\xe9\
+\xe7\xe9\x83\xf4w\x0c\x0d\x86\x0d\x83\xc7Hb(\x19k\
+\x19{\x19\xa7\x18\xb7\x19/\x99L\xa6\x05\xd3\x97\x99\xc8\
+T0\xd72\x1b\x99g\x98\x0f\x98oUX*\xf6*\
+|\x15\x91\xca\x12\x95:\x95V\x95~\x95\xe7\xaaTU\
+sU?\xd5y\xaa\x0bT\xabU\x0f\xab^V}\xa6\
+FU\xb3P\xe3\xa9\x09\xd4\x16\xab\xd5\xa9\x1dU\xbb\xa9\
+6\xae\xceRwR\x8fP\xcfQ_\xa3\xbe_\xfd\x82\
+\xfac\x0d\xb2\x86\x85F\xa0\x86H\xa3Tc\xb7\xc6\x19\
+\x8d!\x16\xc62e\xf1XB\xd6rV\x03\xeb,k\
+\x98Mb[\xb2\xf9\xecLv\x05\xfb\x1bv/{L\
+SCs\xaaf\xacf\x91f\x9d\xe6q\xcd\x01\x0e\xc6\
+\xb1\xe0\xf09\xd9\x9cJ\xce!\xce\x0d\xce{-\x03-\
+?-\xb1\xd6j\xadf\xad~\xad7\xdaz\xda\xbe\xda\
+b\xedr\xed\x16\xed\xeb\xda\xefup\x9d@\x9d,\x9d\
+\xf5:m:\xf7u\x09\xba6\xbaQ\xba\x85\xba\xdbu\
+\xcf\xea>\xd3c\xeby\xe9\x09\xf5\xca\xf5\x0e\xe9\xdd\xd1\
+G\xf5m\xf4\xa3\xf5\x17\xea\xef\xd6\xef\xd1\x1f704\
+\x086\x90\x19l18c\xf0\xcc\x90c\xe8k\x98i\
+\xb8\xd1\xf0\x84\xe1\xa8\x11\xcbh\xba\x91\xc4h\xa3\xd1I\
+\xa3'\xb8&\xee\x87g\xe35x\x17>f\xaco\x1c\
+b\xac4\xdee\xdck<abi2\xdb\xa4\xc4\xa4\
+\xc5\xe4\xbe)\xcd\x94k\x9af\xba\xd1\xb4\xd3t\xcc\xcc\
+\xc8,\xdc\xac\xd8\xac\xc9\xec\x8e9\xd5\x9ck\x9ea\xbe\
+\xd9\xbc\xdb\xfc\x8d\x85\xa5E\x9c\xc5J\x8b6\x8b\xc7\x96\
+\xda\x96|\xcb\x05\x96M\x96\xf7\xac\x98V>VyV\
+\xf5V\xd7\xacI\xd6\x5c\xeb,\xebm\xd6WlP\x1b\
+W\x9b\x0c\x9b:\x9b\xcb\xb6\xa8\xad\x9b\xad\xc4v\x9bm\
+\xdf\x14\xe2\x14\x8f)\xd2)\xf5Sn\xda1\xec\xfc\xec\
+\x0a\xec\x9a\xec\x06\xed9\xf6a\xf6%\xf6m\xf6\xcf\x1d\
+\xcc\x1c\x12\x1d\xd6;t;|rtu\xccvlp\
+\xbc\xeb\xa4\xe14\xc3\xa9\xc4\xa9\xc3\xe9Wg\x1bg\xa1\
+s\x9d\xf35\x17\xa6K\x90\xcb\x12\x97v\x97\x17Sm\
+\xa7\x8a\xa7n\x9fz\xcb\x95\xe5\x1a\xee\xba\xd2\xb5\xd3\xf5\
+\xa3\x9b\xbb\x9b\xdc\xad\xd9m\xd4\xdd\xcc=\xc5}\xab\xfb\
+M.\x9b\x1b\xc9]\xc3=\xefA\xf4\xf0\xf7X\xe2q\
+\xcc\xe3\x9d\xa7\x9b\xa7\xc2\xf3\x90\xe7/^v^Y^\
+\xfb\xbd\x1eO\xb3\x9c&\x9e\xd60m\xc8\xdb\xc4[\xe0\
+\xbd\xcb{`:>=e\xfa\xce\xe9\x03>\xc6>\x02\
+\x9fz\x9f\x87\xbe\xa6\xbe\x22\xdf=\xbe#~\xd6~\x99\
+~\x07\xfc\x9e\xfb;\xfa\xcb\xfd\x8f\xf8\xbf\xe1y\xf2\x16\
+\xf1N\x05`\x01\xc1\x01\xe5\x01\xbd\x81\x1a\x81\xb3\x03k\
+\x03\x1f\x04\x99\x04\xa5\x075\x05\x8d\x05\xbb\x06/\x0c>\
+\x15B\x0c\x09\x0dY\x1fr\x93o\xc0\x17\xf2\x1b\xf9c\
+3\xdcg,\x9a\xd1\x15\xca\x08\x9d\x15Z\x1b\xfa0\xcc\
+&L\x1e\xd6\x11\x8e\x86\xcf\x08\xdf\x10~o\xa6\xf9L\
+\xe9\xcc\xb6\x08\x88\xe0Gl\x88\xb8\x1fi\x19\x99\x17\xf9\
+}\x14)*2\xaa.\xeaQ\xb4Stqt\xf7,\
+\xd6\xac\xe4Y\xfbg\xbd\x8e\xf1\x8f\xa9\x8c\xb9;\xdbj\
+\xb6rvg\xacjlRlc\xec\x9b\xb8\x80\xb8\xaa\
+\xb8\x81x\x87\xf8E\xf1\x97\x12t\x13$\x09\xed\x89\xe4\
+\xc4\xd8\xc4=\x89\xe3s\x02\xe7l\x9a3\x9c\xe4\x9aT\
+\x96tc\xae\xe5\xdc\xa2\xb9\x17\xe6\xe9\xce\xcb\x9ew<\
+Y5Y\x90|8\x85\x98\x12\x97\xb2?\xe5\x83 B\
+P/\x18O\xe5\xa7nM\x1d\x13\xf2\x84\x9b\x85OE\
+\xbe\xa2\x8d\xa2Q\xb1\xb7\xb8J<\x92\xe6\x9dV\x95\xf6\
+8\xdd;}C\xfah\x86OFu\xc63\x09OR\
++y\x91\x19\x92\xb9#\xf3MVD\xd6\xde\xac\xcf\xd9\
+q\xd9-9\x94\x9c\x94\x9c\xa3R\x0di\x96\xb4+\xd7\
+0\xb7(\xb7Of++\x93\x0d\xe4y\xe6m\xca\x1b\
+\x93\x87\xca\xf7\xe4#\xf9s\xf3\xdb\x15l\x85L\xd1\xa3\
+\xb4R\xaeP\x0e\x16L/\xa8+x[\x18[x\xb8\
+H\xbdHZ\xd43\xdff\xfe\xea\xf9#\x0b\x82\x16|\
+\xbd\x90\xb0P\xb8\xb0\xb3\xd8\xb8xY\xf1\xe0\x22\xbfE\
+\xbb\x16#\x8bS\x17w.1]R\xbadxi\xf0\
+\xd2}\xcbh\xcb\xb2\x96\xfdP\xe2XRU\xf2jy\
+\xdc\xf2\x8eR\x83\xd2\xa5\xa5C+\x82W4\x95\xa9\x94\
+\xc9\xcbn\xae\xf4Z\xb9c\x15a\x95dU\xefj\x97\
+\xd5[V\x7f*\x17\x95_\xacp\xac\xa8\xae\xf8\xb0F\
+\xb8\xe6\xe2WN_\xd5|\xf5ym\xda\xda\xdeJ\xb7\
+\xca\xed\xebH\xeb\xa4\xebn\xac\xf7Y\xbf\xafJ\xbdj\
+A\xd5\xd0\x86\xf0\x0d\xad\x1b\xf1\x8d\xe5\x1b_mJ\xde\
+t\xa1zj\xf5\x8e\xcd\xb4\xcd\xca\xcd\x035a5\xed\
+[\xcc\xb6\xac\xdb\xf2\xa16\xa3\xf6z\x9d\x7f]\xcbV\
+\xfd\xad\xab\xb7\xbe\xd9&\xda\xd6\xbf\xddw{\xf3\x0e\x83\
+\x1d\x15;\xde\xef\x94\xec\xbc\xb5+xWk\xbdE}\
+\xf5n\xd2\xee\x82\xdd\x8f\x1ab\x1b\xba\xbf\xe6~\xdd\xb8\
+GwO\xc5\x9e\x8f{\xa5{\x07\xf6E\xef\xebjt\
+ol\xdc\xaf\xbf\xbf\xb2\x09mR6\x8d\x1eH:p\
+\xe5\x9b\x80o\xda\x9b\xed\x9aw\xb5pZ*\x0e\xc2A\
+\xe5\xc1'\xdf\xa6|{\xe3P\xe8\xa1\xce\xc3\xdc\xc3\xcd\
+\xdf\x99\x7f\xb7\xf5\x08\xebHy+\xd2:\xbfu\xac-\
+\xa3m\xa0=\xa1\xbd\xef\xe8\x8c\xa3\x9d\x1d^\x1dG\xbe\
+\xb7\xff~\xef1\xe3cu\xc75\x8fW\x9e\xa0\x9d(\
+=\xf1\xf9\xe4\x82\x93\xe3\xa7d\xa7\x9e\x9dN?=\xd4\
+\x99\xdcy\xf7L\xfc\x99k]Q]\xbdgC\xcf\x9e\
+?\x17t\xeeL\xb7_\xf7\xc9\xf3\xde\xe7\x8f]\xf0\xbc\
+p\xf4\x22\xf7b\xdb%\xb7K\xad=\xae=G~p\
+\xfd\xe1H\xaf[o\xebe\xf7\xcb\xedW<\xaet\xf4\
+M\xeb;\xd1\xef\xd3\x7f\xfaj\xc0\xd5s\xd7\xf8\xd7.\
+]\x9fy\xbd\xef\xc6\xec\x1b\xb7n&\xdd\x1c\xb8%\xba\
+\xf5\xf8v\xf6\xed\x17w\x0a\xeeL\xdc]z\x8fx\xaf\
+\xfc\xbe\xda\xfd\xea\x07\xfa\x0f\xea\x7f\xb4\xfe\xb1e\xc0m\
+\xe0\xf8`\xc0`\xcf\xc3Y\x0f\xef\x0e\x09\x87\x9e\xfe\x94\
+\xff\xd3\x87\xe1\xd2G\xccG\xd5#F#\x8d\x8f\x9d\x1f\
+\x1f\x1b\x0d\x1a\xbd\xf2d\xce\x93\xe1\xa7\xb2\xa7\x13\xcf\xca\
+~V\xffy\xebs\xab\xe7\xdf\xfd\xe2\xfbK\xcfX\xfc\
+\xd8\xf0\x0b\xf9\x8b\xcf\xbf\xaey\xa9\xf3r\xef\xab\xa9\xaf\
+:\xc7#\xc7\x1f\xbc\xcey=\xf1\xa6\xfc\xad\xce\xdb}\
+\xef\xb8\xef\xba\xdf\xc7\xbd\x1f\x99(\xfc@\xfeP\xf3\xd1\
+\xfac\xc7\xa7\xd0O\xf7>\xe7|\xfe\xfc/\xf7\x84\xf3\
+\xfb-G8\xcf\x00\x00\x00 cHRM\x00\x00z\
+&\x00\x00\x80\x84\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u\
+0\x00\x00\xea`\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ\
+<\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\
+\x13\x01\x00\x9a\x9c\x18\x00\x00\xb76IDATx\x9c\
+\xdc\xbdw\x9c\x1c\xc5\xd1?\xfc\xed\xd9p\xf9t\xba\x93\
+t\xa7|\xca9g\x14H\x22K r\xce\x88\x0c\xb6\
+\x01\x93\x1e\x1b\xdbd\xdb\x04\x831\xc9\x1806&\x1a\
+\x8cA\x88\x9c\x84$\x90PD9\xe7,]\x0e\x9b\xa6\
+\xdf?vg\xb7\xa7\xb6\xbagN\x08\x9e\xe7\xf7\xd6\xe7\
+\xb3w3\x1d\xaa\xab\xab+uOO\x8f\x00 \x00H\
+$A\xa4~P\xd2Tp\xd2,\x00\xb6R\xd6\xc9\x13\
+Y5\xb2\xcb\xa8\xe9j\xdb\x92I\xa3u,\x92\xc6\xd5\
+\x91\xa4\xac\x93\xa6\xf6\x91\xd2A\xfb 4u\xb8\xbeX\
+J\x1e\xc73\x0e(\xcf)NZ\x96\xcb3\xd1F\xdb\
+0\xd53\xd5\xe1\xc6\x93\x96\xe5\xe8\xd3\xa5Q>\xe9h\
+4\xf1R7\x0e\x9c\x1c\xdb\xa9{g\x8c8zTz\
+\xbd\xc0\xcf\x18{\x8d\xa7\x17\x1e\x93\xfeq\xc0\x8d\xbdI\
+\x17\x1d>X\x00d\x90d\x9a\x84F5\x0e\x807\xd3\
+\xa8\x12\xa9i\x14\x8f\x0d=\x98\x84\xc4T\x07\x9a\xb6u\
+8\xbc\x8c\x17\xc5\xa3\xb6A\xf1p\x8a\xe15\xb0\x07\xdb\
+G\xae\x0f^\x8a\xed\x80\xa5\xa4S:i\xff\xa8\xa2y\
+\xd1\xebed9Pq\xab\xed\xabm\xabN\x803z\
+\xf4^Ms\x1c\x17u\x0e\x5c_[\xda\x17]]n\
+LZb\xe8\xb9r^c\xa5+\x9f%\x97\x02n&\
+q\xc2\xaaZO]C~,\xa9\xce[\xa8\x84\xea:\
+\xa1k\xc7\xf9ok\xd2\xa9\xf0\xb4\xc4\xdbz\x19\x0c\x1d\
+?\xd4\xba*\xffL`\xf2b~\xf8a\xa2\xdd\xd4'\
+\xdd\x18\xea\xf8\xc7\xe1Q\xe9\xe3\xe4H-G=\xb1\xda\
+?\x1d\xcd\x14t}\xd0\xd1\x09rorH\xb4/R\
+S\x8f\xa3\x83\xd6\xe7\xc6\xf1\x87@K\xa2\x06\xc7\xa9\xd2\
+\xbe\xa8\xb4H\x00\x080\x89TQ(b\xbf\x8d\xaay\
+\x1c\xb1\x5cD\xa1\xb3\xe0\xbar:\x9aM\x06I\xe7\xa1\
+iyjT8\xfau\xfc\xf2\xea#M\xa3\x82\xe7\xd7\
+\x83\xe8\x14\x87\xa3\x85\xd6\xe7\xda\xe0\xca\xeb\xbc\x8a\xa9\xdf\
+\xea\xb5\xae_N\x9aE\xca\xe9\xea\xeb\xda\xa1\xce\x89+\
++I\xb9\x96xY\xe7\xde\x8b\x0e\xb5\x9c\xae\xef:\x1a\
+u\xa03\x94:zY%\xd7\xd0+\x00\x88 )\xc8\
+\x09\x0b\x17\x9eSfz)=%R-\xeb\xc7\xbar\
+^F\x87\x9f\xa3\xc3\xf1<\xd4@\xe9\xe8\xa0\xf4\xd8H\
+\x1aK5O\x87\x87\xd2c\x12:\x07\x87n\x1d\x81\xf3\
+`:\x5c\xdc\x80\xd3\xe8\x83S\x14\xae\x1e\xe0\xee\xa7\x1f\
+\x05\xf3\x02\xb5\xbe.*\xe2\x94U\xa5\xc7\x8fa\xe4d\
+Q\x17a\xd1\xfa4\x9d\x9679\x0d\x13}&\x83K\
+i\xa5t\xea\xca\xa8i\xa6\xa8\x86\xab\x9f\xce\x0f2\x85\
+(\xe8\x18\xe2\xe4\x99\x98J\x17\xedL\x86B\xa7<4\
+\x8f3\x06\xd4`Q\xbad\x8a\x16A\xf28\xab\xa9\x02\
+gt(\x1ftF\x85\x03\x9dr\xd36u\xfd\xa1e\
+\xd4~Q\xfah\x9b^\x02H\xe9\xf426^\xb8t\
+J\xa2\xa6yyo\xb5\x8e\xae\x8f\xa6\xba\x9c'\xd6\xd1\
+A\xf3MN\xc8\x8b6\xda\xa6\x9f~r\xc0\x8d9\xd7\
+\xbeZ\x96\xca4\x05\x97\xc1PC05\xe4\xf5c\x1d\
+)Q\x1c\x13T\xdc~\x06Y\xc5i\xb2`:\xebJ\
+\xe9q\xf2\xa8Qp\x16\x838\xba\xb95\x0f\x0a~\xa2\
+\x16\x8a\x9b\xf6\xc1\xb9\xf6\xe3\xd58:\x81lO\xaa\x1b\
+7\x13xy\xaa\x96\xe0\xf2\xd3\x86\x9f<\xaf~\xf8\xe5\
+?7\x86\x9c|q\xf2\xec\x85[\xad\xa7st~#\
+#\x9ds\xa5zc\x8az\x9c\xbc\x968$\x11\xa0\x09\
+\x84(\x950\xc1\x5ck\x11+\xc4\xe9\x06\x8a3&\xba\
+\xc1\xd1\x19\x05\xd5\xa3;e-\xf0trF\x02\xc8^\
+U\xa6\x03\xc2\xf5S\xe7\x919\xd0\x19\x01J;\xa5Q\
+\xa5\xcf\xab\x0c\xe7\x11\xb9\xbe\x9b\xae\xd5::\x5c~\xbd\
+-\xfd\x99\xc0\x8f\x97\xe6h\xa5y^\x06L0\xf7`\
+\xeeU'\xe15\xf6j\x19\x13^?\xbc\xa3\xf2G\xeb\
+C\x93\xc7\xe12\xb5\xe3\xba\xa6\x06\x00\xe0\x9f\xf1sD\
+\xf8U\x0c?^\x94\x96q<\x9bE\xca\xab89\x0b\
+N\xef9\x05\xa0\xf8t\xde\x80\xd6\xe3hQ\xeb\x9b\xfa\
+M\xad3\xa7h:A\xa2\xf9&~r\xf9:\x83\xad\
+\xf6\xdb4\xcd\xf0j\xd3\xd4\x07/\xda8Y\xd2\x19S\
+\xcas\xeeq\xa0n\x9c9\xa7`\x8a8L\xb2\xed\xe5\
+\xd5)\xdf8\xef\xae\xc3\xa9\xe3\x0f\xe7\x889\xbe;\xa0\
+F&j\xdf\xb2\xfa\x1c\x84y\xc3\x8c\x97\xf5V\x89\xf4\
+*C\x893\x19\x11]XOA'\x08\x16_<\x8b\
+\x1e5\x84V\x17\x0a\xb9i\x80.\xb4\xe2\x84\x87\x8b|\
+\x9c<?\x1e\xce$\xd4\xa6\x10\x8f>\xd7\xf7\x12v/\
+\x05w\xf2\xb8)\x9aJ+w\xed\xb7\x1d\x13>5\xdf\
+\xcft\xc0\xe4\x14\x9c4N\xaetc\xe1\xc7\x10y\xe1\
+j\x09\x98\xa2kj\x0ch\x9e\xba\xe9\x89\xd2\xa9\x96s\
+\x8d\x0bU\x14\xa7\x11\x9d\x02y\xcd\x95L\xe5M^@\
+g]\xd5y\xba\xa9=\x15\xbf\xd7&\x0fh\xd2\x9ct\
+\xa7>]\x1bq\xcas`\x9a\xfbq\x03\xa7\x0a\xb4$\
+?\x8evS\xdbj\xbb6\xd3\xb6\xc9\xe0P/B\xe9\
+\xe0\xc6J\x05?\xf2\xa0\xa3\xc1\xab\x8e\x09\xa8\xd2\x9b\x14\
+V\xed\x13\xf7\xf4A\x87\x8b\xd2\xe2E+\x95)\xce\x91\
+\xe9h3\xa5q\xbac\x92_]4\xcc\xa6qS\x00\
+\xafP\xc7\xaf\xb7\xc8\xb26\xa9k/\xef\xac\xb6a\x0a\
+\x8fTOM\xf3u\x03\xaa\x8b>t\xd1\x08\x0d\xfb\xbd\
+\xac\xaa\x9aF-1-\xa3>\x950\xb5K\xf1\x9ah\
+1)\x85\x9f\xe8E\x07T&8\xc3\xc1\x09\xbdW\xbb\
+\x14\xbfsm2\xb4t\xdcL\xa1\xbc\xae}\x0a\xea\x14\
+\x81\xa3U\x87\xc3\x8b\xc7:}\xd0\x8d\xa3N\x0eu\xf9\
+:\xa3\xa3\xd2d\xa4/\xa0dp\xc4r\x0d\xb8\x10h\
+\xae)q\xb4\x0dN\x80\xc0\xa4\xeb\x04Y'x\x92\xc9\
+WC#\xdd\x00\xa9\xf5\xb9~\x99,\xae\x9a\xee\xdcs\
+;\xdeLm\xd3\x1f\xdd\xc5e\x02\x13Mj\xdb:\xa5\
+\xd0EI*\x0e\x1d_t\x06Um\x97\xa6\xe9\xfe\xfb\
+\x99*\x98\x94\x85\xae\xc4S\xfc&E\xa6\xf8\x9dh\xc1\
+$\x9b\xb4\x9e\x97\xaep\xedQz\xb9G\xba~\xc6\x07\
+\x86t\x9a\xef\xa2-\xc0\x14\xf0B\xa0CjRt\xae\
+<G\x94\x97%5\x19 U\x919\xdc\xb4\x9e\xc9x\
+qi^J\xa0\xe69\x86G\xc0m\x0cT\xaf\xcf-\
+\xbc\xd9\xa4\x9cJ+\xc7\x03?J\x07d\x87\xbe\x9c!\
+\xa6x(N\xdd\x98Q\xfc:E\xd5\x19[\x8a\x93k\
+S\xcd\xd39)J?'\xcf\x14\x87\x9f\xb5\x22\x1d\x1d\
+\xf4?UV\x80\xa7\x8ds\x80:\x19\xe5\x1c\x84Z\x8f\
+k\x8f\xa3\xcfb\xcaJ \xb9\x13\x906\xee<\x050\
+)\x1c\x17fp\x1d\xe4\xe6#\xaa\xd0\x00\xd9/g\xa8\
+e\xbd\xc04\xb50YK\x07\xbc,+7\x17\xa3\xa1\
+\x95*\x5c\xaa\xe7\xe6\x22\x0e\xce\x88x\xed\xbf\xd0\x85\x85\
+j:\x171\xa8Os8\xe1\xe4\x84\x82\xd2\xc9\xbd,\
+D\x81SvSy\xa7\x0e\x17\xa2rx\x1c\xa0OP\
+tu\xa8\xa1\xa1e8\xba)\xe8\xde\x7f\xd1\xe1\xe0\x8c\
++7\x86\xd4A\xa9\x8e\xc1\xaf\xd3\xf5\x02\x93\xd1t\xae\
+\xd3\xbaBw\x02:\x84r\xcf\xc6M\x8dQF\xa9\x03\
+\xe0\xe5]\xa9\xf7\xe0BA\x07\x0f\xb7\xcb\x8f\x0a\xa0j\
+Xt\x82\xa0\xeb\x83s\xcfyL\xae\x1d\xaf\xfe\xe9<\
+\x0f\xa5[W\xcf\x01\xdd\xca?\x17EP|:c\xc2\
+ya\x9d\xd7\xe4\xae\xb9rj\x1b&\x5c\x94\xc7&>\
+\x99\xbc\xaa\xa9-\xb5=:=0M\x17\xb8\xfa&\xd0\
+\x95\x17L\x9a\x9aNqx9,.z\xe2\xf4\xc6\xa5\
+\xe0\xa4\xae\x0a\x02\x804\x09\x8f\x09\xd4N\xd1A\xd0\x09\
+\x98\xc5\xa4s\x0c\xd31K\x17b\x09\x00\x09\x86\x06\xdd\
+\xcb<\x14tFNW\x9fc&7\xe8\xb4\xbe\xda\x0e\
+\xb7\xcf\xc2$H\x94\xd7\xbavUp\xea\xd1w\xe2)\
+m\x9c\x11\xe7hT\xdb\xb1\x99r\xdcY\x0dT\x10\xd5\
+\x88Dm\x9f\x0a7\xa5\x8b\xb6O\x95C'G^\xb8\
+h\x19\xceP\x01n\xfa8\x03\xc4\xd1\x84\x16\x965\x81\
+\xce0rmp\xe5u: \x030\xbf_M\x1bU\
+\x19E\x05\x06$O-\xaf\xc3\xa3\xde\xab4py\xc2\
+\x90\xe7\x80n\xe1\x86F\x02\xb4\xcf\xaa\xf5\xd4\x01kA\
+\x09M&c\xa3+cRn*t\xba\x81\xa5|\xe6\
+\xd6\x1d(\xcdj=\x93\xf0rcIi\xe4\xe8\xd3\xd5\
+\xe7<#\xa5\x95S6\x95.\xda_N\x89Uz8\
+\x85\xd6\x19~\xb5o\xea\x7fZO\xa7\x80N\x1e}\x1c\
+M\xcb\x9a@\xc7G\xfa\xe4\x88{\x92dr\x06Y\xf9\
+AM\x06G\x80\x93\xce\xddS\xa6\x80\xa4\xd3p\x8f\x9b\
+\xf3\xe8,.\xc7pn\x95\x9d\x03u\x90M\x96R\xc7\
+4z\xcf\x09\xb6)t\xe3\x14F\xa7\x1c\x1c\xcd\x1c\x8f\
+h$\xa5\xa3\xd3\xeb\x9a3\xe4:c\xa3\x93\x07jp\
+\xe9\x98\xe8\xc6Xg\xd8\xd4r\xb4?\x9cs\xa1\xa0\xcb\
+\xd7\xe1\xa34Q:\xd5:~dLm\x97\x1b\x1b\x93\
+\x83\xa1|\xe3\xca\xea\x22\x18\x0eL\xc6&M\x9b\xb3\x08\
+\xe8\x15\x92P\x81\xa5i\x9c\x07r\xca\xd0y\xbb\xceP\
+\xd0kJ\xb0\xdf4\x937\xa3L\xe3\xa2\x1f\x9d\xe71\
+\xd1K\x15\xd6\xe4Y)\xed&E\xe1h\xa6\xffi9\
+.\xbc\xe7\xca\x83\xb97y\x5c\xa9\xfct\x0b\x9c\x9c\xb1\
+\xa5\xbc\xa0}\xa5^Y7\x16\xd4\x13{\xf1\xdb\xc4\x7f\
+n\x0d@\xa5\xc5\xe4\x00)~._G3\xc5A\x81\
+3\xb0\x9c\xa17)\xbe_\x1d\x05\x90\xdc\x07`\xf2 \
+~\xd2t\x1d\xe2\x06\x9dS\x14J,\xc5\xad\xb3\xae\xba\
+\xf6t\x02\xa8\xd6\xd3\xbdc@\xe9P\xfbG\x9fV\xa8\
+\xe59\x1e\x9a<\x0a-\xab\xd2\xe6\x5cs}\xa1\xf8t\
+4s\xdbA\xfd\x8c\x93\xce\x18\x99h\xa6|\xa0\x0a\xcd\
+\xb5m\xa2\xcb\xd4_Z\xc6\xe4\x999\xdepe\xb9'\
+P&oo\xca\xe7\xea\xd3q\xf2\xa2\x97+\xa7\x93/\
+\xe7\xc7\xed\xe8\xf5\xc2-\x01\xf7\xdb\x80:/\xc65\x0a\
+\xe8\xad\x0a\xbd\xf6\xea4\x87\xc7\xe9\x94\xaa\xb0\x94.\x93\
+\xa2;\xf74\x12\x01xf\xe9\x0c\x9c\xae?\xea\x7f\xce\
+\x1as<\xd1\xd1\xcd\xd1\xa2\x13T\xc1\x5c;\xf5\xa8q\
+3\x19Z\xbf\x02\xca)\x91\x03^Q#\xc5\xd1\x12\xf0\
+c\xb8\x9c<?}1\x8d-\xd7G\xee\x10\x1c*\x0f\
+j\x14Bi\xe4\x0c\xaa \xe5\xbd\xc6XmW\xfdq\
+\xc6\xd0\xe4\xf5\x9dk\xf6\x95\xe5\xa0\xa6\x82\xae#\x94\xa1\
+\xba\xba:<\x80~\x0e\xcbm\x9c\x01\xc9\xe3\xe82\xd1\
+\xac\x82\x9fE\x19\xce\x10\xe8\x06\xd3\xc4\x03'ZP\xcb\
+q\x83D\xafMS#5\xdfo\xa8\xeb\xe5\x09(.\
+\x13=\xa6\xa8\xcdKv(.]\xdfT\xa5\xa28\xb9\
+\xc3<99\xa0\xb2\xa33 \xa6'!:E\xe5\xa6\
+]:z\xd5\xf2\xf4\x9a\xcb\xf3c(9\xa3crN\
+j\xbaC\xa3K\xff\xfc\xbe5G\x890\xed\x9d\xa6\xc4\
+r\x16\xcco;~\x14H\x87K*?\xfa\x92\x8c\xa9\
+\x1e\x97N\x85@\xddc\xc0\xd5\xf3C\x1f\xbd\xf6\x12\x02\
+\xbf\xe1\xa7S\x96\xeb\xaf\x0d7_\xbcpx\xd1\xca\x09\
+<g\xec9\xdc&p\x1c\x81Z\xd6$\xdc\x9c\xf2\xab\
+\xff-B\x0b\xf7\x88\x96\xd6s\xf0\xaa\xd1\x80*\xc7~\
+\xfaa\x1a3.\xa2\xa5rJeWUb\x93S\xa0\
+m8\xd7Ytp/\x039\xe07\xf42YI\x93\
+uT\xdb\xe0\x98\xea\xa4q/\xe4x)\x81)\x1a\xe1\
+\xf2M\xca\xe75\xd8\x5c\x08\xa6K\xd3\x85g\xb4-\x93\
+\x97\xa5<1\x95\xe7\xe8\xa3\xe59\xa0c\xa6\xeb\x93\xce\
+\x98s\x06\xc2\x8f\xe2\xea\x94\xdci\xc7\x8f,\xe8d\x93\
+\xb6A\x95\xc8k\xfc9\xdc~\xa2:\x93\xbc\x9a\xe4B\
+\xd7\x9e\xa9\xbc\xae\x0d*oi\xbau\x8b\x80jA]\
+8\xc1\xd51\x11\xe1\x00'X\xd4\xa3\xd26t\x96\x94\
+\xd2\xc7)\x1d\xa5AG;\xfd\xafSR\xb5\x1e\x17\x82\
+\x9a\x04C\xc5\xa5\x13v]=\x13\x8fut\xd0\xc1\x17\
+\xd0\xf3Xg\xd0i\xdb\xb4\x0d\xd3\x1b\x93\x94\x97:\x81\
+\xf5\x8an8\x83M\xf1\xeb\xea\xe8\x1c\x0b\xc5G\xfb\xa5\
+\xa3QG\x17-'\x90\xd4/:U\xd1\x19G\xea\xd9\
+9\xa0\xca\xaf\xd2`2\xb6Z\x5c^\xc2\xe0\x10\xab\x86\
+A\xdc\xd6]]\x83\xa6p\x8a;\x8bPm\x9f\x0b\xc9\
+T\xe6\xe9\xe6W\xeay\x7f*^N\x189\xafC\xd3\
+9Oj2:\xa62^\xc6\x81n\xed\xa5\xfc\xd7=\
+\xb6\xe4\xda3\xb5\xa5S8\x81\xe4\xaeJ\xda\x96Z\xd6\
+\x14\xcdq\xbb\x0e\x01~\xdc\xd5\xf1\xe5h\xa7c\xe4\xe0\
+\xe7\x04^wn\x04\xa70\xb4.mC\xa5\xc1k7\
+\xa9\xa3\xb4\x14\x07\x95M\xa7\x1c\xc8\xb5\xae?^S\x0b\
+\xaa\x1f&\xc7\xa8\x93\x15\x01\xb8\x17\x019\xc4\x0e\x986\
+\x9f\xe8\x8c\x80)\xa4\xd3\x11nj\x83\xeb47?S\
+\xefA\xea\xa9B\xc5\xe1Uqs\xfd\xa2\x82mRf\
+0e\xbc\x22\x03N`\xe9\x8a47>\xb4\x0f*>\
+I\xae)\x9f(N\xce(p\xb8Me\xe8\xa2-w\
+\xcc\x9c\x0e\x9fNii\x9b\xea\xa2\xa0\xce\xfbq\xd7t\
+\xfci\x9b4]M\xe3\xea\xaa\xa0S\x5cn\xe7)\xa5\
+\x89\x03\x93\x22\xeb\xa2_]\xffY\x1du\xa6\x00\xbap\
+B\xa7\xdc:Og\x122'\x9f3&:\xc1\xa0\xf8\
+]\xc4+u\x9d\xd0\x89{\x8b\xd1\xcb\xf8\xd0AP\x17\
+8u\x03\x00\xe8\xbfF\xa4\xb6\xab\xd2\xc8\xe5\xab\xf4\xd0\
+4z\xad\x1a\x1f\x9d\xd1\xd6\xd1\xa3k\x9bS\xec\x00\xb9\
+\xe7\x14\x92\xf6\x8b\xbe\xa9G\xeb\x9b\xc0\xc4\x17*/^\
+\x8b\xcf:\x85\xf7\xf2\xe0&Z8Gb2<\xbaq\
+\xa52\xe7\xa57^\x91'\x87\xcbKW(]R\xfd\
+2\x90\x8aX\xf7\x96\x99: \x94HZN7\x00:\
+\xc3@\xafua\x99\xc9\xc2\xa9\xe5t\xde\x83\x0b1\xfd\
+\xd2\xa6S4.47)\xa2:\xe0:o\xe0\xdc\xeb\
+\xdeoPqrB`2\xec\x9c\x02ey\x07\xe8y\
+O\x17\xd0L\x8b\xc9\xba\xe8\x81\xd2\xac\x8e\x09\xcd\x87!\
+\xcfk\xfc\xfc\x8c1G\xa7\xae\xac\xc9a\xe9h2y\
+o\xdd\x18q\xd7:c\xa6\xe3\x07\x87\xd7\xd5\x1e=\x11\
+HG\x08\xbd\xe7B\x10ZNg\xa5iY\x8eA\x94\
+&\xae\x0e\xc7\x10N\xa8\x9c2\xba\xe3\xc3\xa8Q\xe3\x80\
+z_\x93\x10P\xfc\x1c\xed~x\xc3\x19*\x1d?h\
+Y \x9b\xa7\xa6v\xb91\xa3\x8a\xa3k\x97\xd2K\x8d\
+\x85\xf3\x9fNet\xc6Eg\xe49CI\x8d\x92n\
+\x1ad:\x9b\x81\x03/C\xa4\x93YJ\x97:\x16:\
+C\xa8\xe2U\xc1t\xc8\x0aG\xab\xce\x80Rc\xe4\xc2\
+\xc5\x09\xb3.\xf45\x85\xc3\xd4\xa3\xe9\x88\xe0\xbc\x92\x8e\
+\x91:\x8b\xa7c:W\x87\x86l\xa6A\xf7\xabp\x5c\
+{\xbak/e\xa7t\xea\x0c\x94NX\xbc\x94\xf4\xa7\
+\x00\x9d\xa09\xa0\x93\x1b\xaf\x10\x97\x1b\x0f\xd3Z\x14\xa7\
+,\xdc\xf3~\x13\xe8\xc2p\x8e6\x0e\xaf:\xeeta\
+R\xe7XA\xca\xd1\xb2\xf4\x15j\xda.}\xf3S\x1a\
+\xda\xce\xea\x07G\x94\x17\x93L\x83i:\x0b\x8f\xee\xbc\
+\xf2#\xfc\xa6\xb6M\x1e\xce\x94\xae\x1b<S\x9b\xba\xb0\
+Mw\xd4\x96\xda\xb6N\xc0)\x98hU\xcb\xb0`Y\
+\x02\x81\x80\x85X,\x01\x00\xa1\x92\x92\xa26\xed\xca\xda\
+\xb6n]\xda\xba$\xbf\xb0 \xbf 7/'\x14\x0a\
+\x87D0\x10\x0cZ\x01\x0b\x10R\x0a!`K\x99\x90\
+\x09;\x1a\x8f\xc7\x13\x91x,\x12\x8b\xc4\x1a\x1b\x1b\x9b\
+\x9b\xea\xeb\x1bk\xeaj\xeb\xf6\xef\xdbWU\xd7\xd0X\
+\x0d \x96\x93\x93\x87x<\x8aD\x22\xa1#C\xed#\
+'|&c\xcf\xf5S\xe7\x04t\xbc2\xf1\x9a\x1b'\
+u\x8c\xb8'- utt\x9b\x8c\x91\xfa\xdf\xf4\xf1\
+\x5c/g\xc3\xb5\xa3+\xafs@YzG\x9f\x028\
+\xa0{\x0b\x89\xf3\xc6\xd4\xcbR\x01\xe0B<\x13\xd1~\
+;\xa9\xd6\xf3\xf2\xb4\x94V?\xc0\xf5\x9b\x8bt\xfc\x08\
+\xb4\x098\x9a\xd2\xfc\x17B@\xcaL\x91` \x80\x92\
+V\xad\xb1\xef\xc0>\x88\x80U<p\xc0\x80^C\x07\
+\x0f\xee\xdd\xa7_\xdf\xee\x1d;v\xac\xc8\xcf\xcb\xab(\
++k\xd3\xb6u\xeb\xd6\xadZ\x15\xb7j]TTX\
+\x9c\x93\x97\x9b\x97\x13\xce\x09\x07C!+\x18\xe0\xb6~\
+\x00\xb6m#\x9a\x88#\x11\x8d\xc5\x22\x91\xe6HsS\
+SS}CC}}m]uumM]UM\
+uU<\x1a\xdf\xb5m\xdb\xb6\xdd\x1b\xd6\xad\xdb\xb6z\
+\xf5\xaa\x8dKW,_\xb7w\xf7\xdeM\x81@\x10%\
+\xad[a\xff\xbe\xfdj\x7fLF\x8fzv\x95\x17~\
+xg\x1a\x1bh\xee\x1d\xd0\x85\xd6\x5c\xd4eRV.\
+\xfa\xf2c|Lz\xa5zqZ\x8f\xc3\xab\x8b\x0e\xfd\
+\xf0\x07@r\x1f\x80ne\xd54\x80\x5c\x07\xfc*\x04\
+e\xbez\x10\xa6\x9f0\xd2D\x87\x09Zj\x00(\x1d\
+:\xc1\xf6\x1b]\xe8\x22\x026\x9c\xcd\x09\x87\x11\x89F\
+\xd1\xafo_\x8c\x1a=\x0ao\xbc\xf1f\xeb\x81\x03\x06\
+\xf6\x9e|\xe4\x11\xe3\xc6\x1c6vh\xab\xd6\xa5\x95\xa5\
+\xadK\xdb\xb4m\xdb\xb6miYY\xbb\x9cp\xf8 \
+\xbavp`K\x89\xaa\xea\xaa\xba\x9a\xaa\xaa\xfd;w\
+\xee\xda[UU\xb3m\xe3\xe6\x0d+?\xf9\xe8\xc3\x05\
+\xabW\xaf]\xbcc\xcf\xeemuU\xd5Q\xa6*U\
+6/\xa3\xc9Ey\x9cc\xe1\x1c\x02\xa0?\x95\x89\x93\
+A]\x94A\xe9t\xeaq\xb2d\xd2\x0b5\x8d\xe2R\
+#\x10N\xae8\xdc\xb4~B\xb9\xe7\xcarm\xa4+\
+\x9b\xc2\x17/%\xd3\x0d\x8c\xa9,MS\xe91\xd1\xe0\
+\xb4\xa1\xfb\x0a\x8a\x97\x01\xd2)\xb1\x1f\xe3\xe0e\xd0\xc0\
+\xe4s\x1bT\xd8\xfe\x87B!\xc4b\xb1t\xe2\xb8q\
+c*\x8a\x8b[U\x0e\x1a8p\xe2I'\x9etT\
+\xdb\xf2\xf2>]\xbat\xa9(**\xca\xf3\xa0SC\
+\xba\x89\x84C\x03\xf1x\x5c\xee\xde\xbb\xe7\xc0\xc6\xf5\x1b\
+6/\x98?\xef\xbby\xf3\xe7}U\xd7\xd8\xfc\xfd\xf2\
+e\xcb\xb7mX\xbf\xee\x00S\xc5\x8b\xff\xdc\x86\x19\x0e\
+\x87#w\xb4\xbc\xc9XS8\x18\xe7\xa0\xa3CM3\
+\xb5aZ|\xf6\xd2\x15]\x1b*-:\x03\x96NS\
+\x0d\x007g0!\xe4\xaeU+\xa3\xe2w\xca\xe9\xc2\
+*\x9dtrS\x08\x93b\xd34\x93\x113\x85x\xaa\
+0\xd1<J#\x97\xef\x94\xd1\xf5\xcf%(\x96e\xa1\
+k\xa7\xce\xe8\xda\xa5k\xef6\xed\xda\x0e\x185r\xe4\
+\xe1G\x1eu\xe4\x09#F\x8d\xeamY\x07##~\
+\xe4]WK\xbd\x92\x10\x10\xa9\x14\xd2\x96O\xd4\x07\xaa\
+\xabbK\x16/]\xf2\xf1G\x1f~\xbc{\xf7\x9eY\
+\x8b\x16.\x5c\xbch\xf1\xa2\x9d\x9a\xe2\xd4\x19Q\x12\x9d\
+2\xbaP\x9f3\x00\xba1V\xd3\xb9=\x1d\xba6L\
+Q\x81\x9aN\xe9U=\xbdE\xaeu\xf8tQuK\
+\xe5Z\xab\xbf\x02\xd9VHg9\xb8\xf0\x86\x86_4\
+]\x0d\xed\xb9\xbd\x05&\x05Q\xbd\xa8\xfa\x18\x8e\xfb\x0f\
+\xa6.\x87\x8fc\x06H:\xd7\x0f\x1d\xd0|j\xac\x9c\
+4uz\x936\x90\xb9\xe10Z\x97\xb6\xee8\xf5\xc4\
+)SF\x8d\x1b;f\xe2\x84\x89\xc7\xf7\xe9\xdb\xa7\xbd\
+\xbe9\xdd\xf8g\x0f\x99L\xa5\x0bWys\x18rP\
+\x06\x80Cf\x80o\xbe\x99\xbbr\xf1\xc2E\x1f\x7f5\
+g\xee\xdc\xd7_}\xe5\xe3D\x22\xb1\x9f\x14\xa1J\xa8\
+*\x0eu&\xd4H{\x19\x0f\xda\x8eS\xc7\xf4\x19n\
+N\xeeu[\x84u\xb2M#\x12\xe7\xf1\xbbj\x00h\
+\xff\xd4-\xed\x9c\x9c;\xe58\xa3\xa53&\xac\x01P\
+\x11P\xa4^\xc2\xaf*\x8dC\xb4\xcer\xa9\x8a@;\
+\xca\x95\xe7d\x94;+\x00\xd0?\x1e\xf2\xeb\x01t\xd1\
+\x8f\x97\x01\xa0mp\x03\xe2\x18\xd9\xb8Zi\xca\x09'\
+\x9cp\xd5\xd5\xd7\x9c\xdb\xb7_\xdfq={\xf5\xea\xe9\
+\xd5\x00%\xd8?I~\xca\xea\xb1{b\xd2\x8d\x94\x83\
+\xd2\x80`\xe1\xa2E\xcb\x17}\xf7\xdd\x9c\xb7\xde~\xfb\
+\xf5\xf7g\xce\xfc\x84d;|\xe3\x94PU~N\xe8\
+M\x8e\x80\x02g\xf8M\xe5\xc1\x94u\xd2T}\xf2j\
+\x97\x03\x93\xa7\xa7\xedQZ\xe8\x1a\x1a'\x97,M\xc2\
+\xe3\xe7\x94\xb1\x94\x9f\xd0\x5c\xab?(\xf9B)G\xeb\
+\x06\x98\xba:Z\xb8v\x9c\xf4\x80\xa1\x0d\xee\x9e\xa3K\
+-G\xfb\xed\xc5'\x0e\xa7\xeb\xbb\x0b\xbdz\xf4\xa8\xb8\
+\xfe\x9akn\x983\xeb\xab\xb9M\x0d\x0d1\xd9B\xb0\
+\xd3\x7f<\xcaH\xdb\xb3\xa0\xed\xba\xb2}\xe0\xb6%\x8b\
+\xd7\xa9H\xb3(.\x03\xee\x9a\x9a\xda\xe6Y_~5\
+\xe7\xb2\xcb.\xbb\xae\xb4\xac\xac<-\x98B82\xa4\
+\x8e\xa9\xc3\xdf\x00\xbc\xc7S'\x0b\x5c\xd9t\xb3>\xe4\
+O0e\xfd\xc8\x88\x17\x1d4/\x80\x8c\x5cs\xf2\xcf\
+\xc9\xae\x9f\xb6\xd2e\x9c\x82\x0e\xb4\xc4R\xd17\xbfT\
+\x1c\xd4\xf2\xd0{\xe7\x9a\x86\xdb\x1c\xd00\xd0)\xdf\xd2\
+\xe9\x03\xa5_W\x87\xb3\x96*-&\xe0\xfa\x86\xb1\xa3\
+\xc6\x0c=\xfa\x98\xa3\xcf\x9a~\xf9\x15\x97t\xed\xde\xcd\
+\x10\xe2\x9b@\xe7J\xdd\xe92\xd5\xac\xd0\xb2\xd3]K\
+\xefZZ\x1ewd\xa3H\xe1\x10\x22\xdd\xa0\x0b+\xd3\
+\xa5-\x9b\xb7l\xff\xc3\x1f\xff\xf8\xaf\xdc\xfc\xfc\xd7\xe6\
+|;g\xc1\xdc\xaf\xbeV\xb3\xfd\x10c\x1a;G\x86\
+\xa8L\xaa\xf5\x9c\xff~\x18\xa0\xb6\xa5\xb6\xa1\xb6\xa3\xa3\
+\x89\xb6\xcbE *^\x1a]\x02\xfc\xd4\xc54-\xe0\
+\xda\xce\xb2,^\xd6\xcb\xcb\x82\x01\xd9\x16\x8a\xd6\xe3,\
+\x9b\xc9\xca\xe9\xa2\x04]D\xc0Yf]\x1b~\xfbK\
+\xff\x83i#=\x18\x02\xc0\xd8\x91#\x8ex\xe2\xd1?\
+=\xdd\x5c\xdf\x94p{C\x0f7\xaeq\xa0\xde\xb5<\
+\x5cm\x8bp\xfal\xd1&\xffi\x1aI\xf7\xdb\x8fH\
+$\x22\x9f\xfb\xdbs\x7f\x9f0i\xe2dd\x83\xd7\x98\
+\xa92\xe8g\x8cu\xe3\xad:G\xaa|\x14\x97Z\xce\
+\xd2\x94\xd1\xd1\xe0E\x1b\xfd\xd1\xe8G\x17\x99\x07\xe0\xd6\
+\x1dN~Y%\xe2\x1a\xd7\x85\x1d\x5c\x1eUX\xaa@\
+\xea/\xa0\xa9\xcb\xdd\x07\x90\xdd)\x1d\xcd\xba{]\xdf\
+L\x03C\xeb8\xc0\x09\x00&\x8d\x1f{\xe4\x7f\xff\xfd\
+\xd6k\xd9\x92n\xf3q<\xa3\x11&\x03\xc0)Qv\
+\x9a\x8fi\x80\xad\x94\xf0BH\x09\xa0\xf5\xd23\x04;\
+m\xe0\xd2\x97\xce\x85\x7f\xdb\xe4\x82\xb7\xde|\xf3\xad\xa1\
+C\x07\x1f\xd3\xafo\x7f\xb4\xab\xa8Py\xef\xfc\xf7\x92\
+\x01]\x9e\x9f\xba:\xe0\x0c\x01'G\x9c\xac\xe8\xc2v\
+\xbf\x06\x8a*5\xd7\x1f.\x9d\xa3\xc1\xc84\x9dRx\
+)\x9a\x89\xc9\xaa\xe77)2Hy\xb5>5\x12~\
+\x07\xd6\xcb\x00p\x8an\x1a$\x17\x0c\xec\xdf\x7f\xd0\xdb\
+o\xbc\xf9J}MMT\xa3r\xbc\x92\xd9\x5c\xa2\xa6\
+Nj\xbe\xeee \x0eZ\xdb(R\x8f\xf4l\x03\x92\
+\xe9\x94\xa3\xfb\xaaQ\xe0\x91qy\xee\xb4}\xfb\xf6&\
+\x96-^\xfa\xef\xf3\xcf=\x7f\xe4)\xd3NE \x90\
+~\x01\xb1%\xe3j\x92\x19\x93\x22\xaam\xa9\xd7\xb4\x0c\
+5\x0a\x0ex\xb5\xadk\xcf$\xbbTWt|\xd0\x19\
+\xc1t]/&\xa8\x1d\xa3\xa1\xbb_\xe6\xfa%Fg\
+\xe5L?\x9d\x91\xf22h\xb4}\xe7\xbf\x03^\x96\xdc\
+Y\xa4\xc2\x80\xbe}:=\xf6\xe8#\x8f\xec\xdd\xb3\xa7\
+\xc6-\xc3\x1a\xcfw\xb0\xba\xa9F\x0f\xe9kod\xd1\
+XLVUU\xc9D\x22!m[\xca\xaa\xaa*y\
+\xe0@\x95\xacoh\x90\xcd\xcd\xcd\xb2\xa9\xa9\xe9\xe0\xc9\
+\xe1\xc8pHL\xa7\xfb\x9f\xc0P\x846\xa9\xb7}\xdb\
+\xf6\x86\xd7^{\xe3\xe9\xbe\x03\xfasONt\xca\xcb\
+]\xebd\x81SB\x13^S\xdb~\x0d\xcc\xc1\xd4\xf3\
+\xa3\xe8\x9cN\xba\xf09\x09\xea\x22\x83n\xb1@\x97\xc6\
+\xbd\xe0\xa0\xde\xabij;\x82)\xaf[\xe8\x00I3\
+\xb5eJ\xa7e\x1c\x9c\xf4Q\x92\xca\x07\xed\x83\xae\x92\
+\x82\x82\xf0E\x17^x\xc9M\xbf\xfc\xe5=]\xbbw\
+o\xa7\xc5\xee\xd5z\x8b*\xeaa\xe3\xc6\x8d\x88D\x22\
+\xfb\xea\x1b\xea\x0f\xd474VUW\xd7\x1c\xa8\xaf\xad\
+\xabi\xdb\xae]]8\x14\xa8_\xb5jUsuu\
+usqqq$\x18\x0a\xc5\xe2\xb1\x84\xdd\x1c\x89\xa0\
+(\xbf \xb0s\xc7\x8e\xbc\x92\x92V\xb9V\xc0*(\
+o\xdf\xa1\xb8M\xdb\xb6\xc5\xb1h\xb4\xa4\xb0\xb0\xa0\xb8\
+\xa4\xa4\xa4\xb0\xb8\xb8\xb8U\x22\x11/\xedP\xd1>/\
+\x9c\x9bc&\x84{\xd8*S\x7f\x04\x15\x15Z\xc8\xdd\
+\xefL\x09w\xde\xce\x9d;k\x1f\x7f\xfc\xcf\x0f\xbe\xf2\
+\xafW\x9f\xd9\xbce\xa3\xba\xcbP\x95\x1f\xba\xd6\xc9-\
+\x90q\x0b\xc4jYN\x078\x994\xc9\x9cN?\xb8\
+G\x97\xb4\x1c\x97n)\xd7\xba\xfa\x9c\xbe\xaa\xb4\x07\x9c\
+DN\xe1\xd4\x86i\xc7T\xc6rJ\xad\xee\xedW;\
+\xa2\x0e\x82\xeai\xd5\x8eqm\xd02\x1c\xf38\xe0h\
+\xd6)=5f:\xc3\x86v\x15\xe5\xc8\x0d\x86\x10\x0a\
+\x06\xc7=\xfd\xe4\xd3\x0fN>\xe1\xb8I,u\xa64\
+-\xf8W\xfe\xaa\xeaZ,Y\xb8p\xed\xce\xbd\xbbW\
+o\xda\xb8icQ~\xd1\xb6PNx\xf3W\xb3\xbf\
+\xdc\xb4d\xd1\xa2-\xcb\x97-\xdf\x09\x00G\x1du\x14\
+\xa6O\xbf\x12\x95\xdd*\xf1\xd2\xdf\xff\x8em\xdb\xb6b\
+\xca\x94)\xa8\xaa\xaa\xc1K\x7f\x7f\x095\xb55\xc8+\
+\xc8\xc7\xfa\xb5k\x91\x97\x9b\x8bQ\xc3G\xa0\xbe\xa1\x01\
+\xdbv\xef\xc2\xee\x9d\xc9\x0d{\xa1PN\x9b\x0e\x1d:\
+T\x5cu\xf5U\x1d\xc3\x81@\x97\xaa\xea\x9a\xce\xdd\xbb\
+u\xef\xd4\xb9\xb2K\xf7\xde\xbdz\xf7\xee\xda\xb5\xf3\x0f\
+x\xb2\xa1\xf6\xb7E\xcc\x02\x00,Y\xb8d\xf9\xad\xb7\
+\xde\xf6\x9b\xcf\xbf\xfa\xfc\xdf]\xbav\xc1\xfau\xebT\
+\x84~\x09p\x80*\xbcZF\x95Y\x93\xec\x99\xf4\x06\
+$\x9dn\xfeQ\xdb\xd1\xed\x12\xa4\x0e\x94\xea+\xc8=\
+\xa5\xc3I\xb3\x80\xccsj\x8ePz\xedTvB\x08\
+\xee\xd1\x85\x93\xcfY\x22\xce\x9a\x81\xc9\xd3)\xbf\x0eT\
+\xc6QF9\xb8\xe9Qa:C\xc21\x1c\x81@\x00\
+W\x5ct!^~\xf5\x15\xf4\xac\xec\x16\xfa\xed\xaf\xee\
+z`\xe4\xb8\xd17\xb5.-k\xb9\x9b\xf6\x04\x1e\xa5\
+\x94\x12\xdf}\xb7`\xd5\xb7\xdf~;\xeb\xcb/\xbf\x5c\
+<v\xec\xd8u\xf99\xf9\xab\xef\xbe\xf7\xee\xcd\xbbv\
+\xef\xc4M\xbf\xf8%\xce:\xe7,,X\xf2\x1d\xc29\
+9\x08\x04\x02H$\x12\xe8\xd0\xa1\x03\xf2\xf2\x92\xaf\x0f\
+\xb4j\xd5\x0a\xf1x\x1c\xe1p\x18O=\xf5$6o\
+\xde\xecj\xa3\xb1\xa9\x09\xb3\xe6\xce\x86m\xbb\x87(\x16\
+\x8b\xec\xdb\xbcy\xe3\xbe\xb7\xfe\xfd\xe6\xb2\x1d;w`\
+\xc7\xf6\x1dIJ\x85\xc8\xe9\xd5\xbdG\xaf~\x03\x06\xf4\
+\xea\xd9\xa7w\xef\x91\xa3F\x8d\x1e9l\xd8\x84\x9e=\
+{\xba\xa3!WG\xd4.2N\xd8`\x039\xa1\x1a\
+2|\xc8\x80\x0f>\x9e\xf9\xe6\xc7\x1f~\xfc\xea\x8b/\
+\xbex\xd7\xfau\xeb\xd6\x02\x90\x81@\xc0J$\x12.\
+ag(\xa0\x8e\xcc$\xfb\xb4\xbe\xcePp\xf5\xa92\
+\xd2\xb2\x5c\xaf\xfdD\x04\x9cbsQ\x8a\xae\x8d\xac/\
+\x03\xd1\x0a\x1cst\xfb\xac)a\xa6\xed\x95\x00\xaf\xb0\
+\xd4\x00\xe8\x94\x16$\x9f\x1b,\x8e\xd1~B\xaf\xac\xb2\
+\xbf\xbe\xe3\x0e\x8c\x1a4\x00;v\xec\x98t\xf3\xad\xb7\
+?z\xf8QG\x0ewQm2\x03^bd(\x5c\
+]S]\xf7\xcd\xdco\xe6\xbf\xfe\xca\xab\xef\xed\xd9\xb7\
+o\xc1\xd8q\x87\xad\xff\xfc\xf3\xcf\xb7\x7f\xf6\xd9'X\
+\xb6l\x19\xfa\xf7\xed\x8bX<\x86\x9c`\x0e\xbe\xf8\xf2\
+3\xec\xd8\xb3\x03\xb9\xb99(//G^^>\xea\
+\xeb\xeb\xdcMJ\x89\x9c\x9c\x1c\xd4\xd77\xa8\xca\xefj\
+\xd4\xb6\xa5N\xb8\xf0\xddw\xdfQ|\x915\xeb\xd7-\
+[\xb3~\xdd2\x008\xe5\xb4\xd3\xac\xef\xe6\xcf\xef\xb9\
+e\xd3\xd6\xeeC\x86\x0f=\xe2\xcc\xd3O\x9f\xda\xb5S\
+\xc7\xbe9yy\x19\x05d\xfb\xecf\x86\x7f\x96&K\
+\x0a!p\xec\xf1\xc7\x9e\xd3\xb9K\xe7\xa3\xc2\xf99\xf7\
+\xac\x5c\xbe\xf2\x89K.\xb9\xc4\xfe\xe5/oACC\
+\x83:\xe6:\xc3/\xc9\x7f\x9dL\xd0r\x1cp\xedx\
+E\x024\x1d\x862\xa6h\xc0D'\xab[Adw\
+F%DUb\xdd\xfeg?\x8cU\xcb\xa9!\x0e\x94\
+4\xa9\xa4\xfb\x8d\x02h(\xcf\x01g9M\xe5\xd3\x10\
+\x08\x06d\x22\x9e\x80HH\xe4\x15\x16\xff\xea\xa9\xe7\x9e\
+\xfbM\xc7N\x9d\x83\xda\xda&\xd3\x05\xe8\x87^\x81\xbd\
+{\xf7U/^\xb0h\xf1ko\xbe\xf6\xc6'\x9f|\
+\xf2\xc9\x96\xcd[6I\xc8(\x00|\xfa\xc5\xe7hS\
+Z\x0aa\x09\xacZ\xb5\x12\xabV\xad\x14\x00 \x04\xe4\
+\xc2\x85\x0b\xb0p\xe1\x02X\x96\x85\x8e\x9d;\x03\x02p\
+\xce\x12(,,D\xa7\xce\x9dQXX\x08)\x04\x9a\
+\x9b\x9b!,\x01\x99\xf4\xf4&\xbe\xa9T\xeb\xa8\x97\x00\
+`Y\x16\xde}\xfb?\xb6\x84\x5c#\xa5\x5c\x93W\x98\
+\xff\xc1\x8c\x193\x1f\xf8\xcb\x13\x8f\xf5:\xe3\xd4\xd3N\
+>u\xda\xb4\x13\xfa\x0c\x18\xd0\xbf\xa4\xa4U~V+\
+\xea\xba\x80H\xbe\x7f\xc0Av\xaa;\xa5_\xff~\xed\
+^|\xfe\x85?\xbf\xf5\xd6\xdb\x87\xaf^\xb9\xf2\xe7\x81\
+P`\xbb\x10BJ\x99\xee'\x13r\xb0\x81\x05\x8dn\
+Mr\xc3\x95\xd3)$\xc5E\x9d\x98N2\xa8\xfc\xb2\
+\x91*\xf4\x8e\x97\x93\xc6\xacqo\xe9\xea=]\xad\x17\
+\xe4\x07%\x1d$\xcfkE\xd4\xf4\xd8\xcei\x93\xa3\xcd\
+O\x1b\xecj\xa8J\xa3%\x04\xfa\xf5\xed\x8b+.\xbd\
+\x08#\x06\x0d\xea\xf6\xcaK\xff|_\xbb\x04n3?\
+g\x09\x5cy\x1e\x9e\xce\xd4,\x88/^\xb2d\xf1\x93\
+O\xfc\xe5O}\xfb\xf4\x1fJ\x07F\xa1M}\xe4\xc3\
+\xf1\xd5%<V \x80\x9bo\xbe\x19/\xbc\xf8\x12n\
+\xbb\xe3\x0e\xfc\xec\x17\xbf\xc0\xc0\xfe\x03\x10\x0e\xf9:;\
+@\x17Y\x99\xf2\xd3i\xc1`0\xfd\x94\x04H\x1a\xa3\
+q\xe3&L|\xfe\xf9\x17\x9f]\xb6|\xf9r\xfd\xea\
+\x7fK\xd2I)\xa5\xd8\xfco\xbf\xddt\xec\xe4\xc9\x93\
+\xc7\x8d\x19\x85\x9e=\xbbS>\x1dL\xffu|\xe6\xd2\
+i\xbe\x9f\xc7s^\xbaF\xf3\xa9\x0c\xeb\xfaH\xf3|\
+\x03mH}\x04\xe8\xe7Q\x1eg\x0c\xb8\xc7n-}\
+L\xa7\xe6\x81\xa4\x83\xc1C\x19\xc31\xc4\x95\x1f\x0c\x04\
+P^\xda\x1aw\xddy\xfb\xb4\xad\x1b7\xecb\xe5\xd0\
+\xf4\xa8\xdeI\xb4\xf5\x0a\xef\xc0;\xef\xfcw\xc6\xf9\x17\
+^tU(\x14.lU\xd4\x0a\x01+\xe0R\x1c\x86\
+'&!t\x81\x10\x02\x83\x07\x0f\x86\x95yf\xfec\
+\x03gp\xd3`Y\x01\xb4o\xdf\x01\xa1\x9c\x9c\xb2\x8b\
+.\xb9\xf4\x9aw\xdf}\x7f\xa6F\x95\x99\xad\x03z\x86\
+\xeb\x1eG\xd6TU\xc9\xdf\xfe\xfaWw]u\xc5e\
+\xa8\xec\xda%M\x86p\xcb\x0e\xa5_\xbd\xf6\xa3`&\
+\x05\x05I\xd3=\x9a\xe3\xc6\xd7T\x8esj\x5c\x1fL\
+\xe3\x92\xee\x87\xce2\x98\x14\x90k\xd8\xeb\xa5\x1e\x93q\
+\xa0\x1b{\xfc0H\xa7\xcc&#A\x19\x95U\xcf\xb2\
+\x04\x0ar\x82\xf8\xd95W\xdfU]U\x95\xa5\xd3\xc6\
+\xfbl9f\xcb477\xc9?\xff\xf9\xcf\x7f\x1d?\
+~\xc2QY#eY g\x00\xe8,\xfa\xa1\x04\x93\
+\x22\xfc\x90v=\xe9\x9et\xc4\x11\xc7\xfc\xf9\x89'\x9e\
+ojjv\xb3\xce\xb4w\xa8\x05{\x1e\xe3\xf1\xb8\x5c\
+\xbc`\xc1[\xe3\xc6\x8c.V\x9a\xb5\x04o@M\x8e\
+\x83\xde\x9b\x14S\x97g2\x00:\xfd\xf0\xfb\xa3\xc6\x8a\
+\xa3\x9f\xeb\xab\xb6\xe3~\x89\xe1\xa6\x04:k\x08MG\
+\xb9{\x01~\xd7\x9fs\x0fdw\x9c\xa3\x07\x0c~\x8e\
+q\x00\x80\xb0%\xf2\xff\xf5\x8f\xbf\xbf\xa4Uf\xd5\xdd\
+xm\x97%R\xb9\x7f\xff\xfe\xa6\x87\xff\xf8\xc7g&\
+L\x980\x82xyupL\xf7~\xea\x1c\x0c\xe8\x84\
+D\xbd\xfe\xa1\xedpr\x96\xcc\xb0\x02\x980\xe9\xc8Q\
+\x8f<\xf4\xe8\xd3uuu\x8d<\xe3\xbd\x8d\x80\x09>\
+\xfd\xf8\xe3e\x87\x8d\x1d3D1\xae\xaa\x11\xa0\xce\x82\
+s,\xb4/&\x87\xe2eLL2\xdfR\xa3B\xfb\
+\xe0\xc7\xb0\xb1\x9d\xa1\xca\xe0',\xa7\x8d\xea\x14;@\
+\xca\x98\xac\xa1\x97\xd7\xd7\xd1\xa4\xeb\xb0\xce\x12\xab\xf4\x00\
+\x00ztl_\xf9\xe5\x07\x1f\xccf\xa5\xca\xeff6\
+\xdb\x96\x09;!\xe32\xf3\xfe\xcf\xf6m\xdbb/\xbf\
+\xfc\xca\xab\xc7\x1cs\xecP\x0d\xff=\x07\xe9G\x02\xae\
+=\x93P\xd22*\x0e\x9d\xe2\x98\x8c\x89\x05\xc0\x0a\x04\
+2oM\xf7\xec\xddg\xf0s\x7f\xfb\xdbK\xb5\xb5\xb5\
+\x8d\x06.\x1b\xf8O\xc7)s\xb3m\xf3\xe6\x03\x17\x9d\
+\x7f\xc1\xc9=\xbaV\xa6\xfb/\xb2\xfb\xcf\x8d\x83\xc3\x03\
+\xb5\xff&e4\xe1\xa1\xb8\xe8=\xad{\xb0Q\x01\xc8\
+5\x8d\x10\xd2\xd7&\x85\xe4\xee\xb90_\x17\xfa\xab\x06\
+\x80~\x85H\x17\xfe\x98\xc2'\xae\x03\xbaP\x9f\xd6\xe1\
+hKO\x8e\x07\xf5\xe95r\xf3\xfau\xdbX\xe5\xf7\
+\x93\x96Z\xe8\xb3e<\x9d\xd5\xdc\xd8(?x\x7f\xc6\
+'\xd3\xaf\xbcb2\x00\x04\x83!XI\xcf\x9f\xea\x83\
+\xe0\xfa\xa3\x08\x8c\xa0yp\xe7\xb7\x08\xb8z\x9c\x17\xa3\
+\xc6\x91\xa3\x81\xd2\xab\xf3\x84\x1c\xed\xbe\xe8\x1f5z\xcc\
+\x84\xb7\xfe\xf3\xce\x7f\xdd\xacV\xde10\x19\x00\x034\
+\xd4\xd5\xc9\xdf\xdfs\xcfuSO8\x0e\xa1P\x08\xc8\
+6\x02:E\xe2d\x8c\xdeSGd2\x12\xdc\x98\xea\
+\xe4\x81\xd2\xa1F\xb6*xE\xb9\x9c~\xb8\x10\xd3\x0a\
+\x5c\x9e\xee^\xa7\xa0:\x828A31\x8e\x96\xa7\x0b\
+\x92\x9c\xe1\xd2u\x1e\x0a.\x9c>\xe5\xa4)U{\x95\
+}\xfc\xa6P^\x97G\x04o\xf6\xacYk\x1f\xff\xd3\
+\xa3\x97]~\xf9\xa58\xf3\xcc3\xc98\xa5\x0d\x00\xe1\
+S\xd6\xfd\x8fa\x00<\x8c\x0e+x\xbaz\xa6\xb0\xd9\
+\xab\x1d\x90{*?\x00\x80\xe3O\x9cz\xda\xe7\x9f\xcf\
+\x9aCu\x9c\xbe#\xc0\x8e\x15\x1d\x97\xd4u}}\x9d\
+\x9c\xf1\xf6\x7f\xee\xbb\xf4\x82\x0b\xd2F@\xf3\xd3\xf1D\
+\xd7\x17/\xc7\xc5)\xb3I7LJ\xac3 \xb4.\
+\xe5-5\xfa\xae\x8a\xb4\xc3\xea\xbd\x0eL\x82i\x22\xdc\
+\xcb\xd3\x98BQ\xbfa\x11\x90\xdda\x01\xc5\xf3_r\
+\xf6Y\xe7&\xa2\x91\x98KHt\x8f\xf8\x5cexW\
+c\xdb\x09\xf9\xd8\xa3\x8f<\x98\x1b\xceo\xd7\xae];\
+L\x9f~\x05\x82V\x88\xe3\x87\x03)\xfa\x84E\xee[\
+\xa2\xe8\x9c@z\x95\xe5\x14\x94\xe6s\xf8\xb9\xf1\xd3\xc9\
+\x8f\x1f\x03\xa0S\x944\x84s\x0as\xaf\xbd\xee\xc6\xeb\
+v\xec\xdaU\xcdj\xb6\xd7\x8b\x86\xcc8F\x22\x119\
+\xfb\xb3\xcf\x9f\x0e\x87B\x1c-\x1c\xcf8\xdeQ\x1ey\
+9 N\xae\xfd\xca\xb6\x97S\xe6\xe8\xa5\xf7T\xf6\x5c\
+\x9d\xe2B\x18\x93\x80p8\xe8\xbd\x0e/-\xa3c\x1e\
+\x97oJ\x87\xa1\xac\x85\xa4\x96\xa5\xe9\x9c~\xd1\x85\x97\
+\xc7#\x11\xde\x83x\xcd\xff\x99\xb4\x8f?\xfeh\xde\x89\
+'\x9ep\xc4\x90\x81\x03)\x8fU\xbeX\x22y\x12\x93\
+c\x88Te\xe7\xfa\xa2\xe3\xf9\xc1\x80\x1fE\xa4\xe3\xe8\
+\xd0\xa5k\xdfd|\x0f\x86nZ?\x0d=z\xf6\xee\
+\xf5\xdcs\x7f{\xa5\xb9\xb9\xd9<\x10t\x9c\x0c\xf7\xcf\
+>\xf5\xd4\xcb\xc2\xfdqS\x93\x11\xd0\xc9\xb3n\xeak\
+rR-qb\x9c\xc2\xeb\xf4H\xc7G\xdd5+t\
+:\xeb\xc5Y*\xdd|H\x87G\xc7,\xaf\xb3\xcft\
+uuL\xe3\x98\x93\xf6RW^r\xf1tV*\x0c\
+a\xbdN\xd6\x9a\x1a\x1a\x12\xf7\xdf{\xcf\xef\x01\xe4\x00\
+@(\x14\xa4m+\xf7\xc2\xb9V\x95\x9f\x96\xe5\xc6\xe3\
+\xc7\x04?\xca\xabSL\xae\x0e\x95)\x90z&\xdc\x1c\
+=\xae\x90\xf5\x9e{\xee\xbb|\xc7\xf6\x1d;\xb4\xe3\xa2\
+\xbb\xd7\xd8\x89w\xdfz\xeb\xdf\x81\xccJ\xa4\x17\x0fL\
+N\xc8\xcbAy98\x13\x0f8c@y\x9b\xc5+\
+%\x0fJ\xfb\xce\xb5P/t\x83\xeb\xd5\x01S\xa7(\
+\x0e\x9d2s\xfb\x00\xfc\x1a\x0f\x8a\x9f\xd2\xee\xf41m\
+\xe5/8\xef\xecK\xb34[7\xafw\xed\xec\xcb\x16\
+\xa2y\xdf|\xb3\xfe\xc8\x89\x87\x1f\xcb0\x5c\x10\xf9\x11\
+\xc8\xac7\xa5hS\xaf!\xb2\xef\x7ft\xd0\x8d;5\
+\xeaN\x9a\x1fE\xe5\x94\x9f\x931\xae\x7f\x9c\x01t\xd1\
+#\x84\xc0\xd8q\x13p\xd4\xd1\x93+_|\xf1\xc5\x8f\
+\xb9qt\xed!\xa0\xca\xaf1\x06\xaf\xbd\xf2\xca\xdb\xd0\
+\x7f-\xdbK1\xa9\xc3\xd2\xe9\x88W\xa4\xc0\xf1\x833\
+\x10\x5c\xf8O\x0d\x80\xd6\x80R\xe0\x88s\x10\x98\x88\xa6\
+\xf5\xb9\x01W;b\xea\xbc\xe9\xc71\x5cg`\xc0\xa4\
+g\xb8!\x04\xce>\xf3\xb4s\xa4\xed>\xa2/-\x18\
+\xea\xff\xact;+\xff\xe3\x0f?\xf8\xcf\x0d\xd7]\xdb\
+\xbeua\x89\xa6\x9f\x96\xda\xd7\x94\x01p\x19\x07\xa2\xfc\
+\x82\xf6\xcd\x0b\x0e\x85\x91\xe0\x8c\x00'X\x9c\xd15\x8d\
+\x8d\xce\xa0\x98\xfa`2\x0a\xae\xbc\xa2\xa2\x12\x5c:}\
+:^~\xf9\xe5{jk\x95sXl[\xda\xea\x12\
+\xa1.\x8ac\xa2\x81\x97_z\xe9\xcd@\xc0\xa2ms\
+\xe3a\xea3\x95[ \x9bw:\xd9\x85G\xbe\x97!\
+\xa2m\x98\x0c\xb2\x0b\x11-\xc8)\xa1W\x18\xc3yf\
+/A\xf1c19\x01\xd0\x09(\x90\x8d+\x00\x00\xc3\
+\x06\x0f\xc6\x9f\x1e\xfa\xe3)U\x07\xf6\xc7\xb3\x87\xbe\xe5\
+p\xef\xef~w\xdf\x88\xa1Cq\xd8\x98\xc3\xd0\xba\xa4\
+De\xac\x95T\xe4\x94r\x0b\x04\xe0^z\xe0h\xa7\
+\xfd\xf3\x0b?\x96\x01P\xd3\xfd\x8c\x17U\x12/\xa56\
+\xb5\xedg\x9c\x05\x00\x5cs\xc3\x0d\xf8\xd3#\x8f\xe2\xf4\
+i\xa7\x9d\xba~\xc3\x86}n-\xe7\xb4\xde\x1b^x\
+\xee\xaf\x7f?H\xde\xf8\xe1\x87.\xcfT\x9f\x1a\x00/\
+\xe3\xa33D\xba<O+f\xb2(~\x08\xe2\xca\xe3\
+ pQ\xa6\x99\x840\xab\x93'\x1ew\xccD)\xe5\
+\xc1\x9d}\xa5@MUU\xe3yg\x9cqiA~\
+.r\xc3\xb9 tY\x00,\x0b\x81$-)\xe5W\
+\x16\xfdRe\xa9\xa7g=\xff\xa1Pn/\xe0\x0c\x91\
+so\xf2L4Mh\xca\x9a\x14X\xa7\x08\xdc=G\
+\xa7\x10\x10\xb8\xe4\xe2K\xd0\xad\xb2\x07\xdaU\xb4\xef\xfd\
+\xe9g\x9f}\xa3\xb5\x01-\x80\x17\x9e\xfb\xeb\xc3\x93\x8f\
+<\xc2\x0f\xafL\x0a\xc8\x95\xd3\xc9\xbb\x89?:\xe7\x08\
+C\xbeW{j9\xdf^\xd6\xab\xf3*\xe8\xc2}\x93\
+\x91\xf1\x13}\x98\x18\xad\xd6Q\xfb\x80I\x93\xc6U\xae\
+Y\xb9b\xb7/\xe1p\xe6\x8f\xb6\xcc:\xceo\xdb\xe6\
+M[\xc6\x8f\x1e}\x04\x00\x08a\xc1J6%R-\
+9\xa1|\xf2\x7f\xf2\x9d\xd6\x80\x80\xa5\xce+)\xafM\
+J\xfeS\x18\x00S\xdb&Y\xd0\x09\x94:^\xb4,\
+\x0ceM\x86F\xd7v\xa6@\xeae'\xcb\xb2\xf2\xde\
+|\xf3\xcd\xd7\xd2C\xa9>\xae5\xed(f\xd2\x1f\x7f\
+\xf8\xa1;;w\xec@_\xa4j\x89\xac\xfb\xd1\x01\x9d\
+<\x9b\xda\xf3\xca\xd7\xf2I\x07\xba9\x86\x93\xe7\x07\x09\
+\x17v\xeb\x22\x08\x93\xe2r\xf7\xa64\xb5\xc3\xace-\
+**\x0c.^\xb0p\x8dK(\xd2\x03\xaf\x8c\xbe:\
+id\xe6\x89\xdf\xcc\xf9za\xb7.\x9dz\xb1|\x13\
+N\xfb\xe9\xd0?\xf5D#m`U\xe0\x06\xf0GP\
+\xf6C\x8e\xd6D7\xbd\xe7\xe6\x9dN9n>\xaa3\
+*-\xee\x84\x10\x02\x7f\xfc\xe3C\x7f\xca(\xb8j\xd1\
+\xa5\xf7/\x05\x8d\x8d\x0d\xf2\xb6\x9bo\xbaX\xd3g\x1d\
+/\x9c\xfe\x99\xbeZ\xc4\x19\x03]T`\xec*C\xc3\
+A\x01\x1d\x10\xd3\xe0\xd0\x06\xe9\x80\xeb\x14\x95\x13\x14\xd3\
+\x14\xc0\xcf\xd4\x80\xf3\x1aj\x1d\x08\x01|\xfa\xc1\xc7\xef\
+\xdb\xd1\x84\x9c?\xff\xdb\xc5F\xf3\xaf\x18\x00;\xe1v\
+\xfd\xffy\xfb\x8d\x19\xe1P\xb0\xc4iK@\x04-X\
+!@\xa4\xe6\xf8\xe9y\xbe\xe3\xf9\x1dc\xc0\xf1\x94\xc2\
+O`\x002\xff\x85\xa0\xf6\xc8\x17\x22S\x03:\x0f\xc4\
+\x19\x00\xd7\xf8h\xf0q\xb8\xe9\x7f]\xbd4\xfc\xfc\xa6\
+\x9bns\x0d3\xd5p\xafG\x87R\xca\xda\xea\xaa\xf8\
+\xc8\x11\xc3'04\xf9\xa1\xbf%\x06\xc0\xcb\xf0y\xc9\
+\xbfn\x9am\xd2\xbft9\xce\x00P\x02ta\x1a\xf5\
+\xf2^\xa1\x0f4\xe5\xfc2\x84vD\xa5\xcf\xc1\x93\x8e\
+\xd9~\xfb\x9b\xdf\xdc'\xa5\x94\xffs\xe7\x1dw\x1dw\
+\xdc\xd1\xa7\xb8\x05\x82\xb9Ny\x0c\xf5!\xc1\xeb/\xff\
+\xe3\x1f\x96\x10\xcev1K@\x84-XA\x01\x11\x80\
+@\x00\x02\x01\x01\x11\x10\xb0,\x08~\x0a\xa2a>4\
+\xe5\x0e\x11p\xfa\x03\x0c\x1e<\x149\xf99\x10B\xc0\
+\xb2,t\xe9\xd2\x85\x9e?\xe0E\xafiLh\xe8\xef\
+%|\x1c^\x1d\x0d\xdc\xbd\xae\x1e\x00`\xfa\xf4\xe97\
+d\x1b\x01\x0d\xd0\x880\x05;wn\xdf\xdd\xb1c\x87\
+\xce\xa4=h\xda\xa4t\xf91\x02\x9c\xae\x98\xf8\xc5\xf1\
+B\x17\x1dS\x1a\xd8H\x83\x222Y\x11S\xa3:<\
+^\x8an*k\xa2\x8d\xbb\xb7\xc2\xa1 \xbav\xe9\x84\
+\xe9\x97]v\xaa\x13\xeeW\x94\xb7\xa9\xcc\x09\x07\xdb\xd4\
+\xd6V7\xf0\x03\x9f\xbc\xb0\xed\xe4\xcf\x81g\x9ey\xf2\
+ye<\x83\x10\x22\x94\x9c\xd3[\x8e\xa1Q7\xf3X\
+\xca\xb5\xf3\xf3\xb3\xc3\xecG\x02\xde\x00\x0c\x1f>\x02\x00\
+p\xc7\xed\xb7\xe3?o\xbf\x8d+o\xb8\x1e\x0f\xfe\xf1\
+\x8f^\x95\xfd*\xa1IPa\xa8C\x0d\x05\xad\xa7k\
+\x97\xa3\xdbe\x84/\xbfr\xfa\xf5\xd9\x03\xce\x09\x81>\
+\xff\x9b\xd9_\xcf:j\xd2\x84pQA>G\x97\x89\
+g:\x07\xc9\x95\xf3\xc2\xc5\xe13\x8d\x8dN\x87\xb3x\
+i\xb2F~\x8d\x01gy\xb8{\xdaY\xdd\xd4\x010\
+\xb7\xa3\x130\x00\xc0\xf8\xf1cz\xef\xdb\xb7\xafVJ\
+)\xbf\xfe\xfa\xabo\x9d\xf4\x0f>\xfc\xe0\x13\x9d\xf5O\
+$\xdc\xca\xff\xfc_\xff\xfa\x9c\x822\x08\x81\x90\x80\x15\
+\x14\xb0\xd2\x9e\x1f\xb0,\x81@\xd2\xf3\x0b\xd7\x1a\x80n\
+\x0e\x9c$8(r\xda\x94\xb4\xee\x04 \xa4&se\
+\x0f\x1ex\xbd\x1b<x(\x00\xe0\xc1\xfb\xef\xc7\xecY\
+\xb3p\xd6\x05\xe7\xe3\xb3\xaf\xbe\xe2*\x9a\x84\xdc\xa4\x88\
+\x5c\x9e\xa9o\xba\xb5\x02\xaf68zR?a\x09\x88\
+\xb4\xf1\x9d~\xf5\xd5\xd7\xb3\x83n\x04w\xfe\xf3\x7f}\
+\xe6/\xed\xdb\x95:\xd1\x92\x89^5\xef`e\x98\xd3\
++\x9d\xd2s\x0eVg(X\xfez)\xb5\xaeS\xba\
+\xa8\x80\x1a\x0b\xb6Q\x06\x97\xce\x0a\x9a,\x1c-\x8b\xd6\
+%\xc5\xb9s\xbf\x9e\x9d>s\xee\xd8\xe3\x8e>\xc5)\
+4~\xe2aG\xb3/\x91\xd9\x09\x99H\xa8\x9e\xff\xa9\
+,\xe5\x07D\xd2\xf3\x0b\x04\x91\x0a\xfb-\x04\xacT~\
+\x00\xc9\xf3%\xfc(\x08\xc6\x8e\x1b\xd3\xf1\xd1\xdf?\xf0\
+\xfcQG\x1d5\xb0\xa88}P\x8d\xb1\x8e\x070\xf5\
+\xcc\x06\xe0\xf6\xdbn\xc3\xc7\x1f~\x88SN?\x1d\x9f\
+\xcf\xfa\x0a'\x9d4E\xadH\x0d7E\xeaG\x90\x8d\
+\xe3D\x08\xf3*\xc7\xb5\xaf\xde3\xceK\x04\x04\xd2S\
+7\x5c\x7f\xfdu?\xff!\x06\xc0N$\xe4\xc5\x17\x9f\
+w!C\x0f\xd7o\x07\xb8\xe95\xe7\x1c\xfcF\xd2 \
+\xe9\x00o\x008\xbe\xe8\xda\xd0Z\x17/d\x5c\xb4\xc0\
+E\x12\xba\x0e\x99~\x5cD\x00R\x06\xe4\x1a]\xbbt\
+\xc5\xcc\x19\x1f\xbc-\xa5\x94;v\xec\xac\xbb\xf6\xda\xab\
+oLe\xa5O\x11:\xfe\xd8cN\x9a5k\xd6\x22\
+:\xb8\x0e\xfc\xe3\xc5\x17_q\x0d\x8c\x10!@\x04\x91\
+\x9c\xf3;\xc6\xc0JO\x032\xf7&C\x068\x8f\x07\
+\x01\x0c\x1f6\xa4\xdf\xfe\xfd\xbb\xa3?\xbf\xf9\xa6ss\
+Rg\xf6\xbb\xcb\xb6\x18|\x1b\x80A\x83\x06#\x10\x08\
+\xe0\xc1\xfb\xef\xc7\xbb\xef\xbe\x8b\xe3\xa7N\xc5'_|\
+\x8e\x1bn\xf8\x19B\x81 WQ7\x16jYn:\
+\xc6\xe1:X\x03`\x92\x13M\x9e\x08\x08X.#p\
+\xe7\x9dw\xfe\xce\xac\xf0f\xa3PWS\xdd\xd8\xb9k\
+\xa7>\x06\xbaT\x9e\xd1\xfeQ~\xfa\xd1\x03\x0eLm\
+\xb6D\xa7\xd2\xf5uD\xb5D\x91u\xa1\xbc\x17N\x93\
+\xc1\xe0\x94\x89\x96MCNN\x08\x97_r\xe9\xa9\xff\
+\xfd\xcf\x7ff]z\xe9%g\x1d~\xf8\xa4\x8eN^\
+\xc8\x12\xf9AK\xa4\x8f\xa3./\xaf\xc8;\xfb\xecs\
+G\xfe\xfa\xb7\xbf\xfd\xe3\xbe\xbd\xfb\xd3\xfbHg\xcc\x98\
+\xf11\xdc\x1fKqV\xf7\x1dO\x1f$\xca\xef<\x01\
+\xa0|\xd1\x0cV2\xeb\x92\x8b/\xbeAJ)\xef\xbf\
+\xff\xfe\xc7\x00 \x1c\xce\xc5\xf8\xf1\xe3Q^\xde\x96\xd6\
+\xf9\x01\xe0B!\x9c\x85\xbe\x8a\x8a\xf6x\xea/\xcf\x04\
+\xb6o\xdeZ\xf4\xf8\xe3\x8f\xb5:v\xca\x94\xe2\xff\xcc\
+x/g\xc2\xa4\xc3\xd1\xb1}g\x9cs\xd69*\x02\
+\x87\xdf\xeac-\xae\x01.\xf2\xe3\x8c\x85_\x82M\xca\
+\xcf\xa5sx, \x19\xa9A\x91\xa3\xdf?\xfc\xf0c\
+\xbc\xa7\xf7\xb7[p\xf6\xacYs\xc1\xaf\xed\xe8\x14\xd3\
+\xd4\x1f*\xe3\x94\xa7&\xbe\xd0\xbe\x9a\x0c\x00teT\
+\xe6\xe8\xce\xfd\xd7\x81_!\xa5\xe5\xe8\xd9\xe6\xb4\x1c\xd7\
+IZV\xcd\x03\x00\x0c\x1a2d\xf0\xef~\xf3\xdbg\
+?\xfb\xfc\x93\x8f\xde\x7f\xef\x837\x97.]\xb2\xbdW\
+\x8f\xeeH\x00hjj\x0a\x02\x96Dr\xe0\x12\x0d\x0d\
+\xf5\xf1=\xbbv\xee\xd8\xb5go\xc3\x91G\x1cud\
+EEy\xdb\x05\x0b\x17,\x9d<\xf9\x98\xe3m\xdbn\
+R\xe8 \xdf<\x10)\x1e\xc9\xe4\xe3>\x09\x1b\x10\x12\
+\x90\x5cy\x876Y\x5c\x5c\x82N\x9d:\xa0\xaa\xaa\x0a\
+#\x86\x0e\xed\xf6\xc8\x9f\xfe\xf4\x5c\x9b6m\x8a+\xca\
+\xcb\xbb\xd5\xd5\xd4|\xbep\xc9\xe2\x9d\x97_~\x19\xf2\
+C9X\xbej\x95'C\xfdAz?B\xfa\xfc\xf7\
+\xb3\xa6\x9d6|\xfc\xa4Ig\x8c\x1d3\xe6\x7fJZ\
+\x15\xdf\xd4\xbeK\xa7k'N\x98xi@\xe0\xf4h\
+sd\xe0\xc0\x81\x03\x02\xad[\xb7\xde={\xf6\xech\
+\xaaJ@d\x1eg\xd2\xbe9\xdfs\x10\xe0\xcf\xc3W\
+\xd3h\x99\x96\xc8\x98\x8aKM\xa7\xe7\xeb\xeb\xf0\xbah\
+\xfb\xe4\xa3\x8f>\xe8=``\xdfA\x03\xfa+\xefl\
+gW\x97\xe0\xbfO\xd0\xb9K\x97N\xb1X\xc4\x9e5\
+\xeb\xeb/\x85e\x01\xc9o\x0ep\xfd\xa6\xf4r\x06\xcc\
+)\xaf3\x96\xea\x7f\xaeo\xaa\xcc\xa9\xc0\xf1\xc6\x08\xaa\
+%\xa1\x04sVF\xe7\xb9u\xde\x9f\x86\x90~\xf0Q\
+\xbah\xfdt\xa7r\xc29\xd6\x87\x1f~87\x13\xaa\
+\xd5\xcb\xd7^}\xf5\xa3\x97^\xfc\xdb\x11\xb9\xf9a\xa8\
+e\xcb\xcaZ\xb7\xbf\xe3\xd6[\x7f\xb5x\xe1\xa2\x0dN\
+\xf9\xed\xbbv\xee\xe9\xd8\xb5K/\x057}59u\
+\xedZ\xe0Cv~\x16\xef\x00 8i\xd2\xb8\xf6\xf7\
+\xdd\x7f\xdf\x983\xce8\xe3\xf2U\xcbWlT=\xcf\
+\xba\xb5\xeb\xf6\x5c|\xf1\xa5W\xfc\xe2\xc6\x1b\x07\x0d\xe8\
+\xdb+uF\x95_\xfd\xd0\x82\xcb\xb3t\xebV\xd9\xf3\
+\xa1\x07\xff\xf0XMUMz\xaeck\x0e4\xf9\xf8\
+\xc3\x0f\xe7M=e\xea9\x0a\xae\xa0HN\x81\xb2B\
+G\xe6\x9aK\xe3\x04_\xe7\xc9\x0eI\x7f\xbd\xda\xc8\xc9\
+\xcb\xcf\x99=g\xce\x02OwOb\x04\x07\xa2\xd1\xa8\
+\x1c1b\xc4(\x82[\x07\x5c\xff\xbd\xa6\xb7&\xdd\xd3\
+\xf1\x92\x1b\x1b\xd3\xb4=\x8bG~\x0d\x80W\xc8\xee\xb5\
+ \xe17\x9dv\xc2\x15\xca\xa9\xc4\xdfs\xf7\xdd\xff\xc3\
+\x0d\xdc\xde\xbd{\xe5Yg\x9cv\x9a\xb0\x92E\x83\x01\
+\xabx\xce\xd7\xb3\xbe\xa5\xe5\x8e>v\xf2q\x9a\x81P\
+h\x12\x00\xe0l\xfcq\xeeM\x06\x00\x00PRR\xdc\
+\xf9\xd9\xa7\x9fz/\x1a\x8df\x89\x95\xaa\x83\x1b6n\
+\x947\xddt\xf3\x0b\xadZ\x97u\x17V\x00yy\x05\
+\x08\x87\xf3\xd0\xb2\x83\x81\xd2\x90\xe6\xd3\x94\x93\xa7\x1c\xbf\
+g\xcf\xae=~\x85\xdd\x81\xa7\x9e~\xf2\xd9\x9c\xbc\x1c\
+\xa7\xf1P\xd2\x08\xe8\xfb\xc9\xf0NW\x86\x83\x96\x1a\x00\
+/\xa3\xa2\x93\xa14_\xca\xca\xcb\xbb\xec\xdd\xb3o\xbf\
+\x97\xb2K\xc9\x1e>&\xbf\x993g~N\x9e\xeb+\
+\xc9\xba>\xeb\x94\x94\xeb\xaf\x17\xffZ\x82\x9b\xd3-v\
+\x0d\x80\xf3\xac:\xeb\xa1Sp0\x88\xbd\x94]M\x13\
+\xc8\xa6\x030\xd3\x01\x00\xe8\xd5\xa3{\xff\xba\x9a\x9a\x08\
+3FRJ)w\xee\xdc\xb9\xadU\xeb\xe4\x03\xdc\x9b\
+~\xf1\x8b;h\xfe\x15WMw\x16\x0a\xd5v\x01\x9e\
+Y\x96R\x82\x1b\x0c\xd0\xfb\xd6E%E7\xfd\xe2\x96\
+\x13\xae\xbd\xee\xba\xab^z\xf9\xa579\x1a\x1f}\xf4\
+\xe1\xd7\xfe\xf0\xc7\x87._\xb1r\xcd\xc9\x13\x0f?\xaa\
+\x9d\x15\x08\xa6\xf6\xa0\x1f\x94\xf2\xa7\xe9:\xe2\xc8#'\
+777+\x96\xc7<\xcf\xa59o\xbd\xf3\xd6[\x84\
+\x1f\xce\x7f\x9d\x10S\x81\xe4\xf8\xf4C\x80\x13rS\xbe\
+\x93\xc6:\x98\xc3\x0f?\xf2\xe8\x9a\x9a\x9aD6\x0f\xbc\
+N\x17I\xc2\x13\x8f?vG\x87\x0e\x1d\xd4\xb6\xbd\xfa\
+\xcb\xad\x8d@\x93\xe6\xc5\x07\xae\x9e\xc9\x08P}\xcb2\
+\x00\x5c\xa6)l\xe0\x94\xf6P\xfd\xb8p\xce\x89\x02\x9c\
+\x1f\x00`\xe6{\xef\xf1\xcf\xf6\x158\xeb\xec\xb3\xae\x00\
+\x80\x8f>\xfa\xf4s5\xfd\xb5\xd7^\xfb\x97\xd2\x0e\xd3\
+\xf7\xd4\xf6\xdel\x9a\xbc@+\x04G\x1f}\xd4I\xb5\
+\xd5\xd5uRJ\xd9\xd4\xd0\x10=\xe3\xb4\xd3.\x08\x85\
+\x82hSZ\x8aY\xb3\xe6\xe0\x84\x93NnA3,\
+X\x00p\xfc1\x93;\xed\xd8\xbe\xfd\x80\x17o(P\
+q\xff\xcd\xddw\xdfOp\xb7\x84\x0f\x14\xfc\x0a\xba\x8e\
+\xdf~=\xa0\x03\x5cD\xeb\xc8\x11\x00\xe0\xde{\xef\xbf\
+\x8d\xf6?\xf9\x9f<\x06t\x1d0\x90\xbcilll\
+\x1c5jd?\x9f}2\xf5\x95\xeb\x07W\xc6\x18\xc2\
+k\xf0\xe8x\x96N\xa7\x8aL\xbdlK\x15\xdd\xcf:\
+\x80\xae\x8c\x8e)\xce\xe7\x9cR\x8f\xdd\x92p\xde\xd9g\
+^\xe4)\xc1R\xca\xe7_\xf8\xdb\xdf\x8b\x8b\x0b\xbal\
+\xdb\xba=\xfdF\xe0w\xdf}\xb7\xaao\xdf\xbe\x05m\
+;\x94S\x06:!\xbf\xd3>]\x01\xa7L\xe7\x94\x82\
+\xebO\x1a\xee\xfd\xed\xef\xee\x97R\xca\xbf\xbf\xf0\xc2?\
+\x00 \xaf\xb8\x00GN:\x1c3g~\x8c\x8e\x9d\xba\
+\xb0u\xfc\x82\xb3~\xf0\xfcs\xcf\xbd\xd0B\xddg\x05\
+?\x1e\x8f\xcb\x81C\x87\x8e9\x18Z\xfc\x90\xdb\xc2r\
+&\x017M\xc5\xb4\x86\xe2\xc8\xa3&c\xf6\xec\xd9\xef\
+es\x80\x1c#d\xf3Q\xc0\x1b\xaf\xbd2#\x18\xce\
+|\xd7\x80\xd0\xac\x93\x19\x8e~\x93\x01\xf0\xb3\xfeb\xe2\
+\x87\xe9\xd7\xa2\xd0\x9d\xcbW\xe7\xe7T\xa9Ms}]\
+h\x02%O\xc5\x1b\x10\xca:@~^N\xdb-\x9b\
+\xb7l\xcf\x1a\x13\xd7[}\xc9\x9beK\x97,{\xee\
+\x99\xa7\xfeQ\xdfP\x17\x93R\xca\x86\x86\x86\xc8\x80\xc1\
+\x03F&Y\x97\xe6\xb5\xa2\xecBm\x9f~\x89H7\
+8\xba\x81\xc8\xaa7j\xe4\xc8\x89RJy\xfaY\xa7\
+\x9f\x03\x00%\xa5\xc5\xe8\xdf\xaf\x1f\xfa\xf5\xf3\xefLF\
+\x8c\x18\x81\xb1c\xc7b\xd4\xa8Q\xe9\xdf\xd8\xb1c\xd1\
+\xb5kW\x0c\x1c8`@scS\x16k\xb8;\xbd\
+!\xc8\xc0\xbf^{\xedMM\x7fi\xdft\x86\x8f\xe3\
+[K\xc0\xe4\xcdT\xbat\xebH\x1c\x0e\x01@\xb4j\
+]\x82QcG\x97\xadZ\xbdj\x97\x99\x0bz\xbe\x9d\
+}\xeeY\xd3\x0c\xf4R:i\x99\x96\xf0@\x97nr\
+\xb6\x9c\xee\xa9i\xdaL\x9dQ\xd0!\xd2yw\xae\x9c\
+\x1f\x1c\x8eB\xa6\x7f\x22\xf3\x8c\x1e\x7f|\xf0\xfeG\x8d\
+r\xad\x1e\x0cg\xdb\xd2\x8e\xc5\xa4\x9d\xfaZ\xcfM7\
+\xfd\xe2z\x0d\x033\xca\x9f~\xc6\x9fm\xa0\xc2\xe10\
+\xa6L\x9e|\xd4\xd0\x01\xfdF\x10<\x9c1\xa0\xed`\
+\xec\xa8\x11\x83>\xfb\xfc\xa3\x05}\xfa\xf4\x1a\x02\xe0\xa0\
+V\xfd;v\xec\x88n\xdd\xba\xa1K\x97.\xe9_\xc7\
+\x8e\x1d\x91\x1b\xce\xc5\x9dw\xde\xf1k\x17\x1b\x8c\x8c\xe2\
+\xf3\xd4R[w\xec\xd8]V^\xd1\xcd\xab_\x9a<\
+.\xfd`\x80\xc3A\xc7F\x95!\x8e\x06N1\x00\x00\
+\xc7\x1ew\xec\xc9\x06\xc6d\xf1H\xe5\xcf\xbc\xf9\xdf.\
+\xb3\x02\x96\xb3\x22\xc8\xed\x99\xf0\xdb\x9f\x83\xed?\x1d\x03\
+\x9dse\x0d\x80I\x01iC\x9c\x9555\xec\x87\x18\
+h\xea\xa5\xcb\xa7\x14?\x88\xd4\xdc\xadw\xcf\xee\x83\xea\
+\xeb\xeb\xd8\xd3}l\xb2\xbaN\x05\xfe\xc3\xf7g\xcc,\
+,,\x80\xd2n\x9a&\xe1\x84\xfd\xc2\xbd\xce\xa0\x94\x01\
+\x00t\xebV\x89/?\xfb\xe4\xb5{\x7f\xfb\xeb\xbfh\
+\x06\xc84X(**,\xe8\xdd\xbb\xc7\xd0\x80\x15(\
+@6\xf8\x16\x0c!D\xd2x\xa4_AH\xc2;\xef\
+\xfe7\xbd.\xe2\x9e\xbb\xb2\xdcr\xa9\xbd\xee\xbb;\x17\
+\x5cv\xd9\xc5&R\x0c\xf7^\x9e\xf0`\x80\x93;\xd6\
+\xc3{\xfc\x5cr\xfe\xe4SO?\x97-6\xfc\x82 \
+\xe5\xd0\xf4\xe9W\x5c\xeb\xd0#\xf8i\xadW\x7f\xfc\xa4\
+S\x9d\xe3\x0c\x0d\x17\x85\x9b\xa2z-SL\xd3\x00\x9d\
+\xb7\xd3\x0d\x04\xd7\x8e\x0e\x07\x90Mx\x00\x8a\xf7\x7f\xf3\
+\xf5\xd7\xff\xcd\xebwV\x18\x90\xfa\x9f\xf4\xfc;\xb7o\
+\xaf\xeb\xdb\xa7g\x0f\xf5\xb3\xf5\xe0\xa7/\xaa\xf2\xab\xe1\
+\x7f\x1a\x96-]\xb4d\xde\x9c\xaf\x97*It\xc0\x0f\
+\x85\x00\x18\xf1\xb4-+C\xc7\xf6\x15\xa8(o\x8b\x8a\
+\xf2\xb6(**DAA~x\xc1\xc2\x05\xcbu\x1c\
+\xe1\xb9\xe56\x03nQO\xc2\xff\xdcu\xd7\x1d\x1e\xb4\
+\xb7\xd4\xa3\xb5\x04L\x0a\xc2\xf1\xdc$K\x5c\x1e\x00 \
+\xbf\xb0\xb0p\xcb\x96-\x1b\xb3\xb9\xc4\xad\x0b\xb8a\xf3\
+\xa6M;r\xf2\xf2\xcaRHu\x11\x80\x8eG\x07\xcb\
+7\x93\xa3\xa1\xfa\xc8\xea\xb5Z@\xc2\xbd\xab\x88\xec\x82\
+\xd3\x12Kq\xa8\xb8\x00~\x17\x17\x94<uw\x99\xda\
+\xa1\xf4\x0e.\x91L\xb3\x01`\xcc\x98\x91\x13O>u\
+\xda\xb4d\x09\x99M\x8dk_\x94\x80LoX\x03\x9e\
+|\xea\xc9\xffY\xb5z\xdd\xfaT%\x87n\x07\x89@\
+\xf2}~\x89\xe4\x8e?\x87QY;\xbb,\xcbj\xdd\
+\xa6M\xbbNC\x87\x8f\xe8\x9b\x93\x13j\xa5\xe9'\xdd\
+\xa1\xa5\xf3\x84*\xdf8\x81\xe6vz!\x10\x08\xa0\xac\
+M\x1b\x14\x14\x14\xa2\xa8\xb0\x18E\x85\xc5hUX\x84\
+\xd2V%\xf9\xa1`(GE\xa0'I\xbd\x17\xa9+\
+\x9a\x9f\x84\x82\xdc\x5c\xd7Co\xa6\x10\xb7\x1b\xd0Kv\
+\xfc\x02\xb7\xbb\x8e\x82\xc9\x10\xb9;\x9a\xf9/\x91\x94+\
+\x01\x00M\x0d\x0d\xf5\x0f<\xf8\xe0-\xb6m+U3\
+\xe8\xa4\x22\x9a2%Y\x0et\xe9\xda\xb5\xfd\xcd\xb7\xdc\
+\xf4\xb3Tc\x8e\xfc\x18\xa5\x93\xa4\xfb\x05\xaa#\xa6\x1d\
+\x916\xf4\x03\x0e\xa4\x0c\x007p\x94(G\x01y\xe9\
+\xc8l#v\x1a0\xcd\xc3\xe8\x96c\xae3\x5c]\x1b\
+\x00n\xfd\xe5\xad7\x87\x82!\x0bY\x90\xd2!!\x93\
+\xbft\xe5d\xf5Y_|>\xef\xe9\xa7\x9e\xfa\x0b\x00\
+H)IE\xe9\xc8\xbe\x9d\x92\x0bJS\x9a\x1e!\x04\
+N>y\xea\x88\xb6\xed\xcaKC9\xb9\xa1\xe1\xc3G\
+\x0c\x0f\x85BH\x1d'm\x1aHj\x14\xa9Ah\x89\
+\x10\xc0\x11\xd2`(\x04+\x10H\xfe\xac\x00\xac`\xd0\
+\xb2\xd9E\x85l\xf4\xaau\xc9Xp\x91\xda\x06+]\
+\x83\x90\x80dx\xce6\xe2\xc5\x83\x83\x8d\x148\x03I\
+\xc7G\x92\x9f\xcaW\xad1u\xf0J)\xf1\xd4\x93O\
+\xfe\xfbo/<\xff\xb6\xda\x80S\x80^Q\xf8\xd9\x8d\
+?\xbb.\xb7\xb8\xb0\xbdR\xea\xa0\x22\xbb\x1f\x00\xb4\xff\
+4=K\xc7\x9dA\xb5\x99\x02:\xebM-\xbe\xaa\xfc\
+\xbapLG\xa8\x8ex5-m\xa1\xc7\x8c\x1a9~\
+\xda\xb4\xd3N\xc9\xb4`\x8a\x0c3\x10\x89Dq\xf7}\
+\xf7\xdf\xb2w\xff\x81D*\xc91|\xaa\xa9O\xb5-\
+\xc9\xbd[9\xa5\x948l\xec\xd8Q\xcea\x91\xa7\x9f\
+z\xea1\xe5\xe5\xed`\xdbY{\xc2\x0f\x06\xb8\xfe\xf3\
+\x05\xa5\xc4\x8e\x9d;\x11\xce\xc9E\xfa}\xa5@\x00\x10\
+\x96\x14R\xda|-\xd5\x9b\xa9\xf7\x22\xab\x14\xbdja\
+\xd7\xa8\xac\xfcX\xc0E\x8c&#\xc4E\xb7Y\x1d\xfb\
+\xf8\xb3\xcf\xef\x00\x90pWq\xf3\xc59\xfbM-\xd1\
+\xaeM\xdb\xd2\xff\xb9\xf5v'\x0aHp\xef\x12\x1c\x02\
+\xe0\xbc\xbe)_\x85\xacqi\xa9U\xd7\x85\x1b\xd4*\
+\xeb\x1aw;\x1bsG\xd2i\x12\x88\x01\xc0\x8d?\xbf\
+\xf1FrJ+S=\x1b\xcd\xbf\xfe\xf9\xf7\x7f|\xf2\
+\xc9'\xb3\x88c\xe4\x0c\x90J\x1b\xc0\x84qB\x88\xe0\
+\x98\xd1c\xa79\xf7\x13'L\x9c\x1a\x84\x10\xa1p\xfa\
+\x9d\x03\xbf\xa3\xce\x19\xbc\x16Amm-\x9a\x9a\x9a\x10\
+\x0a\x85\xd2\x0b\x82\x22\xf9\xde\x9fB\x03g\xfc3\xcd&\
+\x09\xce\x04\xff\xc2\x95\xaaN\x01\xf2\x84\xff\xaee\x81)\
+lm)\xb0\x9e\x0czyT\x8d=7M\xc8\x8a<\
+\xbf\x99\xfd\xf5\xea\x07\x1f|\xf0\x81dB\xcb\xfa|\xd9\
+\xa5\x97\x5c\x14.\xc8U7\x97\xe8\xd6\x03Z\xc2\x87C\
+\x115Q\xa3\x97\xc6)\xe0\xbdz\xaf{\x84g\xaa\xa7\
+]\xd5\xa7\x040\xf7 \xe50d\xd0\x80a\xf1xL\
+Yv\xd1-o\xb9\x17j\xf6\xed\xdd]\xdd\xbe\xa2\x8d\
+z\xa6\x1b\xd3g\x01\xf8\xeb\x0bN9e\xea\x14\xb5\xb5\
+X$*\x7f}\xfb\xedW)\x86\xe9\xc7\x08\xed\xb4P\
+\x5c\x5c\x8c\xa1\xc3\x87\xa3_\xbf~\xa8\xac\xacD\xb7n\
+\xdd\xca\x96~\xbftC6O(\xcf\xb2\x17\xfex^\
+&\xe1\xee{\xee\xbe\x97i^\xd7W\x9a~0<\xa1\
+\xf2\xe1\xb7\x0e\xado\x91{\xc0\xbc2.\x00 ??\
+\xb7l\xd3\xc6\x8d\xdbU^\xf8{aX\xca\x9bo\xbf\
+\xed\x7f\x14:\x0evO\xf7\xa1\x90!N\xa7\x5c\x0b\xef\
+j\x04\xa0\xf3\xc6\xbap\xce\xb1\xaat\xc5\xc4\x8fU\xa3\
+\x9e\x96\x03W\xd4q\xc5\x15W^\x95\xf9~c\x0a\x85\
+\xb6v\x86\xfc'\x1e\x7f\xfc/;w\xed\xdb\xcad*\
+k\x1a\xda9\xbf\x0d@\x0e\x1d<\xc8>u\xeaT\xd9\
+\xa3S\xa7\xd0\xcd\xbf\xb8\xe9n\x00\x88\xca\x18\xe2\x898\
+\x82\xe1\x10\xae\xbc\xf6\x9a\xfb\x86\x0d\x1a\xd0\x8d\xd0\xad\xf6\
+\x93#\xf0\x90\x18\x89\xda\xdaZ45\xd4\xc1\xb2,H\
+)\xe9\xfa\x86\xd2\x9c\xfa?y\x9d\x1c\x00\xa9\xf8\x7f\xa4\
+\xaf$)_TT\x0c\xb2iJ-\xea\x15\x86r\xd1\
+\x9eW\xffu\x91\xa7\x17p\xceD\x955\x81\xec\xf5\xac\
+,\x1a\x1b\x1b\x9b\xf7\xdf\xff\xc0\xfd\x0f\xaa(\xfc\x0e\xda\
+%\x17\x5cp\x81\xb0\xac\xc2\xd4-\xd7\x96\x1f\xe0\xf8\xea\
+\x17\xa8\xce\xaa\x86PMK{>\xceK{YI\xce\
+\xdar\xd1\x83.\x02\x00\xc1\xa3\xbbF~aA\xf9\x81\
+\x03\x07\xaa\xb3L-w\xbc\x97r\xbdk\xc7\xb6\xbd9\
+99m4t\x1a\xd3\x84\x95\xe4W \x18\xc0\x1b\xaf\
+\xbf\x8c\xdf\xdeyG\xd9s\x7f\xfe\xcb\x7f\xa5\x942.\
+\x13\xb2\xd1n\x94\xd1X4}\x94\xd8\xbc\xb9sV\x0d\
+\x1e0`\xe0\x94\x93N\xc4\xe9\xa7\x9f\x8e{\xee\xb9\x17\
+%\xc9O\x86\x89\xae]\xbbb\xd0\xe0\xc1\xea\x86\x9fC\
+\x1a%\xf4\xea\xd3\x07\x03\x06\x0c@\xd7\xae]QYY\
+\x99\x8e\x00x\x8f\xa5\x8b\x02\xdc\xbb\xe0i\xdd\xfb\x1e|\
+@\x8d\x00(\xed^}9\x14\x11\x81\x1f\xf0#o\x16\
+)\xaf}f/,+\xff\xfb\x15\xcbW\xfbp\xfaY\
+p\xfaYg\x9e{\x88\xfb\xc3\xa5\x83\xc9\xe3\xd28\x9d\
+\xb4@\x22\x00\x8a\x18\xc8^Qu\xd28\x02\x05)O\
+\xf1yYs\xad\xc5\xbf\xfe\x9ak.n\xdd\xbau\xab\
+\xac\x1a\xc2]M\x12\xd4\x8f<\xfa\xf0\xa3\x91Hd\x9f\
+ZZ\x03\x02\x80\x9c4i\x12\xce<\xedt\x00\x90\xa7\
+L=\x09\x97^z\x09\x84@qsS\xf4\x97\x97\x5c\
+>}\xee\xe5\xd7_;U\x02H\xd8Q\x04a\x01\x96\
+@\x5c\xc6\x91\x000j\xec\xb8>s\xe6\xcc\xf9\xe2\xd4\
+\xd3N\xbb\xa7K\xe7\xce\xad'L\x9c\x84\x8e]:\xa1\
+[\xb7n\xf2\x9a+\xafB\xf7\xee\xddU\xef\xfcC\xe7\
+\xc1i(**BQ~\x01\xec\x84\x0d\x81\xd4\x1a\x80\
+\x8f\x9d\x85I\x02x9b%\xca\x8c\xb2\xa5}9d\
+\xfdO\x01\x8dHT\xfct\x81[\xc2\xbd\x09M\xbf\xd0\
+j\xdb\x8d\xcf=\xff\xe23$\x15\xd9\x92\x96\xdd\x9d\xf3\
+\xce=\xef\x82p8W\xb7`\xe5\x17~\x08\x8f\xa8\xee\
+qO\xf1\xd8\xc7\x80^\x0a\xec\xa4Kr\xad2\xd6d\
+\x088\x9c\x9c\xc5J\xb7w\xf6Yg\x9d\xad\xed\xa6\xab\
+Rf\xc9f\xef\xee\x1d\x07\x9e\xfd\xeb__H\xe58\
+\xf30j\xd0\x5c\xed\x96\xb4j\x15\xba\xe5\xe6[J.\
+\xba\xe4\x92\xae\x808\xf5\xf4i\xa7?\xff\xed\x9co\xe7\
+\x9f4\xf5\x94?t\xed\xde\xad\x17\x004\xc7#\xb0\xa4\
+@\xc0\x0e\xa6L\xa8\x80\x9dZt/(..;\xf3\
+\xf43\x7fu\xdd\xf57\xcc\xaf:\xb0\xff\x99.]\xba\
+\x9cTRRR^UU%v\xed\xda\xe9\xa7\x0b-\
+\x86\xba\xfaz\xc4\xa21\xb4*.N~\xf4C\x08\xe9\
+t+\xd9A\xddZ\xab\xcc\x1a\x04\xf7$\xc0\xcd\x9cp\
+0\x8c\xfc\xc2Bd\x15\xf5\x07\x87Z\xe19\xfc\x9c\x89\
+\xa2\x8a\xcfMK\x8c\x8e\xe9\xcf\x8f>\xfa\xcc\x9a5\xeb\
+6dR\xbc\x1cr\x12N\x9e2\xf5\xc4!C\x07\x0f\
+\xf3E\xbd\x198\xdey\xd1M\xfb\xe6\x10\xc9\xfd7\x16\
+0\x85 \xce\x7f\xbaS\x8e\x0b\xc3\xfcL\x0f@\xea\x03\
+\x00\xa6N\x9drb,\x12\xf1\xf5E_5d\xfd\xf5\
+\x1d\xb7\xfeFA\x99zN\x96\xb6\x11Y\xae\xcf\x12\x16\
+\xa6\x9ep\xd2i\x1f\xbe7sqmuM\x16\xee\xc6\
+X\xb3l\x8cD\xec\xe6XT\xc6bq\x99H\xc4e\
+\xc2\x8e\xcb\xb8\xb4\xa5m\xc7e<\x1ew\x9d,\xec@\
+mm\xad|\xf2\xc9\xa7>\x9fp\xf8\xa4\x0b\x85\x10y\
+\x00`)\x86\xeaP\xc4\xc1\xc1`\x10m+*\xd0\xa3\
+got\xef\xdd\xbb\xec\xfbe\xcb\x98E@\xdb\xf5O\
+\xca\xe4\xa9@\xb6+\xf4\xb7]\xc5U\xb8\xfb\xee\xbb\xef\
+\xed7p\x00:t\xe9H\xdf]\xf0\xd6\x063\x1c\xaa\
+\xe9\x80)\x14\xd6\xb5a\x92\xbdt\xfau7\xfc\xecf\
+?\xf2G\xe1\xae\xdf\xfc\xe6\x81`(\x04\x8a\xef\x7f\x09\
+\xd8\xbey=\x064-\xdc\xa8\x1eUE\xcaY&\xaf\
+A\xa6\xd3\x8e4\x5c~\xf9\x15\xe7\x04\xc3a\x8fP*\
+\x13\xd0\x02\xc0\xde=\xbb\x0e<\xf3\xb7\xbf\xfd=\x89X\
+\xa8\x11\x89\xb2\xbfE\xb8\xa2\x80` \x88\xf5\xeb7\xec\
+\xc8\xc9\xcf{{\xe5\x9aU\xff\xfc\xe2\x8b\xcf\x97\xa9-\
+\x04\x83\xa1\xe4\xdbHR\xa4k9[\x07\x81\xe4Wv\
+,\xcb\xdd\xc5\x0d\x1b\xd7E\xbe]0\xff\xeb\xc3\x8f9\
+z\xcd\xf8\xf1\x93\x22\xc1@(\xe5\x9a\x05,a!d\
+\x05Z\xfa\x22\x10[8\x1e\x8fc\xef\xae]\xa8\xab\xad\
+A~N.\xdd\xc3\x03\x09\xa1q\xbf\x99\x98I\xa6\xaf\
+%\xef>\x84@}]=\xfa\xf6\xea\x8bpn\xae\x89\
+\xc6\x96z\xfb\x83\x8d\x0e\xfc0\xce\xcf\x8a\xa8\xceK\xa6\
+\x9d\xdbSO=\xf1\xd7\xad\xdb\xb7\xed\xd6\xb6\xa0\xf1\xc5\
+\x17]r\xc9\x85]\xbawom\xa0\xe5`\xa0\xa5\x86\
+\xc4\xd3\xc0\xea\xf6\xfcs\x8f\x009/\xae{4\xa86\
+\xcez]\x0d\x81\xe9\xebvm\xdau\xda\xb0a\xe3\x0e\
+o[\xebvYO>\xf5\x97g3\xc8,K\xfd\x8c\
+W\x92\xb6\xacS|\xd3\x86p\xda\xb4SQ\xde\xbe\x02\
+\x00\xf2'\x1dq\xc41\xf7?\xf0\xc0\x1f\xf7\xed\xdb\xdb\
+\xec\xe0\x8e\xc7b2\x91\x88Ji\xc7\x93o\x19\xda\xf4\
+\xe5#)\xdf|\xfd\xf5\x99\x17]t\xd1UG\x1f;\
+ypIY)^|\xf9e<\xf2\xd8\x9f\x11\x0c$\
+\xbdA@X\x08\xb6\x5c\xf99^e\xe5\xf6\xe9\xd7\xb7\
+\xcd\x8a\x15\xcb7\xea\xb9\xa3\xe7\xa0s\xc5-\x02\xdes\
+\xef=\xf7\xf6\xe8\xd9\x13}\xf4\xaf,\xff\xd8\x1eN+\
+'>\xca:i\xf41\x18\xcd\xa3\x91m\xfa\xb1\xd3o\
+~{\xf7\xef\xcd\xa2\x97\xf5\xda\xa5\x94R\xca\xa3'O\
+\x9e\xa6'\xd1H\xbf\xdf<?Q\xba)\x02\xf7|\xc6\
+\xef\xf5\xfc\xdf\xcf\xfe\x00\x8eX\xcf\xd0\xeb\xca+\xae\x9c\
+\xce\x89\xa8Nt\xa5\x94\xb2\xbe\xa1\xa1y\xe8\xe8\x11\x93\
+R\xa8D*\x02P\x95_\xbdwYz\x0ez\x0f\xe8\
+\x8d\x8b/:w\xe8\xd3\xcf<\xf5j\xba\x91DLJ\
+;*\x13\x09\xd7iRr\xc6\x8c\xf7\xbe<\xfb\xcc3\
+'\x97\x16\x17\x05\x00`\xc8\xb0a\x182l\x08\xee\x7f\
+\xe0A\xfc\xf3\x95\xd7\x10L=\xc6\x0c\x08\xeb\x87\x1c\xfc\
+i\x1aht\xed\xda\xa5\xcd\xaaU+6\x10\xe9\xa4\xd2\
+\xea\xc1\xd3l\xb8\xf7\xbe{\xee\xeb?h \x8aK\x8a\
+\xa1\x81\x9f\xda\x00x\x95\xa3\xf2\xa4*9U\x08\x81\xec\
+W\xbf\x03H\x9e\x83\x18\x04\x80\xde\xfd\x06\xf4\x8f6G\
+\x13z\x0e\xa9\xd3\xa7\x0c__}\xf5\xd57\x8a\x8a\x8b\
+\xd1\xb1S\x17t\xed\xde\x1d]\xbbwG\xef~\xfdP\
+\xd6F}8\xc5\xf6\xc1O\x9e\x97>q\x06\xd3e\x04\
+\xb8\x95Pn\xb1\xc4tMW^\xb9\xc5\x07\xd5\xba\xea\
+\xa6\x0di|B\x08\xe4\xe6\xe7c\xdc\xf8\xf1\x93\xb3\xe9\
+W!;\xaaZ\xf0\xddw\xdf.\x9e\xb7\xe0+\x00\xb0\
+ \x02\x1229\xe5\x96@\xfa]\x9fdUgU\xd4\
+\x18\x9aU\xed\xaf\xc2[o\xbf\xbb\xf8\xa3\x8f><\xe7\
+\xe9\xa7\x9f|\x00\x00`\x05\x11\x95\xee\x9dr/<\xf7\
+\xb7\x7f\x9ct\xd2\x94\xe3^{\xe3\x8dO\xaaj\xeb\x13\
+\x00 \xa4D\xbb\xb6\xe5\xd8\xb5g7\xbe\x99;\x17y\
+\xb9\xc9\x8f\x80$\xa4\xady^\xef\x0b\xb8\x05! \xc5\
+ iY2\x9e.a\xb2\xb3p]{Q#\xa5\x85\
+X4\x8e\x0e\x15\x1d=J\xfeh\xa0[0\xe6\xcaq\
+\x81\xb9\xba\xf8K\xcb\x02\xc9\xad\xbf\xea\xb4P\x02\xb0S\
+\x13>\xac]\xbdj\xc5+\xaf\xbf\xae\x9e\x91HZ\x15\
+\xdc%\xc6\x8f\x1f\x7fDi\x9b6\xed\x1ab\x8d\x08\xe5\
+\x84\x11\xca\x0d#\x90\x13D}c\x9dW\x1f\xfc\x80N\
+\xe7T\x1c\xdcT\xc7U\xde\xf4\xcc\x9eZ\x125\xbcw\
+\x80\xe6s\xa1\x07\x17\x11p\x96:\xcd\xba\xb1\xe3\xc6\xf7\
+\xd9\xb5gO\xbdo\x17\x95\x82[o\xbd\xe5g\x8aw\
+M}\xcc\xc3\xf9\xa0\x87c\xd9\xd3\x91\x00\xf5\x0aj\x9f\
+\x5c\xfd+N}\xc2\xeb\xc5\x17_xUJ)\xe32\
+s\xb4\xf6w\xf3\xe6/\x80\x12.:0r\xd4(\x8c\
+\x9f81\x83\xc8\xec\xf5u\x99&\xcf\x97Es\x97\xca\
+\xca\xd2\xe5+V\xac7{*~\x0f\xa0k\x1a@\xa6\
+6\xf7\xdf\xfb\xc0\xfd\xdd\xba\xf5\xc2\xe1\x87\x1f\xe9\x97\xb6\
+\x1f\x1b\x8c\xe3E\xaeua\xb3\x0e\xaf\xb3CT\x08\x08\
+K\xa4^\x0f?\xe6\xc4\x13\xa7\xf2\x0c#\xdct\x9fE\
+#/\xba\xe4\x92k\x85%\x90WP\x80\xc2\xa2B\xe4\
+\xe7\xe7\xeb\xda\xcd\x8a\x82=\xfa\xdd\x12\xd0z\x03/e\
+\xe7\x14\x99\x12\xa2\x0bEh\x9e\x8e\xa0\xacN\x9dz\xda\
+\xa9\xe7\xb1\x1ce\xf8\xed\xc0\xae\x9d;\xf6\xe4\xe7\xe7\xb6\
+M\xa1p\x94\xdf\x12\x08$?\xebe%\xef\xe1~\x0d\
+Z\xb7^\xc1\xd2\xde\xb5[e\xdf\xda\xba\xba\xf4\x9a@\
+,\x16K\x9cx\xe2I\xa7P\xfa\x93\xb5\x7f2\xddH\
+\xd3XYYY\xba\xc2`\x00\x5cG\x80\xd8\xd9\x93\x02\
+\x95\xdf.\x03p\xff\xfd\x0fTVv\xc7\x09'\x9c\x88\
+\xf6\x99\x93p\x7f\x92>\x914]Y]:7\xef7\
+\x85\xcd\x8a\x93H\x1b\x81 \x00\x04\xf3rJ\xbf_\xb6\
+,{c\x10s\x0c\x85\x9a\xf4\xc6\xbf\xff\xfdNK:\
+\xae\xa1OW\xa6\xa5\xf8\x5c\xb2\xcdys]\xf8\xe1\xe4\
+\xa9a\x94\x8e\x08/\x0bL!\x1d\xaeXV\x00\xc1P\
+\x08\xc7L>\xe6\xb8\xac\x5c\x03q@\xf2\xeb\xbf\x8d\x8d\
+\xcd{]\xd4B@\x22\x91\xdc\xf1j\x8bT\xd8/\xe9\
+\xf3aJ\x9f.\x9c\xc2\xe6\x8d\x9bV\xbd\xf9\xe6[\xe9\
+\x01\x9d=\xf7\x9b\x05\xef\xbf?\x83\x1f\xe0\x83\x0f\xf3\x0f\
+\x1a\xe2q;\xd9e-\xa8+\xffn\x90J\x99\xf4\xf9\
+HN\x9e\x95\xbc\x8bG\xa3\xe8\xd9\xa3\xe7!\xa3\xb7\x05\
+`\x92!nz\xe0\x5c\xd3\xed\xea^@\xa6\xa8\x122\
+9=\x10\xf1\xa6\xc8\x81\xff\xbc\xfd\xce[lI\x86R\
+'k\xc4\xd0a\xc3\x8bKJ:\x00@0\x1cF0\
+\x9c\x8b@\xf2\xe51\x13\x0d\x87\x1a\xd8\xbd\x04\xd42\xaa\
+\x8c\xe4\xba\xe7\xc7\xe2p\x83\xa1\x1a\x0e\xd5 d=\x82\
+\xb1\xed\x04\x86\x8e\x18^~\xf4\xe4\xc9'd\x8a\x88\x94\
+7M\xa1\xe1(\x06\xf0\xcak\xaf\xbe\x91F%\x85\x0d\
+ \x91\xd1Ba\x0b\xfd\xa6\x09]\xbf\x5c<\x18\xd8\xbf\
+?:v\xec\x88e\xcb\xbf\xff\xd4I\xfbv\xfew\x9f\
+\x06C!\x04\x83AS\x88o\x9ab\x1c,d\xf1Q\
+\x08\x0by9ai'\xb2\xe5=3(J\x97D6\
+1t\xc2\xec@@\x04\x04\x02AD\x12\x09\x14\xb7n\
+\x8d\x0e\x1d;\xb5\x94\xc6\x96\x02\xb7\x16eR\x0c\x8e\xbf\
+\xa6\xf5+\x1d~V\xee\x9di\xc0\xcc\x0f?\xf88\x12\
+\x89\xc4\xb4\x143\xc4TVVv\xba\xf0\xdcs\x8f\xb1\
+\x02\x01\xd8\x89\x04B\x01\x81@\xb6\xacP^y\xf5\xf7\
+`\x1e\x9ff\xd5qV\xc5\xb8\xb0\x97\xab\x0c&\x8f2\
+\x8dF\x11:B\xa9\xf2\xcb`0${\xf4\xec\x8d.\
+\x1d;\x0d\xec\xdd\xabW[Wn\xea\x22\xeb-\xec\xd4\
+\xbf-;\xb6\xed\xfd\xf2\xcb\xaf\xbeV\xd0;\xfd\x92H\
+~\xbfO\xca\xeco\xf89\xa0.\x08j\x99\xda\xa7O\
+\x1f\x9cq\xeai\xd8\xb4v\xddg;\xb7mo\x04\x80\
+\xafg}\xf5I\x9f\x01\x030\xf1\xc8#Q^\xde\x9e\
+\xab\xe6%\x8c\x07\x03,\xcep8\x17\xa1\xdc<$\x94\
+\x13m\xb8\x95/\x0e\x91s\xad\x13\x02! \x82\x01@\
+X\x02\xb1H3z\xf7\xee\xe5\xe7I\xc6\xc1\x08\xe9\xc1\
+\xc2\x0fi\xcb#\x02\x94@\xea\x94\x999_\xcf\x9a5\
+o\xde\xbc\x05\xe9Z\xa6\x89\xaccg-\x81\x1e\xbdz\
+\x8f\x02\x80\x1e={\xa2Ke%z\xf5\xea\x0d\xf2e\
+\xe8\x1f\x93WZ\x11p\x22\x00NN\xbc<\x96\xd7\xfc\
+D\xd7\x19\x1a\x0d\xa4\xa1K\xd7\xce\x182x\x00F\x8d\
+\x1a\xad|\xaa\x8boFB$\x03\xb3\xd4$\xe6\x83\x19\
+3\xde/**\xdc\x9b\xcaup\xa7\xde\x01\x97*M\
+\xf4\xf4\x22\xdf0\xe3\xa3\x99\x98\xf3\xdd<\xbc\xf5\xce\x7f\
+\xd6\xadZ\xbdje]}C\xfc\xd3O?Y\xb0|\
+\xe9R\xcc\x9e3\x17\xcav_\xaf)\xc5\x0f\x05V\xaf\
+m;\x8eX<\x9e\x8aZ\x93\xc5\xb2v\x059l\x97\
+\xfa0\x8fmP@\x08!\x11\x10@4\x1aA\xdb6\
+mP\xfe\xd3\xac\x05\xfcP\xf0\x1b\x85\xe8\x1c\x9bH\xde\
+\xa4\xe7s\xb1o\xbf\x9d\xffeVI\x0a$\xado\xbf\
+\xfe#:t\xe9\x9c\x9f_\x90\x8fV\xc5\xc5\x08\xe5\x84\
+\x10mn6\xb5o\xa2\xdf\x94f\x8af\xb3 \xa8d\
+\x98\x94\x96\x22\xc9\xf2\xde\x1a\x82\xd4\xb2\x82\x94\xa7 6\
+\xac\xdf 7m\xdc\x88\xeb\xae\xbf!\xb3tn\x0c\xd0\
+\x9d\xa3\xd7\x80\x0ff~0\xb3\xa6\xaa\xd6\x83|!\x7f\
+\x88.F\x9a\xa2X\xbbf\x0d\xda\xb7\xaf\xc0\x86\xf5\x9b\
+\x96\xdb\xb6e7\xd6\xd5UC\x08D\x1b\x1b\xa0\xe0>\
+\x94\xde\xde\x0f\x08\x00RJ\x09;a\x83\xbe\xaa\xc2\x83\
+\x89\xb1\xd9`\xc1\x126\x02\x90R\xa0\xb0\xa8\x156n\
+\xd9\x82\xdd;v\x1c,\xbd\x07\x0b\x9a\xc9_\x16\xb0\x0e\
+\xa6\x85\xa0\x9b\xdd\xcb\x7f\xff\xf7\xdd\xf7\xa6_9\xfd\x86\
+V\xc5E\xf9\xdc\xb1\x94\x19\xeb*\x92\xc7V\x0a`\xe2\
+\xa4\x09#\x8b\x0a\x0a\x07-Y\xb8\xe8\xdbCD\x0b\xa5\
+\xcb\x0fdE\x8etE_7\x05\xe4\x16Q\xb89}\
+K\x08\xccr>\xc2\xb2\xd0\xb1\xb2k\xfb^={z\
+\xae2\x09 M\xfd\xfe\xfd\xfb\x9a\xf7\x1e\xd8\xbf<\x1a\
+\x8d:Y\x8e\xa7W\xfb%\x91yB{P\xc2!m\
+\x1b\xd5\x07\xaa0f\xe4h\x1c\xa8\xda?\xff\x93/>\
+\x9b{\xc6\x99\xe7\x04/\xba\xf0b\x9cyf\xd6\xfbJ\
+\x87b\x9e\xefI\x92\xeb\xce\x12\x08\x04\x05|\xbdu,\
+<K\xb8\xad\xbc\xb3y\xd2\x0aBX\x01,Z\xb4\xf8\
+\x87\xece\xf8)@'\xcb\x0e\xf8\x9do\xabSC\x01\
+\x00\xdf\xcc\xfab\xf6\xda5k\xd7\xa5\xb1\xe8\xe2=\x91\
+\xc9*\xcc\xcf\x0f\x8e\x181l\x80\x10\x02\xed\xda\x97\xa3\
+}\xa7\x0e()k\xcd\xd5\xe2h\xd3\xd1\xe47\x9d\xe2\
+L\x03}v\xedw\xaaH\x1bTCn\xb5\x8c\x9a\xc7\
+.\xae\xa8\xb8z\xf4\xec\x8e#\x8f:jdq\xab\xe2\
+2O\x8a \x81\xd4\xde\xfb\xcf?\xff\xec\xcb\x8d\x9b7\
+\xad\x09\x86C\x88GcN-S`\xe6\xa2\xcb\xb2\x04\
+\x02V \x19>\xfb\x80\x193gb\xc9\xb2e\xff-\
+**l\xdb\xa3GO\xd4\xd44\xa1\xa1\xa1\x11\xc1P\
+\x10\xf1\x98\x0b\x87\x9f\xa8\xeaP@\xc6\xa2[^\xafw\
+8\x90al\xd6\xe2\x0e/\x8a\x22 %\x0a\x0b\xf2\xb1\
+}\xcb\x16$\xa2\x91\x83\x22\xf4\x07\x82_^rk$\
+\x5c~K\xc1\x06\x80@\xc0\x92\xcb\x97/_<r\xe4\
+\xf0\xc1<\xa2\xd4\x14K\x00\x99WN\x80!C\x86\x0c\
+\xff\xac\xcb\xe7\xcfw\xeb\xd6\x1d\xa1\xd4!\xae\xb3\xbf\x9e\
+\x8dHS\x93W\xbb^\xfd9h\x19S\x0d\x80\xd7z\
+\x91\xc9\x8azYP]\x1d\x17l\xdf\xbc\x15\x83\x06\x0e\
+\x1e\xdb\xaa\xb8\x15K\x83L\xfd\xa5g\xb3,X\xb4d\
+\xee\xf6M[\xa3\x81p\x88\xe2M\x0d\x83\xa4m\xba\xee\
+\x83\x81@\xb0s\xbb\xf2\xf0\xc6\x1d;\x1a\xed\x8cW\xd3\
+NUb\xf1\x186n\xdc\xb0\xa5w\xcf\x9e[\x96-\
+]\x8c\xb5\xebSo\x8b\x9a\xcf\x1c<\x14`4(\x96\
+Hmxt\x08q\xf5V?\xb4Z\xa4\x8a\xf0\x0a\x88\
+\xe4\xa9\xc3\xb0\xf0\xfd\xb2e\x5c\xe9\x1f\x0b8\xf2\xa8\x83\
+\x01\xb2\xc6\xdd%$\xb4\xfe\xc1/\x16\x0a\xc8\xc3\x0f?\
+\x1c\xcb\xbe_\xf2ic\xe3\xe9\x17\xe5\xe7\xe7\xbbg~\
+\xce\x89\x8c.1J\xc2\xa0\x81\x83\xc7\xb4n\xd5\xb6U\
+\xd5\xde\xaa\x9a\xdc\xbc<\xd8\xd2F,\xca>P\xd0\xd1\
+Kya\x92\x07]\xdf]\xce\xdaq\x17\xf4\xd0\x04.\
+\xb4\xa7\x1b*\xb8\xb2\xb4\x0eG\x04\x8d \xd2\x9dh\x8a\
+D\xd0\xa1C\x87\x81\xae\x5c\x1fC\xb5t\xf1\xa2\x15\x00\
+\xb8G+@r\xf1Fe`V\xa1\x11#G\x1cu\
+\xe3\xcfo\xb8/\xd7\xfb\xd5MW\x7f6m\xd9\xe2(\
+\xbf\xc84\x95.\xe7\xd7\x15\x1f\x0a\x10\x00\xd0\xa6\xac\x1c\
+\xb1\x08\x8db\xfc1Q\xd0\x1bAR\x05Dn~>\
+V\xae^\x8eX\xb4\xd9U\x8aV\xff\x89\x81v\xd0o\
+\xc4I\xe9\xf7\xd7\x07\x09\xf1\xd9g\x9f\xe3\xcd7\xdf\x9c\
+\x1b\x8dD\x9a\x5c\xb5\x85\x8b_Y0j\xd4\xa8A\xf9\
+\xb99\x9dV,\xff\x1e\x0b\xbf\x9b\x87\xc5\x0b\xbe\x83\x9d\
+\xf0\x17u\xa6[w\xd3\xdb\x12C&\xc9\x0f\x80{G\
+\x9c\xa9\x92_\xa2\xd4\xff\x9c\xb7U_\xcd\xa5\xf5\x01 \
+T\xd9\xa5K\x17h I\xa8\x9b\xd4uk\xd7\xed\xcf\
+\xc9/X}\xf2\xa9\xa7\xa24\xfb\x05\x0b\xdd\x5c\xcaE\
+\xc3\x84\x09\x13G]z\xc5\xf4+\xad\x00\xda0\xe5\xb5\
+\xfcQ\xd6\x1c8\xf8!\x11\x00gH=\x054\x94\x93\
+\x83\xb8-!\x9dU@\x97\x22g\x1f\x0d\xd22\x90\xc9\
+\xb3F~z\xf0;\xd7\xfd1\xc6A\x0b\xdbv\xec\xd8\
+\xbec\xd7\xce\xed-i\xa5\xb4\xa4$\xa7\xb8\xb8\xa8\xc7\
+\x8fA\x0f\x03\xbe\xd6\x09\xbc\x16\x01\xd5{\x1b\xee]U\
+\xf4\xd9\xb9$88\x228\xa2\xd2\x91G\x9f>\xbd\xfa\
+\xb4-/\xafH\xe7\xf8\x10\xfbe\xcb\x96\xad\xd8\xb0a\
+\xe3\xca\xdc\xdc\x5c\xec\xdd\xbbWW+\xdd\xbf\x82\x82\x02\
+\xd9\xb3\xb7{\x8dq\xe2\xb8\xc3\xc6\x15\x95\x94\xe6\x9f}\
+\xeeyg\x12\x9a\xa8\x1771\xd5O\xb9\x1f\x0a\xc6i\
+Vu\xcd~\x04C\x96\xba\xf6\x04\xf5\xcd\x94,\xc60\
+T\xbb\x5c\xa9{\xe4\xec\x86\x86F\xf4\xeb\xdb\x0f\xa9#\
+\xd0uc~\xb0`\x8a(Z\xe2\xa9\xfd\xf2\xde\xe4\x88\
+Lu\x10\x08\x04p\xd5\xd5W7\xaeZ\xb3v\xa1\xb6\
+\x10$\xb8\x9d\xa0C\x87\x0d\x1b\x0c\x00\x96\xe5:\xe2\x82\
+\xeb\x93\xa9\x9f\x87J\xbe\x5c_{\xa1o\x06\x9a\x1a\xa0\
+\x13J5\xe4\x92J>U\x22\xae^:\x7f\xd0\xf0\xe1\
+\xfd\xdb\xb6k\xd7\xae\x05\x1d\xc0\x9e\xbd\xbb\xd7-Y\xb8\
+ \xf6\xd1\x87\x1fA&w\xc0\xa9\xed\xab \x00\xa0W\
+\xaf\x1ex\xe4\x0f\x0f\xa7\x13\xcf?\xeb\x8c\xf3\x8f?\xf1\
+\xc4\xe3\x01\xe0\x97\xbf\xbc\xf5\x97\x03\xfb\xf7\xee\xaf\xd0\xea\
+\xe7\x8d\xc1C\xad\xe8\xba9\xad\xa9\x1d\x01@\xd4UW\
+#'\x1c\x12\xc2\x82[\xeb9\xf01\xca\xea\xe3D\x0b\
+\x102f\x0360h\xe0`\x03)-\x06.d7\
+\x19:\x1a\x99i\xd7\x944\xf5[\x92\xce\x96\xed\xd9\xbb\
+\x0f\xb6\xef\xde\x8bY\xb3f\xcfM\xa7\x92\x1e\xa8\xe7-\
+\xaa\xc8\xfb\xf5\xeb;PX\x16\xca\xda\xb6\x85rZ\x90\
+\xc9\xa9\xf8\x9f\x9e\x98\x81\xc5C\x17\x01\xe9\xdc\x82V\x90\
+$\x1f\xca\xbd\x85l\xa1\x15\xca\x7f'\x8d\x9b\xc7HK\
+\x08\x0c\x194\xb8g^8\xdc\xa2\xb9\xf3\x9au\xeb7\
+\x08!\x90\x9f\x97\x8b\xfa:\x01;\x91\xceb\x07\xb5\xb9\
+)\xd2\xaa\xa8\xb0p\xe8\xcd7\xddR\xde\xb9c\xfb\xa9\
+?\xbb\xe9\xa6\x0b\x9c\xbc>}\xfbu{\xff\x83\x8f\xbf\
+z\xe6\x99g\x1f\xc9\x0b\x17\xae\xf9\xe8\x83\x0f\xbf\xffj\
+\xee\x17\xab\xfd\xd2RQQ\x81\xba\xba:444\xb4\
+\xa4\x0b\x148\xde\x9a\xa6U\xe9\xff\xc5%%\xb0m;\
+\xf3a\x10n\x14)v\xb8\xef\x85RF\xdd\xe9'\x05\
+,\x11\x10hl\xa8G\xe7\xce\x9d\xb1r\xcd*4\xd5\
+\xd7\xb7\xa8c@\xf2\xf8\xb2\xb8\xfbi\x0b7N\xba~\
+{\xd5\xfb1!I\x93\x10\xd8_}\x00\xffy\xfdU\
+\x8c\x1e3vEV\x09(lM_d\xba\xd2\xa7_\
+\x9f~\x15\x1d:\x15\xec\xdb\xb3\xab!\x1e\xcbZ\x00\x14\
+\xa4\xc2\xa1\x8c$Y<A%\x93Sn*B\x02\xbc\
+b\x0b\x82\xc3IcW\xe5\xc8\xbd\x05 !\x01\x94\xb7\
+-\xeb\xc8\x15u\xd6\xfd)5\xd5\xd5\xd5\x89\x03\xfb\xf7\
+\xad\x1a?q\x02\xca\xdb\xb5C\xa49\x82\xf7g\xbe\x0f\
+n/\xbcS;\xd2\xd0\xd4u\xd1\xd2%w<\xf4\xf0\
+\x1f\x8f\xe3\x0au\xee\xdc\xa5\xec\xde{\xef\xbdo\xc1\xfc\
+E\x9bg\xcd\x9au\x0b\x00\xa3\x01\x10B \x14\x0c\xa2\
+K\xa7\xceh\xdf\xb13l\x99\xc0\xf6\xed\xdbP][\
+\x83\xea\x03U\xae\xa2\x9a\xfe\x9b\xc0\xb7\xc7\x0a\x06Ch\
+\xdb\xae\x02\xb1H\x14\x82;\xb4V\xb7B\xa3+#\x93\
+\x11@\xfa\xc5!\x99\xfc\x1ca\xdc\x96\x08\x87s\xd1\xa5\
+c\x17\xacY\xbd\x12\x05\x85\x05\x88F\xa2(((@\
+uM\xb5\xe7\xde\x80\xf2\xb6\xed\xb0g\xdf^\xc4\xdc\xc2\
+o\xa2J-\xf3S+}6H\x89}\xbb\x92\xa7\x83\
+56\xd6o\xab\xaa\xaann\xdd\xba$sF\x9aL\
+\xfdI\xaf\xbdd\x92\x05\x80n\x95\xdd:\xe6\x86\x83\xa5\
+\xb1h\x94\xf3\x12-\x9d\x92\xfc`\xe0N\x05\xa6\x8d\xd3\
+24\xa4W\x81\xb3Z\xd4\xebSH\xea\xb6\x94(j\
+U\x5c\xc1\xe4\xbb\xd0\xa9\xc8\xb6o\xdd\xba\xf7\xc0\xbe\xfd\
+++;wEQA\x11zv\xef\x89^={q\
+\xf8\xd3\x08j\x1a\xea\xd6\xcf\xfdf\xce\xf5G\x1f}\xe4\
+\x89w\xff\xee\xb7\x0fD\x22M\x09\xb5\xf0\x07\xef\xbf\xff\
+\xc9\xb4SN9s\xea\xb4\x13\x8f\xfe\xf0\xd3\x99\xef\xf2\
+\xf4$aP\xff\x01x\xec\x91\xc70p\xe0\xa0$\xee\
+\xdaZ467\xa3MY\x1b\xf4\xed\xdd\x1b\xdd\xbbw\
+G\xd8\xfc\xd6\x17\x0dcu\xa0\xf3\x04\xe9z\x89D\x1c\
+\x91H\x04\x08\x06\xdd\xb9:\xcc\x5cLf\x88\x0e,+\
+\x10\x84%PPT\x84\x0d\x9b7b\xcb\x96\xcd\xc8\xcf\
+/\x80e\x09\xb4.*B~N\x1eB\x99\x90V\xc5\
+\xe0\xa2\x22\x16\x8b\xc3r\xbf\x84\xea\xc7I\xf8\x84C\x15\
+-\xb3\xa0\x08\xa1\xc4\x11G\x1e\x81\xeb\xae\xbb\xbej\xc5\
+\xca\x95\x9b\x98\x12\x0c]IhSZ\xda*7'\x97\
+\xca\xf9\xc1\x12\xfd\x83;\xabn\x05v@]\x0bPG\
+\x8az}?\xc4p\x91\x85z\x9dn[\x08\x84\xcb\xdb\
+V\xb8\x97\xf1S\x0bX\xe9\xd5g\xd2Bcs\xd3\xfe\
+\xcf\xbf\xf8|Cnn\x0e\xf2\xf2\xf2\x91\x93\x13\xc6\xf6\
+\xed\xe6\xe3\xb7\xab\xaa\xab\x1b\xe6\xce\x99\xbbn\xdb\xb6\xed\
+\xeb>\xfb\xec\x8b\x99\xb3\xbe\xfc\xf2\xcb\xff\xbc\xfb\xee\xdb\
+\x05\x05\x85y\x9f~\xfc\xf1\xcc)S\xa7NK\xd8v\
+T\xe9\x96 ,J\xdf\x84\xc3a\x94\x96\x94BJ\x89\
+H$\x82\xc2V\x02BJD\xa3Q47%PZ\
+Z\x8a\xb2\xd22\x1c\xd8\xbf\x1f\x9b\xb6l\x96RJt\
+\xebZ\x89]{\xf6\xa0\xa1!+|f\xf9\x97\x97\x97\
+\x83\xa2V\xad\x11\x0a\x04\x11\x00\xb0e\xfb6\xae\xac\x90\
+R\xca@ \x88\x9cP\xc8\x92\x96p\x1f\xa2\xca\x99v\
+\xed2i\xe6^-\x12\x08X\x81\x82\xc2\x02\xec\xdf\xbb\
+\x0fK\x17.\x00 \x90\x9b\x93\x03)%b\xf1\x04b\
+\xb2\x19\x85\xb9\x05\xa8\xb3%b\xf1\x98\x8a\xd5\x859\x16\
+\x8f\xa1\xb8\xa8\x08\xfb\xaab\x90\x99\x97\x96\xa4eY(\
+*(B(\x14DM]-\x02\xa1\x10\x8a\xf3\xf3\x81\
+\x84\x8d\x9a\x86zD\xa2Q\xd7 \x14\x14\x14\x22\x1a\x89\
+!n\xc7\x10\x0a\x06\x9d'28h\xdb\xd1B\xc8\xcb\
+\xcdCsS\xf3\xde\x0d\x1b\xd6\xaf\x1c\x7f\xd8\xb8\xbe\xe9\
+\x0c\xd5\xf33\xbc\xce\x09\xe7\x04\xbb\xf7\xea\xd1u\xe5\xca\
+\x15\xf3\x7f\x12B= \x08\xb3xp\xe2\xe2l\xb1\xa5\
+\x91\x813\x9at1\x91*\xbfP\xca[Nf\xbbv\
+e\x15e\xa5en\x03 \xb2\x9bW\x09\xd9\xb7o\xdf\
+\xae\xda\xda\xba\xa6\xda\xda\xe4\xf1J\x96e\xc1\xfdm\xf7\
+4\x1d\xe9\xfeH)\xc5\xb6m\xdb\xd3\xf4~\xf2\xf9\x17\
+\x1f~\xfc\xd1\x87\x9fN;\xf5\xf4)\xf7\xdc\xfd\xdb\x07\
+S\xca/\x90}\x5cZVt\x13O\xc4\xd1\xd0\xd4\x08\
+;\x91\x80m\xdb\x88\xc7\x13\xb0,\x81x\x22\x01)m\
+444 (,\x94\x94\xb6F\x9f\xfc\x5c\xd8q\x89\
+\x9cp\x0ez\x16\x16c\xe7\xee]\xd8\xb3g\xb7t7\
+\x91\x01'r\xe8\xd0\xa1\x13r\xf3\xf2\x90\x88\xc7\x11\x80\
+@\xb7\xcan\xa8:\xb0_\xda\xb6\x04\xac\x00\xf2\xf3r\
+\xd1\x1ci\x96E\xf9E\xa8\xa9\xaaBm0\xd0 l\
+\xe9\x9e\x5crS\x80,\xce \xdb(\xc8\x8c\x15h\x8e\
+%\x22\x09\x1b\xd8\xb1}\x1bb\xf18rrr\x93\xde\
+<(!\x04`\xdb@H\x04QR\xdc\x0a\xb1x\x14\
+u\x0d\x0d2\x91H\xb8:\x17\x08\x04`'l\xc4\x05\
+P\xd2\xaa\x04\x0d\x0d\x8dH$b2\x18\x0c\xa2\xb0\xb0\
+\x08\x10\x16\x12\xf1\x18\x8a\x8b[AJ\x89D<\x81\x80\
+\x10(-i\x8d\xda\xfaz44&\xa3\xe6\x8a\x8a\xf6\
+\x10\x22\x88={v\x22;(\xfdi\xe0\xd3\xcf>\xc3\
+\xd2\xa5K\xe3\xd7^{\xed\x9at\xa2k\xce\x0f8\xfb\
+\x02\x04\xe1m\xa7\xce\x9d\xe9\xbb\xd4\xdc\xf4\xdb\x0f\xfc\x10\
+k'\x00\xc8\xa0z\xc3\x10\xa1\x15~\xe5^WG\xad\
+g\x91:N\xbd4[\xda\xb6\xadhSVVJ\x1e\
+\xe4\x9b#\x9c\xed\xdb\xb7\xefh\xdd\xba\x04\xc5E\xc5(\
+(,\xc0\x8a\x15+\xb9b\xdc\xc2\x0a\x90|\xbf;\x01\
+\x00K\xbe_\xb6\xec\xb0\xf1\xe3\xc7}\xf5\xf5\x1c\xe5E\
+\x0di#\xfb\xdb\x89\x8e\xb4\xd9\x00\xd0\xd0\xd0\x80\xe6\xe6\
+&l\xdc\xb8\x11MM\x8dH\xc0\x82e\x01\xf1h\x0c\
+R& E\xf2\x18\xa2\xb8\x95\xdc\xa4d\xc7$\x22\xd1\
+(rss\x10\x8d\xab/%fCnn>\xea\xeb\
+k\xb1s\xe7NX\x81\x00 %\x02\x10\xb0\x1ce\x01\
+\xd0\x1c\x8dA\x08\x816\xa5e\x90Q\x89\xad\xfb\xb7\x02\
+@\x93\x15\x0c&\x5c\xa8\x156j\xe7b\xba\x18-\x05\
+U\xd5U\xd5\xcb\x97,@\xd0J\x06\x8d\xce\x1e\x18D\
+\x91\x05\xa9\x1d\x89n\xf4\x22\xf9\xed\xc2\x9a\xba\x1a%-\
+\xf9E\xe3h$\x8a\xfd\xe9\x0f8\xf1dY\xc2\x82H\
+\x1d\xe8,D\x10;wnK\x13)\xa5\xeb\xc3\xacj\
+7\x7f4\x88F\x22\xd8\xbe};\xf6\xec\xdaC\xde\x88\
+J\x89\x89\xb3\xff,\xb5$\xab\xda\x80\x0e\x9d:p\x07\
++\xea\xa6\xd3?\x16H {\x0a\xc0\x85\xeb\x1cqj\
+\x9e\xee\x9e6\xc6E\x15\xe9%\xa3\xb2\xb2\xb2\xd6\xadZ\
+\xb5j\xedMw\x12\xe2\xf1\x18b\x89\xd8\x9e\xab\xae\xb9\
+\x1a\xa3\xc7\x8d\xc1\xa7\x1f|\xac\x1a\x00n\x86\xab\xa3I\
+.Y\xb2t\xc9\xdb\xef\xbc=C\x02\x11w\xbeT^\
+8\x16\xa9\xd1\xccD\x18\xc5\x05\x85\x15e\xadK\x8f\xff\
+\xe5\xcd\xb7\xf4j]V\xda\xa1\xa0\xb8U\x1ed\x02\x89\
+X<\x9e\x90\xb6\x94\x02\x22u\x82\x81\x00\x84\x14R8\
+\xeb\x0d\x02\x96\x05aY\x22\x00\x09X\x902aK\x11\
+\x08\x0a \x81D\xc2\x96\xc9HF\xcaD\xc2\x96\x10\xce\
+<D\x00I\xfd\xcaXP!\xac\xd4\x17\xc1em]\
+]uqqq\xab\x8e\x1d;\xb9\x05L\xe1\xbep\xee\
+\x9d\x1bN\xec\x188\xe1\x98\xc9\xc775\xd45\x95\xb5\
+nS\x1a\x0a\x07rm\xdbN\x88\xe4'\x14\x03BX\
+\xa9Nf\x1aI~\xa4\xccr\xbeV&\x05 2\xd1\
+\x99\x04 \xa4\xf3\x0d3!2\x9f3\x12\xc9\x97\x1a\x81\
+\x0c\xe3aC&\xdf\xe3\xb4,\x19\xb7\xedDmmM\
+\xf5\x9aUk\xd7\xcex\xf7\xdd/\x1a\x9b\x1a\xb6\xc7b\
+\xaa\x15JO\xd9~\x92\xb9\xc0\xce=\xbb\xf6\xbaS\x84\
+\xeb\x1fI\x05\x00\xb4k\xe3z\xd4MG\xe1G[\xc4\
+\xe0@}\x0a\xa06\xcc\x11eZ\xa1\xd5\x81\xe9(&\
+\x97\x91)mU\x5c\x5cPX\x182\x94wA]}\
+\x1d\xa4%v\xb6\xadh\x87\xf7\xfe\xfb.>|\xffC\
+?\xd5\xe8\xda\x83\x00 f\xfc\xf7\xdd\xf7\xbf\xfc\xfc\x8b\
+\xaf\x99rj1G\xf9m!D\xf0\xe1\xdf\xff\xfew\
+\xc7\x1c{\xdc\xe9\x95=z\xf4),,\xf0K\xf6O\
+\x0b:\xf3\xed\xe5[\x18\x970i\xd2\xc4\xc3&M\x9a\
+x\xd8\xa1$\xef\x87\xc2\xf2\xe5+\xd6\xcc\x993\xe7\xcb\
+\x07\xee\xbd\xf7\xa1\x8d[6\xafI\xfa\x13a\x11\xdf\xf2\
+\xa3\xc2\xbe}{\xab\xd27.-\xd2\xebq\xbb\xb6m\
+\xca\xb4\x99\x19\xf8i\x163\xe0\x9e\x97s?\x90kz\
+O\xf38\xbc\xba\x93\x87\xd3\x87\x8c^t\xd1y\x17\x9a\
+OZtCs\xa4Y^q\xd5\x15\x17\x96\x95\x1b\xcf\
+W\xf7\x02\xd7\xc7\x1f\x98~\xa4\xe8Lo\x99\xc6\xa0\xc1\
+\x83\x07\xcd\x9d;w\x81\x918\xe6\xccH\xff'\xf0\x1f\
+\x0a\xd0\xb4\xc8}\x12\xc0\xf4\xa9\x80\x9f\x96\xe8\x83\x86\xad\
+\x9b6\xef\xfc\xd95\xd7\xdd@\xc6U'\x97\x87\x14\x86\
+\x8f\x1aqXCc\xa3\xafO\xd79\xf0\xd9W_\xcc\
+UP\xfc\xa4\x1e\x9f\x02\x9d\xe3J\xe6Z\xb7 \xc8\xf9\
+\x15\xcepP|\xb4=\x1b\x00\x0a\x0a\x8a\xf2\xd0\x02\x10\
+\x10\x89\xad[\xb7W\xed\xdf\x9d5w\xe4\x8c\x15Mw\
+\xaem\x00q\xa6<\xe9c2\xa4\x1c4`\xd0\xa0w\
+\xff\xfb\xee\xc7c\xc7\x8e\x1d\xae\xed\x15\x072\xe9\x8fl\
+\xdbVW\xbe\x0f\x1et\xab1\xae2\x1a\xb9\xa2\xa3\xcc\
+qK]\xa5I\xd7\x93\x80\xed|6L\xa6\xcbH)\
+!\xa5\x84mK\xd8\xa9\xcd\x02R\xd2\x0f\xd1\x1e\x02 \
+\xfd\x952\x93\xd4\xa9k\x97\x8a?=\xf9\xc4\xe3\x0f\xdc\
+w\xff\xefSI\xea\x0e\xce\x1fU\xc1j\xeb\xeb\x1bj\
+\xaa\xab\xabY:5<()*\xcc\x87\x80\xf3|\x98\
+;j\xff'\x03\xdd>\x00z\xef\x0a\x99\x91-::\
+E7\xcd\xbf\xd3\xff-!\x10\x0c\xd2\x07\xe6\xcc\xca\x95\
+\x02\xd1h4Z\xd7Po\xfa\xba\x025T\x9c\x9a\xe8\
+\x84\x83\xaeY\xd8\x81\x80U\xf4\xcf\x7f\xfc\xe3\xb5\xae]\
+\xbb\x94\xebh\xd2\x12\x22\x92\x8f;,\xcbR\x86\xda\xaf\
+\xf5\xe0\x10Bo\xb2\x9c\x04U\x91u+8\x5c\xef\xb5\
+$%;\x91\xac&\x5c\xa1n\xfa\xf5lg\xcdK\xa8\
+b\xe2\xa3\x8f~\x8a\x09\xa5\x90\x13\x97\x01P_\xf6\xbc\
+\xfd\xce;n\xbd\xee\xfa\xebor\x13\xfd\xa3\x85\xd2\x02\
+\x00\x9a\xeb\xea\x1ak\xeb2+\x9bR$\x0f\xa0V\x8a\
+dA8\x9c\x13\x0a\x04\x82\x8e\xc3\xfb\xc9B}\x0e\xe8\
++\xbe\xba\xd0\x89;W\x1d\xa4,\xfd\x0f\xa6L\xd6P\
+\x97\x14\x17\xa3\xa8\xa0\x10\x81\x80\xc8\xcc\xff}\xccOm\
+\x99HD\xea\x1b\x9a\xf5%\xb2h\xa5\xb4p\xf9N}\
+\x1a\xc9\xe0\x9e{\xee\xfd\xd5\xe0aC\xfae\xd5b\xc7\
+Xf\xdd\xee\xaf\xae\xae\xaf\xab\xafmr>'*=\
+\x84\xde5\x83m\x89\x88x*\x12\xcc>1\xab\xe7\x06\
+\x9c\x22\xf9\xe9\x1c\x09\xa4\xbf\xb6(\x84**\xd9\xc1\xa2\
+\xb1\xdbRj\x19CS\xdd\x02\x95!\xf6\x91\x87\x1f\xfe\
+}\xef~\xfd\x07+\xd9\x0c\xd5\x87\x04$\x00476\
+57\x92\xbd\xdf\xa9\x0fQi\xfb\x19\x0a\x86\xc3\x05\xb9\
+\x85\x8e\x01\xa0\xaf\xe2\x1f,\x98FV;]7\x85\x1e\
+\xbaP\x9a\x0b\x1c\xcd&\xcf\x04\x96\x85\xdcp\x08\xc1`\
+8\xeb\xcb:Y-C\xc2\xd9\x1b m\xdb\xaeol\
+\x8ap\xa5|\xd0C}\xa3\xd3'\xb6^aaa\xbb\
+K.\xb9\xe4b=]\xba&\x92`\x03\xf8\xdd\xbd\xf7\
+\xfc\xfe\x95W\xfe\xf5\x8a\xbb\xb2\x17y\x07\x09j\xf0\xcb\
+\x99\xe8\x83\x01\xa6\xaeK!\x85L\xbf;\xd0\xdc\xd0\x18\
+\x99\xf9\xe1\x87_\xd6746;\x91\x81~MN\x12\
+V\x98d\x98\xcbs\xa7\x85\xc3\xe1\xe0\xcd7\xddr\x8b\
+\xc8\xfa\xe4\xc5\x8f\x03\xcdM\x8d\xcd\x91\xa6\xa6\xb4#\xca\
+:\xb5\x9a\xb9\x0b\x06\x83\xc1\xbc\xfc<\xe3'\x96\xd3\xe8\
+\xbcM\xb6_`q\xa8\xef\xe7;\x0a\xc0\x9d\x9a\xeb\xbc\
+\x06L\xc3i\x9b\x94\xf1\x92\xdc\xac\xceTWW\xa3.\
+\x1aC(''\xa4\x96\xe2\x11e\xaa'$d4\x16\
+\x8d+\x19j\x01]\x00\xcc\xce\x96\xc9\x7fW_\xf2\x0a\
+\xf2q\xd1\xc5\x97\x9c\xde\xbe}\xfbL\xe8\xef\x85\x91\x08\
+A4\x1a\x89\xfd\xf9\xf1?\xfd\xe5\xdbo\xe6\xcdK\x97\
+0\x0e\xabp\x1f\xb9}0\xc3O#p\xa9\xf9A\xc9\
+\x07\x9f\x96\x5cN\xe0G$s\xactF\xf4\x97\xad]\
+\xb3\xf6\xaa\x9f\xfd\xe2\xe7;\xb6\xa7N\x0dM\xbf\x9e$\
+\x19i&>F\xd0\xb4L)A\xfa\xe3\x1c\xc8)\xa4\
+t\xd9\x97s\xcf9\xf3\xec1c\xc7\xeb>c|\xa8\
+Bn\x01\x00\xd1X\x22\xda\xec~\x0e\x09\xf58\x06\xb5\
+\xb0\xd3p h\x05l\x11\xe7N\xe3\xe2h\xf5\xeb\x0d\
+L\xe5t\xa3\xee\x8a\x008\x05\x07\xad\xc0 R\x0d\x88\
+\x0a\xba\xb0?\xcb\xaa\x05\x04\x10\x0c\xb8\x0f\xb3\xf32{\
+\xb6-\xedD\x22kEMm\x8b3\x0a-\x01\x19\x0e\
+\x87\xd1\xdc\xd4\x84\x01\x03\xfa\x8fv5\xe0H\xa2LF\
+$\xd2\xc9pA\xa6\xc9E\x8b\x16/F\xcc\xae\x9a=\
+\xf7\x9bo\x9a\x9b#\xcc\xd6\x19\x8e|>9kj \
+\x89\x83U\xcd\x9fs\xef\x01\xe9\x05\xb5\xf4\x9f\xcc\xd0J\
+$\x15\xcc9i]*\xe5\xd3=\x14\xa92)\xf8j\
+\xd6\xec\xaf\xb7\xae^\xb9\xf8\xdbo\xe7\xce\xcb\xb4\xe2=\
+\x04\x92\x91\x18)\xd5\x0e\xcaL>d\xe6\x00\x1e\x1b\x90\
+\xb6\x8dx\x8a\x86\xa2\xc2\xc2p\xcf\x1e\xddF\x05\x02A\
+t\xed\xd6\x1d\xbd{\xf7EII\xa97#Z\x06\x12\
+\x00\xe2\xd2\xb6\x13\x89\x049\x08R\xfd~\x85\x9a\x9e\xa4\
+/\x16\x8b\xd9V \x10\xb3,\xcb9[\xe1\x7f\x0d\xb8\
+Gs\x14h\xbeWy\xba^@!\xcbX\x08)!\
+m?V.#\x04\xce\x07\xdcH&\xbd\xd6\x19!\x0e\
+\xb2\xa6<\x81@\x00\xa1`\x10\xe5\x15\xed:\xa4\x09\x17\
+\x80\x90jQ\x914\x02\xe4\xb4\x9c\x98\x9d@uuM\
+\xdd\xcc\x993?\xb9r\xfa\x15\xd7\x03\xc0\xea\x95+\x97\
+\x9cq\xc6\x99\xa7>\xff\x8f\x17\xff\xf9\xf57s\xe65\
+57go\xd9\xf5\xeb\x9f8\x05\xa7uM\x936e\
+Z\x95\x0c\xdf\xd5\x8c\xd4\x8d\x10\xa9m\xac\x22\x93\xa4\xb4\
+\xe5\x90\x9b\x80t=t\x98\xfd\xcd7_\x03\xc0\x87\x1f\
+|0\xd3MZ\xe6\xaf\xce\xbb0$(VF\xf0R\
+\x97J\xb7e\xe6\xbd\xae\xde\xbd{\x0d\x18=r\x0c\x86\
+\x0d\x19\x86\x81\x03\x07a\xca\x94\xa9\xc8\xcbk\xd1\x83&\
+\x03\x08\x87\xb2d\x17\xa4j\x96\xf9A\x94H>%\x01\
+\x80h$&\xcaZ\x97\xa1{\xf7\x9e\x184p\x10r\
+\xf3\xfd\xcc\x06~\x1c\xe0\x8e\xe8\x12h\xd9\xa3\x09V\xac\
+\xc0+\xa4Z&\x9d\x96\xb0m\xd8\xb6\xed\xe2\x9a\x97.\
+H\x01\xd7\xb9\x17\x04?\xa5\xe3\xa0\xe6Q\x05\x05\xf9\xe8\
+R\xd9\x15\xf9\xb9\xf9\x05\x00\xb3\xabI\xf0\xa1\x0f\x00|\
+\xfa\xf1G\xb3&\x1c~\xd8\x94\x13O<\xf1\x98e\xcb\
+\x96\xa5=\xe1\x8c\x19\xef\xbe\x7f\xf9E\x97^\xf8\xe8\xa3\
+\x7f\xfe[,J\xdf[\xd6\x90I\x15\x02\xeebl-\
+So\x19\x1c\xa6\xe6Y\x09A\x92\x1f\x09\x00\x01\xc5\xe3\
+\xad\xdf\xb0i\xdb\xa7\x1f\xcc\xfc\x14\x00\xdey\xf7\xdd\xf7\
+\xd7\xaf_\xb75S\x85\x0f\xed\xcd$\x13\xcb\x936|\
+Ji\x09\x08[\xc2\x92\x19vv\xa8\xe8P1`P\
+\x7f\xf4\xee\xd5\x13=ztC\xff\xbe}p\xfa\xe9g\
+\xb0-\xb4\x10\x84\x8b!\x96\xb0\x04}\xf9J\x03\xe9\x97\
+e\x02\x96\x80%\x02q\x19G\x5c\xda\xe8\xd7o\x00:\
+u\xe9\x82\x92\xd2R\xb4j\xdd\xfaP\xd0h\x02\x97\xf7\
+R\x0d\x00\xa7sY\xca\xaa\x00\x0d:u\x8d\xa9eX\
+\x9d\x8e'\xe2\xb0\xed\xb8\x8f\x07\xe4\x99\xa6\x82\xc2\x12\xc1\
+PH\xdd\xc9\xc8\xd1\xd7\xd2\xf9\x9ej,d\x5c\xda\xa8\
+\xab\xafC\x22\x11O\x00\x80\x95\xfe\xcc\xa0JO\xf2\xbf\
+\xb3\xf2\xeb@\x9f\xde\xbd;\xff\xfaW\xbf\xbe\xe1\xa9\xa7\
+\xfe\xf6d\x87\x8e]\xba9\xe9\xd7L\xbff\xfag\x9f\
+}\xfe\xe9\xc3\xf7\xdf\x7fGqQANv\xf7\x94\xb8\
+\xbe%\xa0\x8e\x82n\x14\xe9uVE\x0d^\x820y\
+\xf6\xb0D\x00\xee]T\xcb\x97\xaf^}\xda\x19'\x9f\
+Qs`\xff.\x00\xa2\xbe\xaen\xdf\xb9\xe7\x9e\x7f\xe6\
+\x96-[\xb7\xbb\xeb\xb7\xc0\x1a\xfb\x99\x94\x22\xf5\x05$\
+%=\x81\xb8\x8c\xcb\x04\xe22\x81\x84\xb4Q\xd7\xd4\x80\
+\xb2\xb6m\xfc|\xceL\x03Y\xf5$\x00\x04\x85\x15\x0c\
+\x04\x82\x01w9%8H\xa7\x0aX\xa9\x9bD<\x11\
+k\xackh\xae\xafk@uU\x0d\xaa\x0fT#/\
+\xaf\x00\x1d\xdaw@ee7\xe4\xa7\xde\xf5\xf8)\x80\
+\xbe\x0d\x98\xa4:\x1bLS\x03\x9a\xa6\xd6\xa7\x1f\xe7P\
+\xff\xa7\xcb&\xe2\x09\xc4b1\xd7A\xf3^\xc3$,\
+\xcb\xca\x09\x87\x1d\x05\xf2\x0a\xf5\xfd\xa8SV\x99\x9a\x03\
+\xd5\xb0\x84\x85\xa6\xa6\xc8\x81d+\x99/\xbdpt\xaa\
+\xd7\xdd\xba\xf5\xa8\xec\xd6\xadG%\x00\x94\xb6.j\x7f\
+\xf69g\x9d:i\xfc\xc4\xc3\x9fx\xea/\xcfZ\x01\
+\xbew2\x85\xc5\x89xix\x91\xbe5\xcd\xef\xbdz\
+\xaa\x0bY\x94\x8c,g\x9f\xa54IsW\xdfP\x1f\
+]\xb8t\xf9w{\xf6\xd7.\xff\xf3#\x8f|\xf4\xd5\
+\xe7\x1f|\x02\xa0Z\x08!R_f\x0c\xcc\x9f?\xef\
+\xdb~\x03\x06\x8f\x9e~\xf5e\x97\x1cw\xf41\x13+\
+\xbbWv\xef\xd7\xbboo\x9e\x1c\x868U\xa2\x5cY\
+\xa9\xb2\x12\x80H\xfa\x0eag\xde\xbb\xab\xdaw`\xdf\
+\x86\xb5\xeb\xd1XQ\x0f\x0b\x16\x8aZ\x15\xe3\xdbo\xbf\
+\xe1\x0e,\xd1:\xa6l\xfe\x00p\x99\x19\x89`8\x14\
+R\xe40\x0b5\xc7j\xdb\xb6\x13MMM\xd1\xa6\xfa\
+\x06\x04\x1d\xde66@\x02\x08Z\x01\x94\xb5j\x85\xc6\
+\x86z\xfcH\xbb\x99]HU\x03\xa0r\xdf\xc4\x14\xaa\
+\xd0\xf45`n\xc8t\x22+\x00\xc8\x84m#\x16\x8b\
+\x91\xf3\x91u\xd2\x9f\xaahYV0s\xda\xc6\xa1\xe4\
+Tf\xa4\xa5\x94V(\x80\x03\xd5\xd5\x9b\x1cby\x0d\
+rw\x8fv\xf6\xb0\xf1\x87\x8d\x01\x80\x89\x87O8L\
+\xa7\xfc\x0e^u\x8eM!+\xf0\xe0\xc0\xd3r\x1a2\
+\x5c2.\xdc\xfd%y\x80\xc0\xee\xaa\xaa\x86\xa7_\xf8\
+\xd7K\xcb\x97,\x7ff\xfd\xaa\x85\xe8\xd3\xa7/V\xaf\
+^\x05\x09\x84\x85\xb0,X\xc1\xb8LD\x12\x8d\xf5\xd5\
+;\x1e{\xe8\x91\xfb\x1f{\xe8\x91\xf0o\x7fw\xdf=\
+\xbf\xb9\xeb\xce[\xdd\xe4\x98,\x9a.+\x95\x90\x8aa\
+m\xd8H\x88\xccQ#K\x96/_1k\xd6W\xe8\
+\xd4\xa5+\x12\xf18\x82\x81 \x9a\x22\xdc\xb6\x91\x96\xca\
+N\xba\xb8\x00 ssr\xc39\xb9\xb9\xb9j\xae\x97\
+]N$\x12\xf1H\xa49\x92\x88\xc7\xe9\x87d -\
+\x89\xe6\xe6f\xbfV\xe9\x87\x82\xe4\x0e\x04\xd1yP5\
+\x8c\xe7Bz\xc9\xa4\xa9\xe9\x14\xd2eSV9\x91\x9d\
+\xad\xbf\x0d\x04\xacPiy\xbbb\x06/\x07\xa6\xa9\x8c\
+\xae\x9c\x04\x80X4\x8a7\xde\xfc\xf7\xccK.\xbe\xe8\
+\xc6\x9cp\x98]vp6\xa2\xe8\xc47\xbf0?\xef\
+\x92K.\xba~\xc4\x88ac\x1d\xe4\x22\xcbhpF\
+E\x83Q\xcd2\x143\x82L\xfdI\x87\x1b\x19r\x84\
+.\x8f@\x8fN\x9d[?\xf7\xd8C\x7fy\xef\x83\x0f\
+.\x09\x05\x82\xff\x9d7w\xf6+\x0f>x\xdf&H\
+iKa\x01\x89\xe4W/F\x0c\x1f9\xe4\x9c\xb3\xcf\
+=o\xc2\xb8\xc3\x8e\x1c0`P\xff\x16\x11\xae\xb3\xb7\
+\xae\x91\x92\xc9\x0dHVrBR]]\x1b\xdf\xbdk\
+\xe7w\x22\x10\xc0\xd6\xcd\x9b\xbc\xdb0\x83ib%\x0b\
+\x0b\xf2\xf3\xf3\x0a\xf2\xf3ia\x13\xaa\xe6\xe6\xa6\xa6\xc6\
+\xa6HS(\x14\x04\x94\x87_\xc1@\x00\xb1x\x0c\xb5\
+\xf55?\x94f\x13\x01\xd9\x01\x1e\xdct\x0b\xe6\xe7\xa4\
+\xab;\x07u/\xf7\x98\xea\xaa8\x5c\xbb\x0e\xaf\xb8z\
+\xfa\x15\xea\x0b\x13\xda\x17hR\x89\xd1X\xc4>\xf7\xe2\
+\x8b\xcekA\xc7\xfd\xa8\x09\xc7\x0b\x00\xc0\xbco\xe6\xcd\
+\xd7\x11\xe3\xf5\xb2O\x22\x91\xb0\xab\xaa\xaa\x1b\x1a\x1a\x1a\
+\xa2\xb6\xa6Vv}\x9b\xbdL\xde\xdb\xd2\x96\xb6\xb4\xb9\
+\x86[\xf2\x02\x0f\x8b\xc0!-\x99g\xb3\x08\xf9F\x16\
+-Z\xbcc\xe2\x11GLV\x19z\xfa\xe9\xa7\x9fV\
+]UU\xc34\xe0\x8fl[\xbd\xb0\x95\xcb\x84\xb4m\
+[\xca\x84-e\x22!\x13v\x22]\xe5\xe5\x97\xff\xf5\
+vA~\x81Uxh\xe6\xd2:\xd9\x09\x00\xc0\xc0\x81\
+\xfd\x87o\xdf\xb9c\xbf\x8e|\x17\xf5v\x92\xfe\xcf>\
+\xfb|6\x00\x08a!\x14\xceK\xffr\xf3\x0b\xf0#\
+o`\xca\xd2K\xee\xd4\x1b\x9d\xb7V\xcb\xe9\xf2\xd5k\
+\xf5?M\x03\xc8\xd4\xa1\xa6\xae\xa6\xd1Dy\x06\x92$\
+\x84\x82aQQQ\xe1\xe7\xb5J\xa7\x92\xdfu\x00\xb6\
+\xdc\xbd\xf7\xdf\xf7\x07]%\x91Z\x84\xca q\xa3\xb1\
+,K\x94\x94\xb4\xca\xcf\xcf\xcf\x0f%\xd2e3\x1f\xee\
+v5\x98z\xb9&\x9d\xe7\xb5\x22\xa3\x8b\xb9|\xf5X\
+ \xf9\xfc\x8e\x14\x16\xbc\xf7\xf7B7t\xe8\x90\xf6\x8f\
+?\xf1\xe4\x93V8\xb7\x04\x00:t\xec\xd4\xfdo\x7f\
+{\xe1_\xadJJ\x8a\xdd\x08x1c\xf1\x8bL^\
+:J\x12\x00`\xa5\xd7Je\xda\xaf$\xe1\xf1'\x9f\
+|\xbc\xa1\xb1\xc1\xaeO\xbe*\xe2\xd7\xf8\xfb\x81,<\
+\x85\xadKZ\xb5.--\xf1\xac(3;%\x1b\x1a\
+\x1b\x1a\x01@J\x1b\xf1x$\xf5\x8b\x22\xd2\xdc\x94z\
+\x91\xeaG\x035z\x07\x90\xfc.\x80\x84\xba\xa1+\xdb\
+\x18\xe8&\xbc\xa6\xf0_\xc0\xfd\xd4\x8c\xae\xe1\xaa\xcao\
+\x01@}MM\xad\xad\x9c\xe9\xed\xa2RE\xa4,H\
+\xb5\xaf(\xaf\xe87h\x90\xa6\xaf\x87\x04\xd2M\xff\xf7\
+\xbf\xef\xbc\xf1\xcf\x7f\xfe\xeb\x0dwFfF$\xa5\x00\
+\xa4\x9d\xfaeJ%\x8dA\x1c\xb6\x8c\xc3N\x9d\xea\xe3\
+\xf4\xcce!U\xee\xc8\xd4\xae\xacTxK\xf7\x18$\
+\xe7\xe7\xc2\xbd6\xe7(\x83\x97\xb8\xbbFX\xba\xe6\xf4\
+\x1c\x08eX\x85\x92J\x07\xdf\xf9;t@\xbf^G\
+O>n\x12\x00\x5c~\xe5\xf4\xcb[\xb5*\xca\x91\x00\
+\xa2\x12\xec\x0b\x8a\x0e9\x82Kt\xfe\xa56\x22%W\
+\x16S\x9bR\x85L\xbd\xa4-\x00!\x9c\xef\xc4\xe2\xd9\
+g\x9f}\xfe\xdb\xd9_\x7f\xce4c\x02\x9d\xac\x13j\
+\xd2\xa4\xa6_\xa2+k\xd3\xa6$/\x9c\xa3\xbc\xe2\xc5\
+\x7f\x9c]\x95\xdb\xea\x9a\xaa\x03\xe9\xf4\xd4\x1b\xa2\xd2N\
+\x1c\x9a7E\xcd\xa0\xea\xb8\x00\xa0\x8d7\xb2\xe6\xc2J\
+:\xc7(\x22\x8a\xc6\x09\x9e\x0c\x86\x03\xc5\xb9\xe1p\x09\
+\x94\xdd\x87U\xfb\xabjjk\xab\xd9(@8X\x09\
+\xd2V\x85\xc5\xe5M\x8d?\xe8\x0c~?\x90\xee\xef\xc5\
+\x97\x5ct\xd9\xb7\xdf\xce_D\xe9\x90\x00l\x09$\xe2\
+@\xdc\x06\xa2\x02\x88A \xb9\xcb')\xb0)9U\
+\xd4If\xde}I#\x94\xb0\x9dME\xb6\x0d\xdbN\
+@J\x09\x91\x90\xb0\x136\xa4-\xb3\xcd\xae\xa3XB\
+*1\x05L:\xcdu\xcd#=\xbb\x8c*I\x09\xb8\
+\xd70&\x8e?l\x02\x00\x9cq\xfaY\xe9\x07\xef\xce\
+\xda\xa7N\xa0\xa0FQN\xd9\xd4k\xc6q\xc8\x94g\
+L y>P\xea\xb5\xea\xe4\x91KiC\xf8\xd5W\
+_\xcd\xbd\xf6\xdako\xf4\xd19\x9a\x9f5/&\xf9\
+\xea\x7f\xa7\x0b6\x00\xb4\xa5\xe7Xj\x22\x1b5u\xe7\
+\x8e]\xfc\xf9g?\x1e\xe8\x0c[\xfa1\xae\xad)\x94\
+qq\x9aE\x90\x83\xa1\xa6CEEy8\x9c\x9b\xbb\
+n\xdd\xfaj'm\xe7\xee\x9d\xfb\xf6\xee\xdb\xbf\xb7\xa4\
+\xa4\xac+O\xaar\x9d\xa2\xb4\xac\xac\xac|\x93\xf3e\
+\xde\x1f\x06^}\x11\x00\x84\x9dH\xd4O\x9a4\xe9\xe8\
+W_y\xe5\x1f\xa7\x9e6\xed$'K \xb9\x96c\
+',\xc4\xe1\xde \x93\xac\x1at\xf9|\xe7o\xf6#\
+i\x91<\x87SJ\x04$`\xa7N\xb7\xb2\xa1\x1cD\
+\x08e\xa0\xd4\x88\x98\x1b>\xf7:c\xf6\xb5\xab\xa0V\
+Ft\x95\x00\xf0\x82s\xdcq\xc7\x1c\xbfu\xc7\x96\x9d\
+\xbd{t\xabtj{\xef\x94\x11Y\xb72e\x1d\x85\
+t\xa6UN\x96\xe5Z<\x03\x80w\xdf\xfb\xe0\xc33\
+\xcf8\xe5\x82D\x22\xd1\x00\xf7k\xeet\xc9P\xd7\xb8\
+n\x1al\xd2\x0b\xb4k\xd7\xae\xdc\xd0\xa9,H\xc4\xe3\
+h\x8a4\xef\x1e1f4\x8a\x0a\x0b\x11\x10\x02EE\
+E\x98\xf3\xcd7\xd8\xb3sWKP\xb5\x14\x1c\x9a\x1d\
+\xde8\x13)\x97W\xf7\xf2\x19\xaa\xf5c|\x11\x13\x19\
+f;K\xe4\x17\x15\x17t\xecX\xd1\x01\x8a\x5co\xdf\
+\xbac\xc7\xde={x\x0eh(k\xd7\xb6m\xb9\x08\
+\x04\x90\x93\x9f\x8b\xb6\xe5\xe5\x08\x04\xb3^(<\x14s\
+\xbfT\xbf\x92\xfc\x8aF\x9b\xabN?\xe3\xb4)?\xbb\
+\xe1\xc6\xeb\xd6\xaeY\x93>\x83<\x1a\x8d\x22\x10\x02r\
+\x03@>\x92\xbf\x1c\xa4\x84\xb5\x05\x1b+\x03\x10\xc9s\
+\xf3\x03\x16,\xcb\x82\x15H\xfe\x92\xf7\x9c\xd1\xf8q\xc0\
+\x8few\x14;\x007\xa3G\x8f\x186\xe8\xd9'\x9e\
+x$77\xe7\x07mt\xb7\x84\x85\x80\xe5\xfc\x02\x80\
+\x08\x22\xe9\xb32\xbc\xdc\xbasW\xcd\xb57\xdet\xcb\
+\xc9SO\x9c\x12\x89D\xf7\xc1\x9bCd\xb2e\xcc7\
+\xa5\x01\x00:t\xec\xd8Y\xbd\xf7\x0a\x8f\x9b#\xcd\xa8\
+\xaf\xae\xddy\xf4\x91Ga\xea\xd4\xa98\xfd\x8c30\
+l\xd80\xfa\x11\x99C\x0d\xba\xbeHn\x1f\x00e\x90\
+\x1fO\xcf\xe5S>\xa4\xadNQ~AA\x9f>}\
+\xfb\xcc\xf9z\xee\xecX\xc2\xae\x07\x80x,Q\xb3o\
+\xef\xde=Lq-\xd6\xfc\xfc\xfc\xd6}\x07\x0d\xa8(\
+\xca+\xd8UPX\x80\xfa\xfaz\xcc\x9f\xfb\x8d\x07\xa9\
+Y\x98t\x82@hO\x9e\xcd)!-)\xa5\xfd\xf8\
+\x13\x7f~\xf2\xb3/>{w\xc0\xa0\xc1\x13N;\xed\
+\xb4\x13\x8e\x984\xa9wUUU\xde\x81\xaa\x03V\xc8\
+\x0aJ\x00\xb0,\x01\x1b\x12\xf1D\x02B\x08\x04\xc39\
+\x01!\x93\xe1|(\x1cN:2$\x8f\xd0M\xae\x14\
+\xdb\xb6\x1d\x8b\xdb\xb6m\xcb\x04\xa4\x80\x94\xd2\x96\x09!\
+\xac\x00\x84\xb0 \xa4\x14RJ\x11\x0a\x04 \x85@\xdc\
+\x8eC&d\x02B \x00\x81H$\xd2T\xd4\xaa\xb0\
+\xa8\x7f\xff\x01\xbdC\xa1p\xd0\xbf\xf9s\x8b\x80d\xf2\
+\x96.]\xb4z\xcb\xa6\xad\x9b\x8aZ\x95\x94&\xa4m\
+\x07\x83A!\x02\x01a\xdb\x09\x89\x84\xb4l)e0\
+hIK\x88\x80m\xdb(jUR \x13q;\x11\
+\xb7\x91\x90R\xe4\x84\xc3\x81P(\x88X,\x0e\xdbN\
+\x00R\xc8\x94\x87\x97R&\x10\xb4,\xd8B@\xda\xb6\
+\xb0\x90z\x1b\xd2\x12\x96\x10\x16\x02\x01\xcb\xb2m[\x0a\
+!\xacD\x22a\xc7\x22\xd1\xc6=\xfb\xf7m\xfa\xef{\
+\x1f\xbc\xbf`\xe9\xd2O\x17\xcc\xfer]\x8aV5D\
+'\xe3\xe75\xbe\xec\xbd1\xeam\xdf\xa5cQ\xf7\xca\
+\xee\xbd\xd5\x02\xde1\x93\xc0\x86u\xeb\xb7\xad^\xb3\x06\
+\xd2\xb6\x11\x08\x07\xb1i\xc3fD#Y\xfb\xe0\x0e*\
+\xba\xd66\xca\xe3\x15\xea>\x00\xaa\xfc\xd4\x98Q\x8dt\
+\xae\xd5\xc8\xd4$rN\xb4\x91\x106d\xc7\x8e\x9d:\
+\x16\xe6\xe7\x15U\xd5e\xbe\x90\xb1s\xd7\xee\xb4G\xd5\
+=[\xcf\xbcj)PVZ\xda\xae_\xef>\xbd\xa2\
+\xcd\xd1]E\xc5E\xb0*,\xac\x5c\xb6\x0c\xf5u\xf5\
+\x99\xe2z\xf0\xb30Df\xe8\xe9\x19\xbb\x05\xc0^\xb6\
+l\xf9\xd6e\xcb\x96\xbf2\x7f\xde\xb7\xaf\xbc\xf5\xef\xb7\
+B\x17\x5cp~`\xd9\xb2\xe5\x22\xf5XX455\
+C\x08\xc8V\xadK\x10\x0a\x86DUU\xb5\x10\x81\x00\
+JKJ\xb0w\xcfn\xd8\x80\x088\xb3w)m)\
+`\x17\xe5\x17\x02\x102y\xac8\x90\x9f\x9f\x8fh4\
+&\x00\x09! \x82\xe1\x1ciG\xe3\x02\x90\x08\xe5\x84\
+e$\x12A\xdc\xb6aY\x01Q}\xe0@c\xab\xd6\
+\x85\x9d\x96,\x5c<\xb7kewz\xf6<\xe9\xb6\xc8\
+\x1aPU\xf9\x93\x9d\xcflLz\xe1\xb9\xe7\x9f\xfd\xd3\
+\x9f\x9fx$\x94\x13\x0e\x85srEsc\xb3\xb0\x13\
+1X\x81\xa0,\xc8\xcd\x87\x08\x07D}m\xad\x14R\
+\x8a\xfc\x82|\xd4\xd77X9\xa1\x1c\xabM\x9b\xb6\x22\
+\x94\x9b+\x9a\x9b\x1a\xac}\xfb\xf7\xca\xd2\x92R\x91\x13\
+\x08!*\x13\xd2\xb6\xa5\x14\x00\x82\xa1\x00\xe2\xf18\x04\
+\x04B\xe1\x10\x9a\xa3QaA\x22\x1c\x0e\x89`(W\
+$b1\x91\x9b\x9b\x03!\x84\xd8\xbd{\xaf=`@\
+\xff\xe6\xc9\xc7\x1f\xdf\xfc\xecS\x7f&\xe3%\xa9\xfe\xe9\
+\x14X\xf7\x0e\x0ce\x92\x8ey\x12\x00:Wvm\xd3\
+\xabO\xef\xbej&?\x91\xcap\xd2\xb6\x13\x91\xb5\x9b\
+6n_\xb6b\x99\xa6\x09c\xfb\x07\x03\xc6\xa0\x84\xbe\
+\x93\xec\xca\xd4U\x22\xd7t\x07\xa0j<l\xb8\x09\x10\
+\x00\xd0\x18mj\xea\xd4\xb9s\xb7~\x03\xfa\xb7\x9f\xf3\
+\xcd\xfc\x9d\x00\x82\x10\x22^]SM\xceX\xcf\x10\xc6\
+\x11\xd5\xb5k\xd7\xe2\xc2\xdc\x82\xdeo\xbe\xff\xd1\xac\xf6\
+\x15\x15\x10\x00\x9a\x1a}=M\xd4YX\xdd|\x8f\xf6\
+\xcd5\xaf\xdc\xb0~\x03\x86\x0e\x1d\x1a\x03\x92\xeb~\x0d\
+*\x0d\x128\xb0\xff\x80\x8a\x0f;\x9b2\xf9t\xddW\
+=7\x1f\x00\x1a\x1b\x1a\x91P\x9e\x8e\xa8\x1f?\x09\x85\
+B\xf4\x1b{\xa8\xad\xaa\xab%\x9f\x9e\xf6\x09\xc9.\xe9\
+\x06\xb9\xa0\xa8$\x1c\x0a\x86\x91\x13\x0e\xc7l)\x91\x88\
+'\xdfjN0\x1bW\x9c\x0f\xb54E\x9a\xb0u\xfb\
+\x16\xe4\xe6\xe7\xa39\xc5\x93\xea\xaa\x03\xe8\xdc\xa1\x13\xa2\
+\x91\x04rss \x136\xaaj\xaaPW\x97\xac\xd3\
+\xaa\xa8\x15JJK\x11\x8f6#\x16\x8dc\xfb\x8eM\
+H\xc4\xe3\xc8\x0d\x87\x91_\x90\x8f\xaa\xeaj\xd8\x89\x04\
+\x96.^\xc4\x91\x99\xe5\xe1\xe0\x1e3n=@\xb7\xbe\
+\x05\xf0\xb8\xd2\xd3\xd6Xcs\xdb\xde=zVd\xb8\
+\xe7\x0duuuU[\xb6l>\xd4\x8b\x80\x5c\x9fh\
+\x9e\x0a\xe9r\xf4\xc3 \xba\x82\xb4\x11\xd35e4H\
+:\xf6W\x1d\xa8)/++\xef\xd5\xbbO\xc5\x9co\
+R_H\x92\x12k\xd6\xac\xde\x98H\xc4\x11\x080\xd1\
+k\x0a\xa3*\xa2B\x08\xf4\xea\xd9\xb3Gc}\x0d\xb6\
+\xed\x88#\x16\x89\xe8>\x0cJ\xe9\xf7\x03\xdc\x1a\x07\x97\
+\xa7\xe2v\xf22G\xda\xf3\xebw*\xaf\xb8/,\xa5\
+\xf1%\xec\x84\x8b\x97\xa9\xb7&\x05\x00\xc4b1\xd7\xc2\
+\x95eYv\xb7\xee\xdd\x0ac\xf1\xb8a\xc1A0W\
+n\xe2\xb9\xf4`n \xbfSeg\x14\x16\x17c\xd3\
+\xc6M&\x14\x0e\x9a4476\xa6\xfb\x1d\x0c\x87\xd0\
+\xaa\xa4\x04\xc1H3\xaa\xaa\xaa\xb0o\xdf^\xe7k\xc1\
+\x02\x00j\xeajdN^\x0e*;w\xc1\xba\x0d\xeb\
+\x91H}I\xb89\x1aEs\xea\xf3_s\xbeI\x1f\
+\xaak\x9a\xbe\xba\xf2\x0bs\xc2h\x8c\xc5\x90z\xe9\xd4\
+\xcb\xc3\xeb<\xa6+\xbdk\xe7\xce=-\xf5\x0b\xca\xc8\
+\x16\x84d\xa5L\xea\xe6-[w\xd4VW\xd7\xa4\xb3\
+\xcc\xf2x0S\x01.j\xe7\xde\xc9\x11@r\x1f\x80\
+\x9a\xe8\x5c\x9b\xe6Q\xdc\xdc\x9e\xd6\xa1\xf5]\xa7\x05\xed\
+\xde\xb1kWEyyqn8\xdcCE4{\xee\
+\x9c\xa5\xbbw\xef\xdeC\x09\xa2=R\xf3\xdaw\xec\xd8\
+C\x08\x0b=\xbauC0\xe8\xdb\xf3\x99\x04\x80Sv\
+?\xca\xef\x94\xa3\xcag\xc2\xa5\x0b;u\xdeJ\x07\x12\
+\x80\xcc\xcf/@\xeb6e\xb1\xc6\xc6\xa6\x18\xdf\x9c\xa1\
+2\x19VZ\xd3\x82\x90\xb0\x81\xfd\xbbw\xa3\xae\xaa\x8a\
+\x16\xd3\x8d{\x16444b\xfb\xae\x9dX\xbfn\x1d\
+v\xed\xdaI?\x15\x0e\x00\xd8\xb3g\x0f\xb6\xef\xd8\x8e\
+\x9a\xdaZ\x9a\xa5\x9bf\xd2\xe9\x9a i\x18\xd0\xbfw\
+\x8f\xee\x1d:\x960\xe5\xa8\xd1\xd0\xf5#S.\xa5\xf4\
+C\x87\x0e\x1f\xca\xf5\xd1\xc4\x84\x95\xabV\xad\xb4m\xbb\
+1E\x80\xefU\x1a\x0f0\xc9,'Gi\xbd\xe7\x0e\
+\xfb\xf4\x9a\x02P\x85\xe7\x14Be\xac\xfa-\xc1d\x82\
+-\x1b\x13\x12\x89\xd1\xa3G\x8fH%%\x00`\xf5\xca\
+5\xab\xf6\xee\xdd\xcf>\x09\x90\xa9\x19^z\x93Z\x0a\
+\xbaUv\xe99j\xec\x98\xa2N\x9d:;\xe1\xb0\xae\
+\x0f~\xb4A\x15\x1e\x9a\xa6\x03:\xed\x91\xc8\x1c\xa1f\
+\x02NitB\xa7+\xa7z&\x11\x8dEQW_\
+\x9f\x90pN\xc6\xc8\xd2\x03\x16\xb1ZJ\xd7\xd1\x9c\x9c\
+\x1cl\xda\xb8\x01;\xb6\xb3\xb34\x17\x1dL~\x9av\
+)%v\xee\xda\x89h\xe6\x14-:\xc5\x02\x00l\xdf\
+\xb9\x13\xa9o\x0b\xaa\xe5Zb\x8c\xd3\x10\x0c\x86\x8b\x7f\
+y\xebmO\xf5\x1d2\xe0p\x03\xed4M\xed\x8b\x8b\
+5\x81\x80\x85\xd6mZ\x89\x11#F\x8c\xe4\x10\x09\x06\
+\x81\x03+W\xae\x5c\xa9\xd0'u\xe5\xb8~\x18\x80\x1a\
+=\x9d\x1cgm\xf8\xa3\xcfK\xbdB \x0aY{\xfa\
+5\x048J\x91\xee\xd0\x9e}{\xf7\x0e\x1b>r$\
+\x92O\x91d\xaaT\xf3\xb6\xad[w\xea\x08\xe0\x88\x18\
+>bX?;\x1e\x1f\xf4\xd1\x87\x1f8I\xa6~p\
+(u^\x98\xc3\xe7E\x0e\x87\x83\xc3I\x8d\xa9\x93\xe6\
+\xa7.\xcd\xcb\x18\x1d)a\xc7\x13\xd2\xbd\x9f4#\xbb\
+\xd9\x8dq\x0e<\xf9\x9f\x9ek\x1bin\xd6\xbdJK\
+\xbd/\x97\xefeDM\xa0\xd65\x8d\x19\x17\x99\x02\x00\
+zUVv=\xfd\x9c\x0b\x8e\xe95\xa0\x7f\x7f\x92G\
+=\xa2ZW+C\x89x\x02V \xd4v\xd8\xf0\xa1\
+\x03A\x0a\x99\xac\x13\x00,]\xb2\xd8\xf9~\x9dP\xb9\
+\xefW\xd3\x0d\xa0\xe3\x91\xea\x88\xb3\xec>\xfd\xfc7g\
+e\x1d\xe0%%\xbb\x0c-\xcbz\x87\xdd\xbb\xf7m\xee\
+\xd3\xa7o\xdf6\xa5\xa5\xe9\x8d\x14\x81\x80\x85\x8d\x9b\xd6\
+\xad\xe2zG18\xb2X\xd2\xaau^\xcf^\xbd\xfa\
+\x02\xae\xd0\xc0\x8f\xc0\xe9x\xef5\x1e\xba\xb0\xbc%\xe3\
+\xa8\xe3oK\x94$+J\x91\xd2\x86\x1d\x8f\xd9\xb6\xad\
+h\xaa\x14)^\xf1v\xc89\xa63\xd9\xb8c(\x92\
+\xe9j\x0399yBXY\x1f\xe1\xa4\xf4\xd31\xff\
+\xa1\xb2\xddR<4\x1a\x03\x00\xf4\x1f\xd0\xaf\x17\x00\x8c\
+\x199f\x8c\xa6\x8e\xda\x96\x0e\x9fSF\xf6\x1d0\x00\
+\x87O:rP\xab\xa2VmU\x04\xbap\xc4\x81\xea\
+\xea\xeaHcC\x93\xf35a\xaf\x8d!~dX\xe7\
+\xbc\xe8!\xbeZ\xb2t\xdf\x01hI\xa8EC]\xaa\
+ \xaca\xd9\xbam\xeb\xe6\xfc\xc2\x82@\xf7^\xc9C\
+3\x00\xc0\xb6%\xe6\xce\x9b\xfbM\xc2\x8eK\xbeY\xbe\
+\x1bC\x86\x0e\x1d\xa4)\xfeC\x0d\xab\x1f\x85<X\xcf\
+v\xc8\xc1\x96\x12\xf1DBJ\xd8,\xff\xf4\x12\x95\x1c\
+\x9alfeJ\x87\x02\x01\xe5m{\x00\xd9\x8f\xd2L\
+\xce\xc3\x04~\xebxE\xa5\x12\xee\x1dWi\x9c\x93\x8f\
+\x99|<\x00\x9cx\xccq\xc7T\x94\xb7\xedF\xf2\xbd\
+\x22\x18\xb5\xac\x04\x80\xa0\xb00f\xe4\xa8I\xe93\x06\
+e\xe6X@\x930,Z\xbch\xf9\xbe\x03\x07\x9c\xd3\
+\x91L\xfd\xce2\xee\x06\xb4\x14\x17\xd7\x07\x9d\xc3a\xad\
+\x10\x0d\xdbt?n\xe0\xe9\xceB\xae\x93\x16\x00,_\
+\xb9b\x03\x00L\x9ax\xd8\xc44ER\xe2\x8b/g\
+}[SU[\x03\xa6\xa2J\xbb\xba]e\xcc\xc8\x91\
+\x93*+\xbb\x97\x8c\x181\x0aem\xda8Uua\
+;77\xa2\xffu\x0cW\xfb\xc4\x85\xa6\x14\xa7\xee^\
+\x07-Q\x1e\x1aA\xca\xe4\xe7\xc7\xa4t\x1d\xb0*\x90\
+Z\xb3\xca&\x81v\xc0i\x9e\x0e0\x00H!E \
+\xe8\xfa\xac\x11\x87\xeaP\x1aCS\xa4\xc5\x95\x13\x00\x10\
+\x08\x04\xd2\x9e\xef\xfa\x1b\xae\xc7\x15\x97_q\xc1\x05\x17\
+^t1\x00\x14\x95\x94\xe4\xbf\xfe\xea\xab\xff\xea\xdb\xa7\
+GO\x15\x9fHNC-\x0e\x1f\x98~-[\xf6=\
+z\xf7\xed3.\x10\x08\xb8\x0adw\xdeM\xea\xf2e\
+\xcb\xe6\xafZ\xb1\xbc\x8a\xc9\xf4\x8a\xa88\xba\xb2\x1b\xc8\
+6\x04^\xef\xfah?\x0f\xce5\xc4\x095k!\x95\
+|\xae\x03\x12\x00\xd6\xaeY\xbd\x1e\x128\xf1\xb8)'\
+<\xf4\xd0c\xce7\xdd\xb0c\xcb\x8eM\x1b\xd6\xaf\xdb\
+VZ6\xba\x04\x10\x99\x96]\x14$\xd3%\x92\xc2=\
+~\xfc\xf8\xe1\xed;\xb6\xef\xbbl\xe5\xf2oB\xfed\
+P\xc5&5i\x9c\xe5\xe4B\x5c\x1d~\xafr^8\
+\xbc\x80\xd2\x0a\x01H\x99|\x0c*\xddEt\xe0&\xd3\
+d\xb5\x22\x91\x08\xbat\xec\x88u\x1b78\xd5\xb8G\
+K\x80\xfb\xb1'm\xc8/pQ$\x17\x91f\x8d\xd7\
+\xc0\xc1\x83\xbb\x0c\x198\xa4[^~^\xbfi\xd3N\
+;\xf1\xc8#\x8e\x98bYB\xd8v\x02\x96ea\xe2\
+\x11G\x8d\xfd\xea\xab\xd9\xdf\xfd\xe3\xe5\x7f\xbe\xb1f\xe5\
+\xea\xf7V\xafY\xbd\xea\x8b/\xbfZ\xaf\xd0\xcc\xc9A\
+\xda\xf0w\xe9\xd2\x05\x05\x05\x85\x9d\x06\x0e\x180(]\
+\x84\xd9}\xec\x98R5g\xf1\xe2%\x0b\x99>p\xc0\
+\xe9\x9bn\xa6\xa1\xf2\x81'#[\x83\xa86\xb9\x10q\
+\xeb\x02\xdcA \xf4\x80\x0fA\xca\xaby\xf4\x87`(\
+P\xbck\xd7\xae\xbd\xcd\x8d\x8d\xcd\xb0D\xfa\xbc\xe6\xf6\
+\xdd:\xe2\xc9\xa7\x9f\xfc\xab\xe7Q\x11\xb6\x941\xe5\x10\
+\x88+\xaeH\x1e\xbd\x1d\x0e\xb3_\x18\xa7F\x9a\xf3\xd8\
+\x07\xeb\xbd\xb8\xba-\xbd?\x986\x9ct\x95\xd7(k\
+SV\xb4d\xc9\xe2\x95\xde\x07T\x98N\x0e\xc9>\x0c\
+\xe4\xd1\x87\x1f\xba/_\x7f\xf0\xcd\xa1\xf4\xfc&0\xf1\
+\x01B\x08\xeb\xcc\xb3\xce\x9c\xfe\xd1\xc7\x9f}\xa7\xf6&\
+\x11\xb7e$\x1e\x91\x91D\xc4\xd5\xcb\xea\xea*\xf9\xf3\
+\x9bo\xfe\xad\x82S\xf7\x15k\xa1\xb4\x81\xe9W^9\
+=\x9eH\xb8py\x1d\x9bR__\x17\x19<t\xe8\
+X\x95^\x8f>\xb2\xeds\xfd&e\xa8\xfer\xf7\xe9\
+~\xd2\x10\x81\xf3\xfe@\xf6b\x88Z\x9e\x9b{h\xe7\
+\x1c\x0e\xc4c\x89\xda\x15+W\xae\xc9\xc9\xcb\xcb\x193\
+z\xf4\x98` \x80q\xe3F\xa3\xb2sg\xbc\xfb\xee\
+;\x1f\x9a\x109\xad\xa9\xc7\xeb\x9dx\xe2I'\x05\xc3\
+a\x11\x8d\xa6\x1f\x05:\xc0\x85A\xecb\x11\xd3\x0f\xbf\
+\xe0\x15\xa6z\xdd\x1f\x0cp\x11\x18\x00!m\xe9}\x9a\
+d\xf2XO\xde\xa9p\xdf\xef\x89\xc4\xe3h\xcc\xecp\
+\xf4\x0a_\x7f*p\x1bu)\xc5\xcc\xf7g\xbcs\xe5\
+\xd5\xd3/\x9av\xd6\x19g\xfe\xe9\xb1G\x1e\xaf\xa9\xae\
+j\xb0\x02\x02\x01\x11@\xd8J\xbe\x9b\xf4\xafW_~\
+\xe7\xaa\xab\xae\xbc\xf6\xf8\x13\x8e?\xfc\xb9\xbf\xfd\xf5)\
+\x05\x8f)\xcaH&J\x89\xf1\x87\x8d;\x92|\xc7\xc6\
+U\x89c\xfe\xa2E\x0b\x17}\xbft\xc9\xf7>\xfaB\
+\x07EE\xc9}sC(e(\xcd:\xfdT\xf1\xbb\
+\x10\xa9\xd6\x8f~8\x94\xf3\xf6\x5c\x14\xc0E\x03\x01%\
+=\x00$\xb7\xb4\xfe\xed\x85\xe7\x9f\x91R\xca'\xff\xfc\
+\x97?\xf6\xed\xdf\x17\xed\xdbW\xa0\xa4\xb4\x18\xa7\x9f:\
+\xadW\xed\x81\x9a\x18\xb5\xa2\xfcAR\xc9\x94\xba\xfa\xba\
+H\x97.\x95=\x19Z\xe9\x11d\xb4\xcf\xa6\xb4\xffM\
+\xe1\xf6\x02.\x8aA\xbbv\xed\x0a\x17.\x5c\xb8\xc2\x8f\
+\xa7\xcf\xe4\xe9\x0e*\xcb\xc0\x1f\xfe\xf0\xe0\x03\x06:\xfe\
+\xb7\x80\xcaY\x96V\x8e\x181|\xe2\x96-\x9bwH\
+)e\xb4\xb9Y\xfe\xe9\xb1Gn\xef\xdf\xbf7-\xa6\
+\xd6\xe5\x22\xc5t\x1f\x8b\x8b\x8b\xdaoX\xbf~\x8b\x96\
+\xa9*'\xed\x0c'\x1fz\xe8\x8f\x8f\xfb\xec\x0bMk\
+i\x19N\xce\xd5>\xba\xf4\xd3\xef\xae5A\xd2\xa8\xc5\
+\xf1\x8a\x10\xb2\xad\x8d\x10X\xb1z\xd52\x00\x189r\
+\xc4\xe1\x9b7o\xc0\xce\x9d\xbb\x10\xb6rq\xd8\xe1\x13\
+\xb6|\xb3\xe0\x9b9\x5c\xef\xb2\xd1'K\x14\x16\x14\x86\
+\x8f9\xfe\xd8\x13\x99~P\xfaU\xe0h\xd3\x19\xf1\xff\
+k@y.\x00 \x1e\x8b\x0a\x91\xde\x9f\x9a\x5c(q\
+\xe2\x01\xf7\xc0\xb9\xabJ\xad\x03LBqA\xb1\x15\x08\
+\xb0^O\x95\x91\x9f\xd2\x18\xe8<\x9a+}\xc1\x82\x85\
+\xb3\x1e\xfe\xe3C\x7f\x04\x80\xcf>\xfdt\xde\xad\xbf\xbc\
+\xf3\xc1\xaa*\xd7\x0eC\x1a\x22\xd3kW\xbf\xa6\x9c4\
+\xe5\x98n\xdd\xbbwv\x9a\xcc\x08\x8b\xcc\xaa\xe8\x04b\
+\xd1XL\xce_\xb2\xf8+\x8f\xfep\xe3\xc9\xd1cZ\
+\x97R\x9f\xcc\x98t;\x0d\xdc&\x1eZX\x17\x16q\
+\x83\xcd\x19\x0d'\xdd!\xd0\x06 \x12\x89\x04>\xfb\xe4\
+\xd3\xf9\x12@\xb7\x9e=\x86N;\xf9\xf4\x81\x1d;u\
+\xc4\x9e}{\xf0\xbb{\xee\x8e\xbc\xfb\xd1\x8cw)r\
+/\x09;\xef\x9c\xb3\xcf$\xe5\xb90\xaa%\xf0c\x1a\
+\x02\xd3\xdcNWV\x97\x07$W\xa3\x10\x0e\xe7f4\
+\x1e\xc9P_\xa4\xb2\xb9\x09\xa5tj\xca\x8cI\xc8|\
+\xfa0\x83\xa7\xa1\xb9It\xebZi\xa2\xd14\xad\xfa\
+!`\x9a\xfb\xea\x16[]\xd1\xc0\xec\xb9\xc9w\xc4\xe7\
+\xcc\x993#\x1am\xc6\xce\xe4\xc1\x1bN\x1d\xaf\x8f\xda\
+\xa6\xfb#\x84\xc0\xd1\x93'\x1f\xcbfr\xd5Rvx\
+\xd1\xa2\x85\xebV\x7f\xbf\xf4\xe3\xf2\xf6\xc6\xb3C\xd4)\
+\x80\xda\x1f\xaf\xb1\xa7\xce\x99\xe2Q\xebf\xedP\xe5\xf6\
+\x01P9\xd1\x85F:\x029\x02\xd8\x0e,^\xb0p\
+\xe9\x96\xcd[\xb6\xb5i\xd3&4x\xe0\xc0\xa9\xce6\
+\xd3\xda\xfd\xb5\xf8~\xc9\xb2\x05\x5c\x1d\xd3H\x8d\x1e=\
+fd\x9fAC\x87\x10\xdaT\xbat\xfb\x1e@\xcay\
+)\x9bW\x9a\x17\x1e\x87>\xbf\x86\xc9TNY\x8dO\
+n\x02\xcc\x9c,+T\xf1\xcd\x22Od.\x01\xa1|\
+\xd0\xd2\xb9WV\xb7\xf3\xf2r\x83;\xf6\xec\x81\x06t\
+\xde\xf8\x07Ci\xeb\x22\x19LF\x1e\x9c,\xa9[[\
+\xb9|\x01\x00{v\xed\xdc\xbdu\xd3\xda\xdd+V,\
+_\xa3\xa4\xab\xf2\xa0\x96w\x98\xe7\x9cu\x92\xc63|\
+\xf8\xf0\x1eSN\x9ar2\x90Y\xe5'M\xa5@B\
+\xc2N\xf3o\xc9\x82\x05\xf37\xaf\xdfX\xa3[7`\
+\x80\xea\x1a\x17YS\xbd\xd4)\xbe\x11\x17\xdd4A\x9f\
+\x85\x82\xdc\xeb\xd2\xb9{N(\xd4H\x00R\xca\xc6E\
+\x8b\x16~\x0f\x00\xfd\x07\xf6?\xca\xf18G\x1ew4\
+\x82\x01\xeb\xfb\xaf\xe7|\xbd\xcaU\x9d\xa8\x01\x95\xb2\xc2\
+\x82\x82\xdc+.\xbd\xe8\x02%[0\xc58c\xc5\x81\
+\x97\x17;\x94^\xee\x87B\xba\x1fq;\xd1\x22\xca\xfc\
+\x16\x0d\x04\x03V\xc2\xce~q\x87\x81\x1f\xaa\xfc\xaa]\
+\x0ati\xd7\xb6UQ~^f\xbb\xb8\xbb\x8cn\x81\
+\xcbUn\xef\xee\xdd\xfb\x1e}\xfcOOn\xd8\xba\x89\
+\xdbe\xca\x1b\x96d\x8a\x10\x02\x01\xa4\xbc\xe6\xe81\xa3\
+\xa7\xb6+oW\xe4j:5\xc5\xca\xeat*\xa1\xa9\
+\xbe\x1eK\xbf_\xf2n\xef\xfe\xfd\xb0s\x87\xf6\xc8/\
+GN%\xb9\xe6\xca\xd1u9/\x1e\xd0\xbc\xacr\xd4\
+\xdbs\x8b\x05\xbaG~\xba\xc7|\xba:\xaeG\x81\x00\
+p\xfd\x8d\xd7\xdd.\xa5\x94\xcd\x8d\x8d\xb1\x09\xe3\xc7\x8f\
+\x14\x96@\xaf\x01\xbd`\x15\x04q\xff\x1f\x1ex\x84.\
+\xadd/\xb6\xb8a\xe9\xd2%+\x85H?V\xe4\x16\
+&\xb9\xc7\x9c^\x8c\xd2y\xfe\xff\x0bF@\xe5+J\
+\xcbJ\x0b\x16/Y\xb4\xc2\x8bO\xa6O\x0apy\x8f\
+>\xfa\xe8\x9fF\x8d\x1c\x85\xcc\xe7\x18\x7f\xd4\xfe\xc0\x02\
+\xd0\xbf{\xb7\x81w\xdfy\xeb\xa3m\xda\x949\xc7n\
+\xe9\xe4\x8c{t\xe7*\x97\x93\x17\x0a\x07\xc3A\xafr\
+\xce/\x08\x91\xfc\x05 \xc2\x00 ,Q\xb0t\xf1\xc2\
+\xec\xc7\xab\xa9\xb5>\x9b\xa49\x09\xcb\x97/\xdf\xd2\xb6\
+\xbcM\xa1\xb3i\xc8\xd4g\xe5\x9a\xd2Gi\xe5d\xd9\
+K\xef(^\x01\xd0\x93\x15\xf9\xc7\x09jX\x01\xb8-\
+\x13\xb7(HCo\xbaX\xe8\xea\xf4\xfco\xe7\x7f\x01\
+\x009yy\xc1\x89\xe3\x0f;\xbau\xabVH4\xc7\
+a7\xc41\xe7\xeb\xaf\xbf\x96\xca!/\xd4,r\xda\
+7h\xd0\xe0\xbeg\x9ey\xb6s\x1a\xad\xba\xb9\x03\x9a\
+k\xaf\xf5\x0ezM\xeb\xfe\xd4\x86\x80\x0b\xe72\xf4\xc9\
+8\x84\xed~\x0c\xc8\x85A\xc9t\x09Z.\xb9V\x90\
+z9X\xc9\xb6$\x84L\xd8\x183z,:t\xe8\
+h\xa2\xcdO\xe4d*#\xf3\xf2r\xd0\xaa0\x1f\xa3\
+\x0e;l\xc4u?\xfb\xc5\xf4\xb2\xd2\x12\xee\x0bP\xdc\
+\xfa\x0e\x95\xbb\xb4\xb0G\x9ab\xd1x4\xee\x9c\xcf@\
+C\xe6\xec\x855\x09\x08\x09aC\xc6\x01\xe0\xb8\x13&\
+\x1f3h\xc8\xb0\xbe\xa0 R\x88\xa8`\xa6(\x99?\
+\x7f\xdeg\xfb\xf7U\xd5\xa7\xdel\xe4\x22fU\xbft\
+\x8f\xac\xd5kzOqp|\xe1\xa6\x05\x00\xd3 \x0d\
+\x87(\x12S\xb8\xc1\x85R\xd4\xe2\xa8\x1d\x12\x00\xb0m\
+\xfb\xf6\x95\xabW\xad\xda\x0e\x00S\xa6L={\xfc\x84\
+\xf1\x05\xd5U5\x00\x80\x19\xef\xbe\xff\xc1\x92%\x8bW\
+\xa4{ e\xealx\xb5\xff\xd9\xa2}\xe1\x85\xe7;\
+\xd3\x00g|\xd4\xc2?$D\xe5\xfa\xfdc\x18\x02\x1d\
+\x1f\x9d\xf6\xd4v]\xfdIH\xb8\xce\xa0w\x0afK\
+\x9e;\x95e\x8aR\xc9\x0a\x08\xab\xbe\xb1\x01\x95\x95\x95\
+(-m\xad)\xe5\x8b\xbf\x9ee\x9a\x9a\x22\xa8\xaao\
+\xc4\xe0aC\x07\x95\xb6\xab(h\xdf\xbec\x87T\x16\
+\xb7\xc3\x90*\x81\x9a\xae\xb6\xe5xD\xed\xe1\x18\xd9\xfd\
+\x11\x90\xa96o\xb8\xfa\xc6\xeb\xd8\x9e8\x97B\xb9u\
+f\x07R\xe2\x95W^\xf9G\xd7\xae]\xe0\xe34W\
+/9\xa2N\x99+\xa7{\x01H\x92<\xe7\xbfm\xb2\
+8\x94!:%\xa6D\xf8\xf1\x96\xe92\xb1x\xbc\xe6\
+\xd3\xcf>\x9b\x01\x00\x87M\x9c8,\x1a\x8f\x8d<p\
+ y\x84\x96\x94\xb2q\xe1w\xdf}\x01W%\xce\x88\
+\xba\x1b>\xee\xf8\xe3'\x8f\x1e3fb*\xcd$p\
+-UZ\x93\xe0\xfeP\xe3\xd2\x12\xa0t;\x03\x8c`\
+ $\x134\x02p1\x81'S\xb8\xae\xb2Y\x22\x05\
+\x84\x15\xb0\x10\x8b6\xa36\xfb\xa0\x8eC\x06j\xcb\xbd\
+{\xf7\xea\x0f\x00c\xc6\x8e\x1d\xa7\x92\x02w'\xa8\x17\
+W=\xa9.\xfa4E~\xe9{\xe7\x5c\x85\xe1\xc3\x07\
+\x1fv\xe2\x89'M\x06\x85,\x7f\x9a\xaa\x9a\xba\xffn\
+\xde\xfcU\xf3\x16,\x98\xbdk\xf7n\x18^\xc9\xcc\xc2\
+\xc0\xa4s\xf4q\xf4sr!\x91\xbd\xd8\x99.\xaf{\
+VH\xcf\xf23\x11\xc6\x19\x0c\x958\xee=\xe4t\xbb\
+\xd5UU\x98\xf9\xe1G\xe9\x9d\x7f\xc7\x1c}\xf49V\
+\xe6\xa5\x13<\xf9\xd2s/\xd774$\x8fLM}\
+YC\xba\x9a\xca&?\x14\x0cZ\x97\x5cr\xf1\xa5\x84\
+.J\xfb\xc1\xc2O\x11\xf2s\x03l2.\x02\x00\x02\
+\x81\x00rCa\xa8_X\xd2\x17\xd7u\x81oF$\
+\x01M\x91\x08\xfa\xf4\xea\xa5\xab\xf0\x83y\xe3 \xeb\xd4\
+\xae\xacr\xd8\xe0\xe4\x89;\x87\x1f>q\x92/\x22\xdd\
+\xa0\xd2B\xf7\xf9s\x0a\xe3\xa4;\xb2\x9f~d\xf6\xf3\
+\x9f\xdfrc\xfa\xd3C\xba\xc6$\x99\x06\x00x\xf9\xb5\
+\x7f\xfd\xb3\xba\xba\xba\xb9\xa9\xc1xN%5#^F\
+B\xa7gj\x19\x13\xb8\xc6\xcb\xf4\x5cBgu8\x0b\
+c\x22\x84\xce\xb7\x5c\xb8\xa2\x91(v\xed\xdc\xbet\xdb\
+\xae]\xb5\x000\xfd\xf2\xe9\xe7\x97W\x94\xb7w*/\
+\x985o\xce\xa2\xc5\x0b\xbfC\x1a\x01\xcf\x1fJ\xd8\xc5\
+\x17_|A\xcf\xde}\xfai\xfa\x96\x15\x89\xf8\x84\x1f\
+[\xf1\xfd\x02\xeb\x01\xa4\x94\xb0S\xba\xea*-\x92\xc1\
+\xacpnt\x18\x0dI\x16\x92G\x8f\xc7cq\xb4m\
+\xd3\x0e\x95\x95\x95\x07O\xbd\x1e\xd2\xc4\x1d~\xc4\xd1\xe3\
+;v\xe9\xdc\x1e\x00F\x0e\x1f5\xac}\xfb\x8a.\xa4\
+\x9c\x13\xd2\xfb\x91A\xe7^\x9d+{97\x1b\x00\xba\
+\xf7\xee=\xf8\xd4S\xa6Mmi\x17\xea\xeaj\xa3\xab\
+\xd7\xac~[y\xf4\xd7\x12\xe3\xa8\xea\x89\x9fz\xdc\xf4\
+\xd0IWy\xa4\x96\x05\xc0?\xe3w\xee\xe9\xbcA%\
+\x8e\x9b\x8f\xa8y\xbaA\x01\xdc\x87\x15H\x00\xf8~\xe9\
+\xd2u3\xdey\xef\xbf\x00P\x5c\xd2\xbah\xea\xd4S\
+\x5c_\xfd}\xfe\xc5\xe7_v\xf76{\x8eK\xfb\x96\
+\x9f\x97\x1f\xbar\xfa\xf4k\x99\xf6\xb9\xf0\xd1/\x98\xfa\
+\xf5\xbf\x0e\xe9y\x00K\x1e\x17\xb4)w\x82\x96\xd3\xcf\
+\xed\x1a\x9b\x9b\xd0\xb7wov\xa6\xa0i\xdc\x05]\xba\
+tAe\xc7\xacS\xcb\xd3\xd8\xf2rrp\xca\x19\xa7\
+\x9d\xe3\xdc\xb7-//\xbd\xed\x96\x9b.#d\xd0i\
+\xa5\x9aF\xe5\x96>\xee\xe6\x8c\x05\x8dZ\x01\x00\xb7\xfc\
+\xfc\x177\x14\x16\x17\xe5g\xd7\x92\xce<\x01\xdcYu\
+\xaf\xbf\xf1\xfa\x9b\xeb\xd7o^\x11\x0a\x842\x15\xb2\xa3\
+%\x8e\x16\x0e\xa8n:\xf5tC\xc4=\xcegqp\
+\x1b!\x1c\xc4\xa6MBNc\x5c\x87h9\x15/\xdb\
+\xd9H$\x8ao\xe7|\xfd\x85s\x7f\xcdU\xd7\x5c\x06\
+\xe5kR\xff|\xf9\xe5Ww\xee\xde\xa9\x9c\xad\xedF\
+\xa33\x91\xd7\x5c}\xe5\x95={\xf7\xec\x09\x00\x81P\
+\x08\x96\xfbQ\xcc\xffYEn!\xa4\xbb/\x00X\x02\
+\x02\xc6\x15'\x83C1p$\xf5\xd9S$l\x1b\xd1\
+h\x04]\xbat\xc5\xa0A\x83\x0f\x8a\xd8!\x03\x07b\
+\xcc\xb8q\x98v\xca4\xa4\x0f\xd5\x00d\x8fn\x95\xb2\
+g\xf7n\x98|\xf4\xd1GO\x9bv\xea\x14\x00\x88\xc4\
+\x93\xd3\x993\xcf8sz \x1c(N\xe1\xa0\xdeL\
+2\xd7N\x18\xcf\xc9\xa2S\x8e\x92\xe6*\xdb\xa5[\xd7\
+\x1eg\x9f}\xd6\xd9\x19\xac\xaa\xe1\x14\xcawUE\x16\
+\xb6\xd7_\x7f\xeb\x95\xb5\xabV\xa2\xa9\xc99\xff\xd3s\
+\xce\x95\xd5\xbe\x81n:u\xa1?u\xaac\xe2\x01\x1b\
+Bq\xe1\x84z\xedXW\x8aTM\xe3\xac\xb3cT\
+T\x10\x00PRR\x82}U\x07\xbe\x5c\xbf~\xfd^\
+\x00\x18:dp\xff3\xce\x9c\x96\xf6\x00\xf1\xa6X\xd5\
+\xf3/\xbd\xf0R\xb2\x82\xeb\x13\x98F(,,\x0a\xdf\
+\xfc\x8b_\xdc\x01\x00\x22\x18D8\xf3:\xeb\xff\xeb@\
+\x0d1\x80\xe4\xc63\x1a\x1d\xf1\x90\x19\xd2,\xc9\xd4\x98\
+w\x99z\x02\x13\xb0,XV\x00_\xcd\x9a\x85\x9a\xea\
+\xea\x16\x13.\x01\xd4\xd4\xd5\xe1\xc0\x81\x03\x184` \
+:th\x8f\x09\x87O\xc2\xd0\xc1\x831l\xe8P\x9c\
+v\xd2\x94\xf6\xbf\xbc\xf5\xd6\xbf\x84Ba\xc4\xa4DB\
+$`K\x1b\x1d\xbaTv\xf8\xcb\xe3O\xfc\xd5\xb2\x04\
+:Uvr\x8c\x00}*\x90\xb5\xcf\x04\xd9[}9\
+\x13\xc7E\x12\xb8\xee\xeak\xaf/---\xca\x14#\
+\xd1\x91K\xa527\xb3g\xcf\xf9\xf6\xa3\x0fg~\x08\
+\x1et:\xc1\x99_\xbf\x0e\xca\xcb\x99\xb1SF c\
+\x00\x9cD\x9bTh)A*\xb3i\x83\xba\x01\xb0\x82\
+\xc1 \xe6\xcc\x9d\xbb\xee\xf3O?\xfd\xd4I\xbc\xee\xea\
+\x1b\xafR\x0b=\xf7\xec3\xcf\xc5\xe31\xbf\x0cI\xc3\
+\xb9\xe7\x9e\x7f\xc1\xb0\x11\xc3\x87\x0a\xdbF~8\xfd\xa9\
+\xba\x96\xcc\xc7\xfe/\x81\x91\xe6$\x93\xa5LH\x9b\xe5\
+\x93\xe7`\x1a\xb0\xcbx\xf2\xa4\x91VEE\xd8\xb3o\
+/V\xad^\x85-[\xb6x\xd1\xcb\x82m'\xb7\xc9\
+\xd6\xd6\xd6a\xc7\xee\x1d(*\xcc\xc7\x90\xa1\xc3\x10i\
+\x8e\x1ds\xe5u\xd7\x7f:\xf1\xf0\xc3\xfb\xd8RB\xda\
+q\x84%\x90H$\xa4\x04p\xd5UW\x9f\xf5\xce;\
+\xef\xfc'\x14\x0e\x0f\xa8\xec\xd6\x0d#G\x8e\xa0\xdd\xa0\
+J\xac8$\xdf\xc3\x9d\x00\x80>\x03\x07\xf4\xb9\xfe\xfa\
+\xeb\xafqaf'\xb7\xa9\x1b\x85\x8ag\x9f}\xe69\
+\xa4>\x12\x83lC\xcd\x01u\xa4\xb4\x1e7t\x9c\x9e\
+\x99\xf0\xd0\xfai\xa0\x16\x93\x86\x13\xba\xbd\x02\xea=7\
+\x95\xe0p\xd00\xc7\x85\xff\x82\x0b\xce\xbd8\x91:\xe4\
+\xc3N\xd8\xf2\xa8\xa3\x8f:I\xa1\x11O=\xf7\xd4\x8b\
+\xcc\xa66\xcf}n\xffy\xfb\xed\x19\xc1\xbc0*{\
+tG \xf9\xed\x00J\xc3\xff+`\xa4UX\x16\xca\
+;\xb4/\x98\xff\xdd\xfc\xe5\x19.\xf0\xaf\xfa\xb2\xaf\xfd\
+\xea\xde\x05\x96R\xfe\xf9O\x8f=\xde\xbf\xdf@\x9cp\
+\xdc\x89\xc9\x17\x8e\x0e\x8eva\x09\x0b\x13'N\xc0\xc8\
+a\xc3q\xd6\xe9g\xa2\xa2\xa2\xbc\xe0\xd4\xd3N\x9b\xf2\
+\xe1\xcc\x0f\xdf\xd8\xb8ac\xfa\x15\xf0H<&c\xb1\
+f[Fc2\x11M\xd8\xd1h<M\xcb\xda\xb5k\
+\xf7\xbf\xf2\xcak/\x9f{\xfe9\x93\xf3\x0a\xf2\xf3H\
+;\xea\xf7J\xa9\xfc\xfa\xd9A\x88V\xedZ\xe3\x85\x17\
+_|E+V.>\xb9\xb7\x02.]\xfe\xfdj$\
+\xbf\x0b\x0bd\xeb\x0a\x98\xf6\xe8t\x9b}m\xd7\xe3g\
+\xda!\x09\xd2\x06\xa5\xc3\xb3A?\xc4\xd0\xf5\x02\xdd\x96\
+a\x01\xf7\xd9\x00\xaeA\x0a\x04\xac\x82U\xabV\xadu\
+X\xfb\xfe{\xff\xfdP\xc1\x87\x01\x83\x07\x8c\x8a\xc5b\
+Z\xb9\xd5\xbd\xf9\x1e\x8bD\xe4E\xe7\x9fw\x02\x04\x90\
+_\x92\x8e\xe8\xfe_\x8d\x02\xb4`\x05\x02(\xef\xd4\xb1\
+\xf0\xbb\x05\xf3VhX\xe1\xad\xf8\x1aF>\xf7\xcc\xb3\
+\x8f\x05\x82\xeciK-\x82\xdc\xfc\xfc\xfcK/\xb9d\
+\xec\xad7\xff\xf2\x9c\xc7\xff\xf4\xd8S\xdf/^\xb2\xfa\
+\xc0\x81\xaat;\xcd\x91\x98\x1d\x89\xc4\xecx$j\xdb\
+\xb1\xa8\x8c\xc7b2\x1e\x8d\xcbx4!\xe3\x91\x98\x8b\
+\xa6\xaa\xaa*{\xe9\xd2e\xab\x1fz\xe8\xa1\xa7o\xbb\
+\xed\xb6\x0bO9\xf9\xd4a\xc8|>X'\x83\x80[\
+f]\xd3\x06aY\xb8\xe0\xa2\x8b\x8e\xd1K\x13\x03\xca\
+\xe1@\xd7\xdcp\xdd\xcf\x946\xd4E'\xea\xfcZ\xaa\
+\xe4\x87\xe2G\xe9\x10\x5c\x02\xa7\xb4\xd4\x83\xeb\x94\x9b\xb3\
+D\xb4\x0e70iF\xfd\xe9O\x8f\xffE\xe5\xed\xb8\
+\xf1#\x8fT\x98\x88\x7f\xbd\xfa\xaf7T\xb9\xa5~\xce\
+v\x9f\xc3\x90\x86\x85\xf3\xbf[&\xac\xe4\x910\x96\xff\
+\xb7\xb2\xfe\x9f\x01!\x04J\xca\xcaP\xda\xae]\xfe\xdc\
+\xf9\xdf|o\x92W\xdd\xbeu}!)\x9f}\xfa\xe9\
+?\x1d\x0a:\xf3\xf3\xf2+\x1e\xfa\xc3\x1f\xff\xb9g\xdf\
+\xfe\xac&\x9b\x9bcvs$\x9a\x88E\x22\x89xs\
+T\xc6\xa3\x11\x19\x8fGd,\x16\x93\xf1\xe6x\xd2\x10\
+$x\xc5\x5c\xfe\xfd\xf2MW^~\xf5\xcd\xc8\xc8\x92\
+#W^^\xd6e\x00z\x0d\xee\x1f\x5c\xbdb\xf5\x92\
+4\x1b8aR\x98\xa4\xe6.\xfe\xfe\xfb5\x22\x10p\
+^\x96P\xbf\x9a\xce9I\x9db\xba\x86\x95\xa4\xe9\x94\
+\xd8\xa4\xe04\xdf\xe1M:\x22\xa0\x95\xa9\xe2B-\xec\
+\x83\x10\xcb\xa3\x1e\x1d\x00W\x9d>\xfd\xfa\x0eojj\
+\x8a:L}\xe7\x9d\xb7f\xa8\x1c\x192|\xf0\xd8\xe6\
+Hs:T\xb4\x89\x04\xeb\x0c\x80\x94R\xdeq\xfb\x1d\
+w\x09!`\xf1\x07[\xfc\xbf\x06\xaeA\xb5\x02\x16\xca\
+;\xb4GYy\xdbBg\x0a\xe0\xf0\xc8\x08\xba\x02\xc4\
+0<\xf3\xd4\x93\x7f\xea\xd4\xa9\x13\x0a\x0a\x0a~\x10\xd1\
+\xc1pHt\xef\xd1\xad\xfd\x98\xb1c&\xfd\xe2\xe6\x9b\
+nx\xea\xe9\xa7\x9f\x9d\xff\xddw\x1b\x9dv\x12\x89\x84\
+\x8cG\x22v4\x1a\x95\xf1hT\xc6cI\x03\x10\x8b\
+\xc5eB\x19\xd8\xaa\xaa\xaa\xe6\x97_\xfe\xc7\xeb7\xfe\
+\xfc\xc6\x9b\xc7\x8d\x1b\x7fT^A~[\xc2\x1b/\xd9\
+\xcb\xf2\xfe\x00p\xe7\xaf~\xf5k\x95\x16\xdb9wR\
+\xe1\x85\xe3hd\xc2-kg\x9f}\xf6\x05\xa4}:\
+^:\x8f\x0fB\x87I\xaf8\x83\xe1\xc7\xf3SZ\x04\
+\xbd\xe1\x1a\xa1\x95\xfc\xa4q\xc0Y):\x10\xe9\xd7\xcc\
+f\xcc\x9c\xf9\xa9*\x8b\x13\x8f8\xccu\x08\xc3+\xaf\
+\xbf\xea\x8a\x02L\xe1\xbf\x0a\xd1\xa6\xa6\xd8\xd8\xb1\xa3\x87\
+$)\x10\x10\x96\xf0\xdf\x83\xff{\x905N\xad[\x97\
+\xa2\xa2\xa2}\xe1\xa2\xc5\x8bW\xa9\xfc\x91\xec\x8d\x06\xe8\
+\x19l)x\xe8\xa1\x87\x1f\x1d5j4\x8e;\xee\x04\
+\xd0}F-\xa1Y\x90s\x06\x06\x0f\x1d\x8a\xcb\xa6O\
+\xaf\xbc\xe4\xf2\xcb\xae\xdc\xbca\xdd\x0e)\xa5L\xd8\x09\
+\x19\x89D\xecx4n'\xa2\x09\x19\x8be<\xff\x81\
+\x03\xfb\x13\xb7\xde~\xdb\xefF\x8d\x1e9B\xd7\x06\x88\
+\x873\xe4\xb9\x94\xff\xb8\x13N\x1eP_S\xdf\x1c\x8b\
+Db\xdf\xcd\xfb\xf6{\x17\x1f\xd4\xf0\xd2Q~%\x1a\
+\x995k\xd6<d\xa2\x0f\xee\xd5?\x1a\x05s\xd16\
+\x97\xefg\x8a\xce\x19\x11 [FX\xdd\xe6\x94\xd3\x0b\
+tHMQ\x02\xd7\x01\xb5s\xe9\x03\x18\xa6M;\xf5\
+,U&\xbf\xfc\xfc\xd3\xd9j\xe3\x9d\xbbw\xee[W\
+_\xd7\xdcR\xd9\x96R\xca\x0f?\xfc`.R\x82X\
+PP\x00\xf1\xff\xa3\xe9@8\x9c\x83p8\xd7\x9a3\
+\xef\x9b%l\xe75\xca\xcd\xae\x01\x90P\xea\xee\xbb\xef\
+\xb9\xbb]E{\x1cy\xd4dTT\xb4\xf7&\x86\x87\
+,\xcf\x5c\x5c\x5c\x8c^}\xfa \x1c\x0ec\xe4\xc8\x11\
+\xdd\xfe\xf1\xf2?fH\x99\xf4\xbe\xb1H\xb3\x1d\x8f\xc6\
+d\x22\xa5h\xfb\x0e\xec\xdf{\xe6\x99\xa7\x1d\xee\x81\xd7\
+4\xfd\xa4e\x85P\x14\xe6\xdb\xb9\xf3\xbf\x92R\xcaO\
+>\xf9\xe4\xf3#\x8f:\xf2\xc4D<\xee\xe6\x95m'\
+\xa7\x04\x8c\xf7?\xe2\xe8\xa3\x8eJ\xa1Q\x0f\x12\xa1\xf4\
+\xf9\x99\xf3\xeb\x22\x14\xafz\xba(\x81]\xe8T\xaf\xb9\
+\x90\xff`\x91C\xf9\xaf\xe2Vqr\x8b1\x16\x00+\
+ D\x0e\x00X\x96\x95\xff\xfd\x92\xef]\x0bY\xa7\x9d\
+u\xda\xf9*G\x7f\xff\xd0\x83\x0f\xcb\xcc\xb8\xe8\xe3~\
+\x06\x1e\xb8\xef\xde\xbb\x00\xfc_S~]\xc8\xa6\x8b\xc8\
+\xdc\x85,\x0b\x22\xb5\xd1\xe9\xe5\xd7_y'\xab\xd3-\
+X\xd3\xe2\x0c\xc0\xa5\x97]~\xa5\x15\x08\xa2\xb2Go\
+t\xa9\xec\xde\xd2(@\xe7\x89\x14\xd9Hg\xe7|\xfa\
+\xf1'_I\x99<\xf6\xbd!\x12\xb1\xa5\x94\xb2\xa6\xaa\
+J\xde{\xdf\xdd'M\x9a4\xc1i[\xe7IM2\
+\xec*+\x94\xf2\xd7^{\xe3\xcf\x9d\xbe\xde}\xf7\xdd\
+\xf7\x03\xc0\xec\xd9\xb3\xe7eX\x92\x9a\xef'\xa4\xb4\x13\
+2m\x94\xa4\x94\xf2\xc5\xbf?\xff\x8a\xd2\xb5\xa0\xa6\xbf\
+-Y\xf0\xd3\xad\xb1qF\x01$O\x05U\xd7t\xbc\
+\xc9B\xce\x15V\x91\x09\xa6\x0c\xc0#\xa7\x0b!\xa6\x0e\
+\x05\x84\x10a+e=/:\xff\x82KT\x99\x5c\xbe\
+b\xd9*d\x1e\xaf\xa0\xa8uQ\xc9\x86\xcd\x1bw\xa6\
+\xe5\xd5K\xde\x95B\xf1h41t\xf0\xe0qy\x05\
+\x05h\xd7\xae\x1d\xfe\x0f\x81/e\xd7VN)\xe5\xe5\
+W^y}V\xbfu\xde\x9fKs\x0c@,\xb9\xea\
+\xbeo\xdf\xfe\xea\x9e={\x0f\x01\x80\x9c\xfc|\xe4\x15\
+\x16\xa2\xa0\xb8\xb8\xa5\x8b\xa9\x9caS\xfb\x9c\xce\xef\xd1\
+\xa3{\xdf\x9a\x9a\x9aF)\xa5\x8c\xa6\x8c\xd0\x1b\xaf\xbd\
+2#\x1c\x0e\xa1\xb8\xb8\x18\xa4\x1e\xa0\x9f\xefs\x86\x01\
+ \xca\xdf\xbf_\xbf\xe1\xcd\x8d\x99u\xa7c\x8e>\xfa\
+\x04\x00\xb8\xf9\xe6_\xde\xaa\x1a\x80D\xc2N\xae\xf8\xdb\
+R:\xfa\x7f\xe0\xc0\xbe\xba\xd6mZW\xa6\xf0rO\
+\xb8t\x06\x89\xa3U\xa7\x1b\xaanr\xe9Y^\x9d\x94\
+5\x19GOkD\x09\xd5\xad\x13\xe8B|\x9a\xa6{\
+\x0c(\x00\x04\x83HF\x01\xc1`\xa0x\xd9\xb2\xef\xd3\
+sY)\xa5\xbc\xf3\xce\xdb\xefTh\xc19\xe7\x9f}\
+1\x95_\xdd\xd3,\xba8\xf8\xcd\xd7_\xaf;\xfb\x8c\
+3\x0a\xbbUV\x229/\xfd?\x15\x0d\xfc (\xef\
+\xd0\xa1{c\xa49\xaeUvS\xba\xc3\xb9\x98-e\
+,\xb9\x00\xf6\xc1\x87\x1f~\xeanA@\xb3\xdb\xd8d\
+\xc08\x03\xa0\xf5`\x0f<\xf8\xe0\x9f\x1d\x8aj\xea\xea\
+\xe2\xe7_x\xe1q\xe1\xccF.mH\x0f\xfd\x5cZ\
+\x85\xb4g\x0c\x86\x83\x81o\xe7\xcc]\xe8\xb4\xb5g\xd7\
+\xce\x03\xadK\x8a*\x00\xa0]\x9bv]\x0f\xec?P\
+\x93\xe6\x8am\xcb\x84\x1dw}\x90\xe6\xbe\xdf?p\x07\
+\xc1\xabSx\x9d\xa7\xd7)6W\x96\xe3\x9fNO\xd5\
+{N\xb8\xd3\xe9\xb4\x00e,mL\xb7\xd0@;\xa0\
+\xebT@I\xcb2\x04\x22\xb9\x18\x18\x00\x80\xcb.\xbd\
+t\xba*\x9a\xb5\xd5U\xb5\xed:\xb5\xeb\xae\xf6\xe2\x83\
+O?\xfcH\x15^\xdd#..Jx\xff\x9dw\xde\
+\xe8\xda\xa5\x0b\x06\x0d\x1a\x8a#\x8e<\x0a\xe5\xed\x8c\xa7\
+\xb6\xfe_\x86,!\xbf\xef\xf7\x7fx\xa4e\x8a/\x95\
+\xa5\xed\x84LD2B>\xf5\x94i\xa7\x1e,\x1d\x86\
+2\xd4\x00\xb8\xeaO9y\xea\x11\x0d\x8d\x8dq)\xa5\
+\x9c\xf5\xe5W\x8b\xad@\xc0\x99\xb2Q\xc5\x0e\xc0-g\
+\x9cl\x81\xb4\x93\x86\x97^z\xf1\xef*\x0b~v\xfd\
+\xd57\xa5\xb2,\x008\xe3\xb4i\xe7\xc4\x22\x11\xd7g\
+\x80\x1c)\xfb\xfc\x8b\xaf\xbe\x0b\x84BA\xc5\x16\x9a\xbc\
+\xbb\x97\x93\xd5\xf1\x84\xeb\xb3\xce\xb9\xb6\xc4\x89\xa7\xdb\xd0\
+Y\x0c\x9d\xb5\x12\xe4?g$tu\xb9\xc5\x8d,\xeb\
+m\x01!\x00\x10B\xe4.]\xbc\xc4\xf5L\xfb\x1f/\
+\xbf\xf4\xbaB+&\x1ds\xf8\xa0\xa6\x86\x06\xe5Y\x8d\
+\xcd\x86\xbb\xfc\x06\x18[\xde\xfe\xcb_\xde\x16\xce\x09#\
+\x9c\x93\x83\xff\x9f\x80\x05\x00\xe1pn\xeb\xd5\xabVo\
+`\x0d\x00\x17&9\x13\x5c\x19\x97\x89D<\x1d-\xbd\
+\xf0\xe2\x8b\xaf{5h\x00\x9d\x80\x9b\x0c\x85\xd5\xb5k\
+\x17L\x98pX\xce'\x9f~\xbaHJ)\x1f\xfe\xe3\
+\xc3\x7f\x0a\xb9\xb7q\xbb\xe4H$\xc3\x115\x1d\xca\xff\
+l\xa7$\x04z\xf5\xe8\x89\xbf<\xfa\xd8-RJ\x19\
+\x8b\xc7\xed%\x0b\x17}\x7f\xe9%\x17MO\x95\x09\x01\
+\x81\x90\x10\xc9\xf3\x00'M\x9c0\xf9\xeb/\xbf\x9a\x13\
+\x8fgv#677\xc5\xfb\x0d\x1c8R\xdb\x86\x9b\
+\x07\x1c/(\x8fL\x86\x81S~\xd3\xb4G\xa5\x89k\
+\xc3e\x1c\xfdX\x0cn\xb0h\x1a\xbd\xf7\x0am8\x83\
+\x10 \xffq\xfa\x19\xa7\x9fGex\xea)SNT\
+\x1b\xba\xe5\xb6\x9b\xee\xc9\x92p\xa2\xf1Y\xb2\x9e\xba\x89\
+65\xc9s\xce<s\x9aG_~*\xf0\xe3Ai\
+yz\x9f\x16\x8c\x01\x03\x06\x8e\xac\xaa\xaa\xa9\xa1\x06 \
+\x91H\xceam[J\x19O&\xd8\x09;\xf9\x0c>\
+\x96\xd9m\xb7h\xf1\xe2\xc59yy\xad\x0e\x82fN\
+\xe8)\x8d\x9c\x00[\x00\xacp(\xa9\xec\x7f}\xee\xd9\
+\x17\xa5\x94\xf2\xd4S\xa7\x9dT\xde\xa1\x82\xb6k\x01\xc9\
+\x87\xb90O+\xa9\xa3B\xdf\x01\xfdp\xe357\x1c\
+3\xf3\xed\xff\xce\xba\xfe\xfakoiS\xda\xba\xb3\x0b\
+\xb1\x08\xe4\x8a@ \xcf\x0a\x04\xf2\x81\xcc+\xa4={\
+\xf7\x18t\xd7\xff\xdcqw\xd5\x81\xaa\xfaG\x1f}\xe4\
+1\xa5\x8a\xfaua\x876\xba^\xc6MKLs~\
+\xce\x00\xa8\xbc\xf2\xe2\xb1W\xbe\x8bX\x1a\x1a\xa8\x15\xbd\
+\x04\xd2d\xcd\x1c\xfc\x5c\xe7\xb9H \xfd\x13\xca\xbe\x80\
+\xcf>\xf9\xe4KU\x86\x97-]\xba.\xbf(\xb7\xd0\
+\xc9\xef\xd4\xb3\x8b\xb5~\xdd\xdaEY\xde\x8e\x08\xben\
+\xd3@\xcd\xfe\x03\x91!\x03\x079\xd6<\x8bA?\x01\
+\xf81\xb0~\xeaey\x981\xe3'\x1e\xb6n\xfd\x86\
+\xad\x94\x1d\xd1\x84-c\xf1\xb8\x94\xd1\x98\x94\xb18\xcd\
+\x963f\xcc\xfc\xbc\xa8\xb8\xa4M\x0bi\xd09\x10\xae\
+\x0e\xa70.E\xfd\xcdo~sWS}Cb\xf8\
+\xc8\x11\xddI]\x8aG\x95/\x9a\xee\x18\x88\xa4\xb7\x13\
+\xc0\xf1\xc7\x1e;`\xf3\xa6-\xb5+\xbf\xff~\xed\x0d\
+\xd7^}\xfd\xc8a#\x0es\xe1\x14Vn \x1c.\
+\x12V8\x0f\x08\xe48M\x0a\x88\xe2\x9b~\xfe\xf3\x9b\
+\x9f}\xf6\xd9\x97\x0a\x8b\x0a\x9d\xd5H\xfaiq/\xc5\
+6\x85\xee\xba\xa9\xb1I\x17\xb9\xc8\xc3K\xe9]\xf9&\
+\x03@+\xd2\xf2~\xac\x98nn\xe6\xe0\xa2\xd6\x9bF\
+\x03\x181x\xf0\x18G0\x1dQ}\xec\xd1G\xfe\xec\
+\x10\x94\x93\x97\x83\xc9\xc7\x1c=\xba\xb9\xb11\xad\xda\xda\
+\xa7\x00\x9a]C[6l\xdc\xd6\xae\xacL\xf1\x04\xce\
+\xcc\xee'\xb1\x05\x07k\x00L\xf8\xd2\xf5K\xcb\xca\xba\
+>\xf1\xe4S\xcfF\x22\x91\xec\x8e\x13\xd8\xb4y\xe3\xbe\
+\x1b\xae\xbb\xfe\x16\xe1\xfa\xba\x88g\xb4\xe7\xc7\xe3\xeb\xea\
+p\xd3C\xf4\xe8\xd1\x03w\xdcq\xe7\xb9o\xbe\xf5\xd6\
+\xe7\x0f?\xf6h\x05y\xf4g\x91\xbaP\xeei\xbb\xce\
+\x9a\x92\x00\x80.\x1d;\xb4[\xbah\xd1Z\xda\xef\xcf\
+?\xf9\xe2\xf3c'\x1fyB\xb2\xa6\x15\x16\x22\x94\x0b\
+$\xb7\x8e\x8f\x1f?r\xd4[\xaf\xbf\xfe\xf2\xfe\xdd{\
+\xab\xa4\x94r\xcc\x98\xb1\xe3\x95v8\xf95)\xb6\xd7\
+\xf4\x9a\x1a2\x1a\x09\x80\xe4y\xfd\x1c\xbe\xd0\xb4\xf45\
+\x17^\x80I3)\xb6\x9f\x0e9\xf7\xceF\x09\x1dS\
+\xd8(\xe0\x89\xc7\x1f\x7fZJ)c)\xed\x8d\xc7\x12\
+\xf2\xb4\xb3N;A\xa1\x11?\xff\xe5/~\xe92\x00\
+T\xe9u\xf3\xdf\x14,\x9c?\x7fqA8\xdc\x9aa\
+\xfe\xff&\x1c,\x0d.\xfa;t\xe9\x8a\x7f\xbe\xfc\xea\
+\xe8\xdb\xee\xbc\xe3\xf6O?\xfex\xd6\xc6\x0d\x1b\xb7\xef\
+\xdc\xb1\xabj\xf3\xd6\xad\xfbW\xafY\xbdi\xc6\x8c\x19\
+\xff\xbd\xea\xdak\xae\x183vl\x8f4\x82\xa4\xd2\xa9\
+\x8fru4\x99<\x14U\x0aZ\x9e\xf5v\xadKJ\
+0\xb0\x7f\xbfN\xa3\xc6\x8d=f\xc2\xf8\xf1\x05\xa9\x8a\
+&G\xc3\xfd\x02Vr=\xc9\x02\x80p0T0\xf7\
+\xeb\xd9\xf3u\xc6/\xd6\x1c\xb1/:\xff\x9cK\xd5.\
+\x0e\x1c\xda\x7f\xe4\xf6m[w:e\xae\xbd\xf6*\xe7\
+e\x1f\x80\x97a:\xad\xf5C+\x97\xaf\xe3\x13\xc7s\
+.\x1d\xa4.\xcdKw\xd2\xd4(gE8\x02(\xe8\
+:\xab\x8b\x06L\x11C\x00\x00\x8a\x8b\x8b\xcbwo\xdf\
+\xb9OJ)\x9b\x13\xc98`\xc3\x86\xf5\x1b\x83\xe1`\
++\x00\x10\xa9\xfd\xfd\xef\xbf?\xe3\x13\xd7\xa8r\xcf\xbf\
+\x0d\xd1\xc0G3g~\x1e\xb0\xac\x02\xa5\x1f\x87\x02\xfe\
+\xb7\x0dI\xba\xfda\xc3\x86c\xdc\xb8q\xb9y9y\
+\x1d\xc6\x8d\x1e\xd3k\xd4\xa8Q\xdds\xf3s\xdb\x9dp\
+\xc2\x89Vqa\x11\xad\xc7yn?mq\x9e\x8b\x0a\
+\xb1Np\xa9\xd0\xaa\xb4\xd0\x10_'\xb3\x00\x92\xbb\xfc\
+Drc\x0e\xc2\xa1`\xe0\xd3\x99\x1f}`\x94\x0b)\
+eSCc\xac}\x87\x0e\xdd\x9cF\xdf\x9b1\xe3c\
+'\xef\xf57_}\x93\xd0D\x9f@\xf81N~\xf3\
+\xa8\xd1\xf4\xc33\x9da\xa6e\xa1\x96\xf5\xeb\xc9\xb9F\
+i8\xefe\xc1t\xe1>U|\x15wz*p\xee\
+\xd9\xe7^$er\x1a\x10O$\x17\xfe\x9f{\xe6\x99\
+\xd7\xc7\x8d\x1b\x8b\x8a\x8a\xe4#\xbc\xc2\xbc\xbc\x8a\x1d\xdb\
+\xb7\xef\xa1\xd6=K\xd7\x0d;\x87\xfe\xfb\xd6[\xefY\
+B8/\xbd{)\x81\xce\x08\xfeo\x82N1,\xd3\
+ia)\x8f\x9f6\xba\xe0\xc7\x12\x1ey:!\xd4\x09\
+\xbc.\xdd\xf46\x9d\xce\xa8\xa4\xcb\x0a \xe0(\xbf\x00\
+\xf0\xd6k\xaf\xbd\x9e\x19kf\x85X\x81+\xaf\xba\xe6\
+g\x000|\xe4\xa8\xc3\xe2\xf1d\xe6\xb2\xa5KW\x06\
+\xc2\xa1\x02B\x8f_/o\xe2\x85\x03\x5c\xff8\xc3B\
+y\xee\xd5.gP\x5ce\xb8\x06\xfd\x86,\xa6\xce\x83\
+)\x13\xd0\xe0\xe1p\xa8\x11@\xfaE\xf4\xf7\xdf\x9d\xf1\
+\xa1\x94RF\xe2\x99G\xb3\x0f\xde\x7f\xdf\xd5\x0a#q\
+\xec\x09\x93\x0f\xaf\xa9\xadM\xc8\x1f\x00\xef\xbe\xf5\xe6\xbb\
+B\xc01\x02\xff\xd7\x14\x5c\x05?\xc6\xc9K\xf1@\xd2\
+u\xfb\xd9\xa90\xeb\xda\xe1\xd2\xb94\xd5\xa3\x9bh\xd6\
+E\x8d\xda\xe9#R\xd3\xc7p8\x84\x97\xfe\xf6\xb7\xd7\
+Z2\xf6\xaf\xbf\xfe\xc6\xdb\x00\xf0\x9b\xbb~\xfb;)\
+\xa5L$\xe2r\xe8\x88ac\x14\x1a\xd5CG8\x05\
+\xf5\xe2\x13\x07:\x03g2\x08^zd\xe2Y:\xa2\
+\xa2\xd6\xd4\xa4\xf8\xb4AJ<\xed\xa8_\xc2t\x91A\
+\xd6T\xa0s\xc7\x0e=\x1a\xaak\xea\xa5\x94\xb2)\x96\
+\x5c\xd4\xda\xbfo_\xf3\xa0\x01\x03\x87\x01\x80H\x9e\xf8\
+\x83\xab\xae\xbe\xe2\xc6\x1fb\x00\xa4\x94\xf2\xfdw\xde\xf9\
+\x10@n\xe7\x8e\x1d1\xe9\x08z4\xfd\xff\x19\xf0c\
+\x9c\xfc\x0a$\xe79\xbc\xda\xa2F\xc4$':/\xc5\
+\xc9\x9e\x0a~\x1d\x93\xcb\xb0\xe4\xe5\x84\xadw\xfe\xfd\xd6\
+\x7f2#\xca\xac\xfe2S\x81\x85\x8b\x16,n[^\
+\xd6}\xee\xd7\xdf\xcc\x97R\xca\x9bo\xfe\xf9\xad\x84\x16\
+\xdd\xc2\x9f)\x0a\xa6\xfd\x87\xa6\x8e\x89?\x1cN\x9aO\
+\xa3v:\xa6Y\xe3J3\xd5t\x9dp\x99\xac\xbc\xce\
+\x90\xa8\x8b\x7ft\x11\x90.\x0cf-\x12\x0aeA\xf0\
+\x8aK/\xbfZJ)\xe3\xd2\x96\x0d\x89\xa4\x11X\xfc\
+\xdd\xa25\x15\x15\x15\xe9g\xd6\xfd\xfb\xf5\xc4\xcc\x19\xff\
+}:3\xb8v\xe6UNg\xab\x80\x9d\x89\x06]\x1f\
+xT\x84\xe2\xed7\xde\xfc\xec\xe6\x1bo,\x19=F\
+}J\xe8\x0b8\xfe\x99\x14\xae%e\x0e5\xe8\xda\xa0\
+cK\xf3\xb80\xdcoX\xec\xe5\xc5\xbc\x94\x85\xd2\x92\
+\xfe\x1f\x0c\x07PRPX\xf4\xe1\xbb3>\xc8\x1a\x7f\
+*\x0e\xaa\x0c\xa46\xf8\xef\xde\xbdk\xcf\xdf_x\xfe\
+5)\xa5\xfc\xe0\x83\xf7?a\xfa\xac\x1a\x00\x13\xdd-\
+\xe5\x81\x897~d@\x90\xff4\x8f\xc5\xd1\x12%\xa7\
+\x8dp\x96\x8dK\xf3\x8a\x04(c\xe9tA5L\x00\
+\x80\xb7_\xff\xf7\xfbRJ\x19I\xc4d\xd4N\xbe\xc7\
+1k\xd6\xac\x19\xe7]p\x0er\xf2\x92\xbb\xfa,\xcb\
+\x12\x1f|0S\xd9*,\xb3\x17\x034\x8f\x05UX\
+8\x7f\xfew=\xbau\xad\xd4\xf0\xe9`A7H?\
+%\x98\xc6^\xe7\xc5\x80\x96y:N\x90[\xa2\x14&\
+|Y\xf4\x0f\xea\xd7\x0b\xe3\x86\x0f\xe9\xfa\xf9\x87\x9f\xcc\
+\xcd({\x223\xc8\xea\x1e1. Hd\xde\xf3\x9d\
+7\xff\xdb%\xe1p\xb8T\xe9\xb3\xee'<\xf2\xfd\xf4\
+\xb7E\xfd\xd4\x8c\x8b)\x8f\xeaQ\xda\xa8x\x85i\x14\
+\x99\x1f\xa5\xa6\x03\xeee\x15M\xd3\x03\x90k\x00@\xdf\
+\x1e=;o\xda\xb8i\xbf\x94R6&\x9a\xd2\xa3\xf9\
+\xd2K/<>f\xfc\xf0\xf4\x9bje\xe5m\x0a\xe6\
+\xcf\x9f\xe7>\x22\xcb\xf4\x82\x0c}\xab(\x05\xcb\x97.\
+\xd92\xa8_\xbfQ\xc9\xbdgY\xf6\x88c\xbe\xe9\xfe\
+\xa7\x06/\x8f\xa0\x13\x16\x9d`r\x06\x80+\x07d\x8f\
+1\x955]\xc8jR2\xda\x16 \x04N<\xe6h\
+\x5c\x7f\xe9\xc5\xa3\x97/X\x98\xd9\xf8d+\xa7\xfa\x18\
+\xc01\x08vjqy\xfb\xf6m\xbb\xca\xdbWtS\
+\xdar\xce\x1a\xa4\xde\x9f:*\x9d\xfc\x9bd^\xa7#\
+N\xdbtL8>s|\xa4\x11\x13\x17\xa9i-4\
+WQG\xb4\x97\xc5\xe3\x0c\x84\x9f\xa8\x80N\x0d\xd2\xd0\
+\xba\xa4\x04\x8f<\xf8`\xfa\xe0\x90\xe6X2\x0a\x88D\
+\x22\xf2\xf6\xdbn\xbaA-[VQ\xd6y\xf7\xee]\
+\x99'\x03\xf4\xd5@\x1f\x8f\x07\xa5\x94\xb2\xb6\xaa\xaaa\
+\xea)'\x9f\xd5\xb1}\x07L\x9b2\x15\xc3\x87\x8dP\
+\x8d\x01\x15z\x0a&k\xfdc\x83NIi\x9a\x03\x9c\
+\xb2\xd2\xba-\xf9\xe9p\xea\x0c\x00'Gj^\x1a_\
+(\x10\x14\xf9\xf998\xf7\xb4\xd3\xf0\xc6\xdf_<w\
+\xf3\x86\x0d\x0d\x99aMy~\x97\xcb\xe7\xdc~\xf2m\
+\x7f\xe7\xfc\xbf\xbd\xfb\xf7\xd6\x0f\x196X=qH\x8d\
+J-r\x1f\x00/\xdf~\x0d\x00\xd55\x8e\xcf\x94_\
+\x9c,q\x06Bg\x5c9\xdc\xe9\x8e\xea,\xb8\xce\x00\
+\xc0#\x8f\xb3\xe2\x1c\x038\x03\xa22\xd8\xc5\x88VE\
+\x858\xe9\xd8c\xf1\xf0\x1f\x1e|\xd4\xd1\xe9X\xea\xa5\
+\xadHS\xb3<\xee\x84\xc9\xa7\xaa\x1d\x1b4h\xe0\x88\
+\xaa\xaa\xaa\xda\xb4\xa6\x93\xf5\x00\xcf\xf7\xe5SPWS\
++\x1f\xfe\xfd\x1f\xee\xbd\xe7W\xbf\xc6\xc0\x81\x83\xd0\xba\
+Mz\xb7,\xc73:@Z\xc6\x1b\xe0P\x1b\x0e\xbf\
+J\xeb'l\xe5\x84\xd8T\xdf\x0b\x9f\x97\x11Q\xe9\xb7\
+Z\x15\x15a\xe8\xd0\x01\xc8\x0b\x071\xf3\xcd\xb7~\x17\
+ilRF*\x912\x00\xea\x98j\x16\x01\x95\xc7\x82\
+\x91\xa6F\xfb\xd4\xd3\xa6\x1dCx\xc6\x19\x00u=\x8b\
+;\x8a\xdc\xe4\xe0\xfc\xf0\x04L\x1e\x1d?:\xae\x94^\
+\xdd\xf8\xb8\x8c\x88\x1fA\xa0\xe5t\x11\x01g\xe1u?\
+n7\xa0\xc9\xb2j\xe1\xabO?\x9d%e\xf2\x94\x16\
+\xc7\x8a\xd7\xd7\xd64\x1dy\xc4\xe1\xae\xa5\xfbq\xe3\xc6\
+\x1cYUu\xa0V\xaf\xe8>\x16\x04R\xf0\x9f7\xff\
+\xfd\xef\xc2\xc2\xa2v\xc2\xb20u\xcaIH\xbd\xab~\
+(\x15\xf5\xc7\x02?J\xea\x15\x9a\xea\x14\xfe`qz\
+\xb5\xa3\xd2\x0d\x00\xe8X\xd1\x01O<\xf2\x08\xa6L>\
+\xaa\xfc\xc9\xc7\x1e{-\xd2\xe4\x9c\x10\x17\x93\xc9\x9d\x22\
+\x8cEW\x22=v\x1d\xc0N\xc8\xd3\xa6\x9d\x92\xfe\x22\
+\x15\xa1\xc1\xeb\xdao\x9aI\xe99}2\xe9\x99\xce0\
+\xf8\x193(\xff]\x0a\xe9\xc7Jy5\xa8\x13\x0e\xae\
+S\x9c\xa7\xe7\x98\xa8\xd2\xea\xa2\xa5mYY\xd7]\xdb\
+\xb6\xef\x92R\xba\x8eq\xde\xb9}G\xd5\xd0A\x83\x06\
+(u1a\xd2\x84c\xaa\xaa\xaa\xea\xb2\x94\xde&\xf7\
+>\x0c\xc2\xd7_\xceZ=v\xd4\xa8I\xb7\xddr\x13\
+\xa6\x9e:\x0d\xff\x87\xa1%\x82\x22H=NXi\x9e\
+I8M\xed\xaa\xe3\xaaS\x96\xac\xb6\xfbt\xaf\xc4\xb8\
+\x11#\xf0\xf2\xf3/\x1e\xfb\xdd\x9c\xb9\xe9}\xfdq\x19\
+\x91\xb6\x8c\x91Q\xb25\xd1\x1d\x99\x06J[^r\xf1\
+\x05\x97+\xf4p\xfa\xc0\xc9\xb1z\xafsj\x1co\xfc\
+FO\xdc8z\xf1JG';6~\x07JG\xa4\
+N\xb99%\xd6\x19\x185\x8c\xa2FAg\x10\x5cL\
+:j\xc2\xc4#\xe3\xd1H\xd6j\xcf\xda\x95\xab6V\
+T\x94wU\xfa\x86\x89\x13\x0e;&3\x1dHZ~\
+\xdb\xa5\xf4\xfea\xdf\xde=\xf2\xb9g\x9e\xbe}\xc4\xe8\
+Q\x08\x86s1f\xcca\x185r\x94z\xb8\x08\x1d\
+\xc4\xffM\xa0\xca}\xb0\xe3\xac\xcb\xf3\x12f\x9d\xf0\x83\
+\xa9\x9f.#\x92\x0bp\x02\x00\xa6\x9ex\x1cN=\xe1\
+\x98\xf0\x9d\xb7\xde\xf2\xdb\x9a\xaa*e$\x122a'\
+\x98\xed\x9e\xc4\xdd\xa7\xa7~n\x03p\xf9e\x17\xa9\x9f\
+\xa2s\xe4\x8f\xea\x84N\xde\xa9\x01\xe0\xe4\xd5\xafB\xea\
+\xc6\x82\x8e\xa3\x1f\xbd\xa0\xce\x13L>\x8b\xd4\xcf\xcfd\
+\xe18\xebd\x22P5\x02\xd4\x92\xea^\x1eR\xf3\x01\
+\x00\x17\x9cw\x9e\xeb\x1cA\x07V-_\xbe\xb6\xa4\xb4\
+\xa4\xa3\xd2O\x8c\x1c5r\xc2\x81\x03\x07\xd2\xef\xca\xd3\
+\xef\x0b\xb4\xd4\x10\xfc\xfd\xa5\xbf\x7f0\xf1\xf0\xc3{N\
+\x9ax\x04\xfa\xf6\xe9\x8bI\xe3]\x87WR\xfeR\xf8\
+\xb1\x8d\x84\xa9m\x9a\xaf\x13t/\xc1\xe5\x14Zg\x00\
+L\x02\xae\x8e\x7f\x00\x99\xd5w\x84B\x01<\xf3\xc4c\
+\x936\xaf[\xf7\xad\x9b\xfbt\xb1OQ~\xd7-\x8d\
+\xf6\x920\xfd\xd2\x0b\xaf$\xbc\xf0+\xb3T>uu\
+u\xa7`\x99\xf8\xa1\xe3+\x98k\xd6)*\xf7`\xd2\
+\x5c\x06\xc0\xef \xeb\x88\xd5Yv?\x86\xc3d\xc1T\
+\xc3\xa0\xb3\xae\xae\xc3\x18\xee\xba\xebW\xf7\xb8\x06=\x05\
++\x97-[\xd3\xb6\xa2\x8d\xeb\xe0\x87>}z\x0d\xdb\
+\xb6m\xdb.^\xe9[f\x00\xa4\x94r\xc7\x8e\x1d\xbb\
+\x7fu\xc7\x9d\xd7\x03\xc0\xe5\x17^\x8c\x13Np\xbd\xac\
+\xf8\xbfe\x00\xbc\xbc\x08\xa0\xf7\xc4\xb4\xbeW\x1d\x8b\x94\
+\xd1\x09\xb9\x0e\xaf\x00\x10\x10@P@\x84\x84\xb2\x05\x5c\
+\x00yO=\xf6\xe8\xc3\xdb\xb6n!\xef4+\xca\x9f\
+\xa5\xec2\xe3\xf9\xd9q\x8d\xcb\x8b\xce;\xe3R\x85'\
+\x9c\xb2r\x9e\x9d.\x00r2K\xcbr\xfa\xa5F\x19\
+:\xf9\xa7\xcaN\xf9\xcb\x19P\x8b\xd41\x19\xb0\xac\xca\
+\xba\x81\xf1\xfaq\x0d\xe8\x84A\xe7)t\x8cU\xd38\
+C\xe2\xb2\x90\xcf?\xf3\x1c\xfb\x11\xd1\xa5\x8b\x17\xae\xea\
+\xd4\xa9C\xa5\xd2_t\xed\xde\xb9\xef\x8a\x95\xcbWg\
+\x09\x94o#`\xbb\xd6\x1d\xa2\xcd\xcd\xf2\xafO?\xf3\
+\xde\xdd\xbf\xfa\xcd\xb0\xb1c\xc7\xa2[\xf7n\xe9\xd3z\
+\xc9)\xba?\xa6\xd2\x9b\xc0d\xc8Mi~\x0c;-\
+\x0f\x03N\x07\x5c\x8a\x93T~\x84\x95|\x5cz\xe1\x85\
+\xa7,\xf8\xf6\xdbe\x94\xefY\x8b{\xea=\x8d\x04H\
+@\xd0X_\x1b=\xeb\xf4\x93\xb9\x05?_\xaf\xaak\
+~\xf4\x1d\x01\xd3\x8eA\x93\xf7\x07\xdc<\xf2\x1a\x03\xb5\
+\x9c\xee\xa7+\xe3[\xb99\xa6x1\xc9\xcbP8\x84\
+\x99<\xbc)*\xa0\x83\x96\xfe.\xdc;\xef\xbc3\x93\
+S\xd7\xe5\xcb\x96m\x18<\xa0__\x85!((.\
+,\x9f={\x16\x09+\xbd\x9f\x08d/\x15f\xcaW\
+\xed\xdd\x1f\xbd\xef\x9e{\xef9\xed\xe4\x93;\x01\xc0\xd0\
+\xa1\xc3\xd4\x01\xa0\x83\xa1\xbb?\xd4\xc0\x8d\xa9i\x9c\xbd\
+\xf28\xafO\xdb\xe1\xf2\xd4\xeb,\x8f\xe4\xc0\x88\xc1\x83\
+\x86=\xfb\x97'_r3]\xe1\xb6:\x8d\xb7\xd3'\
+\xf7\xbbG(\x1d\x0dd\x96\x87\x0e\xec\xdf\xb3\xff\x98#\
+\x8f8\x9e\xd0A\x17\xa1\xb9\xb0>\xc0\xfc\xb8H\x81\xe3\
+\x93\x8e_\xb4\xdf\xd41\x9a\x0c\xa6\x0e7\xe5\xad\xce\x08\
+\x09\x15\xa9\xa5\x5c\xeb\x0c\x80zO\x89\xf4\xb2\x8e\xb4-\
+\x8aOe8\x8d\x04\xbc\xacfV[B\x88\xfc\xaf\xbe\
+\xf8rNFn2\xc2\xb1c\xe3\xe6]C\x07\x0fT\
+7z\x00\x02\xb9\xaf\xbd\xf1\xea[n\xf5\xd6\xef S\
+\x95\xded*\xe6\x7f\xf3\xcd\xa6\xbb\x7f\xf3\xbb\xeb\x8f<\
+\xe2\xe8\x1c\xd2\x9e\xc9:\xb7\x14\xfc\xd4\xd3\x09\x92\x9a\xe7\
+5\xe6Tp\xb3\x94V\x83O\x97G\x85\x16\x00\xd0\xbe\
+}E\xc5\xfdw\xff\xee\x81\xc6\xba\xba\xa8\x8b\x99d\x0e\
+\x9f4\x00>\x9e\xd8(c\xbf`\xfe\xdc5C\x06\x0d\
+\x18\xca\xd0\xc3ysNqta?'\x93~^r\
+\xcbRF\xe5Z\xa7\x8b\xba\xb12)\xbb\xcei\xb3\x8d\
+r\x03\xcf\x0d\xa0\x0a\x1cR\x9dG\xe1:\xcf\xa5\xd3\xc8\
+\x80{W@7p\xc8\xcf/h\xf7\xcd\x9c\xb9\xdfq\
+2Q\xb5\xff@\xd5\xf8\x89\x13\x8f&}\xc0\xfd\x0f\xdc\
+\xf7@\xb6\xaas\x06\x80\xf7\xff:C\xf0\xc5g_,\
+\xb8\xe8\xa2\x8b\xaf)+k\x83\xe1#G\xa5\x0f0a\
+\xf8H\xe1`\x94[WFW\x9eSl\x93w1\xb5\
+\xe9W\xf9\x05\x00\x11\x0e'\xdf\xb8\x1e;j4N;\
+yZ\xc1u\xd7\x5cs\xd7\xc6\x0d\x1b7r\x1c\xe7C\
+~\xc6\xebkF\xe1\x9b\xaf\xbf\xf8\xe8\x8aK/\xea`\
+\xa2'\x95\xce)*\x957nn\xcf)\x99N\x09u\
+o\x14\x82\xa4\xe9~&\xc3\xc3\x19p]\xf9\xac\x06M\
+\x0a\x0aC\xba\x97\xb1\xe0\x88\xf62\x0c\xba(@\xf7d\
+ \x95&BB$\x17\x90\x0a\x0b\x0b+f\xcf\x9e3\
+\x8f\x13\x88\xda\xea\x9a\xe6\xf3\xcf?\xe7\x82\x01\x03\xfb!\
+\x18L\xaf7\xe1\x92\xcb/\xbb\xac\xae\xbe\xae!S\x92\
+{B\xc0{\x1e/\x7f\xb4|\xf9\x8ao\xff\xf0\x87?\
+^\xd3\xa6M\xbb\xf4\x9b\x8b\xea\xda\xc0\xb0a\xc3\xf1\xe0\
+\xef\xff\xa0r\xd1=PB\xa0W\x9f>\x184x\x10\
+|\x80N\xb1\xfd\xfc\xd4:&\xc1\xa3mq\xf5\xd3\xd7\
+\x05\x05\x05\xe8\xdd\xbb7zv\xeb\x0e\x00\xf8\xf5\xedw\
+\xe0\xe9\xbf<\xd1\xe6\xe1?\xfc\xfe\xce\xba\xea\x9a\x15n\
+n\xe9\xb8\xc8\xcd\xf5\xcdu\x9ez\xe2\xb1\xc7\xcf\x986\
+5\xa7<\xf3%(\xdd\xe2\x1c\x90-WT\xe1\xe9\x13\
++\xddT\x80*\xbbN\xaf\xb8{\x93N\xf81\x02&\
+\x03\xe0\x1a?\x93\xc2\xea\x94SG\x9c\x97\xe5\xe2\xca\x99\
+VL\xbd\xf0pL\x0f\x08\x88\xa0\x10\x22,\xd2\x87B\
+\xe4\x96~\xf9\xd5Ws\x5c2\x92\x82D<.\x1f~\
+\xf8\x0f\xb7\x9fu\xd6\x19i&\xb4nS\x86\xb1\x93\xc6\
+\x8e\xfc\xec\xb3O\x96eI\x92\x16\xfc\xef\x22\x8c\xc5b\
+r\xd9\xd2\xa5\xebo\xbf\xf3\xce;\x8f>zr?\xa7\
+\xdd\xf6\xed\xdb\xe3\xb6[o\xc7\x8b/\xbe\x84\x8a\x8e\x1d\
+p\xdcq'\xc0J\x9dJ\xdd\xbbo_\x9c8e\x0a\
+\xda\xb5k\x87\xe9W^\x85\xe7\x9f\x7f\x11\xdd\xbbwG\
+\x0b\xc0\xe1\x933\xce:\x01\xf2\xf2\x5c^\x82\xaa\xc3\x0b\
+\x00\xb8\xfb7\xbf\xc3m\xb7\xfc\x12\xa7\x9dt\x12\xce?\
+\xf7\xdc\xa1\x0f\xdew\xdf\xef\xa5momjR\xb6\xf1\
+\xa6\xe7\xf9n~\xea\xfd=\x89\x0e\x94B\x9b6\xaek\
+\xbc\xf2\xf2\x8bnl_\xd1\x16\xc1\xe4Y\x11\x02I\xb9\
+\x08\x22[~t\xd1&g\x00\xd4::\xb9\xf5\xb3/\
+\xc0\xe4\xb5\xd5{(\xe9P\xeeu8u\xef)\xa8\x87\
+\xa4\x0a\xe0\xe0\x06\xd3\x8f\x01\xa0^B\xa7\xb4&k\xe9\
+eAu\xf8\x02\x80\x08\x08\xe5+C\x81p\xa8\xd5G\
+\x1f|\xf4\xb9[|R_\xcf\xb2m9\xfb\xab/\x9f\
+\x1e=ft\x08\x00\x8aJK\x00\x00=\xfb\xf5*\x5c\
+\xb9v\xe5?\xe8\x87Gu\xb1\x00\x05?\xe6`\xef\x9e\
+\xbd\x8dw\xddu\xd7_.\xba\xe8\xe2\xa3\x87\x0f\x1f\x19\
+\xba\xe2\xf2\xe9\xb8\xef\xbe\xfbQ\xde\xa1=\xde\x7f\xffC\
+\x9cu\xf6Y\x00\x80\xdbn\xbb\x1d\x0f<\xf8 \xf2\xf3\
+\xf3q\xd6\xd9\xe7\xe2\xf1\xc7\x1fG\xbf~\xfdP^^\
+\x816m\xda \xf9\xb5\xe3B\x18\x8e\xfc\xe2\x14W\x97\
+f\xf2 &a\xa5c\x99\x86\x93N<\x11999\
+\xb8\xf1\xfa\x1b\xca\xff\xfe\xfc\x8b\xd3\x1ez\xf0\xf7\xaf\xc4\
+\x22Q\x17\x8b\xe2i%f6\xf4d\xad\xec\x13\xfe\xd3\
+c\xbe\xa4\x94\xbbvnY~\xed\x15\x17\xd3\x93\x5cL\
+\xd1\xa3iqY\xe7\x8ct\x0b\xd8\x82\xa4\xebxK\xc7\
+\x86\x93o\x07L\x9e\xdcK?U\xa3\x90\xceS\x9fC\
+\xaa\x8d\x00\x80d\xd2%S\xce\x0f\xa8\x96K\x92\xba\xea\
+\xbd e\xa9\xc5\xe3\xf0\xd1t\x07\xa7\x93 \x00X2\
+a7\xfd\xe3\x9f\xffx\xb5o\xdf^}\x07\x0e\x1c\xdc\
+\x1f\x00\xec\x84\x84\x8d\x04,+\x80\xce]\xbb\x8e,o\
+\xd3n\xc27\xdf~\xf3\xc9\x9e\x9d\xbb\xea\x00\xc0\x0a\x85\
+\xa3\xef\xbf\xf7\xde\xdb\xef\xcf\x98\xb9\xe5\xd8\x13\x8e;*\
+?/?GE/\xb2\xfe\x9a\x19\xc0A~A~\xe8\
+\xc8#\x8f\x1cu\xea\xa9\xd3.\xca\xcd\xcd\x9b\xd8\xb9c\
+\x97\xf2%\xcb\x96FV\xad^\xb1c\xd2\xa4\xc3\xb1z\
+\xd5*\xacX\xbe\x1c\x03\x06\x0c\x00\x84\xc0w\xf3\xe7\xa3\
+W\xef>\xe8\xd8\xb1\x03>\xfe\xf8ct\xeb\xd6\x1d\xe3\
+'MB4\x12\x85m\xdb(\xc8\xcb\x87\x05\x0b\xd1X\
+\x946\xe5\xf0\x84\xf2\x97#U\x22{\xbcu]R\x05\
+O\x02\xb0\x9d\xf6\xce;\xef\x1c\x94\xb4j\x8d-[\xb6\
+\xe0\xae\xff\xf9\xf5\x09\xc7\x9fx\xc2\x15C\x86\x0cy\xf0\
+\xcc\xb3\xcf\xbc\xfe\xb0\x09\xe3\x07Z\x81\x80pHK\xa4\
+\x91(\xe4\xb9\xa8\xa3i\x0e\xdfe\xaa\x96p\x19\xbf\xc7\
+\xff\xf4\xd0\x0b\xd3/\x9f~\xd6\x81\xfdUkv\xee\xde\
+\x03d\x94\xd1&\xbc\xa0\xf2G\xd3\xfd\xf0\x8a\xf2\x84^\
+;J,\xc9='\xf7\xb4\x1d\x87\x0e\x8b\xa1U\xa7\xbb\
+&\x9d\xa6}\xd7Z\x13\xb5\xb2\xce\xbaxE\x01-\x09\
+#9\xcbI\x9f\xfd\xebv\x0b\xea\xbc\x96\xb3\x93,}\
+44\x00\xf1\xd0C\x0f=\xe6x\x89X<*#\xd1\
+f;\x9az\x0f|\xed\xaa\xd5\x9bN?\xfd\xd4\x13\xa7\
+\x9ez\xaa\x8b\x83}\xfa\xf7\x1b\xf0\xc6\xbf\xff=\xc3\xed\
+\x97\xfc\x1d;\xd8\xd2-E\xf3\xe6\xcd\xab\xfa\xe4\x93O\
+?\xf8\xcf;\xef\xde}\xca\xb4\x93\xc7\x01\xc0y\xe7]\
+\x80\xcb.\xbf\x1c\x00p\xfa\x19g\xe2\xb1\xc7\x1eC\xc7\
+\x8e\x1d1`\xc0@\x5ct\xc9\xa5\x18:t\x18\x8a\x8a\
+Z\xa1c\xfb\x0e\x18\xd8o0\xac@\x10\x06\xa0\xc2C\
+\xc7AM\xe7xK=S\x16\xe4\x15\x14\x96\xfc\xf9\xcf\
+\x7f>u\xd9\xd2%\x7f\x999\xf3\xfd\xaf\xb7m\xdd\xa6\
+\xe5\x0e\xfb\xf8\xce7\xd7\xdcew\xed\xdcVu\xd1\xf9\
+\xe7\x5c\xc2\xf4\x97\x86\xbe\x16\x887T~j\xba*K\
+\x94\x0f\xdc\xba\x00\x95SUV\xa1\xc1E\xe5\x99{\xca\
+@\xf38]2E\x18\xba:Z\x03\xc0\xdd\x83\x5cS\
+\xe4*cMDr\xde\xc3$h\x1c\xc3\xfd\xfe\xe8s\
+[\x00\xc0M\xb7\xdcr\x9b#4\xb1XL6\xc7\x9a\
+e43%H<\xf1\x97'\xef\x02\x80\xa2\xa2\xf4\x07\
+\x88\x00\x00w\xfe\xfaW7&\xe2\xb1\x03\xfe\x04\xd9\x9f\
+H\xd3=\x04\x0e\xd4\xd5\xd5\xc9\xf5\xeb\xd7\xd7|=\xfb\
+\xeb\x05\xaf\xbe\xfa\xda\xdf\xae\x98>\xfd\xfc\xf2\xf2\xf2^\
+SN>%\xff\xd7\xbf\xbe\x0b\x00P^^\x81\xb3\xcf\
+=\x17\xbd{\xf7A^^>\xda\xb5i\x87\xde=\xfb\
+\x22\x90\xf9\xa2\x95\x1f\xe0\xc6E\x17e\x01\x00:v\xec\
+\x98\xbe\xce\x0d\xe7\x05z\xf4\xe8\xd3n\xf4\xe81\x13n\
+\xbc\xfe\x86_\xfe\xe7\xad\xb7\xdf]\xbeb\xc5\x9aM\x9b\
+6e\x7frHJ)\xedx2\xcc\xcfz\x84j\x93\
+\x9f\x81\x83v6\xbf\xfe\xf5\xf2\x8b\xff\xee\xdd\xa3\xb27\
+\xe9\x17'G:\x87\xc1\x85\xf4&\x19V\xafi\x1d\xae\
+\x1d\x93\xc3\xe2\xf4\x85\xdb\xfc\xc6\xa5Q\xbd\xf3r\xb0\xe9\
+|\xdd \xab!\x03Ms\xd2\xb9<\x8a\xcbF\xc6\xf2\
+IR\x86\x0b\xbd\xb8\x90S2\xf9Z\xc1d\xf2\x5ct\
+\x0a@\xcaT\x98z\xfe\xf9\xe7\x9f\xff\xcc3O?]\
+PPX\x98\xb0m\xd8v\x1c\x026\x82\xc1\x5cH\x09\
+\xfc\xeb\x1f/\xbf\xf3\xc1G3on\x8eD\xd6\x7f\xf4\
+\xc9'\xa8\xad\xae\xc6QG\x1d\x89\xb3\xce9\xab\xb7@\
+\xe0\x0fWN\x9f~\x8a\x9b\xc8\xec.:\x01*K\xb8\
+L\xd5\xe3(fz\xd8\xd8\xd8\x88\x9a\x9a\xda\xda\x8d\x1b\
+7n\xf8\xfe\xfb\xef\xe7}\xfe\xf9\xa7\xdf6Gbk\
+\xa5\xc0\xee\xa5\x8b\x16\xef\xdd\xb4iS\x95\x00\x10\x08\x04\
+\x11O\xc4X\xe6\xe4\xe4\xe5\xa1g\xf7\xee\xa8\xab\xab\x03\
+l\x1b\xb0\x00\x01\x0b\x05\x85\x85\xd8\xb7o\x1fjjj\
+\x90\x13\x0a\xa3\xa2\xa2\x1c\xbbv\xedBm}\xbd\xab~\
+\xeb\xa2V\xb9\xfd\x07\x0el\xd7\x7f\xc8\xe0\xb6\xbbv\xed\
+\xea\xd0\xb3\xb2r\xc8\xf8\xf1\x13\xc6\x0d\x1e:dp\xd7\
+.\x9d;\x84\xc3aMd\xa0\xe9TV\x19\x95K\xee\
+{\x09\x09!\x85\xbb\x08\x80\x8d\x1b\xd6m\xb9\xef\x9e\xbb\
+\xef\xff\xdb\x8b\xffxFA\xe6X@I\xfeS\x22\x04\
+x\x19\xf3\xca\xd7\xc9\x99@\xb6n\xe8\xf0S\x9d\xd21\
+\xc8\x99V\x89\xd4\xb5\xa3\xb7:\x86\xd1\xb6\xb5i\xaa\x01\
+\xf0RH\x89\xa42Kdw\x88\x1a\x12?sGz\
+\xed\x80\x8d\xec\xf6\xd5vU\x83\xa2\xeb\xa0\x0a\x84I\x02\
+\x80L\xcf\x03\xc7\x8c\x193\xee\x89'\x9e\xf8\xc7\xc8\x91\
+#{\x00@<\xde\x0ca\x03V8\x17\x02\xc0\x8a\xef\
+\xbf\xdf\xbfb\xf5\x9a\x1b\xee{\xf0\x81W\xb6n\xda\x8c\
+\xfd\xfb\xf7AX\x16\xa4m\xe3\xbc\x0b/\xb8\xfa\xee\xdf\
+\xfe\xe6\xf6\x1e\xdd{vu7&!T\xa1eIJ\
+\xe5K%\x0e;\x08\x88'\x12X\xb3z\xcd\xbeM\x9b\
+6\xae\xda\xbau\xeb\xfa];wn\xdb\xb5{\xcf\xae\
+\xbd\xfb\xf6\xed\xd9\xb3w\xef\xbe\x9a\xaa\x03u\xb5\x07\xaa\
+kk\xea\xeb\xeakkk\x1a\xbb\xf5\xec\xde\xdc\xbbG\
+\xaf\xd8\xfe\xbd\xfbm\xdbNH\xcb\x02\x84\x15\xb0J\xcb\
+\xdaX\x07\xaa\x0e\x84c\xb1h^\xdb\xb26\x05\x03\x06\
+\x0e,hhjj\xb5d\xf1\xe2\x92\x9e={\xb7n\
+\xd7\xb6mE\xdb\xf2v]zt\xef\xde\xa3{\xf7n\
+};u\xe9\xdc\xa3]\x9b\xb6\x06\xaaMK=&P\
+\xca\xc9\x94\xdc\x0b\x01\x99R|\xd5XJ;\x8e\x17\xff\
+\xfa\xdc\xf37\xff\xf2\xd6\xdfT\xd5\xd5mK%\xaba\
+\xaf\xa306Iw\x1a\xd2\xc9<\x95iNiU\xf9\
+\xe3t\x88\x96Q\xc1\xab\x9eJ\x07mS\xadO\xf1\xd1\
+6\x9ct\x9d\xf3\x954\xd4\xd3\x8d\x12E\xae2\xc8d\
+\x11M\x8c\x01\xb2\x0d\x8a\x8a\x8f\x96\x01\xdc\x1dr\xcaS\
+\x83\xc1\x0d\x9c\x8e\xce\x04\x00L>\xf2\xe8\x8a\x9bo\xbb\
+\xe5\xaf\xc7\x1fw\xfc\x14\x00\x88'\xe2\xb0m)\xad\x90\
+%\x82\x08\xa0\xae\xae\x0e\xff|\xe9\x9f\x7f\xdf\xb0q\xd3\
+\x9d\x9f~\xfa\xf1\x8eE\x8b\x17\xa5\x11\xe4\x97\x14tx\
+\xf0\xfe\x07~{\xc357LW\xf0j\x14\x9fa\x8d\
+\x8eB\xbf\xfab\x80H4\x8a\x9a\xea\xaa\xaa\xaa\xea\xea\
+\xaa\x86\xfa\xfa\xfaHSscummscc}\
+TJ\xcb\x96\xd2\x86\x14\x12\x01\x11\x14B \x90\x9b\x97\
+\x97SXX\x90\x97\x9f\x97_\x98\x93\x9bS\xd4\xa6\xac\
+MI\xfb\xf6\xed\x0b\xbc[\x22}\xd2\x89\x84\xaf>)\
+\x85\x126 \x13\xb0\x05 D\x10\xc2\xcaT~\xef\xbf\
+\xff\xf9\xe4\x0f\x7f\xfc\xe3\x1ff}=\xe7c\xa5\xb2\xaa\
+\xf4\x0e\x01\x1cgU\xa0i\xaa\x87\xa5e\xa8\x03R\xf3\
+uuM\x1e\xdb\x86\x1b8\xe3\xc2\xa5\xd3kz\xef\xe1\
+\x04\xdd\xf4\x0b\xe8\x17\x09\xbc\xe6MYs\x0aMY\xd3\
+\xfc\x9e\xe2\xf1\xb38B\xcb\xd2\xe7\xb7\xbaM\x1bYi\
+B\x08L\x9a4\x09\xb9\xf9\xf9x\xf0\xfe\xfb\xeeu\xe6\
+\x93\xb1XLFc\x11\xd9\x1c\xcf\xbc|Vu\xa0j\
+\xf3?_\xfa\xa7\xeb#$\x0e\x8c\x1b?\xe6\xc8w\xde\
+}\xe7\x03\xf7\xac\xb4\xa5\xcb\x7f\xc6).\xc1|\xf0\xb8\
+\x0f\x1d\xd0\x0dQ\x92\xb9\xd6'g\x1e\xdf1\xd9q)\
+\xe3\xcdq\x99\x88\xbaw\x03/\x987w\xd9%\x17\x9c\
+s^ANX]\xe5\xd4\xcd\xe9\xa9<\xe8dC\xfd\
+\x09\xf0rG\xf3\xe8O'\x97\x9cLZ\x04\x1f\xa7G\
+\xba\xfe\x98\xd6/t:`\xd2A\xcfF\xb8t?e\
+M?\x9d1\xa0\xe9F\xe5e~\xba\xc1\xd6\xad\xca&\
+\xady*\xae\x9c0a\x1c\x9e}\xfa\xa9\xd3\xe6\xcc\x9d\
+\x93>U6\x16\x8f\xc9\xe6DF\x08\xeb\xea\xea\xe4\xbb\
+\xef\xbe\xfb\xc9\xe4c\x8eU\xbf\x10\xeb@\xe0\x94\xd3\xa7\
+\x9d\xfb\xed\x82y\x8b|j\x90YC~\x10\xb4d%\
+\xdd\x8c\xe5\xe0\xf3\xb3s\xbd\xa8\xb2m[\xda\xb1\xe4O\
+\x85U+\x97\xaf\xb9\xea\x8a\xcb\xae\xcf\x0b\x05K\x92C\
+&\x1c\xd9\x0d\x22[\x1et\x8aJ\xd38y\xb0\x98\xb2\
+:\xa3\xe0%\x8f\x1cnS\x1d\x9d\x8eq\xe9\xa6:~\
+\x0dIV<\xa6+\xa0k\x9cS`/\xe3@\x15\xdc\
+\xabS\xba\x01\xf42\x22~\xac\xbd\x8b6g\xd7]y\
+\xbbv\x1d\xdf~\xe7\xed\xb7T\x01L\x90\xb7\xcd\x22M\
+\xcd\xf2\xf7\xbf\xff\xfd\x13\x9d\xbaT\xf6\xa4L\x04\x10\xbe\
+\xee\xe7\xd7\xffl\xde\x82\xf9\xec\x16d\x9d\xae\xd8\xea\x93\
+\x04\xdb\x8f\xba\xf8D\xac\xc1\xc3?~\xe3\xd7\xdf\xfd\xb6\
+\xe2\xae\xe0~y'\xab\x9c\x94\xd2\xf5J\x9fr\xe9\xc0\
+\x92\xa5K\x96\xdc\xf5\xeb_\xdd\x11\x0c\x04\x8a\x19Y\xa5\
+\xe3,\x98t:\xce:\xcf-\x90-/&9\xa4y\
+\xb4\x9e\xc9\xb1\x99\x14\xdaT\xb6\xa5yj\xbft\xe5]\
+V\xa0%\xa1\x87\xae\x9cNAM\xb8u\xe5U|^\
+\x03K\x85\xc1O\xe8G\xade\xfa\xdd}\x00\xb8\xf4\x8a\
+\xcbn\xd8\xbbw\xaf\xf2\xc8\xcf\x96q\x99p\x09\xf0\x8e\
+\xed;\xf7\xfd\xfc\x86\x9f\xdf\x92\x9f_H\x05\x14\x22`\
+\x85.\xb8\xf8\xc2\xab\xde{\xff\xbd\x0fuj\xa3Wx\
+\xf3[\x86\x19=\xf3\xb3/\xd1\xf4x\xd2v\xb5\xa4\x9a\
+\xb9LJ\xb6\x19\xa1-\xd9Y\xa9\xa9s\x12\x5c\x9f\x5c\
+rw3\xf9\x96\xae\xcd\x92\xf7\xd5\xe7\x9f~}\xed\xd5\
+W\xfd,\x1c\x0e\xe7S\xb62\xf2\xa4\xf3\xc0\xe9\xd3\x84\
+4u\xa8L\xa8\xd1\x84.B\xd0\x19\x00N\x1e\xbdt\
+\x88{l\xe7\x95\xaf3x\xa6\x9f\xc9af)\x01w\
+O\x1b\xa2\x0cU\xffs\x04\xea\x08\xd5\x19\x0d\x93e\xa6\
+\x0al2\x0c^\x02\xe2R~\x0e:u\xe9\xd2\xf7\x8d\
+7\xdex\xc7K\x9d\x96-]\xbe\xfc\xa6\x9f\xdf\xf4s\
+\xa1y\x00\x7f\xecq\xc7N}\xe6\xd9g^\xdc_u\
+ \xeb\xd98?\xdf\xe7f\xf9\xdc\x96d\xb3\x89\xd0o\
+bV\xcb\xd8R\xba\xfef\xe3\xa7F\x80\x96\xcdn\xc3\
+\xd6\xafc0\x9e^J)\x1b\x1b\x1b\xe4\xdf\xff\xfe\xfc\
+\xab\xa7O;\xf9\x0c(\x9f\x82K\x81\xcexs\xca\xa8\
+s>\xb4\x9eIFZ\x1a\xda\xb7\xc4\xf1qut\xba\
+\xe2\x15\xd2CS\xd7d(\xd4\xb2.\xa5\x06\xdc\x0d\xd2\
+{\x01s\xa3^\x86\x83\x1a\x0c\xf5ZUh\x8epj\
+,\x02\xcc\xbd\xd7\xc2\x077\x80:\xe5w\xa5_t\xe9\
+%\x17o\xdc\xb0!k;\x1b\x95\xe3\x85\x0b\x17.\xb8\
+\xe6\xaak\xaf\xb3,\x8bz.\x00\xc0Ig\x9c2\xfc\
+\xe6\xdbo\xbes\xe1w\xf3\xd7kt\xc3\xe8\xafYU\
+\xb3\xb9zI-\xb3m;\xa3\xc2\x8a7N{\xfet\
+\x94\x9eRi\x05\x91-yE\xd5,\xdb\x19\x81\x04\x02\
+.X\xbeb\xf9\x9a[o\xbd\xf5wG\x1d~\xf8\xe8\
+\xbcp\x98c\x9b\xc9\x88;r\x00&\x8fK\xd3\xe1P\
+\xe5\xcf\x8fW5\xe1\xe1d\xdb\xcbX\xd0\xc8\x82*\xb3\
+\xceiy\x19\x02\xaa\xb3*o\x04\x90\xdd\x18UPN\
+a\xfd\x868:F\xea\x0c\x81\xce\x92\x99\x06\xd34/\
+3-\xc0\x98,\xb6\xd2\xb6H{\xf4\xa2\xe2\xa2\xf6\x0f\
+=\xfc\xd0\xe35\xea\x89\xc2\x1aUX\xb4`\xe1\xf2\xe9\
+W^uU\xcf\x9e=+\xc0@YY\xab\xd2\x93N\
+<n\xea\xf3\xcf?\xf7\xca\xcaU\xabXc\xe0\x1fL\
+\xb1\x82keA\xaa\xbe;;5\xfb\xba\xc5t\xa4+\
+\x9b1\xacY\xbbf\xdd\x0b/\xbe\xf0\xf2\xb1\x93'O\
+\x09e\xbe\xbf\xe7\x00\xe7\x08t\x06\x9c*ZKd\x81\
+\x8e\xbb\x9f\xba:\xd9Q\xebz\xd1a\xc2\xe9\x155p\
+\x91\xb7\x97\xe33\xe9\x9b\xa7\xb2\xfa\xf9\xe9B0S$\
+@\x89\x06S\xc6\xa4\xec\xba\xf9=WN\xc7l\xae\x9c\
+:\x17\x0cY\x10!\x01\x91\x03%$\xed7\xb0\xff\xc8\
+\x7f\xff\xfb\x8d\xff$\x12\xeew\x01l\xc6].Y\xb4\
+x\xc3-\xb7\xdev\xf3\x11G\x1f\x95~\x81\xbfo\xdf\
+\xbe\x18?~tzS\x8b\x95\x13hs\xcd5\xd7\x5c\
+\xf9\xd6[o\xbe\xb1x\xf1\xa2\xe5{\xf7\xec\xc9\xc2C\
+\xd4\xec\x10(\xeb\x0f\x07\xe7\xf3\x1b~\xda\x8f'\x12r\
+\xd1\xe2\xc5K_\xfc\xfb\xdf\xffy\xe6\x99\xe7\x5c\x98\x93\
+\x97W\x86l\x08\x911Q\xe5\xd3\xa4\x80\xea\x98\x1d\xcc\
+\xcf\x8f\x5cP\xd9\xd6\x95\xa1Q)UZ\x0e\x175 \
+\xd4 \xe9\x94\xdcd\x8c8#\x94\xe5\xf0\x9c\x0c\x80\xdf\
+\xa6!\xa0\xdf\xd5\xd7\x92\xbd\x9d\x14\xa7\x8a\xdb\xb4\xc3\x90\
+\xab\xa7K\xd3\xed\xa62\x85\xf8\xba6-'W@\x08\
+)\x80\xd4\x1fKJ\x19u\xca\x1d=\xf9\x98\x93n\xbc\
+\xe1\xdakO>y\xda\x89\x9a6\xd2\xb0u\xfb\xf6\xba\
+\x8f\xde\x9f\xf9\xcfg\xfe\xfa\xdc\xcc\xaa\xaa}\xef\xdeu\
+\xc7\xafq\xdf\x1f\x1e@L&\xd0\xd8\xd0\x88]\xdbw\
+8E\xdb\xfe\xfb\xdfo\x1c\x9e\x80\x1c\xd6\xd0\xd8<\xf2\
+\x94)'Mh]R\xcaN'h'\xb3;\x9b\xd9\
+\xa0\xac\x1f(\xdd>.\xef\xf6\xbc`\xeb\xd6m{\x16\
+.\x5c8\x7f\xc9\x92\xc5\x8b\xe7\xcd\x9b\xb7\xf0\xe3\x8f?\
+\xfd2\x1am\xdeO\x8a\xa5d\xd01\x87\xe9]\x9a\xaa\
+L8\xd7*\xa1\xa6\xed\xb6-%\xdf$\xe7j=\xb5\
+}\x8a\xcb\xb4\xc1H\xb7\x81\x88\xe2s\xf2\xd5\xb689\
+\xa5\xe0\xa4s\x9b\x8eL4\xb9\xe6\x07\xb4\x80\x93g#\
+\xbb\xd3&\xe2\xd5t\xd3N&5\x9f\xdbN\xec\xd5\x16\
+M\xa3\xc2b\xa2\xc1\xb9\xa7\xf4\xa8;\xc8\x1c<\x16\x80\
+\x84H\xa6\x06\x01@&\xdf^M8\x95\x8e9v\xf2\
+\x94\xcb/\xbb\xec\xb2\xb3\xcf>\xf7TJ\xbe-%\x84\
+H\xbd\xae\x0a\xa0\xa9\xa1\x09K\x16/\x9e\xdd\xd4\xd0\xf4\
+\xd1\xc5W^\xfc\xafSO;k\xdd\xf7\x8b\x97\xe2\xf3\
+\xcf?Ayy9v\xef\xde\x8d\xd1\xa3Ga\xde\xbc\
+\xf9\x00\x10\x180\xb0\xff\xb0\x01\xfd\xfb\xf6\x1e:x\xc8\
+\x90Qc\xc6\x8e\x1d6b\xc4\xb0\xb2\xd6eE\x0c/\
+\x0e\x12Zn\x008hjj\x96\xabV\xaf\xde\xb4z\
+\xed\xaaEK\x16/]\xb0t\xe9\xf7+V|\xff\xfd\
+\xeaM\x9b7\xadd\x8a;\x1eH\x1d_\xeeZ\xa74\
+~\x89V\xc7\x98\xdb\xe2\xab\xe2\xa2v\xd4\x8f#\xd2\x19\
+\x00?i:g\xa5\xeb+W\x87\xeb\x1fG+\xcdO\
+\x1b\x09\x93\xd2Q\x0b\xcc\x11\xa46\xc2m_\xe4,\x99\
+Z\x16L\x1aU\xcc\x96Xl\xd3\x00S\xa0\xccS\xd3\
+9\x1a8\x90H\x19\x0d!\x04\x0e\x9b0~\xd2\xf4+\
+\xa6_w\xea\xa9\xd3N*.*No\xa1\x8d'\x12\
+\x88\xc7\xe2\xb0\x02\x01\x84C\xc9\x99Dmm-\xb6l\
+\xda\xb4s\xdf\xbe\xeayO=\xfb\xe4\xbf\x1b\xeb\xeb?\
+\x197v\xec\xce\xff\xf9\xf5\xaf5M\x01\xc1\xa0\xd5\xaa\
+C\xe7\x8e\xed;Vv\xe9\xd8\xafO\xbf\xfeC\x07\x0c\
+\x1a\xd4\xbbW\xaf\xde\x95\x95\x95\x1d[\x97\x95\x95\x16\x15\
+\x16\x15\xe4\x84ss,\x8b\xb2\xeb\xd0@}}\x83\x1d\
+\x8d\xc6\x1a\xeb\xea\xeb\xaa\xb7o\xdf\xbeg\xf3\x96\xcd\x9b\
+W\xaeZ\xb9j\xe1\xbc\xf9K\xea\x1a\x1b\xd7756\
+\xee\xb2,\xb1k\xfe\xbc\xf9q\xdb\xa6\xbb\x5c\x01d\xc2\
+Q\xf5%1\xea`\x00^\x8e\xbc\x14\xd2\xb4\xddUg\
+\x00$S\xee`\xc0\xcb\xc1\x99d\x9a\xca G#'\
+\xa3 iTo\xb9>KZ\x8e3\x00:bi\x9a\
+.$\xd1u\xd2iT\x1dpN\x099C\xc2\x81I\
+9u\x83\x00\x92\xae2\x85\x0b3)\xd8$_-\x9f\
+\x96\xf8\xca\x9e=\x07\xde\xfc\x8b\x9fO?v\xf21\xc7\
+\xf4\xee\xdd\xbb_\xa6\xb6D4\x11C\x22a\xcb\xbc\xdc\
+\xdct\x1b\xf5\xb5u\xa8ol\xdc\xb5\xe0\xbb\xef\xbe}\
+\xeb\xcd\xd7\xff[]S\xb7\xf0\xbb\xef\x97n\xdc\xb2~\
+}\x8d\x86\x8eLG\x05\xc2\xe1p\xa8\xa0\xb8\xa4\xb8u\
+\x87\x8e\x1d;\xf4\xe8\xd6\xa3Se\xd7.\x1d:w\xa9\
+l_\xd9\xadk;!\xed\xd6y\xf9E\xad\x0a\x0b\x0b\
+\xf2\xf3\xf3\xf3sC\xa1pP\x04\xac@P\x08@\x02\
+\xb6\x04li\xdb\x89\x84m\xc7\x12\xb1x\x22\x1a\x8d6\
+55Gjkk\xeak\xea\xebk,\x81\xaa\x9d;\
+v\xee\xde\xb0~\xc3\xf6={\xf7m]\xbe|\xc5\x96\
+\xad[\xb7\xeck\xa8\xab\xaf\xb1\xa5\xddd M\xe5\xa7\
+3\xee\xea5\x15t/c\xcb)\x81\x9f\xb17\xc9\xa3\
+\x8a\xa7%^[G#\xad\xc7\x197]y/Zu\
+2\xad\x86\xfd\xf4\xa5'\xa9\xa4\xb1\xf8\x85\xf2\xf3\x0au\
+(\xb1N#\x80~\x9a\x10\x80{\xb0A\xcaP\xc2\xc0\
+\xdc\x9b\x06H\x17\x1d\xa8\xc2\xe6U^\xc5\xc9YJ'\
+\x9d\x96\xa3m:\xf9iCPZVZt\xdeYg\
+]|\xdc\x89'\x1e?q\xe2\xa4\xa3[\xb5j\x95\x9b\
+n\xd0\x96\xb0\xed\x04\x02\xc1\xec\x83;\xaa\xabk\x13s\
+\xbe\xf9\xe6\x9b\xef\xe6\xcd\x9d\xb5|\xe9\xf2\x85K\x97-\
+[\xbbj\xed\xaa\x0d\xb0em\xfa\x85f\x03\x0c\x1a\xd4\
+\x1f\x16,|\xbf|\x05\x1cO\x1c\x08\x0b\xcb\x8e\xcb\xbc\
+P\xc0\xca\x0d\xe4\x84\x82!\xcb\xb2,X\xc2NH;\
+\x11\x8f'b\xd2N$\xe2\x89X\xc2\x96Q\x00\x11\x07\
+W\xbbvm\x10i\x8c\xa0\xb6\xa1\x1e\xd2\xdc\xae\x1a%\
+\xaa\xc2\xe8\x18W'\x8d\x1ax5\xd2\x04\xc1A\x1d\x83\
+\x93NAU\x02?\xc6\x9f\xe6\xfdP\x03`2:T\
+W\xb8\xfa~pQ|^}\xa2\xe9\x9cSu\xbd\x0d\
+H\x05\xdf\xc4H.\xac\xf0cy9\xa2T\xfc*P\
+\x01\xd0\xd1\xa7\xf3\x04\x1c>ZNg@\x80loO\
+\xe9\xa4F\xca\x01\x9b)\x8b\xc1C\x07\x8f\x9fz\xd2\xd4\
+\xa3&L\x98t\xdcQ\xc7\x1c9>\x1c\x08\xc1\x052\
+\xf5\x879\xd3o\xef\x9e}\xd5\x8b\x97,X\xb2q\xf3\
+\x96\xe5\xeb6nY\xbbt\xc1\x82U\x8b\x17\xcf_\xb3\
+{\xf7\xbe\x0d\xc5%\xc5\x88E\x12\x08\xe7\x06PSU\
+\x9b&\xa6{\x8f\x9e(--\xc3w\xdf\xcd\xf3R\x5c\
+\xdf\xd0\xb9c'T\xd7\xd6$\xcf\x12p\x83\xc5\x95W\
+\x80\x8e\xb3\xce!\xa8\xe5\xbd<7\x05\x1aQ\xa8\xe5M\
+\xca\xc2\xd1\xa8S ]]]}j\xd8\xe8\x82\xbbN\
+\x9e\x00\xfe\xcdB\x9d~\xea\xf4P\xad\xc7:C.\x04\
+\x03x\xe6\xd0\xca4d\xa6\x04\xe8\xa2\x0a\xb5\x1c\xd7&\
+5.\x1c\xd0\xba\x14\x87\x97\xc7\xd6\xe5\xf9\x0d\x0d\xb9(\
+\xc5\x01\xfa*jB\xc9C\xd7\xee\x95EC\x86\x0e\x1d\
+Q\xd1\xa6|\xe8\x19g\x9c~\xd2\xb0\xa1C\xc7\xb5i\
+\xdb\xd6\xe7+\xb7I\xa8\xa9\xadk\xde\xbem\xcb\xd6\xfd\
+\xfb\xf7\xef\xaaml\xdc\xbeb\xf9\xaa\xb5\x0b\x17\xce_\
+\xbbb\xc5\xb2\xb5[6n\xdaX]]\xbbo\xe4\x98\
+\xb1\x89\x17_\xfc;.8\xf7l,^\xbc\xb8%\xe8\
+\xb5\xf0\xb3\x1b\xae\xc7\xa4#\x8e\xb4\xa6O\x9f\x9eW]\
+S\x1d.m]\x9a\x87DB\xee\xaf\xaa\xde'!c\
+\xc8\x16pu\xaeO\xc3U\xa7\x1c\x07\x9cr\xf8\x0d\x8b\
+9\x5c*M:\xe5\xd5)\xa3\x9fHA\xad\xd7\xd2\xb0\
+_\xd7\x9eN\x0f\xb8\xfe\xd0\xff\xb4\x1cm/\x9d.\x90\
+\xbd\xd2J;\xaaV\xf0\x13&\x81\xc9\xe3V\x84\xfc(\
+\xb9\x8bX\x05t\xab\xc3^\xe0'\xa4kI\xc8\xa6\x0e\
+\x16\xa5\x89>\xda\xcc\x0as\xff\xf5\xea\xcb\xb9\x91\xe6h\
+\xd7\xbf>\xf7\xec\x90\xf3\xce\xbd\xe0\xf8\xc3\x0e\x1b?\xa6\
+K\xe7\xce\x1dKZ\x97\xb4\x0aX^N\xd5\x0dM\xd1\
+(\xea\xeb\xea\xaaj\xaa\xabk\xb7o\xdb\xbe\xef@M\
+\xed\x8e\x9cPx\xd7\xf7K\x17\xed^\xb3~\xed\xbe\xba\
+\xea\xda\xfd\x0d\xf5\xf5\x0dMM\x8dM\xb1X$\x16\x8d\
+%\xe2v\x22\x1e\xb7m\xdb\x16R\x02\xb6\x94V0h\
+!\x1c\x0e\xe7\xe5\xe6\x86\x8b\x0a\x8a\xf2\x8a\x0bKZ\xb5\
+.+mSR\xda\xaa$/\x1c.(\xaf(\xcf+\
+//\x0f\xac[\xb3\xb6y\xf5\x86\xf5[\xd7\xafY\xb3\
+r\xd9\xa2\xc5Kv\x1f\xd8\xbf\x1d\xde2\xe3\xf0@\xe5\
+\x13\xe7 t\x91\x1e\xc5\x05d\x8f\x1b\xa7x:G\xa4\
+\xd6\xd3\x01\x17\x81r\xf9\x5c\x84\xa3N\x8f\xe9`\xb6D\
+n\xfd\xc8\xac\x8e^\xa7\x9c\x8e\xa7\xb6\x1a\xfe\xab\x85i\
+E\x1d!&\x0b\xa6\xe6s\x1e\xdfI\xd7E\x13\x5c\xe7\
+\xb84\x8ef\x95\x0e\xae\xbe\xc9z\xabeM\xfd\xa2\x8c\
+\x0d\x90r\x1c\xa8\xc6!\xd1\xbeC{\xe4\xe7\xe7c\xfd\
+\xba\xf5\x00\x80P(\x98\xd7\xa5{\xb7nG\x1cq\xc4\
+\x98\x89\x93&\x8en\xdf\xae\xa2gy\xbbv\xed\xdb\xb6\
++o\xdb\xa6\xb4\xacM8\x1cj\x91U\x88\xc7\xe3\x08\
+2k\x0c\xbe\xeb'$j\xea\xea\xeaw\xef\xd9\xb3\x7f\
+\xc7\xb6-\x1b\xd7\xaeY\xbb\xfa\xabY_-]\xbfv\
+\xdd\xd2\x8d\x9b7l>\xb0\xef\xc0>\xdb\xb6\x9b`\x0e\
+\xbdu!+-\xa7\x82\xba\x86\xe3\x94\xd3\x8d\xb5\x0e\x87\
+n\xfcMa\xb7\x97b\xd2~q\xfbW\xb8r~\x9c\
+\x9d\x89^\xeaT(M\xdc^\x1e\xdd\xb5\xcb\x19sS\
+\x00\xaa\x90&e\xa4J\xe0\xa7\xc3~\x98\xae\x0b\x01\xfd\
+t\x94\xc3\xe3\x15\x0e\xe9h\xd4\xd5\xd5\xb5\xc5\xa5So\
+@i\xca\x8a\x8e\x84\x10(,*B]m-\xac@\
+\xa0\xa4w\x9f>=z\xf5\xe8\xd9\xbdW\xcfn\xdd\xdb\
+w\xe8X^^QQ\xd1\xae]\xbb\xf2\x92\x92\xd2\x92\
+\x82\xdc\xdcV\xc1p\xb0\xa8\xa0\xa8(\xbf\xb1\xbe\xbe \
+??_t\xec\xd4\x05~\x9e\x0467G\xe2\xf5\xf5\
+uuU\xb5555U55\xfb\xf6\xee\xd9\xb7k\
+\xf7\xae\x9d;w\xec\xde\xb9\x7f\xff\xbe]\x9b6\xac\xdf\
+\xbct\xc5\xf7k7\xac\xdf\xb49\x11\x8f\xd7TT\xb4\
+G]U5\x1a\x22\xae\xc5\x7f\xeaD\xb8\xcd(\x92\x94\
+\xa5|\xf2\x13\x9a\xeb\x22S\xba\xe0k\x1a/\x93\x17\x07\
+)\xe7%S\xa6\x88\x83\xd2\xe5D\x01^\x06F\xe7\xa4\
+hT\xaa\xe3\x9dnJ\xa0u\xe6:\x03\xe0\xa4\xab\x1e\
+\x91k\x94\xf3\xf2 \xf7\xb4\x1c\xe7\xc58\x02\xb96i\
+y\x0e\x0f'l\x0e\xd0CJ\xa9\xd0\xd2\xc1\xe7\x16\x02\
+A\xcaq\x83\xcay,._\xc5\xed\xa4\xa9\xe7\xd6\x9b\
+ h\x05\x02%\xc3\x87\x8f(\x1e1bX\xb1\x0dY\
+\xf8\xeb\xdf\xfe&\x1f\xb0s\xef\xfd\xdd}\xe1m\x9b\xb6\
+\x85J\xcaZ\x07l!aI!\x91\xb0\xa5L\xd8\x89\
+\xa6Hc\xbc\xb1)\x12knnh\xaa\xab\xab\xad\xab\
+\xaa\xaa\xa9=p`\x7fu}]}\xb5-e\xa3\x8f\
+v\x81\xcc\xaa>\xed\x0fUF\xd3\xb8R\x83\xae\xf3\xe4\
+ \xe9\xbaHLWN\x97\xa6\x02\xe7P8\xfc\xd4+\
+\x9b\x0c\x80\xae\xae\x8e\x0e\x9a\xaf\xf2G\xad\xa3\xd3E\x8a\
+\x8b3xY\xf5\x82\xca\x8dZ@\x17\xb6q\x0dS\xa5\
+\x01\xf8\x8e\x0b\xa6\x1eH\x1e\x8d<t\xa1\x15G\xa3\x9a\
+\xa7[m5E\x1f~\x0c\x8c\xce\xab\xa9`#\xbbM\
+jH\xe9\x7f\xfa\x18\xcb\xab\xcf\x00\x10\xb7\x13\x89}\xdf\
+\xcd\x9f\xb7o\xeb\x96\xcdhh\xa8GAA!\x9a\x1b\
+\x1b\xf0\xecS\xea\xe1\xb8?\x18tN\xc2\x01\xddsf\
+*\x03\xea\xb8\xfb\xf5\x84\x9cg3\xc9\x1dW\xc7\x0bT\
+\x1a\xd9\xddK\x0c>\x95\x0e\xce\x89PztF\xcd+\
+\xaa\xe4\xea\xea\xca\x98\xf4E\xeb\xcc\x05xe\xd1\xed\xc3\
+\xf6\x22\x9a\xa6\xf9\xb1\xf0\xba\x08\xc2I3\xcd{9\xcb\
+M#\x18\x9d\x01\xa0i:\xa5\xf3\xd3O\xae\xdf^\x82\
+n\xa2]\x97\xa6\xc3a:\x5c\x92\x03\x1a.S\x8f\xcd\
+yr?\xe1'\x982\x1c]\x5c9\xae\x9fT\xb9h\
+\x9e\xc9\x93\x9ah\xa0|>\x98z\x0ep\x9e\xd6\x8b\x16\
+\x93q\xa2\x06\xcc4u\xe0h\xe2\xfa\xa33\xa8\xe9\x85\
++\xbf\x03C\x1b\xd3y\x07\xd5B\xd2\xb2:\xc5\xa3\xde\
+\x82\xb3\xee\x1c.\x1aYp\x82B\xe94E(\xd0\xa4\
+\x9b\xa2\x025\xdf\xcb\xf3\x98\x06\x88\xd2\xcc\x19N\x8e\x7f\
+tL\x00w\x98\xee\x94\x090ij\x1b6\xb2\xc3{\
+\x93b\xa8\xbc\xe5\x84\x5c\x05S?\xb8\xf6\xb8\xf1\xa4\xed\
+\x99\xda\xd0\xc9\x0e\xd7\x8eZ\x97+\xa7\xeb\x9f)\x220\
+\xb5\xa5\xd61\xf1C\xf7\xa2^Kx\xae\xd3W\x00\xc9\
+w\xdd\xa9\xc2q^\xd7\xcb\xfb\xd10D\x922^\x0b\
+ :A\xa2\x8c\xd51R\x22\xbb\x1f4\x8f\x96\xd7\x81\
+\xc9\xa2\x9b\xc2K\xd5\x83r\x06\xd4D\x87\xc9x\xa9\xd7\
+\xf49\xbaN\xa0\xd4q\xa4\xe3c2tj\x9en\x07\
+'G\x1b\x90\x1d\xf1x\x8d\x9d\x93f\x93:\x5c\xbf\x9c\
+\xff\xb4\x1f\xa6(\x8e\xa3\x93\x93/?r\xe9\x80\xce\x19\
+\xaac\xcf\x19\x1fA\xcaP\xda(OtJ\xcb\x19\x0c\
+\x1d\xdd\xa6\xeb4\xdf\xfc<\x9f\xe4\x18\xa6\x1a\x09u\xe7\
+\x1b\x15|\x13.J\x9c\x8b0\xf0\xa1\xbf\xcd\x94\xa5\xf7\
+\xba\xd0\x9b\xb3\xd2\xce[i\xa6z\xaa\x11\xe3\x06\x83\x0a\
+!\xdd\x08\xc4\x09\x03\xdd'\xaf\xd6\xa7u\xa8'\x07\xcc\
+|\xa3\xe9T\x01u\xf9^\xa0+\xa3\xf3\xba4\x22\xa2\
+N\x81\xc3\xe1\x95\xa6\xa6s\xfd\xd2\xf5\x11\xa4\x8cC\x13\
+\xfdP(}\x1f\xdf\xa9\xdf\x12>qr\xc49P.\
+\xdd\x84\x9f\xd6\xa3\xce\x96\xc3\xab3\xfa\xe9rAB\x84\
+\xa3\xd8Tp\xbc,\x97\xda(\xe0\x16p\xce\xcaRK\
+\xa4\xb6E?\xf4\xc1y/\xbfs^N(MV\x9c\
+\xeeg\xd7\xe1\xe4\xf8\xa3\xd6\xe1\xcas\x86\xc0\xab\xae\x8e\
+\xef\x94>\x8eV\x8a\x9b\xf6\xcf\xcb\x83p\x06\xd8\xe4a\
+\xb9~p_y\xe2\xe84\xd1\xa4\xf6O\xed\x93\xa9\xdf\
+\x1c.?J\xa1\x93Y/z9CG\xc7\xc7D\x97\
+\xaaw^F\x5cu\x1c\xdc\xceJ\x9d\xb2\xb3\x91\x8c.\
+\xd4p@w\xc0\x80\xae\x93\xd4\xab\x99<1\x17b\xfa\
+\xe9\x80\xee\xcb-j\x1e\x87\xcb\xaf\xa5\xe4\x0c\x96\xda\x8e\
+\xee9\xb7\x97\xf56\x85\x80\xa6E.\xae\x8e\xc9#\xd1\
+\xb1\xd0\xb5\xc5\xf5A\x92<']]\x1b\xf02\x1c`\
+\xcapBM\xfb\xc3\x955\x8d\x03\xcd\xa7\xfd\xd6z=\
+C\x9e\xca[/\x19\xe6\xda\xd3\x19%/\x9ai>\x17\
+\xdd\xe8\xe8\xd0\xc9\x8e\x8a_\xfd\xef\xea\xbfsD\x10\xa7\
+\xd0\x80\xff\x97<\x9c\xff\xa6\xd3\x85\xa0\x94\xd1\xe1W\xc3\
+]\x9d0\xaa\x82K\x17\xac\xa0\x94\x03\xcc\x83\xa1SF\
+\xbf\xbcP\xfb\xce\x098\xe5\x8dZV7`j{\x5c\
+\xffMutF\x91^sx\xa8 si\xd4\xbb\xf9\
+1x\xdc~\x01\xae\xac\xae\xbe\xae\x8c\x8e\xb7\xea5W\
+\xc7\x8f\xac\xe8\xae9Y\xd2\xf1\xaa%4sN\xc7\xcb\
+\x11qtR\xe0\x22\xda\xac\xbe\xd2\xf9\xa7:\xc8\x14\x99\
+\x8a\x88;\xd1EWG\xe7i@\xf2)\xe8\x14Rg\
+1\xd5v\xa9\xd1\xf0\xd3\x0e\x07^\xde\xc4\x0bt\x06\x88\
+\xae\x9b\x98\x04Z\xe7=u\xf9\x14tF\x96*\xb5\xc5\
+\x94UiQ\xdb\xe3\xc6\x90\xd2hR6\xb5\x9e.M\
+'\x8b:\xe0\x0c2\xa5\x99\xab\xa3\x93\x15\x8ef\x93W\
+\xd6\x8d\xb5N\xee\xb9::#n2\xb8\xbav\xd5\xf6\
+\xb5\xce@]\x03P\x99\xc4\xed\x0d\xe0\x06U%\xd0&\
+utL\xf7\x9aJ8\x10@&\xfcT\xdbsB\x1e\
+\xafg\xedj\xbaiO9\x98kS]S;\x14\x9f\
+\xee\xcd0\x8a\xcb\x14\x12sm\xe8\xf8\xca\x19\x07S:\
+\x0cy\xd4H\xf85\x9e\xaa\x0c\xb5D\x81[\x02-\x95\
++5]'\xc3\xea=\x17\xcasr\xcdzU\x0d}\
+~\xf2\xb8\xf680\xd1\xa6\xdes\x8eQ\xc5!\xd5\xd3\
+Wu\x8d\xa8\xf7\xaa`s!\x9e\xcez\x99\xbc\x85\x8a\
+\x9b\xab\xe3G\x08\xb9\x8e\xfb\x1dlZ\x97\xa3)\xc1\xd0\
+\x04C]/c\xa9\x13\x1c\x0a\x9c\x91\xa34\x9b\xc2\x7f\
+S\xf4\xc3\xd1\xecu\x06\x9fZO\xe75\x05\xf9Q\x1c\
+\x1c\x8f9\x1a9ON\xa1\xa5\xca\xa7\xe2v@\xb7\xa0\
+\xac\xc3\xef\x17\xaf\x9a\xe6\xa5#\xba\xb2\x0e\x0d4J4\
+\x8d\x07\xd7\xbe\xce\xd8g\x0d$\x15\x00N\x90\xbd\xc2\x1e\
+\x9d`\xe8\x98\xc9\xb5\xaf;z\x8b\xab\xa7^\xebv\xfe\
+y\x09\x85.Z\xa1\x1eT\xf7\xea\xb4s\xadF(\xa6\
+v\xfcxI\x15\x97\xea\x95\xb8\xed\xaa^\xbb5i\x9a\
+i\xb1T\xa5\xd3\xc1\xad\x025\xb2\xb4\x1d\x1dp\xed\x99\
+\xfaN\xe9\xa6J\xc0mA6\xc9\x9a.Z\xa4ro\
+2\x00:\xe7b\xd2\x11\xbf\xf4\xe9\xc0+\xc2\xf5\x83\x93\
+\xeaVz|\xb9\xc7^\xce5\xb5\xe2:o\xa3\xb3@\
+\x1caj{\xea\xaa2\xed\xa4@6\xb39\x86s\xe5\
+\xfe\xbf\xd6\xceu\xc9\x8d\x1d\x04\xc28\xef\xff\xca\x89\xcf\
+/e\xdb\xed\xaf\x1bM\xe5P\xb5\xe5\x19]\x00!\xd4\
+07mJ\xd5\x12\x7f\xe2\xe9\xb4!lrh\x07\x8a\
+\xdfA\xa74N\xad#\xfe\xa9\x7f\x9a\x0b\xd7\x89\x9e{\
+k\x1f\x8a\x1e\xbe\xf0\xbdM\xe2\x952\x00:v=\xa9\
+\xde\xcbi\x0e\x92_\xe9_\xfa\x8c\xfbI\xe4\xf6\x0f\xb8\
+\xc8F\xe4\xcf\xef\xb9\x9b\xdf\xe4{\xf4\xb6g\xd2\x97\xd6\
+\xc8\xe8\xc7@\xbf\xe6\xd3A\xfd\x8e\xfc);\xe7~\x03\
+1)\x9a\x16\xa1GJB\xd7\x0d![4q\xe0\x9a\
+\xc9)\xee\x9f\xf9q\x04\xef\xbf\x8dO\xcbh\xc3S\x95\
+w\xea<\xb5w0:}n\xc1W\xcf\xb5\x9c\x9cp\
+{TJ J\x8fl\x9d\x07\x81\xaaS\xd2\x8b\xda9\
+\x11\xd0<\xe9\x93x\xdc\xf8\x90\xd7\x11\xa0Q0q\xfd\
+Z\x10\xd9@\xe0F\xaf\xd4\xee\xf8\xcfW\x06\xab\xbbE\
+\xa4\x94\x8e\x1c\x91\x04P\xd9\xb6\x80O{2\xe66\xc8\
+\xe4\xec\xba\x1b*\xbdE\xa7\xc6xY\x7f\xd5\xc37\xa5\
+\x18\xab'\x9dha\x0f\x1c\x135\xc0\xd8\xa2`sb\
+/ks\xfb\x1a\xe6\xb39o\xe2w\xea\x93\xddH>\
+\xcd\xc7L\xdexv\xf3\xb7f\xf7\xb6h7 s\x19\
+\x0e&\xda.\x81;\xd9f\xeb\xef\x01G\xcb\x1a0\xa2\
+\x9dO\xe4w\xc7\xa7\x01\x91s\xdeD\xdf\xa4\xd0\xb6\x9b\
+\x8a\xf2R\x83=\xd9\xa3\xc0ui\x0e\xefc\xbb!\xb2\
+\xd1\x13\x10#~i\x0f\x02'\x8a\xc8\xfe\xc4\xe4\xd4\xfb\
+>\x08\xce\xc7\xdb{\xd6\xa4\xb2hO\x85\x14Mo\xa3\
+\xb4\xd7m\x19\x11\xf9$\xc9r\x1b\xcc|\x8f\xf3\xff\xa0\
+\xc6\x8f\x00Q\xf5\xa3\xba\xb1\xf2[Y\xda\x8f\x82\xa2\xd6\
+\xbd\x0e3z\x11h\x84ABVO)RTt\xc7\
+\xf8=\xdfFH}g>\x07Au\x94Ax=E\
+\x9e\x81:m\x9f\xb2\x1e\x97{\xb3-\x94\x9e\x8f\x94o\
+}\xbc\xad\x13\x81@\x92E\xc0\x9et\xa2\xb9m:\xba\
+\xfdH\xaf\xe6\xf0\xda?\xdd\x18\xd5\x85\xec@\xe0z&\
+\xfe[\xb6\xa0\xbc\xa8?\xf1\xa0\xdf\x8dR\xf0j\x1b\xa9\
+4\xbdn\x02\x16\x81\xf3[?\x0fu\x05\xc9\xc8\xd4\xae\
+\x0a\x00%<\xf5n\xbc\x09\xc1\xda\xe0u\xf1n\x80\xd2\
+\xe4z4\xa5\xaf\xf0<\xc2\xa4\xdf\xf4\x0am\xb3o\xca\
+\x1cR\xdb\xb6(\x89\xaf\x83!\xd9\xcc\xf9\x12\xc8\x91>\
+\xe9\xed\xcc\x1b'\xd5\xb6j[\xedO\xe0\xe8\xe5>O\
+t<\x93\x03\x5c\xe2\x99l\x92\xda:\xbd\xac\xde\xcf\xc9\
+\xbe\x09\xb4R\x06\x9b\xc0\x16\xc7\xe5\x05\xde\xd8\x17\x02\x0d\
+F\xfb\xdcn\x1aA\xd15m\x1e\x92\x06\xa3|\xb4\x8e\
+&\xf7f\xd1\x9f>:\x19\x9e)(\xaf\xe68i\xd1\
+n\x8b\xd9\xdb\xa5qS[o\x9flN\x11\xd4y\xa4\
+\xcb\xacS\xd6\x9cN\xe5\xdcd\x88\xae\x87\xdb\x85|\xc1\
+\x17n\xeb7\xc3\xfa\xbao\xa7\xf9p9~O\x88\x00\
+t\x03\xbb\x04J\x04\xcc\xae\xb3\xfa\xdf\xcc\xcfGA:\
+\x8e\x04\x16\xaa\xdb\x9f\x99\xcf;\xdfG@z\xe7\xddi\
+C\xb3\xd4N\x95|C\x7f\x97\xd9\x90?e\x11$\xeb\
+5\xbb,\x1f\x8f\x1b\x9e\x90:\x8d\xeb\x90\x83\x88\xeb\x9f\
+\xf4HeZ\xbee\x15[\x1a\xafz\xb9cy\xb9\x97\
+\xb5\x88\x95\x16\x02\xb5%\xbd]\x0f\xb2'\xf1'j \
+Js\x97t%P\xa6\xc0\x90\xf4\xba\xc9x7\xc0\x7f\
+\xbaFNY|\xdf\x84*]\x896\x18oCw\xce\
+\xb7\x9b\x8a\x84L~\xec\x88}x\xe9\x1d\xff\x91sz\
+\xa1i\x84\xc7\xcd\xa4QfC7\xe8\x9c\xcf\xe9\x9b\xa2\
+\x13\x9d\x933mi\xdc\x8d\x9c\xa4\x93S\x8a,M\xb6\
+\xf2\xa4\xb9%\xbb4\xfdnHm\xe3\x9f\xc3\xde\xd8\xe8\
+\x9cSD\xfd\x17R\xdf\xa4\xf5\xd4\xfc~\xac\xfc)5\
+\xdekF\xa2\x19\x80/\x1cG\xa4\xe4hG\xc0)w\
+\xc7I\xd7\x84c\xed\x08\xf1[\xdf\x14\x89\x12\x0a\xea\xe2\
+?\xf2\xf4%\x904^\xe5G\x9b\x82\xb4t\x9d\x16\x07\
+\xd9\x8e\x22\xe7\x99\x0f\x8a\x94\xc4\xbbM\xbe\xf3S\xf2\xb1\
+\xfb=\x8b\xf7\xf0}\x9b\xb4\xf8\xd3\xd8h\xec\xaec\x9b\
+\xeb\x16\xf1\x9a\x0e7\xfc\x88\xdc^\xfa\x9b\x8eS\x99\xea\
+\xe8\xe5GV\x1b_\xca`\xd5\xd7<\x9b?\xbf\xf4\xf6\
+\xea\xdfz\xfd\x16 M\xa0+\xa2u\xee\x004\x11\xe4\
+\xf0\x87Z[\x8a&7Q\x91(\x19w\x93M\xc6N\
+\x0bXu\xdd\xf8\xa5\x85|\xa8\x01\x06\x01&\xc9s0\
+!\x99i\x1c\xad\x9c\xf8\xb4\x85\xeb:%`\xf5>\xdb\
+\x22p\xba\xd9\xc0\xa4]\x8e5\xffO}T\xafF\x9b\
+}\x92O\xa6\xfe*\x93@\x9d\x80\x97\xfc\xe1u:o\
+Q\xfa\x08UeZ\xcaB\xa9\x9f\xff\x1d%\xfcI\x84\
+G$\xa7\x9b\x89\xa3>d$\xcdZ\x0e\xc0\xa4>/\
+k\xe3\xfc\xe893\xe9L:$\xc7|\xcf\xb7^c\
+\xf5\xfa\x9b28o\xaf\xf2}>\xe9\x92$\xc9\xf52\
+\xb2\x0d\xbd&\x9b\xe4\xb7\x08\xf9\xaf\xa9\xfa\x8d]}\xcc\
+\xa4\xf7{\xbe\xed>\xd6\xeeV\xd7\xf7\xf0?\x93m~\
+\xd8|\xa5\x95\x9f\xcf\xbd?\xc6\xe7\xaf\xbf*\x91\xc1R\
+\x9b\x0fT\x816\xea\xe8\xca\x87n8\x92\xf2\xa4SC\
+K\x97\xe1e\xcd\xe9\xd2\xa2'\xf0\x22\xdd\xb7\xc5C\xe3\
+q\xa7\xbb\x89\xac\xc9N\xbf\xa0\x0d\x8dM\xdb$;R\
+\x04Q\x99\x14\x11\xdbq\x92\xf1t\x81\xdf\x80\xfe\xa1d\
+\xcf\x06\xd24\xbf\x04Nt\xdc2\x91\xcd\x16$\x87\xf4\
+\xd49n\xc1\x81\xd6ge\xa6\x9d\xd3\x82\xf1s?\xa6\
+\xb2D\x9e\x96\xb8n\xe4t3?{\x05\xa4\xcb\x80s\
+\xfd\x96\xd2j\xd2#\x8d\x89.o\x14Uo\xfe\x9f\xa0\
+\x8f)9\x98\xd6S4O\xe9\xbf\xeb\xa9\xd42\x13m\
+C\xa0\xd2\xc0\x90\x1c\xd5\xe7\x83\xc6J\xe3\xf1\xb1\xf8\xf9\
+9NoI\xb6\x85@D\x11\x9et\xdc\xb2\xde\xa4\xb3\
+\x13\xd9\xa0\xf1M:\x9d\xb2'\xdb\x80%\xbd\xdf3\x9f\
+\xe9\xb7NV\xdaw\x8f\xca<\xfd<\xe5\xedf\xe0{\
+\xf6\xe8\xff*\x7f\xd4\xaf\xa5@\xa4\xf3\x19\xa7\x979%\
+\xfe>\xde\x9bH\x9a\x16\xa9\xb7\xf5\xd7o[\x04y\x0d\
+\xebD\xb2\x9a\x83z\x9b\x04\xe2j\xabt\xed\xee~q\
+\xa3C\x1acK\x87\x13%_\xda\xfal\xfa\xbc\xac|\
+\x0bZ\x0d\x1c\x93\xec4g\x04\x9c\x09 \xd2\xe5\xc4\x97\
+\xec\xf4\xc8\x82\xd2\xe6[\xd4:u\xe9\x9b\xfe\xc6\xd3y\
+<%\xbd\xcch\x1b=\x9c\xe3t\x03E\x8f\xdd\xb1\xb5\
+\x0d\xe9\xb8]j\xb8\x0c-#gO\xe5\xd4\xdf\xf9\xb4\
+\x85\xe7\x97\x0dt\x8d\xe8m\x13\xdf\x9bE\xb9Q\x8b\x82\
+\xc9\x89\x93\xec\x96\x11i?Z@$\xa7\x95\xdf\x82\xec\
+F\x0a\xa8\xb43\xb6\xb7\xbd\x09\x0e\xcaW\x7f\xff\x12\xfd\
+\xa7\x18g\xd6\x18\xbb\x91o\x8c\xe8\x03s'\xd7\xb2t\
+\x03\x89\x9c\xc2\xf9\xb7\xc5\xaa\xba;\xdf\xf3\xbb\x01\x03\x01\
+Z\xe3\xed<Ho\xcaB\x8e\x1dT\xaf[\x90\xd9\x00\
++\xcd3\xa5\xee\xfe)\xb8G&\x1d\xc3\x13\x22\xbb*\
+o\xcd\x86Z\x0a~\x13\x0dIf+w\xfe\xcdg\xb4\
+\xcf\x13\xe0v\xf2Ls\xbb\xbcH\xf2\xa9\xfe\xeb\xf8?\
+\xe9\xf9>\x0cUc\xfa\xb4\x00\x00\x00\x00IEND\
+\xaeB`\x82\
+\x00\x00\xd7\x93\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5cr\xa8f\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x0aIiCCPsRGB IEC\
+61966-2.1\x00\x00H\x89\x9dSw\
+X\x93\xf7\x16>\xdf\xf7e\x0fVB\xd8\xf0\xb1\x97l\
+\x81\x00\x22#\xac\x08\xc8\x10Y\xa2\x10\x92\x00a\x84\x10\
+\x12@\xc5\x85\x88\x0aV\x14\x15\x11\x9cHU\xc4\x82\xd5\
+\x0aH\x9d\x88\xe2\xa0(\xb8gA\x8a\x88Z\x8bU\x5c\
+8\xee\x1f\xdc\xa7\xb5}z\xef\xed\xed\xfb\xd7\xfb\xbc\xe7\
+\x9c\xe7\xfc\xcey\xcf\x0f\x80\x11\x12&\x91\xe6\xa2j\x00\
+9R\x85<:\xd8\x1f\x8fOH\xc4\xc9\xbd\x80\x02\x15\
+H\xe0\x04 \x10\xe6\xcb\xc2g\x05\xc5\x00\x00\xf0\x03y\
+x~t\xb0?\xfc\x01\xafo\x00\x02\x00p\xd5.$\
+\x12\xc7\xe1\xff\x83\xbaP&W\x00 \x91\x00\xe0\x22\x12\
+\xe7\x0b\x01\x90R\x00\xc8.T\xc8\x14\x00\xc8\x18\x00\xb0\
+S\xb3d\x0a\x00\x94\x00\x00ly|B\x22\x00\xaa\x0d\
+\x00\xec\xf4I>\x05\x00\xd8\xa9\x93\xdc\x17\x00\xd8\xa2\x1c\
+\xa9\x08\x00\x8d\x01\x00\x99(G$\x02@\xbb\x00`U\
+\x81R,\x02\xc0\xc2\x00\xa0\xac@\x22.\x04\xc0\xae\x01\
+\x80Y\xb62G\x02\x80\xbd\x05\x00v\x8eX\x90\x0f@\
+`\x00\x80\x99B,\xcc\x00 8\x02\x00C\x1e\x13\xcd\
+\x03 L\x03\xa00\xd2\xbf\xe0\xa9_p\x85\xb8H\x01\
+\x00\xc0\xcb\x95\xcd\x97K\xd23\x14\xb8\x95\xd0\x1aw\xf2\
+\xf0\xe0\xe2!\xe2\xc2l\xb1Ba\x17)\x10f\x09\xe4\
+\x22\x9c\x97\x9b#\x13H\xe7\x03L\xce\x0c\x00\x00\x1a\xf9\
+\xd1\xc1\xfe8?\x90\xe7\xe6\xe4\xe1\xe6f\xe7l\xef\xf4\
+\xc5\xa2\xfek\xf0o\x22>!\xf1\xdf\xfe\xbc\x8c\x02\x04\
+\x00\x10N\xcf\xef\xda_\xe5\xe5\xd6\x03p\xc7\x01\xb0u\
+\xbfk\xa9[\x00\xdaV\x00h\xdf\xf9]3\xdb\x09\xa0\
+Z\x0a\xd0z\xf9\x8by8\xfc@\x1e\x9e\xa1P\xc8<\
+\x1d\x1c\x0a\x0b\x0b\xed%b\xa1\xbd0\xe3\x8b>\xff3\
+\xe1o\xe0\x8b~\xf6\xfc@\x1e\xfe\xdbz\xf0\x00q\x9a\
+@\x99\xad\xc0\xa3\x83\xfdqanv\xaeR\x8e\xe7\xcb\
+\x04B1n\xf7\xe7#\xfe\xc7\x85\x7f\xfd\x8e)\xd1\xe2\
+4\xb1\x5c,\x15\x8a\xf1X\x89\xb8P\x22M\xc7y\xb9\
+R\x91D!\xc9\x95\xe2\x12\xe9\x7f2\xf1\x1f\x96\xfd\x09\
+\x93w\x0d\x00\xac\x86O\xc0N\xb6\x07\xb5\xcbl\xc0~\
+\xee\x01\x02\x8b\x0eX\xd2v\x00@~\xf3-\x8c\x1a\x0b\
+\x91\x00\x10g42y\xf7\x00\x00\x93\xbf\xf9\x8f@+\
+\x01\x00\xcd\x97\xa4\xe3\x00\x00\xbc\xe8\x18\x5c\xa8\x94\x17L\
+\xc6\x08\x00\x00D\xa0\x81*\xb0A\x07\x0c\xc1\x14\xac\xc0\
+\x0e\x9c\xc1\x1d\xbc\xc0\x17\x02a\x06D@\x0c$\xc0<\
+\x10B\x06\xe4\x80\x1c\x0a\xa1\x18\x96A\x19T\xc0:\xd8\
+\x04\xb5\xb0\x03\x1a\xa0\x11\x9a\xe1\x10\xb4\xc118\x0d\xe7\
+\xe0\x12\x5c\x81\xebp\x17\x06`\x18\x9e\xc2\x18\xbc\x86\x09\
+\x04A\xc8\x08\x13a!:\x88\x11b\x8e\xd8\x22\xce\x08\
+\x17\x99\x8e\x04\x22aH4\x92\x80\xa4 \xe9\x88\x14Q\
+\x22\xc5\xc8r\xa4\x02\xa9Bj\x91]H#\xf2-r\
+\x149\x8d\x5c@\xfa\x90\xdb\xc8 2\x8a\xfc\x8a\xbcG\
+1\x94\x81\xb2Q\x03\xd4\x02u@\xb9\xa8\x1f\x1a\x8a\xc6\
+\xa0s\xd1t4\x0f]\x80\x96\xa2k\xd1\x1a\xb4\x1e=\
+\x80\xb6\xa2\xa7\xd1K\xe8ut\x00}\x8a\x8ec\x80\xd1\
+1\x0ef\x8c\xd9a\x5c\x8c\x87E`\x89X\x1a&\xc7\
+\x16c\xe5X5V\x8f5c\x1dX7v\x15\x1b\xc0\
+\x9ea\xef\x08$\x02\x8b\x80\x13\xec\x08^\x84\x10\xc2l\
+\x82\x90\x90GXLXC\xa8%\xec#\xb4\x12\xba\x08\
+W\x09\x83\x841\xc2'\x22\x93\xa8O\xb4%z\x12\xf9\
+\xc4xb:\xb1\x90XF\xac&\xee!\x1e!\x9e%\
+^'\x0e\x13_\x93H$\x0e\xc9\x92\xe4N\x0a!%\
+\x902I\x0bIkH\xdbH-\xa4S\xa4>\xd2\x10\
+i\x9cL&\xeb\x90m\xc9\xde\xe4\x08\xb2\x80\xac \x97\
+\x91\xb7\x90\x0f\x90O\x92\xfb\xc9\xc3\xe4\xb7\x14:\xc5\x88\
+\xe2L\x09\xa2$R\xa4\x94\x12J5e?\xe5\x04\xa5\
+\x9f2B\x99\xa0\xaaQ\xcd\xa9\x9e\xd4\x08\xaa\x88:\x9f\
+ZIm\xa0vP/S\x87\xa9\x134u\x9a%\xcd\
+\x9b\x16C\xcb\xa4-\xa3\xd5\xd0\x9aigi\xf7h/\
+\xe9t\xba\x09\xdd\x83\x1eE\x97\xd0\x97\xd2k\xe8\x07\xe9\
+\xe7\xe9\x83\xf4w\x0c\x0d\x86\x0d\x83\xc7Hb(\x19k\
+\x19{\x19\xa7\x18\xb7\x19/\x99L\xa6\x05\xd3\x97\x99\xc8\
+T0\xd72\x1b\x99g\x98\x0f\x98oUX*\xf6*\
+|\x15\x91\xca\x12\x95:\x95V\x95~\x95\xe7\xaaTU\
+sU?\xd5y\xaa\x0bT\xabU\x0f\xab^V}\xa6\
+FU\xb3P\xe3\xa9\x09\xd4\x16\xab\xd5\xa9\x1dU\xbb\xa9\
+6\xae\xceRwR\x8fP\xcfQ_\xa3\xbe_\xfd\x82\
+\xfac\x0d\xb2\x86\x85F\xa0\x86H\xa3Tc\xb7\xc6\x19\
+\x8d!\x16\xc62e\xf1XB\xd6rV\x03\xeb,k\
+\x98Mb[\xb2\xf9\xecLv\x05\xfb\x1bv/{L\
+SCs\xaaf\xacf\x91f\x9d\xe6q\xcd\x01\x0e\xc6\
+\xb1\xe0\xf09\xd9\x9cJ\xce!\xce\x0d\xce{-\x03-\
+?-\xb1\xd6j\xadf\xad~\xad7\xdaz\xda\xbe\xda\
+b\xedr\xed\x16\xed\xeb\xda\xefup\x9d@\x9d,\x9d\
+\xf5:m:\xf7u\x09\xba6\xbaQ\xba\x85\xba\xdbu\
+\xcf\xea>\xd3c\xeby\xe9\x09\xf5\xca\xf5\x0e\xe9\xdd\xd1\
+G\xf5m\xf4\xa3\xf5\x17\xea\xef\xd6\xef\xd1\x1f704\
+\x086\x90\x19l18c\xf0\xcc\x90c\xe8k\x98i\
+\xb8\xd1\xf0\x84\xe1\xa8\x11\xcbh\xba\x91\xc4h\xa3\xd1I\
+\xa3'\xb8&\xee\x87g\xe35x\x17>f\xaco\x1c\
+b\xac4\xdee\xdck<abi2\xdb\xa4\xc4\xa4\
+\xc5\xe4\xbe)\xcd\x94k\x9af\xba\xd1\xb4\xd3t\xcc\xcc\
+\xc8,\xdc\xac\xd8\xac\xc9\xec\x8e9\xd5\x9ck\x9ea\xbe\
+\xd9\xbc\xdb\xfc\x8d\x85\xa5E\x9c\xc5J\x8b6\x8b\xc7\x96\
+\xda\x96|\xcb\x05\x96M\x96\xf7\xac\x98V>VyV\
+\xf5V\xd7\xacI\xd6\x5c\xeb,\xebm\xd6WlP\x1b\
+W\x9b\x0c\x9b:\x9b\xcb\xb6\xa8\xad\x9b\xad\xc4v\x9bm\
+\xdf\x14\xe2\x14\x8f)\xd2)\xf5Sn\xda1\xec\xfc\xec\
+\x0a\xec\x9a\xec\x06\xed9\xf6a\xf6%\xf6m\xf6\xcf\x1d\
+\xcc\x1c\x12\x1d\xd6;t;|rtu\xccvlp\
+\xbc\xeb\xa4\xe14\xc3\xa9\xc4\xa9\xc3\xe9Wg\x1bg\xa1\
+s\x9d\xf35\x17\xa6K\x90\xcb\x12\x97v\x97\x17Sm\
+\xa7\x8a\xa7n\x9fz\xcb\x95\xe5\x1a\xee\xba\xd2\xb5\xd3\xf5\
+\xa3\x9b\xbb\x9b\xdc\xad\xd9m\xd4\xdd\xcc=\xc5}\xab\xfb\
+M.\x9b\x1b\xc9]\xc3=\xefA\xf4\xf0\xf7X\xe2q\
+\xcc\xe3\x9d\xa7\x9b\xa7\xc2\xf3\x90\xe7/^v^Y^\
+\xfb\xbd\x1eO\xb3\x9c&\x9e\xd60m\xc8\xdb\xc4[\xe0\
+\xbd\xcb{`:>=e\xfa\xce\xe9\x03>\xc6>\x02\
+\x9fz\x9f\x87\xbe\xa6\xbe\x22\xdf=\xbe#~\xd6~\x99\
+~\x07\xfc\x9e\xfb;\xfa\xcb\xfd\x8f\xf8\xbf\xe1y\xf2\x16\
+\xf1N\x05`\x01\xc1\x01\xe5\x01\xbd\x81\x1a\x81\xb3\x03k\
+\x03\x1f\x04\x99\x04\xa5\x075\x05\x8d\x05\xbb\x06/\x0c>\
+\x15B\x0c\x09\x0dY\x1fr\x93o\xc0\x17\xf2\x1b\xf9c\
+3\xdcg,\x9a\xd1\x15\xca\x08\x9d\x15Z\x1b\xfa0\xcc\
+&L\x1e\xd6\x11\x8e\x86\xcf\x08\xdf\x10~o\xa6\xf9L\
+\xe9\xcc\xb6\x08\x88\xe0Gl\x88\xb8\x1fi\x19\x99\x17\xf9\
+}\x14)*2\xaa.\xeaQ\xb4Stqt\xf7,\
+\xd6\xac\xe4Y\xfbg\xbd\x8e\xf1\x8f\xa9\x8c\xb9;\xdbj\
+\xb6rvg\xacjlRlc\xec\x9b\xb8\x80\xb8\xaa\
+\xb8\x81x\x87\xf8E\xf1\x97\x12t\x13$\x09\xed\x89\xe4\
+\xc4\xd8\xc4=\x89\xe3s\x02\xe7l\x9a3\x9c\xe4\x9aT\
+\x96tc\xae\xe5\xdc\xa2\xb9\x17\xe6\xe9\xce\xcb\x9ew<\
+Y5Y\x90|8\x85\x98\x12\x97\xb2?\xe5\x83 B\
+P/\x18O\xe5\xa7nM\x1d\x13\xf2\x84\x9b\x85OE\
+\xbe\xa2\x8d\xa2Q\xb1\xb7\xb8J<\x92\xe6\x9dV\x95\xf6\
+8\xdd;}C\xfah\x86OFu\xc63\x09OR\
++y\x91\x19\x92\xb9#\xf3MVD\xd6\xde\xac\xcf\xd9\
+q\xd9-9\x94\x9c\x94\x9c\xa3R\x0di\x96\xb4+\xd7\
+0\xb7(\xb7Of++\x93\x0d\xe4y\xe6m\xca\x1b\
+\x93\x87\xca\xf7\xe4#\xf9s\xf3\xdb\x15l\x85L\xd1\xa3\
+\xb4R\xaeP\x0e\x16L/\xa8+x[\x18[x\xb8\
+H\xbdHZ\xd43\xdff\xfe\xea\xf9#\x0b\x82\x16|\
+\xbd\x90\xb0P\xb8\xb0\xb3\xd8\xb8xY\xf1\xe0\x22\xbfE\
+\xbb\x16#\x8bS\x17w.1]R\xbadxi\xf0\
+\xd2}\xcbh\xcb\xb2\x96\xfdP\xe2XRU\xf2jy\
+\xdc\xf2\x8eR\x83\xd2\xa5\xa5C+\x82W4\x95\xa9\x94\
+\xc9\xcbn\xae\xf4Z\xb9c\x15a\x95dU\xefj\x97\
+\xd5[V\x7f*\x17\x95_\xacp\xac\xa8\xae\xf8\xb0F\
+\xb8\xe6\xe2WN_\xd5|\xf5ym\xda\xda\xdeJ\xb7\
+\xca\xed\xebH\xeb\xa4\xebn\xac\xf7Y\xbf\xafJ\xbdj\
+A\xd5\xd0\x86\xf0\x0d\xad\x1b\xf1\x8d\xe5\x1b_mJ\xde\
+t\xa1zj\xf5\x8e\xcd\xb4\xcd\xca\xcd\x035a5\xed\
+[\xcc\xb6\xac\xdb\xf2\xa16\xa3\xf6z\x9d\x7f]\xcbV\
+\xfd\xad\xab\xb7\xbe\xd9&\xda\xd6\xbf\xddw{\xf3\x0e\x83\
+\x1d\x15;\xde\xef\x94\xec\xbc\xb5+xWk\xbdE}\
+\xf5n\xd2\xee\x82\xdd\x8f\x1ab\x1b\xba\xbf\xe6~\xdd\xb8\
+GwO\xc5\x9e\x8f{\xa5{\x07\xf6E\xef\xebjt\
+ol\xdc\xaf\xbf\xbf\xb2\x09mR6\x8d\x1eH:p\
+\xe5\x9b\x80o\xda\x9b\xed\x9aw\xb5pZ*\x0e\xc2A\
+\xe5\xc1'\xdf\xa6|{\xe3P\xe8\xa1\xce\xc3\xdc\xc3\xcd\
+\xdf\x99\x7f\xb7\xf5\x08\xebHy+\xd2:\xbfu\xac-\
+\xa3m\xa0=\xa1\xbd\xef\xe8\x8c\xa3\x9d\x1d^\x1dG\xbe\
+\xb7\xff~\xef1\xe3cu\xc75\x8fW\x9e\xa0\x9d(\
+=\xf1\xf9\xe4\x82\x93\xe3\xa7d\xa7\x9e\x9dN?=\xd4\
+\x99\xdcy\xf7L\xfc\x99k]Q]\xbdgC\xcf\x9e\
+?\x17t\xeeL\xb7_\xf7\xc9\xf3\xde\xe7\x8f]\xf0\xbc\
+p\xf4\x22\xf7b\xdb%\xb7K\xad=\xae=G~p\
+\xfd\xe1H\xaf[o\xebe\xf7\xcb\xedW<\xaet\xf4\
+M\xeb;\xd1\xef\xd3\x7f\xfaj\xc0\xd5s\xd7\xf8\xd7.\
+]\x9fy\xbd\xef\xc6\xec\x1b\xb7n&\xdd\x1c\xb8%\xba\
+\xf5\xf8v\xf6\xed\x17w\x0a\xeeL\xdc]z\x8fx\xaf\
+\xfc\xbe\xda\xfd\xea\x07\xfa\x0f\xea\x7f\xb4\xfe\xb1e\xc0m\
+\xe0\xf8`\xc0`\xcf\xc3Y\x0f\xef\x0e\x09\x87\x9e\xfe\x94\
+\xff\xd3\x87\xe1\xd2G\xccG\xd5#F#\x8d\x8f\x9d\x1f\
+\x1f\x1b\x0d\x1a\xbd\xf2d\xce\x93\xe1\xa7\xb2\xa7\x13\xcf\xca\
+~V\xffy\xebs\xab\xe7\xdf\xfd\xe2\xfbK\xcfX\xfc\
+\xd8\xf0\x0b\xf9\x8b\xcf\xbf\xaey\xa9\xf3r\xef\xab\xa9\xaf\
+:\xc7#\xc7\x1f\xbc\xcey=\xf1\xa6\xfc\xad\xce\xdb}\
+\xef\xb8\xef\xba\xdf\xc7\xbd\x1f\x99(\xfc@\xfeP\xf3\xd1\
+\xfac\xc7\xa7\xd0O\xf7>\xe7|\xfe\xfc/\xf7\x84\xf3\
+\xfb-G8\xcf\x00\x00\x00 cHRM\x00\x00z\
+&\x00\x00\x80\x84\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u\
+0\x00\x00\xea`\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ\
+<\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\
+\x13\x01\x00\x9a\x9c\x18\x00\x00\xcc\xb4IDATx\x9c\
+\xcc}u|\x15G\xf7\xf7w\xf7J\xdc]H\x02\x04\
+\x12\xdc\xad\xb8\x17\x8a\x14(Poi)\xd4\xed\xa9\xd1\
+B\xbd\xd4\xdd\xbd\xd0R\xa7\x85\x02\x85Bqw\x97`\
+I\xb0\x90\x10\xf7\xe4\xca\xbc\x7f\xdc\xbb{g\xe7\xce\xec\
+nh\x7f\xcf\xfb\x1c>\x97\xec\x8e\x9c9s\xe6\xd8\xcc\
+\xce\xceJ\x84\x10\x88@\x92$Y\x94\x05\x800\xf70\
+\x91f\x06\x94\xf2\x92A\x9a\x92.\xe9\xe4\xd3eX\x9a\
+\xe9<Q\xfbl>\xaf\xbc\x02M\xed/\x8f\x1e\xbd\xb2\
+n\xf8\xf7\x83\xe57\x8f^\x966\xb3\xfd\xf9\xa7\xc0\xf6\
+\x8fnK\xd4w\xba\x9f\x00\x9f~\xb6<\x8b\x9fWV\
+\xb9\x96\xa9{\x91\x9c\xb1<f\xf1\xe9\xf1\x94\xceS\xd2\
+\xd8\xfe\xc8\xde40\xd7<\x9e\x98\x95)\xb6-\x05\x97\
+\x9e\xecK\x0a\x01z@3\x8a\xae(b K\x10}\
+O3E\xe2\x94\x11\x81\xe4\xa5Sb\xd2\xd8\xbf\xbc2\
+\xa2vxt\xf0\xea\xb2x\xcc\xd2od$\x00}a\
+6\xaa\xc3\xa3Y\x0f/\x8fw\x22\xd0\xa3C\x0f\x8f\x11\
+o\xf4\x94\x9e\xf7\x97W\x86'w\xac\xc1\xa6\xd3X`\
+\x0d\xa6\x9e\x1c\x10\xf0\xe5_\x84O/\xdf\x8c3\x83A\
+:\xab\xd0<\xf9\x16\x19\x22\x9ea\x22\x00`\xd5%\xdf\
+\x9f \x9ee\xa1\x09\xa4\xcb\xb0u\xf4\x84_\xd4\x9eR\
+\xd6\xc8K\xf3\x80\xa5\xd3\xcd\xc9\x17\xd1\xcfz*\xd6\x92\
+\xf2\x84P$\xdc<OD\xe7\xb3t\xb1m\x8a\xda\xe2\
+\x09,{\xcd\xab\xc3\xe25\x02\x91\xa2\x89\xc6@\xcf\xeb\
+\xf3\xea\xeb\xd5\xe3yg\x16\x97\x91\xb7f\x1d\x03\xa8\xb2\
+l?d*M\x14-\xb0<6\x13\xf5\x8axB\xa7\
+\xd3\x91\x80d\x90\xc6\xbb\x97\x05\xf9<P\xf3\x8c\x22\x00\
+\x91\x951R\x06\xb6!V\xa8\xfd\x08ap\xb3\xe0\x06\
+_\xc8\xd84\x11~Z\x10x\x9eF$DzJF\
+\xb7\xc9\x02\xaf.\x0f\xcc\xe0\xe3)+-\x9c\xecx\xd0\
+\xf9\x22Oa\xc6\x80\x8a\x84\x99\xce\xe3\xf5\x8d7\xfe\x80\
+6\x14\xd6kC\x8f\x9f\xec\x8f\xc7/^;,.\x02\
+\xff\xd0\x9b\xe7\xd8X9#\xcc\x8f\x87\x9b\x06\x16\x8f\xcc\
+\xa4\x89p\xb0\x06\x87\xee\x0fOgE\x8e\x99\xa7\x9f\xda\
+\x8a\x97\xb1\x06\xc0\xb3\x80\x22K\xad'<\xac\xa5\xa5\xeb\
++\xe5\x8c\x22\x05\x91\xb0\x89\xf0\xf0\x94\x8dU\x1e\xbd6\
+\xd8<\xe8\xe4\x1b\x81\x996\xf5\x06V\xe4\x89DJ\xc9\
+\xe3\x97\x9e\xd1\x03\xb4J\x02NY\xbd~\xd0\xe5\xe99\
+/\x8f6\x91\x1c\xe8\xf5\x9b.\xc7kS\x84K\x0fx\
+\xbc4#Gl\x1a\xcf[\xb3\xbc\xe7\xf1\xd6h<h\
+\xa0q\xb2\xb8E\xc6\xd1o\xec\x8c\x22\x00#P<\xb3\
+\xc8\x9a) \x12\x16\x9e\xf0\x18y`p\xd2\xf5,\x9e\
+\x1e\x13y\x0cT\xea\x1a\x09\xb6\x11\x98\xad+\x8a\xb2h\
+P<\x87\xe1\x80\x9al\xdb\x8c\xb1\x14\xe1c\x95\xc9\x8c\
+\x91\x16Ev<\x5cnN\x1a\x0fxc-\x12~\x09\
+\xda\xa8\x89\xae\xc3^\x8bp\xd2xD\x91\x0c\x8bCD\
+\xbb^\x98nd\xa4x`\xa4\x07\xa2\xa8\x83\x98Y\x03\
+0\x22L/d\xd2\xeb ;P\xac7\xe6Y8\xba\
+-vuU$\xc4<aP\xfeZ \x1e$\xba\xbc\
+(\xd2\xd0S\x163\xde\x86\xe7\xfd\x94~\x89\xfa \xb2\
+\xfc4\xcfx\x9e\x8c\xb7\xba\xce\xd2\xc3\x13J\xdex\xb0\
+c\xc8^\xb3 RJ\xb6<\xcd\x13Z\x16\x5c\xf0W\
+`\x9e\x91`\xd3\x94t\x9a\xbf\xac\xe2\xf3\xbc'\x8dS\
+\x14)\xb1\x8e\x85G\x8b\x0c~\x1fiZy\xe3%\xca\
+\xa7\xc1M\xe1\x17\x19jCcbf\x0a`\x14*\xea\
+\x85EB\xd4\x0c\x0e\xbdp\xc8l\xbb\xec\x80\x89\x22\x00\
+\x91\xd0\xb0\xcc\xe61UD\x87\x19\x1a\xf4\x80\xa7\x18z\
+m\x19\x19\x1e#\x8fn\xa6-0iz\x8a.J\x13\
+\x8d+o\x9cY\xbe\xb3\x06\x8b\x1e#\xba.\xbbX\xa7\
+\xd4\xe1)\xdf?\x01Q\x1f\xe9\xb6\x954\xda\xe0*\xd7\
+z}\xa0q\xd1rH\xf7A\xe4XDxE<\xd7\
+\xf4\xc1(\x02\xe0\x11B#d;M\xe0\xb3L~\x8d\
+\xe9\xdc\xf3<\x0a\x0b<\xa1\xe1)6M\x0f[\x9f\x87\
+\x9b'\xfcf\x84\x977\x88l;z\x1e\x8f\xc7;\xba\
+}#\xe0\xd1E{<v\x91K$8\xa2kv\xfe\
+*\xf2\xe2\xbc\xf6y\xf4\x1b\x19\x1fQ\x9fE\x8a\xc1\x8e\
+\x91\x9e\xe1\xe6\xb5K\x97\xe1E\x05\x22\x0f\xca\xe3\x03\x8b\
+\x97\xc6)\xe2\x1d[\x8e\xbe\xd6s\xae,\xb0\xd1\x8d\xde\
+X\xf89M\xb3k\x00,\xe1\xec*3\xdb9\x11c\
+y\xde\x97%^\xaf\xbc\x08$h\xcb\xf3\x06\x91\xe7=\
+\xe9\xfa4\xd0\xc2\xc4\xe2f\xcb\xeb\x0d\x8e^\x1fxF\
+\x8a5\x0a\x80v\x80i\xbe\xb3\xb8\x94|\x9e\xf0\xb2m\
+\xf1x\xa0\xc7c\x91\x00\xeb\xd5\xe1)\x10\xcf\xa8\xb2\xed\
+H\xcc\xb5H\xa0y\x0eId\xd0x\x8e\x86nS\x0f\
+7t\xd2DF\x8d\xa5\x07\xf0\xef\x1b\x0f\x0f\x8fg,\
+?Dt\xe9E'B0\xfb\x18\x90F\xc86L\xdf\
+\x1bYaQ'\xf4\xd2\x94\xbfn&\xcf\x88\x19M\x0d\
+\xff\xf4\x0c\x90\xa8\x0c\x0f\x07\xfd\x97g\x14yJ.\xf2\
+6zm\xb0i\x97\x13E\xf0\xca\xb1^\x96\xd7\x8er\
+M\x8f9O!i\xfcf\x8c\x87\x12A\xb2\xf8\xe9\xb6\
+\xcd\xc8\x96\x9e\x81\xe6\x8d\xb1\x9e\x97dq\xd3Q\x96H\
+\xf9\x944\xfa\xc7kG$\xc7,\xed4\x1e\x96\x1e\xba\
+}3\xd1\xb3F\xe6\x8c\xd6\x00,\x06\x88\xe9<\x9eU\
+\xa5\x99%\xc2\xa3\xe7\xa1\x15A\x14\x85\x9e\xbcz\xf4\xc0\
+\x88<\x02O\x91\xcdD\x07\xa2\xfc\xcb56f\x0c\x8a\
+\x99P\xb6\xa9i\x22|\xa2g\xf5,\xffhh\x8a\xf1\
+\x12\xb5K\xe3\xa2\x15\x835\xfa\xa2v\xf5\xbc\x1d\xdd\x7f\
+\x9a\xe7\xa2EE^y\x1a\x0f\xab\x94z\x11\x84^\x04\
+\xc3\xd2kd\x84h\xc3\xacW\x86M\xe3\xa5\xab\xf7M\
+\xd9\x07 j\x88~\xc6\xcbv\xc8LX\xc2Z5\x97\
+\xf7\xaf\xcc)\xc3%\x93SF\xcf@\xb0\xf9<\xfcz\
+J\xcf\x1bd\x1e\xb0\xed\x89\xe6\xd4\xa2v\x01\x7f\x85\x14\
+\xd5\x15)\xb9\x9e\x0162.Jy\x9e\x82\xf3\x94\x85\
+\xad\xc7\x13^\x85\x16\xd6\x9b\xb1\xf5\xd9\xc7dFF\x8d\
+g4\xe8{\x9e\xf2\xf2x\x22\xf2\xb0\xec\xd4\x85up\
+4]\xbc<V\x96E\xfc\x13)\xaa(\x8d\xce3S\
+\x17`\xe4\xd0\xcc\x1a\x00/L\xa1\xefeh\x1fG\x88\
+B'\x1e\xf0\x84\xcb\x8cW\x04U\x867\x10\xe0\x94\xd1\
+K\x17\x85H\xa2\xb6\x8d\x80\x15$\xde \x8b\xea\x19E\
+If\xdaS\xd2\x8c\x04\xc9hl%\xf8\xe3\x14y|\
+V\xf0\xf5\x04U\xcf\xc3\x01\xfe+\xfb\x04b\xde\x18\xf1\
+Vi\x83\xde\x09\xaa\x18\x06\xb6/<\x05\x16\xf1\x96\xa6\
+S$\xe7\xbc\xf1\xe7\xd1.\xe2\x89\x11\x0eV\xf1E\xba\
+'t~f^\x06b\xefy\x03\xa1\xe7%\xe9N\xb2\
+[z\xd9\x10N\xb9\xa6\xbd\x04o\xa0X\xe1\x15\xd1\xc9\
+\x82HAX\x1ax`40zBJ\x97\xa7\x05L\
+4\xb8.\x86>\x85\x07\xec{\x03f\xe8fW\xcc\x15\
+ZE|P\xd2\xf4\x94\x9dmW\xcf\xa8\xf1\xf0\xf2\x8c\
+\xb8\xa8\x0d^\xfb\xac\x5cH\xd0\xf2\x87\xf5\xfel\xbeQ\
+\xf4&Rt0\xe9tY\xba\x0d^\xff\xdc\xf0\x1f\x03\
+\x16\x17\x8b\x93\xd7\x9e\xa8]Qy\xd1\x94\x81\x00\x90\x8c\
+\x1e\x03\x8a\xbc\xb3(\x84\x12m\xf9l\x8aG\xa4\xcb\xf2\
+\xca\xb1\x0a\xc7\xee\x8bg\xafY\xbaY\xa1\x12\x85Nt\
+\xd8H\x98k\x11}\xbc6\x8d\x80'\x08\xbc\x90\x8eG\
+#[\xde\x8c\xa7g\xfb\xc1\xb6\xc3{\x01\x85g\x0cD\
+^\x85\xc7\x17\xb6M:\x8f7\x1ez}\x87A\x1a\x9b\
+\xce[G\xe0)(\xfb\xe8\x94G/\xcf\x88\xb2\xc6\x95\
+n\xab)r\xc3\x1bC\xc0X\x0e\xf4\x9c\xa0h\x5c\xd4\
+t\xb3k\x00\xb4p\xe8y^3\xc0\x13D\x9aQ<\
+\x8b\xc5c$\xddA^t\xc0\xb6\xc9\x0a1\x8f!<\
+\xcf\xcc\x0e\x8c\x0c\x7fZx\xa0\xe7=y\xf9F\xb4\x98\
+\xc1\xc9\xe26S^\xcfX\x82I\xe7\xd5\xe1\x09\xa1\x19\
+\x1a\x15\xe0m\x8b\xe5\x8d\x01o\x87\xa4\xc8(\xf0\x1c\x87\
+\x88&E\xf9\x8d\x14\x95'C\xf4\x9e\x17=0\xd2\x13\
+#\x85\xd6\xd37\x11O\x8c\xc6\x08\x80\xf1F\xa0\xa6\x0c\
+$K\x0c\xef\x9a\xbd\xa7\xc3%\xfauF\xe5\x9e\xd71\
+#\xaf z\xe1\x84\x15(6\x8f\xc5\xc9[\xf812\
+|l]6\x8f\xee/}O\xffh\xfcz\xfc\xe7\x19\
+C\xb6<\xbb\xc5\x98MS\x80\xe5\x0f\x8d\x9f\xb7\x09\x0c\
+\x10\x0b#[\x8e\xb7\xdaN\x97W</\xcbg\x91\xf7\
+dq\xf1\x0c\xba\x1e]zi\xbcH\x87\xcdc\x171\
+E\xc6V\x0f\x17\xdd\xbe\x91\xa1\x17\x19b=\x07\xc8+\
+\xc75\x12M\xd9\x08$\xea {\xad\x17\xce\xd0e\xd9\
+\xf2\xe0\xd4S\x94D$tF\xc2\xc82H$ l\
+\x9b\x22zE}f\xf3Dxx\x03\xc5\xbb\x17\xe5\xb1\
+J\xcf\x02K\x83\xc83\xe8\x8d\x0d\x8bGO\xd1Y\x9c\
+\xbc2\xbc6\x95\xb1a\xd7\x84xm\xb3\xe3\xc2\x1bW\
+\x1e]\xaccQ\xf0\xf1\xae\xe9\xb5\x01\x11N\xfa\x9a6\
+nzc\xca\x1av\x1e\x0e3\x1e\x9f\xd5?\xf6\x9a\xad\
+\xcbk\x8f\xab\x97f\xa6\x00tg\xf5\xe6:l\xe3\xac\
+'\x17yV\x1e\xd0m\xd2\x16\x8c7@zVVT\
+\xc6H\x91Xoh4Xt\xdf\xd8A\x12\xd1.j\
+\xd7\xc8\xfb\x9b\xf5~z\xc2l\xa6?\x22#\xcd\xe3\x89\
+\x1e\xcd,n\x9ew\xa3\xd3\xf5\xfa\x22\xf2n\xec5\x0d\
+\xa2q\x14)\x1cO\xbe\x14`\xe5Q\x8f'\x8a\x81\x13\
+\x8d\xb9\x91S\xe2\xd1-zt)\x09\xca\x18F\x14f\
+\xdf\x06\xe4\x09\x12\xcb,\xbd\x0d\x0a`\xca\xf1\xca\xe81\
+_\xa4\xfc<|b\x8b\xe6\xdf\x96\xc8\xf2\xf3\x94\x8cG\
+'\xcf\xb0\xb0eE\xf7F\xca\xc2\xb6G\xf7\xd1\xe8\xd0\
+\x0b\xa5\x9c^\x18i\xc4o\xba\x1c\x8bC\xe4\xedy\xe3\
+\xca\xb6%2\x18,O\xd9vE\xed\xeb\xd1\xa5\x97\xc6\
+zP\x91Q\xe2\x81\x99q\x12\x19\x0a\xde\xb8\xf0\xca\xf1\
+\x0c\xa7\x91S\xe1\xd5\xd5\xa3\xd90\x02`-\xb2h\x81\
+\x8e\xbdV\xee\x85\x0d\x0b\x083\x13\x0e\xd14\x99\xf1(\
+\xbcvh0\xa2\x9bf6\x1b\xcd\x00\xe6\x0e\xb1d=\
+\x9c^$\xc5\xa3G\xe4\xa1\x15\xe0\x19\x22\x9e\x910\x8a\
+\x0a\xf4\x0c\xd4?1^J\x1d=\xa5\xd0\xa3\xf1\x9f\x80\
+\x19\xfcz\xc6\xf0r\xa26=\x99\xe7\x19\x96\xa6\x8c\xbd\
+2N\xec.]^9V\xde\xfcxn\xb4\x06@o\
+\x9e\xe0-~\xf0\xeeYbX\xd0\xb3\xd8zB(\x12\
+\x0a\xb6\x8c\xc8\x93\xeb\xe5\xb3i\xac\xa5U\xfa\xaf\x94u\
+3\xe5x\xc6\x89\x06\x11o$\xf8\xf7\x99\xbe\x17\x19'\
+\xb6\xae\x9e@\xf3\xea\xb0e\xd9g\xeazF\x82\xad\xab\
+\xd4g\x81n\x9f\xa6\xb5)^\xda\xa8\x8c\x08\xf4\xfa\xcf\
+\x03\xa3\xc8\x8d\x87\x97\xad\xafg\xb4xr&\x02Q\xe4\
+\xc6\xf2\x93\xddW\xd0\x14\xa3\xa9\x965\x9a\x02(\x8f9\
+XA5\xea\xb0^\xf8\xa4\xe7\x1d\x8d\x18\xc5\xd6\xe5Y\
+M\x96>#\xa3\xc4\xae@+iF\x11\x04\xcf\x90\xf1\
+\x14\xc7\x8cw\xe0\x85xz\xfc\xe5\xcd-E\x86\x8f\xf7\
+>\x07/\xa2\xa0\xf1\xf0\xa2\x14\xba/MQF\x11\x18\
+\xc9\x07\x8f_f<+\xcf0\xf2\xe4\xc5H~\x95\xf2\
+\xbc\xc8\xcf\x8c\xd1e\xf7\x14\x88\xe4\x9e\xa5\x9fn_\x0f\
+\xbf\x19\xe7\xc3\xca\xb6\x1fO\xcc>\xc3d\x19*\xc1\x1f\
+\xb1\xc8\xea\x8ap\xb28D\xe5\x8c\xe82SO\xa4t\
+\xec\x80\x8a\x8e\xa3\xa2\xbd\xa4\x9e\xf0\xe8\xd1D\xb7C\xdf\
+\x8b\xf6\xe9\x8b\xca+\xe5\x8c\xf6d\xf0\x8c#\xcbw=\
+:YZ\x00\xb1\xbc\xe8\x19>\xd6q\xf0@\xf4\xa8P\
+D\x87\x1e.\x16\x1f\x8f\x0e@;\x9e\xbc|\x1ax<\
+\x14\xc9\x89\x1e\x0e\xb3\x86\xf3r\x0c,\xcf\xb0\x88\xc6E\
+\xa5\xd7\xcc>\x00\x16\x99\xc8\xbb\xf3\xf6o\xb3\xf5\x00\xcf\
+6W\x1eqt\x9aHP\xcdZoEa%A\x1d\
+\x91g\xd6\xf3\xd8\xa2\xd7?Y\xcb\xcbS^\xbdk\x9e\
+\x05o\x8a\xa0\xf0\xea\x89\x0c\xab\x88\x07\x0a.\xd1\x8b:\
+\x22O\xc5\xde\xb3|6:\x95\x87\x8e\xb8h:\xd8:\
+\xa2~\x88\xc6\xce\x0c\xff$\x0e}\xbcH\x8c\xc6g\xe4\
+\x99y\x9b\x95X\x9ayy\x22\xe3\xcf\xd6\xe79\x04^\
+{\x22=a\xfb'7\xe5e VXD\x88\x8d,\
+\xa0\x04mX*\xb2\xf2\x22f\xb3t\xb1\xc0n\xae\x01\
+\xf8\xa7\xa6\x88\xe8\x13\x1d\xc0\xa9\xe7\x8dX\xcf\xc2>]\
+\xd0+\xaf'h\x22~\xf2\xbc\x8fH\xe9E\x06\x86g\
+\xf0xsJ=af\xef\xf56\xfd\xb0\xe5yFK\
+\xcf)\xb0<a\xfba\xb4\x0e\xa1\x00o\xac\xf4\x8c?\
+\xab\xe0z2{9\x11\x12/\x9f\xa5\x81\xf7\x97\xa7+\
+\xbc\xb2\xf4\xcf\xef\x11\xfc\xe5\x1c\x0a*\xb2\xce,\xb3x\
+\xdeF\xcf\x88\xd0i\xf4\x82\x9b\x9euc\xdbd\xd3y\
+ \x12\x14e\x9f\x03\x1bZ\xf3<\xb7\x08\xf4\x06E\xcf\
+\xf0\x88\xd2x\xc6\x97G\x13\xcf\x13\xf0\x84\x9e\xa5\x8f\xf5\
+XF\x91\x15{OGZf\x807fFt\xb2}\
+\xb3\xc0\x9f\xa7\x22\x05\xe6\xe15\x1a\x0fQ\x1ek\xa0\x8c\
+d\x99\xd7\x07Q[<Zy\xf4\xf0x\xce[\xe17\
+\x03\x12`n\x0d\xa0\xc9HM\xa4\xe9\x85\x90\xbc\xb2z\
+\x0a@\x971b\x02\xabX\xec\x02\xa7\x91\xa7f\xa3\x1c\
+\x91\xc2\xf3\xa2!QD\xc1\xe2\xe0))/\x8f\xadk\
+\x86~\x1a\x8f\x19\xa5\xe7\xe1\x12ymZHY\x1aE\
+\xe3btT7[\xd7H\x89x\xfd22j\xa2\xcf\
+\xce\xf1\xeey\xceC\x14\xe5\x89\x0c\x06\xcb'\x9eA\xe4\
+9O\x91n\xf1\xca\xf3h\xe3\xd1h\xeaPP\x1e2\
+\x9e\xc2\xe9\x0d\x10Oi\xf4\x06\x86\xe7\xd1\xd8<\x1a\x07\
+M\x9bh\xcf\xbbhM\x80\x8d\x18\x8c<5ap\x8b\
+\x22\x143\x11\x03\xaf>\x8f&\xa5\x1cw\x10\x05m\xe9\
+yS\x05\xd8\x97\xbd\xccDh\x0a\x8fE\xca.\xc2\xc7\
+*\xa7\xd1=\x0bl\x19\x1e\x8d\xac<\xb0<c\xa3\x05\
+\x11ox|\xe79)=\xcfo6b\xd4\x8bBX\
+0r<f\xeah\xfa\xd8\xd4\x13\x81\x9a\xb2\x8d\x97%\
+\x10\x10\x7f\x10Ad\x5cx\x16\x94\xad\x03\xf8\x0f\xa8\xe8\
+$\x1d##\xc6\xd2\xdb\x94\x10\x91G\x9b\x9e\x90\xf1\xf0\
+\x19\xe1\xe5)\x09\xcf\xcb\x8b\xda2\x12X\xb3\xc0\xa3\x81\
+g\x0c\x8c\xfa\xc2+\xc3\xeb\x8f\x912\xb1\xb2\xc0n\xce\
+b\x0fK\x15\xf1\xd0\x8cA0RZ=\x83.\x02^\
+T\xc0\xd6\x13\xc9\xa5\xd9\xf1cq\x11\xc0\xdc\x99\x80\xac\
+'\x12YT\x1eq\xbc\x86\xf5\xca\xe8y\x01\x96\x89z\
+\x1eOd\xa5i\xda\xf5\xe6\xbf\x22\x1a\xd8Aj\xca\x80\
+7E\x19i\xfa\xf4\xda\xa0q\xb1\xe3`\xc6\xbb\x98\xa1\
+\x9d\x1e\x1b#\x9a\xcc\x18\x02\x9eWf\xcb\x88>\xa8\xa1\
+\xa7 FgG\x82\x93\xa7\xc77\xb3\x8a\xc5:\x15=\
+\xc3lf\x1cy\xf9\x97SO\xaf\x8cJ\xab\x99\x8d@\
+\x9a\x0a\x1c\x84\xac\x12\xe9)\xa6\x888\xb6\x0d^;\xca\
+`\xf1^O\x15)?\x8f>\x05.\xe7\xc3\x11\xec@\
+\x1a\x1d \xf1O\x80\xc7K3J\xadW\x9e0\x7f\x8d\
+\xca\xebEo<\x83\xc0\xe3\xa9\x9bIg\xfb\xc5\x93-\
+\x9a^Q\xd9\xa6F\x0ez\xcaE\xe3\x139\x0f\x91\xd1\
+\xe1\xb5\xc3\x1a8\x1e]<\xbc\xbc\x08\x846R\xac\xe3\
+e\xfb\xc2\xe2\x16-\xd0\xaae\x9a\xfayp\x1a\x81\x9e\
+\xa2\xf1\xea\xe9\xe5\xb1\xe5Xc\xc0\x1a\x22\xba\x9c\x1e\x1e\
+\xa5\x0e\x8fq\xbc\x90\x88\xa5\xcf(*\xa1\xc1\xccj\xb8\
+\x19\x0f\xc9\x963\x8a$\x944v\x81\x8a\xab\xe4V\x8b\
+\x8c\x90\xa0`@\x22 \x92\x0c\x8bl\x81\xa3\xa1\x01\xd5\
+uu\x00@$I\x02!\x04\x81\xf6@48\x1a\x08\
+\x13!\x12I\x92\x944\x9e\x81\xe2\x01\xaf\x7f\xbc\xdd\x97\
+l>\xdd\x0f=e\x12\xd532\xca\x0a^\xd1B\xb8\
+\x9e1g\xe9\xe1\x9d\x80e\x867\xa2:\xac\xd3\xa3\xdb\
+\xe4\xd1\xc2\x8bd\xf4\xea\xa8m\x981\x00z^Y\xaf\
+!\xbd0\x9ag1\x95\xb2\x04>\x01\xe1\xcd\xe5E\xaf\
+X\x8a\xbc\x9d\xc8k\xf0,,km\xd9\xf6\xd8p\x8f\
+\xee\x9f\x91b\xb3\x86K\xd72s\xca\xb3\xe5\x84\x02j\
+\x91eXl6[DTd`LttP]u\
+U\x88$K!\x11a\x11\x81i\xcdR\x02\x22#\x22\
+\xacD\x96dI\xb6J\x16X\x88\xa3\xbe\xce}\xfaL\
+\xbe\x03\x848\xecv[\xdd\xa9\xbc3u\x91\x91\x915\
+\x8d\xf5u\xf5\xe7\xce\x17\xd4\xd67\xd47\xba\xdd\x1e\xdd\
+\x0a\x0e\x0eBph\x08.\x15^\x12\xd1\xca\xfbT\x97\
+\x9eB\xb0\x9e\xd7\x8cQ\xd7+'\x92+\x1e\x0eQ4\
+!Jc\xf1\xeb\xdd\xf3\x9c\x16\x0d\xbc\xfe\xb2|b\xef\
+\xd9\xafn\x89dZ\xb4K\xd4\x8f\x16\xb3\x8b\x80FV\
+\x98\xa7lz\xa0\x87\x8f5\x02t;,\x0e\x11\x0d\xca\
+\xbd\x9eU\xd4\x1b\x00\x9e\xa1\xe1\xd1J\xd7\xe1\x0d\x04\xcf\
+\xa2\xb3m\x1a\x01\x01\x00\x9b\xcd\x0a\xa7\xd3\x05e\xbc$\
+\x09HKL\x0a\xcfh\x9d\x1d\x1d\x12\x1e\x16\x0b\x973\
+#33\xb3E\xf3\xf4\xf4\xf4\x94\xd4\xd4\xd4\xd8\x84\xf8\
+\xc4\xc8\xe8\xa8\xf0\x90\x80\xc0\xa0\x90\xb0\xd0\xe0\x80\xc0@\
+\x9bU\xb2X\x9c\x8eF\xd9\xe5r\xc9D\xb6@\x22\x90\
+@\x08 \xc1m\x0f\xb4\xbb\x89\xd3Ej\xeb\xea\x9c\x92\
+dq\xd6\xd4\xd4\xd4\xd7\xd7\xd76TUUW\x96\x96\
+\x95\x96\x96\x94\x96\x96^8\x7f\xa1\xa0\xe8R\xe1\xd9\xb3\
+\xf9g\xf2]N\xe7\x99\x8a\xaa\xea\xa2\xbc\xdc\xdc\x8a\xf3\
+g\xcfU8\x5cN\xd5\xfbJ\x92\x04I\x92\xe05\x1a\
+z\x86\x91\x17\xdd\x89\xf8fJ\xa09<fe\x92'\
+'\xbc2f\xda2\x02\x91\x112{\xb4\x9e\x91\xa3\xd5\
+3Rfh5\x5c\x04\x14y~\xb3\x8c2\x0a\xddD\
+\xe1\x0bO\x11\xcdx\x10\xbd\xb3\x01\xcc\x84\xd5\x22:D\
+\x02\xcb\xbb\xe7\xf5\xc7\x8c\x97\xa1\xeb\xfaAph\xb0e\
+\xc8\xc0\xc1-$\xab\xb5y\x5cll\xab\x8e\xed\xda\xb6\
+o\xdb\xb6]\x87\xe6\x99\x99\xad\x92\x92\x93\xe3B\x82\x82\
+\x9abT\xfe1\xd4\xd4\xd4\xa0\xe0\xe2\xc5\xe2\xf3\xe7\xce\
+\xe5\x9f>}\xea\xf8\x89\xe3'\x8e\xe6\x1c;\x9aCd\
+k^\xe1\x85sg\xb7\xef\xd8Q\xe0r\x0be\x8b\xf7\
+t\xc9\xcc\x18\x18}`\x86g\x0c\xcc(>\x0c\xca\xb0\
+y\x0a\xcdz\xf4\x18\xe1\xa1\xf3y\xed\x1b\xe1\xe4\xd5\xa3\
+\xeb\x1a9B\x02\x13\x06\xc0\xe8\x83\x12z\x16\xccL\x14\
+\xc0\x96\xa5\xd3x\x0bJzm\xb3\x9d\xd6\xfb\xb2\xaa\xc8\
+\xda\xd3\x0aM\xe7\xb1\x06\x09\x9c{\x85f\xa5\x1eO`\
+Y\xfai\xfc\x04\x00,\x16\x0b\xae\x1c=\x1a\xeb\xd7\xae\
+\x85DH\xda\xd8\xf1c\xfbt\xec\xd8\xa9]zzF\
+\xa7N\x9d:\xf5\xcc\xce\xceN\xf4\xd8\xe5\xffM(\xaf\
+\xa8t\x1d=r\xe8\xf8\xf1c\xc7\xf6\x9f\xce\xcb=\xb4\
+\xff\xc0\x81C\xeb\xd7\xad\xdbY^^yA\x92e\x10\
+\xb7f\xa9\x82\xde\x84\xc3\x8e#\xcds#o&\x12v\
+\xde\xb5\x19\xa3\xcb{'\x82\xa7\xc4\xbc\xb7\x04Et\xd1\
+\xf7<\x10\xd1jv\xb0E\x86E\xa4\x1f\x00 7\xf5\
+1\xa0\x82@\xef\xe0N\xa3\xce\xea\x19\x0b^\x87\xf5\xc2\
+k=\x8b/j\x8b\xa5\x8d5\x00J\x1d\xde\x9e\x07\x91\
+p\xd1m\xe9\x0d\x18O\xd8\x01\x00#G\x8eDEe\
+9\x8a\x8a.\xb5\xfd\xee\xbb\xef\xc776\xd6w\x8b\x8e\
+\x8e\xee\xde\xa1}\x87t\x1d|\x97\x07\x84\xc0M\x08*\
++\xcaQ_W\x8b\xa0\xe0\x10DDF\xfd\xeb\xcd\x00\
+\x80\xc3\xe9$\xc7s\x8e\x9d\xcc9\x91s\xf0\xc0\xc1\xa3\
+\xbb\x16\xfe\xf2\xcb\x8aC\x07\x0f\xec\xe5\x14\xe5\xcdmi\
+yc7_\xf1\x0c\xb3HQ\x15\x10EbzG\xa1\
+\xd3\xe9<]\x00\xc4\xed\xf1\xf2E2\xa3g\x00\x8c\x1c\
+\xae^\x94C\xb7\xc5\xe2o\xd2\xa7\xc1X\xa2E\x0d\x1b\
+yv\x11\xe1\x22&\xb3\x0c\xe3\x19\x80\xa6x\x7f\xb6\x1f\
+z\xc6\x87\xc5\xc1\xe2e\x0dGS\xd2<\x08e\x19=\
+{\xf5j=\xeb\x89\xa7\xaei\xdb&k\xa4\x8b\xb8:\
+\xa4\xa4\xa4F\x85\x86\x84\xa0)@\x08AMUu]\
+Yii\xe9\x85\xc2\x8bEg\xcf\x9f=_p\xe1\xfc\
+\x85KEE\x85\xa5\xa5\xc5\xa5\x95\x15e\x15\xe5\xe5\x15\
+U5U\xd5\x155\xb5\xf5uU\xb5\xf5\xce\xbe\xbdz\
+\xbb\x9b5k\x86s\xe7\xcfJ;v\xed\xb2FEF\
+\xdb\x83\xed\xf6\xa0\xd0\xf0\x90\xf0\x88\x88\xa8\xf0\x98\x98\x98\
+\xa8\xf8\xa4\xc4\xd8\x84\xa4\xa4\xf8\xb8\xd8\xb8\x84\xa0\xc0\xe0\
+\xf8\x88\x88\x88\xf8\x94\xe4\xe4\xe8\xc8\xa8\xa8\xa0\xcb\x09D\
+JKK+\xf6\x1f8xh\xf9\x8a\x15\xab\xff\x5c\xf6\
+\xc7\xaf\xc7\x8e\xe6\x1ct\xb9\x5ct\x11\x89\xf9\x0b\xf0\x95\
+Z\xa4\x18F\x0e\xa0)^\x95\x07l\x9bfd\xbc)\
+\x91\x01\x1d=\x8a\xfagfC\x9eQ\x1b@\x13\x0c\x80\
+\xde\x01\x14\xac\xa5\x12\x85\xb9<\xcbjD\xb8\x91\x875\
+cxhc\xe1\x06\x80\xfe\xfd\xfb\xe3\xec\xd9\xb3\xc8\xcb\
+\xcb\x03\xc4\x1f1a\xdb\xe7\x19\x1c\xdaC\x89\x06\xc3O\
+\xe9{\xf4\xe8\x8e+\xaf\x1c\x95v\xe2\xd4\x89\xe17\x5c\
+w\xc3MW\x5c\xd1\xb7w``@@`` d\
+\xef\x0b\x9a.\xb7\x0b\xb2$\x83\x0d\xf7kk\xebp\xb1\
+\xa0\xa0\xba\xa1\xb1\xe1\xe2\x85\x0b\x05\xe7srrN\xe6\
+\xe4\x1c;\x9es\xe2\xd8\xf1\xfc\xdc\xdc\xbc\xa2\xc2K\x17\
+\xab\xab*\xab\x1d.w\x03!p\x08h\x02\x00\xa4\xa6\
+\xa6\xa0Ez\x06\x0e\x1c<\x88\xf2\xcaJH\x12@\x08\
+`\x91%\x04\x06\xdaa\xb7\x07 &6\x0e\x8d\xceF\
+\x8c\xbdj\x9c|\xe6L^\xe0\xf1\xe39aqq\xf1\
+\x89\xf6\x80\xa0\xe6\x1d:v\xccn\xd7\xaeM\xbb\xec\xec\
+\xd6\x99\xa9)i\xc9\x89\x09\x89\x89AAAv\xbd6\
+i\xa8\xa9\xadi\x5c\xbdf\xf5\x96U\xcbW|\xbf\xff\
+\xe0\xfe?7n\xdcr\xdef\xb5!55\x15\xb9y\
+\xb94\xff\xd8kv\xdcYy4*\x03\xe6^\xe4i\
+\x8d@\xe4\xb9\xe9\xf6\xe9rl\x19\x9e\xc31\x92s=\
+\x10\xe9\x8cp\xcf\x8b\xd9S\x81y^\x95\x0d\xbdD\xe1\
+\x97H\x89X\xc2\x15\x10\xbdR\xca\xeb\xbc\x9e\x07\xd0D\
+\x11v\xbb\xdd-Y\x08i\xa8s\xc4\xae]\xbd\xa6\xdb\
+\xa6-[\x1cs\xe6\xcc\xde\xd923\xb3\xea\xd4\xc9\x93\
+\xec\xeb\xc9\xec\xe0\xb1\xc6\x8b\xed\x93h\x87\x9c\xa6\xaf\xb2\
+$\x05\x0e\x1e4\xb0\xff\xd4\xa9S'\x8f\x9d0\xf1\xda\
+\xc4\xf8\xf80:\xdf\x017$\x00V\xc6&\x95\x97\x97\
+W\x1f9t\xe4\xc8\xd1\xe3\xc7\x0f\x95\x95\x15\x1f8r\
+\xe8\xd0\xbe\x85\x8b\x16\x1e\xac,\xaf.\xe5\xf0\xc4\x0f$\
+\xcf\x1bt\xb2\xe4\xa5\x87x\xf4\x9c\x00p+\xcf\xfd\x8d\
+\xa0m\xbb\xb6HJL\xc4\xfa\xf5\xeb\xe1r\xb9\xfd\xea\
+\x84\xc7\x846\xeb\xd5\xeb\x8an}z\xf4\xe9\xde\xbec\
+\xbb\xb6\xad3\xb3\xb2\xb2\xb2Zg\x05\x06\x04Z\x04(\
+5\x90\x97\x9fW\xfa\xf5W_\x7f\x9b\x9f\x9f\xff\xf3\xd1\
+\xa3G\xb6UWW\xbb\xcb\xca\xcaPPp\x91\xe9\x8a\
+\xd0\xe3\xf2\x1c\x8d\x08\xf4\x9c\x85r-\xfaz0K\x8f\
+\x9ew7\x1bm\x88\x0cDS\xea\xb1@+?M\x0f\
+M\xa3't\x14\xfd\xe0c\xa8\x04\xdf\x82\x8d\xcc\x5c[\
+\xa846\x8f\xfd #[\xceB\xe5Y\xa8\x1f\x0f\x0f\
+\x8b\xcf\xa8-:\x1d\x00p\xed\x0d\x93\xbb\xed\xdc\xbem\
+\x7fMM\x1d\xa9\xa9\xa9!\xdb\xb7n\xfbs\xc2\x84\x09\
+\xc9\x14S\xd8\xb6hF\xd3\xc2\xc5\xb6\xe3G\x93\xe2\xb9\
+%IBLlL\xdc\xfd\x0f\xde\x7f\xcf\x96\x8d\x1b7\
+\x12\x13\xd0\xd0\xd0H6o\xdc\x90\xfb\xe9\xa7\x9f|q\
+\xf7=\xf7\xdc\xdd\xb9k\x97\xde\x00\x02\xedv;n\xba\
+\xe9&\xdc}\xf7]\xe0\x80\xc2O\xab\x04\xd8%\x09v\
+I\x82U\x06,\x12\xc0\x8d\xd6#BC\xf1\xd3\x8f?\
+c\xde\xfc\xef\xd0\xb1c\x07$$$\xa0_\xbf\xfej\
+~pP\x10\x12\x13\x13 y\x1a\xf7\x8bF(~\xf8\
+\x81-\xc0\x1e3p\xe8\x90Q\x8f>\xf1\xd8\xac\x1f\x7f\
+\xfe~\xe1\xc5\xa2\xc2\x123}\xaf,\xaf \xdf\xcd\xff\
+n\xc5\xbcy\xf3n\x19<dP\xc4\xa0A\x83`\x0f\
+\xf0\x0b*D\xfc756:uy\xf8\xe9\x85J=\
+\x1ct>]\x87G\x07/]\xd4\xae\x91|\x9b\xadC\
+\xb7\xab\xea\x8d\x99\xc7\x80\x0a(VQ\xb1:l\x14\xa0\
+0\x80}S\xcc\x8c\xe7\x06uO\xe3\xd6xqN\xbb\
+\xacU\xe3uF\x02\xe0\xb6\xd8,Q\x9b6n\xda\xd4\
+\xbbW\xef\xb6t\xe6\xa7\x9f~\xfa\xcb\x9dw\xde9\x85\
+\xa2\x9f\xa5Sd\x91Y\xcf\xa1XLB\x00\xdc1c\
+\x06v\xec\xdc\x19?~\xcc\xd8\xfb\xa7O\x9f~]\xb3\
+\xb4f-884\x90s\xe4\xe8\x99\xcf>\xff\xfc\x17\
+7\xb0\xba[\x97N\xfb\x1fz\xf4\xa1\x0b\xc5Ee~\
+\xe5233\xd1\xa2E\x06v\xee\xdc\x8d\xb22\xff|\
+\xb3p\xe3\x0d7\xe2\xb1\xc7\x9f@\xfe\x993p9\x1d\
+(**\x82\xd5j\xc3\x91#\x87QRR\x8c\x8a\x8a\
+\x0a\x14_\xba\x88c\x87\x8e\xa2\xb1\xa1\x11\xe5\xb55,\
+\x0a\x19\x80\x0d>\xbe\xbb\xa9\x9f\xa6\x5cRFJ\xab\xde\
+=zv\x1e1b\xe4\x95\xe3F\x8f\x1d\x97\x9c\x9c\x1c\
+M\x17p\xb9\xdcp\xc1\x0d\x9b\xc5\x0a\x09@q\xf1%\
+\x14\x17\x97\xe4\x1c?y\xea\xdb\xbd\xbbw}\x92\x97\x9b\
+_\xf2\xcd\xbc\xaf!\xcb2\xdcn\xb7h<x\x8fd\
+\xe9\xbf\x80\xd8c\xd2y\xb4,\x89\xe6\xe2`\xca\xf2\x22\
+C@\xdc6\x9b\xa6\xe7\xf9\x8dp\x99\xa9\xc3\x8d\x96\x9b\
+j\x00\xd8\xc6\xd9{\xd1\x9eoQ\xb8\xc6\x82\xd9\xb9\x8e\
+\x92/z\xa1\x87\xbew\x03\xc0\x80\xfe\xfd\x87\xaf\xdf\xb0\
+a%\xe0Y\x99\x86,I6\xd9\x823\xe7\xce^\xe8\
+\xd3\xaf\xcf\xd0\x0b\xf9\xe7\x8fqp\xf0\xaeE\xf4\xb8\x01\
+`\xfc\xd5\xe3\xd1\xa2e\xf3fi\xa9\x19\x0fM\xbb\xf5\
+\xb6\x9b\x22\x22Cc\xf5\xaa\x96\x96\x94U,\xffs\xe9\
+_\xf3\xbf\x9b?\xffx\xce\x89\xady\xf9\xf9\xa5QQ\
+\xd1\xe8\xdf\xbf\x1f\xfe\xfak\x05\x1a\x1a\x1a=\x0dx\x87\
+\x82\x10\x02\x8bE\xc6\xf3\xcf?\x8f\xcc\xcc,\xbc\xf9\xe6\
+\x1b\xd8\xb1c;\x00   \xc0\x9a\x96\xda,,$\
+8,\x02nGBjj\xb3\xc4\x84\xf8\xf8\xf8\x98\xa8\
+\xe8\xe8\xb0\xa8\x88\xc8\x90\xb0\xb0\xb0\xa0\xc0\xc0\x00\xab\xcd\
+fw\xbb!\xc5\xc7\xc7!$,\x1c\xd5\xb5\xd5.\x8b\
+$;]\xc4\xddX^ZV\xebr9jKK\xcb\
+*/\x5c\xbcX~\xf1l~IA\xc1\x85\xc2\xc6F\
+\xe7\xa5\xca\x9a\x9a\x8a\x8b\x17/\xd6VUV\xd69\x9c\
+NV\xc9\x15\x90\x01\xc8\x12$\xd9c\x0d\x89\x0b\xbec\
+\xe0\x00\x00)\x19)\xc9\x03\xfb\x0d\xe8\x7f\xc7\xed3o\
+\xcc\xccl\xd5?\x22\x22,\x224,\x14\x12$8\x1c\
+\x0e\xb8\xe0D\xa0-\x10\x80\x84\x92\xb22\xb8\x1d\xae\x82\
+\xaf\xbf\xf9\xea3B\xdc\x1f\xee\xda\xb5\xeb\xd2\xaf\xbf.\
+\xa4\xf9\xae\x8c\x8fro\xb4v\xa38)\xbd\xb1\xe59\
+\x19=y\x16\xd1!\x02\xa3|\x11^Q:\xcf \xf1\
+\x8c\x98__\xcd\x9e\x08$\xb2n\xca5}\xcf\xae\x15\
+\xf0\xac0\x8d\x97\xc6\xa1giyt\xd0\x83\xc9\xce\xdd\
+5\xf5\x1d\x8d\x8d\x0dj\xa2\xdb\x0d\x09 \x90-\x92U\
+\xb6Xl\x16\xab2Oe\x07\x86\xf6*\xbc\xf6\x09\x00\
+\xa4\xa4\xa4\x90\x9a\xfaZ\xdc6\xed\xf6\x84\x8c\xd4fw\
+\xddp\xe3\x8d\x8fF\xc7D\x07\x03\xca\x14\xcb\xad.\xee\
+\x01@C]\x9d\xeb\xc4\x89\x93{~\xfc\xf5\xd7\x9f\xdf\
+~\xfb\xdd\x05\xb5\xd5\x15\x054\xd1ee\xa5\xf8\xe3\x8f\
+?\x00\x00\x03\x07\x0e\xc2\xfe\xfd\xfb0d\xe8\x10\x04\x07\
+\x05\xe3\xbb\xef\xbe\x83$K\xc8\xc99\x16\x98\x9c\x92\x9e\
+\xd2:;+>1%\xb1U\xf7\xae\xdd\xdag\xb5\xce\
+\xca\xce\xc8h\xd92%%9!>66\xc2\x16`\
+\xd3\x1d_\xb7\xdb\x0d\x87\xc3\x01I\x96\x01\xdf\xb4\x0f\x84\
+\xb8\xbd\x8b\x04\x12\xe0r\xc3E\x9c\xae\xca\xca\xaa\xea\x92\
+\x92\xb2\xb2K%\xc5\x17\x0b\xce\x9e;w:\xef\xe4\xa9\
+\xa3\xc7\x8f\x9e\xbct\xa9\xec\x84\xd5b;\xbf}\xc7\xd6\
+\x82\xf2\x92\xb2\x1a/\xbf\xdc\x04D\xe1\xa4\x05\x12\x02!\
+I\x80\x9b8\x018\xcf\xe7\x9d\xbf\xb0\xb2z\xd5Oq\
+qq?\xfd\xb5re\xf2\x0b/\xcd\xbd\xa5CV\xdb\
+k\x02\x83\x02\xbb\xa4\xa7\xa7K6\xd8\xe0t5\xc0\xe9\
+&\x88\x89\x8a\x02q\x93\xa4\xc7\x1e{\xec\x99\xb3g\xce\
+\xdc\x13\x17\x1d\xfbFbb\xd2g\xdf}\xbf\xa0,6\
+:\x86\x9c<yR\x19'v|\x94\xb1\xd4\xdb\xb7\xc1\
+\x82H\xd1E\xf2\xcb\xb6\x0d\xe6\x9a7\x0fg\xe9d\xeb\
+\xe8\xe1\xa4\x1d\x1fM\x17\xad\xe0\xbc6x<\x90\x00\x98\
+\xfa0\x08\x0fXF\xd1\xc4\x8a\xa2\x84\xa6\xa6\x89\xca\xb0\
+m\xeb\x9d\x05\xa72C\x96\xe5\xe0\x0d\x1b6\xac\xeb\xdb\
+\xb7o\x0f\xba\xe0\xf2\xe5K\xff\x1e=z\xecp\x06\xbf\
+r\xcd\x1a\x04\x0d\xb3\x82\x82\x02\xe0p:1b\xf8\x88\
+\xe0+\xfa\xf6\xbd}\xc2\x84\x89O\xb7m\xd3&\xd6S\
+\x90\xa0\xd1\xe9\x84\xcdb\x85\xecec~^n\xe5\xea\
+5k\x96}\xfb\xed\xb7\x0b6m\xda\xbcL\x92e8\
+\x1a\x1b\xe9\xa6\xfd\x84\xf4\xe3O\xbf\xc0\xd2e\x8bq\xf4\
+\xf0\xa1\xc0\xc9\xd7Li\x97\x9b\x9b\xdf\xa6]\xdb6m\
+\xb3\xb2\xb3\xbb\xb4j\xd5\xaasf\xabV\x89\xe1a\xa1\
+\x1c\x16\xfcw\xc0\xed&8~\xea\xd4\xa5\xe39G\x0f\
+\x1c\xcb9r\xe0\xd8\x91c\x07\x0f\xec?xt\xdf\xbe\
+}\x87].W\x15S\x5cY\xa7p\x03p)\x0b\x90\
+\xb7\xdez+\xac6\x0b\xd2\xd3\xd2'fe\xb5\xbe\xa1\
+G\x8f^\xa3222\x82\x00\xc0M\xdcp\xbb\x9c\xb0\
+ZlPV26o\xd8\x94{\xe8\xf0\xa1\x17~[\
+\xf4\xdb\xfc\x95+W\xb9\xe0\x0f\xac\x11\xe0\x81\xa28\xf4\
+\xbd\x91\x9c\xb1x\xcd\x84\xf6,\x1d\xac\x876\x9a:\x98\
+\x99\xe6^\xfe\x0e\xc9&,\x02J0\xbf0g\xb4(\
+hT\x97m\x97\xad\xcf\xbb\xe7\xd1I_#\xabuV\
+\xa7-[\xb6\x1cT\x16\x9cV\xafZ\xb5'3\xb3E\
+\x1b\x0e\xd3\x94\xbe\xd3<\xf0\xdcx\x8506:\x06\xf7\
+\xdf{7f\xcc\x98~\xcd\xba\xd5k\x0e)8\x9d\xc4\
+M\xea\x9d\x8d\xc4\xedv\xab\x0b[yy\xb9e\xaf\xbc\
+2\xf7\xb5\x87\x1ey\xa0\x9d$\xfb\xd9T+<\xf3h\
+5C\xb6Za\xb5\xdba\x0d\x0aJz\xf7\xc3\x8fn\
+Y\xbat\xc5\x87\xdf\xcd\xffn\xc3\xa9S\xb9\x95f\x16\
+\xd2\xfe\x7fCYYy\xf5\xbauk7\x7f\xf6\xf9\xe7\
+\x1f\xdcp\xeb-\xd7\x87\x84\x87&\xda\xec\x81\x90-\x16\
+\x0d\x0fi\x08\x0e\x0eD\xdf\xfeW\xa0S\x97v\xb8\xe9\
+\xa6\xeb\xba\xbf4\xf7\xa5\x0f\x0b\x0a\x0aj\x14\x9c.\x97\
+\x9b\xd456\x12\x97\xdb\xa5\xde\xff\xf6\xdbo\x1b\xc7]\
+5f\xf0\xe4\x89\xd7 22\x92\x1e7\x91l\x80\xc9\
+\xa3\xcb\xeb\xc9\x9c\xcc\xe0\xe0\xc9\x99H\xf6\xf4\x16\xc2E\
+xX\xba\xe8\xbe\xd1yl\x9a\xc4\xa4)\xfd\x15\xf5\xbf\
+Ik\x00z!\x0b/\x9f\xb5p\x22\x0b\xc8\xd65;\
+\xf7\xe6\xcd\xeb\x14\x5c\x1a/\x0a*Dj\xdd:3\xae\
+EFF\xaf\xd4fi8p\xf0\xd0\xb6\x1d;v\x14\
+\x0b\xf0\xb3 \x01@Td$\xe9\xda\xb9\x13\x22\x22\x22\
+\xb3\x9e\x7f\xee\xb9w\xd3Z\xb4\x18\x19\x16\x16\x06\x02\x17\
+\x1a\x1cN\xd8-v\xc8^%\xcf\xcb\xcd-}\xff\x83\
+\xf7\xdf\xbbPx\xfe\x9bE\xbf/\xca\xef\xd9\xb37\xf2\
+s\xf3\x90\x9f\x7fF\xa1\xc9\x02\xc0I\xf5\x05\xb1II\
+q\x93&M\x9cp\xcd\x84I\xa3\xd2\xd3\xd2\xba\xc4\xc6\
+\xc5\xa6G\x84\x87\xabQ\x04\xf1V\x90A`\x11\xb0\xc6\
+\xe1p\xc2f\xb3\xc2\xe1p\xa2\xa2\xa2\xa2\xb6\xa4\xb4\xb4\
+\xaa\xbc\xac\xac\x92\x10R\x09\xa0\xeabAA]m]\
+]#\x01q\x02\xc4\x1dh\x0b\x84\xd3\xe5\xb0\xca69\
+ $$<8,4<$448<(0(\
+<\x22\x22\x224&&:\xd4n\xb7\x8b\xc6A\x17\x9c\
+N'N\xe7\x9e\xce=u2o\xcf\xef\x8b\x16._\
+\xf0\xfd\x0f\xbf\xf7\xeb\xdb\xaf\xf4b\xd19$\xc5'\xe1\
+\xe8\xd1c8s\xe6\x8c*\x0bII\x89\x08\x0e\x0eF\
+UE9\x06\x0f\x1d\xda\xba]\xbb\xf6\xd3\xef\xb8c\xe6\
+\xdd\x89\x89\x09!\x00\xe0r9\xe1p\xbb`\xb7\xda=\
+<! '\x8f\x9f\x9c?a\xe2\xf8'\x0e\x1d9\xa2\
+<3\xa4\xa37^d*3y4\xb02\xcf+\xa3\
+7\x1d0\x9a\xc6\xf2\xf2x\x91&K/ ^\xe4\xe4\
+}\xc4\x85\xc6#\x5c\x97k\xea\xcb@,\xd1t\x1ao\
+\xfe\x05\xe6^\xc9o\xca\x8b\x14\xbc6y\x8c\x131\x9c\
+\x9d\x87\xb9\x01 \xabuk\xb8\x9cN\x9c<}Zo\
+\xa0\xfc %))\xf0\xf9g\x9ey\xe2\xeaI\xd7\xcc\
+\x8a\x8e\x8d\xb1\x03@\x8d\xcb\x01\x1b$\xd8-V\x80\x00\
+yy\xf9\xa5\xf3\xe6\xcd\xfbx\xd3\xe6\x0d\xef\x15\x14\x14\
+\x14\x1d>|\x04\x00\x10\x12\x12\x02\xa7\xd3\xa1.\xec)\
+\xd0\xbeC\x87\xd8v\xed;\x0c\xbej\xd4U\xd7\x0d\x1a\
+2\xa8ojrR\xbc\x99\xfd\xfeU\xd5U\xa8\xa9\xae\
+q546\x96_*)+\xcc\xcf\xcb?St\xf1\
+\xc2\xe9\xda\xea\x9a\xfc\xdd\xbb\xf7\x9c\xcd9u\xe2\x82\x0c\
+\xf9\x92=\xd0^\x9dw\xfat\xfd\x83\x0f>\xd8\xd0\xa2\
+EK\xe7\xfd\xf7\xdf\xe7\xbcXX\xe0v\xbb\xdcn\xd9\
+\x22\xe3\x96\x9bn![\xb6l\x96\x8f\x9f8a\xb1\xd9\
+\xacV\xbb\xc5j\x8d\x8c\x8a\xb65o\xd92\xd0n\xb5\
+\x06UVW\xc5d\xb6\xc8LMHIJOm\xd6\
+,\xb3]\x9b\xac\xd6i\xcd\x9b\xa7\xc5\xc6%\xc4E\x87\
+\x85GX\xad\xa6\x1e\xf5\x83\x008q\xea\xf4\xf9\x95\x7f\
+\xfd\xb5b\xcf\xee\x1d\xdf\x8f\x18:|\xeb\xc3\x8f\xfc\xa7\
+.!!\x11\xa5\xe5\xe58\xe3\xd9\x98\xa5\x82$I\xc8\
+HOCtL\x5c\xfa\xcd7\xdf\xf4\xc4\xb5S\xa7\xde\
+\x1a\x9f\x90\x10\x08\x00\x0e\xb7\x13\x16\xc8\x90e\x19\x84\x00\
+\xf9\xa7O\x97<\xff\xd2\x8bO\xacY\xb3\xea\x8b\xea\x9a\
+\x1a\x94\x14\x97\x01\xferG\x93b\xc6\xa0\x19\xc9\x06=\
+M0\xa3\xf8Mm\x9fG\x8f\x1e-\x80\xb1^iq\
+\x11\xfd)\x00\xfdL\x9e}\xdeO?\xb3gC\x1c:\
+\x1dL\x9er/*\xc3\x0b\xa7X\x1cf\xa7\x02,\x1e\
+6\xa4\xa2\x99a\x14Ja\xd0\xc0\x01\x83\xb6n\xda\xa4\
+N!\x1a]\x0eR\xe3l$J\xb0\x9f\x9fw\xa6\xe6\
+\x87\x05\xdf\x7f\xdc2+3\xb9K\xb7\xae\xb8m\xda4\
+t\xeb\xda\x05\x00\x90\x96\x91\x81f\xe9\xe9\x88\x8e\x8eF\
+\xfb\xf6\xed [,\xf2\xc8\xd1Wuy\xf2\xc9'_\
+\xc8\xc99~\xc1lx]TXX\xb7a\xed\xfa\xc3\
+\xcbW\xfc\xfd\xfb\xf7\xbf\xfc\xfa\xe2\xbd\xf7?xM\xbb\
+\xf6\x1d\xb2BBB\x03\x00 .&\x06\x0f\xde\xff\x10\
+\x92\xe2\x13\x01\x006\xab\x1d\xed\xda\xb5G\xf7\x1e=\x90\
+\xd5:K\xb3\x18\xa9v^`l,\x16\x0bd\xeff\
+\xd0\xd4\xd4T\x04\x04\x04\xa8y\xb2E\x0e\xcdn\xd7\xbe\
+\xeb\xb4\x99wN\xfbr\xfew\xef\xaeY\xb3n\xe5\xd1\
+c\xc7N\xd6748\xcd\xf4\xa3\xb1\xd1A\xd6\xad[\
+\xb7\xef\xa1\x07\xef\xbf\xff\xc9\xd9O\xb7h\x96\x9e\x8e^\
+=z\xa0}\x87\x0e\x90d\x8bf\x1cZg\xb6Fz\
+\xf3T\x0c\x1c\xd2\xaf\xfd\x92%K\x16\x15\x17\x97\xaax\
+\xdc\xc4\xad\xc1\xbbx\xf1\xa2\xbf\xfa\xf6\xee\x9d\xad\xe9\x9e\
+~\xb8\xcd\x9b\xa2\xea\xc9\x9f(OT\x96\xd6\x19\x18\xe0\
+2\x9a\x1a\xfc\x1bSfM[fw\x02*D\x9b}\
+5\x97\xb6\x82\xbc\xc8\x80\x17\xa2\xd1\xf9<\xbcl\xd8\xc3\
+\x867\xa2:,ml;\x86\x16\xdbf\xb1\x05\xbc\xf1\
+\xc6\xeb\xaf\xde\xff\xe0\x03\x0f(iN\x97\x0b\x16\xd9\xb3\
+U\xb7\xa8\xa8\x10\x07\xf6\xee\xfb\xf3\x8b\xaf\xbf~*7\
+7w_]}\x1d\x82\x83\x83\xd1,\xb5\x19\x9cN\x07\
+\x1c\x8d\x0et\xea\xdc\x09\x17\x0b\x8b\xb0o\xef^\xcb\xf4\
+;\xa6_\x19`\x0f\x986i\xe25\x13\x22\x22\xc3\xfd\
+5\x92\x81Sy\xb9\x176\xad\xdf\xbcy\xef\xfe}{\
+\x1b\x9d\xce\xdd\xab\xfeZ\xb5->:\xba\xf2\xb1\xd9O\
+\xe1\xd7\x85\x0b\xb1t\xf1o\xa8\xaa\xa8\x80\xb2\xa7^\xf6\
+\xae\xea'%\xa7@\x86\x05)\xcd\x92q\xf6\xdcY\x9c\
+?w\x8e\xd7w\xbd\x95n\xe3\xa8H\x02\x22\xa3\xa3Q\
+QV\x86\xc0\xa0\xa0\x94\x81\x83\x06\xf7\xec\xde\xa3{\x97\
+\xae]\xbav\xed\xd3\xa7O\x9f\xc4\xb8\xb8h#\x14\xfb\
+\xf6\x1d(\xdf\xb7g\xcf\xaf5u\xb5\xdf\xed\xdc\xbd{\
+}HP\x006n\xdc\x88C\x87\x0e\x83\x10\x82\xf8\xf8\
+x\x94\x97\x97#..\x0eq\x09\xb1\x18>d\xf8\xb8\
+)S\xa7>\xdf\xbd{\xf7N<|\xc5\x97.\xd5\xcc\
+\x9e\xf5\xd4c\x9f~\xf9\xf9GT\xdfX\xd0\x9bj\xd2\
+\xb2\xce+\xaf\x94\x11\xc9*\xed\x85y\xe5\x8c\xa6\xcf\xa2\
+\xb2\xecx\xb1t\xea-\x02r\xdbh\xca\x14@\xb4\xdf\
+\x9de\xa2^\xe8o4\x1f\xe2)&\x9d\x07N\xbe\x99\
+U\xd2\xcb\x86^\xdd\xba\xf7\xfc\xfa\x8b\xaf\xbeh\xd3\xb9\
+C\x07\xc0\xb7h\xaax\xd2\x83\xfb\xf7\x1f\xdf\xb9s\xe7\
+\xac\xc5K\x96\xfc\x16\x14\x14\x84Sy\xa7\x11\x13\x1d\x85\
+];w#&:\x163f\xce@^\xee)\x9c9\
+sF\xea\xda\xb3\xf7\x0d\xa3\x86\x0e\x9f\x99\x96\xde\xac_\
+bR\x92n\xbb\x07\x0e\x1e<\xb3n\xf5\xda\xa5\x9b6\
+m\xd9\xbc}\xf7\xce\xed\x85\x05\x17O54\xd4\x22>\
+1\x11N\x87\x13\x95\xe5\xe5\xf8\xe8\xf3/p\xfa\xf4i\
+|\xff\xdd|\x5c*,B]]\xadR]\x02@\xec\
+6\x1bBB\xc2\xd023\x13G\x8e\x1cBmm\xad\
+N\x8b\xa6\x805\xe4\x80\x98\xdfRZ\xcb\x16m\x87\xf4\
+\x1f\xd0\xb3w\xef\xde\x83\x07\x0f\x1erU\xeb\xd6\xad4\
+\xc6\x80\x10\x02\xb7$\xa9\x9f\x89:\x9es\xc2QXP\
+\xb0j\xd1\x92E\xef\xb9%\xe9\xaf\x83{\xf6\x22\xadY\
+:\x96\xfd\xf9'\x8a\x8a\x8b$\x00\x08\x0b\x0b#.B\
+P[]\x1d\xf4\xe0\xfd\xf7\xdd\xfb\xfc\xf3/<\x13\x16\
+\x11\x11\xa2%\xc5C\xe6\xa2\xdf~\xfb\xe3\xbe\xfb\xee\xbb\
+\xeb\xdc\x85\x0b\x178t\x9b\xed\x9fr\xafw\x1a\x0f\xbd\
+\xae@\xe3a\x9d\x15M$\x982l\x07DF\xe2r\
+\x1d\x19m0|i\x06S\x00:|\x00\xf8+\xa8\xa2\
+p\xc6\xcc\x8f\x0dI\x8cB\x18\xa30\x8cG\x17\xcb@\
+\xf6\x9ae\x12\xc2C\x83\x11\x1f\x15\x8e{\xee\xbc\xeb\x81\
+\x9a\xaa\xaaF%\xbct:\x9d\xea\xea\xbe\xcb\xed&\xb3\
+f\xcdz\xbd[\xd7.\xa1\x0b\x16|\x8f\x9bo\xbe\x05\
+\x01\x01\x01\xe8\xda\xbd\x1bn\x99v+\x9a\xa5\xa7!9\
+%\x05\x8f<\xf6\x18\xee\xbf\xf7\xde\xebw\xed\xd8\xb9\xa7\
+\xa0\xb0\xd0\x17\xba\xba\xd9\xe0\x95\x90\x82\xa2\xa2\xf2\xf7\xde\
+\x7f\xff\x9b\x9bo\xbeyL\xaf\xde\xbd\x13\x15\xa2\xac\x16\
++:\xb6\xeb\xe4\x17\xaa\xc7\xc7\xc7\xe3\xe6\xdb\xa6\xa3]\
+\xfb\xf6\x08j\xe2\xdb\x83\xff\x10X\xfe\xd12\xe2\x07V\
+\x9b\x15\x13&OJ\xbf\xe3\xce\x99S\x7f\xfau\xe1\xe2\
+\xb2\xb2\x8a\xba\xfa\xfa\x06\xe2\xe3\xab\x8b46:\xd4\xfb\
+\xb3g\xcf9W\xae\x5c\xbd\xf2\xf1YO\x0c}\xf2\xd1\
+\xc7\xd0\xaf\xd7\x15\xe8\xd4\xa1\xa3\xd2\x8e\xa6\xed\xd4\xb4\xe4\
+V\x8b\x17\xff\xbe\x8c\xe6#\xcd\xd9\xb3g\xce\x9e\x1b5\
+b\xc4\x10\x0e\xed<y\x01s\xcf\x93G\xa3\x15{#\
+9\x07'MO\xa7Di\xa2>\xe8\xf5\xcf\x7f\x0al\
+\xc2\x00\xd0\xf3v\xd1#=3\x8c\xe2\xe5\x99\x99\xbf\xeb\
+1S\xcf\x10\xf8\x09\x8b\x99\xb4\xe4\x84\x04L\x1a?&\
+\xe4\xebO?\xfd\xce'P\x84PO\xf5\xc8\x81\xbd\xfb\
+\x0fu\xef\xd1C\xdd4\xdf\xbcysDG{\x9c[\
+\xbb\xf6m1l\xd8P\x8c\x1c9\x12w\xdeu\xd7\xb8\
+5k\xd6\xed\xa9\xad\xad\xf3\xcd}\x1dN\xe2t\xf9\xa6\
+\xc9\x97JJ\x1aW\xad[\xbb}\xe6\xdd\xf7<\x9c\x90\
+\xd4,E\xa5\x88&P\x92\x10\x1f\x9f\xa8\xce\xc7i\x18\
+=v\x1cz\xf6\xe9\x8b\xa0\xa0`\xbf\xbc\xff\x8f\xa0\xe9\
+\x81\xf7}\x08\xb4\xe9\xd0\x1e?\xfd\xbe\x10\x0f?\xfcp\
+\xab\xd9\xb3g?\xb3g\xcf\xde\x03\x8d\x94!p8\x9d\
+\xa4\xd1\xe1\xe1\x8d\xcb\xe5&\xd5\x95\xd5d\xde\x17_/\
+~\xf6\xc9\xd9]\x06\x0d\x1c\xec\x89\xba<FP\x96!\
+\xd9A\x19\x9d[n\xbeqz\xf1\xa5K\xdc\xf7\x0d\x1a\
+\xea\xea\xdd\xcf=9{\x96E\xbb\xfe!\x92\x11Q\x19\
+#\xe5\x12\xc9\xaa\x91\xc2\x8ap\xf0\xd6\xab\xf4\xdaR@\
+\xa4\x0b\xca\xbdVw\x0c\x0c\x00\xab\xac\x16\xe6\xaf\xc8\xf2\
+\xe9-@\x98Y\x90\xe3\x957b2\xbb\xc8\xc22\x99\
+\xbd\xe7\x96\xb9\xf7\xee\x99m\x0e\xee\xdb\xbb\x8f'H\x84\
+\x10\xf2\xe1\x87\x1f~,\xcbr\x10\x87n\xf4\xe8\xde\x03\
+\x0f\xdcw\x1fF\x8f\x19\xdd\xe5\xdb\x05\x0b\x96\xd3\xf5\x1a\
+\x89\x8b\xb8\xbcV\xc4\xe9t\x92\x9c\x93'\xaa~Y\xf4\
+\xdb\x0f\xf7\xdcw\xdf0\x89\xff\x8dV=\x1e\xa90t\
+\xc4\x95h\xd3\xbe\xbd^\x91\xff\x15\x90\xc2##1\xf6\
+\xea\xab1h\xf0@\x5c;e2\x22#\xa3\xacc\xc7\
+\x8f\x9f\xbaz\xd5\x9a\x95\xb5\xb5u.\x85WN\xa7\x93\
+8\x9d>#Y]VI^~\xe1\xa5\xf7&O\x9a\
+\x9cl\xb1\xa8O\x1c,\x92$\x05H\xd4\xd1\xf6\x89\x89\
+\x09\xcd\x97,Y\xa4\xe1;\x0d\xdf~\xf5\xcdO\x11\xa1\
+\xa1\xe1M\xa5\xdb\xe4\x8f\xb7\xc8'\x8aPy\xf7\xac\xa3\
+\xe5\x95\x01\xc48\xf4\x16\x03ye<\xd0\x04\x03\xc0\xde\
+\xebyd0\xe5y\xa1\xbc\x0a\xa9II\xc8n\xdb\x16\
+11\xb1lGYF\xf0\x98j\xc4,\xd1@\xf8\x0d\
+\xdc\xb0aCG_8\x7f\xbe\x94\x10o\x88\xae\xd9\xcc\
+\x93w\xf1\xaa\xd1W]\xcd\xe0\xb6*\xf5{\xf4\xec\x81\
+\xb9/<\x1f\x7f\xf2X\xce\x07'N\x1cW\xa5\xd7\xe5\
+ti\xf0l\xdf\xb5\xa3x\xc9\x92%o\xddz\xeb\xb4\
+N\x00\x90\x9a\x96\x0e\xce\xbbz\xbcA\xe3\x82\xa4\x97\xf5\
+\xff\x1f\xf8^J\x92\xd4>\x87\x84\x84\x00\x92\x84\xfe\x03\
+\x07\x0e[\xf0\xc3\x0f\x0bkkkUC\xe0\xf6\xfe\x14\
+\xc8=\x9d[x\xcf\x9dw\xdfo\xb5XlT\x036\
+\x19\xb2\x9df\xe2\xbdw\xcd|\xa0\xb6\xb6F\x9d\xba\xb9\
+\xdd*J\xb2c\xcb\x96=YY-2\x19\x1a\x9b\xd2\
+\x07\x9e,\xd2z@\xd7\xe3\xc9\xa6\x9e\x02\xf3\xd2\xcd\xd4\
+\xd7\xd3K\x91nz\xda4i\x00\x8c\x1a\xe3\x0f\xb4\xff\
+\xa3C\x0d\x01I\x89\xb1\x19s_x\xfe\xa9_~\xfa\
+\xe9\x9b\x1f\x7f\xfe\xf1\x87/\xbf\xfc\xfa\xbd\x1e]\xbb\x0d\
+\xea\xd8\xb1\x03\x06\x0c\x18\xa0\xccy\xd9\xce\xf0\xc2*\x9e\
+\xf7g\x07\x87e$\x00H\xb2\xd5\x82\xb0\x90@\xdc}\
+\xe7\xcc\xfb\x9c\x8d\x8d\x84\x07\xeb\xd6\xaf[\xd7:;;\
+E\xc38\x8f\xf2{\x08\x94e\xfc\xf8\xf3\x8fw\x9e8\
+~\xbc\xa0\xae\xae\x9e\x10B\x88\xc3\xed\x22\x0eJ\xf0r\
+O\xe7V\x7f\xfe\xc5\x17\xaf>\xf2\xe4\xac\xe6\xb3\xe6\xcc\
+\xc1\xfd\xf7\xde\xc7\x8c\x05-P\x9a\xc5W\x91\x071\x82\
+\xff]\x03@\xdd\xc7\xc4\xc4\xa8\x89\x16\x8b\x15\xa3F\x8d\
+\xea;\xef\xeb\xaf\x17\xd3F\x93\x85\xdd\xdbw\xee\xe8\xdf\
+\xaf\x7f\x1f\x0a\x9fU\x86\x1c$K\x92j\x18\xfa\xf5\xed\
+\xd3{\xff\xfe}\xc7x\xf5/^8_8r\xd8\x90\
+\x81\x0c=,\xddf\xfa\xa3g\x10\xf4\xea\xf8\xf1A\xa7\
+\x9c\x99)\xb3^:K\x97\xd6y\x1a\x18\x00\x112\xbd\
+p\x83g\x05%\xf8\xf6\x0d@\xb6\xc8\x81/\xbf\xf0\xe2\
+[\xa5\xc5\xa5\x15\xec\xe0TUW\x93\x9f\x7f\xfc\xf9\xab\
+\x99\xd3g\x04\xd9=\x87\xcb\xe8M5@\xfd\xe51\x11\
+L\x19\x8d\xf1\x08\x0e\x0eD\xb7n]\xf0\xee\xeb\xaf\xbf\
+\x22\x12\xb6\x17_\x9a\xfb\x06\xd5'\x0b$\xc9\x0e\xea%\
+\xaan]\xbbf\xfd\xfe\xdbo+\x1b\xbd\xc6\xc3\xed&\
+\xc4\xe9\xf4\x09oIY\x89\xe3\xcd7\xdf\xfe\xe4\xd5\xb9\
+\xaf6\x1f:l\x18\xba\xf6\xe8\x81\xce\xdd\xba\x22!>\
+\x81\xa5\x8d\xe6\x17\x984\xb6\xdc\x7f\x1b\xfe\x8d\xb6E\x82\
+\x0f\xd9b\x03$\xa8OV\x82\x83\x031f\xcc\x98\xa1\
+\x8b\x17/[\xa7\x19\x0c\xca&4\xd678_\x99\xfb\
+\xf2\xdba!\xa1\xca\xa1*\xb2,\xc9A\x92$\x05\xc2\
++gV\xbb-\xf2\xbby\xf3~P\xabSQ]Y\
+ii\xfd\xa3\x0f\xdew]\x9bl:\x18\xf0\xa3\xb5\xa9\
+\x8a\xcc3\xd2\x22\x03n\xa4\xfc<\xe5\x16\xe9\x9d\x11\x0e\
+\xf1\xcf\x84\x01\xa0\x09\xe6\x85\xf3\x8ab\xebYC\x0b\x00\
+90$\x18\xad\xdb\xb4\x09_\xb6l\x99\xe1\xc1\x18\xdf\
+\xcd\xfb\xee{jn\xcc\xc3\xad\x00/\x22`\x07@b\
+\xcb%\xa7$aP\xff~\xd2W\x9f\x7f\xfe\xb5O\xc0\
+|\x12VUSS;i\xeauS(<\x16@R\
+\x8d\x98\xcdb\xc1#\x0f\xff\xe7\xc1\xd2\x92\xd2:_u\
+_\xfd\xb2\xb2\x0a\xf2\xf3\xaf?/\xeb\xd0\xb1C\xd7\xe0\
+\xe00\xb4\xc9n\xc7\xa3\x89\xa1U\x12\xe5\xf3\x04\xeb\xbf\
+\x0d\x22\xbe\xfec\x1a%jJ\x00@\xdd\xf6,I\x12\
+&N\xb9\xf6\xfa\xa3G\x8f\x9e\xd2\xd8\x01\xca\x10\xec\xdb\
+\xb5\xe7\xd8\xf8q\xe3\xfbQ\xc8\x02d\xc8v\x09\xbeh\
+\xe0\x89\xc7\x1f\xfd\x8fR\xde\xe5r\x93F\x87\xe7\x89C\
+ue%y\xe1\xd9\xd9\x0f\x8c\x1a6\x04\xe1\xe1\xe1\xa2\
+>\x88\x94G\xc9\xd3\x9b^\x8a\x9c\x95Y>\x89\x1c\x9d\
+\xa8\xac\x02\x22\x8f\xcf\x1a\x15S\x11\x00\x98J<\xcb\xc4\
+*<\x1b-\xc8\x00\x10\x11\x1f\x83U\xab\xd7|G(\
+((\xbcP\xba\xe0\x87\xef~]\xb3f\xf5f\xc2<\
+\x18\x1b=z\xccd\x0e3D\xf3\x1dS\xd65)1\
+\x09\xc3\x86\x0c\xc55\x13\xc6\x07,]\xb4\xf8g\xa5-\
+\x87\xd3\xa56~,'\xe7tv\xbb\xb6]|\xf5%\
+\x0b \xab!\x7fbBB\xda\xa2\xdf~\xd5<z\xa2\
+\xe1\xe8\xf1\xe3'_xq\xee\x94\xd8\xd8X\xd1.;\
+\xd6\x90\xe9\x09\x0d\xe0\x9b\x12\xfc\xff4\x02f\x0d\x80N\
+?L\xb7#\x01Pyg\xb5\x07D\xbe\xf4\xd2\xcb\xaf\
+\xd5\xd4\xd44\xf0\xf8]WWO\x9e\x9c\xf5\xe43\xf0\
+\xf1S\xb6Jr\xa0\xc5\x13\xad\x01\x00F\x8f\x1aue\
+\xe1\xc5\x8b\xc5\x8a\x01Q\x1e;\xd6\xd5\xd5\x92\xcf>\xfc\
+\xe0\x99\xc9\x13'\x22**\xca\x8f\x06\x13\xd7l\x1fY\
+]\x10\xd5\xa1\xcb\x03\xfe|2\xa3\xf0\xbc\xba\xa2qb\
+\xef=?\x13\x06\xc0\x8c\xf2\xb3\xca\xce\xfe\x00\x00\x03G\
+\x0c\x19SVU\xe1S\xb4\xa3G\x8e\xb5i\xd3RQ\
+4<\xf5\xc4\xe3s\xe8\x81]\xbcx\xd9\x0a\x8apv\
+~\xa5\xc7H\xa1 v\xed\xda\x15\xaf\xbc\xf8r\xc0/\
+?\xfd\xbcT\x15\xa0F_\xcc\xfe\xf7\xdf\x7fo\x8e\x0c\
+\x8fT\x8e\x09\xb3@\x82\xdd\xab\xfc\x00\x80\xe1\x83\x87\x8e\
+\xbcp\xf6\x5c\x01O\x10\xeb\xeb\xeb]/\xbc<\xf7\x1d\
+{@@l\xcb\xe6-`\xb7\xdbY\xdaXrE\x9e\
+\x84Nc\xfb\xf4\xbf\x02\x22\x81\xd53\x00f\xe8\x17\xf6\
+\xb3c\xfb\xf6]\xff\xfak\xd5z\x91\xe1]\xb6d\xd9\
+\x8a\xa4\xa4du\xec$H\x81\x125]k\xdd:\xb3\
+\xfd\xe1\xc3\x07s\x08!\xc4\xe1v\x93\xfa\x86:7!\
+\x84\xd4\xd5\xd4\x90\xef\xe7}\xfb\xca]3\xee\x80\xf7h\
+\x083t\xeb-\xae\xb18\xcc\x18\x10\xd1\xd8\x8bx\xa2\
+\x97&\xcac\xcb\x98Z\x04d\x95\x5c\xa4\xf4l\x19\xbf\
+\x05\xbbW\xde|\xed\x19z\xc0&O\x9ep#C$\
+~\xfd\xe1\xc7_UOz\xe4\xe8\x89\x90\x90\x10\xe5e\
+w\xb3\xd6Td \x90\x9c\x9c\x8c\xa9\x93'\x07\xfe\xf4\
+\xc3\x8f\x7f*m\xd46\xd4\xab+u\xdf/\xf8\xfe\xc7\
+\xb0\x90\xd0@oq\x19\x9e\xd7t\xd5\xe7N\xb3\x9fx\
+\xfcq\xb7\x8b\xbf8\xb5g\xef\x9e\xa3\x83\x87\x0c\xed\x07\
+-\x08h\x96x\xf7\xbc\x01\xff_Qz\xb3\xc2f6\
+\xad)mj\xeaX,\x16\xf9\xae\xbb\xef}\xa8\xa2\xb2\
+\xb2\x9e7\x0e\x17\x0b.^\x185R\xb3\xf1G\xb3\xa6\
+\x12\x15\x15\x9e\xbci\xc3\xfa-\x84\x10\xe2r\xb9HC\
+m\xad\xdbc\xbc\x1b\xc8\xfb\xef\xbe\xf3\xfa\xdd3g`\
+\xc6\xf4\xdby}\x16)\xb9Q\x9e^\xffD\x7f\xd9k\
+\xdd'A\xd0\xf2J\xb4`\xce\xcf70\x00\x22\xa5V\
+\xe6\xfe<eW\xf2\xe8\xba\xb0Y,\xf8\xe2\xcb\xcf\xdf\
+T\x06\xaa\xa0\xe0|a\xab\x8c\x14\xbfw\xf1\xe7\xbe\xf8\
+\xc2\xebJ\x99\x9cc\xc7N\xc5\xc6\xc6Dz\xb3\xf4\x16\
+@XF\xf8A@\x80\x1dS'O\x0aZ\xb1l\x85\
+\xfa\x9c\xb8\xb6\xa1A\xd5\xe67\xdf|\xf3C*\x5c\x97\
+\x01IV\x145\xc0n\x0b\x99\xff\xf5W\xeab\x12\x0b\
+\xef\xbd\xff\xde\xa7\x16\x8b\x95>\xe1\xd7H\xe8\xa9<I\
+\xfa\xdf\xd0\xf1\xff)`y\xe7\xa7\x00\x9d;w\xed\xb2\
+}\xeb\xb6=\xca\x18\xb8\xdd\xbe\xb5\x81\xfa\xfa\x06\xf7C\
+\xf7\xde\xf7\xa0\xd5\xb7g@3\x0eV\x9b5r\xc5\x8a\
+\xe5\x7f\x13B\x88\xcbMH}m\xbd\x9b\x10B\x1a\x1a\
+\x1a\xc8w_}\xf5\xf2\xa8\x91\xc3\xd5z\x9c\x91\x11\x19\
+8\xb6\xcc\xe5\xf4S\x94\xa7\xc7\x0b\x91\x134\xfay\xf0\
+\x980\x00\xa2UH\x9eQ\xa0\x95\xdfo\x0a0\xf7\xe5\
+\xb9j\x88\xbfq\xe3\xfa#V\x8b\x14A\xf7\xb8yF\
+R\xe2\x81}{\x8f*e\xd6\xaf]\xb7]\xa7cz\
+k\x01\x9a\x9f\xd5nC\x8f\xee\xdd\xec\xcb\x97.Y\xa2\
+*\x7f\xbdO\xf9\xdfz\xe3\xcd\xd78\xcc\x07\x00\xb4l\
+\x99\xd9|\xd3\xa6\x8d\xbb\xb9\xde\xa6\xa8\xb0t\xd2\xd4\xc9\
+Su\x06\x83\x87\x93\xa2Sb\x07\x93g\xe9\xff\xaf\xa2\
+\x80\xff\x9fV\xc7\xa8O|a\xf5{\xca$\x05~\xf6\
+\xf9W\x1f\xf2\xc6\xa6\xae\xae\x96l\x5c\xbd\xe6\x83\xf1W\
+\x8d\xa5q\xd2\xfc\xb5/_\xb6\xe4/B\x08q\xbb\x08\
+\xa9\xaf\xf1\x18\x01Wc#yu\xeeK\xb3\xbbv\xe9\
+H?\x866\xea\x8bh\xceo\x96\x0fzF\x84\x97\xcf\
+3B\xbch\x5c\xa4+P\xd3L\x18\x00\x11\xb1<\xa5\
+\xa3#\x036\x1d\xd9YY\xd9\xdf\xcc\xfbz\xc9\xea\xd5\
+\x7f\xff\xf5\xc2\xf3\xcf\x0f\xa3{+\xcb\x12\xee\x9cq\xc7\
+\x0cz\x10\xef\xb8\xe3\xf6\x07\x99\xf6\x8d\x1eE\xaa\x8b@\
+4\xedi\xcd\xd3\xf1\xe3\x0f?\xccS\xf0\xd64\xd6\xa9\
+\xca\xff\xe2\x8b/\xbe\x90\x90\xcc\x7f1\xa7s\x87\xf6\xdd\
+\x8e\xe7\x1c\xcf\xe7\x09\xd8\xda\xb5\x7foJIIi\xc1\
+\xa9&\xe0\x99\xc4\x19\x0c\xbf\xc5=F\xc058\x8c\xa0\
+\xa9\x0a\xfd\xbfj\x00D2&\x08m%L\xb9\xee\xfa\
+\x1b\x8a\x8a\x8a\xca\x94\xb1\xa17\xfe\xfc\xf2\xd3\xcf\x7f\xd8\
+l\x96@\x0a\xb7\xc5\xe2=\x96I\x92\xa4\x80?\xbdN\
+\xc1\xed&\xa4\xc1\x1b\x098].\xf2\xc23O?\x10\
+\x11\x1a\xcc\xd2\xa4\xd7\x1f\xb3\xfd\x13\xd5\x17M\x01E\xb2\
+\xce\x96\x139k0\xf7M6\x00lcF\x8b\x81\xbc\
+t\xf5\xf1YDT\x18R\xd3R0n\xec8\xd8l\
+6\x95I\x93&M\xe8YQQ\xad\xee\x0b\xd8\xbau\
+\xeb\xbef\xe9)\x91T\xdb\xe0\xb4\xa5\xc7P5\xff\xe5\
+\x17\xe6\xaa\xcf\xf9k\xa9\xcd>\xaf\xcc\x9d\xfbFJz\
+*\xecA\x01\xda\xca\xb2\x84I\x13\xc6\x0f\xbaT\xc8?\
+\xcb\xfe\x95\xd7_}\x0f\xda\x03U\x0d\x06\x84\x9d\xf3\xab\
+\xcaO\xd7\xfd\xa7\xf0o\xe0\x11\xf1\xd5HY\xffM\xe0\
+\x19P^\xba\xc6\xc8\xb7\xce\xce\xea\xb8m\xdb\xf6\xbd\xca\
+\x18\xb9\x5c>#\xb0~\xed\xda-II\x09\xd1J]\
+\x09\xb0y\xbf{\x09\xd9\x22\x05,\xfc\xfd\xd7?\x08\xf1\
+\xbc\xe0UWW\xef]\x18\xac%\xb7\xdd|\xe3\xf5\x02\
+\xba\x8c\xe8\xbf\x1c\x9e\xe89[^\xbar\xcf\x8b\xcay\
+\x06\x80\xe7\xb4M\x19\x00\x91\xc2\xb3\xd6X\xef\xc9\x80b\
+\x04\xa4\xc0\x90@DEE\xfau}\xde\xbcy\xea\xaa\
+<q\x132y\xca\xe4\xf1T\xd7\xcd(\x0b\xd70\xdc\
+;\xf3\xee\xfb\x15\xb4\x0d\x0d\xbeu\xa3\x0f>\xf8\xe0\xc3\
+\xe6-2`\xb3\xab\x9b\x8ddI\x92\x00Y\xc2\x84\x89\
+\xe3GW\x95W\xd4x<\x83o\xf3HCC=y\
+\xf4\x89\xc7\xee\xd1o[b\xd3\x01\xdf\x22\x1f\xcf\xbb\xff\
+/\x01OxyB\xa8W\xfe\xbf\x09\x9a\xf6ccc\
+\xc3\xbe_\xf0\xc3O\xbeH\xc0\xb7`\xbb{\xc7\xf6C\
+\xed\xdb\xb7M\xf5\x16U\x16x\x95H h\xd9\xb2%\
++=F\x80\x90\x86Z\x8f\x9c\x94\x95\x95\xd5\xf7\xee\xdd\
+k\xa0\xb7\x8c_{fh\xfa\x17\xca\x19\x01O\xae\x8c\
+\x9cr\x93\x0d\x00/\xa4\x17\xad\x01\x98\x0dIT\x06\x84\
+\x04\x04Xwn\xdf\xa1.\xe8\xac\xfd{\xed\x8e6\xd9\
+YQ\xd4\xa2\x1c/\x12\x01\xb4\x0c\xd4\xb4a\xb3X1\
+j\xe4\xa81\xce\x06\xcf\xf3\xde\x1aJ\xf9\xbf\xf9\xf2\xeb\
+\xf9\xfd\xfa\xf5Cf\xebL\xba\x1e\x00`\xca\xd4\xc9\xe3\
+\xab**\x9c\x84\x10\xd2\xe0r\x11e{\xc0\xf9\x82\x0b\
+%C\x86\x0e\x19\x0b-(\x9e\x9c5\x00\x12'\xcfh\
+%\xd7\x10lV+\x02\xec\x9eh%9%\x19\x09\x09\
+\x09\x9cR\xe2&\x02\x02\xec\xff\x96\xba\xf2<\x91\x11\x01\
+\xbe\xc1\x94$X-\xac\xcc\x1a\xe2\xe1\xe5q\x8d\xfe\x9c\
+\xd9O\xbfXW\xe7\xd9\x9f\xe5y\x01\xcb3\x86{v\
+\xed\xce\xe9\xd5\xa3\x07\xbd\xf5O%\xc2n\xb7F\xae\xf9\
+{\xd5V\x8f\xe1 \xc4\xe1=\xd8\xe8\xd8\xb1c\xe7\xbb\
+w\xef\x96\xc9\xd9\x94\xf6\xdf\x04=^\xebE\x09\xa2\x08\
+\xc0'\x93\x97i\x00D\x1e\x9f=\x22\xcc/\x02\x10\x10\
+\x88\x9f\x7f\xfee\xb1\xa2\xa0\xf9y\xf9U3\xef\x98\xd1\
+\xa5Y\x8ab\xb0\x85\x1d\xe0\x0abpd(\xee\x9ey\
+W\xa7\xa2\x8bE\xe5\x84\x10R\xeb\xf0-\xf8\xfd\xfc\xd3\
+O\x7f\x0c\x1e4\xd0\x9a\x98\x98\xa0\x1e\xde\xa9\xc0\x98q\
+c\xc6UWW{B\xc0\xc6F\xd2\xe0\x0d#w\xed\
+\xday:\xbbmvG\xaa\xa8\x9f\xd5e^\xca\xf1*\
+\xbf\x9f\xd7\xe0\x0a\xac\x06$  (\x88[$*2\
+\x12\xa9I\x9e\xc7\xdc\xe9\xe9\xe9HV\x1fy\xb3l\xe2\
+Cpp0\xecV[S\xc5\xd7P\xa1\x0d\xca\xf9\x95\
+\x91e\xc9\x8f\xf7^`\xe7\xa9<\xc1f\xf1\xd1\xb2\xa6\
+\xc2g\x9f|z\xb72\xe6N\xe2&N\x97g\xaf\xc7\
+\xc1\x83\x07O\xb4m\x97\xddJ\xb6\xa8ccQ\x06\xaa\
+ef\x8b\xa4\x83\xfb\xf7\x1d&\x84\x10\x97\xcb\xb3k\x90\
+\x10B\x0e\x1f>\xb4\xbd_\xbf>!T\x9bM\x01#\
+>\x89d\x82\xe7\xf0D\xb8ESq\x91q\xf0\x957\
+0\x00\x22\xa4f\xe6\xfe\xa2\xa8\x81\xbb\xa2{\xcb\xcd\xb7\
+\xdc\xae\x0cXUu5\x19=\xe6*\xfa\x99:O \
+\x84\xd0\xb1c\xfb\x98}\xbbw\x1f\x22\x84\x90zG\xa3\
+\xbb\xc1\xfb\xfe}\xce\xe1\xa3\xbb_\x9d\xfbJd\xcb\x96\
+-|\xb8\xbc\x828f\xcc\x95\xa3*\xca\xca\xeb=\xca\
+\xdf@\x1a\xbc\x0bI\x07\x0e\xec;0q\xe2\xd5\xcd)\
+\xf4\xde\x85N\xdf\x1c^\xf2\xbd\xde\xa6\xc7|!X\xed\
+6\x04\x07\x05!( \x00\x92$!-#\x9d{v\
+_xh(\xe2c=oL6KIE\x92\xefT\
+!\x91\xe7\xd4\xb4\x1f\x10\x10\x00\x9b\xd5\xc6\xeeN4\xad\
+\xb8\xcc\xbd\x9e`\x8b\x14X\xedT\x80\xdd\x06Y\x96a\
+\xb1X\xc1\x89\xf4$\xa6\x0eO\x19\x84\xb2(\xcb2\x06\
+\x0c\x18\x80\x1bn\xba\xf1\x86s\x17\xce7z\x14\xdaM\
+\x9cN\x97W\xa1\x0f\x1fo\xdb.\xbb\x05\x85\xc7\x02@\
+\x8a\x8a\x0a\xc7\xfd\xf7\xde\xdd\xee\xd4\xa9\x13\x85\x84h\xf7\
+\xa5~\xf1\xd9\xa7\xdf\x1a\xb3\x89\x0bF\xfce\x8d\x1e\xcb\
+\x07#\xc3G\xe3\x11\xd5\x15\xff\x9a`\x00\xf4\x14[\xcf\
+(H\x06\xe5e\x00\x08\x0d\x0a\x89\xf9\xe4\xb3\x8f\xe6\xbd\
+\xff\xfe{\x9fth\xd7\xa1\x0b\x87Q\xba\x96\xd0j\xb1\
+H\x09\x09\x89\x08\x08\x0a\xc07_~\xf9\x03!\x844\
+\xba\x5c\xa4\xc1\xfb\xac\xff\xe0\xc1\x03\xe7\xb3\xb3\xb32\xba\
+u\xed\x06\xef\xf3aI\xc1\xda\xafo\x9f\xde\xc5E\x97\
+\xca\x09!\xa4\xbe\xa1\xc1\xdd\xe0\x15\x94\xd5k\xfe\xdeu\
+\xfb\xed\xb7\xa5\xf6\xe8\xd9]e\xb2\x04\x89V~\xef\xb5\
+\xa4\xd7\x7fCh\x93\x9d\x8d\xf4\xe6\x19h\x9d\xd9\x1a\x90\
+$$%'\x81\xf3\xfd\x00\xaf\x01\x88\x07\x00$$$\
+`\xe8\xa0\xc1\xe8\xd8\xces\x16\x80E\xf6\x9d\xcc+K\
+2,\x16\x9aL\x0f\x04\x05\x05\xc1f\xb5B\x964\xa7\
+\xf8\x9a5\x00\xac\x22\xf2\xca\xb0\xd7<\xa1\x06\x00<x\
+\xdf}3\xb7n\xd8\xb0n\xd9\x92e\xbfu\xed\xde\xa3\
+\x9b\x0e=\xdc\xb9\x02\xd3\x06+k\x9e\x8a\x16\x19\xcf>\
+\xf7\xf4\xb8\x82\x82\x0b\x0d\x9e\xb1u\xb8\x1a\x1b\x1b\xdd\x84\
+\x10r\xe8\xc0\x81cii\xc9\x89\x14\x0e\x19\x00\x06\x0d\
+\x1c\x80\xf9_~9\xaa\xb6\xba\xca\xe5\x99\x0e\xf8\xcc\xc0\
+#\x0f?\xf4\xb8\x0e\x9d\x220-\x07&\xfa\xa6\x87S\
+\xcf\x01]\xb6\x01`\x19+\x9a\x0a\xf0\xca\x19\x19\x05\xde\
+\xa0\xa9D'$\xc4Y^\x7f\xe5\x15k@\x80z\xf6\
+\x86\xee\x22Zf\xeb\xd6\x98\xfd\xcc3\x98\xf7\xd5\xfcY\
+\xcaS\xa0\x06\xef`WUT6\xf4\x1f8\x90~\xfd\
+\x13V\xab\x15\x81v;:\xb6o\xd7\xfaLn\xde\x05\
+B\x08\xa9mlp+'\xd2\xac^\xf5\xf7\xce\xd1c\
+\xaeJJo\x9e\xe1\xd7\x16\xdd'\xc9\x13Bx\x7f\xba\
+\xdfQ\x10B\xeb\xd6\x99HNNFzZ\x9aj\x00\
+\x94\x08 !!\x01V\xab\xe7\x81\x03\xfd\xc5\xe1\xe1C\
+\x87b\xf2\xc4Ix\xea\xf1\xc7e\xbb\xcdf\x8b\x8a\x8a\
+\xb6\x87\x85E\xda\xed6\xbb\xac\xbcL\x93\x96\x9a\xa6\xbe\
+h\xd3\xb1}{DDEA\x92$\xc8\xb2\xd9/\xc2\
+i@\xaf?FB\xae\xc9{\xf8\xe1\xfb\x1f\xa7\x9c+\
+\xc9\xcd\xcd;\xd7\xaaek\xa3SM\x84\xc6_\xe7\x87\
+\xa1C\x87\xe0\xd99sF\xe7\xe5\xe6\xd6zd\xc2\xa9\
+F\x02\xdb\xb7n\xdd\x1d\x15\x19\x16E\xe1\x92\x01\xa0y\
+F:f=\xf6\xf8\xbd\x0a}\xca\x13\x85\xfa\xfazg\
+\x9f~}\x861m\x9b\xe9\xbf^\x9fx\x8aj\xa6\xbf\
+<\x1cF\x11\xb8\x9f\xde^\xee\xa7\xc1X\x82\x14\xe0\x1d\
+\x82H\xe7\xb1@\x9fe\xae\x1e\xee\xd9\x22=\xbd\xdd+\
+\xaf\xbe\xfaB\xe7N\x9d3\x1ex\xf0\xfe\xa7\x97\xff\xb5\
+r)\xaf\x9c\x92&\x01n[\x90\x0d\xd3o\x9b1\xea\
+\x9d7\xdfZj\x0b\xb0\xcb\x0d\x8d\x0d$\xc0\x1e \x01\
+\xc0\x8d7\xdcx\xf7\x82\xef\x17|l\xb3Z\xe1p:\
+\x01\x00\xe1\xe1\xe1\x98~\xcbm\x097\xdft\xe3\xdaN\
+=\xba\xb5q\x12\x17\x00\x09VI\xc6\xdauk\x0f\x7f\
+\xfe\xd9\x17WF\x85G\x9c\xfb\xe2\xeb/\xd1\xd8\xd8\xe8\
+k\xd7\xd3;o\x08!\xbb\x89\xe7\x8cE\x89\xa2K\xe9\
+\xb7\xe9\xc3I33[\xa2\xb6\xb6\x0e6\xab\x0d\xf9g\
+\xf2\x11\x19\x13\x85\xf2\x922\x00@V\x9b,\x84\x85\x84\
+\x86\x06\x07\x87$\x06\xd8lIQ\x91Q\xcd[\xb7n\
+\x95\xde\xa2E\x8b\xd4\xe0\xb0\x90\xe8\x88\xb0\x880\x00\x01\
+\x90%\x8b,[\xe4\xba\xda\xda\xaa\x92\xe2\xe2\xd2\x92\xe2\
+\xe2K\x97JJ\xce\x1e>r$7((0\xbf\xa4\
+\xb8\xe4\xfc\x86\x8d\x1b\x0b\xddnwS\x0fMU\xfa\xc6\
+\x02;\x16\xbcq\xf7;(\xd6j\xb1D\xec\xda\xb1c\
+c\xa7\xae];\xd0\xc8^\x99;\xf7\xcd'g\xcf~\
+\x04\x92\x04\xe2\xf9\xfa\xef?=\xdcU\x11tw\xaf\xee\
+\xdd1l\xd4\xc8\xf1w\xdfy\xd7\xcf\xc9\xc9)v7\
+\x01\x91\xbd\x8b6?\xff\xf8\xfd\xca9s\xe6\x5cu\xb1\
+\xa8\xd8YYY\xa9\xbc\xf0\xe5\x00\x80\x8f\xdf{\xef\xe3\
+;\xef\xbb\xefN\xc0sp\x8e$I8r\xe4\xf0\xf1\
+\x9e={\x0e\xa8\xa9\xa9-\xd4\xe1\x0dM\x83\xd1\xe9\xd5\
+tY\x05x'_\xab\xfd\x81\xbfn\x19\xc9\x9c\xf8;\
+\x04\x06\x11\x00 \xb6*zk\x00zO\x06\xd8\xbat\
+\x19\x84\x86\x06\xc6\xee\xd8\xb6M\xddyw\xf8\xd0\xa1C\
+\x16\x8bL\xef\x18\xe4v$\x22*<n\xff\xde}9\
+\x9eP\xaf\x9e8\xbd3\xb8?\x97.\xfd\xa4[\xb7n\
+\x9a7\xbd\x02\xed6\x0c\x1epE\xe0\xba\xd5k\xfe&\
+\x84\x10\x07q\x92z\xa7g\x7f\xc0\xde\xbd\xbbs\xef\x7f\
+\xf0\xfe\x96CG\x8c@||\xbc\x7f{\x9eCle\
+\xca\xf3\xcb\x94\xe7\xe7\xad\xf4s\xbc\x83\xf6633\x13\
+!!!\x18<h\xb0:\xafOOOk9n\xec\
+\xb8k\x9e~\xe6\x99\x17\x96.]\xba.77\xafT\
+\xef\x90\x0c=(+/sm\xde\xb2\xe9\xd8\xc7\x1f\x7f\
+\xf4\xcd]w\xdfy\xdf\x15\xfd\x06\x0c\x09\xb4\x07\xc5@\
+\x0c\xbc\xd0QT\xc6l:\x00 284>\xe7\xd8\
+\xb1\x13,\x8d\xaf\xbe\xf6\xda'\x16\x8b\x85\xb7\xf6\xd1\x14\
+\xcf\xca\xf3\xa8\xb2\xc5b\xc1\x88\x11#\xf0\xf2\xcb/_\
+S]]\xed\xf4xu\x1f/\xd7\xad^\xf3\xc5\x84q\
+\xe3\x95\x08+\x00\x80\xf2\x16\x97}\xc3\xda5\x9bXZ\
+\xbf\xfc\xec\xb3o.\x93>3\xb4\xf3\xd2\x15\xe0E\xc0\
+z\xbae\x94\xde\xe4\xa7\x00f\x9e\x06\xe8)>]\x86\
+\x87\x1f-\x9b7k\x9b{\xfa\xd49\x85\xd9\x17/^\
+\xac\xbef\xf25\xfdBC\xf5O\xbd\xfd\xe2\xd3/\xbf\
+%DY\xf1\xf5\x84l\xcb\x96-\xdb\x9a\xdd\xb6M\xc8\
+\xcc\xe93pEo\xdf\x012\xb2\x0c|\xf9\xd9'\x9f\
+z\xca\x13R\xef\xf0l\xfe\xb8XPP\xfc\xdcs\xcf\
+v\xb9\xa2\x9f\xe6\x9d\x1ev\x00d\x092\xd3?\xbf\x05\
+@\xde \x09!&&\x1a\x16\x8b\x057\xddxs\xf6\
+W_|\xfd\xe0\xfb\x1f|\xf0\xc3\xb9\xfc3\x85\xe4\xff\
+\x08\x1cN\x07\xd9\xb9k\xd7\x81\x0f>\xf8\xf0\xc3k\xa6\
+N\x99b\xb3\xdb#\xa87\x17\xcd\x80^\x7f\xd8\xf0\xd4\
+\x0f^\x7f\xe5\xd5wiz\xaak\xaa\xdd\x13&N\x1c\
+q\x19m\xf1\xca\xb2\xfc\xf6\x84\xba\x90\xd0\xbem;\xdc\
+9c\xe6m\x0e\xefy\x00\xb49}\xef\xed\xb7\xe7\xa8\
+VC\x92\x03$\xc9c\x04\x9a\xa5\xa4\xb4*\xbcx\xb1\
+\x88\xe5\xe1]3g\xdc`\xb1q\xdf50K//\
+\x947[\x96\xd7_V\xd1ES\x00h\xd2H\xd3O\
+\x04\xf2Gb<\xcfgq\xf1:\xa6\xa6\xbf\xff\xd6\x9b\
+\xef(\x8c\xfe\xe2\xcb/\xff\xec\xdc\xb9s@Fz\x86\
+\x7f\xef\xbd\x8e\xf7\xa6\x1boT\x9f 4\xba=s\xf8\
+\xe2\xe2\xe2\xd2\xb4\x8c\x8c\xb6\x00\xd023\x13\xc9)I\
+\x88O\xf28\xbd\x993g<\xa2\x94\xaf\xab\xf7(\x7f\
+AAA\xe3\xcd7\xdf<\xe2\x96[n\xa1ic\x99\
+\xadx~\xd9\x13\x09H\xb2\xacY\x03\xd0\x05a\xfe\xb8\
+\xab\xae\x1a\xff\xf7\xca\x95\x8brrr\x8a\xe9\xc30\xb9\
+\xc0\x09\x02\xfc\x0f\x18W\x0a\x1aG\x0cn\xb7\x9b\xec\xdd\
+\xb7\xef\xd0K/\xbd\xf4RZjZ\x9a1\xb5&r\
+\xc5\xe5$\x00\xb0[\xed\xf6\xd9\xb3\x9exv\xcb\x96\x8d\
+G\xffX\xf4\xdb\xea\x09\xe3\xc6\x8ff\xde\xc5\xff\xb7\x80\
+k\x98\x1f\xbc\xdf\xb7\x06\xa1\x1c\xd4\xeahh \xa3G\
+\x8dR\xde\xeb\x90eI\x0a\x80\xd7)];\xf9\x9a\x1b\
+Y\xf6\x97\x95\x94\x9c\xef\xd4\xa5c\x0b\xa6-3\xf4\xb3\
+\xfa\xc0\xa6\xb3\xb4\x8b\xca\x1a\xfd\x8c\xd6\xebL=\x06\xd4\
+\xb3*F\xa1\x86\x99H\x80\xed\x94\x15\x00\x02l\xd6\xb0\
+\xeb\xae\x9bz\xeb\xb5\xd7O\xbd9%=-\xc2j\xb5\
+\xf2\x1e]I\xf1\xb1\xb1\x188`@f^n^\xa9\
+g0}\xdb?\xef\xb9\xe7\xde\x99ja\x09HI\x8a\
+\xc3\xf5\xd7M\xc5\xdc\x17_\x1cQR\xec\xd9\xe1[\xe7\
+]$$\x84\x90\x19\xb7\xdf>]-,`\xb8\xe4\xbf\
+\xe9\xc7d\xc8\xaf\xc9\x03\x00\xd8\xedv\x5c7e\xf2\xd4\
+\xcd\x1b6\xect\xd2g\x88q\xb5\xd4\xb4>\x9b\x001\
+\x92\xc2\xc2\x8beo\xbc\xf1\xfa\x87\xe9\xe9i\xe9\x9d\xda\
+\xb7\xc3\xc8\xe1\xc3Y\xba\xcd\x18:=P\xebK\x92$\
+\xa5e4\x8b\xea\xd7\xabgPhP\x10\x9d\xdfT|\
+\x22\xbax2\xaa\x86\xd0\xef\xbd\xf3\xf6\xc7>\x8exx\
+RZRR\xd1\xb1}\xfb\x0e\x9e\xca\x92M\xa6\x0e\x14\
+\xf9\xe0\xddw?b\xf9\xf5\xed\xbcy?5\x91\xde\xa6\
+\xf6\xcd\xc8\xf3\xd3\xf7<]c\xf1\xf8\xff\x88\xf1c@\
+\x91\xe7\xe7Y\x1b\xd13M\x11q<|\x16:_\x92\
+dH\x02\xc3\x91\x9e\x96\x8c\xbf\x96/\xf7{M\xf7\x87\
+\x1f~\xfc\x9e\xe6\x96\xddnCTX0\x86\x0e\x1e\xd4\
+\xec\xfc\xb9s\xf9\x84\x10RK\xed\x0c|\xfe\xf9g_\
+\x96};\xd3x}U\xe6\xf9\xb4\xf2\xebYpf\xd0\
+|\xb7\x16\x8b\x8c\xa9\xd7\x5c\xd3o\xc5\x92?\xd6]\xae\
+\xbe\xf2=>]\x81\xcdw3\x7f\xf5\xf1\x9c8q\xbc\
+\xfc\x9d7\xdf|\xe2\xce;f\x84\xd9\x03\xec\x08\x0d\x0b\
+\xe5w\xe6\x1fBzz\x1aR\x93\xb9{\x19\x8c\x80u\
+6F8\xfcdG\x92$\xacX\xb1|\x15\xcb\x8b\x8d\
+\x1b7\xed\x94d)\x18\x00d\xc86\xc9k\x04\xc2\x82\
+\x83c\x0e\xee\xdes\x80\xe5\xd5\x0d\xd7_\x7f;\xa7\x9d\
+\xcb\x01\x9eN\x98\xa9\xc33\x82f\x1c\xb5)\x03\xc0\x22\
+\x00\x83\x80^\x94\xe0\x95\xe5\xe5\x89:(\xc2\xcbvH\
+\xad7u\xea\x94\x9b\xd9\x01\xc9\xcf\xcb=O\xbd\xa5\xe7\
+)/I\xb0Z-\xf8a\xc1\xb7\x8b\x09!\xa4\xd1\xe5\
+;w~\xfd\x9a5K[g\xb7\xd2\xdb\xeb-{V\
+\x0dT:x\xca\x0f\xc1\xbd\xa6\x5cbLt\xfc\xfbo\
+\xbd\xf9\x89\xc3\xc1\x9e>\xac\xa3\xd0\xdc,#\x03\xe0\x13\
+h\xdf\xff\xde\x147\xa1\xf2}ey\xc6`\xe5\x8a\x15\
+\x07\xaf\xbf\xf1\xba\xa1\x13'OB\xb4\xef\xf4^\x91!\
+o2DFG\x99}\xe5\x96\x07\x12\xf3\xd7\x08\x8f\x1f\
+\xcd\x91\xe1\xe1\xc9\x87\x0e\x1d\xf6;9\xf8\x95\xd7_y\
+G)#\xc3\xa2~{`P\xff\x01\xc3\x146)S\
+\x87\x9c#GO\x04\x07\x05\xc5s\xda\xb9\xdc\xfe\xf0\xd2\
+X\xfd3S\xc6\x5cT@\xcc?\x05\x00\x83H/\x22\
+\xe0E\x05\x22K\xa4\xe0\xb00i\xd0\xabc\x91-!\
+;\xb6m\xf7{O\xff\xfa\xeb\xa6\xdeB\xd5\x97\x00 \
+\x22*\x0a\xcf\xce\x99\xf3\x80R\xa6\xbe\xc13\xef\xdf\xbb\
+wonFzz\xa2\xcd\xf3\x9c\xdd\x8f\xc9\x9e'E\
+\x92\xda\x07I\xec\xf9ytk\xf6-L\xb9z\xfc\xb8\
+\x82\xf3\xe7\xce\xe8)m\x93b|U\x9b\xf9u|\x0a\
+\xee\xc3\xad\xbc\xd8\xe4fT\xde\xbf\xac\x0f.\x95\x5c\x22\
++\xfeZ\xf1V\x87\x0e\x1dl\x9c\xfe\x19\x19A]\x08\
+\x0b\x0f3.\xf4\xef\x83\xc6\xc1\xf4\xe8\xd1spuu\
+\xb5\xdfy\xf0W_=~\x92\xb7\xb8\xc5\x06\xab:\x15\
+xe\xee\xdc\xb7\xd9\xb2/\xbd\xf4\xd2\xab\x9c6D\x0e\
+\xc1\x886=\x85\x06\xc48\xc4^^\x8c\xaf\xc9S\x00\
+\xa3\xa7\x00\xbck\xa3G\x824\x1e3\x06\x00\x000\xfb\
+\xa9\xa7\x9ee\x07b\xc1\x82\xef~\xa1\xd8\xa1~:\xea\
+\xca\x11W\xf6t\xbb\xdc\xd5\x84\x10\xd2\xe0\xf4\xac\x007\
+\xd4\xd5\xb9F\x8c\x1cN\xaf<\xfb\x19#\xc97\xc7\xa7\
+\xff\xf2\xce;\x10\xf5\x05VY\xb2|\xfa\xfe\xbb\xef\xb2\
+\xb4\xf2\xc3\xf4\xa6\x1a\x00\xdf\x85[s%\xc0\xc9|\x8f\
+\xd0\xbf5\xb1!Z\xbax\xc9\xa6>\xddz\xa4GF\
+F\x8a\x04\x8e\xe6\xe1\xffO\xd0S4\xda\x91\xa9K\xf8\
+\x8f>\xf2\xe8\x83,\x07\x0e\x1f<t$<<,\xde\
+SI\xb2)Q@xxX\xe8\x81\xbd\xfb\x8e\x10B\
+\xd4\x0dEN\x87\x93\xf4\xee\xd3\xab\x9b\x82\xb8\x09t\xb1\
+\xbc33U\xd6\xc3\xc9\xca\x9f\xdecx\xcf\x8f\x983\
+\x00\x22%\x16-\xf8\xd1\x04\xb1\xc45\xd5\x82\xf91$\
+))\xb1\xe5\x85\x8b\x05\x97\xe8!+\xbeTT\xd6\xa2\
+E\x86g7\x99$\x05x\x0d\x00\x00`\xc9\xe2\xc5k\
+\x09\xf1\x85m\x84\x10\xf2\xd4\x93\xb3\x9e\x91d\xc0n\xb3\
+\xb3\xed{\x95\x9c{\x12/k\x10x}P\xbdKJ\
+B\x5c\xf2\xdf\xcb\x97\xad\xf5\xd3&\xb1\x06\xfa{c\xb7\
+\xa0\xa0Ips\xae.\x17\x0e\x1f:|\xf6\x96\x1bo\
+\xec\xdb6\xab\x15\xcb\xb3\xff\x06\xf0<\x99\x1e\x0d<\xe3\
+\xc4sf\x00\x80o\xbe\x99\xff-\xdb\xdfo>\xff\xfc\
+K\x0a\x99\xfa\xfa\xf0\x8c\xdbn\x1d\xaf\x94i\xf4\xee'\
+X\xf4\xfb\xa2\xc5\x16\xbbf\x87eS\x0d\xa3(\xaa\xe2\
+\xf5]d|E\xd1\xb6\xc8)_\xf6\xcb@t\xc3<\
+k\xc3#V\xc4\x18\xbd)\x06\xedqU\x8b\xfd\xca+\
+\xaf\xbc\xc1\x0e\xd6s\xcf>\xfb\x92\x8a\x83z\x84\xf3\xc8\
+\x7f\xfe\xf3\x04[v\xc5_\xcb\xd7P\x06\x82\xa1Q\x86\
+\xa4\x09\xfb%\x9a\x81,\x88\x8c\x1d\xbavh\xdf\xe6\xd0\
+\xbe\xbd\xc7}\xadr<\xbc\x9fN\xb2\x8bt\xff.\x88\
+\x1e\x16\xf2\xd2Dm\x17\x5c\xb8P\xf7\xccS\xb3\xa6\x06\
+\xfb\x0eQ\x11\xad\xfb\xf0\xc6\xfb\x9f\x80\xc8\xfb\x99\xf5\x8a\
+\xec\xbd\x0c\xdf8#6::\xf9\xc4\xf1\x13\xa7\x09\xd1\
+~w`\xc8\x90AWy\xeb\xc9\x00\xe4\xa8\xc8p\x0c\
+\x1f:\x18\xcb\x16\xfd\xf1\x13!\x844P\x1b\x8a\xae\xbb\
+n\xea\xa4\x7f\xa9\x9f\xac\x0e\xd1:\x06&\x8d5h\xbc\
+<\xbe\xf77\x11\x01\x88\x14\x94Ut3!1\xaf\x93\
+\xec\x5cYd\x00\xac\x92\xe4yD\x98\xd9:\xb3Cm\
+m\x9df\xcev\xe4\xe8\x91\x1cI\x96C\x01\xc0\x22!\
+\x10\x12\x02\x00 -#\xb5MQ\x91\xe7T\x1f%\xf8\
+\xad\xad\xadi\xe8\xd6\xad\xeb\x15\x1cz\xbc\xf4\xb3;\xfc\
+\xe8\x17}\xfc\xb6F\xb3\xd1\x01\x00\xa0m\xeb\x96\x1dO\
+\xe7\x1c\xa3\xe6\xfb\x971\xc7\xd7)\xedv\xbbH\xe1\xc5\
+\x0b\xc5\xbbw\xef8\xb4l\xc9\xe2\xad\xbf\xff\xfe\xeb\xfa\
+\xbf\xfeZ\xbe~\xe3\xc6u\x9b\xb7\xef\xd8\xb6\xe7\xd8\xd1\
+\xa3'\xcbJJ\xaa.\xa7\x0da\x9b\xd4uc]-\
+\xb9\xe9\xc6k\xa7SL\xb0@;\x86\xbc\xb1\x16)\xab\
+^\x9d\xa6\xe0\xd1[\x80\x16\xb5\xa1\x89\x02\xc6\x8e\x1d\x7f\
+\x0d\xdb\xef}\xfb\xf6\x1f\x09\x0a\x09\x8cV\xca\x04\xd8\xed\
+\x08\x0d\x0dA\xbf~\xfd\xda\x96\x14\x97T\x12BH\xa3\
+\xc33\x158\xb4\x7f\xff\x8e\xa4\xd4D+\x85_\xe44\
+\xf4\x1c\xa2^_y\x8eW\xb9\xd6\x9bj\xf3p\x9a\x8a\
+\x00X&\x99]\xd8c=&K\x14\x9d\xce#P)\
+o\x91\x00\x9b$A]\x80\xfa\xf8\xd3\x8f\xbfd\x07\xe9\
+\x8e\x19\xd3\xd5\x0f\xedI\xd4\xb3\xdb/\xbe\xfc|\x1e[\
+\xf6\xa99O\xcd\x85\x16\xbcmJ\x12\xe5\x11\x944\x86\
+>\xee\xbb\x11\x9a>\xb5\xcb\xca\xcc\xce;y\x22W\xab\
+:\xdcX\xdf4\xb8\x5cN\xb2k\xd7\x8e\x13\xef\xbf\xff\
+\xeegw\xdd=\xf3\xde!\xc3\x07\x8fj\x96\x9e\xda\xa9\
+mV\xcbf3n\xbf%\xf2\xfa\xeb\xaf\x09\x8eO\x8c\
+\x09\x06\x10\x1e\x14\x12\x18\x9f\x94\x98\xd8\xb2S\x87\xf6=\
+F\x8c\x1c1\xe6\xce\xbb\xee\xba\xe7\xc3\x8f>\xfcr\xff\
+\xde\xbd\xa7\xc8en%\xe6\x91\xebr:\xc8\xf4i\xb7\
+\xdcN1\xc1B\xf1\x83\x07\xff\xd4\x00\xd0\xe9\x22\xc5`\
+\xd3D\x8a\xc0s8\x00\x80\xaf\xbe\xf8\xdao*\xf0\xfa\
+\xeb\xaf\xcd\x96\xed\xbe7(\xed\x01v\x04\x06\x07\xe0\xf1\
+\xc7\x1f\x9fM\x88\xe7\x1b\x03\x0aL\x9bv\xdb\xdd\x9c\xfe\
+\x19\xf5\x8dUj\xb3}\xa4\xfb\xc33\x08z\x06\xc0\xf3\
+#\xe6\x0d\x80\xa8!\x9eB\x1b\x85'\x22\x82\xd8rV\
+\x09\xb0I\xde\x0dBYm\xdbv\xa9\xae\xae\xae\xa3\x07\
+g\xeb\xb6m\xbb\x15\x8f\xef\xd9\xb8\xe1Y\xac\x19<d\
+\xc0\x95\xec@\x1e>|\xe8PXx\x08\xfdioE\
+\xd1\xfd\x98\xc9\x84\xfe\x22\x81\x04\x00)%)\x09\xe1\xa1\
+\xa1h\x99\x9a\x92qR\xb3\xcf\xdd\xab\xfc\xa2G\xf3n\
+6A\x0b\xa7O\x9d8\xfb\xdc\xb3O\xbe>z\xd4\xb0\
+A\xdd\xbau\x89g)\x90e\x19\xdd\xbavA\x97\xce\
+\x1d\xb8\xe7\x07\xf8(\x94\xd0\xbd{\xf7\xc4QW\x8d\x19\
+\xf6\xec\x0b/\xbcs\xe2\xc4\xf1s\xa2\x96\xfd\x9f\x1d\xb0\
+\xe0Kq\xd4\xd7\xb9\xa6\x5c=V\xf9|\x1a=\xb6f\
+Ad\x00\xd8|\xb6\xac\xd1\x98(@\xd3\xa3\xe7\xa4\xd4\
+\x08&44,>\xefT\xee\x19\xba\xaf\xf55\xb55\
+]\xbbw\xeb\xc4\xd2\x92\x9e\x96\x9az\xe4\xc0\xa1\x13\x84\
+\x10R\xeb}\xb4\xbbm\xdb\xf6\x9d\x90\x10D\x973I\
++O\xbfD\x06\x80\xc7\x17^{\xc6?b~+\xb0\
+\xe8\xc7\xb34z\x0b\x85\xbcz<\x03 \xc1\x1b\x01(\
+\xbd\xfb\xfc\xd3\xcf\xfc\xbc\xffu7\x5c{\x8b\xb7Q\x9b\
+w\xfb& !`\xfd\xfa\xf5[\xe9rN\xa7\x93L\
+\x1c?\x8e\x9d\xa3\xd1a>E\x93on\xe8\xbd\x17Y\
+]\x09\x00\xee\x99q;\xdez\xf9\xc5\x84\x9d\x9b6\x1d\
+\xd6Sh\x91\xd2\xd1P[W\xdb\xb0\xe2\xafe\xab'\
+M\x18s\xbd\xddf\x89\xf4kU{\xa7' <\xba\
+!ABRRR\xc4\x8d7\xde8}\xdb6\xdf\xb9\
+\xfa\x97\x0bU\xe5e\xb5W\xf4\xea\xa9\xf7\xa5\xdd\x7f\x02\
+\x22\xc5\xd1k\xc3H\xd9DJ\xa2\x1a\x8bi7\xdf\xaa\
+\x9eN\xad\xbcT6\xff\x9bo~\xa0\x91\xc8\xde\xf3\x17\
+fL\x9f~\xa7\xa7\x9c\x0ff\xcc\x98\xe9\xf7\xe9g\x86\
+.\x1e\x8d\x86\x8eF\xa7\x0e/_4\x15\x00h\x9d$\
+\xc6\xfb\x00x\x0a+Rj#\xc56ZTd\xdbP\
+\x1513\xb3u\xe7\xa2\xc2\xa2bZ\xf8\xd6oX\xb7\
+E\x92\xa5P\x0f\x91\x92\xfa\x15\x9f\xa9\xd7M\xb9\x85\x15\
+\xd4o\x17\xccg\xb7mr\xd6\x1e$za\xc8h \
+$\xc0\xb3\x8f\xa5{\xb7N\xb6\xcd\x1b\xd6\xad\xf4\xb5f\
+&\xd4\xd6\x96q9\x9dd\xd5_\x7f.\x1f6\xa4\xdf\
+`\x9d6A\xfde\xe9\xa7\x17L\xd9\x9fo\x8e\xce\x1c\
+Yp\xff\xbd\xf7\xdeq\xf6l~\xaeY:yp\xf4\
+\xc8\xa1\x9c\xb8\x98\xe84\x0db145\xcf\x8c\xf7\xd4\
++\xab\xe71\xe9|M\xb9E\xbf/\xfa\x83\x10_x\
+\xefhp\x90\xd1\xa3G\x8f\x07<,\xb4zW\xfc\xad\
+VK\xe8\xb6\xcd[v\x13BH\x85\xf7\xe4\xa9];\
+v\xeeQ\xd6\xa4L\xf6\x83\xa7\x9cl\x1dS\xf2\xc8\xe0\
+\x11\xe9\x93/\x8f\x5c\xde\xdb\x80z\x9e\x9cG\x94\x91\xe2\
+\xeb\x19\x0c\x00\xc0\xfb\xef\xbe\xe7\xf7\x01\x88\xeb\xaf\xbb\xee\
+&os\x16\xc0{\xcc\x8f\x84\x80\xdd;wh<[\
+YYiU\x8b\x96-\x94\xcf\xf3R\xf8}\x8f\xfa$\
+\xff5\x00^?\xfc\x0614\xc0\x82W\xe7\xbe\xf0\xa6\
+\xaf571\x9ekk\xe3\xff\x03{\xb7\x1f\x1d=r\
+\xf0\xd5\x82\x01\xf6Wb1\x88\x0c4;n\x1a\x88\x8f\
+\x8f\x8fy\xfd\xf5\xd7>\xf4\x7f\x11I\x7fo\x02\xbd\xab\
+`\xe1\xaf\x0b\xffHNN\x86\xf7\xf0L!\xbfx\xed\
+s\xca\x8a\xeey\xe5\xf5\xe4\x0e\x02\x1c\xbck\x0d\x7f\xc6\
+]5nHMm-!\x84\x90Z\xef\x22\xdf\xe2E\
+\x8b\xfe\x04<\xdb\xb9%\x0a\xc5\x8c\xdbn\xbf\x97\xe5\xcd\
+\xd4\xeb\xa6\xdc$\xe8#\x0f\xe81\x13\xf5C\xaf/\xac\
+\xbe\xf0t\x8e'\x0b\x86\xe7\x01\xb0\x82\xa3\xa7\xc8\x1c\x8f\
+\xaa;8<\xc6+?\xfa\x93\xe3HJMmy\xea\
+\xd4i\xcd.\xba\xed[\xb7\xec\xb2\xc8r\xb8\x07\xb3\xac\
+\x9ety\xef]w>\xc8\x0e\xc6\xb3\xcf\xa9\x8f\x08\x95\
+>Y\xb4\xd7\x92\xe41\x22*\xad\xb4q\x10\xf5\x19\x00\
+0e\xd2\x84\x9b\xb8\xfa\xad\x0b\xbe\x02\xdf~\xf5\xc9\xf7\
+\x89\x09\xd1\x91\xd0\x07\x85\x0e3e8\x8bA\x12;\xf0\
+\x5c|\x13'^}\xf5\xc9\x13'.j\xe9\x14t\xc6\
+\xed1\x00\xf4\xde\x8a\x0f\xde}\xe7Y\x86\x1e=\xa1g\
+ig\x05\xddt\x14f\x90\xae\x97\x06\xf0\x95\x06\x00\xf0\
+\xee\xdb\xef|H\x08!uT\x1f'^}5\xfd\xc5\
+j\x00@lT\xa4\xf5\xd0\xfe\x03\x07\x08\xf1l\x0a\x22\
+\x84\x905k\xd7l\xb6\xd8,\xc1T1#\x03 \xea\
+\x0b[\x8e\xd7'\x91N\xb1\x8e\x9a\xc6\xe3\xc9'\xc6\x06\
+\xc0,\xb3\xcd\x84\xf8\x22bEx\x00\x00\xf7\xdd\x7f\xff\
+\xc3\xac\xfc\xdd}\xcf\x9d\x0f\xaatx\x1f\x11\xca\xb2\x1c\
+\xb6{\xe7N\x8d\xf7\xcf\xcb\xcf\xbd\x90\x94\x9c\xd4\x9aC\
+3\xc5$I\x86\xa4^\x83i\x9f7h\x12\x00\x0c\xe8\
+\x7fE\xcb\x9cc9\xd4\x82\x91v\xdb\x8d\xdb\xbb\xfd\x96\
+\xa7C55\x95d\xce\x13\x0f?L!\xb7@\xd2~\
+\x8cT\x04I\x89\x89\xc1\xed\xdb\xb6M\xef\xde\xa3\xfb\xa0\
+\x19w\xdd\xf9\xe0\xc7\xef\xbd\xffE\xf7n\xdd\xfb2}\
+T\xd63\x94jF\xd30\x00@\xd7\xee\xddZ\xac_\
+\xef\xf9x\xa6\xa7#\xcaB\xa6\xff\x1e\x06\xf6\x0d\x82\xb2\
+\xb2\xe2\x86\xce\x1d;(t\xd0\xbc\xd3\x13|\x1e\xd04\
+6\xa5\x1e\x9bg\xc6\xf8(\xe5\xfc\xf8\x91\x9e\x9e\xde\xa6\
+\xb0\xb0\xb0\x98\x10B\xea\xbc\x9f\x92[\xb5b\xe5zY\
+\xf6=i\xb2\xdb\xed\x88\x8e\x8a\xc2\x13\x8f\xcfz\x8a\x1d\
+\xe3A\x83\x06^\xc9\xb4!2j<\xc3$\xba\x16\xd1\
+\xad\xd7\x17\x91\xe10\xbd\x13\x90\xa7\xacf\xbd\xbd(4\
+\xd1\x84\xf8L\x9a\x8a\xbfeV\xcb\xf0\xf5\xeb\xd7\xef\x22\
+\x84\x10\x87\xf7u\xdf\xa3G\x8f\xe4\xd8l\x96ho=\
+54\xbe\xfb\x9e\xbb\xfc\xbc\xffc\x8f>\xfa\x94\x80q\
+2 \xe9m\xf41\x1c\x88_\x7f\xfe\xf9\x17\xadF\x98\
+\x0b\x97\x8b/]\xac\xba~\xea\xc4\xf1T[\x16I\x82\
+\x1d\x9e\xa7\x19\xdc\x03\xfbF\x0e\x1f\xd6\xe2\xb6\xdb\xa6]\
+\xff\xd6\xeb\xaf\x7f\xb6n\xfd\x86\xdd\xb9g\xce\x16\xd57\
+\xd4;\x14\x9cw\xdd\xad\x1aD\x8aN\x89\xb9\x17\xf1A\
+\xdb\x7f\xbb=0\xf0\xa7\x1f\xb4\x1f\xd8p\xbb\xc5\xa7\x0e\
+\xd0\x17\x1bV\xaf\xde(yN\xd51j\x1bL\xba\x9e\
+b\x88\xea\x8a\xc6L\xaf\x0e\xaf]v\x8cU#\xfc\xda\
+\xcb\xaf\xbd\xc5\xf6\xf9\xaa\xd1#\xc7\x02\x80l\x91\x11\x16\
+\x16\x0aY\x96\x10\x15\x15\x9e\x90\x97\x9b{\x9e.\xb7\xe0\
+\x87\x1f\x17R\xed\xb02fD\xbb\x9e\xc2+\xd7,N\
+\x91\xc3\xe6\xad\x05xp\x18\x18\x00=\xcf\xce\x12J\x1b\
+\x050eE\xd3\x080u\x95\xf0\x5c\x0d\xc7\xa7\xddv\
+\xeb\x08v\x00^\x7f\xf5\x957\x99N\xc3b\x91\xc2w\
+m\xdf\xba\x9b\x16\xca\xdc\x93'\xf2\xe2c\xa2S\xa96\
+hf\x00\xda\xd3|5k\x02\xf0\x07\x09\x80\xa4\x9c\xd6\
+;r\xd4\x88\xf1\xfeZ`\x0c%\xc5\xe7\xca{t\xef\
+p\x85\xa7uI\xc1k\x01`\xe5D\x00R\xdf>}\
+\x07|\xf0\xde{\x9f\x9c\xc9?S\xae\x87\xf7\xd1\xc7\x1f\
+\x99-\xe0=#(\x9a\xaeQc\xe1\xdf\xf7\x9f~\xfc\
+^5pN\xc1\x1b\x83J\xf7\xe9\xbc\x99w\xdcq\xaf\
+\x80\x7f\xa24\x9e\xec\xd0\xfd\xe0AS\x0d\x06]\x86g\
+\x08\xd8|\x19\x00b\xa3\xe3S\xcf\x9e9{\x8e\x10\xdf\
+T`\xc5\x92e\xabm6\x8b\xcdb\x91\x90\x90\x14\x8b\
+\xae]:!!>\x16\xef\xbc\xf9&{\xd2Q]\xf3\
+\xcc\x96\x1d8m\x98\xa5\x95G/\xcf\xc9\xea\x95\x03\xf8\
+:\xe7I#M\xdf\x07\xc0\x0a\x97\xc8\x22\xe9y~\xb6\
+,+\x002\x00\xc8\xb2\x8c\xb7\xdf~\xfbKB\x08Q\
+\x5c\xdd\x85\xf3\xe7\x8b\x12S\xd4\x90^\x85)\xd7\x5cs\
+\x1d+\x98s_|\x9e\xfe\xea/E\xafF\xf1\x944\
+\xa5}\xd1\x5c[\xedk\x8b\x16\xcd\xa3\xf6\xef\xdf\x7fD\
+O!\xb5O\xd4=\x82SY~\xb1\xa6w\x8fl\xf6\
+\x91\x99\xd2w\xf5\xfb\x89\x00\xd0\xa5K\xa7\xae\xbf/\xfc\
+\xedw\xe5\xf8*\x1ev\xfa\x00\x94g_|\xe1U\x06\
+/\xfdW\xe9\x97\xa2\xe8\xca=;\xb6\xcaz\x81\x04\x00\
+\x16\xd9\x12\xb8n\xf5\x9a5f\xbaI\x1b\x80\x93'N\
+\xe6F\x87G\xa6p\xf8'\x02\x91S1\xaaw9\xc0\
+S \xdeO\x95\x83\x97_\x9c\xfb\x06!\xbeG}\xce\
+\xc6Fr\xe5\x88\x11C\xb2Z\xb7D\xd7.\x1d\x91\x9e\
+\x96\x8e\xd8\xe8ht\xee\xdc\xb1{C]\x9d\x8bf\xcf\
+\xf3/\xbd\xc4~yZ\xafO\x22\x07k\xb4\xfeC\xd7\
+\x05\xfc\xa3:q\xb4@\xcc\xbf\x0e\xcc\x1a\x00\xbd4\xbd\
+\xc8AT\xd6\x8f))II\xe9EE\x97J\x09\xf1\
+=\x8eY\xb4h\xd1ot\x19\x8bEFBB\xace\
+\xd1\xa2E\xcbi\xc6\x9f9\x93\x7f..&:\x83\xcf\
+'\x966\xa1\x8cq3f\xce\x9c\xf9\x80V\x03x\xe0\
+\xf2\xfe\xbc\xef\xe8\xb9\xea\xc9\xb4\x1b\xc7]\xc7\xe0\xf6\x0d\
+\x90\xa4\x1a \xcbk/\xbf\xfaRueU\xadV\xcf\
+\xdc\xc4\xe1v\x11\x87\xdb\xe5\xf9j\x8d\xd3M\x5c.\xa7\
+\xda\xfa\x1bo\xbe\xf9\xae\xa8\x13\x10\x8e\x07\x1b\x01)\x86\
+\xd0\xb7\x0f\x22))9\xf3\xe8\x91\xc39z\xddu\xbb\
+\xb5\xcf\xc1\x09!\xe4\xd99s^0\xcbO\x0e?\xfe\
+\x1b`$\x93\xaa\xe2%\xc5&\xa4\x17y\xd7\x02\x1a\xbd\
+r\xf8\xf7\xf2\xbf~\xea\xd8\xae\x1d\x82\x83\x824H\x7f\
+\xf9\xf9\xe7%4\x9b\xf6\xee\xdbw@\x92\xa4`h\xc1\
+\x8c\x01h\x0a/\xd8\xb2z\x06@+\x07M4\x00z\
+\xca\x0d\x88\x19)\xaa#Zc\x00\x00L\x9e\xac=\xf0\
+\xa3\xae\xae\x9e\x5c7e\xca8\x8b\xef\xa3\x19RtL\
+8F\x8c\x1c\xd6\xd3\xad\xb1\xbb\x84|\xfa\xd9'\xdf0\
+\x0c\xe2,\x82\xa9\x8f\xfexL\xe429448\xfa\
+\xd8\xb1\xa3\xa7}\xda\xa0\xb7{\xde\x97\xf7\xe4\xe3\x0f\xbe\
+\xc8\xc3\xa7@\x8f\x9e\xdd1u\xea\x94\xe6\x8b\x7f_\xb4\
+\x8eU|\xa7W\xf9=sq~k\x0b\x16\xfc\xb8\x10\
+\x92\xe6\x8b\x1f\xac\x00(?\xf6\xdc\x05\x91\xc7Q\xd7V\
+\x86\x0f\x1d:\xba\xb1\xb1\xc1\xe5\xa3\x89\xea\xa1\xdb\xf7s\
+R}>|\xf8\xf0\xc9\x8c\x8c\xf4\xe6\x0c^\x91p\x9b\
+\xf1\xf8f\xc6\x87\x17\xf9\x98Q$\x1e/4kTo\
+\xbd\xfe\xc6\xfb\x84\x10\xd2\xe0\x1d\x80\xb2K%\xe5\xd9Y\
+Y\x1d\xd8z\xb7L\xbb\xed\x06\xcd\xc0\xb8\xdcd\xda\xf4\
+\xe9\xec\x19\x15<\x9ax4\x981\x04l\x19\xd1\xba\x00\
+\xdf\x19\x1b\x18\x00\xd6\x92\xf0,\x0b\xcf\xfa\x98Q|\x9e\
+p\xaaVW\x92$,Z\xbcx\x89\xa2\x04\x84\x10r\
+\xf8\xd0\xa1\x13\x16\x8b%\x82\xaa\x87.]:\xe0\xc3\xf7\
+\xdf\xd3,\xd4TWV\xd6v\xe9\xd2\xd1{\x0c\xb0\xea\
+\xd1,\x00l\xf0<1\x90\x01I\xd9\xee\xcb\xeb\x97\xa8\
+o\xb8\xe7\xde{\xff#\xd0xj\xc5\x5c\x9b\xbcw\xf7\
+\xee\xbf\xc2#\xc3m\x1c\xbc2\x00\xa9G\xef^x\xf0\
+\xe1\x07z\x1f;vT\xdd\xa2\xeb$n\xe2$.\xdd\
+\x85\xc5\xf2\xf2\xb2\xea\xc3\x87\x0f\x9d\xda\xbdg\xcf\xe9w\
+?\xfah^XHh\x14\x85\x97jK\xf5\xf4B~\
+\xf3\xd2=_A\xf2\xc0\xf3\xcf=\xfb\x12m\x00\x9c\xde\
+G\x80.7!\x0a\x99\x0e\xa2\xed\xfac\xb3\x9ex*\
+\xd8nG\x80\xe7\xc4a\x9e\xd2\xeb\x19\x04\x11]\xa2\xfa\
+F^U\x04FtI\x00\xd0\xbd[\x8f+\x1a\x1b\x1d\
+n\xcf\xd8x`\xee\xdc\x97\xde\xa6\xea\xd9\x00\xa0}\xdb\
+vi\x07\xf6\xee;A(^\xfc\xf4\xeb\xcf?q\xf0\
+\xeb\xd1\xc1\xa3\xc1\xe8g4Ug\x1d\xad\xa7\x1d\x03\x03\
+ R`\xb3\x83bT\x17\x1c\xc2\x01\x00\x11QQ\xcd\
+\xce\x9e={\x9e6\x00s\xe6<5W\xf5\xd7\x80\x14\
+\x1b\x1b\x81\xb6\xedZ\xc7\xe5\xe6\xe6\x9d\xa5\x19\xbet\xe9\
+\x92U>\x92d\x99\x22\xd1k\x08T\xa3@\xf7QO\
+\x10\x14\xb0\xae]\xbf~\xa3\xaa\xec\xec#>\xb7o9\
+L\xd1\xdb\xf3\xe7/V\xce\x98~wW\xe5\xeb>,\
+\xde\x94\xf4T\xcc\x993\xfb\x8aS\xa7N]\xf2)\xbf\
+\x8b\xb8\x15\xadb\x0c@yyi\xd5O\xbf\xfc\xfa\xfb\
+\x03\xf7=\xf0P\x9f\xbe}\x06\xb7\xcc\xcaJ\xcbj\xdf\
+)\x22!59Y\x96\xa5 \xa6\x0d\xde\x18\x8a\xfa\xcc\
+\x8e\x95\x02\x16\x0f\x17\xe5\x90\xfd{\xf7\x1d\xa4\x0d\x94j\
+\x00\xbc?'c\x00V\xae\x5c\xb9}`\xbf\xfe\xd1\xa1\
+\xa1\xea\xa68\x91\xb2\xeb\x19\x00\xa3zj\x9eM\x96C\
+\xdaefu\x08\xb0\x07D2\xe5X`e\x96\x07\x12\
+\x9b\xff\xed\xbco\x7f\xa4\x0d\xc0\xfe\x03\x07\x0e\xdb\x02l\
+q\x9eB\x92:\xc0/\xbd\xf0\xfc\x5cz\xccN\x9c>\
+u6>5\xb9\xad\xc9\xfe\xb0kgzNJ\xd4\x17\
+\xbd\xe9u\x93\xa6\x00,\x02\x91E\xe1\xa5\xb3\x1d\xe3\x95\
+\x03\xe7\x1a\x92$\xe1\x81G\xffs\x97\xf2I&\x05\x86\
+\x0e\x1b:\xd0b\xb3\xa8_,\x92$`\xd2\xa4\x89\xd7\
+\xb1>\xf2\xca\x11#\xa62\xed\xb3\xb4\xb0t\xe9\x81\x9a\
+\x7f\xedM7N\xaeW\x0e\x13\xe5\x19\x00\xc5\x0eP\xd7\
+O>\xfe\xc8\x0b\x92\xb7Ol\xbb\xb2E\xc6\xf8\xab\xc7\
+\xb5?y\xe2D\x81\xaf\xae\xcbcBh+B\x08)\
+\xaf,\xaf\x7f\xed\xb5\xd7\xde\xeb\xd0\xb6}7\x0dq\x92\
+\x8c\xb6\x1d:#08\x90\xc7o6\x8d\xc7s^>\
+x\xe5\xc6\x8f\xbbz\xb2J\xa7\x9b\xfei\x8f1\xa1\xfb\
+\x7f\xf3\xcd7M\xe6\xb4cF\x01\x8d@S/::\
+2\xe1\xf7\x85\x0b\x97T\x96W\xd6n\xde\xbce{\x87\
+\x8eZ>q\xea\x8a\xe4\x82\xc5\xaf\xf2\xe0\xba\xa9S\xfd\
+6}M\x9fv\xdb\x9d\x00 C\x92\xac\x90m\x00\xd0\
+o@\xff\xe1\x0e\x87vU\xe4\x8e;\xef\xbc\x8f\xc1-\
+2L\x22Cld\xc8x\xfd\xa3\xf5\x917\xdeMz\
+\x19\x88n\x90g\xa5\xf4,\x8e\x9e\xa1\xe0*\xe2\xc2\xdf\
+\x17.$\xc4\xb7\xd2\xbdf\xcd\xeamc\xc6\x8d\x89\x1c\
+6|\x88\xe7\xc3\x97^\xf8n\xc1\x82_\x09!\xc4\xe1\
+\x89\xce\xc8\xb1\xa3GNu\xef\xdeM9j\x96a\xa8\
+f#\xbc\x99\xad\xb5\x1a\xf8\xe4\xd3\xcf>\xf6\x0d\xa9\x9b\
+sI\xc5\xc3\x84\x90\xfc\xd3GN%\xc7\x87F\x8a\xf0\
+%&\xc6E\xef\xda\xb2]s\xd2\xac\x9b\xb8\x89\xdb\xe5\
+\xd6|\x94\xf2\xcf\xa5\x8b\xd7t\xee\xd8\xb1\xa3\x08\x0f\x05\
+f\x94\x89\xe2\xb7\xf0\x8b\xc6\xec8)|\xb2\xadX\xb1\
+R}*\xc0\x9e/\xc8\xb3\x89\xef\xbd\xf7\xee\xe7\xfa4\
+\xe8*\x9eix\xf5\xd5\x975\x87\xc4,\x5c\xb4py\
+`\x08\xbb\xf6&\x04\x9e\xdc\xd2tZ\x00 \x22,,\
+\xf9\xe0\xc1\x83\xc7\xe8!\xff\xfd\xb7_\x7fW\x0a\xdba\
+Q7\x08\xad_\xbf^\xf3E\xa1o\x17\xcc\xff\x9e\x83\
+\xd7\x8c\x02\xeb\xa5\x1b9]\xde\xb4@\xd3\xdf\xa6(\x80\
+\x04\xed\xb7\xca\xe8o\xc2)@\xe0\xf9v\x19M\x84\x08\
+\x88\xe0\x1aA\xe1\xa1\x09\x99-Z\xb6\x05|\x9e\xf3\x8f\
+\xa5K\x97\xec\xd9\xbd\xa3\xbc\xba\xba\x1a\xcd\x12\xe2\x91\x9e\
+\x9c\x80\x96\x19\xcdR:w\xea\xd4\x15\x80\xfa5\xdd\xef\
+\x7f\xf8\xfegY\x96\x0a\xb2\xdadq\xda#\xf47\xd6\
+\x9a\xf4\xed\xb9\xc8\x98\xd8\xe4\xee\xdd\xbb\x0f\xf0\xa5H\x9c\
+K\x02\x02\xa2\xda\x997_{\xfe\xed\x0bE\xd5\xe5T\
+)\xcd\xc2\xd23\xcf>\xffZ\xb7>=;(\x0c \
+\x84@\x22\x92w{\x92\x04B\x9cx\xfa\xc9\xc7\x9f\x1f\
+=f\xfc\xb0}\x07\x0e\x1c\xf0V\x13\x19X\x05\x0d\x0b\
+</\xe2\x1d?\xc2\x8e!a\xfe*\xd7\xca\x98:>\
+\xf8\xe0\xbdw59D\xf2\xfc4\xe0\xab>v\xec\xb8\
+1]\xbbvKg\xbe\xeb@\x98\x1fM\x1fM\x83i\
+\xf9\x8c\x8e\x8e\xd1<v\x94%{dDT\xbc-5\
+\xad9\x02\x83C`\xd3\xff\xf2\x11\x8f\x16:\xcf\x0d\x00\
+\x15UU\x17\xd6\xacY\xbdR!\x14\x00\x06\x0d\x1a6\
+\xacc\xbb\x0e=\x00\xc0\x05\xb7J\xf3\xd6\xcd[\xb6\xd2\
+H\x86\x0e\x1e6\xbcYFz6\xa7M3\xf4\xd02\
+K\xa7\x13\xa6<M\x9aB7\xfbmB\xedX\x9b\x88\
+\x008\xab\xe7\xbas{3\xf3~^9u\xb0\xaf\xbd\
+\xe1\x86\x1b5\x0e\xd6\xe1&C\x86\x0e\x1d\xa9\xe4\x87\x87\
+\x87!<4\x10\xb7\xdf~\xdb]\x84\x81\xc1C\x86\xa8\
+\xe5(0Z\x117\x84\xf1\x13'Lb\xdb\xd2\x83C\
+\x07\xb6\x1f\xb5x\xdfT\xa4\xdaR\xfbx\xd7]wN\
+\xa3z\xe8\xf9\xf9\x9e\x1a\x12\x97\xcbIfN\xbf\xfdf\
+\xa6\x0fV\x0a\x07\xcf\x13\xe8\xf5E\x14B\xf2<\x07\xaf\
+\x8c\x04\x00\xf6\x80\xa0\xd0\x95\xabVnP\xc8v\x12B\
+\x5c\x9c\x99\x90r\xefp8\xc8\x94\xa9S\xaf\xee\xd5\xeb\
+\x0a\xc4DF\xeb\x90\xf7\xcf\xa0\x7f\xff+\xfa\x1d8\xb8\
+\xaf\xa8\xbc\xb4\x9c\xe4\xe7\xe7\xd7\xdf\x7f\xffC\x93-\x16\
+\x9b\xf7k\xc82{^\x82\x11\xafxe$\x00\x181\
+r\xe4U\x8d\xd4\x07e\x08!\xe4\xde\xfb\xee\xbd\xdf[\
+F}}\xbdG\x8f\x1eW\x94\x96\x96V\xd0\xe5&N\
+\x9a8\xc5\xa0\x0d\x1e\x0dl9\x9eA\xe7\x951\xd2K\
+\x19\x80\xde)\x12\x00\xf4\xad\x22K\x00]\xd6\xcd)K\
+\x7f=\x97\x8d\x224u\xbav\xeb\xda\x1d\x12\x00\xef\x87\
+l\xb7l\xdd\xb4\xaf\xf4R\xd1n\xab\xd5\xf3\xc2_M\
+u\x0d*\xab\xeb\xd1\xfb\x8a\xbe\xfd\x00\xc0\xe5t\x01\x00\
+6m\xd8\xb0\xfbx\xce\xf1=\x0c\x13D\xf4\xb2VQ\
+\xa4 \x00\x80\xf6\xed\xda\xfa\x0e\x84\xd0p\x84o\xc4\xbf\
+Y\xb0\xf0[\x97\x9bTs\xdaEHxH\xd2\xbdw\
+\xdf\xf3\x04\xbc]$J\x11ex\x88\x1b\xb7\xdfr\xd3\
+\x8cO\xbf\xf8r>C\xab\xd3\x8bJ\xecr\xc5J\xac\
+\xe7mX\x9c\xa2qEcC]\xf5\xe2E\x7f,T\
+J\x11%\xe0\x11\xc4sV\xab\x15W\x5c\xd1w\x98=\
+\xd0\x8e\xea\x9aj\x1e\xed\xa24\xb3 Y-\x16\x14\x9c\
++\xd8\xf4\xf6[o\x0f\xd9\xbdo\xd7\xfd\x9f}\xf1\xd9\
+\xc8\xcd\x9b6\xfc\xe2r9@\x08\x91\xdcn7\xdcn\
+\xb71&\x7f\xf0\x93\x8f\x95\x7f\xfd\xb5|\xff\xfe\x03{\
+\xe9\xcc\xa1C\x86\x8d\xb4\xda\xad\x16\x00.\xe5\xc9\xd2\xce\
+\x9d;\xb7\x9c:}\xfa\x04\x8d\xec\x8a+\xfa\x0e\x92\xfc\
+\x0d\x91a\xff\xa0\x1f-\xf0\xf0\x89t\x96Mw\x9b\x09\
+\xb1\xe8PB\x0f\x99\xd28\xcbi^\xf8!\x22\x12\x92\
+$\x05v\xe9\xd4\xa5\xab\x07\x91\xa7\xc8\xae];w\xec\
+;p\xb0\xd8\xe5r\x03\x00i\xdb\xa6\x0dn\xbf\xf5\xd6\
+\xc4V-[v\xf2V\x02\x00l\xda\xb2e\xcd\xf9\xf3\
+\xe7.\x09\xfa\xc0\xf3\x92t\x88\xc4%\xc7\x8b?\xa8W\
+\xcf\xde=\x05e\xfc\xa0\xb6\xae\xd1\xf5\xf7\xdf\xeb\xd7R\
+(\x14\x1e\xb8\x01\xe0\xfe\xbb\xef\xbd\xa3m\xfb\xf6\xad\x01\
+xN \x84\xa4a\xc6\x87\xef\xbf\xfb\xd6\xbc\x05?*\
+sgf\xca\xa2NcD\x06\xb5)S\x1b=\xe3\xae\
+\x12O\xa5K\x00\xb0\xf6\xef\xbf\xd7\x9c>\x9d{\x1eP\
+\xc2\x11\xa2+\xc9}z\xf7\xea\x7f\xe8\xc0\x81\xf0\x06G\
+c\x13H3\x0d\x84\x00\x08\x0e\x09\x81\xd3\xe9:\x94\x94\
+\x94\xf8~Z\xb3\xd4\xf5{\xf6\xeef\xe9\xd7\xd4\xc1\xe5\
+\x7f~\xdc\xbds\xd7\xae\x9d4\xf2a\x83\x87\x0ei\xd1\
+\xa2e\xb67M\xc5\xbbw\xdf\xbe}t\xc5\x91#G\
+\x8eHn\x96\x9a\xe8\xbd\x15\xe9\x85\x02l\xd4J\xd3\xce\
+\xa6\xf1\x14\x9f\xed#\xdf\xe1\x1aL\x01\xe8\x06\xd8\xf0B\
+o\xa5R\x14\xf6+\xd7\xc2\x05\xc0\xde}\xfa\xf6-/\
+\xab\xd0\x1c\xfb\xf5\xd4\xe3O\xdcC/\xfc\x85\x04\x07\xe3\
+\xd99s\xa6\xd4\xd5\xd5\xd3\xc5\xc8\xf8\xab\xc7_\x03\x7f\
+`\xe9c\xdb\xd6\x03\x09\x00RRR2\xcf\x15\x14\xf8\
+\x0e#\xe1\xad\xffQW+V\xae\x5ck\xb1j\xf6+\
+\xa8\xdb|\xa3\xa2\xa2R\xceh^\x1a\xd1\x06\xcf\xeb\xd7\
+\xac\xde\xdc\xb9m\xdb\x80\xd8\xe8(\x9a\x06^8'\xea\
+\xc3?\xf1\xa6\xbc\xfes\xf1\xbd\xfd\xf6[_)\xd4;\
+\xfd&\x00\xea\xfeGB\x08!\xa5e\xa5\x95\x09II\
+~\x8b2\x02\x9a\xff\x11\xfd}\xfb\xf6\xc5c\x8f=\x82\
+\xf8\xf8\xd8\x7f\x82\x86\x05\x0d\xaf\x07\x0d\x1d2\xaa\xa6\xb6\
+V#|\x13&^}\xad\xb7\xa0J\xff\xa81W\x8d\
+wz\xf7\x0e(\xd0\xa9K\xa7^\x0c^\x9e\x1e\x01\xe6\
+\x9e\x06\xf0d\x83G;\xfbW\xbd6\x8a\x00x\x8d+\
+?QL\xc5\xf3FJ;\xfa\x0b\x12\x00\xda\xb5\xcd\xce\
+\x8e\x88\x0cW\x9fi\x1d=v\xa4\xd4%\x91\x9d}\xfb\
+\xfa>\xd9]S[\x0b\xc0\xdd%00@\xadx\xe4\
+\xd0\xa1\xe3\x1bV\xaf\xde\xc2\xa1\x87\xb5\xf4zV\x97\x9b\
+\x9e\x91\x91\x96\x9a\x92\x98\x18#*L\x00\xcdB\xd8\xee\
+\xed[\xb6\xba\x9c\xae\x0a\xef\xad\xd2w\x17\x00\x8c\xbar\
+\xe8\xb0f\x19\x19\xc9\xdc\xe6\x5c.\xbc2w\xee\x8bG\
+O\x9dl\x90l\xeace\x9eG\xa6\xfb \xea\x9fY\
+\xd03 ~\x8bK\xcd\xd2\xd31j\xccU\xa8w:\
+\x0f*\x89\x16\x8e\x03\x92@\xd4\xb8 <<\x22\xb4k\
+\xb7\xee\xecsp\x11\xcdtD\xd6Tc m\xde\xbc\
+\x19o\xbd\xf5\x0e\xca\xca\xca\x9bXU\x8c\x93\xa5g\xfd\
+\xdau\x1b\xcf\x9d;w\x96.4\xea\xcaQ\xa3\x01\xcf\
+\xca\xaa\xe45\xf6\xabW\xff\xbd\xf3BAA\x11]\xae\
+w\x9f>\xbd\xa9[^t\xcd\xe6\x99\x01\xdeb*=\
+(<9\x91`\xc2\x00\xd0\xc8\xd8\x95[\xba\x01\x19\xfe\
+\x8d\xb0\xf5\x00\xfe\x80J\x00$en\xd4\xaaUf;\
+P\x15\x0a.\x16\xe6\xbe\xfd\xe1\xfb\xbb\xf6\x1f9@\xd7\
+\xb1\xf6\xe8\xde\xb3\x13\x9d\xb0\xf7\xc0\x81\xfdeU\xd5\x17\
+8\x94\xeb\xad\x92\x1b\x09\x18\x01\x80\xd6\xadZe\xf2j\
+\xf9\x18\xa1E{\xe8\xd0\xfe\xa3\xdeK\xcd\xbb\xfdV\xbb\
+\xc5z\xcd\xd4k\xa7B\x00_|\xf9\xc5w\xab\xd6\xae\
+[.[e\x5c*\xd4\xccd\xd8\x95_v\xad\xe5\x9f\
+xM\x9e1\xf6\x13z\x05\xfa\xf5\x1f\x80\x1bo\x99\x86\
+\xd2\xb2\xf2\xbd\x87\x8f\x1c)\xd7\xa2\xd2\xa2P\xf8b\x91\
+e\xa9s\xe7N\x9d9\x05Y`\xc7\xa9\xa9\xc6\x8c\x00\
+\x80\xd3\xe9\x84\xc3\xe1lbU!-~t\x10\xb7\xbb\
+z\xeb\xb6m\xbb\xe9\xb4\xc1\x83\x07\x0f\x0c\x0b\x0fM\xf0\
+\x16v\xdb\xedv\x8c\x18>\xe2\xc2\xa9\x93'\x8f\xd2\xe5\
+\xfa\xf5\x1d0\xc8\xe2;a\x98\x95MVq\xe9\xbf\xa2\
+0\x9f\x97G;^]\x87k\xc6\x00\xb8\xe1\xbf\xa8\xc7\
+\xce\x9bE\x8a\xc5\x0a-\xaf\x93\x04\x00d\xc9\x82\xf6\x9d\
+;F\xb4m\xdfI\xf3\x89\xa5\xe2\xa2K\xa7\x1c\xb5u\
+n\x87\xd3\xa1>\xeak\xde\xa2y\xeb\xae=z\xf6\xa4\
+\xcb\x1d\xd8\x7f`\x8f\xec\xb3g\x12\x85]$D\xf4\xfc\
+_\xd8\x17\x09@F\x8b\x16\x99\xfc\x5c\xff\x1e\x9f?\x7f\
+\xaa\xac\xa8\xa8\xf04\xa7\x1d\x84GF&\xf5\xed\xdb\xbf\
+\x17\x0f\x11q\xbb\xb0g\xcf\xde%N\x97\x0bu5\xf5\
+\x0cVu \xdd\xf0\x85\x8d\x97;\x87\xfd' \xfd\xf9\
+\xe7R|\xf1\xf1\x87\xf8c\xd1\xef\xc7*\xab\xaa.\xc0\
+$!Y\xadZ\xb5\xa2nE\xeb\x0c\xffk\xc0\xca\xb1\
+\xaa\x07+\x96.]F\x17l\xd1\xa2EZ\xeb\xec,\
+EN\x88\xd5jE\xf3\xf44\xec\xda\xb5s\x13]\xae\
+C\xfb\xf6\xd9!a\xa1\xcaG\x11\xcdD\xa3\x22\xe7e\
+\x96n\xb6\x0d\xda1\x1b.\x02\x8a\xc2\x0a\x1a\xb9\x04\x8e\
+Q\x90\xc4\x04\xb3\x91\x04\x01\x00\x97\xcb\x81 {`R\
+\xb7n]U\xcf^[]\x83\xc2s\xe7\xf6\xcc~\xe2\
+I\xdc~\xd3\xad\xb0\x07x\xb6\xd3geg7OL\
+\xf2\x85\xe4\x17\xce\x9f\xaf:w\xf6\xec\xe6fii\xe0\
+\x00\x8f\x09f\x04P\x06\x80\xd0\xa8HkZ\xba\xe6\xa5\
+\x16ME\x89Aq*\xff\xfc\x99\x8b%\x15\xe7\xa8$\
+u\xba\xd4\xaeM\xdb6\xb1Q1Q\x00@\x98g\xe7\
+\x1b7l\xd8{\xea\xd4\x89\x0d\x09I\x09Z\xd4\xfe\x16\
+\x9c\x17\xb2\xff\x1b\xc6@\xb4`\xa4\x19\xe3\x8a\xd22\xec\
+\xd9\xbb\x1b\xf9\xf9\xf9E\xe5e\x15E\x0a\x01\xfe$i\
+sRRS\x93\xe0\x8b\x88\xf4d\xe3\xbf\x0d\xa2\xf1\x17\
+M\xadd\x00\xd8\xbb\x7f\xff\xbe\xea\x9a\x9a:%S\x96\
+-\xe8\xd5\xbd\x97:\xbf\xaf\xad\xab\x93\xde\xff\xe0C\xac\
+Z\xf3\xf7v\x1aIlttr\x87\x0e\x1d\x9bw\xe9\
+\xde\x19\x92$\xe9\xc9\xa1\x91Q\xa0\x15YT\x8f'\xf7\
+\x1a=5\xbb\x06\xc0\xae\x03\xb0\x8b\x13~\xc6\x81\x00\x18\
+w\xd5\x88\xf1\xbf\xfe\xf0\xc3\xe2\x9f\x17\xfe\xbc\xf4\xc6\x1b\
+\xae\xbd\xc5\xbb\x19\x847\xc7#\x00`\xb5\xd9\x12\x92\x13\
+\x13\x94\xc53\x94U\x94\xd5\xae\xdf\xb2y\xc7\xc1#G\
+\x90s\xe4\x18\xa2#\xa3a\xb1Z\xd06\xbb\x0d=\x9f\
+DaQ\xe1\xd9\xa5\xcb\x96\xee\xcc\xcf\xcf\x03\x077\xaf\
+?4\xb0\x06B\xe9\x9f\x0c\x00\x91\x11a\x01q\x09\xf1\
+\x09~5\x04\xf7UU\xd5\x97\x8e\x1c:Z\xe2M\xd3\
+\xb4\xd5\xa5S\xe7\xce\xb2\xc5\x22\x01\x80\xc4X\xc8#\xc7\
+\x8e\xed\xdb\xbce\xf3E\x97\xc3A\xd3\xe4g(\xe1\x9b\
+\x1b\xb2\x91\x00;FM\xb9\xe6\xdd\x0b\xcbUW\xd6 \
+:2\xca]Q^V\x22\xa8\xa3\x12\xaa@dtD\
+\xb4\xc5beO\xcae\x8b\xe9\xc1?\x8d\x14xco\
+\x04<\xef\x09\x00())9w\xe4\xe8\xd1St\xe1\
+^=z\xf5\xf2I4! \xc0\x99\xbc\xbc3\xa5\xa5\
+\xe5\xaa\xa1\x08\x09\x0e\x0e\xef\xdf\xeb\x8a\xaecF\x8fE\
+V\x1bz_\x10w\x9c\x95\xbf\xcaX\x8bh\x12M\x1f\
+\xf4\xcaH\x00\xf5\x02\x83\x00hD\xec\xbc\x9fE\xa8Y\
+\xb0\x982\xe5\x9a\x9b~\xfa\xe9\x17\xe596&O\x9c\
+|UF\xf3\x96-^|\xf1\xa5g\x98\xb2\xb2r\x9f\
+\xdd:[s\xd0G]]}\xc9\xc6\x8d\x1b\x0e\x15\x15\
+\x15c\xd0\xc0Ax\xec\x91'p\xea\xe4\x09\xa9}\xdb\
+\x0e\x9d\xe9r\xa7O\x9e>]YY\xa9\xc4\xcd\xb4\xc7\
+2\xea\x0f\x0d\xdc:AA!\xd6\xb0\xf0\x88pM)\
+\x16\x19\x95V^QQA\xdcn\xe5\xf9\xbf\x86'\x99\
+\x99\xadZj\x1b\xf4\xb1\xf4\xc4\xa9S'jj\x1bP\
+S\xd7\xe8\xcb\xf6\x8fT\xd8\x81\xe5\xed\xb70{m\x16\
+\xfc\xa6{\x12\x00g}\x03\x8a\x8b\x8b\xcb\xf5*\xd2\x95\
+B\x82C\x83\xc3\xc3\xc3\xc3\xca\xcaJ+.\x83\x06\x85\
+\x8e\x7f\x02f\xa2\x0e\xd3\xf3\xec\xe2\xe2\xe2\xb2\xed\xdb\xb6\
+o\xeb\xd9\xbd{{\xa5`v\xdb\xacLI\x92\xec\x84\
+\x90\xc6\xa4\xe4$t\xeb\xda\x15\x0d\x0d\x0d\x97\x8e\x1c9\
+r\xba_\xbf+\xda\x11\x00\x91\xd1Q\x88\x8a\x89\xe9\xfc\
+\xf8c\x8f\xf1\xf0\xf3hT#H0\xe3\xc0\xe9\x87\xc4\
+\xf9KO\x1dA\xe1\x92\x01\x10\xb3[-ysy\x1e\
+\x11\x00\x80\xe8\xf8\xd8\x98G\x1f}\xfcq6\xfd\xde{\
+\xee}\xa8\x7f\xbf+\xb8{\xda%\xc9\x82v\xed\xdaw\
+\xa2\xd3\x8a\x8a\x0a/^**\xb9\x04\x00.\xb7\x0b\xe1\
+a!HNI\x8ek\xdd&\xbb\x8bJ\x98\xd3\x85\xb3\
+g\xce\xee\xe9\xdfo\x00]\xd5\xcc\xf4\x03\x9ck\xb6\x1c\
+\x82\x03\x02-\xa1\x81\xd4\xa9\x0fT)\x9e;\xa9\xf7<\
+\xa2\xf0+\x22\xdb,HIKQW\xff\x09\xa5Wn\
+\xb7\x1b9\xc7O\x9c\xf1d\x10_\x11-\x1eQ\x88~\
+\xb9\xa0\x13\xc7h\xda\xa5\xf3d\x00\xb2\x9b\x10\xd4\xd4\xd5\
+\xa1\xba\xa6\xba\x9aS\x87\x0b\xc1\x01\x81\xf6\x90\xb0\xf0\x90\
+\xcb\xa0\xf3\xbf\x09zS^6\x1f;wl\xdfI\xdf\
+\xc7\xc4\xc4&g\xb5i\x95f\xb5\xcb\xe8\xd5\xa7'\xba\
+v\xeb\x86\x98\xb8\x98\xc2\x9c\x9c\xa3\x87\x00@Y\x96l\
+\xd1\xbc\xb9\xc6\x11p\xdaQ\xd2\xd8qf\xe5\x97\xa5\x89\
+\x17=\xf0\xaeUyj\xea\xbb\x00\xf4\xb5f1\x81.\
+\xd3.\xabmBBRR*\x00\xb8\x09\x81\xd3\xe5\xd9\
+\xa9\x97\x90\x98\x186\xe5\x9a)\xad\x99\xef\xd5H\x00\x10\
+\x97\x90\x12\xd4\xa6M\x9b\xf6t\xc6\xc9\x93'O)k\
+x\xdb\xb7l\xc1\x1d3\xee\xc0\x92\xdf\x7f\x8bi\xdb&\
+\xbb\x85R\xa6\xa2\xb2\x92\xec\xdf\xb7golt\x04\xe2\
+b\x0c\xb7\x9a\x9a\x0d\x03\xd5\xd5Y\xab\xcd\x22\xdb\x95o\
+\x883\xba\xc9\xd5@\xffD\x19\x00\x12\x12\xe2\x02\x12\xe2\
+\xe2\xe3|\x84\xf8\xc8())i\x88\x8c\x8c*\x199\
+z\x0c\x06\x0d\x1e\xc2\xa3Y\xef\xfe\xbf\x01\xf4X\x13I\
+\x92@ \xa3\xb1\xb1\xd1a\x16\x81l\xb5Z\x03\xec\xdc\
+\x0d\xf9\xff?\xfa\xc3\x03\xda\xd8\x89Bi\x05d\x00\xa8\
+\xab\xaf\xcf\xa7\x87\xdbn\xb7E\x0f\x1f2\xa2\xcdC\x0f\
+<\x0c\xa7\xd3\x85\xf9\xdf\xcd\xc7\xa2%\x8b\xdd\xc7O\x9d\
+<\x0c@\xdd[\x93\x94\x94\x94\x92\x94\x94\x10\x9c\x92\x92\
+H\xe3\xd43\xc0\xa2k\xd1\x14\x5c\xb4VD_\x13\x98\
+\x88\x00\xd85\x00v\xfe\xcf\x1d\xbc\x8d\x1b7\x1c?\xb8\
+\xff\xd0\x0e\x00\x90%\x09V\xef&\x9e\xa2\xa2B\xe7\xc6\
+-\x9b\xcei\xf7\x18y:\x1e\x1f\x1b\x1e\xd6\xa2EF\
+\x06\x9d\x91\x93s\xf4\xb8r\x1d\x15\x11\x017\x00\xd9b\
+M\x8a\x8a\x8aTO\x9d\xadkh(\xdb\xb5k\xd7\xe1\
+\xdf\xffX\x82\xe2\xd22=\xfay\xe1\x9dh\x8dCM\
+s\x03 \xca\x09DTI\x91d\xd8lV\x1bu\xab\
+Z]\xa7\xdb%)\x93\x05\x97\xc3\x01\x10\xa2nO\xad\
+\xae\xae\x91\x12\x12\x121a\xd2\x04u\xf7#\x03\xff\xd4\
+\xdb_.\xf0\xbd\x0f\xf1\xfcQOH5\x09\xd2\x7fQ\
+\xd9\xa5\x7f\xde\x94aDT^Yy>'\xe7\xb8\xfa\
+\x9c?)!\xd1\x1e\x17\x1b\x97}\xe6\xccy\xc8\xc4\x82\
+\xbcSy\xa8\xaf\xaa\xc7\x89c\xc7O\x03\x1e]\x00\x80\
+\xb0\xb0\xb0\xd8n=z4k\xddZoo\x940B\
+\xa3i\x10\xed\x13\xe0Mo\xd9|\x8f\x83\xd3\xa3\x80A\
+\xc0.J\xb0\xc8\xe9F\x9d\xaf\xbf\xf2\xf2\xeb}\xfb\xf6\
+\xec\x1f\x11\x11\xa5n\xea\xf9\xf8\xa3\x8f^\xfa\xf9\xe7_\
+\xb7\xf1\x88\xad\xab\xa9\x89JIJ\x8a\xa33N\x9f<\
+u\x12\x00$IB\x87\xce\x9d\x90\xe5p\xa0c\xfb\x8e\
+\x1a\xae\x9d;_Px\xe8\xd8\xb1\x02\x00\xf4\xeeE^\
+\xf8\xc4\xb5\x80L\xdfh\x9a\x08\x00\xb8\x5cN\xe2TB\
+\x18\xaa\xbaH\xbc\x02\x02\x03\xe8#\xb1U<\x97.\x5c\
+\xaa\x9f\xfd\xc4\xec\xa7[\xb7i\xd92:6\xc6i\x93\
+\xed\x91\xc1\xa1!\xd6\xc4\xa4\xc4\x88\xfc\xbc\xb3r\xce\x91\
+#\xb9\x87\x0e\x1c\xc0\xd6M\x9bh\xfa\x00\xb1 \xfc7\
+A\xd3\xa6\xcb\xedF}}\x1dBCC\xec\xda\x22:\
+J\xe7v\xbb\x89\xf2\xd2\x86\x0e\xee\xcb\x07\xd1\x14\xfa\xb2\
+\x80'\x17\xf4\x5c\x5c\x06@\xb6m\xdf~\xee\xd4\xa9\x93\
+G\xb2\xb3Z\xc7\x03\x80\xd5nGHpp\xfaO?\
+y>#\x98\x96\x96\x86\xd8\xd8\x18\x84E\x84\x15\x94\x97\
+W!2\xd2\xf3\xf4/99%\xdaf\xb5\xb7X\xbf\
+~c\x8eA{<\xa6\xea\xad]\xb1k\x00,\xb0z\
+a\xb8\x08H7\xaa'\x94t\x9e\x05\x80k\xdd\xc6\xf5\
+\xab\x06\x0d\x1a\xd8\xff\xd1G\xff3=-=-\xe9\xd3\
+\xcf\xbf\xfa\xed\xbb\xf9\x0b\xe6I\xb2\x0c\xe2v\xb3\xab\x93\
+\x88\x8e\x89\x8a\x0f\x8b\x08W_\xe0nll\xc0\xb9\xb3\
+\xe7\xce\xd8mV\xf4\xe8\xde\x1dWO\x9c\x04\x97\xcb\x05\
+\xbb\xd5\xd6\xda\xe5\x22\xf0.\xa6\xa3\xa8\xf0\xe2\xb9>}\
+{\xd7\x1c=|\x0c\xe5\xe5\xe5<c\x04A\x1a\xcfH\
+\xf8\x95k\xa8ot\xd5\xd7\xd6\xd7\xc2$\x84\x86\x84\x86\
+\x05\x04\x05\x854\xd4\xd5\xd50\xf8\xa4u\x1b\xd7\xfd\xb5\
+q\xcb\x06L\xb8f\x02\x16\xff\xbe\x04\x9d:uDv\
+\x9b6\xf8\xf1\xfb\x1f\xd0\xbaUk\x1c9zDD\xeb\
+\xff\x1c\x04\x05\x05!\x22<R]\x1c\xf5\x08\x08\xcf\xde\
+zr\x5c.\x97\xab\xae\xa1\xa1\xe1\xff\x8e\x22}\x96e\
+\xa4g\xa0\xe0b!\x1a\x1a\xeat\xcby\x81\xa7t~\
+S\x83\xea\xf2\xf2\xf2\xbc\xfc\xfc\x93\x00\x06\xb9@`\x81\
+\x84\xb4\xb4t\xe5\x18z\x5c9\xeaJ\x5cw\xfd\xf5\xd8\
+\xbbo_\xd1\x89\x9c\xa3\x17z\xf4\xea\x99\x0c\x0011\
+1!\xa9))\xe9\xcc\x0bJ\xac\xb2\xd3\xba\xa6D\xea\
+\xcab\x1e\xad\xf04M\xa2\x01\x10Zg3\x06\x80\x9d\
+\x1b\xf9-$0\x0d\xbb\xe11\x02\xee}\xfb\x0e\xee\x9a\
+9\xf3\x9e]\xa1\xa1\xc1(,,\x06<\xef\x18\xd0\xf5\
+\xd4'\x00\xcd\xd2\xd3R)\x1c\xa8\xac\xa8\xacq8\x1c\
+%\xf1q\xb1\x08\x8f\x8c\xc2\xb1#\xc7PQY\x89\xf1\
+W_\x9d\xae(?\x08\xc1\xa5K\x17OM\xbaf2\
+y9g\xae\x88f\xbd\xfe\xf0\xfa\xa71\x0c\xd5\x95U\
+\x8dee\xa5\xa5B\xee0\xbc\x8d\x8a\x8a\x8a\xcf\xccj\
+\x15{\xea\xf8\xc9\x9a\xfa\xdaZ?\xa1q\xb9\xdcX\xf8\
+\xf3o \x84`\xd7\xce]\xd8\xbdk7\x08!\x8a\xf2\
+\xff\xabn\xec\xff\x12\xea\xea\xea\x10\x11\x15\x11\xe1K\x11\
+9,o\xf9\xfa\xba\xc6\x92\x92\xe2\xaa\xff\x0aq\x1c\xb0\
+Y\xad\x90\x8dg,ld(\x8a\x0e%\xa5\xf4\xf9\xf3\
+\xe7\xf2\x01\xc0\xe5\x96`\x91\x81\xc8\xe8\xc8\xb8\x98\xd8\xd8\
+\x00\xd9bi\xb8p\xfe<\x16/\xfc\x15\x05\x05\x85E\
+\x1d\xb2\xda^\x00\x90\x0cx&\x82\xcd33\x93d\x8b\
+\x05nOp\xc9k\x87f\xa8\xa2\xf8F\xf3z\x85>\
+ZWYG'\xd3\xf7f#\x00=`\x09tS\xf7\
+\xa4\xba\xba\x06\xd5\xd5\x8a3\xd4,:j\xe60)\xcc\
+.\x9e\x92\xd2\xd2\xca\x06gcEdd$N\xe4\xe4\
+\xe0\xefU\xab\xe0t\xb9\xac7\x5c\x7f\x83o\xe5D\x92\
+p\xfc\xe4\xc9\xbc\xdd{v\xa3\xaa\xb2\x8a\xc6\xcbc\x94\
+A\x8c\xea\x97\xe7\x02\x80\xd2\xf2\xf2\xfas\x17\x0a\x0a4\
+9:\x98\x92\x93S\xd2Zgf\xa6\xe4\x9e:\x9d/\
+*M|g-\x10f\xda\xf2\xbf\x0a~\x02\xeav\xbb\
+\x02c\xa2\xa3b\xe9\x02J1O\x87\xb5\xebT\x15\xe5\
+\xe5ev{`\xf9\xffi\x10\xa0\x03n\xb7\x0bn\xb7\
+\xaeme\x1d\x9bq\x08M\x80S'N^\x00\x00\x9b\
+\xb7\xbb!!\xa1\x91m\xb2\xb3\xe3C\xc3\xc3\xcf\xd6\xd7\
+\xd4b\xc7\xe6\xad\xa8\xac\xa8*\xad\xac(\xd7\xec\xed\xb6\
+[\xacqn\xed\xcc\x927\xfeF\x0e\x817-g\x9d\
+4\xfd\x97\xb0yf_\x07\xe6yzq\xbc\xa7\xbdV\
+\x0e\xdd`_\x08\xd2t8\xd9\xbb\x05N\x81\xb2\x92K\
+\x97\x0a\x0b\x8bj/\x5c\xbc\x08\xab\xdd\x82\xccV\x99h\
+\xde<#86>V\xb3\xd4\x9f\x9f\x9f\x7f\xe1\xd4\xf1\
+\xe3\x88\x8b\x8b\xa5i\x12\x0d \x01\x87\x09\x9czj\xdd\
+\xda\xeaj\xf7\x99\xfc\xfc\x5c\x0e.\x0a\x85\xaf\xa9\x8c\xf4\
+\x8cH\x9blO\xaf\xad2|B\xf6\xbf0\xb77\x0b\
+~F,%==#%%5YP\xde\x0f\xce]\
+8_R\xd7P\xd7 \xc92$\x8b\x0c\xd9b\x81l\
+5\xfc\x0c\xe2\xbf\x06n\x02\xc8M\xb3\xb1\x22'\xa2\x5c\
+K\x00PUSSP__\xaf\xee\x05\x09\x0d\x0e\x8e\
+j\x95\xd9*\xbec\xfb\x0eht9\xb0\xfb\xe0>\x1c\
+9}\xc2Y^Y\xa1\x89\x22c\xe3c\x92\xa8[V\
+\xaf\xcc\x84\xf3<E\xe7\xd1\xce[WP\xd3\x9b\x1a\x01\
+\x88B\x22^\xbeB\x84\x9bS\xceo\x1a\x11\x1b\x1b\xab\
+y\x7f\xb3\xb8\xb8\xa4\xb8\xba\xba\xaa\xceb\xb3\xe3\xcc\x99\
+3\xa8\xadm@bb\x5cx||\x5c$]\xae\xe0\
+\xfc\x85\xa2S\xa7r!\xe9\x9fm\x22R.\x1eM~\
+\x8b('O\x9c\xccQ\x0b\x11\xa2\x1eS\xe6\x9b\xf7j\
+\xf9\x9f\xd9\xbaU\x1bO\xef$x\x9f\xeb\x9bU\xee\xff\
+e#\xa0\x81\x8e\x1d:\xb6m\xd6,-\xdd?\x87\xbf\
+@z\xee\xec\xf9\xdcfi\xcd\x90\x9c\x9c\x02B\x80\xb0\
+\xb0P\x04\x07\x07\xa2\xa2\xa2\x12\xf5\xf5\xf5\xd8\xbfg/\
+jjj85/\x0f\xe8W@dYFxX\x18\
+\xf2\xcf(A\x99p*\x0bp\xc6\x1f\x82)\xe5\xf8\xf1\
+\xe31\xea\xaaQ%'N\x9c(\xe9\xd0\xa1C\x0c\x00\
+X\xed\xf6\xc8\xce]:\xc7w\xed\xda\x0d\x07\x0f\x1fD\
+C\xa3\xc7\xcbW\xd5\xd6\x94\xd3u\xe3b\xe3\xa3\x01\xd8\
+\x014R\xed\xb1\x8a\xad\xe7\xe1EJ.\xea\x93\x92\xae\
+\x89\x0a\x8c\x0c\x80\x99\x10\x84%D/\x84\xe2\xd5\x07\x00\
+D\xc6h\x1f\xe2\x97\x97\x97\x95:\x1a\x1a\x1b\x1d\x0d\x0e\
+\xd4{\x1f7\x87\x84\x84E\x87\x85\xfb6\x93\xd4\xd6\xd5\
+\x11\x9b=\xb0\x12\x00\xbd\xb0\xc8c\x06\xdb\x9e^\xc4B\
+\x97\x93\x01\xb8\x8f\x1e=tRE@|\xc5|\x9f\xf6\
+\xd3B\xb7n]{\x06\x87E\x86\xd4VW\xd0\x12\xdd\
+\xd4\xf9\xfd\xff\xf4z@\xf7\xee\xdd\xba\x04\x06x^k\
+S\x16\xc0DPUU\x85\x8b\x05\x05\xfbF\x0e\x1f\x8e\
+\xe0\x90\x10\x04\x05\x05\xe1\xc8\xe1\xc38\x9b\x9f\x8f\xe0\x90\
+PDGD\xc2f\xfbw\xa3\x01Y\x92\x83\xdb\xb4\xce\
+\xca\x0a\x0c\x0d\x8d\x88OLByqQ^dDd\
+\xde\xb0\xe1#\xf1\xf3\xcf?\x98Y\x1bb\xc1\xcf`8\
+\xdd.\x5c((()\xaf(/\x03\x10\x03\x00\x09\xf1\
+\xf1A2!\xd1\xdb\xb7nA\xce\xd1c\xbe\xca\x0eG\
+%\x8d,\x22\x22\x22\x5c\xb6X\x22\xdd.W\x91\xa0M\
+\x11CE\xca,z3T\xcf\x98\x99\xde\x0a\xacG\x10\
+\x8f0\x16x\x91\x81o\xf2k\x91\x10\x1a\x16\x12FW\
+\xa8\xac\xac\xa8hp8\x9d\xf4\x9e\x81\xb8\xb8\xb8\xa8\x00\
+\xbb]\xa5\xb9\xbc\xa2\xa2\xcej\xb3\x9au\x1bF\x03\xac\
+SS*<\x91\x9f{\xb1Uzs\xef\xfa\x83\x1b\x80\
+,\xecp\xdf\xde\xbd{6OOm~\xf8P\xf9!\
+\xa6\xc8\xff\xb2R\xeb\xd1\xa6vQ\x92-\x00`\xeb\xde\
+\xa5Kw\xa8\x15\xb4~\x80\xf5\x0aN\x97\xaba\xfd\xfa\
+M\x07\xce\x9e=\x8b\xc4\xc4\x04\xb8\xddn\xec\xdf\xbf\xf7\
+r\x8f\xe92\xa4\x7f\xc4\xc8\xa1\xa3\x1e}\xf8\xd1Gz\
+\xf4\xe8\xdd+<*\x22\xa4\xc1\xe1\xc0\xcem\xdb\xce\x11\
+\x97\xeb\xafU\x7f\xaf}\x1f\xc0~\xb6\x8e\x00\x9f\xd2\x1d\
+n\x99\xfc\xbc|\xc8\x16[E\xff+\xfa\x95+i\xd1\
+118z,'\xe2\xa3O>\xd6\x94-\xaf\xac`\
+\xe7\x84\xe1S\xae\xbf>b\xcd\xaaUEE\x17/\xd2\
+\xe9z\xf2!\x9a\xcb\x8b\x1c\xb1\xa8\xaez}\xb9\x8b\x80\
+z\xc6@\xa8\xe8\x1c\x02$\x00$4\xc0f\x0d\x0f\x0e\
+\xd1|d\xad\xae\xae\xbe\x9a\xd90\x84\xb8\xe8\xe8\x18\x9b\
+\xcd\xa6n\xb4\xa9\xab\xa9\xad.).\xa6\xdf\x01\xd0\xa3\
+\xd3(\xe4\x13\x1a)\xbb\xd5\x9e\xbfg\xc7\xaem\xad\xd2\
+\x9b_-K\xde\xa3.$\xdf\x81\x17,$$&F\
+e\xb7\xcd\xeer\xf8\xd0!\xda\x004U\xf1\xff'\x0d\
+\x85l\xb5`\xf4UW\xf5\xeb\xd5\xa7\x8fw\xef5\xe1\
+.$y\xb8\xe3\xe1Oq\xf1\xa5\xe2\x13\xb9\xa7\xf2\x88\
+\xc3\x89\xd2\xd2R\xe4\xe6\x9e\xe2\xd4\xf8G\xa0\xf2\xf7\xe6\
+\x9bo\xbe}\xde\xbcy_\xd0\x99\x816\x1b\xfa\xf7\xef\
+\x9f\x0a\xe0\xf6\xe6-3\xaf?r\xec\xf0\xad\xbf-\x5c\
+\xf83\xf4Ci\xda\xab\xfa\xb5\x03\x00\x8e\x86\x06\x94\x16\
+\x16\xd5\xd4\xd76h\x1e\x13'%'\x871\xf5P^\
+V\xaa1\x00a\xa1a\xa1v\xab5\xcc\xfb\xf2\x17\xdd\
+>Oo$\xe6\x9a6\x00l\x1fx\xb2&\x9c.4\
+e+0\xcf\x12\xb2\x0d\x1b\x85-\xf4\xbdZ684\
+\xd2n\xb7k6\xd0\xa0\x81\xf3\xc064\x22,\xccj\
+\xf5\xad\x1cUWWU\xd5\xd6\xd6\xb0\xcb\xcalg\x9b\
+\x12^q\x8d\xd6\xae\x9d;]\xfb\xf7\xee\xf6\xbc\xd7M\
+\x1d\xa5\xef\xd7a\xaa\xd6\xd4)S\xae\x91\xad\xba\xa7\xfa\
+\xf0\xaeE\xd1\x93\x08\x9a\xb4\xaa\xf5o\x80\xab\xb1\x11\x1d\
+\xda\xb7\xef\x9d\x10\x17G\x1d\xba\xaf%C\x02\x01\xf5N\
+\x03v\xee\xd8\xb9;9>\xbe\xb8G\x8f\x1ep\x11\xde\
+^\xa0\x7f\x07z\xf5\xee5\xf0\xa3\x8f>\xfa\x90Ns\
+\xbb\xdd\xa8\xad\xad\x81\xdb\xedi\xb7Y\xb3\xd4\xa0o\xbe\
+\xf9\xe6\xdb.\xdd\xbb\xf7\xd5\x90\xec\x7f\xcd>z\xf3\x0b\
+\xa5+\xcb\xcbQp\xfe|]\xa3C+\xab\xc4\xe5\xa4\
+?H`\x01\x80\x9a\xeaZM\xa4\x1a\x9f\x10\x1f\xbck\
+\xfb\xf6\xd0\x92\x12\xbf\x17*y\xb4\xf0\xf4N\xf9\xb1o\
+\x09\x82\xb9g\xffj\xf4\xa3I\x1f\xc6\xa0@y\xd4G\
+\xafXJ\xcc\x8f\xc0\x7f\x01\x90f\xa8\xaa\x9cV\xbb\xd5\
+j\xa5<;\x00\xd4\xd6\xd7\xf9=/\x0a\x0a\x0e\xd5\xbc\
+LRSW[[\xd3P\xab\x98P\xd1\xd1\xe5\x0a\x18\
+YE\x9e\xb1P\x0d\xd5\x81C\x87\x0f9\x1c\x1e!b\
+\xdf\xe5\xe7a\x1c2h\xc8\x80\x96\xad[)o7\xb2\
+\xb8\xd9\x81\xd5\xb3\xdaF!\xaa\x9e\xe1\x95\x0c\xf2i0\
+\x8a8\x08\x00H\x16k\xe4\x88a#\xc6\xd3\x15$/\
+?\x08\x88\xbaF\x22Q\x87Mm\xd9\xb4e\xb9\xcb\xe9\
+r\x11\xe2Bi\xb1\xee\x1b\xc44\xddf\xd3T\xdeM\
+\x9dz\xdd5!!!\xaa#Y\xb7n\xfd\x86\x89\x13\
+'Nzr\xce\x937\xee\xdc\xbb{\xbd\xf2\x180,\
+4\xd4\xfe\xd4\x93O>n\xf1\x88\x1cO\x86yJ\xe3\
+'\x1b\x05EE8}&\x0fn\x09\xf5t\x86=\xc0\
+NG\xb3\x1e\x03\xd0X\xab\x91g\x9b\xcd\x1a\x98\x92\x9a\
+B\x97\xa3O\xef\x91\x98k\x0b\xb44\xf0\xc2}z\xb3\
+\x10\x8b\x8b\xed\x8f\xda\xa6Y\x03\xc0*.k\x19\x8d\x04\
+Pd\xa5$\x00h\xa8\xad\xb7\xda\xac\x9a=\xf4p:\
+\x9d\x0e\x16\xb9- P\x13%4646\xba\x1b\x5c\
+\xcaKVD\xf0\xe3}\xf1\x85g\x90\xfc\xe8\xa2a\xdd\
+\x9a\xb5;w\xee\xda\xb1\x13\x80\xf2\xaa\xb7\xa0K\x1e\x88\
+\x89\x89\x89\xbc\xed\xa6\x9bfr\xda\x15\x19\x1a12>\
+\x88p5\xb5\x0c\x0b\xbc\xa8D\xad\x7f\xe5\x95W\x0e\x1a\
+8\xa0\x9fz\xaa\x91\xdf\x9a\xbf$i\x1a\xac\xae\xael\
+\xdc\xb8y\xcb\xf6\xa3\xc7\x8e`\xcf\x9e\xfd\xa8\xad\xfd\xf7\
+V\xfa\xc1\xf4m\xe3\xc6\x8d[v\xec\xda\x99WYU\
+\x89M\x9b\xb7\xee\x1fs\xd5\x98\xab\x17/^\xfc[^\
+~\xfe\x82YO<1\xe8\xbb\x05\xdf\xadQ\xca\x0e\x1b\
+:\xf4\xca\xf6\xed;\xb4\xa7\xf0\xd08Y\xc3\xa9\xcb\xbf\
+F\x87S\x13\xc7\x07\x07\x04\xa8\x8a\xad \xa8\xae\xafo\
+hllT\xf1X\xedvk`p\x88\xee\xd7J\x18\
+\x14,\x8d\xbc\x9fR^/Zo\xf2\x14@\xb4\x98@\
+\xdf\xf3\x1ae\x95\x8b%@m;0 \xc0\xef3]\
+.\x97[=\xd4M\xa9`\xb7Z4K\xc5N\xa7\xc3\
+)Ye7\xf3\x92\x19O\x99\xe84\x91\xf2\xf1@\xa5\
+\xa9\xa6\xa6\xa6t\xdb\x8e\xed\xdb\x00\xa8\xdb\x90\x8d\xf4\xea\
+\xda\xa9\xd7N\x8e\x8c\x8c\xa4\x9e\xf7J~\x17:\xd0T\
+c\xf0o\x03g\xec$\xeb\x03\xf7?p\xbf_\x01%\
+\x97\x1ab\xe5j\xdd\xba\xf5\xeb\x0f\x1c\xd8{\x88\x10\x82\
+\xe2\xe2B\xb3\x0b\x7f\xbc\xfe\x18\xf6\xf1\xf7\xdf\x16\xfe\xf0\
+\xce;o\xf68|\xe4\xf0\xf8{\xef\xbbwjMm\
+u\x19\x00,^\xb8\x18k\xff^\x8b\xa5\x8b\x17\x7f\xa9\
+\x94\x0d\x0f\x0f\xb7\xd9\x03\xec\x11:\xed\x88\xe6\xe2~N\
+\xc3\xcd\xbc\xe3@\xbf\xf5H\xbc\xf5]\x8d\x8d\x0e\x97\xcb\
+\xa9\xca\xb4\xcdb\x85\xc5b\xa1\xd7\xe0\xe8\x88\x9a^\xd1\
+g\x8f\xe4c\x0f\x11e#j\xd6\xf1\xb1\x0e[S\xc7\
+\xcc\xdb\x80T_\x84\xde\x81g\x9d\xd8{^\xf8\x02\x00\
+\xb0z4J\x93\xeer9\xfd$E\xf2\x9fr\xbbj\
+\xeb\xeb\xdd\x8d\x8d\x8dT\x12\xd7\xdb\xf3\xd2\xe9~\xb0\xc0\
+\xb5\x9e+W\xae\x5cU[W\xab\xee\xdd4\x8a\xae3\
+\x9a7o6{\xd6\xac\xffPI\xbch\xe4\x7f\x0d\x84\
+\xca7n\xe2\xc4\x09#G\x0c\x1b\xecK\xf2\xef\x8aD\
+\x88\x06\xc3\xe2?\x96.\x04\xe0\xb0X\xac\xb0\xd9\x02\xa0\
+\x95\xf9\x7f\x0d\xd4\x818\x91s\xb2\xf8\x95\xb9\xaf\xfc\xb1\
+\x7f\xef\x9e\x1c\x96\xc0fi\xe9\xean\xd3\xba\xfa\x06\xd4\
+\xd5k\xb6%\xb2s}\xa3\x03W)\xfb\xe7\xd6\x94\xb1\
+X\xfcw8\xb9]n\x17\xdc\xd4\xb6OI\x82\xac\xfd\
+V%\x1bQ\xd3:#r\xae\xa2i\x01\xad\xf82\xa7\
+\x9ez\xdf\xd43\x01y\x8am6\x22`\x89T\xf3\x9c\
+ \x00sH\x00\x8f\x89\x0c\xc3`\x91-\x16\x9b,\xb1\
+\x1d\xa4i\xe2E\x01t9\xbd\xf0X\x11\x025\xff\xaf\
+?\x97/\xd9\xb8q\xd3z\xbfR:p\xc7\x8c\x19w\
+vj\xdf^\x09\x99y\x96\xfb\x7f\x15T\xdeH\x16\x0b\
+\x12\x92\x93\x22\x9e\x9b3\xe7\x05_6\x9f|\x22\xf9d\
+\xec\xc8\x91\xc3\xa7V\xad\xfck\x95\xe7;\x87n8\x9c\
+\x8dp\xb9\xfe\xf1i\xbd,\xd0\x84\xc8\xbbv\xed\x96\xfe\
+\xf8\xe3\x0fO\x86\xf7\xcc\xbd\xa9S\xa7\xe2\x99\xd9\xb3\x07\
+\xdf:m\xda#J\xc1c'\x8e\x1d;\x9es$\x8f\
+\xc2\xa1\x17\x1d\xf2\xbc\xac\x0a\x16F.e\x8b\x9fL\x02\
+p\xc3M9r\x09\x80\xd5\xae\x89hY\xb9\xa5\xa7\xcf\
+F\xb2B\xd3\xc9\xd3i\x9e\xeeJ0\x11\x01\xb0\x8d\x98\
+\x09\xcd\x8c\xe6\x1f~F\xa3\xbe\xb1\xce\xe5vk\x97\x87\
+-\x16\xdf\xfa\x84R\xd8I\xb4\x9b\xa7\xedv\xbb\xddf\
+\xb5\xd3.Ea\x00\xcd@\xda\x12\xf2\xac&/<\xe2\
+YS\x00\xc0\xa2E\x8b\xfe\xd0tU\xd2\xb7\x00\xe1\x91\
+\x91!\xcf<\xfb\xec,_\x05H\xf0\xff\x98\xd6\xff\x22\
+\xa8\xbc\x0a\x0a\x0e\xc5S\xb3f=\xd1\xb9s\xa7,\x00\
+\x10\x1f\xb4\xeca\x87\xa2\x0eK\x97.[\x92\x9f\x9f\x7f\
+\x9a(g\x1f\xb0\xcfu\xff\x1d\xa0\x95\xd2\x0d\x00\x92$\
+\xc9\x11\xa1!\x88\x88\x08\x91\x06\x0f\x1e\xd4{\xd8\x90\xa1\
+\xdf<\xf3\xfc\x0bk:th\xaf\x1e$\xfb\xdd\xfco\
+\xe75\xd65\x14S8\xc0\x5c\xd3!4+/\x9a:\
+\x92M\x1b\xd6\x10\xb7\xe6\x05\x0f\xe2A&K\xcaw\xa0\
+\xd8<\x0a7\xdb/\x9e\x5c\xb2?\xd1\x17\x84D:\xd7\
+\xe45\x00\xde\x02\x83\xa8\x016\x8cQ\x80\x0d\xe75\xa1\
+P\x90-\xb8\xb1\xa1\xa1A\xf3\xdd(\x8b\xeca*M\
+m\xbdC\xfb\xd0\xd4\x1e\x18\x10\x14\x18\x10\xa00_\x14\
+\x0e\xb1hX\xe3\xa0\x07~\x0c\xfd\xf2\x8b/\xbe9z\
+\xd4wP\x89\x19\x980i\xd2\xf8\x87\x1f|\xf0?\xde\
+-\xc4n\xfd\x19\xc9\xffw\xf0\x13\xf2A\x03\xfb\x0f\xbf\
+m\xdam\x8f*I\xba\x94{3/\x16],\xfbn\
+\xc1\x82\x1f\xfcs\xfe\xcf\x81\x10B\xdc\x1d\xda\xb5\x0f\x7f\
+\xf7\xed\xf7\xbe[\xb9\xea\xef\xad\xd3g\xdcq\x0b\xed\xa3\
+\x17\xfd\xb1x\xf9\xdbo\xbc\xf9&E\x17+\xb7\x22\xd9\
+\xa0\xe7\xd7*\xd8\x03\x025\x0b\xd8\xf5\x8e\x06'S\x07\
+\x16\xd9*\xcb\xd4\xeb\x88.\xa7\x0b\xf5\x0d\x9a\x13\x95x\
+\xb2\xcb\xa3A$\xdbt\xc4j\x86\xd7\x04M\x8c\x00D\
+\xc0\xb5,:eY\xc3\x01\x17!.'\xb5@\x02\x00\
+\x01\x81\xda\x15\x7f\x00h\xd4\xce\xd9\x10\x14\x14\x14l\x0f\
+R\x99/Z\x18Q\x1e\x07\x8a\xbe\xc0\xc2\x02o\x0dC\
+e\xa8\xc3\xe1\xa8x\xef\xbdw?\xf4\xeb\x8e\xded\x02\
+\xc0\xcbs_\x9a{\xc3\x94\xc9\xd4\xc1\x85\xff\x8a\x11\xe0\
+Y\xfc\x7f\x05\x9f$I\xa4{\xb7\xae\xb8z\xcc\xd8\xd8\
+'\x1f{\xfc\xd5\x90\x90\x10\x0b\xa0t\xd1\xbf)6*\
+X\xbc\xf0\xb7\xdf\x0e\x1e8\xb0C\xd0\xc6\xbfm\x0c\xfc\
+B\xdf[\xa6\xdf\xf1\xd9\xcd\xb7N\xbb\x9e^7nl\
+l\xc4{\xef\xbd\xf3\xe5\xa4\x89\x13'\x03p\xb0u\xc0\
+wn\xf4=\x1bU\x02\x80\x1c\x18\x10\xc4\xecaiT\
+6\x06\xa9v'\xc0n\xb5Y\xa9H\xc1\xe1l$\x8e\
+z\xe1\x91jz\x1f\xb3\x01\xfc\x1f\xc3+`\xd6\xb1)\
+eMo\x04\xe2!f\xbd\xbeh\xd1\x82-\xa7!\x80\
+\x10\x82\xf2\xaaj'q\xbb5\x06 88(\x98)\
+\x8f\xda\xea\x9a\x1a*\xbaBdXDDdd\x94\xf2\
+\xc8\x85G\x07\xe0?\x88t\x19\xde\xdcOO@e\x00\
+\xf8\xe2\xcb/\xe7\x1f8p\xe0(\x9bI$\x22\x0c\x8f\
+\xedA\xc1\xf6YO\xcd\x9e\x97\x92\x98\x98\x09u\x93\x09\
+a\x05\xebr\xc0L\xbd\xa6\xe0'\x00\x88\xcdf\xc5\xa8\
+\xe1\xc3\xe5\xb9/\xcf\xfd\xaao\xff~]hT\xdc\x1e\
+\x12\x1f\x13\xcb\xcb\xcb\xaa^{\xe3\xcdw8xy\xd7\
+\xff:\xf4\xed\xdfo\xc8\xb5S\xa6\x8cU\xeeO\x9f\xc9\
++x\xf2\xe9\xa7^\x9e4yb\xaf\xc7\x1f}\xfc\x0e\
+\xb7\xcb]\x03\xf1\x1e\x11\xd1z\x00]\xd6\xb7>\x22K\
+\xc1\xc1AZY\xad\xaf\xabW\x9eu\xaa:\x13\x18\x1c\
+\x1cd\xb3\xfa\x9eV5:\x1c\x8e\x86\xc6z\xda\x00\xb0\
+\xed\xea\xb5/\xd2'\x9e\x8c\xd3\xf7\x80VOL\x7f\x1a\
+\x8c\xd70\xcf\xcb\xf2\x08b\x15\x93V<\x09\x00\x1a\xeb\
+j\x1a\xeb\x99\x17\xc5\x83\x83\x83\x83iD\x00PZY\
+V\xe1p\xf8\xacfHXhpXX\x98R\x8e\xed\
+,m\xa5i\xef\xcf\x9b\xe3\xf3\x80\xb5\xf4j\x1bN\x87\
+\xb3\xfc\xb9\xe7^x\x8e-\xad\xee\x0d\x14\xb0\xbem\x87\
+\x0e\x19K\xfe\xf8cQ\xf3\x8c\x8c\x14\x0e\x8dz\xb4\x88\
+\xc0\x8c\xc0\xb0\xe5Dm\xa9\xe3g\xb7\xdbq\xf5\xd8q\
+\xc8j\xdb\xf6\x8b\xacvm\xc7\xd2\x084\xcc\xa30J\
+\x92\xef!\xe0\x9bo\xbe\xf5\xce\xe9\xd3\xa7\x0f\x81\x0fz\
+\xf3\xde\x7f\x02*\xde\xab\xc6^ueh\xb8G.\x9c\
+N\x17fN\xbfc\xfa\xcb/\xcc}r\xe9\x1f\xcbv\
+\xd4{\x9e\xc5\xf3\x9c\x05\xeb\xe4x\xd3\x01?\x19\x0a\x0d\
+\x0d\x09\x0b\x0d\x0d\xd1|\xef\xa0\xba\xbaF\xdd\x1a\xec\x9d\
+\xef!$04\x90.SW__[YYIo\
+\x8a\xe0\xcd\xd3\xb9lg\x80\xa5S\xaf\x7f~r`\xf6\
+1\xa0\x11\x11\x06\x01\xb0\x90`\x00\x9eo\xb9\xd5\xd4T\
+kv\x88\x84EFD\xc2\xfb\xb6\x22\xf1\xd2Y^V\
+^\xeaj\xf4m\xba\x88\x8a\x8c\xb4\x95\x96\x96\xd1\xfb\xae\
+yJ\xceUb\xf83\x9b\xcd\xe7\x01\x81wg\xd7o\
+\xbf\xfd\xfa\xd3\x1fK\xff\x5c\xc6f\xaa P\xeb.=\
+z\xb4\xfb\xe5\xe7\x9f\xff\xec\xdc\xae]\xf3\xe8\xa8H\xc8\
+\xb2L\x1b\xc6\x7f\xd33\xf2\xc6\x8a\x15\x16\xd6\x98\xa3c\
+\xbbv\xb8\xeb\xf6i\xf2\xb5S'\x7fu\xfd\x0d7M\
+\xf3<d!\xfc\xc1\xd7$xH\xdf\xbeq\xdb\xce\xb9\
+s\xe7\xbez\x99\xf45\x15\xb8c\xbc\xfc\xcf\x15\x7f\x1d\
+<x\xe0(!n|\xf6\xc5g_\xfc\xbd\xea\xef?\
+\xa9\xf2\xec\xb9\x14,\x1e\x9e#\xa1\xdb\xd3\xc8MdT\
+tD8\xfd\xdd\x08\x00U\x15\xea\xe94j\xdd\xf0\xb0\
+\x10\xcd.\xd6\xba\x9a\xda\x9a\xaa\xca*\xfa\x84$zL\
+\xd8\xc8\x90\x9d\xbe\x8a\xe8d\xfb\xa1\xf4W\x9d\xae\x80\x91\
+L3\x0fe/7t\xe3\x95\xe5\x11\x08\x00\xa8\xac\xaa\
+\xd6\xbc.\x19\x15\x19\x1dm\xb5\xc8\x81N\x97\xbbZ\x82\
+g\xad\xbd\xb0\xe0Ri}\xa3\xa31\x18\x08V\x90\xc5\
+\xc4F%P8\xe9v\xe8\xbd\xdcFV\x9f\xa6\x99\x15\
+*VP\xd4\xd3\x8ef?5\xfb\x85\x81\xfd\xfb\x0d\x8a\
+\x88\xe0\x9cw\xefm\xc1\x13\xe4{w\xccy1u\xeb\
+\xd1\xa3\xe3\xbco\xbf\xfd\xfb\xed\xd7_\x99\x22\xcb\xd6\xdd\
+\x97J\xcb\xb1d\xf9\x9f\x0a\xfe\x7f\xc3\x08\xb0\x9e\x8c\xa2\
+\xc8\xef\x9a.O\xc6\x8e\x1a\x15;}\xfa\xed_\xc55\
+k6\x96>\xf4\x977\x8fbQ\xe4\xe7\xe7\x9e\xbdm\
+\xe6\xed\xb7\xb8\xdd\xee\x1a\xa8\xd3_\xc2kO\x94\xf6O\
+@\xc5\xb7q\xdd\xfa\xd5}\xfb\x5c1\xa0YZz\xca\
+\xd1\x9c\x1c\xe5,\x07\x0b\xb4\xdd\xd0{}\x96\x95\x1fz\
+K\xbb&*\x88\x8e\x8e\x8a\x0c\x0b\x8f\x8c\xa4\x11T\xd5\
+\xa8\xb2\xac\xcaZDL\xb4\xe6\x05\xa1\xda\x9a\xea\x9a\x9a\
+\xaa\x0a\xbdm\x91<\x17\xa2\xe7\x88\xd9\xe8\x9a\xae':\
+R\xacI/\x03\x89\x1a\xbc\x9c:~\xf2TRZR\
+F\x17\x8c\x8d\x8d\x89\x09\x08\xb0i\x16W,\x01\xd6\x8a\
+\xb2\xcar\xedK\x15\x89\x89\xf4I\xc2l\x18\xc4c\x86\
+\xd1\x02\x0bk\x9cX\x1c*\xfd\x07\x0f\xec\xdd>w\xee\
+\xcb/\xd3\x95%05\x05\xd0\xb1K\x97\x16\x0f>\xf2\
+\xd8\x9a\x9b\xaf\xbf\xee\xda\xf1c\xc6\xa0M\xebl4K\
+I\xfd\xb7\x95\x02\xd0\xf2\x9b\xcb{x=L\x87vm\
+;\x8e\x197vCFV\xf6\xd8\x90\xe0\x10\xaa\x8a9\
+(**.\xbbPPP\xe8\xdf\xd4\xff\x19\x88\x0c\xb9\
+\xad\xaa\xa6\xa6\xe4\xc8\xd1#\xfb\x89\xdbU\x0f\xed9x\
+\x04\xda/\xe5\x80\xc2\xc1~\x84\x95n\x03\xf0WD\xc4\
+\xc7\xc6EF\x86\x87G)\x05\x0a\xce\x9do\xccl\xd1\
+\xb2\xf4\x8e\x9bo\x06\xbdM:4<\x5cs\xdeEU\
+ee\xf9\xa5K\xc5\xecY\x93\xb4\xb7g\xa3\x00\x08\xd2\
+\xc0\xa4\xf1\xa2]\xfaZS\xaf)\x1b\x81\x9a2\x9aF\
+\xf3\x15?\x9c\x97.\x15i\xbe\xa3\x9e\x18\x17\x1f\x17\x12\
+\x1a\x12\x0c\x00no\x1d\xabE\xaa*/)-\xd7\x94\
+\x8bO\x88\x17\xe0\xe7)\xbf\xd2&\x1b\xca\xf1\xe6Z\xbc\
+\xa9\x01\x9d&\x03\xc0k\xaf\xbd\xf2\xd2\xc2\x85\xbf/\xf1\
+5\xe2-&\xd1\x04I\xda!\xf5B\xa7\xae\xdd\xc2\xaf\
+\x18:\xe2\x87\xfaF\xc7{\x9d\xda\xb7\x0bn\xd7\xb6-\
+F\x8f\x1a\x85\xf0p\xd5Y\x5cn\x98lj\xac\xe8\x8f\
+S\xde;\xf3\x8e\x076l\xdc\xb4\xa9w\xff\x01m<\
+\x08\xb4\xac\xd3s;\x0a\xf4\xe8\xd1\xa3\xe3\xf2?\xfe\xf8\
+\xf3\x8a\x1e=\xd3\xed\xb6\x00\xc2|\xfc\xf2\x9f\x82\xde\x94\
+\x06\xf0z\xe9q\x13\xc6M=u\xea\xe4\xc9\xf5\x9b\xb7\
+n\xbf\xe1\xe6\x9b\xef\x00\x10\x00\xedchz\x9cyQ\
+!\xcf[\xf2L:\x01\x80\xf8\xf8\xf8\xb8\xc0@\xdf\xe2\
+\xde\xa5K\x85\xe5u\xf5U\x97\xfa\xf6\xed\x83v\xd4\xb7\
+\xff\x82\xed\xc1\x11\x80\xf7\xa0I\x00\xe5\x95U\x95\xf5\x8d\
+\x8er\x9d~\xf2\xa6\x86\x22y\x10M\x1d\xd8<\xbf\xc8\
+\xdb\xf3b\x8b\xe0\x07\x9fU\xe4\xbde\xc76f\xf4\x03\
+UW\xa6p\x01\x00n\x9fq\xc7\xbd\x84\x82\xaa\x8a\xb2\
+\x9a\xec\xac\x96\xde\xcf\x88I6\x00\x08\x0e\x0d\xb5.Y\
+\xb6t5]\xee\x93O?\x9d\xc70\x8f\xb6\xe4l:\
+\x984\x16\x9a\x90\xe6\xdb\xf2\x96\x9c\x92\xd6\xec\xf8\xf1\xe3\
+y4]\xc4M\x84\xc0\xcb:\xb0kw\xee\xbdw\xdd\
+}\xed\x88\xa1Cm\xcd\xd3\xd21f\xcc\x18dge\
+a\xcc\x981\x08\x0a\x0a\xe2\x90 \xa4Ox\xdf6+\
+\x0b\x03\xfa\xf7Gph(\xd2\xd2R1p@?\xbc\
+6\xf7\xc5^?.\xf8v\xb5\x96>\x96B\x0e\xc5n\
+\xe6\xd2\xedK8\xb4o\xff\xe9\xd1\xc3G\xb4\x0f\x0d\x0d\
+1s\x12\xafY\x10\x8d\x8d\xba\x00\x1d\x12\x12\x1c\xb6\xea\
+\xef\x95\x1b\x15:.\x16\x15\x95t\xed\xde\xad/U\x96\
+.\xcf\xca4\x8d\x9f\xfd\xf8-[_M\xff\xcf\xc3\x0f\
+?B\x08!No\x9b\xdb\xb6l>2\xb0o\x9f\xb4\
+\x09c\xc7``\xdf>\xc8\xcal\x81\xe6\xa9\xc9\xf8\xf1\
+\x87\x1f~'\x84\x90F/\x9b\xe6\x7f;\xffGN{\
+,]\xecOD7O\xcf\xd82\xbc6L\xbd\x0d\xc8\
+\x0b!E\x0b\x12\x22\xa6)\xd7\x22o\x8bs\xf9g\xce\
+\xd2\x8d\x86\x86G\x04'\xa4(\xdf\xd2#n\x00\xa8\xad\
+\xabu\xe6\xe7\xe5\xe5\xd1\xe5\x9a5k\xd6\x5c\xb2[\xd9\
+\xb5\x0cv~\xc7[\xcc\xe1\xf8dn?x\xf3eM\
+\xf5\x0b\xe7\xcf\x9c\xbd\xe5\xa6[o\xad\xa9\xa1^\xf9\xd4\
+\x91{^V\x87n]3\xde\xff\xe8\xc3\x1f\xee\xbe\xef\
+\x9eMc\xc6\x8c\xb9\xb6\xb8\xb88b\xe8\xb0\xe1\xb8\xef\
+\xce\xbb!Y<\xc3\x14h\xa7\x16\x92};[x\x91\
+\x0a\xacv;,\x1e\xb6\x90\x98\x98hX-\x16\xf4\xec\
+\xde\x1d\x8f?\xf6\x08Zdd\xe0\xde{\xef\xe9v\xe3\
+\x0d7|\xf3\xe0\xc3\xff\xd96\xf5\xfa\x1b\x87\xd0\xd5\xe9\
+\xd0\x95\x88(\x96\x98Kj\xa7M\xbbN\x1d\x9b\xbf\xf9\
+\xf6[+F\x0c\x1d\xd6\x9b:\x89W\x14D\x98\x01:\
+\x9ac\xd3\xd4\xf4\x8e\x1d;\xa6\xb5l\x99\xa9~8&\
+(0 <>>QY\xa1g=*\xcf\xc3\xf2\xf0\
+\xd2\xde\x93.\x03\x00HHL\xf4\xc8\xa8\xf7%\xa7\xaa\
+\xaa\xea\x92\xa3G\x8e\x9e\xdf\xb1c;B#\xc20d\
+\xe8\x10t\xee\xda5.2:2\x05\x00\xac^,\x8d\
+\x0d\x8dt\xc4\xcb\x9b\xa2\xf1\xe6P\xec+\xf8\xdc\xb1\x17\
+\x94\xa1#\x1c\xb5|S\xbf\x0d\xc8\x86B\xac\xe5i\x0a\
+h\xe6bg\xcf\x9e=\xe7t:\xa9\x0eIHk\x96\
+\x9e\xe2\xbd\xf1DN.7N\x9d<q\x82F\xd2,\
+==)\xc0\xa6~vZD\x8bH\xd1\xd9:\x22\xc5\
+\xd7\xe9\xbbG\xf2\xb7n\xdf\xb2\xee\xe6\x1bn\x9eF\xfc\
+\xdfa\x12\x03Q\xfe\xf355~\xfc\x84\x9e\xef}\xf8\
+\xc1\x0fs\x9e\x9a\xb3e\xd8\xa0\xc1\xcf.[\xfeg\xcf\
+\xa8\x88(|\xf4\xf1g\x88O\xf6\xacw\xdal6\xf5\
+`R=\xb0\xd9\xad\xe8\xd2\xb1=:v\xe8\x80\xa8\xc8\
+(l\xda\xb2%:((\xe4\xfa7_{\xed\xa7\x89\
+\x13\xaf\xd96}\xc6\x9d\xb7\xd8\x02(\xa3\xa2\x11\xa7\x7f\
+6\x87\xcfn\xd7.\xe5\x9dw\xde\xf9\xa3{\x97.\x03\
+\xacv\x1b\xe2bb\xfe\xaf\x16\x04TB\xb7m\xdb~\
+\xf4\xc7\x1f\x7f\xfcN\xc9X\xf6\xe7\xd2e\x7f-\xffs\
+\xad\xf7\x96\x17\x19\xb1!\xbd\xc8\xe8s\xc1b\xb5\xda\xd2\
+\xd2\xd2\x9a{jx\xaa\x94\x94\x96\x16\x15\x95\x95\xbb\xce\
+\x17^BTt\x0c\xc6]=\x11}\x07\x0c\x8c\x8f\x8c\
+\x88J\x02\xa0>x\xaf\xa8\xac.\x0c\x0a\xf2\xdb\xeb\xc6\
+\x933\xae\xe1\xe1\xd0\xcf\x8b\x04X\xe3\xe5g\xcc\x9a\xf2\
+a\x10\xbdk\xd6\xca\xd0\xc4\x8b\x14R\x198\xef\x02\x8d\
+Tr\xa9\xa4\xa4<)!!J)\xd42\xadys\
+\xb6\xce\xe1\xc3\x875\x1bp\x12\x13\x12b\xe2b\x13\x12\
+\xce\xd6\xe4\x97S\xed\xd1\x87#(\xa0\xf9 \x02\xf8\x8c\
+a\xfb\xc3\x0e\x06\xb4\xf7\xc4;\xd9\x97d\x80\xb8\x7f[\
+\xbc\xf0\x87\xbbg\xcc\x08\xfe\xe8\x8b\xcf\xbe\xa0O)\xf6\
+c\x02\x93\xe0\xb9%\x00\x91\xd4\xf4\xd1cF\xb7u\xbb\
+\x5c\xcf\xb4l\xd5\xf2\xe1ko\xb8~7$iG\x97\
+\xce\x9d\xb7UTT\xec\xad\xae\xae:K\x94#n\x04\
+\xe0r:\x11\x1e\x16\x19\xdb<3\xb3c\xfb\xf6\x1dz\
+\xdd}\xdf\xbd\x9d\x93\x93\x92;\xb7\xcal\xd5:.\x8e\
+^7\xa5\xba\xeaq\xe5^z$n\xc7\xf9\xc0L+\
+\xbdw\xcd22\xe2\x16\xfd\xb1\xf8\xb79O\xcd\x9e\xb4\
+r\xd5\xaa\xf5TVS\x8d\x01O9\xd94\x89\x10\xe2\
+~j\xd6S\xb3\x16\xfd\xfe\xdb\xef\x09\xc9I\x09\xbbv\
+\xec\xdaL\x08i\x84O\x1eDF\x80G\x0f\xcf8h\
+h\xc8n\x9b\x9d\x9c\x91\x91\xde\x1a\x00d\xef\x8e\xc3\xf2\
+\xd2\xd2\x82\xc4\xc4\x04DGG\xc3\xd9\xe8\xc4\xda\xf5\xeb\
+!\x11D\xa7\xa6\xa4\xa8\xc7\xde7:\x9c8q\xe2x\
+A\x9d\xef\xcc\x1b\x9a/\x062\xe7'N\xa2!\x92\x05\
+\xd7\x9a>\x989\x15\x98&\xb2)\x04\xb0\xf5\xd8km\
+!\x99T\x9c;\x7f\xae\x906\x00Y\xd9m\xda0\xed\
+\x90\xf3\xe7\x0br\xeb\xeb\x1b]\x81\x81\x9e\x13i\xc3\xc3\
+\xc2\x22\xb2:\xb6\xcd:\x9b\x9f\x9f\xc3\xc1\xcfN\x01x\
+\x11\x02+X\x8a\x01\xa1\xeb\xf0B-o\x1e\x91\xbcS\
+*\x19p\xbb?\xf9\xfa\xcb/\xeb\x1d\x8d\xf2\x17_\x7f\
+\xfd\x99\xf2B\xa3\xc4\xe1\x18\x01\xd4S\x85%xM\x09\
+C\x99l\xb1\xa0C\xa7Na\x00\x06\xd5\xd5\xd5\x0d\xfa\
+\xee\xbb\xef\x1c\xe5\x15\x15\xc5\xe7\xce\x9d+\xca=\x9b\x97\
+_t\xbe\xf0ByYYYmmM\x9d\xc3\xedr\
+\x05\xdb\x03\xec\x11\x91QQ\xf1\x89\xc9\x89ii\xa9i\
+\xcdRR\x92\xc2\xc3\xc3\xe3\xe3\xe2\xe2\x82\xf8\x11\x03\xff\
+\xe9\x90\xde\x80\xf2W\xa3\xb4\xb2\xeb\xe9\x8f\xe7\xf8\xf4\x94\
+\xd4f1O?\xf7\xdc\xa2\xc2K\x85c\xce\x17\x14l\
+\xe6\xf0\xd2\x08h\xfe\x8b\xea\xaa\x9d  \x0d;v\xec\
+\xda\xc8\xe4\xb1]0R.\xda0\xf0\xc2p\x00@\xab\
+\x96-\x133Z\xb4\xccT\x10\x94\x95\x95\xc1b\xb1\xe4\
+}\xf1\xc9\xa7\xd8\xb2u+\xe6\xbe\xea\xd9\x0e1j\xc4\
+\x95q)\xa9\xa9\xea\xfb\x02\x15\xe5\xe5\x15'\x8e\x1f\xcb\
+\xe5\xd0\xcfk\x8fN\xd7\xeb\x8bH\xcf\xf4\x22\x09\xc9\xcc\
+\x22 \xfdc\x17\xff\xd8E\x08\xde\x02\x0b/\x9f\xc6m\
+\x01\x80\xe0\xb0P\xdbw?\xfd\xb4\x98^g\xda\xb1c\
+\xc7^%\x1f\x00$IB\xcf^=R\xf6\xee;\xa0\
+Yp{\xe9\xf5W\x9f\x0b\x8fQ\xed\x86H~y!\
+\x92\xb6\x00?\xac\x16\xf5\x97J\x93d@\xb2\x80\xdaW\
+1e\xd25\xd7\x94\x97\x95U\xf9\xad\x9c\xb9\xd5U3\
+\xa2\xac\x9d\xb9\xbd\x0bonu\x09\xce\xad\xad\xf3/\x81\
+\x9b\xf8\xdab\x97\xfa\x94\xb65\xb4\x19\xe0\xd2\xde\xbb\xb5\
+\x8d\x10\xef\xba\xa0\xf7:?/\xb7p\xe8\xa0\x81\xbd\xac\
+\x16\x0b\xcdg\xe1X\x18\x8c\xa1\xd9|=\xb9\xd4[l\
+\xe3\xc9\x89_\xfa\x84\x89\x13'\xd0<8s\xe6L\xdd\
+\x03\xf7\xdd}\xd5]w\xdd\x81\xf0p\xdf\xde\xa0\x193\
+\xa6\xdfG\xf3\xec\xf8\xf1\x9cSI\x89q\xe9z\xb8u\
+\xe8a\x17\xd1\xf5\xe8\xe6\x95\xd1\xe0n\xea\x89@<\x0b\
+\xcc\x86\xd4f'\x8f\x0a\x11\x9e\x05\xbe\xaaj\xc7\x91\x83\
+\x87\xf6\xd3\x05\x92\x93\x12\xe3\xa2\xa2\xc2\xd5O\x81e\xa4\
+g 9)\xb5$\xe7\x98\xe7CzJ\x0c\xdc\xb1m\
+\xfb\xce\x8d\xf5\x9aCAX\xba\xd9>\xb0S\x05=\xd0\
+\xf1\xfe\x80\x87~B\xbc\x93@\xb7\xc7\x10\x00?/\xfc\
+\xf5\xd7A\x83\x07\x0f>z\xf4\xe8I\x0d\x22u\x18\xbc\
+\xdeRR\x92|$\xb2\xde\xd5T\x08% \x9c\xa8\xff\
+|\xb8y\x9f\xee\xe01H\x0f$?b$\xba\x01_\
+\x8a\xf7I`ZzF\xfc\xe7\x9f}\xbep\xc4\xb0\xa1\
+=9O\x06\xcc\x18\x01\x9e\x87\xe4yD^\x1d\xf61\
+\xa0\x99i \x1d\xd6\xf0\xd2\xd123\xb3=\x95\x8e\x86\
+\x86\x86\xe2\x95\xabV\x1f\xfc\xfc\xf3\xafPYY\x09\xbb\
+\xcd\x861c\xaeD\xfb\xf6\x1d\xda\x02\x9e/\x80\x00@\
+QQQQ\xc1\xc5Kg\x04}`\xe9\xa7\xafiz\
+\xd9t\xd6\xd3\x8bx\xa3I7\xb3\x15X\x0f\xa1(\xac\
+\x16\xc9\x0f\xfd\xdd@\xb6\x1d\x1c<x\xf00\x9d\x18\x11\
+\x19\x15\xdd\xb1K\xd7v\xca}Mm-r\xcf\x9c\xad\
+?x\xf8\xf0N\xba\x5cjrr\xcb\xfa\x9a\x1aeE\
+\x85g\xe9Xz5}\x8b\x8f\x8fF\xa0\xdd\x1e\xd4\xad\
+s\xd7\xbe\x13\xaf\x9e8q\xc4\xd0a#BCC\xa2\
+\x18O%\x0a\xc3\xa8>\x13\x02\xcf\x13\x0b\x09\x00\xf6\xef\
+\xdf\xbfk\xc2\xa4I\xdd\xe7\xcf\xffn\x91\x07\x89\x98M\
+\xdaX\xcew\xc5\x9boi\x99\xab(7\xfd\xbf/\x95\
+f\x82$hO\x83]\xf2\xd0\xc9u\xb5\xaa\xea\xf8\x0f\
+\xaf?.\xa2&*\xb44o\xd5*\xe5\xdd\x0f>\xf8\
+}P\xff~=(\x8cF \xe2\xb7\xce8h\x94\x85\
+2\xd4~s\x1e\xd6\xb6\xeaM14mZmV[\
+\xcf\x9e\xbdz\xd1\x85.\x15\x16\x15\x1c?q\xf2\x9c\xd3\
+sB\x98\xe4p:\xe1\x86-\xba]\xfb\x0e]\xe8r\
+\xe7\xf2\xcf\x9c\xa7\xda\xd2\xeb\x07\xef\xde\x8f\x16\x06\xd8\x8d\
+nJ\x9f\xf9\xe7r\x12\xf3S\x00\xd1\xb3u:,\x11\
+\x85$\x10\xd4\x93\xe0\x09\xf1-\x00\xd0\xabw\x9f\xdel\
+\xa8\xf9\xd4S\xb3\x1fg?\xfb5|\xc4\x95\x93\xe82\
+E\xc5\xc5\xa5\xed\xbbt\xec\xa5\xd3\x06\x9d\xae\xd9\xc7`\
+\xb1YB\xdfz\xed\xd5\x17N\x9e8q\xb4\xa8\xa8\xa8\
+\xbc\xae\xa6\xc6QQVV\x9b\x9f\x97\x97\xf7\xce\xbb\xef\
+\xbd\x22I\x12\xbbT\xeb\xad/1\xf7\xbc~{\xcaX\
+,\x16<\xf9\xe4\xecG++\xab\x1a\xcc\x84\xd4n&\
+X\xe7\x97\xe5=\xab\xe7\x97\xf7a\xa51\x8bp\xf9c\
+\xd8\xba}\xc7\xdeS\xa7N\x9d\xa1\xf14\x05\xdc\x9a\x16\
+\x099u<\xe7\xc2\x95C\x06u\x0b\x08R\xa7\xc5<\
+\x83m\x94'*\xc7\x96\xe5\xd5\xe3\xc93-\x1f\xa2\xb2\
+\xea\x14\xb6y\x8b\x16\xc9'O\xe5\x9e\xa7\xfb\xf9\xf5\x97\
+\x9f\x7fG#\xb3Ydt\xeb\xda\xad\xed\x85\x0b\x85\x9a\
+\xa9\xe0SO\xcez\x8e*\xa6\xa73\x22\xdaYzy\
+\xfbt\xd8\xa9\x02o\xef\x8e\xdc\x94\x8d@f7+\xf0\
+\x88\x978u\xe8{\x0b\x00\xf4\xec\xd3;m\xff\x81\xfd\
+\xa7if};\xef\xdb\xefi\xa6Z\xedv\x0c\x1d6\
+\xbcs\xe1\xc5\xc2j\xba\xdc\x83\x0f?\xfc\x10\xb4 \x12\
+\x185\xad}\xe7\xce\x1dv\xef\xdesDOx\x97,\
+[\xbeR\xb6\xa9'\x16\xb3\xcaM\xf5Cb\xfb\xa6i\
+\x0b\x002[gu\xf8k\xf9\xf2\x8d.\x97\x8bQ\x10\
+\xbe\xda\xf0r\xdd\xcc\x8fM\xf3\xdc\xbb5\x8a-RW\
+_\xae\xcb\xfb\xd3Bee\x15\x99\xfb\xda\x1b\xef\x03@\
+\xe7n]\xaf(\xbeTTfD\xb5\x1e\xd05N\x9f\
+:Ux\xe5\xf0\xa1=\x99(\xcb\x08\xb8\x81\x89\xa0\x1c\
+o\xbdI\xf4\x13m\xa8\xe1)\xbf\x04\x00}\xfb\xf6\xee\
+\xeft85\xfd\x9b~\xfb\xadw\xab\x04x\xdf\x8e\x1c\
+?\xe6\xaaQt\x19GC\x83k\xc4\xb0\xa1\xea\xab\xca\
+\xd0\xca\x0b\xdb&O\xff\xf4\xea)`\xe4\x8c\x9bd\x00\
+D\x1e\x9eoQ\xc4\x96\x88%\x8c\xfe\xab.\x9e}7\
+\x7f\xfe\x8f4\xc3\xb6l\xd9\xb2\x9d\xea\x18n\xbb\xed6\
+L\x992%\xf0\xb7\x85\xbf\xac!\x84\x90:\x87G\xac\
+\xe6\xcd\xffn\x01\xc3\x0c]A\x09\x8b\x8e\x8e\xdb\xbbo\
+\xffQ\x8d\x80\xba\x09q\xb9<\xf8\x94\xbf\x84\x10\xf2\xe6\
+\xbb\xef}\xc4a\xb4\x97v\x09\xf0\x1c\xf5$\xf2\x1e\x1a\
+:$I\xc6\xd3O?3#\xf7t\xaev\xe7\xa0P\
+e\xcc\xf8t\xff:Z\xd5wkr\xb5\xd7\xfem\xd4\
+7\xd4\x93\x8d\x9b7\xaf\xb9\xeb\xde\x87\x07\xd1\xb4\x0f\x1e\
+2|DiiY\x85\x7f{\x022\xdd\x0a\x95<\xe3\
+DH~^^\xd1\xb0!\x03\xaf\xb0\xdb,`>\x0d\
+\xc9\x1b;\xd6\x80\x8b\x1c\x0d\xab\x08\xac<\xb2\xe3bF\
+Y,`hz\xe4\xb1G\x9f\xa6\xbb\xeat:\x5c\x9d\
+;\xb6\xefA\xe1\x04\x00<\xf1\xc4c\xcf\xd1\xe5\x8a\x0a\
+\x0b\x8bS\x93\x12[0\xf4\x9a1Hl\x1fx\xd7f\
+\x9c\xb46\x8f\xe8\x1b\x00\xb3+\x8ez\x0d\xe9\x85T\x12\
+\x00\x8bD1\xf8\xd1G\x1ey\x9cf\xd8\xb9s\x17.\
+6\xcfl\xd9AA\x90\x9d\xdd\x0a\x90\x80'\x9f|\xe2\
+\x15B\x08\xa9\xf5\x1a\x80}\xfb\xf7\x1f\x91C\x02\x13\xa8\
+vh\x03\xe5\xa5\xc1\xe7n^~\xed\x8d\xb7\xe9vv\
+\xef\xd9\xbd\x7f\xc6\xddw\xdf9r\xd4\xe8\xb1O?\xff\
+\xcc\xcb\x15U\x15\xb5*\x0d\x17.\x5c\x88H\x8c\xcdd\
+\xfa\xa1x~^{\x00_\xd8\x10\x1e\x1e\x8e\x01\x83\x06\
+#  $\xe6\xf1\xc7\x9f\x98}\xfat\xeeY\x8e\xea\
+\xf8+\x18'\x9d\xf5\xf4\xec:\xbf(.\xd0\x83M\x1b\
+6l\xb9\xf2\xaa\xab&Y\xacV4KoA\xf7\x17\
+\x00\xd0\xbf\xdf\xc0a\xc5\x97JJ\xb5\xf4\xf9\xe3u\x13\
+\xad\xf1q\xfb\xa5{\xe0\xf4\xa9\x93\x17']=\xb6O\
+JJ\x22\xc5:.?y\x02L\xa7\x9b\x91G^\x1d\
+v\x1dL\xac,\x14\xacZ\xbbf\x03\xdd\x8f\xe3G\x8f\
+\x9c\x0c\x0e\x0eT\xbepmU0-_\xb6|-\xdd\
+\xff\x1d;w\xed\x95$I\xd9}e&\xf2\xd0s\xc0\
+\xa2\x9f\xc8!\xfb\xf7\x8b\x983\x00\x22K\xca\x13r\x11\
+\xc1\x22\x0b\xa7|\x13\xc0\x02\x00c\xc7\x8f\x1b\xcf\x0a\xd3\
+-\xb7\xddv\x87\xc2\xf8\xf0\xc8p\xd8\x02l\x98t\xcd\
+5\xd7\xb1\xe5F\x8d\xbfz\x22g A\xfd\xf5\xdeI\
+A\x9b\xb6m\xdf\xa9\xd4;y\xe2xnFFz[\
+\xba\xc8#\x8f?>\x87\xc6}\xd3\xed\xd3\xee\x02\x00\xef\
+!\xc4\xac@x\xef5\xc6\x80\x1b\x0dH\x92\x84\xa8\xa8\
+(5#<22i\xc6\xcc;\xef^\xbf~\xfd>\
+?-\x12\x82\xe8Q!\xcf\xd3\xfb\xae\x9c\xc4ED\x06\
+\xe5\xcf\xe5\x7fn\xb8f\xc2\xa4k)\xe1\x84\x96~\x9f\
+\xf1\xec\xd7\xaf\xdf\x90\xb2\xb2\xf2\x0a\x05;;\xc7W(\
+4;K8}\xea\xe4\xc5\x81\xfdz_a\xb5\xc8\x08\
+\xf5}\xfc\x89\xe5\xaf\x86\x8f\xcc\xbd\x9es2\xf2\x8aM\
+\x9d\x83#.&\xb6\xd9\xb9\xb3\xe74\xf3\xff\x8f>x\
+\x8f\xfa\x1e\xa1\xe7IP\x5cBl\xd2\x99sg/\xd2\
+\xe5>\xfc\xf4\xb3y\x14\xbe\xcb5\x00`\xca\x19E\x06\
+\xbc~\x9a2\x00f\x1a\x101\xdd\xac\xf1\xd0t,)\
+5\xa5\xf9\xe1\xc3GN\x12BH\xa3\x97i\xef\xbe\xfb\
+\xceG\x00 \xd9-\xe8\xd5\xb7/F\x8e\x1e\x85^\xbd\
+{\xa7m\xdb\xb2%\x87\x10Bj\xdd\x9e\xf9\xeb\x8b/\
+\xbf\xf6\x1a\xb4\xc05\x02)-3\xb3N\xe6\xe6\x9fS\
+\x06\xe5\xbd\xf7\xde\xfd\x98\xa9\x87^}\xfb\xf6)*.\
+\xa9&\x84\x90\xc6\xfa\x06\xb2x\xf1\x92\x17~\xfc\xf9g\
+\x5c{\xc3\xf54:\xaa\xcf\x1e\xfdf\xfa\xc6\xa3\xc5S\
+Q\x92\x95/\xed\x02\x00Zg\xb6\x0e\x1f7q\xe2\xf0\
+w>x\xff\xb3\xdc\xbc|\x8dp\x99\x01\xed\x12\x9f1\
+8\x9dNr\xec\xd8\xb1\xbcW_~\xe5\x83\x11#\xae\
+\x1c\x18\x1f\x1f\xcf\xbeq$i\xfb\xa3<\xb0\xf4@\xdf\
+\xbe\xfd\x87\x95\x96\x96V\xfa\x08\xd0\x7fa\xc8\x08rO\
+\x9f.\xb9n\xd2\xd5}\xe3c\xa3\xe0O\x87\xbf\x07f\
+\xc6\x94\xf7\xb7)FB\xcf@\xf8\x8d\xe7\xf4\xdb\xa7\xdf\
+\xc1\xd2?\xf1\xeaq\xd7x\x9b\x93\x15c9j\xd4\xb0\
+\xb1N\xa7C\xc3\x85\xebo\xbcAuf\x9c6\xd8t\
+\x1eMf\x22#\xf3}\x22\xe6\xd6\x00x\x04\x9b\xfd\x01\
+\xc6\xc4h\xda\x99\xff\xed\x82\x1f\x09!\xa4\xd6\xcb\xba\xd5\
++W\xedl\xdf\xb9c\xc4\xc0!\x83\xd1\xa5{7D\
+\xc4F\x03\x120\xff\xdb\xf9?\x10BHU\xa3\xc7\x00\
+l\xde\xb8eoJF\x06;\x0d\xf0\x8bRl\x01A\
+Q\xfb\xf7\xee?\xa4\x0c\xca3\xcf?G\x9dw\xef\x81\
+'\x9e\x98u\x8b\x9bZ\x17{\xe8?\x8f\xdc\xd723\
+\x13\xa1a\x11t1e\x1a\xc02\x9c\x05\x9e\xf0j\xf2\
+\xb2\xb2\xb2\x10\x9f\xe4\xf9\x88\x90l\xb1\x86\xf7\x1d<t\
+\xe4\xabo\xbc\xf9\xee\x86\x0d\x1b\xb7\x1e\xcb\xc99SQ\
+Q.|\x82`\x06\xea\xeb\xeb\x9d\xf9\xf9g.\xac\xf9\
+\xfb\xefM\xcf?\xf3\xec\xcb\xbdz\xf4\x18\x18\x1c\x1c\xec\
+\xf7\x15[\x8aO<\xa3\xaf\xe9\xcb\xa0A\x83\x06\x17\x15\
+\x161\xd3\x81\xcb\x87\xb3yye\x13\xae\x1a\xd9\xdf\x9f\
+\xbf\x5c\x03\xa0ghi\xba\xd9~\xf1\xf0\xb1r*\x92\
+y\x00\xc0\x82\x1f~\xf8\x99\xa6\xbb\xbc\xac\xb4\xa6E\x8b\
+\xe6\xde\x08R\xb6\x03@xd$\xbe\xf9\xe6\xab\xcf\xd8\
+>v\xeb\xd6\xb5\xab\x17\x8d\x85i\x8b\xe7<\x8d\x0c\x95\
+\x9e\x83\xd5\xeb\xabZ\xc6\xccV`v\xbb\xa1L]\xeb\
+\xd5\xa1\xef\x95\xf2\x12\xf885\xf5\x0e\x1f9\xb4\x17\xc0\
+\xd4 o\x89!\x83\x86vO\x8dO\xee\xbdb\xe5\x8a\
+\xbfd\xab\x8cN\x9d;#\xb2KW\x9c:uzC\
+c]\xc3\xb5\xa1A\x01 \x00\xae\xe8\xd7\xa7s\x97N\
+\x9dz\x9d\xcf\xcb\xfb\x83\x87\xd7K;q4\xd4\x95}\
+\xf0\xf1G\xaf\xdf9\xf3\x8e\x07\x0f\x1c8\xbc\xf7\x93\xcf\
+\xbe\xfc\x9c\xee\x80\xddn\x0f\x9f4i\xd2\x03\xca6\xa9\
+Sy\xb9\xb9\x9f}\xfe\xe9\xef5\xeaIO~\xb4+\
+i\x12|\xfb\x93\xe8v\x8d\xb6f\xc2wp\x0d\xe0v\
+9+7\xaf]\xfd\xd7\xe6\xb5\xab\xff\x02\x80\x8c\xec\xac\
+\xc4\xb6\xd9m\xbav\xed\xdc\xb9C\xcb\x8c\x16\xcd\x03\x83\
+\x02\xe2ccc\xa3\xc3#\x22\xc2B\x83\x82\x82\x1c\x0e\
+\x87\xddf\xb7[,\xb2\xec\xae\xa8\xacl\xb4X\xe4\xba\
+\x8a\x8a\xca\xda\xfa\xfa\xfa\xb2\xda\xfa\xfaK'N\x9c8\
+\xb3g\xe7\x8e\xc3;\xb6m\xdf~\xe6\xdc\xb93\xe0\x03\
+;n\xbckZ\xd0\x5c\xeb\xd6\xad[;q\xd2\xd5\x13\
+\x16\xfd\xb6\xe8\xf7\x98\xb8\xb8(\x7f]\xf4\x0d\xb3\xc1\x06\
+\x0aH\x00R\xd3\xd3#?\xfd\xea\x9b?\x0a\xc7\x8f\x9f\
+\xb0e\xdb\x8eu\xa0N_\x82VvX\xfax\xb4K\
+\x82<Q\x1d\xde\xb8\xc8\x14.\x02\x006\xbb=\xa6K\
+\xa7N\x9dhD\x7f\xfd\xb5|\xc5\xe9\xd3\xb9G<X\
+$\x80\x00\x95\xe5\xe5\xe8\xdc\xb1sW\xba\xdc\xf6\x1d;\
+\x0e\xd7\xd47(\xfc\xe7mHb\xff\xb2t\xf2\x18,\
+\xa2\x9d\xd7_\xba]O\xdf\xc8\xe5\xaf\x01\xe8Y(\xba\
+Q\x89S_d\xbd$\x00\xe8\xd2\xadk\xd7sg\xcf\
+\x16\x11B\x88\xd3\xe9q\xc3\x0f<\xf4\xd0\x93\x00\x90\xd9\
+:\x13\xfd\xfb\xf7G\xc7\x8e\x1d\x90\xd5:3q\xdf\x9e\
+='\x08!\xa4\xc6\xe9y$\xf3\xce\xbb\xef}J5\
+\xcf\xb1\xe4\x92\x0c@\xb2\xd8\xec`\x9e@\xa9w\xef}\
+\xf0\xe1\xe7\xb4\xd5\xbey\xda\xadt\xd8\xa6\x17\x82\xf1\xbc\
+\x0a8e\x0d\x22\x02\xed\x9e\xe4\x00\xef\xbcX\x92-\xb0\
+\xda|\x87OH\xb2\x1cb\xb5Y\x13\x06\x0d\x1a\x94\xd1\
+\xb3g\xcfV\x19\x19\x19\xcd\x07\x0f\x19\x92d\xb1X\x22\
+\x00\xc8\xb2\xc5\x826m\xda\xc0JM58\xf4\xd0\x9e\
+\x9d\xe75\xd8{\xbf\xb9\xe8\xc0\x81\x03\x87\x96\x95\x96R\
+O\x07x\x8b\x82\xd4_\xb7\xff\xd2!}_Xp\xa1\
+\xb8\x7f\xaf^\x83t\xf8'J\xe3yr\xd1\xcf(\x22\
+\x05\x93\x0f\x00\x98:u\xeaMl\xdff\xdc~\xfb\x9d\
+\xdel\x0b\xbc\xf3\xff\xf6m\xb3{\x14\x15\x16\x96\xd0\xe5\
+^~\xf9\x95\xb7\x18\xbaY\xfe\xf2d\xc8\x02~\xbf \
+HcuL\x84\xbb\xc9k\x00\x22\x03@\x13\xc2\x0e\x0e\
+\xab\xec<\x82X\x82\x01\x00+W,\xff\x9b\x10B\xea\
+\xbd\xcfZ\xff^\xb9r[\xcf^=\xa3:t\xed\x08\
+\xbb\xdd\xf7\x1d\x86\xef\x17x\xc2\xb1Z\xb7\xa7\x5c\xe1\xc5\
+K\xc5\xc9))\x99\xbe\xe65tx\x0d\x80x\x0b\xf4\
+\x80\xc1\x83\x86\xd1\x83\xf6\xd5W_\xcd\xe7\xf4\x87\xed\xa3\
+\x17\x9f\xc4\xe3\x01\x0dF\xf9\xa2:\xba\x10\x1c\x1c\x0c\xab\
+\xdd\xf3\x8apll\xacQq\x96\x0e\x91\xf0\x98\xfd\x01\
+\x00\x86\x0c\x192\xbc\xa4\xb8\xd8g\x04\x04\xb3\x01]\x03\
+@%\x94\x14_*\xbdz\xec\x98AM\xe0\x03\xcfh\
+\xd1}\xe2\xf5\x0b:y\x5cc\xfd\xe5\xe7_|I\x08\
+!\x8d\xde\xc7\xc4\x17\x0b.\x14\xb7l\xd9\xdc\xfb\x94\xca\
+\x17Q\xbf0\xe7i\xcd\xe3?B\x08\x19\x7f\xf5\xf8I\
+&i\xe5\xf5\x89M\xd3\xab#Z\xaf\xf3\xef\xa7\x81\x01\
+`\x15\xdd\xc8K\xb0D\xe8-J\x88\x16\x04\x01\x00\xaf\
+\xbd\xfe\xfa+\x84\xf8NZ!.\x17\xe9\xdd\xa7\xe7@\
+\x15\xbb\x17\xc6_=\xde\xefi\xc0\xed3g\xdcC\xd1\
+\x22C\x9doI\xde6%\x0bu\xad\x99\xb7?2\xeb\
+q\xf5\xf9\xee\xa5\xa2Ke\x19\x19\x19\xca\x1b\x89\x22\xe5\
+\xe5YV\x114U\xf9y<TvN\x8a\x0c1\xdd\
+\x96HHXz\x8c\x0c\x00o.\xee\xa7 =\xbb\xf5\
+\x18p\xee\xec9\xca\xeb5u\xd7\xa0\xd6,\x14\x14\x5c\
+\xa8\x18\xd0\xb7\xf7`N\x9fx?\xd6[\xeb\xc9(\xaf\
+\x1e\xdb\x86_\x9f\xd3\xd3\xd3\xdb\x9e\xcb\xf7\xac\xea;\x9c\
+\x0eB\x08!\xdf~;_\xfd\xfa\x91L\x19\x80\x95+\
+\x96\xaf\xa4{\x96\x97\x9f\x7f!!9\xb9\xa5Z\xd4_\
+\x07x\xfd\xd3\xd3!\x91\xe1b#:}\x03g`\x00\
+\xccz\x00=c \xea\x00\xe0\xdf!\xb5^\xe7\xce]\
+\xba]\xbaT\x5cI\x08!u^&>\xf7\xec3\xcf\
+\xb7\xef\xd0\x0e\xde\xaf\xbdH\x00\x10\x1c\x16\x9a\x98w\xe6\
+\xccyB\x08qx\xcbm\xd9\xb4\x95\xda<$Q\x83\
+)\xb1\xccS~\x16\x85\x9c'g\xcf~^\x19\xb4\xa2\
+\xc2K\x15\xd9\xd9\xd9\x1d$I\xe2\xbd)\xa81\x1cL\
+\x9f\xf5\xd2x`\xc4W3c`vj\x22j\x9bw\
+\xcd\x1a\x0d=\xc5\x03\x00\x0c\x1b>\xacO\xfe\xd93\xbe\
+G_n\xf3O&xP^V\x5c\xdd\xa7W\x8f\xe1\
+\x00`\xb3YY\x1a\x94~\x1bE\x9a\x22\x03&2\x8a\
+,\x1f\x01\x00\xf7\xdcs\xcfL\xd5Nya\xea\xd4)\
+\xb7(\xf9\x8a\x01\xe8\xde\xbdk\xff\xda\xaaj\xcd\xa2\xed\
+\xa7\x9f\x7fN=&\x14*\xae\xe8'\xea\x8b^Y\x9e\
+Q\x00u\xedI70\x00zVFOX\xa1S\x96\
+5\x00l=\x0f\x95\x92\x84\x0d\x1b\xd7o'\xc4\xf74\
+ \xe7\xe0\xe1\xe3)\x19\xa9Qt\xb9\xf4\x16\x19\xf8\xe0\
+\xc3\x0f\xde\xa7\x99\xedhp\xb8\x87\x8d\x1c=\x9a\xe94\
+\x8fQ\x8a\xf2\xab\x93\xe4\xa9S\xaf\xbb\x91\xc6u\xfb\xf4\
+\xdbn\x8fK\x8c\x86\xc5gtD\xfd2R2\xbd<\
+\x1e\xef\xd8|\x0d{.\xa3\x0d=\xe0\xf5\xc1Ld\xc1\
+\xf2\x12\xa1aa\x980qR\xaf#\x87\x8f\x14\xf8\xb8\
+\xd8t#@G\x0e\x85\x05\x17\xaa\xa6\xddt\xdd\x95\xa9\
+\xc9\x89\xec\xab\xc4,/\x8c\x8c\xa3Hv\xd9~\xd1\xf8\
+%\x00HMM\x0d[\xbdz\xf5fB\x08qz\xbd\
+\xff\xd6m[wI\x16\xc9\xfba\x1aI\xe5\xd7\xec\xd9\
+O\xcea\xfbs\xeb\xed\xb7\xdd)\xc0-Rh\xb6\x0c\
+\x1b-\xb3\xfd\xe2\x95\x13\x19\x0c_\x7f\x9b`\x00Xb\
+x\xf7,#E\x16XdX\x00x\x5cv\xab\x96-\
+\xf1\xe4\x93O=\xa1\x88\x0f!\x84\xb8\x9cN2h\xd8\
+\xe01`\xa0\x7f\xff\xfe}Y\x86/[\xb2\xe2\x0f\xa8\
+\xdf\x85\x93\xa8i\x80\xa6mj*\xe01\x02q11\
+\xa9\x17\xce\x9e\xbb@\x08!\x7f\xfe\xb9bCZ\xcb\x96\
+\x99\x16\xdf\xf7\xe5X\xda\xc1\x5c\xb3\xfd\xa7\xd3D`$\
+\x8c<\x5c\x22\xef\xa5\x07F\xde\xd0\xe8\x9e\x17\xed\xf8\x19\
+DI\x92\xd0\xafo\x7f\x5c7uj\xaf\x9c\x9cc\x94\
+\x11\x10oB\xe2mIfw5\x9c\xc9\xcf\xab\xb8\xed\
+\xe6\x1bG\x84\x04\xab\xfb\x94X\xb9dy\xa5g\xbcD\
+c\xc4\x9bF\x00\x00n\xbd\xe5\xd6\xb1,\xdd/<\xff\
+\xdc\xebT}+\x00D\x84\x85En\x5c\xb7v\x1b]\
+\xee\xd8\xb1\xa3\xa7b\xe3\xa3[\x0a\xda\xe19LV\xa6\
+\xf4\x9c&\xaf\x0ek\x00\xd8v}}30\x00f\xac\
+\xa4\x91\xf0\xf2:\xac\xd7\x09\x19\x80\x1c\x12\x12\x82+z\
+\xf7k[^^\xe1 \x84\x90\x06\xef\x22\xdf\xf7\xdf~\
+\xff\x0b\xd3\x16 I\x81\xabV\xadZO3\xbd\xa8\xa8\
+\xb8$-\xab\x95\xf7q\x0d\xd7\x00x\x7f\xcaa\x1e\xbe\
+\xd5\xd6\xac6m\xba\x8c\xb9z\xc2$\x8b\xd5\x1e\x0e\x00\
+\xd1\xd4\xce=\xa6/</)\x120\xbd<3\x1e\xc9\
+\x0c.\xa3\xf2za\x22\xa8<\xbd\xf1b\xdb\xf6\xcb\xcf\
+\xce\xce\xc6\x80\x01\x030d\xe8\x90\xee'N\x1c\xa7v\
+\xc2\xf1\xb7\x0c\x8b\xdeI`S\xce\x9e9S=s\xfa\
+\xb4Q-\xd23\xd8\xfe\xea\xd1*\xe2\x99Q\xbf4\xfc\
+\xfc~\xc1\x0f\x9a\xc3j\xce\x9d;W\xd6\xa9KG\xe5\
+\xdco\xd5\x81\x8c\xb9\xea\xcaql\x1f\xe7\x7f3\xffk\
+\x8a\x06v\x0c\xc0\xc9c\x15\x95G#\xdb\x7f\x9e\x01\x10\
+\xc9\x94\xaf\xac\x81\x01\xe0y7^\x98A_\x83\xa9\xa3\
+7\x8f\x11]K\x80\xe7\x1bu?,\xf8i\x11!\x84\
+\xd4y\xdfV+\xb8p\xe1b|b\x5c\x0bO#\x92\
+\x15\x80\x0d\x00\xa6M\x9b6\x9de\xfc\x1bo\xbc\xf9.\
+E:\x1d\xee\xf3\xa6\x04\xb2\x17\x1f\xe5\xee%\xb4n\x9d\
+\x9d:~\xfc\xb8\xb1\x09\x09q1j2\xdf\x00\x18)\
+,\xcb\x97\xcb\xc9\xd7\xab\xa7g\x08D\x06KO\x11x\
+\x02\xc4\xf3\x90\x5c\xa5\x91\xbd\xafpw\xe8\xd0\xa1\xc7\xd9\
+3g\x0b\xfd4_h\x14\xf4\xa7\x0a\x85\x17/6\xdc\
+w\xe7\xcc\xb1I\x89\xea\x11{F\x0a\xa2g\x18\x8c\x0c\
+\x01\x00\xa0\x7f\xff\x01W4\xd4\xd6k^\x97\xfc\xe5\x87\
+\x1f\xbfo\xdf\xbe\x1d=5\x04\x00\xbc\xf3\xd6\x1b\x1f\xd3\
+\xe5\x1a\x1b\x1b\xc9\xd4\xeb\xae\x9b\x0c\x7f0RR#\x03\
+p9\xe5\xfc\xeb\x19\x18\x00#\x04z\x9eB4\xdf\xe6\
+y\x19\xd1<\x08\xe3\xc7\x8d\x9b\xc8\x8a\xc6\xeb\xaf\xbe\xa2\
+|\xdb\x1d2\xe4\x00\x00\x08\x0a\x0d\x8e;p\xe0\x80\xe6\
+\xd5\xde\xfc\xb3\xe7\x0a\x12\x92\x93[y\xf9a\xd1\xa1\xc1\
+\xe2\xfby\x9e\xe3Z\xad\xd6\x88YO\xcdz!\xf7d\
+^\x01!\x84\xbc\xf2\xca\xcboS\x83\xc4\x0b?i\x10\
+\x19\x03Mzh@\x18d\xc9bT\x87\x07\xbc\xb2\xc6\
+\xd6\xdeG\xbb\xde\x18\xb0S\x0b=%\xd23**\xf4\
+\xea\xde\xad\xfb\xf9\xfc\xfc\x0bfL\x80\xe85fzM\
+\xa0\xf8R\xa1c\xdaM7N\xe8\xde\xa5\x13\xa2<_\
+\xe5\x12\xb5\xcf\x9b\x07\xf3\xe8\xe6Ma\xd5\xb4_~\xfa\
+Y\xb3\xf3\xcf\xe9t\x92\xb1\xa3G\x0d\x8a\xf7=r\x95\
+\x00 55\xa5UIqI9]v\xc7\xcem{\
+\xe0\xf98\x89\x88NV\x8e\x8c\xf4JT\x8f\xc5)\xc2\
+C\x975\xb5\x08\xc8Z\x14^\xd8\xcb6\xae7\xef\x17\
+\x09\x1f[\xde\x0a\x00\xc1A\xc1\xb1\xfb\xf6\xec;L\x08\
+!\x0eo\x14p\xf4\xe8\xd1\x1c\xd9n\x8d\x02\x00\x8b\xc7\
+\x00X\x01\xe0\xf1\xc7\x9f\x98\xcd\x0a\xd7\xa3O\xccz\x92\
+\x22\x90\x8d\x02,\x9c{\x09\x00\xee\x7f\xf0\xde\x07i<\
+\xc7sr\xf2\x22#\xa3S|\xa8\x0c-\xae\x88?\xb0\
+X\xe4\xe0\xbb\xef\xbc\xf3\x8e\xf7\xde\xfe\xf0\x8d+G_\
+5^P\x96\x07\x22A7#\x0ct:\xab\xec\xecx\
+\xb0\xf8y\xf8\xd81\xd5\x0b[\xd1\xb1}\xfb\x1eg\xf3\
+\xf2\xa8w\x1c\xd8S\x0c\xb4\xa9<3A\xa7\x17_\xba\
+\xe4\xbc\xff\xae\x99\x93\xbbv\xe8\x80\xb6m\xdb\xd24\xf2\
+Ba^\x1f\xf4\x0c\x80\x0a\xd9m\xdbu++\xab\xd0\
+\x9c=\xb1l\xc9\x92\x95\x16\xdf\xc2\x90Z\xf7\x91\x07\x1f\
+z\x94\xa5\xfa\xa1\x87\x1ex\xc2D\xfb\x80?O\x8d\x14\
+_\x0f\xa7\xd9\x9f\xa9\xf3\x00x\x0d\xe9\x09\xbeHP\x8c\
+\x0c\x84\x04\xadwV\x95\xf1\x89\xc7\x1f\x9f\xc52\xf6\xee\
+\xbb\xef~\xc0\xc3}\xc9f\x97\xe4`\x00\x08\x0a\x0d\x89\
+?|\xf8\xc81\xba\x5c~\xfe\x99\x0b\x09II\xde\x05\
+\x18\xcd\x82\x1fc\x00\xd4)\x82\xd4\xa6M\x1b|\xf4\xc1\
+\x07S+\xcb}\xfbZ\xb6l\xd9\xb27444\x92\
+\xea\xb3H\xe0u\x95\x1f\x00^\x7f\xf5\xb5w\x14\xbc\x0e\
+\x87\x83L\xbbm\xda\x1d\x9c\xf2<\xe0)%[\x9e\x1d\
+\x1b\xa3\xb0\x9f.\x07A=\xbd\xb1g\xc7\x91N\xa7\xa7\
+\x85\xe8\xd2\xb9s\xcf\xb3g\xceP\x91\x80\xde\xa2\xa0q\
+\xfa\xf9sg\x1d/\xcc\x99}\xfd\x98Q\xa3\xa1\x1e\xb1\
+\xeco\x8cD\xfd\xe6\xc9$\xcbW\xcc\x9b\xf7\xdd\x8f,\
+\x1d\xc3\x87\x0e\x19E\x95\x95\x01 )).\xf0\xf0\xfe\
+\xfd\xc7h:/]\xbaT\x1a\x1f\x1f\x9f.\xa0Co\
+j\xac\xa7\xf8F\xbaf\xa6\x8c\xcf\x01\x18\x18\x000\x88\
+y\xcc\x14\x85\xf2\xa22\xa2P\x9c\xf7\xb3\x02@z\xf3\
+\x8c\xf6\x17\x0b.\x16\xd3b\xb0u\xf3\xd6\x9d\x16\x9b%\
+\x0c\x00\x02dk\x88\xe4-\xfb\xe4\xacY\xcf\xb0\x03\xf6\
+\xc2\x8b/\xbe\xe4#\x5cb\x95\xdeK\x8b\x9a.\xc7F\
+G#\xabu\x16\x1e\xfa\xcf\xc3O\xe7\x9f\xcd\xcb]\xb0\
+`\xc1\x1fC\x87\x0d\xa7O\xaf\xd1\x1b(@\xcb/\x8d\
+2u\xee\xda\xb1\x9b\xb3Q\xfb\x86\xd8\xb1c\xc7r\xac\
+v{\x14\xcc\x81\x91`\x1b)\xa8Y\x01b=$O\
+YDB'\x8c,\xda\xb6m\xdb5?\x9f:J\xcb\
+mn\xb3\x90[pS\x5c|\xc9=c\xc6\xf4k\xa9\
+Sx\xcd\x18=V\xa6\xfd\xf2dY\xc6\xa8Q\xa3\xfa\
+\x94\x97\x95\xd7\x13BH\x83w\xab\xf9\x8a?\x97\xfd\x0d\
+j\x9d\x08\x00\xacV\x0b\xee\xb9\xe7.\xbf7\x04\xdfz\
+\xeb-\xbf\xb7L\x19\x1e\x89\x22\xe2\xcb\xfd\xf1\xda\xe1\x8d\
+\xab\xaf-\x13\x06\xc0\x0c\x13\xe9\xc6y\xc2\xc2Sr\xc5\
+\x18X8\xf9\xf4B\x1d\x00`\xfe\xd7\xf3\xbef\x19|\
+\xe3\xcd7\xdd\xe4iP\x0a\xb4Ir \x00\xd8\xad\xf6\
+\x88\xc3\x87\x0e\xe5x\xe4\xc4#)\xe5e\x15U\xcd3\
+[\xb7\xf3\x10*[\xe1\xbf\x10HO\x03\xd4\xbeH\xb2\
+,\xbf\xf6\xca\xcb\xa1-\x9b7\xb7\x01\xf0<\xe3\x12\x0f\
+\x96\x11\x9f$\x00\xb8\xa2G\x8f>n\xb7\xf6\xf8\xadC\
+\x87\xf6\xe7\xd8m\xb6H\x06\x07\x8d\xcb\x0c\x985B\xec\
+\xd8\x08\xc3_\x0e>\xde\x98\xd2\xf8E\xd3\x01M;-\
+[\xb6\xe8x\xfa\xf4I\xdfA(nz:\xa0\x1f\x15\
+h\x8e<\xf1&VUT4\x0e\x198p\x88\x80\x17\
+,\x1fD\xbcS\xf9#I\x12\xb2\xb3\xb2\xf1\xcbO\xbf\
+\xfcL\x08!\x0d.\x87J\xc7\xc8Q#&\xb2\xf8$\
+\x09\xd8\xb3k\xf7.B\x08q\xb9<\x86\xc2\xe1h \
+]\xbaw\xea\xe2-\xc73H<\x9e\xf2\xa2\x02=Y\
+0\xab\x93\x22\xf94\x5c\x04\xe41\x89\x8fH_\xc8\x14\
+e\xe7\xa5\xe9)\xa3\xda^\xff~\xfd\xfa\x97\x97\x95\xd5\
+\xd0B\xb1v\xed\xda-\x92,\x85\x02@\xa0d\x0d\x92\
+\xbd\x1f\x11\x9dq\xfb\xf4\x19\xac\x00}\xfb\xed\xf7?Q\
+\xa4\x8b\x22\x0e\x96Fv\xe3\x89^\xb8\xab\xc7'u \
+%\x09\xd6\xef\x16|\xab\x09+\xef\x7f\xf0\xbeG\x98\xf2\
+\x22\xd0\xb3\xf6\xbc2F\xc2\xcf\x1a\x00\xba\xbe\x08\x1f\xab\
+\xf8zB'4\x96\xad\xb3\xb3:\x9e>u\xf2\x8c\x8f\
+\x0b\xe2}\x02\xac\x11 \xc4c3\xdcT\x95uk\xd6\
+l\x84\xcf3\x8bh\x12\xf5\xcf\x8f\x17\xf7\xcc\xb8\xf3j\
+\xa5\xadF\x87\xe7d\x8a5\x7f\xaf^F\xd5T\xaf\xa6\
+L\x99<\x8d\xa5\xf5\xf3\xcf?\x99g\xe2\xfb\x07\xa2H\
+\x89g \xcc\x8c\xab(j\xe3\xd1\xe0\xc970\x00\x22\
+\x0b\xc5#\x9c\x17\xce\x80S\x97\xf7\x18\xce\xc2\x5c\xb3m\
+\x02\x00~\xfa\xf1\xfb_XFO\xbaf\xd2u\x00`\
+\x85\x1c`\x97\xec\xc1\x00 Kr\xc8\xce\xcd[wi\
+\x84\xc7\xe5&#F\x8d\x18\xe7%I\x82\xf6\xa9\x00\xdb\
+\xbe\xc8\x1a\xeb\x85llY\x80\xa1\x1f\xcaGP\x82\x82\
+c\xe6\xcc\x99\xf5\xfc\xfc\x05_\x7f\x7f\xfd\x8d7N\xa3\
+\xf2E\x82\x22\x02\x9e\xa0\xeb\x09\x0b\x9bo$t\xe0\x94\
+\xe3\x8d7\xaf\x1c\xcb7\x967\xc8\xce\xce\xear\xea\xd4\
+\x09\xd5\x08\xe8\x1fh\xe2\x7f\x06\x92\x93\xf8^ jh\
+h \xd3n\xbb\xfd\xda0\xedy\x0dF|\xe3\xf2 \
+(\xc8\x1e\xbaq\xfd\xfa\x9d\x84\x10\xd2\xd8\xe8\xd9\xd1[\
+ZT\xec\x9ev\xf3M\xc3%\xab\xd6^J\x12,\x9b\
+\xd6\xae\xdbL\x08!\x0e*\xb2\x1b0\xe0\x8aa\x9c\xf6\
+x\xed\x8b\xd2A\xfd\xe5)6]\x9eUv\xa5\x9c\x91\
+\xc36\xb5\x13Po\xe0y\xf7<\xa1\xe3y[v\x10\
+,\x02\xbcjGzt\xef\xd6\xdf\xe9p\xa8\x02@\x08\
+![\xb7n\xd9\x09\xef^\x00\xabd\x0bR\x1e\x0b\x0e\
+\x1e4x8+B\xbbw\xef\xde\x07\xc9\xf3HF\xf6\
+=\xf3g\x0c\x80\xc4\x1a\x04\x1e-l\x1a\xcb+\x11/\
+x\x1e\x97\x1e \xfa\xaf\x11\x88\x14U\x0f\x1f\xcf\x90\x19\
+\x8dcS\x0c\x00\xaf\x0eM\x83\x9f\xb2eggu:\
+y\xf2\x04\x15\x09\x88\x8c\x80(\xcd\x97\xfe\xd5\xd7\xf3\xde\
+\x98z\xfd\x0d\xe8\xda\xb5[S\xf8\xa7\xf2C\x92$D\
+DG\xe1\xa9\xa7f?\xad`W\x0e\x87\xfd\xec\x93\x8f\
+\xbf\xcc\xcc\xcc@\x9f\xbe=\xd5\xaf5\x03\xc0\x8c\xdbn\
+U\xbd\xbfr\xda\xf3O?~\xbf\x90\xd3\x0e\xdb6=\
+\x1elY\x11\xdfi\x9e\x82\x93.\x92=\x91q6\x1d\
+\x01\x88\x94\x9eG4[O\xafS\xcaO\xb89\x87e\
+\xd2\xbc\xaf\xbe\xf9\x9e\x15\x83;gx\xde\xfe\x93\x00K\
+\x90d\x0d\xf6\x95\x9d\xe7W\xf6\xf1Y\xb3\x9eV\xf2\x05\
+F\x80g\x80D\x8c\xd43|\x22\xcb\xce3\x02\xac \
+\x18\x81\xc8H\x88hc\xeb\x89\x14\xd5\xecx\xf1\xda\x01\
+\xfcy%\x12|\x0d\xb4h\xd1\xbc\xdd\x89\xe39yb\
+#\xe0\xd6&\xbb\xdd\xc4\xedv\xfb\xfez\xe1\xc3\x8f?\
+y\xf5\xba\x1bo\xc6\xc3\x8f<\x86\xfe\x03\x07\x81\xfd\x9e\
+\x04C\x87?\xfd\x92\x84\xde\xfd\xfbw*/-\xab&\
+\x84\x90\xbaFO\xe8\x9f{:\xb7\xb8O\x9f\xde-\xd2\
+\xd3R\x91\x94\xe8{\x1f!--%f\xdf\xee=\x07\
+\x08!DY\xd7\xa9\xad\xaev\x5c9z\xd4p\xa3>\
+3\xfc\x11)/\x8f\xd7,\x0e\x91A7#\x9fM\x9a\
+\x02\x98!\xde\xc8\x1a\xd1\xc4\xb2\xcf\xdfE\xde\x96.\x8b\
+\xce\x1d:tu{\xcf\x08P\x86\xfexN\xce)\xd9\
+\x22G\x02@ ,\x01\x16\xef\xc1\x96\xad[\xb6\xcc*\
+-..&\x84\x10\x97WP*K+\xaa\x07\x0f\x19\
+\xd2\xddK\xbb,i\xdb\x10);\xddo\xb6\xcff\x0d\
+\x00\xfb\x97UP\x1e\x9fE\xd0\x94rFe\xf9\x82\xc1\
+/\xc3\x0a\xa2\xa8\xff\xbc{]/\xd5\xb2yF\xf6\xd1\
+\xa3\x87O\xf9t\xde\xad*;qy5\xdf\xed\xf2\xa6\
+{\x7f.\x17q{=\xb4\xc3\xe1 \xf7\xdcw\xdf\xb4\
+f\xdem\xc2a\xc1\xa1z\x07\xa1\xb0\xfd\x94dY\xc6\
+\xb0a\xc3\xb0}\xeb\xf6\xbf\x08!\xa4\x91Z\xf8\xbb\xef\
+\x9e{\xee\xb3Z,\xca[\xa8\x90\xbd\x11\xc0\xa3\x8f>\
+\xaa\x9e`\xad\x9c\x22\xff\xfd\x82y?\xeb\xb3[\xd3\xb6\
+\x1eODr\xc5\xe3/\x9d\x0e\xe8\x87\xfeJ\x9a\xa7m\
+\x03\x03\xa0G\xbc\x88 3\x06@\xb9f=\xaf^x\
+\xaa\xbek\xfd\xde\xdbo\x7f\xc8z\xf6W_\xf5\x9d\xb6\
+b\x97,\x81\x0a\x8dO>\xf6\x84\xba\x87\xa0\xde;\xa8\
+K\x97,]F\xd1N?\x89\xd03Xf\x04\x9a\xcd\
+\xa3\xef\xc1\xa4\x19)\x8e\x9eb\x9a5\x004\x88\xea\xd0\
+\xf4\x89h\x04\xf8c\xa2\xd7\x0f\x91\x91\xe0\xa5\x03\x00R\
+\x93\x93\xb2\xf6\xec\xda\xe5\xdb\xc7\xa1*\xba\xd7\xeb+\x0a\
+\xef\xf2\x1a\x07\x97[]\x048|\xf8pNDT\xa4\
+\xba?\xb8\x09 \x01\x80\xc5n\xc13O?\xfd\x88\xd2\
+t\x83\xd3\xe3\xfd\xff\x5c\xb2d\x9d$\xa9\xef\xf9\xab\xf4\
+\x0e\x192\xb0E\xc9\xa5\x92bB|gVT\x94\x95\
+Tu\xd5~\xa1J\xd8\x9e\x80wz|\xd4\xc3\xc5\xc3\
+-*\xa3\xe9GS7\x02i+\x8b\x95\xc6\x8c\x01\xe0\
+-\xb6\xf1\x14\x8e\xf6\xce\x16\x00HKK\xcb.).\
+.\xa7\xc3\x80\xca\xf2\xf2\xea6\xd9\xd9]\x01\xcf\x82\xa0\
+\xcd\xf3\xb8\x0f\x00\xb0b\xd9\xf25\x1e\x03\xe0T\xa3\x86\
+gg?\xf3x\xa4\xef\x8b\xc2z\x86\x87g\xb8x\xd3\
+\x14\xb6\x9c\xc8X\xf0x\xa9\xc7/v\xd0X\xc3\xc0\x8e\
+\x09\x9d\xc6\xbb7\xa2C\x86?\xcdf\xee\xd9\xf6xF\
+P4EP\xeb\x0e\x18\xd0\xaf\xf5\xe1\x03\x07\x18#@\
+\x08q{\x95_\x99\x060\x1f2\xfa\xcf\xa3\x8f\xa8;\
+>\x9b\x00*\x0d}\xfb\xf6\xedQ|\xa9\xb8\x86\x10B\
+\xea\x1b\x1a\xbc\x0a]V7x\xd0\xa0\xee)\xa9I\x08\
+\x0b\x0f\xd3\xd0\xf9\xd1G\x1f~\xc5:\xa1\x97_~\x89\
+\xdd.\xee\xd7\x0e\xc3'#\xfda\xeb\xf2p\x19\xe1S\
+\xf2y\xbco\xd2\x22\xa0\x19E7\x13\xd2\xe8)\x93H\
+\xc1\xe8\xbd\x02\x00\x809O\xcez\x9a\x1d\x80\xef\x17,\
+P\x1f\xf5\xd9`\xb1\xc3\xbb88\xa8\xdf\x80\x9ee%\
+\xa5\xf5\x84\x10R\xd7\xd8\xe0&\x84\x90\xc6\xba\x86\x86)\
+S\xa7\x0eP\x18\x22\x89\x95\xda\x0c\xfd\x22\x03\xc0g\xba\
+\xb9\x01\xa4\xd3 \xb87#$,\x88\x94Vo\xfcD\
+B\xc9\x8e\x97^\x9e\xde\xfa\x80\x04@\xb2Y,\x90d\
+\x09-3\x9a\xb7=\x9es\xec\xb4G\xff)\xcf\xaf\xcc\
+\x04\x14\xa3\xe0\x85\x95+\xff\xda\x00h\xbe\xe1\xa8\xd7\x7f\
+\x96\x17\xb0\xd9\xeca\x9b\xd6o\xda\xe4\xf1\xe6>\xcb\xf2\
+\xd8\xa3\x8f\xce\x09\x0e\x0dF\xf3\xe6\x19\x08\x0e\x0aBd\
+x\x18\x82\x02l\x185r\xc4\x90\xca\xca*\xdf\x1c\x81\
+\x10r\xfaD\xce\xf9\xa8\xc8pe\xab8;\x9d\xa4\xf9\
+\xc3\xb6/\x92\x07\x91\xec\x18\xf1\x91\x96M\x05\xc42m\
+\x22\x02\x10\x09uS\x14\x9dG$O\xc9y\xca\xc4K\
+\x83,\xcb\xe1{w\xed\xda\xef\x194\x9f4L\xbb\xf9\
+\xe6\x1b\xe9vd\x8b\x0c\x8b\xcd\x82\xd9O=\xa9\x86w\
+\xb5^#\xb0k\xc7\xceCv\xbbM9\x1a[\xa4\xc8\
+z\xc2\x0f&M\xc4h\x98\xac\xcf\x03=\x03\x22\xaa\xaf\
+'\xfc\xbc\xb1\xd2\xcbg\xf1\x99\x19kQ\x1e\x98k\x91\
+\x81A\xf3\x8c\xe6\xedN\x1d?\x91\xaf\x0e\xac`\x9b\xc0\
+\xfe\xbd{N\xa4\xa4\xa7\xd2\xdbm\xcd*\xbf\x0ao\xbd\
+\xf1\xe6{\x0a>\xe5a\xe3\xc6\xf5\xeb6\xca\x16\xdf\x9b\
+Z\xb2,c@\xff\xde\xe8\xd4\xbe\x8de\xeb\xfa\x0d\xbb\
+\x08!\xa4\xd1\xed\xfb6\xe0\xcc\x99\xb7\xd3\xdb\xb9\xd9O\
+\x89\xe9\x19]=\xfd\xe1\xa5\x81s\xad\xa7\x97\x80^\x9b\
+\x97\x11\x01\xb0iJ9Q\x08m$\x18\xb4\x010z\
+\x14H\x97\xc3\x94I\x93\xafUG\xc0\xbb\x0a{\xf2\xd8\
+\xf1\xdc\xc8p\xd5\x12\xab\x9d\xbfr\xf8p\xcb\xfaUk\
+Vy\x06\xceE\xea]\x9e9\xdeg\x1f~<?>\
+>\x16\xcdRR\x00\x7f\x9ay\x06L\x01\x9e\xd7\x13]\
+\xeb\x09?{\xcd\xb6\x01N\x19\xb3\xc6@O\xb8\xe86\
+\x8c\xca\x8b\xc6\xad)\x86@\xf4c\xe9V\xd3233\
+\xb3\xf6\xee\xdd{\xd0_\xed=\x8f\xdc\x16.\xfcmq\
+\xf3\xe6-S9\xfd\x17\x81\x9fB\xdc\x7f\xef\x03~[\
+x\x0b/^\xac\x1a3jd\x1f\x8b\xefq\x9f$I\
+\x12Z\xb7\xce\xc4\x97\x9f|\xfa\x8cR\xae\xc1{2\xd0\
+\x8aeKW\xb5k\x9fm\xb1Z-\x0a?E\xfce\
+\xfb\xca\xed7\xc4<U\xf0\xb1\xb8\xf4\xa6[\xbcz\xa6\
+\x0d@S\x06R\xcf\x00\x88\xf2\x94k\xce\xf3xM9\
+\xcd\xd3\x02\x89\xda\x8b=\xef\xab\xf9\xdf\xb2\x03\xf8\xf9'\
+\x9f\xf8\x9d\xbf\x16\x17\x1d\x8d\xd6-[6?\x95s\xbc\
+\x90\x10B*\x1bj\xd5wN?y\xff\xfd\xc7\x06\xf4\
+\xef\xa3<\xde\xe1\x09\xb9(\x92\x11)3\x9f\xd9|A\
+\xd0\xbb7\x1aXQ\xe8\xadg(\xcc\x18\x08\x9eP\x89\
+\x04\x92.\xdbT\x03\x00\x88\xdb\x00\x00\x84\x85\x87'\xbe\
+\xff\xfe\xfb\x9f\xef\xd8\xb9#\xef\xf0\xe1C\xf9\xdb\xb7o\
+\xdb\xb9`\xc1\xb7\xdf\x8e\x1d;\x8e\xfe\xc2\xae\x88\x7fl\
+\x9ef\x0c\xbav\xe9\xd2\xa7\xcc\xbb\xbb\x94~\x9cx\xff\
+\xbd\xf7>\x04@9\xd3@\xad3x\xc0\x80~\xb5\xd5\
+\xd5\x0eB\x08\xa9\xab\xafw\x13BH]uU}\x97\
+\x8e\x1dz\x01`w\x8d\xd2\x8a\xc7\x1bgVFx\xce\
+\xe4r\x0d\xaa\x99:\x9er\x97\x19\x01\x98i\x80U \
+\xa3\xf0\x9e6\x02\xac\x80\xb0\x8f\x0b\x95\xbfHLHl\
+q\xb1\xe0\xe2%B|\xf3\xb7\xba\x9a\x1ar\xd3u7\
+\x5c\x9d\x9a\x9a\x8a\xa0\x00\xbb\xd2\x0f\x04\xd8,\xb8\xef\xce\
+\x997\x10\xef\x86\x8d\x8a\xfaZ\x17!\x84\xd4\xd7\xd6\x92\
+IWk\x04\x8a\xa6\x8f\x1e ^\xd8\xc53\x12z\xe1\
+\x9b\x1e\x88\x8c\x84\x19\xe5\x16\x09?O\xd9\xc0\xdc\x9b5\
+\x00\xa2:z\x06@\xe4\x00\xf4h\xd0\x9c\xd0d\xb1X\
+\xf0\xf8\xac\xc7R\xc7\x8e\xbd*\x1b@8\xc4\xa0g\x00\
+\x94|\x19\xf0\x1c\xfdv\xf2X\xcei\xd6y\xfc\xb8\xe0\
+;\xbfM<\xd9Y\xadp\xcd\x84\x89\xc1\xebW\xad\xdb\
+N\x08!\x0e\xa7/\xf4\x7f\xee\xe9\xd9/1\xe5Y:\
+D\xf2\xc0\xf2\x81\x95#\x16\x8fh<XC\xc2\xfe\xd5\
+o\xb3\x09\x06\x80&\x84\x17^\x98Qv\x9eg\xa5\xaf\
+E\x06\x807EP;~\xf3\x0d7\xdc\xaa\x0cH\xbd\
+\xcb3\xbf\xbfp\xe6\x5cn\xff~W$y\xc32\x09\
+\x80\x94\x92\x98\x80;n\xb9\x09K\x7f[\xf4\xba\xd7\xf9\
+\x93j\x87\xa7\xfc\xf9\xbc3\x97\xda\xb6\xcdV\xbeB\xac\
+\xf7X\x90\xa5\xab\xa9\x1e\x0f\x9c{0y\xbc4#\xe1\
+6\x03<a1j\xdf\xc8\x00\x01\xfa<\x11\xf1\x07L\
+\x1d\xf6^\xc5\x13\x18\x1c\x88\x01\x83\x06*\x87\x7f\xf0h\
+5c\x5c\xd5rV\xd9\x12\xb6f\xd5\xdf\x9a#\xe4\x08\
+!\xe4\xe8\x91\xc3\xc7#\xc2B\x13\xbc\x88\xad\xf0>z\
+\xee\xdc.\x1bkW\xacz\x97\x10\xcf~\x12\xe5\x85\x9f\
+\xd5\xab\xfe\xda\x04_4\xca\xea\x84\x1e\xcfD\xcand\
+\xcc\xc1\x94e\xfb\xae\x87\x93O\x9f\xc9)\x00\x00\xbfA\
+\xe3)\xbfHi\x8c<\x04\xab\xd8\xa2g\xf3\xac\x11Q\
+\xa7\x02\xdf~\xe3\xf9N`\xa3\xdbE\x5c\xde\xf5\x80\x05\
+\xf3\xe7\xff\x0a\x00\xe1\xa1\xa1\xea\x11U\xd9-[\x226\
+*\x0a\x0b\xbe\xf9\xe6\x0fB\x08\xa9'nR\xd1P\xe7\
+&\x84\x90}\xbb\xf6\x1c\x0a\x0b\x0b\x8d\xa7\xfa\xc8{\x81\
+\x89e,\xcb\x5c#KN\x83\xd9\x01g\xeb\xfcS\x10\
+\x09+8ize\xf4\xca\x89\x94\xdfL=\xb6=\xbd\
+>\xd0`\x8a\x97?}\xbb@=\xe1G\x09\xfd+\xcb\
+Kk\xbat\xe9p\x85\x17\x89,{\xbf\xf1\x07\x00\xd7\
+O\x9ex\x83\xb2\xf9\xcc\xe1\xfd\xd8g}Mu\xfd\xd0\
+\xc1\x83\xfa2m\x8b\xae\xcd\xfeD|0\xc2\xc5\xcb7\
+\xe7\x9cLD\x00\x22k.\x1a\x5c^\x1e/\x0c\x04\x93\
+'\xda\x17`a\xae5e%\xaf\x11\x88\x8f\x89I9\
+s:7\x9f\x10B\x1a\x1a\xeaU\xab>\xe3\xf6\xe9\x8f\
+t\xed\xd2\x09\x99\xcd[\x80\xc2\x8b\xcc\xb4\xb4\xb8\xbd\xdb\
+w\x1e#\x84\x90\x1a\xe2t\xd7z7\x09\xad]\xbdf\
+]\xa8\xef\x1b\xd5\x22&\xb2S\x83\xa6\x0e\xb2\x08\xfe\x0d\
+\xe5V\xf0\xf0p\x19\xa5\x99\x11<3\xe1\xacrM\xf3\
+\x8f\xc5\xc3\x96\x15\xc9\x97\x88N\x167\xaf\x7f~\xfd\xfd\
+\x80\xdaDF\xbf^t\xed\x94\xc9\xea\xd3#\x19\x92\xcd\
+{>$\xd2R\x93[\x15\x16\x14\x5c\x22D\xbb;\xf0\
+\xcd\xd7^y,>>\x9en\x87\xc7s\x91\x82\xeaM\
+\xaf\x8cx\xca\xde\xf3x`\x14u\xf9\xa6\xb3\x06\x06\x80\
+.\xccSd^X/\xea\x08\x8f\x18\x99s\xcd\xe6\xf3\
+\xce\xf0c\x0d\x03\x00\xe0\xea1c&\xba\x1b=\x83T\
+\xed\xf0,\xd28\xea\x1b\xc9\x83\xf7\xdc{erJ\x22\
+\xdd\x1f\xd8\xadVL\x99tM\xd7syg\xca\x09!\
+\xa4\xde\xd1@\x1c\xde\xdd_\x0b\x7f\xf9u\xa9\xe4\xddN\
+\xcca(o\x1a\xc0c.\xcf0\xf2\xd2h\xf8\xb7\x0c\
+\x80\x08\x8c\x8c\x90\x9e\xb1\xd2\x1bG\xa3\xbe\xf2\xfa\xac\x19\
+;\x83vY\xdaE2\xc3\xab\xab\xb6\xf1\xc2\x9c9\xea\
+\xe7\xba\xdc.\xdf\xf3\xfe\xff\xfc\xe7\xc1\xc7\xd4\x0a\x92\x14\
+ A\xf2,\x1cIR\xf0\xe6u\x1b4G|\x13B\
+\xc8\xd2\xc5\xbf\xad\xb0Xd=\xfe\xb0i\x0a\xe8M\x7f\
+E\x06\x97\xe5\x03\xef\x9aW\x96\x87\xdf\x9fW&\xa6\x00\
+<\xef\xcdS~\x9fU\xf1'Lb\xf2EVPd\
+d\xd8\x0e\xf1^\xe1\x85,I\xf8\xfe\x9bo\xde\xf0X\
+wB\x1a\xbc\xafr\x1e;t\xf8Lf\xf3\xf4\xe6\x14\
+m\xde\xf7\x0a:\xe2\xcdW_\x1b[YV\xe1\x09\xeb\
+\x1a\xea\xdc\xca'\x9f~\xfa\xf1\xa7\x9feY\xe6\xd1\xcb\
+\x1b\x08\xd6h\xf1\x0c\x80\x88/l\x9aY\xd0\x13|^\
+Y^=#\xbc\x80\xff\xb8\xe9\xd572\x10l\x19\x05\
+\xaf\xc8#\xea\xd5\xa5q\xe8\xd1\x03\x00\x98\xf5\xf0#\xd4\
+y}>\xcf\xff\xd6[o\xbc\xaf\x94\x91%9H\x92\
+\xe4 \xe5\xfe\x8bO?\xfd\x9a\xadr.?\xef|R\
+||s\x0a?\xaf]Q\x7fD\xd3\x16\x91S\x11E\
+\xa0~\xfd\xe3\x94\xe3\xe9\xa5?N\x03\x03\xc0\xf3\xd0\xa2\
+\x06y\x96\xc6L'\x15\x85f\x05\x8e\xfd\xb1\xe7\x05\xd2\
+\xe9\x16\x00V\xab\xc5\x82\x88\xb0P\xfc\xfa\xcb/\xab\x08\
+\xf1|0\xb4\xde\xbb`\xf3\xf7\x9f+\xd6\xc8\xbe\xe74\
+\x12\x00\xd9&[\xf0\xe0=\xf7c\xfe\xe7_\xdcZY\
+VF\x08!\xa4\xa6\xb1\xc1\xed\xf4\xd6\xf9\xf9\xa7_~\
+\x0c\x0a\x09\x16\x09\xbf\x9e\xd56\x1a@#\xde\x88\x94@\
+\xef\x07\xa6<\x0dF4\xe8\x01\xad\xa84n=\xc3\xc6\
+\xa6\xd1\xd7\xa2(\xd2L\x1f\xd9\xb2\xec=\x97\xe6\xa7\x1e\
+{TU~\x17\xf5\xb8o\xde\xd7_}\xaf\xd4\x93$\
+)@\x92du7\xe13O<\xee\xf7u\x1fB\xdc\
+d\x8c\xf6D v\xdc\xe8\xb6\xf5dA\xc47\x1eo\
+D\xebP\x22>\x88\xf4\x94\xbe7m\x00x\x83\xc9\x1b\
+\x04=\xe1\xd2\x1b0\x9e\xa5b\x7fl9v\xb3\x90\x04\
+\xc0\x22yVl-\x00\xd0<#=\xe3\xc2\x993\x05\
+\x84\x10R\xedr\xaa#\xfe\xeaK/}\xd5\xbbk7\
+t\xf7|\xb6]\x02 \xc5F\xc7\xc0f\xb1\xe0\xae;\
+\xeexP)\xd7\xe8\xf2=\xe6\xf9\xe9\xc7\x9f\x16\x05\x04\
+\x04\xd0\xdbLE\xd6]\x94&R\x18^\x9aHy\x8c\
+\xd2x\xd7<\x03\xa5\xd7\xb6\x11\x88\xe87\xe2\x01\xaf,\
+\xcf\xd8\xf1dJ\x01\x91L\x88\xdaV\x95\xff\xc9G\x1f\
+y\xca\xa7\xbe>\xe5_\xb2x\xf12I\xf2l\x1f\x96\
+$\xd9.I6\xf5\x93Cw\xdd1\xfd6\x7f\xe5'\
+\xe4\xe5\xe7\xe6\xbc\xc8\xd0\xc4\xeb\xa3\xc8\xb0\x99\x95\xf1\xa6\
+\x18B\x16\x87\x1e\x9f\xf9zg2\x02\x10Y(\x09|\
+\x85\xd4+\xdf\x14\x8b/\x12\x16\xbdN\x01\x00F\x0c\x1d\
+2\xd2Q\xef\x99\x02\xd4y\xa7\x02.\xa7\x8b\xcc\xfb\xec\
+\xcb\xa7g\xdcx\x0b\xfa\xf6\xee\x03\x06\x1f\xe6\xcc~R\
+}s\xd0E\x9d\xee\xb2|\xd9\xf2\x95\xb1\xd11\xeaQ\
+3\x92\xe7D!Pt\xf0\x04\x9e7\x18\x22\xa5k\xaa\
+2\x9a\x01\x9e\x80\xf2h\x12\x95Sp\xf0\xea\xf0\xc6\x81\
+\xc5\xcf\xd63\x03M-\xaf\xd4\xa1\xff\xaa\xf0\xda\xb3\xcf\
+\xbf\xc2S\xfe\xe5K\x97\xac\x94$x\x15^\xb2\x02\x16\
+\xabR\x7f\xf0\xa0\x81C*\xcb+\x1a<u|2\xf0\
+\xfb/?.2\xe8#\xaf\x1ff\x14\x93\xad\xcf\xbb\xd7\
+\x8b\x1c\x00-\xff\x95{#\xc3\xe2Ik\xa2\x01\xd0\xb3\
+llCl:M\x9cYe12\x16,\x83\xd4m\
+\xc2\x00p\xcf\x1d3\xefS\x06\xb0\xae\xde\xf3\x8d\xe1\x9a\
+\xaa*2\xeb\x91G\xef\xb8\xe9\xba\xa9h\xd5\xb2\xa5\x1f\
+=\x8f=\xfa\x88\x1a\xfa\xd1\x02\xb0~\xcd\xbam\xd1\xd1\
+\xd1\xa9\xbe6%^_\x8dB~\xf6\x9a\xed?\x8f\x1f\
+<\xb8\x1c\x83a\xc6\xc8\x8a\xea\xf0\x14\x5cD/+\x98\
+\xbc\x10\x9d\xae\xc3\xbb\xd7S.\xa3\xba\x00 }\xf7\xd9\
+\x97\xea\xdbz\xb41_\xb6l\xd9\xdf\xb2,+Oy\
+,\x80\xc5\x06x\xd6zZ\xb7\xccl_t\xb1\xb0X\
+\x1d\x7f\xaf\xcd\xd8\xb3g\xe7\x91\xd0\xa0\x00e\xc9_o\
+\xea\xc7\xeb\xb3\xd9\xbe\xfc\x9bF\xd2h\x8a\xe5\x93U\x03\
+\x03\xa0'0\xbc9\x0d\xafQ6\x8d\xc5\xabg4D\
+?\xd1\xe1\x1d\x9a\xd7\x86\x01\xe0\xcd\xd7\xdfx[5\x02\
+\x8d\xcak\x9e\xe5d\xfaM7];x@?$%\
+'\x02\x80E\xf6(4\x00\xe0\xf9\xe7\x9ey\x86\xe79\
+N\x1c?~\xba{\xf7\xae]\xa9\xfe\x8a\x8e\x0e\xe3Y\
+\x7f\x16\x8c\x8c\xc4\xff\x85\x01\x10\xa5\xe9\x09+=nz\
+8\xc5^\xc6\xbf-\xb6M^\xfbzt\x89\xa6\x01\x08\
+\x09\xb0E\xaf\x5c\xb6d\x95O\x89}\xca\xbft\xc9\xe2\
+\x15\x01\x01\xf6P\x00\x90$\xc9.I\x16\xbb\xd7\x90\xa3\
+EzZ\xebS\xc7\x8f\xe7\x11\xdf\xc0\x13B\x08),\
+8_\xd2\xadk\xc7NT\x1fE/\xfa\xd0|hJ\
+\x84\xab\xc7\x0b\x91\xa11\xe2\x95h\x1c\x9al\x00D\xde\
+\x9d\xb7c\x8f\x1d \x9e\x22\xf3\x04\x8cU^\x96h\x9a\
+\xe9\x12\x93fap\xb0?H\x92\x84\xdf\x17\xfe\xf6\x13\
+!\x9e\x977\xea\xeak\x09!\x84\x5c*\xb8\xe8\xb8\xeb\
+\x8e\xe9\x13\x9b\xa5\xa7x\x11H\xea\xce/\x00x\xe2\xd1\
+Gf\xfbd\xc1g\x04JKJ\xab\xc6\x8f\x1b7\x95\
+\xea3\xdd/\xa1`\xea\x0c\x0e\x8f\x1fz\x02\x06\x93\xf9\
+z\xc6\x87\x87\x87UrQ\x1f\xcc\xccY\xc1\xf9\xcb\xa3\
+\xd5\x08\x87Q\x19O\xba\xb7t\xab\xf4\xe6\xd9{v\xee\
+<\xc0\xf3\xfc?\xfe\xf8\xfdo\x12\xbca\xbf$Y%\
+\xc86x\xcf\x8c\x88\x8f\x89I\xdf\xbbk\x8f\xaf\x9e\xf7\
+x\x9f\x86\xba\x1a\xe7\xa0\xfe}F2<bi\xe3\xf1\
+JD\xb3\xc88\xc0 \xdf\xecO\x14\x89\xf3p\x9b\x9a\
+\x02\xb0\x15\xd5=\xf8L\x1e\xef%\x1e\xb6.]\x87\xad\
+\xaf7\xc0\xa2\x08\x80\xfd\x9e\x00k\x9c,\xf0*\xb4,\
+KA\x7f-\xffk-!\x848\x1b\x1d\xa4\xae\xae\xce\
+E\x88\xe7C\x93w\xdcv\xebX\xab\xf7\xad/Y\x96\
+\x83\x94g\xc0\x00p\xff\xfd\xf7\xa8\x0b\x83\xc4\xad=\xf5\
+\xf5\xb9\xa7\x9f}Q\xf6\xbd\xfc\xc1\x0e:\x9b\xce*\x1a\
+O\x88\xe8\xb2\x22\x1cF\xca\xd4\xd4\x1f\xdb>\x0f\x0f\xdb\
+\x16\xdbO=\x85\xa5\xfbk\xa4\x1cz4p\x95D\x96\
+ddee\x22<<\x04\x13\xc6\x8e\x19{\xe1\xcc\xd9\
+b\x8f\xd7wk<\xffg\x9f|\xfc\x15T\xb9\x93\xec\
+\x92d\x0d\x80w\xa3OTXD\xf2\xf6-[w\xab\
+\xc3\xec\xf2\x19\xfb\xeb\xae\xbb\xe6\x16\x01Ml\x1a\x8fv\
+\x11?h\xd9f\xa1)\xe3\x06\xf8\xcb>\xdb\x1e\xcf8\
+4\xc9\x00\xb0\x8d\xb0\x06\x80V8\x91\xe2\x9b!\x8e\xa7\
+\xecz\xf9\xbcc\xc4Xz\x94]\x82\x16\x00\x08\x0b\x09\
+\x8d\xde\xbfg\xef^B\x08q8\x9c\xa4\xc1{&@\
+mUu\xfd\xd8\x91#'\xa8# \xc9\x81\xb2\xe4\xdb\
+\x06:\xe9\x9a\x09\xd7\xd7\xd7\xd6R\x87?\xf8\x04d\xf1\
+\xef\x8b\x96\x87\x87G\xaa;\x8c\x98\xfe\xb1\x03\xca\xeb?\
+ \x1a\x18m\xdfX\x5c\x22\x1ct\x1b\xe0\xd43\xf3c\
+\xdbgi\x14Esl}\xbd\xf6\x8d\xa2&\x1e\x1d~\
+u\x87\x0e\x1e\x8c\xb7^{Y~n\xce\x9cg*\xca\
+\xca\xdd\x8a\xd7\xa7\x95\xff\xb9g\x9f\x99\xab\x12\x22\xc9v\
+x\x94\xdf\x02\x00\xb1Q\xd1\xa9;\xb7n\xdf\xe3\x1bZ\
+\xdf\xd8>|\xdf=\xf71}\x10),\xdb\x17:\x8f\
+-\xa3\xa7\xc4,\xaf\xf4\xf4@\x8f\x9f\xf4\xbdq\xc4a\
+\x22\x02\xd0#\xcaL\xc8a6\x14\xd23\x00\xbc\x08@\
+\xef\x9eNS\x8dVllt\xea\xb1c\xc7N\x12\xe2\
+\x99\x0e(/u8\x1b\x1b\x5cS&\x5c\xad\x86\xf5\xb2\
+d\x09\x90\xbc\x1f\x19\x01\x80\xde={\x0c8{\xf6\x8c\
+\xfa9+zJp&\xff\xec\xb9\x09c\xc7\xb3\x1f\xf8\
+\xd4S\x04\xfa\x9eW\x96\xc7+\x16\x87H\xc1\xc1\xc9\xe7\
+y\x09Q;<o\xa2\xa7\x8c\xbc\xb2t\x1b\xa2\xb6\xcc\
+\x08:OId\x00R\x5cB\x1cl6\x0bn\xbe\xfe\
+\xc6\x16gN\xe5\xae\xad\xad\xf6|\xbb\xb3\xc1\xe5P\xa3\
+\xb4\x9a\xaa*2\xed\xb6[f\xfa(\x90l\x1e\xe5\xf7\
+,\xf8\xa5&\xa7\xb48|\xe0\x90z\xf4\x18\xfd:\xf0\
+\xe3\x8f<@\x7f\xa8\x85\xb7\xde\xa4\xd7\x0fQ\x9f\xd9t\
+\xb6o,/\xcc\x18F\x91\x9e\xe9]k\xefM\x18\x00\
+3\xc8E\x0c\xe2\xd5\xa5\x15\xd4\xc2\xc1\xc9Sx\x9e\xa2\
+\xb3\xa7\x0a\xb3\xd1\x09\xbbqH\x02\x80\xe6\x19\x19mO\
+\x9d<\x99G\x88'\xa4W\xe6\x89n\xb7\x9b\xdcv\xf3\
+M\xd3\xa9q\xb2\xcb\x9e\xcf\x8dy\xdf5\x88M\xdf\xb8\
+\xde\xf3\x01\x08o\xac\xa8F\x03n\xb7\x9b|\xf0\xde{\
+\xef\x05\x04i\xf6\x0b\xd0 R\x0c\x08\xd2\xf5\x84\x89\xf5\
+D\x12\xe7\xaf\x91\xd0\x00Z\x5cF\xc6Z\xcfh\x8b\x84\
+\x9b'\xe4l\xba\x9eQ\xe1\xfe\x02\x02\x02\xf0\xe0\xfd\xf7\
+\xe3\xd99O\xddth\xff\xfe\x22e8j\x1a\xea\xdc\
+.\xef\xe4\xfd\xdc\xd9\xb3\x97n\xbbm\xda`\xb5qI\
+\x0e\x94\xa8\xb1l\xd3&\xbb\xc3\xc9\x9c\x13\xea\x82\x9f\x93\
+\xda\x16\xfc\xd0\x83\xf7\xd2_\xf3\xe5\xd1\xae\xa7\x98z\xfc\
+g\xfb\xcc3\x0cz\xe3 \x1a\x0b\x91\xe34\xe7x\x0d\
+\x0c\x80H\x11\x8d\x0852\x00\x22k'b\x06\x8d\xc3\
+\xe80Q\xeeO\xf2\xac\x07H\x00\xd0\xaaef\xa7\xbc\
+\xdc\xbc\xb3\x8a\xf2\xd2\x1e\xfd\xc1\xfb\xe8\xcftIvY\
+\xb6\x04\xc3\xb7.`\xfd\xf4\xa3\x8f\xbe\xa0CF\xdas\
+\xec\xdc\xb9\xeb\xe8\xf0\x11#\x86B\x0c\x22\x05a\x95\x97\
+\xadC\xe7\x19\x09\x90(M\xa4\xc8<^\x1a)\xa6\x99\
+(@D\xab\xa8\x7f,\xa8\xed(\x1b8[\xb7l\x8e\
++\x87\x0cI\x5c\xbex\x99\xfa6_\xbd\xb3\x91\xd46\
+\xd6\xaac\xb0~\xfd\xbaM\xdf~\xf3M\x8b\x0e\x1d\x94\
+7\xbba\x05`W\xda\x19>x\xf0\xe0\xf3g\xce\x16\
+\xf9\x86\xd07~\xcf>;\xfb)\xa6}3\xfd\x13\xe9\
+\x01\xaf\x7f<\x5c\xe0\xa4\xb1yf\x22\x03\x91\x91`\x9d\
+s\x93\x0c\x80^\xe3\x22\xcb(\xfa\xc8\x07\xdb1\x16/\
+\xc0\xef\x84\x82\x93\xae\xc7;=H\xd4&\x1d9\xa8F\
+\xa0eF\xf3v\xb9\xa7O\x9fQ\x8d\x00%\x08\xaf\xbf\
+\xf2\xf2[\xd4\xe9.v\x9bl\x09Qv\x8d\x01\xc0\xf5\
+7^7\xad\xac\xbc\xb4\x92p\xa0\xbe\xa1\x91\xbc\xf7\xce\
+\xbb\x1fM\x9e49\xc6n\x0f@8\xff\x1dv=\xa1\
+7\x93\xc6\xc3#\x1ad\xb6\x8e\x9e\xf1\xd4\x13@3\xca\
+\xc0k\xcb\x8cR\x08\xf1%%%a\xf4\xe8\x91\x18=\
+f\xac\xb4`\xfe\xfc\xdb\xf7\xef\xde\xa3*o]}\x8d\
+[y\x81\xcb\xe5t\x927^}\xf5\xadk\xaf\xbfV\
+\x1e0h\x90\x86\x86\xc8\xc8p\xd8lV\x5c\x7f\xdd\xd4\
+\xebk*+\x1b\xfd\x95\xdfM\x1e}\xf4\xa1\x87\xe3c\
+c\xe9S\x80x\xc6T\xafof\xf8\xc2\xca7\x04u\
+Y<\x22\xc7id\x00x\xba\xa6\xc5\xd1D\x03\xc0k\
+\x8c\xed\x9cH\x19Yk\xc4zu3m\xf1\x94Z/\
+\xca\xa0\xcb\xb2'\x0e!%%\xb9\xd5\x09\xef\x9a\x80\x22\
+\x08\x0a\xfc\xb4`\xc1\xcf\x81v\xab\xf2b\x88\xcd\xf3\xa2\
+\x88o]\xa0E\xcb\x8cv[6\xf9\xbf)\xa6\xc0\xc1\
+}\x07r\xaf\x9fz\xc3u\xb7L\xbb\x0dC\x87\xf9>\
+\x14#i\x9f\x1c\xf0x\x07\xea\xaf^\x196MdX\
+Y\x5c\xac\xe1\xd63\xe6\xbc6h|<\x0f#\xa2[\
+\x84K$\xc0\x00\x80\xa8\xd8h<\xfc\xf0\x03]\x7f\xff\
+m\xf1_\x0ao\x1b]\x0d\xa4\xb1\xbeF\x1d\xac#\x87\
+\x0f\x17\x8c\x186tBB|,\xa2\xa2\x22\xd5v\x12\
+\x13\x130s\xe6\x0c\x8c\x1e5\x02/>\xfb\xf4\xac\xea\
+\xca*\xbfqr\xbb\x1d\xe4\xd6[o\xbe\x9d\xa1W4\
+\xef\x17\xf1\x90g,D\x86A\xe4\x95\xc1\xdc\xeb\xe9\x83\
+\x99t\x91\xaei\xeb\x1a\x18\x00\x91G\xd5\xf3\xb6\xe06\
+\xc4\xef\xa0r\xcf[\x0b\x10E\x1d,\x0d\xa2\x8f\x8b\xf0\
+\x8e\x11\xf33\x02Q\x91\x91I[\xb7n\xd9\xc9S\xe2\
+}\xbbw\xee\xc8l\x91\xd1Ba\xa2$I\x81\x92\xe7\
+\xa3#J?\xadO\xcdy\xf2\xf9\xba\x1a\x9f0\xba\x5c\
+.u!\xaa\xac\xac\x8c\x9c8qj\xf5\xab\xaf\xbd\xd1\
+'\xabM6\xdaw\xee\x8c{\xef}\x00v\x9b\xfa\x90\
+A\xe9\xbf\x91\xf2\xb3\xe5\xf4\x84\xc1\xc8;\x88\x223\xd1\
+\xbdH\xd0\xf4\x94\x97\x1ds\xb6\x0f\xa2\xfe\xd0\x8a\x80\xa4\
+\xf8\x84\xe4\x8f?\xf8\xf0\x83\xa2\xc2B\xef\xd6\x5c7\xa9\
+k\xacs\xbb\xa8w5~X\xb0\xe0\xe7+G\x0c\xe3\
+\x1e\x0c\xda\xa7oo\xec\xda\xbe=\xe4\xd7_\x7f\xfc\xb6\
+\xaa\xca\xa3\xfc\x9e\xa7\x04\x9e\xe1*-.\xae\x1d9|\
+\xe8\xd5T==\xbe\x00\xfe\xfd\xd4\xeb\x93\x86\x16\x01\x9f\
+\xd824\x0d\x22\x9e\x1a\xe9\xa3\x19c\xe1k\xbf\x09\x11\
+\x80HX\xf4\xbc\xbd\xc8\x13\x19u\x8a\x87W4\xb5\x10\
+\x1d(**O\xd7\x91\x00\xc0f\xb3\x06.\xfa}\xe1\
+\x12\xca-\xa8\x97\x05\x17\xce\x15\x8e\x1a9\xec*\xdfP\
+IvY\xb2\x04)\x07F\x00\xc0\xb0\xe1C{\x1e8\
+p@\xfd\x1a\xb1\xcb\xe9t;\x1a\x1a\xdd\x1eTnr\
+\xfat\xaec\xd1\x92%\xf3\xae\x9e0\xa9\xf9\xf5\xd7\xdd\
+\x88aC\x86\x2244\x94\xe6/O\x88@\xdd\xb3`\
+F\xd1ye\xf5\x14^\xcf\x80\xf3<\x16K\x97\x1e\x1d\
+\x22:A\xb5\xa3BBBl\xc4\xeb/\xbf\xf2|\xd1\
+\x85\x8b\x85\x0aO\x1b\x5c\x0d\xa4\xde\xe5;\xe8%?/\
+\xaf\xe4\xa6\x9bn\x9c\x16\x11\x15\x8e[o\xbd\x09aa\
+aj\xfd\xf4\xb4t\xc4\xc4D\xa3W\xaf\xee\xad\xf6\xed\
+\xdb\xab>\xe6s8\x1d\xea#\xc2\x9c\x9c\xc3\xe7\x86\x0d\
+\x1a\xd0\x93\xc3'v<x\x06@\xd4\x17\x9e\x01`e\
+\x1b\x82{\xf6\xfaruMT\x87\xdf?\x13\x06\x80\xa7\
+\xb8<f\xf0\x0e\xee`\x85OO\xc1y\x9d\xd43\x04\
+\x12\x93\xc6F\x11t\xba\x11\xd3\x00\x00o\xbd\xfd\xa6\xef\
+\x93c\xcag\xa9<\x0aM\x9ez\xec\x89\xd9T\xf8n\
+\xf1\xec$\x93l\x00$\xab\xdd\x8e\xc7\x9f|\xc2\xf2\xc2\
+\x0b/<r\xe4\xc8Qum\xa0\xae\xb1\x9e\xd45\xd6\
+\x11\xc5\x10\x5c8{\xbe\xf2\xe9\xa7\x9e~\xe3\xe9\xa7\x9f\
+I\xbf\xea*\x9fMa\x80'Xze\xd9k\xbdz\
+\xbc<^=\x9ea2C\x9f(Od\xe85\xd0\xaa\
+e\xeb\xb8\x07\xef\x7f\xf0\xd1\xdc\xd3\xa7/\xd0\x91\x98\x93\
+R\x5cB\x08\xf9\xed\xd7\x85\xdf\xdes\xcf=I#F\
+\x0dCpX\x08\xd2\xd2Ra\xb7\xdb\x11\x13\x1b\x05\xd9\
+\xf2\xff\xda{\xd2\xf0\xa8\xca\xab\xcf\xbd\xb3$\x93\x09!\
+\x90\x85\x84$\x04H\x02\x08\x04\x5c\x00\xc5\xb2);\x02\
+\xa2\x82\x88\xda\xcf]\xean\xfdT\xa0jm\xfb\xb4_\
+K\xd1V[\x97\xda\xd6\xfa\xb9 V\x11\x17D@\x14\
+Y\x95E\x10!,\x02\x09\x09d_HB\xd6\x99\xb9\
+s\xef\xf7cr'o\xce\x9c\xf3\xde\x1b\xdb\xefO\x99\
+\xf3<\xf3\xcc\xcc\xbb\x9cs\xde\xb3\xdf\xf7\xbewF\x85\
+\x87\xee\xbd\x17\x9eZ\xf6\xb3\x05\x05\x07\x0f\xd6\x85\x03\x88\
+\x16\xbe\xf47\xb6l\xde\xb4+g@V\x7f\x09\xdf\xb2\
+5\xd8}q\x19\x99\x1b\xfb\xaf\xcc\xb7\xe2\x93\xe7\xbf\x1b\
+\x01\x003E\xb5q\x8e\x8d\xc7\x8a\xe3\xad\x1c\xd4N%\
+`\xd7\xd1\xcd\xb1\x0aD\x06\x0d\x00\x00\xb8\xf7\xbe\xfb\x1f\
+\xf4\xf9\xfd\xe8\x8f\xa7B\xb0~\xed\xdaM\xfd2\xfb\xf5\
+\x17\x84\xed\x80\xd0\xbf\x0f\xa9\x19\x19\xfd 95\x15\xa6\
+L\xbd2\xf7\xab\xed\xdb\xd7\x9c>]\xdai\xc0\xbev\
+#\xa8u\x9e%*/\xafhZ\xbe\xfc\xf7\xcf\xe5\x0d\
+\x1e<\x2233\x03f\xce\x9c\xd9\xa9=\xfa\xa7\xa5)\
+%c\xc0\xe3\xad\xda\xc4us\xc6g7\xfba\xdc8\
+\xabG\xb4{\xe3\xbc0jT\xe8?Z'\x8d\x1f\x9f\
+\xf7\xe4\xb2e??S|\xba\x86\x92\xbb\x09\xdb\xb7n\
++x\xe8\xfe\x07f\xfd\xea\x97\xbf\x82\xfc\x11# g\
+pNX^\xa9i)04\x7f\x10\xdc\xb8pQ\xdc\
+\x81=\xfb^\xa8\xaa\x0a\xed\x15\xfa\x03~\xbd\xdd\xd7\x1e\
+.\xe9\xde{\xef\xed\x95\x9e\x18\xb7\x07\xf1E\x052*\
+\x89Q\xce\xc9UR8\x19r\x15\x15X\xe0\xe1|\x10\
+ \xd2\xbe\x01hz\xbc\xfe,\x02\x00\x97\x8de\x06c\
+%(\xca1\xad\x0c\xd0* P/\x8e\xb6l<\x00\
+\x00L\x9ax\xc5\xf4\x8a\xf2\xf2J\xca\x08++*k\
+o\x5c\xb8\xe8FBy\x0a\x00\xc0\xd8\xb1\x97\xc2\x0d\xd7\
+_\x07\xaf\xbf\xf6\xfa\xdc\xf2\xb2\xf2\x03\xbe\x8e\xff\x99\xd3\
+\xf5\xa0\xe1\xf3u\xbd~->}\xc6\xbf\xf5\xcb\xado\
+\xaf[\xbbn6\x00\xb8'\x8c\x1f\x0fsf\xcf\x86\x07\
+\x1e|\x18\xf2\x06\x0f\x01D\xc3*\xa2[9+\xa7\x07\
+N_2}s|\xc9\x02C\x18\xa6O\x9d\x0a\x13'\
+\x8cW\x9f[\xfe\xcc\xb4W\xff\xf2\xca_KKJ\xc8\
+;*&\x94U\x94W>\xfc\xc8CK\x145\xf43\
+m\xc2N}\x08\xb9\xa2\xc0\x8fo^\x047\xdd\xb4\xe0\
+\xd2\xcd\x1b7}k\xcek\xf5\xfbt\x9f\xdf\xdfqX\
+C3~\xfa\xf0\x03\x8f+\xf2\xe3\xdb\x9c-S\x8ek\
+w\xdd2\x7f\xc1|p\xfa\xb0\xfb\x92\xe9\x17\xd3\x0c}\
+\xb7\x19\x00\xa8\x88D!\xb7\xbb\x00.8\x98\x80\x0f\xf9\
+p\x8b\xb1\x0a\x06\x22~\xce\xf1#\x9e\x1d\x00\x00\xe8\x93\
+\x9e6p\xdb\xb6m\xbb9\xa3\xfc\xe33\xcf\xbe\xb3\xec\
+\xb1\xc7\xd3~4v\xac\xa8D\x00\x00HLL\x84'\
+\x9ex\x12z'\xf5\xf6\xdcp\xe3\x0dw\x15\x1c<X\
+\x22\xce\xd5\x02\xedF@\xf3\x85\xbf\x97WV\x1a;w\
+\xee\xdc\xfd\xd7\xbf\xbc\xf2\xf8\xf4\xa9S3W\xaf\xf9\x00\
+\xae\x9ew]HK\x9d\xffq\x8f\x8d\x8b\xcb2\xa2\x8c\
+\x00\xe42\xb3\x13\xc4\x01\x22\xf5\x85\x01;E\xb8\xcdt\
+\xb8\xfe\xfd\xfb\xc3\xf4\xa9\xd3 \xc1\xebM\xdf\xb5c\xe7\
+\x92\xe2\xefOn?y\xa2\xb0K\xa5%\x9e\xc70\x0c\
+\xc3hmnn\xff\xdd\x8a\xe5\x7fH\xea\x93\xd2\x0f\xd1\
+S\x01@QT\x15\x86\x0d\xbb\x00\x06\xf4\xcf\x86O\xd7\
+\xae\xfbe}C\xbdf\x18\xa1\xbf\x8ak\xd3|\xe1C\
+^\xa7KOWM\x9a4~\x06\xe2\xd7\x8e3Y\x05\
+Y+9px\xec\xbc~\x88\xc3\xcb\x826\xado\x8b\
+\x00`73\xfc\x90\xef\xd81\xa9\xf6\xee\x08\x01g~\
+;\x07\x86d\x81\x06\x1c\x0e\xd5\xb5b\xc5\xef\xff\x1c6\
+P\xf4\x90\x89\xee\x0f\x96-[\xba\xec\xa6\xe9S\xa6C\
+Fz_\xe8\x9d\xd4[\x94\x19\x00\x84\x82\xc1\x9dw\xdd\
+\xddk\xe9cK\x1f=Vp\xb4,\xa8u\xceoo\
+o\xd3\xfd\xed\xada\xabojj2\x0a\x0a\x0eWn\
+\xd9\xb6\xfd\x9dY\xb3\xe7,\xfa\xf9\xd3\xbfL\xba\xed\xf6\
+\xdbMT\xe1\xff\xa7\xc74\x846\x15\xf5Q\x81\xd6\x8e\
+\xe1\xfd\x90>\x12\xee\xb9g1L\x9d6-\xf1\xfa\xf9\
+\xf3\xaf?\xb0o\xff{'\x8e\x9f(onn\xe9\x94\
+A\xd0o\xf8\x03\x9d\xd7\xe7\x86a\x18\x8d\xf5\x0dM\xcf\
+\xfd\xe1\xd9\x17\xb3\x07f\x89e\x90*<\xb1\xa9\x00\x00\
+\xdc~\xcb\xad\xf0\xee\xca\x95c\xd7~\xf4\xd1\xee\xb6\x96\
+\xd0a\xa0\xb6\x80\xdfh\x16\xf0\xbd\xfd\xce\xca\x8dw\xde\
+u{vjZ\x8a\xc8\x96]\xa7\xefN\xa0\x94\xc9\x0b\
+\x98v;\xba\x92\xf9\x91]\x7f\xe3\xdbl\x06\x00\xcc\x90\
+\x0c\xb9,[\x8bm\xd4u;w-/\xbb\xc6\x979\
+>vn\x93>>&,\x06 q>\x00\x00\x5cw\
+\xfd\xf5\xd7VUUUt\x06\x82\xd01`\xf3f\xc1\
+\x86\xb5\xeb7\x5c0d\xc8\xb0%K\x1e\x83eK\x97\
+\x01\x86\xe1\xc3\x87\xc3\x9dw\xde\x0d\x13&\x8c\xef\xf1\xb3\
+%K\x1f\xf9\xee\xdb\x03\xc7ZZ:\x9d@\xd3\xfc\x86\
+\xcf\xef\x0b\xe3k\x0f\xf8\x8d\xa6\xa6f\xa3\xf6l}\xc5\
+\xbb\xef\xbf\xff\xf6\xbc\xab\xe7\xdd4q\xc2\xc4\xc1\x99\x99\
+\x99\xb1\x11\xc8;A\xe6\xac2\x83\x05\xe1\x1d\x88v\xca\
+\x80\xa5\x10\xebv\xbb\xa7O\x9f6\xf0\xe6\x9bn\x9c\xb7\
+\xf2\xcd7\xde\xa8\xa8\xa8(\xf7\xf9|]\x0e[iF\
+0\x22\xe3\x9f:u\xea\xf4\xb3\xcf>\xb3\x225-Y\
+\xcc\xf8\x0eUU<\x1d\x07\xb1\x1c\x00\xa1\xa0\xfa\xf0\x83\
+\x0f\xa6\xbd\xf2\xd2\xcb/\x99(t\xdd0Z\xdb}\x86\
+\xbf#@\xd7\xd4\xd4\xf8\x1e_\xfa\xf82\x00\x00\x87\xc3\
+\x01qqq \x91\x03\xb5V.a\xd9qF+\xe7\
+\xc4\xc1\x01\xcbWE\xfd\xf8;7\x1e\xbf\xa8\xb5t]\
+\xb7E\x00\xa0\x98\xf8W\xb2\xbd,h\xe0\xc0\x80\x99\xa5\
+\x9cY\x1c\xcf\x95\xfdN\xa1\x1d\x10\x0e\x8ao\x5c\x15\x00\
+\x00@ffF\xe6{\xef\xbe\xb3&\x1c\x04\x82\xba\x11\
+\x106\xf6\x8a\x8b\x8b\xfd\x1f}\xf0\xe1\xf2\xfb\xef\xbd7\
+y\xd1\xa2\x850fL\xf8\x0e\x93\x12\xe3\xf1\xc0\xb4i\
+3 6.\x16\xa6\x5cy\x05\xe4\x0f\x1b\xea\xbe\xe7\x9e\
+{\xee\xfch\xedG\x9b\x1b\x1b\xcfu^\x0b\x840\x1b\
+\x14TW\xd7\xb4\xac^\xfd\xfegK\x9fX\xf6\xe4\x8c\
+9sfg\x0f\x184TQ\x94\xd0f\x16}\xb8\xc8\
+\x0eP\x01@\x0aN\xa7\x13\xdc.\x17\x8c\x1e5\x1ar\
+B\xff\xb5\x00\x8a\xa2\xc4\x0c\x1a\xd0\x7f\xd8\x9c\xd9W\xcd\
+\xfd\xef\xff~\xe4\xd1wV\xae\xfa\xb0\xb4\xb4Tz]\
+\x1f\x0e\x04\x01\xcd\xd8\xb9m\xe7\xd7\x8f=\xf6\xf8\xa31\
+1\xaeDL\x0eB\xc7\xb0\xc3zPU%\xee'?\
+Y|\x7fEyE\xf8\x97{|Z\xc0\xf0\x09\x7f\xd7\
+\xf5\xed\x81\xfd{o\x5c\xb4p4\xc2\x85m\xd7\x5c7\
+\x95\xdc\xa8qT\x82\xa3\x9c\xd2N\x00\xb0\xaa\x1e\xb8*\
+\x83\xa2\xcd\xbd\x80\x18\x1f1G1:\x1f\xfb\x8d\x00\xa5\
+\xeb\x8e\x89\xccH\x0cb\x8c\xd8f0}\xe2\x1c\xb3M\
+\x15\xbe\x8b\xf3D<\x06\xd04\xbb\xb0O\xf0 \x1b\x83\
+\xdbE^u\xf3\xcb\xfc\x05\x0b~\xfc\xdc\x1f\xfe\xf8l\
+FfF\x0a\x00\x80\x16\xf4\x87\xa2\x93#t\xb8\xe7\xab\
+\x1d;N\x7f\xf7\xdd\x81g\xd6}\xfa\xe9_\x15\xa7\xcb\
+w\xf2\xf8\x09\xc8\xc9\xc9\x81u\xeb>\x09#\xcc\xea\x9b\
+\x01\xfd\xb2\xfb\xc1\xd7{v\xc3\x84\x09\x13'\xce\x981\
+\xe3\x9ak\xe7^\xb30oH\x9e\xf8h\xb1\x14JJ\
+\xcb\xaa\x8e\x16\x1c9|\xa6\xectaiyY\xe1\xb1\
+\xc3G\x8aO\x9e8q\xeaPA\xc1\x89\x80\xdf_\x9f\
+\x9d\x9d\x0d\x9a\xa6\x81\x01\x00\xe5eev\xd1v\x0a@\
+\x09m\x10\xab\xaa\x0a\x8a\x02\x90\x9b\x9b\x07\xa7KKA\
+\xd1uw\xfe\xf0\xfc\xfe\x0bnX\x98\xd7'\xb9ON\
+umU\xee\xd0!\x83\x07\x8f\x18y\xe1E}32\
+R\xac1\x87\xa0\xac\xac\xac\xf6\xa3\x0f>|\x7f\xcd\x87\
+\x1f|\xf8\xc5\x17_l\x02\x80\xa0H>\xf4RtS\
+=\x8aCU\x16^w\xdd\x0dK\x97,[:\xf2\xe2\
+\x8bF\x00\x00\xe8\x86\x0eAC\x07W\xe8w=\xa0\xae\
+\xae\xaeu\xf9\x8a\xdf/\x7f\xfe\xb9\xe7~\x97\xe0\xf5\xfa\
+k\xcf\xd6\x8b\xb6\xa5\x0a\xf8\x0d\xa2]f\xa3\xd8\x0e\xc5\
+6\x1d\xb5c{\x17m\x16\xd0\x18\x0a\xcc\xf1V\xb6\xc9\
+\xf9\x90H\x8f\xf2\xdf.8\xad\x02\x00@W\x01Q\xc8\
+(b\x22p}\xdcB1nq<\x85\xc3\x9cc.\
+^\x8c\xca\xb2@c\x15 \xa8\x80c\x00\x00\xe4\x0d\xce\
+\xcbZ\xf6\xd8\x92\xdf\xdev\xc7\x1d7\x99\x83\x03\x81 \
+(\xaa\x01N\x87\x13\x9a\x1a\x1b\xe1DaQ\xc1[o\
+\xad|\xa6\xb4\xa4\xe4u\xd5\xe5\x86\x1d\xbb\xbf\x02\xdd\xe7\
+\x87\x8a\x8ar\xc8\xcd\xcd\x85\xbc\x9c\x1c8Y\x5c\x08%\
+\xc5%\xe0\xf7\x05`\xc2\xf8\x09\x19C\x86\x0f\x9d<~\
+\xd2\xc4\x05W_5gJ\x0f\xafWV\xeeG@@\
+\xd3\xa0\xa6\xba\xba\xb6\xb6\xba\xba\xa2\xac\xaa\xb2\xe6\x5cS\
+sY]MM\xd5\xe9\x92\x92\xea\xfa\xba\xba\x9a\xaa\xca\
+\x8a\xba\x9a\xda\xba\xb3\x8dM\xe7Z|\xadm>\x9fO\
+\xf3\x05\xf4\x80\x0e`(\x0eEU\x9cn\xb736\xc6\
+\xe5\x8e\x89\xf5\xc4\xf4L\xe8\xe9\xed\xd5+11))\
+9!-==5\xab_fZJjZR\x9c\xc7\
+\xd3\xa7\xa77>5)%%5\xb1Wb\xdf^\xbd\
+z\xb9b\xd8\x07 #\xa1\xbd\xdd\xafm\xfcl\xd3\xe7\
+\xab\xd7\xbc\xfb\xee\xfe\xfd\xdfl9r\xe8\xc8)4$\
+lk\x8a\xa2\x18#.\xcc\x87C\x07\x0f\xc1\xac\x99\xb3\
+\xe6\xfe\xe2\xa9\xa7\x97\x5c2f\xf4\xe5\xe6@\xcd0B\
+)\xad#G}\xf0\xc1\xfb_\xaeZ\xf5\xce\x03\x9f|\
+\xb2\xeep[[\x9b9\xcc\xac\x1ct\x88\xb47\x9c@\
+\xb0=\x00t\xb5A\xec\xc8f;\x15\x00\xb0=\xd9I\
+>\x1c>\xb1_G\xfc\xa8\x1dm\xa6\xdct\xa0}\x86\
+\xc2e\x80\x8d\x0a\x00GM\x99\x93\x9b\x88qT\x94E\
+4q\xd1*\xc8\x1d\x96\xa2\x83\xfb\xf1\x5c\x137@\xd7\
+\x0c\x80\xf1\x89\xbc\x9a\xed\x14\x0ds\x8c\x0e\x000}\xe6\
+\xcc\x99\xbf\xf8\xf9S\xcbG\x8f\xba4\xdf\xe1T\x01\x0c\
+\x03|\x01\x1f\xb8\x5c.P\x15\x07444\xc2\xc9c\
+\xdf\x1f\xf8\xd3\x8b/\xfc)\xb1W\xe2?\xebj\xebZ\
+\x87\x0e\x1b\x0e\xaf\xbf\xfd\x16\xe4\x0e\x18\x08\xbe\xb6\x16\xd8\
+\xbc\xf9K\xcc\x933}@\xe6\xc0\xa9\x93'_y\xcd\
+\x9ck\xe6\x8d\x1e3\xfa\xa2\xf4>i)\xaa\x12\xf1O\
+4\xb6!\x10\x08@{{\x9b?\x10\xd0\xda\xfcZ \
+\xa0kZP\xeb\xf8k\x1c\xc5\x00P@\x01p8\x1c\
+.Uu\xa8\x0e\x87\xc3\xe1r\xba\xdcNw\x8c;\xc6\
+\xed\x8eq\xbb\xad\x090`\x18\x06TW\xd7\xd4\xec\xdb\
+\xbf\xef\xe0'k?^\xbb\xf1\x8bM_\x14\x9d(\xfc\
+\x1e\x0c\x08t\x0cQB?\xcf\xa5\x80a\xe8\x00\x00\x1a\
+\x00\x18\x99\xfd\xfa\xc2\xc0\xfe\xd9jVV\xf6\xdc\xc5w\
+\xdd\xf3\xf8\xd8\x1f]>\xd6\xe9\x0cey\xc3\xac\x08:\
+Ts\xaa\xf8T\xd9\x93?\x7f\xe2\xe9\xb7\xdfZ\xf5\x8f\
+pgW\xddu\xd1\x19H\x9c\xc1d\x1bh\xbd\xe3>\
+\xb1\x1f\x03\x9e\xcfU\xb2\x14\x0dq<UeP~$\
+\xc3\xc1\xf1\x17\x9ac\xb1\x07`\xe7z\x84\x1b\x877\xe2\
+\x14\xa2\x8fza\xfc\xd4\x0b_\xa7+\xa8\x1d\xef\x07P\
+\xcf\x03\x88\xb8\x9c\xa0\x80\x93X#5^\x5c7\x00\x80\
+\xbar\xe5\xaaGZ[[+\x82\x1d\xcf\x95k\x01\xbf\
+\xe1\xf3u>\xa2j\xe8\xba\xb1w\xf7\x9e\xc2\xff\xf9\xf5\
+o\x1ez\xf5o\xff\xc8t\xb8\x5cp\xc5\x95\x93a\xdc\
+\x84\x09\xa2RL:] \xa6\x87\xb7\xcf5\x0b\xae]\
+\xf0\xeak\xaf\xbe\xbcm\xdb\xd6\xaf\xca\x99\xf3\x09\xff\xdf\
+\xa0\x1b\x86\x110t#\xa0\x07\x99]\x8a\xd0s\x10\xa5\
+\xa5\xa5\x15;w\xee\xdc\xfd\xe6\xca7\xff\xbe\xf0\xe6E\
+7%$&fD\xda\x1f8\x14\x80X\xe88I)\
+v\x5c\x98\x9f\xdf\xfb\x91G\x1e\xbai\xcb\xe6/\xf6\x98\
+g(\x0c#\xf4\xdb\x0d\xe2&b]]]\xe3\x8a\x15\
++~\xeb\xf1z{\x09\xd3E]\xcb\xecI\x81H[\
+\xa6l\x9b\xb2i\xeeA!n\xef\xcb\x8e\x0fq\xe3\xec\
+\xee\x1d\x001^\x94+\xe7\xa7\xaa\xdd=\x00YIm\
+\x96\x1d\xf8\x1a^\x04\xaa\xfc\xe2\xa2\x19\xcb\x0e\xc2\xc5\x95\
+\xf22\xa0\x22:\xf5\x9d\xca$\x22\x0eq\xed\xc6\xe8\xd1\
+\xa3A\xd7\x83i\xd3\xa7\xcfx\xfc\xfe\xfb\xee\xbf=\xbd\
+ozO\x00\x00=\xa8\x81\xa1\x038\x5c\xe1\xe3\x05p\
+\xec\xd8\xf75o\xbc\xf5\xe6\xebU\x15\x95k\xb6n\xdb\
+\xba\xab\xf0\xe4Iq\xfd*\x80\xe2\x04E\x010\x8c\x00\
+@G\x14V\x14p\xba\x5c\x10\xf0\xfb!#\xa7\xff\xb0\
+q\xe3\xc6]v\xc9\xf0\x11\xc3r\x07\xe5\xe6eee\
+\xf7\xcb\xce\x1e0 \xa5w\xaf\x1e\xd0M\x90\xa5\x08+\
+h8\xdb\x00E\x85\x85u5\xb5u\xa7\xce\xd6\x9f=\
+US[{b\xd7\x9e\xaf\x8fm\xdb\xb9m_Yq\
+\xe9Q\xb7'\xc6\x08\xf8\x02`\xe8\xe1\xed\x13\x15\x14\xc5\
+\x09\x86\xa1@(\xd3\x8b\xd7\xfc0d\xe8\xd0\x0b\xaf\xbb\
+f\xde\xdc\x85\x0b\xae\xbf5\x7f\xe4\xc8\x01f{P\x0f\
+\x82\xaa\xa8\xe1\xf3\x04\xcd\xcd\xe7|\x1f\x7f\xb2v\xd5\xd3\
+O=\xbd\xfc\xe4\xc9\xc2c\x02\x0a\xd1\xc8\xa9R\x98\xd2\
+\xa3\x09v\xec\xd0,\xb7\xc5\xf1\xb2\x8a\x94\xb3W\x8e\x9e\
+\xac\x12\xa1x\xc6\x80\xab^\xd1\xbf\xd8\xaa\xc3N\x00\xc0\
+N\xcb-Z\xec\x17\x83\x80\xa8\x10\xd1q\xa8\xbd\x05\xaa\
+T\x02\xe2\xbbL\xf0\x22}\xbcx*\x80\x89\xb4\xc5v\
+\xbb\xc2\x0e\x97\x97Y\xd9\xd90r\xe4\x88\xc1\x13.\xff\
+\xd1O\xef^\xbc\xf8\xb6\x9e\x89\x89l\xfd\x5c]]\x13\
+\xdc\xbbg\xef\xe7[\xb6n\xfb\xf8\xa5W^\x5c\xedo\
+\xf3UkA\xad\xc3\xe7\xc3,8!\xb4\xc5\xaf\x03\x18\
+A\x0aOL\x8f\xb8\xb4\xdc\x9cA\xfd\x07\xe6\xf4\xcf\xec\
+\xd7/3#\xb3OFvJZZV\x9f\x94\x94\xcc\
+\xd4\xe4\x94\xf4\xe4\xe4\xa4d\x8f7\xde\x9b\x92\x94\x04f\
+\x19m\x07\xfc\x01?TVUk\xcdM\xe7\x1a\xeaj\
+\xeb\xea\x9a\x9a\xceUVWV\x96\x95WV\x9d9r\
+\xec\xe8\x99aC\xf3K\xe3\xbd\xde3\x1b6\xac+\xdc\
+\xbdgwc\xc3\xd9\x06\x08v:\xbb)#'(\x8a\
+\x03\x0cP@Q\xfc`\xe8\xa15(\x0a8\x5c.p\
+9\x9dIw\xdcr\xeb\xb5S\xa7M\x9e6n\xdc\xc4\
+iI\xc9I\x09\x1c?M\xcd\xe7\x8cw\xff\xf9\xee;\
+\xcf?\xff\xfc\xf3\x87\x0e\x15\xecF\xddf\xe6\xb3*\x95\
+\x01x\xc7\xe2\xf4\x8eu\x0d\x10i\xf7\x98\xa6\x98\x0c\xb9\
+KT\x91_L\xcb\xcaN\xb9`c\x02\xbe\xece/\
+U\xba\x13\x00(\x06D&\xcdq\xe2\xf5\xbc\x9d,\x8f\
+3\xb9,rs\x91\x97\xe2\xcf\x8a.\xa50\xd9Z\xa9\
+*\x06\xa0s\xadFBB\x82\xa1\xe9:\xb467\xc3\
+\xa4+&\x0d\x9f;g\xee}w\xdf\xbd\xf8\x0e\xaf7\
+\xce\x05\x12(*,*\xde\xff\xdd\x81-o\xbc\xf9\xc6\
+\x9a\x8d\xeb7m\xf2\xfbZ\xdb\x11\xab\x0a\x00\xb8\x00\x0c\
+\x05\x14%\x08\x06(\x00\x86\xc6\xad/\xff\x92\x11\xea\xe4\
++\xa7&^\x907\xb8\xd7\xde=\xbb\xe3U\x97\xcbS\
+SY\xe9\xf5\xf9|\x89I))=b\xdcnO\x9c\
+\xc7\xe3v\xbac\x1c\x8aa8\x14E\xd1\xdb\xdb\xdb\x03\
+-\xad\xad\xbe\xd6\xb6\x96\xe6\xaa\xca\xaa\xa6\x9e={\x9e\
+\xcb\xee?\xb0\xd9\xeb\xf1\xb6\x8e\xbett\xf3\xb6-\x9f\
+\xd7o\xdf\xbe\xb5\xa9\xa0\xe0(\xf8|\x01xt\xc9R\
+\x98;s6<\xf8\xe0\xbd\xf0]\xc1!0\xf4.\x97\
+\x8c\x1d\x972J\xb8\x8a1\xc1\xed\x89\xf3L\x9b:y\
+\xf2\x7f\xddr\xeb\xfc\x91\xc3\x87\x8f\xcb\xcb\xcd\xcb\x91m\
+o\xb4\xb5\xb5\xfb_}\xed\xef+7|\xba\xfe\xa5\x0d\
+\x1b6~\x13\x0c\x86\xe3\xa0\x02\x0a\xa8\xe6\x95\xac0\xc5\
+L\x00\xf8\xfa[V%\xca\xb2-\x95\xc9\xb9\xa0\xc0e\
+u\x0a8\x9e\xecT\xa9T\x9f\xac\x22\xc6\x893,\x1f\
+\xbb\x9b\x80\xb8l\xc7\xd9XV\x9es\x0b\xa4\x18\x94\x95\
+M\xe2\x1c*hp\x81\xc4\xfc\x8c\xab\x10;\xa5\x99\x1d\
+\x1e\xc46\x1d\xb7\xe7\xe4\xe6\xe6-^|\xd7\xfd7\xdf\
+x\xf3\x0d\xe9}\xfb\xa6\x82\x044M\xd3\x8f\x1c=v\
+r\xdd'\x9f~\xbeo\xdf\xdeO\xaa\xaa*\xbf\xdb\xb5\
+gO\xb5\xe6\xf7k\x04Y|\xa9\xa5\x03\x00\xc4zc\
+a\xe2\x15\x13!\x7f\xd8\x08\x186d8\x1c=Z\x00\
+\x8d\xcd\xcd\xf0\xcf\xb7WACC\x03\xc4x\xdc\x90\x91\
+\x9e\x0e\xba\xae\x83\xa18\xa0\x877\x1eZZZ!\x18\
+\xd0\xa0\xb1\xb1\x1e\x1a\x9b\x9a\x00 t\xbf\xbfO\x9f4\
+\x981c&\xc4\xc5\xc5\xc1+\xaf\xbc\x0c\xba\x1e\x04M\
+\x0b9\xe0-\xb7\xdd\x06~\xbf\x1fV\xad\x5c\x19bF\
+Q@'l)955f\xc0\xc0\x81\x99\xc9\xa9I\
+\x17\xcd\x9by\xf5\xec\x89\x93&\x8e\x1f\x983 \xdb\xe5\
+rE\xecw\x88PZQ^\xbdj\xd5\xaa\xf7_~\
+\xe1\xc5?\x9f:u\xea(\xea\xe6n\xdd\x99m\xa6\xb0\
+p\xb0\x8e\x10\x22j\x07b,E\xc7*\xb1\xd8\xa9\x1e\
+\xb9\xe4CU\xd52<\x5c\xf2\xc3\xbc\x92\x89\xdbn\x05\
+ \x22\x90E9\x8aYYi\x85\x99\xc3\x97\x1b,k\
+\x1d\xef\xb8\xe43q\x89Y@\x86\x8b\xab0\xc4\xcf2\
+As\xeb1\xfb\xc2\xe9*&\xde\x9b\xfc\xe4\xd2\x9f\xdd\
+5g\xf6\xec\xeb\x87\x0e\x1d2\xd2\xe5r\xcb\xd6\x07\x00\
+\x00EE\xa7jv\xef\xda\xb5c\xcb\xb6-\xdbK\xcb\
+\xab\xbe\xad\xafo<\xf1\xf5\x8e-\xf4M}E\x81{\
+\xee\xbb\x0f.\x184\x18v\xef\xda\x01\x87\x8f\x1d\x05\x17\
+(\x90\x9c\x9c\x02\xc7O\x9c\x84\xc2S\xc5a\xce\xd2\xfa\
+\xf4\x81\xda\x9aZ\xd0\x82Ap8\x1c`f\xd5\xb4\xb4\
+4\xe8\xdd\xbb7\x1c=v4\x9c\xd1UU5\x8c\xae\
+?\x13\x0f\x9e\x988H\xcfH\x87\xd2\x8a3\x90?t\
+8\xcc\x9c6\x0b\xea\x1b\xce\xc2\x8b/\xbf\x04\x0e\x87\xc3\
+1m\xf2\xf4~\x9exOnFF\xda\xa8\xa9Sf\
+L\x1e{\xf9\xe5\x97%'\xf7\xf6F\xf0\x8c \x10\x08\
+\xc0\xf1\xe3'\x0e\xae\xf9`\xcd\xbb\xbf\xfe\xddo\xfe\xe6\
+oi\xaf\x16\xba\xcd2_\x94\xb1\xa9\x7fY\xa5\xc69\
+1\xa0v;\x89\x89\x9ak\xf6s\xf3E\xfc\xd4\xed:\
+\x19\xef\x22\x0d\x8c\xd7\x1c\xa7\x13\xfd\x80\xda\xa8\xea\xc5V\
+\x05 \x0b\x008\xbbs\xd7_V\x11\x113*fj\
+J\x10T\xc47\x85K\x95\xf0\x98W\xee\x16%\xc6\xd7\
+9G\x01\x05\x8c.\xf7\x929EQ\x99)\x5c\x15\xa8\
+\xaa\x0a\xa0(\xae)\xd3\xa6\xcc\x99\x7f\xed\xb5W\xcd\xba\
+j\xee\x9c\x8c\xf44[\x87g4-\x08\x07\x0e\x15\x14\
+\x1e;z\xe8\x9bS\xc5\xc5\x87\x0f\x1f>z\xe2\xfb#\
+\x05\x85\x87\x0e\x15\x9c\x0c\x06\xf5\xfa\x8bG\x8d\x82'\x9e\
+z\x0a\xea\xaa\xaaa\xd3\xc6\xf5Pp\xf8 \x14\x9d(\
+\x02_0\xb4\xdc\xe4\xd4T\xa8\xad\xa9\xc1\x1598\x9d\
+N\xd04\x0d\x1c\x0e\x15\xae\x9b\xbf\x00.\x1ey\x11\xec\
+?p\x00>\xfbl\x03444\x84\xe6\xf6N\x00o\
+\x8fDp\xaaN\x98{\xf5<\xf0z\xe3\xe0\x1f\xff\xfb\
+\x1aTVU\xc0\xe5\x97]\x9a\xf8\xd0\x83\x8f\x0e\xae\xab\
+\xad\xcd9v\xf2\xf8\xa0K/\x195\xe2\xc2\x91\x17^\
+6h\xc8\xe0t\xd5a\x19\xe3\x00\x00\xa0\xac\xb2\xa2f\
+\xe3\xa7\xeb?]\xbdf\xcd'\x9f\x7f\xf6\xd9\xc7\xc1`\
+\xd0\xafw\xee'`\xfd\x98`\xb7\xdc\x16\xed\x17'\x05\
+\x9c\x85){\x90\xd1\xe3\xfae\xd5\x04@\xd7\x8ds\xce\
+\x8e\xb8\xccNU\x0d\x1cO\xd4\x18\xb1\xcd\xd69\x00j\
+\x00\xb5\xc9f^\xfb\x8b\xe5\xb6H\x0c\x0b\x97rhY\
+I'2\xcf9\xba\x88\xcfN\xc0\xc0c\xa8\x8c\xcf\x95\
+~\xb2\xca\x06\x8f\x17e\x14\x86\x94\xbe}s\xae\x9a9\
+\xf3\xca\x19\xd3\xa7\xcc\x99>u\xfa\x8c\xc4\xc4^\xd2\xbd\
+\x02\x0cU5\xd5\x8d\xa7K\x8a\x8b+*+O\x97\x97\
+W\x15\xc7\xc5y\xceT\x97\x97\x9f\xd9\xbbo\xef\x99c\
+\xc7\x8f\x96\x97\x15\x97T\xd774\xb7\xe8\x000k\xf6\
+l\x88\xf7z\xe1l]\x1d\x1c<x\x10\xb4\xa0\x0e\x83\
+\x06\x0d\x86\xa0\xe6\x87\x84\xf8x\x18\x96?\x1c\xe2\xe2{\
+\x80\xe6\x0b\xc0\x98\xb1\x97\xc3\x96/\xbf\x80\x97^|\x01\
+T\x05 \xb9w\xaf\x84\x91\x17^\xdcg\xf4\x98\xcb\xfa\
+\x8e\x193\xa6_\xdd\xd9\xb3\x99\x8d\x8d\x0di\xd9\xd9\xd9\
+Y\x09\x09\x09\xfd\x93\x93\x93r\xf3\x06\xe6\xf4\xf0&\xd8\
+\xbf\x11\xd1\xd0\xd0\xe8\xdf\xb4i\xc3\xe7\x1b6}\xfe\xf1\
+\xbau\xeb6U\x95W\x14\xa1!\xa2\x8d\xe1KQS\
+\xa6\x9c\xd3w7\x9bS\xc9\x8d\xb3\x05\x91\x07\xee\x90\x9c\
+U\xe5 \xd2\xc4\xd5\x82\x082\x5c\xd8WdI\x96\xf5\
+\xa1\xee\xee\x01P\xc7)\xed0G-\x84\xfbN\xe1\xc3\
+\xcc\x03D\x1e\xec\xb0#t\x19]Y\xc9/\xc3!\xcb\
+\x1ax\xbc9\xa7\xcb^AL\x8c\xdb5\xe6\xb2K\xf3\
+\xfafd\x8d]0\x7f\xfe5\x13'N\x18'\xfe\x1d\
+\xb9]h8\xd7\x08\xe7\x1a\x1a\x0d-\xe0olko\
+olmkonjj:\xd7x\xae\xa11\x10\x08\
+6i~\xad\xb9\xa5\xa5\xb9]UU\xbf\xcf\xef\x0f4\
+55\x05\x03\x01\x7f0\xde\x1b\x0f\xf1\x09\xf1\x0eM\x0b\
+\xbab\xdd\x9e\x98\xc4\xc4\xc4X\xa7\xd3\xed\xf5\xfb\xdb\x13\
+\x93\x92{'\xf6\x88\x8fO\xf0\xb8\xdd\x09\xae\x18w\x82\
+\xdb\xed\xee\x91\x9c\x92\xaa\xc4\xc5y\x22\xe8\x07A\x07\xc3\
+P\xc0\xc9<\x9b\xd0\xd0\xd0\xd0\xbcu\xc7\x8e\xaf\xde_\
+\xbd\xfa\x83\x92\xd3%\xdb\xbf;\xb0\xffxc\xfd\xb9\x80\
+0D\x81\xd0\x06\x22.\x9dM\xdb\xa3N\xdd\x01\x1a#\
+\xab<\xa9>;z\xa7\x82\x10Np\xe2\x1a(z\xe6\
+w;\x09\x8ak\xb7k\xdb\xb2\xfe.\x95Dw\xef\x02\
+p\x8b\x93EJ\x8eiJ(x\x11\x94p\xb9rM\
+\xa4\x8d\xef\x03\xe3v. qFC\x19\x9c\xf8\xce\x95\
+l\x18\xa8\xec\x85#\xbf\x92\x90\x94\x94>n\xfc\xb8q\
+s\xae\x9au\xd5\xa5\xa3F_\x98\x91\x99\x95\x95\x92\x94\
+\xd4\x8b\xfaEa\xc30 \xa0\x1b\xa0(*\xb8\xa8\x13\
+\x186 \x84C\x0f\x95o\x8a\x02\x86\xa1\x82\xaa\x00\xa8\
+\x12|\x9a\x01`\x18:8\x14\x05T\x82/-\xa8A\
+mMmMQQq\xf1\xfe\xfd\xdf\x1c\xd8\xbc\xf9\x8b\
+\xcd_}\xf5\xf5\xae\xaa\xaa\xaa\x12\x88\x941v\xfa0\
+k\x10\xa9\x1f\xec\xb0\xc0\xcc\x05\x88\xb4\x05*\xd3\x03\xf0\
+z\x11\xfb\xa9\x00d\xb7\x8a\xc5\xc0\xf1\x81\xc7P\xb8e\
+\xf49\xdb\xc52\x0b\xaf\xc3*\x00\x98;\xb5\x11F\xca\
+0\x8b\xfb#\x22NG\xbbU\xf9-~\xc7\x8a\x909\
+$\xa09\xb2l\x80\xd7a\xb5\x06\xcc\x93Up\xe3\x04\
+\xcb)]\x01t8\xc6l\x1f2\xf4\x82\xfc\x993g\
+\x8d\xcb\xcf\xcf\x1f\x91\x9e\x96\x96\xd7?'g@vf\
+V?Ol\x0c\xbf\x93n\xb7\x1eb@\xefX\xa1\xd1\
+\x11\x04\xc4\xa3o\x14\xb4\xb5\xb5\x07\x8a\x8bKJ\x8a\x8a\
+N\x16\x95\x96W|\xbf\xff\xdb}\xdf\xae_\xbf~\xe7\
+\x99\xe2\x92\xe3\x92iX\x8f\x22\xe7\xe2\x18\xd3\x91\xf1<\
+<\x9e\x0a\x0ex\x9c\xe9\xc88\xabc\x1c\x98?N\xe7\
+v\xec\x98\xea\xc7>\x01\xc4<\x99\x5cD\xa0\x12\x93\xb8\
+\x0e\xeaR^\x01\x00\xbd;\x01@|\xa7\xa2\xaf\xd9n\
+er\x9c\xd3b\xfc\x5cF\xb6\x8b\xc7N\x99\x87\x95 \
+\xf2N)\x94\xdb\xbd5\xbfs\x97HX\xe9&~\xaa\
+\x22\x11\xfb\xc2m\x8a\xa2\x80\xaa\xaa\x10\x0c\x06!15\
+)\xfb\xe2\xfc\x91\xc3\x06\x0d\x1a40w\xd0\xe0\xac\xf4\
+\xd4>\x03223s232\x06\xf6\xcdHO\xf4\
+\xc4F\x96\xe7\xff\x0e0t\x03\xea\xce\xd6\x07\xab\xaa*\
+++\xcb\xcbJ\xca*\xcaO\x97\x96\x95\x17\x17\x9e*\
+.9~\xfcXQ\xc1w\x07\x8e44\x9c+U\x1d\
+*\x18z\xd7;\x07\xc2\xba\x00\x227\xe3\xa8@\x8d\x9d\
+\x8fe\x0b\x22\xed\x85rR+\x1b\xe0\x9c\x88rV\x99\
+\xed\x01j\xa3\xaa\x09\xbc.j\x8d8\xe9Qt\xb8\x0a\
+\x89\xaa\x80I\xe8\xce\xc3@\x22\x11\xce\x81\x1c\xc4X\x80\
+\xc8{\xf0A\x88\xdc0\xe4\x84\x80\x83\x8f\xect\x150\
+}\x80\xfa\xa8[\x84\xd8p\xac\x0c\xcf\x0a7\xee\x93\x05\
+\x00\x0a\x8f8\x1e\x9f\x18\x8b\x80\xb9\xd7\xccK\xee\x97\x91\
+\xd5\xf7\x5cccRsKSJFfF\xdf\xa4\x94\
+\x94\xd4\xa4\xde\xc9\xc9=\x13\x12\x92\x12\x12z$x\xbd\
+\xf1\xf1\x9eX\x8f\xc7\xe5v\xbaT\xa7\xd3\xe5R\x1d\x0e\
+E\x05U\xd7A\xd7t=\xa8\xf9\xfd~\x9f\xaf\xdd\xd7\
+\xda\xda\xd2\xda\xdc\xd2\xdc\xd0\xd2\xd8|\xb6\xae\xae\xae\xae\
+\xa2\xa6\xaa\xa6\xb2\xb2\xb2\xaa\xb5\xb9\xb5j\xe4\xc8\x8b\xea\
+z'\xf7\xaa\x7f\xf3\x8d\xd7+\xf6\xee\xf9\xe6\x9c\x05[\
+\x0a!\x0f\xab\xccf\xd7\xf1\xf1\x1cL\x03\x83\xc9\x07\xde\
+\xa0\xc6sL\xbd\xe0\xea\x80\x0aNTb\x94U!\x22\
+\xc8\x82\x09n\xe7\xea9*\xb0X\x9d\xfe\xebJ\xe4\x07\
+\xdc\x06\x14\x89S\xed\xa2sa\xa6\xc5\x00\xe0\x009\x93\
+2\x87\xeeN\xf6\x17AtD\x00\xfep\x10G\x97\xe2\
+\x83\x0a\x8a\xb2\xf9V\x06Ee$\x9c\x85\xa8\xf2\x91\x85\
+\xd8\xb8XGB\xbc7\xd6\xe3\x89w\xc5\xc6\xba]\x0e\
+\xa7\xd3\xa1\xba\x9c\xaa[q*\x86\x1a\xba\x0c\xd4uM\
+\xd7\xfc\xba\xe6\xf3\xfb\x82\x01\xbf_+-+k\x8f\xf5\
+x|}SS\xe1dQ\xd7\x0dzUUA\x8f<\
+\xf6k\xf2\xca\x1d\xd2\xa12\xae\x18\x04\xb1.0\x0e\x0a\
+\x1fv\x08Q\xaf@\xf4\xcb\xe6\xe2\x84@m\xfa\xc9*\
+\x09\xcc\x03\x0e\x0a\x80\xda)yX\x05\x0e\x91\x17\xce\xc6\
+9\xdf \xc7v\xe76\xa0L\x99\xe6g\xabr\x8er\
+X|m'\x13\xb4\xacL\xa3\xe8b\x87\xb7R\x16\x06\
+\x1c(D\xfc2\xda\x5c\x86\xe3dh~\x97\x95\x94\xd8\
+i\xa8\xcc\x8ay\xfew\x03%K\xea!\x19 \xbes\
+\x8e,\xe2\xc2\xfd\xf8H\xaf\x88\x07\x83\x95\xf3P\x01T\
+l\x97Ub\x18?\x97x8\x9b\xa0\xf0\xca\xf8\xe6\xec\
+\x5c\x06\xb2\xc0\x89\xfd \x8c\xdb\xce\xd3!2'\xa1\x14\
+GE@;\x80\x19\xb4\xa2\x0d\xc0\x97;T\xc4\x939\
+Kw\x80\x9b\x8b\x03\x04\xe5\x0c\x22\x0e\x1c\xa8\xa8\xa0\x87\
+q`\xda\xb2J@v\x5c\x16\xf3d\x95-8#\x95\
+U$V\xf2\xc18\xc5\xcf\xb8\x8a\xc4\xf3(>e\x99\
+\x19\xe3\x93U'\x1c\xff\xd4Z(\xbb\x93=\x07\x83\x93\
+%N,f\x1b7\x9f\x92\x01\x97l@\x18\x8b\x93E\
+\xf8 \x92U\x00\xa0\xa2$\xb5x+g\xa3\x8c\xdal\
+\x13\x05\x86\xe9Q\xf3\xac\x9c\x16\x0b\x0f\xe3\xb1r\x08;\
+\x81\x82R\x90\x9d\x8cA\x19>\x97\xfdd@9)\x97\
+\x01\xcc\x0cMU\x1a\x94\xec\xa5\x19\x03\x22\xf5\x80e\x81\
+eO\xe1\xc0\xf3\xed\x04+n\xad\x14`\xfc\xe6\xdd\x15\
+\x05\xbdS:\x13i\x88r\xa2\xf0\xcb\x02\x86\xac\xe2\x90\
+\x01\x9e\x87y\xc6\x9f\xb9\xeaE\x9c\x8f\x7f5\xc8\x1cC\
+>\xbb\x8f\xc1D\x14\xfe/=\x82a\xf1G2\xa8l\
+D-B\x1ck\x15y9\xa1QF\xc6\xe1\x95\xcd\xa7\
+\xe6\xe2\xcf&>.\x08\x8asdA\x92[\x1f\xce\x04\
+x>\xd5N\x19\x0a\x0eHT\xa6\xb5\x0a\x86V\xeb\xc3\
+\xe3d|\x8b\xf38}q4(G\xc54\xa9#\xe0\
+\x1c_\xe2\x0ff\xe0L\x8a\xe9\x89\x99\x18\xaf\x01\x80\x97\
+/\xee\xc7<a9\x88\xfc`\x9a\xb2\x00%\x02\xb6c\
+.p`[Q\xad*\x00\xca\xa8d\x91\x88+]0\
+.\xca\x000\x0d+!`\x81r\x8a\xa2\xf8\xfd\xa1<\
+\xc8\xe6bZx<\x95i\xa9\xf9\x9c\x92\xa9~\x85h\
+\xe7\xe4$V\x01T\x89m\xce\x11\x93\x02\xbeKA\xd1\
+\xe7\xf4 ~\xe62\xa0I\x8f\xe3]\x16\x80\xb0\x13S\
+\xfca>\xa8\x0dG.\x08\x88|R\x1b\x94\x14O\x14\
+\x88sD\xb9SA\x8d\xd2\xad\x95\x0c\xb8vq\x1eu\
+\xd7K\x01\x00[w\x01\xc42\x08\x97'\x80>c\xe6\
+\xc5~\xcc\x1c\xb7hY\x05!\x134\x06Y\xf4\xa4\x0c\
+\x93\xfa\x8e\x0d\x14\xe3\xb5\xe3\xb0\xe6\x1cJYV\xb8\xec\
+V7\x5c\xf6\xb3rHQ\x9f\xb8\x82\xe3pb\xa0\xf0\
+R\xb2\xe7\xf8\x02b<\xd5N\xe9\x06\xdb\x95\x98I)\
+G\x16q\x02\xd3o\x8e\xa1\xe4A\xe1\xa2\x02\x9a\xf9\x99\
+\xb2\x1f \xda9\x7f\x00\xa6\x9d\x0a\xc2\x94\x1d\xcb\x92\x95\
+\x01 \xfc\xc55\x03\xb8\x94\xc0\x99\xd1Dd'Kc\
+\xe6e\xf7\xffIf\x11\x1f\x14\xaf\xd8(p\xbf\xec\xb3\
+\x95\xd1b\x5c\xd8\xc08\x05`zTd\xc6\xf4(\xa3\
+\xa6\x9c\x0cg\x0f\xee;~l\x96\xd2\x87,\x90\xcb\x82\
+\x13'\x07;A\x8d\xca\xbe\xb2'\xe5(\xa0x\xa6\xe4\
+ \xf6s\xc9\x88\x1a\xc3\xd11\x01\xcb\x14\xeb\x9dK\x1e\
+b%`\xe7\xf7\x0dd<P\xb48\x19t\xa1a\xb5\
+\x07 sv\x0a\x07\xc7\xac\xa8`\xd9\x02)\xa5\xdb1\
+\x00*\xdacZ\xd80(<&\x0fT\xa03AE\
+c9z\x22\x88\xca\xa6\x14\x85\xc7\xca\x14-\xf2\x01\xd0\
+\xb9\xc1\x83O\xebb\xb9(\xc4\x18\x00z=v\x1d\x8f\
+\xe3\x9d\xca\xcc\x22~\x19p\x81\x9arH\xfc\xa2\xae\xdb\
+1\x7fx\xae\xd9.\xbe8\xa0x\xc0\x0e\x8fo\xbfr\
+\xc9\x90\xcb\xe8b\x1be'2\xdb\xb4c7]dj\
+U\x01\xe0\xddc\x911\x1c\xa5Eapg\xacE\xc0\
+\xa5\x11\xe7\x18T\x84\xc5c\xec\x1c\xe8\xe1\x0c\x9a\xca\x9c\
+vx\x02\xf4\x19\x1b\xabU@\xa1x\xc1?\xb0j\xd7\
+H\xc4yT\xe6\x17u\xc5\x19\x16\xc5\xbbH\xd7*0\
+Q2\x17iPr\xa2\xaa\x07\x11\x8f\xa8W\xca\x16\x01\
+\xba\x9e\xed\xe7\xe8cyZ%\x18\x8aW\xb1\xcf\x8e\xad\
+\x88c\xa9\xf5SU\x07\xe6\x95\xb3aJ\x17\xb2}\x0d\
+\x0aG\xe8\x8b\xc5\x1e\x809\x81CD}\x8f B\xa1\
+f\x18\x12q\xca\x0e\x98\x88\xc0)\xc1N\x16\x90\xf1\xc0\
+\x81l\x1c\x15\x80\xac\xe6\xc8\x0c\x91\x0b\x06x.\x00\x7f\
+D\x9a\x03l\x9c\x98g\xae*\xe0\x8e/S\xc6g\xe5\
+d\xe2mH\xbc\x1e\x8c[\x0c\x5c\xdcQn\xb3O\x04\
+\x1cTez\xc3\xb2\x10\xdf\xf1m4\xbc.\xca\xfee\
+N\xcc\x05\x11\x10\xdaEy[%Aq\x8e\x88_\x0c\
+\xa6\xe2\x9c\x90s\xdb\xfcYpq\x12\x95\xd1\xecdM\
+q\x9cL\x08]X`\xfa\xf1\x5cn\xd12\xdc\x22\x1f\
+\xdd\x09\x04\xd8\xd08#\xe7\x14C\xd1\xc1<p\xd0\x9d\
+`K\xf1c\xf50\x93U\xf0\xe3\x80\xa2%\xcbR\xe2\
+8\x916g[T\xbf8\xcf\xd1\x81\xdb\xces%\xd8\
+\xa9\x00x\xd9\x8b\xbcpO\x10\xfeP\x99a\xdc\x22\x9f\
+b\xbfHK\x5c\x07\xfe\x0c\xcc\x18\xa9^\xbb\xb3\x09H\
+)Gl\x07\xa0\x95K1\xd6\xdd2\x0ag\x18\x1c\x95\
+\xb9`D\xd1\xe6\xfa\xf0g\x99pM:2c\x034\
+\x8e\x92\x93\x95<0\x1f\xe2\x18\xab\xfd\x1b\xabj\x80\xe3\
+\xdd\xec\x93=Q&\xab<8\xfda\xfcb;\xb5>\
+j\x0c\xe6Y|\xa0L\xac(\xf0|\x99\xac0\xef\xd8\
+\xb6\xa8\xf1V\xf6\xc6%=\x19P\x01\x90\xb3+\x99o\
+\xc9x\x11\xc1\x00\xb0w\x148b\x12AL$\x22\x9e\
+:\x02b\x9c\xcc\x11E\xe0\xb21\x0e\x02\x98\x9e\xc9\x03\
+\x15\xcd1\xc8\xb2\x96,\x83\x98\xfd\xd4x;\x86!\x1a\
+5\x15\xa1q\x04\xe7\x80\xc3Ce\x00\x0e\x8f\xd8\xce9\
+=\x97Ep@\xa2\xaa\x0a\x00\xde\x08)\x1eL\x08\x02\
+o\xf0Tp\xc0\xeb\xe7\xf8\xe6\xaa\x09\x19O\xb8\xb2\x90\
+\xcd\xe3\x12\x1b\xa6o\xb6Q\xcfl\xc8\xf0s\xff\x05h\
+\xc5\x97\xc9G\x17\x9d\xd8\xb9\x0b`\x22\xc7m\x14`\xe1\
+\xca\x94Be\x06*\x1a\xcb22\xa7`\xf3\x1d\xbfD\
+\x90Eq\x99\xe1\xda\x8d\xf8Vs\xccv\xcc\x07\x96\x97\
+\x02\x91\x7f\xb4\x82\xcbF\x19\x0f2}\x898\xa8\xea\xc4\
+l\xc7Y\x95\xe2\x99[7\x1e/\xd2\xc24u\xd4F\
+\xd9\x13^\x97\xe9\x04\xdc\x8f^P\xd5\x1d\xd5'\xd2\xc4\
+k\x90\xd9\x09\xb6QL\x8bJ\x10X\xa6\xb2@G\x05\
+\x0f\x8a\x17\x8e>\x95\xb4\xc3\xe3\xec\xfe\x1e\x00\x97\xf1\xb9\
+\x8a\x80c\xcc*\xf3c&\xedT\x0a\xe2X\xab\x08(\
+\x82\x98\xb5(\x1cT\xb6\x06fNw\x80+\xf10\xef\
+\xa2\x93S\xed2\x07\xa4\x8c\x86[\x1bW\xc1`\x9e\xa9\
+MYLGv\xae\x813d\x11\x1f%c;v%\
+\xe2\x15\xdb\xa9@I\xe1\xe0h`{\xc4:\xb1c\xcf\
+\x987\xb1\x9d\xd3\x19\xc7\xb7Uu\x86\xd7\x8f\xf1G\xec\
+5\xd8\xd9\x030\xc0\xfa\x17F(\xc28\x83p\xf8\xc5\
+\xf1\x9cC\xc8\x16\x86q\xe16+\xda\x22\xd8)\xed\xf0\
+w\x8e\x06\x17\xcc\xec\x06C|k\x0f\xe3\xa6\x14\xca\xf1\
+/:\x16\x05\x5c\xd6\xe5\x82\x05\xa0\xcf\x5c\x10\xa2\xf8\xc6\
+\xbb\xf2\xe2z\xcc\xb5R\xff\xf7\x00\xd0\xb5\x14\xa7\xf0`\
+>\xed8\xb6\xac\x82\x11\x7f\xe9\x9a\xf2\x03Y\x00\xa2\xaa\
+&\x0a\xb8>Y\xe6\x17\xf5\xc9\xc9\x00\xe3 \x7f#\xc1\
+\xeeF\x12W\xa2pmT\xbfL\x00\xe2X\x19\x0d.\
+K\x99;\xc0\xe2w\x8c\x9b\xc3I\xf1A\x95\x9b\xb2\xac\
+)\xc3k\x17\xb8uS\x8fr\x1a\xd0\xb5\x5c\xa6>\xe3\
+\xf2^!\xc6RAW\xa4\x8d\xe5J\x05AJgX\
+\xe7\x5cF2_A\xa0w\xe6M^\xb1>\xb8\xea\x00\
+\xf3b\xa7:\x13y\xc4\xceM\x1d\xae\x92\xe1\xc6c\xed\
+\xf0B\xe9\x9d\xd2\x1de\x93\xf83\x17\x08X?\xb6\xf3\
+80u\xa8\x87\xfa\x8c\x99\xe8Nyd\x8e\xe7\x16E\
+)\x9a\xa2A\x95\x9a\xd4x1\x83`\xc7\x96U\x1dv\
+\xb2\x1c\xa6M\x01\xe7\x10\x5c\x99(3&\x0a\x17\xa5\x03\
+\x99\xa3\x03X\x1f\xcd\xb6\x0a\xe0T\x96\x12w\xe9M\x1c\
+X\xc7\x22]j\x8dT\x16\xa5\x820\xf7X9\x17X\
+\xcc9\x18\x9f\xd5\xfa\xb8*U\x5c\x93U\xb5$\xb6\x9b\
+<\xda\xd1)v`\xeep\x14\x0e\x18l\xf5)\xdd\x03\
+\x88B\x14\xa2\xf0\x9f\x0d?\xf0\x97\xe4\xa3\x10\x85(\xfc\
+'@4\x00D!\x0a\xe71D\x03@\x14\xa2p\x1e\
+C4\x00D!\x0a\xe71D\x03@\x14\xa2p\x1eC\
+4\x00D!\x0a\xe71D\x03@\x14\xa2p\x1eC4\
+\x00D!\x0a\xe71D\x03@\x14\xa2p\x1eC4\x00\
+D!\x0a\xe71D\x03@\x14\xa2p\x1eC4\x00D\
+!\x0a\xe71D\x03@\x14\xa2p\x1e\xc3\xff\x01\xb7\xbe\
+L\xee\x10%\x22\xf6\x00\x00\x00\x00IEND\xaeB\
+`\x82\
+\x00\x01\x08p\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5cr\xa8f\
+\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\
+\x00\x00\x0aIiCCPsRGB IEC\
+61966-2.1\x00\x00H\x89\x9dSw\
+X\x93\xf7\x16>\xdf\xf7e\x0fVB\xd8\xf0\xb1\x97l\
+\x81\x00\x22#\xac\x08\xc8\x10Y\xa2\x10\x92\x00a\x84\x10\
+\x12@\xc5\x85\x88\x0aV\x14\x15\x11\x9cHU\xc4\x82\xd5\
+\x0aH\x9d\x88\xe2\xa0(\xb8gA\x8a\x88Z\x8bU\x5c\
+8\xee\x1f\xdc\xa7\xb5}z\xef\xed\xed\xfb\xd7\xfb\xbc\xe7\
+\x9c\xe7\xfc\xcey\xcf\x0f\x80\x11\x12&\x91\xe6\xa2j\x00\
+9R\x85<:\xd8\x1f\x8fOH\xc4\xc9\xbd\x80\x02\x15\
+H\xe0\x04 \x10\xe6\xcb\xc2g\x05\xc5\x00\x00\xf0\x03y\
+x~t\xb0?\xfc\x01\xafo\x00\x02\x00p\xd5.$\
+\x12\xc7\xe1\xff\x83\xbaP&W\x00 \x91\x00\xe0\x22\x12\
+\xe7\x0b\x01\x90R\x00\xc8.T\xc8\x14\x00\xc8\x18\x00\xb0\
+S\xb3d\x0a\x00\x94\x00\x00ly|B\x22\x00\xaa\x0d\
+\x00\xec\xf4I>\x05\x00\xd8\xa9\x93\xdc\x17\x00\xd8\xa2\x1c\
+\xa9\x08\x00\x8d\x01\x00\x99(G$\x02@\xbb\x00`U\
+\x81R,\x02\xc0\xc2\x00\xa0\xac@\x22.\x04\xc0\xae\x01\
+\x80Y\xb62G\x02\x80\xbd\x05\x00v\x8eX\x90\x0f@\
+`\x00\x80\x99B,\xcc\x00 8\x02\x00C\x1e\x13\xcd\
+\x03 L\x03\xa00\xd2\xbf\xe0\xa9_p\x85\xb8H\x01\
+\x00\xc0\xcb\x95\xcd\x97K\xd23\x14\xb8\x95\xd0\x1aw\xf2\
+\xf0\xe0\xe2!\xe2\xc2l\xb1Ba\x17)\x10f\x09\xe4\
+\x22\x9c\x97\x9b#\x13H\xe7\x03L\xce\x0c\x00\x00\x1a\xf9\
+\xd1\xc1\xfe8?\x90\xe7\xe6\xe4\xe1\xe6f\xe7l\xef\xf4\
+\xc5\xa2\xfek\xf0o\x22>!\xf1\xdf\xfe\xbc\x8c\x02\x04\
+\x00\x10N\xcf\xef\xda_\xe5\xe5\xd6\x03p\xc7\x01\xb0u\
+\xbfk\xa9[\x00\xdaV\x00h\xdf\xf9]3\xdb\x09\xa0\
+Z\x0a\xd0z\xf9\x8by8\xfc@\x1e\x9e\xa1P\xc8<\
+\x1d\x1c\x0a\x0b\x0b\xed%b\xa1\xbd0\xe3\x8b>\xff3\
+\xe1o\xe0\x8b~\xf6\xfc@\x1e\xfe\xdbz\xf0\x00q\x9a\
+@\x99\xad\xc0\xa3\x83\xfdqanv\xaeR\x8e\xe7\xcb\
+\x04B1n\xf7\xe7#\xfe\xc7\x85\x7f\xfd\x8e)\xd1\xe2\
+4\xb1\x5c,\x15\x8a\xf1X\x89\xb8P\x22M\xc7y\xb9\
+R\x91D!\xc9\x95\xe2\x12\xe9\x7f2\xf1\x1f\x96\xfd\x09\
+\x93w\x0d\x00\xac\x86O\xc0N\xb6\x07\xb5\xcbl\xc0~\
+\xee\x01\x02\x8b\x0eX\xd2v\x00@~\xf3-\x8c\x1a\x0b\
+\x91\x00\x10g42y\xf7\x00\x00\x93\xbf\xf9\x8f@+\
+\x01\x00\xcd\x97\xa4\xe3\x00\x00\xbc\xe8\x18\x5c\xa8\x94\x17L\
+\xc6\x08\x00\x00D\xa0\x81*\xb0A\x07\x0c\xc1\x14\xac\xc0\
+\x0e\x9c\xc1\x1d\xbc\xc0\x17\x02a\x06D@\x0c$\xc0<\
+\x10B\x06\xe4\x80\x1c\x0a\xa1\x18\x96A\x19T\xc0:\xd8\
+\x04\xb5\xb0\x03\x1a\xa0\x11\x9a\xe1\x10\xb4\xc118\x0d\xe7\
+\xe0\x12\x5c\x81\xebp\x17\x06`\x18\x9e\xc2\x18\xbc\x86\x09\
+\x04A\xc8\x08\x13a!:\x88\x11b\x8e\xd8\x22\xce\x08\
+\x17\x99\x8e\x04\x22aH4\x92\x80\xa4 \xe9\x88\x14Q\
+\x22\xc5\xc8r\xa4\x02\xa9Bj\x91]H#\xf2-r\
+\x149\x8d\x5c@\xfa\x90\xdb\xc8 2\x8a\xfc\x8a\xbcG\
+1\x94\x81\xb2Q\x03\xd4\x02u@\xb9\xa8\x1f\x1a\x8a\xc6\
+\xa0s\xd1t4\x0f]\x80\x96\xa2k\xd1\x1a\xb4\x1e=\
+\x80\xb6\xa2\xa7\xd1K\xe8ut\x00}\x8a\x8ec\x80\xd1\
+1\x0ef\x8c\xd9a\x5c\x8c\x87E`\x89X\x1a&\xc7\
+\x16c\xe5X5V\x8f5c\x1dX7v\x15\x1b\xc0\
+\x9ea\xef\x08$\x02\x8b\x80\x13\xec\x08^\x84\x10\xc2l\
+\x82\x90\x90GXLXC\xa8%\xec#\xb4\x12\xba\x08\
+W\x09\x83\x841\xc2'\x22\x93\xa8O\xb4%z\x12\xf9\
+\xc4xb:\xb1\x90XF\xac&\xee!\x1e!\x9e%\
+^'\x0e\x13_\x93H$\x0e\xc9\x92\xe4N\x0a!%\
+\x902I\x0bIkH\xdbH-\xa4S\xa4>\xd2\x10\
+i\x9cL&\xeb\x90m\xc9\xde\xe4\x08\xb2\x80\xac \x97\
+\x91\xb7\x90\x0f\x90O\x92\xfb\xc9\xc3\xe4\xb7\x14:\xc5\x88\
+\xe2L\x09\xa2$R\xa4\x94\x12J5e?\xe5\x04\xa5\
+\x9f2B\x99\xa0\xaaQ\xcd\xa9\x9e\xd4\x08\xaa\x88:\x9f\
+ZIm\xa0vP/S\x87\xa9\x134u\x9a%\xcd\
+\x9b\x16C\xcb\xa4-\xa3\xd5\xd0\x9aigi\xf7h/\
+\xe9t\xba\x09\xdd\x83\x1eE\x97\xd0\x97\xd2k\xe8\x07\xe9\
+\xe7\xe9\x83\xf4w\x0c\x0d\x86\x0d\x83\xc7Hb(\x19k\
+\x19{\x19\xa7\x18\xb7\x19/\x99L\xa6\x05\xd3\x97\x99\xc8\
+T0\xd72\x1b\x99g\x98\x0f\x98oUX*\xf6*\
+|\x15\x91\xca\x12\x95:\x95V\x95~\x95\xe7\xaaTU\
+sU?\xd5y\xaa\x0bT\xabU\x0f\xab^V}\xa6\
+FU\xb3P\xe3\xa9\x09\xd4\x16\xab\xd5\xa9\x1dU\xbb\xa9\
+6\xae\xceRwR\x8fP\xcfQ_\xa3\xbe_\xfd\x82\
+\xfac\x0d\xb2\x86\x85F\xa0\x86H\xa3Tc\xb7\xc6\x19\
+\x8d!\x16\xc62e\xf1XB\xd6rV\x03\xeb,k\
+\x98Mb[\xb2\xf9\xecLv\x05\xfb\x1bv/{L\
+SCs\xaaf\xacf\x91f\x9d\xe6q\xcd\x01\x0e\xc6\
+\xb1\xe0\xf09\xd9\x9cJ\xce!\xce\x0d\xce{-\x03-\
+?-\xb1\xd6j\xadf\xad~\xad7\xdaz\xda\xbe\xda\
+b\xedr\xed\x16\xed\xeb\xda\xefup\x9d@\x9d,\x9d\
+\xf5:m:\xf7u\x09\xba6\xbaQ\xba\x85\xba\xdbu\
+\xcf\xea>\xd3c\xeby\xe9\x09\xf5\xca\xf5\x0e\xe9\xdd\xd1\
+G\xf5m\xf4\xa3\xf5\x17\xea\xef\xd6\xef\xd1\x1f704\
+\x086\x90\x19l18c\xf0\xcc\x90c\xe8k\x98i\
+\xb8\xd1\xf0\x84\xe1\xa8\x11\xcbh\xba\x91\xc4h\xa3\xd1I\
+\xa3'\xb8&\xee\x87g\xe35x\x17>f\xaco\x1c\
+b\xac4\xdee\xdck<abi2\xdb\xa4\xc4\xa4\
+\xc5\xe4\xbe)\xcd\x94k\x9af\xba\xd1\xb4\xd3t\xcc\xcc\
+\xc8,\xdc\xac\xd8\xac\xc9\xec\x8e9\xd5\x9ck\x9ea\xbe\
+\xd9\xbc\xdb\xfc\x8d\x85\xa5E\x9c\xc5J\x8b6\x8b\xc7\x96\
+\xda\x96|\xcb\x05\x96M\x96\xf7\xac\x98V>VyV\
+\xf5V\xd7\xacI\xd6\x5c\xeb,\xebm\xd6WlP\x1b\
+W\x9b\x0c\x9b:\x9b\xcb\xb6\xa8\xad\x9b\xad\xc4v\x9bm\
+\xdf\x14\xe2\x14\x8f)\xd2)\xf5Sn\xda1\xec\xfc\xec\
+\x0a\xec\x9a\xec\x06\xed9\xf6a\xf6%\xf6m\xf6\xcf\x1d\
+\xcc\x1c\x12\x1d\xd6;t;|rtu\xccvlp\
+\xbc\xeb\xa4\xe14\xc3\xa9\xc4\xa9\xc3\xe9Wg\x1bg\xa1\
+s\x9d\xf35\x17\xa6K\x90\xcb\x12\x97v\x97\x17Sm\
+\xa7\x8a\xa7n\x9fz\xcb\x95\xe5\x1a\xee\xba\xd2\xb5\xd3\xf5\
+\xa3\x9b\xbb\x9b\xdc\xad\xd9m\xd4\xdd\xcc=\xc5}\xab\xfb\
+M.\x9b\x1b\xc9]\xc3=\xefA\xf4\xf0\xf7X\xe2q\
+\xcc\xe3\x9d\xa7\x9b\xa7\xc2\xf3\x90\xe7/^v^Y^\
+\xfb\xbd\x1eO\xb3\x9c&\x9e\xd60m\xc8\xdb\xc4[\xe0\
+\xbd\xcb{`:>=e\xfa\xce\xe9\x03>\xc6>\x02\
+\x9fz\x9f\x87\xbe\xa6\xbe\x22\xdf=\xbe#~\xd6~\x99\
+~\x07\xfc\x9e\xfb;\xfa\xcb\xfd\x8f\xf8\xbf\xe1y\xf2\x16\
+\xf1N\x05`\x01\xc1\x01\xe5\x01\xbd\x81\x1a\x81\xb3\x03k\
+\x03\x1f\x04\x99\x04\xa5\x075\x05\x8d\x05\xbb\x06/\x0c>\
+\x15B\x0c\x09\x0dY\x1fr\x93o\xc0\x17\xf2\x1b\xf9c\
+3\xdcg,\x9a\xd1\x15\xca\x08\x9d\x15Z\x1b\xfa0\xcc\
+&L\x1e\xd6\x11\x8e\x86\xcf\x08\xdf\x10~o\xa6\xf9L\
+\xe9\xcc\xb6\x08\x88\xe0Gl\x88\xb8\x1fi\x19\x99\x17\xf9\
+}\x14)*2\xaa.\xeaQ\xb4Stqt\xf7,\
+\xd6\xac\xe4Y\xfbg\xbd\x8e\xf1\x8f\xa9\x8c\xb9;\xdbj\
+\xb6rvg\xacjlRlc\xec\x9b\xb8\x80\xb8\xaa\
+\xb8\x81x\x87\xf8E\xf1\x97\x12t\x13$\x09\xed\x89\xe4\
+\xc4\xd8\xc4=\x89\xe3s\x02\xe7l\x9a3\x9c\xe4\x9aT\
+\x96tc\xae\xe5\xdc\xa2\xb9\x17\xe6\xe9\xce\xcb\x9ew<\
+Y5Y\x90|8\x85\x98\x12\x97\xb2?\xe5\x83 B\
+P/\x18O\xe5\xa7nM\x1d\x13\xf2\x84\x9b\x85OE\
+\xbe\xa2\x8d\xa2Q\xb1\xb7\xb8J<\x92\xe6\x9dV\x95\xf6\
+8\xdd;}C\xfah\x86OFu\xc63\x09OR\
++y\x91\x19\x92\xb9#\xf3MVD\xd6\xde\xac\xcf\xd9\
+q\xd9-9\x94\x9c\x94\x9c\xa3R\x0di\x96\xb4+\xd7\
+0\xb7(\xb7Of++\x93\x0d\xe4y\xe6m\xca\x1b\
+\x93\x87\xca\xf7\xe4#\xf9s\xf3\xdb\x15l\x85L\xd1\xa3\
+\xb4R\xaeP\x0e\x16L/\xa8+x[\x18[x\xb8\
+H\xbdHZ\xd43\xdff\xfe\xea\xf9#\x0b\x82\x16|\
+\xbd\x90\xb0P\xb8\xb0\xb3\xd8\xb8xY\xf1\xe0\x22\xbfE\
+\xbb\x16#\x8bS\x17w.1]R\xbadxi\xf0\
+\xd2}\xcbh\xcb\xb2\x96\xfdP\xe2XRU\xf2jy\
+\xdc\xf2\x8eR\x83\xd2\xa5\xa5C+\x82W4\x95\xa9\x94\
+\xc9\xcbn\xae\xf4Z\xb9c\x15a\x95dU\xefj\x97\
+\xd5[V\x7f*\x17\x95_\xacp\xac\xa8\xae\xf8\xb0F\
+\xb8\xe6\xe2WN_\xd5|\xf5ym\xda\xda\xdeJ\xb7\
+\xca\xed\xebH\xeb\xa4\xebn\xac\xf7Y\xbf\xafJ\xbdj\
+A\xd5\xd0\x86\xf0\x0d\xad\x1b\xf1\x8d\xe5\x1b_mJ\xde\
+t\xa1zj\xf5\x8e\xcd\xb4\xcd\xca\xcd\x035a5\xed\
+[\xcc\xb6\xac\xdb\xf2\xa16\xa3\xf6z\x9d\x7f]\xcbV\
+\xfd\xad\xab\xb7\xbe\xd9&\xda\xd6\xbf\xddw{\xf3\x0e\x83\
+\x1d\x15;\xde\xef\x94\xec\xbc\xb5+xWk\xbdE}\
+\xf5n\xd2\xee\x82\xdd\x8f\x1ab\x1b\xba\xbf\xe6~\xdd\xb8\
+GwO\xc5\x9e\x8f{\xa5{\x07\xf6E\xef\xebjt\
+ol\xdc\xaf\xbf\xbf\xb2\x09mR6\x8d\x1eH:p\
+\xe5\x9b\x80o\xda\x9b\xed\x9aw\xb5pZ*\x0e\xc2A\
+\xe5\xc1'\xdf\xa6|{\xe3P\xe8\xa1\xce\xc3\xdc\xc3\xcd\
+\xdf\x99\x7f\xb7\xf5\x08\xebHy+\xd2:\xbfu\xac-\
+\xa3m\xa0=\xa1\xbd\xef\xe8\x8c\xa3\x9d\x1d^\x1dG\xbe\
+\xb7\xff~\xef1\xe3cu\xc75\x8fW\x9e\xa0\x9d(\
+=\xf1\xf9\xe4\x82\x93\xe3\xa7d\xa7\x9e\x9dN?=\xd4\
+\x99\xdcy\xf7L\xfc\x99k]Q]\xbdgC\xcf\x9e\
+?\x17t\xeeL\xb7_\xf7\xc9\xf3\xde\xe7\x8f]\xf0\xbc\
+p\xf4\x22\xf7b\xdb%\xb7K\xad=\xae=G~p\
+\xfd\xe1H\xaf[o\xebe\xf7\xcb\xedW<\xaet\xf4\
+M\xeb;\xd1\xef\xd3\x7f\xfaj\xc0\xd5s\xd7\xf8\xd7.\
+]\x9fy\xbd\xef\xc6\xec\x1b\xb7n&\xdd\x1c\xb8%\xba\
+\xf5\xf8v\xf6\xed\x17w\x0a\xeeL\xdc]z\x8fx\xaf\
+\xfc\xbe\xda\xfd\xea\x07\xfa\x0f\xea\x7f\xb4\xfe\xb1e\xc0m\
+\xe0\xf8`\xc0`\xcf\xc3Y\x0f\xef\x0e\x09\x87\x9e\xfe\x94\
+\xff\xd3\x87\xe1\xd2G\xccG\xd5#F#\x8d\x8f\x9d\x1f\
+\x1f\x1b\x0d\x1a\xbd\xf2d\xce\x93\xe1\xa7\xb2\xa7\x13\xcf\xca\
+~V\xffy\xebs\xab\xe7\xdf\xfd\xe2\xfbK\xcfX\xfc\
+\xd8\xf0\x0b\xf9\x8b\xcf\xbf\xaey\xa9\xf3r\xef\xab\xa9\xaf\
+:\xc7#\xc7\x1f\xbc\xcey=\xf1\xa6\xfc\xad\xce\xdb}\
+\xef\xb8\xef\xba\xdf\xc7\xbd\x1f\x99(\xfc@\xfeP\xf3\xd1\
+\xfac\xc7\xa7\xd0O\xf7>\xe7|\xfe\xfc/\xf7\x84\xf3\
+\xfb-G8\xcf\x00\x00\x00 cHRM\x00\x00z\
+&\x00\x00\x80\x84\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u\
+0\x00\x00\xea`\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ\
+<\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\
+\x13\x01\x00\x9a\x9c\x18\x00\x00\xfd\x91IDATx\x9c\
+\xec\xbdy|\xd4\xd5\xbd\xff\xff\x9c}\xc9L\xf6\x8d$\
+\x10 @\x90}\xdf\x17\x15\x17T\x5cZ\xb7\xba\xb6\xb5\
+\xad\xda[\xbaX\xb5\xcbm{\xfbm\x7f\xdaz\xd5z\
+{[m\xf5V[w\xadZW\xeaRP(\x22\xa0\
+\x80\x22\x10\x16Y\x02\x84\x84\xec\xc9$\x93Y2\x99\x99\
+\xdf\x1f\xf1}8\xf3a\xb2A\x90`\xfb~<\xf2H\
+2\xf3Y\xce\xe7|\xcey/\xaf\xf7fZ\xbat)\
+\xa7(y\x81\xb1@)0\xe4\xd3\x9fA@\x06\x90\x09\
+\xa4\x02N\xc0~\xb2\x06\xf8o:\xa5\xc9\x04D\x81\x10\
+\x10\x04|@\x13P\x03\x1c\x04*\x80\xfd\xc0V\xa0\xfc\
+\xe4\x0c\xf1\xf8\xc9z\xb2\x07\xd0\x07\x1a\x09\x9c\x01L\x07\
+\xa6\x02\xa7\xd1\xb9\xc1\xffM\xff\xa6\x13I\xa9\xbd8\xa6\
+\x0a\xd8\x0cl\x04\xde\x03\xd6\x00\x81\x138\xa6~\xa3\x81\
+\xcc\x00Ltn\xf8\x8b\x80s\xe8\xdc\xf0\xff\xa6\x7f\xd3\
+@\xa4\x82O\x7f\xce\xff\xf4\x7f?\xb0\x12\xf8\x07\xf0\x0a\
+\x9d\xda\xc2\x80\xa4\x81\xc8\x00&\x037\x00\x97\xd2\xa9\xd2\
+\xff\x9b\xfeM\xa7\x1ay\x80\x0b?\xfd\xf9=\x9dZ\xc1\
+_\x80g\x18`\x9a\xc1@a\x006\xe0z\xe0\xdb\xc0\
+\xc4\x93<\x96S\x96L&S\xc2o\xb3\xd9\xac\xfeN\
+F\xf1x\x9cX,F<\x1eW\xff\xff\x9bN\x08\xcd\
+\xfd\xf4\xe7wt2\x81\xdf\x02\xdbN\xe6\x80\x84N6\
+\x03H\x05\xbe\x07|\x97N\xe0\xee\xdf\xd4K2\x99L\
+\x98L&,\x16\x0bf\xb3\x19\x8b\xc5B<\x1eW\x9b\
+Z~:::\x88F\xa3\xc4b\xb1\x84\xf3\xe4\x1c\x9b\
+\xcd\x86\xd5jM`\x16\xfau\xe4o\xe3gr\xdc\xbf\
+\xa9O\xe4\x06\xbe\xf6\xe9\xcf;\xc0\xff\x03\xde=\x99\x03\
+:Y\x0c\xc0\x09\xfc'p;\xff\x06\xf2zE\xb2q\
+\xadV+Vk\xe7k\x8b\xc5b\x04\x02\x01\x9a\x9b\x9b\
+\xf1\xf9|\xf8|>\x1a\x1a\x1ahnn\xa6\xbd\xbd\x9d\
+X,F4\x1a=\xeaZ\xb2\x89\xcdf36\x9b\x0d\
+\xb3\xd9\x8c\xd3\xe9\xc4\xe3\xf1`\xb1Xp8\x1cx<\
+\x1e\x5c.\x17\x1e\x8f\x87\x94\x94\x14\xecv\xbb\xfa\x91s\
+ Q\x8b\xd0\x7f\xcbw\xfff\x12]\xd2\x99\x9f\xfe\xbc\
+\x0f\xdc\x02\xac;\x19\x838\x19\x0c\xe0\xeb\xc0\xbd@\xda\
+I\xb8\xf7)G\xb2\xe1-\x16\x0b\xb1X\x8c\xe6\xe6f\
+\xaa\xab\xab\xa9\xa8\xa8\xe0\xc0\x81\x03\xf8\xfd~\xe2\xf18\
+n\xb7\x9bA\x83\x06QPP\xc0\xa4I\x93\xc8\xce\xce\
+&==\x9d\xf4\xf4t\xdcn7n\xb7\x1b\xbb\xdd\xae\
+\xb4\x82p8L \x10 \x18\x0c\x12\x0c\x06\x09\x04\x02\
+\xb4\xb4\xb4\xd0\xda\xda\xaa\x18H8\x1c\xa6\xae\xae\x0e\xbf\
+\xdfO8\x1c&\x14\x0a\x11\x89D0\x9b\xcd\xa4\xa5\xa5\
+\x91\x99\x99\xa9\x18DZZ\x9ab\x1a6\x9bMi\x19\
+\x80bD\xd1h\xf4\xdfL\xe1h\x9a\x09\xac\x05^\x07\
+\xbeE\xa7k\xf13\xa3\xcf\x92\x01L\x05\x1e\xa3\xd3w\
+\xffo\xea\x86\xccf3v\xbb\x1d\xab\xd5J[[\x1b\
+\x95\x95\x95\xec\xdb\xb7\x8f\xdd\xbbw\xe3\xf7\xfb\xb1X,\
+\x0c\x1b6\x8c3\xcf<\x93q\xe3\xc61m\xda4\x86\
+\x0d\x1bF^^\x1e\x99\x99\x99j\xe3\x1d/\x85\xc3a\
+\x1a\x1a\x1a\xa8\xab\xab\xc3\xe7\xf3\xd1\xd8\xd8Hcc#\
+UUUTTTP]]MMM\x0d\x15\x15\x15\
+455\x11\x0c\x06\x95Y\x91\x91\x91Ann.\x19\
+\x19\x19x<\x1e\xd2\xd3\xd3\xf1z\xbd\xd8l6\xe2\xf1\
+\xb82M\x84)\xfc\x9b8\x9f\xcex\x82;\x81\x9f~\
+V75}\x06\x81@\x16\xe0\x7f\xe8\x04\xf8\xfeM]\
+\x90\xc9d\xc2n\xb7\xe3p8\x08\x06\x83\x1c8p\x80\
+\xed\xdb\xb7SUU\x85\xd5je\xe8\xd0\xa1L\x9a4\
+\x899s\xe60c\xc6\x0cF\x8c\x18\x81\xcb\xe5Jz\
+-}c\xc5b1L&\xd3Q\x9b,\x1e\x8f'\x00\
+\x84\x22\xb1\x05\x1b\xe8\x0e<\xd4\xa9\xa3\xa3\x83\xda\xdaZ\
+\xf6\xef\xdf\xcf\xd6\xad[\xd9\xbe};\xbbv\xed\xa2\xa6\
+\xa6\x86\xda\xdaZ\xea\xeb\xeb\x95\xd6\xe0p8\xc8\xc9\xc9\
+\xa1\xb8\xb8\x98\xc2\xc2Brrr\xf0z\xbd\x00D\x22\
+\x115\xee\x8e\x8e\x8ec\x9c\xc5\xcf\x0d\x1d\x04\xae\xa6\xd3\
+{pB\xe9D3\x80\xc9\xc0\xcbtF\xe9\xfd\x9b\x92\
+\x90\xd5j\xc5\xedv\xd3\xd1\xd1Ayy9\xdb\xb7o\
+\xa7\xbe\xbe\x9e\xac\xac,f\xcc\x98\xc1\xc2\x85\x0b\x991\
+c\x06#G\x8e\xc4f\xb3%\x9c+\x9b%\x12\x89\x00\
+\x89\xe8\xff\xf1JU\xfd|Q\xdb\xe5\xba\x16\x8bE\x99\
+%]i\x1b\xf1x\x9c\xda\xdaZ*++ihh\
+\xe0\xf0\xe1\xc3\xec\xdc\xb9\x93-[\xb6p\xf0\xe0A\xaa\
+\xaa\xaa\x08\x06\x838\x9dN\xf2\xf2\xf2\x182d\x08\xf9\
+\xf9\xf9ddd\x90\x92\x92B,\x16#\x14\x0a\xd1\xd1\
+\xd1\xf1\xaf\xac!\xfc\x06\xb8\xedD\xde\xe0D2\x80\xdb\
+\x81\xbbO\xd4\xc5Our8\x1c\xb8\x5c.\x9a\x9a\x9a\
+\xd8\xbcy3\xbbw\xef\xc6\xe9t2\x7f\xfe|\x96,\
+Y\xc2\xd9g\x9fMVVV\xc29b\xbbC\xa2\xcb\
+O$\xbc\xbeQt\x09.\x9f'\x93\xea\xbd\xd9\x5c\xc9\
+4\x08\xfdz:\x830\x02\x95\xc9\xa8\xa3\xa3\x83={\
+\xf6\xb0a\xc3\x066o\xde\xcc\xd6\xad[\xd9\xb3g\x0f\
+UUU\xd8l6\xf2\xf2\xf2(,,d\xc4\x88\x11\
+\xe4\xe5\xe5a6\x9b\x09\x04\x02\xff\xaa\xcc`\x1b\x9d\xe6\
+\xc1\x09\x09&:\x11\x0c\xc0\x06<\x0b|\xb1\xbf/\xfc\
+y \xa7\xd3\x89\xd3\xe9\xa4\xb2\xb2\x92M\x9b6\xb1\x7f\
+\xff~\x8a\x8b\x8b\xb9\xe6\x9ak\xb8\xea\xaa\xab\x182\xe4\
+\x88\xb2\xd4\xd1\xd1A{{{\xc2\xf9\xbdU\xcd{K\
+\xfd\xc1\x00z\xba\xa6x\x05\xacV+6\x9b\x0d\x8b\xc5\
+r\xd49\xd5\xd5\xd5|\xf8\xe1\x87l\xd8\xb0\x81M\x9b\
+6QVVFmm-v\xbb\x9d\x91#G2v\
+\xecX\x0a\x0a\x0a\x00\x08\x04\x02D\x22\x91\x7f%f\x10\
+\x06.\x03\x96\xf5\xf7\x85\xfb\x9b\x01\x0c\x02V\x03#\xfa\
+\xf3\xa2\x9f\x07\x12\x89_QQ\xc1\xbau\xeb\xa8\xae\xae\
+f\xf2\xe4\xc9|\xf5\xab_\xe5\xb2\xcb.#%%\x05\
+\xe8T\xebC\xa1\x90:O\x97\xf0\xf2\xbfPw\x1b\xa0\
+7\x8c\xe2x7Po\x99\x91>v\xdd-)q\x0c\
+v\xbb\xfd(S\xa2\xbe\xbe\x9e\xf5\xeb\xd7\xf3\xf2\xcb/\
+\xb3f\xcd\x1a\xca\xcb\xcb\xb1X,\x8c\x1f?\x9e\x89\x13\
+'\x92\x9f\x9fO,\x16#\x18\x0c\x1e\xc5$?\xc7\xf4\
+c\xe0\xae\xfe\xbc`\x7f2\x80\xe9t\xc6>\xa7\xf7\xd7\
+\x05?\x0fd\xb7\xdbq\xb9\x5c\xd4\xd6\xd6\xf2\xde{\xef\
+\xb1\x7f\xff~\xa6O\x9f\xce7\xbf\xf9M.\xbe\xf8b\
+\x9c\xce\xce0\x88p8LGG\x87\xda\xf0\xbd\xa1\xbe\
+H\xe5c9\xbf'\x06q\xac\xdaHW&I<\x1e\
+W\xde\x0f\x9d\x22\x91\x08\xef\xbe\xfb.\xcf?\xff<\xef\
+\xbc\xf3\x8e2\x97&M\x9a\xc4\xc4\x89\x13\xc9\xc9\xc9!\
+\x12\x89\x10\x08\x04\x88F\xa3\xfd\xae%\x0d0z\x08\xb8\
+\xb9\xbf.\xd6_\x0c`1\xf0F\x7f\x5c\xe8\xf3@\xb2\
+\x90=\x1e\x0f\xb5\xb5\xb5l\xdc\xb8\x91\xed\xdb\xb73q\
+\xe2$n\xbd\xf5V\x96,\xb9@m\xfcP(\xa4\x16\
+m\x7f\x80w}\x1d\xa71|X\xe2\x04b\xb1\x98R\
+\xd7O\xc4\x98\xf4\xfb\x09\xa8\x18\x8b\xc5\x88D\x22\xcaD\
+\x10\xa0\xd18\xe6\x95+W\xf2\xd8c\x8f\xb1b\xc5\x0a\
+\xaa\xaa\xaaHMM\xe5\xf4\xd3Og\xcc\x981\xd8l\
+6Z[[?\xef\x9e\x84W\x80K\xfa\xe3B\xfd\xc1\
+\x00\xbe\x00\xbc\xd8\x0fc9\xe5I\x80\xb0\xb4\xb44\xda\
+\xda\xdax\xef\xbd\xf7\xd8\xb9s'\xc5\xc5\xc5\xdct\xd3\
+M|\xf9\xcb_\xc6\xe3\xf1\x00\x9d\x12\xffdK+a\
+\x00&\x93Im|\xf1\xcf\xdbl6\xecv{\xbf\x8d\
+/\x19\xb3\x91\xcf\x84\xc1\x88\x19 \x9futt(O\
+\x83\x80\x8b\xfax\x02\x81\x00\xaf\xbe\xfa*\x8f<\xf2\x08\
++V\xac\x00`\xfa\xf4\xe9\xcc\x9e=[\xbd\x83\xcf\xb1\
+y\xb0\x9c\xce,\xd9\xe3\xa2\xe3e\x00\x17\xd3\xe9\xe6\xfb\
+\x97\xa7x<NJJ\x0aV\xab\x95M\x9b6\xb1r\
+\xe5JRSS\xb9\xfd\xf6\xdb\xf9\xcaW\xbeBnn\
+.pD\xd5\xef\xaf`\x9d\xe3!\xd9\xfc\x91H\x84\xf6\
+\xf6v\xc5\x90$\xe4\x17\xfa/\xde\xbf+mCg@\
+\xa2\x05\xc9X,\x16\x8bb\x00\xc6\x5c\x04\x87\xc3\xa1\xc6\
+\x08\xb0g\xcf\x1e\x1e~\xf8a\x1e{\xec1\xaa\xab\xab\
+\x195j\x14g\x9cq\x06yyy*\x92\xf1sh\
+\x1a\x1c7\x138\x1e\x06p&\xf0\xf6\xf1\xdc\xfc\xf3@\
+\xba\xd4\xaf\xae\xae\xe6\x8d7\xde\xa0\xa6\xa6\x86\xab\xaf\xbe\
+\x9a\xdbo\xbf\x9dq\xe3\xc6\x01\x9dvl\x7f\xa8\xa5\xc6\
+\x00\x9ec%\xd9T\xa1PHII\x89\xf3\x17\xb5\xfb\
+D\x99#F\x9cA\x82\x8f\x04\xd0\xb3Z\xad8\x1c\x8e\
+\xa4\xc7\xcb\xdf\xed\xed\xed\x0aD\xd4\xdd\x8e\xe1p\x98W\
+_}\x95?\xfc\xe1\x0f\xbc\xfb\xee\xbb\x14\x15\x15\xb1x\
+\xf1b\xf2\xf3\xf3iiiQ\xe7}\x8e\xe8%\x8e\xc3\
+\xe3v\xac\x0c`\x1c\xf0\x01\x90<\x14\xed_\x84\xe2\xf1\
+8N\xa7\x13\x87\xc3\xc1\x86\x0d\x1bX\xb9r%S\xa6\
+L\xe1\xe7?\xff9\xe7\x9dw\x9e\x92\xae\xfdi\x8f\x1e\
+/\x030J}\x89\xd2\x93(D\x91\xc6'\x92\xf4\xf1\
+\x0b#jkk#\x1a\x8d\xe2p8p8\x1cX\xad\
+\xd6.\xfd\xfe\xfag\x92\xe9(\x89M\xba\xd9\xb2~\xfd\
+z\xee\xbe\xfbn\xfe\xfe\xf7\xbf3|\xf8p\xce>\xfb\
+l233?\x8f\x8c\xe0A\xe0\x9b\xc7r\xe2\xb10\
+\x80<:7\xff\xbftt_<\x1e\xc7\xeb\xf5\x12\x0a\
+\x85X\xb6l\x19\x8d\x8d\x8d,]\xba\x94\x9bo\xbe\x99\
+A\x83\x06)\xe9\xaa\xd3\xb1\x04\xe2t\x17\xc4\xd3W\x92\
+\xcd/\x89=\x12\xd5'\xea\xf4\x89\xda\xf8\xc6g0j\
+\x00\x92\xb9\xe8r\xb9\xb0\xdb\xed\x0a\x87\x10,\xc0h2\
+\x88\xc6\x10\x8dF\x15> \xe9\xcf:\x80(\xe7\xbd\xff\
+\xfe\xfb\xdcv\xdbm\xac]\xbb\x96\xd2\xd2R\x16-Z\
+DVV\x16\xad\xad\xad\x9f'\xd3\xe0\xa7t\xe6\x11\xf4\
+\x89,3f\xcc\xe8\xeb9\xaf\x03\x13\xfaz\xd2\xe7\x8d\
+\xd2\xd3\xd3\xa9\xad\xad\xe5\xd1G\x1f\xa5\xa0\xa0\x80G\x1f\
+}\x94\xaf|\xe5+x\xbd^\xc2\xe1\xb0\x0a\xcf\xd5\xe9\
+X\x16Z_\xdc\x82\xdd\x91l\x94`0H8\x1c&\
+\x1e\x8f\xab0d\x9b\xcdv\xc2\xa5>t\xcd\x00-\x16\
+\x0bN\xa7S\xc5\x09\xe8\xc7I\xf8\xb3h\x07v\xbb]\
+\xb9\xfc\x04H\x95\xcdo2\x99\x14\x90)\x9a\x97\xd5j\
+\xa5\xa8\xa8\x88\x1bn\xb8\x81\x89\x13'\xb2r\xe5J\xde\
+y\xe7\x1d\x0e\x1d:DVV\x96\xc2f\xc4\x05{\x0a\
+\xd3\x99\xc0\x16`g_N\xea\xab\x06p?\x9d)\x8b\
+\xff\xb2d2\x99HOO\xe7\x93O>\xe1\xb9\xe7\x9e\
+\xe3\xb2\xcb.\xe3\xa1\x87\x1e\x22##\x83X,\xa66\
+W2i\x97\x8c>\x0b\xb7\x9f\xd9lV\xb1\xf5\x12A\
+'*\x7fo]\x8f]E\x03\xf6\xd7\xf8\xe0\x88\x84\x17\
+\x92y\x94@!\xbf\xdfOcc#\x91H\x04\x87\xc3\
+\x81\xdb\xedV\x8cM4\x03\xbd`\x89\xe0\x03&\x93)\
+\x01S\xf8\xfb\xdf\xff\xcec\x8f=\xc6\x87\x1f~\x08\xc0\
+\x8c\x193\x182d\x88\x02hOa\x0a\x00\xd3\x80\x1d\
+\xbd=\xa1/\x0c\xe0*\xe0\xe9c\x18\xd4\xe7\x82\xe2\xf1\
+86\x9b\x0d\xaf\xd7\xcb\xbau\xebx\xfb\xed\xb7\xf9\xc1\
+\x0f~\xc0]wu\x06f\x85\xc3\xe1\x04)z\xacq\
+\xf7\xfdM\xb2)$|V6\x94d\x12\x9e\xccpZ\
+\xdd\x1d($\xf1\x00\x22\xf1-\x16\x0b\xad\xad\xad\xec\xdb\
+\xb7\x8fH$Bff&\xf9\xf9\xf98\x9dN\xe5*\
+\xd4\x19\x87\x110\x8c\xc5b\x0a$\x14\xac@\xe8\xf0\xe1\
+\xc3\xfc\xf1\x8f\x7f\xe4\xef\x7f\xff;V\xab\x95\xc9\x93'\
+\xe3\xf1xT\xbe\xc5)J\x1f\xd0Yc\xa0W\xd4[\
+\x060\x9c\xce\xb2\xc7\xdec\x1b\xd3\xa9M\xe2vr\xb9\
+\x5c,_\xbe\x9c\x8d\x1b7r\xdf}\xf7\xf1\xdd\xef~\
+\x17@\xd9\xd3\x03A\xda\xebd6\x9b\x89F\xa3*\x91\
+F\xdf\xfc\x9f\x05\xd8g$\xa3\x16a\x0cs\xb6\xd9l\
+\x09\xee\xbf\xf6\xf6v6o\xdeLCC\x83J\x0er\
+\xbb\xdd\xc0\x91\xf4a\xddD\xd2S\x9f\x8d\x09I\xed\xed\
+\xed\xb4\xb6\xb6\xe2\xf3\xf9\xf0\xfb\xfd\xa4\xa7\xa7STT\
+\x84\xd9l\xa6\xb5\xb5\x95?\xfd\xe9O\xbc\xf6\xdakx\
+\xbd^\x8a\x8b\x8b\x15\x08y\x8a\xd2\xff\x00\xdf\xef\xcd\x81\
+\xbde\x00o\x02\xe7\x1e\xcf\x88NU\x8a\xc7\xe3\xb8\x5c\
+.\xacV+\xaf\xbc\xf2\x0a{\xf6\xec\xe1\xf1\xc7\x1f\xe7\
+K_\xfa\x92\x02\xfa\x8e't\xf7D\x91\x80d~\xbf\
+?\xc1\xbf\x7f\xb26?\x1c\x1d\x00$c\x84#\x18\x85\
+\xd8\xfc\xdb\xb6m\xe3\xc3\x0f?d\xf0\xe0\xc1L\x9e<\
+\x99\xf4\xf4tb\xb1\x18\xed\xed\xedIk\x19\x08\xe9^\
+\x80\xe6\xe6f\xca\xca\xca\xd8\xbbw/>\x9fO1r\
+\xa7\xd3\xa90\x9a\xf9\xf3\xe7SZZ\x0a\xc0\xc1\x83\x07\
+y\xe6\x99gX\xbbv-\x1e\x8f\x87\xdc\xdc\xdcS\xb9\
+`\xc99t\xc6\x09tK\xbda\x007\xd2\x19\x7f\xfc\
+/G\xb2\xf9\xcdf3\xcf>\xfb,uuu\xbc\xfc\
+\xf2\xcb\x9cs\xce9*S\xefXA\xba\xfe\x5cT\xc9\
+\xfc\xea\xb1XLm~8\x92\x8c\xd4\xdf\xf7>\x16\xd2\
+\xe7L\x97\xd8\x16\x8b\x85\xfa\xfaz^|\xf1Eb\xb1\
+\x18g\x9f}6%%%\xc0\x11\x13K?W\x82\x83\
+$\xa1H\x8e\xdb\xbau+\x1f~\xf8!\xd5\xd5\xd5\xa4\
+\xa7\xa73|\xf8pF\x8c\x18Ann\xaer1\x02\
+\xec\xdf\xbf\x1f\xbf\xdf\xcf\xd8\xb1c\x95\x0b\x14`\xeb\xd6\
+\xad<\xf4\xd0C\x1c8p\x80\xe2\xe2b\x05<\x9eb\
+\xb4\x1d\x98\x04t;\xf0\x9e\x18\xc0\x10:[\x1f\xf5\xa6\
+;\xca\xe7\x8ad\xf3\x9bL&\x9e~\xfai\x82\xc1 \
+\xcf?\xff<g\x9ey&\xd1h4\xc1}4\x90\x18\
+\x80 \xe9mmmJ\x85u8\x1c*\xdb\xf0dH\
+~#\xe9\xaa\xbf\xcc3\xc0\xea\xd5\xaby\xf6\xd9g9\
+\xfd\xf4\xd3\xb9\xe2\x8a+\x80#\x1b_r\x12\xe4<\xb1\
+\xedEc\xa8\xaf\xafg\xf5\xea\xd5\x94\x95\x95a6\x9b\
+\x19=z4\xb3f\xcd\xa2\xb0\xb00\xe1\xde\xf1x\x5c\
+1E\xab\xd5J4\x1aU\xc1G\x1d\x1d\x1d\xaaJr\
+$\x12\xe1\xcf\x7f\xfe3/\xbc\xf0\x02EEE\xe4\xe6\
+\xe6\x12\x08\x0c\xa8\x92\xfe\xbd\xa1{\xe9\xac\xcb\xd1%\xf5\
+\xc4\x00\x9e\x00\xae\xed\xcf\x11\x9d\x0a$\x01>&\x93\x89\
+\xbf\xfd\xedo\xb4\xb7\xb7\xf3\xf4\xd3O\xb3`\xc1\x82\x84\
+\x90\xd9\xbe\xfa\xe8O\xb4\xe4\x15\x9b\xbf\xad\xadM\xb9\xc6\
+\xacV\xab*\xbbu\xb2%?\x1c\x99+\xbd\x9c9\xc0\
+\xef~\xf7;\xb6o\xdf\xce\xd2\xa5K\x197n\x1c\xf1\
+x\x9c`0\x98PhDL\x17]\xe2\x1f:t\x88\
+\xd7_\x7f\x9d\xc3\x87\x0fSTT\xc4\xacY\xb3\x18=\
+z\xb4\xba\xae^1I\xaee6\x9b\x15s\xd4\xaf\xad\
+'e\xc9\xf5W\xaf^\xcd/\x7f\xf9K\xacV+S\
+\xa7NU\xd1\x8a\xa7\x90\xcbp2\x9d\xf8]R\xea\x8e\
+\x01,\x00\xfey\x02\x064\xa0I$R<\x1e\xe7\xa5\
+\x97^\xc2l6\xf3\xe0\x83\x0f\xb2h\xd1\xa2\x04\xb5_\
+\xa7\xee\x16\xc3g\xb5\xe9t\xb5_\x16\xb7\xd5j%%\
+%EU\x14>\xd9\xa4\x83u6\x9b\x0d\x9b\xcdF}\
+}=?\xff\xf9\xcf\xc9\xcd\xcd\xe5G?\xfa\x11\x0e\x87\
+CU>\x92\xcd\x08Gp\x03\xc9\xa2<t\xe8\x10\xaf\
+\xbe\xfa*\xe5\xe5\xe5L\x9e<\x99s\xcf=WUP\
+\x8aF\xa3\xca\xdd\x99\x0cx\x94\xeb\xc1\x11\x17d4\x1a\
+\xc5\xe9t*\xb7\xa80\x0e\xb7\xdb\xcd\xbe}\xfb\xb8\xf6\
+\xdak\xa9\xae\xae\xe6\x0b_\xf8\x02v\xbb\x9d\xd6\xd6\xd6\
+S\x85\x09\xbcJg\xceNR\xea.\x10\xe8a:\xd1\
+\xff\x7f\x19\xd2%\xff\xf3\xcf?\x8f\xd3\xe9\xe4\xbe\xfb\xee\
+\xe3\xdcs;\xf1\xcf\xae\xa2\xc6N\xf6B\x90\xcd/i\
+\xb0\xb2q\xbc^\xef\x80\xd9\xfcp\xc4\xde\x17\x09\xfe\xf1\
+\xc7\x1fs\xdbm\xb71o\xde<n\xbd\xf5V\xacV\
++\x81@@i2\xf2\x1c\x82\x118\x1c\x0e\xea\xeb\xeb\
+y\xfa\xe9\xa7Y\xb9r%EEE|\xf5\xab_e\
+\xc6\x8c\x19\xb8\xddn\x95\xd7`\xc4\x0a\xf4\xfbCbD\
+!\xa0\xb2\x0e\xc5\x9c\x10\x80\xd2b\xb1\x10\x89D\xc8\xce\
+\xce\xe6\xea\xab\xaff\xe7\xce\x9d<\xfc\xf0\xc3\x14\x14\x14\
+PTT\xd4k\xef\xcfI\xa6R`=\xb07\xd9\x97\
+]\x15n;\x1f8\xebD\x8dh \x92l~\xb3\xd9\
+\xcc3\xcf<\x83\xd7\xeb\xe5\x17\xbf\xf8\x05\x93&M\x02\
+8*\xac\x17z\xb7\xf1\x93\xf9\xba\xfb\x93\xe4\xfa\xba\xab\
+\xcfd2\xa9&\x1f\xc9\x1a\x83\x9c,\x12)k\xb1X\
+x\xf5\xd5W\xb9\xe7\x9e{\xb8\xed\xb6\xdb\xb8\xf8\xe2\x8b\
+U:\xb2D\xf3I\xf9p\x09\x11\x06x\xeb\xad\xb7\xf8\
+\xe7?\xff\xc9\xb8q\xe3\xb8\xe5\x96[HOO\x07:\
+\xdfM2\x80\xd0H\xba\xc9&.\xc7p8\x8c\xcdf\
+\xc3\xe9tRUU\xc5\xf2\xe5\xcb\xa9\xaa\xaa\xa2\xa8\xa8\
+\x88K.\xb9\x04\xb7\xdb\x8d\xcf\xe7#--\x8d\x87\x1f\
+~\x98\x193f\xf0\xcdo~\x93\xe9\xd3\xa7s\xce9\
+\xe7\xe0\xf7\xfbO\x05\x93\xe0\x07\xc0[\xc9\xbe\xe8\xca\x04\
+x\x078\xe3D\x8eh \x91\xb8\x87l6\x1b\x7f\xfd\
+\xeb_\xb1X,\xdc{\xef\xbd\x0c\x1d:\x941c\xc6\
+(\x9f\xf4\xf1\xbc\xe4\x13UTC\x02eB\xa1\x90\x92\
+h)))8\x1c\x8e\x01\xb5\xf9e#\x9b\xcdf\x1e\
+~\xf8a\xfe\xf8\xc7?r\xe7\x9dw\xb2x\xf1b\xb5\
+\xf9\x015fy6)\xf0\xf1\xf2\xcb/\xd3\xd4\xd4\xc4\
+\x17\xbe\xf0\x05\x06\x0f\x1e\x0c$n\xfc\xde\x92\xbc\x07\x01\
+\x00\x05H|\xfb\xed\xb7y\xf2\xc9'U6dUU\
+\x15%%%\xfc\xf8\xc7?&''\x87\x96\x96\x16\xd5\
+\xf4d\xd3\xa6M\xca\x0d\xfc\xc5/v&\xe2\x05\x02\x81\
+\x81\xce\x04.$IM\xc1dI\xe9g\xf1/\xb6\xf9\
+%,\xf6\xe5\x97_\xa6\xbd=\xc2]w\xdd\x85\xddn\
+'77\x17\xbb\xdd\xae\x22\xc3\xfa\xb2\x89\x05\xe1\x96\x9f\
+\xae\xbe?V\x12\x15\xb6\xad\xad\x8d`0\xa8\x002\x97\
+\xcb\xa5\xec\xe8\x81B\xb1X\x8c\x94\x94\x14\xccf3\xbf\
+\xfe\xf5\xaf\xf9\xcdo~\xc3o\x7f\xfb[\x16/^\xac\
+lmA\xe7e\xe3\x0b8WWW\xc7\xca\x95+\x19\
+6l\x18\xdf\xf9\xcew\x18<x0\xa1P\x88@ \
+pL\xea\xb7\xcc[$\x12Q\x9b\x7f\xd5\xaaU\xfc\xe9\
+O\x7f\xc2j\xb5\xe2r\xb9p\xb9\x5cL\x9a4Ie\
+\x0eB\xa7'E4\x92\xa9S\xa7\xb2a\xc3\x06\xc6\x8d\
+\x1b\xc7_\xfe\xf2\x17\xda\xda\xda\xf0z\xbd\x03\x02d\xed\
+\x86\x92\xf6\xe5Hf\x02\x1cSZ\xe1\xa9J\x16\x8b\x05\
+\x97\xcb\xcd\xeb\xaf\xff\x9d\xfa\xfaz\xee\xb9\xe7\x1e\xdcn\
+7\xe9\xe9\xe9\x14\x14\x14\xa8\xf0\xd9\x81Ff\xb3\x99`\
+0H[[\x9b\xb2\x99SRRp\xb9\x5c}\x96\x8a\
+'\x9a\xc4\x05y\xcb-\xb7\xb0l\xd92\xee\xbf\xff~\
+\xe6\xcf\x9f\x0f\x1cI\xe7\x85#R_r*\x9a\x9b\x9b\
+\xa9\xad\xade\xc6\x8c\x19\xe4\xe7\xe7\x1fw\xec\x85\x9e5\
+(\xf1\x00\xeb\xd6\xad\xe3\xc1\x07\x1f$%%\x85\xa2\xa2\
+\x22\xc6\x8f\x1f\xcf\xa4I\x93(((\xc0\xe9t\x12\x0a\
+\x85\xf0\xfb\xfd\xd8\xedv\xa5\x09vtt\x90\x9e\x9e\xce\
+\xcb/\xbf\xcc\xad\xb7\xde\xca\x03\x0f<\xc0UW]E\
+aa!\xcd\xcd\xcd\x03j\xee5:\x87\xce\x0e\xc5\x09\
+\xcdF\x8c\x0c\xe04\xfe\xc5\xcay\xa7\xa6\xa6\xb2j\xd5\
+?\xd9\xbb\xb7\x9c\xff\xf7\xff\xfe\x8b\x82\x82\x02l6\x1b\
+c\xc7vv0;QYb\xc7sM\x8b\xc5B8\
+\x1cV\x9b_<\x17n\xb7;!\x19\xe6X)\x19j\
+~,\xd70\x99L\xb8\x5c.\xfc~?\xd7\x5cs\x0d\
+\x1b7n\xe4\xcf\x7f\xfe3\xe7\x9e{\xaeB\xea\xa5\x0b\
+\x91\x80\x83\xe1p\x18\xbf\xdf\xaf\xa4\xfc\x88\x11#HO\
+O?&\xc0\xcd\x08\xfa\xc9g\x92$\xb4m\xdb6\xee\
+\xb9\xe7\x1e\x0a\x0b\x0b\xb9\xf8\xe2\x8bY\xb8paB\xf3\
+\x15\xd1L\x04/\xe8\xe8\xe8\xc0\xe1p\xd0\xd2\xd2\xc2\xc1\
+\x83\x07)))\xe17\xbf\xf9\x0dC\x86\x0c\xe1\xf6\xdb\
+o\xe7\xf2\xcb/\xa7\xa4\xa4\x84\x86\x86\x86\x01Q\xf1)\
+\x09}\x15\x03\x030z\x01n\x01\xe6\x7f\x96#:Y\
+\x14\x8f\xc7\xc9\xcc\xccd\xcb\x96-\xacY\xb3\x86\xdbn\
+\xbb\x95\xb1c\xc7b\xb3\xd9\x182d\x08\x85\x85\x85\x03\
+2)D\x90iQM\xa1\xd3\x9e\xf5x<'$c\
+\xefX\x19\x80l\xfe\xda\xdaZ\xae\xb8\xe2\x0a>\xfa\xe8\
+#\x1e~\xf8a\xce;\xef<\x80\x04\xb3J6\xa54\
+(moo\xa7\xad\xadM\xf5\x16<\xd6\xba~2v\
+=\xe3QZ\x94\xd5\xd6\xd6\xf2\xa3\x1f\xfd\x88\xd1\xa3G\
+s\xfb\xed\xb73a\xc2\x04,\x16K\x82y\xa1{O\
+\xc4$1\x9b\xcd\xb8\x5c.B\xa1\x10\xfb\xf7\xef'#\
+#\x83y\xf3\xe6QRR\xc2\x1dw\xdcAZZ\x1a\
+#G\x8e\xa4\xad\xadm j\x02\xa3\x80?\xd1\x995\
+\x08$j\x00f:3\xfe>\xf7\x14\x8f\xc7IMM\
+\xe5\xd0\xa1C\xacX\xb1\x82\x9bn\xba\x89\xd1\xa3G\x93\
+\x93\x93\x03\xa0\xd0\xe5c\x05\x98\xf4\xff\xfbs\x11\xc8B\
+\x96\x8e\xc0\xf2\xbf\xa4\xc5\xf6\x97\xbb\xefx\xc1N\xd9\xfc\
+\xad\xad\xad\xdc|\xf3\xcd\xec\xd9\xb3\x87_\xfd\xeaW\x9c\
+uV\xa7cI\xf7\xa8\x88\xa4\xf4\xfb\xfd\xb4\xb5\xb5\x11\
+\x8f\xc7ihh //\x8f\xac\xac\xac>7\x001\
+\x1e\xabk\x18p\xc4\x96\xff\xe9O\x7fJ~~>?\
+\xff\xf9\xcf\xb1\xd9l\xaa\x8e\x80\x1c#\xf3 \xe7\xc9o\
+9\xa6\xb8\xb8\x98\x94\x94\x146o\xde\xcc\xa4I\x93\xb8\
+\xfa\xea\xabq8\x1c\x5cv\xd9e\x04\x83A\xe6\xcc\x99\
+C]]\xdd@c\x02\x1e\xe0\x0a\xe0\x0f\xf2\x81\xae\xa7\
+,\x06\x86}\xd6#\xfa\xacI\xdc}\xa1P\x88W^\
+y\x85/|\xe1\x0bL\x9e<\x99\xc2\xc2BRSS\
+\xb1\xd9ldee\xf5\x19\xf5O\xb6H\xfb\xf3\xe5\x8b\
+\xdd\xeb\xf7\xfb\x15.!v\xff\x89\xac\xe6s,$n\
+\xbb\x1f\xfc\xe0\x07l\xd9\xb2\x85\xdbo\xbf\x9d+\xae\xb8\
+\x02\xbb\xddN0\x18\x04\x8e\x80qR\x0e\xcc\xef\xf7\x03\
+PUUEZZ\x9a\xc2_\xe4\xb9\x921\xd7\xae\xe6\
+\x5c\xc7\x08$\xd4\x17PADw\xddu\x17\x81@\x80\
+;\xee\xb8\x03\x9b\xcd\xa6J\xa3\x19\xaf\x99\xcc\xad(\x9f\
+\x05\x02\x01\xb2\xb3\xb3)((`\xfb\xf6\xed\xc4\xe3q\
+.\xbd\xf4R\xdex\xe3\x0d\xfe\xf1\x8f\x7f\xf0\xee\xbb\xef\
+\x92\x9b\x9b;\x10\x81\xc1K\xf5\x7ft\x06\xb0\xe43\x1e\
+\xc8I!Q\x01_\x7f\xfdu\xc6\x8d\x1b\xc7\xe9\xa7\x9f\
+Nff&\xc3\x87\x0f\xa7\xa5\xa5\x85\xa1C\x87\xf6\xd9\
+\x7f\xfeY\x15\xf5\x08\x04\x02\x04\x02\x01\x15\x17/\x88\xf5\
+@\xd9\xfcz\x5c\xff\x1dw\xdc\xc1+\xaf\xbc\xc2\x0d7\
+\xdc\xc0\x97\xbf\xfceRRR\xd4\xe6\x97p\x5c\xf1\xc3\
+K\x8c\xfd\xfe\xfd\xfbq\xb9\x5c\x94\x94\x94\xa8\xb2`\xfd\
+Az\xb7\xe3\xbf\xfd\xedo\xacX\xb1\x82{\xee\xb9\x07\
+\xaf\xd7\xab\x02\x87\xf4\x90c]\xea'c4\xf2\x7f8\
+\x1c\xa6\xb8\xb8\x98\xf4\xf4t\x0e\x1f>\x0c\xc0\xe2\xc5\x8b\
+Y\xbe|9o\xbf\xfd6\xef\xbd\xf7\x9e\xea`4\x80\
+\xe8t\xa0D\xfe\x11\x06`\xa7\x9f\x1a\x0d\x0cd\x8a\xc7\
+\xe3x<\x1e\xb6n\xddJ$\x12\xe1\x9cs\xce!=\
+=\x9d\x09\x13&P[[\x8b\xc3\xe1 ;;{\xc0\
+\xd5\x89\xd3\xc11aN6\x9bMu\xd1\x1d\x08RF\
+@<\x93\xc9\xc4\x0b/\xbc\xc0C\x0f=\xc4\x85\x17^\
+\xc8\x0d7\xdc@JJ\x8a\x92\xc2\x82\xc4\x8b*-\xe9\
+\xd4\x07\x0e\x1cP\xad\xbfD\x1d\xef\xafw \xa8\xff\xde\
+\xbd{\xf9\xbf\xff\xfb?~\xf4\xa3\x1f1h\xd0 %\
+\xf9\xa5P\x88\x1ev\xdc\x15\x89\xe6\xa2\x17.\x192d\
+\x08\x91HD\xa5\x1c\x9fu\xd6Y\xacZ\xb5\x8a\xe5\xcb\
+\x97\xf3\xc1\x07\x1f\x90\x93\x933 \xde\xd1\xa7dF\xdb\
+\xeb\xc2\x00f\xd1\xd9\xd7\xefsMv\xbb\x1d\x9f\xcf\xc7\
+\xde\xbd{Y\xb0`\x01\x83\x06\x0db\xdc\xb8\xf1\x004\
+661hPg\xf3\xc9X\xac\x03\x88i?\xc9_\
+\xde\xf1\xfa\xf2{C\x22)\xfd~\x7f\x02\xa8%~\xf5\
+\x01\xb4\xb0p8\x1cl\xde\xbc\x99_\xfd\xeaWL\x9c\
+8\x91o}\xeb[\xe4\xe7\xe7\xab\xda}z\xdc\xbd\xb8\
+\xd4b\xb1\x18\x87\x0e\x1d\x22\x10\x080e\xca\x14\xe2\xf1\
+xR\xd7k\xb2\xff\xbb\x0a\xcb6&iI\x11\x91;\
+\xef\xbc\x93K.\xb9\x84\xb3\xcf>[\xd5\x0c\xd4[\x9c\
+\xebU\x88\x8d\xd2_\xf7(\xc8\xe7&\x93\x89\xf6\xf6v\
+,\x16\x0biii\x0a\x9b\x89\xc7\xe3,\x5c\xb8\x907\
+\xdf|\x93\xd7^{\x8d\x1d;v\x90\x9e\x9e>\x90\xde\
+\xd5B\xf9C\x18\xc0\xbfD\xd8\xaf\xddng\xc7\x8e\x1d\
+dgg3v\xecX\xc6\x8f\x1fOJ\x8a\x9b\xda\xda\
+:\x5c.\x17\xb9\xb99D\x22\xed\x0c\x14\xe1\x9f\xcc\xee\
+\x97\xa0\x1a\xbb\xdd>`\x22\xfd\x04\x88lii\xe1\xb7\
+\xbf\xfd-iii\xdc|\xf3\xcdL\x980!\xa1`\
+\xa7\x1c+Qx\x81@\x80\xa6\xa6&\xaa\xab\xab\x998\
+q\x22v\xbb\xbdO\x05VzC\x92\x15\xf8\xe8\xa3\x8f\
+\xe2p8\xb8\xe9\xa6\x9b\x80\xce\x0aA6\x9b\x0d3\x89\
+\xa9\xd4\x16\x93\x093\xc9\x99\xbb1\x8dY\xbe\x8fF\xa3\
+\xb8\xddn\xecv;mmmD\x22\x11B\xa1\x10\xe7\
+\x9cs\x0e\xcf>\xfb,\xcf?\xff<555\x03)\
+X\xe8\x0c>\xed\xe1)\x0c`\xdeI\x1b\xcagD\x0e\
+\x87\x83\xba\xba:\xfc~?\x13'Nd\xf2\xe4)\xe4\
+\xe4\xe4\xd0\xde\x1e\x22\x12\x09\x91\x97\x97\x83\xc5b\xf9T\
+5\xb5\xd095\xf2cJx\xe1\x9f\x85\xe4\x87#v\
+\x7f(\x14Rc\x93\x8a6]m\xfec\x0d\x929\x16\
+\x92{\x89\xef\xfc\x91G\x1ea\xcf\x9e=\x5cr\xc9%\
+,^\xbc\x18@\x85(\x0b\xf3\x12U\xbb\xa5\xa5\x85p\
+8\xcc\xae]\xbb\x18>|8\xb9\xb9\xb9IM\xaf\xee\
+\xa2)\x93\x91\xd8\xf2\x82\x93\xd8\xedv\xf6\xee\xdd\xcb\x8b\
+/\xbe\xc8M7\xdd\x84\xd9l&\x1c\x0e+\x15>\x1e\
+\x8fc\xc6\x84\xc9\xac\x15U\xd1\x86\xd0\xdd|\xcaw\x82\
+W\x08\xfe!\x0c/\x1a\x8dr\xe5\x95Wr\xcf=\xf7\
+\xf0\xf8\xe3\x8f\xd3\xd6\xd6\x86\xdb\xed\x1e\x08L\xc0\xc3\xa7\
+{\xde\x0c\xa4\xd1YI\xf4sK\xf2\xa2\x0e\x1c8@\
+^^\x1e\xf3\xe7\xcfg\xf8\xf0a\xca\xdf\xebp\xd8\xc9\
+\xcd\xcd&\x1a\x1d8Q\x7fb\xf7K\xda\xa9\xa4\xd0J\
+o\xc1\x93\xb5\x88\x8c(\xbb\x04\xca\xac^\xbd\x9a\xd7^\
+{\x8dY\xb3fq\xf9\xe5\x97c\xb5Z\x13\xf2\x13D\
+e\xb6Z\xad\xb4\xb6\xb6\x12\x89D\xd8\xb7o\x1f.\x97\
+\x8b1c\xc6\xa8\x88\xc0\xfe`\xae2_\xe2\xce\xbb\xfb\
+\xee\xbbY\xb4h\x11\x93&MR%\xc5\xc4|\x8a\xc6\
+\xe3D\xe31\xf8t|1\xba~\xff\xc6\xb1\xe9\xccI\
+\x9eM4\x04\xf1\x14D\xa3Qn\xbd\xf5V\x96.]\
+\xca\x13O<\xa1j\x0d\x0c\x00&0\x0d:\x19\xc0\x14\
+>\xe7\xc5>%\xd3\xab\xa5\xa5\x85\xd3O?\x9d\x09\x13\
+&\x10\x0a\x85\xb1\xd9\xacttDp8\x9cx\xbd\xa9\
+]\x96}2\xbe\xf4\xbe\x90q\xc3\xf4\x86\xf4\xf4^]\
+\xeb\x90\x0c\xbf\xeeP\xe5\xcfJ;\x11\x92H\xbf\x07\x1e\
+x\x80\x9c\x9c\x1c\xae\xbe\xfaj\x0a\x0a\x0aT\xa2\x8e\xce\
+\x00\x84)\x84B!jjjhnnf\xfa\xf4\xe9\
+*6_W\xaf\x8f\x85d\x9e\xf5t\xdf\xbf\xfc\xe5/\
+\xf8\xfd~$\xe9Mg4&\x93H\xfe8\xf1\xf8\xa7\
+\xba\x9e\x09\xe8\x05\x13\xd0\xc7(Z\x8d\x044\x89\xf4w\
+8\x1cjM\xfd\xe67\xbf\xe1\xbc\xf3\xce\xe3\xaf\x7f\xfd\
++n\xb7{ \x08\x9a\xa9\xd0\xf9\xcc\x9fk\xe9/\x8b\
+\xeb\x93O>a\xfc\xf8\xf1,\x5c\xb8\xf0\xd3>t\x01\
+RR<\xf8\xfdm\x9fJ\xd5\x13W\xf7\xbe/$\x0b\
+C\xec~\xd9\xf0\x1e\x8fg@e\xf8\xe9s\xf5\xc4\x13\
+OP]]\xcd\x15W\x5c\xc1\x94)S\x14\x83\xd2\xeb\
+\xf4\xebL-\x18\x0cr\xe0\xc0\x01F\x8c\x18Aff\
+\xa6R\xfduiz\xacc\xd2\xa5\x7fUU\x15\x8f?\
+\xfe87\xdex\xa3\xea=(\x09@*\xff\x000\x99\
+>\x05'\xe3\x10\x8f\x83\xa9\x97\xcb@g\xee\xfa\xd8\xe5\
+G\x5c\xce\xe2\xfe|\xea\xa9\xa7\x18>|8o\xbf\xfd\
+\xf6@\x00\x05\xa7\x03N3\x9f\xf3\xe0\x1f\x97\xcb\xc5'\
+\x9f|\x82\xc5b\xe1\x0b_\xf8\x02\xd9\xd9\xd9\xb4\xb5\xb5\
+}\xeaB\x8b\x12\x0a\x05?\xad\xfe\xda1 \xc0?I\
+\xf2\x09\x04\x02\xcaN\xb5\xdb\xed\xca\xe57\x90\xc8\xe9t\
+\xb2y\xf3f^z\xe9%\x16-Z\xc4\xa2E\x8b\x00\
+\x14\xe3\xd2\xbd\x14V\xabU\xb5\xeb\xde\xbf\x7f?\x0e\x87\
+C\xa9\xfe\xb2y\xfa#\x89I\x5c\xa4\x00\xbf\xff\xfd\xef\
+\x99<y2\x0b\x17.T\x81>:(\xa9\xb4+\xc0\
+\x1c\xef\xfc+N\x9c\xae\xbc>\xbd!\xb9G<\xdeY\
+1\xba\xa3\xa3#\xa1\x82\xd0\xa3\x8f>\x8a\xdf\xefg\xc7\
+\x8e\x1dx<\x9e\x93\xc9\x04r\x80B3\x9f\xe36_\
+v\xbb\x9d\xa6\xa6&v\xed\xda\xc5\x92%K\x183f\
+\x0c\xc1`\x90\x8e\x8e\x0e\x95\xeai\xb39p\xb9R\x88\
+D\xa2t\x82\x7f\xfd\xcb\x05\xfa\x02b\x89\xb6\xe2\xf7\xfb\
+\xd5\xe61\x99L',\xce\xffxHj\xe6=\xf1\xc4\
+\x13\x98L&.\xbd\xf4R\x95\xb4#\xc0\x98^\x9d(\
+\x12\x89\xd0\xd6\xd6Fkk+555\x8c\x1f?\x1e\
+\x9b\xcd\x96\x10\xd5\x08GB\x83\x85z\x03\xc2\x19\xbf\xb7\
+\xdb\xed\xbc\xff\xfe\xfb\xec\xdc\xb9\x93[o\xbd\x15@\x99\
+#:\xc3Q\xd7\x01\xe2\xe6O\xaf%\x9f\xc59\xb2\x14\
+L\x107\xc5\x89\x11O*\xf5\xf5X\x0c\xd1@\xacV\
+\xab\x0ak\x964\xedP(\xc4\xe0\xc1\x83\xf9\xdd\xef~\
+\xc7\xc6\x8d\x1bijjJ\xe8X\xf4\x19\x93\x19\x98`\
+\x06F\x9e\xac\x11\x9cH\x12tz\xc3\x86\x0d\x14\x17\x17\
+s\xe1\x85\x17\xaa4S\x9b\xcd\x86\xcb\xe5\xa2\xb1\xb1\x91\
+\xec\xec\x9cO\xcf\xf8l7WW~n\xbf\xdf\x9f\x80\
+\x22\x0f4\x97\x1f\x1c\x09\xfay\xfb\xed\xb7Y\xbdz5\
+\xd7]w\x1dc\xc7\x8eM\xd8\x5c\xb2\xf1\xa1sS\xfb\
+|>b\xb1\x18\x87\x0f\x1f&==\x9d\xe2\xe2\xe2\x04\
+\xcc\xe5X\xb4\x1b}\xf3Y\xad\xd6\x84b\x9e\x7f\xf9\xcb\
+_8\xeb\xac\xb3TR\x97n\xa7\xeb\x94,\xdc7\x06\
+\xc4:\xa1\x01\xb5*\xe2q\xc3\xff&\x12d\x85\x11\x10\
+looWciiiQ\xa5\xc8\xa3\xd1(g\x9c\
+q\x06\xdf\xf9\xcewX\xb3fMB\x94\xe2I\xa0Q\
+f\xc0}\xb2\xee~\x22\xc9\xe9tr\xf0\xe0A\xaa\xaa\
+\xaa\xf8\xd2\x97\xbeDff&\xa1P\x88h4Jf\
+f&\x91H\x84H\xa4\x83\xfc\xfc\xfcO7W\xdf\x80\
+\x9f\xe3!\xb1\xebu{\xb7+\x97\x9f\xb8\x8d>K\xf7\
+^2\xd2\xa5\x9e\xcb\xe5\xa2\xa3\xa3\x83\xfb\xef\xbf\x9f\xd2\
+\xd2R\x96,\xe9\x8c\x22\xd7my!\xb1\xbd\x03\x81\x00\
+mmm\xd4\xd6\xd62f\xcc\x18\xa03\xf0F\xa4\xb2\
+H\xe8\xbe\xce\xb1 \xefz3\xd07\xdex\x83\xfa\xfa\
+z\xbe\xf2\x95\xaf\x00\xda\xc6\xee\xa2V\xa0<\x9f\xf1Y\
+1\x99:\xa5?\x9fb\x05\xd0\xc9\x04>e\x0e\xc2\x0d\
+\x8ck#\x16\x8b\xa9\x82#999\xf8\xfd~ZZ\
+Z\x120\x9c\xef\x7f\xff\xfb\xcc\x9c9\x93\xf5\xeb\xd7\x9f\
+LS o@&-\x1f/\x09\xa7_\xb7n\x1d\xb3\
+f\xcd\xe2\xf4\xd3OW\xfd\xe7\xcdf3\x99\x99\x994\
+44\x90\x92\x92BJJJ\x8f\xd5s\x8e\x05\xc9\xef\
+\xeeZ\xb2@\xe4z\xc6P_\xd9\x0c^\xafW\x1d?\
+PH\xc6\xfc\xf8\xe3\x8f\xb3c\xc7\x0e\xbe\xfd\xedo\x93\
+\x9e\x9eN{{{R\xf5\x1dPE2\x0e\x1d:D\
+zz:C\x87\x0eU\xd2_\xcc\x05]c\x80\x9e+\
+*\xe9\xc7\x09\xe3\x90d\x9f\xbf\xfd\xedo\x5c{\xed\xb5\
+\xa4\xa4\xa4\xa8\xb4\x5c\xfd\x1d'\xbb^\xc2g\x9f\xee}\
+:\xf7?\xe6X\x5c\xe3\x02G\x8fI\x9eS\x07\xff$\
+\xd2\xd1b\xb1\x90\x99\x99Icc\xa3\x1a\xab\xa4B\xff\
+\xfa\xd7\xbf\xc6l6s\xf0\xe0AU\x89\xfa3\xa6\xc1\
+\x9fK\x06\xe0t:\xd9\xb5k\x17\xa1P\x88\x1bn\xb8\
+\x01\x87\xc3\xa1*\xb9x\xbd^\xdcn7\x8d\x8d\x8d\xaa\
+\x8c\xf4g9\xf1\xf1x\x5cm\x16]\xaaJ-\x7f\xd9\
+\xf0\x1e\x8fG\x15\xa2\x90\xf3N6\x06 \x9b\xcc\xe7\xf3\
+\xf1\xe7?\xff\x99\xcb/\xbf\x9c\xe9\xd3\xa7\x03\xc9\x0b\xa7\
+\x08\xf0'\xd5z\xeb\xea\xea\x8e\x92\xfe\x82\x15\x88\xcd\xdc\
+\x17\x123I\xf2\x0c,\x16\x0b/\xbd\xf4\x12^\xaf\x97\
+K.\xb9$\x81)%c\xdeF\x93@\xfd\xfd\xa9t\
+W\x12_\xe9\xfd\x1c\xb1\x01\x0c\x97\xd3\x99\x97\xbc7a\
+\xdc^\xaf\x97X,FUU\x95z\xceP(D^\
+^\x1e\xb7\xddv\x1b[\xb6lI\x08\x95\xfe\x0c)\xf7\
+s\xc7\x00\xc4\xdd\xb4q\xe3F\xce=\xf7\x5c\xa6L\x99\
+Bkk\xabz\x19\xd9\xd9\xd9\xaa\xbaLVVV\x97\
+\xb6u\x7f\xa9\xfd\xba\xe6\xa0\xc7\x93K\x88\xaa\xd4\xf5K\
+\xa6\xfa\x0f$\xc9\x0fG\xc6\xff\xe8\xa3\x8f\x12\x0e\x87\xf9\
+\xcaW\xbe\xa2$\x9aQ}\x97\xc5\xdc\xdc\xdc\x8c\xcdf\
+\xa3\xa2\xa2\x02\x97\xcbEqqqBS\x0e1\x1b$\
+r\xaf7c\xd0\x19\xa7\xdc\xc7\xedv\xd3\xd1\xd1\xc1\xaa\
+U\xabT\xa1\xceH$\xa2\xecpH\xac\xcf \xf7\x93\
+\x8d'v\xbb\xd4%\xec<\xe1\xd3u`\xd8\xec\xa6O\
+]\x85\xc65\xa2\x9b\x1a\xfa\xff\x00\xb9\xb9\xb9\xf8|>\
+\x85A\xc9=\x96,Y\xc2\x8c\x193\xd8\xb0a\x03)\
+))\x9f5\x93\xcf\xfc\xdc1\x00\xa7\xd3\xc9\xee\xdd\xbb\
+1\x99L\x5cu\xd5UJ\xc2H\xa8fZZ\x1a\xcd\
+\xcd\xcd\xaai\xc6g\x09\xae\x89\xad*%\xa9d\x03\x88\
+\xea/\x0bz \xa2\xfe\x22\xfd\x9b\x9a\x9ax\xe2\x89'\
+\xf8\xd2\x97\xbeDII\x89\x02\xe2\xf4\x80\x1f\x01\xe5Z\
+ZZ\x08\x06\x83\xc4b1jjj\x185jT\x82\
+\xca/\xa6\xd0\xb1\x02a:~b2\x99x\xe5\x95W\
+HOOg\xfe\xfc\xf9\xca\x06\xd75\x13\x9diHF\
+\xa2d\xf4\xe9-\xc8zK\x82\xe3\xe8\xccK\xc7\x19$\
+\xb9\xa8\xa3\xa3\x03\x8f\xc7\x83\xcb\xe5\xe2\xd0\xa1C\xea\x1e\
+\xa2\xb9\xdcr\xcb-\x84\xc3a\x1a\x1a\x1a\x12\x18\xd6g\
+@\xa9\x9f+\x06 \x8b\xf0\x83\x0f>`\xf1\xe2\xc5L\
+\x9c8\x91\xd6\xd6V\xe0H\x090\x93\xc9DSS\x93\
+\xea\xf8\xfbYIY\x91\x90b\x17\xcab\x94\x0c2\xd9\
+\x10\xfd\x85\xfa\x1f\x8f\x06\xd3\xdd\xb9\x0f>\xf8 f\xb3\
+\x99\x1bn\xb8\x018\x92\xcek\x04\xfe\xa2\xd1(MM\
+M\xd8\xedv\xaa\xab\xabq8\x1c\x94\x94\x94$l\x1a\
+\x01e\x8f5\xc0I\xee\xe9v\xbb\x09\x04\x02\xbc\xf3\xce\
+;\x5cr\xc9%\xc0\x11\xf3@6\xb9\x900\x031A\
+\x9cN\xa7\x02_%\xc3\xb2\xa75\xa1kr\xfa\xb3\xeb\
+\xda\x89\xc9dR\x95\x8f\xe4\xddKyqqE\x87\xc3\
+a\xda\xdb\xdb\x19;v,\xe7\x9e{.\xeb\xd6\xad\xc3\
+\xe9t~\x96\x8c\xdf\xf5\xb9b\x00\x0e\x87\x83\xdd\xbbw\
+c6\x9b\xb9\xea\xaa\xabT8\xaa4\xa4HKK\x03\
+\xc0\xe7\xf3\xa9pL=\xfe<\xd9\xc2?^3@\xce\
+7\x9b\xcdJ\xcd\x97@\x15\x1d\xf5\x97\x8d0\x10\x03~\
+\x04\xf9ojj\xe2\xc9'\x9f\xe4\xa6\x9bnR\xb5\xfa\
+\x92\x01\x7f\xba\xf47\x9b\xcdTWW\xab*\xbbzU\
+_)gn\xbcFW\xf3\xadk\x09:\xd3\x04x\xf1\
+\xc5\x17\x19:t(\x93'OVx\x8f\xb8\xfe\x8c\xef\
+S0\x07\x09\xd0\x01T\xa6\x9e\xee\xca\xecj\x1c\xfa\x86\
+\x87\xa3]\x9826\xe9\xd4$\x9a\x9e\xd7\xeb\xc5\xe5r\
+Q__\xaf\x00K\xb9\xd6\xcd7\xdfL$\x12a\xcf\
+\x9e=*}\xf93 \xc7\xe7\x86\x01\xc8B\xfa\xf0\xc3\
+\x0f9\xfb\xec\xb3\x990a\x82*\x9c\x19\x8b\xc5HM\
+M\xc5\xe5r\xd1\xdc\xdcL(\x14\x22===\xd1\xde\
+;\x81$\x810\xe1pXu\xc6\x91D\x1f\xf1\x0fK\
+\x8e\x7fW\xaa\x7f2\x1fvwt<\x9e\x0b\xe3\xb9\xf2\
+\xfb\xc1\x07\x1f$++\x8b\xeb\xaf\xbf\x1e@E\xd5\x19\
+\xdd\x99\x91H\x84\xa6\xa6&\xc5\x08\x22\x91\x88j\xf3-\
+\xc7H\x89\xef\xdeJ\xbcd\xcf!i\xb8\xad\xad\xad|\
+\xf8\xe1\x87\x9c\x7f\xfe\xf9\x00\xca\x96\xd7\x81V\xf9\x115\
+\xdfj\xb5\xd2\xd4\xd4\xa4\x1a~X\xad\xd6\x84\xa2%\xdd\
+\x91\x91A\xe8AAz\x0c\x84tk\x929\x8a\xc5b\
+\xe4\xe4\xe4P__\x9f\xb0\xf6:::(,,\xe4\
+\xc6\x1bod\xc3\x86\x0d\x9f%\x1880k\x17\x1f\x0b\
+I\xecw8\x1c\xe6\xb2\xcb.S6\x9d\x84\xd2\x8a\xf4\
+\x17\xb7\x90\x80F=\xd1\xf1\xba\xffd1\x84B!%\
+u$\xdaO\x16\x90\xe0\x13]\xa9\xc2]I\x9a\xcf\x8a\
+\x5c.\x17---<\xfb\xec\xb3|\xe5+_\xc1f\
+\xb3%\x94\xe9\xd6\xa5\xac\xc5b\xc1\xef\xf7\x13\x0c\x06q\
+\xbb\xdd\xd4\xd4\xd4\x90\x9a\x9a\xaa\xd2}\xe1H\xcc\x83\xe0\
+\x0a\xc6\xe7\xean\xbe\xe5>\xfa=\xdf~\xfbm\x0a\x0a\
+\x0a\x18;v\xacj\xf5\xad'M\xe9\x1b\xd4b\xb1\xe0\
+p8\xf0\xf9|\xf8|>\xb2\xb3\xb3UD\xa2\x98f\
+=1O\xd1\xd8\x22\x91H\x82\x96\xa1'!\xe9]\x9a\
+\xc5-\x18\x08\x04T\x0e\xc0\xe1\xc3\x87U\xfa\xb0<\xc7\
+\xd2\xa5K\x194h\x10\x9b7oV\xdf\x9dh\xfa\xdc\
+0\x00\x89\xfa\x9b6m\x1a3f\xcc\xa0\xa9\xa9Iq\
+\xfc\xd4\xd4T\xa5V\xd5\xd7\xd7\x7f\xe6\x854e\xb1\x88\
+\xb4\x0b\x06\x83\x84\xc3a\xb5\x90,\x16K\xb7\x08\xb0 \
+\xd4:\xea\xfdY\xd3c\x8f=\x86\xddn\xe7\xaa\xab:\
+\x0bG'\x1b\x8b\xd8\xcf>\x9fO\xd9\xe0\xb5\xb5\xb5\x14\
+\x14H\xa5\xa5#\xf3\x1d\x08\x04p8\x1c}\x0e\xfe\xd1\
+\x11v\x97\xcbE$\x12a\xed\xda\xb5\xcc\x9e=\x1b\xe0\
+(\xa6\x1e\x8f\x1f\xa90$IB\xcd\xcd\xcd466\
+RXXx\x14P\xd8\x1b\xd2\x81La.\xc9\xdc\x89\
+\xcd\xcd\xcd\x09\x1e\x0fi;\x96\x95\x95E}}}\x82\
+V\x17\x0a\x85\xb0\xdb\xed|\xfd\xeb_\xa7\xa1\xa1\xe13\
+\x03\xa7?\x17\x0c\xc0f\xb3\xd1\xdc\xdcLUU\x15_\
+\xfc\xe2\x17\x95\x8a\x09\xa8rM\xba[J:\xd5\x9ch\
+\xb0E$\x8ed\x839\x9dN\x15\x13\xaf\x17\xa0\xf4x\
+<I\x01I\xd9d\x02f\xe9\x08uO\xc11\xc7K\
+z\xd4_$\x12\xe1\x89'\x9e\xe0\xd2K/\xc5\xe5r\
+%\x00\x99r?yV\xbf\xdf\x8f\xdf\xef\xc7\xe9t\xd2\
+\xd8\xd8H4\x1a\xa5\xb8\xb88!+0\x12\x89\x10\x0c\
+\x06\x8f\x0b\xf0\x92\xf9X\xbbv-V\xab\x959s\xe6\
+$\xad\x8f(.F1\x17ZZZ\xa8\xae\xae&'\
+'G\x09\x81\xee\xec}}c\xcb\x1a\x12\x5cI\xe6\xc8\
+\xd8mX4\xbe\xda\xdaZ\xb5\x91E\x13\x88D\x22\xe4\
+\xe7\xe7\x13\x89DhllT\xe7HN\xc0\x97\xbe\xf4\
+%&M\x9a\xc4\xe1\xc3\x87\x95yx\x22\xe9s\xc1\x00\
+\xa4\x16\xdd\x88\x11#X\xb4h\x91\xe2\xae\x12K/\xd2\
+_\xb2\xd1233?\x93q\x09#\x0a\x04\x02\xaav\
+\x7f[[\x9bZ\xbc\x1d\x1d\x1d8\x9dN\xdcnw\x97\
+\xaa\xbfH0\xbd\xd8Dw\xd4_\x01C\xbaT{\xfe\
+\xf9\xe7imm\xe5\xdak\xafM\xf8\xce\x88\xae\xc7b\
+1\x9a\x9b\x9b\x81Nfw\xe8\xd0!rrrHO\
+OOP\xff\xa5\xfe\x7f_+\x1a\xeb\x12W\xdcek\
+\xd6\xaca\xce\x9c9JKJ\xa6!\x09\xf0\xea\xf7\xfb\
+\xa9\xad\xad%??\x9f\xb4\xb44\xa5U\xf5f.\x8c\
+\xfe\xfe\xae\x0a\x89\xca\xf3\x08\xc6#5\x1d\xe4=F\x22\
+\x11\x1c\x0e\x07^\xafWu\x10\x92sC\xa1\x10n\xb7\
+\x9b\x0b/\xbcP\xcd\xe3\x89\xa6S\x9e\x01\x08W-+\
++c\xf1\xe2\xc5\xa4\xa7\xa7+\x89\x0b\x9d\xad\xbf\xa4\xd7\
+\xbb\xe4\xd8{<\x9e\x13\xd6\xf2K'\xab\xd5\xaa\x90n\
+\x8f\xc7C[[\x9b\x92\xfe\x02Fy\xbd\x9d\xb5X\x92\
+-Da\x12\x12\xd0\xd2S\x05`]\x1a\x1d/\xc9\x06\
+\x85N\xf5\xff\x9cs\xce\xa1\xa8\xa8H\x81Zz\x01M\
+y\xd6@ \xa0\xfa\xe8\x05\x83A\xea\xea\xea\x18>|\
+\xb8\xba\x9el\xe0\x96\x96\x16\x9cNg\x9f\xa2\xff\xf4\xf8\
+\x02\x8b\xc5\x82\xddng\xd3\xa6M\xf8\xfd~\x16-Z\
+\xa4@\xbfd~|\x99\xef\x8a\x8a\x0a\xbc^o\xc2\x1a\
+1z\x16\xba\xf2\x08\xc95\xc4d\x10\xaf\x8d\xfe\x5cr\
+\x9c\x90\xdf\xef\xa7\xbe\xbe^\xe1\x1dB\xd1h\x94\xac\xac\
+,\xe5\x0e\x84\xc4NI\xe7\x9dw\x1e\xc5\xc5\xc5\xd4\xd5\
+\xd5\x9dp-\xe0\x94g\x00\x0e\x87\x83\x03\x07\x0e\xe0r\
+\xb98\xff\xfc\xf3\x95\xfd)\xf6\x9e\x9eh\xe1\xf7\xfb\xf1\
+x<\xdd\xd6\xd4;^\xd2\x01\xa4h4J(\x14\xc2\
+\xe3\xf1\x10\x8dF\x95\xcbI\x16\x931\xdc\x17\x8e\x96\xe0\
+\x02\x1e\x1a\xa5\x7fW\xa8\xb8\x5c\xbf?\x9e\x03\xe0\x8d7\
+\xde`\xf7\xee\xdd\x5cw\xddu\x00\x09H\xb91\xc0\xc6\
+\xe7\xf3\x11\x8dF\xb1\xdb\xed\xd4\xd4\xd4`\xb3\xd9\x18<\
+x\xb0R\x97\xcdf3\xed\xed\xedjNz\xda\xfcF\
+@N\x18\x9c\xd0\xfb\xef\xbf\xcf\x8c\x193p\xb9\x5c\x09\
+L_\x1f\x93\xfc]WWGFF\x06999*\
+v!\x99\x0f\xbf\xbb\xb9\x80#\xea=\xa0\x18\x98\x8e\xfe\
+\x0b\x89\xe6\xd7\xd4\xd4D(\x14R\x8c_4\xd3\xd4\xd4\
+Tb\xb1\x18mmm\x8a\xa9I\xec\x80\xcdfc\xe1\
+\xc2\x85TTT$\xf4*<\x11tJ3\x00\xb1\xef\
+>\xfc\xf0Cf\xce\x9c\xc9\xd8\xb1c\xf1\xf9|j\x83\
+\xa5\xa5\xa5\xe1r\xb9\xd4\xc6\xf0\xf9|8\x1c\x8e\x1e\xcb\
+j\x1d\x0f\x19\xeda\x01!\xfd~\xbfB\xa8\xa5\xbe_\
+W\x08\xb8<\x97\xf8\xb3%Q\xa4\xbb\x05*\xfe\xeb\xde\
+\x86\xd4\xf6Db\x93>\xf3\xcc3\x8c\x1f?\x9ei\xd3\
+\xa6\xa9\xb1\xca\x82\x152&3Y,\x16\xea\xea\xea\xc8\
+\xce\xceV=\x01\xf4\xe0\x1f \xe1\xbd\x18\x9f\xbd+\x92\
+\xe7\x94\xe0\xa2\x86\x86\x06\xe6\xce\x9d\xab\xbeO\xf6N\xed\
+v;\x8d\x8d\x8dX,\x16\xb5\xf9uU\xde\xc8\xc8\x92\
+1O}L\x82\xe1\x08~\xd1U\xccHCC\x03N\
+\xa7\x13\xbf\xdfOkk\xab*\x85\xa6\x17y\xd1\x0b\x85\
+\x18\xb5\xb7s\xcf=\x97\x8c\x8c\x0c\xea\xea\xeaN(\xf0\
+{J3\x00\xab\xd5\x8a\xcf\xe7\xe3\xf0\xe1\xc3,Y\xb2\
+D\xd9\xdc\xa2*z<\x9e\x04\xb59\x18\x0c*\xdb\xb1\
+\xbbMr\xac\xae?\xa34\x90\xcaC\xe2\x12\x92\x17)\
+\x80T\xb2\xcd\xaa\xab\x92\x81@\x00\x9b\xcd\xd6\xad\xaa,\
+\xda\x8e\x04\xb7\x1c\xaf\xfa/\x8b\xd1l6\xb3{\xf7n\
+\xd6\xacY\xc3\x95W^\x09\x90\x10\xf3\xaf\xcf\xab\xc5b\
+\xa1\xad\xadM}\xdf\xde\xdeNSS\x13\x85\x85\x85\xc0\
+\x91\x90Y\xb3\xd9\xac\xc2\xb0\xbb\xf3\xc2$\x9b\x7f\xb9\x97\
+\xa8\xc4\x1b7nd\xd8\xb0a\xe4\xe6\xe6*\xa9\x09(\
+mC6\x99\xcf\xe7\xa3\xa5\xa5\x85\xcc\xccL5\x86\xbe\
+\xce\x910\x1eY_b\xc7\x1bc \xf4\xf1m\xd8\xb0\
+Aa\x1cUUUJ \x08\xd3\xb3Z\xad\xaa\x9e\xa2\
+<\x9f\x08\xa6h4JFF\x06\x0b\x17.d\xef\xde\
+\xbd*h\xe8D\xd0)\xcd\x00\xecv;;w\xee\xa4\
+\xb0\xb0\x903\xce8C\x81\x7f\x1d\x1d\x1d\xb8\xddn\x95\
+\xb7.\x8b\x12P\xf1\x00'\x82d\xe1\xda\xed\xf6\x04\xe9\
+\xdf\xd4\xd4\xa4|\xc6\x22\xd1\xbb3C\x04(\xd3\xf1\x8a\
+\xae\x18\x80\x9e{~,\xf9\xf4\xc6\xf1\xc3\x91E\xfc\xdc\
+s\xcf\x91\x9e\x9e\xce\x05\x17\x5c\x00\x1cap\xd1hT\
+m4\xc1)\xc4\xedj\xb7\xdbihh \x1e\x8f3\
+t\xe8P\xb5\xe9dq766\xaa`\xa8\xbenD\
+1\xeb\xa4\x9c\xf8\xcc\x993\x13\xc6%$\x9b\xa9\xa3\xa3\
+\x83\x96\x96\x16rrrT/\x02#\xe9L[\xe2F\
+\x92\x1d\x03\xa8\xba\xffn\xb7[\xd5\x15\xd4\xe7L\x04\x0f\
+t\x02\xa7eee\xa4\xa7\xa7SSSC<\xde\x19\
+\x81\xd8\xd6\xd6\xa6\x9eE\x80H\xd1\x90\xc4%,\xa9\xd2\
+\xe7\x9dw\x9ejG~\xa2\xf0\xaaS\x96\x01\x88\xa4\xda\
+\xbcy3\x0b\x17.d\xf0\xe0\xc1\x04\x02\x01\xa5\xc6\xa5\
+\xa5\xa5%$\xd8\x84B!\x82\xc1\xe0\x09-\xbe\xa0\xdb\
+\xab~\xbf_\xf9\xf6\xdb\xda\xda\x12\xf2\xfc\xbb\x8b\xf8\x93\
+cd\xa1u\xb5p\x85\x04D\xea/\xb0H\x10\xf6\xd6\
+\xd6V^{\xed5\xce?\xff|\xd2\xd2\xd2TX\xaf\
+HP\xdd\xe5\xd5\xda\xda\xaaz\x16\x8a\xfd\x9f\x91\x91\xa1\
+\x16\xb8\x8cO\x98Zjjj\xaf\x82\xb0\x8c\xe3\x92\xf9\
+\xda\xb0a\x03v\xbb\x9d\x91#G&T\x15\x12\xd3/\
+\x1a\x8db\xb5Z\xa9\xa9\xa9!%%\x05\x8f\xc7\xa3\x8e\
+;\xd6w/X\x8d\xe0H\xa2e\xc8o\xdd+PW\
+W\xc7?\xff\xf9O\xdex\xe3\x0db\xb1\x18\xc1`\x10\
+\x9f\xcf\xa7\x18\x88\xc4\x11\x88;:\x10\x08$\x94\x0a\x17\
+f4z\xf4h\xc6\x8d\x1bGyy\xf9\x09+\x1dv\
+\xca2\x00\xbb\xddN]]\x1d\x81@\x80\xc5\x8b\x17+\
+\xdbN\xd0k\x01\xde\xe0\x88\xa7@\x16wOH\xf9\xb1\
+\xba\xd2t;\xb7\xa3\xa3\x83\xd4\xd4T\xd5/N\x16\x8a\
+t\x90\xe9J\x1a\xd9l6\xc2\xe1\xb0\xd2b\x92\xb5\xc9\
+\x92g\x92\x85'\x9b\xbf\xbf\xfc\xff\x00+W\xae\xa4\xa1\
+\xa1A%\xd7\xc8wF 2\x1e\x8f\xab\x90k\xf9\xbf\
+\xa6\xa6\x86\xfc\xfc|\x00\x85MHX0\xa0\xcc\x22\xdd\
+\x067\x86\xd3&C\xe1\xc5|\xdb\xb2e\x0bc\xc7\x8e\
+\x05\x8e$\xf5\xe8\x019.\x97\x8b\x9a\x9a\x1a\xecv;\
+^\xafW\x81~:\xb3\xe8\xc9\x04\xd4\x7f\xcb{mm\
+mU\x09DzF\xa3H\x7f\xd1\x1e^}\xf5UU\
+\xfel\xd3\xa6M\xa4\xa6\xa6R]]\xad\xc2\x8d\xa5:\
+\xb1\xc3\xe1\xc0f\xb3\x11\x08\x04\x12L\x13Y\xaf\x00\xa7\
+\x9f~\xba\xd2\xa8N\x04\x9d\xb2\x0c\xc0j\xb5\xb2c\xc7\
+\x0eF\x8c\x18\xc1\xcc\x993ihhP\x8b\xc0\xeb\xf5\
+&\x96~6\x99T\xe0\xc9\x89\xac\xaf'\xae\xbd\x96\x96\
+\x16\xecv\xbb\xd2\x04D\xfa[,\x96n+\xbf\x88d\
+\x95d\xa5\xae\x00=\x91 }\xcd\xa5\xef\x0d\x89\xa4y\
+\xe5\x95W\x18;v,S\xa7N\x05\x923E\x01\xff\
+D\xc3\xb1\xd9l\xca\x13P\x5c\x5c\x9c0^\x80\xba\xba\
+\xba\x04\xf5\xb9\xafd\xb3\xd9\xd8\xbbw/\x81@\x80i\
+\xd3\xa6)\xedN\x1f\x97\x04\xfb\x84\xc3a233\x13\
+\x98\x83<[w\x80\xaa>f\x1d\xbb\x10F\xe7r\xb9\
+T`\x91\xce\xbc\x84\xb9Cg\xce\xc4\xb5\xd7^\xcb\xdc\
+\xb9s\xf9\xcb_\xfe\xa2jQ\xca9\x92\x1fa2\x99\
+T.\x03\x90\xd4\x84\x9b7o\x1e999\xd4\xd4\xd4\
+\x9c\x10\x97\xe0)\xc9\x00\xc4\x96\xde\xb9s'3g\xce\
+$''G\xb9\x81\xa4k\xae\x11\xe9\x15@\xad\xbf\xbb\
+\xb2\xe8\x8b@6\xa2\x04\xfeH\xc0\x8b,@\x09A6\
+JQ\xf9^\xc04\xb1\xfd\x93%+\xc9\xb1\xa2Z\xf7\
+W\xfe\xb8.A\x0f\x1e<\xc8\x86\x0d\x1b8\xeb\xac\xb3\
+\xd4\xdc\x19\xc7+\x7f\x07\x02\x01\xb5\x98m6\x1b\xf5\xf5\
+\xf58\x1c\x0e\x06\x0d\x1a\xa4>\x17\x89\x16\x08\x04\x14\x06\
+\xa3\xbf\x9f\xae4.\xfd^\xf2\xfd\xe6\xcd\x9b\xc9\xc9\xc9\
+Qn4\xbd\xb0\x87\xc4]\xf8|>\xf2\xf2\xf2\x88\xc7\
+\xe3\x0a{\xd1\xaf\x91\xec\x1e\xc6x\x00\x1d\x0c\xd5\xbd\x17\
+F\xf3E\x98\xb1\x9c\xff\x8f\x7f\xfc\x83\xb2\xb22.\xb9\
+\xe4\x12\xbe\xf1\x8do\xb0g\xcf\x1e\xb6o\xdf\xae4;\
+\xc9\xa3\xd0\xa3C\xa5I\xaaQ\xc3\xea\xe8\xe8 ++\
+\x8b\x09\x13&p\xe8\xd0\xa1\x13\xe2\x12<%\x19\x80,\
+\xb4@ \xc0\x19g\x9c\xa1@\xb2x<\xae\xc0?\x91\
+\xf2\xf2r% \xe7D\xd4\x00\x90\x97\xe6p8hl\
+l\xc4d2)\x17\x90\xd8\xf0\x82\xfav\x15\xcc#\x19\
+j\x8d\x8d\x8dGi0B\xf2,b\x22He\x99\xfe\
+`h\xbaT\x5c\xbbv-\x00g\x9cqF\xc2\xbd\xe5\
+8\xb9\x9f\x1e\xdb\x00(\xbb;??_\xf9\xbb\xc5\xac\
+iii\xa1\xbd\xbd\x9d\x8c\x8c\x8c.\xcd\x9adc\x12\
+\x09.\xe0\xdf\x8e\x1d;\x98<y2\x80\xdaDrL\
+4\x1a\xa5\xb9\xb9\x99\xb4\xb44e\xea\xe9R\xd3X\x14\
+\xb4;SO\x0091\xb5\x1a\x1a\x1a\x12\x8a\xb4\x8a\x1b\
+T\x98\x8f0\xe2\x07\x1ex\x80\xb9s\xe7\xe2\xf5z)\
+,,d\xd6\xacY|\xf0\xc1\x07\x84B!\xfc~\xbf\
+\xd2Btw\xa8^\x19Ig>\x12\x1c4g\xce\x1c\
+\x95Y\xd8\xdftJ2\x00\xab\xd5\xca\xfe\xfd\xfb)(\
+(`\xfa\xf4\xe9\xb4\xb6\xb6\xaa\x97%\x854\x8d/V\
+j\x02\xf47\x19\x81\x9b\x96\x96\x16\xdcn7\xc1`0\
+\xc1\xd4\x90b\x13F\xf3C\xce\x13\xd3\xa1\xbd\xbd]I\
+\x99d6w8\x1c&\x12\x89\xf4\xe8\x1e<\x16\x92\xc8\
+\xb6\xe5\xcb\x973a\xc2\x04\xc6\x8e\x1d\x9b\xb0\xd8e\xbc\
+\xf2Y0\x18L\x08p\x09\x85B\xf8|>\x86\x0e\x1d\
+\x0a\x1c\xf1\xcb\x9b\xcdfU\x84\xa5/\xf5\x0eD\xba\x8a\
+\x9d\xff\xd1G\x1fa\xb1X\x18=z\xb4\x02\xdd$2\
+\xd1\xe9t\xd2\xdc\xdc\xac@V\xbd\xabRw\xf7K\xc6\
+\x88t\xb5?\x16\x8b)-G\x8a\x9f\xca\xa6\xd7\x19\x8a\
+\xd5je\xdd\xbaul\xdc\xb8\x91/}\xe9KD\xa3\
+Q&N\x9c\xc8\x7f\xfc\xc7\x7f\xb0k\xd7.\x0e\x1e<\
+\xa8\x18\xb7l\xf8p8\x8c\xc7\xe3Q\xff\xebLE\xf7\
+\xfd\xcf\x9e=\x9b\xbc\xbc\xbc\x13\x12\x19x\xca1\x00\xd9\
+D\xbbv\xedb\xfa\xf4\xe9\x0c\x1e<X\xa9\xda\xc9:\
+\xe7\x0a\xf8\xa3wo\xed/\xd2\xd5Giz\x09G\xfa\
+\xe5\xc9\x02t8\x1cIm\x7f]\x95\x8e\xc5b\xd4\xd5\
+\xd5\x91\x95\x95\xa5\xb4\x06#H\x16\x89DT\xbc\xbb`\
+\x0c\xfd\xf5\x1c\x22E\xf7\xee\xdd\xcbG\x1f}\xc4\xbcy\
+\x9d\x0d\xa3\x83\xc1`\x02\x93\x132\x9b\xcd\x09m\xcbm\
+6\x1b\x8d\x8d\x8d\xd8\xedv\x15\xfd\xa7?ccc\xa3\
+\x0a\xcb\xee-\x03\x10F#\x1bc\xc7\x8e\x1d\x8c\x193\
+FIw\x91\xa6\xe2\xb5\x08\x85B\xa4\xa5\xa5%E\xe7\
+\xf5k\xea\x92\xbf;\x13$\x1e\x8f\xab\x8aAn\xb7[\
+%s\x89V\xa0\x83\xce\x00\x7f\xfc\xe3\x1f\x994i\x12\
+\xc3\x87\x0fg\xf8\xf0\xe1\xe4\xe4\xe4\xb0`\xc1\x02\xacV\
++\x9f|\xf2\x89\x8a\xd7\x10\xecD\x02\xc3\xacV\xab\x8a\
+\xa1\x80#\x9e \xd9\xec999\x94\x96\x96R[[\
+\xfbo\x06 \x85\x1c\xea\xeb\xeb\x993g\x8ej\xc0(\
+\xea\xbf\xcdf;j\xa1J\xcd7\x09\xde8^J\x16\
+\xa4\x22\xee0\xd9\xbc\xba\xfd.\x89@]-2IT\
+1\x99L\xa4\xa5\xa5%\xc4\x85\xeb\x1e\x04\xbdn]\x7f\
+\x02\x7f:}\xf0\xc1\x07D\xa3Q\x16.\x5c\x98\xf0\xac\
+\xfa3\xcb\x9c\xeaA,V\xabU\xa9\xdf^\xafWi\
+0\x92\x07\x1f\x0a\x85\xc8\xc8\xc8\xe8\xf3\xfc\xcb&\xf4\xf9\
+|TVV2n\xdc8\x00\x05\x82\xca\xa6\x912\xef\
+:('\xe3\xee\xeb<\x09\x93\x12L!\x14\x0a\x91\x9a\
+\x9a\xaa\xde\x8b\xfe\x0edCo\xdb\xb6\x8d\x95+W2\
+\x7f\xfe|233\x191b\x04\xb1X\x8c\xc2\xc2B\
+\x16.\x5c\xc8\xf6\xed\xdb\x15@*\xda\xaa`+\xb2.\
+E;\x90\xfa\x04\xa2\xfd\x00\x94\x94\x94$\x98[\xfdE\
+\xa7$\x03\xa8\xaa\xaa\xc2\xeb\xf52k\xd6,\xb5q\xac\
+Vk\xd2RJ\xc2\xad\xdb\xdb\xdbq8\x1c\xfdb3\
+';_\xcaS\x8b[G/\xf3%\x85>\x8c\xe7\xe9\
+\x9b\xbb\xb1\xb1\x91\xf4\xf4\xf4\xa3\xae\xaf\x83~\x12\xed\xd7\
+\xdfu\xe3t5\x7f\xed\xda\xb5\x9cv\xdai\x9cv\xda\
+i\x09L\xcc\x08V\x06\x02\x01\xe5\xce\x92\xcf\x9a\x9b\x9b\
+U\xa6\xa5l@\x89\x80\x93\xb4\xec\xbez`d\x03|\
+\xf2\xc9'8\x9dN\x15\x5c\xa4\x03\x7f\xb5\xb5\xb5\xaa\xe8\
+\x8b|g\x94\xfa}\x9d\x0f\x19\xbb\x98.\x82\xdf\xc8u\
+u\x17 \xc0\xff\xfe\xef\xff\x92\x96\x96\xc6\xc2\x85\x0b)\
+--%\x1e\x8f+\xcf\xd4e\x97]Fss3\xbb\
+w\xefV\xd7\x90\x0d\x0f(\xb7\xa2nR\x08\xae%\xee\
+\xc0i\xd3\xa6)&\xdb\x9f\xa1\xc1\xa7\x14\x03\x90\xc5\xb8\
+w\xef^\xc6\x8c\x19\xc3\xa8Q\xa3Td\x95T\xd4I\
+\x06\x9c\xc9B\x16\x1b\xb7\xbfITP\x91H\xfa\x18\x04\
+\xe4Iv_=\x5cUlL#xi2\x99T]\
+}\x93\xc9\xa4T\xff\xfef\x00V\xab\x95\xc3\x87\x0f\xf3\
+\xf1\xc7\x1f3\x7f\xfe|\xe0H\xe2\x8fN2&\x09k\
+\xd5%n8\x1c&'''\xe1x\x8b\xc5\xa2\xaa\xdd\
+\x1eK\x12\x96 \xdf\x1f\x7f\xfc1\xa3G\x8fV\xeas\
+4\x1a\xc5\xeb\xf5\xaa\xae;\xe9\xe9\xe9jC\x19s\xfc\
+\xfbj*\xc9\xc6\x96\x9a\x92\xe9\xe9\xe9\xca\xd4\xd1\xcd%\
+\xb3\xd9\x8c\xcb\xe5b\xf3\xe6\xcd<\xf7\xdcs|\xfd\xeb\
+_g\xda\xb4i\xaaz\xb2\xac\x83\xc9\x93'\x93\x9a\x9a\
+\xca\xd6\xad[\x13\xea\x08\xe8Y\x852W\xba&\xa0\xaf\
+\xa5\xd3N;\x8d\x82\x82\x02\x9a\x9b\x9b\xfbT\xb9\xb8'\
+:\xa5\x18\x80\xd5j\xc5\xef\xf7SQQ\xc1\xd4\xa9S\
+\xc9\xc8\xc8 \x14\x0a\xa9\xe0\x8cdj\xb1\x80Sbk\
+u\xe5\x03\xee\xce\x16\xec\x8aD\x0aI\x90\x88\x1ex$\
+\xa0cw\x8b^\xa4Gmm-999G\xd9\xc7\
+\xe2>\xd3]~]\x15\x0e\xe9\xeb\xd8\x93QYY\x19\
+\x81@\x809s\xe6$\xbd\xbe>&\x89h\x13\xe6!\
+\xc1O\xf9\xf9\xf9G\xa9\xdf\xd2\x16Ko\x89\xd6\xdb\xf1\
+J\xf9\xae\xea\xeaj\xa5\xfe\x8bi\x11\x8dF\xa9\xaa\xaa\
+R\xa8\x7fWR\xbf7\xf7\xd3\xd7\x84\x5c\xdf\xe7\xf3%\
+\x0d\xdb\x16lAl\xff[o\xbd\x953\xcf<\x93\x9b\
+n\xbaI\xe5\xa7\x88\xc0\x09\x85Bx\xbd^&O\x9e\
+\xcc\xc1\x83\x07\xd5\x06\x96\xf1\x0b\x0e\xa0ov=PM\
+\xe6;%%\x85\x89\x13'*s\xb7\xbf\xe8\x94c\x00\
+uuuD\x22\x11\xe6\xcd\x9b\xa7T%\xc9\xac\xeb\xca\
+\xcf+\x8b\xd5\x98zk<\xce\xe8\x0f\x16\xean\xc2\x05\
+\xc0\x91\xd0_\x1d\xf9\xee.\xe4W@\xcb\xba\xba:L\
+&\x13\xd9\xd9\xd9\x09\x12W\xa4\xaa\xd4\xd5\xd7\xa5\x7f_\
+\xc6\xde\x1b\x12\x89\xb2~\xfdz\x8a\x8b\x8b9\xed\xb4\xd3\
+\x126\x8d\xd1\xfe\x17?\xb60:)\xb6*j\xb8^\
+\x06K<\x05b\xff\xebc\xed\xedx\xb7n\xddJV\
+V\x16C\x87\x0eU\xa5\xc4].\x17\x95\x95\x95\xd8\xed\
+v\xf2\xf2\xf2\x8e\xca\x97\xe8\xcb&\x91q\x88t\x16@\
+W\xea\xf9\xcb\xa6\x13\xaf\x80\xce\x80\x1fy\xe4\x116o\
+\xde\xcc\x03\x0f<\xa0\x1a\xce\xeaa\xc1\x82\x1b\xcc\x9f?\
+\x9f`0H}}\xbd*\x0d&\x0c@\xf2\x22\xba\xea\
+\x91 kv\xd4\xa8QI\xb5\xb2\xe3\xa1S\x8a\x01\x98\
+L&jkk\xc9\xce\xcef\xcc\x981\xcawj\xb7\
+\xdb\x8f\x02\xfft\x92\xe3\xba;\xe6X\xc9\xe1p\xd0\xda\
+\xdaJ0\x18T\x0c@\xdcR\xdd1\x1cq\xa354\
+4PPP\xa0b\xd8\xe59%\xc8F\x16\xa5\xddn\
+?!i\xcc\xc2\x88:::\xd8\xb6m\x1b\x13'N\
+L@\xbb\xf5\xe3d\x03K\x9fEY\xc4\x1e\x8f\x87\xba\
+\xba:\xbc^oB\xa4\xa5`\x05\xb2\x91\xfa:v\xd9\
+\x08;w\xeeT\x91\x85\xa2\xed\xb5\xb6\xb6\xd2\xd4\xd4D\
+nn\xaebR:\xceb\x94\xe8=1\x1b\xdd\x07/\
+s\x9f\x9a\x9a\x9a\xb01\xf5\xe3$\x82\xef\xfb\xdf\xff>\
+?\xfa\xd1\x8f(((Pm\xddu4_\x9ey\xea\
+\xd4\xa9dffRQQ\xa1T|=\x8bS\xe68\
+\xd9\x98e>G\x8c\x18\xa1\x00\xc2\xfe\xa2S\x86\x01\x88\
+\xb4\xa9\xac\xac\xa4\xb4\xb4\x94\xa2\xa2\x22\x05\xb69\x9d\xce\
+n3\xe1\xe4\x05\x1e+r\xde\xd3\xe2\x91D\x0f\x91\xda\
+\x82\x5cw'\xfd%\x97\xc1j\xb5\x92\x9e\x9e\xaeL\x19\
+y\xd6`0\x98\x90H\xd3_\x1e\x8c\xae\xe8\xd0\xa1C\
+\xd4\xd7\xd7\xab \x1b]\x8d\x17\x92w\xa0G\x06\x8a=\
+\x1c\x0c\x06\xc9\xcb\xcbS\xcf'\xc0`CC\xc31u\
+a\x929joo\xa7\xb5\xb5U\x95\x15\x97\xcds\xf0\
+\xe0ARSS\xf1x<\x09\x0d8\x8e\x85d\xbc\xb2\
+\x11[[[\xb1\xdb\xedj\xcc\xfa\xe67\x99L*\x9e\
+\xe4\xdb\xdf\xfe6\x19\x19\x19\xdcr\xcb-\x0a\xb5\x979\
+\xd2\xc1\xd3p8Lnn.\x05\x05\x05TVV&\
+\x5cS\xb4\xa5d\xde\x16#\x0d\x1d:\x94\x94\x94\x94\x84\
+v\xe3\xc7K\xa7\x0c\x03\x10;\xbb\xb6\xb6\x96)S\xa6\
+\x90\x96\x96vTxoW\x9b[\xe2\xb4\xfb\xc3N6\
+\x8e)\x18\x0c\xe2\xf7\xfb\xf1z\xbdJ\x02\x09\xf2\xdf\xd5\
+\x86\x15 \xab\xb9\xb9\x99\xbc\xbc\xbc\xa3:\x05K\xd5\x1c\
+\xb1EOd>\xb8\xcc\xc7\xce\x9d;1\x99LL\x98\
+0\x018\xda}&\x1b\xba\xbd\xbd]1\x00\xc19\xa2\
+\xd1\xce.@R\xfdW\x97^\xcd\xcd\xcd\xb8\x5c\xae\xa3\
+\xf2\xff{c\x8f\x9b\xcdf>\xf9\xe4\x13L&\x93\xea\
+)\xe8v\xbbU\x14\xe8\xe0\xc1\x83\x95\x8a\xdd\xd33\xf6\
+\xf4\xde\xc5s \x81V\xba\xc6\x22\x9a\x81hA6\x9b\
+\x8dU\xabV\xf1\xd8c\x8fq\xff\xfd\xf7+\xbb_\x84\
+\x90\x8e\x97\x00\xaa\xf9\xcb\xd8\xb1cijjJ\xa8]\
+(u\x02u05Y\xbcH$\x12!--\x8da\
+\xc3\x86\xa9n\xcb\xfdA\xa7\x0c\x03\x900\xd9p8\xcc\
+\xb4i\xd3\x80#\xcd\x1f\x05)6N\x8aD\x8a\x85B\
+!%\x91\x8d\x94lq\xf4v\xc1\xd8l6%\xa9\xf5\
+\xf0\xe3\x9e\xa4\xbf\xc3\xe1\xa0\xb6\xb6\x16\x87\xc3\x91\x80^\
+\xcb\x02\x90\x1arr\x8f\xfe\x8e\xf8\x93{\xc1\x11 r\
+\xdb\xb6m\x0c\x1b6\x8c\xa1C\x87&uY\x0a\xea\x1d\
+\x08\x04\xd4\x02\x96\x0d)\xb5\xed$\x08\x07\x8e\xd4\xce\xd7\
+]\x83\xc9\xee\x9f\x0c\xa0\xd3U\xe7\xb2\xb22\x15\x84#\
+T^^Nnn\xae\xca\xae\xeb/\xb7\x98<\xb7t\
+\x8d\xd2\xab,\xc9\xb8\xa4\x9f\xc4u\xd7]\xc7M7\xdd\
+\xc4\x92%KT\x96\xa0n~\x08\xb3\x90g\x04\x18=\
+z4\xed\xed\xed\xcaT\x90k\xea\x0c\xa6+\x8cG\xd4\
+\xfe\xd2\xd2R\xc5l\xfa\x83N\x19\x06\x00\xd0\xd4\xd4\xa4\
+\xa2\xa2\xa0s\x83w\xe7\xdb\x97\x97\x18\x0a\x85\xba\xcc\xa7\
+Nf\x1f\xf6\xc5f\xac\xaf\xafW\xe8\xbc\xc4\x84wU\
+\xedVw/\xd5\xd7\xd73h\xd0\xa0\xa3\xc6\xad\x87\x10\
+w\x07n\xf6\x07\x093\x8aD\x22\xbc\xf7\xde{J\xfa\
+'\xab\x96+\xcf\xab'8I\xc1\x13\xe9o/\xee2\
+\xd94\xa2\x1d\x89\x7f>\x19\x19\x01A\xf9[b\xeb+\
+**\x18<x0p$\x04<\x18\x0cRPP\xa0\
+\xdek\x7fxAtw\xb1`E:&\xa0G\x92^\
+y\xe5\x95D\xa3Q\xee\xbb\xef>\x80\x04\x9f\xbdh\x12\
+\xc6\xf5\x13\x8f\xc7),,L(Q\x06\xa8s\xba\xc3\
+\xa7\xf4g\x1b:th\x8f5\x22\xfaB\xa7\x04\x03\x90\
+\xc5VWW\xc7\xb0a\xc3\x18>|\xb8\x0aB\xe9\xce\
+\x16\x12\xce)\xe5\xb7\xfb\xd3\x86\x16\xf7Lkk\xab\x02\
+\xff\xe2\xf1\xce\xb0\xd0\xee\x18\x92\xddn\xa7\xb2\xb2\x12\xa7\
+\xd3\x99\x10]&f\x81\xa8\xd7\x82#\x1co\x95\x9f\xae\
+H\xbf\xe6\xda\xb5k\xd9\xb7o\x1f\xb3f\xcdR\xe3\xd4\
+\x8f\x93E\xdd\xde\xde\x9eP\xda\xccd2\x91\x92\x92B\
+mm\xad*n\xa1k\x00uuu\xd8l\xb6\x04-\
+\xa7\xa71\xc9\xa6\xb3\xdb\xed\xd4\xd7\xd7\xe3\xf3\xf98\xed\
+\xb4\xd3\x80N\xc6\xb4{\xf7nJJJ\x12Zl\xf7\
+\xc7{\x95g4\xba*M&\x93\x8a\xc1\xb0X,<\
+\xf8\xe0\x83\xbc\xf8\xe2\x8b<\xfb\xec\xb3\xb8\xddnU\xdb\
+_\xceM&L\xa0\xd3\x0c\xc8\xcc\xcc$%%\x85\xa6\
+\xa6\xa6\x844ecQ\xd8\xee\xa8\xb4\xb4\x94\xf4\xf4\xf4\
+~\xd3\x02N\x19\x06\xd0\xde\xde\x8e\xcf\xe7c\xd8\xb0a\
+ddd\x10\x0e\x87\x152\xde\x9dt\x91\xc4\x99\xfe\x0c\
+\x02\x12\x80JPz\xa7\xd3\xa9B\x8d\xbb\xb3\xfdm6\
+\x1bmmm477STT\x94\xa0b\x0a\xb8&\
+\x8b\xa2'/B\x7f\x90,\xa0\x95+Wb\xb3\xd9\x94\
+f\x05GKfQ\xb7E\xe5\x969\x88\xc5b\xb4\xb6\
+\xb6\xaa\x04 }\x8ekjj\x14\x86\x91\x8c\x01$s\
+\xdb\x89i\x01\x9d\xb1\xff\x80\xc2\x16\xb6l\xd9B4\x1a\
+\xa5\xb0\xb0PmJc\xac\x7fw\xd4\x95\x96 \xea\xba\
+ld\x89\xca\x93\xf9\x97\x1a\x8e\x9f|\xf2\x09\xdf\xfc\xe6\
+7\xf9\xcew\xbe\xc3\x82\x05\x0bT\x10Z2\xb7\xa6n\
+\xe2\xc88=\x1e\x0f\xe9\xe9\xe9\x09L\xc3\xe8}H\xe6\
+&\x15\xe6\x03\x90\x97\x97GFFF\xbf\x05\x04\x9d\x12\
+\x0c@\xf2\xe4\x83\xc1\xa0\x0a\x06\x910\xd0\xae\xa4-\x1c\
+\xc9W\xef) \xa7\xaf$/G\x1a;\x88J&\xc1\
+.\xc9\xd4gYP\x87\x0f\x1f&55UI\x7fY\
+\xbc\xe2Z\x93\x97-\xc9C'R\xfd\x17\xc6\xb5r\xe5\
+J\xa6L\x99\x82\xd7\xebMZ-I\xfe\x17\x86'H\
+\xb7\xdb\xed&\x14\x0a\xd1\xdc\xdc\xac6)\x90\xf0L\x12\
+\x19\xd8\x9b\xe7\xd0\x810\x80\xfd\xfb\xf7\x93\x9f\x9f\xaf\xbc\
+\x01eee\x8aI\xe9\x011}\xf5\xf9\x1b\xcd\x0d\xe3\
+\xf7\xc2\xe0\xe4\xef\xd4\xd4T\xda\xdb\xdb\x99={6E\
+EE\xfc\xf7\x7f\xff7\xd1h4!c\xb3'&$\
+\x01?\xd2\x1fB\xee%\xe372C\xe3\xff\x22\x04\x01\
+\x86\x0d\x1b\xf6\xaf\xa5\x01H\xf0I(\x14R\x0b@w\
+\xdb@r\xf7\x89\xd8\xa1@\xbf\xf6\x02\x144\xbc\xb1\xb1\
+Q\xd5\x18\xec.F_6\x7f[[\x1b>\x9f\x8fA\
+\x83\x06%\xf4\x96\x93\xb8zY\xfc\x12\xd5x\x22\xdd~\
+B\x1f}\xf4\x11\xdb\xb6mS\xea\x7f8\x1c>\xea\x19\
+\xc4g-y\x17\xf2L\xa9\xa9\xa9\xaa\xc7\x9f\xb4\xd7\x16\
+\x06\x16\x0e\x87iii!77\xb7W\xe3\xd0\xd5a\
+\xc9\xe98x\xf0\xa0\xb2\xff\xdf}\xf7]RSS\x19\
+6l\x98*\xa1\xa5\x03m=][~\xeb\x02CO\
+\xb6\xd17\xa3\xa8\xf2\xe1pX\xd9\xfd\xe7\x9e{.\x8d\
+\x8d\x8d\xbc\xf9\xe6\x9b*\x0eA\xa8;\xcdBH\x90\xfe\
+\xb4\xb44\x15F\xad\xd71\xd0\x8b\x8a$\xc34$h\
+\x08PB\xb0?\xd6\xc7)\xc3\x00Z[[\xc9\xce\xce\
+V\x9df$\xa3J\x16MW/@\x22\x05\xfb\xc3\x96\
+\x96\xf3%R\xac\xbd\xbd]\xb5\xf5\x12\x95=\xd9K\x11\
+u\xf9\xe0\xc1\x83\xb8\xddn\xe5\xbb\x96\xb0^\x89g\x90\
+\xe3\x04\xaf\x90\xc5z\x22\xb4\x00Yl+W\xae\xc4d\
+21}\xfat\xf5y2\xa9(\x0cX\xb7\xff\xa5\xd6\
+\x9d\xdb\xedV\x00 \x1c\x9d\x00\xd4\x15\xbam$y\x97\
+\x92\xf4\xd2\xd2\xd2\xa2\x80I\xa9\xfed<\xbe7\x80\xad\
+\xf1\x1cy\x06c\x02\x8eNf\xb3\x19\x8f\xc7\x03\xc0\xcd\
+7\xdf\xcc\xaaU\xabx\xf6\xd9gU\xef\x09a\xd6\xfa\
+\xa6\x95\xdf\xc9\xde\x97\xdcS*E\x09\x03\x80D\xafG\
+W\xebX\x1f\xe3\xa8Q\xa3p8\x1c\xcad<\x1e\x1a\
+\xf0\x0c@6Amm-C\x86\x0ca\xd8\xb0a*\
+\x1d\xd3\x98Ue\xb4\xc1\xa2\xd1\xce\xae\xbc\x12\x03\xd0\x1f\
+$/\xad\xb6\xb6VU\xc1\x95\xb8\xf0\xae^\x9e\xcb\xe5\
+\xc2\xe7\xf3\xd1\xd0\xd0\xc0\xd0\xa1CU\x0a\xa9\x14\x10\x11\
+\x06&\xe1\xc3r\xde\x89\x22\x19o(\x14\xe2\xcd7\xdf\
+d\xcc\x981*\xd0&\xd9\xbd\xf5\xc0$\x99s1S\
+\x9a\x9a\x9a\x94\xdbS\xc03\xb3\xd9L}}=V\xab\
+\x15\xaf\xd7\xdb\xeb\xc85\xfd\xfd\x95\x97\x97\x03\x9d\xa8\xf7\
+\xdf\xff\xfew222(((PQ\x9d}%\xdd\
+\xd6\xb6\xdb\xed\x0a|\xd5\xeb\xfb\xeb\xc7\x89\x16p\xf7\xdd\
+w\xf3\xd0C\x0fq\xf7\xddws\xe5\x95W\xaa\x92m\
+\xbdej\xc6c$\xcaRo\xf6\x9a\xcc\xf7o\xbc\x86\
+.\xe4JKK\x19<x\xb0*\xc5~<4\xe0\x19\
+\x00t.H\x9f\xcfGNN\x8e\xaa\xf6\xa2\x03(\xb2\
+\xe8\xf4I\x94I\x93b\xa0\xfdE\xa2\x1a\xfa|>U\
+{P\xba\xbc$\xc3\x18\xc4\x8e<t\xe8\x10yyy\
+\xaa\xbb\xae\xf4\xd2\x13\x1c@\xdcL\xc6d\x9f\x9e\x16\xc7\
+\xf1\xd0\xbau\xeb(++c\xf6\xec\xd9\xb8\xdd\xee\xa4\
+\xf6?t\xce\xbf\x9e\x93\xa0g\xb0\xf9\xfd~\xe5\xe7\xd7\
+\xc7\xd9\xda\xda\xaa\x9e\xa7\xbb\xfc\x0b\x9dt\x9bv\xdf\xbe\
+}\x0c\x1a4\x88h4JYY\x99\x92\xfe\xdde(\
+v\xf7#\xe4t:\xa9\xad\xad\xa5\xa6\xa6F\xb5'\xd7\
+\xa5\xb8lL\xbb\xdd\xce\xf3\xcf?\xcf\x0f\x7f\xf8C~\
+\xf4\xa3\x1fq\xfb\xed\xb7\xab*>r^w\xa4\xfb\xf6\
+uJMMU*\xbf\x9eU\xd8\x1d\x8e \xdf\x89K\
+\xdbl63b\xc4\x08\x1a\x1a\x1a\x8e\xbbN\xe0\x80g\
+\x00\x22Y\xc2\xe1pB\xa9)]\x8dK\xa6\x0a\xcay\
+\x1d\x1d\x1d\xfd\xe6\x01\x90{\xf8\xfd~U\xce\x09\xe8\x92\
+\xc1\x88\x7f\xb7\xb1\xb1\x91\xa6\xa6&\x86\x0c\x19\xa2\xc2\x92\
+%\xa2N4\x01]\xf5Ov\x9d\xe3\xe5\xf4\xfa\xb5D\
+\xcbX\xb6l\x19\x91H\x84\x89\x13'\x02t\xc9\xc0\x84\
+\x91\xca\xf9\xb1XL]C\x18\xb3|'\x1aBkk\
+\xab\xaao\xd0\x97\xb1\x09c)//\xa7\xb4\xb4\x94\x8d\
+\x1b7\x92\x9a\x9aJII\x89r\xfd\xeac\xebj^\
+t|@\x004\xb7\xdb\xcd\x9e={x\xff\xfd\xf7\xc9\
+\xcb\xcb\xc3f\xb3%`1\xa2\x96\xdb\xedvV\xacX\
+\xc1\x15W\x5c\xc1u\xd7]\xc7\xaf\x7f\xfdk\x15\xc0#\
+\xa6ZO6\xbf\x90\xce\xc0EX\xe8\xad\xd2dcK\
+\xbb5c%%!=\xa8\x0d 77Wa!\xc7\
+C\x03\x9e\x01\xc0\x11\xbbj\xd0\xa0A\xea\x7fyi\xc9\
+\xd4\x7f@\x85u\xf66\x8e>\x99\xb40\x8eA6\xab\
+\x14z\x10I \xd7\xd7\xcf\x17\xeen\xb5Z\xa9\xac\xac\
+$++K\x15\x061\x99L\xb4\xb6\xb6&\xd8~R\
+3\xd0\xa8\xc5\xf4\x16\xe4\xea\x8d-\xac/\xdc5k\xd6\
+\xb0j\xd5*F\x8c\x18\xc1\xa8Q\xa3\x80\xc4\xf8\x7f\xf9\
+\x91\xaa7\xba\xc7\xc2d\xea\xf4\xff\x87\xc3a\xd5\xe8S\
+?O\x1ac\xca\xe7\xbd\x19\xbb\xdc_\xaa\xe6\xfa\xfd~\
+222\xf8\xf8\xe3\x8fU~Bw\xde\x9e\xae<\x17\
+\x22<RSS)//\xe7\xaf\x7f\xfd+\x13'N\
+L\x08Z\x92Mh6\x9bq\xbb\xdd\xac^\xbd\x9a\xb3\
+\xcf>\x9b\x0b.\xb8\x80\xc7\x1f\x7f\x5c14\xbd\xc6\xa0\
+q,\xc9<?\xc9\x18\xb7\xb8\x16E\xd3\x90\xf9\xd25\
+\xdad$\xebOL\x97\x92\x92\x12\xbc^o\xafB\xa1\
+\xbb\xa3S\x82\x01\xc8d\x89D\xd1_\xb8n\x0e\x18s\
+\xe9\xc5\xdd\xd2\x1f.@\xb9\xa7\xc4#\x88\xcbO8\xb7\
+\xd1%\xd5\xd1\xd1\xa1\x8a}\x88\x9f\x5c\xa4\xbf\xdf\xefW\
+\xaa\x9c\xa8\xfe\xddI\xff\xfe\x22\x91\xfe\xc1`\x90\xe7\x9f\
+\x7f\x9e\xe6\xe6fJJJ\x94g%\xd9\xc2\xee\xca\xfe\
+\xf7x<*\xa2-##C1\x17\xa9\xd9`2\x99\
+z]\x02\xccx\xcf\x03\x07\x0e\xa8\xae\xcf\x81@\x80\xa9\
+S\xa7&\xe0>\xc9\xce7\x82p\xbaY\xe8\xf5z\xa9\
+\xa8\xa8\xe0\x8e;\xee`\xd1\xa2E\x14\x17\x17'd\xee\
+\x89\x04NII\xe1\xf5\xd7_g\xe1\xc2\x85,Y\xb2\
+\x84e\xcb\x96\x01$\xf8\xdc\x8f\xc7$\x13\x81 e\xc0\
+\xf5\xfb\x1b\x99E2\x86\x22s\x0b\x9da\xc5)))\
+*\x0c\xf9Xi\xc03\x00\x89\xb8s:\x9dddd\
+\x00\x89\xee\x1cc\xda\xaa~\x9e\xe4Z\xf7&\x0d8\x99\
+\xeb\xc5x=Q\xc1\xc2\xe1\xb0r\xd5%\x0b1\x96k\
+X,\x16\xf6\xee\xddKFF\x86\x0a\x0f\x16\xe9&\xb6\
+\xbe,<\xe3\xbd\x85\xa1\xf5v\x03\xf5\xc6[ \x0bl\
+\xf9\xf2\xe5\xec\xd9\xb3\x07\x8f\xc7\xc3\x84\x09\x13\x12j\xf8\
+%\xbb\x9e\x9e\x96,f\x8d\xcb\xe5\xa2\xbe\xbe\x1e\x8b\xc5\
+\xa2\xce\x97g\x96j8zw\xa6\xee\xc6.$\xef\xb1\
+\xba\xbaZ%\x02\x8d\x1c9R\xd5\x5c\x90\xe3\x8d\x12_\
+\xc6j\xdc\x9c\xd1h\x94\x94\x94\x14\xea\xeb\xeb\xf9\xe1\x0f\
+\x7f\xc8\xe2\xc5\x8b\x995k\x96\xc23tI\xect:\
+y\xee\xb9\xe7\xb8\xe0\x82\x0b\xb8\xf4\xd2Ky\xed\xb5\xd7\
+\xe8\xe8\xe8PA;\xf2\x1c\xc7\xdb\x80\xd5\xc8\x9cD\xed\
+\xef\xca\x1b\xa1\x93\x8c#\x1c\x0e\x93\x9d\x9d\x8d\xd7\xebU\
+`\xeb\xb1\xd2\x80g\x00p$\x05\xd4X\xd5W\x07S\
+\x92\xa9d\x81@\xa0\xdb\xd0\xdc\xbe\x90\xd8\x88\x81@@\
+\xa1\xe8\xba\x17@\xee)\x94\x92\x92Bcc#--\
+-\x09\x096\xc2\xc1\xe5\xf8\x94\x94\x94\xa4@\x990\x00\
+\xdd]t<$\x89,---\xbc\xf1\xc6\x1bJj\
+\xcf\x981\x03 )R\xaf\x03O\xb28%N\x01P\
+j\xb1dc\xca\xe2\x15\x0dI\xb0\x97\xde\x9a'B>\
+\x9f\x0f\x9f\xcfGGG\x87J\xfc\x12\x80\xae7\xaa7\
+\x1c\xd9\xfc>\x9f\x8f\xff\xf8\x8f\xff`\xc1\x82\x05\x5c~\
+\xf9\xe5\x0aD\x94\xbcz1\x11\x1fy\xe4\x11\xae\xbc\xf2\
+J\xbe\xf1\x8do\xf0\xc2\x0b/\x00$\xd8\xd8z\xc9\xee\
+\xde\x90\x91\x99\xcbg\xc2\xd4\xa5\x0a\x90\xac+]\x8b\xd4\
+\x05\x9c\xfc\x16\xe6&\xc01@aa\xa1j9v\xac\
+tJ0\x00\x93\xc9\xa4z\xea\xc1\x11)\xa0\x17\x9e\xd0\
+I\x18BSS\xd3Q\xa5\xa2\xfaB\xc9TK\xbf\xdf\
+\x9f\xb0q\xe5\xbbd$H\xb6t)\x96L:\xbd`\
+\xa8|\xd7\xd5\xfd\xe5\xf9\xfb\x83\x81Ag\xd7\xda\xb6\xb6\
+6\xacV+\x99\x99\x99j\x83%#\xd1\xa2\xf4\xc0\x9b\
+x<\xae\x02u$\xd1\xc7h~577\x93\x9e\x9e\
+\xdek\x0cC\xc6'\xf3YUU\xc5\xe1\xc3\x879\xed\
+\xb4\xd3T\xb5\x9f\xaep\x0ea@\x02\xa2J\xea\xb1t\
+U\xfe\xd6\xb7\xbe\xc5\xec\xd9\xb3\xb9\xf9\xe6\x9b\x01Tv\
+\xa5\xc9d\xc2\xe3\xf1\xe0t:\xf9\xdf\xff\xfd_\xbe\xfe\
+\xf5\xaf\xf3\x93\x9f\xfc\x84\xff\xfb\xbf\xffSY\x8c:\xc0\
+|<d\xf4\xae\xc8\xc6\x97\xf8\x14\xbf\xdf\x9f\xb0\xb6\xf5\
+\xf7\x0e\xa8\xe7\x97\xc8M\x9f\xcf\x07t2\x80\x96\x96\x96\
+\xcf\xb7\x09\x00\xa8F\x9bz\xd5_\x91N\x22!\xf5\x17\
+%\x91\x83\x82Vw\xe5\xde\xea-\x09\xb3\x91v\xd3\xa2\
+\xb6\x1b\x03\x7f\xe4\x1eN\xa7\x93\xfa\xfaz\xda\xda\xda\x94\
+\xf4\xd7\xd3@e\xac\xdd\xf9\xfc\xc5\xf4\x115\xf1x\xc6\
+.\xd2\xbf\xa9\xa9\x89W_}\x95I\x93&\xb1\x7f\xff\
+~\xc6\x8d\x1bGfff\x82\xfao\x1c\x83\xe4\xc7\xeb\
+\xae*\xd1\xc4\xa4\x18\xa7<\x830*\xbf\xdf\x7fL\xae\
+WI\xaf\xde\xb7o\x1f\xd1hT5\x00\xd5\x0bl\xe8\
+$R\xd3\xef\xf7\xd3\xd4\xd4\xc4\xe1\xc3\x87\xd9\xb3g\x8f\
+*\xe5\xbdx\xf1b\x00\x96.]Jss3UU\
+U\xf8|>\xe5\x1a\xb6X,\xfc\xe7\x7f\xfe'\xdf\xfb\
+\xde\xf7x\xe8\xa1\x87\xb8\xe3\x8e;\x94\xc6\x03G\x8au\
+\xf4\xc5\xbc\xea\x8ad~t,C\x5c\xca\x92\xd7b\x04\
+a\xf5se\x1dttt\xa8(D\xf1\x8a\x89\x86v\
+,\xd4\xff\xdd\x06\xfb\x99,\x16\x8b\xdat\xd9\xd9\xd9\xea\
+s\x01\xe4\x80\x04\x1bM\x80\xa8\xe6\xe6fU\xaeJg\
+\x0e}\x91\xa4r\x8e\xc5\xd2\xd9\x1b.\x10\x08\x10\x08\x04\
+\xc8\xc8\xc8P\x9a\x85\xb1\xc8\x85l\x92\x03\x07\x0e\x90\x9f\
+\x9f\x8f\xc3\xe1Pi\xb1\xf2\x9d\xb4\xc8\x96\xd8\x81d/\
+\xcfd2\xa9B\x12\xfa\xf3\xf5\x95\xf4g\x7f\xec\xb1\xc7\
+\xc8\xce\xce\xa6\xb8\xb8X%\xb6\xc0\xd1\xee?]\xe3\x10\
+F\xaa\xd7\xca\x17\xdc\xa3\xb5\xb5UEf\x8a\x8bK\xba\
+!gff\xf6j\xe3\x08\xc9<\xd6\xd4\xd4\xb0g\xcf\
+\x1e\xc6\x8c\x19\xc3\xb0a\xc3\xd4\xb5\x8d\xe3\x93\xe3#\x91\
+\x08\x0d\x0d\x0d\xc4b\x9d\xa5\xdf\xd3\xd2\xd2\xa8\xab\xabc\
+\xf1\xe2\xc5\x14\x16\x16\xf2\xdf\xff\xfd\xdf\xec\xda\xb5\x8b\xda\
+\xdaZ\x82\xc1 \xe1p\x98\xfc\xfc|:::\xb8\xfd\
+\xf6\xdb\xf9\xe0\x83\x0f\xb8\xf1\xc6\x1b\xb9\xea\xaa\xabhh\
+h\xc0\xe9t*\xc6\x1c\x8dFikkK\x88\xf9\xef\
+\xad)c<N\x1f\xaf\xdb\xedV\xcd_\xe5\x1dK\xeb\
+3\xb9\x86\xee\xc5\xd0\xdf\x87\xd4b\x04\x183f\x8c\xaa\
+\xc7\xd8\xdb\x8cK#\x0dx\x06`6\x9biii!\
+55\x95\xac\xac,\xe0\xc8\x04\x09\xe7\xd33\xc8\xa0s\
+\xf2%mU\xdcU\xba$\xed\xab:-`cCC\
+\x83jp\x91L*\x8b\xa4\xad\xab\xab\xa3\xa5\xa5\x85q\
+\xe3\xc6)\xdc@\x5c\x92R3@o`j$q\x0d\
+\xb5\xb7\xb7\x93\x9e\x9e~\x5c\xea\xbf0\xc1\xf2\xf2r\x96\
+-[\xc6-\xb7\xdc\xc2\xe6\xcd\x9bq\xb9\x5c\x09\x9d\x7f\
+\x8d\xcf+$\xd2P\xb4 Q\xb3\x05\x18\xf4z\xbd\xea\
+X\xa9\xa4\x1b\x0e\x87\x13J\x9c\xf7\x86d\xc1\x1f<x\
+\x90\xfa\xfazJKK\x95\x1a\xafk\x17\xfa\xf8\xa4\x9d\
+\x96\xe4\xd9\x9bL\x9d\xd9\x9f\x97\x5cr\x09\xa5\xa5\xa5\xbc\
+\xfa\xea\xab@\xa7\xcf\xbc\xa4\xa4De\x8fn\xd8\xb0\x81\
+y\xf3\xe6\x11\x8f\xc7\xb9\xeb\xae\xbbp\xbb\xdd,]\xba\
+\x94\x9c\x9c\x1c\xc6\x8c\x19CAA\x01\x19\x19\x19x\xbd\
+^\xd5\x88T\x04\x8e\xb1*o_2\x11e>%9\
+M\x17n\xc2\xd4\x8c\x82*\x1e\x8f\xabs\x00e\xf3\xcf\
+\x9e=\x9b\xc2\xc2B\xd2\xd2\xd2\xf0\xf9|I\x8b\xae\xf4\
+\x86\x064\x03\x90E'~\x5c\x09\xe9\x15\x15\xc9X\xeb\
+OW\x9d\x9a\x9a\x9aTv\x9b\x04\xdcH\xf1\x90\xbe\xdc\
+_$v4\x1a\xa5\xae\xae\x0e@y#\x92I&\x93\
+\xc9\xc4\xbe}\xfb\x94\xf4oiiI(\xa1\x1d\x8f\xc7\
+\xf1x<J\x9dKF\x92\xfd(\xde\x86\xe3I\xfa\xd0\
+\x9bV\x16\x14\x14PZZ\xca\xff\xfd\xdf\xffQZZ\
+JIII\xc23\xe8s(\xf3+\xa1\xb72~q\
+\x7fJ6\x9a\xb1\xd8\x87TGv\xb9\x5c}*^)\
+\x1b\xe9\xe0\xc1\x83X,\x16U\x04TW\xc3\xf5\xcd!\
+c\x928\x0c\xe8\xec\x1c|\xf9\xe5\x973j\xd4(^\
+~\xf9e\x00%\x08$f\xe3\x9dw\xdea\xd1\xa2E\
+\x9cv\xdai\xbc\xfb\xee\xbbdee\xe1\xf3\xf9\x987\
+o\x1e{\xf6\xec\xe1\xc0\x81\x03\xd4\xd5\xd5\x91\x9a\x9aJ\
+NN\x0e^\xaf\x17\x8f\xc7\x83\xdb\xed\xa6\xb8\xb8\x98\xcc\
+\xccLU\xb7A\xdegW1\x08\xba\xd6 \xcf\xd7\xd2\
+\xd2\xa2\xd2\xd3\xc5\xa44\xc6\xb7\xe8s\x22IU\x22\xfc\
+\x1a\x1a\x1ahiiQ\xef6+++\xa1FC_\
+i\xc0c\x00\x82\xfe\xa6\xa7\xa7+;I\x18\x83\x1e\x19\
+\xa6O:t\xaa\xa7\xd2zY\x1a0\x1c\x8b$\x95{\
+\x09\xa8\xe8r\xb9HMMUc\x93\xdf\x22\xfd\xeb\xeb\
+\xebijj\xa2\xa4\xa4D\x05\x90\x88\x0a-%\xb4\xba\
+\xca\x8f\x97k\xe9\xbe\xf4\xe3\xc9b\x14mc\xe3\xc6\x8d\
+\xac^\xbd\x9a\xf3\xcf?\x9f\xc6\xc6F***\x984\
+i\x92\xda\xe4\xc9\xc6 f\x87\x9e\xff\x0fG\x1au\xc8\
+\xa2\x93\x18\x0b\x99\xf7\xfa\xfaz\xd2\xd3\xd3\xfb\x94|%\
+\xcf\x0c\x9d\x0c ++K\xa9\xff\xc6\xd8\x0e8\x02\xfa\
+J3\x18\x9f\xcf\xc7\x1f\xfe\xf0\x07\xa6N\x9dJqq\
+1\xaf\xbd\xf6\x1af\xb3\x99\xe6\xe6f\xe2\xf1\xb8j\xce\
+\xf2\xe3\x1f\xff\x98E\x8b\x16q\xf5\xd5W\xb3}\xfbv\
+\xb2\xb2\xb2hii\xc1\xe5r1y\xf2d.\xbd\xf4\
+R\xbe\xfa\xd5\xaf\xb2p\xe1B222T\xf6\xa6\xac\
+\x81u\xeb\xd6\xb1l\xd92\xd5\xe5\xd8\xb8\xe9z#\x5c\
+\xa4y\xac\x84\x82777+l\xcbh\xfbKk2\
+\xdd\xd5\xdd\xd6\xd6FEE\x85:&33Sii\
+\xc7B\x03\x9a\x01\xc8\xc2HIIQ\x15ge\xb1\xc5\
+b1\xe5\xc6\xd1\x17\x9ad\xea\x89z*\xea\x7fO\xf6\
+[W>\xf7x\xfcH'\xd8\x96\x96\x16\xd2\xd2\xd2\x12\
+l\x7f\xe3\xb5w\xef\xdeMQQ\x91\xb2\x87\xf5X\x7f\
+\x8b\xc5\xd2c\xb2\x8fH\x0dY(\xbd\xf1\x00\xc8\x18\x92\
+\xf9\xc0\xa1\xb3m\xd5\xd8\xb1c\x19;v,\xfb\xf7\xef\
+\xa7\xb6\xb6Ve\xff\xe9j\xba\xceD\xc5\x03 \x0cB\
+\x9eW\xa4\xad\xa4/K\x0a\xb4\xee\x02\x94\x05\xdd\x17\x86\
++\xe6Qee%C\x87\x0e=*\x8dXw\x87\xe9\
+\x95\xa0\xdf|\xf3Mn\xbd\xf5V\x96.]\xcae\x97\
+]\xc6\x8a\x15+T\x10XZZ\x1a\x1e\x8f\x87\x0f?\
+\xfc\x90\xd2\xd2R\xee\xba\xeb.\xfe\xf8\xc7?\xf2\xd4S\
+O\xd1\xd1\xd1\xa1\xe2\x15Z[[innVM<\
+f\xcd\x9a\xc5\xa5\x97^\xca\xc2\x85\x0bIMM\xa5\xa6\
+\xa6\x86X,\xc6\xa4I\x93HKK\xe3\xb9\xe7\x9ec\
+\xf7\xee\xdd\xca\x03b\x1c\xa7\xfe[\xc7\x85\xa0S0\x89\
+\xd9\xd4\xd2\xd2B]]]\x02\xb8\xad\x9b;f\xb39\
+\xa1\x9f t\xba&\xf7\xed\xdb\xa7\xdeGVVV\x97\
+ noh@3\x00\xb1\x85}>\x1fC\x86\x0c\x01\
+\x8e\x80\x22R9\xd7\x98\x83oL\xd5\xd5\x9b:tG\
+\xe2Q0\xde_\xce\xf7\xfb\xfd\xf8\xfd\xfe\x04F$\xc7\
+\x082.\xeaYii\xa9Bk%\xdcS\x02c\xba\
+\x03\xfed\xfc~\xbf\x9f@ \xa0\x9al\x1c\xcb\xcb\x15\
+i\xf2\xfc\xf3\xcfSVV\xc6E\x17]\x04t2(\
+\x9b\xcd\xc6\xa4I\x93\x80\xeemXiF*\x0bR\xaf\
+P\xac\xa7\xfe\xcawR/\xb0+\x13\xa9'\xaa\xaf\xaf\
+\xa7\xbe\xbe\x9e\x92\x92\x92\xa3\xf27dC\x08x\xb6i\
+\xd3&\xbe\xf5\xado\xf1\xd0C\x0f\xf1\xd6[oq\xdb\
+m\xb7\xf1\xd7\xbf\xfe\x15@y\x7f\x22\x91\x08\xb7\xdf~\
+;S\xa7Ne\xf0\xe0\xc1l\xdb\xb6\x8d\x9bo\xbe\x19\
+\xbf\xdf\xafL\x18q\xc7\xc9\x9a\x12\x8fB(\x14b\xe8\
+\xd0\xa1,^\xbc\x98\x193f\x10\x08\x04\xd8\xb9s'\
+\xf9\xf9\xf9\x8c\x193\x86\xb7\xdez\x8bO>\xf9\x84\xf4\
+\xf4t%<\x8cq\xff\xba\xfa/\xf9\x1f\x02\xd8A\xa7\
+\xb6#&\x93q\xbe\xe4\xfd\x19;\x02\xd7\xd6\xd6\xd2\xd6\
+\xd6\xa6\xa4\xbe0\x93c\xc5\x89\x064\x06 \x8d%\xea\
+\xeb\xeb\x132\xce$&Z/P\xa1\x93H!\xdd\x95\
+\xd6\xdd&\xd2\xdd\x89r\x0f8\xc2\x00L&\x93\x0a\xb9\
+\x94\xc5\xad\x83\x80r\xfd\x9d;wRTT\x84\xcdf\
+\xa3\xba\xbaZ\xa1\xe6R\x96\xac7\xb5\xf1m6\x1b\x07\
+\x0f\x1eT\xf9\xe8\xc7\xa2\xdeI\x9cBkk+\x0f=\
+\xf4\x10K\x96,Q\xa9\xb4\x9b7o\xa6\xb0\xb0P\xa9\
+\xd8\xc6\xf3\xe4\xb9\x05|\x92g\x13sBL\x00\xc1'\
+\x04\x80\xb5\xd9l\xd4\xd7\xd7\x13\x8dF\x15\x00\xd8[\xc6\
+%\xf7=t\xe8\x10\xc1`P\xd9\xffz\x9a\xb4\xe07\
+\x0d\x0d\x0d\xfc\xd7\x7f\xfd\x17{\xf6\xeca\xc1\x82\x05l\
+\xdb\xb6\x8d\xeb\xaf\xbf\x9e;\xef\xbcS]\xcfl6\xb3\
+l\xd92n\xba\xe9&\xd2\xd2\xd2X\xb6l\x19\xe7\x9f\
+\x7f>&\x93\x89\xc6\xc6F\xe0H\x1f>\x1d\xf3\xd0\xb1\
+\x8eH$\xa2\xfa6dee\x91\x97\x97\x87\xcf\xe7c\
+\xdf\xbe}\x98\xcdf\x86\x0d\x1b\xc6\xdf\xff\xfewL&\
+\x13\xa3F\x8dR\xe6\x86h{\xa2\xa9\xc8\xf3\xc93\xb6\
+\xb4\xb4\xa85\xb4{\xf7n:::TEi9F\
+\x92\xc3\x84a\x88\xa7\x05\xe0\xf0\xe1\xc3JH\xb8\xdd\xee\
+n{O\xf6\x86\x06\xbc\x06 \xc1&\xa2\x01\xc0\x11\x90\
+L&J\x16\x9b\xae>\xeb\xae\x1c\xe3\xc26Rw!\
+\xb7b\xabWWW\xe3\xf5z\x95WA\xae'\xc8x\
+}}=~\xbf\x9f\x91#G\xd2\xd2\xd2\xa2\xdc5\xb2\
+\x81\xbc^\xaf2\x1d\xba\xda\x18r\xbd\xc3\x87\x0f+\xf5\
+\xb27/V_\xbc\xf2?t\xf6\xab\x0f\x85B\x9cs\
+\xce9*\x08i\xdb\xb6m*\xfaOG\xf8\x8d\xd7\xd3\
+3\xcfD\x83\x91\x80\x1b\xe8\xb4E\xf5\xd6g&\x93I\
+\x85\xd8J\xd2SoH\xbfwyy9f\xb3Yi\
+Y\xd0\x19Q\xe9t:ikk\xe3\xce;\xefd\xea\
+\xd4\xa9x\xbd^\xbe\xf5\xado\xb1|\xf9r\xce=\xf7\
+\xdc\x84\xcd\xff\xc9'\x9fp\xd1E\x17q\xd9e\x97q\
+\xdbm\xb7\xb1}\xfbv.\xb8\xe0\x02\x82\xc1 \x8d\x8d\
+\x8dGy\x12\x80\xa4\x12\xdcl6+\xf3R\xdc\xb8N\
+\xa7\x93)S\xa60z\xf4h&O\x9e\xcc\xe0\xc1\x83\
+y\xf2\xc9'\xa9\xa8\xa8P\xda\xa6\xfe>\x84\x04\x87\x90\
+6\xe9#F\x8c\x00\xe0\xc3\x0f?$--M\x8dA\
+\x7f\x7fv\xbb\x9d\x8a\x8a\x0a\xe2\xf1\xb82\x87\xaa\xaa\xaa\
+8p\xe0\x00iii\x8a\x91IH\xf9\xe7\xd2\x04\xb0\
+Z\xad\xd4\xd4\xd4\x90\x9d\x9d\x9d\xc0\x00\xe0H\x18\xaa^\
+\xd0\xc1l6\xabVTz|{o\xec\x7f!\x1d]\
+\xd6\xcd\x82\xda\xdaZ\xf5\x22\x8cv\xb3\xd9l\xa6\xac\xac\
+\x8c\xbc\xbc<\xecv{B\xe3\x06#\xf0\xd7\xd58\xe2\
+\xf1x\x02#\xc9\xcf\xcfOh\x18\xd2[\x92\xc5\xb6o\
+\xdf>\x1e}\xf4Q.\xbc\xf0B5\xe6\x83\x07\x0fr\
+\xe0\xc0\x81\x84\xec:\xa3y$\xcf/\x18\x8b\xce\x84\xc4\
+\x8d\x06(\x13K\xae\x03\xa8\x0a\xc9\x12\x1a\xdc\xd38\xf5\
+\xf9\x8b\xc7\xe3TTT`\xb3\xd9T\xbc\x87\xd5j\xe5\
+\xc0\x81\x03\xdcq\xc7\x1d\xcc\x9f?\x9f\x0d\x1b6(\x14\
+\xff\xc7?\xfe1\xd7]w\x1d\xff\xf9\x9f\xff\x09t2\
+\xe8\xaf~\xf5\xabL\x9e<\x99\x8c\x8c\x0c\xaa\xaa\xaa\xb8\
+\xe5\x96[\xf0\xfb\xfd\xd4\xd7\xd7'0\xb3\xaeL\xc2d\
+\xf3!f\x82\xc5bQU\xa0-\x16\x0b\xd9\xd9\xd9\x5c\
+|\xf1\xc5\x9c~\xfa\xe9\xbc\xfb\xee\xbb\xf8\xfd\xfe\x84\xac\
+P9O\xeeg\xb5ZU\xf5\xa4\x11#FPVV\
+\xc6\xfa\xf5\xeb\xc9\xcf\xcf\x07H\xd0FD\x13\xdd\xbbw\
+\xafj\xb7\x06\x9d\x1aC$\x12\xa1\xb0\xb0PE\x03\x1e\
+O\x8c\x08\x0cp\x06 ~\xd2\xac\xac\xac\xa3\x12K\xc4\
+\x86\xd3Uq\xe9\x1e$u\xe5\xf4\xe3\xbb*\xd9,\xc0\
+R2\x97\x9eH\x7f\xe9\xe2c\xf4\xb5vtt\xa8d\
+\x93\xe6\xe6fF\x8f\x1e\xadBHE\xdaK,\x02t\
+o\xa7\xc9\xd8\x0e\x1c8@zz:)))Gy\
+\x0az\xc22\xe2\xf1\xb8R\xd1\xef\xbf\xff~rrr\
+X\xb8p\xa1B\xba\xa5\xcb\xce\x94)S\x92\x8eG\x97\
+@\xc6:u@Bs\xd2H$\xa2\x00A\x1d\x00\x94\
+\x1c\x89\x9e\x18\x80\xd1\xa5\x17\x0a\x85hll$''\
+\x87\x9c\x9c\x1c\x0e\x1f>\xcc\xcf\x7f\xfes\xae\xb9\xe6\x1a\
+>\xfa\xe8#\x1e}\xf4Q^~\xf9e\x9ez\xea)\
+\xfe\xe3?\xfe\x83?\xff\xf9\xcf|\xedk_\xa3\xa9\xa9\
+\x89\xdbo\xbf\x9dq\xe3\xc6QUU\xc5{\xef\xbd\xc7\
+c\x8f=\xa6\x12e\xc4\x8dit\x1d\xea\x19\xa4\xc6\x5c\
+\x0e\xfd\x99E\x83\xd4\x1b\x9e\x8a\xfb.\x1c\x0e3\x7f\xfe\
+|f\xcc\x98A0\x18Ts/&\x80\x11\x9b:t\
+\xe8\x90\xd2\xec\x96-[Fmm-EEE@b\
+\x96\xa1T,\xaa\xa8\xa8HP\xff\xb7o\xdf\xae\xb4P\
+q\x05\x1eoe\xe0\x01\x8b\x01\xc8\x06\xf4\xfb\xfd*_\
+]GC}>\xdfQ`\x93\xa0\xbf\x1e\x8f\x07\xab\xd5\
+\x9a\x90<\xd2\x95$5\xba\x07u\x89'\x9d\x87\xaa\xaa\
+\xaa\x08\x87\xc3\x09\xaa\xa9~\xbd\xb2\xb22\x8a\x8a\x8ap\
+:\x9d\x1c>|XI\xb4X,\xa6\xa2\x06{\x02\xf3\
+\xecv\xbb\x92V3f\xccP\x0b\xa2\xaf\x1a\x80\xcdf\
+c\xed\xda\xb5l\xda\xb4\x89o~\xf3\x9b\xc4b1\xd2\
+\xd2\xd2p\xbb\xdd\x94\x95\x951j\xd4(\xa5\x82vg\
+\x8aH\xd9*}\xf3\xe8q\x14b\x12\xe8\xe4\xf7\xfb\x13\
+B\x83{C\xb2)\x9b\x9a\x9aT\x11\xd1e\xcb\x96\xb1\
+i\xd3&<\x1e\x0f\x8f=\xf6\x18%%%\x1c<x\
+\x90y\xf3\xe6\x91\x9f\x9f\xcf\xee\xdd\xbb\x09\x06\x83\x0a\xf8\
+\x1b>|8/\xbd\xf4\x12\xf3\xe7\xcf\x07Pe\xd6$\
+\xdeB6\xb0\x9e\x82+\x1b_>\xd7\xbf\x13\xc0N\xb4\
+Ja\x14\xfaZ\x12l'\x12\x89\xa8\xc8B\x1d3\x91\
+9\xd0%\xfa\xe1\xc3\x87\x15\xbe\xf1\xd7\xbf\xfe\x95\x11#\
+F$\xe0\x1dr\x9e\xc5ba\xed\xda\xb5D\x22\x11\x15\
+\xee\x0b\x9de\xd1\xbd^/\xc1`P\x8d\xe5x<\x00\
+0\xc0\x19\x80\xb4\x96\x1e=z4\xd09IR0\x22\
+\x10\x08$\x84\xa1\x8a\xd4\x0a\x85BG\xd5\x00\x14\x15.\
+\x19\x199\xb5\xfe\x02\xc5\xbe?t\xe8\x10V\xab\x95\x9c\
+\x9c\x9c\x04\x89\xe0\xf1x\xa8\xa9\xa9\xa1\xa1\xa1\x81\x993\
+gRWW\xa7@JI\xf6\x91R[\xdd\x91\x9c\xb3\
+k\xd7.\xecv;\xd9\xd9\xd9\xca\xcdf\x9c\x93\xae6\
+\x96\xa8\xfe\x00\xf7\xdcs\x0f\x1f}\xf4\x11\xcf<\xf3\x0c\
+UUU\x9c{\xee\xb9\x9c\x7f\xfe\xf9\x94\x97\x973i\
+\xd2$\xd5\x0d\xa8;\x06\xd0\xde\xde\xae\xf2\xe4e|z\
+\xc7\x1c\xbd\xab\xad0k1\xbd\xfaB2\x86\xba\xba:\
+Z[[\x994i\x12\xe3\xc7\x8f\xe7\xcc3\xcfT\xa6\
+\xc0\xc3\x0f?\xccc\x8f=\xc6\x0d7\xdc\xc0\x17\xbf\xf8\
+E\xee\xbe\xfbn\x1ey\xe4\x11F\x8d\x1a\xc5\x93O>\
+\xc9\xc2\x85\x0b\x81N\xd7\xa4\xc4\x86\x08\xe0'c\x97\x0d\
+n\xb3\xd9T \x8ed\x8a\x02*\xe8I\x98\x820&\
+\xbdJ\x8f\xcc\xb3Q\xa3\x90\xb9\x14u\xdc\xf8\x9e\x84Y\
+\x1c:t\x88/\x7f\xf9\xcb,[\xb6\x8c-[\xb6\xf0\
+\xd3\x9f\xfe\xf4\xa8\xa2\xa9\xf2\x0e\xd7\xae]\xcb\xdc\xb9s\
+\xd55\x1a\x1a\x1a\xd8\xbau+\x85\x85\x85\x09\x80\xb5\x84\
+\x12\x1f+\x0dX\x06`\xb1XT\x90\xc4\xc8\x91#\x81\
+#q\x01\xb2X\xf4\x92S\x12X!A\x1a\xb2\xb1\xe5\
+\x1c\x1d)\xd5\x7f\x8b\xba&\x9c\x1e\x8e,h\x91\xe2\x02\
+\xbc\xa4\xa4\xa4$\x14\xc6\x80\xce\xde\xf5\xc5\xc5\xc58\x1c\
+\x0e\x0e\x1d:\x94`\xffz<\x1e\xc5\x98\xba\xa2x<\
+\xae\xf2\x05\xf6\xec\xd9\xa3j\xdfu%\xfd\x8d\x9f\xe9\xda\
+\x8f\xc9d\xe2\xc1\x07\x1f\xe4\xe5\x97_\xe6\xb6\xdbnc\
+\xd1\xa2E\xec\xd9\xb3\x87'\x9ex\x82\x17_|\x91\xda\
+\xdaZn\xba\xe9&\xa0k\xc9!s&\x12P\xa4\x9f\
+d\xd1\xe9\xf3&\x0bOw\xbd\xea\xc5A\xba\x1a\xb3\xfe\
+\x99\x5c\x7f\xff\xfe\xfd\xf8|>F\x8d\x1a\xa5:\x01\xed\
+\xd9\xb3\x87{\xef\xbd\x97C\x87\x0eq\xd5UWa\xb1\
+X\xb8\xe5\x96[\x00x\xea\xa9\xa7T&\xa3\xdf\xefg\
+\xe7\xce\x9d\xd4\xd5\xd5\xa9\x8d,9\x0cr}\xf9-\x9b\
+G\x9a\xca\xba\x5c.\x06\x0d\x1a\xc4\xd0\xa1CUi3\
+\xc9\x01\xd0\xcd }S\x1fy7\xf1O\x7f\x8e~\x0f\
+r?\x09b\xdb\xb7o\x1f\x00999<\xf2\xc8#\
+dgg3x\xf0`l6\x9b\x8aU\x91s\xd7\xae\
+]K[[\x9b\x8a\xd5\x00X\xbdz5\x95\x95\x95L\
+\x992%\xa1\x0a\x90d\x97~\xae\xdc\x80b\xcbVV\
+V\x92\x9b\x9b\xab\x18\x80Puu5\x16\x8bE\x15X\
+\x04\x14\x00\x08\x89=\x00db\xf5:\xfb\xfa\x0b2r\
+t!\x092\x92\xc8\xab9s\xe6\x00Gj\x10\xa6\xa4\
+\xa4P]]Mcc#\xb3g\xcf\xa6\xb6\xb66!\
+\xbf[\x5c4\xbd\x89\xe2\xb3X,\x94\x95\x95a\xb3\xd9\
+\x18:th\x9f*\xdf\x0a3r:\x9d\x1c8p\x80\
+\xef~\xf7\xbb\xfc\xcf\xff\xfc\x0f\xdf\xfb\xde\xf7\xd417\
+\xddt\x13_\xfe\xf2Wx\xe6\x99\xa7U\xfd\xbf\xaeH\
+\xe6E/\xbe)LT\x16\x9ah\x06b\x02H\xf6e\
+(\x14R\xcf\xdc\xdb\xf1\x0b\xf3X\xbf~=)))\
+\x8c\x1d;\x96\xda\xdaZ\x9ez\xea)\xee\xba\xeb.l\
+6\x1b_\xf9\xcaW\x08\x04\x02\xb8\xddn~\xfd\xeb_\
++\xe0\xac\xb6\xb6ViM^\xafW5'\x95\x04*\
+)\xd5\xae\x97\xf2jkkS\x01N>\x9f\x8f\xc6\xc6\
+F*++y\xff\xfd\xf7q8\x1c\x14\x15\x151f\
+\xcc\x18\x8a\x8a\x8a\x14\xa6$n\xdc\xa3\xa3&Mt\xee\
+\xbb\xae\xb52y\xff\xdb\xb6mc\xfc\xf8\xf1\xacY\xb3\
+\x86\xd6\xd6Vf\xcc\x98\x91\x10S\x22\xdaS4\x1a\xe5\
+\xd5W_e\xe6\xcc\x99\x0aT4\x9b\xcd\xbc\xf0\xc2\x0b\
+\xa4\xa6\xa6\xaa\xf4q\x89\xc7\x10\xef\xc4\xe7\x8a\x01\xc8\x06\
+\xad\xae\xaef\xc6\x8c\x19*\xd3I\x16U0\x18$'\
+'\x07\x97\xcb\x95\xb0Y\xa4IE2\x15,\x19\x09\xca\
+\xaf\xbb\xd1t\xe6 \xc8m \x10P\xb6\x9a\x8c\x0f:\
+\x9bj\x14\x16\x16b\xb3\xd9\xf0\xfb\xfd\xaa\xde\x9b\xf8\xf0\
+!ya\x08!\xd9X\x91H\x84\x8a\x8a\x0a\xc6\x8f\x1f\
+\xaf\xc6\xd5\xdb\x0d\xa4\x03\x7f\xdf\xfd\xeew\xb9\xe0\x82\x0b\
+\x126\x7fGG\xe7\xe2\xfd\xcew\x96\xf2\xf1\xc7\x1f\x93\
+\x9b\x9b\xd7\xc5\x95:I\x18\x8a\x91\x09\x89\x06 \x8cV\
+\x8f\xc1\x17sM\x98BWL\xaf+M \x1c\x0e\xb3\
+o\xdf>,\x16\x0b\x7f\xfd\xeb_\xb9\xff\xfe\xfbih\
+h`\xf6\xec\xd9\xcc\x9d;\x97E\x8b\x16)\xe0\x12:\
+m\xfcP(\x84\xddn'33\x93\x97^z\x89\xfc\
+\xfc|\xae\xb8\xe2\x0a\xcc\xe6\xce\x92\xe4\xc2\xa8\xc4\xbb\x22\
+}$E\xbb\x13\x93F\xdeY \x10\xe0\x93O>\xa1\
+\xae\xae\x8e\xb7\xdez\x8b\xb6\xb66&N\x9c\xc8\x99g\
+\x9e\xa9\xa2@uFrDc\x94g\x8a\x22\x0cA4\
+ =u\xfa\xe0\xc1\x83\x0c\x1d:\x94\x17^x\x81\xf1\
+\xe3\xc7S^^\xaeLX\xd1H,\x16\x0b/\xbf\xfc\
+\xb2Z\xf7r\x8d={\xf6\xb0b\xc5\x0a\x16-Z\xa4\
+\xdc\xcb\xe2\x81innV)\xef\xc7B\x03\x92\x01H\
+\xa0Ccc\xa3rY\x89D\x96\x02\x15\xa2\xae\xe9q\
+\xf6\xed\xed\xed\x09y\xe8\xb2\xf9\xba\xb2\x91\x8c1\x02z\
+ \x900\x80\x83\x07\x0f\x12\x8f\xc7)((P\xc7\xba\
+\xddnjkk\xd5\x22mjjR\xf7\x90@\x18\xa9\
+\xff\xde\x1d\xc5\xe3\x9d)\xb4\xdb\xb7o\xc7d2QR\
+R\xd2\xe7\xba\xf7\xc2\x00\xdex\xe3\x0dv\xef\xde\xcd;\
+\xef\xbc\x03\xc0\xdbo\xaf\xa0\xa1\xa1\x96K/\xbd\x1c\xe8\
+\xb4)\x07\x0f\x1eBaaa\xb7\xe0\xa20O\x9d\x09\
+\xc9=d~\xe4;\xbd$uKK\x8b\xcar\xeb\xeb\
+blkk\xa3\xb5\xb5\x95\xed\xdb\xb7\xb3c\xc7\x0e\xce\
+9\xe7\x1c.\xb9\xe4\x12f\xce\x9cI \x10\xa0\xbc\xbc\
+\x9c\x1d;v0d\xc8\x10RRRTk5\x80\xf4\
+\xf4t\xd2\xd3\xd3\xb9\xf3\xce;Y\xb3f\x0d\x17^x\
+!yyy\xa4\xa4\xa4(\xef\x8b\xc9dR\xf6\xbe\xc4\
+2\x88m/\xdd\x98\x9dN'\xb3g\xcf\xc6l6\xd3\
+\xd8\xd8\xc8\x07\x1f|\xc0\x0b/\xbc\xc0\xf6\xed\xdb\xb9\xf6\
+\xdak\xd5\xf1v\xbb]\x8b\xcd\x8f\xd3\xb9\xf1\xcd\x9fj\
+\x02fL\xa6(\xc2\xf3#\x91\x08^\xaf\x97\x9a\x9a\x1a\
+|>\x1fo\xbd\xf5\x16\x81@\x80\xb6\xb66233\
+U/\x06\x89\x5c\x14\xe63s\xe6LU\x12\xddj\xb5\
+\xf2\xf8\xe3\x8f\xab\xc8D\xa9\xc3(B\xf1\xd0\xa1C\x0a\
+\x0c?\x16\x1a\x90\x0c\xc0f\xb3QUUE{{\xbb\
+\x92\x8a\xd0\xc9)%LS\x16\x80\xa0\xd1\x92t\xa3\x07\
+\x06\xe9\xea\xbf\x91t\xf5LGk\x05\xd4\x91M\xb0s\
+\xe7NrssU\x15Y\xd9\x14\xeb\xd7\xaf\xa7\xb8\xb8\
+\x18\xb7\xdbMCC\x83B\xfa%\xd57\x99\xddoT\
+\xd3d1}\xf0\xc1\x07L\x9f>=\x01D\xea\x0d\xc5\
+\xe3\x9d\xd5y\xc2\xe10\x7f\xfc\xe3\x1f\xf9\xaf\xff\xfa/\
+\xf2\xf2\xf2\xf8\xc5/\xfe\x1f\xff\xef\xff\xfd\x02\x80\xb3\xce\
+z\x84\xb7\xde\xfa\x07\xb5\xb5\xb5\x0c\x1bV\x8c\xc5bN\
+Z[_H\x00@\xfdYu\x0f\x80\x98M\xc6,\xcc\
+\xe6\xe6f%Q{\x13\xbd(\xef\x06P\x9b\x7f\xe4\xc8\
+\x91\xfc\xf6\xb7\xbfU\xa0\xaf\xa8\xbaYYY\x9c~\xfa\
+\xe9\xb4\xb5\xb5q\xfb\xed\xb7\xab\x0d.L\xdf\xeb\xf52\
+b\xc4\x08\x1ez\xe8!^y\xe5\x15&L\x98\xa0\x18\
+\x91\xd3\xe9T\xf9\xf7\xe9\xe9\xe9dggSXXH\
+qq1c\xc6\x8c!777\x81\xd1I\x1d\x89\x0b\
+.\xb8\x80\x0b.\xb8\x803\xce8\x83'\x9f|\x92W\
+^yE\xa9\xdf\x9d\xe6@;\xf18\x98L\x16\x8e\xe0\
+\x00\x89\xf1!r\xddM\x9b6\xb1k\xd7.\x5c.\x17\
+\x99\x99\x99l\xdb\xb6\x8d\x0b/\xbcPiP\x22\xcd_\
+x\xe1\x05,\x16\x0bs\xe7\xceU\x1e\x89\xc6\xc6F\x1e\
+{\xec1f\xcf\x9e\xad\xc6\x18\x8f\xc7IKKSy\
+\x1dC\x86\x0c9\xe6X\x80\x01\xc9\x00\xccf3UU\
+Udee\xa9\x8a\xb5F\x10G\x18\x80lZQK\
+\x93\x15\x071&\x0c\xe9\xa8\xb5\x1c\xa7\x83\x80\xf2\x92[\
+ZZ(//\xe7\xdcs\xcf\x05P\xc9\x22\x07\x0e\x1c\
+\xa0\xa1\xa1\x81\x85\x0b\x17RWW\x97\x00\xc2x\xbd\xde\
+\xa3\x90\xe3d$c\xfb\xe0\x83\x0f\x88\xc5b\x8c\x1d;\
+Vu\xbc\xed\x0d\xe9R\xfc\xe9\xa7\x9f\xa6\xa4\xa4\x84+\
+\xaf\xbc\x92[o\xbd\x95\xfb\xee\xbb\x8f;\xef\xfc\xff\x18\
+R4\x84\xfb\xfe\xe7\xb7,X0\x97H$\xcam\xb7\
+\xfd\x00\xe8\xde\xc4\x10\x06\xa83Qq{\xe9\xf7\x96\xb9\
+\x96\xef\xa5\xda\x91|\xdf\xd5\x98\x93Qee%\x95\x95\
+\x95\xfc\xecg?c\xf4\xe8\xd1\xaa\xf0\x8a\xc4Y\x0c\x19\
+2\x84?\xfd\xe9O\x9cu\xd6Y\xdc~\xfb\xedI\xaf\
+!Aa\x81@\x80\xd5\xabW\xf7j\x0esss\x19\
+3f\x0cS\xa6La\xe4\xc8\x91\x8c\x1f?\x9e\x92\x92\
+\x12\x15\x9d\xf7?\xff\xf3?|\xfc\xf1\xc7\xcc\x9b7\x8f\
+\xb5k\xd7r\xf6\xd9gk\xe0\xa8\x99x<\x86\x0e\x04\
+\xca3\x8a\x97$##\x03\x93\xc9\xc4\x1f\xfe\xf0\x07Z\
+ZZ\x983g\x8e\x0a\x18\x12LI\xe8\xd5W_e\
+\xf7\xee\xddL\x9b6-!\xe8\xed\xbe\xfb\xee\xa3\xae\xae\
+\x8ek\xae\xb9\x86\xd6\xd6VL\xa6\xceRf\x19\x19\x19\
+\xacZ\xb5\x8a`0\x88\xc7\xe3Q\xf8W_i\xc01\
+\x00Yt\x95\x95\x95\x8c\x193\x86A\x83\x06%\x14R\
+\x94&\x9c\x1e\x8fG\xd9b\xe2\x8fM\x06\x86H\xa2\x87\
+1\xda\xcfX\x89U\xdf\x10\x22\xe1\xca\xcb\xcb\x09\x06\x83\
+J\x22\x89&\xb1~\xfdzU`BlQ\x91V\x12\
+\xd7\xdd\x13\x09\xa8\xb4g\xcf\x9e\x04\x80\xb1/\xea\x7fg\
+5\x98&6o\xde\xccO~\xf2\x13\x1e{\xecQ\xfe\
+\xf8\xc7?r\xdf}\xf7q\xdai\xa3\x19>\xbc\x84e\
+\xcb^\xe3k7~\x837_\x7f\x831c\xc6\xa8\xe7\
+\xd3\xa5\x9e\x91\x04\xe8\x94\x0d\xad\x87\xc5\xcayv\xbb=\
+\x81)ttt\xf4\xb9(\x85\x5c_\xec\x7f\x99g\xa9\
+Y(A7555,Z\xb4\x88\x9f\xfc\xe4'\x09\
+a\xbf:\x89\x1d\xaf\xc7\xf8\x0b\xe9\xa6\xa0\xae\xf5\xd5\xd6\
+\xd6R[[\xcb\xaaU\xab\xd4\xb1\xa3F\x8db\xfa\xf4\
+\xe9TTT\xb0z\xf5j\xfe\xf0\x87?p\xe3\x8d7\
+\xf2\x7f\xff\xf7\x7f\xec\xdb\xb7\x8f!C\x86\x1c\x15\xd2\xdd\
+\xb9\xe9\xc1b1a\xb1\xd8\x94fb\xb7\xdby\xe4\x91\
+GX\xb1b\x05_\xf9\xcaWT$\xe1\xd0\xa1C\xd5\
+\xb3B\xa7\x86\xb0z\xf5j\x0a\x0a\x0a(((P\xae\
+\xd4\xc3\x87\x0f\xf3\x97\xbf\xfc\x85\xf3\xce;\xef(\xc6b\
+6\x9bY\xb9r%yyy\xc7U/b\xc0E\x02\
+J\x02Puu\xb5\xf2\x83\x8ad\x14\x95\xc8\xe5r\xe1\
+v\xbb\xd5\x86\x91:\xeb\xfa\x0b\x06\x8e\x92\x5cB:@\
+\xa4\xdf\xd7\xb8\xf9v\xed\xda\x85\xc7\xe3Q`\x8d\xdb\xed\
+f\xff\xfe\xfd455QZZ\xaal\x7f\x91\x96\xe2\
+\xf6\xeb\x09\x91\x15\x9b\xfa\xa3\x8f>\xc2\xe9t2z\xf4\
+\xe8>\xdb\xfer\xec\xf2\xe5o3u\xea\x14jkk\
+\xf8\xf6\xb7\xbf\xcds\xcf=\xcb\xfc\x05sq9l\xe4\
+\xe7fQPX\xc8\xc5\x17,a\xfc\xd8qdg\xe7\
+\xa8s\xbb\x1b\xa3^\x85G\x98l\xb2\xb4k\xd1\x02$\
+3\xb3+\x06`d\xb0B\xc2P+**HOO\
+W\xa8\xb8Q\x1b\xeb\xe8\xe8\xa0\xa1\xa1\x81\xdbn\xbbM\
+u\xc6\x15\x13\xc4h\xde\xc9{\xd5c\xfbe\xed\xe8\x8c\
+@\xca\xcc\xa7\xa7\xa7\xab\x22'\xd0\x99K\xf0\xd4SO\
+\xb1z\xf5j\xae\xbd\xf6Z\xae\xbb\xee:,\x16\x0bc\
+\xc7\x8e\xa5\xb2\xb2\xf2(\xfc\xa4S\x0b\x00\x93\x09\xe2q\
+\x93\x02\x96\x07\x0d\x1aDEE\x05?\xf9\xc9O8\xe7\
+\x9cs\xc8\xcc\xccT\x0c`\xda\xb4iJ\xed\xdf\xbbw\
+/\x8f=\xf6\x18\xa3G\x8f&77\x97\xe2\xe2b5\
+\x96\xbb\xef\xbe\x9b\xf4\xf4tN;\xed4%\xfd#\x91\
+\x08\x83\x06\x0db\xef\xde\xbdl\xd9\xb2\x85\x11#Ft\
+k\xd2\xf5D\x03\x8e\x01X\xadV\x1a\x1a\x1a0\x9b\xcd\
+J2\xea\x0b\xcf\xe7\xf3\xe1\xf5z\x13\xfc\xeb\xc9\x8a}\
+\x08C0\xf6\x04\xd0M\x09}#\xc8\xa2\x13\xb3\xa0\xa3\
+\xa3\x83\xbd{\xf72d\xc8\x90\x04@\xef\xddw\xdf\xa5\
+\xb8\xb8Xe\xea\x89\x94\x92\xe6\x1e\xba\xf9\x91l\x93\x09\
+*\xdd\xd6\xd6\xc6\xe6\xcd\x9b\xd5\x82\xee\xab\x0dg\xb5Z\
+\x09\x85BTVV0i\xd2\x04\xee\xb8\xe3\x0e\xbe\xf3\
+\x9d\xef\xb0d\xc9\x85\x94\xef\xdb\xcb\xa8\xd2R\x5c.7\
+m-\xcd\xec\xda\xb9\xf3\xd3\x0a\xbb\xb9\xc4ID\xe3u\
+\x0dH$\xb2\xa8\xb92^\x8b\xc5\x92\xc0\x00\x8c\xa1\xb3\
+\xa1P\x88\xb6\xb66e\x96\xf5\x86D\xc3\x88D\x22T\
+WW\x93\x95\x95\xa5r\xdbe>\xf4{\xb7\xb6\xb6\x92\
+\x96\x96\xc6\xddw\xdf\x9d0_\xd2\xa4$77\x97\xbc\
+\xbc<\x15\xfd\xa7\xdfG\xde\xb7\xce\x1cB\xa1\x10\xcd\xcd\
+\xcd\xaaG\x83T\x17NIIQ\xe7gff\xd2\xd2\
+\xd2B,\x16\xa3\xb4\xb4\x94\xec\xec\xec\x84\xe8H\x9d$\
+.@\x0f\x90\xfa\xd5\xaf~\x85\xc3\xe1`\xf2\xe4\xc9\xb4\
+\xb6\xb6\xaa.J\xf3\xe6\xcd\x03:+\x18}\xff\xfb\xdf\
+g\xca\x94)\xe4\xe6\xe6b\xb5ZU\xe4\xdf\xb2e\xcb\
+x\xfe\xf9\xe7Y\xb4h\x91\xea\x02,kz\xc2\x84\x09\
+,_\xbe\x9c@ \xa0\xd2\x91\x8f\x95\x06$\x03\xd8\xb1\
+c\x07c\xc6\x8cQ=\xebe\xb1H\x0a\xb0\xd8h\xf2\
+\x12\x925\x07\x11)k\x0c\x92\x10\xc6\xa1\xdb\xc1\xba\x84\
+\x92\x17\xd8\xd4\xd4Duu\xb5\x0aC\xb6\xd9l\xec\xdb\
+\xb7\x8f\xda\xdaZ&N\x9c\xa8\xd2\x83\xe5\xa5H\xf1\xd1\
+\x9eH6\xda\xfb\xef\xbfOZZ\x1a\xa3F\x8d\xea\xb5\
+\xf4\xd7\xaf/\x1aDVV.\xad\xad\x9dYf\xb7\xde\
+\xfa}\x1a\x9a\x1a\xd9\xbf\xff\x00\xad\xbe\x16l\x0e\x17m\
+\xc1\x10\xbbv\xed\x22\xc5\xdd\x89\x88\xc7\xb4:\x06\xc9(\
+\x1a\x8d\x1e\x15%(\x1bD\x1f\x87.\xa5%l\xf8X\
+z0\xb6\xb5\xb5q\xe8\xd0!\xf2\xf3\xf3IMMU\
+\xccGg\xcc\x80\x8a\xc8<\xeb\xac\xb3\xf8\xf6\xb7\xbf\xdd\
+\xf9,\x9f\xc6+\x9cw\xdeyl\xd8\xb0\x81\x15+V\
+\xf0\xce;\xef\xb0b\xc5\x0a\x1e}\xf4Q~\xf1\x8b_\
+\xf0\xbd\xef}\x8f/~\xf1\x8b\x8c\x1b7\x8e\xfc\xfc|\
+\xb2\xb2\xb2\x14#\x10\x95Z\x5c\x98bF\xc8s=\xf9\
+\xe4\x93\x1c8p@\xe5sH\x095c/\x0a\x9d\x89\
+F\x22\x11\xd2\xd2\xd2x\xfd\xf5\xd7y\xe1\x85\x17\xb8\xec\
+\xb2\xcb\x94\xf4\xae\xaf\xaf\xe7\xac\xb3\xceb\xf8\xf0\xe1\xac\
+Y\xb3\x86\x05\x0b\x160|\xf8p\xa6N\x9dJee\
+%\x83\x06\x0d\xc2\xe1pPQQ\xc1\x8f~\xf4#\xd5\
+\xb4U$|4\x1a%77\x97p8\xcc\xca\x95+\
+\xd5\xda9\x1e\x1aP\x18\x80\x04\xdeTUU\xf1\x83\x1f\
+\xfc\x00\x87\xc3\xa1\xe2\xab%1(\x12\x89$\xe4\x9b\xeb\
+\xa1\x9b\xc6\x8d\xdeU\xe7T=\xfaO\x07\xb4De\xb4\
+Z\xad\xec\xdf\xbf\x9f\xf6\xf6\xf6\x84 \xa4\xe5\xcb\x97S\
+RRBzz:555J\xfa\xa7\xa5\xa5)\x1c\
+\xa0;\x12\xd4\xbe\xae\xae\x8e\xdd\xbbws\xd9e\x97\xa9\
+\xf1\xf4\x86\x01\xc81\xb2)\xca\xca\xca\x987o\x1e+\
+W\xaed\xea\xd4\xa9ddd\xd1\x16hc\xe4\x88\x91\
+<\xf7\xc2\xdf\x18Q\xf2\x11\xee\x147\x91\x8e\x8e\x84\xa4\
+\x13}<\xfa\xbc\xc9|\xea\x0c@\x18\xa9\x1c'\xefB\
+Z\x82Cg\x5c\xc6\xb1\xb67khh`\xef\xde\xbd\
+*\x8e_/A\xae\xe3\x0dR\x9e\xbc\xa6\xa6\x86\x9bo\
+\xbe\x99\xe7\x9e{\x8e\x9a\x9a\x1a\xa030\xac\xa8\xa8H\
+\x15\xf4\xe8\xe8\xe8`\xe4\xc8\x91\x0a\x10\x8eD\x22\xc4b\
+1\xb2\xb3\xb3\xb9\xfc\xf2\xcbY\xbe|9g\x9cq\x06\
+\xb5\xb5\xb5\xec\xde\xbd[\xb9\x96\x05c\x92\xe7oll\
+\xe4\x81\x07\x1e`\xf0\xe0\xc1j\xfejkk\x93v\x08\
+\x96\xb9\x91\xda}\x0f=\xf4\x10s\xe6\xcc\xc1f\xb3\xd1\
+\xd6\xd6\x86\xdf\xef\xe7\xb4\xd3N\xe3\xca+\xafd\xd3\xa6\
+M\x5cy\xe5\x95\xe4\xe5\xe5q\xf9\xe5\x97s\xe0\xc0\x01\
+\xacV+\x0b\x16, \x12\x89p\xd5UW\x91\x99\x99\
+Iii\xa9\xca,\x15\xcd\xa5\xa4\xa4\x847\xdex\x83\
+\xe6\xe6f&M\x9at\xcc\xe0\x9f\xd0\x80\xd2\x00l6\
+\x1b\xe5\xe5\xe5\x14\x15\x15q\xcd5\xd7\x00GT=\xab\
+\xd5J}}\xbdR\xd3\x84\x0bK\x14\x95N\xb2\xa9\x8d\
+\x0c@g\x18\xfa\xb1b\xff\xcb\xdf\xf1x\x9c\xb2\xb22\
+\xd2\xd3\xd3U\x00PYY\x19\xd5\xd5\xd5L\x9b6M\
+!\xde\x12\x22\xdb\xdb@\x0c\x91\xa2o\xbc\xf1\x06\xc3\x86\
+\x0d#+++A\xe2\xf4\x86\xe2\xf1\xce\xd0\xe1\x0f>\
+\xf8\x80\x8e\x8e\x0e\x86\x0f\x1fNyy9\xb3g\xcf!\
+\x1e\x87P0\xcc\xf9\x17\x5c\xc8\xc2\xf9\xf3\xc9\xcd\xcd\xa1\
+t\xf4h\x82\xe10C\x86\x1d)\xb2\xd9\xdd\xfdD]\
+\xd6\xef'1\x00z\x80\x8b.\x01[ZZ\xba\xedn\
+\x9c\x8cd\x0cMMMTUU\xa9\xc2\x98\xc2\x0cE\
+\xc3\x90\xfbY\xadVl6\x9b\xeaF\xfc\xfd\xef\x7f_\
+]k\xfd\xfa\xf5\x94\x97\x97\xe3t:US\x10\x89\x9a\
+3\x9b;\xbb\xfd\x16\x17\x17+-\xee\xec\xb3\xcf\xe6\x9c\
+s\xce\xe1\xb2\xcb.\xe3\x9ak\xaea\xee\xdc\xb9*y\
+L\x12\xc0$\xce\xe4\xa9\xa7\x9e\xe2\xb4\xd3Nc\xe9\xd2\
+\xa5\xfc\xfd\xef\x7fW\xaeE\xd9\x902'\xf2c\xb3\xd9\
+x\xf0\xc1\x07ijjb\xcc\x981\x8a!\xb9\xddn\
+\x16-Z\xc4\xd3O?\xcd\xef\x7f\xff{222\x98\
+;w.\xa1P\x88}\xfb\xf61g\xce\x1c,\x16\x0b\
+\xe7\x9cs\x0e\xf5\xf5\xf5,X\xb0\x80\x96\x96\x165O\
+\xb1X\x8c\xcc\xccL\x9a\x9a\x9a\xf8\xe8\xa3\x8f())\
+9.\xdb_h\xc0h\x00\xf2\xb2w\xec\xd8\xc1u\xd7\
+]G~~\xbez@\x01\xda\x1a\x1b\x1bUM>\x09\
+\x92\xd0]VB\xf2\x22\x8c\xc0\x15\x90\xc0\x00\x8c*\x9c\
+\xc4\xb7\xfb\xfd~\xca\xcb\xcb\x192d\x88\xb2k\xff\xf9\
+\xcf\x7f2z\xf4h\xd2\xd3\xd3\xa9\xaf\xafW\x0c 5\
+5U-\x9e\xeeH6\xee\xae]\xbbhmm\xe5\xf2\
+\xcb/\xef\xb3\xed\xa6#\xf3\x9b6mb\xc2\x84\x09\x1c\
+>|\x18\x80q\xe3\xc6\x11\x8bE\x89\xc5\xa2\x84\xc3!\
+\xe6\x9f~\x06\x00\x07\x0f\x1c \x18\x0cRPX\xa8\x9e\
+_\x7ff\x9d$\xa4Wg\x12\xa2I\xe9\xd2N\x8f\x96\
+\x84N5^\x02lz\xab\x92\xca\xf5%}[\x5c_\
+\xba\xe4\xd7\xbd4\x02::\x1c\x0ejkk\xb9\xe0\x82\
+\x0bx\xf5\xd5Wy\xef\xbd\xf7TX/\xa0p\x1f\x19\
+\x9f\x84&[\xadV^~\xf9e&L\x98\xc0\x9dw\
+\xde\xa9b\xeb\xf3\xf3\xf3\x19:t\xa8* \xebv\xbb\
+y\xeb\xad\xb7hllTkr\xe9\xd2\xa5\x0a\xb5\x97\
+\xf1\xe9c\x14\xa1\x91\x99\x99\xc9\xde\xbd{y\xe3\x8d7\
+\x988q\xa2\xaa\x06-\xe3~\xfb\xed\xb7U\xdf\xc3\xd6\
+\xd6V\xe6\xcc\x99\x83\xcf\xe7\xa3\xa8\xa8\x88\xb1c\xc7r\
+\xddu\xd7\xb1g\xcf\x1e\xae\xbd\xf6ZZ[[\x8fZ\
+\xbb\x92\xd1)y)\xc9\x12\xc6\xfaJ\x03F\x03p:\
+\x9d\xaa\x00\xc2W\xbf\xfaU\x80\x84\xce8\x81@\x80\xd6\
+\xd6V\x95!&/G\x12)\x8c\x0c@\x1aw$\xf3\
+\xff\x1b\x01@\xbdt\x93\xc5b\xa1\xaa\xaa\x8a\xfa\xfaz\
+\x956\xbbu\xebV\xea\xeb\xeb\x99:u\xaaz\xa9\x12\
+\x15\xd6\x9bl?@1\xa3\x0d\x1b60c\xc6\x0c\x5c\
+.\xd71\xbd@\xa7\xd3\xc9\xae]\xbb8|\xf80s\
+\xe7\xceU\x01&\xd9\xd9\xd9J5\x0d\x06\xc3\xf8>\xcd\
+\x17\xaf\xac\xaa\xc2b\xb1P\xf2\xa9'\xa3;\xf7\x1f\x90\
+\x906\xab\xc7\x00\xe8\xa0\xa0\xc9\x94\x98])a\xb2\xdd\
+]\xd7Hr\x5cMM\x0d\x1d\x1d\x1d\x09i\xafB:\
+c\x16\xc9+\xc93V\xab\x95\xdbn\xbbM1\xa6m\
+\xdb\xb6\x01(\x13&\x14\x0a\xd1\xde\xde\x9e\x00h\xbe\xf7\
+\xde{D\xa3Qv\xed\xda\xa5\x12\xc7\xc2\xe1\xb0\xb2\xfd\
+\xbf\xfd\xedo\xf3\xe6\x9bo\xf2\xe0\x83\x0f&\xb8\x94\xf3\
+\xf2\xf2\xf8\xf2\x97\xbf\xcc\xa2E\x8bT\x05\x1e\xb9\xaf\x8c\
+O\x82z\xee\xba\xeb.\x05\x0a\xeb\xeb+\x14\x0aQ[\
+[\xcb\xa0A\x83\xd8\xbau+\xc3\x86\x0d\xa3\xb4\xb4\x14\
+\xa7\xd3\xc9\x9c9s\xb8\xe5\x96[X\xbbv-W^\
+y\xa5\xca\xc4\xd4\xe7*%%\x85\x9a\x9a\x1a\xc2\xe10\
+\xb9\xb9\xb9\xc7\xd5\x0dH\xa7\x01\xc1\x00\xe4A>\xfc\xf0\
+C.\xbb\xec2\x86\x0c\x19\x92Pv\xcbb\xe9\xec8\
++\x5cV$T2\xc0J6\xb11W]\x07\xf9t\
+\x92\xc4\x11\xdd]$\xb5\xda\x84\x01\xac_\xbf\x9e\xd1\xa3\
+G\x93\x9d\x9d\xad\xa2\xdcb\xb1\x98\xaa;\xd0\x1d\x03\x10\
+U\xd1n\xb7\xb3~\xfdz\x02\x81\x00\xd3\xa6M\xebS\
+\xd0\x8f\x8c_\x8e\xef\x0c\xeb\x1d\x0ct\x06\xd1ddd\
+(\x10\xab3\x0f>\x85\xb4\xd4T\xea\xea\xeax\xfe\xf9\
+\xe7\xf1z\xbdJ\xc2\xea\xe0]2$[6\x9b\xfe\x99\
+\x11H\xd5\xe7\x0cP\x19\x92\xc9\xae\xd9\x15\xe99\xf2\xc0\
+Q\xb5\xf1u\xaf\x84\x8e\xf8\x8b\x0b\xb8\xa1\xa1\x81\x89\x13\
+'\xf2\x8b_tF<\xfe\xe1\x0f\x7f\x00P\xe5\xc8\x04\
+\xb8\x8c\xc5b\xca\xe5V__\xcf\xe1\xc3\x87)++\
+\xa3\xa3\xa3\x83M\x9b6\xa9\xf1\x06\x83Ae\xbf\xdft\
+\xd3M\xec\xdc\xb9\x93\xeb\xaf\xbf\x1e\x80[n\xb9\x85g\
+\x9f}6A\xf5\xd7\xeb\x15\x86\xc3a\xa59\xbc\xf9\xe6\
+\x9b\x8c\x181\x22!\x1aR\xd6\xa4\xe4\xaetttp\
+\xd1E\x17\x91\x9b\x9bK{{;\xdf\xfc\xe67y\xe7\
+\x9dw\xf8\xc2\x17\xbe\x00p\x14(,\xae\xd6`0H\
+vv\xf6qU\x00:\xea=\xf4\xdb\x95\x8e\x83\x5c.\
+\x17;v\xec ##C5q\xd4mA\xb3\xd9L\
+]]\x1d)))\xca\xff/\x93\x22\x7f\x0b\xc9f\xd3\
+s\xd7uI\xa2\xab\xb7\xba=\x0b\x9d\x0b,\x18\x0c\xb2\
+k\xd7.RSS\x191b\x04\xfb\xf6\xed\xa3\xba\xba\
+\x9aI\x93&)W\xa0 \xde\xbd)\xf2)n\xbfP\
+(\xc4\xfb\xef\xbf\xcf\xacY\xb3\x94&\xd2[\x06 \xcf\
+!Z\xc3\xe6\xcd\x9bU\xca\xac\x9e\x0f.Y\x88n\xb7\
+\x9b\x97^z\x89\xfb\xef\xbf\x9f\xe5\xcb\x973x\xf0`\
+\xd5\xa8\xc38'F\xd2M\x04\x99\x9fd\x05P\x8d\x8c\
+D/m\xdd\x1b\x92s\x0f\x1f>\x8c\xc5bQ\x9b/\
+Y\xda\xb6\xbc\x1fy\xb7R&\xab\xae\xae\x8e\x8b/\xbe\
+\x98\x85\x0b\x17\xf2\xfe\xfb\xef\xb3|\xf9r\xc5\xf8\xc5|\
+\x90\xff\xab\xaa\xaahkk\xe3G?\xfa\x11W]u\
+\x15n\xb7\x9b\xbd{\xf7b2\x99Tj\xb9\xc4{4\
+77SXX\xc8c\x8f=\xc6\x0b/\xbc\x80\xcb\xe5\
+\xe2\x9ak\xae\xe1\xbd\xf7\xde#77W\x81\x8ab\x8a\
+J\xe2\xd7C\x0f=\xc4\xd0\xa1C\xbb\xec\xfad\xb3\xd9\
+8p\xe0\x00\xd3\xa6M\xe3\x8c3\xce\xe0\xad\xb7\xde\xe2\
+7\xbf\xf9\x0d\x8d\x8d\x8d,^\xbcX\xb9'\x93\xbd\x97\
+h\xb4\xb3\xcc\xbb\x9e\x8a\xde\x1ft\xd2\x19\x80L\xe2\xc6\
+\x8d\x1b\xf9\xf2\x97\xbfLVVVB\xfd6Q\x9fZ\
+[[)((\x00\x8e\x14q\x14\xf5_'\x93\xc9\xa4\
+\x10j\x1d$\x91M'A.:\xa2-\xf6\xa2\xd4\x1a\
+\xd8\xbbw/\xa5\xa5\xa5\xd8\xedv\xdey\xe7\x1d\x86\x0d\
+\x1bFnn\xae\xea\x06c2\x99T,BO\x12O\
+\x9e\xe1\x9dw\xdea\xd0\xa0AL\x980\xa1\xcf\xea\x9b\
+no\x7f\xfc\xf1\xc7\x1c<xP\x85H\xcb\xf72\x97\
+\x0e\x87\x83\xe7\x9f\x7f\x9eu\xeb\xd61u\xeaT\xf2\xf3\
+\xf3\xd5\xc2\xd6s\xdb\x85\xf4\xf1\x8b\x8bK\xf7\xf7'\x0b\
+\x02\xd2\xa53tj\x00\xc6f)=\x91\x9c\xbfg\xcf\
+\x1e222\xc8\xc8\xc8H\x9a{\xaf\x93\xbc3\xb7\xdb\
+\xad\x8e\x0f\x85B\xca-(e\xc1E\x1d\x97w\x0a\x9d\
+\xd9xv\xbb\x9d\x92\x92\x12\xa2\xd1(\x1f\x7f\xfc1Y\
+YY\xcc\x9d;Wy{$\x15;\x1a\xed\xec\x02\x15\
+\x0c\x06\xb9\xf4\xd2K\xa9\xab\xab\xe37\xbf\xf9\x0d\xaf\xbc\
+\xf2\x0a\x9f|\xf2\x09iii\x09\x91\x91^\xaf\x97\xe5\
+\xcb\x97\xf3\xd2K/1r\xe4\xc8.\xc1\xb9\xf6\xf6v\
+\x1c\x0e\x07\xd3\xa7O\xe7\x85\x17^\xe0\x95W^a\xf8\
+\xf0\xe1\xcc\x993\x87`0\xd8\xa5V\xa8\x9b\xb8}u\
+\xb3\xf6D'\x9d\x01x<\x1e6l\xd8\xc0\xa0A\x83\
+\xf8\xc67\xbe\x01$VH5\x9b;\xdb'C\xa7-\
+&\xb9\x00\x1d\x1d\x1d\xaa\xe9\x86\x90lh\xe9\xda+\xe6\
+\x81,(}q\xeb\xb6\xac\xae\x01\xec\xde\xbd\x9bP(\
+\xc4\xc4\x89\x13\xd9\xb1c\x07uuu\xcc\x981#\xa1\
+@\x881\xe8\xa7+\x92\xc5z\xe0\xc0\x01v\xee\xdc\xa9\
+r\x0a\xfa\xca\xc1ui\xbbu\xebV\x95\x11\x07(\xf0\
+J\x00\xc9u\xeb\xd6\xb1y\xf3f\xce:\xeb,\x00\x1a\
+\x1b\x1b\x13\xea\xcauE\xfa\x1c\xe9\xa4'\xfd\xe8\x12Y\
+\x9f\xd7p8\xac2\xef\xfa\xf2L\xd0)\x99\x8b\x8a\x8a\
+\xf0z\xbd]n\x1c#\xc32\x99:\xa3.\xb3\xb2\xb2\
+hhh ??\x9f\x1bo\xbc\x91\xed\xdb\xb7\x13\x0c\
+\x06U\x1e\xbd\xfc@'\x03\xf0z\xbd\xaa|\xf9'\x9f\
+|\xc2i\xa7\x9dFzz:\xb5\xb5\xb5,Z\xb4\x08\
+@\xe5\x94\xd8l6Z[[ill\xc4\xedv\xf3\
+\xbd\xef}\x8f[n\xb9\x85x<\x9eP,U\x98\xcd\
+\xe3\x8f?\x0et\xaa\xef\xba\xfd\xaf?o8\x1c\xc6\xeb\
+\xf5\xf2\xde{\xef\xf1\xfe\xfb\xef3i\xd2$\xb2\xb3\xb3\
+U\xe3\xd8\xfe\xb0\xe9\xfbJ'\x95\x018\x1c\x0e\x1a\x1b\
+\x1bY\xbf~=\xdf\xf9\xcew\x92\x22\x9bfsg\x8b\
+'\x97\xcb\xa5\x0a&\xc8d\x1a\xd5hy!R\x81W\
+\x07k\x84!@b5\x1aY\xdc\x92j\xbcs\xe7N\
+\xd5\x13n\xc3\x86\x0d\x14\x17\x17+\xe9/\xe7I\xcf\x81\
+\xee\xb8\xb1\x5c\x13:=\x08c\xc6\x8c!==\xfd\x98\
+\x80\xbfh4\xaaT\xf8\xed\xdb\xb7'\x84\xdc\x0e\x1a4\
+H1\x80\xf6\xf6v\xd6\xacY\xc3\xd0\xa1Cq\xb9\x5c\
+\xaa@\x87\xb1\xa2rwdd\x00\xfaf\xd7%\xb3<\
+\x9bd\x0evg\x02${^\xb9VSS\x93\x02v\
+\xbb\xf3\xa4\xe8\x12P\x12\x7fDs8|\xf80\xf3\xe7\
+\xcf\xa7\xa3\xa3\x83\xff\xf9\x9f\xff\x01\x8e`\x01\xf2\xfe\x9b\
+\x9b\x9b\x19:t(\x1e\x8f\x87\x86\x86\x06\xb2\xb3\xb3\xb9\
+\xe8\xa2\x8bhnn&\x16\x8b\xa9\xa03\xdd\xa3$\xbe\
+\xfe\xba\xba:\x9a\x9b\x9b\xc9\xc8\xc8P\xf1\x06\xfaZ8\
+t\xe8\x10/\xbd\xf4\x12\x00+W\xae\xa4\xbd\xbd=)\
+C\x94Z\x05\x00\x93'OV*\xff\xc9\xa4\x93\xc6\x00\
+\xc4>\xfb\xc7?\xfe\xc1Yg\x9d\xc5W\xbe\xf2\x15\xe0\
+\xe8\x02\x1a&\x93\x89\x96\x96\x16\x95 !j\xbc\x0e<\
+\xc9y&\x93I\xc5u\x0b6\xa0\x03IF\xfb_\xa4\
+\x9b\xf8\xf3}>\x1f\x87\x0e\x1db\xd8\xb0a\xaa\xc7\xdf\
+\xd8\xb1c\x15\xe8\xd3\x97\x84\x1f\xf1D|\xf8\xe1\x87\x04\
+\x02\x01\xce<\xf3\xcc\x04\x0d\xa4/$\xcf&\x85!\xea\
+\xeb\xeb\x95\xe4)**\xc2\xe7\xf3\xd1\xda\xda\xca\xbe}\
+\xfb\xf0\xf9|\xe4\xe6\xe6*5\xd6\xe3\xf1\xa8\xbc\xf3\xee\
+H6\xa4\x11}\xd6c$\xf4c\xe5s\x01b\x93\xe5\
+\x5ct\x05\xbc\xcaw\xd2\xf5I\xf2\xd9\xbb\xd3\x8ct\xb3\
+C\x18\xbb\xc5b!''G\xd5\x04\xf8\xaf\xff\xfa/\
+\xd6\xacY\xc3\x1f\xfe\xf0\x07\xecv;\xa9\xa9\xa9\x8a\xe9\
+\x07\x83A\xd2\xd3\xd3U\xa3\xd9[o\xbd\x95E\x8b\x16\
+\xb1s\xe7N\xc6\x8c\x19Cqq\xb1\x8a\xee\x94g7\
+z\x89\xc4\xe5,!\xcc\xf2\xfds\xcf=G[[\x9b\
+\xda\xd4o\xbe\xf9\xa6\x0ag\xd7\xdd\x856\x9b\x8d\xc2\xc2\
+Be\xe6\xf6\xa5r\xd2\x89\xa2\x93\xc6\x00\xa4g[S\
+S\x13\xbf\xfe\xf5\xaf\x01\x8e\x0a\x8a1\x9b\xcd\xaa\x80B\
+VV\x96\x9a\xb0H$r\x94\xbd$\xbe\x7f)x\x19\
+\x0e\x87\x95?\x18P\xc0\x8d\x1c\x0bG'\x00\xed\xdd\xbb\
+\x97\xe6\xe6f\x86\x0d\x1b\xc6\xfe\xfd\xfb\xc9\xcb\xcb\xa3\xa8\
+\xa8H5\xc2\x14\xd5\xb3'\xdb_\xdc6\x81@\x80U\
+\xef\xacd\xde\xbcy\xaa\xd3\xcb\xb1\xbcpy\xa6M\x9b\
+6\x91\x99\x99\xc9\xbau\xebhmm\x05:\xe3\xd5}\
+>\x1f\xe5\xe5\xe5\xb4\xb6\xb6\xe2p8T\x08tEE\
+\x05)))\x0a`\xeb\xee\xdeb\xde\x18#\x05\x8d\xf5\
+\x14\x85\xf4\x85-\xbe\xf0\xaeH\x18\x80\xd1\x8e\x95\x1c\x02\
+cu\xe7\xae\xec\x7f8\x82\x19I\xcc\x86\xd7\xebe\xe4\
+\xc8\x91\x0c\x1f>\x1c\x93\xc9D]]\x1d\xdf\xfa\xd6\xb7\
+\xb8\xe5\x96[0\x9b\xcd\xcaM\x1b\x08\x04T\xb5\x22\xa7\
+\xd3Iii)\x0d\x0d\x0d\xec\xda\xb5\x8b%K\x96\x00\
+G\x8a\xce\x1a\xe7J\x9e_\xe6F\x98\x84\x84\xa4\xbf\xff\
+\xfe\xfb\x5cp\xc1\x05,Y\xb2\x84\xab\xae\xba\x8a\xd2\xd2\
+RZ[[\x932>\x096\x1a(\xf4\x993\x00A\
+\xc5\x1b\x1b\x1bY\xb9r%?\xfe\xf1\x8f\x990aB\
+\xd2\xcd!\xe1\xbf&\x93\x89\xb4\xb44\xa5\x9eu\xe5\xfb\
+w8\x1c\x09\xc1(\xf2\xc2\x93\xd9\xb6\xb2\xb8uPl\
+\xf7\xee\xdd\x0aa\x96\xd0M=v\xc0\xe5r\xf5J\xfa\
+\xcb\x02Y\xf1\xce;\xe4\x17\x0cb\xdc\xb8q\xb4\x87\xfa\
+\x96\xedg\x1c\xe7\xe6\xcd\x9b\xd9\xb2e\x0b_\xfd\xeaW\
+\xa9\xa8\xa8\xe0\xddw\xdf\x05\xa0\xa0\xa0\x80\xd4\xd4T\xde\
+y\xe7\x1d\xd2\xd3\xd3\x13Z\xa8\xd7\xd7\xd7SXX\xd8\
+\xab\xeaD\x024\x1a\xa5p\xb2\x82\xaa:0(\x92\xad\
+\xab\xac\xcb\xee\xb4\x00\xf1\xc5K\x8d\xbf\xdehG\xfa1\
+\x12\xe5\x97\x9e\x9eNaa\xa1\x8a\xb0|\xf6\xd9gY\
+\xbdz5\xd3\xa6MSe\xda\x01\xe55\x12M\xec\xc9\
+'\x9fd\xc8\x90!\xaa\xf7\x9f^K\xc28\x07\xe2\xee\
+\x95y\x14\x0d\xa4\xba\xba\x9a\x94\x94\x14\x86\x0d\x1b\xa6Z\
+\xd5\x15\x17\x17STT\xd4\xa3\x998\x10\xe83g\x00\
+\x22\x95_}\xf5U.\xbc\xf0BU\xe0!\xd9\x02\x11\
+\xfb_6\xb6\x8e\xfe'\xf3\xfd\x0b\xf7\x96\x9ao:\xe7\
+6\xc6\xb7\xeb\xf6\xbf\x5c\xbb\xbc\xbc\x9ca\xc3\x86\xd1\xd4\
+\xd4DVV\x16C\x87\x0eU\x81?&\x93\xa9W\x0d\
+>\x84\xc1\xed\xdb\xbb\x97}{\xf6p\xc1\xa7\xd2\xa5#\
+\x1e\xed,\x1f\xa7\x97\x91\xeb\x81$\x022\x1c\x0e\xf3\xce\
+;\xef`\xb5Z\x991c\x06\xb9\xb9\xb9<\xfb\xec\xb3\
+\xea\xb8K/\xbd\x94\xd7^{\x8d\xaa\xaa*\x95\x1e\x1a\
+\x8b\xc5T\xeeyW\xf3\x9bl\xecF\xb5To\x06b\
+\x1c\x1b\xa0\x80Xc\xbd\x00Hl\xbc\x92\xec\x1a\x12&\
++\x0c\xa0+\xd7\xa4N\xba\x0bR\xcf\x02moo\xe7\
+\xa7?\xfd)\x8f<\xf2\x08W^y%+V\xac \
+%%\x85\xd1\xa3G\xb3b\xc5\x0aF\x8e\x1cIZZ\
+\x1a\x16KgW\x9fu\xeb\xd6QYY\xc9\xb7\xbe\xf5\
+-u\xbe\x08\x0b#\x89\xc6!\xcf\xad\x9b\x9e\xd2\xa2N\
+$\xbb\x1e\x84t*\xd0g\xca\x00L&\x13n\xb7\x9b\
+U\xabV\x91\x97\x97\xc7\x03\x0f<\x00\x1c\xad\xfa\xcb\xb1\
+\x02\x12\xe9\xbd\xd8\x93\x81\x7f\xb1Xg?:Q\x95\xa5\
+\xa2\x8f\x5cG$\xb8N:\xbam6\x9b9x\xf0 \
+555\xe4\xe5\xe5\xd1\xd8\xd8\xc8\xd8\xb1c\xb1X,\
+\xcatp:\x9d8\x1c\x8e\x1e7\x92H\xc2\xe5+V\
+0q\xfc\x04\xd2RSi\x0d\x06\xc0dR\xb5cz\
+\x92\x09\xf2l\xb2\xc9>\xfc\xf0C\xb6o\xdf\xce\x88\x11\
+#\xb0\xd9l\x5c\x7f\xfd\xf5<\xf3\xcc3\x1c<x\x10\
+\x80\xe9\xd3\xa73a\xc2\x04n\xb9\xe5\x16\xa5\xc1\xc8B\
+\xecN\xba\x1a\xedz}\xa1\x1b\xc7b$a\x0cbj\
+\x19k1\xe8d\x04_\x85$\x91E\xea\x00\x18\xc3\x94\
+u\xb0\xd6\xf8\x99\xfe\x0c\x12#\x91\x93\x93\x83\xc5b\xa1\
+\xbe\xbe\x1e\xb7\xdb\xcd\x1bo\xbc\xc1\xd8\xb1c9\xfb\xec\
+\xb3y\xe8\xa1\x87\x08\x85B*\xe3n\xd5\xaaU\x5c\x7f\
+\xfd\xf5\xe4\xe7\xe7\xd3\xdc\xdc\xac\xae\xd5\x95\x1bN7\x1f\
+u|\xc0d:\xd2\x13\xf1d\xdb\xf3\xc7B\x9f)\x03\
+p\xbb\xdd|\xf4\xd1G\xf8|>\x1e\x7f\xfcq\xf2\xf2\
+\xf2\x92n~\x91\xa2\x02n\xe5\xe6\xe6\xaa\x17 \xd2\xdf\
+\xb8@\x04\xb1\x15\xc0NWI\x8d\x0bP\xd4j=\xc2\
+m\xdb\xb6m*h\xc4\xe1pP\x5c\x5c\xac\xa4\xbf\x8c\
+\xbd7\xb6\xbf\xddng\xe3\xc6\x8dD\x22\x11\x16\x9c\xbe\
+\x80H,zL\x93,\x1aJ0\x18\xe4\x9dw\xde\xc1\
+\xedvSTTDmm-K\x97.%\x1a\x8d\xaa\
+\xe87\xe8\x0cA-//\xe7\xbe\xfb\xee\xa3\xa0\xa0\x80\
+\x86\x86\x06|>\x9f\x8a\xb0K6V\x9dtmI\x9e\
+S\x07\xde\x8c\x9e\x001\x9fB\xa1\x90J\xd4\xe9jn\
+DR\xeb\xd7\x85#\x0c@\x5c\x9a=\xcdow\xe3\x8f\
+\xc7\xe3\xf8|>\xda\xdb\xdb\x13\xba\xe7\xce\x9f?\x9f\xcb\
+/\xbf\x9c1c\xc6\xf0\xd0C\x0f\xf1\xcb_\xfe\x92\x8f\
+?\xfe\x98\xef~\xf7\xbb\xcc\x9f?_E\x98\xea\xcfm\
+$]\xeb\xd0\xd7\x5c,\x16S\xa6\xe9@\xb2\xeb\xfbB\
+\x9f\x19\x03p\xb9\x5c\x94\x97\x97SQQ\xc1\x83\x0f>\
+\xc8\xf8\xf1\xe3\xbbt\x89\x89\xe4\xfb\xf8\xe3\x8fq:\x9d\
+\xa4\xa6\xa6*\x15+\x99\xef_\x8aQ\xc2\x91\xcd\xae\x87\
+\xc6&{9r\xbc\xdc\xab\xac\xac\x8c\xd4\xd4T\x02\x81\
+\x00\xa3F\x8dRv\xb3\xd1\xb5\xd8\x15\x97\x17\x9f\x7fK\
+K\x0b\xabV\xad\xe2\xec\xb3\xcf\xc6b\xb1\x1e\xb3\xed/\
+\xcf\xf8\xf1\xc7\x1f\xb3a\xc3\x06&L\x98\xa06OQ\
+Q\x11_\xfa\xd2\x97\xf8\xedo\x7f\xab\xdcH)))\
+\xfc\xedo\x7f\xe3\xef\x7f\xff;o\xbe\xf9&\x1d\x1d\x1d\
+\x09\xe5\xcc{3\x06\xa3\x0a\xac3\x00\xe3qR\xa8C\
+\xcaTw\x15\x12-\x9b+\xd9\xc6\x92\xb1\x8b\x0b1\xd9\
+\xbddSv\xc5\x18d#\xb6\xb7\xb7\xab\xa4%]K\
+\x1b?~<7\xdcp\x03\xff\xfb\xbf\xff\xcb\x1f\xfe\xf0\
+\x07***\xf8\xfe\xf7\xbf\xcf_\xff\xfaW***\
+\x14\x8e\xd0\xdbPf]\x1b\x08\x04\x02dee1r\
+\xe4H\xda\xda\xda\xba\x05B\x07*}&\x0c\xc0\xe9t\
+RWW\xc7\xbe}\xfb\xf8\xef\xff\xfeo\xce8\xe3\x8c\
+\x84$\x0d#9\x1c\x0e\xb6n\xdd\xca\x96-[\x94\x0b\
+KW\xb5t\x92\x0d*\x12H$\x92^\xe1\xc7\xb8q\
+eaK\x12Gmm-\x15\x15\x15dddt&\
+\xce\x94\x94$\xf8g%\xdd\xb7\xbb\xc5!\x0bh\xd9\xb2\
+e\xe4\xe5\xe5QZZJ\xfb1&lH\xc8kK\
+K\x0b/\xbf\xfc2V\xab\x95a\xc3\x86\x11\x08\x04T\
+\x0e\xc0/~\xf1\x0b\xc2\xe1\xb0\xd2\x02\xda\xda\xda8\xf3\
+\xcc3\xf9\xe5/\x7f\xc9O\x7f\xfaS\xd6\xad[\xc7\xe0\
+\xc1\x83U\xcc@2\x14\xbf+u:\x99\x06\xa0\x1f#\
+\xcf+&\x80nN\x19\xef\x01]\xb7h\x17\xed\xaf\xa7\
+vb\xdda\x03b\xc2\x09^\xa2\xbb\x7f\x9b\x9b\x9b9\
+\xe7\x9cs\x988q\x22MMML\x9f>\x9d\xe7\x9e\
+{\x8e\xfb\xee\xbb\x8f\x07\x1f|\x90\x9f\xfd\xecg\xea\xba\
+F\x09\xdf\x13\xc9z\x04\x981c\x06\xb5\xb5\xb5\xfff\
+\x00F\x12\x95\xb8\xad\xad\x8d\x1d;vp\xfb\xed\xb7s\
+\xfe\xf9\xe7+\xfb4\xd9\xf1\x0e\x87\x83\xf6\xf6v\xde~\
+\xfbm233\x95\x0d+\xe7\x18c\xd0%\xfcU\xb7\
+a\xf5\xca4z};\xe1\xde\x22\xbd\x84\xca\xca\xcaT\
+\xac\xb5\x94\xfa\x16?\xadH\x7f=\xa8$\xd9\xb8\x9dN\
+\xa7jO\xf5\xc5/~\xb1\xf3\xde\xb1\x18&S\x22\xf6\
+\xd7\x07\x0c\x90\xcd\x9b7\xb3~\xfdz\xa6M\x9b\x86\xc9\
+\xd4\x99\x96+\x8d(G\x8e\x1c\xc9\xcd7\xdf\xcc\x0f~\
+\xf0\x03B\xa1\x90r;\xfe\xecg?\xe3\x07?\xf8\x01\
+\xf7\xdf\x7f?\x85\x85\x85\xaadTo\x17v2\x0d \
+\x99\xba-R\xbf+\xfb^\xa7\xaep\x05Q\xbf%\x96\
+\xbe\xa7\xeb\xc8\xbduf\x92\xec>:C\x90\x0a\xba\xb1\
+X\x8c\xc3\x87\x0f\x13\x08\x04\xb8\xe8\xa2\x8bX\xb5j\x15\
+_\xfc\xe2\x17\xf1\xf9|\x09Q\x83\xddi\x1bF\x925\
+4g\xce\x1c\xb2\xb2\xb2hjj\xear\x8d\x0cT:\
+a\xa3\xd5\xc3$%\xd8\xe7\x8a+\xaeP>Y8\xfa\
+\x05\xca\x82\xfb\xc7?\xfe\xc1\x96-[\x982e\x8aZ\
+d\x92\xa7nT\xffE\xfa\xc3\x91j2\xd2\x9f/\x1e\
+\x8f'$\xc0\xc89\xa2!\x08\xc7\xde\xb5k\x17fs\
+g\xd9\xa7\xe1\xc3\x87\xab&\x91\xe2\xcf\x17\x06\xd2\x15@\
+$\xd5\x80V\xacX\xc1\xcc\x993III9\x82\x1f\
+\xe8\xc8_/Q@y\x9e7\xdex\x03\x87\xc3\xc1\xb8\
+q\xe3hkkc\xe8\xd0\xa1\xd8l6\x850\xdf{\
+\xef\xbdX\xadV\x96.]\x0a\xa0\x02T~\xfd\xeb_\
+s\xdey\xe7q\xe8\xd0!\xa0\xfbz\x83\xfas\x19c\
+\x00d\x8e\x8c\xc0\x97\xcc\x87DOvG\xba\x0ao\x9c\
+?)\x95%\xdds\xfaBF/\x90\x8cW\x7f\x16I\
+\x18\x13\xc1!.\xdc\xe6\xe6f\xf2\xf3\xf3Y\xbcx\xf1\
+QLL\xbf\x06$7K\xe4\x9e\xd0\x19a\x98\x97\x97\
+\xc7\xc5\x17_LEEE\xd2\x1a\x14\x03\x99N\x08\x03\
+\x10\x89h\xb5Zy\xe9\xa5\x97(..V\xee>\xb1\
+\x95\x8c\xe9\xba\x82\xe4\xd6\xd6\xd6\xf2\x9b\xdf\xfc\x86\x91#\
+G*uW\x92>\x92\xbdt\xbd4\x93\xe4\x89\xeb\xd1\
+\x7f\xc9\xba\xe0\xca\x06\xb3\xdb\xed\x04\x02\x01*++\xf1\
+x<\x0c\x1e<\x98\x94\x94\x14\x15G \xcc\xc5X\x03\
+\xceHV\xab\x95\xb5k\xd7b\xb5Z\x995kV\xd2\
+\x1a\x85}\x99;\xe9\x8b\xf8\xf6\xdbo3o\xde<\xe5\
+~\xd4Cz\x03\x81\x00)))\xbc\xf0\xc2\x0b<\xf2\
+\xc8#<\xf1\xc4\x13*\xeb\x10`\xe6\xcc\x99\x09\xed\xcc\
+z\x22\xb1\xa5\xf5\x8d*\xaatw\xc0\x98\x8e\xaft\x17\
+,d|Fy\x06\xb7\xdb\xad\x04Eo\xc7i4\xe7\
+\xba\xd3\x1a\x8c\x12]\x98\xa1\xdf\xefW\xa1\xd2\xfa8\x8d\
+U~\x8cc7z\x9f\x04s\xb8\xe2\x8a+\xc8\xce\xce\
+\xa6\xa2\xa2\x22i.\xc0@\xa5~g\x00\xb2\xf9\xcdf\
+3\x7f\xfb\xdb\xdf(((\xe0\xf1\xc7\x1f'---\
+\xa1\xee\x9aq\x82\x04\x08\xba\xf1\xc6\x1bihh\xe0\xc2\
+\x0b/\xc4\xedv+?\xb8\x04\x0a\xe9/F\x22\xff\xe0\
+H\x98\xa6\x94\xa52\x99\x12\x1b\x5c\xc8\xd8t\xc9o2\
+\x998t\xe8\x10\x15\x15\x15\x14\x15\x15\xa9\xd6\x5c\xb2\x08\
+$\xff\xbb;\xe9\xefv\xbbinnf\xe3\xc6\x8d\x9c\
+s\xce9j,\xc7Jr\x9f\xd7^{\x0d\xbf\xdf\xcf\
+\xacY\xb3hjjR\x01?:#\x0c\x87\xc3,Y\
+\xb2\x84k\xae\xb9\x86\xeb\xaf\xbf\x9e\xf2\xf2r\xbc^/\
+\x81@\x80\xbd{\xf72v\xecX\xe0\xe8*\xbe\xc6g\
+H\xb6\xd8e\xae\xbacd2/z\xd7`\xfd|!\
+\xdd\x0c\xd3)\x18\x0c\xe2v\xbb\x15\x93\xedo\xd2=\x17\
+\xbaP\x10LB\xc7&\x8cZNO\xa4\x9b\x95MM\
+M8\x1c\x0en\xb9\xe5\x16***\x08\x06\x83\xc7\xd5\
+\xb0\xf3\xb3\xa4~g\x00\x22\xad\x9ez\xea)rrr\
+x\xee\xb9\xe7(,,L@\xfc\xf5I\x97B\x09m\
+mm|\xfd\xeb_\xe7\x95W^\xe1K_\xfa\x12\xc3\
+\x87\x0fW~x)\x0cj\x5c@N\xa7S\x85\xf3\x8a\
+\xd4\x95L@8\xb2\xf0\x84D\xfd\x17\x17\x16tf\xd7\
+\xb5\xb4\xb40~\xfcxe\xfb\x03\x095\x05\x92\x01\x5c\
+pD=|\xed\xb5\xd7\x18<x0\xc3\x87\x0f?\xee\
+2M.\x97\x8b@ \xc0_\xff\xfaWf\xce\x9cI\
+ff&\xa1P(\xa1\x8f\x9c\xcc\x85H31\x01$\
+\x9f\xa2\xbd\xbd\x9d\xc6\xc6Frss\x81\xde\x99\x00\xba\
+{\xab7\xa4KM\xa36g<\xceXgP\xce\x95\
+2\xd9\xd2\xceMg6\xbd\x05\xe4\xba\xd2:\xba:N\
+we\x1a\xcf\xd7\x83|zs\x7f\xf9\xdef\xb3\xd1\xd0\
+\xd0\xc0\xf4\xe9\xd3\xb9\xe5\x96[X\xb1b\x05mmm\
+**s S\xbf0\x00Y\x90\x1e\x8f\x87\xe6\xe6f\
+\x1ey\xe4\x11\x8a\x8a\x8a\x94\x06\xd0U\xc6\x93\x14q\xdc\
+\xbd{7\x17_|1\xcf?\xff<\xe3\xc7\x8fg\xc1\
+\x82\x05*\x86[\xca6%K\xfb\xd5\xd3>\xa5H\x87\
+\xbc\xdc\xee\xd4\x7f]\x0b\xd8\xb2e\x0b\xc5\xc5\xc5\xaa\xc4\
+\xb2\xbc0\x09t1\xda\x84\xfa\x18\xa4<W}}=\
+\x17\x5cp\x81\xfa\xfcx\xe9\xf5\xd7_g\xf7\xee\xdd\x9c\
+}\xf6\xd9\xb4\xb4\xb4PXXHNNNB\xcc\x84\
+\x80\x99\x91H\x04\x8b\xc5\xc2=\xf7\xdc\xc3\xea\xd5\xaby\
+\xf6\xd9gU\xb3\x0b\xb1\xad\x93\x99N\xc9\xa8\xab@\x9c\
+\xae(\x1e\x8f'\x04]\xe9\xa4o2=\x10K\xbfw\
+$\x12\xc1\xe1p$\xb8\x10\xfb\x82\xc4\xeb\xe3\xe8-\x19\
+1\x0f]\xf2ww\x1d\xe3\xf7\xfa\xff2\xf6\xd6\xd6V\
+\xae\xb8\xe2\x0a\xbe\xfb\xdd\xef\xf2\xc6\x1bo\xe0\xf3\xf9\xba\
+,\x0e2P\xe8\xb8\x19\x80\xd8\xac\x1e\x8f\x87={\xf6\
+\xf0\xc8#\x8f0y\xf2d\x96-[\xa66\xbfq\xe2\
+D\xea\x9b\xcdf\x9ex\xe2\x09\xce8\xe3\x0c\xfc~?\
+\x93'O\xa6\xb8\xb8Xu\x04\x96\x9c\x7f#\x8a-\xe8\
+\xbcHrq\xff\x88\xf4\x17\xdb4\x99\xdf^\xcc\x0f\xab\
+\xd5JMM\x0d{\xf6\xeca\xe6\xcc\x99x\xbd^\xe5\
+\xd6\x11\x84\xbb+\x14\x1cPRk\xe5\xca\x95\xcc\x9d;\
+\x17\xb7\xdb\x9d\x108\xd4\x97\xf9\x93\xdfb\xce<\xfd\xf4\
+\xd3\x8c\x1b7N\xcd\x9f\x94&\xd3\xe7A\x97h\x87\x0e\
+\x1db\xf6\xec\xd9\xaa5\xf8\xca\x95+q\xb9\x5cG\x15\
+\xe9\xe8jl\xb2)\x82\xc1`\x82\x89\xd1\x9b\xcd\xa8\x17\
+\xddHF\xf2.\x92yQ\xc4<;\x1e\x8d\xc9H\xbd\
+\xddl\xc9\x98\x5c\xb2\x0d\xde\x15c\xd0\xf1\x11Y'\xe1\
+p\x98\xe6\xe6f\xbe\xf9\xcdo\xf2\xf3\x9f\xff\x9c\x97_\
+~\x99\xda\xdaZRSS\x07,\x138n\x06 5\
+\xdaV\xaf^\xcd\xcb/\xbf\xccm\xb7\xdd\xc6\xeb\xaf\xbf\
+NNN\x8er\xa5\xc1\x11-\xc1\xedvc\xb7\xdb9\
+t\xe8\x10\xd7_\x7f=_\xff\xfa\xd7\x199r$K\
+\x96,\xe1\xd0\xa1C\x8c\x1b7N\x99\x11:\x82+\xa4\
+3\x10y\x81\x12\xfb\xaf\x87\xa3J\x08\xaf\xbea\x8c\x1d\
+n\xca\xca\xca0\x9b\xcdL\x992E\x8dU\x18\x9a\x98\
+\x16:\xee`\xf4$\xbc\xfb\xee\xbb\xc4b1U0\xa4\
+/\x0b\xd9\xb8\xb0d\x11\xbd\xf7\xde{\xac[\xb7\x8e\x0b\
+/\xbc\x90\xf6\xf6v233\x15#0n \x8b\xc5\
+\xa2j\xe1777s\xf5\xd5W\x93\x96\x96\xc6\x0f\x7f\
+\xf8CRRR\x12\xb2\xecz\xda\xd4\xe27\xf7\xf9|\
+\xbdV\x83e\xfc\xdd\xe1\x04\x12\x9d\x99\x0c\x18\x15\xa6p\
+<\x9b\xa3\xaf\xbe{H\xd4t\xba\xa2\xae\xf0\x0c=a\
+J\x84\x8f\x8e\x95\xc4b1\xda\xda\xda\xf8\xeaW\xbf\xca\
+\xef\x7f\xff{\x96/_\xae\xca\xddu\x17-y\xb2\xe8\
+\x98\xca\x82\x0b@\xe4\xf1xhkk\xe3\x99g\x9eQ\
+m\x8c\xaf\xbe\xfaj\x00%M\xe5\x05\xe9e\xba\x1ey\
+\xe4\x11~\xf5\xab_\x11\x08\x04\xb8\xfa\xea\xab\x19<x\
+0\x07\x0f\x1e$\x1a\x8d\xaa\xaa9\xba\xebO\x0f\xb0\x90\
+\x22\x8f\x92\xc0#\x01=\xba]oL\xfe\x911\x8b\xfd\
+//k\xe3\xc6\x8d\x8c\x1e=\x9a\xa2\xa2\x22\xea\xea\xea\
+\x94\xbd\xaa\xbb\x09\xf5\xcd#@YJJ\x0a\xad\xad\xad\
+l\xde\xbc\x99\xf3\xcf?\x1f\xa0\xcf\xa9\xbe\xc6\xb1\x89\xf4\
+\xff\xe3\x1f\xff\xc8\xe0\xc1\x83\x19?~<\xf5\xf5\xf5*\
+\x06\xc0X\xc9X\x9e\xc7\xe7\xf3\xd1\xd6\xd6\x86\xd3\xe9$\
+//\x8f\xff\xfe\xef\xff\xe6\x86\x1bn\xa0\xa3\xa3C\xc5\
+\xd8\xeb\xe37\x8eQ\xde%t\xfa\xe5M\xa6#\x15\x7f\
+{\x8a\x8e\xeb\xcd\xf3\x0a\x83\xd6\xcb\xbc\xe9dL\xae\xe9\
+I[1\x8e\xbd\xafLW\xeei<\xbf;,!\xd9\
+\xdf\xfa8u\xc0T\xe2\x0f|>\x1fW\x5cq\x05E\
+EE,]\xba\x94\x1d;v\xb0`\xc1\x02\xf2\xf3\xf3\
+\xf1\xfb\xfd\xc7\x9c\x1a\xde\xdf\xd4g\x0d@$\xa4\xd7\xeb\
+e\xd7\xae]\xfc\xeew\xbf\xc3\xe9t\xb2f\xcd\x1a\xae\
+\xbe\xfaj\xe5\xe7\x97I\x91\xf2Y&\x93\x89\xbf\xfd\xed\
+o,X\xb0\x80\xdbo\xbf\x9d\xe1\xc3\x87s\xc3\x0d7\
+\x90\x9b\x9b\x8b\xdf\xefWe\xb7\xa5\x0f\xbaH\x7f\xe3F\
+1\x99\x8e\xf4\xaa\x97\xc5eT\xff\xbb\xca\xb9\x16\xb0J\
+\xcaB\x95\x97\x973g\xce\x1ce\xa3\x8a\x96\xa0k\x00\
+\xc6\x85!\x8b\xf5\xcd7\xdf\xa4\xa8\xa8\x88Q\xa3F\x1d\
+w\x89f\xd9t[\xb7ne\xf9\xf2\xe5|\xf1\x8b_\
+T\xad\xc8\x07\x0f\x1e\x9c\x90\xfdh\xdc RW_Z\
+\x93\xe5\xe6\xe6\xb2p\xe1B\xca\xca\xcaz\x95\x91&\x8c\
+$\x14\x0aQWW\xa7p\x03#:\xde\x15\x89\x84\xef\
+\x8aDK\x11\x81`|n]\x9a\xf6\x97t4\xaa\xef\
+F/\x87lV\xe3\x8f0#\xdd<0\xfe$\xbb\x8f\
+\x80\x9c\xc6\xec\xd3\xfa\xfaz\xe6\xcc\x99\xc3\x8a\x15+X\
+\xb2d\x09\xcb\x96-\xe3\xa9\xa7\x9e\x22\x10\x08\x90\x96\x96\
+6 \xb4\x81>1\x00\x01\xbe\x5c.\x17+W\xae\xe4\
+\xc5\x17_\xe4\xaa\xab\xaeb\xd3\xa6ML\x992E\x01\
+vN\xa7S\xf9w\xc3\xe10\xcf=\xf7\x1c3g\xce\
+\xe4\xb2\xcb.\xa3\xad\xad\x8d\xeb\xaf\xbf\x9e\xb9s\xe7\xd2\
+\xd1\xd1\xa1\x8am\xb4\xb6\xb62{\xf6lU\xcaIZ\
+A\xe9\xd2A\x10g\xa3\xabOo\x02*L\xc1\xa8\xfe\
+\x1b\xe3\xd57o\xdeLVV\x96\xea\xbc*\xd2^6\
+\x7fW\x11p.\x97\x8b\xdd\xbbwS^^~\xcc5\
+\xfe\x8c$\x12\xe9\xd1G\x1f%//\x8fY\xb3f\x11\
+\x0a\x85\x183f\x8cz\x9ed\x8b\x0f\xa0\xae\xae\x8e\x8e\
+\x8e\x0e\xbc^/\xb9\xb9\xb9\xaa\x08\xc8\x19g\x9c\x91\x94\
+y&#\xb3\xd9LKK\x8b*\xbd\xa6\xab\xf6\xbd\x01\
+\x02{\xfaNR\xb8\x93\xdd\xd7hZA\xef=\x11\xc7\
+J\xc9\xfc\xfdr\xff\xbenJ\x99#\xe35\xa4}z\
+]]\x1d\xe9\xe9\xe9\xdc{\xef\xbd\xacX\xb1\x82y\xf3\
+\xe6\xf1\xc2\x0b/\xb0i\xd3\xa6>WR>\x11\xd4k\
+\x13@\xec\xf7P(\xc4\xb2e\xcb\xa8\xaa\xaa\xe2\xe1\x87\
+\x1f\xe6k_\xfb\x9a:Fw\x07\xed\xdd\xbb\x97\xbf\xfd\
+\xedo<\xfa\xe8\xa3\xec\xd8\xb1\x83\xbc\xbc<\xae\xbf\xfe\
+z\x8a\x8a\x8a\x08\x87\xc3\xaa\xa2\x8d\x98\x05\x16\x8bEu\
+M\x0d\x87\xc3I\xddi2\x06Q\xfb\x05\xed\xd7\xa5\x96\
+^/@g\x00\xf2BDS\xd8\xbe};\xb3f\xcd\
+\xc2\xe9t\xd2\xdc\xdc\xac^\xa0\x94\x14\x13\xc9\xa6\x8fA\
+\x9eo\xf5\xea\xd5\xcc\x9a5K\xf9\xdc\x8fg\xc1\xca\xd8\
+\x0e\x1e<\xc8K/\xbd\xc4\x97\xbf\xfce\x00\xbc^/\
+\x85\x85\x85\x09\xaa\xa2\xbe\xd0\x84i\x1c>|X1\xc1\
+\xf4\xf4t\x22\x91\x08MMM\xa4\xa6\xa6v\x1b`c\
+\x5c\xe8\x07\x0e\x1cPE+\xe5\xb9\xbb\x0b\x04\xea\xed\xb3\
+\xc9\xb8\xdb\xda\xda\xd4\xe7\xc20\xf5\xa2\x22\xfd\x0d\x06&\
+#\xe3\x9a\xe8\xefk'3\x0b\xa4|\xb9\xcdfc\xcc\
+\x981<\xf6\xd8c\xac[\xb7\x8e\x1f\xfe\xf0\x87\xd4\xd4\
+\xd4\xa8>\x17'\x8bzd\x00b\x9f:\x1c\x0e\x0e\x1e\
+<HYY\x19\x0b\x16,\xe0\x8e;\xeeP~\xe6p\
+8\xac\x12j\xf6\xec\xd9\xc3\x9a5kx\xf1\xc5\x17i\
+hh\xa0\xb8\xb8\x98\xab\xaf\xbe\x9a\xe2\xe2b\xa2\xd1(\
+-\x9fv\xacQ\x03\xb0Z9|\xf80EEE\xcc\
+\x981C]/\x99\xf4\xb7\xd9l\xca\xf6\xd7\x01\x18\xfd\
+\xefd\xc9?\xa2\xe6\xca\xfd\xf6\xef\xdf\x0f@ii\xa9\
+\xda\xc0\xed\xed\xed\x8aIt%\xfdm6\x9bJ\xf5\x15\
+\x0d\xe6x\x17\xad\x9c\xff\xec\xb3\xcf\x12\x8f\xc7\x991c\
+\x06~\xbf\x9fi\xd3\xa6\x01\x89M7\x8c\xcf\xd3\xd1\xd1\
+Acc\xa3z6\x09u\xd55\x9e\x9e\xee-\xcf)\
+\x1dz$\xa3\xb1\xb7c\xef\xcd\xf3\x8b\x86g$a\x00\
+\xc6N\xcd}A\xf2\xa1g-\xc4\xb89\x8f\x95\xfa\x82\
+9\xc8s\x01\xaa\x8eDmm-^\xaf\x97\xd9\xb3g\
+\xb3t\xe9R\x1e}\xf4\xd1\x84\x02\xaf'\x83zd\x00\
+v\xbb\x9d\xe6\xe6f>\xfe\xf8c\x1a\x1a\x1a8\xeb\xac\
+\xb3\xb8\xec\xb2\xcbT\x91\x8a\x8a\x8a\x0a\xb6m\xdbFe\
+e%\xad\xad\xad*\x0aj\xfc\xf8\xf1\x8c\x1c9R\xd5\
+\xf2\x93\xd2\xc7\xc9\xae_UU\xc5\xe5\x97_\xae\x5cQ\
+\xc1`\xb0K\xf5[\xd2|\x8d\x08\xac\xd4\x88\xd3\x9b6\
+\xc8y\x12 $/o\xdf\xbe}\x0c\x1f>\x9c\xf4\xf4\
+t\x02\x81\x80R\x07\xe5\xfaF\x06 L\xb0\xa3=\xc2\
+\x9a5k\x987o\x9ejWv\xbc\x0bJ\xb4\xaa\x17\
+^x\x81s\xcf=W\xb97\xa57\xa2Q\xc5\x94\xbf\
+\xa5\x88iKK\x8b\xd2\x8aD{\x01T\x9f\xfb\xae\xd0\
+l!\x19\xbf\x14\x1a\xd5\x01W\xdd\x0b\xd2\x15\xf5\xe6\xf9\
+\xa5C\xae\xfe^\xe0H\xacEW\xb1\x04\xbd\xa5c\xc1\
+\x0f\xfa\xaa\x09\xf4\xe5\xfa\xc9\x98\x8d\x80\xd4R6\x5c\xca\
+\xa1\x9d\xec\xe4\xa1n\x19\x80LlSS\x13\xb1X\x8c\
+\xf1\xe3\xc7\x13\x8f\xc7\xb9\xf7\xde{\x95\xea)\x80\xe0\xe0\
+\xc1\x83\xf1z\xbd\xaaB\xabH\xa8\xb6\xb6\xb6nQd\
+i\x82x\xc6\x19g\x00\xa8\x06\x09\xc9\xa4\xbf\x9e\xe5'\
+v\x9c,\x1c\xd9\xb4\xc64c\xdd\xae\xb7\xdb\xed\xf8|\
+>\x1a\x1b\x1b\x13:\xfdHU[\xe3\x06\xd0\x06\xda\xd9\
+\xdc\xe3\x9f\xff\xc4\x9d\x92\xd2\xd9\xda+I\x90\x91\xd1\xad\
+\xd7\x13\xc91\xaf\xbc\xf2\x0a\xf5\xf5\xf5\x9cs\xce9\x84\
+\xc3a\x15\x07\xd1UN\x81\xa8\xe7\x95\x95\x95D\x22\x11\
+rss\x95v$\xc7K\x9d\xbe\xee\xf0\x09\xd1$\xe2\
+\xf18\x07\x0f\x1ed\xd4\xa8Q\x09\xcf\xd1\xdb\x8d\xd5\xd5\
+1\xbaY\xd5\xda\xdaJ8\x1c\xc6n\xb7'\xd40\x80\
+\xcex\x8f\xae\xa2\x09\x8dc\xe8\x0e\xad\xef\xea|\xfdw\
+_=\x07\xc7z\x8e~\x7f\xdd\x94\xf4x<ttt\
+\xb0l\xd9\xb2\x01\x11\x1f\xd0-\x03\x88\xc7;\xb3\xe9\x06\
+\x0f\x1e\xcc\xa8Q\xa3\x88\xc5b\x04\x83AF\x8d\x1a\xa5\
+JfA\xa2\xbbH\x22\xf0z\xd3%\xd6\xe9t\xf2\xd1\
+G\x1f1j\xd4(\xc6\x8d\x1bG<~\xa4\xd9\xa7\xd1\
+5d\x94\xfe\xb2\xd9\xc5\xce\x15\x8d \xd9\xa6\x11\xe9o\
+6\x9b\xd9\xb3g\x8f\xea,#\xaa\xae\xa8\xbeFi+\
+\xf7v\xbb\xdd445\xb2u\xdb6.\xf9\xc2%\xc0\
+\xa7\x9b\xb3\x97~\xe4dd2\x1di[\xf5\xe4\x93O\
+2o\xde<U\xe7>##\x03\xbf\xdf\x9f\x94\x19\xe9\
+\x8b\xa9\xaa\xaa\x0a\x9b\xcd\xa6\x80Y\xd1\x1e\x04\x03\x11\xcd\
+\xa8;\xb2\xd9l\xb4\xb4\xb4\xe0\xf3\xf9\x94\xb6&\xe3\x93\
+\xe7\xe8I\x03\xe8\x09\x04\x95\x96f\x81@ \xa1\x85\xb8\
+\x84\xca\x8a\xab\xf7X6\xc3\xb1\x9e\xd3\x1ds\xeb+\x03\
+\xec\x89t\xf7\xb4\xd5j\xe5\xa1\x87\x1eb\xe3\xc6\x8d\x5c\
+q\xc5\x15\x03\xbf/\x80LB \x10H\x88\x94\x8bF\
+\xa3\xaa\xfbj(\x14RQdz\xf9\xed\x9e(\x16\x8b\
+\xd1\xd0\xd0\xc0E\x17]\x04tv\x995\x86\xfd\xca\xa4\
+9\x9dN5\x1eq-\xc9w\xb2\xc8\xe53\xa3\xdfV\
+\xa4cGG\x07\x95\x95\x95\x14\x16\x16\xaa8\x01a\x18\
+.\x97\xab\xcb\x90V\x80\x95\xabVRP8\x88\xe2\xc1\
+Ch\x0b'\x8f\xf7O\xe6.\xea\xca\x9d$.G\x09\
+\x14\x91D\xa2\xd1\xa3G'\x05\xc5\xe4oqW\x89M\
+)RD\xca\x95Kz\xab\xce\x94\xbb\x92^\xba'!\
+\x12\x89\x90\x9d\x9d\x9d\x00H\x89y\xd5\x9d\xf4\xeb\x0dH\
+\xe8v\xbbioo\xa7\xb9\xb99\xe1\xb9\xa4\xbd\x9a^\
+c\xbf\xab1v5\x9f'\x82\xf4k\x1f\xef}d\xfe\
+\xa3\xd1(^\xaf\x97\xe6\xe6f\x9e|\xf2If\xce\x9c\
+yL^\x87\xfe\xa6^\x19 \xc6\x81&\xf3\xb1\xf6\x95\
+\xacV+UUU\x8c\x1a5\x8a\xf3\xce;\x0f@\xd9\
+\xfeF\x00O\xdaB\xeb\x9cYZR\xcb\x02\x95\xbc\x01\
+\x9d$^^\x22\x00+++q:\x9d\xe4\xe7\xe7+\
+\xce+9\x04\xa2%\x18\x9f\xd3\xe5rq\xb8\xb6\x9a\xca\
+CU\xcc\x9f\xbf\xe0\xd3\xeb\xc6{\xac\xea\xd1\xdd\xc21\
+\x99LJs\xb9\xff\xfe\xfb\x99;w.\xc5\xc5\xc5\x14\
+\x17\x17\xe3t:U\x89\xead\x8b_\xf0\x88\xda\xdaZ\
+\x02\x81\x00\xe9\xe9\xe9\xc0\x91lJat=\x05\xf1\xe8\
+T^^\xae\xaa\xe5\x0a\xf3\xe8\xed\xc2\x17\x1b\xdeH\xfa\
+\xba\x10\xd7\xa2\x11\x08LMMU1\x08\xc9\x98]o\
+\xc6~\xac\x1b\xb4?7\x9eq\x0c\xfa:\xd5\x9f\xc5f\
+\xb3\xf1\xd0C\x0f\x11\x0c\x06U\xe2\xd8\xc9\xa6\x93\x86@\
+\xd8\xedv***8\xfd\xf4\xd3U\xf9\xabd\xdd~\
+,\x16\x8b\x92\xfeb\xb3J\xb3\x90\x94\x94\x14\xb5\xd8\x8d\
+\xc9?\xe2^\x92\xac>\xe8D\xbasrr\xd41\x91\
+O\x17\xae\x98\x17\xc6\x85$cy\x7f\xfd\x07\x14\x0f\x1b\
+F~n\x1e\x81P\x10\xcbqJ\x1eaL\xcb\x97/\
+g\xe7\xce\x9d\x9cu\xd6Y\xb8\xddn\x86\x0e\x1dzT\
+\xdas\xb2s\xa1\xb3-\xb8\x80gzZ\xb4\xe0\x00}\
+\x01\x97\x1a\x1a\x1ap\xb9\x5cx<\x9e^\xa72\xcb\xd8\
+t\x0d\xac\xabg\x95\xd8\x0da\x00rnVV\x96\x02\
+~\x8d\x9b\xfedK\xc6\xe3!\xa3\x10\x8bF\xa3\xe4\xe4\
+\xe4PVV\xc6\x8b/\xbe\xc8\xb4i\xd3\x8e;x\xac\
+\xbf\xe8\xa40\x00\xab\xd5Jmm-V\xab\x95\x8b/\
+\xbe\x18@\xa1\xf1\xba\xca)\xd2N\xef\x09`\xb3\xd9T\
+Ki\xa9\x17 R\xc8\xe8\x96\x13W\x98\xd5j\xa5\xb9\
+\xb9\x99h4JVV\x96\xb2\x91\xdb\xc3al6;\
+.\xa7\x13\xab!\xa2-\xf6\xa9\xe6q\xf0\xe0A\xf6\x97\
+\xefc\xc1\x82\xf9\x9d\xc5|\x8esa\xea.\xc9\x87\x1f\
+~\x981c\xc6PXX\xc8\x90!C\x94\x1b3\xd9\
+\xc2\x10\x86 \x1b[\xec\x7f\xa9\x81 \x0c@\xaa\x17\xeb\
+\xe1\xae]\x91\xdcG\x1a`\x1a;%u\xb7@\xf5x\
+\x84d\x0c@0\x08a\x00\x0e\x87\x83\xa6\xa6&\x00\x85\
+S\x08\xb32J\xc2\xe3\x0d\xac\xeaO:\x16\x0dC?\
+GZ\xb6\x03\xfc\x7f\xff\xdf\xffGjj\xaa\x8a\xd7\x18\
+\x08t\xd2:\x03m\xdd\xba\x95E\x8b\x161h\xd0 \
+Z[[\x93\xbaD\xc46\x17\x15_\xa4\xbf\x94a\x12\
+[9\x99\xfa\x0fG\xe2\xcc-\x16\x0bMMM\xa4\xa4\
+\xa4(\x89\x15\x89D\x88\xc5\xe38\xdcN\xac\x0e;Q\
+\xb3\x89\xb8\x09\xf5c\xb6vn\xa0\xe5o\xaf\xa0tT\
+)\x99\xa9i\x04\x03\x01\xcc\x980\xc5\xc1t\x1c|\xc0\
+n\xb7\xf3\xf6\xdbo\xf3\xde{\xefq\xd6Yg1h\
+\xd0 rrr\x8e*yn\xd4\x04\xc4$ill\
+T\xda\x8ct\xe6\x15-G\xb0\x8c\xde0\x009\xa6\xa6\
+\xa6\x06\xaf\xd7{T>~o=\x00\xc2\x00\x8cR\x5c\
+\xde\x8d\xc3\xe1 55\x95\x86\x86\x06\x95\x02,-\xdf\
+m6\xdbI\x07\xc2\x8e\x97\xf4w$\xefM\xe21\xe4\
+\x9d=\xf0\xc0\x03l\xde\xbc\x99)S\xa6\x1cS\xd6\xe8\
+\x89\xa2\xcf\x9c\x01\xd8\xedv\x0e\x1f>\x8c\xcdf\xe3\x86\
+\x1bn\x00H\xdaXA\x16\x8e\x84\x06C\xa7;i\xff\
+\xfe\xfd\xaa\x1d\x94\xa8Q\x12\xfbo4\x1fD\xf5\x0c\x87\
+\xc3\x84B!RSS\xd5\x8b\x09\x85BX-\x16\xdc\
+n\x17f\x8b\x05\x8c\xb6\xbf\xdd\xc1\xee}\xfb\x88D\x22\
+\x9cy\xfa\xe9\xc4c\xc7\xaf\x92\x0a\xf3\x03\xf8\xdd\xef~\
+\xc7\xd0\xa1C\x994i\x92\xeaY\xdf\x9b\xc0\x22\x93\xc9\
+Dyy9\xc1`PU+\x96\x1eu\xd0\xa9\x01\xe8\
+\x19\x8f\xdd]O6ykk+YYYJ3\xe9\
+\xcb\xe2\xec\x89I\x08\xe3\xce\xce\xce\xa6\xa5\xa5\x05\xbf\xdf\
+\xaf4\xb3P(\x84\xd3\xe9\xecu\xe0\xd1\xa9@:.\
+\x16\x8dF\xc9\xce\xcef\xe3\xc6\x8d\xdcw\xdf},\x5c\
+\xb8\xf0\xa4F\xfd%\xa3\xcf\x94\x01\xc8\x06\xd8\xb2e\x0b\
+K\x96,\xa1\xa0\xa0\x00\xbf\xdf\x9f\xb4\xe0\x87H\x7f\xf9\
+_\x0aPVUUQXX\x98p]I\xe6I\x86\
+\xfeKs\x0d=\xbbO\xaf\x1e\xec\xb0;\xd4=\x84\xcc\
+\xaa#\xcfF&N\x98\x80\xc3\xe5\x22\x18:\xbeJ?\
+\xea\xdaf3o\xbf\xfd6k\xd6\xaca\xf1\xe2\xc5\x9c\
+v\xdai\xaa6aOv\xbb|/\xf1\xfe\xc24%\
+\xef\x1fP\x89W\xbd\xb1\xa5%\x98\xc9\xef\xf7\xab\xd8\x8d\
+\xbeRO\xa5\xb0\xe5\xfeR\x12\xae\xb1\xb1Q\x8dS\xbc\
+K\xd2\x99\xa7?(\x99\xc7\xa5\xabczs\x8dc\xb9\
+?t>\xb7\xa4c\xdf|\xf3\xcd\x14\x15\x15)\x8dm\
+ \xd1g\xca\x00l6\x1b\xd5\xd5\xd5\xa4\xa5\xa5%H\
+\xff\xeeZ}\x097\xb5\xdb\xed\xec\xdb\xb7\x0f\xe8l%\
+%\xd2\xdfd2%\x0d\xfe\x918l\x89\x17\x90\xc6\x1e\
+\x12\xdb`\xb1Xp\xba\xdd\xd8\xac\x89\xae?\x91\xfe\xbb\
+>\xf9\x84\xa6\x86&&O\x9eL4Iw\x9f\xbez\
+@\x04\xcf\x00\xf8\xf3\x9f\xffLaa!g\x9du\x16\
+\x99\x99\x99\xaa\x98\xa9\x1c\xd7\xd5\xf9.\x97\x8b\xe6\xe6f\
+*++\xc9\xc8\xc8P\x1dou\x0d@<&\xb21\
+\xbb\xebg I@RV\xdcx\x5co\x9eO\x0f\xe0\
+1\x22\xe1\xfa\xb9r\xfd\xda\xdaZ\xa0\x93qdff\
+\xd2\xda\xdaJCCC\xc25\x8eu\xe3\x9d(\xb5\xba\
+\xaf\xb8\x8f \xfe\x16\x8b\x85\xaf\x7f\xfd\xeb\xec\xdb\xb7\x8f\
+\xf9\xf3\xe7\xe3\xf3\xf9\x06\x8c\xea/\xf4\x992\x00\xa7\xd3\
+\xc9\xb6m\xdb8\xfb\xec\xb3\x194h\xd0Q\x15h\xe0\
+\x08\x82*\xb6\xbfx\x02\x00\xf6\xec\xd9CAA\x01@\
+B\xec\xbf\xe0\x07\xba\xea%\xad\xbf\x04\x1b\x10pQ:\
+\xc4:\xec\x0e\x5c.\x07q\xb3\x89\xb8\x06:\x89\xf4\xdf\
+\xb4q#\xa3JG\xe1t8\x09\x87\xc2\xc4\x93\xb8y\
+\x84\xbas\xf7\xe9\xd2\xd8b\xb1\xb0v\xedZV\xaf^\
+\xcd\x92%K\x985k\x96z\x96\x9eH\xaeQ^^\
+\xaez\x18HXiJJJ\x82\x1dn\x0c\xa4\xea\x8e\
+$\xf6B\xc0C\xdd\xff\xdd\x1d\x18'\xc7\x09\xf6`\xd4\
+\xc0\x8c\xe3NMMU\x9e\x1f\xa1\xc1\x83\x07c\xb3\xd9\
+\xa8\xab\xab\xeb\xd5X?+:\x1e\x17\xb7d\xa2\xa6\xa5\
+\xa5\xf1\xe2\x8b/\xf2\xcc3\xcfp\xed\xb5\xd7\x1eU\x19\
+k\xa0\xd0g\xc6\x00\xacV\xabj\xa5,\x19o\x12\x1f\
+n,\xf8aD\xfe\x9dN'{\xf7\xee\xa5\xa9\xa9\x89\
+\x11#F$\x94\xe9nooO(-%\x08\xb8\x84\
+\xf5J\xc7V\x99\xfcH$B\x9c8N\x97\x13\xa7\xdd\
+\x899\x16?\x02\xea\xc5:\xa5\xff\xc1\x83\x07ioo\
+g\xf6\xccYGU\xca\xd5_\xa2\xbeYd\xec:\x89\
++\x12\x8eH\xcae\xcb\x96\xe1\xf5z\xf9\xd2\x97\xbe\x04\
+\x1c\xe9\x8f\xd7\x1dI\x80O<\x1eg\xff\xfe\xfd\x09!\
+\xb4iii\x98\xcdf\xc5\xe8L&S\xc25\x93I\
+F\xfd\x19\xe4\x1d\x086a<\xa7\xa7\x00\x1d\xc9\xae\xd4\
+M\x8ed~q\x97\xcbEzz:\xd5\xd5\xd5\xf8\xfd\
+~\x00\xb2\xb3\xb3),,\xa4\xbe\xbe\x1e\xe8\xd9\x9c\xe8\
+-\x197\xb01\xa8\xe7D\x06\xe0X,\x16rrr\
+\xd8\xbf\x7f?\xb7\xdez+\x17\x5cp\x01\x1e\x8fg\xc0\
+\xb8\xfd\x8c\xf4\x990\x00\xb1\xfd?\xfe\xf8c.\xba\xe8\
+\x22\x0a\x0b\x0bUlx2\xe9\xaf\xa7\xfc\x8a\x84Y\xb7\
+n\x1dEEE\xaa\xf3\xad\xbcHce\x15a(R\
+0TZP\xeb\xb6\xbf\xd5bU\xc92\xfa\xa6\x15\xa9\
+\xf9\xf1\xe6\xcd\x8c\x1d;\x16\x97\xcbE8\x18\xea\x16\x11\
+\xd7\x17T\xb2\xac=YtV\xab\x95\xb2\xb22^~\
+\xf9e.\xbd\xf4R&L\x98\xa0\x00\xa1\x9e\x16\x86\xb8\
+\xfa\xea\xeb\xeb\xa9\xa9\xa9!;;[mx\xb13E\
+\x03\xe8\xe8\xe8H\x00\xd5z\xda\xc0\x92\xab!\x91\x84]\
+=cW\xdf\x89Y\xd3\x95\x06\x00G\xaa8\xe5\xe6\xe6\
+\xd2\xd8\xd8\xc8\x81\x03\x07\x80N\xa68q\xe2Dv\xed\
+\xda\x05\x90\x80A\x9cH\x95\xbe':\x9e\xe0\x22Y\x03\
+\xf7\xdf\x7f?yyy\x8c\x1a5\x8a\x96\x96\x96\x01\xb9\
+\xf9\xe13`\x00\xb2\xf9\x0f\x1e<HVV\x16_\xff\
+\xfa\xd7\x81N\xdb\xdf\xb8ht\xdb_\x97\x9c\xe5\xe5\xe5\
+\xd4\xd7\xd73}\xfa\xf4\x84\xeb\x8a\xfaod\x22V\xab\
+U\x01k\xa1P(\xa1o\x9c\x1e\x98b\xdc\x1c\xa2i\
+4651q\xe2\xc4N\xc9\xd6\xc3{\x13F\x95\x0c\
+\xc1\x97\xffea\xbf\xfe\xfa\xeb\x00J\x0322\xc0\xae\
+H\x8e\xd9\xbbw/f\xb3Y\xe1\x196\x9b\x8d\xb4\xb4\
+\xb4\xa34\x0f\x9f\xcf\x970>\x99\x17\xfdz\xf2\xbf\xf4\
+\xf6\x93*KzL~w\xf8\x81\xfelR\x95\xb9\xab\
+\x8d\x13\x89Dp:\x9dddd\xd0\xd1\xd1Ayy\
+\xb9\xfan\xd2\xa4I\x1c>|\x98\xe6\xe6\xe6\xa4\xef\xa4\
+\xbf6NO\x1aM\x7f\x91\xe04>\x9f\x8f\xb1c\xc7\
+\x0e\xe8\xcd\x0f\x9f\x01\x03\x90E\xb5i\xd3&\xae\xb9\xe6\
+\x1a\xbc^/mmm\x09*+$J\x7f\xa3j\xbd\
+q\xe3FF\x8d\x1a\x85\xc7\xe3Q.C\xa96kt\
+\x1fJZ\xac\xd9lV\xbd\xe7d\xc1\x8b\xe6\xe0\xf1x\
+\x8ejN\x22\xd7(++c\xf8\xf0\xe1*k-\xd9\
+\xa66\xfa\xe9\x05TL\xf6\xec\x02\x08UVV\xf2\xca\
++\xafp\xd5UW1b\xc4\x88^o~\xe8d\x82\
+\xed\xed\xed\xec\xdb\xb7\x8f\x8c\x8c\x0c\xe5\xfaLII\xc1\
+\xeb\xf5&0\xd2\x8e\x8e\x0e\x1a\x1a\x1a\xbam\x06\xa2\x93\
+4k\xd1\x8b\xa0&\xa3\xae\xae#q\x15\xc6T_\xe3\
+\x1c\x00j\xbc\xe5\xe5\xe5\xca\xf7?u\xeaT\xccf3\
+\x07\x0e\x1c\xe8u\xec\xc1\xf1RO\xf78V\x13A\x84\
+Kee%---\xa7Ds\x90\x13\xce\x00RR\
+R\xf8\xf8\xe3\x8f\x192d\x88j\x5c\x11\x08\x04\x8e\xea\
+\xf3g\x94\xfe\x12AUYY\xc9\x81\x03\x07T\x81\x0c\
+Q\xf1\xf5\xca?p\xc4\xde6\x9b\xcd\xaa7_kk\
++.\x97KE\x09\x8aI!\x91Y\xba\xdd*\xf1\xf5\
+\xd1h\x94\x09\x13&$u+&\xb3\x8dE\xf56\x06\
+\xde\x08\x88&\xd2\xff\xe9\xa7\x9f\xa6\xbd\xbd\x9do|\xe3\
+\x1b\xea\xbc\x9e\x18\x80<\x93\xcdf\xa3\xa2\xa2\x82\x96\x96\
+\x16<\x1e\x8f\xc2Frrr\xd4\xf3\x09\x05\x02\x01|\
+>_\x82\x1472I\x19\x1f\xa0\xcc\x05#\x03\xe8M\
+\x92\x8f`\x07:s\xed\xea8\xe8\x0c\xfd\xcd\xce\xce\xe6\
+\xf0\xe1\xc3\xd4\xd4\xd4\x00\x9d\xed\xce\xf2\xf3\xf3\xf9\xf8\xe3\
+\x8f\x13\xc6\x95l\xac}\xa1\xee6qob-\xfaj\
+\x06\xe8\xf7\xd2kb\x0et:\xa1#4\x99:3\xbd\
+\x0e\x1c8\xc0-\xb7\xdc\x02t\xaa\xa7\xb2qu\xa0\xc6\
+l6+\xe9\xafK\x935k\xd6PPP@nn\
+\xeeQ\xae?Q;\xf5\xc9\x97\x94\xd8\x9a\x9a\x1a\x95\x07\
+ \x0c\x00Pi\xb3F\xe9o2\x99\xd8\xbbw/\xb9\
+\xb9\xb9\xa4\xa5\xa5\xf5\xaa\xa0\xa6\xc9t\xa4=\xb6\xb18\
+\xa6\x5c\xd3n\xb7\xb3c\xc7\x0e\x1e}\xf4Q\xbe\xfe\xf5\
+\xaf\x93\x9f\x9f\xdf\xab$\x10}#Bg\x03S\xe9\xb7\
+(\xe9\xb3\x92\xd7\xa0\xb7\xb82\xaa\xed\xc6\xaa\xbbF\xd2\
+\xc7/\xc7\x0b\xc9\xb5\xba\xd3\x0aD;1\xe6a\xe8\xc7\
+\x08y<\x1eU\x15w\xdd\xbau@\xa7v3z\xf4\
+h\xb6l\xd9\xd2\xab\xf98\xd9dd\x0eF\xf0\x19N\
+\xad<\x86\x13\xda\x1d\xd8\xedv\xb3y\xf3f\xce8\xe3\
+\x0c\xce;\xef<\xe2\xf1\xce|\xff\xae\xa4\xbf\x8e\xfc\xbb\
+\x5c.\xaa\xab\xab\xd9\xb1c\x073g\xceT\xc7\xc9\xc4\
+\x0b\xb2o\x5ct\x1e\x8fGIA\x89\x16\x14\x10PJ\
+\x99\xeb\xe0\x9f,b\xbf\xdfOCC\x03\xa5\xa5\xa5\xdd\
+\xbe@aX\x12\x98\xd4\xde\xde\x9e\xd0\x8eL\x1f\x9f\x04\
+2\xdds\xcf=\x0c\x1b6L\xd5OL&\x91\xbb\x9b\
+\xc3\xea\xeaj\x0e\x1e<HNN\x8ejx\xe2p8\
+\xc8\xcc\xcc<J\xd2H\xa0\x8dnbu\xf7<RI\
+\xc9hv\xf5\x96$\xaa\xaf\xa7\xd8v1YRSS\
+IMMe\xd5\xaaU\x8a)O\x9c8\x91\xfd\xfb\xf7\
+\xabw\xd1\x1f\x1b\xe8x@\xc4\xde\xba\x00\x8d\xd8\x93^\
+\xe7@w\xcd\x0ed:a\x0c\xc0f\xb3\xd1\xd8\xd8H\
+{{\xbb\x92\xfe\x12t\x92,\xe3/%%%!y\
+\x04:\xdb\x8a\x17\x16\x16RRR\x92\xb0\xc0\xa4c\x90\
+\xfe\x92\xc4\xf7\xeft:9t\xe8\x90J\x90\x117\xa1\
+0\x99d\xfd\xda,\x16\x0b;w\xee\xc4\xedv\x93\x9d\
+\x9d\xdd\xad\x84\xd6}\xfammm\x09\x95wtw\xa0\
+<\xe3\xab\xaf\xbe\xca\xfb\xef\xbf\xcf\x8f\x7f\xfccuN\
+oTC\x9d\xb9\xed\xd8\xb1C\x01\x9b\xe2\xcdHMM\
+\xc5\xe3\xf1\xa8 (\xb9\xa6\xa8\xd6\xbd]\xbc\xa2U\xc9\
+\xf9\xc6T\xe0\xee\xae\xa3\xd7j\x90\xf7c\xd4\x18\xe4Z\
+\x1d\x1d\x1d8\x9dN<\x1e\x0fC\x87\x0e\xe5\xa3\x8f>\
+\xe2\xc3\x0f?\x04:q\x80\xc6\xc6F\xf6\xed\xdb\xd7e\
+\xab\xf0\xde0\xe5\x13\xe9\xdeK6'\xba\x9bQ\x18m\
+(\x14\xa2\xb8\xb8\x98\xc1\x83\x07\x9f\x129\x0e'\xac=\
+\xb8\xc3\xe1\xe0\xa3\x8f>\xe2\x8b_\xfc\x22#G\x8eT\
+\x88\xbdQb\x89\x1d\xa9\xc7\xfcK\xd4\xdf\xee\xdd\xbb9\
+\xf3\xcc3\x01\x94\x8a)\xbe}\xa3\x16a2\x99HI\
+I\xa1\xbd\xbd\x9d\xba\xba:\xb2\xb2\xb2\x94\xf4\x17\x15Y\
+:\xd1\xea\x9cYL\x84\xda\xdaZ\xd5\x82\xab'\xb2Z\
+\xad\x04\x83A\x15@c\xb4\xe7\xe5^>\x9f\x8f{\xef\
+\xbd\x97\x8b.\xba\x88\xb9s\xe7\xf6\xa9m\xb8` \xcd\
+\xcd\xcd\xec\xd9\xb3\x87\xac\xac\xac\x04\xad'??_\x01\
+pz\x01\xd0\xfd\xfb\xf7'\xfc\xdfU\xa5\x1d\x9dY\x19\
+m\xff\xde\x92hB6\x9b\xad\xdb\x10W1\xeb\x00U\
+\xbe\xbc\xbd\xbd\x9dW_}\x15\xe8,\xce\x9a\x92\x92\xc2\
+\x8e\x1d;\xfaE\xd5?Q\xe6B2-\xc9n\xb7\xab\
+rs&\x93IEb\xf6\x96\xd1\x9fl:!\xed\xc1\
+\xddn7\xbbw\xef&''\x87o~\xf3\x9b\x00\xca\
+%\xa7\x83K\x02\xe89\x9d\xce\x84\xcd\x0f\xb0|\xf9r\
+\x06\x0d\x1a\xa4\x12e\xf4\xeb\xeb\xea\xadp^\xab\xd5J\
+ZZ\x1a\x15\x15\x15J\xa3\x90 \x17\xd12<\x1e\x8f\
+\xba\x86\xfc\x16\x84\xde\xe3\xf1PXX\xa8\xb8vw\x00\
+\x92\xddn\xa7\xa9\xa9I\xd5\x114\x8eOb\x17\xfe\xf4\
+\xa7?\x11\x0c\x06\x95\x06\xd4\x1b\x5cAH\xb7\xfd\xc5\x8d\
+&*\xb3\xc5b!777!\x1bR\xc6{\xf0\xe0\
+A\x00ulO\x8b\xd0h\xe7\xeb\xbexQk\xbb\x8b\
+%\x10\x06`\x94v]Id\xaf\xd7\x8b\xd3\xe9\xa4\xb0\
+\xb0\x90g\x9eyF\x95\x09\x1b4h\x10;v\xecH\
+\x18So\xc9\xe8\x99\xe9o\x929\x96>\x95R`F\
+\xe6*\x1c\x0e\xd3\xd4\xd4DVV\x16\x00?\xfb\xd9\xcf\
+\xd8\xb1c\x87*\xd62\x90\xa9\xdf\x19\x80\xf8\xc5w\xee\
+\xdc\xc9\x7f\xfc\xc7\x7f\xa8\x0a7\xe1p\xf8(\x9b(\x1e\
+\xef\x8c\x10\xd3\xed>\xab\xd5\xca\xa6M\x9b\xd8\xb9s'\
+\x0b\x17.\x04HH\x93M\xd6-Xz\x03\xc4\xe3q\
+\x0e\x1d:D~~\xbe\xd2\x12d19\x9d\xce\x84z\
+tp\xe4\xc5\xd6\xd5\xd5QXX\xd8en\xbbNR\
+\x8f\xa0\xa1\xa1\x81\xac\xac\xac\x04\xff\xbf\x5c\xcf\xe1pP\
+VV\xc6_\xfe\xf2\x17~\xf2\x93\x9f\x90\x9b\x9b\xab\x12\
+\x92z\x22\xd9t.\x97\x8bP(\xc4\xb6m\xdbHM\
+MU\xe3\x0e\x06\x83\xaa\xf8\xaah6\xa2\xc2\xc7b1\
+\x0e\x1f>LZZ\x9a\xc2Zz\xb3)\xf4\x8d*\x95\
+\x91zk\x02\x08C\xecMDc,\x16SU\x80\x0a\
+\x0b\x0b\xa9\xa8\xa8\xe0\xad\xb7\xde\x02`\xc2\x84\x09\x94\x95\
+\x95\x01G*\xe8\x1e\x0f\xf5\xc4\x10z\xf3\x9dq\x1e\xec\
+v;\x1e\x8fGI\xf9\xf6\xf6v\x0e\x1c8@}}\
+=\x85\x85\x85\x94\x97\x97s\xddu\xd7\xa9\x96s}a\
+\xf8'\x8b\xfa\x95\x01\xc4\xe3q\xbc^/\xef\xbd\xf7\x1e\
+\xb3g\xcff\xc9\x92%\xc4b\x9dm\x92\x8c\x1b@\xdc\
+[\xbaK\xce\xe5r\xd1\xda\xda\xcaK/\xbd\xa4\x0a\x8f\
+\xea\x08\xb70\x00\xa3\xcam6\x9b\xc9\xc8\xc8\xa0\xb2\xb2\
+\x92p8L~~>\xad\xad\xad\x09\x92D|\xff:\
+\x03\x90\x82\x98\xd2GO\xcc\x8a\xae\x16\x87\xc9\xd4\x19\xd1\
+'\xb6\xabn\xfb\xca3y<\x1e\xa2\xd1(?\xf9\xc9\
+O\x98={6\x97\x5crI\xc23\xf4D2G&\
+\x93\x89\xed\xdb\xb7\xe3\xf3\xf9\xc8\xc8\xc8P\x8c)\x12\x89\
+PXX\xa8\xc2\x7f\xc5\xa4\xb2X,466R^\
+^NAA\x81\x92X]\x91\xcc\x83\xb1\x01\x8a\xfe\xfc\
+2\xe6\xae\x18\x97\x8e\x87\xc8\xbd\x92\xa1\xe3\xf2\xbf\x00\xa3\
+\x12v<u\xeaTV\xae\x5c\xa9\xfe>x\xf0 \xb5\
+\xb5\xb5jM\x18\xb1\x84\xcf\x82\x92\x01{V\xab\x95\xac\
+\xac,\xd2\xd3\xd3\xb1X,TWW\xf3\xe1\x87\x1f\xf2\
+\xfe\xfb\xefSUUEJJ\x0aO<\xf1\x04S\xa6\
+L\xa1\xb2\xb2R\xb5\x9b;\x15\xbc\x01\xc7\xd4\x1c4\x19\
+\x89\xea\x7f\xe0\xc0\x01\x1a\x1a\x1a\xf8\xd9\xcf~\x06\xa0$\
+\xb6\xa8\xe1rl<\x1eW\x85,t\xdb\xf8\xb5\xd7^\
+\xa3\xa5\xa5\x85k\xaf\xbd\x16@I{qw%+\x1a\
+*\x81?\xbbw\xef\xa6\xa8\xa8\x08\x93\xc9\xa4\x02\x86t\
+\x90\xd1\xe8\x9e\x92JA\x1e\x8f\x07\xb7\xdb\xdd\xe5\x86\xd1\
+\xc7[^^\xce\x81\x03\x07\x98;wn\x02\x9e!\xd7\
+\x03\xb8\xef\xbe\xfb\xd8\xb3g\x0f\xf7\xdf\x7f?\x802}\
+z\x13\xe8\x22\xf8I8\x1cf\xdb\xb6m\xe4\xe7\xe7\xab\
+\xfbH\xf4_^^\x9e\x1a\x93\x14\x08u:\x9d\xd4\xd5\
+\xd5QSS\xa3\xe2\x18zSuF\xdc\x8a:\x93\xd5\
+]\xb4\xbdA\xb2=\x1e\x0f\x8d\x8d\x8dJ\x1b\xe9\xea\x19\
+\xe5ZR$t\xdc\xb8q\xec\xdd\xbb\x97\x0f?\xfc\x90\
+\xd9\xb3g\x13\x8b\xc5T\xa1\x18\x01u\xf5y\xe9O\xea\
+\x8dfc2\x99\x14\xc8\xbbk\xd7.\xd6\xacY\xc3\xfb\
+\xef\xbf\xcf\xae]\xbb\xa8\xab\xab\xe3\x92K.\xe1\xdcs\
+\xcf\xe5\xc7?\xfe1\x9b7o\xe6\x0b_\xf8\x02\x99\x99\
+\x99\xa7T}\x83~\xd3\x00\xa4\x0e\xdd\x9a5k\xb8\xfd\
+\xf6\xdb)..Vn\xb2d\xf9\xfe\x0e\x87C\xd9\xfe\
+\x02\x9e|\xf0\xc1\x07\xacY\xb3\x86\x193fPRR\
+rT\x9c\xbe\x11\xfc\x93\x05\x9a\x91\x91Auu5\xad\
+\xad\xad\x8c\x181B\x95\xff\x82#q\xe8F\xf5_6\
+\x94\xcf\xe7#;;\xfb({WW\x8bu\x1f\xef\xca\
+\x95+U\xef\x03\xa9e'\xc7\xd9\xedv\xde|\xf3M\
+\xee\xbd\xf7^\xee\xba\xeb.\x8a\x8a\x8a\x12\xc0\xa0\xde,\
+ba$eee\xf8\xfd~233\xd5\x1c\x85B\
+!\xb2\xb3\xb3U\x9c\x82H~Q5w\xef\xdeM \
+\x10`\xcc\x981D\x22\x91\x84v\x5cF\x12I\xa7W\
+X\x96\xffuf\xd5\x1b{\x5c\xda\x89\xf5\xd4\xe8B\xae\
+\x93\x9d\x9d\xadj\x10Z,\x16\x9e~\xfai\x00F\x8d\
+\x1a\xc5\x9a5k\x80\xe4}\x09{\xc3<\x8d\xc7\xf4\xe4\
+\x19\xe8\xce\x0c\x10F\xfc\xca+\xaf\xb0t\xe9R~\xf2\
+\x93\x9f\xf0\x8f\x7f\xfc\x83\xd1\xa3G\xf3\xc3\x1f\xfe\x90\x91\
+#G\xf2\xd3\x9f\xfe\x94\xbd{\xf7\xb2l\xd92\xae\xbe\
+\xfaj\xaa\xaa\xaa\xba\x1d\xe3@\xa3~a\x00\xf1x\x9c\
+\xd4\xd4T\xfe\xf9\xcf\x7f2i\xd2$n\xbc\xf1F\xb5\
+9%\x0d\xd2hS\xeaA?.\x97\x8b\x86\x86\x06^\
+\x7f\xfdu\x8a\x8b\x8b\x996m\x1a6\x9b\xed\xa8b\x91\
+\x02\xc2\xe8\x9bT\x80\xb8\xb2\xb22\xf2\xf3\xf3\xb1\xdb\xed\
+\xaac\xae.\xb9\x8d\x81:\xa2\xfe\x03*F=\x99\xfb\
+J\xee\xe3t:illd\xcf\x9e=L\x992E\
+}\xae\xfb~kjjX\xbat)\xd7^{\xad2\
+\x7fz;\x7f\xf2[\x16\xdd\xce\x9d;\x95\xa4\x17$\xbf\
+\xbd\xbd\x9d\xc1\x83\x07+uZ\x8f9\x00\xf8\xe4\x93O\
+\x08\x87\xc3\x14\x16\x16\x12\x0e\x87U\xd6]w$>|\
+=\xa2Q\x80\xda\xdex\x06d~\xc55\xdb\xdd\xb1\xc2\
+T\xf2\xf2\xf2T\x11\x93\x09\x13&\xf0\xe6\x9bo\x12\x08\
+\x04X\xbcx1\x9b7o\x06H\xc8\x07\xd1\xcf\xef\x8e\
+\xba2\xdb\x92\x99\x12]\x05\xf3\xe8\xcf+-\xea\xb3\xb2\
+\xb2\xb8\xe9\xa6\x9b\xf8\xe3\x1f\xff\xc8\xbd\xf7\xde\xcb5\xd7\
+\x5c\xc3\x97\xbf\xfce\xc5\xf0~\xf5\xab_\xe1\xf1x\xd4\
+\xba\x1b(AK\xbd\xa1\xe3f\x00b\xbbWVVR\
+__\xcf]w\xdd\x05\xa0z\x04\xe8\xea\xaflx\x01\
+\xe4\x22\x91\x88\xb2\xf7\x9e~\xfai\x82\xc1 \xa7\x9dv\
+\x1a\xa5\xa5\xa5J-\x15\xf5W\x9a\x8d\xe8\xd24\x16\x8b\
+\xa9Z\xeb\xcd\xcd\xcd\x94\x96\x96\xd2\xd2\xd2\xa26\x84\xd8\
+on\xb7;\xe9bjmm%--\xed\xa8\xc5\xd6\
+\x95\xd4X\xb7n\x1d\x0e\x87\x83\xd1\xa3G\xab\xf8\x7f\xd1\
+0\x00\xbe\xf5\xado\x91\x9b\x9b\xcb/\x7f\xf9K5\x07\
+\xbd\x01\xfetFc\xb1X(++#\x10\x08\xa8\x9a\
+\xfff\xb3\x99p8Ljj*\xf9\xf9\xf9\x09\xb9\xff\
+\xa2\x15\x01l\xdf\xbe\x9d\x8c\x8c\x0c\x05Nv\xe5\x87\xd6\
+\x9fM\xc0,\xb9\xa6\x9e\x17\x00\xf4\x88_\x08\xd3\x12w\
+kO\xcf+f\xcc\xe0\xc1\x83illd\xf2\xe4\xc9\
+tttp\xff\xfd\xf7s\xce9\xe7\xd0\xdc\xdc\xcc\xee\
+\xdd\xbbU\x9fC}\x8ez\xb3\xb1\xba;\xc6h\xdfw\
+EF\xcf\xd1\xf8\xf1\xe3\x993g\x0e\xe3\xc7\x8fg\xc8\
+\x90!\xb4\xb4\xb4\xb0o\xdf>\x82\xc1 c\xc6\x8c\xa1\
+\xa9\xa9I\xf5h0\xa6\xb7\x0ft:n\x06 \xaa\xff\
+\xaaU\xab\xb8\xfd\xf6\xdb\x19=z\xb4\x0a.1\x06\xd4\
+\xc8\xa4J0\x8e\xb8\xfc\x9e~\xfai\xaa\xab\xab\x196\
+l\x18\xa3G\x8fV\xea\xae\x1e\x9f.^\x04]54\
+\x99L\xa4\xa5\xa5\xb1s\xe7N\xd2\xd3\xd3IKK\xc3\
+\xe7\xf3%\xa8\xff\x82\xda\x1am\xd9p8L{{\xbb\
+\x92\xfe\xdd-\x08\x89\xf4[\xbf~\xbd\xf2L\x08\x93\x11\
+\x97\xdf=\xf7\xdc\xc3\xbb\xef\xbe\xcb\x9f\xfe\xf4'RR\
+R\xfa\xd47P$\xa3\xf4\x8c+++S\xe3\x12\xc6\
+\xd4\xd1\xd1A~~>\x1e\x8f'!\x83\xaf\xbe\xbe^\
+m\xba\xcd\x9b73b\xc4\x08\xf2\xf3\xf3\x15\x83\xeb\x8a\
+\xe4y\x9dN\xa7\xca\xcc\x84#\xefS\x8e\xe9I}\x16\
+&+AW=\x910\xab\x92\x92\x12\x95\xacu\xf5\xd5\
+Ws\xd7]w\x11\x0e\x87\x19;v,o\xbc\xf1\x06\
+\xd0}}\x80\xae\xd4}y\x86\xe3%1i\xa2\xd1(\
+v\xbb\x1d\x97\xcbEZZ\x1a999\x0c\x1b6L\
+y\xb7ZZZTy\xb9\xdc\xdc\xdc\x04\x93\xecT\xa0\
+\xe3\x9a)A\xfdW\xaf^\xcd\xec\xd9\xb3\xb9\xf1\xc6\x1b\
+\x13\xecUi\xfb-$\xea\xbe|f\xb7\xdby\xeb\xad\
+\xb7\xd8\xb2e\x0b\x13&L\xa0\xa8\xa8\x88Q\xa3F\x1d\
+\xd5\x12;\x19\xf8'\x812\xc1`\x90C\x87\x0eq\xda\
+i\xa7\x11\x8b\xc5\x14\xf8'\xe4\xf1x\x8eJl\xb1X\
+,\x84B!\x95\x16\xdc]\x22\x8b\xf8\xf5\xd7\xae]K\
+8\x1cf\xde\xbcyJB\x88\xf4{\xe7\x9dw\xf8\xd5\
+\xaf~\xc5\xef\x7f\xff{\xc6\x8e\x1d\xdb\xa7L?\xb9\x87\
+\xb8\xf26o\xdeL(\x14R\xde\x04\x997\x9b\xcdF\
+QQQ\xc2y\x91H\x04\x9f\xcfGNN\x0e\x15\x15\
+\x15l\xdd\xba\x95\x92\x92\x12\xe5\xca\xeb.\x12M\xe6C\
+*\xf4\xea\x80\xa1^\x1cT\x0fqN\xf6L26q\
+[vG:^\x92\x9b\x9b\xab\xbc2\xe7\x9f\x7f>\x0e\
+\x87\x83{\xee\xb9\x87%K\x96\xb0~\xfdz5\xb6\xbe\
+H~9N\x0f\xf3\xd6\x19\x85\x11\xe8\xec\xea\xba\xd2L\
+F?^${FF\x06999dgg+\xa1\
+$1\x1a\x83\x07\x0fV\xf3y\xaa\x98\x01\xc7\xc5\x00$\
+\xec6\x16\x8bq\xe7\x9dw\x02(\xc4_\x97\xfe2\x81\
+\xd2\xc7N\xce]\xbf~=\xaf\xbe\xfa*\xd3\xa7O'\
+\x1a\x8d2i\xd2$\x80\x04\x06 \xeao\xb2(\xba\xac\
+\xac,\xf6\xec\xd9\x83\xcdf\xa3\xa0\xa0\x00\x9f\xcf\x97\x10\
+\x92\xeap8p\xb9\x5cI\xd5\xff\xf6\xf6vUx\xa4\
+;I'\xccj\xc5\x8a\x15\x8c\x1b7N\xd5\xb4\x97\xa2\
+\xa5b\xf7\x7f\xe3\x1b\xdf\xe0\x8a+\xaePEG\xfaB\
+\x12\xc7\xd0\xd2\xd2BYY\x99\x02\xfe\xf4\xe7\xf7z\xbd\
+\xe4\xe7\xe7+\xacB\xa4\xbf\xe0 \x1f}\xf4\x11\x1d\x1d\
+\x1d\x8c\x1c9RI\xad\xee0\x00\x99_\x97\xcb\xa5\xb4\
+!\xf9\x5c\x9eY\xde\x9b\x8e\x07\x18I\xdek_\x17\xfe\
+\x90!C\x940\xc8\xce\xce\xe6k_\xfb\x1a\x0f<\xf0\
+\x00\xed\xed\xedx\xbd^6o\xde|\x14pk\x1c\x7f\
+w*\xbd\xfe\x7fw\xcc]\xff\xdb\xc8 D\x1b\x929\
+\x11\xad ''\x07\xbb\xdd\xce\xca\x95+)..V\
+\x11\x99\xe9\xe9\xe9\xe4\xe7\xe7\x0f\xf8\x1a\x00:\x1d3\x03\
+\x90\x07\xdc\xb8q#\xdf\xff\xfe\xf7\x196l\x18\x81@\
+@\x81w\xc9\xcatK\xcdz\x97\xcb\xc5\xd6\xad[\xb9\
+\xeb\xae\xbb\x98;w.\xb1X\x8c\xbc\xbc<\x8a\x8a\x8a\
+\x94z\xabc\x06F\xf7\x9c\xb8\xfeL&\x13\xbbw\xef\
+f\xf4\xe8\xd1\x00\xf8\xfd~e&\x88\xb6a\x8c\xd43\
+\x99L\x09\x85Az\x02\xea\x1c\x0e\x07;v\xec\xa0\xb2\
+\xb2Ru0\x96\x0d\x0b\xf0\xcdo~\x93\xa1C\x87r\
+\xf7\xddw\x03\x89n\xcb\xee\x10f}^D\xe2\xbe\xff\
+\xfe\xfb\xc4b1RRR\x12j\x1dHl\x83$ \
+\xc9y\xd5\xd5\xd5\xaa\x22\xd0\xbau\xeb0\x99L\x0c\x1e\
+<X5M\xed\x8a\x01\xe8\xf7\x97{\xc9\x1cK\x18\xb1\
+Q\x9avEz\x1cBo\x18\x80\xcc\x7fvv6\xd9\
+\xd9\xd9\xec\xda\xb5\x8b\xac\xac,\xe6\xcd\x9b\xc7\xd4\xa9S\
+y\xe0\x81\x07\xc8\xc9\xc9\xe1\xbd\xf7\xdeK\xb8G_\xcc\
+)\xf9m\x04r{\xeb\x0d0>\xb3\x9e\xdb!\x19\x98\
+_\xfb\xda\xd7hhh\xe0\xbc\xf3\xceK\xd8\xf0\x83\x07\
+\x0f\xa6\xb5\xb5\xb5\xcbn\xc7\x03\x8d\x8e\x89\x01\x08\xf2\xfb\
+\xde{\xef\xb1`\xc1\x02\xae\xbc\xf2J%\x99\x04|2\
+\xfa\xea\xc5N\x948\xff\xab\xaf\xbe\x9a\x993g\x92\x97\
+\x97\x87\xcf\xe7c\xea\xd4\xa9\x00\x09\xaa\xa8\x80\x5cF\xf7\
+R4\x1a%33S\x15\xc8,--M\x887\x90\
+1\xba\x5c\xae\xa3\xd4\x7f\xb9\xa6\x84s\xf6\x06\xa9\x7f\xfb\
+\xed\xb7)))I\xd8\x5c\x00w\xdf}7;w\xee\
+\xe4\xf7\xbf\xff=@\xafJ{'sm9\x9dN\x0e\
+\x1f>\xcc\x9e={T@\x92\xc9t\xa4\xd1g,\x16\
+S\xa5\xd0\x05;\x91&\x1bC\x86\x0c\x01:\x19\xc0\xe8\
+\xd1\xa3\xc9\xc8\xc8 \x12\x89`\xb7\xdb\x95\x1b\xb0\xbb\xcd\
+#&\x90\x1e\xc9g\xd4\x00t\x93\xa7\xbb\xeb\xf46n\
+@p\x80Q\xa3F\xb1s\xe7N\x1c\x0e\x07\x83\x06\x0d\
+\xe2\xfa\xeb\xafg\xf7\xee\xdd,_\xbe\x9c\xfd\xfb\xf7+\
+\x90\xb87\xd2\x5c\xe8x\xe3\x05\x92\xb9>u\x17l<\
+\x1e\xe7\xb2\xcb.\xe3\xd9g\x9f\xe5\x8e;\xeeP\x02O\
+\xe6\xac\xb4\xb4\xf4\x98\xb4\xc0\x93E}f\x00\xb2\xb1\xca\
+\xcb\xcb\xb1\xd9l\x0a\xf1\x16\xc9-\x098F\xb7\x9f\xc7\
+\xe3Q*\xf3\xf8\xf1\xe3q:\x9d,^\xbc\x98\xed\xdb\
+\xb7s\xdai\xa7)\xbf\xba\xd1\xf6\x0a\x85B\x09\x91j\
+\xba\xebo\xfb\xf6\xed\x14\x17\x17\x03\xa8pc\xdd^\x93\
+\xda\xf9\xc9\x9e\xc1f\xb3u[\xf4B\x9e\xb3\xbe\xbe\x9e\
+\x8f>\xfa\x88\xd3O?\x1d8\x82b\xbf\xf5\xd6[<\
+\xf8\xe0\x83\xdc{\xef\xbd\x94\x94\x94\xf4\xaa\xdb\x8b\xd1\x1d\
+e\x94\xfe\xd2\xa4TG\xf9\xfd~?999\xaa|\
+\xb8\xd8\xa7\x07\x0e\x1cP\xc5AkkkY\xbbv-\
+\x13&LP\xd7\x95lL\xe8\xbe\xb8\x87\xe4\xf3\x0b`\
+\xa8\xab\xbfr\xad\x9e$\xb0\x84\xf8J\xa2VO\xf3 \
+\xefd\xd4\xa8Q\xaa\xcbQII\x09YYY\x5cy\
+\xe5\x95\x94\x95\x95\xf1\xd6[o\xb1s\xe7\xce\xa4\x92\xb4\
+;w\x9f\xf1\xc7xNw\xef;\xd9\xb1\xb2\x9ers\
+s\x89D\x22\xcc\x9e=\x9b\xb5k\xd7\xb2l\xd92\x06\
+\x0f\x1eL]]\x9d\x0a\x16\x02\x187n\x9cj\xef~\
+*\x98\x01}f\x00\xb2\xc9\xf7\xec\xd9\xc3/\x7f\xf9K\
+rrrT/{]\xfa\xeb*\xa4\xdb\xed&55\
+\x95\xfd\xfb\xf73u\xeaT\x02\x81\x00\xdf\xfa\xd6\xb7\xd4\
+\x22\x96V\xc9:\xe0$\xae?]\xad\x14\x0d#55\
+UU\x97\x9d8q\x22@\x82\xd9\xd1\xd1\xd1\xa1\x82\x7f\
+d3\xc9B\x16\xee\xdeS\x13\x0c\xe1\xe8\xaf\xbd\xf6\x1a\
+n\xb7\x9b\x193f\x10\x8f\x1f\x89v\xfc\xf9\xcf\x7f\xce\
+\xd2\xa5K9\xff\xfc\xf3\x8f*o\xd6\x13\xe9R\xd5\xe1\
+p\xb0s\xe7Njjj\xc8\xcd\xcdU\xf9\xf9\x22E\
+\xfc~?\xc3\x86\x0d\x03P\x92\xbd\xa9\xa9\x89\xa6\xa6&\
+\x86\x0f\x1f\x0e\xc0\xfa\xf5\xeb\x89D\x22L\x9e<Y\x05\
+\xf5\xa4\xa6\xa6\xaa^|\xc6\x9e\x7f:\x89\x0bS\xb4\x05\
+\x99\x1b\xa3\x06\xd7\x15\xc9\xbc\x8a\xbd\xde\x9bZ\x07\xf2\xfd\
+\x981c\xb0Z\xadl\xd9\xb2\x05\x8f\xc7Cqq1\
+\xb3g\xcf\xe6\xca+\xafd\xeb\xd6\xad,[\xb6L\x1d\
+/\x9b\xb1;{>\xd9Ow\xc7\xea\xff\xcb}\xe4G\
+\x8f\xbf\xf0z\xbd\x00,\x5c\xb8\x90\x86\x86\x06\xdex\xe3\
+\x0d\xd2\xd2\xd2\xa8\xa9\xa9Qs%\xebe\xd0\xa0AL\
+\x980\xa1W\xb9\x11\x03\x81\xfa\xcc\x00$\xcd\xf7\xd2K\
+/\xe5\xf4\xd3OO@\xbcC\xa1PB \x84,\xf0\
+\xac\xac,\xb6l\xd9\xc2E\x17]D,\x16\xe3\xf2\xcb\
+/\xa7\xa0\xa0\x80C\x87\x0e\xb1`\xc1\x02\xacVk\xd2\
+\xf4I\x91\xfe\xf2\xb9\xfc\xed\xf5z\xd9\xb1c\x07\xf9\xf9\
+\xf98\x9dNB\xa1P\x02\xe8h\x0c\xfe1\xa2\xb9\xc2\
+`\xba[ N\xa7\x13\x9f\xcf\xc7\xaaU\xab8\xe3\x8c\
+3\x14S\x8b\xc5b\xfc\xecg?c\xfc\xf8\xf1|\xff\
+\xfb\xdf\x078*5\xb9'\x92\xebHm\xff\x8d\x1b7\
+\x92\x9e\x9e\xae\xae!\xa5\xcb\x9a\x9b\x9bIMMe\xd8\
+\xb0a\x09\x9e\x82-[\xb6\x90\x99\x99\xa96\xef\x9bo\
+\xbe\x89\xc5ba\xc4\x88\x11\xaa\xcb\xb2\xd7\xebU}\x17\
+\x8c\xf5\x0fu\xf2x<\x09AQzO\x05\xf1\xc0t\
+\xe7\xdb6n\x96\xde\xb47\x939+,,$??\
+_e\x01N\x9c8\x91\xdc\xdc\x5c.\xbe\xf8bJK\
+K\xb9\xf3\xce;ijj\x22--\xed\xb8U{\x19\
+k2&b\xfcL\xd7~\xa4\xaa\xd4\xcd7\xdf\xcc\xb6\
+m\xdbx\xec\xb1\xc7\x80\xce\xe6\xac:@\xa8\xbf\xff1\
+c\xc6$\x98\xa3\x03\x99z\xbdjeS\xec\xde\xbd\x9b\
+\xa1C\x87r\xfb\xed\xb7\x03(W\x9f1PG$Y\
+^^\x1e\x1f}\xf4\x11\x8b\x17/f\xd0\xa0A\xcc\x9c\
+9SUK\x1d4h\x10#F\x8cP\x92[W7\
+\xc5\xf5\xa73\x93h4\x8a\xd7\xeb\xc5\xef\xf7SWW\
+\xc7\x981c\x00\x12\x9a\x83\x08*-\xea\x7f2N\xdf\
+S\x99,\xbd\x1c\x99\xc9db\xf6\xec\xd9\xea\xbbG\x1e\
+y\x84\xfd\xfb\xf7\xf3\xe3\x1f\xff\x18\xe0\x98\x1b=\xca\x86\
+\xfa\xf8\xe3\x8fUg\x1e=\xf8I\x1a\x9a\x8e\x1a5J\
+\xe5\x97\xa7\xa4\xa4PWWG]]\x9d\x02>\xe3\xf1\
+8+W\xaed\xda\xb4i*x&%%\x05\xb7\xdb\
+\x8d\xdf\xef\xef6\x16\x00PH\xbc\x1e\xbf.f\x86P\
+8\x1c\xee\xb6H\x8a0\x0d\xa9\xad\xd0\x9b\xf9\x10\xadi\
+\xf4\xe8\xd1l\xdf\xbe]\x09\x8e\x92\x92\x12233\xf9\
+\xd5\xaf~E[[\x1b\xbf\xfd\xedo\xd5\x98t7\xe2\
+\x89$\xd1xD{]\xb7n\x1d\x7f\xf9\xcb_\xb8\xf3\
+\xce;\xf1z\xbd\xaa3\xb3\x8e\x95\xe8\xf35f\xcc\x98\
+.\xcd\xcf\x81F\xbdf\x006\x9b\x8d\xd6\xd6V\xaa\xaa\
+\xaa\xf8\xeew\xbf\xab\xa4\xb6<\xb8\x9e\xa5'\x9bp\xd0\
+\xa0A\xacZ\xb5\x8a\xd3O?\x9d\xf1\xe3\xc73z\xf4\
+hZZZ())\xc1\xef\xf7\xb3`\xc1\x02\xe0H\
+\xb1\x0f\xdd\xfe\x14\xd7\x9fq1\xa5\xa7\xa7\xb3{\xf7n\
+RRR\x94]&\x00\xa0\xdc[/.\x9a\x0ct\xeb\
+IZ\x8bw`\xdd\xbau\x8c\x193\x86A\x83\x06\x01\
+\x9d\x816\x8f=\xf6\x18\xdf\xfe\xf6\xb7\x19>|\xb8r\
+W\xea\xc0cw*\xa8|&^\x84\xca\xcaJv\xec\
+\xd8\xa1T\x7f\x19\x97\xcdf\xa3\xbe\xbe\x1e\xb7\xdb\xcd\xb8\
+q\xe3\x12\xc6\xfc\xfe\xfb\xefSXX\xa8j\x1bl\xdf\
+\xbe\x9d\x9d;wr\xfa\xe9\xa7\xe3\xf7\xfb\xc9\xcf\xcf\xa7\
+\xb4\xb4\x14\xb3\xd9Lkk\xabj\xbaa\x1c\x9f\xfc\xef\
+t:\xb1\xdb\xedG\xf5\xe7\x93X\x02\xb3\xd9L \x10\
+\xa0\xb6\xb66A\x1b3>\x97\xddnW.\xd2\xbe0\
+\xc4\x09\x13&P]]M]]\x1d\xf1x\x5c\x15\x0e\
+=\xf7\xdcs\xf9\xc1\x0f~\xc0/\x7f\xf9K\x0e\x1d:\
+\xa4\xf2\x0d\xfa\xcb\xae\xee\xee:2Gb&\xfe\xef\xff\
+\xfe/3g\xced\xd6\xacYTVV&\x1c\x03\x89\
+\x0c3\x16\x8bQZZ\xaaz_\x0ct\x1c\xc0\xdc[\
+\x8ej\xb1X\xd8\xbcy3\xd7^{-\xd3\xa7OW\
+/Z\xf2\xffE\x13\x90\xc5\x90\x9f\x9f\xcfs\xcf=\xc7\
+\xd9g\x9f\xcd\xdc\xb9s9\xe3\x8c3\xd8\xb4i\x13\xa3\
+G\x8f&%%\x85\x92\x92\x12rrr\x8e\x8a\x9a\x92\
+M\xac\x17\x00\x15\xdb]r\xfe\xf7\xef\xdfOII\x89\
+:^\xef1 \x5c\xdb\xd8\xf4\xc3H\xdd=\xb7\x84\xe3\
+\x1e:tHI\xff\x8e\x8e\x0e\xee\xbb\xef>&N\x9c\
+\xc8\x17\xbe\xf0\x05 \x91q\xf5\x96\xe49:::\xd8\
+\xb4i\x93\x92$\xbay\x22\x0c@\x1a\x87\xb6\xb5\xb5\xe1\
+v\xbb\xd9\xb3g\x0f\x95\x95\x95L\x9a4I!\xe9/\
+\xbf\xfc2\x003f\xcc \x10\x080h\xd0 \xf2\xf2\
+\xf2\x14\x86\x22\xbd\xf8\x8c\xcf\xab3K\xbb\xdd\xae\x8e\x93\
+\xef\xf4`\xa0h4\xaal\xda\xae\x18\x80H\xc1\xdej\
+\x00B\x93&M\xe2\xffo\xee\xbc\xe3\xa3\xac\xb2>\xfe\
+\x9d\x9ad\xd2&\xbdW \x94\x84\x04\x08\x04B\xe8\xbd\
+*M\xb0\x01*\x82t{\xef\xaeuum\x88\x8a\x0a\
+\xb8\xa2\xbcb\x03\x94U@\xa4\xbaRCh\xd2\x92\x90\
+Jz\x9dLz2\xf3\xfe\x11\xee\xe5\x99aBq\xc5\
+\xdd\xc3g>$\x93\x99\xa7\xdc\xe7\xdesO\xf9\x9d\xdf\
+ihh\xe0\xd8\xb1c\xa8Tm\xe8\xc5\xd0\xd0P\xea\
+\xea\xeax\xe6\x99g\xd0j\xb5<\xf1\xc4\x136\xe7\xbe\
+\xd61\xff#\xd2\xd2\xd2\x82\xbb\xbb;'O\x9ed\xeb\
+\xd6\xad\xdc|\xf3\xcd6\xd1}\xa5\xb5\xaa\xbc\x1eQ\xbf\
+\x92\x90\x90@UU\xd5\xff\xbe\x02\xb8\x1a\xff\xd5\xc9\xc9\
+\x89\xf4\xf4tz\xf5\xea\xc5\x92%K\xa4\xaf\x07\x17A\
+5b@\xf4z=\xfe\xfe\xfe\xbc\xff\xfe\xfb\xdc|\xf3\
+\xcdL\x9c8\x91~\xfd\xfaq\xf6\xecY\xb4Z-\xbd\
+z\xf5B\xa7\xd3\x91\x9c\x9c\xec\xd0gT\xab\xd5\x12\x99\
+f\xcf\x1ed4\x1a\xc9\xcf\xcf\xa7\xb5\xb5U\xd2\x8c\xb5\
+\xb6\xb6\xda\x14\x0d\x89\xe8\x7f{\xe6\xe2\x95\x1e\x88\x18\x8b\
+\x7f\xff\xfb\xdfx{{\x13\x1b\x1b\x0b\xc0\x87\x1f~H\
+nn.\x0b\x16,@\xab\xd5\xca\x94_{~\xa5\xbd\
+\x08%&\x16\xca\xf1\xe3\xc7\xa9\xa8\xa8\x90\xc4\x1e\xe2\xbc\
+Z\xad\x96\xb2\xb22\x5c]]ILL\x94\xee\x00\xb4\
+U\x22v\xea\xd4\xc9\x867\xef\x87\x1f~ ))\x09\
+\xa3\xd1HKK\x0b^^^\xb8\xba\xba\xe2\xe5\xe5\x85\
+V\xab\x95}\xf7\xda\x1b\x0b\xa1\xc4\x85\xa5\xa0\x1cG\xf1\
+w\x8b\xc5BUU\x95\x0d\xc2\xce\x91\xe8\xf5\xfa\xab\xae\
+\x83\x17\x01]oooBBB$1\x88\xa7\xa7\xa7\
+L\xfd\xb9\xba\xba\xf2\x7f\xff\xf7\x7f\xacY\xb3\x86\xc3\x87\
+\x0f\xcb`\x9c\xf2\x1a\xae\xd7\x02\x13c\xfe\xd9g\x9f\xe1\
+\xed\xedM\xaf^\xbd\xa8\xae\xae\xbe$\x16boU\x89\
+\xe7\xd8\xa3G\x0f<==\xff\xe7\xda\x81\xdb\xcb\x15]\
+\x00\xadVKee%j\xb5\x9aG\x1f}\x14@\x9a\
+6\xca\x22\x1d\x916\xf3\xf5\xf5\xe5\x8d7\xde`\xf1\xe2\
+\xc5L\x9b6\x8d\xd8\xd8Xjkk\xc9\xce\xce\xa6W\
+\xaf^\x84\x86\x86\x92\x90\x90 y\xf5\xecy\xfd\x04\xf0\
+\xc7\xfe\x01\x0b\xb4Yzz:\xd1\xd1\xd1r\xb7\x11\xe7\
+\x17;\xbe\xb2\xcc\xd8\x91\x5c\xc9\xf4svv\xe6\xfc\xf9\
+\xf3\x1c<x\x90\xee\xdd\xbb\xe3\xed\xedMZZ\x1a\x9f\
+\x7f\xfe93g\xce$..\xce&Mw\xad\x22X\
+~\x05\xe2O\xa9\xe0\xc41\x0b\x0b\x0b\xe9\xd9\xb3'N\
+NN\xd4\xd7\xd7\xe3\xe2\xe2\xc2\xaf\xbf\xfeJYY\x19\
+C\x87\x0e\xa5\xa9\xa9\x09\xadV\xcb\x89\x13'\xd8\xbf\x7f\
+?\x13'N\x94\x81?OOO4\x1a\x0d\x11\x11\x11\
+\xa8T*\xd9\x8c\xb3\xbd\x89\x0bm`\xa0\xc2\xc2B\xe0\
+\x22%\x9b\xd2\xac\xd5\xe9t\x98\xcd\xe6\xcb\xf2\xdc\xa9T\
+*\x09\xbaj\xaf\x22NYg\x00\x17\xf9\x01\x12\x13\x13\
+\xd9\xbe};\xeb\xd7\xaf\xe7\xcc\x993\xd4\xd6\xd6\xe2\xef\
+\xefOmm-\xd3\xa6M\xe3\xfe\xfb\xef\xe7\x9e{\xee\
+\xc1l6\xcb\xa6\xb1\xe2\x9c\x7fT\x01(#\xf7\x8e\xc6\
+DT+\xfe\xf4\xd3O\x8c\x1a5\x0a\x17\x17\x97v\xf9\
+\x15\xec3X\x16\x8b\x85\x98\x98\x18bbb\xfe';\
+\x02+E}90\x8c0\xffrss\x993g\x0e\
+\x11\x11\x11\xb2\x93\x8c\xd8\x9d\x05\xf5\x94\xbb\xbb;^^\
+^\xbc\xf2\xca+<\xf6\xd8c\xdcr\xcb-t\xee\xdc\
+\x19\xb3\xd9LYY\x19\xce\xce\xce$$$\x10\x12\x12\
+\x22\x19S\xed'\x93\xb0&\xec\x81?---\xb8\xb9\
+\xb9Q]]\x8d\xd9l\xa6c\xc7\x8e\xd2\x1f\x15\x9c\xf4\
+\xe2z\x04w\xfe\x1f\x01b\x88\x07\xf5\xdbo\xbf\xd1\xd4\
+\xd4DJJ\x0a\xd0F\xf0\x91\x98\x98(\x1bz^m\
+\x95\x9f\xbd\x88T\xd9\xb1c\xc7d\xd0Ly\x9d\xc2\x14\
+\xf7\xf4\xf4lkK~\xa1\xde\xc1l6\xf3\xe3\x8f?\
+2j\xd4(T*\x95\x9c\x88_|\xf1\x05j\xb5\x9a\
+>}\xfaPUUE``\xa0\x84>\x87\x85\x85\xe1\
+\xe9\xe9Izz\xba\xc4\x05\xd8\xef\xcc\xe2\xdc\x9e\x9e\x9e\
+\x94\x96\x96JkLD\xfd\xc5\xf3\x17 \x9f\xca\xca\xca\
+vS\x8a\xc2\xfa\x03\xc7\xb4\xe7J\x0bH\xfc,v\xc7\
+\xde\xbd{\xd3\xd4\xd4DQQ\x11yyyl\xde\xbc\
+\x99\xa3G\x8f\xda\x10\xac\xf4\xe9\xd3\x87\xe5\xcb\x97S[\
+[K]]\xddUU\x1e^N,\x16\xcbe\xe7\x88\
+V\xabe\xdf\xbe}\x94\x96\x96\xd2\xbf\x7f\x7f\x87\xc1^\
+\xa5\xf2V\xba\x06\xa2&B\xb8e\xff\xcb\xa2\xbe\xdc \
+\xea\xf5z222\x180`\x00\x13&L\x90)!\
+\xa1y\x05\xeb\x8c\xd1h\xc4\xc3\xc3\x83\xe7\x9e{\x8e\x97\
+_~\x99\xdbo\xbf\x9d\xc8\xc8H*++\xd1\xeb\xf5\
+dgg\x13\x10\x10@\x87\x0e\x1d\xe8\xd4\xa9\x13p\xb1\
+\xe4\xd2~R\x8a\x9a\x7f{0\x86\x87\x87\x07\xe7\xcf\x9f\
+\xc7\xd5\xd5\x15\xa3\xd1(3\x0e\xa2\x0b\x8b\x98X\xce\xce\
+\xce\x97M\xf1]NDE\xdb\xf1\xe3\xc7\xa5\x06\xff\xec\
+\xb3\xcf\xc8\xcf\xcfg\xde\xbcy\xb8\xba\xba\xda\x10\x9b^\
+M\xceY\x880\xe5O\x9d:EYY\x19\x1e\x1e\x1e\
+r!\x8b\xdd\xa8\xb5\xb5\x95\xa2\xa2\x22\xfa\xf6\xed\x8bV\
+\xab\x95\x13\xe9\x9bo\xbe\xc1\xcb\xcbKb(\xc4\x82\xfc\
+\xea\xab\xaf\x18<x0NNN\x98L&\x82\x83\x83\
+eL\xc4\xdf\xdf\x9f\x88\x88\x08rss\xa9\xae\xaev\
+\x88{\x10\xd7l4\x1a)++\x93\x93U(W\xb1\
+9\x88\x8aG\xfb8\x81R\xc4\xe7\x84io\xffw\x81\
+v\x14\x94\xed\xca\xf3\xc7\xc4\xc4\xe0\xeb\xeb\xcbG\x1f}\
+$\x99\x81\xb3\xb2\xb2HKK\xa3\xa8\xa8\x08\x80\xb7\xde\
+z\x8b\xa4\xa4$\xce\x9f?O}}=&\x93\x89\xea\
+\xeaj9F\xf6\xd8\x85+=\x0bG\xcfL\x19s\x02\
+8v\xec\x18\x81\x81\x81DGG\xcb\xb1i\xef\xbb\x8e\
+\x94IRR\x12\xde\xde\xde\xd7T\x19\xfaWK\xbbA\
+@\xd1\xce\xdb\xcb\xcb\x8b{\xef\xbd\x17\xc0\x06\x94#L\
+u\x91\x8f~\xf0\xc1\x07\xf9\xe0\x83\x0f\xb8\xe5\x96[d\
+a\x8e\x12\x8d\xd6\xa7O\x1f:u\xea\x84\x93\x93\x93C\
+SR\x00x\x1cQ~\x09Hoaa\xa1\x84\xbe\x02\
+\x92pD\x04\x1f\xb5Z\xad\xc3\xe2\x1f!WZ\xa4b\
+\x81\x16\x16\x16\xd2\xbf\x7f\x7f222\xf8\xea\xab\xaf\x98\
+>}\xbal\x16z\xad\x96\x85\xd8\xed\x5c]]\xa9\xaa\
+\xaa\xe2\xf4\xe9\xd3\xd2\x12P\x9a\xc4b\x81\x04\x07\x07\xd3\
+\xbd{w\x9a\x9b\x9bquu%==\x9d\x03\x07\x0e\
+H\x8a4\xd1\x15h\xc7\x8e\x1d\x9c;w\x8eq\xe3\xc6\
+QYY\x89\x8b\x8b\x8b\xcc&\x88\xb4\x5c\xf7\xee\xdd\xa9\
+\xab\xab\x93\x91\xeb\xf6\xc6\xc3\xcf\xcf\x8f\xca\xcaJ\x9b\x8c\
+\x81F\xa3\x91\x0b_\xa5j+\xbb\x16\x99\x82\xf6\x02\x81\
+b\x11\xdagoD\x16C\xa3\xd1p\xe6\xcc\x19\xd9L\
+E\x04\x90\xfd\xfd\xfdINN\xe6\xc8\x91#,]\xba\
+\x94\xf9\xf3\xe7\xb3r\xe5J\xb6l\xd9\xc2\xae]\xbb8\
+y\xf2$NNN\x0c\x1d:TR\x8a\x0b\xf8\xb2\xc9\
+d\xc2l6\xcb\x8c\x8c2\xa8\xda\x9e\x5c.n#6\
+\x13\x80\xb4\xb44\xbaw\xef\x8e\xa7\xa7\xe7%\x804\xa5\
+\xa2\x10JO\xf97\xb3\xd9\x8c\x97\x97\x17\xbdz\xf5\xa2\
+\xb4\xb4\xf4\x7f\x96#\xc0\xa1\xca\x147T\x5c\x5c\xcc=\
+\xf7\xdc\x83\xd1h\x94&\x90\x08|555a4\x1a\
+innf\xde\xbcy\xac_\xbf\x9e\xa9S\xa7JN\
+4\xf10rss\xe9\xdc\xb93\xa3G\x8f&  \
+@\x16\x9d8\xd2\xbe\x8e\x80DV\xab\x15OOO\xca\
+\xcb\xcbihh ,,L.\x02Q\xc5&\xf2\xff\
+\xa2\xbf\xc0\xe5\x5c\x1aG\xbf+\x03m\xa9\xa9\xa9\xf8\xfa\
+\xfa\xe2\xe7\xe7\xc7'\x9f|Bpp0S\xa7N\x05\
+\xae\x0e\xeb/D\xb9S\x08\xd6\xe3\xb4\xb44\x9a\x9b\x9b\
+m\xaeQX;\xb5\xb5\xb5\x98\xcdfF\x8c\x18as\
+\x9cw\xdf}\x97\xbe}\xfb\x12\x14\x14\x84\xd9l\x96f\
+\xf6\xca\x95+\xf1\xf5\xf5%>>\x9e\xb2\xb22|}\
+}%\xaf\xa1\x98\x8c]\xbbv\x95J\xc4\xd1\xfd\x8bk\
+\x10\x16\x95P\x14\xe29\x8b\xa2\xa0\xd6\xd6V\xfc\xfc\xfc\
+(--\x95\xd7\xe0(\xc5)\xf8\xf1\xed\x15\x80\x98/\
+\xc1\xc1\xc1444\x90\x97\x97'\xefCd\x81z\xf6\
+\xecIDD\x04\xe1\xe1\xe1TTT\xb0i\xd3&\x9e\
+{\xee9f\xcf\x9e\xcd\xcc\x993\xf9\xdb\xdf\xfeFq\
+q1~~~\xc4\xc4\xc4\xe0\xe3\xe3#\x83\xc8uu\
+u\x94\x95\x95Q^^\x8e\xd9l\x96.\x8c\xb2\x9aO\
+\x5c\xc7\xd5\xa4\xff\x84%\x98\x9e\x9eN\xd7\xae]\xa5\xa5\
+\xe6\xe8\xfbB\x11(K\xb7\xc5\xb1\xa0\x0d=\xf8\xbf\xcc\
+\x11\xe0p6k\xb5Z\xb2\xb3\xb3\x19;v,\x83\x06\
+\x0d\xba\xa4\x8f\xbd\xc5b\xc1\xd3\xd3\x13\x93\xc9\xc4\x9c9\
+s\xd8\xb3g\x0f\xa3F\x8d\xc2`0HE!\xa2\xd9\
+V\xab\x95I\x93&I\x8e?\xe5b\x13\x22\x14\x8e}\
+\x0eY\xf8\xae\xa2\xbd\xb8\x87\x87\x87$\x94\x14\xbe\xf0\xb5\
+\xa6\xff\xecE\x9cO\x14\xd8\xa4\xa7\xa7\x93\x98\x98\xc8\xc1\
+\x83\x079q\xe2\x043f\xcc\xc0\xdf\xdf_\x06\x1a\xaf\
+U\x84\x22LOO\xa7\xb0\xb0PF\xb8\x95\x14eN\
+NNdff\xd2\xb5kW\x82\x82\x82hllD\
+\xa7\xd3\xb1z\xf5jjkk\x999s\xa6\x9c`\x82\
+\x9al\xdd\xbau\x8c\x1f?^\x8eCpp\xb0MV\
+\xa5\xb5\xb5\x95\xd0\xd0P\x02\x03\x03m\xdaq+\xafK\
+LR\x11]\x17\x01Ca\xb5\x88\x1d]\xd0b\x89\x06\
+*b\xbc\x1d\x1dS`(\xec\x15\x84\xa8\xa1\xf0\xf6\xf6\
+&33S~^\xdcW\xa7N\x9d\xf0\xf1\xf1\xe1\x91\
+G\x1ea\xe7\xce\x9dl\xd8\xb0\x81\xb7\xdez\x8b)S\
+\xa6\x90\x9d\x9d\xcd3\xcf<CHH\x08\xb7\xdf~;\
+\x87\x0f\x1f\xc6\xc7\xc7\x87\xce\x9d;\x13\x16\x16&\x89M\
+E\xbc\xa9\xbc\xbc\x5c\xd2s\x89\xf38\xe2\x18tt\xfd\
+*U[\x87\xea\x13'NPTTDLL\x8cM\
+\xb0\xda\x91\x0b\xa0\x8cg\x88q\x15\xd7\x14\x1b\x1bK\xf7\
+\xee\xdd)**\x92\x16\xd5\xff\x92\x5c\xa2\x00Dc\xcd\
+\x90\x90\x10\xe6\xcf\x9f\x0fp\x09\xe0\xc5`0PXX\
+\xc8\xacY\xb38r\xe4\x08)))\x97h9\x9dN\
+\xc7\xb9s\xe7HJJb\xd4\xa8Q\xc0\xc5\xae\xa9\xf6\
+\x93C\x04\xf3\xecS\x92V\xabU\x02^\xca\xcb\xcb\x89\
+\x8c\x8c\x04..\xda\xfa\xfaz\x1b\xd0\x86\x80\xc6^\xab\
+\x88\x07\x7f\xfc\xf8qT\xaa6\x82\xd2\x1d;v0d\
+\xc8\x10\x19\x08\xbc\x9a\x22\x17\xfbcZ\xadm\xb5\x03&\
+\x93\x89\xd3\xa7OKWFy\x7f...\x92\x0a{\
+\xe8\xd0\xa1r\x07:{\xf6,\xdf~\xfb-\x0f?\xfc\
+\xb0\x8cu\x88\xef\xae\x5c\xb9\x12\x8b\xc5\xc2\xf8\xf1\xe3)\
+--\xc5\xdd\xdd]ZW\xc2\x84mjj\xc2\xcd\xcd\
+\x8d\xd8\xd8X\xce\x9e=\x0bpIST!~~~\
+@[W!\xb8h\xe2\x8bL@cc\xa3\xa4\x1a\x13\
+\xc7rd\x09)\xe3\x05\xede\x02:u\xeaDnn\
+.UUU\xb2\xaa\xb2\xb5\xb5UZ\x00\xe7\xce\x9d#\
+  \x00\xa3\xd1\xc8\xc0\x81\x03y\xe2\x89'\xf8\xf6\xdb\
+oY\xbdz5\xb3g\xcf\xe6\xa7\x9f~\x2211\x91\
+\xae]\xbb\xf2\xfa\xeb\xafSZZ*\x99\xa4\x044\xbc\
+\xb6\xb6\x96\x8a\x8a\x0a\xca\xcb\xcbe;:e\xecJ4\
+\xf5P\x22B\xc5\xfbBRSSe\xab\xb8\xf6\xd0\x9e\
+J\x8b\xc0>C`\xb1Xd\xdc`\xfc\xf8\xf1r~\
+\xff\xaf\x89\xcdS\x14fxMM\x0d\xf7\xdcs\x0f\x06\
+\x83A\x060\xc4\xc4rqq!77\x97\x9bo\xbe\
+\x99\x93'O\x92\x98\x98(;\xf2\x8a\xc9\xa5\xd7\xeb)\
+,,D\xab\xd52o\xde<\x00\x9b@\x88r\x12\x8a\
+\xdd\xc4\x9eMF\x98q\x9e\x9e\x9e\x92i5((H\
+.D%\xfcW,\x1a\xfb\xda\xff\xab\x11%\xca\xee\xc4\
+\x89\x13\xb2n\xc1\xd9\xd9\x99\xf1\xe3\xc7K\xea\xa7\xf6Z\
+l9\x12q\x9fbB\x1d9r\x84\xfa\xfaz9\xe1\
+\xc5=\x8b [nn.)))\xb2\xbd\x14\xc0\xe3\
+\x8f?\xce\xc8\x91#\xe9\xda\xb5\xab\xac,\x13\xc1\xbfO\
+>\xf9\x84\xf1\xe3\xc7\x13\x10\x10@EE\x05\xc1\xc1\xc1\
+\xb8\xbb\xbb\xdb\x80\xb1\xc48\xc4\xc7\xc7\x93\x9f\x9fO~\
+~\xbe\xcd=(wi\x91:\x14\xe3,\xaeS\x94L\
+\x0b%\x1b\x10\x10 \xad\x84\xcb)\x00\xe1\xdb\xdb\xbb\x01\
+\x8d\x8d\x8d\x04\x07\x07\xa3\xd1h8v\xec\x98\xdc\x95\x85\
+\x7f=l\xd80\xb6o\xdfNAA\x01\x8d\x8d\x8d\xe4\
+\xe7\xe7\x93\x9d\x9dMkk+\xdd\xbau\xe3\x81\x07\x1e\
+`\xfb\xf6\xed\xbc\xff\xfe\xfbxyy\xf1\xc8#\x8f\x10\
+\x15\x15\xc5\x90!Cx\xfd\xf5\xd7)(( ,,\
+L\x06\x15-\x16\x0b555TUUQQQA\
+UU\x15\x0d\x0d\x0d\x12e*\xf8\x0e\x95A]\xa1\xc0\
+v\xec\xd8A\xe7\xce\x9d1\x1a\x8d6\x1b\x9b\xa3\xf8\x81\
+\x80\xc2+\x9f\xbd\x88yX,\x16\x92\x92\x92\xe8\xda\xb5\
++\xe7\xcf\x9f\xff\x9f\xb3\x02l\x9e\xa2F\xa3!//\
+\x8fq\xe3\xc6\xc9\xca2a\xf6\x0a\x06\x9cs\xe7\xce1\
+y\xf2d\xce\x9d;Grr2\x9e\x9e\x9e\x0e;\xee\
+\x9c>}\x9a\x9bn\xba\x89\xf0\xf0p\x9b\x06\x16\xf6\x83\
+'&\x86\x92\x05\x08\x90\xbb'\xb4\x15^\xf8\xf9\xf9\xc9\
+\xfaxa\xf6*\xa3\xcd\xae\xae\xae\xd7l\xfe\x8b\xf3\x08\
+\xb3\xba\xbc\xbc\x5c\xc6-\xfa\xf7\xefO\xe7\xce\x9d\x1d\x9a\
+\xb3W#\x82'.##\x83\xfc\xfc|\x87\xd8p\xbd\
+^\xcf\xd9\xb3g\x89\x8e\x8e&..N\xee\x10\xaf\xbe\
+\xfa*f\xb3Y\x82\xae\xe0b\x0e\xfd_\xff\xfa\x17\x99\
+\x99\x99L\x9e<\x19\x93\xc9\x84N\xa7#<<\xbc]\
+\x02\x8an\xdd\xba\xa1\xd3\xe9d\xc1\x8d\x12\xc1&\x8e\xed\
+\xe6\xe6\x86\xd1h\xa4\xa8\xa8H\xa2\xd7\x84\xab&\x94X\
+SS\x13\x1d;v\x94\xe3$\x94\x84\xbd\x88\x89\xefh\
+\xcc\x84R\xea\xd2\xa5\x8b\xec\x02\xa4\xfc\xec\xd8\xb1c%\
+*\xd0\xc3\xc3C\x9a\xee\xf5\xf5\xf5\x94\x94\x94\x90\x95\x95\
+EQQ\x11\x89\x89\x89\xacX\xb1B\xd2u\x9bL&\
+\x9ex\xe2\x09z\xf5\xea\xc5\x981c\xf8\xe4\x93O\xa8\
+\xae\xae&**\x8a\xc8\xc8H\x99\xd3\xaf\xad\xad\xa5\xbc\
+\xbc\x9c\xf2\xf2r\xe9*TTTH\xe5`2\x99d\
+\xba\xf9\xd4\xa9S\xf4\xe9\xd3\xc7\x86\x80\xa5=\x11\xe9p\
+e\xfaTX\x14\xc2\x0a\x18=z4\xd5\xd5\xd5\xed\x1e\
+\xe3\xbf%R\x01h\xb5Z\xce\x9f?Oll,\xf3\
+\xe6\xcd\xc3b\xb1\xc8f\x94b\xf1gdd0v\xec\
+X\xb2\xb3\xb3\x19:t(>>>6=\xeb\x009\
+\xe9\xe3\xe3\xe3\xb9\xe7\x9e{\x00$\x01G{&\xb4}\
+9\xad8\xa7\xc1`\xa0\xa1\xa1\x81\xda\xdaZBBB\
+lh\xb2\x94\x1a\x5c\xab\xd5^\xd2\xf8\xe3jD\xf9\xf9\
+3g\xce\xc8(\xbf\xaf\xaf/)))\xd2\xffU\x9a\
+\x89W#\x02\xb7PSS\xc3\x89\x13'lx\x10\xe1\
+\xa2r\xa8\xa8\xa8\xa0\xb5\xb5U\xbaHZ\xad\x96]\xbb\
+v\xb1z\xf5j^~\xf9e\xd4j\xb5\xcc\x98\x88k\
+x\xf7\xddwIII\xa1c\xc7\x8e\x14\x14\x14\xe0\xe3\
+\xe3#[\xa1)\x8bS\xa0\xcdE\x0a\x0c\x0c\xa4k\xd7\
+\xae\x1c:t\x08\xb8\x88\xf1W\xde\xbb\xab\xab+\xbe\xbe\
+\xbe\x94\x96\x96\xda`\xdd\xc55\xa9\xd5j\xccf3A\
+AA\xe8t:\xce\x9c9s\xc9\xf8\x89\xdfU*U\
+\xbb\x8aXX>\x89\x89\x89\xd2-rvv\x96.K\
+\x87\x0e\x1d\xe8\xd7\xaf\x1f\xdb\xb6mC\xa5R\xd9\xd4s\
+\x88\x97\x807\xe7\xe5\xe5\xe1\xe1\xe1\xc1\x9dw\xde\xc9\xca\
+\x95+\xf9\xfe\xfb\xefy\xf4\xd1G\xa9\xac\xacd\xf1\xe2\
+\xc5\xc4\xc5\xc51m\xda4\xd6\xaf_Occ#\xa1\
+\xa1\xa1DEE\x11\x12\x12\x82\x97\x97\x97<\xaf\xb2\x88\
+-00\x10\x80g\x9ey\x06WWW\x92\x93\x93%\
+\x90\xa7\xbd\x8c\x81\xb8/\xb1\xc9\x89c*\xaf\x1b`\xf8\
+\xf0\xe1\xc4\xc4\xc4\x90\x9b\x9b\xfb\xbfd\x054\xa9\xa1\xed\
+\x06\xc4n\xb2h\xd1\x22\xa9uE\xa0J\x04\xa9\x06\x0c\
+\x18@~~>\x93&M\xc2\xdf\xdf_.D!\x22\
+\xfdQ[[+S\x87b\x02;\x0a\x9e(\x91\x84\xca\
+\x01\x16\xa9?ggg\x0a\x0a\x0adI\xb1\x12\xf0#\
+\xea\xde\xadV+\x06\x17\xc3\x1f\xea+/\x94\x07\xc0\xf9\
+\xf3\xe7Q\xa9T\xd4\xd5\xd5\x91\x98\x98(\xa9\xc9\xed?\
+\x7f5\xc7\x14\xbbqjj*uuu\x97t\x10\x16\
+\x8b9//\x8fA\x83\x06\xc9&\x92\xa5\xa5\xa5\xcc\x99\
+3\x87E\x8b\x16\x91\x98\x98(\x95\x8f\xc8p\xec\xdc\xb9\
+\x93}\xfb\xf61k\xd6,Y\xf6\x1b\x16\x16&\xf1\x09\
+\xe2\xd8b\xe7\x14\x8a5>>\x9e\xd4\xd4T\x1b7D\
+)\xbe\xbe\xbex{{SUU%\xe3\x00B\x94\x81\
+@\x95\xaa\x8dr\xec\xe4\xc9\x93@\xfb\xc4\x1cbWw\
+4^\xf5\xf5\xf58;;\x13\x1d\x1dm\xd3\x04D\xcc\
+\xa3\xc9\x93'\x93\x99\x99\xc9\x89\x13'\xa4;a\x7f|\
+\xa1\xc0jkk)((\xa0\xb8\xb8\x18777\xa6\
+O\x9f\xce?\xff\xf9O6n\xdc\xc8\xdc\xb9s9p\
+\xe0\x00\xb7\xddv\x1b\xf1\xf1\xf1\xdcp\xc3\x0d\xbc\xfa\xea\
+\xab\xec\xdc\xb9S\x16\x1e\xb9\xba\xba\x12\x12\x12B\xa7N\
+\x9d\xf0\xf7\xf7'??\x9f)S\xa6\xf0\xc5\x17_p\
+\xff\xfd\xf7\xcby\xd6\x9e\xe2\x17\xd7\xe2\xa8\x1aV\xc4\xbb\
+D\xd1\x1c\xc0\x8d7\xdeHyy\xb9\xc3c\xfd\x97\xa4\
+Y\x0bm\x0b\xae\xac\xac\x8c\x85\x0b\x17\x12\x1e\x1e.\xab\
+\xfcDd=//\x8f\xfe\xfd\xfbSSS\xc3\xacY\
+\xb3\xf0\xf0\xf0\x90&\x8fR\xb4Z-g\xcf\x9ee\xda\
+\xb4i\xc4\xc7\xc7_\x111'4\xa7\xb2\xcaL\x98\x9e\
+b\xa2\x8a|\xaa\x88\x18\x8b\xe8\xaa\x98\xdc\x1a\x8d\x06\x83\
+\xab\xe1\x92]\xedr\xa2|\xa0\x02\x97PXX(\xbb\
+\xd5\xf4\xee\xdd\x1b\xc0&\xc6p5\xc7S\xa6\xfd23\
+3)((\x90\x80\x1f\xe5\xf5\x89\xd4\x5chh\xa8l\
+2\x020u\xeaT\xe2\xe2\xe2X\xbat\xa9\x8c\xc4\xc3\
+E\xea\xf1\x8f>\xfa\x88\x1bo\xbc\x91\xe8\xe8h23\
+3\xf1\xf4\xf4\x94\xe5\xd4b\xd1\xdb\x9b\xf8V\xab\x95^\
+\xbdz\xb1v\xedZ\xd2\xd3\xd3\x89\x8f\x8f\xb7\xc9u\x03\
+x{{c4\x1a1\x99L\xb2\xbb\xb02\x10\xa8D\
+\x8b&$$\xf0\xd5W_QSS\x83\x9b\x9b\x9bM\
+\x1d\x86\x18\x03e\x86C\xbcg?V\xc9\xc9\xc9\xac\x5c\
+\xb9\x92\xd2\xd2R\xfc\xfc\xfc\xe4\x22\xe9\xd5\xab\x17>>\
+>\xec\xdb\xb7\x8f\x90\x90\x10\xd9z\xfcr\x8bP\xf8\xfa\
+\x02{\xe2\xed\xed\xcd\xfc\xf9\xf3\x995k\x16\xc7\x8f\x1f\
+\xe7\xa7\x9f~b\xeb\xd6\xad\xb2\xde\xc0\xc5\xc5\x85\x80\x80\
+\x00\x82\x82\x82\x88\x8a\x8aB\xab\xd5r\xfc\xf8q\x093\
+\xff\xe8\xa3\x8f\x88\x8c\x8c\xa4\xa0\xa0\xe0\xb2\x5c\x0aB\x84\
+\x02\x13\x14f\x02:-\xe2<b-\x8d\x1e=\x9a\x0d\
+\x1b6\x90\x93\x93Cdd\xe4\xffBj\xb0Q\xadV\
+\xab)..f\xe8\xd0\xa1\x8c\x1e=\xda\xc6\xaf6\x18\
+\x0c\x9c?\x7f\x9e\xa4\xa4$jkk\x993g\x8e\x04\
+E\xd8/~q\x9cn\xdd\xbaq\xf7\xddw\xcb\xdd\xd9\
+\xbe\x82K\x99\x93\x15\x0cB\xca\xf7\x95\xa9?\x01\xf0P\
+\xb6\xc2\x16\x8a\xa0\xa5\xa5\x05\x95\x22\xf8g\xbd\xf0\xef\x8f\
+HAA\x01uuu\xb2\x09DXX\xd8\x15\xbb\xdc\
+8\x12\xb1\xabTWWs\xe4\xc8\x91K\xa2\xfe\x80\x04\
+G\xb5\xb4\xb4H\xd3\x1f`\xf1\xe2\xc5\xe4\xe4\xe4\xb0f\
+\xcd\x1a\x00\x89\xa5\x10\x16\xd8\xf7\xdf\x7fOVV\x167\
+\xddt\x13UUU466\x12\x11\x11a\x03RQ\
+NT\xf1s]]\x1d\x1d:t 44Tv\xdd\
+Q\x9a\xae\x02nl4\x1a\xd1\xeb\xf5\x14\x15\x15Q[\
+[+\xcdo% \xa8\xb6\xb6\x96\xe8\xe8h\xb4Z-\
+\xe9\xe9\xe9\xed*]%\xa1\x868\x8fPP\xd0\x06(\
+\x0b\x0d\x0d\xc5\xc7\xc7\xc7\x86\xfcS\xa4.\xe3\xe3\xe39\
+{\xf6\xac\xe4(\xb8\x9a\xf4\xab\xf0\xb9E\xe1RNN\
+\x0e\xd5\xd5\xd5\xc4\xc5\xc5\xf1\xe4\x93O\xb2i\xd3&V\
+\xaf^\xcd\xd2\xa5K\x194h\x90\xec\x9et\xfc\xf8q\
+\x8e\x1c9\x82\xbf\xbf?O<\xf1\x04\x1f\x7f\xfc1\xa1\
+\xa1\xa1\x14\x14\x14\xc8\xf1\xb9\x1a\x05\xa0\xdc\x94\x9c\x9c\x9c\
+dC\x5caa\x0a>\x85\xe9\xd3\xa7S\x5c\x5c|Y\
+\xcb\xe2/\x14\x93\xd6d2a4\x1a\xb9\xf5\xd6[\x81\
+\x8b\xad\xb8E\xb3\xc9\xa4\xa4$*++Y\xb4h\x91\
+MP\xc3^\x04}\xd7m\xb7\xdd\x86F\xa3\x91i\xab\
+\xf6\x06O\xec\xfe\xc24V\xee\x5c\x82\x1bO4\x9c4\
+\x18\x0c6\xad\xae[ZZ\xda\xaa\xceT*\x9c\x0d.\
+h\xb4\x17\x02IW\xb1\xfe\xed'&@VV\x16*\
+\x95J*\x00\xe0\x9a\xb1\xe6J\xd3\xff\xd8\xb1c\xd4\xd7\
+\xd7\xe3\xeb\xebks\x7fbg\xcc\xce\xcef\xd4\xa8Q\
+x{{\x03mi\xbd\x15+V\xf0\xeb\xaf\xbf\xcaN\
+G\xa2\xd8I\x10\x85|\xf8\xe1\x87\x8c\x1c9\x12\x0f\x0f\
+\x0frssqss#**\xca&Nc\x7f_\
+\xc2\x1fuuu\xa5k\xd7\xae\xa4\xa5\xa51k\xd6,\
+\x1b\xb0\x8e\x00Uyzz\xa2\xd5j)))\xa1\xa8\
+\xa8H\xe26\xb4Z\xad\xe4\x0dlll\xc4\xd5\xd5\x95\
+\xd0\xd0P\x0e\x1c8@\xaf^\xbdl\xf2\xebJ\xb3\xff\
+re\xc3B\x92\x93\x93\xd9\xb0a\x03c\xc7\x8e\xc5\xd9\
+\xd9\x99\xc6\xc6F\x0c\x06\x03\xe3\xc7\x8f\xe7\x97_~!\
+''\x07gggI]~\xa5\x05\xa3\x1cc\xab\xd5\
+Jss\xb3l\x9c\x22::\xc5\xc7\xc7\x03\x17\xb3 \
+\xc2\xfa\x14u\x19eee466\xca\x85{\xa5\xc5\
+/\xeeI\x99\xc9R\xab\xd5\xb2E\x9d(\xf8\x12\xf5)\
+C\x87\x0e%))\x89s\xe7\xce\x11\x15\x15\xf5\xdfN\
+\x0dV\xaa\xcb\xcb\xcb\xb9\xe5\x96[\xf0\xf7\xf7\x97\xe9.\
+\x83\xc1@UU\x95\x5c\xfcK\x97.E\xa3\xd1\xb4\xdb\
+lR\xa7\xd3QXX\xc8\xb0a\xc3HLL\xb4\xc1\
+\x0d\x88\x01T\xc6\x00\xc4\xdf\x94-\xa5\xc5\xc3U\xf6\x0e\
+0\x99Lxzz\xa2\xd7\xebm\x16\x92\xc8w\xebt\
+:\x5c\x9c\x9cQq\xf5\x9aT\xf9@\xf5z=\x0d\x0d\
+\x0d\x12\xb0\xd4\xa1C\x07\xbc\xbc\xbcl\xd0\x8a\xd7\x12W\
+\xd0j\xb5\xe4\xe4\xe4PXX\x88\x97\x97\x97\xc3\xa8\x7f\
+ff&\xd1\xd1\xd1R\xd1\xec\xda\xb5\x8b\xb9s\xe7\xf2\
+\xc9'\x9f\xd0\xb7o_\x19\x8b\x11\x13P\xadV\xb3b\
+\xc5\x0aZZZ\x188p \x15\x15\x15\xd4\xd7\xd7\x13\
+\x1a\x1a\x8a\x9f\x9f\x9f\x9c@W\xca~\xf4\xed\xdb\x97\xfc\
+\xfc|\x8a\x8b\x8bm\xe8\xd0\xc5\xff~~~2\xe8(\
+r\xfd\xca\xe7%&9\xb4\xb9\x01\x99\x99\x99\x98L&\
+\x09\xbdvd\xe6\xb77vbq&&&\xd2\xda\xda\
+\xca\x8e\x1d;l\x02\x87\xa3G\x8f\xc6\xcf\xcf\x8f\xb4\xb4\
+4\xc9\x0cu\xb5\x813q\xbd\xf6\x19\xa7\xc6\xc6F\xca\
+\xca\xcad\xcc\xa0\xb4\xb4\x94\xf2\xf2r*++)/\
+/\xa7\xa0\xa0\x80\xc2\xc2BI\xc7\xe6(\xdd\xa7\x1c\x13\
+\xe5\xdc\x10c\xa3dMrqq\xa1\xb2\xb2\xd2&n\
+%\x14\xc4\x8c\x193lR\x87\xffE)V\xdf}\xf7\
+\xdd\x0c\x1b6L\xd6q\x0b\x9a\xe8\xc1\x83\x07\x93\x97\x97\
+\xc7\xe2\xc5\x8b\x01\xda-h\x10\xc0!___\xee\xb8\
+\xe3\x0e\x80+j5\xb139\x02\xd7\x88j>\x91\x1a\
+\x14|pJM+\xae\xd5\xc9\xc9\x09\xadN\x8b\x15\xeb\
+5)\x01\xb8\x18k((( ??\x1f___\
+z\xf6\xec)\xaf\xffZP\x7f\x22Hg2\x998z\
+\xf4\xa8\x5c\xc0\xca\x89\xe2\xe4\xe4DQQ\x11z\xbd\x9e\
+\x91#G\x02m\xcd<\x87\x0f\x1f\xce\x82\x05\x0bd\xb3\
+Iqm\xa2\xbc777\x97O?\xfd\x94\x09\x13&\
+P[[++\xf2bbbd\x01\x91\x18\xd3\xf6\xee\
+\xb3\xa6\xa6\x86\xd8\xd8X\x5c]]\xd9\xbf\x7f?p\x91\
+\xff_,\xba\xd0\xd0P\x19|\x15A>1q\x95~\
+lKK\x0b\xdd\xbbwG\xa3\xd1p\xf0\xe0Ay\xff\
+\x8e\xae\xe1r\xcaSL\xfe\xc1\x83\x07\xb3u\xebV\xac\
+\xd6\x8b\xad\xd14\x1a\x0dw\xdey'\xbbv\xed\xa2\xa6\
+\xa6\x06\x93\xc9t\xcd\x10l{\xb7C\x5c\x9f\x98C\x02\
++!^\xca4\xb5R\xda\xcb\x00(E\xe0\x1eD\x1f\
+\x061o\x05u\x9dp\x09\x84\xd5+\xd8\x85\x0a\x0b\x0b\
+\xff\xdb\xfd\x03\xf2\xd47\xdcpC\x9d0\xdf\x05\xcd\xf4\
+\xe4\xc9\x939v\xec\x18K\x97.\x95\x91\xf1\xf6\x22\xbe\
+\x22-s\xc7\x1dw\xe0\xea\xeaz\xd9\x9aq\xa5(\xd3\
+&`\xdbaF\xa5RI\x96_\xd1 \xb3\xed\x84\xd0\
+bi\xa5\xd9\xd2f\x9e;;;\xa3V\xa9\xafj\xf1\
+\xdb\xc7\x1f\xc4\x02\xcf\xc9\xc9\xa1\xaa\xaa\x8a\x84\x84\x04\x5c\
+]]%\xe8\xe6Zw~\x95J\xc5\xc9\x93'ih\
+h\x90JT\x88\xd8Y\xcb\xca\xca\x18=z4nn\
+n\xe4\xe7\xe7\xd3\xa7O\x1fn\xb8\xe1\x06\x96/_.\
+w\x08\xfb\x0a\xbc\x97_~\x99\x1e=z0`\xc0\x00\
+T*\x95\xec\xfe\x1b\x10\x10pI\xfc\xc4\x91\x88\x00\x95\
+\xc1` !!A*\x00q\x1eq\x9f!!!\xb2\
+]\xda\xa9S\xa7hhh\x90\xbb\xbb0\xa1\x95\xbbX\
+bb\x22\xbf\xfc\xf2\x0b\xd0\xe6\xf3\xda\xbb{W\xba.\
+1\xc6#G\x8e\xa4\xb9\xb9\x99\xad[\xb7\xda`\x02\xee\
+\xb8\xe3\x0e|||\xd8\xbf\x7f?Z\xad\x96\x8a\x8a\x8a\
+kZ,\xca{\xb3w\x8d\xc4{\xf6\xfe\xfd\xb5Z|\
+\xf6\xdfQV\x0c\xaaTm\x05T\x02\x7f!\xe6\x88P\
+\xf23g\xceD\xa3\xd1PQQqE\x86\xea\xeb(\
+\xc5\xea\xc6\xc6\xc6\xf4\x96\x96\x16\xc92\xf3\xe0\x83\x0f\xf2\
+\xaf\x7f\xfd\x8by\xf3\xe6\xc9\x08y{\x0fR\xa7\xd3\x91\
+\x91\x91\xc1\x88\x11#HII\xb9\x042\xecH\x84\x06\
+no\xf7\x17\xf0SQy&\xe8\xb3T*\x15*T\
+4]\xf0\xff\xb5:\x1d:''\xae\xf1yI\x11\xad\
+\xacN\x9e<IPP\x10\xdd\xbbw\x97\x93\xfdZ\x14\
+\x80\xc5\xd2\xd6a(//O\xd2\x9c\xdbO<\x9dN\
+Gff&}\xfb\xf6%\x22\x22\x02\x93\xc9D\xbf~\
+\xfd\x88\x8c\x8c\xe4\xbb\xef\xbe\x03\x90\xd4\xea\x80t\xc3\xbe\
+\xff\xfe{V\xacX\xc1\x89\x13'X\xb3f\x0d\x19\x19\
+\x19t\xea\xd4\x89\xb1c\xc7\xa2\xd7\xebm\xfc]q>\
+\xe5\x0eh/\xa3G\x8f&77\x97\xe2\xe2b\x89\x9a\
+\x14\x9f\x13.\xa0\xab\xab\xab\xc4/\x88q\xb0\xcf0\x00\
+\x0c\x192\x84\xfc\xfc|N\x9d:u\x09\xaf\x81\x90+\
+\x8d\xa1\xc8\x12\x8d\x1c9\x92\xed\xdb\xb7\xcb\xe7\x226\x91\
+\xf9\xf3\xe7\xb3m\xdb6\x9c\x9c\x9c$\xb3\xd1\xb5\xc6e\
+\x94\xc59\xf6\xd7\xe3h\xc7oO\x098z_\xa9X\
+D\xbaO(qh\xeb\x12\x94\x9d\x9dMII\x89$\
+2\x11\xf1\xb1\xc0\xc0@\xa6O\x9fNFF\xc6\x7f3\
+\x18xV\xdd\xdc\xdc|L\xa0\xb7V\xadZ\xc5\x9bo\
+\xbe\xc9\xd4\xa9S%\xdf\x7f{\x17\xa7V\xab)//\
+'00P\xc2}\x1d\xf5\xef\xb3\x17\xa1\x05\x05\xee_\
+\xe9\xfb\x8b\x5c\xbe\xd5j\xa5\xbc\xbc\x5c\x16\xa9\xb4\xb4\xb4\
+\xa0\xa6-\xc6\xd7\xda\xd2Bk\xab\x05\xbd\x93\x13z\xb5\
+\x06\xb0^\xd5\x82U\xeeH\x22\xa3PPP \xb3\x1c\
+B!\x5c\xab\xa9)\x98x\x8f\x1f?.\xbf\xabt!\
+\x5c\x5c\x5c\xc8\xc9\xc9!::Z\xd2\xa0\x0d\x192\x84\
+\x9a\x9a\x1av\xee\xdc\x09\x5c\x8c\xf8\x8b\xef\x8bL\xc2}\
+\xf7\xdd\x07\xb4\xf1\xfe\xbf\xfd\xf6\xdb<\xf4\xd0C<\xf9\
+\xe4\x93\xac]\xbb\x96\x8a\x8a\x0aI\xfde4\x1a\xe5\x22\
+\xb4\xaf2\x14\xa6mmm-\xdd\xbau\xc3h4\xb2\
+c\xc7\x0e\xc0\x96\x1dY\x90\x89\xe8t:\x0c\x06\x834\
+\xef\xc53\x12x\x00Q\x06\xee\xe7\xe7Gtt4\x9b\
+7o\x96\x9f\xb3\x1f\xef+=\x0b\xf1\x99\x91#GR\
+]]\xcd\x9e={l\xdc\x92\xbb\xef\xbe\x1b\xb5Z\xcd\
+\xe1\xc3\x87\x09\x09\x09!++\xeb\x12\x1c\xc3\x7f\xb2x\
+.\xe76]\xcd\x06\xa0\x9cOba\x0b\x17\xa6\xbe\xbe\
+^V\xcb\xee\xde\xbd\x1b\xc0&\xc3f\xb1X\x986m\
+\x1a\xbd{\xf7&;;\xfb\xbf\xe1\x0aX\x80cj\xab\
+\xd5\x9a\xed\xe4\xe4\xc4\x81\x03\x07\xb8\xfb\xee\xbbIII\
+\xa1k\xd7\xae64\xd1\xedIee%\xb3g\xcf\x96\
+\x9dP\xae\x06//\x02@\xf6\x22\x88<\xc4d-/\
+/\xc7h4^\x9c\xc8\x17\x06\xae\xf9\xc2 \xea\x9d\x9c\
+\xb0\xaa\xaf\xcc\xf1\xeeH\xc4d=v\xec\x18^^^\
+\xb2)\xa9\xb8\xbe\xab\x11\xa5\x8f)H>\x04i\xa9X\
+(...\x94\x96\x96\xa2R\xa9\x984i\x12\x00\x93\
+&M\xe2\xcc\x993\x9c<y\x12///\xe9\xdf\x0a\
+?R\x98\xfe\x8f?\xfe8YYYx{{\xe3\xee\
+\xee.\xeb\x04\xd2\xd2\xd2\xb8\xed\xb6\xdb\xe8\xdd\xbb7\xb7\
+\xdez+k\xd7\xae\xa5\xbc\xbc\x1c\x83\xc1\x80\x8f\x8f\x8f\
+\xec\x15(\xd0h\xe2^\xc5\x98\x0f\x1c8\x90\xb4\xb44\
+\x00\x19\xa7\xb0X\xdaz3\x06\x04\x04PRRB\xa7\
+N\x9dHMM\x05.2$\x0b\xcbL\xc9\x890v\
+\xecX\x0e\x1e<Hee\xa5\xacS\xb0\x1f\xa3+I\
+]]\x1d...\xa4\xa4\xa4\xf0\xf5\xd7_\x03\xc8\x14\
+\xb0^\xafg\xfe\xfc\xf9|\xfe\xf9\xe7\xb2o\xa4\xc9d\
+\xfaC\xa0\xafk\x15G\xc1\xbe\xcb}F\x00\xafD\x1c\
+@(\xb1\xa4\xa4$6n\xdcHEE\x85\xec\xf8,\
+\x8a\xbb\x00\x16.\x5c\x88\xc5b\xc1l6_s\xda\xf9\
+?\x94R\xe0\xbc\xda\xdd\xdd\xfd`NN\x0e\x93&M\
+\x22..\x8eA\x83\x06a6\x9b/;\xc0\x82\x9b\xaf\
+o\xdf\xbe\x92\xa3\xeej\x003b\x92+\xab\xfeD0\
+N<T\xc1\x88\xdb\xdc\xdcl3`m\x1f\xb6\xd0\xda\
+\xd2\x8c^\xa3E\xaf\xd5r-\xf6\xbf\xf2a\x89N\xbc\
+'O\x9e\xa4O\x9f>\x92{\xefZv\x13q\x9c\xca\
+\xcaJ\x8e\x1d;f\x83\xf5\x17\x0bF\x00\x8cD\xd9\xee\
+\xa2E\x8b\xd8\xb7o\x1fiii\x84\x84\x84PUU\
+%wXa\xca\xebt:\xbe\xf9\xe6\x1b>\xf8\xe0\x03\
+\xa9PE\xba\xb4C\x87\x0e\x0c\x1f>\x5c6T]\xb7\
+n\x1d\xb7\xddv\x1b\x9d:ub\xea\xd4\xa9\xac_\xbf\
+\x9e\x86\x86\x06\x8cF#~~~\x0e\xc9Q\x86\x0c\x19\
+Bii)\xe9\xe9\xe9\xd2j\x10\x1d\x87BBB\xa4\
+\xb5RTT\xc4\xc9\x93'mvd\xa10D\xfa\xb0\
+O\x9f>\xb8\xba\xba\xf2\xaf\x7f\xfd\xeb\xb2\xe3t\xb9\xf7\
+\xc4\x98O\x9d:\x95\xf2\xf2r6o\xdel\x83\x00\x5c\
+\xb2d\x09\x00?\xff\xfc3\xc9\xc9\xc9\x9c={\xd6\x06\
+\x1a}=\x15\xc1\x95\x14\x80RD@V\x10\xe0\x88(\
+\x7f\xaf^\xbd(//g\xf9\xf2\xe5\x80-\xc0\xcal\
+6\xd3\xa9S'&O\x9e\xcc\x993g\xfej\x88\xf0\
+!\xa0A\x0d\x1c~\xe8\xa1\x87jT*\x15\xe3\xc7\x8f\
+\xbf\xa4W\xbc\xbd\xe8t:\x0a\x0a\x0apww\x97\x19\
+\x02G\xa6\xbf\xbd\xef(DY\xc3/>'|\x7f1\
+\xd1\xf2\xf2\xf2\xf0\xf6\xf6\xc6\xc9\xc9\xc9\xa6\xce\xba\xd5b\
+\xc1\xd2\xd2\x8aV\xafC{aq\x5c\xed\xa2\xb5\x7f\x90\
+'O\x9eD\xadV\x93\x94\x94\x048N\xa3\xb5\xb7\x0b\
+\x88\xc88 I>\xc4\xc3SF\x98322\x18=\
+z4\x81\x81\x81<\xff\xfc\xf3\x1c8p\x80\xdd\xbbw\
+\x13\x13\x13c\xa3\xf1\x05\xe0\xc4\xdd\xdd\x9d\xd4\xd4Tn\
+\xba\xe9&\x00\x09\xf1\xb5X,\xb2\xf5\xb4\xa0\xc1\x0a\x0e\
+\x0e&%%\x85\xc4\xc4D\x0c\x06\x03\xdf}\xf7\x1dS\
+\xa6L!::\x9a;\xef\xbc\x93\xdf~\xfb\x0d''\
+'\x8cF\xa3\x04\xf9\x94\x97\x97\xe3\xef\xefOhh(\
+\xeb\xd7\xaf\x97\xe7\x16c\xdc\xa5K\x17JJJpw\
+w\xc7\xd7\xd7\x97={\xf6\xc8\xcf\xc0\xc5@\x96\xc5b\
+\x91J\x7f\xd4\xa8Ql\xda\xb4I\xe6\xf0\xed\x8b\xc2\xec\
+\xc7\xd3\xfeg\xb1\x1b\x1a\x0c\x06\xa6L\x99\xc2\xca\x95+\
+\xe5\xb1\xc4\x18=\xfb\xec\xb3\xbc\xf7\xde{xzz\xe2\
+\xeb\xebKFF\xc6\x1f.\xfd\xfe\xb3\xa4=\xa5 \x0a\
+~\x94\xf0\xe6\xbb\xee\xba\x8b\xd7^{\x8d\x8c\x8c\x0c\xe9\
+2*\xad\xbe\xd9\xb3g\xd3\xad[7\xce\x9c9#S\
+\xe0\x7f\x81\xa4\x02\xa8\xfb\xf4\xe9S\x9d\x95\x95\x95:}\
+\xfatI\xc8y\xb9E\xd5\xdc\xdcLii)\x8b\x16\
+-\xc2\xc3\xc3\x83\x9a\x9a\x9aK\x16\xb9\xd8\xd5E\xbf\x00\
+\xe5b\xb7O\x11\x0a\xa0\x89\xd8\xfd\x1a\x1b\x1be\x89+\
+\xd8Fs[\x9a[\xb0\xb4Zp\xba\x90\xa7U\x9eO\
+\xf9\xb3\xa3\x87#\xfca\xb1P\x8f\x1f?N\xef\xde\xbd\
+e\xc9\xb3#\x05v9\x11]\x8esss\xf1\xf1\xf1\
+\xb1\xf9\xbe\xb3\xb33\xa7N\x9d\xa2G\x8f\x1et\xeb\xd6\
+\x8de\xcb\x96q\xe8\xd0!\xbe\xf9\xe6\x1bI\x94*\x02\
+Bb\x01\x0a\xd6\xa3\x09\x13&\x00m,=\xcaE\x12\
+\x16\x16\x06\x5c\xe4fhnn\x96\x01\xda\xf0\xf0p\x86\
+\x0e\x1dJ\x9f>}hhh\xe0\xd3O?%%%\
+\x85\xbe}\xfb\xf2\xf6\xdboK\x22\x12\x1f\x1f\x1f\xa0-\
+\xf5v\xf4\xe8Q\xaa\xab\xabqss\x93\xe7\x89\x8d\x8d\
+\xa5\xb9\xb9\x99\xea\xeaj:w\xee\xcc\xb1c\xc7$R\
+\x10.R\x85+9\x1b\xc7\x8d\x1bGcc\xa3\xb4\x02\
+\xdaC~\x8a\xf7\xec\xc7X(q\xab\xd5\xca\xd4\xa9S\
+qvv\xe6\xc3\x0f?\xb4\xf9\xfc\xacY\xb3\xf0\xf2\xf2\
+b\xd9\xb2e\xdcx\xe3\x8d\x94\x96\x96RVV&\xfd\
+\xe6\xbf\x22\x88\xe6Hy\x09\x11\xe7wqq\xa1\xba\xba\
+Z\x12\xe7\x8a\xf7\xa7M\x9bF\x97.]$\xbf\x86\xab\
+\xab\xeb%\xae\xc0\x83\x0f>H]]\x9d\xacH\xfd\x0b\
+\xe4 \x80\xda\xcb\xcb\x8b\xf8\xf8\xf8=\xa2\xf7\xfc\xe5\x06\
+S\x00Y\x06\x0e\x1c\xc8\xa0A\x83$=\xb5R\xc4\xe2\
+\x07$\x8f\xba0s\xed\xcd\x7f\xb8\xe8\xfb\x8bhzQ\
+Q\x11\x0d\x0d\x0d\x92\xdfN\x1cS\x09DQ2\xdc\xb6\
+w\xbd\xed\xc5\x02D\xc4\xbe\xb9\xb9Yb\xfe\xdb\xb3$\
+\x94\x93\xd8\xdebiii\x91\xbc\x01\xe2o\x82A7\
+33\x93\xd0\xd0P\x86\x0d\x1b\xc6'\x9f|\xc2/\xbf\
+\xfc\xc2\x9bo\xbeIDD\x045556\x13H4\
+;\xb5Z\xdb\xdaN\x17\x15\x15\xe1\xee\xeeNKK\x8b\
+\xcc\xbb\x07\x07\x07\xe3\xe1\xe1q\x89\xab%\xc6\xb1\xb1\xb1\
+QfMz\xf4\xe8\xc1\x88\x11#\x88\x8f\x8f\xe7\xc8\x91\
+#\xdc\x7f\xff\xfdt\xee\xdc\x99\x9bo\xbe\x99\x9f~\xfa\
+\x09\x8b\xc5\xc2\xf0\xe1\xc3\x89\x8e\x8e\x96\xd8xq\xfd\x91\
+\x91\x91\xe8\xf5z\xce\x9f?O\xd7\xae])**\x92\
+\xf1\x02\xe59\xc5s\x10\xed\xcaF\x8c\x18\xc1\xbau\xeb\
+\x00d6I,\xea\xab\x89\x09\xc1E\xa8\xec\xbcy\xf3\
+X\xb7n\x9d\xec\xfe$Z\x9b-Y\xb2\x84\xf7\xdf\x7f\
+\x9f\xda\xdaZF\x8d\x1a\xc5\xf1\xe3\xc7\xdb\xb2Avx\
+\x8b\xeb)W:\x87^\xaf\xa7\xba\xbaZ\xd2\xe8+\xc1\
+A\x0b\x17.\xe4\xc8\x91#\xac]\xbb\x16\xb88\x8e\x22\
+\xe6\xd5\xa1C\x07\x16,X\xc0\x89\x13'\xae\xc9\xb2\xfd\
+\x83b\x06~\x05Pw\xe9\xd2\x0577\xb7_\xec\x09\
+9\xecED\xfd\xbd\xbd\xbde\x99\xaf}\x13\x081@\
+NNN\xe4\xe6\xe6b\xb5Ze%\x9c\xf0eE\xc0\
+\x04.\xee\xfe\xca(\xbeH\xa5\x09\x1eve\xa6@i\
+:\xc1\xe55\xbfrw\x11\x9f\x13\xdfKOO'<\
+<\x1c\xa3\xd1hCx\xa2\x94+\xe5\xd6\x7f\xff\xfdw\
+jjj\xf0\xf2\xf2\x92\x8a\xcd`0\xc8\xc6%7\xdf\
+|3_~\xf9%\x87\x0e\x1db\xd9\xb2et\xea\xd4\
+\xc9\x06\xdb.\xac!\x81\xbd\x98;w.;w\xee\xb4\
+1m\x05\x8cW\x94\xfb^\xeez\x84\xd2\xad\xad\xad\xa5\
+\xaa\xaa\x0a\x83\xc1@\xff\xfe\xfd\x198p ~~~\
+\xac[\xb7\x8eq\xe3\xc6\xd1\xb1cG6l\xd8@|\
+|\xbc\xac\xc9\x17J<22\x12???\x09\xec\xf2\
+\xf0\xf0\x90\xb9~!\xe2<\xca\xf1\x9a:u*UU\
+U\xd2\x0a\xb8\x92rv$\xc2\xaa\x198p \x89\x89\
+\x89\xbc\xfe\xfa\xeb\x00\xd2$\x9e5k\x16\x81\x81\x81<\
+\xf1\xc4\x13$%%\x11\x15\x15%\x9b\xcd\xb4gY\x5c\
+M \xef\xcf\x10\x11H\x15\xcaYT\xfc)\x95\xe5\xc0\
+\x81\x03\x191b\x04\x9f}\xf6\x19G\x8e\x1c\x91AS\
+\xe5\xe68m\xda4\x86\x0f\x1f.\xebH\xae\xa3\xec\x00\
+\xaa\xe0\x22\x1f\xc0^\xa0\xf0r\xdf\x10\x15\x83s\xe7\xce\
+%  \xc0!\xc3\x8f\xc5\xd2\xc6~\x9b\x97\x97Ga\
+a!\x81\x81\x816\x85*\xf6t\xd1z\xbd^\xfa\xfe\
+\xc2\xec9w\xee\x1c!!!\xf2xJQv\xae\xfd\
+#\x0fT\x04\xfbJKK%\x14\xf7Z\x8e#\xaa#\
+\xab\xab\xab9}\xfa4\x9e\x9e\x9eR)999Q\
+SSC]]\x1d\xd3\xa6M\xe3\xeb\xaf\xbff\xf7\xee\
+\xdd<\xfd\xf4\xd3\x84\x85\x85Is]\xa9\xcc\x04\x93\xd2\
+\x1bo\xbc\xc1\xca\x95+e0\xd4b\xb1\xc8h{@\
+@\xc0%\xb1\x90\xabI\xb5\x0adZ}}=\xc1\xc1\
+\xc1\x8c\x181\x82\xde\xbd{\x93\x9f\x9f\xcf\xe4\xc9\x93\x99\
+9s&\xef\xbf\xff>g\xce\x9c\x91)P\x0f\x0f\x0f\
+:u\xea$\xad\xb0\xc4\xc4D\xf6\xee\xddKAA\x81\
+\x0c(\x8a\xf3\x8b\x09/8\x07F\x8f\x1e\xcd\xda\xb5k\
+\xa5\xcb \xe2<W\x8b\xa9\xb0Z/B\xc3\x9fz\xea\
+)\xf6\xee\xdd\xcb\xda\xb5k\xd1\xe9t444`0\
+\x18x\xe7\x9dw\xf8\xe2\x8b/\xf8\xf5\xd7_\x995k\
+\x96\xecY\xf1_F\xd3IQ\xa9T6m\xd6\xc4\xe6\
+\xd6\xd4\xd4D\xa7N\x9d\xa4\xc5\xb9l\xd92*++\
+m\x5c\x01\xb1\x01?\xfd\xf4\xd3\x04\x07\x07\x93\x99\x99\xd9\
+.\x85\xdb\x9f \xbb\xc4\x0f\xea\x0b\xda\xb1\x09\xd8\xd0\xde\
+\xa7u:\x1d\xf9\xf9\xf9\x0c\x1d:\x94\xc1\x83\x07\xdb\xd4\
+\xe2+\xf3\x9a\x82\x04c\xd7\xae]\x12\xaa\xaa$\xa9T\
+\xe6\xa6Ec\x0c1\xd9\xf5z=\xf9\xf9\xf9\x98\xcdf\
+\x22\x22\x22l\xce/\xbe\xa3\xc4i\xdb\xef\xee\xe2s\xf6\
+\xbf\x0b\xed/&lNN\x0e\x1a\x8d\x86\xb0\xb0\xb0k\
+\xae\xc8\x12\x0b\xef\xc8\x91#\x92\xdd\xb7\xb9\xb9Y\xeeB\
+\x85\x85\x85\xf4\xed\xdb\x97\xdd\xbbws\xe0\xc0\x01\x9e}\
+\xf6YBBB0\x99L6\x96\x8f \xc8tvv\
+\xe6\xf3\xcf?\xe7\xe1\x87\x1fF\xa5R\xe1\xee\xee.w\
+\xfa\x86\x86\x06\x02\x03\x03\x09\x0c\x0c\xb4\xc9P8\xf2\xad\
+\xc5\xfb\xf6\x22>\xd7\xd0\xd0 !\xc4\xc9\xc9\xc9\xf4\xe9\
+\xd3G\xf6\x02\xf8\xf4\xd3O\x81\x8bl=qqq\xd4\
+\xd5\xd5\xa1\xd3\xe9\x88\x8b\x8bC\xa5R\xc9\xfe\x83B\x94\
+\xf8\x01\xf1\xbd\xa9S\xa7R\x5c\x5c\xcc\xc6\x8d\x1b\xe5X\
+\xb5\x07\x11v$\x22&R__O@@\x00\x8b\x17\
+/\xe6\xc1\x07\x1f\x94Me,\x16\x0bS\xa7Ne\xf8\
+\xf0\xe1\xdcv\xdbm\xa8\xd5j\xa6N\x9dJYY\x19\
+UUU6J\xe0\xaf\x02\xd6\xd8\xc70DfH4\
+\xb0\x11\x1b\x95Pl\xc3\x87\x0f'00\x90\xaa\xaa*\
+\xdex\xe3\x0d\x00\x19\x83\xd1j\xb5\x98\xcdf\x0c\x06\x03\
+O?\xfd4\x95\x95\x956\xbc\x89\x7f\xa2XP\xacu\
+\xe5V\xb2\xc9\xd1\xa7EZ\xce\xdd\xdd\x9d\xbb\xee\xba\x0b\
+\xc0\xa6TV,.aF~\xf9\xe5\x97\x18\x0c\x06\x02\
+\x03\x03%\xaf\x80X\xbcpqR:99]\xb2\x93\
+\x9f={\x16WWW\xbc\xbd\xbd/\x09\x1e\x8a\xc9\xa4\
+\xb9\xc6\xe8\xbf\xbc\xd1\x0b\xd7\x9b\x91\x91ADD\x84\xcc\
+\xdb^\x097`\x9f><\x7f\xfe<\xb9\xb9\xb9\xb2\x17\
+\x9fN\xa7C\xa7\xd3Q\x5c\x5cLTT\x14'O\x9e\
+$;;\x9b'\x9ex\x82\x80\x80\x00\x19\xf0S*1\
+A`\xbaa\xc3\x06f\xce\x9c\x89J\xa5\xc2\xcb\xcbK\
+.\xfe\xc6\xc6F<<<\x88\x8c\x8c\x94\xb1\x00{\xb9\
+\x1a\xbc\x83\xf2\xb3\x22\xe2,\x0a\xbaD\xd7\xe35k\xd6\
+\xc8^\x84\x80l\xbe!h\xb9\xa6N\x9d\xca\xde\xbd{\
+1\x99L2\xca\xaf|\xf6*U\x1bl;\x22\x22\x82\
+\x09\x13&\xb0n\xdd:\xaa\xab\xab\xa5\x89{\xad\xcfI\
+\x8c\xf5=\xf7\xdcCLL\x0cw\xdf}7pQ\xd1\
+\xac^\xbd\x9a\xdc\xdc\x5c\x96.]JDD\x04#G\
+\x8e$//\x8f\xda\xdaZ\x87\xdd\x8f\x94cp\xbdD\
+\x9cS\x04\x99\x85\x95)\xce\xab\xd3\xe9hnn\xa6g\
+\xcf\x9et\xea\xd4\x09WWW\x8e\x1c9\xc2{\xef\xbd\
+\x07 \x8b\xdd\x84%\xd0\xa5K\x17\xee\xbf\xff~~\xff\
+\xfd\xf7\xab\x02\xd7]\xa3\xec\x042\xc5/\xca#o\x06\
+\xb2\x94\x9f\x14\x83v\xee\xdc9\x19\x89\x15\x11N\xfb\x9b\
+wrrb\xfb\xf6\xed\x1c:t\x88\x89\x13'\xda|\
+_,`e$^\x89\xfa\x13\xc7\xcb\xc9\xc9\x91\xd1\x7f\
+{h\xa9\xf8\xbeRi\xb4g^\xda/\x0ee\xce\xbe\
+\xbe\xbe\x9e\x8e\x1d;\xb6\xdd\xfcU\x0c\xac8\x8e\xb8\xde\
+\xd4\xd4TI\x92\xd1\xda\xda\x8a^\xaf\xa7\xac\xac\x0c\x9d\
+N'I'\x17.\x5c\x88\x97\x97\x97\xec\xa1(^\xc2\
+\xd51\x18\x0cl\xda\xb4Iv\x19\x165\xfd\xd0\x16\xe5\
+7\x18\x0c\xc4\xc4\xc4H\xf3\xf1r\x81N{8\xab#\
+\x7fW\x9c_\x19+\xa8\xa9\xa9\xa1S\xa7N\x94\x94\x94\
+\xf0\xcf\x7f\xfeS~\xb6g\xcf\x9e8;;\xb3t\xe9\
+R\xee\xbd\xf7^Y\x1e\xfb\xd3O?9\x1cse\x1a\
+q\xc6\x8c\x19466JN\x83\xcb-\xc8\xcb\x8d\xb7\
+PR\x1f~\xf8!\xdf\x7f\xff=\x1f\x7f\xfc\xb1\x5cX\
+aaa\xbc\xfb\xee\xbb,[\xb6\x8c\x0d\x1b6\xd0\xa3\
+G\x0f\xfa\xf5\xebGvv6\xf5\xf5\xf5\x7f\xe8\x9c\xff\
+\x89(\xadQa\xe5\xa9\xd5j\xf2\xf3\xf3\x81\x8b1\x13\
+a\x05\xdcp\xc3\x0d444\x10\x1d\x1d\xcd\xfa\xf5\xeb\
+Y\xbbv\xad\x04Y\x899\xd2\xd8\xd8\xc8\x84\x09\x13\xb8\
+\xf5\xd6[9t\xe8\x90\xc38\xc7\x7f \xdf*\x7fQ\
+\xae\x00\x0b\xf0\x7f\xca?:;;\xb3o\xdf>RR\
+R\x181b\x84C\xaaga\xfa\x0bb\xc6q\xe3\xc6\
+\xa1\xd3\xe9lj\x08\x94\xee\x82\xa8\x95V\x1e\xc7\xc9\xc9\
+Iv\xa6\x89\x8a\x8a\x02\xb0)\xd4\x10\xc1\x95\xcb\xe1\xf4\
+U*\x15*+\xf2e\xf3\xbe\xeab\xdd\xbf\xa7\xa7'\
+^^^\xd7\x04\xfc\x11J*==\x9d\xd2\xd2R<\
+==ijj\xc2\xc9\xc9\x09\xb3\xd9L]]\x9d$\
+\xd1\x98={6\xee\xee\xee\x98L&\x1b\x8e>\xe5\xe2\
+\xdf\xb6m\x9bT\x92\x82]I\x00Gt:\x1d11\
+18;;_\xb5\x8b\xa2\xbcG\xfb\xcc\x85\xa3\x00\x19\
+\x5c\xa4\xfc\xf6\xf1\xf1\xe1\xab\xaf\xbe\xb2a\xa7\x11\x8a\xe9\
+\xd7_\x7f\xe5\xa1\x87\x1e\xe2\xeb\xaf\xbf\x96@\x16\xe1\xb7\
+*\x8f+\xa8\xc3\x83\x82\x82\x187n\x1c\x9b7o\xb6\
+\xe1\xbe\xbb\xd6\x1dL\xa3\xd1\xd0\xd0\xd0@\xd7\xae]y\
+\xf0\xc1\x07\x997o\x1e\xf9\xf9\xf920\xb6d\xc9\x12\
+z\xf4\xe8\xc1\xfc\xf9\xf3\xc9\xcc\xcc$99\x99^\xbd\
+z\x91\x99\x99I]]\xdd\xf50\x9b\x1d\x8ar\xcc\x95\
+\xa2\xd7\xeb\xa9\xac\xac\xb4\xc9\x92\x09\x5c@\xf7\xee\xdd\xe9\
+\xd3\xa7\x0fEEEt\xeb\xd6\x8d\x8f>\xfa\x88M\x9b\
+6I\x8b\x18.\xa28\x97,YBrr2ii\
+i\x7fVP\xd0\x0c|\xa5|\xc3\xfe\xc9|.~\x10\
+f\xadF\xa3\x91\x80\x1fe{$\xb8\xc8\xdd\x070{\
+\xf6l\xacV+7\xdex\xa3\x0dzO\xf8\xffB\x01\
+\x88RY{\xff077\x17\x8dFCPP\x90\xcd\
+\xfb\xcas\x09\x0b\xa0\xdd\xc9\xad\xba\xf8R\x8a\xb0\x1a\x0a\
+\x0b\x0be>\xdd\x1e\x8c\xd4\x9e\x08F\x9e\xc6\xc6F\x8e\
+\x1e=*}6aR\x8b\xba\xf2\xa0\xa0 n\xba\xe9\
+&\x9c\x9d\x9d\xe5\xce\xaf\xfc\x9cJ\xd5F\xa9\xbem\xdb\
+6Y\x0e\xec\xe5\xe5%\xd3\xa6B\x09DGG\xe3\xec\
+\xeclS[~\xb5\xd2\xde\xb88\xfa\x8c\xd5j\xa5\xbe\
+\xbe\x9e\xc8\xc8H\x0e\x1e<\xc8\x97_~)?3p\
+\xe0@\xe9\xa6\x09\xd7`\xcf\x9e=|\xfb\xed\xb7\x97\x1c\
+G\x88p_\xa6M\x9b\x86\xb7\xb7\xb7\xb4\x02\x94\x01\xcc\
+k\x11a\x01>\xf2\xc8#\xe8\xf5z\xe9~\x0aY\xbd\
+z5\xc5\xc5\xc5\xbc\xf4\xd2K\x14\x17\x17\x93\x92\x92B\
+\xf7\xee\xdd9u\xea\x14f\xb3\xf9\xaf\x04\xd4\xd8HK\
+K\x0bz\xbd\x1e\xb3\xd9,\x89]\xc4\x06\x22\x94\xac\xe8\
+4e\xb1X\xe8\xdc\xb93\xef\xbd\xf7\x1e\x9b7oF\
+\xaf\xd7K\x14\xa4\xc0\x07\xbc\xfa\xea\xabDEEq\xfc\
+\xf8\xf1?\xe3\x9e\xd6\x01e\xca74\x02\x09wA\xca\
+\x80x\x95J\xd5\xb5\xb9\xb9\x99\xa2\xa2\x22^x\xe1\x05\
+bcc\xa9\xa9\xa9\x91\x8bO,\x18\x91\xc6\xfb\xe0\x83\
+\x0f\xf8\xc7?\xfe\xc1\x9a5k\x88\x8a\x8a\x92\xe6\xac\x98\
+ \xc2\x8f\x15\x5c\x7f\xca\x89#\xea\xd2\xf7\xed\xdb'\x91\
+y\x82\xe5F\xa9a\x95\x0c\xc0\xca\xef^\xfcE\x05*\
+\xe4K\xb9\x04\x9c\x9d\x9d)))!77W\xb2\xd8\
+\xd8\xc7$\xecE\xa9\x1c\x9c\x9d\x9d9v\xec\x18YY\
+Y\x92\x9cT\xa7\xd3I\x1a\xed\x9e={2f\xcc\x18\
+\xe0\x22o\x82\xb0VDz\xd0\xd9\xd9\x995k\xd60\
+e\xca\x14y\x0e\xd1\x0a\x0d\xda\x089D;r%\xe3\
+\xf1\x1f1\xfd\xae\xf4=\xe5=\x1b\x0c\x06*++9\
+w\xee\x1cw\xdf}7*\x95\x8a\xa0\xa0 v\xee\xdc\
+Iff&...\xb8\xb8\xb8\xd0\xd0\xd0\xc0\xa9S\
+\xa7\x987o\x9ed\xef\xb1\x0f\xb8\x8a\xf2m'''\
+\xd6\xad[G@@\x80t\xb7\xfe\x88+`\xb1X\xf0\
+\xf0\xf0\xa0\xa1\xa1\x81\x7f\xfe\xf3\x9f\xa8T*\x86\x0c\x19\
+\x02\xb4\x15/\xb9\xb9\xb9\xf1\xf7\xbf\xff\x9d\x88\x88\x08\x8c\
+F#={\xf6\xa4\xa5\xa5\x85C\x87\x0e\xe1\xe5\xe5\x85\
+\x9b\x9b\xdb%]\xad\xae\x87(]R1\x9fkjj\
+d\x0aW\xcc\x7f\x11\x18\xf5\xf3\xf3\xc3d2\xb1{\xf7\
+n\xa2\xa2\xa2prr\xe2\xc7\x1f\x7f\xc4\xcd\xcd\x8d\xb8\
+\xb88\x09\xa2knn\xc6\xd9\xd9\x99!C\x86\xb0c\
+\xc7\x0e\x0a\x0a\x0a\xe4\xf1\xfe\xa0,\x05\xf2\x94o\xd8+\
+\x00\x80\x0a\xbd^?+++\x8b\x81\x03\x07r\xf3\xcd\
+7\xdb,h\xa5Yo0\x188v\xec\x18\x0b\x16,\
+`\xe4\xc8\x91<\xfa\xe8\xa3\x17\xf9\xfa\xec\x02_\x80\xec\
+\xc8\xa2\x9c\x0c\x22\x00\xb2}\xfbv:t\xe8@tt\
+\xf4%||B\x01\x006f\xb5|\xa8*\xc0>*\
+\xae\xf8Y\xa7\xd3q\xfa\xf4i\xacV+\x9d;w\xb6\
+i(z9\xffZ\xdc\xa3\xd9l\x96t]\xe2\x1e\x84\
+BIIIa\xe8\xd0\xa1\xb4\xb6\xb6\xca][\x89\xef\
+wqqA\xab\xd5\xf2\xf1\xc7\x1fs\xd7]w\xa1V\
+\xab\x09\x0f\x0f\xc7\xc5\xc5\x85\xda\xdaZ\x99\xee\xab\xa9\xa9\
+\x91\xed\xac\x5c]]m\x9a\xad\xfc\x91\xc5s\xb5\x9fi\
+ii!$$\x84}\xfb\xf6\x11\x1c\x1cLbb\x22\
+*\x95\x8a\x92\x92\x12\xb6m\xdb&\xb34*U[\x96\
+\xc3\xcf\xcf\x8f\xa4\xa4$\x9b\x18\x8dx\x16\x22\xb5\x19\x11\
+\x11AVV\x16[\xb7n%!!Ar:*\x11\
+\x84W#\xc2m\xd2\xe9t\xec\xde\xbd\x9b\xb4\xb44T\
+*\x15\xfd\xfa\xf5\x03\xa0\x7f\xff\xfe\xec\xd8\xb1\x83M\x9b\
+6\x11\x1f\x1fOyy9\x03\x06\x0c@\xa3\xd1\xb0\x7f\
+\xff~\x8cF\xa3\xcc\xac\xfc\x15\x99\x01\xe5\x9c\x14\x8b4\
+::Z\x8e\x8d\xf8_\xaf\xd7\x13\x17\x17\xc7\xde\xbd{\
+)..\x96\x95\x98[\xb6l\x91LI\x22p(\xd2\
+\xb3\x83\x06\x0db\xeb\xd6\xad\x9c?\x7f\x9e\xa0\xa0\xa0?\
+\xa2\x04~\x06^\xb6\x7fS\xd3\xbbwo\x9bH\xb7Z\
+\xad>WRR2\xd8\xd9\xd99\xea\xa9\xa7\x9e\xc2\xc5\
+\xc5ER\x84\x8b`\x9e\xc0\xad\xe7\xe5\xe5\xf1\xfc\xf3\xcf\
+\x13\x14\x14\xc4\xacY\xb3\xe8\xdc\xb9\xb3\x0cv\x88\x01\x11\
+\x9fW\xab\xd52\x85'D\x80\x86\x8a\x8a\x8a\xd8\xbbw\
+/\xfd\xfb\xf7\xc7\xc7\xc7\xe7\x12\xdfW\x1c\xc7\xde*\xb8\
+\xa8\x00\xec\xb6|.\xfe\xaaR\xb5\x95\xb2\x1e;v\x8c\
+\xf0\xf0p|}}m\x8e\x7f\xa5\x9dR\xa7\xd3q\xe0\
+\xc0\x01\xd9)\x19\xda\xcaw\xb3\xb2\xb2\x181b\x84D\
+D*\x9b\xa8\x08\xcc\x83\xc1`@\xab\xd5\xf2\xe6\x9bo\
+\xb2z\xf5j\x9e|\xf2I\xe6\xce\x9d\xcb\xa8Q\xa3$\
+Tw\xd6\xacY\xdc~\xfb\xed\x04\x07\x07SYYI\
+zz:\xe7\xce\x9d#;;\x9b\xe6\xe6f\xdc\xdd\xdd\
+e_\x81?\x13\xd0\xa2<\x8eN\xa7\xa3\xa9\xa9\x89\xb4\
+\xb44n\xbf\xfdv\x89n\xfc\xfa\xeb\xaf\xa5?\xea\xee\
+\xeeNCC\x03{\xf6\xeca\xce\x9c9\xb2\xd4\xd5~\
+\x0c\x9b\x9b\x9bqqq\xc1\xcf\xcf\x8f\x83\x07\x0f\x92\x91\
+\x91A\x97.]\xf0\xf6\xf6\xfeCJ@\xa3\xd1\x10\x19\
+\x19\xc9\xf6\xed\xdb\x09\x08\x08 55\x15\xadVKB\
+B\x02\x00\x03\x06\x0c\xe0\x9dw\xdeA\xaf\xd7\x13\x10\x10\
+\xc0\x91#G$\xd5\xfao\xbf\xfd\x86\x87\x87\xc7uW\
+\x02\x8e\x82\xce\xa2\x18,44\x14\x83\xc1 \xcf\xafR\
+\xb5\x91\xba\x08f\xe2\x8d\x1b7b4\x1a1\x18\x0cx\
+{{s\xf0\xe0A\xd2\xd3\xd3\xe9\xd1\xa3\x07\xee\xee\xee\
+\xd2U\xf3\xf2\xf2b\xe8\xd0\xa1\xec\xda\xb5\x8b\x82\x82\x02\
+\x02\x02\x02\xaeH\x03g'\xf7\x01g\xed\xdf\xd4\x0c\x1a\
+4HjY\xe1\x9f\x97\x97\x97\x97\xde}\xf7\xdd\xb7\xc5\
+\xc6\xc6\xda\x10U\x88\x85\xe8\xea\xea\x8aZ\xadf\xc9\x92\
+%|\xf1\xc5\x17$&&2w\xee\x5cI\xde\xa9\x14\
+\xb1p\x1d\x01x\xac\xd66\x22\xcd\xdf\x7f\xff\x9d\xbc\xbc\
+<\x86\x0e\x1d*}FG\x0a@\x99\x82\xb2\x89~\xab\
+/}\xb0\x1a\xa0\xf5\x02U\x97XX\xf1\xf1\xf1\xe8t\
+:\x1b\x0b\xa5=\x11\xbb\x7fee%{\xf7\xee\xc5h\
+4J\xd3\xf7\xd4\xa9S\x8c\x1c9\x92\x94\x94\x14\x9a\x9b\
+\x9b%DW\x5ckkk+\x1e\x1e\x1e\xa8\xd5j\x1e\
+~\xf8av\xed\xda\xc5\xc3\x0f?,\x01Teee\
+h\xb5Z&O\x9e\xcc\xc0\x81\x03\xe9\xd6\xad\x1bc\xc6\
+\x8ca\xfe\xfc\xf9\xcc\x9e=\x9b\xa4\xa4$\x5c\x5c\x5c(\
+((\xe0\xf7\xdf\x7f'''\x07h\x8b\x19\xd8#'\
+\xff\xa8\x88{\x17\xc1)\xc1\xc1\xe7\xe2\xe2\xc2\xe0\xc1\x83\
+\x09\x0b\x0b#--\x8dS\xa7N\xc9\xc8\xb6\x87\x87\x87\
+\xec\xa03q\xe2D\x1b\xe5\xae\xc4e\xa8\xd5j\xb9\xeb\
+\x1f=z\x94\xaa\xaa*\xc9`l\xdfF\xfbrq\x0b\
+\xe1V\x08\xc0\xd8\xe6\xcd\x9b\xb9\xef\xbe\xfbx\xe7\x9dw\
+\x88\x8c\x8c\xa4C\x87\x0e\xf8\xf8\xf8\xe0\xe4\xe4\xc4\x9bo\
+\xbe\xc9\x90!C\xd0j\xb5l\xdb\xb6\x8d^\xbdz\xd1\
+\xb1cG\x0e\x1e<\x88Z\xad\x96\x88\xcd\xbfJ\x04?\
+\x80\xd1h\x94\x8dU\x95\xf7j\xb5Ze'\xe4={\
+\xf6\x10\x16\x16&\x8b\xbe233\xd9\xb7o\x1f11\
+1\x04\x04\x04\xa0\xd5j%\xbf\xc0\xf0\xe1\xc3IMM\
+\xe5\xf4\xe9\xd3\xf8\xfb\xfb\x03W\xe5^m\x07\x9erx\
+\x9d#G\x8eD\xaf\xd7\xcbWkk+\xe1\xe1\xe1\xe9\
+\xb7\xdcr\xcb\x00\xadV\x1b-\xfcq\xb1\xfb\x8b\x14\xde\
+\x07\x1f|@SS\x13~~~\x84\x86\x862y\xf2\
+d\x87\xbe\xabX\xb4z\xad\xee\x12\xdan\x91N\xdb\xb3\
+g\x0fj\xb5\x9a\x94\x94\x14\xc9\xf8\x0b\xb6;\x8b\xd2\x02\
+\xb0\x02j\x95\x0a\x95Za\x01\xb4#z\xbd\x9e\xf4\xf4\
+tL&\x13\x09\x09\x09We:\x09\x0d\xae\xd5j9\
+p\xe0\x00eee\x12\x8e{\xe6\xcc\x19z\xf7\xee\xcd\
+\x90!Cd\x9fz\xe5\xeel\xb5Z%_\xfe\xdc\xb9\
+s)((`\xf1\xe2\xc5X,\x16\x8a\x8b\x8b))\
+)\xc1\xd5\xd5\x95a\xc3\x86\x11\x1e\x1e.A#\xad\xad\
+\xadh4\x1a\xbc\xbc\xbc\x88\x8b\x8bc\xca\x94)\xcc\x9b\
+7\x8f\xa4\xa4$\xea\xeb\xeb9x\xf0 \xb9\xb9\xb9\x92\
+'A\xf0\xcf\xffQ\xab@\x8c\xa5\xb2\xd8J\xab\xd5\xb2\
+u\xebV\xa6N\x9d\x8a\xaf\xaf/555l\xdb\xb6\
+M\x16}\x89\xb6\xd9\x87\x0e\x1d\x92\xad\xd3\xec!\xcaV\
+\xabU\x82\xa4\xdc\xdd\xdd9\x7f\xfe\xbcl\xed\x1e\x15\x15\
+%\xbb;_Kf@\xab\xd5\x12\x17\x17\xc7\x8a\x15+\
+0\x1a\x8d\xdc}\xf7\xdd\xdc\x7f\xff\xfd\xf4\xec\xd9\x93\xb0\
+\xb00\xe2\xe2\xe2\xf8\xf9\xe7\x9f\xf9\xe9\xa7\x9f\xb8\xfd\xf6\
+\xdb\xa5O\xed\xeb\xeb+\x09Lkjj\xf0\xf1\xf1\xb1\
+1\xc7\xaf\xa7\x88\xc0\xaeJ\xa5\x22\x22\x22\xe2\x12H\xb2\
+XK\x89\x89\x89\xec\xda\xb5\x8b\x92\x92\x12I\xf2*\x14\
+\xed\xcf?\xff\x8c\xc1`\xa0s\xe7\xce\xe8\xf5z\xea\xea\
+\xeapwwg\xd8\xb0a\xe4\xe4\xe4\x90\x9a\x9a*c\
+.W\xb0\x06\x16\xa0\xc8\xfd\xdb\x5c\xe7+\xaf\xbcB\xc7\
+\x8e\x1dm^]\xbbv%   \xc7b\xb1\xdc\xa9\
+\xdcmD\xcao\xf7\xee\xdd\xacZ\xb5\x8a\x993g\x92\
+\x97\x97\xc7m\xb7\xddFhh\xa8t\x15\x94Z\xce\x8a\
+\x15\x8dF\xdb\x96o\x10A:.\x12i644\xb0\
+y\xf3f\xa2\xa3\xa3\xe9\xd2\xa5\xcb%\x8d\x18\xc5\xff\x16\
+\x8b\xa5\x8d\xfcS\xec\x5c\x8a]C\xa5R)\xe3\x7fm\
+/+\xa8.\x04d\x0e\x1e<\x88\xd1h$\x22\x22\xe2\
+\x8aL\xacJ\xdf\xbf\xbc\xbc\x9c\x03\x07\x0e\xe0\xef\xef\x8f\
+V\xab%++\x8b\xa8\xa8(\xc6\x8d\x1bgCj\xaa\
+\xccp\x88\x9d{\xf2\xe4\xc9xxx0o\xde<\x9a\
+\x9a\x9a\xa8\xac\xac\xa4\xae\xae\x8en\xdd\xba1~\xfcx\
+\x8cF#\xd5\xd5\xd527/Jl\x1b\x1a\x1ahh\
+h\x90\xd8\x05Q\xc83c\xc6\x0c\x9a\x9a\x9a8|\xf8\
+0\xf9\xf9\xf9\xb2\x81\x87\xbb\xbb\xbb4\xd9\xffH\xac@\
+\xe9\xbf{{{\x93\x95\x95EAA\x01\xd3\xa7O'\
+&&\x86_~\xf9\x85\xca\xcaJi\x81\xb9\xba\xbaR\
+__\xcf\xde\xbd{\xb9\xfb\xee\xbb\xe5\xef\xf6$\xaaV\
+\xab\x15oooZ[[)))\xa1\xac\xac\x8c\x96\
+\x96\x16:v\xecxM=\x1cU\xaa6,\x84^\xaf\
+\xc7\xd7\xd7\x97\x07\x1ex\x80\x07\x1f|\x90\xa0\xa0 \xfe\
+\xf1\x8f\x7f\xd0\xb7o_\xc2\xc2\xc2HHH\xe0\x9dw\
+\xde!77\x97\x9bn\xba\x09\x7f\x7f\x7fv\xec\xd8A\
+ee%\x09\x09\x09\x92\xa0S\xd0\x9f_\xa3\xf9|\xcd\
+\xa24\xf7CCCem\x8b\x10ay9;;\xd3\
+\xa5K\x176l\xd8 \x03\xae\x02N\xad\xd1h\xd8\xb9\
+s'g\xcf\x9e\x95\xed\xd3\xa1M!\x0e\x192\x04\xbd\
+^\xcf\xaf\xbf\xfe*\x09d\xdb\x91\xef\x81\x17\xdb\xfb\xa3\
+\xe6\x93O>!,,L\xbe\x22\x22\x22D\x90!\xc7\
+b\xb1t\x04\xe2\xc5\xc5zzzRZZ\xca}\xf7\
+\xdd\xc7\x9dw\xde\xc9\xb9s\xe7\xc8\xcf\xcfg\xf1\xe2\xc5\
+2\xd2i\xef\x0b\xa9\xd4jT\x1a;\xba(@e\xb5\
+\xa2\xbbP\x99\xf7\xdbo\xbf1`\xc0\x00\x02\x03\x03e\
+\x00\xd0\xde\x05P\x82\x89\xda\x06P%\xc9@\x1d\x91\x82\
+Z\xb1J~\xb9\x83\x07\x0f\x92\x90\x90`\xe3\xb7^N\
+\xc4\xee\xbfw\xef^jjjd\xdb(OOO\xa6\
+L\x99\x82\xc5b\xb1i\xdb\xa5\xd7\xeb%\xa7\xc1\xd1\xa3\
+GIJJ\x2299\x99\x05\x0b\x16P\x5c\x5c,\x09\
+N\x06\x0d\x1aDrr2\x16\x8b\xc5\x06'\xe1\xc8\x1c\
+\x16AE\x81W\x08\x0c\x0cd\xe2\xc4\x89,X\xb0\x80\
+\xe0\xe0`\xb2\xb3\xb3e\xe3Q\xd1\x0a\x5cY[q%\
+q\xb4\x03Z,\x16\x82\x82\x82\xd8\xb6m\x1b\x1d;v\
+\xa4w\xef\xde\xd4\xd5\xd5\xb1m\xdb6|||$\x81\
+\xa5Pr\x15\x15\x15L\x980A\xa2*\xc5sS\xab\
+\xd52\x1d&\x14]SS\x13999xzz\xda\
+ty\xbe\x1a\xa5%\xc6$..\x8e={\xf6\xb0a\
+\xc3\x06^y\xe5\x15*++\xf9\xf2\xcb/\xe9\xd3\xa7\
+\x0fqqqt\xed\xda\x957\xdex\x83\xaa\xaa*\xc6\
+\x8c\x19Ctt4\xe9\xe9\xe9ddd\x10\x12\x12\x82\
+V\xab\xa5\xb2\xb2R\xa6\xdb\xae7`H\xa5RQS\
+S\x83\xaf\xaf\xaf\x9c{\xca\xb9-bE\xc1\xc1\xc1\xd2\
+j\x09\x0d\x0d\x95V\xb4\xe8r\x94\x91\x91\xc1\xcf?\xff\
+Lss3QQQ\x12\xf6\x1c\x17\x17G||\xbc\
+D\x9f:;;;*%\xbe\x19(j\xef\x1a5\x8f\
+=\xf6\x984\xbb\xc5K\xe1+\x1d\x06\xee\xb2X,N\
+\xa2\xcb\xcdc\x8f=\x86\x8f\x8f\x0f\x93&M\xe2\xad\xb7\
+\xdeb\xec\xd8\xb16}\xec.\x19\x04\xb5\xfa\x92\xe5)\
+vi\xadN\xc7\xd1\xa3G9w\xee\x1c\xc3\x87\x0f\x97\
+i\x1b\xfb\xc9)\x7f\xb7X\xb0^\xd8\xed\xed\xb3\x04\x8e\
+D\xaf\xd7\x93\x9b\x9bKnn.\xfd\xfa\xf5\xb3\xe9.\
+\xdc\x9e\x88\xe0]II\x09\x87\x0f\x1f\x96~{cc\
+#c\xc6\x8c\xc1\xc5\xc5\x05\xb3\xd9,#\xf4NNN\
+\xe8\xf5z\x1a\x1b\x1b\xf9\xfe\xfb\xef\x196l\x18\xa3G\
+\x8f\xe6\xe1\x87\x1f&;;\x9b\x9a\x9a\x1a\xb4Z-\xc3\
+\x87\x0f\x97\x5c\x00\x02\x22}\xa5@\xa4XLB\x19\xb4\
+\xb4\xb4\xe0\xe5\xe5E\xbf~\xfdX\xb8p!C\x86\x0c\
+\xa1\xb0\xb0\x90\xa3G\x8fRXx\xb1\x96\xcb\xc5\xc5\xc5\
+\x06i\xa9\x14e\xca\xca\xfe\x5cV\xabU\x92\x90\xec\xdf\
+\xbf_\x02n\xbe\xfd\xf6[jkk\xa5\xcb#v\xd0\
+\xfd\xfb\xf7\x13\x19\x19Ibb\xa2C\xb7M\xa4\x05\xd5\
+j5\x15\x15\x15R\x09t\xec\xd8Q\x82\xa9\xae6c\
+!b\x01\xb1\xb1\xb1<\xff\xfc\xf3\x84\x85\x85q\xcb-\
+\xb7p\xea\xd4)~\xfd\xf5W\x86\x0c\x19BBB\x02\
+\xee\xee\xee\xbc\xf3\xce;h\xb5ZI\xbc\xda\xda\xda\xca\
+\xd9\xb3g%0G\xa4v\xaf\x86\xc5\xeaZE\x09\x0b\
+\x16\xd0^WWW\x82\x82\x82.\x89A(\x15~\xf7\
+\xee\xddIOO\xe7\xd0\xa1CDEE\xd9P\xc4{\
+yy\xa1V\xab\xd9\xbbw/\xfb\xf6\xed\x93n\x85V\
+\xab\xc5\xdf\xdf\x9f\xd1\xa3G\xe3\xe4\xe4\xc4\xc9\x93'e\
+\xe7\xe6\x0b\xe9\xf27\x805\x97\xbb^\xcd\x93O>y\
+\xb9\xbfW[,\x96J\xb5Z=\xc1\xc9\xc9\x89\xcf?\
+\xff\x9c={\xf6p\xef\xbd\xf7\xb2\x7f\xff~\xf6\xef\xdf\
+\xcfs\xcf=\x87\x9b\x9b\x9b\xc3\x85\xa5\xb2\x8b\xce[\xad\
+m\xfc\xfd*@}a\x97\xdd\xb5k\x17---\x0c\
+\x1a4H\xc2k\xed\xe5\xa2;q\xe1w\x14\x0a@\xe5\
+\xd8\x02\x10&\xf9\xd1\xa3Giii\x91\xfe\xff\x95\xa2\
+\xd0b\xf7\xdf\xbf\x7f?\xb5\xb5\xb5\xd2\x8f\x1d2d\x08\
+AAAr\xf1\x0b\x17F\xab\xd5\x92\x99\x99\xc9\xf2\xe5\
+\xcbY\xb8p!\x91\x91\x91\xbc\xf0\xc2\x0b\x14\x16\x16R\
+VV\x86\xb7\xb77\xe3\xc6\x8d#88\x18\xb3\xd9l\
+\xd3\xc5\xb7=q\xb43*\xeb\xcb\x1b\x1b\x1b\xd1\xeb\xf5\
+DGG3s\xe6L\x02\x03\x03\xd9\xb4i\x93$\xa3\
+\xa8\xac\xac\x04\xda\xf0\x0f\xa2\xa2L\xa9\x0c\xec\xb1\xfc\xe2\
+ghS\x80\x22\x00(\x08JZ[[\xf9\xe1\x87\x1f\
+\x88\x8e\x8e\xa6\xa4\xa4DV-644\xf0\xfd\xf7\xdf\
+3y\xf2d\xd9NM\xc4C\x94\xae\xa0\x8f\x8f\x0f\xd5\
+\xd5\xd5\xb4\xb4\xb4\x90\x9f\x9fOuu5\xdd\xbbw\x97\
+\xee\x96\xf2\xbe\xaf4&\xa1\xa1\xa1\x14\x16\x16\xf2\xf1\xc7\
+\x1f3f\xcc\x18\xbaw\xef\xce\xb1c\xc7HMMe\
+\xc8\x90!\xf4\xef\xdf\x9f\xc6\xc6F\xde~\xfbm\x22\x22\
+\x22\xe8\xd2\xa5\x0b\x06\x83\x81\x80\x80\x00\x1a\x1b\x1b\xa5{\
+%\xf2\xf5\x7f2\xce\xde\xe6\x1eD>\xbf\xb5\xb5U\xd6\
+\x9f(\xd3\xd9b\xfcEM\xc9\xa0A\x83\xd8\xb2e\x0b\
+\xc5\xc5\xc5\x04\x07\x07K\x05)\xe2\x05\xbe\xbe\xbe\xd4\xd6\
+\xd6\xb2g\xcf\x1e~\xfd\xf5Wjjj\x08\x08\x08\xc0\
+\xdd\xdd\x9dn\xdd\xba1z\xf4h\xd4j5\x99\x99\x99\
+\xd4\xd7\xd7\x9ftuu\xbd\xc9r\x05sP\xf3\xec\xb3\
+\xcf\xca(o;\xafTgg\xe7\xfeg\xce\x9c\xe9\xf0\
+\xe6\x9bo2}\xfat\xc2\xc3\xc3\xf9\xf4\xd3O\x89\x89\
+\x89\xe1\xa6\x9bn\x92\xc0\x1d\xc7#\xe2`p\xac\x17y\
+\xf9v\xec\xd8\x81\x8f\x8f\x0f\xfd\xfa\xf5\xb3a\xb5\xb5\x1f\
+T1\x81U\x17\x8eyQ\x01\x5c\xba\xfc\x05\xe8H\x98\
+\xf1\x82\xc1\xf6r;\x8ep1\x0c\x06\x03\xa5\xa5\xa5\x1c\
+8p\x80\x80\x80\x00rss\x89\x8f\x8f'..N\
+\xe6\xf9\x95\x99\x90\x1f\x7f\xfc\x91\x95+W\xf2\xd1G\x1f\
+\xd1\xd4\xd4\xc4\x0b/\xbc\x80\xa7\xa7'\xe7\xce\x9d\x93\x8b\
+\xdfh4J?\xfa\x8f\x06\x9f\xec#\xe5MMM\x92\
+\xc9\xa8_\xbf~t\xec\xd8\x91\xf5\xeb\xd7\xcb\x00fa\
+a\xa1<\xa7\xab\xab\xabtQ\x04\x87\x83\xbd\xf5!\xac\
+\x0d\xf1\xbf\x97\x97\x17\xdf\x7f\xff=#F\x8c`\xea\xd4\
+\xa9\xfc\xfa\xeb\xaf\xe4\xe5\xe5\xa1\xd7\xeb%\xaf\x81\xb0\xa8\
+v\xed\xda%!\xd0J\x17N\x10\x9a8;;\xe3\xee\
+\xee.\x9bm\x9e<y\x12OOO\xc2\xc2\xc2\xae)\
+2/r\xe8))),[\xb6\x0c\x93\xc9DJJ\
+\x0aQQQ\xec\xdb\xb7O\xa6\x00G\x8c\x18\xc1\xb9s\
+\xe7x\xeb\xad\xb7\xe8\xd5\xab\x17\x91\x91\x91\xd4\xd5\xd5\x11\
+\x10\x10\x80\xd1h\x94\x0b_\xa4\x88\xaf\x97(K\xa6\x83\
+\x82\x82l6J\xa5B\x16\x8dp\x9c\x9d\x9d\xe9\xdd\xbb\
+7\xdf}\xf7\x9dl\xd7\xa6\xdcX\x05*\xd5\xc7\xc7\x07\
+\x93\xc9$\x15Aff\xa6\x8c5\xf4\xea\xd5\x8b\x1bo\
+\xbc\x91\xa2\xa2\xa2\xdb\xcf\x9c9\x93.\xe8\xc8\xdb{\xa9\
++++\xb9\xdc\xab\xb6\xb6\x96\xba\xba\xba\x85\xef\xbc\xf3\
+NMll,=z\xf4 ++\x8b\xec\xecl\xa6\
+M\x9b\x06p\xd9.\xa7J|\xbe\xca\x0aX/V\xf6\
+UVVb2\x99$\xfc\xd7>E\xa4\x14\xe5\x80\xa9\
+P\xfa\xff\x8eEth\xad\xae\xae&  \xe0\xb2\x0f\
+J\x1cW\xf8OG\x8f\x1e\xc5\xd9\xd9\x99\x8a\x8a\x0a\x02\
+\x02\x02\xe8\xdb\xb7\xaf\xcd\xb5\x19\x0cm\xdd\x88\xd7\xad[\
+\xc7\x93O>\xc9\xf9\xf3\xe71\x9b\xcd\x8c\x1e=\x9a\xce\
+\x9d;\x93\x91\x91APP\x10\x13'N\xc4\xdd\xdd]\
+\x12D(\x83\xa3r|\xdaI\x81\xb5'\xca\xcf\x8bT\
+\x93\xd9l\xe6\xf6\xdbog\xd5\xaaU\x12\xa5(\x14^\
+ff&G\x8f\x1e\xe5\xf4\xe9\xd3\xe4\xe7\xe7c4\x1a\
+\xf1\xf0\xf0\xb09\x8eP\x1aB\xe9755\xe1\xe3\xe3\
+Chh(\xb3g\xcf\x06\xe0\xef\x7f\xff;\xcd\xcd\xcd\
+\xb2\x95\xb9\x88\xa4\x1b\x0c\x06N\x9d:\xc5\xacY\xb3\x80\
+\xb6\xf2Vq\x9d\x22\xc0Y__\x8f\x8f\x8f\x0f\x91\x91\
+\x91\x18\x0c\x06\xfc\xfd\xfd\xf9\xf1\xc7\x1f\xa9\xaa\xaar\xc8\
+&\xdc\xdef\x22\xd8s\x8cF#\xaf\xbc\xf2\x0ak\xd6\
+\xac\xe1\xf4\xe9\xd3\xb8\xba\xba2c\xc6\x0c\xaa\xaa\xaax\
+\xe6\x99ghmm\xe5\xb3\xcf>c\xec\xd8\xb1\xcc\x9f\
+?\x9f\x9c\x9c\x1c\x82\x82\x82\xa8\xa9\xa9\x91\xe8BWW\
+W\x99R\xbd\x9e\x19\x01Q\xe3QVv\x11\x81+\xe6\
+\xb2\x80|\xd7\xd7\xd7K`XTT\x14/\xbd\xf4\x12\
+\xa7O\x9f\xa6\xba\xba\xfa\x12\xae\x03\x1170\x1a\x8d\xc4\
+\xc7\xc7\xe3\xee\xee\xce\xbe}\xfbx\xe7\x9dw\xb8\xf7\xde\
+{y\xf5\xd5W\xd9\xb6m\xdb[*\x95j+`\xd3\
+\xfd\xc8\xd1K-\xb8\xcc\xdb{]\xa0\xbe\xca4\x9b\xcd\
+\xf7\x08\xc4[jj*AAA\x0c\x1e<\x18\xb86\
+\x98\xa5\x98\x18\x00\xf9\xf9\xf9X\xadV\x19\xdd\xbc\xdc\xb1\
+.\xb7s;\xfa]\xadVSPP \xbb\x0b+\xff\
+fo\x12\x8bc;99QXXH~~\xbe\x8c\
+\xca\x0f\x1f>\x1c\xb8\xd8\xc9H\xc4BV\xadZ\xc5\xec\
+\xd9\xb3INN\xc6\xc7\xc7\x07\x9dN\xc7\x1dw\xdcA\
+vv6^^^\xdcx\xe3\x8d\xb8\xb9\xb9Iz(\
+\xe5\xe2\xb7\x0f\x94^\x8d\x1f\xaa\xbcf\xe5}\x88H\xb3\
+\xd9l\xe6\xce;\xefd\xe5\xca\x95\x94\x97\x97c\xb1X\
+HJJ\x22$$\x84\xba\xba:\x82\x83\x83\xf1\xf4\xf4\
+\xe4\xe7\x9f\x7f\x96=\xf7\x84\x8b \xdc\x0be\x01\x96\xd9\
+l\xa6s\xe7\xcedggs\xd7]w\x11\x1b\x1b\xcb\
+\xc3\x0f?LFF\x06\xc1\xc1\xc12\x98*\xe0\xdd\xeb\
+\xd7\xaf\xe7\x91G\x1e\x01.R\x89+\x8b\xb7\x9a\x9b\x9b\
+\xe9\xd1\xa3\x07\x81\x81\x81\x84\x86\x86b6\x9b%\x0d\xf8\
+\xb5\x10z\x88\xe3\xddq\xc7\x1d\x0c\x1b6\x8c\x97^z\
+IZ\x8e\x93&M\xc2\xd9\xd9\x99G\x1ey\x84\x9a\x9a\
+\x1a~\xfc\xf1G\x86\x0f\x1f\xceM7\xddDnn.\
+\xe1\xe1\xe1\xf2\xb9*IW\xfe(\xe4\xfaJ\xa2d\xaf\
+\x12\xe5\xc1\xc2\xfd\x13\x81RQ\x08\xd7\xd8\xd8(\x89Y\
+\x92\x92\x92\xb8\xf7\xde{9|\xf8\xb0C\xda=\xb8\xd8\
+>N\xa7\xd3\xc9\xe0\xbdZ\xad\xe6\xd4\xa9S\x07\xde\x7f\
+\xff\xfd\x07v\xef\xde-\x01P\x97{in\xbe\xf9f\
+\xccfs\xbb/\xd1\x9b\xcd\xc3\xc3\xe3\x84\x97\x97\x97\x9f\
+Z\xadN\xfa\xf2\xcb/\x19?~<\xbd{\xf7\xb6i\
+\x1er5\x83(\xa2\x9b\x1a\x8d\x86\xbd{\xf7R]]\
+MRR\x92\xc4\xd8;:\x862\x0b \x06\xaf\xbds\
+\x8a\xdfu:\x1d\x87\x0f\x1f\xa6\xb6\xb6\x96\xfe\xfd\xfb\xcb\
+\x87\xdd\xde\xe7E\xcc`\xef\xde\xbd\xb2\x01\xe7\xa8Q\xa3\
+lz\xd7\x8b\xc5\xff\xf1\xc7\x1f3w\xee\x5c\xc6\x8c\x19\
+\xc3-\xb7\xdc\xc2\xe3\x8f?\xce\x92%K\xe8\xd8\xb1#\
+---L\x992E2\x04\x89c+\x03NJ\xbf\
+\xb3\xbd\xa0\xdc\xb5\x88F\xa3\x91\x93\xbao\xdf\xbeDG\
+G\xb3z\xf5j4\x1a\x0d\xf1\xf1\xf12\xe3\xf0\xd9g\
+\x9f1b\xc4\x08\x0e\x1d:\xc4\xd1\xa3G\xc9\xc9\xc9\x91\
+\x0dX]]]\xa5\x05$\x94\x9d\xc5b!22\x92\
+\x0d\x1b6\x10\x11\x11\xc1\x82\x05\x0b\xd8\xbe};'O\
+\x9e\xc4\xcf\xcfO\xa61\xc5\xf3\xdc\xb5k\x17*\x95\x8a\
+a\xc3\x86\xc94\x97\xd2\xcf\x15\xd8\x80\x82\x82\x02\x8cF\
+#{\xf6\xec\xc1\xc3\xc3\x83\x0e\x1d:\xd8<\xfb\xcb\x8d\
+\x858\xaeN\xa7c\xf4\xe8\xd1\xfc\xfd\xef\x7f\xa7\xb1\xb1\
+\x91\x81\x03\x07\xca\x0a\xbb\xe6\xe6f\xbe\xfa\xea+\xbav\
+\xed\xca\xd2\xa5K9~\xfc8\xcf>\xfb,\x03\x07\x0e\
+$**\xca\xe6\xb9\x5cOQ*\xf6\xe6\xe6fBB\
+Bpvv\x96\xf3PP\xc2\x99L&rrr\x08\
+\x09\x09\x91.ZBB\x02MMMl\xdd\xbaU*\
+\xae+\x9dG\xa3\xd1\xd4;;;\x8fsww/\x13\
+57\xa2\xea\xb3\xdd\xd7\x84\x09\x13.\xab\x00\xaa\xab\xab\
+imm%((\x08''\xa7\x1fsss\x87\xed\
+\xdb\xb7/\xe2\x81\x07\x1e\xc0\xcb\xcb\xeb\xaaa\xb5\xca]\
+K\xa0\xf3\xf6\xef\xdf\x8fN\xa7\xa3W\xaf^\xb8\xbb\xbb\
+\xb7\xdb_@(\x001p\x97S\x00\xc2\x9c\xd5h4\
+\xec\xd9\xb3\x07\xa3\xd1H\x5c\x5c\x9c\x0d\x7f\xa1\xd2\x07\x12\
+\x13\xdd\xd5\xd5\x95\x92\x92\x12RSS\xa9\xa9\xa9\xa1w\
+\xef\xde\xd2\xefW\xd2w\xadZ\xb5\x8a\xb9s\xe7\xd2\xab\
+W/\xde}\xf7]\x9ey\xe6\x19ZZZX\xb4h\
+\x11\xb5\xb5\xb5L\x9c8\x11\x0f\x0f\x0fI\x0f\xad\xb4x\
+\xc4CTVBJ_\xccA\xea\xf3Z\xccS\xb1\xa3\
+\x88\xe6\x93aaa|\xf6\xd9g477\x93\x94\x94\
+\xc4\xa1C\x87\xf8\xe5\x97_x\xe5\x95Wx\xe0\x81\x07\
+\x18:t(\xae\xae\xae\x9c={\x96\x8c\x8c\x0crr\
+r0\x9b\xcdr\x91\x1a\x0c\x06\x89\xe0tuue\xd5\
+\xaaUL\x9d:\x95E\x8b\x16\xf1\xd9g\x9fI\x9a\xae\
+\xda\xdaZ\x9bn\xc3YYY\xb8\xb8\xb8\xd0\xa7O\x1f\
+\x99\xce\x14\xf7!\xd8\x8f\xeb\xeb\xeb%a\xec\x9e={\
+\x184h\x90C\xb8n{;\xb3pS\x8cF#\x9e\
+\x9e\x9e\xbc\xf0\xc2\x0b\x0c\x192\x84\x90\x90\x10\x0a\x0b\x0b\
+\xe9\xd2\xa5\x0b\x1e\x1e\x1e|\xfb\xed\xb7xxx\xf0\xe0\
+\x83\x0fR__\xcfC\x0f=D\xcf\x9e=\xe9\xd6\xad\
+\x9b\x8cc\x5c\x0f%`\xff\x1c\x05,\xd8\xdf\xdf\x1f\x0f\
+\x0f\x0f\xa9\x18E\x90\xd0\xc7\xc7\x87\xd4\xd4T\xd9\xf7Q\
+\x04S\xfb\xf6\xedKFF\x06\x07\x0f\x1e$\x22\x22\xe2\
+j\x9a\xee\xce\xb0Z\xad{\x00\x1b\x97\xee\xb2\xaf\xab\xb9\
+\x19\x8b\xc5BUU\x15\x16\x8b\x85\xb3g\xcf\xce\x88\x8b\
+\x8b\xcb\x15>\xa62\xa2}5\xe6\xac\x18\x9c\xb2\xb22\
+jjj\xf0\xf0\xf0\x90~\xe3\xd5\x5c\xcb\x95\x8e/R\
+s&\x93\x89\xca\xcaJ|}}\x81\xf6\xdbg\x8b\x07\
+\x01m\xbd\x02\x8a\x8b\x8b\x09\x0f\x0f'99Y*\x0d\
+\x917\xde\xb8q#s\xe6\xcc\xa1C\x87\x0e,_\xbe\
+\x9c\xd4\xd4Tv\xed\xda\xc5\xfc\xf9\xf3\xb1X,\x0c\x1d\
+:T\xa2\xb8\xc4\xa2Wr\xfc\x89V^\xde\xde\xde\xb2\
+\xa5\x97xyxx\xe0\xe1\xe1!w\xe3?21\xc5\
+\xeeh2\x99\x983g\x0e\xcb\x96-#++\x8b\xe3\
+\xc7\x8f3a\xc2\x04233\xe9\xd0\xa1\x03\xf9\xf9\xf9\
+\x0c\x1e<\x98\xf7\xde{\x8f3g\xce\xf0\xc3\x0f?p\
+\xd7]wa\xb5Z9v\xec\x18\xbbw\xef\xe6\xd7_\
+\x7f\x95\xa9\xbb\xce\x9d;\xe3\xef\xef\xcf\xf8\xf1\xe3qu\
+u\xe5\xbb\xef\xbe\xc3l6\xe3\xee\xee\x8e\xab\xab\xab,\
+Zqww\xe7\xe9\xa7\x9ff\xd3\xa6M,_\xbe\x5c\
+\x16N\xb5\xb6\xb6\xa2\xa6M\x01\xb4^\xc8\xc8\xb8\xbb\xb9\
+\xd1\xb1c4\x80$$\xb9\xda\x80\x9cr\x0e\xcc\x9d;\
+\x97\xe4\xe4d^~\xf9e\xf4z=\x1e\x1e\x1e\xe4\xe5\
+\xe5\x11\x10\x10\xc0\xa8Q\xa3\xf8\xe1\x87\x1fX\xbdz5\
+\xaf\xbe\xfa*\x1f\x7f\xfc1\xaf\xbc\xf2\x0a{\xf7\xee%\
+00\xf0\xba\xa4\x01\x1d]\xabX\xe8\x22U\xab\x5c3\
+bQ\xc7\xc7\xc7\xb3a\xc3\x06JJJ$U=\xc0\
+\x8b/\xbeHxx8G\x8f\x1e\xbd\x12'\xc0SV\
+\xabu\xbd\xf2\xbcW\xf3\xd2\x8a>qW#j\xb5\x9a\
+\xdc\xdc\xdc\xa2;\xef\xbcs<p\xa0\xa9\xa9\xc9E\x89\
+\x81\x17\xbb\xa9\xfdn&\xfe\xae\xfc_ \xc3\xd4j\xb5\
+\xe4|\xbb\x9a\x05\xee(\x90\xe6\xe8<%%%47\
+7\xdb\x04\x18\xed\xd3o\xe28\x82-(--M\xe6\
+U\x01\xc9\x8d\xe7\xe4\xe4\xc4/\xbf\xfc\xc2\xa4I\x93\x08\
+\x09\x09a\xd9\xb2exxx\xf0\xd2K/1`\xc0\
+\x00bcc\xe9\xd9\xb3'AAA\x94\x97\x97\xcbk\
+\x14\xd1f///\xb9\x1b\xe6\xe4\xe4p\xee\xdc9\x0a\
+\x0b\x0b\xc9\xcb\xcb\x93\xe7pvv\xc6\xc3\xc3\x83\xe8\xe8\
+h\xbav\xed\x8a\x87\x87\x87\x1csev\xe4J\x8aA\
+0\xe7X,\x16\x16/^\x8c\xd5je\xe9\xd2\xa5h\
+4\x1aIV\x9a\x90\x90@jj*\x91\x91\x91\xb8\xbb\
+\xbb3a\xc2\x04&L\x98\xc0[o\xbd\xc5\xde\xbd{\
+\xf9\xf1\xc7\x1f\xd9\xb6m\x1b'O\x9e\x94\xcf3((\
+\x88\x9c\x9c\x1c\x86\x0e\x1d\xca\x8e\x1d;X\xb7n\x1d\xd3\
+\xa7O'22\x12\x93\xc9DSS\x13\xb5\xb5\xb5\xb8\
+\xb9\xb9\xf1\xc0\x03\x0f\xf0\xd4SOa\xb5ZY\xbcx\
+1j\x8d\x9a\xfa\x86\x064:-\xe6\xfa:<\xdd=\
+\xe8\xdd\xa7\x0f\xbf\xfd\xf6\x1b\x83\x06\x0d\xe2\x9bo\xbe\xa1\
+G\x8f\x1e\x0c\x1e<\xd8\x86l\xf6J\xf7*\x1a\x8a\xbc\
+\xf1\xc6\x1b\xa4\xa4\xa4\xf0\xc9'\x9f\xb0x\xf1b\x9a\x9a\
+\x9a\xa8\xae\xae\xc6\xd5\xd5\x951c\xc6p\xe0\xc0\x01\x9e\
+{\xee9f\xcd\x9aE@@\x00\xabV\xadB\xadV\
+\xcb2\xf7\xeb\x8d\x0a\x14Y\xa9\xca\xcaJ\xa9\x10\x04\x04\
+[d\x09\xc2\xc3\xc3\xf1\xf2\xf2\xe2\xb1\xc7\x1ec\xd5\xaa\
+U\x12N\xee\xe2\xe2\xc2\x1bo\xbc\xc1\xec\xd9\xb3\xc9\xca\
+\xca\x2222\xd2\x11\x99\xcd\x87\xc0K\x7f\xe4\xda4=\
+z\xf4\xb8b\xa4P\xbc\xc4\xee\xd2\xa7O\x9f\x92N\x9d\
+:\xedmjj\x9a\xad\xf4g\xc5\x8e\xe9\x88\xb5W\x5c\
+\xb0(\x0aJKK\xa3\xb8\xb8\x18\x7f\x7f\x7f\x12\x12\x12\
+\xe49\xda\x8b\x01\x88\x81\x84K\xbb\xba*\xa3\xd9\x22\xbf\
+{\xf4\xe8Q\x8a\x8b\x8b\xe9\xdd\xbb7\xee\xee\xee\xed\xe2\
+\x0b\x94y\xff\x8c\x8c\x0c&M\x9a\x84\xbf\xbf\xbf\x04\xf0\
+\x18\x0c\x06\x8e\x1e=J\xff\xfe\xfd1\x1a\x8d\xac^\xbd\
+\x9a\xee\xdd\xbb\xf3\xea\xab\xaf\xb2c\xc7\x0e\xee\xbd\xf7^\
+\x92\x92\x92$\xed\xb7^\xaf\x97<\x09\xa2S\xf0\xd9\xb3\
+g\xf9\xe7?\xff\xc9s\xcf=\xc7\x8a\x15+\xd8\xbcy\
+3\xa7O\x9f\xa6\xb1\xb1\xd1fa\xd7\xd7\xd7SPP\
+@ee\xa5\x84\xf8\x8a\xfburr\x92\xe0\x15\x19\xc1\
+\xb5+\xc2Q\xe6\xe0\x85u\x96\x92\x92\x82\xd1h\xe4\xf3\
+\xcf?\xa7\xa9\xa9\x89\x94\x94\x14\xd2\xd2\xd2\xf8\xe2\x8b/\
+\xb8\xf9\xe6\x9b%9\xa8\xc0\xa0w\xec\xd8\x91\xb1c\xc7\
+\xb2p\xe1B\xa6M\x9bF\xb7n\xddpss\x935\
+\x0b\x19\x19\x19\xec\xdd\xbbW\xeeL+W\xae\x94\x01\xa5\
+\xd6\xd6V\x06\x0d\x1aD\x87\x0e\x1d\xe8\xd9\xb3'\xef\xbf\
+\xff>eee\x0c\x1a8\x08\xb5JESS#:\
+\x8d\x96\xc6\xa6F\xbc\xbd\xbciii\xa1\xb6\xb6\x16g\
+gg6m\xda\xc4\xc8\x91#\xaf\xbarO\xb9\x09D\
+DD\xa0R\xa9x\xfd\xf5\xd7\xe9\xd3\xa7\x0f\x1d;v\
+\x94\xaekcc#\x1d:t\xc0\xd9\xd9\x99\xed\xdb\xb7\
+\xe3\xe3\xe3\x83\xbf\xbf?\xbf\xfd\xf6\x1b...\xb2\xe7\
+\xe0\x9f\x1d\x08\xb4w\xe1\xc4\x06\x10\x14\x14$\xfbJ(\
+\xefA\xa7\xd3\xd1\xbbwo^|\xf1E233\x19\
+9r\xa4\xec8\xec\xe5\xe5EBB\x02\xdf~\xfb-\
+NNN\xb2e\xde\x05\xd9\x00\xcc\xfc\xa3\xd7\xa9\xbd\xd6\
+<\xa8\x02j\xba\x1d\x98\x0c\xac\x87\x8b;\x95\xf0-\x1c\
+-8\x11\x00\xbc\x90Z\xb4a\x0e\xba\x9a\x02\x8d+=\
+$\xf1\xf7\xd6\xd6V\xca\xca\xca\xf0\xf2\xf2r\xd8\x1fO\
+\x88(\xb75\x9b\xcd\x1c:t\x88\xbe}\xfb\x12\x19\x19\
+)\xd3\x9a\x06\x83\x81\xa2\xa2\x22\x12\x13\x13\xd1j\xb5\xac\
+^\xbd\x9a\xf0\xf0p6o\xde\xcc\xca\x95+\x99<y\
+2\xbd{\xf7\xa6[\xb7n\xb2d\xd6b\xb1PWW\
+GEE\x05iiil\xd8\xb0\x81\xb4\xb44\x9c\x9d\
+\x9d\x190`\x00K\x96,\xa1[\xb7n\x04\x06\x06^\
+\x82\xdf\x16@\x9f\x9a\x9a\x1a\x1a\x1b\x1be\x81P]]\
+\x1dUUUxxx\xe0\xef\xef/\x9b\x90\x8a\xddK\
+Y\xaa-&\x94\x88(k4\x1a\xee\xbb\xef>T*\
+\x15\xf7\xddw\x1f\x16\x8b\x85Q\xa3F\xb1u\xebV\x92\
+\x92\x92\xd8\xbf\x7f?\x11\x11\x11\x94\x97\x97SRR\x82\
+J\xd5\xc6\x5c\xe4\xe6\xe6Fll,\xb1\xb1\xb1,Z\
+\xb4\x88\xa6\xa6&rss9}\xfa4\xaf\xbf\xfe:\
+\xf7\xdcs\x0f+V\xac\xa0\xbe\xbe\x9e\x85\x0b\x17\xe2\xef\
+\xef\x8fZ\xad\xc6\xdd\xdd\x9d\xa2\xa2\x22\x5c\x5c\x5cx\xf6\
+\xd9gy\xf1\xc5\x171\x99L\xbc\xf4\xd2Km\xa9Y\
+S\x0d*M\x9b\x82\xea\xde\xbd;\xc5\xc5\xc5t\xef\xde\
+\x9d\x13'N\xf0\xc1\x07\x1f\xf0\xd8c\x8f]5\x9cY\
+\xb8<z\xbd\x9eg\x9ey\x86\x1d;v\xb0p\xe1B\
+~\xf8\xe1\x07\xbc\xbd\xbd\xa55&\x0a\xa8RRR\xc8\
+\xcf\xcfG\xa5R\xd1\xa1C\x07~\xfa\xe9'\x89%\xa8\
+\xa9\xa9\xb9.%\xc3\xca\x5c\x7f]]\x1d555x\
+zz\xca\xbf\x8b\xf3\x89\xdd\xfe\xb1\xc7\x1e\xe3\x8e;\xee\
+ 66\x96Y\xb3fI*\xfb\xb8\xb88\x1ey\xe4\
+\x11^x\xe1\x05z\xf7\xee-27\xdbh[\x83\x7f\
+X\x1c\x11\x82\x5cVjjj\xe8\xd9\xb3'111\
+455\x9dV\xa9T\xc7/\x04\x1fdt\xf6r)\
+;\xbd^Oqq1\x99\x99\x99TUU\x11\x1c\x1c\
+L\xd7\xae]/\x1b\xe0\x10\x83hO\x0a\xe2H\x849\
+\x7f\xf0\xe0A|}}\xe9\xda\xb5\xab\x9c(JKA\
+\x88^\xafg\xcf\x9e=TUU1}\xfat\xb9\x13\
+\x8b\x9d(11\x91\xf2\xf2r\xbe\xfe\xfak\x02\x02\x02\
+0\x99L<\xfc\xf0\xc3\x18\x8dF\x9e|\xf2I\xfa\xf6\
+\xed+\x8bq*++\xa5O\xfd\xe1\x87\x1f\xb2y\xf3\
+f\x22\x22\x22X\xb4h\x11\xcf<\xf3\x0c\xe3\xc6\x8d\xa3\
+K\x97.\xf8\xf8\xf8\xc8\x12\xcf\xfa\xfaz\x1a\x1a\x1ah\
+ll\x94n\x8a\x88\xc8k4\x1aY\xab\x7f\xe6\xcc\x19\
+v\xec\xd8\xc1\xc6\x8d\x1b9{\xf6,~~~\x04\x06\
+\x06\xca\x5c\xb2p\xa1\x94%\xd3p\xd1\xc7\x1c0`\x00\
+F\xa3\x91\xff\xfb\xbf6\xda\xc7\xfe\xfd\xfb\x93\x96\x96\xc6\
+\xaaU\xab\x982e\x8aD\xf2\x09>\xbd\xc6\xc6F\x89\
+\x9c\x13\xe9&???bbb\xb8\xf3\xce;\xd9\xb3\
+g\x0f[\xb6l\xe1\x89'\x9e\xe0\xae\xbb\xee\xe2\xc8\x91\
+#\xb8\xbb\xbbs\xd3M7Q__OII\x09\x1e\
+\x1e\x1e\x0c\x1d<\x84\x7f~\xf6\x19\x07\x0f\x1ed\xfc\xf8\
+\xf189;\xc9\x1dW\xaf\xd7\xe3\xe3\xe3Cvv6\
+\x91\x91\x91l\xda\xb4\x89\xb0\xb00:t\xe8\xe0\x10\x12\
+n\xff\xec\xc4\xdf\x052r\xec\xd8\xb1\xbc\xff\xfe\xfb\xa4\
+\xa5\xa5I^C\x91Fknn\x96AH\x7f\x7f\x7f\
+\x82\x83\x83\xf1\xf6\xf6\xe6\xe8\xd1\xa3\x14\x15\x15\x11\x1c\x1c\
+,i\xea\xffLQZ\x00\x8d\x8d\x8d\xb8\xbb\xbb\x13\x10\
+\x10\xe0\xb0l^\xaf\xd7\x13\x16\x16Fqq1\xdb\xb6\
+m\xc3\xc5\xc5\x85\xf8\xf8x\xa0m\xeew\xe9\xd2\x85\xca\
+\xcaJ~\xf9\xe5\x17\xc2\xc3\xc3\x7f\xb6Z\xad\xa3\xfe\xd3\
+\xeb\xfbO\x15\x00*\x95\xea\x94Z\xad\xde\xdf\xd2\xd2r\
+\xbb\x88\x96_\xce\x8f\x17=\xf5\xf2\xf2\xf2\xa8\xac\xac$\
+::\x9a\x8e\x1d;^U\x91\x8ex8\xed)\x00\x91\
+\xca;\x7f\xfe<\xa7O\x9f&88\x98\x0e\x1d:\xc8\
+\xdd\xd1>\xc2l0\x18\xa8\xaf\xaf\xe7_\xff\xfa\x17C\
+\x14P_\x83\xc1\x80Z\xadf\xda\xb4i\xec\xdd\xbb\x97\
+/\xbe\xf8B6\xe8\xf8\xfa\xeb\xaf\xd9\xb2e\x0b\xf7\xdf\
+\x7f?\x13&L\xc0\xd7\xd7\x97\xf2\xf2rN\x9e<\xc9\
+\x8e\x1d;\xf8\xec\xb3\xcf8v\xec\x18\xbdz\xf5\x92\xda\
+\xbcC\x87\x0eX,\x16L&\x13uuur\xd1\x8b\
+\xfbQ\xee\xde\x22\x92/\x824bLE\xfd\xbb\x8b\x8b\
+\x0b\xfb\xf6\xedc\xc5\x8a\x15\xa4\xa6\xa6\x12\x13\x13Cp\
+p\xb0\xcc\x0b+II\x84u'|\xc6\x81\x03\x07\xa2\
+\xd3\xe9\xf8\xf6\xdbo\xd1j\xb5\xf4\xe8\xd1\x83S\xa7N\
+\xf1\xe9\xa7\x9f2c\xc6\x0cBBBd\xca\xd0>s\
+\xd1\xd8\xd8(w0\x8dF\xc3\xb8q\xe38v\xec\x18\
+k\xd6\xac\xe1\xe6\x9bof\xc0\x80\x01\xec\xd9\xb3\x87\xe2\
+\xe2b.t\x9b\xa2\xb0\xa8\x10\x8dF\xc3\xf8Q\xa3\xd9\
+\xb2y\x0b\xdf\xac\xfb\x9a1c\xc6\xe0\xe1\xe9\x89\xc5j\
+\x91\x0bBX3...l\xdc\xb8\x91\xb1c\xc7\xca\
+\xe0\xe2\xd5JSS\x13\xde\xde\xde$''\xf3\xca+\
+\xaf`\xb1X\x182d\x88L\xf9\x09+I\xb8\xb2j\
+\xb5\x9a\xc8\xc8H\xa2\xa3\xa3\xa9\xab\xab\xc3\xd9\xd9\xf9\xb2\
+\xd6\xe2\x7f\x22\xc2\x15hllD\xa7\xd3\xd9\x94\x07+\
+?#\xd8\xa0\x8a\x8b\x8be\x8d\x87\xb3\xb33\xb1\xb1\xb1\
+rsHII\xe1\xe4\xc9\x93\x1b\x8b\x8a\x8a\xc6\x0b\x17\
+\xf3?\x91?\x05\x08\xadR\xa96\xb7\xb4\xb4$Y\xad\
+\xd6*ePP\xe9\x03)/\xd4d2I\x98\xa8 \
+\x9d\xb4\x17Gh9e\xfaBy|\xfb\xc0`UU\
+\x15V\xabU\xee\xa4\xf6\xee\x85\xf2X\xa9\xa9\xa9\xb8\xbb\
+\xbb\x93\x90\x90 \xa1\x96\x1a\x8d\x86W^y\x85\x0d\x1b\
+6\xf0\xdak\xaf\xc9\x14\xcc\xf9\xf3\xe7y\xf7\xddw\x19\
+0`\x00\x93&M\x22((\x88c\xc7\x8e\xb1z\xf5\
+j\xbe\xfa\xea+v\xee\xdcIBB\x02\x1f|\xf0\x01\
+\xcf?\xff<qqq\xd4\xd4\xd4PQQAmm\
+\xadM\x1aR\x89\xc7\x17\xef)\xafO\xf97\x8b\xc5B\
+ss3>>>\x8c\x1b7\x8ee\xcb\x96\xf1\xea\xab\
+\xafRYY\xc9\xd0\xa1Cy\xe7\x9dw$\xa3\x8c\xb2\
+\xfb\xb2\x92\x8cE\x14\xf3<\xf9\xe4\x93<\xf6\xd8c\x9c\
+:u\x8a\xc2\xc2BF\x8e\x1c\x89\xd9l&))\x89\
+\xdc\xdc\x5c\xbc\xbd\xbdm\x16\x8a \xa9\x14\x0a\xd4\xc9\xc9\
+I\xb2 ?\xf4\xd0C\x0c\x1f>\x9c\x05\x0b\x16\xd0\xd4\
+\xd4\xc4\xb7\xdf~K`` _~\xf9%YYY\
+\x04\x06\x04\xb6=\x8fZ3\x8f=\xfe\x18\x01!\x81L\
+\xb8a\x22G\x0e\xa7\xe1\xec\xe4,\x99\x8f\xbbt\xe9\x82\
+\x93\x93\x13\xb1\xb1\xb1\xa8\xd5\xeaK\x9a\x83\xda\x8f\x8br\
+N(\xdfojjb\xc8\x90!\xb2\xd3\xd2\x9e={\
+\x08\x0e\x0e\x96\x96\xa3\x12\x98\xd3\xdc\xdc,;\xf8\xf4\xec\
+\xd9S\xf6^\xbc^\x22\xb2S555\xed\xd2\x97\x0b\
+\xab\xa0o\xdf\xbe\xe8t:\x82\x82\x82X\xb9r\xa5d\
+\x0d\xbep}+\x92\x93\x93'\xd5\xd5\xd5\xfd)\x19\x8c\
+?\xc3\x02\x10A\xa7\x02`\x8d\x93\x93\xd3\x8d\x16\x8b\xc5\
+\x1b.M\xdb\x89\x80\xdb\x89\x13'$3N\xcf\x9e=\
+%\xb2\xecr\x0f\x1c.\xfa\xf8\x8e\xde\x17\xc1?\xab\xd5\
+\xca\xf1\xe3\xc7\xa9\xaa\xaa\x22&&F\x96\x18\x8b\xe3\x89\
+\xef\x8ah\xf9\xae]\xbb\x186l\x98l\xcc\xa1\xd7\xeb\
+\xf9\xf9\xe7\x9f\xb9\xe3\x8e;X\xb4h\x11S\xa6L!\
+//\x0f???\x1e\x7f\xfcq\x0a\x0b\x0be p\
+\xcd\x9a5l\xdc\xb8\x11\x7f\x7f\x7f\x0c\x06\x037\xddt\
+\x13\xb7\xdcr\x0bF\xa3Q\xb6\xe5R\xee(J\xc5u\
+5\x22\xc6O|\xbe\xb9\xb9Y\xba\x0a\x1d:t`\xea\
+\xd4\xa9t\xeb\xd6\x8d\xc7\x1f\x7f\x9c\xad[\xb72q\xe2\
+D|||d\x93\x0c\xf1}q\xde\x86\x86\x06t:\
+\x1d\xa3F\x8d\xa2\xae\xae\x8e\x0d\x1b6\xe0\xe5\xe5E\x8f\
+\x1e=8q\xe2\x84\xdc\xcd\x03\x02\x02$&\xc3\x9e\xc6\
+K\xfc,\x14\x8d\x98\x0b\xcb\x96-\xa3\xb0\xb0\x90E\x8b\
+\x16\xd1\xb9sgv\xec\xd8Azz:...m\
+\xa650|\xc4\x08\xb0X\xb8\xef\x81\x07())a\
+\xc4\x88\x11\xd2J1\x1a\x8d\xe4\xe5\xe5\x11\x16\x16\xc6\x86\
+\x0d\x1b\x88\x8d\x8d%,,L\xee\xd6b\xc7T\xc6\x07\
+\x1c\x05\xd9\xf4z=\xfd\xfb\xf7'55\x95o\xbe\xf9\
+\x86a\xc3\x86\xe1\xe9\xe9i\xd3\x01\xda~c\x12\x0b\xff\
+z`\x02\xec\xa5\xa1\xa1\x81\xb0\xb00I\x8c\xa2<\xa7\
+\x08\xe2\x06\x05\x05q\xf8\xf0a\x8a\x8b\x8b\xf1\xf3\xf3c\
+\xcb\x96-xyy\xd1\xad[\xb7\xc7\x81\xc7\x8e\x1f?\
+\xce\x89\x13'lb\x09\x7fT\xfe\xdcR((\x00\xba\
+\xa9T\xaa\xf5`\xbb\x8b\x8b\x05Z__/\xc1#b\
+\xc1]I\xec\xe1\xaf\x8e4\x9f\xc5b\x91E\x15\x02c\
+\xee(o\xaa\xdc\x15O\x9c8A@@\x00\xd1\xd1\xd1\
+\xd4\xd7\xd7K\xf7d\xd4\xa8QL\x9c8\x919s\xe6\
+\x90\x95\x95E@@\x00?\xff\xfc3\x87\x0e\x1db\xf9\
+\xf2\xe5\xb8\xbb\xbb\xf3\xf8\xe3\x8fs\xfa\xf4i\xee\xbc\xf3\
+N\xc6\x8d\x1b\xc7\xc2\x85\x0b\xe9\xdb\xb7\xaf\xa4\x83\xbe\x16\
+f\xdfk\x01\xfbX\xadm\xad\xa6\xca\xcb\xcb1\x9b\xcd\
+\x8c\x193\x86\xdf\x7f\xff\x1d\xab\xd5J\xaf^\xbd((\
+(\xc0\xcf\xcfO\xba\x11B\xe9\x0a\x5c~ee%-\
+--\xfc\xfd\xef\x7fg\xc9\x92%\xa4\xa6\xa6R__\
+\xcf\xc4\x89\x13)++#11\x91\xf3\xe7\xcf\xcb\x8e\
+\xc5\xc0%tV\x80,,\xaa\xaa\xaa\xa2s\xe7\xce\xbc\
+\xf9\xe6\x9bTVV\x12\x1b\x1b\xcb\xd1\xa3Gy\xf5\xd5\
+W\x993g\x0e\x8d\x8d\x8d\xa4\xa5\xa5q`\xff~v\
+l\xdfNrJ\x0a\xaf\xbe\xfa*k\xd6\xac!))\
+\x89#G\x8e\x00\xe0\xeb\xebKdd\xa4dDZ\xb6\
+l\x19\x804\xcbE\x1c\x07\x90 %Gf\xb4\xc8\x9f\
+/_\xbe\x1c\xab\xd5\xca\xb3\xcf>\x8b\xb3\xb3\xb3\x0d\x1d\
+\x99r<\x95\xf3\xe2z\x8aP\xc4\xcd\xcd\xcd\xb2\x93\xb3\
+\xa3JD\xb1Y\x0d\x1a4\x08\x93\xc9\x84\x9b\x9b\x1b!\
+!!\x8d_\x7f\xfd\xf5\xc4\xaa\xaa\xaaW\xff\xeck\xfd\
+\xb3\x15\x00@30\x05xT\xf9\xa6X\xa0\x82\xf1F\
+hl\x01?m/mx\xc9\x05+\xf0\xe5\xf6\x13@\
+\xadVSSS#w@%9\x820\x89\xa1-\x0e\
+Q[[Kqq1\xc9\xc9\xc9\x12\x0bPWWG\
+rr2111<\xf1\xc4\x13\xe4\xe5\xe5\xa1\xd3\xe9\
+\xa8\xa9\xa9\xe1\xf5\xd7_g\xda\xb4i\x04\x07\x07\xf3\xb7\
+\xbf\xfd\x8d\x98\x98\x18^\x7f\xfduz\xf7\xeeMxx\
+8\x1a\x8dF.|q>Gf\xaa#\xb9\x9c\x92\xb0\
+\x9f$\x22\xdd\xa7\x9cL\xee\xee\xeel\xd9\xb2\x85q\xe3\
+\xc6\x91\x92\x92BNN\x0e\xbe\xbe\xbe\xb2zQp\x16\
+\x88\xefVWWc\xb5Zy\xf7\xddw\xb9\xf3\xce;\
+\xd9\xb9s'\xa5\xa5\xa5\x8c\x181\x82\xb2\xb22\xfa\xf4\
+\xe9#\xe1\xba\x22\xae\x22v~\xa5\x0b&\xe2\x0d\x95\x95\
+\x95\xa8T*\x1ez\xe8!f\xcc\x98\xc1\x8c\x193\xe8\
+\xdf\xbf?\x99\x99\x99\x92\xc4d\xe4\xc8\x91\x84\x84\x84p\
+\xf8\xf0a\xd4j5\x8f?\xfe8\x05\x05\x05\x8c\x193\
+\x86\xd5\xabW\x03m`\x18\xbd^\xcf\x80\x01\x03\xa4\xa5\
+\xa5\x1c\x17\xd1\x9c\xc5l6\xdb4+U\x8e7 ;\
+\x08}\xfd\xf5\xd7\x1c>|\x98\x97^z\x09\x1f\x1f\x1f\
+<==/Y<b|\xff\xec\xb2`G\xa2\xbc>\
+{\x11q 1\xa6}\xfb\xf6%  \x80\x8a\x8a\x8a\
+\x13\x06\x83\xa1\x93\xbf\xbf\xff\xa6\xff\x80\x0e\xbc]\xb9\x9e\
+w\xfdw\xa0\x17\x90\x0b\x17\xb5\x96H\xb7\x08t\x94\x92\
+p\xf4J\xe2\x08`d\xff\xdd\x8a\x8a\x0a\x19l\xb1o\
+\xa4\xa0\xc4\x22ddd\xe0\xe7\xe7\x87\x8f\x8f\x8f\xbc\xb6\
+\xc9\x93'SZZ\xca\xf2\xe5\xcb\xa9\xaa\xaa\xc2l6\
+\x13\x1c\x1c\xcc\x17_|AMM\x0d\xdd\xbauc\xfd\
+\xfa\xf5\xdcq\xc7\x1d\x92\x05\xa9\xa6\xa6\x86\x86\x86\x06\xea\
+\xeb\xeb\xa5B\xb2_\xfc\xd7C\xc4B\x14(\xcd\xc6\xc6\
+F\xde{\xef=&O\x9e\xcc\xf8\xf1\xe3)--%\
+00\x90\xe2\xe2b\xce\x9d;'\x1bh\x0a\xaal\xb3\
+\xd9\x8c\xc5ba\xd5\xaaUL\x9f>\x9d\xbd{\xf7\xd2\
+\xd2\xd2\xc2\xb8q\xe3(,,$99\x99\x92\x92\x12\
+\xb9h\x84\xe9\xad\x8c\xc7(\xaf\xa5\xba\xba\x9a\xfa\xfaz\
+\x9ey\xe6\x19\x9ey\xe6\x19\xf6\xee\xdd\xcb\xc4\x89\x13\xe9\
+\xde\xbd;\xaf\xbd\xf6\x1a\x15\x15\x15\xf8\xfb\xfb\xd3\xb3g\
+O\xfc\xfc\xfc\x184h\x10\xa7O\x9f\xe6\xc8\x91#\x1c\
+?~\x9c\xb9s\xe7R[[\xdb\x16$\xf4\xf0`\xe4\
+\xc8\x91\xac]\xbb\x96\xa2\xa2\x22I6\xeb\xea\xeaJ]\
+]\x1d\x9f|\xf2\x89,\x9fud\x19\xb6\xb6\xb6\xd2\xd0\
+\xd0@rr2\xdf}\xf7\x1d\x1b7n\xe4\xe9\xa7\x9f\
+\xc6\xdb\xdb\x1b77\xb7K\x02\xc2\xd7{\xf1\xdb\xc7~\
+\xccf\xb3\xfc]\xfc\xaf\x1c\xd3\xc6\xc6FQ\xed\xf7\x8f\
+\xf2\xf2\xf2\xee\x5c\xe0\xf2\xbf\x1e\xd7y\xbd\xd5^\x1a\x10\
+\xadR\xa9\xde\x13\x0b\xbd\xba\xba\xda&\xfam\x1f\x0c\xb3\
+\x17{\xfc~{\x9f\x15\x7f\x13\x01@A^\xaa\x14\xc1\
+\xc2S__\x8f\xc9d\xa2C\x87\x0e\xf2\xfd\xe7\x9e{\
+\x8e\xad[\xb7\xf2\xe9\xa7\x9f\xa2\xd1h$\x11hzz\
+:k\xd7\xae\xc5\xc7\xc7\x87\xd2\xd2R\x1ex\xe0\x01\xa6\
+L\x99\x82\xc9d\x92\x0fR\x14\x1a\x89\xeb\xb8\x1aHt\
+{\xf7\xe9\xe8}\xe5K\xb80\xf6\xbe\xb9\xc9d\xa2\xbe\
+\xbe\x9e7\xdf|\x93\xc1\x83\x073}\xfatZZZ\
+\x88\x8c\x8c\xc4j\xb5\x92\x9f\x9fOZZ\x1aiii\
+\xe4\xe4\xe4\xd0\xd8\xd8(w\xa2u\xeb\xd61c\xc6\x0c\
+v\xee\xdcIEE\x05\xfd\xfa\xf5#77\x97A\x83\
+\x06a6\x9b\xf1\xf6\xf6\x96\xe3\xa4\xac\xa9\x10\xd7 R\
+zuuu455\xf1\xfc\xf3\xcf\xf3\xc5\x17_\x10\
+\x1f\x1f\x8f\xc9d\xe2\xbd\xf7\xdec\xe2\xc4\x89\xcc\x9e=\
+\x9bM\x9b6\x91\x9f\x9f\xcf\xb1c\xc7\xf8\xf2\xcb/\xf9\
+\xd7\xbf\xfeE\x97.]8r\xe4\x08\x09\x09\x09|\xf3\
+\xcd7\x92t\xd5\xc7\xc7G\x06\x04\x05O~RR\x12\
+\xb5\xb5\xb5\xac_\xbf\xde\xa6g\x9eR\xe9\x0ae\xd5\xdc\
+\xdc\xcc\x0d7\xdc\xc0\xaaU\xab\xd8\xb8q#\x8f>\xfa\
+(\xbe\xbe\xbe\x0e\x19\x82\x95\x18\x8a\xeb)\x22\x16\x03\xb6\
+\xd0g\xe5}X,\x96\x5c`\x80\xaf\xaf\xefCp\xed\
+MU\xaeE\xae\xbf\xdd\x03\xad\xc0\x12\xa07pRT\
+\x0f\xb6\xb7\x9b\xff\x11Q\x0e\x90\x08\xf6\x08\xc4\xa1\xf23\
+---\xb8\xb8\xb8\xc8\x96\xd3~~~\x00\xfc\xf4\xd3\
+O<\xff\xfc\xf3<\xfd\xf4\xd3t\xee\xdc\x99\xe2\xe2b\
+\x09\x86\x11\x1d\x5c\xe7\xcd\x9b\xc7\xa3\x8f>J||\xbc\
+D\x99)\xcd\xc7\xbf\x22\x80\x04\xed[J\x02`\xd5\xd4\
+\xd4\xc4\xf2\xe5\xcb\x09\x0b\x0b\xe3\xee\xbb\xefF\xab\xd5\x12\
+\x13\x13C\xd7\xae]\x89\x8c\x8c\xc4b\xb1H\xda\xe9m\
+\xdb\xb6\xb1i\xd3&\x8a\x8b\x8b\xf9\xf2\xcb/\x191b\
+\x04\xfb\xf6\xed\xc3l6\x93\x98\x98\xc8\x993g\x18>\
+|\xb8\x0d\x0f\x80\x92EG\xb8\x07\xcaf/\xc2\x0d\xba\
+\xf5\xd6[\xf9\xf4\xd3Oy\xea\xa9\xa7\xb8\xe1\x86\x1b\xe8\
+\xde\xbd;\xf9\xf9\xf9|\xf8\xe1\x87|\xfa\xe9\xa7\xfc\xfe\
+\xfb\xef\xb8\xb9\xb9\xc9`\xe5\xf3\xcf?\xcf\xad\xb7\xde\xca\
+\xa2E\x8bx\xfc\xf1\xc7\xa9\xaf\xafg\xd6\xacY\x1c<\
+x\x90\xa3G\x8fJ`\x13\xc0\xacY\xb3\xf8\xe5\x97_\
+\xc8\xce\xcen7u\xa7\x0cT\xdey\xe7\x9d|\xf9\xe5\
+\x97l\xd9\xb2\x859s\xe6\xe0\xea\xea\x8a\x9f\x9f\x9fT\
+`\xd7S\x1c\xb9\xb6\x02\xe4\xd5\xce\xb3|Y\xadVG\
+\x00\xff\xfe+\x1a\x9a\xfc\x15\x0a@H*\x10\xdb\xd0\xd0\
+0W\xadVW\x0b\xedw\xb9\x22\x1dG)2!\xf6\
+\xe9?\x11A\x15|{\xc2DV>\x00\xf1\xb30G\
+U*\x15\xd9\xd9\xd9\x8c\x1b7\x8e\x993g2y\xf2\
+drrr$9\xe6\x96-[\xd8\xbbw/\x0b\x17\
+.\xe4\xe9\xa7\x9f&\x22\x22B\x06\xd1D\x0cCy\x5c\
+GbQ9~\xfdQq\xe4^(]\x1b\xd1]h\
+\xd5\xaaU\x12\x81'\x14\xae\x9f\x9f\x1f}\xfa\xf4a\xe8\
+\xd0\xa1\xb2l\xd8\xd9\xd9\x99\xad[\xb7\xb2u\xebV\x16\
+/^\x8c\xaf\xaf/'N\x9c\xa0\xbe\xbe\x9e\xa4\xa4$\
+\x0e\x1c8\xc0\xa0A\x83\xa8\xaf\xaf\xc7\xd3\xd3\x13\x83\xc1\
+ \xbb\x1d\x09\xc4\xa72\xe0(\xf8\x11-\x16\x0b={\
+\xf6\xe4\xe1\x87\x1ff\xe6\xcc\x99\xdcv\xdbm\xbc\xfe\xfa\
+\xeb\xcc\x981\x83\xf4\xf4t^}\xf5U\x96.]\xca\
+\xce\x9d;\xe9\xda\xb5+\xa1\xa1\xa1\x8c\x1f?\x9e\x95+\
+W\x92\x93\x93#\x0b\xac\xc6\x8e\x1d\xcb\xaaU\xab\x806\
+\x06\xe4\xda\xdaZ\xc2\xc3\xc3\xe9\xde\xbd;\xef\xbf\xff\xbe\
+\xbco\xfb\xb9\x22\xee\xb9\xa1\xa1\x81\xe6\xe6ff\xcc\x98\
+AZZ\x1a\xa9\xa9\xa9\x8c\x1e=ZV\xe7\x81\xed\x1c\
+\xbc\xdeV\x80J\xa5\x92\xdc\x8av\xf3\xfaG \x0a\xb8\
+,G\xdf\x9f-\x7f\xa5\x02\x00@\xa5R}\x02\x04\xaa\
+\xd5\xea\x17\x81\x06e'\xa1\xffD\x94\x19\x06eWZ\
+\xa5\x8f(P\x82---DDD\x00p\xeb\xad\xb7\
+\x12\x1d\x1d\xcd\xe2\xc5\x8b\xc9\xcd\xcd\x95h\xb1\x8a\x8a\x0a\
+\x9e\x7f\xfey\xbat\xe9\xc2k\xaf\xbd&\x19\x82\x84\x89\
+\xa9<\xee\x7fC\xda;\xafF\xa3\xc1d2\xa1\xd5j\
+Y\xb1b\x05\x87\x0f\x1ff\xe3\xc6\x8d\xb2\xc2\xac\xaa\xaa\
+\x8a\xd6\xd6V<==\x89\x8b\x8bc\xc4\x88\x11L\x99\
+2\x85\x98\x98\x18\xe2\xe3\xe3\xf9\xf1\xc7\x1f\x89\x8d\x8d\x95\
+\x85@)))\xec\xdb\xb7\x8f\xbe}\xfbRQQ!\
+\xd3\xa7\x82\xe6\xcb\xd3\xd3SV0\xba\xb9\xb9I\x98\xb2\
+\xc9d\xa2\xb6\xb6\x16\x0f\x0f\x0f\xa6M\x9bF\xe7\xce\x9d\
+\xb1Z\xad\xdcz\xeb\xad\xacY\xb3\x86\x97^z\x89\x98\
+\x98\x18V\xaf^\xcd\xc0\x81\x03\xf9\xe1\x87\x1f\xd0h4\
+\x18\x0c\x06\x9e{\xee9\xa6L\x99\xc2;\xef\xbc#q\
+\x08\x9b6m\x02..\xf0\xbb\xee\xba\x8b\x13'N\xb0\
+m\xdb6\x1bZtGA>\x91>\xed\xd1\xa3\x07\x95\
+\x95\x95\xf8\xfb\xfb3f\xcc\x18\x0a\x0b\x0be;z\xf8\
+k2\x01b\xe3P \x1d\x0f\x00\x03\x80\xf1@\xf6u\
+\xbd\x00\x07r\xfd\x08\xd1./\x0dj\xb5\xfa\xe9\xd6\xd6\
+\xd6\xd7\xeb\xeb\xeb\x1f\x00\xeeS\xa9T\xed&5\x1dM\
+v\xfb\x9d]\xadn\xa3\x8b\x12\xc5%\xcal\x81\xf23\
+eee\xb2DX\x04\xab\xd6\xaf_OUU\x95\xe4\
+\xb7\xf7\xf7\xf7\xe7\xb5\xd7^\xa3\xb5\xb5\x95e\xcb\x96I\
+f\x9f\xff\xd6bW\xca\x95\xc6\x02\xda\x16IEE\x05\
+~~~<\xf3\xcc3\xbc\xfc\xf2\xcbt\xea\xd4\x89n\
+\xdd\xbaI\x13]\x99\xfb\xd6\xeb\xf5\x84\x84\x84\xa0\xd1h\
+\x88\x8a\x8a\xe2\xc8\x91#\x8c\x193\x86_~\xf9\x85\x94\
+\x94\x14F\x8f\x1e\xcd\x96-[\x88\x89\x89\xe1\xed\xb7\xdf\
+\x16\xdd\xa3\x08\x08\x08\xc0\xcd\xcd\x0d???BBB\
+d\x17\x1b\x01'njj\x92\x11\xfbI\x93&\xf1\xef\
+\x7f\xff\x9bm\xdb\xb6\x11\x12\x12BRR\x12\xfd\xfb\xf7\
+\xa7\xb6\xb6\x96\xe5\xcb\x97\xf3\xd4SOQ^^\xce\xad\
+\xb7\xdeJAA\x01\x93&M\x2288\x98\xf5\xeb\xd7\
+\x13\x1c\x1c\xcc\xa9S\xa7\x18<x0\xee\xee\xee\xd4\xd5\
+\xd5\xe1\xe1\xe1\xc1\xad\xb7\xde\xca\x8a\x15+\x186l\x98\
+dkV\x22!\x95\xa2\xd1h\xc8\xcf\xcf\xa7\xb0\xb0\x90\
+#G\x8ep\xcb-\xb70u\xeaT\xbe\xfa\xea+\xa2\
+\xa2\xa2d\x8d\xc0\xf5\x141\x07/(\xaa\xdd*\x95\xea\
+i\xab\xd5\xba\xfb\xafr\x1f\x1d\xc9_n\x01(\xc5j\
+\xb5\x9a,\x16\xcbs\x80?0\x178*\xfev-\x91\
+t\xe1\x93\x8a\x02#\x11\xecS\x06Y\x94\xd8\xfb\x88\x88\
+\x08\x0e\x1d:\xc4\xdf\xfe\xf67\xee\xbf\xff~|}}\
+\xa9\xaa\xaaB\xa5R\xe1\xeb\xeb\xcb\x993g\xf8\xf6\xdb\
+o\x99?\x7f>#F\x8c\x90\x9d{\xfe\x08\x81\xa4\xda\
+\xea\xf8u=E\xec4\x15\x15\x15$$$0g\xce\
+\x1c\xd6\xae]KMM\x8d\xcc\xa1+\xa5\xb1\xb1\x11\x93\
+\xc9DYY\x19\x95\x95\x95\xb2\xbd\xd6\xa8Q\xa3\xf8\xf7\
+\xbf\xffMkk+\x13&L\xa0\xbc\xbc\x9c\xc7\x1f\x7f\
+\x5cf\x12v\xef\xde\xcd\xc6\x8d\x1bY\xb5j\x15o\xbf\
+\xfd6\xff\xf8\xc7?X\xbbv-\xfb\xf6\xed\xa3\xb0\xb0\
+\x10\xadV\x8b\x9b\x9b\x9b\x5c\x94)))\xdcp\xc3\x0d\
+\x94\x96\x96\x92\x91\x91Aii)V\xab\x95\x97_~\
+\x999s\xe6\xf0\xd6[o\xb1o\xdf>\x82\x82\x82\xc8\
+\xca\xca\xa2W\xaf^,X\xb0\x00\x93\xc9\xc4\x8f?\xfe\
+\xc8\xfe\xfd\xfb\xe5\xfd\x01\xdcv\xdbm\xb4\xb6\xb6\xcaV\
+\xe4\xca\xa0\xa0RT\xaa6.\x02\xc1\xb9\xff\xc1\x07\x1f\
+\xb0z\xf5jf\xce\x9c\xc9M7\xdd\xc4\xef\xbf\xff.\
+i\xbb\xaf\xa7\x15\xa0R\xa9\xeaU*\xd5* \x1e\x18\
+\x0c\xec\xben'\xbbJ\xf9oY\x00R.<\xb0&\
+\xe0\x93\x0b\xaf^\xc0]\xc0T \xf0\x1a\x8e!\x17\xaa\
+#\xdf_\xa7\xd3QQQ!\x83Y\x0f=\xf4\x10q\
+qq\x12\x00#\xb4\xb3\x87\x87\x07/\xbc\xf0\x02*\x95\
+\x8a\x17_lk\xa8R[[kC\xaf}\xbd\xc5\x1e\
+\xdc\xf2GDX?\xd5\xd5\xd5\x8c\x1a5\x8a\xa2\xa2\x22\
+6o\xde\xcc\xd4\xa9S\x1d\x1eS\x19\xcc\xab\xa9\xa9\x91\
+\xd8\x82\xe1\xc3\x87\xb3m\xdb6F\x8c\x18\xc1\xb0a\xc3\
+\xd8\xbe};_}\xf5\x95,\x22:w\xee\x1cuu\
+u\x94\x94\x94PTT\xc4\xb9s\xe78~\xfc8*\
+U\x1b\x1dxtt4\x01\x01\x01\x04\x05\x05\xe1\xe7\xe7\
+G\xcf\x9e=\xd1\xe9tl\xdb\xb6M\xd2\xa4ggg\
+s\xff\xfd\xf7\x93\x9b\x9b\xcbk\xaf\xbd\xc6W_}\x85\
+\xc1` ;;\x9b\xc0\xc0@\x16,X\xc0\xbb\xef\xbe\
+\xcb\xdf\xfe\xf67\x12\x12\x12\xf0\xf3\xf3\x93\xd7x\xdbm\
+\xb7\xb1b\xc5\x0a\xd9\x89I\x00\x81\xec\xc7\xcebi\xab\
+=\xe8\xd7\xaf\x1f\x8d\x8d\x8d\xbc\xf8\xe2\x8b\xbc\xfd\xf6\xdb\
+X\xadVf\xcf\x9e\xcd\xd7_\x7fMxx8EE\
+EW\x05\xde\xba\xc6\xe7\xf0o\xe0S\xe0\xff\x80\xda?\
+\xe5\xc0\x7f\x92\xfcW-\x80v\xe40\xb0\x18\x08\x02\x86\
+\x03\xef\x00\xa7.\xf7\x05\xb1`\xc4\xc3\xb7\xe7#\x10\x0f\
+\xb3\xae\xae\x8e\xb0\xb00\xb6n\xdd\xca\xe9\xd3\xa7\x99?\
+\x7f>\xf5\xf5\xf52 c4\x1a9z\xf4(\xbbw\
+\xef\x96\xe0\x11\xb1#^/\xb9\x16\x85b?)\x95V\
+\x92\xbd\xb5$&qKK\x0b\x0d\x0d\x0d\xb2\x99gV\
+V\x96\x0d>B|GYV\xdc\xda\xda*S\x9c\xdb\
+\xb6mc\xc0\x80\x01\xb2Ux\xdf\xbe}Y\xbdz5\
+s\xe7\xce\xc5\xcd\xcd\x8d\xf8\xf8x\xfa\xf5\xeb\xc7\x0d7\
+\xdc\xc0\x1dw\xdc\xc1\x92%K\xb8\xef\xbe\xfb\xb8\xfd\xf6\
+\xdb\x89\x8b\x8b\x03\x90MV\xce\x9c9\x83\xc9d\x22.\
+.\x8e\x1bn\xb8\xc1\x86\xa7\xbf\xb4\xb4\x94\xa5K\x97b\
+2\x99\xd8\xb6m\x1b\xde\xde\xde\xa8\xd5j\x8a\x8a\x8ah\
+mm\xe5\xb1\xc7\x1eC\xa5R\xf1\xd8c\x8f\x01H7\
+c\xea\xd4\xa9\x18\x0c\x06>\xfe\xf8c\x9b\xfbq4V\
+\x22`9x\xf0`\xa2\xa3\xa3Y\xb0`\x01+W\xae\
+d\xfa\xf4\xe9\xdc|\xf3\xcdTTT\xe0\xeb\xeb\xfbg\
+X\x01f\xe0\x07\xda\xb2_\xe1\xb4\xf9\xf8\x9f\xf0?\xb6\
+\xf8\xe1\x7fS\x01(e;mm\x8d\xbb\x011\xc0=\
+\xc0J\xda\xf0\x05\x0d`\xbb\x80D\xfd;\xd8\x06t\x94\
+\x04\x19*\x95\x8ao\xbf\xfd\x96\xe4\xe4d:v\xec(\
+KS\x05\xe9\xc6g\x9f}\x86\x93\x93\x13\xf7\xdcs\x0f\
+\x804\xfd\xafg\x9e\xd8>\xd7\xffg\x1eW\xadVK\
+\xe6\x1c\xc1\xe2\xac\xac\xb2S*\x0aa=\x89\x8aD\xe1\
+\x16m\xdd\xba\x95\xee\xdd\xbb\xb3s\xe7N\xdc\xdd\xdd\x89\
+\x8d\x8d\x95\xec;\xd06\xeeeeer\xfc\xbd\xbc\xbc\
+\xe8\xd2\xa5\x0b\xa3G\x8ff\xf2\xe4\xc9\xdcx\xe3\x8d\x8c\
+\x1e=\x9a\xe8\xe8hL&\x13\x85\x85\x85DGG3\
+a\xc2\x04\xc9$TYYIpp0\xb7\xdez+\
+?\xfd\xf4\x93\xb4\xdaDP\xb3\xb2\xb2\x92'\x9ex\x82\
+\x8c\x8c\x0c6n\xdc\x88^\xaf\x978\x86\xf9\xf3\xe7\xf3\
+\xc3\x0f?\x90\x99\x99)\xe1\xdf\xedaEDs\x98{\
+\xee\xb9\x07OOO\xee\xb9\xe7\x1e\xd6\xad[G\x8f\x1e\
+=\xe4\x86 \xba*]\x83\x14\xd0\x16\xc5\x7f\x01\x18\x0d\
+\x04\x007\x00\xefq\x01\xc4\xf3\xbf*\xffu\x17\xe0\x1a\
+$\xfd\xc2\xeb\xa3\x0b\xbf\xbb\x03\xb1@\x17\x95J\x15\x06\
+\x84766\x06i4\x1a/\xb5Z\xed\xdd\xda\xda\xea\
+i\xb5Z\x9d\x01\xbdF\xa3\xb1VWW\xe3\xe5\xe5\xc5\
+\x89\x13'8u\xea\x14\xd3\xa7O\x97`\x11\x95\xaa\x8d\
+\x04###\x83={\xf6\xb0d\xc9\x12\xbc\xbd\xbd%\
+\x1b\xf0\x9fi\x12\xfe'b?)/7I\xed\xd3\x84\
+\xa2\xb3\xac}\xafzq\x1c\xa5\xd5\xa4\x0c\xa4UVV\
+\xe2\xe5\xe5\xc5\xaf\xbf\xfeJ\xff\xfe\xfd\xf9\xe5\x97_\x18\
+6l\x18\xd0\x86\xb7\xd7h4\xbc\xf3\xce;\xb2\xd0H\
+\xd0q\x09\x8c\x808\xa6^\xaf\x97\x1d\x8d\xcb\xcb\xcb\xc9\
+\xc9\xc9!\x22\x22\x82I\x93&\xb1u\xebVJKK\
+Q\xab\xd5\x8c\x1d;\x96C\x87\x0e\xb1g\xcf\x1ez\xf6\
+\xecIUU\x15\x1a\x8d\x86\x8a\x8a\x0a\xc2\xc3\xc3\xb9\xe5\
+\x96[\xf8\xfc\xf3\xcf\x19<x0F\xa3\x11\x8b\xc5\xc2\
+\x981c\xf8\xfa\xeb\xafY\xb5j\x95$\x1ei\xaf\x94\
+X\x00q\x0c\x06\x03\xef\xbd\xf7\x1ec\xc6\x8c\xe1\x8d7\
+\xde`\xcf\x9e=2\xc8\xb9h\xd1\x22\x01&j\xa2\x0d\
+\xda^\x0f\xd4\x00\x15\xb4\xf5\xd9\xcb\x03\xf2\x81,\xe08\
+m\xd1\xfb\xff~\x84\xf8\x0f\xc8\xff\x03\x5c\x00d\x8e\xe7\
+\x80\xc1\xe3\x00\x00\x00\x00IEND\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x0a\
+\x0c\xad\x0f\x07\
+\x00d\
+\x00e\x00l\x00e\x00t\x00e\x00.\x00p\x00n\x00g\
+\x00\x07\
+\x07\xa7W\x87\
+\x00a\
+\x00d\x00d\x00.\x00p\x00n\x00g\
+\x00\x08\
+\x06`Gg\
+\x00z\
+\x00o\x00o\x00m\x00.\x00p\x00n\x00g\
+\x00\x08\
+\x0aaZ\xa7\
+\x00i\
+\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00>\x00\x00\x00\x00\x00\x01\x00\x01\x8a\x1a\
+\x00\x00\x01\x9a\x1e\x82\xf7\xf8\
+\x00\x00\x00*\x00\x00\x00\x00\x00\x01\x00\x00\xc8\x01\
+\x00\x00\x01\x9a\x1e\x82\xf7\xf8\
+\x00\x00\x00T\x00\x00\x00\x00\x00\x01\x00\x02a\xb1\
+\x00\x00\x01\x9a\x1e\x82\xf7\xf8\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9a\x1e\x82\xf7\xf8\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()